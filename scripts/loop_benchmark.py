@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Misthollow Event Loop Benchmark
+===============================
+Compares the default asyncio event loop with uvloop under the real server.
+
+For each loop a server process is started on a spare local port with the
+full pulse loop and job table, but no web services. Instead of the login
+screens, every socket is handed a throwaway bot character straight away.
+Many concurrent clients then send commands back to back. Each command's
+round trip runs from the write until the prompt comes back. The report
+covers the latency percentiles, commands per second, and the server's
+CPU time per thousand commands.
+
+    python3 scripts/loop_benchmark.py --clients 200 --duration 20
+
+Loops that are not installed (uvloop) are reported and skipped. Commands
+run on the 10Hz game pulse, so latency includes up to one pulse of
+queueing whichever loop is used. CPU per command is the number that
+shows loop overhead.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+# Read-only commands, so every client does the same work for the whole run
+COMMANDS = ['look', 'score', 'inventory', 'equipment', 'exits', 'who', 'time', 'affects']
+
+PROMPT_END = b'> '
+READY = 'READY'
+CPU = 'CPU'
+
+
+# ----------------------------------------------------------------------
+# Server side (child process, run from src/)
+# ----------------------------------------------------------------------
+
+def serve(loop_name: str, port: int):
+    sys.path.insert(0, SRC_DIR)
+    import logging
+    from main import Misthollow, install_event_loop
+    from server import MUDServer
+    from simulate import BotPlayer
+    from world import World
+
+    logging.getLogger().setLevel(logging.WARNING)
+    used = install_event_loop(loop_name)
+    if used != loop_name:
+        print(f"{READY} unavailable", flush=True)
+        return
+
+    class BenchmarkServer(MUDServer):
+        """Skips the login screens: each connection plays a fresh bot."""
+
+        async def greet(self, conn):
+            n = conn.conn_id
+            conn.player = BotPlayer.create_new(
+                name=f"Benchbot{n}", password='benchmark', race='human', char_class='warrior',
+                stats={stat: 13 for stat in ('str', 'int', 'wis', 'dex', 'con', 'cha')},
+                world=self.world)
+            await conn.enter_game()
+            await conn.flush()
+
+    async def run():
+        mud = Misthollow()
+        mud.config.HOST = '127.0.0.1'
+        mud.config.PORT = port
+        mud.world = World(mud.config)
+        await mud.world.load()
+        mud.server = BenchmarkServer(mud.world, mud.config)
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGTERM, lambda: setattr(mud, 'running', False))
+        run_task = asyncio.create_task(mud.run())
+        while not mud.server.server:
+            await asyncio.sleep(0.05)
+        print(READY, flush=True)
+        # Leave world loading out of the CPU figure
+        started = time.process_time()
+        await run_task
+        print(f"{CPU} {time.process_time() - started:.3f}", flush=True)
+
+    asyncio.run(run())
+
+
+# ----------------------------------------------------------------------
+# Client side
+# ----------------------------------------------------------------------
+
+class Results:
+    def __init__(self):
+        self.latencies = []
+        self.bytes_in = 0
+        self.errors = 0
+        self.connected = 0
+
+
+async def read_prompt(reader, results: Results):
+    """Read until a chunk ends with the prompt."""
+    while True:
+        data = await reader.read(65536)
+        if not data:
+            raise ConnectionError('server closed the connection')
+        results.bytes_in += len(data)
+        if data.endswith(PROMPT_END):
+            return
+
+
+async def client(port: int, warmup_end: float, end: float, results: Results, rng: random.Random):
+    try:
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    except OSError:
+        results.errors += 1
+        return
+    try:
+        await asyncio.wait_for(read_prompt(reader, results), timeout=30)
+        results.connected += 1
+        while True:
+            now = time.perf_counter()
+            if now >= end:
+                break
+            writer.write(f"{rng.choice(COMMANDS)}\n".encode())
+            await asyncio.wait_for(read_prompt(reader, results), timeout=30)
+            if now >= warmup_end:
+                results.latencies.append(time.perf_counter() - now)
+    except (OSError, ConnectionError, asyncio.TimeoutError):
+        results.errors += 1
+    finally:
+        writer.close()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+async def measure(loop_name: str, clients: int, duration: float, warmup: float, seed: int) -> dict:
+    port = free_port()
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, os.path.abspath(__file__), '--serve', loop_name, '--port', str(port),
+        cwd=SRC_DIR, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    line = (await proc.stdout.readline()).decode().split()
+    if line[:1] != [READY] or line[1:] == ['unavailable']:
+        await proc.wait()
+        return {'loop': loop_name, 'available': False}
+
+    results = Results()
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    warmup_end = start + warmup
+    end = warmup_end + duration
+    await asyncio.gather(*(client(port, warmup_end, end, results, random.Random(rng.random()))
+                           for _ in range(clients)))
+
+    proc.send_signal(signal.SIGTERM)
+    cpu = None
+    for raw in (await proc.stdout.read()).splitlines():
+        words = raw.decode().split()
+        if words[:1] == [CPU]:
+            cpu = float(words[1])
+    await proc.wait()
+
+    lat = sorted(results.latencies)
+    count = len(lat)
+
+    def pct(p):
+        return lat[min(count - 1, int(p * count))] * 1000 if count else 0.0
+
+    return {
+        'loop': loop_name,
+        'available': True,
+        'clients': results.connected,
+        'errors': results.errors,
+        'commands': count,
+        'commands_per_second': count / duration,
+        'kb_per_second': results.bytes_in / 1024 / (warmup + duration),
+        'mean_ms': statistics.mean(lat) * 1000 if count else 0.0,
+        'p50_ms': pct(0.50),
+        'p95_ms': pct(0.95),
+        'p99_ms': pct(0.99),
+        'max_ms': lat[-1] * 1000 if count else 0.0,
+        'cpu_seconds': cpu,
+        'cpu_ms_per_1k': cpu * 1000 / count * 1000 if cpu is not None and count else None,
+    }
+
+
+def print_report(rows: list):
+    print(f"{'loop':<8} {'clients':>7} {'cmds/s':>8} {'mean':>7} {'p50':>7} {'p95':>7} "
+          f"{'p99':>7} {'max':>7} {'KB/s':>8} {'cpu s':>7} {'cpu ms/1k':>9} {'errors':>6}")
+    for row in rows:
+        if not row['available']:
+            print(f"{row['loop']:<8} not installed - skipped")
+            continue
+        cpu = f"{row['cpu_seconds']:7.2f}" if row['cpu_seconds'] is not None else f"{'?':>7}"
+        per_1k = f"{row['cpu_ms_per_1k']:9.1f}" if row['cpu_ms_per_1k'] is not None else f"{'?':>9}"
+        print(f"{row['loop']:<8} {row['clients']:>7} {row['commands_per_second']:>8.0f} "
+              f"{row['mean_ms']:>7.1f} {row['p50_ms']:>7.1f} {row['p95_ms']:>7.1f} "
+              f"{row['p99_ms']:>7.1f} {row['max_ms']:>7.1f} {row['kb_per_second']:>8.0f} "
+              f"{cpu} {per_1k} {row['errors']:>6}")
+    print("(latencies in ms, command sent -> prompt received)")
+
+
+async def benchmark(args) -> int:
+    rows = []
+    for loop_name in args.loops:
+        print(f"[*] {loop_name}: {args.clients} clients, {args.warmup:.0f}s warm-up, "
+              f"{args.duration:.0f}s measured", flush=True)
+        rows.append(await measure(loop_name, args.clients, args.duration, args.warmup, args.seed))
+    print()
+    print_report(rows)
+    return 0 if any(row['available'] and row['commands'] for row in rows) else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Compare asyncio and uvloop under simulated clients')
+    parser.add_argument('--clients', type=int, default=200, help='concurrent clients (default: 200)')
+    parser.add_argument('--duration', type=float, default=20.0,
+                        help='measured seconds per loop (default: 20)')
+    parser.add_argument('--warmup', type=float, default=3.0,
+                        help='seconds of unmeasured traffic first (default: 3)')
+    parser.add_argument('--loops', nargs='+', choices=('asyncio', 'uvloop'),
+                        default=['asyncio', 'uvloop'], help='loops to compare (default: both)')
+    parser.add_argument('--seed', type=int, default=1, help='random seed for command choice')
+    parser.add_argument('--serve', choices=('asyncio', 'uvloop'), help=argparse.SUPPRESS)
+    parser.add_argument('--port', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.port)
+        return 0
+    # Thousands of sockets need a higher open-file limit than some defaults
+    try:
+        import resource
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (max(soft, min(hard, args.clients * 2 + 64)), hard))
+    except (ImportError, ValueError, OSError):
+        pass
+    return asyncio.run(benchmark(args))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
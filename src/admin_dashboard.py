@@ -23,6 +23,9 @@ class AdminDashboard:
         self.app.router.add_get('/api/stats', self.api_stats)
         self.app.router.add_get('/api/players', self.api_players)
         self.app.router.add_get('/api/logs', self.api_logs)
+        self.app.router.add_get('/api/ticks', self.api_ticks)
+        self.app.router.add_get('/api/net', self.api_net)
+        self.app.router.add_get('/api/commands', self.api_commands)
         self.app.router.add_post('/api/broadcast', self.api_broadcast)
         self.app.router.add_post('/api/shutdown', self.api_shutdown)
     
@@ -97,6 +100,21 @@ class AdminDashboard:
             </div>
         </div>
         
+        <div class="card" style="grid-column: 1 / -1;">
+            <h2>Tick Budget</h2>
+            <div id="ticks">Loading...</div>
+        </div>
+        
+        <div class="card" style="grid-column: 1 / -1;">
+            <h2>Network</h2>
+            <div id="net">Loading...</div>
+        </div>
+        
+        <div class="card" style="grid-column: 1 / -1;">
+            <h2>Commands</h2>
+            <div id="commands">Loading...</div>
+        </div>
+        
         <div class="card" style="grid-column: 1 / -1;">
             <h2>Recent Logs</h2>
             <div id="logs" class="logs">Loading...</div>
@@ -115,6 +133,7 @@ class AdminDashboard:
                 <div class="stat"><span>Total NPCs</span><span class="stat-value">${data.total_npcs}</span></div>
                 <div class="stat"><span>Active Combats</span><span class="stat-value">${data.active_combats}</span></div>
                 <div class="stat"><span>Memory</span><span class="stat-value">${data.memory_mb} MB</span></div>
+                <div class="stat"><span>MCCP</span><span class="stat-value">${data.compression.ratio}x, ${(data.compression.bytes_saved / 1024).toFixed(1)} KB saved (${data.compression.active} conns)</span></div>
             `;
         }
         
@@ -140,6 +159,59 @@ class AdminDashboard:
             document.getElementById('logs').textContent = data.logs;
         }
         
+        async function fetchTicks() {
+            const res = await fetch('/api/ticks');
+            const data = await res.json();
+            const shed = data.load_shedding;
+            const shedRow = shed ? `<div class="stat"><span>Load shedding</span><span class="stat-value ${shed.level ? 'status-error' : ''}">${shed.state} (${Object.entries(shed.shed).map(([k, v]) => k + ' ' + v).join(', ') || 'nothing shed'})</span></div>` : '';
+            const rows = [['PULSE', data.pulse]].concat(Object.entries(data.subsystems)
+                .sort((a, b) => b[1].p99_ms - a[1].p99_ms));
+            document.getElementById('ticks').innerHTML = `
+                <div class="stat"><span>Budget</span><span class="stat-value">${data.budget_ms} ms</span></div>
+                <div class="stat"><span>Overruns</span><span class="stat-value ${data.overruns ? 'status-warn' : ''}">${data.overruns} / ${data.pulses} (${data.overrun_pct}%)</span></div>
+                ${shedRow}
+                <table style="width: 100%; font-family: monospace; font-size: 12px; margin-top: 10px;">
+                    <tr><th align="left">Subsystem</th><th>calls</th><th>p50</th><th>p95</th><th>p99</th><th>max</th></tr>
+                    ${rows.map(([name, s]) => `<tr><td>${name}</td><td align="right">${s.count}</td><td align="right">${s.p50_ms}</td><td align="right">${s.p95_ms}</td><td align="right" class="${s.p99_ms > data.budget_ms / 2 ? 'status-error' : ''}">${s.p99_ms}</td><td align="right">${s.max_ms}</td></tr>`).join('')}
+                </table>
+            `;
+        }
+        
+        async function fetchNet() {
+            const res = await fetch('/api/net');
+            const data = await res.json();
+            const t = data.totals, lat = data.latency, mpc = data.messages_per_command, cpm = data.commands_per_minute;
+            document.getElementById('net').innerHTML = `
+                <div class="stat"><span>Traffic</span><span class="stat-value">${(t.bytes_in / 1024).toFixed(1)} KB in, ${(t.bytes_out / 1024).toFixed(1)} KB out, ${t.commands} commands</span></div>
+                <div class="stat"><span>Line &rarr; flush</span><span class="stat-value">p50 ${lat.p50_ms} / p95 ${lat.p95_ms} / p99 ${lat.p99_ms} ms</span></div>
+                <div class="stat"><span>Messages / command</span><span class="stat-value">p50 ${mpc.p50} / p95 ${mpc.p95} / max ${mpc.max}</span></div>
+                <div class="stat"><span>Commands / min</span><span class="stat-value">p50 ${cpm.p50} / p95 ${cpm.p95} / max ${cpm.max}</span></div>
+                <table style="width: 100%; font-family: monospace; font-size: 12px; margin-top: 10px;">
+                    <tr><th align="left">Name</th><th align="left">Address</th><th>KB in</th><th>KB out</th><th>cmds</th><th>cmd/min</th><th>msg/cmd</th><th>avg ms</th><th>max ms</th><th>queued</th></tr>
+                    ${data.per_connection.slice(0, 25).map(c => `<tr><td>${c.name}</td><td>${c.address}</td><td align="right">${(c.bytes_in / 1024).toFixed(1)}</td><td align="right">${(c.bytes_out / 1024).toFixed(1)}</td><td align="right">${c.commands}</td><td align="right">${c.commands_per_minute}</td><td align="right">${c.messages_per_command}</td><td align="right">${c.avg_latency_ms}</td><td align="right">${c.max_latency_ms}</td><td align="right">${c.queued_lines}</td></tr>`).join('')}
+                </table>
+            `;
+        }
+        
+        async function fetchCommands() {
+            const res = await fetch('/api/commands');
+            const data = await res.json();
+            const total = data.total_ms || 1;
+            document.getElementById('commands').innerHTML = `
+                <div class="stat"><span>Calls</span><span class="stat-value">${data.calls} (${(data.total_ms / 1000).toFixed(1)} s handler time)</span></div>
+                <div class="stat"><span>Allocation tracking</span><span class="stat-value">${data.tracking_alloc ? 'on' : 'off'}</span></div>
+                <table style="width: 100%; font-family: monospace; font-size: 12px; margin-top: 10px;">
+                    <tr><th align="left">Command</th><th>calls</th><th>total ms</th><th>%</th><th>p50</th><th>p99</th><th>max</th><th>slow</th><th>KB max</th></tr>
+                    ${data.commands.slice(0, 25).map(r => `<tr><td>${r.command}</td><td align="right">${r.calls}</td><td align="right">${r.total_ms}</td><td align="right">${(100 * r.total_ms / total).toFixed(1)}</td><td align="right">${r.p50_ms}</td><td align="right" class="${r.p99_ms >= data.slow_ms ? 'status-error' : ''}">${r.p99_ms}</td><td align="right">${r.max_ms}</td><td align="right">${r.slow}</td><td align="right">${r.alloc_max_kb ?? '-'}</td></tr>`).join('')}
+                </table>
+                <h3 style="margin-top: 10px;">Slow commands (&ge; ${data.slow_ms} ms)</h3>
+                <table style="width: 100%; font-family: monospace; font-size: 12px;">
+                    <tr><th align="left">When</th><th>ms</th><th align="left">Player</th><th align="left">Command</th><th>Room</th></tr>
+                    ${data.slow_log.slice(-15).reverse().map(e => `<tr><td>${new Date(e.at * 1000).toLocaleTimeString()}</td><td align="right">${e.ms}</td><td>${e.player}</td><td>${e.command} ${e.args}</td><td align="right">${e.room ?? ''}</td></tr>`).join('')}
+                </table>
+            `;
+        }
+        
         async function broadcast() {
             const msg = document.getElementById('broadcast-msg').value;
             if (!msg) return;
@@ -161,6 +233,9 @@ class AdminDashboard:
         function refresh() {
             fetchStats();
             fetchPlayers();
+            fetchTicks();
+            fetchNet();
+            fetchCommands();
             fetchLogs();
         }
         
@@ -184,7 +259,8 @@ class AdminDashboard:
             'total_rooms': len(self.world.rooms),
             'total_npcs': len(self.world.npcs),
             'active_combats': active_combats,
-            'memory_mb': round(mem, 1)
+            'memory_mb': round(mem, 1),
+            'compression': self.world.compression_stats.snapshot()
         })
     
     async def api_players(self, request):
@@ -209,6 +285,28 @@ class AdminDashboard:
         except:
             return web.json_response({'logs': '(no logs available)'})
     
+    async def api_ticks(self, request):
+        profiler = getattr(self.world, 'tick_profiler', None)
+        if not profiler:
+            return web.json_response({'error': 'tick profiler not available'}, status=503)
+        data = profiler.snapshot()
+        shedder = getattr(self.world, 'load_shedder', None)
+        if shedder:
+            data['load_shedding'] = shedder.snapshot()
+        return web.json_response(data)
+    
+    async def api_net(self, request):
+        net_stats = getattr(self.world, 'net_stats', None)
+        if not net_stats:
+            return web.json_response({'error': 'network statistics not available'}, status=503)
+        return web.json_response(net_stats.snapshot(request.query.get('sort', 'out')))
+    
+    async def api_commands(self, request):
+        command_stats = getattr(self.world, 'command_stats', None)
+        if not command_stats:
+            return web.json_response({'error': 'command statistics not available'}, status=503)
+        return web.json_response(command_stats.snapshot(request.query.get('sort', 'total')))
+    
     async def api_broadcast(self, request):
         data = await request.json()
         message = data.get('message', '')
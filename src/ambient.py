@@ -313,7 +313,7 @@ class AmbientManager:
         message = cls.get_ambient_message(player, world)
         if message:
             c = player.config.COLORS
-            await player.send(f"\r\n{c['white']}{message}{c['reset']}\r\n")
+            await player.send(f"\r\n{c['white']}{message}{c['reset']}\r\n", low_priority=True)
             cls._last_ambient[player.name] = now
             return True
         
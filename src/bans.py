@@ -0,0 +1,192 @@
+"""
+Misthollow Bans
+==============
+Site bans and per-IP connection rate limiting, checked on accept.
+
+Bans live in a text file (``Config.BAN_FILE``) of addresses and CIDR
+ranges, one per line, with ``#`` comments::
+
+    85.217.149.48          # single scanner
+    222.186.0.0/16         # whole subnet
+    2001:db8::/32
+
+They are loaded into a binary prefix trie per address family, so a
+lookup walks at most one node per prefix bit (32 for IPv4, 128 for IPv6)
+no matter how many bans there are. ``ipban reload`` re-reads the file
+while the server is running.
+
+The rate limiter keeps one token bucket per IP. A client that opens
+connections faster than ``CONNECT_RATE_LIMIT`` per ``CONNECT_RATE_WINDOW``
+seconds is refused before any session is built.
+"""
+
+import ipaddress
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger('Misthollow.Bans')
+
+
+class _Node:
+    __slots__ = ('children', 'network')
+
+    def __init__(self):
+        self.children: List[Optional['_Node']] = [None, None]
+        self.network: Optional[str] = None  # Set where a banned prefix ends
+
+
+class PrefixTrie:
+    """Binary trie of banned networks, one root per address family."""
+
+    def __init__(self):
+        self._roots = {4: _Node(), 6: _Node()}
+        self.count = 0
+
+    def add(self, network) -> None:
+        """Add an ``ipaddress`` network."""
+        node = self._roots[network.version]
+        bits = int(network.network_address)
+        width = network.max_prefixlen
+        for i in range(network.prefixlen):
+            if node.network is not None:
+                return  # Already covered by a shorter prefix
+            bit = (bits >> (width - 1 - i)) & 1
+            child = node.children[bit]
+            if child is None:
+                child = node.children[bit] = _Node()
+            node = child
+        if node.network is None:
+            node.network = str(network)
+            self.count += 1
+
+    def match(self, address) -> Optional[str]:
+        """The banned network containing ``address`` (an ``ipaddress`` address), if any."""
+        node = self._roots[address.version]
+        bits = int(address)
+        width = address.max_prefixlen
+        for i in range(width):
+            if node.network is not None:
+                return node.network
+            node = node.children[(bits >> (width - 1 - i)) & 1]
+            if node is None:
+                return None
+        return node.network
+
+
+def parse_ban_file(text: str) -> Tuple[list, List[str]]:
+    """Networks in a ban file, and the lines that could not be parsed."""
+    networks = []
+    errors = []
+    for line in text.splitlines():
+        entry = line.split('#', 1)[0].strip()
+        if not entry:
+            continue
+        try:
+            networks.append(ipaddress.ip_network(entry, strict=False))
+        except ValueError:
+            errors.append(entry)
+    return networks, errors
+
+
+def _address(ip: str):
+    """Parse a peer address; IPv4-mapped IPv6 addresses count as IPv4."""
+    try:
+        address = ipaddress.ip_address(ip)
+    except ValueError:
+        return None
+    if address.version == 6 and address.ipv4_mapped:
+        return address.ipv4_mapped
+    return address
+
+
+class BanList:
+    """File-backed site bans."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.trie = PrefixTrie()
+        self.errors: List[str] = []
+        self.loaded_at: Optional[float] = None
+        self.blocked = 0  # Connections refused since start
+
+    def load(self) -> int:
+        """(Re)read the ban file; returns the number of bans in effect.
+
+        A missing file means no bans. On a read error the current list is
+        kept.
+        """
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                text = f.read()
+        except FileNotFoundError:
+            text = ''
+        except OSError as e:
+            logger.error(f"Could not read ban file {self.path}: {e}")
+            return self.trie.count
+
+        networks, errors = parse_ban_file(text)
+        trie = PrefixTrie()
+        for network in networks:
+            trie.add(network)
+        self.trie = trie
+        self.errors = errors
+        self.loaded_at = time.time()
+        for entry in errors:
+            logger.warning(f"Ignoring invalid ban entry {entry!r} in {self.path}")
+        logger.info(f"Loaded {trie.count} IP bans from {os.path.basename(self.path)}")
+        return trie.count
+
+    def match(self, ip: str) -> Optional[str]:
+        """The ban entry covering ``ip``, or None."""
+        address = _address(ip)
+        if address is None:
+            return None
+        return self.trie.match(address)
+
+
+class ConnectionRateLimiter:
+    """Per-IP token bucket for new connections."""
+
+    # Forget idle buckets once the table is this large
+    PRUNE_AT = 4096
+
+    def __init__(self, limit: int, window: float, exempt=()):
+        self.enabled = limit > 0 and window > 0
+        self.capacity = float(limit)
+        self.rate = limit / window if self.enabled else 0.0  # Tokens per second
+        self.exempt = frozenset(exempt)
+        self._buckets: Dict[str, List[float]] = {}  # ip -> [tokens, last refill]
+        self._prune_at = self.PRUNE_AT
+        self.rejected = 0
+
+    def allow(self, ip: str) -> bool:
+        """Spend a token for a connection from ``ip``; False if none are left."""
+        if not self.enabled or ip in self.exempt:
+            return True
+        now = time.monotonic()
+        bucket = self._buckets.get(ip)
+        if bucket is None:
+            if len(self._buckets) >= self._prune_at:
+                self._prune(now)
+            bucket = self._buckets[ip] = [self.capacity, now]
+        else:
+            bucket[0] = min(self.capacity, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+        if bucket[0] < 1.0:
+            self.rejected += 1
+            return False
+        bucket[0] -= 1.0
+        return True
+
+    def _prune(self, now: float):
+        """Drop buckets that would be full again (clients gone quiet)."""
+        full_after = self.capacity / self.rate
+        self._buckets = {ip: b for ip, b in self._buckets.items() if now - b[1] < full_after}
+        # Under a wide flood most buckets are live; don't rescan on every accept
+        self._prune_at = max(self.PRUNE_AT, 2 * len(self._buckets))
+
+    @property
+    def tracked(self) -> int:
+        return len(self._buckets)
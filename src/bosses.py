@@ -77,6 +77,12 @@ class Boss(Mobile):
     def has_cast(self) -> bool:
         return self.ai_state.get('cast') is not None
 
+    def ai_think_delay(self):
+        """Boss AI only acts in combat; sleep until attacked otherwise."""
+        if self.is_fighting:
+            return 1
+        return None
+
     async def process_ai(self):
         if not self.is_alive:
             return
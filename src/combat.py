@@ -276,6 +276,10 @@ class CombatHandler:
         defender.fighting = attacker
         attacker.position = 'fighting'
         defender.position = 'fighting'
+        # Wake NPC AI so combat behaviours start on the next pulse
+        for combatant in (attacker, defender):
+            if hasattr(combatant, 'wake'):
+                combatant.wake()
         # Auto-target when entering combat
         if hasattr(attacker, 'target') and (not attacker.target or attacker.target not in attacker.room.characters):
             attacker.target = defender
@@ -2081,6 +2085,7 @@ class CombatHandler:
         # Start combat if not already fighting
         if not player.is_fighting:
             await cls.start_combat(player, target)
+        player.add_wait_state('kick')
         skill_level = player.get_skill_level('kick')
 
         # Check if kick lands
@@ -2119,6 +2124,7 @@ class CombatHandler:
         # Start combat if not already fighting
         if not player.is_fighting:
             await cls.start_combat(player, target)
+        player.add_wait_state('bash')
         skill_level = player.get_skill_level('bash')
 
         if random.randint(1, 100) <= skill_level:
@@ -2164,6 +2170,7 @@ class CombatHandler:
         if not weapon or getattr(weapon, 'weapon_type', '') not in ('stab', 'pierce'):
             await player.send(f"{c['red']}You need a piercing weapon to backstab!{c['reset']}")
             return False
+        player.add_wait_state('backstab')
 
         # Stealth/detection rolls
         env_bonus = 0
@@ -0,0 +1,46 @@
+"""
+Misthollow Command Groups
+========================
+Player and immortal commands, one module per group.
+
+Each module defines one class whose methods are written exactly as they
+would be on ``CommandHandler``; ``cls`` is always ``CommandHandler`` once
+they are attached. Importing this package does not import the groups:
+``CommandGroups`` reads each module's source for the names it defines and
+imports the module the first time one of those names is used.
+
+A name may only be defined by one group.
+"""
+
+# Group module -> what it holds, in the order ``cmdgroup`` lists them
+GROUPS = {
+    'movement': 'Walking, positions, doors, travel and mounts',
+    'information': 'Looking around, character info, help, news and world events',
+    'skills': 'General skills: stealth, tricks, light and dual wielding',
+    'olc': 'Online room, mobile and object editors',
+    'combat': 'Fighting, fleeing, targeting and combat settings',
+    'magic': 'Casting, spell lists and mage abilities',
+    'progression': 'Skills, talents, practice, levels and prestige',
+    'bard': 'Bard performances and inspiration',
+    'warrior': 'Warrior rage, stances and shouts',
+    'ranger': 'Ranger tracking and archery',
+    'paladin': 'Paladin auras and holy power',
+    'thief': 'Thief combo points and luck',
+    'cleric': 'Cleric divine favor and faith',
+    'necromancer': 'Necromancer soul shards',
+    'talents': 'Talent and level 31-60 class abilities',
+    'items': 'Picking up, wearing, giving and using items',
+    'consumables': 'Eating, drinking and potions',
+    'crafting': 'Gathering and crafting',
+    'quests': 'Quests, story and reputation',
+    'communication': 'Talking, channels, NPC chat, friends and mail',
+    'socials': 'Social emotes',
+    'companions': 'Pets, hirelings, minions and companions',
+    'commerce': 'Shops, banking, auction and player trading',
+    'party': 'Grouping and following',
+    'settings': 'Toggles, display options, aliases and saving',
+    'rent': 'Rent, storage and quitting',
+    'housing': 'Player housing',
+    'pvp': 'Duels and the arena',
+    'immortal': 'Immortal and administration commands',
+}
@@ -0,0 +1,570 @@
+"""
+Misthollow Bard Commands
+=======================
+Bard performances and inspiration.
+"""
+
+import random
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class BardCommands:
+    """Bard commands."""
+
+    @classmethod
+    async def cmd_songs(cls, player: 'Player', args: List[str]):
+        """Show known bard songs and current performance status."""
+        c = player.config.COLORS
+        
+        if player.char_class.lower() != 'bard':
+            await player.send(f"{c['red']}Only bards can perform songs!{c['reset']}")
+            return
+        
+        from spells import BARD_SONGS
+        
+        # Get songs available to this bard
+        known_songs = []
+        for song_key, song_data in BARD_SONGS.items():
+            if player.level >= song_data['level']:
+                known_songs.append((song_key, song_data))
+        
+        await player.send(f"{c['bright_magenta']}╔═══════════════════════════════════════════════════╗{c['reset']}")
+        await player.send(f"{c['bright_magenta']}║{c['bright_yellow']}  ♪  BARD SONGS  ♪                                 {c['bright_magenta']}║{c['reset']}")
+        await player.send(f"{c['bright_magenta']}╠═══════════════════════════════════════════════════╣{c['reset']}")
+        
+        if player.performing:
+            current = BARD_SONGS.get(player.performing, {})
+            encore_str = f" {c['bright_yellow']}[ENCORE!]{c['reset']}" if player.encore_active else ""
+            await player.send(f"{c['bright_magenta']}║ {c['bright_green']}♪ NOW PLAYING: {current.get('name', player.performing)}{encore_str}")
+            await player.send(f"{c['bright_magenta']}║ {c['cyan']}  Duration: {player.performance_ticks} ticks | Mana/tick: {current.get('mana_per_tick', 0)}")
+            await player.send(f"{c['bright_magenta']}╠═══════════════════════════════════════════════════╣{c['reset']}")
+        
+        if not known_songs:
+            await player.send(f"{c['bright_magenta']}║ {c['yellow']}You haven't learned any songs yet!{c['reset']}")
+        else:
+            for song_key, song_data in known_songs:
+                name = song_data['name']
+                mana = song_data['mana_per_tick']
+                lvl = song_data['level']
+                target = song_data['target'].title()
+                playing = " ♪" if player.performing == song_key else ""
+                await player.send(f"{c['bright_magenta']}║ {c['bright_cyan']}{name:<25} {c['white']}Mana: {mana}/tick  Lvl {lvl:<2} ({target}){playing}")
+        
+        await player.send(f"{c['bright_magenta']}╠═══════════════════════════════════════════════════╣{c['reset']}")
+        await player.send(f"{c['bright_magenta']}║ {c['cyan']}Commands: perform <song>, stop, encore{c['bright_magenta']}            ║{c['reset']}")
+        await player.send(f"{c['bright_magenta']}╚═══════════════════════════════════════════════════╝{c['reset']}")
+    
+    @classmethod
+    async def cmd_perform(cls, player: 'Player', args: List[str]):
+        """Start performing a bard song."""
+        c = player.config.COLORS
+        
+        if player.char_class.lower() != 'bard':
+            await player.send(f"{c['red']}Only bards can perform songs!{c['reset']}")
+            return
+        
+        if not args:
+            await player.send(f"{c['yellow']}Perform which song? Type 'songs' to see your repertoire.{c['reset']}")
+            return
+        
+        from spells import BARD_SONGS
+        
+        song_input = '_'.join(args).lower()
+        
+        # Find matching song
+        matching_song = None
+        for song_key in BARD_SONGS:
+            if song_key == song_input or song_key.startswith(song_input):
+                matching_song = song_key
+                break
+            # Also check display name
+            song_name = BARD_SONGS[song_key]['name'].lower().replace(' ', '_')
+            if song_name.startswith(song_input.replace(' ', '_')):
+                matching_song = song_key
+                break
+        
+        if not matching_song:
+            await player.send(f"{c['red']}You don't know the song '{' '.join(args)}'.{c['reset']}")
+            await player.send(f"{c['cyan']}Type 'songs' to see your repertoire.{c['reset']}")
+            return
+        
+        song = BARD_SONGS[matching_song]
+        
+        # Check level requirement
+        if player.level < song['level']:
+            await player.send(f"{c['red']}You need to be level {song['level']} to perform {song['name']}!{c['reset']}")
+            return
+        
+        # Check if already performing
+        if player.performing:
+            if player.performing == matching_song:
+                await player.send(f"{c['yellow']}You're already performing {song['name']}!{c['reset']}")
+                return
+            # Switch songs
+            old_song = BARD_SONGS.get(player.performing, {})
+            await player.send(f"{c['cyan']}{old_song.get('end_self', 'Your song ends.')}{c['reset']}")
+            if player.room:
+                await player.room.send_to_room(
+                    old_song.get('end_room', '$n stops playing.').replace('$n', player.name),
+                    exclude=[player]
+                )
+        
+        # Check mana
+        if player.mana < song['mana_per_tick']:
+            await player.send(f"{c['red']}You don't have enough mana to begin performing!{c['reset']}")
+            return
+        
+        # Check if song is combat-only or non-combat only
+        if song.get('combat_only') == False and player.is_fighting:
+            await player.send(f"{c['red']}{song['name']} can only be performed out of combat!{c['reset']}")
+            return
+        
+        # Start performing
+        player.performing = matching_song
+        player.performance_ticks = 0
+        player.encore_active = False
+        player.lullaby_saves = {}  # Reset lullaby tracking
+        
+        await player.send(f"{c['bright_magenta']}{song['start_self']}{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(
+                song['start_room'].replace('$n', player.name),
+                exclude=[player]
+            )
+    
+    @classmethod
+    async def cmd_stop(cls, player: 'Player', args: List[str]):
+        """Stop the current bard performance."""
+        c = player.config.COLORS
+        
+        if not player.performing:
+            await player.send(f"{c['yellow']}You're not performing anything.{c['reset']}")
+            return
+        
+        from spells import BARD_SONGS
+        song = BARD_SONGS.get(player.performing, {})
+        
+        await player.send(f"{c['cyan']}{song.get('end_self', 'You stop playing.')}{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(
+                song.get('end_room', '$n stops playing.').replace('$n', player.name),
+                exclude=[player]
+            )
+        
+        player.performing = None
+        player.performance_ticks = 0
+        player.encore_active = False
+        player.encore_ticks = 0
+        player.lullaby_saves = {}
+    
+    @classmethod
+    async def cmd_encore(cls, player: 'Player', args: List[str]):
+        """Reapply current song buff at 2x strength for 2 ticks. Costs 3 Inspiration. 30s CD."""
+        c = player.config.COLORS
+        import time
+
+        if player.char_class.lower() != 'bard':
+            await player.send(f"{c['red']}Only bards can perform encores!{c['reset']}")
+            return
+        if not player.performing:
+            await player.send(f"{c['red']}You must be performing a song to use encore!{c['reset']}")
+            return
+
+        now = time.time()
+        cd = getattr(player, 'encore_cooldown', 0)
+        if now < cd:
+            await player.send(f"{c['yellow']}Encore on cooldown ({int(cd - now)}s).{c['reset']}")
+            return
+
+        insp_cost = 3
+        try:
+            from talents import TalentManager
+            if TalentManager.get_talent_rank(player, 'encore_mastery') > 0:
+                insp_cost = 2
+        except Exception:
+            pass
+
+        if getattr(player, 'inspiration', 0) < insp_cost:
+            await player.send(f"{c['red']}You need {insp_cost} Inspiration! (Current: {player.inspiration}){c['reset']}")
+            return
+
+        player.inspiration -= insp_cost
+        player.encore_active = True
+        player.encore_ticks = 2
+        player.encore_cooldown = now + 30
+
+        from spells import BARD_SONGS
+        song = BARD_SONGS.get(player.performing, {})
+
+        await player.send(f"{c['bright_yellow']}♪♪ ENCORE! ♪♪ Your {song.get('name', 'song')} swells with double power!{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"♪♪ {player.name}'s performance reaches a powerful crescendo! ♪♪", exclude=[player])
+    
+    @classmethod
+    async def cmd_countersong(cls, player: 'Player', args: List[str]):
+        """Use your music to dispel magical effects."""
+        c = player.config.COLORS
+        import time
+        
+        if player.char_class.lower() != 'bard':
+            await player.send(f"{c['red']}Only bards can perform countersong!{c['reset']}")
+            return
+        
+        if 'countersong' not in player.skills:
+            await player.send(f"{c['red']}You haven't learned countersong yet!{c['reset']}")
+            return
+        
+        # Check cooldown (30 seconds)
+        now = time.time()
+        if now - player.last_countersong < 30:
+            remaining = int(30 - (now - player.last_countersong))
+            await player.send(f"{c['yellow']}Countersong is on cooldown! ({remaining}s remaining){c['reset']}")
+            return
+        
+        # Check mana cost
+        if player.mana < 25:
+            await player.send(f"{c['red']}You need 25 mana to perform countersong!{c['reset']}")
+            return
+        
+        player.mana -= 25
+        player.last_countersong = now
+        
+        skill_level = player.skills.get('countersong', 50)
+        
+        await player.send(f"{c['bright_cyan']}♪ You weave a countersong to disrupt magical energies! ♪{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(
+                f"{player.name} begins a disruptive countersong!",
+                exclude=[player]
+            )
+        
+        from affects import AffectManager
+        
+        # Try to remove debuffs from allies
+        dispelled_ally = 0
+        for char in player.room.characters:
+            if char == player or (hasattr(char, 'is_hostile') and char.is_hostile):
+                continue
+            # Try to remove negative effects
+            if hasattr(char, 'affects') and char.affects:
+                debuffs = ['poison', 'blindness', 'curse', 'weakness', 'slow', 'fear', 'silence']
+                for debuff in debuffs:
+                    if debuff in char.affects and random.randint(1, 100) <= skill_level:
+                        AffectManager.remove_affect_by_name(char, debuff)
+                        dispelled_ally += 1
+                        if hasattr(char, 'send'):
+                            await char.send(f"{c['bright_cyan']}The countersong dispels your {debuff}!{c['reset']}")
+        
+        # Try to remove buffs from enemies
+        dispelled_enemy = 0
+        from mobs import Mobile
+        for char in player.room.characters:
+            if isinstance(char, Mobile):
+                if hasattr(char, 'affects') and char.affects:
+                    buffs = ['haste', 'bless', 'armor', 'sanctuary', 'shield']
+                    for buff in buffs:
+                        if buff in char.affects and random.randint(1, 100) <= skill_level // 2:
+                            AffectManager.remove_affect_by_name(char, buff)
+                            dispelled_enemy += 1
+                            await player.send(f"{c['cyan']}Your countersong strips {buff} from {char.name}!{c['reset']}")
+        
+        if dispelled_ally + dispelled_enemy == 0:
+            await player.send(f"{c['yellow']}Your countersong fails to dispel anything.{c['reset']}")
+        else:
+            total = dispelled_ally + dispelled_enemy
+            await player.send(f"{c['bright_green']}Your countersong dispelled {total} magical effect{'s' if total != 1 else ''}!{c['reset']}")
+    
+    @classmethod
+    async def cmd_fascinate(cls, player: 'Player', args: List[str]):
+        """Charm an enemy with your music, preventing them from attacking."""
+        c = player.config.COLORS
+        
+        if player.char_class.lower() != 'bard':
+            await player.send(f"{c['red']}Only bards can fascinate!{c['reset']}")
+            return
+        
+        if 'fascinate' not in player.skills:
+            await player.send(f"{c['red']}You haven't learned fascinate yet!{c['reset']}")
+            return
+        
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send(f"{c['yellow']}Fascinate whom?{c['reset']}")
+                return
+        
+        target_name = ' '.join(args)
+        target = player.find_target_in_room(target_name)
+        
+        from mobs import Mobile
+        if target and not isinstance(target, Mobile):
+            target = None
+        
+        if not target:
+            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
+            return
+        
+        if target.is_fighting:
+            await player.send(f"{c['red']}{target.name} is too alert to be fascinated!{c['reset']}")
+            return
+        
+        # Check mana
+        if player.mana < 20:
+            await player.send(f"{c['red']}You need 20 mana to fascinate!{c['reset']}")
+            return
+        
+        player.mana -= 20
+        skill_level = player.skills.get('fascinate', 50)
+        
+        # Charm check
+        if random.randint(1, 100) <= skill_level:
+            from affects import AffectManager
+            duration = 3 + (player.level // 10)
+            affect_data = {
+                'name': 'fascinated',
+                'type': AffectManager.TYPE_FLAG,
+                'applies_to': 'charmed',
+                'value': 1,
+                'duration': duration,
+                'caster_level': player.level
+            }
+            AffectManager.apply_affect(target, affect_data)
+            
+            await player.send(f"{c['bright_magenta']}♪ Your captivating melody fascinates {target.name}! ♪{c['reset']}")
+            await player.room.send_to_room(
+                f"{target.name} stares dreamily at {player.name}, fascinated by the music.",
+                exclude=[player]
+            )
+        else:
+            await player.send(f"{c['yellow']}{target.name} resists your captivating melody.{c['reset']}")
+    
+    @classmethod
+    async def cmd_mock(cls, player: 'Player', args: List[str]):
+        """Taunt an enemy with vicious mockery, debuffing them."""
+        c = player.config.COLORS
+        
+        if player.char_class.lower() != 'bard':
+            await player.send(f"{c['red']}Only bards can use mockery!{c['reset']}")
+            return
+        
+        if 'mockery' not in player.skills:
+            await player.send(f"{c['red']}You haven't learned mockery yet!{c['reset']}")
+            return
+        
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send(f"{c['yellow']}Mock whom?{c['reset']}")
+                return
+        
+        target_name = ' '.join(args)
+        target = player.find_target_in_room(target_name)
+        
+        if not target:
+            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
+            return
+        
+        # Check mana
+        if player.mana < 10:
+            await player.send(f"{c['red']}You need 10 mana for mockery!{c['reset']}")
+            return
+        
+        player.mana -= 10
+        skill_level = player.skills.get('mockery', 50)
+        
+        # Mockery always lands some effect
+        from affects import AffectManager
+        
+        # Psychic damage
+        damage = random.randint(1, 4) + (player.level // 5)
+        
+        # Debuff
+        if random.randint(1, 100) <= skill_level:
+            duration = 2 + (player.level // 15)
+            affect_data = {
+                'name': 'mocked',
+                'type': AffectManager.TYPE_MODIFY_STAT,
+                'applies_to': 'hitroll',
+                'value': -2,
+                'duration': duration,
+                'caster_level': player.level
+            }
+            AffectManager.apply_affect(target, affect_data)
+            
+            insults = [
+                f"Your mother was a hamster and your father smelt of elderberries!",
+                f"I've seen scarier things in a goblin's lunchbox!",
+                f"Even the village idiot thinks you're an embarrassment!",
+                f"You fight like a dairy farmer!",
+                f"I've met corpses with more charisma than you!",
+            ]
+            insult = random.choice(insults)
+            
+            await player.send(f"{c['bright_yellow']}♪ \"{insult}\" ♪ [{damage} psychic damage]{c['reset']}")
+            if hasattr(target, 'send'):
+                await target.send(f"{c['red']}{player.name} mocks you viciously! You feel demoralized.{c['reset']}")
+            await player.room.send_to_room(
+                f"{player.name} hurls vicious mockery at {target.name}!",
+                exclude=[player, target]
+            )
+        else:
+            await player.send(f"{c['yellow']}Your mockery falls flat, but still stings. [{damage} damage]{c['reset']}")
+        
+        await target.take_damage(damage, player)
+        
+        # Start combat if not already fighting
+        if not player.is_fighting:
+            from combat import CombatHandler
+            await CombatHandler.start_combat(player, target)
+
+    
+    # ----- BARD: Inspiration Abilities -----
+
+    @classmethod
+    async def cmd_crescendo(cls, player: 'Player', args: List[str]):
+        """Massive sonic damage (int*5). Costs 5 Inspiration. 20s CD. Bard only."""
+        c = player.config.COLORS
+        import time
+
+        if player.char_class.lower() != 'bard':
+            await player.send(f"{c['red']}Only bards can use Crescendo!{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
+            return
+
+        now = time.time()
+        cd = getattr(player, 'crescendo_cooldown', 0)
+        if now < cd:
+            await player.send(f"{c['yellow']}Crescendo on cooldown ({int(cd - now)}s).{c['reset']}")
+            return
+        if getattr(player, 'inspiration', 0) < 5:
+            await player.send(f"{c['red']}You need 5 Inspiration! (Current: {player.inspiration}){c['reset']}")
+            return
+
+        target = player.fighting
+        player.inspiration -= 5
+        player.crescendo_cooldown = now + 20
+
+        damage = player.int * 5
+        await player.send(f"{c['bright_yellow']}🎵 CRESCENDO! A devastating wave of sound strikes {target.name}! [{damage}]{c['reset']}")
+        if hasattr(target, 'send'):
+            await target.send(f"{c['bright_yellow']}{player.name}'s music hits you like a wall of sound! [{damage}]{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name}'s music builds to a devastating crescendo!", exclude=[player, target])
+
+        killed = await target.take_damage(damage, player)
+        if killed:
+            from combat import CombatHandler
+            await CombatHandler.handle_death(player, target)
+
+    @classmethod
+    async def cmd_magnum_opus(cls, player: 'Player', args: List[str]):
+        """AoE party buff: +20% damage/healing/DR for 20s. Costs 10 Inspiration. 180s CD. Bard only."""
+        c = player.config.COLORS
+        import time
+
+        if player.char_class.lower() != 'bard':
+            await player.send(f"{c['red']}Only bards can perform a Magnum Opus!{c['reset']}")
+            return
+
+        now = time.time()
+        cd = getattr(player, 'magnum_opus_cooldown', 0)
+        if now < cd:
+            await player.send(f"{c['yellow']}Magnum Opus on cooldown ({int(cd - now)}s).{c['reset']}")
+            return
+        if getattr(player, 'inspiration', 0) < 10:
+            await player.send(f"{c['red']}You need 10 Inspiration! (Current: {player.inspiration}){c['reset']}")
+            return
+
+        player.inspiration -= 10
+        player.magnum_opus_cooldown = now + 180
+
+        from affects import AffectManager
+
+        # Buff self and group
+        targets = [player]
+        if player.group:
+            for member in player.group.members:
+                if member != player and member.room == player.room:
+                    targets.append(member)
+
+        for t in targets:
+            AffectManager.apply_affect(t, {
+                'name': 'magnum_opus_dmg', 'type': AffectManager.TYPE_MODIFY_STAT,
+                'applies_to': 'damroll', 'value': max(1, int(t.get_damage_bonus() * 0.20)),
+                'duration': 10, 'caster_level': player.level
+            })
+            AffectManager.apply_affect(t, {
+                'name': 'magnum_opus_dr', 'type': AffectManager.TYPE_MODIFY_STAT,
+                'applies_to': 'damage_reduction', 'value': 20,
+                'duration': 10, 'caster_level': player.level
+            })
+            if hasattr(t, 'send') and t != player:
+                await t.send(f"{c['bright_yellow']}🎵 {player.name}'s Magnum Opus empowers you! +20% damage, +20% DR!{c['reset']}")
+
+        await player.send(f"{c['bright_yellow']}🎵 MAGNUM OPUS! Your masterwork empowers {len(targets)} allies! +20% damage, +20% DR for 20s!{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"🎵 {player.name} performs a magnificent Magnum Opus!", exclude=[player])
+
+    @classmethod
+    async def cmd_discordant_note(cls, player: 'Player', args: List[str]):
+        """Silence target 2 rounds + int*3 sonic damage. Costs 4 Inspiration. 25s CD. Bard only."""
+        c = player.config.COLORS
+        import time
+
+        if player.char_class.lower() != 'bard':
+            await player.send(f"{c['red']}Only bards can use Discordant Note!{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
+            return
+
+        now = time.time()
+        cd = getattr(player, 'discordant_note_cooldown', 0)
+        if now < cd:
+            await player.send(f"{c['yellow']}Discordant Note on cooldown ({int(cd - now)}s).{c['reset']}")
+            return
+        if getattr(player, 'inspiration', 0) < 4:
+            await player.send(f"{c['red']}You need 4 Inspiration! (Current: {player.inspiration}){c['reset']}")
+            return
+
+        target = player.fighting
+        player.inspiration -= 4
+        player.discordant_note_cooldown = now + 25
+
+        damage = player.int * 3
+
+        # Silence effect
+        silence_rounds = 2
+        try:
+            from talents import TalentManager
+            if TalentManager.get_talent_rank(player, 'discordant_mastery') > 0:
+                silence_rounds = 3
+        except Exception:
+            pass
+
+        from affects import AffectManager
+        AffectManager.apply_affect(target, {
+            'name': 'silenced', 'type': AffectManager.TYPE_FLAG,
+            'applies_to': 'silenced', 'value': 1,
+            'duration': silence_rounds, 'caster_level': player.level
+        })
+
+        await player.send(f"{c['bright_yellow']}🎵 DISCORDANT NOTE! {target.name} is silenced for {silence_rounds} rounds! [{damage}]{c['reset']}")
+        if hasattr(target, 'send'):
+            await target.send(f"{c['bright_yellow']}{player.name}'s jarring note silences you! [{damage}]{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name} strikes a discordant note at {target.name}!", exclude=[player, target])
+
+        killed = await target.take_damage(damage, player)
+        if killed:
+            from combat import CombatHandler
+            await CombatHandler.handle_death(player, target)
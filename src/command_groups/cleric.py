@@ -0,0 +1,315 @@
+"""
+Misthollow Cleric Commands
+=========================
+Cleric divine favor and faith.
+"""
+
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class ClericCommands:
+    """Cleric commands."""
+
+    @classmethod
+    async def cmd_turnundead(cls, player: 'Player', args: List[str]):
+        """Turn undead creatures, causing fear or destroying weak ones."""
+        c = player.config.COLORS
+        import time
+        import random
+        
+        if player.char_class.lower() not in ('cleric', 'paladin'):
+            await player.send(f"{c['red']}Only clerics and paladins can turn undead!{c['reset']}")
+            return
+        
+        # Check cooldown (30 seconds)
+        now = time.time()
+        if now - player.last_turn_undead < 30:
+            remaining = int(30 - (now - player.last_turn_undead))
+            await player.send(f"{c['yellow']}Turn Undead is on cooldown! ({remaining}s){c['reset']}")
+            return
+        
+        if player.mana < 20:
+            await player.send(f"{c['red']}You need 20 mana to turn undead!{c['reset']}")
+            return
+        
+        player.mana -= 20
+        player.last_turn_undead = now
+        
+        await player.send(f"{c['bright_yellow']}✟ You raise your holy symbol and invoke divine power! ✟{c['reset']}")
+        await player.room.send_to_room(
+            f"{player.name} raises a holy symbol, radiating divine light!",
+            exclude=[player]
+        )
+        
+        from mobs import Mobile
+        from affects import AffectManager
+        
+        undead_keywords = ['undead', 'skeleton', 'zombie', 'vampire', 'lich', 'ghost', 'wraith', 'ghoul', 'wight', 'specter']
+        
+        turned = 0
+        destroyed = 0
+        
+        for char in list(player.room.characters):
+            if not isinstance(char, Mobile):
+                continue
+            
+            is_undead = False
+            for kw in undead_keywords:
+                if kw in char.name.lower():
+                    is_undead = True
+                    break
+            
+            if not is_undead:
+                continue
+            
+            # Check if destroyed (weak undead) or turned (strong)
+            level_diff = player.level - char.level
+            
+            if level_diff >= 5:
+                # Destroy weak undead
+                destroyed += 1
+                await player.send(f"{c['bright_yellow']}{char.name} is destroyed by holy power!{c['reset']}")
+                
+                # Remove from room and world
+                if char in player.room.characters:
+                    player.room.characters.remove(char)
+                if hasattr(player.world, 'npcs') and char in player.world.npcs:
+                    player.world.npcs.remove(char)
+                
+                # Give XP
+                from combat import CombatHandler
+                await CombatHandler.award_experience(player, char)
+            else:
+                # Turn (fear) stronger undead
+                if random.randint(1, 100) <= 70 + (level_diff * 5):
+                    turned += 1
+                    affect_data = {
+                        'name': 'turned',
+                        'type': AffectManager.TYPE_FLAG,
+                        'applies_to': 'feared',
+                        'value': 1,
+                        'duration': 3,
+                        'caster_level': player.level
+                    }
+                    AffectManager.apply_affect(char, affect_data)
+                    await player.send(f"{c['yellow']}{char.name} cowers from your holy power!{c['reset']}")
+        
+        if turned == 0 and destroyed == 0:
+            await player.send(f"{c['cyan']}There are no undead here to turn.{c['reset']}")
+        else:
+            await player.send(f"{c['bright_green']}Turned {turned}, destroyed {destroyed} undead!{c['reset']}")
+            
+            # Gain divine favor
+            if player.char_class.lower() == 'cleric':
+                favor_gain = (turned + destroyed * 2) * 5
+                player.divine_favor = min(100, player.divine_favor + favor_gain)
+                await player.send(f"{c['cyan']}(+{favor_gain} Divine Favor){c['reset']}")
+    
+    @classmethod
+    async def cmd_divinefavor(cls, player: 'Player', args: List[str]):
+        """View current divine favor."""
+        c = player.config.COLORS
+        
+        if player.char_class.lower() != 'cleric':
+            await player.send(f"{c['red']}Only clerics have divine favor!{c['reset']}")
+            return
+        
+        favor_bar = cls._make_bar(player.divine_favor, 100, 20, c['bright_yellow'], c['yellow'])
+        
+        await player.send(f"{c['bright_yellow']}╔══════════════════════════════════════════════════╗{c['reset']}")
+        await player.send(f"{c['bright_yellow']}║  ✟ DIVINE FAVOR ✟                                {c['bright_yellow']}║{c['reset']}")
+        await player.send(f"{c['bright_yellow']}╠══════════════════════════════════════════════════╣{c['reset']}")
+        await player.send(f"{c['bright_yellow']}║ {favor_bar} {player.divine_favor}/100{c['reset']}")
+        await player.send(f"{c['bright_yellow']}╠══════════════════════════════════════════════════╣{c['reset']}")
+        await player.send(f"{c['bright_yellow']}║ {c['cyan']}Gain favor: Heal allies, turn undead{c['reset']}")
+        await player.send(f"{c['bright_yellow']}║ {c['cyan']}Spend favor: holysmite (50), sanctuary (30){c['reset']}")
+        await player.send(f"{c['bright_yellow']}╚══════════════════════════════════════════════════╝{c['reset']}")
+    
+    @classmethod
+    async def cmd_holysmite(cls, player: 'Player', args: List[str]):
+        """Spend divine favor for a powerful holy attack."""
+        c = player.config.COLORS
+        import random
+        
+        if player.char_class.lower() != 'cleric':
+            await player.send(f"{c['red']}Only clerics can use holy smite!{c['reset']}")
+            return
+        
+        if player.divine_favor < 50:
+            await player.send(f"{c['red']}You need 50 divine favor to use holy smite! (Current: {player.divine_favor}){c['reset']}")
+            return
+        
+        if not player.is_fighting:
+            await player.send(f"{c['red']}You must be fighting to smite!{c['reset']}")
+            return
+        
+        player.divine_favor -= 50
+        target = player.fighting
+        
+        damage = random.randint(20, 40) + player.level + (player.wis - 10)
+        
+        await player.send(f"{c['bright_yellow']}✟ You channel divine favor into a devastating holy smite! [{damage}] ✟{c['reset']}")
+        if hasattr(target, 'send'):
+            await target.send(f"{c['bright_yellow']}{player.name} smites you with divine power!{c['reset']}")
+        
+        killed = await target.take_damage(damage, player)
+        if killed:
+            from combat import CombatHandler
+            await CombatHandler.handle_death(player, target)
+
+
+    @classmethod
+    async def cmd_oath(cls, player: 'Player', args: List[str]):
+        """Swear a paladin oath. Usage: oath vengeance|devotion|justice"""
+        c = player.config.COLORS
+        if player.char_class.lower() != 'paladin':
+            await player.send(f"{c['red']}Only paladins can swear oaths!{c['reset']}")
+            return
+        if not args:
+            current = getattr(player, 'active_oath', None) or 'none'
+            await player.send(f"{c['cyan']}Current oath: {c['bright_yellow']}{current}{c['reset']}")
+            await player.send(f"{c['white']}Usage: oath vengeance|devotion|justice{c['reset']}")
+            await player.send(f"{c['white']}  Vengeance: +15% dmg, -10% healing, faster Holy Power from hits{c['reset']}")
+            await player.send(f"{c['white']}  Devotion: +20% healing, +10% DR, Holy Power from heals{c['reset']}")
+            await player.send(f"{c['white']}  Justice: +10% dmg, +10% healing, balanced generation{c['reset']}")
+            return
+        oath = args[0].lower()
+        if oath not in ('vengeance', 'devotion', 'justice'):
+            await player.send(f"{c['red']}Valid oaths: vengeance, devotion, justice{c['reset']}")
+            return
+        if player.active_oath == oath:
+            await player.send(f"{c['yellow']}You have already sworn the Oath of {oath.title()}.{c['reset']}")
+            return
+        player.holy_power = 0  # Switching costs all holy power
+        player.active_oath = oath
+        await player.send(f"{c['bright_yellow']}✟ You swear the Oath of {oath.title()}! Holy Power reset to 0.{c['reset']}")
+        await player.room.send_to_room(f"{player.name} swears the Oath of {oath.title()}!", exclude=[player])
+
+    # --- CLERIC FAITH ABILITIES ---
+
+    @classmethod
+    async def cmd_divine_word(cls, player: 'Player', args: List[str]):
+        """AoE group heal. Costs 3 Faith. Cleric only. 20s CD."""
+        import time
+        c = player.config.COLORS
+        if player.char_class.lower() != 'cleric':
+            await player.send(f"{c['red']}Only clerics can use Divine Word!{c['reset']}")
+            return
+        now = time.time()
+        if now < getattr(player, 'divine_word_cooldown', 0):
+            remaining = int(player.divine_word_cooldown - now)
+            await player.send(f"{c['yellow']}Divine Word on cooldown ({remaining}s).{c['reset']}")
+            return
+        if player.faith < 3:
+            await player.send(f"{c['red']}You need 3 Faith! (Current: {player.faith}/10){c['reset']}")
+            return
+        player.faith -= 3
+        player.divine_word_cooldown = now + 20
+        heal_pct = 0.15
+        if getattr(player, 'shadow_form', False):
+            heal_pct = int(heal_pct * 0.70 * 100) / 100  # -30% healing in shadow form
+        # Heal all group members in room
+        healed = []
+        if player.group:
+            for member in player.group.members:
+                if member.room == player.room:
+                    heal = int(member.max_hp * heal_pct)
+                    member.hp = min(member.max_hp, member.hp + heal)
+                    healed.append((member, heal))
+        else:
+            heal = int(player.max_hp * heal_pct)
+            player.hp = min(player.max_hp, player.hp + heal)
+            healed.append((player, heal))
+        await player.send(f"{c['bright_green']}✨ Divine Word! Healing light fills the room!{c['reset']}")
+        for member, heal in healed:
+            if member == player:
+                await player.send(f"{c['green']}You are healed for {heal} HP!{c['reset']}")
+            else:
+                await player.send(f"{c['green']}{member.name} is healed for {heal} HP!{c['reset']}")
+                if hasattr(member, 'send'):
+                    await member.send(f"{c['bright_green']}{player.name}'s Divine Word heals you for {heal} HP!{c['reset']}")
+
+    @classmethod
+    async def cmd_holy_fire(cls, player: 'Player', args: List[str]):
+        """Massive holy damage + DoT. Costs 5 Faith. Cleric only. 25s CD."""
+        import time
+        c = player.config.COLORS
+        if player.char_class.lower() != 'cleric':
+            await player.send(f"{c['red']}Only clerics can use Holy Fire!{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
+            return
+        now = time.time()
+        if now < getattr(player, 'holy_fire_cooldown', 0):
+            remaining = int(player.holy_fire_cooldown - now)
+            await player.send(f"{c['yellow']}Holy Fire on cooldown ({remaining}s).{c['reset']}")
+            return
+        if player.faith < 5:
+            await player.send(f"{c['red']}You need 5 Faith! (Current: {player.faith}/10){c['reset']}")
+            return
+        player.faith -= 5
+        player.holy_fire_cooldown = now + 25
+        target = player.fighting
+        damage = player.int * 5 + player.level * 3
+        dot_damage = damage // 4  # Each of 4 ticks
+        player.holy_fire_dot_target = target
+        player.holy_fire_dot_ticks = 4
+        player.holy_fire_dot_damage = dot_damage
+        await player.send(f"{c['bright_yellow']}🔥 Holy Fire engulfs {target.name}! [{damage}] + DoT{c['reset']}")
+        if hasattr(target, 'send'):
+            await target.send(f"{c['bright_yellow']}{player.name} engulfs you in holy fire! [{damage}]{c['reset']}")
+        killed = await target.take_damage(damage, player)
+        if killed:
+            from combat import CombatHandler
+            await CombatHandler.handle_death(player, target)
+
+    @classmethod
+    async def cmd_divine_intervention(cls, player: 'Player', args: List[str]):
+        """Make target invulnerable for 8s. Costs 10 Faith. 5min CD."""
+        import time
+        c = player.config.COLORS
+        if player.char_class.lower() != 'cleric':
+            await player.send(f"{c['red']}Only clerics can use Divine Intervention!{c['reset']}")
+            return
+        now = time.time()
+        if now < getattr(player, 'divine_intervention_cooldown', 0):
+            remaining = int(player.divine_intervention_cooldown - now)
+            await player.send(f"{c['yellow']}Divine Intervention on cooldown ({remaining}s).{c['reset']}")
+            return
+        if player.faith < 10:
+            await player.send(f"{c['red']}You need 10 Faith! (Current: {player.faith}/10){c['reset']}")
+            return
+        player.faith -= 10
+        player.divine_intervention_cooldown = now + 300
+        # Target self or named ally
+        target = player
+        if args:
+            target_name = ' '.join(args).lower()
+            for ch in player.room.characters:
+                if hasattr(ch, 'connection') and target_name in ch.name.lower():
+                    target = ch
+                    break
+        target.evasion_until = now + 8  # Reuse evasion mechanism for invulnerability
+        await player.send(f"{c['bright_yellow']}✟ DIVINE INTERVENTION! {target.name} is protected by the divine for 8 seconds!{c['reset']}")
+        if target != player and hasattr(target, 'send'):
+            await target.send(f"{c['bright_yellow']}{player.name} grants you Divine Intervention! You are invulnerable!{c['reset']}")
+        await player.room.send_to_room(f"A blinding light surrounds {target.name}!", exclude=[player, target])
+
+    @classmethod
+    async def cmd_shadowform(cls, player: 'Player', args: List[str]):
+        """Toggle shadow form. Cleric only."""
+        c = player.config.COLORS
+        if player.char_class.lower() != 'cleric':
+            await player.send(f"{c['red']}Only clerics can use Shadowform!{c['reset']}")
+            return
+        player.shadow_form = not getattr(player, 'shadow_form', False)
+        if player.shadow_form:
+            await player.send(f"{c['bright_magenta']}You embrace the shadows... +25% shadow damage, -30% healing. Damage builds Faith.{c['reset']}")
+            await player.room.send_to_room(f"{player.name} shifts into shadow form!", exclude=[player])
+        else:
+            await player.send(f"{c['bright_green']}You return to the light. Normal healing restored.{c['reset']}")
+            await player.room.send_to_room(f"{player.name} returns from the shadows.", exclude=[player])
@@ -0,0 +1,1123 @@
+"""
+Misthollow Combat Commands
+=========================
+Fighting, fleeing, targeting and combat settings.
+"""
+
+import time
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class CombatCommands:
+    """Combat commands."""
+
+    @classmethod
+    async def cmd_consider(cls, player: 'Player', args: List[str]):
+        """Consider how tough a mob is and learn about its capabilities."""
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send("Consider whom?")
+                return
+            
+        target_name = ' '.join(args)
+        target = player.find_target_in_room(target_name)
+                
+        if not target:
+            await player.send(f"You don't see '{target_name}' here.")
+            return
+            
+        c = player.config.COLORS
+        diff = target.level - player.level
+        target_level = getattr(target, 'level', 1)
+        
+        await player.send(f"\r\n{c['bright_cyan']}=== Considering: {target.name} ==={c['reset']}")
+        
+        # Difficulty rating and exp info
+        if diff <= -10:
+            msg = f"{c['bright_cyan']}Now where did that chicken go?{c['reset']}"
+            exp_note = "gray (10% exp)"
+            danger = "Trivial"
+            advice = "No real danger."
+        elif diff <= -7:
+            msg = f"{c['cyan']}You could kill {target.name} naked and weaponless.{c['reset']}"
+            exp_note = "trivial (25% exp)"
+            danger = "Trivial"
+            advice = "Very low risk."
+        elif diff <= -4:
+            msg = f"{c['cyan']}{target.name} is far beneath your skill.{c['reset']}"
+            exp_note = "easy (50% exp)"
+            danger = "Easy"
+            advice = "You should win easily."
+        elif diff <= -2:
+            msg = f"{c['bright_green']}{target.name} looks like an easy kill.{c['reset']}"
+            exp_note = "green (80% exp)"
+            danger = "Easy"
+            advice = "You should win with minimal risk."
+        elif diff <= 1:
+            msg = f"{c['green']}A perfect match!{c['reset']}"
+            exp_note = "even (100% exp)"
+            danger = "Even"
+            advice = "Expect a fair fight."
+        elif diff <= 2:
+            msg = f"{c['yellow']}{target.name} might put up a fight.{c['reset']}"
+            exp_note = "yellow (+15% exp)"
+            danger = "Moderate"
+            advice = "Be ready to heal or flee."
+        elif diff <= 4:
+            msg = f"{c['yellow']}{target.name} says 'Do you feel lucky, punk?'{c['reset']}"
+            exp_note = "challenging (+30% exp)"
+            danger = "Challenging"
+            advice = "Bring consumables or a friend."
+        elif diff <= 6:
+            msg = f"{c['bright_red']}{target.name} laughs at your puny weapons.{c['reset']}"
+            exp_note = "dangerous (+50% exp)"
+            danger = "Dangerous"
+            advice = "High risk without a group."
+        else:
+            msg = f"{c['red']}Death will thank you for your gift.{c['reset']}"
+            exp_note = "suicide (+50% exp)"
+            danger = "DEADLY"
+            advice = "Avoid unless you have a strong group."
+            
+        await player.send(msg)
+        await player.send(f"{c['white']}Threat: {danger}  |  Level: {target_level} vs You {player.level}  |  XP: {exp_note}{c['reset']}")
+        await player.send(f"{c['white']}Outcome: {advice}{c['reset']}")
+
+        # Tactical quick stats (OB/DB/PB style)
+        try:
+            player_ob = player.get_hit_bonus()
+            player_db = 100 - player.get_armor_class()
+            player_pb = int(getattr(player, 'damage_reduction', 0))
+            target_ob = target.get_hit_bonus() if hasattr(target, 'get_hit_bonus') else getattr(target, 'hitroll', 0)
+            target_db = 100 - (target.get_armor_class() if hasattr(target, 'get_armor_class') else getattr(target, 'armor_class', 100))
+            target_pb = int(getattr(target, 'damage_reduction', 0))
+            await player.send(
+                f"{c['white']}Tactics:{c['reset']} "
+                f"{c['bright_cyan']}OB/DB/PB{c['reset']} "
+                f"{c['white']}You {player_ob:+d}/{player_db:+d}/{player_pb}% "
+                f"| {target.name} {target_ob:+d}/{target_db:+d}/{target_pb}%{c['reset']}"
+            )
+        except Exception:
+            pass
+
+        # Stance, movement, and defense layers
+        try:
+            stance = getattr(target, 'stance', 'normal')
+            stance_label = stance.title() if isinstance(stance, str) else 'Normal'
+            move = getattr(target, 'move', None)
+            if move is None:
+                move_state = "steady"
+            else:
+                move_state = "winded" if move < player.config.FLEE_MOVE_COST else "steady"
+            defenses = []
+            shield_bonus = target.get_shield_evasion_bonus() if hasattr(target, 'get_shield_evasion_bonus') else 0
+            if shield_bonus > 0:
+                defenses.append(f"shield +{shield_bonus}%")
+            skills = getattr(target, 'skills', {}) or {}
+            if skills.get('parry', 0) > 0:
+                defenses.append('parry')
+            if skills.get('dodge', 0) > 0:
+                defenses.append('dodge')
+            if skills.get('shield_block', 0) > 0:
+                defenses.append('block')
+            if skills.get('evasion', 0) > 0:
+                defenses.append('evasion')
+            if getattr(target, 'damage_reduction', 0) > 0:
+                defenses.append(f"mit {int(getattr(target, 'damage_reduction', 0))}%")
+            defenses_display = ', '.join(defenses[:4]) if defenses else 'baseline'
+            await player.send(
+                f"{c['white']}State:{c['reset']} "
+                f"Stance {stance_label} | Move {move_state} | Defenses: {defenses_display}"
+            )
+        except Exception:
+            pass
+        
+        # Health assessment
+        hp_ratio = target.hp / max(1, target.max_hp)
+        if hp_ratio > 0.9:
+            hp_status = f"{c['bright_green']}excellent condition{c['reset']}"
+        elif hp_ratio > 0.7:
+            hp_status = f"{c['green']}good condition{c['reset']}"
+        elif hp_ratio > 0.5:
+            hp_status = f"{c['yellow']}slightly wounded{c['reset']}"
+        elif hp_ratio > 0.3:
+            hp_status = f"{c['yellow']}wounded{c['reset']}"
+        elif hp_ratio > 0.15:
+            hp_status = f"{c['red']}badly wounded{c['reset']}"
+        else:
+            hp_status = f"{c['bright_red']}near death{c['reset']}"
+        await player.send(f"{c['white']}Health: {hp_status}{c['reset']}")
+        
+        # Combat style assessment (based on stats and equipment)
+        combat_styles = []
+        target_str = getattr(target, 'str', 10)
+        target_int = getattr(target, 'int', 10)
+        target_dex = getattr(target, 'dex', 10)
+        
+        if target_str > target_int and target_str > target_dex:
+            combat_styles.append("heavy hitter")
+        elif target_int > target_str:
+            combat_styles.append("spellcaster")
+        elif target_dex > target_str:
+            combat_styles.append("agile fighter")
+        
+        # Check for special abilities based on mob type/flags
+        special_abilities = []
+        target_flags = getattr(target, 'flags', set())
+        if isinstance(target_flags, list):
+            target_flags = set(target_flags)
+            
+        if 'caster' in target_flags or 'magic_user' in target_flags:
+            special_abilities.append(f"{c['magenta']}casts spells{c['reset']}")
+        if 'healer' in target_flags:
+            special_abilities.append(f"{c['green']}can heal{c['reset']}")
+        if 'poisonous' in target_flags:
+            special_abilities.append(f"{c['bright_green']}poisonous attacks{c['reset']}")
+        if 'stun' in target_flags or 'basher' in target_flags:
+            special_abilities.append(f"{c['yellow']}can stun{c['reset']}")
+        if 'drainer' in target_flags:
+            special_abilities.append(f"{c['magenta']}drains life{c['reset']}")
+        if 'fire' in target_flags or 'firebreath' in target_flags:
+            special_abilities.append(f"{c['red']}fire attacks{c['reset']}")
+        if 'cold' in target_flags or 'frostbreath' in target_flags:
+            special_abilities.append(f"{c['cyan']}cold attacks{c['reset']}")
+            
+        # Boss-specific info
+        if getattr(target, 'is_boss', False) or 'boss' in target_flags:
+            special_abilities.insert(0, f"{c['bright_magenta']}BOSS{c['reset']}")
+            # Show boss abilities if available
+            boss_config = getattr(target, 'boss_config', {})
+            abilities = boss_config.get('abilities', [])
+            for ability in abilities[:3]:  # Show up to 3 abilities
+                ability_name = ability.get('name', ability.get('type', 'unknown'))
+                special_abilities.append(f"{c['bright_yellow']}{ability_name}{c['reset']}")
+        
+        if special_abilities:
+            await player.send(f"{c['cyan']}Special:{c['reset']} {', '.join(special_abilities)}")
+        
+        # Behavior warnings
+        warnings = []
+        if 'aggressive' in target_flags:
+            warnings.append(f"{c['red']}Will attack on sight!{c['reset']}")
+        if 'hunter' in target_flags or 'tracker' in target_flags:
+            warnings.append(f"{c['yellow']}Will hunt you if you flee!{c['reset']}")
+        if 'memory' in target_flags:
+            warnings.append(f"{c['yellow']}Remembers attackers{c['reset']}")
+        if 'assist' in target_flags:
+            warnings.append(f"{c['yellow']}Calls for help{c['reset']}")
+        if 'wimpy' in target_flags:
+            warnings.append(f"{c['green']}Flees when wounded{c['reset']}")
+            
+        if warnings:
+            await player.send(f"{c['red']}Warning:{c['reset']} {', '.join(warnings)}")
+        
+        # Weakness hints (class-specific tips)
+        hints = []
+        mob_class = (getattr(target, 'mob_class', '') or '').lower()
+        if 'undead' in target_flags or 'undead' in str(target.name).lower():
+            hints.append("Vulnerable to holy attacks and turning")
+        if 'animal' in target_flags or mob_class == 'animal':
+            hints.append("Can be calmed or charmed by rangers")
+        if 'humanoid' in target_flags and target_int > 12:
+            hints.append("May be susceptible to sleep/charm spells")
+        if target_dex < 10:
+            hints.append("Low agility - easier to hit")
+        if target_level <= 3:
+            hints.append("Good target for beginners")
+            
+        if hints and player.level >= target_level - 5:  # Only show hints if not too underleveled
+            await player.send(f"{c['cyan']}Insight:{c['reset']} {hints[0]}")
+        
+        await player.send("")
+
+
+    @classmethod
+    async def cmd_target(cls, player: 'Player', args: List[str]):
+        """Set your combat target."""
+        c = player.config.COLORS
+
+        if not args:
+            # Show current target
+            if player.target:
+                await player.send(f"{c['yellow']}Your current target: {c['red']}{player.target.name}{c['reset']}")
+            else:
+                await player.send(f"{c['yellow']}You have no target set.{c['reset']}")
+                await player.send(f"{c['white']}Usage: target <name> - Set combat target{c['reset']}")
+                await player.send(f"{c['white']}       target clear - Clear target{c['reset']}")
+            return
+
+        if args[0].lower() in ['clear', 'none', 'off']:
+            player.target = None
+            await player.send(f"{c['yellow']}Combat target cleared.{c['reset']}")
+            return
+
+        target_name = ' '.join(args).lower()
+        target = player.find_target_in_room(target_name)
+
+        if not target:
+            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
+            return
+
+        # Check if it's a player
+        if hasattr(target, 'connection'):
+            await player.send(f"{c['red']}You can't target other players!{c['reset']}")
+            return
+
+        player.target = target
+        await player.send(f"{c['green']}Target set: {c['red']}{target.name}{c['reset']}")
+
+    @classmethod
+    async def cmd_kill(cls, player: 'Player', args: List[str]):
+        """Attack a target."""
+        c = player.config.COLORS
+
+        # If no args, use current target
+        if not args:
+            if player.target and player.target in player.room.characters:
+                target = player.target
+            else:
+                await player.send("Kill whom?")
+                if player.target:
+                    await player.send(f"{c['yellow']}(Your target is not here. Use 'target <name>' to set a new target){c['reset']}")
+                return
+        else:
+            # Find target with numbered targeting support
+            target_name = ' '.join(args).lower()
+            target = player.find_target_in_room(target_name)
+
+            if not target:
+                await player.send(f"You don't see '{target_name}' here.")
+                return
+            
+        # Check if it's a player
+        if hasattr(target, 'connection'):
+            await player.send("You can't attack other players here!")
+            return
+            
+        # Check if room is peaceful
+        if 'peaceful' in player.room.flags:
+            await player.send("A peaceful feeling overwhelms you. You cannot fight here.")
+            return
+            
+        # Start combat
+        from combat import CombatHandler
+        await CombatHandler.start_combat(player, target)
+        
+    @classmethod
+    async def cmd_attack(cls, player: 'Player', args: List[str]):
+        """Alias for kill."""
+        await cls.cmd_kill(player, args)
+        
+    @classmethod
+    async def cmd_flee(cls, player: 'Player', args: List[str]):
+        """Flee from combat."""
+        if not player.is_fighting:
+            await player.send("You're not fighting anyone!")
+            return
+            
+        from combat import CombatHandler
+        await CombatHandler.attempt_flee(player)
+
+    @classmethod
+    async def cmd_escape(cls, player: 'Player', args: List[str]):
+        """Escape from combat to a chosen direction. Usage: escape <direction>"""
+        c = player.config.COLORS
+        if not player.is_fighting:
+            await player.send(f"{c['yellow']}You're not fighting anyone.{c['reset']}")
+            return
+        if not args:
+            await player.send(f"{c['yellow']}Escape which direction?{c['reset']}")
+            return
+        direction = args[0].lower()
+        dir_map = {'n':'north','s':'south','e':'east','w':'west','u':'up','d':'down'}
+        direction = dir_map.get(direction, direction)
+        if player.room and direction not in player.room.exits and direction not in player.config.DIRECTIONS:
+            await player.send(f"{c['red']}That's not a valid direction.{c['reset']}")
+            return
+        from combat import CombatHandler
+        await CombatHandler.attempt_escape(player, direction)
+
+    @classmethod
+    async def cmd_disengage(cls, player: 'Player', args: List[str]):
+        """Disengage from combat if you're not the primary target."""
+        c = player.config.COLORS
+        if not player.is_fighting:
+            await player.send(f"{c['yellow']}You're not fighting anyone.{c['reset']}")
+            return
+        from combat import CombatHandler
+        await CombatHandler.attempt_disengage(player)
+
+    @classmethod
+    async def cmd_tactical(cls, player: 'Player', args: List[str]):
+        """Show concise tactical combat readout."""
+        from combat import CombatHandler
+        c = player.config.COLORS
+        stance = getattr(player, 'stance', 'normal')
+        stance_label = stance.title()
+        ob = player.get_hit_bonus()
+        db_info = player.get_db_breakdown() if hasattr(player, 'get_db_breakdown') else {'total': (100 - player.get_armor_class())}
+        pb_info = player.get_pb_breakdown() if hasattr(player, 'get_pb_breakdown') else {'total': int(getattr(player, 'damage_reduction', 0))}
+        db = db_info.get('total', 0)
+        pb = pb_info.get('total', 0)
+        ac = player.get_armor_class()
+        wimpy = getattr(player, 'wimpy', 0)
+        flee_chance = CombatHandler.get_flee_chance(player)
+        flee_risk = CombatHandler.get_flee_risk_label(flee_chance)
+        flee_cd = int(max(0, getattr(player, 'flee_cooldown_until', 0) - time.time()))
+        if flee_chance <= 0:
+            flee_display = f"{c['red']}0% (winded){c['reset']}"
+        else:
+            cd_text = f", cd {flee_cd}s" if flee_cd > 0 else ""
+            flee_display = f"{c['white']}{flee_chance}% ({flee_risk}{cd_text}){c['reset']}"
+        escape_chance = CombatHandler.get_escape_chance(player)
+        escape_risk = CombatHandler.get_escape_risk_label(escape_chance)
+        escape_cd = int(max(0, getattr(player, 'escape_cooldown_until', 0) - time.time()))
+        if escape_chance <= 0:
+            escape_display = f"{c['red']}0% (winded){c['reset']}"
+        else:
+            cd_text = f", cd {escape_cd}s" if escape_cd > 0 else ""
+            escape_display = f"{c['white']}{escape_chance}% ({escape_risk}{cd_text}){c['reset']}"
+        dis_cd = int(max(0, getattr(player, 'disengage_cooldown_until', 0) - time.time()))
+        dis_status = "ready" if dis_cd <= 0 else f"cd {dis_cd}s"
+        if player.room:
+            attackers = [ch for ch in player.room.characters if hasattr(ch, 'fighting') and ch.fighting == player]
+            if attackers:
+                dis_status = "blocked"
+        wimpy_display = f"{wimpy}" if wimpy > 0 else "off"
+        shield_bonus = player.get_shield_evasion_bonus() if hasattr(player, 'get_shield_evasion_bonus') else 0
+        shield_display = f" | Shield +{shield_bonus}%" if shield_bonus > 0 else ""
+        protecting = getattr(player, 'protecting', None)
+        guarded_by = None
+        if player.room:
+            for char in player.room.characters:
+                if getattr(char, 'protecting', None) == player:
+                    guarded_by = char
+                    break
+        protect_bits = []
+        if protecting:
+            protect_bits.append(f"Protect {protecting.name}")
+        if guarded_by:
+            protect_bits.append(f"Guarded by {guarded_by.name}")
+        protect_display = f" | {' / '.join(protect_bits)}" if protect_bits else ""
+        line = (
+            f"{c['white']}Tactical:{c['reset']} "
+            f"HP {player.hp}/{player.max_hp} "
+            f"MN {player.mana}/{player.max_mana} "
+            f"MV {player.move}/{player.max_move} "
+            f"| {c['bright_cyan']}OB/DB/PB{c['reset']} {ob:+d}/{db:+d}/{pb}%{shield_display} "
+            f"| AC {ac:+d} Mit {pb}% "
+            f"| Stance {stance_label} "
+            f"| Wimpy {wimpy_display} "
+            f"| Flee {flee_display} "
+            f"| Escape {escape_display} "
+            f"| Disengage {dis_status}{protect_display}"
+        )
+        await player.send(line)
+        db_break = f"DB base {db_info.get('base',0):+d} st {db_info.get('stance',0):+d} sh {db_info.get('shield',0):+d} dg {db_info.get('dodge_skill',0):+d}/{db_info.get('dodge_item',0):+d} wt -{db_info.get('weight_penalty',0)}"
+        pb_break = f"PB base {pb_info.get('base',0):+d} st {pb_info.get('stance',0):+d} pa {pb_info.get('parry',0):+d} sb {pb_info.get('shield_block',0):+d} wt -{pb_info.get('weight_penalty',0)}"
+        await player.send(f"{c['bright_black']}{db_break} | {pb_break}{c['reset']}")
+
+    @classmethod
+    async def cmd_secondwind(cls, player: 'Player', args: List[str]):
+        """Recover movement points with a burst of endurance."""
+        c = player.config.COLORS
+        now = time.time()
+        if now < getattr(player, 'second_wind_cooldown_until', 0):
+            remaining = int(getattr(player, 'second_wind_cooldown_until', 0) - now)
+            await player.send(f"{c['yellow']}Second Wind is on cooldown ({remaining}s).{c['reset']}")
+            return
+        if player.position == 'sleeping':
+            await player.send(f"{c['yellow']}You need to wake up first.{c['reset']}")
+            return
+        # Determine resource cost by class type
+        caster_classes = {'mage', 'cleric', 'necromancer', 'bard'}
+        char_class = str(getattr(player, 'char_class', '')).lower()
+        restore = max(10, int(player.max_move * player.config.SECOND_WIND_RESTORE_PCT))
+        if char_class in caster_classes:
+            cost = max(10, int(player.max_mana * 0.10))
+            if player.mana < cost:
+                await player.send(f"{c['red']}You lack the mana to steady your breathing.{c['reset']}")
+                return
+            player.mana -= cost
+        else:
+            cost = max(10, int(player.max_hp * 0.08))
+            if player.hp <= cost + 1:
+                await player.send(f"{c['red']}You're too hurt to push for a second wind.{c['reset']}")
+                return
+            player.hp -= cost
+        player.move = min(player.max_move, player.move + restore)
+        player.second_wind_until = now + player.config.SECOND_WIND_BUFF_SECONDS
+        player.second_wind_cooldown_until = now + player.config.SECOND_WIND_COOLDOWN_SECONDS
+        await player.send(f"{c['bright_green']}You catch a second wind, restoring {restore} move.{c['reset']}")
+
+    @classmethod
+    async def cmd_dodge(cls, player: 'Player', args: List[str]):
+        """Attempt to dodge a telegraphed boss attack."""
+        if not player.is_fighting:
+            await player.send("You're not fighting anyone!")
+            return
+
+        target = player.fighting
+        if not getattr(target, 'is_boss', False):
+            await player.send("You don't need to dodge right now.")
+            return
+
+        if not target.can_dodge():
+            await player.send("There's nothing to dodge yet!")
+            return
+
+        # Dodge chance based on skill and dex
+        import random
+        skill = player.skills.get('dodge', 0) if hasattr(player, 'skills') else 0
+        bonus = (player.dex - 10) * 2
+        chance = min(95, max(25, skill + bonus))
+
+        if random.randint(1, 100) <= chance:
+            target.mark_dodging(player)
+            await player.send("You prepare to dodge the incoming attack!")
+            if player.room:
+                await player.room.send_to_room(f"{player.name} braces to dodge.", exclude=[player])
+            if skill:
+                await player.improve_skill('dodge', difficulty=3)
+        else:
+            await player.send("You mistime your dodge!")
+
+    @classmethod
+    async def cmd_interrupt(cls, player: 'Player', args: List[str]):
+        """Attempt to interrupt a boss cast with bash or kick."""
+        if not player.is_fighting:
+            await player.send("You're not fighting anyone!")
+            return
+
+        target = player.fighting
+        if not getattr(target, 'is_boss', False):
+            await player.send("There's nothing to interrupt.")
+            return
+
+        if not target.can_interrupt():
+            await player.send("The boss isn't casting anything interruptible.")
+            return
+
+        if target.attempt_interrupt(player):
+            await player.send("You slam into the boss and break its cast!")
+            if player.room:
+                await player.room.send_to_room(
+                    f"{player.name} interrupts {target.name}'s casting!",
+                    exclude=[player]
+                )
+        else:
+            await player.send("You fail to interrupt the cast!")
+
+    @classmethod
+    async def cmd_kick(cls, player: 'Player', args: List[str]):
+        """Kick skill."""
+        c = player.config.COLORS
+        if 'kick' not in player.skills:
+            await player.send(f"{c['red']}You don't know how to kick!{c['reset']}")
+            return
+        
+        # Find target: args > fighting > pre-set target
+        target = None
+        if args:
+            target_name = ' '.join(args).lower()
+            target = player.find_target_in_room(target_name)
+            if not target:
+                await player.send(f"{c['red']}You don't see '{args[0]}' here.{c['reset']}")
+                return
+        elif hasattr(player, 'target') and player.target and player.target in player.room.characters:
+            target = player.target
+        elif player.is_fighting:
+            target = player.fighting
+        else:
+            await player.send(f"{c['yellow']}Kick whom? (Use 'target <name>' to set a target){c['reset']}")
+            return
+            
+        from combat import CombatHandler
+        await CombatHandler.do_kick(player, target)
+        
+    @classmethod
+    async def cmd_bash(cls, player: 'Player', args: List[str]):
+        """Bash — Stun + damage. Warriors use doctrine system, others use legacy."""
+        import time, random
+        c = player.config.COLORS
+
+        # Warriors use the new doctrine system
+        if player.char_class.lower() == 'warrior':
+            from warrior_abilities import do_bash
+            await do_bash(player, args)
+            return
+
+        # Non-warriors use legacy bash
+        if 'bash' not in player.skills:
+            await player.send(f"{c['red']}You don't know how to bash!{c['reset']}")
+            return
+        target = None
+        if args:
+            target = player.find_target_in_room(' '.join(args).lower())
+        elif hasattr(player, 'target') and player.target and player.target in player.room.characters:
+            target = player.target
+        elif player.is_fighting:
+            target = player.fighting
+        if not target:
+            await player.send(f"{c['yellow']}Bash whom?{c['reset']}")
+            return
+        from combat import CombatHandler
+        await CombatHandler.do_bash(player, target)
+
+
+    @classmethod
+    async def cmd_envenom(cls, player: 'Player', args: List[str]):
+        """Envenom your weapon with deadly poison."""
+        if 'envenom' not in player.skills:
+            await player.send("You don't know how to envenom weapons!")
+            return
+
+        from combat import CombatHandler
+        await CombatHandler.do_envenom(player)
+
+    @classmethod
+    async def cmd_assassinate(cls, player: 'Player', args: List[str]):
+        """Attempt a deadly assassination on an unsuspecting target."""
+        if 'assassinate' not in player.skills:
+            await player.send("You don't know how to assassinate!")
+            return
+
+        if player.is_fighting:
+            await player.send("You're too busy fighting!")
+            return
+
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send("Assassinate whom?")
+                return
+
+        target_name = ' '.join(args)
+        target = player.find_target_in_room(target_name)
+
+        if not target:
+            await player.send(f"You don't see '{target_name}' here.")
+            return
+
+        from combat import CombatHandler
+        await CombatHandler.do_assassinate(player, target)
+
+    @classmethod
+    async def cmd_shadowstep(cls, player: 'Player', args: List[str]):
+        """Shadow Step — teleport behind target, dodge next attack, +1 Intel."""
+        import time
+        c = player.config.COLORS
+        char_class = getattr(player, 'char_class', '').lower()
+
+        if char_class == 'assassin':
+            if not args:
+                if hasattr(player, "fighting") and player.fighting:
+                    target = player.fighting
+                    args = [target.name]
+                else:
+                    await player.send(f"{c['yellow']}Shadow step to whom?{c['reset']}")
+                    return
+            target = player.find_target_in_room(' '.join(args))
+            if not target:
+                await player.send(f"{c['red']}They aren't here.{c['reset']}")
+                return
+            now = time.time()
+            if now < getattr(player, 'shadowstep_cooldown', 0):
+                remaining = int(player.shadowstep_cooldown - now)
+                await player.send(f"{c['yellow']}Shadow Step on cooldown ({remaining}s).{c['reset']}")
+                return
+            player.shadowstep_cooldown = now + 30
+            player.shadowstep_dodge = True
+            await player.send(f"{c['magenta']}You step through shadows behind {target.name}!{c['reset']}")
+            if player.room:
+                await player.room.send_to_room(
+                    f"{c['white']}{player.name} dissolves into shadow and reappears behind {target.name}!{c['reset']}",
+                    exclude=[player]
+                )
+            # Grant +1 Intel on marked target
+            if player.intel_target == target:
+                player.intel_points = min(10, player.intel_points + 1)
+                await player.send(f"{c['cyan']}[Intel: {player.intel_points}/10]{c['reset']}")
+                await cls._check_intel_thresholds(player)
+            return
+
+        # Non-assassin fallback
+        if 'shadow_step' not in player.skills:
+            await player.send("You don't know how to shadow step!")
+            return
+        if player.is_fighting:
+            await player.send("You're too busy fighting!")
+            return
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send("Shadow step to whom?")
+                return
+        target_name = ' '.join(args)
+        target = player.find_target_in_room(target_name)
+        if not target:
+            target_lower = target_name.lower()
+            for direction, exit_info in player.room.exits.items():
+                if exit_info and exit_info.get('room'):
+                    adj_room = exit_info['room']
+                    for char in adj_room.characters:
+                        if target_lower in char.name.lower():
+                            target = char
+                            break
+                    if target:
+                        break
+        if not target:
+            await player.send(f"You don't sense '{target_name}' nearby.")
+            return
+        from combat import CombatHandler
+        await CombatHandler.do_shadow_step(player, target)
+
+    @classmethod
+    async def _check_intel_thresholds(cls, player: 'Player'):
+        """Check and announce Intel threshold crossings."""
+        c = player.config.COLORS
+        target = player.intel_target
+        if not target:
+            return
+        tname = target.name
+        thresholds = getattr(player, 'intel_thresholds', {})
+        if player.intel_points >= 3 and not thresholds.get(3):
+            thresholds[3] = True
+            await player.send(f"{c['bright_green']}You spot an opening in {tname}'s defenses! [Expose Weakness unlocked]{c['reset']}")
+        if player.intel_points >= 6 and not thresholds.get(6):
+            thresholds[6] = True
+            await player.send(f"{c['bright_yellow']}You've mapped {tname}'s vital points! [Vital Strike unlocked]{c['reset']}")
+        if player.intel_points >= 10 and not thresholds.get(10):
+            thresholds[10] = True
+            await player.send(f"{c['bright_red']}You know exactly how to kill {tname}. [Execute Contract unlocked]{c['reset']}")
+        player.intel_thresholds = thresholds
+
+    @classmethod
+    async def cmd_mark(cls, player: 'Player', args: List[str]):
+        """Mark a target for Intel tracking (Assassin)."""
+        c = player.config.COLORS
+        if getattr(player, 'char_class', '').lower() != 'assassin':
+            # Fallback to old mark for non-assassins
+            if 'mark_target' in player.skills:
+                if not args:
+                    if hasattr(player, "fighting") and player.fighting:
+                        target = player.fighting
+                        args = [target.name]
+                    else:
+                        await player.send("Mark whom for death?")
+                        return
+                target = player.find_target_in_room(' '.join(args))
+                if not target:
+                    await player.send(f"You don't see that here.")
+                    return
+                from combat import CombatHandler
+                await CombatHandler.do_mark_target(player, target)
+                return
+            await player.send(f"{c['red']}You don't know how to mark targets!{c['reset']}")
+            return
+
+        if not args:
+            # Show current mark status
+            if player.intel_target:
+                await player.send(f"{c['cyan']}Intel target: {player.intel_target.name} [{player.intel_points}/10]{c['reset']}")
+            else:
+                await player.send(f"{c['yellow']}Usage: mark <target>{c['reset']}")
+            return
+
+        target = player.find_target_in_room(' '.join(args))
+        if not target:
+            await player.send(f"{c['red']}You don't see that here.{c['reset']}")
+            return
+
+        player.intel_target = target
+        player.intel_points = 0
+        player.intel_thresholds = {}
+        await player.send(f"{c['magenta']}You study {target.name}, looking for weaknesses...{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(
+                f"{c['white']}{player.name} studies {target.name} intently.{c['reset']}",
+                exclude=[player]
+            )
+
+    @classmethod
+    async def cmd_expose(cls, player: 'Player', args: List[str]):
+        """Expose Weakness — Intel 3 threshold ability."""
+        import time
+        c = player.config.COLORS
+        if getattr(player, 'char_class', '').lower() != 'assassin':
+            await player.send(f"{c['red']}Only assassins can use Expose Weakness!{c['reset']}")
+            return
+        if not player.intel_target or player.intel_target not in getattr(player.room, 'characters', []):
+            await player.send(f"{c['red']}Your Intel target is not here.{c['reset']}")
+            return
+        if player.intel_points < 3:
+            await player.send(f"{c['red']}You need at least 3 Intel! (Current: {player.intel_points}){c['reset']}")
+            return
+        now = time.time()
+        if now < getattr(player, 'expose_cooldown', 0):
+            remaining = int(player.expose_cooldown - now)
+            await player.send(f"{c['yellow']}Expose Weakness on cooldown ({remaining}s).{c['reset']}")
+            return
+        player.intel_points -= 3
+        player.expose_target = player.intel_target
+        player.expose_until = now + 30
+        await player.send(f"{c['bright_green']}You expose {player.intel_target.name}'s weakness! They take 15% more damage from you for 30s.{c['reset']}")
+        await player.send(f"{c['cyan']}[Intel: {player.intel_points}/10]{c['reset']}")
+
+    @classmethod
+    async def cmd_vital(cls, player: 'Player', args: List[str]):
+        """Vital Strike — Intel 6 threshold ability."""
+        import time
+        c = player.config.COLORS
+        if getattr(player, 'char_class', '').lower() != 'assassin':
+            await player.send(f"{c['red']}Only assassins can use Vital Strike!{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['red']}You must be in combat!{c['reset']}")
+            return
+        if not player.intel_target or player.intel_target not in getattr(player.room, 'characters', []):
+            await player.send(f"{c['red']}Your Intel target is not here.{c['reset']}")
+            return
+        if player.fighting != player.intel_target:
+            await player.send(f"{c['red']}You must be fighting your marked target!{c['reset']}")
+            return
+        if player.intel_points < 6:
+            await player.send(f"{c['red']}You need at least 6 Intel! (Current: {player.intel_points}){c['reset']}")
+            return
+        now = time.time()
+        if now < getattr(player, 'vital_cooldown', 0):
+            remaining = int(player.vital_cooldown - now)
+            await player.send(f"{c['yellow']}Vital Strike on cooldown ({remaining}s).{c['reset']}")
+            return
+        player.intel_points -= 6
+        player.vital_cooldown = now + 30
+        target = player.intel_target
+        # Guaranteed crit, ignores 50% AC, weapon damage * 3
+        weapon = player.equipment.get('wield')
+        if weapon and hasattr(weapon, 'damage_dice'):
+            from combat import CombatHandler
+            base = CombatHandler.roll_dice(weapon.damage_dice)
+        else:
+            import random
+            base = random.randint(2, 6)
+        damage = int(base * 3) + player.get_damage_bonus()
+        damage = max(1, damage)
+        await player.send(f"{c['bright_yellow']}*** VITAL STRIKE! ***{c['reset']}")
+        await player.send(f"{c['bright_red']}You strike {target.name}'s vital points! [{damage}]{c['reset']}")
+        if hasattr(target, 'send'):
+            await target.send(f"{c['bright_red']}{player.name} strikes your vital points! [{damage}]{c['reset']}")
+        killed = await target.take_damage(damage, player)
+        if killed:
+            from combat import CombatHandler
+            await CombatHandler.handle_death(player, target)
+        await player.send(f"{c['cyan']}[Intel: {player.intel_points}/10]{c['reset']}")
+
+    @classmethod
+    async def cmd_execute_contract(cls, player: 'Player', args: List[str]):
+        """Execute Contract — Intel 10 threshold ability."""
+        import time
+        c = player.config.COLORS
+        if getattr(player, 'char_class', '').lower() != 'assassin':
+            await player.send(f"{c['red']}Only assassins can Execute Contract!{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['red']}You must be in combat!{c['reset']}")
+            return
+        if not player.intel_target or player.intel_target not in getattr(player.room, 'characters', []):
+            await player.send(f"{c['red']}Your Intel target is not here.{c['reset']}")
+            return
+        if player.fighting != player.intel_target:
+            await player.send(f"{c['red']}You must be fighting your marked target!{c['reset']}")
+            return
+        if player.intel_points < 10:
+            await player.send(f"{c['red']}You need 10 Intel! (Current: {player.intel_points}){c['reset']}")
+            return
+        target = player.intel_target
+        player.intel_points = 0
+        player.intel_thresholds = {}
+        hp_pct = (target.hp / target.max_hp) * 100 if target.max_hp > 0 else 100
+        if hp_pct <= 20:
+            # Instant kill (non-boss check)
+            flags = getattr(target, 'flags', set()) or set()
+            is_boss = ('boss' in flags) or getattr(target, 'is_boss', False)
+            if is_boss:
+                # Bosses take weapon * 5 instead
+                weapon = player.equipment.get('wield')
+                if weapon and hasattr(weapon, 'damage_dice'):
+                    from combat import CombatHandler
+                    base = CombatHandler.roll_dice(weapon.damage_dice)
+                else:
+                    import random
+                    base = random.randint(2, 6)
+                damage = int(base * 5) + player.get_damage_bonus() * 2
+                await player.send(f"{c['bright_red']}*** EXECUTE CONTRACT! *** You deliver a devastating blow! [{damage}]{c['reset']}")
+                killed = await target.take_damage(damage, player)
+            else:
+                await player.send(f"{c['bright_red']}*** EXECUTE CONTRACT! *** You execute {target.name}!{c['reset']}")
+                killed = await target.take_damage(target.hp + 1, player)
+        else:
+            weapon = player.equipment.get('wield')
+            if weapon and hasattr(weapon, 'damage_dice'):
+                from combat import CombatHandler
+                base = CombatHandler.roll_dice(weapon.damage_dice)
+            else:
+                import random
+                base = random.randint(2, 6)
+            damage = int(base * 5) + player.get_damage_bonus() * 2
+            damage = max(1, damage)
+            await player.send(f"{c['bright_red']}*** EXECUTE CONTRACT! *** [{damage}]{c['reset']}")
+            killed = await target.take_damage(damage, player)
+        if killed:
+            from combat import CombatHandler
+            await CombatHandler.handle_death(player, target)
+        await player.send(f"{c['cyan']}[Intel: {player.intel_points}/10]{c['reset']}")
+
+    
+    @classmethod
+    async def cmd_assist(cls, player: 'Player', args: List[str]):
+        """Help someone in combat. Usage: assist <player>"""
+        from combat import CombatHandler
+        c = player.config.COLORS
+        
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send(f"{c['yellow']}Assist whom?{c['reset']}")
+                return
+        
+        target_name = ' '.join(args)
+        target = None
+        
+        # Find player in room
+        for char in player.room.characters:
+            if char != player and target_name.lower() in char.name.lower():
+                target = char
+                break
+        
+        if not target:
+            await player.send(f"{c['red']}You don't see {target_name} here.{c['reset']}")
+            return
+        
+        # Check if they're fighting (handle both .target and .fighting attributes)
+        enemy = getattr(target, 'fighting', None) or getattr(target, 'target', None)
+        if not getattr(target, 'is_fighting', False) or not enemy:
+            await player.send(f"{c['yellow']}{target.name} isn't fighting anyone!{c['reset']}")
+            return
+        
+        if player.is_fighting and player.fighting != enemy:
+            await player.send(f"{c['yellow']}You're already fighting {player.fighting.name}.{c['reset']}")
+            return
+
+        await player.send(f"{c['green']}You rush to assist {target.name}!{c['reset']}")
+        # Only send to target if they can receive messages (players, not pets)
+        if hasattr(target, 'send'):
+            await target.send(f"{c['green']}{player.name} rushes to assist you!{c['reset']}")
+
+        # Join the fight without stealing the target
+        if not enemy.is_fighting:
+            await CombatHandler.start_combat(player, enemy)
+        else:
+            player.fighting = enemy
+            player.position = 'fighting'
+            if hasattr(player, 'target'):
+                player.target = enemy
+
+    @classmethod
+    @classmethod
+    async def cmd_protect(cls, player: 'Player', args: List[str]):
+        """Protect an ally, intercepting attacks. Usage: protect <ally>|protect off"""
+        c = player.config.COLORS
+
+        if player.char_class.lower() not in ('warrior', 'paladin'):
+            await player.send(f"{c['red']}Only warriors and paladins can protect allies!{c['reset']}")
+            return
+
+        if 'rescue' not in player.skills and 'shield_block' not in player.skills:
+            await player.send(f"{c['red']}You haven't learned how to protect allies yet.{c['reset']}")
+            return
+
+        if not args:
+            current = getattr(player, 'protecting', None)
+            if current:
+                await player.send(f"{c['cyan']}You are protecting {current.name}.{c['reset']}")
+                await player.send(f"{c['white']}Use 'protect <name>' to switch or 'protect off' to stop.{c['reset']}")
+            else:
+                await player.send(f"{c['yellow']}Protect whom?{c['reset']}")
+            return
+
+        target_name = ' '.join(args).lower()
+        if target_name in ('off', 'none', 'clear', 'stop'):
+            player.protecting = None
+            await player.send(f"{c['yellow']}You relax your protective stance.{c['reset']}")
+            return
+
+        if not player.room:
+            await player.send(f"{c['red']}You don't see anyone here to protect.{c['reset']}")
+            return
+
+        from mobs import Mobile
+        target = None
+        for char in player.room.characters:
+            if char == player:
+                continue
+            if isinstance(char, Mobile):
+                continue
+            if target_name in char.name.lower():
+                target = char
+                break
+
+        if not target:
+            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
+            return
+
+        existing_protectors = [
+            char for char in player.room.characters
+            if char != player and getattr(char, 'protecting', None) == target
+        ]
+        if existing_protectors:
+            names = ', '.join(ch.name for ch in existing_protectors[:2])
+            if len(existing_protectors) > 2:
+                names = f"{names} and others"
+            await player.send(f"{c['yellow']}Note: {target.name} is already being protected by {names}.{c['reset']}")
+
+        player.protecting = target
+        await player.send(f"{c['bright_green']}You move to protect {target.name}.{c['reset']}")
+        if hasattr(target, 'send'):
+            await target.send(f"{c['bright_green']}{player.name} moves to protect you.{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(
+                f"{c['cyan']}{player.name} takes a defensive stance in front of {target.name}.{c['reset']}",
+                exclude=[player, target]
+            )
+
+    @classmethod
+    async def cmd_wimpy(cls, player: 'Player', args: List[str]):
+        """Set auto-flee HP threshold. Usage: wimpy [hp amount]"""
+        c = player.config.COLORS
+        
+        if not args:
+            wimpy = getattr(player, 'wimpy', 0)
+            if wimpy > 0:
+                await player.send(f"{c['yellow']}You will flee when HP drops below {wimpy}.{c['reset']}")
+            else:
+                await player.send(f"{c['yellow']}Wimpy is disabled. Use 'wimpy <hp>' to set it.{c['reset']}")
+            return
+        
+        try:
+            amount = int(args[0])
+        except ValueError:
+            await player.send(f"{c['red']}Invalid HP amount.{c['reset']}")
+            return
+        
+        if amount < 0:
+            amount = 0
+        elif amount > player.max_hp:
+            amount = player.max_hp
+        
+        player.wimpy = amount
+        
+        if amount > 0:
+            await player.send(f"{c['green']}You will flee when HP drops below {amount}.{c['reset']}")
+        else:
+            await player.send(f"{c['yellow']}Wimpy disabled.{c['reset']}")
+
+    # ==================== TARGET LABELS ====================
+
+    @classmethod
+    async def cmd_label(cls, player: 'Player', args: List[str]):
+        """Label a target for quick targeting in combat.
+        
+        Usage:
+            label                    - Show all current labels
+            label <target> <name>    - Label a target (e.g., label warrior DEAD)
+            label clear              - Clear all labels
+            label clear <name>       - Clear specific label
+        
+        Then use the label in commands: kill DEAD, cast fireball DEAD
+        Labels are case-insensitive and session-only (not saved).
+        """
+        c = player.config.COLORS
+        
+        if not args:
+            # Show all labels
+            if not player.target_labels:
+                await player.send(f"{c['yellow']}You have no targets labeled.{c['reset']}")
+                await player.send(f"{c['cyan']}Usage: label <target> <name>  (e.g., label warrior DEAD){c['reset']}")
+            else:
+                await player.send(f"{c['cyan']}Current Labels:{c['reset']}")
+                for label, char in list(player.target_labels.items()):
+                    if char in player.room.characters:
+                        await player.send(f"  {c['bright_yellow']}{label}{c['white']} -> {c['bright_green']}{char.name}{c['reset']}")
+                    else:
+                        # Stale label
+                        del player.target_labels[label]
+                        await player.send(f"  {c['bright_yellow']}{label}{c['white']} -> {c['red']}(no longer present){c['reset']}")
+            return
+        
+        if args[0].lower() == 'clear':
+            if len(args) > 1:
+                # Clear specific label
+                label_name = args[1].upper()
+                if label_name in player.target_labels:
+                    del player.target_labels[label_name]
+                    await player.send(f"{c['bright_green']}Label '{label_name}' cleared.{c['reset']}")
+                else:
+                    await player.send(f"{c['yellow']}No label '{label_name}' found.{c['reset']}")
+            else:
+                # Clear all labels
+                player.target_labels.clear()
+                await player.send(f"{c['bright_green']}All labels cleared.{c['reset']}")
+            return
+        
+        if len(args) < 2:
+            await player.send(f"{c['yellow']}Usage: label <target> <name>{c['reset']}")
+            await player.send(f"{c['cyan']}Example: label 2.warrior TANK{c['reset']}")
+            return
+        
+        # Parse: label <target> <labelname>
+        target_name = ' '.join(args[:-1])
+        label_name = args[-1].upper()
+        
+        # Find target using existing targeting (supports 1.warrior, 2.warrior, etc.)
+        # But temporarily disable label lookup to avoid circular reference
+        old_labels = player.target_labels
+        player.target_labels = {}
+        target = player.find_target_in_room(target_name)
+        player.target_labels = old_labels
+        
+        if not target:
+            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
+            return
+        
+        # Set the label
+        player.target_labels[label_name] = target
+        await player.send(f"{c['bright_green']}Labeled {target.name} as '{label_name}'.{c['reset']}")
+        await player.send(f"{c['cyan']}Now you can use: kill {label_name}, cast spell {label_name}, etc.{c['reset']}")
+
+    @classmethod
+    async def cmd_unlabel(cls, player: 'Player', args: List[str]):
+        """Remove a target label."""
+        c = player.config.COLORS
+        
+        if not args:
+            await player.send(f"{c['yellow']}Usage: unlabel <name>{c['reset']}")
+            return
+        
+        label_name = args[0].upper()
+        if label_name in player.target_labels:
+            del player.target_labels[label_name]
+            await player.send(f"{c['bright_green']}Label '{label_name}' removed.{c['reset']}")
+        else:
+            await player.send(f"{c['yellow']}No label '{label_name}' found.{c['reset']}")
@@ -0,0 +1,862 @@
+"""
+Misthollow Commerce Commands
+===========================
+Shops, banking, auction and player trading.
+"""
+
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class CommerceCommands:
+    """Commerce commands."""
+
+    @classmethod
+    async def cmd_list(cls, player: 'Player', args: List[str]):
+        """List items for sale in a shop. Usage: list"""
+        from shops import ShopManager
+
+        c = player.config.COLORS
+
+        # Find shopkeeper in room
+        shopkeeper = None
+        for char in player.room.characters:
+            if ShopManager.is_shopkeeper(char):
+                shopkeeper = char
+                break
+
+        if not shopkeeper:
+            # Check if this is a pet shop (room name must contain 'pet shop')
+            if player.room and player.room.vnum and 'pet shop' in player.room.name.lower():
+                pet_room_vnum = player.room.vnum + 1
+                pet_room = player.world.get_room(pet_room_vnum) if player.world else None
+                if pet_room and pet_room.characters:
+                    from mobs import Mobile
+                    pets = [ch for ch in pet_room.characters if isinstance(ch, Mobile) and ('pet' in ch.flags or 'pet_shop' in ch.flags or getattr(ch, 'special', None) == 'pet')]
+                    if pets:
+                        await player.send(f"\n{c['bright_cyan']}╔══════════════════════════════════════════════════════════╗{c['reset']}")
+                        await player.send(f"{c['bright_cyan']}║{c['bright_yellow']}            Pets Available for Purchase                 {c['bright_cyan']}║{c['reset']}")
+                        await player.send(f"{c['bright_cyan']}╠══════════════════════════════════════════════════════════╣{c['reset']}")
+                        await player.send(f"{c['bright_cyan']}║ {c['white']}Pet                                   Lvl    Price    {c['bright_cyan']}║{c['reset']}")
+                        await player.send(f"{c['bright_cyan']}╠══════════════════════════════════════════════════════════╣{c['reset']}")
+                        for pet in pets:
+                            price = getattr(pet, 'gold', 100) * 3
+                            if price <= 0:
+                                price = pet.level * 100
+                            pname = pet.short_desc[:36].ljust(36)
+                            await player.send(f"{c['bright_cyan']}║ {c['white']}{pname} {pet.level:>3}  {price:>6} gold {c['bright_cyan']}║{c['reset']}")
+                        await player.send(f"{c['bright_cyan']}╚══════════════════════════════════════════════════════════╝{c['reset']}")
+                        await player.send(f"{c['yellow']}Use 'buy <pet name>' to purchase.{c['reset']}\n")
+                        return
+            await player.send(f"{c['red']}There's no shopkeeper here.{c['reset']}")
+            return
+
+        # Get shop
+        shop = ShopManager.get_shop(shopkeeper)
+        if not shop:
+            await player.send(f"{c['red']}This merchant has nothing to sell.{c['reset']}")
+            return
+
+        # Check if shop is open
+        game_time = player.world.game_time if hasattr(player.world, 'game_time') else None
+        if not shop.is_open(game_time):
+            await player.send(f"{c['yellow']}{shopkeeper.name} says, 'Sorry, I'm closed right now. Come back during business hours.'{c['reset']}")
+            return
+
+        await shop.list_items(player)
+
+    @classmethod
+    async def cmd_buy(cls, player: 'Player', args: List[str]):
+        """Buy an item from a shop. Usage: buy <item>"""
+        from shops import ShopManager
+
+        c = player.config.COLORS
+
+        if not args:
+            await player.send(f"{c['yellow']}Buy what? Use 'list' to see what's available.{c['reset']}")
+            return
+
+        # Find shopkeeper in room
+        shopkeeper = None
+        for char in player.room.characters:
+            if ShopManager.is_shopkeeper(char):
+                shopkeeper = char
+                break
+
+        if not shopkeeper:
+            # Check if this is a pet shop (room name must contain 'pet shop')
+            if player.room and player.room.vnum and 'pet shop' in player.room.name.lower():
+                pet_room_vnum = player.room.vnum + 1
+                pet_room = player.world.get_room(pet_room_vnum) if player.world else None
+                if pet_room and pet_room.characters:
+                    from mobs import Mobile
+                    pet_name = ' '.join(args).lower()
+                    target_pet = None
+                    for char in pet_room.characters:
+                        if isinstance(char, Mobile) and ('pet' in char.flags or 'pet_shop' in char.flags or getattr(char, 'special', None) == 'pet') and pet_name in char.name.lower():
+                            target_pet = char
+                            break
+                    if target_pet:
+                        # Pet purchase
+                        price = getattr(target_pet, 'gold', 100) * 3  # Pets cost 3x their gold value
+                        if price <= 0:
+                            price = target_pet.level * 100
+                        if player.gold < price:
+                            await player.send(f"{c['red']}You need {price} gold to buy {target_pet.short_desc}.{c['reset']}")
+                            return
+                        player.gold -= price
+                        # Create pet from mob
+                        from pets import Pet
+                        pet = Pet(target_pet.vnum, player.world, player, 'companion')
+                        pet.name = target_pet.name
+                        pet.short_desc = target_pet.short_desc
+                        pet.long_desc = target_pet.long_desc
+                        pet.level = target_pet.level
+                        pet.hp = target_pet.hp
+                        pet.max_hp = target_pet.max_hp
+                        pet.damage_dice = target_pet.damage_dice
+                        pet.armor_class = target_pet.armor_class
+                        pet.is_persistent = True
+                        # Add to player companions (persisted on save/load)
+                        if not hasattr(player, 'companions'):
+                            player.companions = []
+                        player.companions.append(pet)
+                        # Also register in world NPCs so pet_tick and combat work
+                        if player.world and pet not in player.world.npcs:
+                            player.world.npcs.append(pet)
+                        pet.room = player.room
+                        player.room.characters.append(pet)
+                        await player.send(f"{c['bright_green']}You buy {target_pet.short_desc} for {price} gold!{c['reset']}")
+                        await player.send(f"{c['cyan']}{pet.short_desc} follows you loyally.{c['reset']}")
+                        if player.room:
+                            await player.room.send_to_room(
+                                f"{player.name} just bought {pet.short_desc}!", exclude=[player])
+                        return
+                    else:
+                        # Show available pets
+                        await player.send(f"{c['yellow']}Available pets:{c['reset']}")
+                        for char in pet_room.characters:
+                            if isinstance(char, Mobile) and ('pet' in char.flags or 'pet_shop' in char.flags or getattr(char, 'special', None) == 'pet'):
+                                price = getattr(char, 'gold', 100) * 3
+                                if price <= 0:
+                                    price = char.level * 100
+                                await player.send(f"  {c['white']}{char.short_desc} (Level {char.level}) - {price} gold{c['reset']}")
+                        return
+            await player.send(f"{c['red']}There's no shopkeeper here.{c['reset']}")
+            return
+
+        # Get shop
+        shop = ShopManager.get_shop(shopkeeper)
+        if not shop:
+            await player.send(f"{c['red']}This merchant has nothing to sell.{c['reset']}")
+            return
+
+        # Check if shop is open
+        game_time = player.world.game_time if hasattr(player.world, 'game_time') else None
+        if not shop.is_open(game_time):
+            await player.send(f"{c['yellow']}{shopkeeper.name} says, 'Sorry, I'm closed right now.'{c['reset']}")
+            return
+
+        item_identifier = ' '.join(args)
+        await shop.sell_to_player(player, item_identifier)
+
+    @classmethod
+    async def cmd_sell(cls, player: 'Player', args: List[str]):
+        """Sell an item to a shop. Usage: sell <item>"""
+        from shops import ShopManager
+
+        c = player.config.COLORS
+
+        if not args:
+            await player.send(f"{c['yellow']}Sell what? Use 'value <item>' to check prices.{c['reset']}")
+            return
+
+        # Find shopkeeper in room
+        shopkeeper = None
+        for char in player.room.characters:
+            if ShopManager.is_shopkeeper(char):
+                shopkeeper = char
+                break
+
+        if not shopkeeper:
+            await player.send(f"{c['red']}There's no shopkeeper here.{c['reset']}")
+            return
+
+        # Get shop
+        shop = ShopManager.get_shop(shopkeeper)
+        if not shop:
+            await player.send(f"{c['red']}This merchant doesn't buy items.{c['reset']}")
+            return
+
+        # Check if shop is open
+        game_time = player.world.game_time if hasattr(player.world, 'game_time') else None
+        if not shop.is_open(game_time):
+            await player.send(f"{c['yellow']}{shopkeeper.name} says, 'Sorry, I'm closed right now.'{c['reset']}")
+            return
+
+        item_name = ' '.join(args)
+        await shop.buy_from_player(player, item_name)
+
+    @classmethod
+    async def cmd_value(cls, player: 'Player', args: List[str]):
+        """Check how much a shop will pay for an item. Usage: value <item>"""
+        from shops import ShopManager
+
+        c = player.config.COLORS
+
+        if not args:
+            await player.send(f"{c['yellow']}Check the value of what?{c['reset']}")
+            return
+
+        # Find shopkeeper in room
+        shopkeeper = None
+        for char in player.room.characters:
+            if ShopManager.is_shopkeeper(char):
+                shopkeeper = char
+                break
+
+        if not shopkeeper:
+            await player.send(f"{c['red']}There's no shopkeeper here.{c['reset']}")
+            return
+
+        # Get shop
+        shop = ShopManager.get_shop(shopkeeper)
+        if not shop:
+            await player.send(f"{c['red']}This merchant doesn't buy items.{c['reset']}")
+            return
+
+        item_name = ' '.join(args)
+        await shop.value_item(player, item_name)
+
+    @classmethod
+    async def cmd_compare(cls, player: 'Player', args: List[str]):
+        """Compare a shop item to your equipped item. Usage: compare <item>"""
+        from shops import ShopManager
+
+        c = player.config.COLORS
+
+        if not args:
+            await player.send(f"{c['yellow']}Compare what? Use 'list' to see available items.{c['reset']}")
+            return
+
+        # Find shopkeeper in room
+        shopkeeper = None
+        for char in player.room.characters:
+            if ShopManager.is_shopkeeper(char):
+                shopkeeper = char
+                break
+
+        if not shopkeeper:
+            await player.send(f"{c['red']}There's no shopkeeper here.{c['reset']}")
+            return
+
+        # Get shop
+        shop = ShopManager.get_shop(shopkeeper)
+        if not shop:
+            await player.send(f"{c['red']}This merchant has nothing to sell.{c['reset']}")
+            return
+
+        item_name = ' '.join(args).lower()
+
+        # Find the item in shop inventory
+        shop_item = None
+        for item in shop.inventory:
+            if item_name in item.name.lower() or item_name in item.short_desc.lower():
+                shop_item = item
+                break
+
+        if not shop_item:
+            await player.send(f"{c['red']}The shopkeeper doesn't have '{item_name}' for sale.{c['reset']}")
+            return
+
+        # Determine what slot this item uses
+        equipped_item = None
+        if shop_item.item_type == 'weapon':
+            equipped_item = player.equipment.get('wield')
+        elif shop_item.item_type == 'armor' and shop_item.wear_slot:
+            equipped_item = player.equipment.get(shop_item.wear_slot)
+
+        # Show comparison
+        await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
+        await player.send(f"{c['cyan']}║{c['bright_yellow']} Comparing Items:{c['cyan']}{'':>45}║{c['reset']}")
+        await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}\r\n")
+
+        if not equipped_item:
+            await player.send(f"{c['yellow']}You have nothing equipped in that slot.{c['reset']}\r\n")
+            await player.send(f"{c['white']}Shop Item:{c['reset']} {shop_item.short_desc}")
+            if shop_item.item_type == 'weapon':
+                await player.send(f"  {c['red']}Damage: {shop_item.damage_dice}{c['reset']}")
+            elif shop_item.item_type == 'armor':
+                await player.send(f"  {c['blue']}Armor: {shop_item.armor} AC{c['reset']}")
+            return
+
+        # Compare equipped vs shop item
+        await player.send(f"{c['bright_cyan']}Currently Equipped:{c['reset']} {equipped_item.short_desc}")
+        await player.send(f"{c['bright_yellow']}Shop Item:{c['reset']} {shop_item.short_desc}\r\n")
+
+        if shop_item.item_type == 'weapon':
+            # Parse damage dice to compare
+            def parse_damage(dice_str):
+                # Parse "2d6" -> avg = 2 * 3.5 = 7
+                try:
+                    num, sides = dice_str.lower().split('d')
+                    return int(num) * (int(sides) + 1) / 2
+                except:
+                    return 0
+
+            equipped_dmg = parse_damage(equipped_item.damage_dice if hasattr(equipped_item, 'damage_dice') else '1d4')
+            shop_dmg = parse_damage(shop_item.damage_dice)
+
+            diff = shop_dmg - equipped_dmg
+            if diff > 0:
+                await player.send(f"{c['red']}Damage: {equipped_item.damage_dice} → {shop_item.damage_dice} {c['green']}(+{diff:.1f} avg){c['reset']}")
+            elif diff < 0:
+                await player.send(f"{c['red']}Damage: {equipped_item.damage_dice} → {shop_item.damage_dice} {c['red']}({diff:.1f} avg){c['reset']}")
+            else:
+                await player.send(f"{c['red']}Damage: {equipped_item.damage_dice} → {shop_item.damage_dice} {c['yellow']}(same){c['reset']}")
+
+        elif shop_item.item_type == 'armor':
+            equipped_ac = equipped_item.armor if hasattr(equipped_item, 'armor') else 0
+            shop_ac = shop_item.armor
+
+            diff = shop_ac - equipped_ac
+            if diff > 0:
+                await player.send(f"{c['blue']}Armor: {equipped_ac} AC → {shop_ac} AC {c['green']}(+{diff}){c['reset']}")
+            elif diff < 0:
+                await player.send(f"{c['blue']}Armor: {equipped_ac} AC → {shop_ac} AC {c['red']}({diff}){c['reset']}")
+            else:
+                await player.send(f"{c['blue']}Armor: {equipped_ac} AC → {shop_ac} AC {c['yellow']}(same){c['reset']}")
+
+        # Compare magical affects
+        if hasattr(shop_item, 'affects') and shop_item.affects:
+            await player.send(f"\r\n{c['bright_magenta']}Shop Item Magical Properties:{c['reset']}")
+            for affect in shop_item.affects:
+                sign = '+' if affect['value'] > 0 else ''
+                await player.send(f"  {c['magenta']}{affect['type'].capitalize()}: {sign}{affect['value']}{c['reset']}")
+
+        if hasattr(equipped_item, 'affects') and equipped_item.affects:
+            await player.send(f"\r\n{c['bright_cyan']}Current Item Magical Properties:{c['reset']}")
+            for affect in equipped_item.affects:
+                sign = '+' if affect['value'] > 0 else ''
+                await player.send(f"  {c['cyan']}{affect['type'].capitalize()}: {sign}{affect['value']}{c['reset']}")
+
+    @classmethod
+    async def cmd_examine(cls, player: 'Player', args: List[str]):
+        """Examine an item in your inventory or equipment. Usage: examine <item>"""
+        c = player.config.COLORS
+
+        if not args:
+            await player.send(f"{c['yellow']}Examine what? Specify an item in your inventory or equipment.{c['reset']}")
+            return
+
+        item_name = ' '.join(args).lower()
+
+        # Search in equipment first
+        item = None
+        item_location = None
+
+        for slot, equipped in player.equipment.items():
+            if equipped and (item_name in equipped.name.lower() or item_name in equipped.short_desc.lower()):
+                item = equipped
+                item_location = f"worn on {slot}"
+                break
+
+        # Search in inventory if not found
+        if not item:
+            for inv_item in player.inventory:
+                if item_name in inv_item.name.lower() or item_name in inv_item.short_desc.lower():
+                    item = inv_item
+                    item_location = "in inventory"
+                    break
+
+        if not item:
+            await player.send(f"{c['red']}You don't have '{item_name}'.{c['reset']}")
+            return
+
+        # Display item details
+        await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
+        await player.send(f"{c['cyan']}║{c['bright_yellow']} Examining: {item.short_desc:<46}{c['cyan']}║{c['reset']}")
+        await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}\r\n")
+
+        await player.send(f"{c['white']}{item.description}{c['reset']}\r\n")
+
+        await player.send(f"{c['yellow']}Type: {item.item_type.capitalize()}{c['reset']}")
+        await player.send(f"{c['cyan']}Location: {item_location.capitalize()}{c['reset']}")
+
+        # Weapon stats
+        if item.item_type == 'weapon':
+            await player.send(f"{c['red']}Damage: {item.damage_dice} ({item.weapon_type}){c['reset']}")
+            if hasattr(item, 'envenomed') and item.envenomed:
+                poison_type = getattr(item, 'poison_type', 'venom')
+                charges = getattr(item, 'envenom_charges', 0)
+                await player.send(f"{c['green']}Envenomed with {poison_type} ({charges} charges remaining){c['reset']}")
+
+        # Armor stats
+        elif item.item_type == 'armor':
+            await player.send(f"{c['blue']}Armor: {item.armor} AC{c['reset']}")
+            if item.wear_slot:
+                await player.send(f"{c['cyan']}Slot: {item.wear_slot}{c['reset']}")
+
+        # Poison stats
+        elif item.item_type == 'poison':
+            if hasattr(item, 'poison_type'):
+                poison_config = player.config.POISON_TYPES.get(item.poison_type, {})
+                await player.send(f"{c['green']}Poison Type: {poison_config.get('name', 'Unknown')}{c['reset']}")
+                await player.send(f"{c['green']}Effect: {poison_config.get('effect', 'unknown').capitalize()}{c['reset']}")
+
+        # Potion stats
+        elif item.item_type == 'potion':
+            if hasattr(item, 'potion_spell'):
+                await player.send(f"{c['magenta']}Effect: {item.potion_spell.replace('_', ' ').title()}{c['reset']}")
+
+        # Container stats
+        elif item.item_type == 'container':
+            status = 'closed' if item.is_closed else 'open'
+            locked = ' (locked)' if item.is_locked else ''
+            await player.send(f"{c['yellow']}Container: {status}{locked}{c['reset']}")
+            if item.contents:
+                await player.send(f"{c['yellow']}Contains: {len(item.contents)} item(s){c['reset']}")
+
+        # Magical affects
+        if hasattr(item, 'affects') and item.affects:
+            await player.send(f"\r\n{c['bright_magenta']}Magical Properties:{c['reset']}")
+            for affect in item.affects:
+                if isinstance(affect, dict):
+                    affect_type = affect.get('type', '')
+                    applies_to = affect.get('applies_to', '')
+                    value = affect.get('value', 0)
+                    sign = '+' if value > 0 else ''
+                    
+                    # Format nicely based on type
+                    if affect_type == 'modify_stat':
+                        stat_name = applies_to.upper() if applies_to in ('str', 'int', 'wis', 'dex', 'con', 'cha') else applies_to.replace('_', ' ').title()
+                        await player.send(f"  {c['magenta']}{sign}{value} {stat_name}{c['reset']}")
+                    else:
+                        await player.send(f"  {c['magenta']}{affect_type}: {sign}{value} {applies_to}{c['reset']}")
+                else:
+                    # Handle affect objects
+                    await player.send(f"  {c['magenta']}{getattr(affect, 'name', 'Unknown')}{c['reset']}")
+
+        # Weight and value
+        await player.send(f"\r\n{c['white']}Weight: {item.weight} lbs{c['reset']}")
+        if hasattr(item, 'cost'):
+            await player.send(f"{c['yellow']}Value: {item.cost} gold{c['reset']}")
+
+    # ==================== BANKING ====================
+
+    @classmethod
+    async def cmd_deposit(cls, player: 'Player', args: List[str]):
+        """Deposit gold in the bank. Usage: deposit <amount>"""
+        c = player.config.COLORS
+        
+        # Check if in a bank room
+        if not player.room or 'bank' not in getattr(player.room, 'flags', set()):
+            await player.send(f"{c['yellow']}You must be at a bank to deposit gold.{c['reset']}")
+            return
+        
+        if not args:
+            await player.send(f"{c['yellow']}Deposit how much?{c['reset']}")
+            return
+        
+        try:
+            if args[0].lower() == 'all':
+                amount = player.gold
+            else:
+                amount = int(args[0])
+        except ValueError:
+            await player.send(f"{c['red']}Invalid amount.{c['reset']}")
+            return
+        
+        if amount <= 0:
+            await player.send(f"{c['red']}Nice try.{c['reset']}")
+            return
+        
+        if amount > player.gold:
+            await player.send(f"{c['red']}You don't have that much gold!{c['reset']}")
+            return
+        
+        # Ensure bank_gold is initialized and valid
+        player.bank_gold = max(0, getattr(player, 'bank_gold', 0))
+        player.gold -= amount
+        player.bank_gold += amount
+        
+        await player.send(f"{c['bright_yellow']}You deposit {amount:,} gold.{c['reset']}")
+        await player.send(f"{c['white']}Bank balance: {player.bank_gold:,} gold.{c['reset']}")
+
+    @classmethod
+    async def cmd_withdraw(cls, player: 'Player', args: List[str]):
+        """Withdraw gold from the bank. Usage: withdraw <amount>"""
+        c = player.config.COLORS
+        
+        # Check if in a bank room
+        if not player.room or 'bank' not in getattr(player.room, 'flags', set()):
+            await player.send(f"{c['yellow']}You must be at a bank to withdraw gold.{c['reset']}")
+            return
+        
+        if not args:
+            await player.send(f"{c['yellow']}Withdraw how much?{c['reset']}")
+            return
+        
+        bank_gold = getattr(player, 'bank_gold', 0)
+        
+        try:
+            if args[0].lower() == 'all':
+                amount = bank_gold
+            else:
+                amount = int(args[0])
+        except ValueError:
+            await player.send(f"{c['red']}Invalid amount.{c['reset']}")
+            return
+        
+        if amount <= 0:
+            await player.send(f"{c['red']}Nice try.{c['reset']}")
+            return
+        
+        if amount > bank_gold:
+            await player.send(f"{c['red']}You don't have that much gold in the bank!{c['reset']}")
+            return
+        
+        player.bank_gold -= amount
+        player.gold += amount
+        
+        await player.send(f"{c['bright_yellow']}You withdraw {amount:,} gold.{c['reset']}")
+        await player.send(f"{c['white']}Bank balance: {player.bank_gold:,} gold.{c['reset']}")
+
+    @classmethod
+    async def cmd_balance(cls, player: 'Player', args: List[str]):
+        """Check your bank balance."""
+        c = player.config.COLORS
+        
+        bank_gold = getattr(player, 'bank_gold', 0)
+        await player.send(f"{c['bright_yellow']}Bank Balance: {bank_gold:,} gold{c['reset']}")
+        await player.send(f"{c['white']}Gold on hand: {player.gold:,} gold{c['reset']}")
+
+    # ==================== AUCTION ====================
+
+    @classmethod
+    @classmethod
+    async def cmd_auction(cls, player: 'Player', args: List[str]):
+        """Auction house commands for buying and selling items.
+
+        Usage:
+            auction list [category]      - Browse listings
+            auction sell <item> <price> [auction] - List item for sale
+            auction buy <id>             - Purchase a listing
+            auction bid <id> <amount>    - Bid on an auction listing
+            auction cancel <id>          - Cancel your listing
+            auction search <keyword>     - Search listings
+            auction history              - Your recent transactions
+            auction collect              - Collect pending gold/items
+        """
+        from auction_house import AuctionHouse, AUCTION_HOUSE_ROOM, AUCTIONEER_NAME, CATEGORIES
+        c = player.config.COLORS
+
+        if not args:
+            await player.send(f"\n{c['bright_cyan']}═══ Auction House ═══{c['reset']}")
+            await player.send(f"{c['white']}Commands:{c['reset']}")
+            await player.send(f"  {c['bright_green']}auction list [category]{c['white']}  - Browse (weapons/armor/materials/consumables/misc)")
+            await player.send(f"  {c['bright_green']}auction sell <item> <price>{c['white']} - List item (5% fee)")
+            await player.send(f"  {c['bright_green']}auction sell <item> <price> auction{c['white']} - List as auction with min bid")
+            await player.send(f"  {c['bright_green']}auction buy <id>{c['white']}           - Buy a listing")
+            await player.send(f"  {c['bright_green']}auction bid <id> <amount>{c['white']}  - Bid on auction")
+            await player.send(f"  {c['bright_green']}auction cancel <id>{c['white']}        - Cancel your listing")
+            await player.send(f"  {c['bright_green']}auction search <keyword>{c['white']}   - Search listings")
+            await player.send(f"  {c['bright_green']}auction history{c['white']}            - Recent transactions")
+            await player.send(f"  {c['bright_green']}auction collect{c['white']}            - Collect pending gold/items")
+            await player.send(f"\n{c['yellow']}Visit {AUCTIONEER_NAME} at Market Square to trade.{c['reset']}")
+            return
+
+        sub = args[0].lower()
+
+        if sub == 'list':
+            category = args[1].lower() if len(args) > 1 else None
+            if category and category not in CATEGORIES:
+                await player.send(f"{c['yellow']}Categories: {', '.join(CATEGORIES.keys())}{c['reset']}")
+                return
+            listings = AuctionHouse.get_active_listings(category=category)
+            if not listings:
+                await player.send(f"{c['yellow']}No active listings{' in ' + category if category else ''}.{c['reset']}")
+                return
+            header = f"{'#':<5} {'Price':>9} {'Item':<30} {'Category':<12} {'Seller':<14} {'Time'}"
+            await player.send(f"\n{c['bright_cyan']}═══ Auction House Listings ═══{c['reset']}")
+            await player.send(f"  {c['white']}{header}{c['reset']}")
+            for listing in listings[:30]:
+                await player.send(AuctionHouse.format_listing(listing, c))
+            await player.send(f"{c['white']}  ({len(listings)} listing{'s' if len(listings)!=1 else ''}){c['reset']}")
+
+        elif sub == 'sell':
+            if len(args) < 3:
+                await player.send(f"{c['yellow']}Usage: auction sell <item> <price> [auction]{c['reset']}")
+                return
+
+            # Parse: last arg is price (and optionally "auction" after)
+            is_auction = args[-1].lower() == 'auction'
+            if is_auction:
+                if len(args) < 4:
+                    await player.send(f"{c['yellow']}Usage: auction sell <item> <price> auction{c['reset']}")
+                    return
+                try:
+                    price = int(args[-2])
+                except ValueError:
+                    await player.send(f"{c['red']}Invalid price.{c['reset']}")
+                    return
+                item_name = ' '.join(args[1:-2])
+            else:
+                try:
+                    price = int(args[-1])
+                except ValueError:
+                    await player.send(f"{c['red']}Invalid price. Usage: auction sell <item> <price>{c['reset']}")
+                    return
+                item_name = ' '.join(args[1:-1])
+
+            if not item_name:
+                await player.send(f"{c['yellow']}What item do you want to sell?{c['reset']}")
+                return
+
+            # Find item in inventory
+            item = None
+            for inv_item in player.inventory:
+                if item_name.lower() in inv_item.name.lower() or item_name.lower() in getattr(inv_item, 'short_desc', '').lower():
+                    item = inv_item
+                    break
+            if not item:
+                await player.send(f"{c['red']}You don't have '{item_name}' in your inventory.{c['reset']}")
+                return
+
+            result = AuctionHouse.create_listing(player, item, price, is_auction=is_auction, min_bid=max(1, price // 2) if is_auction else 0)
+            color = c['bright_green'] if result['success'] else c['red']
+            await player.send(f"{color}{result['message']}{c['reset']}")
+
+        elif sub == 'buy':
+            if len(args) < 2:
+                await player.send(f"{c['yellow']}Usage: auction buy <id>{c['reset']}")
+                return
+            try:
+                lid = int(args[1])
+            except ValueError:
+                await player.send(f"{c['red']}Invalid listing ID.{c['reset']}")
+                return
+            result = AuctionHouse.buy_listing(player, lid)
+            color = c['bright_green'] if result['success'] else c['red']
+            await player.send(f"{color}{result['message']}{c['reset']}")
+
+        elif sub == 'bid':
+            if len(args) < 3:
+                await player.send(f"{c['yellow']}Usage: auction bid <id> <amount>{c['reset']}")
+                return
+            try:
+                lid = int(args[1])
+                amount = int(args[2])
+            except ValueError:
+                await player.send(f"{c['red']}Invalid ID or amount.{c['reset']}")
+                return
+            result = AuctionHouse.place_bid(player, lid, amount)
+            color = c['bright_green'] if result['success'] else c['red']
+            await player.send(f"{color}{result['message']}{c['reset']}")
+
+        elif sub == 'cancel':
+            if len(args) < 2:
+                await player.send(f"{c['yellow']}Usage: auction cancel <id>{c['reset']}")
+                return
+            try:
+                lid = int(args[1])
+            except ValueError:
+                await player.send(f"{c['red']}Invalid listing ID.{c['reset']}")
+                return
+            result = AuctionHouse.cancel_listing(player, lid)
+            color = c['bright_green'] if result['success'] else c['red']
+            await player.send(f"{color}{result['message']}{c['reset']}")
+
+        elif sub == 'search':
+            if len(args) < 2:
+                await player.send(f"{c['yellow']}Usage: auction search <keyword>{c['reset']}")
+                return
+            keyword = ' '.join(args[1:])
+            listings = AuctionHouse.get_active_listings(keyword=keyword)
+            if not listings:
+                await player.send(f"{c['yellow']}No listings matching '{keyword}'.{c['reset']}")
+                return
+            await player.send(f"\n{c['bright_cyan']}═══ Search: '{keyword}' ═══{c['reset']}")
+            for listing in listings[:20]:
+                await player.send(AuctionHouse.format_listing(listing, c))
+            await player.send(f"{c['white']}  ({len(listings)} result{'s' if len(listings)!=1 else ''}){c['reset']}")
+
+        elif sub == 'history':
+            history = AuctionHouse.get_player_history(player.name)
+            if not history:
+                await player.send(f"{c['yellow']}No transaction history.{c['reset']}")
+                return
+            await player.send(f"\n{c['bright_cyan']}═══ Your Auction History ═══{c['reset']}")
+            for h in history[-15:]:
+                role = 'SOLD' if h.get('seller', '').lower() == player.name.lower() else 'BOUGHT'
+                color = c['bright_green'] if role == 'SOLD' else c['bright_yellow']
+                ts = datetime.fromtimestamp(h['time']).strftime('%m/%d %H:%M')
+                await player.send(f"  {color}{role:<7}{c['white']}{h['item_name']:<25} {c['yellow']}{h['price']}g {c['blue']}{ts}{c['reset']}")
+
+        elif sub == 'collect':
+            gold = AuctionHouse.collect_pending_gold(player)
+            items = AuctionHouse.collect_pending_items(player)
+            if not gold and not items:
+                await player.send(f"{c['yellow']}Nothing to collect.{c['reset']}")
+                return
+            if gold:
+                await player.send(f"{c['bright_green']}Collected {gold} gold from sales!{c['reset']}")
+            for item in items:
+                await player.send(f"{c['bright_green']}Received: {getattr(item, 'short_desc', item.name)}{c['reset']}")
+
+        else:
+            await player.send(f"{c['yellow']}Unknown auction command. Type 'auction' for help.{c['reset']}")
+
+    # ==================== PLAYER TRADING ====================
+
+    @classmethod
+    async def cmd_trade(cls, player: 'Player', args: List[str]):
+        """Trade items with another player.
+
+        Usage:
+            trade <player>       - Initiate a trade with a player
+            trade offer <item>   - Add an item to your trade offer
+            trade accept         - Accept the current trade
+            trade cancel         - Cancel the trade
+        """
+        c = player.config.COLORS
+
+        if not args:
+            await player.send(f"{c['yellow']}Usage: trade <player> | trade offer <item> | trade accept | trade cancel{c['reset']}")
+            return
+
+        sub = args[0].lower()
+
+        # Initialize trade state if needed
+        if not hasattr(player, 'trade_partner'):
+            player.trade_partner = None
+            player.trade_offer = []
+            player.trade_accepted = False
+            player.trade_request_from = None
+
+        if sub == 'accept' and not getattr(player, 'trade_partner', None):
+            # Accept incoming trade request
+            requester = getattr(player, 'trade_request_from', None)
+            if not requester:
+                await player.send("No pending trade requests.")
+                return
+            # Start the trade
+            player.trade_partner = requester
+            player.trade_offer = []
+            player.trade_accepted = False
+            requester.trade_partner = player
+            requester.trade_offer = []
+            requester.trade_accepted = False
+            player.trade_request_from = None
+            await player.send(f"{c['green']}Trade started with {requester.name}. Use 'trade offer <item>' to add items.{c['reset']}")
+            await requester.send(f"{c['green']}{player.name} accepted your trade! Use 'trade offer <item>' to add items.{c['reset']}")
+            return
+
+        if sub == 'cancel':
+            partner = getattr(player, 'trade_partner', None)
+            if partner:
+                # Return offered items
+                for item in getattr(player, 'trade_offer', []):
+                    player.inventory.append(item)
+                for item in getattr(partner, 'trade_offer', []):
+                    partner.inventory.append(item)
+                await partner.send(f"{c['red']}{player.name} cancelled the trade.{c['reset']}")
+                partner.trade_partner = None
+                partner.trade_offer = []
+                partner.trade_accepted = False
+            player.trade_partner = None
+            player.trade_offer = []
+            player.trade_accepted = False
+            player.trade_request_from = None
+            await player.send(f"{c['yellow']}Trade cancelled.{c['reset']}")
+            return
+
+        if sub == 'offer':
+            partner = getattr(player, 'trade_partner', None)
+            if not partner:
+                await player.send("You're not in a trade. Start one with 'trade <player>'.")
+                return
+            if len(args) < 2:
+                await player.send("Offer what? Usage: trade offer <item>")
+                return
+            item_name = ' '.join(args[1:]).lower()
+            item = None
+            for i in player.inventory:
+                if item_name in i.name.lower() or item_name in i.short_desc.lower():
+                    item = i
+                    break
+            if not item:
+                await player.send("You don't have that item.")
+                return
+            player.inventory.remove(item)
+            player.trade_offer.append(item)
+            # Reset acceptance when offer changes
+            player.trade_accepted = False
+            partner.trade_accepted = False
+            await player.send(f"{c['green']}You offer {item.short_desc}.{c['reset']}")
+            await partner.send(f"{c['cyan']}{player.name} offers {item.short_desc}.{c['reset']}")
+            # Show trade status
+            await cls._show_trade_status(player)
+            await cls._show_trade_status(partner)
+            return
+
+        if sub == 'accept' or sub == 'ok':
+            partner = getattr(player, 'trade_partner', None)
+            if not partner:
+                await player.send("You're not in a trade.")
+                return
+            player.trade_accepted = True
+            await partner.send(f"{c['green']}{player.name} has accepted the trade.{c['reset']}")
+            await player.send(f"{c['green']}You accept the trade. Waiting for {partner.name}...{c['reset']}")
+            # Check if both accepted
+            if getattr(partner, 'trade_accepted', False):
+                # Complete the trade
+                for item in player.trade_offer:
+                    partner.inventory.append(item)
+                for item in partner.trade_offer:
+                    player.inventory.append(item)
+                await player.send(f"{c['bright_green']}Trade complete!{c['reset']}")
+                await partner.send(f"{c['bright_green']}Trade complete!{c['reset']}")
+                player.trade_partner = None
+                player.trade_offer = []
+                player.trade_accepted = False
+                partner.trade_partner = None
+                partner.trade_offer = []
+                partner.trade_accepted = False
+            return
+
+        # Initiate trade with a player
+        target_name = sub.capitalize()
+        if not player.room:
+            return
+        target = None
+        for ch in player.room.characters:
+            if hasattr(ch, 'connection') and ch.name.lower() == target_name.lower() and ch != player:
+                target = ch
+                break
+        if not target:
+            await player.send(f"{c['red']}{target_name} is not here.{c['reset']}")
+            return
+        if getattr(player, 'trade_partner', None):
+            await player.send("You're already in a trade. Cancel first.")
+            return
+        # Send request
+        if not hasattr(target, 'trade_request_from'):
+            target.trade_request_from = None
+        target.trade_request_from = player
+        await player.send(f"{c['cyan']}You request a trade with {target.name}.{c['reset']}")
+        await target.send(f"\r\n{c['bright_cyan']}{player.name} wants to trade with you. Type 'trade accept' or 'trade cancel'.{c['reset']}")
+
+    @classmethod
+    async def _show_trade_status(cls, player: 'Player'):
+        """Show the current trade offers to a player."""
+        c = player.config.COLORS
+        partner = player.trade_partner
+        if not partner:
+            return
+        your_items = ', '.join(i.short_desc for i in getattr(player, 'trade_offer', [])) or 'nothing'
+        their_items = ', '.join(i.short_desc for i in getattr(partner, 'trade_offer', [])) or 'nothing'
+        await player.send(f"{c['cyan']}  Your offer: {c['white']}{your_items}{c['reset']}")
+        await player.send(f"{c['cyan']}  Their offer: {c['white']}{their_items}{c['reset']}")
@@ -0,0 +1,995 @@
+"""
+Misthollow Communication Commands
+================================
+Talking, channels, NPC chat, friends and mail.
+"""
+
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+from server import fan_out
+import os
+
+
+class CommunicationCommands:
+    """Communication commands."""
+
+    @classmethod
+    async def handle_npc_trigger(cls, player: 'Player', npc: 'Mobile', message: str):
+        """Handle NPC responses to player speech."""
+        c = player.config.COLORS
+
+        # Healer NPCs
+        if npc.special == 'healer':
+            if 'heal' in message or 'help' in message:
+                # Check if player needs healing
+                if player.hp < player.max_hp:
+                    heal_amount = player.max_hp - player.hp
+                    player.hp = player.max_hp
+                    await player.send(f"{c['bright_cyan']}{npc.name} says, 'Let me tend to your wounds.'{c['reset']}")
+                    await player.room.send_to_room(
+                        f"{npc.name} places their hands on {player.name} and heals them.",
+                        exclude=[player]
+                    )
+                    await player.send(f"{c['bright_green']}You are fully healed! [{heal_amount} HP]{c['reset']}")
+                else:
+                    await player.send(f"{c['bright_cyan']}{npc.name} says, 'You appear to be in perfect health already.'{c['reset']}")
+
+        # Shopkeeper NPCs
+        elif npc.special == 'shopkeeper':
+            if 'hello' in message or 'hi' in message or 'greet' in message:
+                await player.send(f"{c['bright_cyan']}{npc.name} says, 'Welcome! Type LIST to see my wares.'{c['reset']}")
+            elif 'buy' in message or 'sell' in message:
+                await player.send(f"{c['bright_cyan']}{npc.name} says, 'Use BUY <item> to purchase or SELL <item> to sell to me.'{c['reset']}")
+
+        # Trainer NPCs
+        elif npc.special == 'trainer':
+            if 'train' in message or 'teach' in message or 'practice' in message:
+                await player.send(f"{c['bright_cyan']}{npc.name} says, 'I can train you in the arts of thievery. Type PRACTICE to see what I offer.'{c['reset']}")
+            elif 'hello' in message or 'hi' in message:
+                await player.send(f"{c['bright_cyan']}{npc.name} says, 'Welcome to the guild, shadow walker.'{c['reset']}")
+
+        # Innkeeper NPCs
+        elif npc.special == 'innkeeper':
+            if 'rent' in message or 'room' in message or 'stay' in message:
+                rent_cost = max(20, player.level * 10)
+                await player.send(f"{c['bright_cyan']}{npc.name} says, 'A room costs {rent_cost} gold per night. Type RENT to secure a room and rest.'{c['reset']}")
+            elif 'hello' in message or 'hi' in message or 'greet' in message:
+                await player.send(f"{c['bright_cyan']}{npc.name} says, 'Welcome to The Prancing Pony! Looking for a room to rest? Just ask about rent.'{c['reset']}")
+            elif 'help' in message:
+                await player.send(f"{c['bright_cyan']}{npc.name} says, 'We offer safe rooms where you can rest and save your progress. Type RENT when you're ready.'{c['reset']}")
+
+        # Flavor / Lore NPCs with talk_responses
+        elif npc.special == 'flavor_npc':
+            talk_responses = getattr(npc, 'talk_responses', {})
+            if talk_responses:
+                # Try to match a keyword in the message
+                response = None
+                for keyword, resp in talk_responses.items():
+                    if keyword != 'default' and keyword in message:
+                        response = resp
+                        break
+                if not response:
+                    # Use 'hello' for greetings, otherwise 'default'
+                    if 'hello' in message or 'hi' in message or 'greet' in message or message == 'hello':
+                        response = talk_responses.get('hello', talk_responses.get('default', ''))
+                    else:
+                        response = talk_responses.get('default', '')
+                if response:
+                    await player.send(f"\n{c['bright_cyan']}{response}{c['reset']}\n")
+            else:
+                await player.send(f"{c['bright_cyan']}{npc.name} regards you silently.{c['reset']}")
+
+        # Generic helper NPCs
+        elif 'helper' in npc.flags:
+            if 'hello' in message or 'hi' in message or 'greet' in message:
+                await player.send(f"{c['bright_cyan']}{npc.name} nods at you in acknowledgment.{c['reset']}")
+            elif 'help' in message:
+                await player.send(f"{c['bright_cyan']}{npc.name} says, 'I'm here to keep the peace. Stay out of trouble!'{c['reset']}")
+
+    @classmethod
+    async def cmd_ask(cls, player: 'Player', args: List[str]):
+        """Ask an NPC a question using LLM-powered conversation."""
+        c = player.config.COLORS
+        
+        if len(args) < 2:
+            await player.send(f"{c['yellow']}Usage: ask <npc> <question>{c['reset']}")
+            await player.send(f"{c['cyan']}Example: ask sage What is the history of this realm?{c['reset']}")
+            return
+        
+        npc_name = args[0].lower()
+        question = ' '.join(args[1:])
+        
+        # Find the NPC in the room
+        from mobs import Mobile
+        target_npc = None
+        
+        for char in player.room.characters:
+            if isinstance(char, Mobile):
+                if npc_name in char.name.lower():
+                    target_npc = char
+                    break
+                # Check keywords
+                keywords = getattr(char, 'keywords', [])
+                if isinstance(keywords, str):
+                    keywords = [keywords]
+                for kw in keywords:
+                    if npc_name in kw.lower():
+                        target_npc = char
+                        break
+                if target_npc:
+                    break
+        
+        if not target_npc:
+            await player.send(f"{c['red']}You don't see '{npc_name}' here to ask.{c['reset']}")
+            return
+        
+        # Check if LLM is available
+        from llm_client import get_llm_client
+        llm = get_llm_client()
+        
+        if not await llm.is_available():
+            # Fallback to generic response
+            await player.send(f"{c['cyan']}{target_npc.name} looks at you thoughtfully but doesn't seem to understand.{c['reset']}")
+            await player.send(f"{c['yellow']}(LLM server not available - start LM Studio to enable NPC conversations){c['reset']}")
+            return
+        
+        # Show thinking indicator
+        await player.send(f"{c['cyan']}You ask {target_npc.name}: \"{question}\"{c['reset']}")
+        await player.room.send_to_room(
+            f"{player.name} speaks with {target_npc.name}.",
+            exclude=[player]
+        )
+        
+        # Get NPC personality and context
+        from npc_personalities import get_npc_personality, get_world_context
+        
+        personality = get_npc_personality(target_npc)
+        context = get_world_context(player, target_npc)
+        
+        # Get conversation history for this NPC (if we have it)
+        conv_key = f"{player.name}:{target_npc.vnum if hasattr(target_npc, 'vnum') else target_npc.name}"
+        if not hasattr(player, 'npc_conversations'):
+            player.npc_conversations = {}
+        history = player.npc_conversations.get(conv_key, [])
+        
+        # Call LLM
+        response = await llm.ask_npc(
+            npc_name=target_npc.name,
+            npc_personality=personality,
+            player_name=player.name,
+            question=question,
+            context=context,
+            conversation_history=history
+        )
+        
+        if response:
+            # Store conversation history
+            history.append({"role": "user", "content": f"{player.name} asks: {question}"})
+            history.append({"role": "assistant", "content": response})
+            # Keep only last 10 messages
+            player.npc_conversations[conv_key] = history[-10:]
+            
+            # Display NPC response
+            await player.send(f"\n{c['bright_cyan']}{target_npc.name} says, \"{response}\"{c['reset']}\n")
+        else:
+            await player.send(f"{c['cyan']}{target_npc.name} ponders for a moment but doesn't respond.{c['reset']}")
+
+    @classmethod
+    async def cmd_say(cls, player: 'Player', args: List[str]):
+        """Say something to the room."""
+        if not args:
+            await player.send("Say what?")
+            return
+
+        message = ' '.join(args)
+        c = player.config.COLORS
+
+        if not getattr(player, 'norepeat', False):
+            await player.send(f"{c['bright_green']}You say, '{message}'{c['reset']}")
+        await player.room.send_to_room(
+            f"{c['bright_green']}{player.name} says, '{message}'{c['reset']}",
+            exclude=[player]
+        )
+
+        # Check for NPC triggers
+        from mobs import Mobile
+        for char in player.room.characters:
+            if isinstance(char, Mobile) and char.special:
+                await cls.handle_npc_trigger(player, char, message.lower())
+        
+    @classmethod
+    async def cmd_shout(cls, player: 'Player', args: List[str]):
+        """Shout to everyone in the zone."""
+        if not args:
+            await player.send("Shout what?")
+            return
+            
+        message = ' '.join(args)
+        c = player.config.COLORS
+        
+        if not getattr(player, 'norepeat', False):
+            await player.send(f"{c['bright_yellow']}You shout, '{message}'{c['reset']}")
+        
+        # Send to all players in the zone
+        zone = player.room.zone if player.room else None
+        recipients = [p for p in player.world.players_in_zone(zone)
+                      if p is not player and not getattr(p, 'noshout', False)]
+        await fan_out(recipients, f"\r\n{c['bright_yellow']}{player.name} shouts, '{message}'{c['reset']}",
+                      low_priority=True)
+                
+    @classmethod
+    async def cmd_emote(cls, player: 'Player', args: List[str]):
+        """Emote an action."""
+        if not args:
+            await player.send("Emote what?")
+            return
+            
+        message = ' '.join(args)
+        c = player.config.COLORS
+        
+        # Send to room, respecting ignore lists
+        from social import is_ignored
+        if player.room:
+            for char in player.room.characters:
+                if hasattr(char, 'connection') and char.connection:
+                    if char == player or not is_ignored(char, player.name):
+                        await char.send(f"{c['yellow']}{player.name} {message}{c['reset']}")
+        
+    @classmethod
+    async def cmd_tell(cls, player: 'Player', args: List[str]):
+        """Send a private message."""
+        if len(args) < 2:
+            await player.send("Tell whom what?")
+            return
+            
+        target_name = args[0].lower()
+        message = ' '.join(args[1:])
+        c = player.config.COLORS
+        
+        target = player.world.get_player(target_name)
+        if not target:
+            await player.send(f"No player named '{target_name}' is online.")
+            return
+            
+        if getattr(target, 'notell', False):
+            await player.send(f"{c['yellow']}{target.name} is not accepting tells.{c['reset']}")
+            return
+
+        # Check ignore list
+        from social import is_ignored
+        if is_ignored(target, player.name):
+            await player.send(f"{c['yellow']}{target.name} is not accepting tells.{c['reset']}")
+            return
+        
+        if not getattr(player, 'norepeat', False):
+            await player.send(f"{c['bright_cyan']}You tell {target.name}, '{message}'{c['reset']}")
+        await target.send(f"\r\n{c['bright_cyan']}{player.name} tells you, '{message}'{c['reset']}")
+
+    # ==================== NPC CHAT ====================
+
+    @classmethod
+    async def cmd_talk(cls, player: 'Player', args: List[str]):
+        """Talk to an NPC."""
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send("Talk to whom?")
+                return
+
+        if not player.room:
+            await player.send("You are nowhere.")
+            return
+
+        choice_index = None
+        if args and args[-1].isdigit():
+            choice_index = int(args[-1])
+            target_name = ' '.join(args[:-1]).lower()
+        else:
+            target_name = ' '.join(args).lower()
+
+        if not target_name:
+            await player.send("Talk to whom?")
+            return
+
+        from mobs import Mobile
+        target = None
+        for char in player.room.characters:
+            if isinstance(char, Mobile) and target_name in char.name.lower():
+                target = char
+                break
+
+        if not target:
+            await player.send("You don't see them here.")
+            return
+
+        # Reputation gating for NPC interactions
+        try:
+            from factions import FactionManager
+            faction_key = FactionManager.normalize_key(getattr(target, 'faction', None))
+            min_required = None
+            if getattr(target, 'min_rep_talk', None) is not None:
+                min_required = int(target.min_rep_talk)
+            elif getattr(target, 'min_rep_talk_level', None) and faction_key:
+                min_required = FactionManager.get_threshold_for_level(target.min_rep_talk_level)
+
+            if faction_key and min_required is not None:
+                rep = FactionManager.get_reputation(player, faction_key)
+                if rep < min_required:
+                    c = player.config.COLORS
+                    await player.send(f"{c['yellow']}{target.name} refuses to speak with you.{c['reset']}")
+                    return
+        except Exception:
+            pass
+
+        c = player.config.COLORS
+        await player.send(f"{c['bright_green']}You greet {target.name}.{c['reset']}")
+
+        # Trigger NPC responses
+        if target.special:
+            await cls.handle_npc_trigger(player, target, 'hello')
+
+        # Dialogue trees
+        from quests import QuestManager, QUEST_DEFINITIONS
+        if hasattr(target, 'vnum'):
+            await QuestManager.handle_dialogue(player, target.vnum, choice_index)
+
+        # Quest giver interactions
+        if hasattr(target, 'vnum'):
+            available = QuestManager.get_available_quests(player, target.vnum)
+            # Filter out tutorial quests that aren't the current next step
+            if available:
+                active_tutorials = [q.quest_id for q in getattr(player, 'active_quests', []) if q.quest_id.startswith('tutorial_')]
+                if active_tutorials:
+                    # Player has active tutorial — don't show other tutorial quests
+                    available = [q for q in available if not q.startswith('tutorial_')]
+                else:
+                    # Show only the first available tutorial quest (the next in chain)
+                    tutorial_avail = [q for q in available if q.startswith('tutorial_')]
+                    non_tutorial = [q for q in available if not q.startswith('tutorial_')]
+                    available = non_tutorial + tutorial_avail[:1]
+            if available:
+                # Flavorful NPC intro based on quest giver identity
+                _quest_giver_intros = {
+                    4050: "Grimjaw the Prospector strokes his iron-grey beard. 'The deep mines have been overrun, friend. I could use help with a few things...'",
+                    5290: "Captain Varro fixes you with a piercing stare. 'The desert holds many dangers. If you've got steel in your spine, I have work for you.'",
+                    5390: "Professor Khepri adjusts her spectacles excitedly. 'The pyramid holds secrets untold! I need brave souls to help with my research...'",
+                    6090: "Ranger Thornwood nocks an arrow absently. 'The forest grows more dangerous by the day. I could use another pair of hands.'",
+                    6590: "Zilara's silver eyes gleam from beneath her hood. 'The drow stir below. If you dare the darkness, I can guide your purpose.'",
+                    7090: "Skullcap grins, revealing a mouth of mostly-absent teeth. 'The sewers ain't gonna clean themselves, friend. Interested in some dirty work?'",
+                    7390: "Professor Mindwell's hands tremble as he speaks. 'They're down there... the mindflayers. I need someone braver than I to finish what we started.'",
+                    8090: "Drakon runs a whetstone along his massive blade. 'Dragons. Nothing else worth hunting, if you ask me. You look like you might survive.'",
+                    10090: "Scout Harken unfurls a stained map. 'Orc patrols are getting bolder. I've been tracking them — want to help thin the herd?'",
+                    11090: "Lyralei's harp falls silent as she regards you. 'The ancient forest needs protectors. Will you answer its call?'",
+                    14090: "Paladin Dawnguard's war hammer pulses with golden light. 'The undead defile this sacred ground. Join the crusade, and we shall purge them.'",
+                    16090: "Arcanist Veyla's orbiting runes flare briefly. 'The planes bleed into each other here. I need capable hands to help contain the chaos.'",
+                    18090: "Borin the Wilderness Guide checks his massive pack. 'The northern forest is no place for the unprepared. But if you're ready, I've got work.'",
+                    19090: "Freja breathes frost as she speaks. 'The Frostspire is death for the careless. But the rewards... come, let me tell you what I need.'",
+                    22090: "Sir Aldren slams his fist against his dented breastplate. 'Castle Apocalypse WILL fall. This time, I swear it. Are you with me?'",
+                }
+                npc_vnum = getattr(target, 'vnum', 0)
+                intro = _quest_giver_intros.get(npc_vnum)
+                if intro:
+                    await player.send(f"\n{c['bright_yellow']}{intro}{c['reset']}\n")
+                else:
+                    await player.send(f"\n{c['bright_yellow']}{target.name} has quests for you:{c['reset']}")
+                for quest_id in available:
+                    quest_def = QUEST_DEFINITIONS[quest_id]
+                    await player.send(f"  {c['bright_cyan']}{quest_def['name']}{c['reset']} — {c['white']}{quest_def['description'][:80]}{c['reset']}")
+                    await player.send(f"    {c['bright_black']}(quest accept {quest_id}){c['reset']}")
+                await player.send(f"\n{c['white']}Use 'quest accept <quest_id>' to accept a quest.{c['reset']}")
+
+        await QuestManager.check_quest_progress(
+            player, 'talk', {'npc_vnum': getattr(target, 'vnum', 0), 'npc_name': target.name}
+        )
+        
+        # Journal entry for notable NPCs (those with quests, special functions, or notable flag)
+        try:
+            from journal import JournalManager, NOTABLE_NPCS
+            is_notable = (
+                getattr(target, 'notable', False) or
+                getattr(target, 'special', None) or
+                available or  # Has quests
+                getattr(target, 'shopkeeper', False) or
+                getattr(target, 'trainer', False)
+            )
+            if is_notable:
+                npc_key = f"{getattr(target, 'vnum', 0)}_{target.name.lower().replace(' ', '_')}"
+                npc_desc = getattr(target, 'description', '') or getattr(target, 'long_desc', '') or f"A resident of the realm."
+                
+                # Check for predefined lore about this NPC
+                for lore_key, lore_data in NOTABLE_NPCS.items():
+                    if lore_key.lower() in target.name.lower() or target.name.lower() in lore_key.lower():
+                        npc_desc = lore_data['content']
+                        break
+                
+                await JournalManager.discover_npc(
+                    player, npc_key, target.name, npc_desc
+                )
+        except Exception:
+            pass
+
+    @classmethod
+    async def cmd_chat(cls, player: 'Player', args: List[str]):
+        """Have a dynamic AI conversation with an NPC. Usage: chat <npc> <message>"""
+        c = player.config.COLORS
+        
+        if len(args) < 2:
+            await player.send(f"{c['yellow']}Usage: chat <npc> <what you want to say>{c['reset']}")
+            await player.send(f"{c['white']}Example: chat guard Hello, any trouble around here?{c['reset']}")
+            return
+        
+        if not player.room:
+            await player.send("You are nowhere.")
+            return
+        
+        # First arg is NPC name, rest is message
+        target_name = args[0].lower()
+        message = ' '.join(args[1:])
+        
+        from mobs import Mobile
+        target = None
+        for char in player.room.characters:
+            if isinstance(char, Mobile) and target_name in char.name.lower():
+                target = char
+                break
+        
+        if not target:
+            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
+            return
+        
+        # Check AI chat toggle
+        if not getattr(player, 'ai_chat_enabled', True):
+            await player.send(f"{c['yellow']}AI chat is disabled. Use 'ai on' to enable.{c['reset']}")
+            return
+        
+        # Conversation key
+        convo_key = f"chat_{target.vnum if hasattr(target, 'vnum') else id(target)}"
+        if not hasattr(player, 'conversation_history'):
+            player.conversation_history = {}
+        
+        # Handle reset
+        if message.strip().lower() == 'reset':
+            player.conversation_history.pop(convo_key, None)
+            await player.send(f"{c['yellow']}Conversation with {target.name} has been reset.{c['reset']}")
+            return
+        
+        # Show player speaking
+        await player.send(f"{c['white']}You say to {target.name}, \"{message}\"{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(
+                f"{player.name} says something to {target.name}.",
+                exclude=[player]
+            )
+        
+        # Try AI response
+        from ai_service import ai_service
+        
+        # Get NPC personality from attributes or generate defaults
+        npc_desc = getattr(target, 'short_desc', target.name)
+        npc_personality = getattr(target, 'personality', None)
+        
+        if not npc_personality:
+            # Generate personality from NPC type/keywords
+            if any(k in target.name.lower() for k in ['guard', 'soldier', 'knight']):
+                npc_personality = "Serious, dutiful, protective. Speaks formally."
+            elif any(k in target.name.lower() for k in ['merchant', 'vendor', 'shopkeeper']):
+                npc_personality = "Friendly, business-minded, always looking to make a sale."
+            elif any(k in target.name.lower() for k in ['beggar', 'peasant', 'farmer']):
+                npc_personality = "Humble, weary, speaks simply."
+            elif any(k in target.name.lower() for k in ['wizard', 'mage', 'sage']):
+                npc_personality = "Wise, cryptic, speaks in riddles sometimes."
+            elif any(k in target.name.lower() for k in ['priest', 'cleric', 'monk']):
+                npc_personality = "Pious, kind, speaks of faith and blessings."
+            elif any(k in target.name.lower() for k in ['thief', 'rogue', 'bandit']):
+                npc_personality = "Shifty, cunning, speaks in hushed tones."
+            elif any(k in target.name.lower() for k in ['bartender', 'innkeeper']):
+                npc_personality = "Friendly, gossipy, knows local rumors."
+            else:
+                npc_personality = "A typical citizen of the realm."
+        
+        # Get conversation history if we have it
+        history = player.conversation_history.get(convo_key, [])
+        
+        # Generate AI response
+        response = await ai_service.npc_dialogue(
+            npc_name=target.name,
+            npc_desc=npc_desc,
+            npc_personality=npc_personality,
+            player_name=player.name,
+            player_says=message,
+            conversation_history=history
+        )
+        
+        if response:
+            await player.send(f"{c['bright_green']}{target.name} says, \"{response}\"{c['reset']}")
+            
+            # Store in history
+            history.append(f"{player.name}: {message}")
+            history.append(f"{target.name}: {response}")
+            player.conversation_history[convo_key] = history[-8:]  # Keep last 8 lines
+        else:
+            # Fallback to generic responses
+            import random
+            fallbacks = [
+                f"{target.name} looks at you but doesn't seem to understand.",
+                f"{target.name} nods politely.",
+                f"{target.name} shrugs.",
+                f"{target.name} seems distracted.",
+                f"{target.name} grunts acknowledgment.",
+            ]
+            await player.send(f"{c['yellow']}{random.choice(fallbacks)}{c['reset']}")
+
+    @classmethod
+    async def cmd_chathistory(cls, player: 'Player', args: List[str]):
+        """Show recent AI chat history with an NPC. Usage: chathistory <npc>"""
+        c = player.config.COLORS
+        
+        if not args:
+            await player.send(f"{c['yellow']}Usage: chathistory <npc>{c['reset']}")
+            return
+        
+        target_name = ' '.join(args).lower()
+        from mobs import Mobile
+        target = None
+        if player.room:
+            for char in player.room.characters:
+                if isinstance(char, Mobile) and target_name in char.name.lower():
+                    target = char
+                    break
+        
+        if not target:
+            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
+            return
+        
+        if not hasattr(player, 'conversation_history'):
+            player.conversation_history = {}
+        
+        convo_key = f"chat_{target.vnum if hasattr(target, 'vnum') else id(target)}"
+        history = player.conversation_history.get(convo_key, [])
+        
+        if not history:
+            await player.send(f"{c['yellow']}No conversation history with {target.name}.{c['reset']}")
+            return
+        
+        await player.send(f"{c['cyan']}=== Chat History: {target.name} ==={c['reset']}")
+        for line in history:
+            await player.send(f"{c['white']}{line}{c['reset']}")
+
+    @classmethod
+    async def cmd_ai(cls, player: 'Player', args: List[str]):
+        """Toggle AI chat on/off. Usage: ai on|off"""
+        c = player.config.COLORS
+        
+        if not args:
+            status = 'ON' if getattr(player, 'ai_chat_enabled', True) else 'OFF'
+            await player.send(f"{c['cyan']}AI chat is currently {status}.{c['reset']}")
+            await player.send(f"{c['yellow']}Usage: ai on|off{c['reset']}")
+            return
+        
+        val = args[0].lower()
+        if val not in ['on', 'off']:
+            await player.send(f"{c['red']}Usage: ai on|off{c['reset']}")
+            return
+        
+        player.ai_chat_enabled = (val == 'on')
+        await player.send(f"{c['green']}AI chat {val.upper()}.{c['reset']}")
+
+    @classmethod
+    async def cmd_aistatus(cls, player: 'Player', args: List[str]):
+        """Check AI service status (admin command)."""
+        c = player.config.COLORS
+        
+        from ai_service import ai_service
+        
+        await player.send(f"{c['cyan']}=== AI Service Status ==={c['reset']}")
+        await player.send(f"  Enabled: {c['green'] if ai_service.config.enabled else c['red']}{ai_service.config.enabled}{c['reset']}")
+        await player.send(f"  Available: {c['green'] if ai_service.available else c['red']}{ai_service.available}{c['reset']}")
+        await player.send(f"  Endpoint: {ai_service.config.base_url}")
+        await player.send(f"  Cache entries: {len(ai_service.cache)}")
+        
+        # Try to check connection
+        available = await ai_service.check_availability()
+        if available:
+            await player.send(f"{c['bright_green']}LM Studio is running and ready!{c['reset']}")
+        else:
+            await player.send(f"{c['yellow']}LM Studio not detected. Start it for AI features.{c['reset']}")
+
+    # ==================== GLOBAL CHANNELS ====================
+
+    @classmethod
+    async def cmd_gossip(cls, player: 'Player', args: List[str]):
+        """Global chat channel. Usage: gossip <message>"""
+        c = player.config.COLORS
+
+        if not args:
+            await player.send(f"{c['yellow']}Gossip what?{c['reset']}")
+            return
+
+        message = ' '.join(args)
+        
+        # Send to all players in the world
+        if hasattr(player, 'world') and player.world:
+            if not getattr(player, 'norepeat', False):
+                await player.send(f"{c['magenta']}[Gossip] You gossip: {message}{c['reset']}")
+            recipients = [p for p in player.world.players.values()
+                          if p is not player and not getattr(p, 'noshout', False)]
+            await fan_out(recipients, f"{c['magenta']}[Gossip] {player.name}: {message}{c['reset']}", low_priority=True)
+
+    @classmethod
+    async def cmd_grats(cls, player: 'Player', args: List[str]):
+        """Congratulations channel. Usage: grats <message>"""
+        c = player.config.COLORS
+
+        if not args:
+            # No args = just say grats
+            message = "Congratulations!"
+        else:
+            message = ' '.join(args)
+        
+        if hasattr(player, 'world') and player.world:
+            if not getattr(player, 'norepeat', False):
+                await player.send(f"{c['bright_green']}[Grats] You: {message}{c['reset']}")
+            recipients = [p for p in player.world.players.values()
+                          if p is not player and not getattr(p, 'noshout', False)]
+            await fan_out(recipients, f"{c['bright_green']}[Grats] {player.name}: {message}{c['reset']}", low_priority=True)
+
+    @classmethod
+    async def cmd_holler(cls, player: 'Player', args: List[str]):
+        """Shout to everyone (costs 20 movement). Usage: holler <message>"""
+        c = player.config.COLORS
+
+        if not args:
+            await player.send(f"{c['yellow']}Holler what?{c['reset']}")
+            return
+        
+        if player.move < 20:
+            await player.send(f"{c['red']}You're too exhausted to holler!{c['reset']}")
+            return
+        
+        player.move -= 20
+        message = ' '.join(args)
+        
+        if hasattr(player, 'world') and player.world:
+            if not getattr(player, 'norepeat', False):
+                await player.send(f"{c['bright_red']}You holler '{message}'{c['reset']}")
+            recipients = [p for p in player.world.players.values()
+                          if p is not player and not getattr(p, 'noshout', False)]
+            await fan_out(recipients, f"{c['bright_red']}{player.name} hollers '{message}'{c['reset']}",
+                          low_priority=True)
+
+    @classmethod
+    async def cmd_qsay(cls, player: 'Player', args: List[str]):
+        """Say something on the quest channel. Usage: qsay <message>"""
+        c = player.config.COLORS
+
+        if not getattr(player, 'on_quest', False):
+            await player.send(f"{c['yellow']}You're not on a quest.{c['reset']}")
+            return
+
+        if not args:
+            await player.send(f"{c['yellow']}Quest-say what?{c['reset']}")
+            return
+
+        message = ' '.join(args)
+        
+        # Send to all players on the same quest
+        if hasattr(player, 'world') and player.world:
+            for p in player.world.players.values():
+                if getattr(p, 'on_quest', False):
+                    if p == player:
+                        await p.send(f"{c['bright_magenta']}[Quest] You: {message}{c['reset']}")
+                    else:
+                        await p.send(f"{c['bright_magenta']}[Quest] {player.name}: {message}{c['reset']}")
+
+    # ==================== SOCIAL & COMMUNICATION ====================
+
+    @classmethod
+    async def cmd_global(cls, player: 'Player', args: List[str]):
+        """Send a message on the global chat channel. Usage: global <message>"""
+        if not args:
+            await player.send("Global what?")
+            return
+        from social import send_channel_message
+        await send_channel_message(player, 'global', ' '.join(args))
+
+    @classmethod
+    async def cmd_newbie(cls, player: 'Player', args: List[str]):
+        """Send a message on the newbie help channel (levels 1-15 + helpers). Usage: newbie <message>"""
+        if not args:
+            await player.send("Newbie what?")
+            return
+        from social import send_channel_message
+        await send_channel_message(player, 'newbie', ' '.join(args))
+
+    @classmethod
+    async def cmd_lfg(cls, player: 'Player', args: List[str]):
+        """Send a message on the LFG (Looking For Group) channel. Usage: lfg <message>"""
+        if not args:
+            await player.send("LFG what?")
+            return
+        from social import send_channel_message
+        await send_channel_message(player, 'lfg', ' '.join(args))
+
+    @classmethod
+    async def cmd_channel(cls, player: 'Player', args: List[str]):
+        """Manage chat channels. Usage: channel list | channel on/off <name>"""
+        from social import CHANNELS, can_access_channel, is_channel_on
+        c = player.config.COLORS
+
+        if not args or args[0].lower() == 'list':
+            await player.send(f"\r\n{c['cyan']}═══ Chat Channels ═══{c['reset']}")
+            for key, ch in CHANNELS.items():
+                access = can_access_channel(player, key)
+                enabled = is_channel_on(player, key)
+                color = c.get(ch['color'], c['white'])
+                status = f"{c['bright_green']}ON" if enabled else f"{c['red']}OFF"
+                access_str = "" if access else f" {c['bright_black']}(locked)"
+                await player.send(f"  {color}{ch['name']:<10}{c['reset']} {status}{c['reset']} - {ch['description']}{access_str}{c['reset']}")
+            await player.send(f"{c['white']}Use 'channel on/off <name>' to toggle.{c['reset']}")
+            return
+
+        if len(args) < 2:
+            await player.send(f"{c['yellow']}Usage: channel on/off <name>{c['reset']}")
+            return
+
+        action = args[0].lower()
+        ch_name = args[1].lower()
+
+        if ch_name not in CHANNELS:
+            await player.send(f"{c['red']}Unknown channel '{ch_name}'. Use 'channel list'.{c['reset']}")
+            return
+
+        if not hasattr(player, 'disabled_channels'):
+            player.disabled_channels = set()
+
+        if action == 'on':
+            player.disabled_channels.discard(ch_name)
+            await player.send(f"{c['bright_green']}{CHANNELS[ch_name]['name']} channel turned ON.{c['reset']}")
+        elif action == 'off':
+            player.disabled_channels.add(ch_name)
+            await player.send(f"{c['yellow']}{CHANNELS[ch_name]['name']} channel turned OFF.{c['reset']}")
+        else:
+            await player.send(f"{c['yellow']}Usage: channel on/off <name>{c['reset']}")
+
+    @classmethod
+    async def cmd_friend(cls, player: 'Player', args: List[str]):
+        """Manage your friends list. Usage: friend add/remove/list/notify"""
+        from social import add_friend, remove_friend, show_friends
+        c = player.config.COLORS
+
+        if not args or args[0].lower() == 'list':
+            await show_friends(player)
+            return
+
+        action = args[0].lower()
+        if action == 'add':
+            if len(args) < 2:
+                await player.send(f"{c['yellow']}Usage: friend add <player>{c['reset']}")
+                return
+            await add_friend(player, args[1])
+        elif action == 'remove':
+            if len(args) < 2:
+                await player.send(f"{c['yellow']}Usage: friend remove <player>{c['reset']}")
+                return
+            await remove_friend(player, args[1])
+        elif action == 'notify':
+            player.friend_notify = not getattr(player, 'friend_notify', True)
+            if player.friend_notify:
+                await player.send(f"{c['bright_green']}Friend login/logout notifications ON.{c['reset']}")
+            else:
+                await player.send(f"{c['yellow']}Friend login/logout notifications OFF.{c['reset']}")
+        else:
+            await player.send(f"{c['yellow']}Usage: friend add/remove/list/notify{c['reset']}")
+
+    @classmethod
+    async def cmd_ignore(cls, player: 'Player', args: List[str]):
+        """Ignore a player (blocks tells, channels, emotes). Usage: ignore <player>"""
+        c = player.config.COLORS
+        if not args:
+            # Show ignore list
+            ignored = getattr(player, 'ignore_list', [])
+            if not ignored:
+                await player.send(f"{c['yellow']}Your ignore list is empty.{c['reset']}")
+            else:
+                await player.send(f"\r\n{c['cyan']}═══ Ignore List ═══{c['reset']}")
+                for name in ignored:
+                    await player.send(f"  {c['white']}{name}{c['reset']}")
+            return
+        from social import ignore_player
+        await ignore_player(player, args[0])
+
+    @classmethod
+    async def cmd_unignore(cls, player: 'Player', args: List[str]):
+        """Remove a player from your ignore list. Usage: unignore <player>"""
+        if not args:
+            await player.send("Unignore whom?")
+            return
+        from social import unignore_player
+        await unignore_player(player, args[0])
+
+    @classmethod
+    async def cmd_note(cls, player: 'Player', args: List[str]):
+        """Add private notes about players. Usage: note [player] [text]"""
+        from social import add_note, show_notes
+
+        if not args:
+            await show_notes(player)
+            return
+
+        if len(args) == 1:
+            await show_notes(player, args[0])
+            return
+
+        await add_note(player, args[0], ' '.join(args[1:]))
+
+    @classmethod
+    async def cmd_finger(cls, player: 'Player', args: List[str]):
+        """Show detailed info about a player. Usage: finger <player>"""
+        if not args:
+            await player.send("Finger whom?")
+            return
+        from social import show_finger
+        await show_finger(player, args[0])
+
+    @classmethod
+    async def cmd_whois(cls, player: 'Player', args: List[str]):
+        """Show detailed info about a player. Alias for finger."""
+        await cls.cmd_finger(player, args)
+
+    # ==================== PLAYER FEEDBACK ====================
+
+    @classmethod
+    async def cmd_bug(cls, player: 'Player', args: List[str]):
+        """Report a bug. Usage: bug <description>"""
+        c = player.config.COLORS
+        
+        if not args:
+            await player.send(f"{c['yellow']}Usage: bug <description of the bug>{c['reset']}")
+            return
+        
+        import os
+        from datetime import datetime
+        
+        report = ' '.join(args)
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        room_vnum = player.room.vnum if player.room else 'unknown'
+        
+        # Append to bugs file
+        bug_file = os.path.join(os.path.dirname(__file__), '..', 'logs', 'bugs.log')
+        os.makedirs(os.path.dirname(bug_file), exist_ok=True)
+        
+        with open(bug_file, 'a') as f:
+            f.write(f"[{timestamp}] {player.name} (Room {room_vnum}): {report}\n")
+        
+        await player.send(f"{c['green']}Bug reported. Thank you!{c['reset']}")
+
+    @classmethod
+    async def cmd_idea(cls, player: 'Player', args: List[str]):
+        """Suggest an idea. Usage: idea <your suggestion>"""
+        c = player.config.COLORS
+        
+        if not args:
+            await player.send(f"{c['yellow']}Usage: idea <your suggestion>{c['reset']}")
+            return
+        
+        import os
+        from datetime import datetime
+        
+        report = ' '.join(args)
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        idea_file = os.path.join(os.path.dirname(__file__), '..', 'logs', 'ideas.log')
+        os.makedirs(os.path.dirname(idea_file), exist_ok=True)
+        
+        with open(idea_file, 'a') as f:
+            f.write(f"[{timestamp}] {player.name}: {report}\n")
+        
+        await player.send(f"{c['green']}Idea submitted. Thank you!{c['reset']}")
+
+    @classmethod
+    async def cmd_typo(cls, player: 'Player', args: List[str]):
+        """Report a typo. Usage: typo <description>"""
+        c = player.config.COLORS
+        
+        if not args:
+            await player.send(f"{c['yellow']}Usage: typo <description of the typo>{c['reset']}")
+            return
+        
+        import os
+        from datetime import datetime
+        
+        report = ' '.join(args)
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        room_vnum = player.room.vnum if player.room else 'unknown'
+        
+        typo_file = os.path.join(os.path.dirname(__file__), '..', 'logs', 'typos.log')
+        os.makedirs(os.path.dirname(typo_file), exist_ok=True)
+        
+        with open(typo_file, 'a') as f:
+            f.write(f"[{timestamp}] {player.name} (Room {room_vnum}): {report}\n")
+        
+        await player.send(f"{c['green']}Typo reported. Thank you!{c['reset']}")
+
+    # ==================== MAIL ====================
+
+    @classmethod
+    async def cmd_mail(cls, player: 'Player', args: List[str]):
+        """Send, read, list, and delete mail.
+
+        Usage:
+            mail send <player> <message>  - Send mail to a player
+            mail read                     - Read your unread mail
+            mail list                     - List all mail
+            mail delete <number>          - Delete a mail by ID
+        """
+        from mail_system import MailManager
+        c = player.config.COLORS
+
+        if not args:
+            await player.send(f"{c['yellow']}Usage: mail send <player> <message> | mail read | mail list | mail delete <id>{c['reset']}")
+            return
+
+        sub = args[0].lower()
+
+        if sub == 'send':
+            if len(args) < 3:
+                await player.send("Usage: mail send <player> <message>")
+                return
+            recipient = args[1].capitalize()
+            body = ' '.join(args[2:])
+            # Check if player exists (file or online)
+            player_file = os.path.join(player.config.PLAYER_DIR, f"{recipient.lower()}.json")
+            online = recipient.lower() in player.world.players if hasattr(player, 'world') and player.world else False
+            if not os.path.exists(player_file) and not online:
+                await player.send(f"{c['red']}Player '{recipient}' not found.{c['reset']}")
+                return
+            MailManager.send_mail(player.name, recipient, body)
+            await player.send(f"{c['green']}Mail sent to {recipient}.{c['reset']}")
+            # Notify if online
+            if online:
+                target = player.world.players.get(recipient.lower())
+                if target:
+                    await target.send(f"\r\n{c['bright_yellow']}You have new mail from {player.name}! Type 'mail read' to read it.{c['reset']}")
+
+        elif sub == 'read':
+            messages = MailManager.get_unread_mail(player.name)
+            if not messages:
+                await player.send(f"{c['cyan']}You have no unread mail.{c['reset']}")
+                return
+            for m in messages:
+                ts = m.get('timestamp', 'Unknown')[:16]
+                await player.send(f"\r\n{c['bright_cyan']}═══ Mail #{m['msg_id']} from {m['sender']} ({ts}) ═══{c['reset']}")
+                await player.send(f"{c['white']}{m['body']}{c['reset']}")
+                MailManager.mark_read(player.name, m['msg_id'])
+
+        elif sub == 'list':
+            messages = MailManager.get_all_mail(player.name)
+            if not messages:
+                await player.send(f"{c['cyan']}Your mailbox is empty.{c['reset']}")
+                return
+            await player.send(f"{c['bright_cyan']}═══ Mailbox ({len(messages)} messages) ═══{c['reset']}")
+            for m in messages:
+                ts = m.get('timestamp', 'Unknown')[:16]
+                read_mark = ' ' if m.get('read') else '*'
+                await player.send(f"  {c['white']}{read_mark} #{m['msg_id']:<4} From: {m['sender']:<12} {ts}{c['reset']}")
+
+        elif sub == 'delete':
+            if len(args) < 2:
+                await player.send("Usage: mail delete <id>")
+                return
+            try:
+                msg_id = int(args[1])
+            except ValueError:
+                await player.send("Invalid mail ID.")
+                return
+            if MailManager.delete_mail(player.name, msg_id):
+                await player.send(f"{c['green']}Mail #{msg_id} deleted.{c['reset']}")
+            else:
+                await player.send(f"{c['red']}Mail #{msg_id} not found.{c['reset']}")
+        else:
+            await player.send(f"{c['yellow']}Usage: mail send <player> <message> | mail read | mail list | mail delete <id>{c['reset']}")
@@ -0,0 +1,792 @@
+"""
+Misthollow Companion Commands
+============================
+Pets, hirelings, minions and companions.
+"""
+
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class CompanionCommands:
+    """Companion commands."""
+
+    @classmethod
+    async def cmd_order(cls, player: 'Player', args: List[str]):
+        """Order your companion or pet. Usage: order <action> [target] OR order <pet> <action> [target]"""
+        from pets import PetManager
+        from companions import CompanionManager
+
+        c = player.config.COLORS
+
+        if not args:
+            await player.send(f"{c['yellow']}Usage: order <action> [target]{c['reset']}")
+            await player.send(f"Actions: attack, assist, follow, stay, guard, protect, fetch, report")
+            await player.send(f"Positions: sit, stand, sleep, rest")
+            await player.send(f"Movement: order north/south/east/west/up/down")
+            await player.send(f"{c['cyan']}Assist: 'order assist' - pet attacks what you're fighting{c['reset']}")
+            await player.send(f"{c['cyan']}Report: 'order report' - pet reports its status{c['reset']}")
+            await player.send(f"{c['cyan']}Protect: 'order protect <player>' - pet intercepts attacks{c['reset']}")
+            return
+
+        # Check for companion order by name
+        companions = CompanionManager.get_player_companions(player)
+        if companions:
+            companion = CompanionManager.find_companion(player, args[0])
+            if companion:
+                if len(args) < 2:
+                    await player.send(f"{c['yellow']}Usage: order <companion> <action> [target]{c['reset']}")
+                    return
+                action = args[1]
+                target = ' '.join(args[2:]) if len(args) > 2 else ''
+                await CompanionManager.order_companion(player, companion, action, target)
+                return
+
+        # Get all pets
+        pets = PetManager.get_player_pets(player)
+        if not pets:
+            await player.send(f"{c['red']}You don't have any pets to command!{c['reset']}")
+            return
+
+        # Check if first arg is a pet name
+        command = args[0].lower()
+        target = ' '.join(args[1:]) if len(args) > 1 else ''
+        
+        # Check if first arg matches a pet name - if so, shift args
+        for pet in pets:
+            if pet.name.lower().startswith(command) or command in pet.name.lower():
+                if len(args) >= 2:
+                    command = args[1].lower()
+                    target = ' '.join(args[2:]) if len(args) > 2 else ''
+                    if pet.room == player.room:
+                        await pet.execute_command(command, target)
+                    else:
+                        await player.send(f"{c['yellow']}{pet.name} is not here.{c['reset']}")
+                    return
+
+        # Order all pets in room
+        ordered_any = False
+        for pet in pets:
+            if pet.room == player.room:
+                await pet.execute_command(command, target)
+                ordered_any = True
+        
+        if not ordered_any:
+            await player.send(f"{c['yellow']}None of your pets are here.{c['reset']}")
+
+    @classmethod
+    async def cmd_pets(cls, player: 'Player', args: List[str]):
+        """Manage all your pets. Usage: pets [list|report|assist|recall|dismiss all]"""
+        from pets import PetManager
+        c = player.config.COLORS
+        
+        pets = PetManager.get_player_pets(player)
+        
+        if not args:
+            args = ['list']
+            
+        action = args[0].lower()
+        
+        if action == 'list':
+            if not pets:
+                await player.send(f"{c['yellow']}You don't have any pets.{c['reset']}")
+                return
+                
+            await player.send(f"{c['cyan']}╔═══════════════════════════════════════════════════════════╗{c['reset']}")
+            await player.send(f"{c['cyan']}║{c['reset']}              {c['bright_white']}YOUR PETS{c['reset']}                                   {c['cyan']}║{c['reset']}")
+            await player.send(f"{c['cyan']}╠═══════════════════════════════════════════════════════════╣{c['reset']}")
+            
+            for i, pet in enumerate(pets, 1):
+                hp_pct = int((pet.hp / pet.max_hp) * 100) if pet.max_hp > 0 else 0
+                if hp_pct > 75:
+                    hp_color = c['bright_green']
+                elif hp_pct > 50:
+                    hp_color = c['green']
+                elif hp_pct > 25:
+                    hp_color = c['yellow']
+                else:
+                    hp_color = c['red']
+                
+                # Location
+                if pet.room == player.room:
+                    loc = f"{c['green']}Here{c['reset']}"
+                elif pet.room:
+                    loc = f"{c['yellow']}{pet.room.name[:15]}{c['reset']}"
+                else:
+                    loc = f"{c['red']}Unknown{c['reset']}"
+                
+                # Fighting status
+                if pet.is_fighting and pet.fighting:
+                    status = f"{c['red']}Fighting {pet.fighting.name[:10]}{c['reset']}"
+                else:
+                    status = f"{c['green']}Idle{c['reset']}"
+                
+                await player.send(f"{c['cyan']}║{c['reset']} {i}. {c['white']}{pet.name[:18]:<18}{c['reset']} Lvl {pet.level:<2} {hp_color}{pet.hp:>4}/{pet.max_hp:<4}{c['reset']} {loc:<20} {status} {c['cyan']}║{c['reset']}")
+            
+            await player.send(f"{c['cyan']}╠═══════════════════════════════════════════════════════════╣{c['reset']}")
+            await player.send(f"{c['cyan']}║{c['reset']} Commands: pets report | pets assist | pets recall         {c['cyan']}║{c['reset']}")
+            await player.send(f"{c['cyan']}╚═══════════════════════════════════════════════════════════╝{c['reset']}")
+            
+        elif action == 'report':
+            if not pets:
+                await player.send(f"{c['yellow']}You don't have any pets.{c['reset']}")
+                return
+            for pet in pets:
+                await pet.execute_command('report', '')
+                
+        elif action == 'assist':
+            if not pets:
+                await player.send(f"{c['yellow']}You don't have any pets.{c['reset']}")
+                return
+            if not player.is_fighting:
+                await player.send(f"{c['yellow']}You're not fighting anyone!{c['reset']}")
+                return
+            for pet in pets:
+                if pet.room == player.room:
+                    await pet.execute_command('assist', '')
+                    
+        elif action == 'recall':
+            if not pets:
+                await player.send(f"{c['yellow']}You don't have any pets.{c['reset']}")
+                return
+            for pet in pets:
+                if pet.room != player.room:
+                    if pet.room:
+                        pet.room.characters.remove(pet)
+                    pet.room = player.room
+                    player.room.characters.append(pet)
+                    await player.send(f"{c['green']}{pet.name} appears at your side!{c['reset']}")
+                    await player.room.send_to_room(f"{c['cyan']}{pet.name} appears at {player.name}'s side.{c['reset']}", exclude=[player])
+                else:
+                    await player.send(f"{c['yellow']}{pet.name} is already here.{c['reset']}")
+                    
+        elif action == 'dismiss' and len(args) > 1 and args[1].lower() == 'all':
+            if not pets:
+                await player.send(f"{c['yellow']}You don't have any pets.{c['reset']}")
+                return
+            count = 0
+            for pet in list(pets):
+                await PetManager.dismiss_pet(pet)
+                count += 1
+            await player.send(f"{c['green']}Dismissed {count} pet(s).{c['reset']}")
+            
+        else:
+            await player.send(f"{c['yellow']}Usage: pets [list|report|assist|recall|dismiss all]{c['reset']}")
+
+    @classmethod
+    async def cmd_dismiss(cls, player: 'Player', args: List[str]):
+        """Dismiss a pet or companion. Usage: dismiss <pet name>"""
+        from pets import PetManager
+        from companions import CompanionManager
+
+        c = player.config.COLORS
+        
+        pets = PetManager.get_player_pets(player)
+        
+        # If no pets at all
+        if not pets and not getattr(player, 'animal_companion', None):
+            await player.send(f"{c['red']}You don't have any pets to dismiss!{c['reset']}")
+            return
+
+        # If a name is provided, find that specific pet
+        if args:
+            target_name = ' '.join(args).lower()
+            
+            # Check companions first
+            companion = CompanionManager.find_companion(player, target_name)
+            if companion:
+                await CompanionManager.dismiss_companion(player, companion)
+                return
+            
+            # Check animal companion (ranger)
+            if player.animal_companion and target_name in player.animal_companion.name.lower():
+                comp = player.animal_companion
+                await player.send(f"{c['cyan']}You release {comp.name} back to the wild.{c['reset']}")
+                if player.room and comp in player.room.characters:
+                    player.room.characters.remove(comp)
+                if hasattr(player, 'group_members') and comp in player.group_members:
+                    player.group_members.remove(comp)
+                if hasattr(player.world, 'npcs') and comp in player.world.npcs:
+                    player.world.npcs.remove(comp)
+                player.animal_companion = None
+                return
+            
+            # Check undead/summoned pets
+            for pet in pets:
+                if target_name in pet.name.lower():
+                    await PetManager.dismiss_pet(pet)
+                    await player.send(f"{c['green']}You dismiss {pet.name}.{c['reset']}")
+                    return
+            
+            await player.send(f"{c['yellow']}You don't have a pet named '{target_name}'.{c['reset']}")
+            return
+
+        # No name provided - list pets
+        await player.send(f"{c['cyan']}Your pets:{c['reset']}")
+        for pet in pets:
+            await player.send(f"  {c['yellow']}{pet.name}{c['reset']}")
+        if player.animal_companion:
+            await player.send(f"  {c['yellow']}{player.animal_companion.name}{c['reset']} (companion)")
+        await player.send(f"{c['white']}Use 'dismiss <name>' to dismiss a specific pet.{c['reset']}")
+
+    @classmethod
+    async def cmd_hire(cls, player: 'Player', args: List[str]):
+        """Hire a companion from a tavern or guild. Usage: hire <npc>"""
+        from companions import CompanionManager
+
+        c = player.config.COLORS
+
+        if not args:
+            await player.send(f"{c['yellow']}Usage: hire <npc>{c['reset']}")
+            return
+
+        target_name = ' '.join(args).lower()
+        target = None
+        for char in player.room.characters:
+            if char != player and not hasattr(char, 'connection') and target_name in char.name.lower():
+                target = char
+                break
+
+        if not target:
+            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
+            return
+
+        await CompanionManager.hire_companion(player, target)
+
+    @classmethod
+    async def cmd_companions(cls, player: 'Player', args: List[str]):
+        """List your current companions. Usage: companions"""
+        from companions import CompanionManager
+
+        c = player.config.COLORS
+        companions = CompanionManager.get_player_companions(player)
+        if not companions:
+            await player.send(f"{c['yellow']}You have no companions.{c['reset']}")
+            return
+
+        await player.send(f"{c['cyan']}╔═══════════════════════════════════════╗{c['reset']}")
+        await player.send(f"{c['cyan']}║{c['bright_yellow']}           Your Companions             {c['cyan']}║{c['reset']}")
+        await player.send(f"{c['cyan']}╠═══════════════════════════════════════╣{c['reset']}")
+        for comp in companions:
+            hp_pct = int((comp.hp / max(1, comp.max_hp)) * 100)
+            await player.send(
+                f"{c['cyan']}║ {c['bright_green']}{comp.name[:16]:<16} {c['white']}Lv {comp.level:<2} {c['yellow']}{comp.companion_type:<6} {c['magenta']}{hp_pct:>3}% {c['cyan']}║{c['reset']}"
+            )
+            await player.send(
+                f"{c['cyan']}║ {c['white']}Morale:{comp.morale:<3} Loyalty:{comp.loyalty:<3} Order:{comp.order:<6} Upkeep:{comp.daily_upkeep:<4}{c['cyan']}║{c['reset']}"
+            )
+        await player.send(f"{c['cyan']}╚═══════════════════════════════════════╝{c['reset']}")
+
+    @classmethod
+    async def cmd_minions(cls, player: 'Player', args: List[str]):
+        """List your summoned minions (undead, summons). Usage: minions"""
+        from pets import PetManager
+
+        c = player.config.COLORS
+        pets = PetManager.get_player_pets(player)
+        minions = [p for p in pets if not p.is_persistent]
+        
+        if not minions:
+            await player.send(f"{c['yellow']}You have no summoned minions.{c['reset']}")
+            return
+
+        await player.send(f"{c['magenta']}╔═══════════════════════════════════════╗{c['reset']}")
+        await player.send(f"{c['magenta']}║{c['bright_magenta']}           Your Minions                {c['magenta']}║{c['reset']}")
+        await player.send(f"{c['magenta']}╠═══════════════════════════════════════╣{c['reset']}")
+        for minion in minions:
+            hp_pct = int((minion.hp / max(1, minion.max_hp)) * 100)
+            timer_str = ""
+            if minion.timer:
+                mins_left = minion.timer // 60
+                timer_str = f" ({mins_left}m)"
+            await player.send(
+                f"{c['magenta']}║ {c['bright_red']}{minion.name[:18]:<18} {c['white']}Lv {minion.level:<2} {c['yellow']}{hp_pct:>3}%{timer_str:<8}{c['magenta']}║{c['reset']}"
+            )
+        await player.send(f"{c['magenta']}╚═══════════════════════════════════════╝{c['reset']}")
+
+    @classmethod
+    async def cmd_tame(cls, player: 'Player', args: List[str]):
+        """Tame a wild creature. Usage: tame <creature>"""
+        from pets import PetManager
+
+        c = player.config.COLORS
+
+        # Check if ranger
+        if player.char_class != 'ranger':
+            await player.send(f"{c['red']}Only Rangers can tame creatures!{c['reset']}")
+            return
+
+        if not args:
+            await player.send(f"{c['yellow']}Usage: tame <creature>{c['reset']}")
+            return
+
+        target_name = ' '.join(args).lower()
+
+        # Find creature in room
+        target = None
+        for char in player.room.characters:
+            if char != player and hasattr(char, 'name'):
+                if char.name.lower().startswith(target_name):
+                    target = char
+                    break
+
+        if not target:
+            await player.send(f"{c['red']}There's no '{target_name}' here to tame.{c['reset']}")
+            return
+
+        # Can't tame players or existing pets
+        if hasattr(target, 'connection'):
+            await player.send(f"{c['red']}You can't tame a player!{c['reset']}")
+            return
+
+        if hasattr(target, 'owner'):
+            await player.send(f"{c['red']}That creature is already tamed!{c['reset']}")
+            return
+
+        # Attempt to tame
+        success = await PetManager.tame_companion(player, target)
+        if success:
+            await player.send(f"{c['bright_green']}You successfully tame {target.name}!{c['reset']}")
+
+    @classmethod
+    async def cmd_summon(cls, player: 'Player', args: List[str]):
+        """Summon an elemental. Usage: summon <air|fire|water|earth>"""
+        from pets import PetManager
+
+        c = player.config.COLORS
+
+        # Check if mage
+        if player.char_class != 'mage':
+            await player.send(f"{c['red']}Only Mages can summon elementals!{c['reset']}")
+            return
+
+        if not args:
+            await player.send(f"{c['yellow']}Usage: summon <air|fire|water|earth>{c['reset']}")
+            await player.send(f"Elementals: air, fire, water, earth")
+            return
+
+        element = args[0].lower()
+        valid_elements = ['air', 'fire', 'water', 'earth']
+
+        if element not in valid_elements:
+            await player.send(f"{c['red']}Invalid elemental type. Choose: air, fire, water, earth{c['reset']}")
+            return
+
+        # Check mana cost
+        mana_cost = 50
+        if player.mana < mana_cost:
+            await player.send(f"{c['red']}You don't have enough mana! (Need {mana_cost}){c['reset']}")
+            return
+
+        # Check level requirement
+        if player.level < 5:
+            await player.send(f"{c['red']}You must be at least level 5 to summon elementals!{c['reset']}")
+            return
+
+        # Summon elemental
+        template_name = f"{element}_elemental"
+        pet = await PetManager.summon_pet(player, template_name, duration_minutes=30)
+
+        if pet:
+            player.mana -= mana_cost
+            await player.send(f"{c['bright_magenta']}You summon {pet.short_desc}!{c['reset']}")
+            await player.send(f"{c['yellow']}Duration: 30 minutes{c['reset']}")
+
+    @classmethod
+    async def cmd_animate(cls, player: 'Player', args: List[str]):
+        """Animate a corpse as undead. Usage: animate <corpse>"""
+        from pets import PetManager
+
+        c = player.config.COLORS
+
+        # Check if necromancer/cleric with evil alignment
+        if player.char_class not in ('cleric',) or player.alignment > -200:
+            await player.send(f"{c['red']}Only evil Clerics can animate the dead!{c['reset']}")
+            return
+
+        # Look for corpse in room
+        corpse = None
+        for item in player.room.items:
+            if hasattr(item, 'item_type') and item.item_type == 'container':
+                if 'corpse' in item.name.lower():
+                    corpse = item
+                    break
+
+        if not corpse:
+            await player.send(f"{c['red']}There's no corpse here to animate!{c['reset']}")
+            return
+
+        # Check mana cost
+        mana_cost = 60
+        if player.mana < mana_cost:
+            await player.send(f"{c['red']}You don't have enough mana! (Need {mana_cost}){c['reset']}")
+            return
+
+        # Check level requirement
+        if player.level < 8:
+            await player.send(f"{c['red']}You must be at least level 8 to animate the dead!{c['reset']}")
+            return
+
+        # Determine type of undead based on level
+        if player.level >= 20:
+            undead_type = 'wight'
+            duration = 30
+        elif player.level >= 15:
+            undead_type = 'ghoul'
+            duration = 45
+        elif player.level >= 10:
+            undead_type = 'skeleton'
+            duration = 60
+        else:
+            undead_type = 'zombie'
+            duration = 60
+
+        # Summon undead
+        pet = await PetManager.summon_pet(player, undead_type, duration_minutes=duration)
+
+        if pet:
+            player.mana -= mana_cost
+            # Remove corpse
+            player.room.items.remove(corpse)
+
+            await player.send(f"{c['bright_magenta']}You animate {corpse.name} as {pet.short_desc}!{c['reset']}")
+            await player.send(f"{c['yellow']}Duration: {duration} minutes{c['reset']}")
+
+    @classmethod
+    async def cmd_raise(cls, player: 'Player', args: List[str]):
+        """Raise a necromancer servant. Usage: raise <knight|wraith|lich|stalker>"""
+        c = player.config.COLORS
+
+        if player.char_class != 'necromancer':
+            await player.send(f"{c['red']}Only necromancers can raise undead servants!{c['reset']}")
+            return
+
+        if not args:
+            await player.send(f"{c['yellow']}Usage: raise <knight|wraith|lich|stalker>{c['reset']}")
+            await player.send(f"{c['cyan']}Servant types:{c['reset']}")
+            await player.send(f"  {c['white']}knight{c['reset']}  - Bone Knight (tank, high defense)")
+            await player.send(f"  {c['white']}wraith{c['reset']}  - Wraith Healer (support, heals you)")
+            await player.send(f"  {c['white']}lich{c['reset']}    - Lich Acolyte (caster, high damage)")
+            await player.send(f"  {c['white']}stalker{c['reset']} - Shadow Stalker (rogue, fast attacks)")
+            return
+
+        if 'animate_dead' not in player.spells:
+            await player.send(f"{c['red']}You do not yet know how to animate the dead.{c['reset']}")
+            return
+
+        choice = args[0].lower()
+        # Map themed names to template names
+        themed_map = {
+            'knight': 'knight', 'bone': 'knight', 'tank': 'knight',
+            'wraith': 'wraith', 'healer': 'wraith', 'support': 'wraith',
+            'lich': 'lich', 'caster': 'lich', 'mage': 'lich',
+            'stalker': 'stalker', 'rogue': 'stalker', 'shadow': 'stalker',
+        }
+        if choice not in themed_map:
+            await player.send(f"{c['yellow']}Choose a servant: knight, wraith, lich, stalker.{c['reset']}")
+            return
+
+        from spells import SpellHandler
+        await SpellHandler.cast_spell(player, 'animate_dead', themed_map[choice])
+
+    @classmethod
+    async def cmd_soulstone(cls, player: 'Player', args: List[str]):
+        """Create a necromancer soulstone. Usage: soulstone [create]"""
+        c = player.config.COLORS
+
+        if player.char_class != 'necromancer':
+            await player.send(f"{c['red']}Only necromancers can forge soulstones!{c['reset']}")
+            return
+
+        # Allow optional 'create' argument
+        if args and args[0].lower() not in ('create', 'forge', 'craft'):
+            await player.send(f"{c['yellow']}Usage: soulstone [create]{c['reset']}")
+            return
+
+        # Check if already has a soulstone
+        def has_soulstone():
+            for item in player.inventory:
+                if getattr(item, 'is_soulstone', False) or ('soulstone' in getattr(item, 'flags', set())):
+                    return True
+            for item in player.equipment.values():
+                if item and (getattr(item, 'is_soulstone', False) or ('soulstone' in getattr(item, 'flags', set()))):
+                    return True
+            return False
+
+        if has_soulstone():
+            await player.send(f"{c['yellow']}You already possess a soulstone.{c['reset']}")
+            return
+
+        # Require a corpse in the room
+        if not player.room:
+            await player.send(f"{c['red']}You are nowhere. There is no corpse to bind.{c['reset']}")
+            return
+
+        corpse = None
+        for item in player.room.items:
+            if hasattr(item, 'item_type') and item.item_type == 'container' and 'corpse' in item.name.lower():
+                corpse = item
+                break
+
+        if not corpse:
+            await player.send(f"{c['yellow']}You need a corpse here to bind into a soulstone.{c['reset']}")
+            return
+
+        mana_cost = 60
+        if player.mana < mana_cost:
+            await player.send(f"{c['red']}You need {mana_cost} mana to forge a soulstone.{c['reset']}")
+            return
+
+        # Consume resources
+        player.mana -= mana_cost
+        if corpse in player.room.items:
+            player.room.items.remove(corpse)
+
+        # Create the soulstone object
+        from objects import Object
+        stone = Object(0, player.world if hasattr(player, 'world') else None)
+        stone.name = 'soulstone'
+        stone.short_desc = '\x1b[95ma soulstone\x1b[0m'
+        stone.room_desc = '\x1b[95mA faintly glowing soulstone lies here, drinking the light.\x1b[0m'
+        stone.description = 'A crystal of bound souls, pulsing with cold necromantic light. Dark tendrils swirl within it like trapped smoke.'
+        stone.item_type = 'worn'
+        stone.wear_slot = 'hold'
+        stone.weight = 1
+        stone.cost = 0
+        stone.flags.add('soulstone')
+        stone.is_soulstone = True
+        stone.soulstone_bonus_int = 3
+        stone.soulstone_mana_regen = 0.10
+        stone.soulstone_spell_damage = 2
+
+        player.inventory.append(stone)
+        await player.send(f"{c['bright_magenta']}You bind the corpse's essence into a soulstone.{c['reset']}")
+        await player.send(f"{c['cyan']}It hums with power. Hold it in your offhand to channel its bonuses.{c['reset']}")
+        await player.room.send_to_room(
+            f"{player.name} binds a corpse into a coldly glowing soulstone.",
+            exclude=[player]
+        )
+
+    @classmethod
+    async def cmd_imbue(cls, player: 'Player', args: List[str]):
+        """Imbue a corpse with soulstone power. Usage: imbue [corpse]"""
+        c = player.config.COLORS
+
+        if player.char_class != 'necromancer':
+            await player.send(f"{c['red']}Only necromancers can imbue corpses.{c['reset']}")
+            return
+
+        if args and args[0].lower() not in ('corpse', 'body'):
+            await player.send(f"{c['yellow']}Usage: imbue [corpse]{c['reset']}")
+            return
+
+        # Must be holding a soulstone in offhand
+        stone = player.equipment.get('hold')
+        if not stone or not (getattr(stone, 'is_soulstone', False) or ('soulstone' in getattr(stone, 'flags', set()))):
+            await player.send(f"{c['yellow']}You must hold a soulstone in your offhand to imbue a corpse.{c['reset']}")
+            return
+
+        if not player.room:
+            await player.send(f"{c['red']}You are nowhere. There is no corpse to imbue.{c['reset']}")
+            return
+
+        corpse = None
+        for item in player.room.items:
+            if hasattr(item, 'item_type') and item.item_type == 'container' and 'corpse' in item.name.lower():
+                corpse = item
+                break
+
+        if not corpse:
+            await player.send(f"{c['yellow']}There is no corpse here to imbue.{c['reset']}")
+            return
+
+        level = getattr(corpse, 'soul_imbue_level', 0)
+        if level >= 5:
+            await player.send(f"{c['yellow']}This corpse is already saturated with soulstone power.{c['reset']}")
+            return
+
+        mana_cost = 20 + (level * 15)
+        if player.mana < mana_cost:
+            await player.send(f"{c['red']}You need {mana_cost} mana to deepen the imbue.{c['reset']}")
+            return
+
+        player.mana -= mana_cost
+        level += 1
+        corpse.soul_imbue_level = level
+
+        progress_msgs = {
+            1: "The corpse shudders as dark veins spread across its flesh.",
+            2: "Bones tighten and re-knit as the soulstone drinks deeper.",
+            3: "A cold aura wreathes the corpse, thick with necromantic gravity.",
+            4: "The corpse rises slightly, then settles—heavier, denser.",
+            5: "The corpse glows with a dense, hungry darkness. It is ready."
+        }
+
+        await player.send(f"{c['bright_magenta']}You channel soulstone power into the corpse.{c['reset']}")
+        await player.send(f"{c['cyan']}Imbue level: {level}/5{c['reset']}")
+        await player.room.send_to_room(
+            progress_msgs.get(level, "The corpse crackles with dark power."),
+            exclude=[player]
+        )
+
+    @staticmethod
+    def _make_bar(current: int, maximum: int, width: int = 20) -> str:
+        """Create a visual bar for stats."""
+        if maximum == 0:
+            filled = 0
+        else:
+            filled = int((current / maximum) * width)
+
+        bar = '█' * filled + '░' * (width - filled)
+        return f"[{bar}]"
+
+    # ==================== COMBAT COMPANIONS ====================
+
+    @classmethod
+    async def cmd_companion(cls, player: 'Player', args: List[str]):
+        """Manage your combat companion. Usage: companion [attack|defend|passive|status|summon|dismiss]"""
+        from companions import CombatCompanion, COMBAT_COMPANION_TYPES
+
+        c = player.config.COLORS
+
+        if not args:
+            # Show status
+            if player.combat_companion:
+                cc = player.combat_companion
+                hp_pct = (cc.hp / cc.max_hp * 100) if cc.max_hp > 0 else 0
+                if hp_pct > 75: hp_color = c['bright_green']
+                elif hp_pct > 50: hp_color = c['green']
+                elif hp_pct > 25: hp_color = c['yellow']
+                else: hp_color = c['red']
+
+                status = "KNOCKED OUT" if cc.knocked_out else cc.behavior.upper()
+                await player.send(f"\n{c['bright_cyan']}═══ Combat Companion ═══{c['reset']}")
+                await player.send(f"  {c['white']}{cc.name}{c['reset']} (Lv {cc.level})")
+                await player.send(f"  {hp_color}HP: {cc.hp}/{cc.max_hp}{c['reset']}")
+                await player.send(f"  Mode: {c['bright_yellow']}{status}{c['reset']}")
+                if cc.knocked_out:
+                    await player.send(f"  {c['red']}Revives after resting ({cc.ko_timer} ticks remaining){c['reset']}")
+                await player.send(f"{c['bright_cyan']}════════════════════════{c['reset']}\n")
+            else:
+                if CombatCompanion.can_unlock(player):
+                    comp_key = CombatCompanion.get_available_type(player)
+                    cfg = COMBAT_COMPANION_TYPES.get(comp_key, {})
+                    await player.send(f"{c['cyan']}You can summon a {cfg.get('name', 'companion')}! Use: companion summon{c['reset']}")
+                else:
+                    await player.send(f"{c['yellow']}Combat companions unlock at level 20.{c['reset']}")
+            return
+
+        sub = args[0].lower()
+
+        if sub == 'summon':
+            if player.combat_companion:
+                await player.send(f"{c['yellow']}You already have {player.combat_companion.name} as your companion.{c['reset']}")
+                return
+            if not CombatCompanion.can_unlock(player):
+                await player.send(f"{c['red']}You must be level 20 to summon a combat companion.{c['reset']}")
+                return
+            comp_key = CombatCompanion.get_available_type(player)
+            cc = CombatCompanion(player, comp_key)
+            player.combat_companion = cc
+            await player.send(f"{c['bright_green']}{cc.name} appears at your side!{c['reset']}")
+            if player.room:
+                await player.room.send_to_room(
+                    f"{c['cyan']}{cc.name} materializes beside {player.name}.{c['reset']}",
+                    exclude=[player])
+            return
+
+        if sub == 'dismiss':
+            if not player.combat_companion:
+                await player.send(f"{c['yellow']}You have no combat companion.{c['reset']}")
+                return
+            name = player.combat_companion.name
+            player.combat_companion = None
+            await player.send(f"{c['yellow']}{name} fades away.{c['reset']}")
+            return
+
+        if sub in ('attack', 'defend', 'passive'):
+            if not player.combat_companion:
+                await player.send(f"{c['yellow']}You have no combat companion.{c['reset']}")
+                return
+            if player.combat_companion.knocked_out:
+                await player.send(f"{c['red']}{player.combat_companion.name} is knocked out!{c['reset']}")
+                return
+            player.combat_companion.behavior = sub
+            await player.send(f"{c['green']}{player.combat_companion.name} is now in {sub.upper()} mode.{c['reset']}")
+            return
+
+        if sub == 'status':
+            await cls.cmd_companion(player, [])
+            return
+
+        await player.send(f"{c['yellow']}Usage: companion [summon|dismiss|attack|defend|passive|status]{c['reset']}")
+
+    # ==================== PETS ====================
+
+    @classmethod
+    async def cmd_pet(cls, player: 'Player', args: List[str]):
+        """Show your pets and companions."""
+        from pets import PetManager
+
+        c = player.config.COLORS
+        pets = PetManager.get_player_pets(player)
+        if not pets:
+            await player.send(f"{c['yellow']}You have no pets or companions.{c['reset']}")
+            await player.send(f"{c['cyan']}Tip: Necromancers animate undead, Rangers tame beasts, Mages summon elementals.{c['reset']}")
+            return
+
+        await player.send(f"\n{c['bright_cyan']}═══════════════ Your Pets ═══════════════{c['reset']}")
+        for pet in pets:
+            # Type badge
+            if pet.is_persistent:
+                badge = f"{c['bright_green']}[Companion]{c['reset']}"
+            elif pet.pet_type == 'undead':
+                badge = f"{c['magenta']}[Undead]{c['reset']}"
+            else:
+                badge = f"{c['yellow']}[Summon]{c['reset']}"
+            
+            # HP bar
+            hp_pct = (pet.hp / pet.max_hp * 100) if pet.max_hp > 0 else 0
+            if hp_pct > 75:
+                hp_color = c['bright_green']
+            elif hp_pct > 50:
+                hp_color = c['green']
+            elif hp_pct > 25:
+                hp_color = c['yellow']
+            else:
+                hp_color = c['red']
+            
+            await player.send(f"  {c['white']}{pet.name}{c['reset']} {badge} Lv {pet.level}")
+            await player.send(f"    {hp_color}HP: {pet.hp}/{pet.max_hp}{c['reset']} | Loyalty: {pet.loyalty}")
+            
+            # Position
+            pos = getattr(pet, 'position', 'standing')
+            staying = getattr(pet, 'ai_state', {}).get('staying', False)
+            guarding = getattr(pet, 'ai_state', {}).get('guarding', False)
+            
+            status_parts = [pos]
+            if staying:
+                status_parts.append("staying")
+            if guarding:
+                status_parts.append("guarding")
+            if pet.is_fighting:
+                status_parts.append(f"fighting {pet.fighting.name}" if pet.fighting else "fighting")
+            
+            await player.send(f"    Status: {', '.join(status_parts)}")
+            
+            # Time remaining for temp pets
+            if pet.timer:
+                remaining = pet.get_despawn_time()
+                if remaining:
+                    mins = remaining // 60
+                    secs = remaining % 60
+                    await player.send(f"    {c['yellow']}Time left: {mins}m {secs}s{c['reset']}")
+            
+            # Location
+            if pet.room != player.room:
+                await player.send(f"    {c['cyan']}Location: {pet.room.name if pet.room else 'Unknown'}{c['reset']}")
+        
+        await player.send(f"{c['bright_cyan']}═════════════════════════════════════════{c['reset']}")
+        await player.send(f"{c['cyan']}Use 'order <action>' to command pets. See 'help order'.{c['reset']}\n")
@@ -0,0 +1,426 @@
+"""
+Misthollow Consumable Commands
+=============================
+Eating, drinking and potions.
+"""
+
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class ConsumableCommands:
+    """Consumable commands."""
+
+    @classmethod
+    async def cmd_eat(cls, player: 'Player', args: List[str]):
+        """Eat food."""
+        if not args:
+            await player.send("Eat what?")
+            return
+            
+        item_name = ' '.join(args).lower()
+        
+        for item in player.inventory:
+            if item_name in item.name.lower():
+                if item.item_type != 'food':
+                    await player.send(f"You can't eat {item.short_desc}!")
+                    return
+                    
+                c = player.config.COLORS
+                player.inventory.remove(item)
+                food_value = getattr(item, 'food_value', 10)
+
+                # Restore hunger based on food value
+                old_hunger = player.hunger
+                player.hunger = min(player.max_hunger, player.hunger + food_value)
+                hunger_restored = player.hunger - old_hunger
+
+                await player.send(f"You eat {item.short_desc}.")
+                if player.hunger >= player.max_hunger:
+                    await player.send(f"{c['bright_green']}You are completely full.{c['reset']}")
+                elif hunger_restored > 0:
+                    if player.hunger >= player.max_hunger * 0.75:
+                        await player.send(f"{c['green']}You feel satiated.{c['reset']}")
+                    elif player.hunger >= player.max_hunger * 0.5:
+                        await player.send(f"{c['green']}You feel less hungry.{c['reset']}")
+                    else:
+                        await player.send(f"{c['green']}You eat but are still hungry.{c['reset']}")
+                else:
+                    await player.send(f"{c['yellow']}You are already full!{c['reset']}")
+
+                # Check for food bonuses (rare/magical food)
+                food_bonus = getattr(item, 'food_bonus', None)
+                if food_bonus:
+                    from affects import AffectManager
+                    bonus_type = food_bonus.get('type')
+                    bonus_value = food_bonus.get('value', 1)
+                    duration = food_bonus.get('duration', 300) // 6  # Convert seconds to ticks
+                    
+                    # Custom message
+                    food_msg = getattr(item, 'food_message', None)
+                    if food_msg:
+                        await player.send(f"{c['bright_magenta']}{food_msg}{c['reset']}")
+                    
+                    if bonus_type == 'all_stats':
+                        # Boost all stats
+                        for stat in ['str', 'int', 'wis', 'dex', 'con', 'cha']:
+                            AffectManager.apply_affect(player, {
+                                'name': f'divine_nourishment_{stat}',
+                                'type': AffectManager.TYPE_MODIFY_STAT,
+                                'applies_to': stat,
+                                'value': bonus_value,
+                                'duration': duration,
+                                'caster_level': 30
+                            })
+                        await player.send(f"{c['bright_cyan']}You feel divinely nourished! All stats +{bonus_value} for {food_bonus.get('duration', 300)//60} minutes.{c['reset']}")
+                    elif bonus_type == 'regen':
+                        # Bonus HP/mana regen - just heal directly for now
+                        heal = bonus_value
+                        player.hp = min(player.max_hp, player.hp + heal)
+                        player.mana = min(player.max_mana, player.mana + heal)
+                        await player.send(f"{c['bright_green']}You recover {heal} HP and mana!{c['reset']}")
+                    elif bonus_type == 'stealth':
+                        # Stealth bonus
+                        AffectManager.apply_affect(player, {
+                            'name': 'shadow_nourishment',
+                            'type': AffectManager.TYPE_FLAG,
+                            'applies_to': 'sneak_bonus',
+                            'value': bonus_value,
+                            'duration': duration,
+                            'caster_level': 20
+                        })
+                        await player.send(f"{c['bright_cyan']}You feel stealthier! Sneak bonus +{bonus_value} for {food_bonus.get('duration', 300)//60} minutes.{c['reset']}")
+                    elif bonus_type in ['str', 'int', 'wis', 'dex', 'con', 'cha', 'hitroll', 'damroll']:
+                        # Stat bonus
+                        AffectManager.apply_affect(player, {
+                            'name': 'nourishment_bonus',
+                            'type': AffectManager.TYPE_MODIFY_STAT,
+                            'applies_to': bonus_type,
+                            'value': bonus_value,
+                            'duration': duration,
+                            'caster_level': 20
+                        })
+                        await player.send(f"{c['bright_cyan']}You feel empowered! {bonus_type.upper()} +{bonus_value} for {food_bonus.get('duration', 300)//60} minutes.{c['reset']}")
+
+                return
+                
+        await player.send(f"You don't have '{item_name}'.")
+        
+    @classmethod
+    async def cmd_drink(cls, player: 'Player', args: List[str]):
+        """Drink from a container or fountain."""
+        if not args:
+            # Default: try to drink from a fountain in the room
+            if player.room:
+                for item in player.room.items:
+                    if getattr(item, 'item_type', '') == 'fountain':
+                        args = [item.name.split()[0]]
+                        break
+            if not args:
+                await player.send("Drink what?")
+                return
+            
+        c = player.config.COLORS
+        target = ' '.join(args).lower()
+        if target.startswith('from '):
+            target = target[5:]
+
+        # Check for explicit drink container in inventory
+        explicit_container = None
+        for item in player.inventory:
+            if target in item.name.lower() and getattr(item, 'item_type', '') == 'drink':
+                explicit_container = item
+                break
+
+        # If there's a fountain in the room, drink from it by default
+        fountain = None
+        if player.room:
+            for item in player.room.items:
+                if getattr(item, 'item_type', '') == 'fountain':
+                    if target in item.name.lower() or target in ('fountain', 'water', 'spring', 'pool'):
+                        fountain = item
+                        break
+            if fountain is None:
+                # If no specific target matched but a fountain exists, default to it
+                for item in player.room.items:
+                    if getattr(item, 'item_type', '') == 'fountain':
+                        fountain = item
+                        break
+
+        if fountain and not explicit_container:
+            drink_value = getattr(fountain, 'drink_value', 12)
+            old_thirst = player.thirst
+            player.thirst = min(player.max_thirst, player.thirst + drink_value)
+            await player.send(f"{c['cyan']}You drink from {fountain.short_desc}.{c['reset']}")
+            if player.thirst >= player.max_thirst:
+                await player.send(f"{c['bright_cyan']}Your thirst is completely quenched.{c['reset']}")
+            elif player.thirst > old_thirst:
+                if player.thirst >= player.max_thirst * 0.75:
+                    await player.send(f"{c['cyan']}You feel well hydrated.{c['reset']}")
+                else:
+                    await player.send(f"{c['cyan']}You feel less thirsty.{c['reset']}")
+            else:
+                await player.send(f"{c['yellow']}You can't drink any more!{c['reset']}")
+            if player.room:
+                await player.room.send_to_room(f"{player.name} drinks from {fountain.short_desc}.", exclude=[player])
+            return
+
+        # Drink from container if explicitly requested or no fountain available
+        if explicit_container:
+            item = explicit_container
+            drinks_remaining = getattr(item, 'drinks', 20)
+            drink_value = 3  # Each drink restores 3 hours of thirst
+
+            if drinks_remaining > 0:
+                item.drinks = drinks_remaining - 1
+
+                old_thirst = player.thirst
+                player.thirst = min(player.max_thirst, player.thirst + drink_value)
+                thirst_restored = player.thirst - old_thirst
+
+                liquid = getattr(item, 'liquid', 'water')
+                await player.send(f"You drink {liquid} from {item.short_desc}.")
+                if player.thirst >= player.max_thirst:
+                    await player.send(f"{c['bright_cyan']}Your thirst is completely quenched.{c['reset']}")
+                elif thirst_restored > 0:
+                    if player.thirst >= player.max_thirst * 0.75:
+                        await player.send(f"{c['cyan']}You feel well hydrated.{c['reset']}")
+                    else:
+                        await player.send(f"{c['cyan']}You feel less thirsty.{c['reset']}")
+                else:
+                    await player.send(f"{c['yellow']}You can't drink any more!{c['reset']}")
+
+                if item.drinks <= 0:
+                    await player.send(f"{c['white']}{item.short_desc} is now empty.{c['reset']}")
+                    player.inventory.remove(item)
+            else:
+                await player.send(f"{item.short_desc} is empty!")
+            return
+
+        await player.send(f"You don't have '{target}'.")
+        
+    @classmethod
+    async def cmd_quaff(cls, player: 'Player', args: List[str]):
+        """Drink a potion. Usage: quaff <potion>"""
+        await cls.cmd_use(player, args)
+
+    # ==================== FOOD & DRINK ====================
+
+    @classmethod
+    @classmethod
+    async def cmd_drink_alt(cls, player: 'Player', args: List[str]):
+        """Drink from a fountain or container. Usage: drink [from] <source>"""
+        c = player.config.COLORS
+        
+        if not args:
+            thirst_pct = (player.thirst / player.max_thirst) * 100
+            if thirst_pct > 80:
+                await player.send(f"{c['cyan']}You are not thirsty.{c['reset']}")
+            elif thirst_pct > 50:
+                await player.send(f"{c['yellow']}You could use a drink.{c['reset']}")
+            elif thirst_pct > 25:
+                await player.send(f"{c['yellow']}You are thirsty.{c['reset']}")
+            else:
+                await player.send(f"{c['red']}You are dying of thirst!{c['reset']}")
+            return
+        
+        # Handle "drink from X" syntax
+        target = ' '.join(args)
+        if target.lower().startswith('from '):
+            target = target[5:]
+        
+        # Check for fountains in room
+        fountain = None
+        if player.room:
+            for item in player.room.items:
+                if target.lower() in item.name.lower():
+                    if getattr(item, 'item_type', '') == 'fountain':
+                        fountain = item
+                        break
+        
+        if fountain:
+            drink_value = getattr(fountain, 'drink_value', 12)
+            player.thirst = min(player.max_thirst, player.thirst + drink_value)
+            await player.send(f"{c['cyan']}You drink from {fountain.short_desc}.{c['reset']}")
+            if player.room:
+                await player.room.send_to_room(f"{player.name} drinks from {fountain.short_desc}.", exclude=[player])
+            return
+        
+        # Check containers in inventory
+        container = None
+        for inv_item in player.inventory:
+            if target.lower() in inv_item.name.lower():
+                if getattr(inv_item, 'item_type', '') in ('drink', 'container'):
+                    if getattr(inv_item, 'drink_amount', 0) > 0:
+                        container = inv_item
+                        break
+        
+        if container:
+            drink_value = getattr(container, 'drink_value', 6)
+            container.drink_amount = getattr(container, 'drink_amount', 0) - 1
+            player.thirst = min(player.max_thirst, player.thirst + drink_value)
+            await player.send(f"{c['cyan']}You drink from {container.short_desc}.{c['reset']}")
+            if container.drink_amount <= 0:
+                await player.send(f"{c['yellow']}{container.short_desc} is now empty.{c['reset']}")
+            return
+        
+        await player.send(f"{c['red']}You can't drink from that.{c['reset']}")
+
+    @classmethod
+    async def cmd_fill(cls, player: 'Player', args: List[str]):
+        """Fill a container from a fountain. Usage: fill <container> [fountain]"""
+        c = player.config.COLORS
+        
+        if not args:
+            await player.send(f"{c['yellow']}Fill what?{c['reset']}")
+            return
+        
+        container_name = args[0]
+        fountain_name = ' '.join(args[1:]) if len(args) > 1 else None
+        
+        # Find container in inventory
+        container = None
+        for inv_item in player.inventory:
+            if container_name.lower() in inv_item.name.lower():
+                if getattr(inv_item, 'item_type', '') in ('drink', 'container'):
+                    container = inv_item
+                    break
+        
+        if not container:
+            await player.send(f"{c['red']}You don't have a container called '{container_name}'.{c['reset']}")
+            return
+        
+        # Find fountain in room
+        fountain = None
+        if player.room:
+            for item in player.room.items:
+                if getattr(item, 'item_type', '') == 'fountain':
+                    if fountain_name is None or fountain_name.lower() in item.name.lower():
+                        fountain = item
+                        break
+        
+        if not fountain:
+            await player.send(f"{c['red']}There's no fountain here to fill from.{c['reset']}")
+            return
+        
+        # Fill container
+        # Support new drink system (drinks/max_drinks/liquid) + legacy fields
+        max_drinks = getattr(container, 'max_drinks', None)
+        if max_drinks is None or max_drinks <= 0:
+            max_drinks = getattr(container, 'drinks', 0) or getattr(container, 'max_drink_amount', 10)
+        
+        container.drinks = max_drinks
+        container.max_drinks = max_drinks
+        container.liquid = getattr(fountain, 'liquid', getattr(fountain, 'liquid_type', 'water'))
+        
+        # Legacy fields for backward compatibility
+        container.drink_amount = max_drinks
+        container.liquid_type = container.liquid
+        
+        await player.send(f"{c['cyan']}You fill {container.short_desc} from {fountain.short_desc}.{c['reset']}")
+
+    @classmethod
+    async def cmd_taste(cls, player: 'Player', args: List[str]):
+        """Taste food or drink. Usage: taste <item>"""
+        c = player.config.COLORS
+        
+        if not args:
+            await player.send(f"{c['yellow']}Taste what?{c['reset']}")
+            return
+        
+        item_name = ' '.join(args)
+        item = None
+        
+        # Find in inventory
+        for inv_item in player.inventory:
+            if item_name.lower() in inv_item.name.lower():
+                item = inv_item
+                break
+        
+        if not item:
+            await player.send(f"{c['red']}You don't have that.{c['reset']}")
+            return
+        
+        item_type = getattr(item, 'item_type', '')
+        
+        if item_type == 'food':
+            # Small food benefit
+            player.hunger = min(player.max_hunger, player.hunger + 2)
+            await player.send(f"{c['green']}You taste {item.short_desc}. It's edible.{c['reset']}")
+        elif item_type in ('drink', 'container'):
+            if getattr(item, 'drink_amount', 0) > 0:
+                player.thirst = min(player.max_thirst, player.thirst + 1)
+                await player.send(f"{c['cyan']}You sip {item.short_desc}. It's {getattr(item, 'liquid_type', 'water')}.{c['reset']}")
+            else:
+                await player.send(f"{c['yellow']}{item.short_desc} is empty.{c['reset']}")
+        else:
+            await player.send(f"{c['yellow']}You lick {item.short_desc}. Tastes like... stuff.{c['reset']}")
+
+
+    @classmethod
+    async def cmd_pour(cls, player: 'Player', args: List[str]):
+        """Pour liquid between containers. Usage: pour <from> <to> OR pour <from> out"""
+        c = player.config.COLORS
+        
+        if len(args) < 2:
+            await player.send(f"{c['yellow']}Usage: pour <from container> <to container>{c['reset']}")
+            await player.send(f"{c['yellow']}       pour <container> out{c['reset']}")
+            return
+        
+        from_name = args[0]
+        to_name = args[1]
+        
+        # Find source container
+        from_item = None
+        for inv_item in player.inventory:
+            if from_name.lower() in inv_item.name.lower():
+                if getattr(inv_item, 'item_type', '') in ('drink', 'drinkcon', 'container'):
+                    from_item = inv_item
+                    break
+        
+        if not from_item:
+            await player.send(f"{c['red']}You don't have a container called '{from_name}'.{c['reset']}")
+            return
+        
+        current = getattr(from_item, 'drink_amount', 0)
+        if current <= 0:
+            await player.send(f"{c['yellow']}{from_item.short_desc} is empty.{c['reset']}")
+            return
+        
+        # Pour out
+        if to_name.lower() == 'out':
+            from_item.drink_amount = 0
+            await player.send(f"{c['cyan']}You pour out {from_item.short_desc}.{c['reset']}")
+            if player.room:
+                await player.room.send_to_room(f"{player.name} pours out {from_item.short_desc}.", exclude=[player])
+            return
+        
+        # Find target container
+        to_item = None
+        for inv_item in player.inventory:
+            if inv_item != from_item and to_name.lower() in inv_item.name.lower():
+                if getattr(inv_item, 'item_type', '') in ('drink', 'drinkcon', 'container'):
+                    to_item = inv_item
+                    break
+        
+        if not to_item:
+            await player.send(f"{c['red']}You don't have another container called '{to_name}'.{c['reset']}")
+            return
+        
+        # Pour liquid
+        to_max = getattr(to_item, 'max_drink_amount', 10)
+        to_current = getattr(to_item, 'drink_amount', 0)
+        space = to_max - to_current
+        
+        if space <= 0:
+            await player.send(f"{c['yellow']}{to_item.short_desc} is already full.{c['reset']}")
+            return
+        
+        transfer = min(current, space)
+        from_item.drink_amount -= transfer
+        to_item.drink_amount = to_current + transfer
+        to_item.liquid_type = getattr(from_item, 'liquid_type', 'water')
+        
+        await player.send(f"{c['cyan']}You pour {getattr(from_item, 'liquid_type', 'liquid')} from {from_item.short_desc} into {to_item.short_desc}.{c['reset']}")
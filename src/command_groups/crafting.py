@@ -0,0 +1,62 @@
+"""
+Misthollow Crafting Commands
+===========================
+Gathering and crafting.
+"""
+
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class CraftingCommands:
+    """Crafting commands."""
+
+    @classmethod
+    async def cmd_gather(cls, player: 'Player', args: List[str]):
+        """Gather resources based on environment (auto-detects type)."""
+        from crafting import gather
+        await gather(player)
+
+    @classmethod
+    async def cmd_mine(cls, player: 'Player', args: List[str]):
+        """Mine ore from mountain or cave rooms."""
+        from crafting import cmd_mine
+        await cmd_mine(player, args)
+
+    @classmethod
+    async def cmd_forage(cls, player: 'Player', args: List[str]):
+        """Forage for herbs in forest or field rooms."""
+        from crafting import cmd_forage
+        await cmd_forage(player, args)
+
+    @classmethod
+    async def cmd_skin(cls, player: 'Player', args: List[str]):
+        """Skin an animal corpse for hides and pelts."""
+        from crafting import cmd_skin
+        await cmd_skin(player, args)
+
+    @classmethod
+    async def cmd_fish(cls, player: 'Player', args: List[str]):
+        """Fish in water rooms."""
+        from crafting import cmd_fish
+        await cmd_fish(player, args)
+
+    @classmethod
+    async def cmd_recipes(cls, player: 'Player', args: List[str]):
+        """Show your known crafting recipes."""
+        from crafting import show_recipes
+        await show_recipes(player, args)
+
+    @classmethod
+    async def cmd_craft(cls, player: 'Player', args: List[str]):
+        """Craft an item from a recipe."""
+        from crafting import craft, craft_list
+        c = player.config.COLORS
+
+        if not args or args[0] == 'list':
+            await craft_list(player, args[1:] if len(args) > 1 else None)
+            return
+
+        await craft(player, args[0])
@@ -0,0 +1,188 @@
+"""
+Misthollow Housing Commands
+==========================
+Player housing.
+"""
+
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class HousingCommands:
+    """Housing commands."""
+
+    @classmethod
+    async def cmd_house(cls, player: 'Player', args: List[str]):
+        """Manage housing. Usage: house [buy|sell|list|info|lock|unlock|invite|name|decorate|furnish|enter|storage]"""
+        from housing import HouseManager
+
+        c = player.config.COLORS
+
+        if not args or args[0].lower() == 'info':
+            await HouseManager.show_info(player)
+            return
+
+        sub = args[0].lower()
+
+        if sub == 'buy':
+            await HouseManager.buy_house(player)
+        elif sub == 'sell':
+            await HouseManager.sell_house(player)
+        elif sub == 'list':
+            await HouseManager.list_houses(player)
+        elif sub == 'enter':
+            await HouseManager.teleport_home(player)
+        elif sub == 'lock':
+            await HouseManager.lock_house(player)
+        elif sub == 'unlock':
+            await HouseManager.unlock_house(player)
+        elif sub == 'invite':
+            if len(args) < 2:
+                await player.send(f"{c['yellow']}Usage: house invite <player>{c['reset']}")
+                return
+            await HouseManager.invite_guest(player, args[1])
+        elif sub == 'name':
+            if len(args) < 2:
+                await player.send(f"{c['yellow']}Usage: house name <name>{c['reset']}")
+                return
+            await HouseManager.set_name(player, ' '.join(args[1:]))
+        elif sub == 'decorate':
+            if len(args) < 2:
+                await player.send(f"{c['yellow']}Usage: house decorate <description>{c['reset']}")
+                return
+            await HouseManager.set_description(player, ' '.join(args[1:]))
+        elif sub == 'furnish':
+            if len(args) < 2:
+                await HouseManager.show_furniture(player)
+            else:
+                await HouseManager.install_furniture(player, ' '.join(args[1:]))
+        elif sub == 'storage':
+            await HouseManager.show_storage(player)
+        else:
+            await player.send(f"{c['yellow']}Housing commands: house [buy|sell|list|info|enter|lock|unlock|invite|name|decorate|furnish|storage]{c['reset']}")
+
+    @classmethod
+    async def cmd_home(cls, player: 'Player', args: List[str]):
+        """Teleport to your house. Alias for 'house enter'."""
+        from housing import HouseManager
+        await HouseManager.teleport_home(player)
+
+    @classmethod
+    async def cmd_store(cls, player: 'Player', args: List[str]):
+        """Store an item in your house chest. Usage: store <item>"""
+        from housing import HouseManager
+
+        c = player.config.COLORS
+
+        if not args:
+            # Show storage contents if in house
+            await HouseManager.show_storage(player)
+            return
+
+        await HouseManager.store_item(player, ' '.join(args))
+
+    @classmethod
+    async def cmd_retrieve(cls, player: 'Player', args: List[str]):
+        """Retrieve an item from your house chest. Usage: retrieve <item>"""
+        from housing import HouseManager
+
+        c = player.config.COLORS
+        if not args:
+            await player.send(f"{c['yellow']}Usage: retrieve <item>{c['reset']}")
+            return
+
+        await HouseManager.retrieve_item(player, ' '.join(args))
+
+    @classmethod
+    async def cmd_dungeon(cls, player: 'Player', args: List[str]):
+        """Procedural dungeon commands.
+
+        Usage:
+            dungeon list
+            dungeon enter <type> [difficulty] [permadeath]
+            dungeon enter daily [difficulty] [permadeath]
+            dungeon leave
+        """
+        from procedural import get_dungeon_manager
+
+        c = player.config.COLORS
+        manager = get_dungeon_manager()
+
+        if not args or args[0].lower() == 'list':
+            await player.send(f"{c['bright_cyan']}Available Dungeons:{c['reset']}")
+            for entry in manager.list_dungeons():
+                daily_marker = f" {c['bright_yellow']}[DAILY]{c['reset']}" if entry['daily'] else ''
+                await player.send(f"  {c['green']}{entry['key']:<8}{c['reset']} - {c['white']}{entry['name']}{c['reset']}{daily_marker}")
+            await player.send(f"{c['yellow']}Usage: dungeon enter <type> [difficulty] [permadeath]{c['reset']}")
+            return
+
+        sub = args[0].lower()
+        if sub == 'enter':
+            if len(args) < 2:
+                await player.send(f"{c['yellow']}Usage: dungeon enter <type> [difficulty] [permadeath]{c['reset']}")
+                return
+
+            if not player.room or player.room.vnum != 3015:
+                await player.send(f"{c['red']}You must be at the Adventurer's Guild to enter a dungeon.{c['reset']}")
+                return
+
+            dungeon_key = args[1].lower()
+            daily = False
+            if dungeon_key == 'daily':
+                dungeon_key = manager.get_daily_type()
+                daily = True
+
+            difficulty = None
+            permadeath = False
+            for arg in args[2:]:
+                if arg.isdigit():
+                    difficulty = int(arg)
+                elif arg.lower() in {'permadeath', 'hardcore'}:
+                    permadeath = True
+
+            await manager.enter_dungeon(player, dungeon_key, difficulty=difficulty, permadeath=permadeath, daily=daily)
+            return
+
+        if sub == 'leave':
+            await manager.leave_dungeon(player, reason='abandon')
+            return
+
+        if sub in {'leaderboard', 'leaders', 'scores'}:
+            boards = manager.get_leaderboards()
+            if not boards:
+                await player.send(f"{c['yellow']}No dungeon clears recorded yet.{c['reset']}")
+                return
+
+            if len(args) >= 2:
+                dungeon_key = args[1].lower()
+                difficulty = None
+                if len(args) >= 3 and args[2].isdigit():
+                    difficulty = int(args[2])
+                if difficulty:
+                    board_key = f"{dungeon_key}:{difficulty}"
+                    entries = boards.get(board_key, [])
+                    await player.send(f"{c['bright_cyan']}Leaderboard: {dungeon_key} (Level {difficulty}){c['reset']}")
+                    for idx, entry in enumerate(entries, 1):
+                        await player.send(f"  {c['green']}{idx}. {entry['player']} - {entry['duration']}s{c['reset']}")
+                    return
+                else:
+                    await player.send(f"{c['bright_cyan']}Leaderboards for {dungeon_key}:{c['reset']}")
+                    for key, entries in boards.items():
+                        if not key.startswith(f"{dungeon_key}:"):
+                            continue
+                        level = key.split(':', 1)[1]
+                        best = entries[0] if entries else None
+                        if best:
+                            await player.send(f"  {c['green']}Level {level}:{c['reset']} {best['player']} - {best['duration']}s")
+                    return
+
+            await player.send(f"{c['bright_cyan']}Dungeon Leaderboards:{c['reset']}")
+            for key, entries in boards.items():
+                best = entries[0] if entries else None
+                if best:
+                    await player.send(f"  {c['green']}{key}{c['reset']} - {best['player']} {best['duration']}s")
+            return
+
+        await player.send(f"{c['yellow']}Unknown dungeon command. Use 'dungeon list'.{c['reset']}")
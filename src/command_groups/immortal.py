@@ -0,0 +1,1856 @@
+"""
+Misthollow Immortal Commands
+===========================
+Immortal and administration commands.
+"""
+
+import logging
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+logger = logging.getLogger('Misthollow.Commands')
+
+
+class ImmortalCommands:
+    """Immortal commands."""
+
+    @classmethod
+    async def cmd_mload(cls, player: 'Player', args: List[str]):
+        """Load a mob into the current room (immortal only).
+        
+        Usage: mload <vnum>
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+            
+        if not args:
+            await player.send(f"{c['yellow']}Usage: mload <vnum>{c['reset']}")
+            return
+            
+        try:
+            vnum = int(args[0])
+        except ValueError:
+            await player.send(f"{c['red']}Invalid vnum. Must be a number.{c['reset']}")
+            return
+            
+        proto = player.world.mob_prototypes.get(vnum)
+        if not proto:
+            await player.send(f"{c['red']}No mob with vnum {vnum} exists.{c['reset']}")
+            return
+            
+        from bosses import create_mob_from_prototype
+        mob = create_mob_from_prototype(proto, player.world)
+        mob.room = player.room
+        mob.home_room = player.room
+        player.room.characters.append(mob)
+        player.world.mobs.append(mob)
+        
+        await player.send(f"{c['bright_green']}You wave your hand and {mob.short_desc} appears!{c['reset']}")
+        await player.room.send_to_room(
+            f"{c['bright_magenta']}{mob.short_desc} appears out of thin air!{c['reset']}",
+            exclude=[player]
+        )
+    
+    @classmethod
+    async def cmd_oload(cls, player: 'Player', args: List[str]):
+        """Load an object into the room or your inventory (immortal only).
+        
+        Usage: oload <vnum> [room]
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+            
+        if not args:
+            await player.send(f"{c['yellow']}Usage: oload <vnum> [room]{c['reset']}")
+            return
+            
+        try:
+            vnum = int(args[0])
+        except ValueError:
+            await player.send(f"{c['red']}Invalid vnum. Must be a number.{c['reset']}")
+            return
+            
+        from objects import create_object, create_preset_object
+        obj = create_object(vnum, player.world) or create_preset_object(vnum)
+        
+        if not obj:
+            await player.send(f"{c['red']}No object with vnum {vnum} exists.{c['reset']}")
+            return
+        
+        to_room = len(args) > 1 and args[1].lower() == 'room'
+        
+        if to_room:
+            player.room.items.append(obj)
+            await player.send(f"{c['bright_green']}You conjure {obj.short_desc} onto the ground.{c['reset']}")
+            await player.room.send_to_room(
+                f"{c['bright_magenta']}{obj.short_desc} materializes out of thin air!{c['reset']}",
+                exclude=[player]
+            )
+        else:
+            player.inventory.append(obj)
+            await player.send(f"{c['bright_green']}You conjure {obj.short_desc} into your hands.{c['reset']}")
+    
+    @classmethod
+    async def cmd_slay(cls, player: 'Player', args: List[str]):
+        """Instantly kill a target (immortal only).
+        
+        Usage: slay <target>
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+            
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send(f"{c['yellow']}Usage: slay <target>{c['reset']}")
+                return
+            
+        target = cls._find_target(player, ' '.join(args))
+        if not target:
+            await player.send(f"{c['red']}No one by that name here.{c['reset']}")
+            return
+            
+        if target == player:
+            await player.send(f"{c['red']}That would be unwise...{c['reset']}")
+            return
+            
+        # Check if it's a player
+        from player import Player
+        if isinstance(target, Player):
+            await player.send(f"{c['red']}You cannot slay other players!{c['reset']}")
+            return
+            
+        target.hp = 0
+        await player.send(f"{c['bright_red']}You slay {target.name} with a wave of your hand!{c['reset']}")
+        await player.room.send_to_room(
+            f"{c['bright_red']}{player.name} waves their hand and {target.name} crumples to the ground, dead!{c['reset']}",
+            exclude=[player]
+        )
+        
+        # Trigger death
+        from combat import CombatHandler
+        await CombatHandler.handle_death(player, target)
+    
+    @classmethod
+    async def cmd_purge(cls, player: 'Player', args: List[str]):
+        """Remove all mobs and objects from the room, or a specific target (immortal only).
+        
+        Usage: 
+            purge           - Remove all mobs/objects in room
+            purge <target>  - Remove specific mob/object
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+        
+        from mobs import Mobile
+        from player import Player
+        
+        if args:
+            # Purge specific target
+            target_name = ' '.join(args)
+            target = cls._find_target(player, target_name)
+            
+            if not target:
+                # Try finding an object
+                for item in player.room.items:
+                    if target_name.lower() in item.name.lower():
+                        player.room.items.remove(item)
+                        await player.send(f"{c['bright_magenta']}{item.short_desc} vanishes in a puff of smoke.{c['reset']}")
+                        return
+                await player.send(f"{c['red']}Nothing by that name here.{c['reset']}")
+                return
+                
+            if isinstance(target, Player):
+                await player.send(f"{c['red']}You cannot purge players!{c['reset']}")
+                return
+                
+            # Remove the mob
+            if target in player.room.characters:
+                player.room.characters.remove(target)
+            if target in player.world.mobs:
+                player.world.mobs.remove(target)
+            await player.send(f"{c['bright_magenta']}{target.name} vanishes in a puff of smoke.{c['reset']}")
+            return
+        
+        # Purge all mobs and objects in room
+        purged_mobs = 0
+        purged_objs = 0
+        
+        for char in player.room.characters[:]:
+            if isinstance(char, Mobile):
+                player.room.characters.remove(char)
+                if char in player.world.mobs:
+                    player.world.mobs.remove(char)
+                purged_mobs += 1
+                
+        for item in player.room.items[:]:
+            player.room.items.remove(item)
+            purged_objs += 1
+            
+        await player.send(f"{c['bright_magenta']}You purge the room!{c['reset']}")
+        await player.send(f"{c['cyan']}Removed {purged_mobs} mobs and {purged_objs} objects.{c['reset']}")
+        await player.room.send_to_room(
+            f"{c['bright_magenta']}{player.name} gestures and everything not a player vanishes!{c['reset']}",
+            exclude=[player]
+        )
+    
+    @classmethod
+    async def cmd_restore(cls, player: 'Player', args: List[str]):
+        """Fully restore HP/mana/move for self or a target (immortal only).
+        
+        Usage:
+            restore         - Restore yourself
+            restore <name>  - Restore a player
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+            
+        if not args:
+            target = player
+        else:
+            # Find the player
+            target_name = args[0].lower()
+            target = None
+            for p in player.world.players.values():
+                if p.name.lower() == target_name:
+                    target = p
+                    break
+            if not target:
+                await player.send(f"{c['red']}No player named '{args[0]}' is online.{c['reset']}")
+                return
+        
+        target.hp = target.max_hp
+        target.mana = target.max_mana
+        target.move = target.max_move
+        
+        if target == player:
+            await player.send(f"{c['bright_green']}You restore yourself to full health!{c['reset']}")
+        else:
+            await player.send(f"{c['bright_green']}You restore {target.name} to full health!{c['reset']}")
+            await target.send(f"{c['bright_green']}You feel a surge of divine energy! Fully restored!{c['reset']}")
+    
+    @classmethod
+    async def cmd_advance(cls, player: 'Player', args: List[str]):
+        """Set a player's level (immortal only).
+        
+        Usage: advance <player> <level>
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+            
+        if len(args) < 2:
+            await player.send(f"{c['yellow']}Usage: advance <player> <level>{c['reset']}")
+            return
+            
+        target_name = args[0].lower()
+        try:
+            new_level = int(args[1])
+        except ValueError:
+            await player.send(f"{c['red']}Level must be a number.{c['reset']}")
+            return
+            
+        if new_level < 1 or new_level > 100:
+            await player.send(f"{c['red']}Level must be between 1 and 100.{c['reset']}")
+            return
+            
+        # Find the player
+        target = None
+        for p in player.world.players.values():
+            if p.name.lower() == target_name:
+                target = p
+                break
+        if not target:
+            await player.send(f"{c['red']}No player named '{args[0]}' is online.{c['reset']}")
+            return
+            
+        old_level = target.level
+        
+        await player.send(f"{c['bright_green']}You advance {target.name} from level {old_level} to level {new_level}!{c['reset']}")
+        
+        # Level up one at a time to trigger proper celebrations and ability unlocks
+        while target.level < new_level:
+            await target.level_up()
+        
+        # Restore to full
+        target.hp = target.max_hp
+        target.mana = target.max_mana
+        target.move = target.max_move
+    
+    @classmethod
+    async def cmd_transfer(cls, player: 'Player', args: List[str]):
+        """Teleport a player to your location (immortal only).
+        
+        Usage: transfer <player>
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+            
+        if not args:
+            await player.send(f"{c['yellow']}Usage: transfer <player>{c['reset']}")
+            return
+            
+        target_name = args[0].lower()
+        target = None
+        for p in player.world.players.values():
+            if p.name.lower() == target_name:
+                target = p
+                break
+        if not target:
+            await player.send(f"{c['red']}No player named '{args[0]}' is online.{c['reset']}")
+            return
+            
+        if target == player:
+            await player.send(f"{c['yellow']}You're already here!{c['reset']}")
+            return
+            
+        old_room = target.room
+        
+        # Remove from old room
+        if old_room:
+            await old_room.send_to_room(
+                f"{c['bright_magenta']}{target.name} disappears in a flash of light!{c['reset']}",
+                exclude=[target]
+            )
+            old_room.characters.remove(target)
+            
+        # Add to new room
+        target.room = player.room
+        player.room.characters.append(target)
+        
+        await target.send(f"{c['bright_magenta']}You feel yourself being pulled through space!{c['reset']}")
+        await target.room.show_to(target)
+        
+        await player.send(f"{c['bright_green']}You summon {target.name} to your location!{c['reset']}")
+        await player.room.send_to_room(
+            f"{c['bright_magenta']}{target.name} appears in a flash of light!{c['reset']}",
+            exclude=[player, target]
+        )
+    
+    @classmethod
+    async def cmd_wizinvis(cls, player: 'Player', args: List[str]):
+        """Toggle invisibility to mortals (immortal only).
+        
+        Usage: wizinvis [level]
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+        
+        # Toggle wizinvis flag
+        if not hasattr(player, 'wizinvis'):
+            player.wizinvis = False
+            
+        player.wizinvis = not player.wizinvis
+        
+        if player.wizinvis:
+            await player.send(f"{c['bright_cyan']}You slowly vanish from sight...{c['reset']}")
+            await player.room.send_to_room(
+                f"{c['bright_cyan']}{player.name} slowly fades from view.{c['reset']}",
+                exclude=[player]
+            )
+        else:
+            await player.send(f"{c['bright_cyan']}You become visible again.{c['reset']}")
+            await player.room.send_to_room(
+                f"{c['bright_cyan']}{player.name} slowly fades into view.{c['reset']}",
+                exclude=[player]
+            )
+    
+    @classmethod
+    async def cmd_peace(cls, player: 'Player', args: List[str]):
+        """Stop all combat in the current room (immortal only).
+        
+        Usage: peace
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+            
+        stopped = 0
+        for char in player.room.characters:
+            if char.fighting:
+                char.fighting = None
+                stopped += 1
+                
+        if stopped > 0:
+            await player.send(f"{c['bright_cyan']}You wave your hand and all combat ceases!{c['reset']}")
+            await player.room.send_to_room(
+                f"{c['bright_cyan']}{player.name} waves their hand and a feeling of peace washes over everyone.{c['reset']}",
+                exclude=[player]
+            )
+        else:
+            await player.send(f"{c['yellow']}No one is fighting here.{c['reset']}")
+    
+    @classmethod
+    async def cmd_force(cls, player: 'Player', args: List[str]):
+        """Force a player to execute a command (immortal only).
+        
+        Usage: force <player> <command>
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+            
+        if len(args) < 2:
+            await player.send(f"{c['yellow']}Usage: force <player> <command>{c['reset']}")
+            return
+            
+        target_name = args[0].lower()
+        command = ' '.join(args[1:])
+        
+        target = None
+        for p in player.world.players.values():
+            if p.name.lower() == target_name:
+                target = p
+                break
+        if not target:
+            await player.send(f"{c['red']}No player named '{args[0]}' is online.{c['reset']}")
+            return
+            
+        await player.send(f"{c['bright_cyan']}You force {target.name} to '{command}'.{c['reset']}")
+        await target.send(f"{c['bright_magenta']}{player.name} forces you to '{command}'.{c['reset']}")
+        
+        # Parse and execute the command
+        parts = command.split()
+        cmd = parts[0].lower()
+        cmd_args = parts[1:] if len(parts) > 1 else []
+        
+        await cls.execute(target, cmd, cmd_args)
+    
+    @classmethod
+    async def cmd_stat(cls, player: 'Player', args: List[str]):
+        """View detailed stats on a player, mob, or object (immortal only).
+        
+        Usage: stat <target>
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+            
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send(f"{c['yellow']}Usage: stat <target>{c['reset']}")
+                return
+            
+        target_name = ' '.join(args).lower()
+        
+        # Try to find a character (player or mob)
+        target = cls._find_target(player, target_name)
+        
+        if target:
+            # Character stats
+            from player import Player
+            from mobs import Mobile
+            
+            char_type = "Player" if isinstance(target, Player) else "Mobile"
+            
+            await player.send(f"{c['bright_cyan']}=== {char_type} Stats: {target.name} ==={c['reset']}")
+            await player.send(f"{c['white']}Level: {target.level}  Class: {getattr(target, 'char_class', 'N/A')}")
+            
+            if isinstance(target, Mobile):
+                await player.send(f"{c['white']}Vnum: {target.vnum}  Keywords: {', '.join(target.keywords)}")
+                await player.send(f"{c['white']}Flags: {', '.join(target.flags) if target.flags else 'none'}")
+                await player.send(f"{c['white']}Special: {target.special or 'none'}")
+                
+            await player.send(f"{c['green']}HP: {target.hp}/{target.max_hp}  Mana: {target.mana}/{target.max_mana}  Move: {target.move}/{target.max_move}")
+            await player.send(f"{c['yellow']}STR: {target.str}  INT: {target.int}  WIS: {target.wis}")
+            await player.send(f"{c['yellow']}DEX: {target.dex}  CON: {target.con}  CHA: {target.cha}")
+            await player.send(f"{c['red']}AC: {target.armor_class}  Hit: {target.hitroll}  Dam: {target.damroll}")
+            await player.send(f"{c['cyan']}Gold: {target.gold}  Exp: {target.exp}  Align: {target.alignment}")
+            
+            if isinstance(target, Mobile):
+                await player.send(f"{c['magenta']}Damage Dice: {target.damage_dice}")
+                
+            if isinstance(target, Player):
+                await player.send(f"{c['white']}Account: {target.account_name or 'None'}  Room: {target.room.vnum if target.room else 'None'}")
+                
+            await player.send(f"{c['cyan']}Position: {target.position}  Fighting: {target.fighting.name if target.fighting else 'No'}")
+            
+            # Equipment
+            if target.equipment:
+                await player.send(f"{c['bright_yellow']}Equipment:{c['reset']}")
+                for slot, item in target.equipment.items():
+                    await player.send(f"  {c['white']}{slot}: {item.short_desc} (vnum {item.vnum})")
+            return
+            
+        # Try to find an object
+        for item in player.room.items + player.inventory:
+            if target_name in item.name.lower():
+                await player.send(f"{c['bright_cyan']}=== Object Stats: {item.name} ==={c['reset']}")
+                await player.send(f"{c['white']}Vnum: {item.vnum}  Type: {item.item_type}")
+                await player.send(f"{c['white']}Short: {item.short_desc}")
+                await player.send(f"{c['white']}Room: {item.room_desc}")
+                await player.send(f"{c['yellow']}Wear Slot: {item.wear_slot or 'None'}  Weight: {item.weight}  Cost: {item.cost}")
+                
+                if item.item_type == 'weapon':
+                    await player.send(f"{c['red']}Damage: {item.damage_dice}  Type: {item.weapon_type}")
+                if item.item_type == 'armor':
+                    await player.send(f"{c['green']}Armor: {item.armor}")
+                if item.affects:
+                    await player.send(f"{c['magenta']}Affects: {item.affects}")
+                if item.flags:
+                    await player.send(f"{c['cyan']}Flags: {', '.join(item.flags)}")
+                return
+                
+        await player.send(f"{c['red']}Nothing by that name found.{c['reset']}")
+    
+    @classmethod
+    async def cmd_set(cls, player: 'Player', args: List[str]):
+        """Set a field on a player or mob (immortal only).
+        
+        Usage: set <target> <field> <value>
+        
+        Fields for characters:
+            level, hp, maxhp, mana, maxmana, move, maxmove
+            str, int, wis, dex, con, cha
+            gold, exp, alignment, hitroll, damroll, ac
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+            
+        if len(args) < 3:
+            await player.send(f"{c['yellow']}Usage: set <target> <field> <value>{c['reset']}")
+            await player.send(f"{c['cyan']}Fields: level, hp, maxhp, mana, maxmana, move, maxmove,")
+            await player.send(f"{c['cyan']}        str, int, wis, dex, con, cha, gold, exp,")
+            await player.send(f"{c['cyan']}        alignment, hitroll, damroll, ac{c['reset']}")
+            return
+            
+        target_name = args[0].lower()
+        field = args[1].lower()
+        try:
+            value = int(args[2])
+        except ValueError:
+            await player.send(f"{c['red']}Value must be a number.{c['reset']}")
+            return
+            
+        # Find target
+        target = cls._find_target(player, target_name)
+        if not target:
+            # Try online players
+            for p in player.world.players.values():
+                if p.name.lower() == target_name:
+                    target = p
+                    break
+                    
+        if not target:
+            await player.send(f"{c['red']}No target named '{args[0]}' found.{c['reset']}")
+            return
+            
+        # Map field names to attributes
+        field_map = {
+            'level': 'level',
+            'hp': 'hp',
+            'maxhp': 'max_hp',
+            'mana': 'mana',
+            'maxmana': 'max_mana',
+            'move': 'move',
+            'maxmove': 'max_move',
+            'str': 'str',
+            'int': 'int',
+            'wis': 'wis',
+            'dex': 'dex',
+            'con': 'con',
+            'cha': 'cha',
+            'gold': 'gold',
+            'exp': 'exp',
+            'alignment': 'alignment',
+            'hitroll': 'hitroll',
+            'damroll': 'damroll',
+            'ac': 'armor_class',
+        }
+        
+        if field not in field_map:
+            await player.send(f"{c['red']}Unknown field '{field}'.{c['reset']}")
+            await player.send(f"{c['cyan']}Valid fields: {', '.join(field_map.keys())}{c['reset']}")
+            return
+            
+        attr = field_map[field]
+        old_value = getattr(target, attr, 0)
+        setattr(target, attr, value)
+        
+        await player.send(f"{c['bright_green']}Set {target.name}'s {field} from {old_value} to {value}.{c['reset']}")
+    
+    @classmethod
+    async def cmd_zreset(cls, player: 'Player', args: List[str]):
+        """Reset (repopulate) a zone (immortal only).
+        
+        Usage: 
+            zreset          - Reset current zone
+            zreset <number> - Reset specific zone
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+            
+        if args:
+            try:
+                zone_num = int(args[0])
+            except ValueError:
+                await player.send(f"{c['red']}Invalid zone number.{c['reset']}")
+                return
+        else:
+            # Get current zone from room vnum
+            if not player.room:
+                await player.send(f"{c['red']}You're not in a room!{c['reset']}")
+                return
+            zone_num = player.room.vnum // 100
+            
+        zone = player.world.zones.get(zone_num)
+        if not zone:
+            await player.send(f"{c['red']}Zone {zone_num} does not exist.{c['reset']}")
+            return
+            
+        # Reset the zone
+        await player.world.reset_zone(zone)
+        await player.send(f"{c['bright_green']}Zone {zone_num} ({zone.name}) has been reset!{c['reset']}")
+    
+    @classmethod
+    async def cmd_backup(cls, player: 'Player', args: List[str]):
+        """Create a backup of game data (immortal only).
+        
+        Usage: backup [players|world|full]
+               backup list
+               backup restore <filename>
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+        
+        import subprocess
+        import sys
+        import re
+        from pathlib import Path
+        
+        script_path = Path(__file__).parent.parent / "scripts" / "backup.py"
+        
+        if not args:
+            args = ['full']
+        
+        mode = args[0].lower()
+        
+        if mode == 'list':
+            await player.send(f"{c['bright_cyan']}=== Available Backups ==={c['reset']}")
+            result = subprocess.run(
+                [sys.executable, str(script_path), '--list'],
+                capture_output=True, text=True
+            )
+            for line in result.stdout.strip().split('\n'):
+                await player.send(f"{c['white']}{line}{c['reset']}")
+            return
+        
+        if mode == 'restore':
+            if len(args) < 2:
+                await player.send(f"{c['red']}Usage: backup restore <filename>{c['reset']}")
+                return
+            filename = args[1]
+
+            # Security: Validate filename to prevent command/argument injection
+            # Only allow alphanumeric, dots, underscores, and hyphens.
+            # Must not start with a hyphen.
+            if not re.match(r'^[a-zA-Z0-9._][a-zA-Z0-9._-]*$', filename):
+                await player.send(f"{c['red']}Invalid backup filename. Only alphanumeric characters, dots, underscores, and hyphens are allowed, and it cannot start with a hyphen.{c['reset']}")
+                return
+
+            await player.send(f"{c['yellow']}Restoring from {filename}...{c['reset']}")
+            result = subprocess.run(
+                [sys.executable, str(script_path), '--restore', filename],
+                capture_output=True, text=True
+            )
+            for line in result.stdout.strip().split('\n'):
+                await player.send(f"{c['white']}{line}{c['reset']}")
+            if result.returncode == 0:
+                await player.send(f"{c['bright_green']}Restore complete! Use 'shutdown reboot' to load changes.{c['reset']}")
+            else:
+                await player.send(f"{c['red']}Restore failed:{c['reset']}")
+                for line in result.stderr.strip().split('\n'):
+                    await player.send(f"{c['red']}{line}{c['reset']}")
+            return
+        
+        # Create backup
+        cmd_args = [sys.executable, str(script_path)]
+        if mode == 'players':
+            cmd_args.append('--players')
+            backup_type = "player data"
+        elif mode == 'world':
+            cmd_args.append('--world')
+            backup_type = "world/zones"
+        else:
+            backup_type = "full"
+        
+        await player.send(f"{c['yellow']}Creating {backup_type} backup...{c['reset']}")
+        
+        result = subprocess.run(cmd_args, capture_output=True, text=True)
+        
+        if result.returncode == 0:
+            # Parse output for summary
+            lines = result.stdout.strip().split('\n')
+            for line in lines[-4:]:  # Show last 4 lines (summary)
+                await player.send(f"{c['bright_green']}{line}{c['reset']}")
+        else:
+            await player.send(f"{c['red']}Backup failed:{c['reset']}")
+            for line in result.stderr.strip().split('\n'):
+                await player.send(f"{c['red']}{line}{c['reset']}")
+    
+    @classmethod
+    async def cmd_shutdown(cls, player: 'Player', args: List[str]):
+        """Shutdown the MUD server (immortal only).
+        
+        Usage: shutdown [now|reboot]
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+            
+        mode = args[0].lower() if args else 'warn'
+        
+        if mode == 'now':
+            # Immediate shutdown
+            await player.send(f"{c['bright_red']}Initiating immediate shutdown...{c['reset']}")
+            for p in player.world.players.values():
+                await p.send(f"{c['bright_red']}*** SHUTDOWN BY {player.name} ***{c['reset']}")
+                p.save()
+            import sys
+            sys.exit(0)
+        elif mode == 'reboot':
+            await player.send(f"{c['bright_yellow']}Initiating reboot...{c['reset']}")
+            for p in player.world.players.values():
+                await p.send(f"{c['bright_yellow']}*** REBOOT BY {player.name} - Please reconnect shortly ***{c['reset']}")
+                p.save()
+            import sys
+            sys.exit(0)
+        else:
+            await player.send(f"{c['yellow']}Shutdown options:{c['reset']}")
+            await player.send(f"{c['white']}  shutdown now    - Immediate shutdown")
+            await player.send(f"{c['white']}  shutdown reboot - Reboot the server")
+    
+    @classmethod
+    async def cmd_immlist(cls, player: 'Player', args: List[str]):
+        """List all immortals (admin accounts).
+        
+        Usage: immlist
+        """
+        c = player.config.COLORS
+        
+        import os
+        from accounts import Account, ACCOUNTS_DIR
+        
+        await player.send(f"{c['bright_cyan']}=== Immortals ==={c['reset']}")
+        
+        if not os.path.exists(ACCOUNTS_DIR):
+            await player.send(f"{c['yellow']}No accounts found.{c['reset']}")
+            return
+            
+        found = False
+        for filename in os.listdir(ACCOUNTS_DIR):
+            if filename.endswith('.json'):
+                account_name = filename[:-5]
+                account = Account.load(account_name)
+                if account and account.is_admin:
+                    found = True
+                    online = any(p.account_name == account_name for p in player.world.players.values())
+                    status = f"{c['bright_green']}[ONLINE]{c['reset']}" if online else f"{c['red']}[OFFLINE]{c['reset']}"
+                    await player.send(f"  {c['white']}{account_name}{c['reset']} {status}")
+                    
+        if not found:
+            await player.send(f"{c['yellow']}No immortals found.{c['reset']}")
+    
+    @classmethod
+    async def cmd_wizhelp(cls, player: 'Player', args: List[str]):
+        """List all immortal commands.
+        
+        Usage: wizhelp
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+            
+        await player.send(f"{c['bright_cyan']}=== Immortal Commands ==={c['reset']}")
+        await player.send(f"{c['yellow']}Loading/Creating:{c['reset']}")
+        await player.send(f"  {c['white']}mload <vnum>         {c['cyan']}- Load a mob into the room")
+        await player.send(f"  {c['white']}oload <vnum> [room]  {c['cyan']}- Load an object (inv or room)")
+        await player.send(f"  {c['white']}load <mob|obj> <vnum>{c['cyan']}- Combined load command")
+        await player.send(f"  {c['white']}purge [target]       {c['cyan']}- Remove mobs/objects from room")
+        await player.send(f"  {c['white']}zreset [zone]        {c['cyan']}- Reset/repopulate a zone")
+        await player.send(f"")
+        await player.send(f"{c['yellow']}Player Management:{c['reset']}")
+        await player.send(f"  {c['white']}restore [player]     {c['cyan']}- Fully heal a player")
+        await player.send(f"  {c['white']}advance <player> <lvl>{c['cyan']}- Set player level")
+        await player.send(f"  {c['white']}transfer <player>    {c['cyan']}- Summon player to you")
+        await player.send(f"  {c['white']}teleport <plr> <room>{c['cyan']}- Send player to room")
+        await player.send(f"  {c['white']}force <player> <cmd> {c['cyan']}- Force player to do command")
+        await player.send(f"  {c['white']}set <tgt> <fld> <val>{c['cyan']}- Modify stats")
+        await player.send(f"  {c['white']}freeze <player>      {c['cyan']}- Toggle player frozen")
+        await player.send(f"  {c['white']}mute <player>        {c['cyan']}- Toggle player muted")
+        await player.send(f"  {c['white']}dc <player>          {c['cyan']}- Disconnect player")
+        await player.send(f"  {c['white']}snoop [player]       {c['cyan']}- Watch what player sees")
+        await player.send(f"")
+        await player.send(f"{c['yellow']}Combat/Control:{c['reset']}")
+        await player.send(f"  {c['white']}slay <target>        {c['cyan']}- Instantly kill a mob")
+        await player.send(f"  {c['white']}peace                {c['cyan']}- Stop all combat in room")
+        await player.send(f"  {c['white']}nohassle             {c['cyan']}- Toggle mob aggro immunity")
+        await player.send(f"")
+        await player.send(f"{c['yellow']}Movement/Location:{c['reset']}")
+        await player.send(f"  {c['white']}goto <vnum/zone>     {c['cyan']}- Teleport to a room")
+        await player.send(f"  {c['white']}at <room> <cmd>      {c['cyan']}- Execute cmd at location")
+        await player.send(f"  {c['white']}wizinvis             {c['cyan']}- Toggle invisibility")
+        await player.send(f"  {c['white']}holylight            {c['cyan']}- See in dark/see invis")
+        await player.send(f"")
+        await player.send(f"{c['yellow']}Communication:{c['reset']}")
+        await player.send(f"  {c['white']}echo <message>       {c['cyan']}- Send msg to room")
+        await player.send(f"  {c['white']}gecho <message>      {c['cyan']}- Send msg to all players")
+        await player.send(f"")
+        await player.send(f"{c['yellow']}Information:{c['reset']}")
+        await player.send(f"  {c['white']}stat <target>        {c['cyan']}- View detailed stats")
+        await player.send(f"  {c['white']}mlist [zone]         {c['cyan']}- List mobs in zone")
+        await player.send(f"  {c['white']}olist [zone]         {c['cyan']}- List objects in zone")
+        await player.send(f"  {c['white']}rlist [zone]         {c['cyan']}- List rooms in zone")
+        await player.send(f"  {c['white']}find <mob|obj> <name>{c['cyan']}- Find mob/obj by name")
+        await player.send(f"  {c['white']}show <zones|players|stats>{c['cyan']}- Show game info")
+        await player.send(f"  {c['white']}invis                {c['cyan']}- List invisible in room")
+        await player.send(f"  {c['white']}immlist              {c['cyan']}- List all immortals")
+        await player.send(f"  {c['white']}tickstats [reset]    {c['cyan']}- Game loop timings per subsystem")
+        await player.send(f"  {c['white']}ipban [reload|check] {c['cyan']}- Site bans and connection limits")
+        await player.send(f"  {c['white']}netstat [sort]       {c['cyan']}- Per-connection traffic and latency")
+        await player.send(f"  {c['white']}cmdstats [sort]      {c['cyan']}- Time spent per command; 'cmdstats slowlog'")
+        await player.send(f"  {c['white']}cmdgroup [reload <g>]{c['cyan']}- Command modules; reload one from disk")
+        await player.send(f"")
+        await player.send(f"{c['yellow']}Server:{c['reset']}")
+        await player.send(f"  {c['white']}shutdown [now|reboot]{c['cyan']}- Shutdown server")
+    
+    @classmethod
+    def _find_target(cls, player: 'Player', name: str):
+        """Find a character in the room by name or number."""
+        if not player.room:
+            return None
+            
+        name = name.lower()
+        
+        # Check for numbered targeting (e.g., "2.guard")
+        number = 1
+        if '.' in name:
+            parts = name.split('.', 1)
+            try:
+                number = int(parts[0])
+                name = parts[1]
+            except ValueError:
+                pass
+        
+        count = 0
+        for char in player.room.characters:
+            if char == player:
+                continue
+            # Check name
+            char_name = char.name.lower()
+            # Check keywords for mobs
+            keywords = getattr(char, 'keywords', [])
+            
+            if name in char_name or any(name in kw.lower() for kw in keywords):
+                count += 1
+                if count == number:
+                    return char
+        return None
+
+    @classmethod
+    async def cmd_olist(cls, player: 'Player', args: List[str]):
+        """List all objects in a zone (immortal only).
+        
+        Usage:
+            olist           - List objects in current zone
+            olist <zone>    - List objects in specified zone
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+        
+        # Determine zone
+        if args:
+            try:
+                zone_num = int(args[0])
+            except ValueError:
+                await player.send(f"{c['red']}Invalid zone number.{c['reset']}")
+                return
+        else:
+            if not player.room:
+                await player.send(f"{c['red']}You're not in a room!{c['reset']}")
+                return
+            zone_num = player.room.vnum // 100
+        
+        # Get objects in that zone range
+        min_vnum = zone_num * 100
+        max_vnum = min_vnum + 99
+        
+        await player.send(f"{c['bright_cyan']}=== Objects in Zone {zone_num} (vnums {min_vnum}-{max_vnum}) ==={c['reset']}")
+        
+        count = 0
+        for vnum, proto in sorted(player.world.obj_prototypes.items()):
+            if min_vnum <= vnum <= max_vnum:
+                name = proto.get('name', proto.get('short_desc', 'unknown'))
+                obj_type = proto.get('type', 'other')
+                await player.send(f"  {c['yellow']}{vnum:5}{c['reset']} - {c['white']}{name}{c['reset']} ({obj_type})")
+                count += 1
+        
+        if count == 0:
+            await player.send(f"{c['yellow']}No objects defined in this zone.{c['reset']}")
+        else:
+            await player.send(f"{c['cyan']}Total: {count} objects{c['reset']}")
+
+    @classmethod
+    async def cmd_mlist(cls, player: 'Player', args: List[str]):
+        """List all mobs in a zone (immortal only).
+        
+        Usage:
+            mlist           - List mobs in current zone
+            mlist <zone>    - List mobs in specified zone
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+        
+        # Determine zone
+        if args:
+            try:
+                zone_num = int(args[0])
+            except ValueError:
+                await player.send(f"{c['red']}Invalid zone number.{c['reset']}")
+                return
+        else:
+            if not player.room:
+                await player.send(f"{c['red']}You're not in a room!{c['reset']}")
+                return
+            zone_num = player.room.vnum // 100
+        
+        # Get mobs in that zone range
+        min_vnum = zone_num * 100
+        max_vnum = min_vnum + 99
+        
+        await player.send(f"{c['bright_cyan']}=== Mobs in Zone {zone_num} (vnums {min_vnum}-{max_vnum}) ==={c['reset']}")
+        
+        count = 0
+        for vnum, proto in sorted(player.world.mob_prototypes.items()):
+            if min_vnum <= vnum <= max_vnum:
+                name = proto.get('name', proto.get('short_desc', 'unknown'))
+                level = proto.get('level', 1)
+                await player.send(f"  {c['yellow']}{vnum:5}{c['reset']} - [{c['green']}{level:2}{c['reset']}] {c['white']}{name}{c['reset']}")
+                count += 1
+        
+        if count == 0:
+            await player.send(f"{c['yellow']}No mobs defined in this zone.{c['reset']}")
+        else:
+            await player.send(f"{c['cyan']}Total: {count} mobs{c['reset']}")
+
+    @classmethod
+    async def cmd_rlist(cls, player: 'Player', args: List[str]):
+        """List all rooms in a zone (immortal only).
+        
+        Usage:
+            rlist           - List rooms in current zone
+            rlist <zone>    - List rooms in specified zone
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+        
+        # Determine zone
+        if args:
+            try:
+                zone_num = int(args[0])
+            except ValueError:
+                await player.send(f"{c['red']}Invalid zone number.{c['reset']}")
+                return
+        else:
+            if not player.room:
+                await player.send(f"{c['red']}You're not in a room!{c['reset']}")
+                return
+            zone_num = player.room.vnum // 100
+        
+        zone = player.world.zones.get(zone_num)
+        if not zone:
+            await player.send(f"{c['red']}Zone {zone_num} does not exist.{c['reset']}")
+            return
+        
+        await player.send(f"{c['bright_cyan']}=== Rooms in Zone {zone_num}: {zone.name} ==={c['reset']}")
+        
+        count = 0
+        for vnum, room in sorted(zone.rooms.items()):
+            await player.send(f"  {c['yellow']}{vnum:5}{c['reset']} - {c['white']}{room.name}{c['reset']}")
+            count += 1
+        
+        await player.send(f"{c['cyan']}Total: {count} rooms{c['reset']}")
+
+    @classmethod
+    async def cmd_snoop(cls, player: 'Player', args: List[str]):
+        """Watch what another player sees (immortal only).
+        
+        Usage:
+            snoop <player>  - Start snooping on a player
+            snoop           - Stop snooping
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+        
+        if not args:
+            # Stop snooping
+            if hasattr(player, 'snooping') and player.snooping:
+                target = player.snooping
+                player.snooping = None
+                if hasattr(target, 'snooped_by'):
+                    target.snooped_by = None
+                await player.send(f"{c['yellow']}You stop snooping.{c['reset']}")
+            else:
+                await player.send(f"{c['yellow']}You aren't snooping anyone.{c['reset']}")
+            return
+        
+        target_name = args[0].lower()
+        target = None
+        for p in player.world.players.values():
+            if p.name.lower() == target_name:
+                target = p
+                break
+        
+        if not target:
+            await player.send(f"{c['red']}No player named '{args[0]}' is online.{c['reset']}")
+            return
+        
+        if target == player:
+            await player.send(f"{c['red']}You can't snoop yourself!{c['reset']}")
+            return
+        
+        # Stop any current snoop
+        if hasattr(player, 'snooping') and player.snooping:
+            old_target = player.snooping
+            if hasattr(old_target, 'snooped_by'):
+                old_target.snooped_by = None
+        
+        player.snooping = target
+        target.snooped_by = player
+        await player.send(f"{c['bright_cyan']}You begin snooping on {target.name}.{c['reset']}")
+
+    @classmethod
+    async def cmd_at(cls, player: 'Player', args: List[str]):
+        """Execute a command at another location (immortal only).
+        
+        Usage: at <location> <command>
+        
+        Examples:
+            at 3001 look
+            at 3001 mload 3000
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+        
+        if len(args) < 2:
+            await player.send(f"{c['yellow']}Usage: at <room_vnum> <command>{c['reset']}")
+            return
+        
+        try:
+            target_vnum = int(args[0])
+        except ValueError:
+            await player.send(f"{c['red']}Invalid room number.{c['reset']}")
+            return
+        
+        target_room = player.world.rooms.get(target_vnum)
+        if not target_room:
+            await player.send(f"{c['red']}Room {target_vnum} doesn't exist.{c['reset']}")
+            return
+        
+        # Save current location
+        original_room = player.room
+        
+        # Temporarily move to target room (silently)
+        if original_room:
+            original_room.characters.remove(player)
+        player.room = target_room
+        target_room.characters.append(player)
+        
+        # Execute command
+        cmd = args[1].lower()
+        cmd_args = args[2:] if len(args) > 2 else []
+        await cls.execute(player, cmd, cmd_args)
+        
+        # Move back
+        target_room.characters.remove(player)
+        player.room = original_room
+        if original_room:
+            original_room.characters.append(player)
+
+    @classmethod
+    async def cmd_echo(cls, player: 'Player', args: List[str]):
+        """Send a message to the current room (immortal only).
+        
+        Usage: echo <message>
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+        
+        if not args:
+            await player.send(f"{c['yellow']}Usage: echo <message>{c['reset']}")
+            return
+        
+        message = ' '.join(args)
+        await player.room.send_to_room(f"{c['bright_yellow']}{message}{c['reset']}")
+
+    @classmethod
+    async def cmd_gecho(cls, player: 'Player', args: List[str]):
+        """Send a message to all players (immortal only).
+        
+        Usage: gecho <message>
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+        
+        if not args:
+            await player.send(f"{c['yellow']}Usage: gecho <message>{c['reset']}")
+            return
+        
+        message = ' '.join(args)
+        for p in player.world.players.values():
+            await p.send(f"{c['bright_yellow']}{message}{c['reset']}")
+
+    @classmethod
+    async def cmd_teleport(cls, player: 'Player', args: List[str]):
+        """Send a player to a location (immortal only).
+        
+        Usage: teleport <player> <room_vnum>
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+        
+        if len(args) < 2:
+            await player.send(f"{c['yellow']}Usage: teleport <player> <room_vnum>{c['reset']}")
+            return
+        
+        target_name = args[0].lower()
+        try:
+            target_vnum = int(args[1])
+        except ValueError:
+            await player.send(f"{c['red']}Invalid room number.{c['reset']}")
+            return
+        
+        # Find player
+        target = None
+        for p in player.world.players.values():
+            if p.name.lower() == target_name:
+                target = p
+                break
+        
+        if not target:
+            await player.send(f"{c['red']}No player named '{args[0]}' is online.{c['reset']}")
+            return
+        
+        # Find room
+        target_room = player.world.rooms.get(target_vnum)
+        if not target_room:
+            await player.send(f"{c['red']}Room {target_vnum} doesn't exist.{c['reset']}")
+            return
+        
+        # Teleport them
+        old_room = target.room
+        if old_room:
+            await old_room.send_to_room(
+                f"{c['bright_magenta']}{target.name} disappears in a flash of light!{c['reset']}",
+                exclude=[target]
+            )
+            old_room.characters.remove(target)
+        
+        target.room = target_room
+        target_room.characters.append(target)
+        
+        await target.send(f"{c['bright_magenta']}You feel yourself yanked through space!{c['reset']}")
+        await target_room.show_to(target)
+        await target_room.send_to_room(
+            f"{c['bright_magenta']}{target.name} appears in a flash of light!{c['reset']}",
+            exclude=[target]
+        )
+        
+        await player.send(f"{c['bright_green']}You teleport {target.name} to room {target_vnum}.{c['reset']}")
+
+    @classmethod
+    async def cmd_freeze(cls, player: 'Player', args: List[str]):
+        """Freeze a player so they can't do anything (immortal only).
+        
+        Usage: freeze <player>
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+        
+        if not args:
+            await player.send(f"{c['yellow']}Usage: freeze <player>{c['reset']}")
+            return
+        
+        target_name = args[0].lower()
+        target = None
+        for p in player.world.players.values():
+            if p.name.lower() == target_name:
+                target = p
+                break
+        
+        if not target:
+            await player.send(f"{c['red']}No player named '{args[0]}' is online.{c['reset']}")
+            return
+        
+        if not hasattr(target, 'frozen'):
+            target.frozen = False
+        
+        target.frozen = not target.frozen
+        
+        if target.frozen:
+            await player.send(f"{c['bright_cyan']}You freeze {target.name} in place!{c['reset']}")
+            await target.send(f"{c['bright_cyan']}You have been frozen by {player.name}!{c['reset']}")
+        else:
+            await player.send(f"{c['bright_green']}You unfreeze {target.name}.{c['reset']}")
+            await target.send(f"{c['bright_green']}You have been unfrozen.{c['reset']}")
+
+    @classmethod
+    async def cmd_mute(cls, player: 'Player', args: List[str]):
+        """Mute a player so they can't talk (immortal only).
+        
+        Usage: mute <player>
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+        
+        if not args:
+            await player.send(f"{c['yellow']}Usage: mute <player>{c['reset']}")
+            return
+        
+        target_name = args[0].lower()
+        target = None
+        for p in player.world.players.values():
+            if p.name.lower() == target_name:
+                target = p
+                break
+        
+        if not target:
+            await player.send(f"{c['red']}No player named '{args[0]}' is online.{c['reset']}")
+            return
+        
+        if not hasattr(target, 'muted'):
+            target.muted = False
+        
+        target.muted = not target.muted
+        
+        if target.muted:
+            await player.send(f"{c['bright_cyan']}You mute {target.name}!{c['reset']}")
+            await target.send(f"{c['bright_cyan']}You have been muted by {player.name}!{c['reset']}")
+        else:
+            await player.send(f"{c['bright_green']}You unmute {target.name}.{c['reset']}")
+            await target.send(f"{c['bright_green']}You have been unmuted.{c['reset']}")
+
+    @classmethod
+    async def cmd_dc(cls, player: 'Player', args: List[str]):
+        """Disconnect a player (immortal only).
+        
+        Usage: dc <player>
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+        
+        if not args:
+            await player.send(f"{c['yellow']}Usage: dc <player>{c['reset']}")
+            return
+        
+        target_name = args[0].lower()
+        target = None
+        for p in player.world.players.values():
+            if p.name.lower() == target_name:
+                target = p
+                break
+        
+        if not target:
+            await player.send(f"{c['red']}No player named '{args[0]}' is online.{c['reset']}")
+            return
+        
+        if target == player:
+            await player.send(f"{c['red']}You can't disconnect yourself!{c['reset']}")
+            return
+        
+        await target.send(f"{c['bright_red']}You have been disconnected by {player.name}.{c['reset']}")
+        if target.connection:
+            await target.connection.disconnect()
+        
+        await player.send(f"{c['bright_green']}You disconnect {target.name}.{c['reset']}")
+
+    @classmethod
+    async def cmd_invis(cls, player: 'Player', args: List[str]):
+        """List all invisible players/mobs in room (immortal only).
+        
+        Usage: invis
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+        
+        await player.send(f"{c['bright_cyan']}=== Invisible Entities ==={c['reset']}")
+        
+        found = False
+        for char in player.room.characters:
+            is_invis = 'invisible' in getattr(char, 'affect_flags', set())
+            is_hidden = getattr(char, 'hidden', False)
+            is_wizinvis = getattr(char, 'wizinvis', False)
+            
+            if is_invis or is_hidden or is_wizinvis:
+                found = True
+                flags = []
+                if is_invis:
+                    flags.append('invisible')
+                if is_hidden:
+                    flags.append('hidden')
+                if is_wizinvis:
+                    flags.append('wizinvis')
+                await player.send(f"  {c['white']}{char.name}{c['reset']} ({', '.join(flags)})")
+        
+        if not found:
+            await player.send(f"{c['yellow']}No invisible entities in this room.{c['reset']}")
+
+    @classmethod
+    async def cmd_holylight(cls, player: 'Player', args: List[str]):
+        """Toggle ability to see everything (dark rooms, invisible, etc) (immortal only).
+        
+        Usage: holylight
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+        
+        if not hasattr(player, 'holylight'):
+            player.holylight = False
+        
+        player.holylight = not player.holylight
+        
+        if player.holylight:
+            await player.send(f"{c['bright_yellow']}Holy light activated! You can see all.{c['reset']}")
+        else:
+            await player.send(f"{c['yellow']}Holy light deactivated.{c['reset']}")
+
+    @classmethod
+    async def cmd_nohassle(cls, player: 'Player', args: List[str]):
+        """Toggle immunity to mob attacks (immortal only).
+        
+        Usage: nohassle
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+        
+        if not hasattr(player, 'nohassle'):
+            player.nohassle = False
+        
+        player.nohassle = not player.nohassle
+        
+        if player.nohassle:
+            await player.send(f"{c['bright_green']}Nohassle activated! Mobs will ignore you.{c['reset']}")
+        else:
+            await player.send(f"{c['yellow']}Nohassle deactivated.{c['reset']}")
+
+    @classmethod
+    async def cmd_show(cls, player: 'Player', args: List[str]):
+        """Show various game statistics (immortal only).
+        
+        Usage:
+            show zones    - List all zones
+            show players  - List all online players with details
+            show stats    - Show server statistics
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+        
+        if not args:
+            await player.send(f"{c['yellow']}Usage: show <zones|players|stats>{c['reset']}")
+            return
+        
+        sub = args[0].lower()
+        
+        if sub == 'zones':
+            await player.send(f"{c['bright_cyan']}=== All Zones ==={c['reset']}")
+            for zone_num, zone in sorted(player.world.zones.items()):
+                room_count = len(zone.rooms)
+                await player.send(f"  {c['yellow']}{zone_num:3}{c['reset']} - {c['white']}{zone.name}{c['reset']} ({room_count} rooms)")
+        
+        elif sub == 'players':
+            await player.send(f"{c['bright_cyan']}=== Online Players ==={c['reset']}")
+            for p in player.world.players.values():
+                room_vnum = p.room.vnum if p.room else 'None'
+                flags = []
+                if getattr(p, 'frozen', False):
+                    flags.append('FROZEN')
+                if getattr(p, 'muted', False):
+                    flags.append('MUTED')
+                if getattr(p, 'wizinvis', False):
+                    flags.append('WIZINVIS')
+                flag_str = f" [{', '.join(flags)}]" if flags else ""
+                await player.send(f"  {c['white']}{p.name}{c['reset']} [{p.level} {p.char_class}] Room: {room_vnum}{flag_str}")
+        
+        elif sub == 'stats':
+            await player.send(f"{c['bright_cyan']}=== Server Statistics ==={c['reset']}")
+            await player.send(f"  {c['white']}Zones:{c['reset']} {len(player.world.zones)}")
+            await player.send(f"  {c['white']}Rooms:{c['reset']} {len(player.world.rooms)}")
+            await player.send(f"  {c['white']}Mob Prototypes:{c['reset']} {len(player.world.mob_prototypes)}")
+            await player.send(f"  {c['white']}Object Prototypes:{c['reset']} {len(player.world.obj_prototypes)}")
+            await player.send(f"  {c['white']}Online Players:{c['reset']} {len(player.world.players)}")
+            await player.send(f"  {c['white']}Active NPCs:{c['reset']} {len(player.world.npcs)}")
+            compression = getattr(player.world, 'compression_stats', None)
+            if compression:
+                for line in compression.format_report(c):
+                    await player.send(line)
+        
+        else:
+            await player.send(f"{c['yellow']}Unknown option. Try: zones, players, stats{c['reset']}")
+
+    @classmethod
+    async def cmd_tickstats(cls, player: 'Player', args: List[str]):
+        """Show per-subsystem game loop timings (immortal only).
+        
+        Usage:
+            tickstats        - p50/p95/p99/max per subsystem and pulse overruns
+            tickstats reset  - Clear collected timings
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+        
+        profiler = getattr(player.world, 'tick_profiler', None)
+        if not profiler:
+            await player.send(f"{c['yellow']}Tick profiling is not available.{c['reset']}")
+            return
+        
+        shedder = getattr(player.world, 'load_shedder', None)
+        if args and args[0].lower() == 'reset':
+            profiler.reset()
+            if shedder:
+                shedder.reset()
+            await player.send(f"{c['bright_green']}Tick statistics cleared.{c['reset']}")
+            return
+        
+        for line in profiler.format_report(c):
+            await player.send(line)
+
+        zones = player.world.zones.values()
+        asleep = sum(1 for z in zones if z.hibernating)
+        await player.send(f"  {c['white']}Zones:{c['reset']} {len(zones) - asleep} awake, "
+                          f"{asleep} hibernating")
+        if shedder:
+            for line in shedder.format_report(c):
+                await player.send(line)
+
+    @classmethod
+    async def cmd_ipban(cls, player: 'Player', args: List[str]):
+        """Site bans and connection rate limiting (immortal only).
+        
+        Usage:
+            ipban            - Ban list and rate limiter status
+            ipban reload     - Re-read the ban file
+            ipban check <ip> - Show whether an address is banned
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+        
+        bans = getattr(player.world, 'ban_list', None)
+        if not bans:
+            await player.send(f"{c['yellow']}The ban list is not available here.{c['reset']}")
+            return
+        
+        sub = args[0].lower() if args else ''
+        if sub == 'reload':
+            count = bans.load()
+            await player.send(f"{c['bright_green']}Ban list reloaded: {count} entries.{c['reset']}")
+            for entry in bans.errors:
+                await player.send(f"  {c['red']}Ignored invalid entry: {entry}{c['reset']}")
+            return
+        
+        if sub == 'check':
+            if len(args) < 2:
+                await player.send(f"{c['yellow']}Usage: ipban check <ip>{c['reset']}")
+                return
+            ban = bans.match(args[1])
+            if ban:
+                await player.send(f"{c['red']}{args[1]} is banned ({ban}).{c['reset']}")
+            else:
+                await player.send(f"{c['green']}{args[1]} is not banned.{c['reset']}")
+            return
+        
+        if sub:
+            await player.send(f"{c['yellow']}Usage: ipban [reload | check <ip>]{c['reset']}")
+            return
+        
+        await player.send(f"{c['bright_cyan']}=== Site Bans ==={c['reset']}")
+        await player.send(f"  {c['white']}File:{c['reset']} {bans.path}")
+        await player.send(f"  {c['white']}Entries:{c['reset']} {bans.trie.count}"
+                          + (f" ({len(bans.errors)} invalid lines ignored)" if bans.errors else ''))
+        await player.send(f"  {c['white']}Refused:{c['reset']} {bans.blocked} banned connections")
+        limiter = getattr(player.world, 'connection_limiter', None)
+        if limiter:
+            if limiter.enabled:
+                await player.send(f"  {c['white']}Rate limit:{c['reset']} {player.config.CONNECT_RATE_LIMIT} "
+                                  f"connections per {player.config.CONNECT_RATE_WINDOW}s per IP, "
+                                  f"{limiter.rejected} refused, {limiter.tracked} IPs tracked")
+            else:
+                await player.send(f"  {c['white']}Rate limit:{c['reset']} off")
+
+    @classmethod
+    async def cmd_netstat(cls, player: 'Player', args: List[str]):
+        """Per-connection traffic and command latency (immortal only).
+        
+        Usage:
+            netstat [in|out|cmds|rate|msgs|lat]  - Sort connections by bytes in/out,
+                                                   commands, commands/min,
+                                                   messages/command or worst latency
+        """
+        from net_stats import SORT_KEYS
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+        
+        stats = getattr(player.world, 'net_stats', None)
+        if not stats:
+            await player.send(f"{c['yellow']}Network statistics are not available here.{c['reset']}")
+            return
+        
+        sort = args[0].lower() if args else 'out'
+        if sort not in SORT_KEYS:
+            await player.send(f"{c['yellow']}Usage: netstat [{'|'.join(SORT_KEYS)}]{c['reset']}")
+            return
+        
+        for line in stats.format_report(c, sort):
+            await player.send(line)
+
+    @classmethod
+    async def cmd_cmdgroup(cls, player: 'Player', args: List[str]):
+        """Command group modules (immortal only).
+
+        Usage:
+            cmdgroup                 - List the groups and which are loaded
+            cmdgroup <command>       - Show which group a command is in
+            cmdgroup reload <group>  - Re-import a group from disk
+        """
+        c = player.config.COLORS
+
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+
+        groups = cls.groups
+        if args and args[0].lower() == 'reload':
+            if len(args) < 2:
+                await player.send(f"{c['yellow']}Usage: cmdgroup reload <group>{c['reset']}")
+                return
+            group = args[1].lower()
+            if group not in groups.groups:
+                await player.send(f"{c['red']}No command group '{group}'.{c['reset']}")
+                return
+            try:
+                count = groups.reload(group)
+            except Exception as e:
+                logger.exception(f"Reloading command group {group} failed")
+                await player.send(f"{c['red']}Reload of {group} failed, keeping the old commands: "
+                                  f"{type(e).__name__}: {e}{c['reset']}")
+                return
+            cls.registry.rebuild(cls.ALIASES, cls.COMMAND_ALIASES)
+            await player.send(f"{c['bright_green']}Reloaded {group}: {count} names.{c['reset']}")
+            return
+
+        if args:
+            name = cls.registry.lookup(args[0].lower())
+            group = groups.group_of(f"cmd_{name}") if name else None
+            if group:
+                await player.send(f"{c['white']}{name}{c['reset']} is in {c['bright_cyan']}{group}{c['reset']}.")
+            else:
+                await player.send(f"{c['yellow']}No command '{args[0]}'.{c['reset']}")
+            return
+
+        await player.send(f"{c['bright_cyan']}=== Command Groups ==={c['reset']}")
+        for group, description in groups.groups.items():
+            count = sum(1 for g in groups.owner.values() if g == group)
+            state = f"{c['green']}loaded" if group in groups.loaded else f"{c['bright_black']}not loaded"
+            await player.send(f"  {c['white']}{group:<14}{c['reset']} {count:>3}  {state:<22}{c['reset']} {description}")
+        await player.send(f"  {len(groups.loaded)}/{len(groups.groups)} loaded")
+
+    @classmethod
+    async def cmd_cmdstats(cls, player: 'Player', args: List[str]):
+        """Per-command timings (immortal only).
+
+        Usage:
+            cmdstats [total|calls|avg|p50|p99|max|slow|alloc]  - Commands by time spent, etc.
+            cmdstats slowlog                                  - Recent slow commands
+            cmdstats alloc on|off                             - Peak allocation per command
+            cmdstats reset                                    - Start over
+        """
+        from command_stats import SORT_KEYS
+        c = player.config.COLORS
+
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+
+        stats = getattr(player.world, 'command_stats', None)
+        if not stats:
+            await player.send(f"{c['yellow']}Command statistics are not available here.{c['reset']}")
+            return
+
+        sub = args[0].lower() if args else 'total'
+        if sub == 'slowlog':
+            for line in stats.format_slow(c):
+                await player.send(line)
+            return
+        if sub == 'reset':
+            stats.reset()
+            await player.send(f"{c['bright_green']}Command statistics reset.{c['reset']}")
+            return
+        if sub == 'alloc' and len(args) > 1:
+            if args[1].lower() == 'on':
+                stats.start_alloc_tracking()
+                await player.send(f"{c['bright_green']}Allocation tracking on. The server runs slower "
+                                  f"until you turn it off.{c['reset']}")
+            elif args[1].lower() == 'off':
+                stats.stop_alloc_tracking()
+                await player.send(f"{c['bright_green']}Allocation tracking off.{c['reset']}")
+            else:
+                await player.send(f"{c['yellow']}Usage: cmdstats alloc on|off{c['reset']}")
+            return
+        if sub not in SORT_KEYS:
+            await player.send(f"{c['yellow']}Usage: cmdstats [{'|'.join(SORT_KEYS)}] | slowlog | "
+                              f"alloc on|off | reset{c['reset']}")
+            return
+
+        for line in stats.format_report(c, sub):
+            await player.send(line)
+
+    @classmethod
+    async def cmd_find(cls, player: 'Player', args: List[str]):
+        """Find a mob or object anywhere in the world (immortal only).
+        
+        Usage:
+            find mob <name>    - Find all mobs matching name
+            find obj <name>    - Find all objects matching name
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+        
+        if len(args) < 2:
+            await player.send(f"{c['yellow']}Usage: find <mob|obj> <name>{c['reset']}")
+            return
+        
+        search_type = args[0].lower()
+        search_name = ' '.join(args[1:]).lower()
+        
+        if search_type in ('mob', 'm'):
+            await player.send(f"{c['bright_cyan']}=== Mobs matching '{search_name}' ==={c['reset']}")
+            count = 0
+            # Search prototypes
+            for vnum, proto in player.world.mob_prototypes.items():
+                name = proto.get('name', '').lower()
+                if search_name in name:
+                    await player.send(f"  {c['yellow']}[{vnum}]{c['reset']} {c['white']}{proto.get('name')}{c['reset']} (prototype)")
+                    count += 1
+            # Search active mobs
+            for mob in player.world.npcs:
+                if search_name in mob.name.lower():
+                    room_vnum = mob.room.vnum if mob.room else 'None'
+                    await player.send(f"  {c['green']}[{mob.vnum}]{c['reset']} {c['white']}{mob.name}{c['reset']} @ room {room_vnum}")
+                    count += 1
+            await player.send(f"{c['cyan']}Found {count} matches.{c['reset']}")
+        
+        elif search_type in ('obj', 'o', 'object'):
+            await player.send(f"{c['bright_cyan']}=== Objects matching '{search_name}' ==={c['reset']}")
+            count = 0
+            # Search prototypes
+            for vnum, proto in player.world.obj_prototypes.items():
+                name = proto.get('name', proto.get('short_desc', '')).lower()
+                if search_name in name:
+                    await player.send(f"  {c['yellow']}[{vnum}]{c['reset']} {c['white']}{proto.get('name', proto.get('short_desc'))}{c['reset']} (prototype)")
+                    count += 1
+            await player.send(f"{c['cyan']}Found {count} matches.{c['reset']}")
+        
+        else:
+            await player.send(f"{c['yellow']}Usage: find <mob|obj> <name>{c['reset']}")
+
+    @classmethod
+    async def cmd_load(cls, player: 'Player', args: List[str]):
+        """Load a mob or object (immortal only).
+        
+        Usage:
+            load mob <vnum>       - Load a mob
+            load obj <vnum>       - Load an object to inventory
+            load obj <vnum> room  - Load an object to room
+        """
+        c = player.config.COLORS
+        
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
+            return
+        
+        if len(args) < 2:
+            await player.send(f"{c['yellow']}Usage: load <mob|obj> <vnum>{c['reset']}")
+            return
+        
+        load_type = args[0].lower()
+        
+        if load_type in ('mob', 'm'):
+            await cls.cmd_mload(player, args[1:])
+        elif load_type in ('obj', 'o', 'object'):
+            await cls.cmd_oload(player, args[1:])
+        else:
+            await player.send(f"{c['yellow']}Usage: load <mob|obj> <vnum>{c['reset']}")
+
+
+
+    @classmethod
+    async def cmd_wevent(cls, player: 'Player', args: List[str]):
+        """Immortal command to manage world events.
+        Usage: wevent start <type> | wevent stop [type] | wevent list | wevent log
+        Types: invasion, world_boss, treasure_hunt, double_xp, weather, storm, fog, blizzard
+        """
+        c = player.config.COLORS
+
+        if not player.is_immortal:
+            await player.send("Huh?!?")
+            return
+
+        em = getattr(player.world, 'event_manager', None)
+        if not em:
+            await player.send(f"{c['red']}Event system not initialized.{c['reset']}")
+            return
+
+        if not args:
+            await player.send(f"{c['yellow']}Usage: wevent start <type> | wevent stop [type] | wevent list | wevent log{c['reset']}")
+            await player.send(f"{c['white']}Types: invasion, world_boss, treasure_hunt, double_xp, weather, storm, fog, blizzard{c['reset']}")
+            return
+
+        sub = args[0].lower()
+
+        if sub == 'start':
+            if len(args) < 2:
+                await player.send(f"{c['yellow']}Usage: wevent start <type>{c['reset']}")
+                await player.send(f"{c['white']}Types: invasion, world_boss, treasure_hunt, double_xp, weather, storm, fog, blizzard{c['reset']}")
+                return
+            event_type = args[1].lower()
+            event = await em.start_event(event_type)
+            if event:
+                await player.send(f"{c['bright_green']}Started {event.event_type} event!{c['reset']}")
+            else:
+                await player.send(f"{c['red']}Failed to start event. Unknown type or duplicate already active.{c['reset']}")
+
+        elif sub == 'stop':
+            event_type = args[1].lower() if len(args) > 1 else None
+            stopped = await em.stop_event(event_type)
+            if stopped:
+                await player.send(f"{c['bright_green']}Event(s) stopped.{c['reset']}")
+            else:
+                await player.send(f"{c['yellow']}No matching active events to stop.{c['reset']}")
+
+        elif sub == 'list':
+            summaries = em.get_active_summaries()
+            if not summaries:
+                await player.send(f"{c['cyan']}No active events.{c['reset']}")
+            else:
+                await player.send(f"\n{c['bright_cyan']}═══ Active World Events ═══{c['reset']}")
+                for s in summaries:
+                    await player.send(f"  {c['bright_white']}{s}{c['reset']}")
+
+        elif sub == 'log':
+            log = em.get_log(20)
+            if not log:
+                await player.send(f"{c['cyan']}No event history yet.{c['reset']}")
+            else:
+                await player.send(f"\n{c['bright_cyan']}═══ Event History (last 20) ═══{c['reset']}")
+                import datetime
+                for entry in reversed(log):
+                    ts = datetime.datetime.fromtimestamp(entry['time']).strftime('%H:%M:%S')
+                    await player.send(f"  {c['white']}[{ts}] {entry['type']} — {entry['status']}{c['reset']}")
+
+        else:
+            await player.send(f"{c['yellow']}Usage: wevent start <type> | wevent stop [type] | wevent list | wevent log{c['reset']}")
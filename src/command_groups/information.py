@@ -0,0 +1,1847 @@
+"""
+Misthollow Information Commands
+==============================
+Looking around, character info, help, news and world events.
+"""
+
+import random
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class InformationCommands:
+    """Information commands."""
+
+    @classmethod
+    async def cmd_look(cls, player: 'Player', args: List[str]):
+        """Look at the room or something."""
+        await player.do_look(args)
+
+    @classmethod
+    async def cmd_exits(cls, player: 'Player', args: List[str]):
+        """Show available exits from the current room with descriptions."""
+        c = player.config.COLORS
+
+        if not player.room:
+            await player.send("You are nowhere!")
+            return
+
+        visible_exits = player.room.get_visible_exits(player) if player.room else {}
+        if not visible_exits:
+            await player.send(f"{c['yellow']}There are no obvious exits.{c['reset']}")
+            return
+
+        await player.send(f"\n{c['cyan']}Obvious exits:{c['reset']}")
+
+        has_exits = False
+        for direction, exit_data in visible_exits.items():
+            if exit_data:
+                has_exits = True
+                # Get description if available
+                desc = exit_data.get('description', '')
+
+                # Check for door
+                door_info = ""
+                if 'door' in exit_data:
+                    door = exit_data['door']
+                    door_name = door.get('name', 'door')
+                    state = door.get('state', 'open')
+                    locked = door.get('locked', False)
+                    if state == 'closed':
+                        if locked:
+                            door_info = f" {c['red']}[{door_name}, closed, locked]{c['reset']}"
+                        else:
+                            door_info = f" {c['yellow']}[{door_name}, closed]{c['reset']}"
+                    else:
+                        door_info = f" {c['green']}[{door_name}]{c['reset']}"
+
+                # Format exit line
+                if desc:
+                    await player.send(f"  {c['bright_green']}{direction:8}{c['white']} - {desc}{door_info}{c['reset']}")
+                else:
+                    await player.send(f"  {c['bright_green']}{direction:8}{door_info}{c['reset']}")
+
+        if not has_exits:
+            await player.send(f"{c['yellow']}There are no obvious exits.{c['reset']}")
+
+    @classmethod
+    async def cmd_search(cls, player: 'Player', args: List[str]):
+        """Search the room for hidden exits or items."""
+        if not player.room:
+            await player.send("You are nowhere!")
+            return
+
+        c = player.config.COLORS
+        room = player.room
+
+        # Too dark to search without light or infravision
+        game_time = player.world.game_time if hasattr(player, 'world') and player.world else None
+        if room.is_dark(game_time) and not player.can_see_in_dark():
+            await player.send(f"{c['blue']}It is too dark to search here.{c['reset']}")
+            return
+
+        # Small movement cost
+        if player.move < 2:
+            await player.send("You are too exhausted to search.")
+            return
+        player.move -= 2
+
+        # Perception-style score
+        perception_bonus = player.level * 2
+        perception_bonus += (player.wis - 10) * 3
+        int_bonus = player.get_soulstone_bonus_int() if hasattr(player, 'get_soulstone_bonus_int') else 0
+        perception_bonus += ((player.int + int_bonus) - 10) * 2
+        perception_bonus += (player.dex - 10)
+        perception_bonus += player.skills.get('detect_traps', 0) // 10
+
+        found_any = False
+        found_messages = []
+
+        # Hidden exits
+        for direction, exit_data in room.exits.items():
+            if not exit_data or not exit_data.get('hidden'):
+                continue
+            if (room.vnum, direction) in getattr(player, 'discovered_exits', set()):
+                continue
+
+            # Requirements
+            if exit_data.get('requires_light') and not player.has_light_source():
+                continue
+            if exit_data.get('requires_detect_magic') and 'detect_magic' not in getattr(player, 'affect_flags', set()):
+                continue
+
+            difficulty = exit_data.get('search_difficulty', 60)
+            roll = random.randint(1, 100) + perception_bonus
+            if roll >= difficulty:
+                player.discovered_exits.add((room.vnum, direction))
+                found_any = True
+                found_messages.append(exit_data.get('reveal_message') or f"You discover a hidden exit {direction}!")
+
+                if exit_data.get('secret'):
+                    from achievements import AchievementManager
+                    await AchievementManager.record_secret_found(player, exit_data.get('to_room', room.vnum))
+                    if hasattr(player, 'add_journal_entry'):
+                        player.add_journal_entry(f"Discovered a secret passage {direction} in {room.name}.", category='secret')
+
+        # Hidden items
+        if room.hidden_items:
+            from objects import create_object
+            for hidden in list(room.hidden_items):
+                if hidden.get('requires_light') and not player.has_light_source():
+                    continue
+                if hidden.get('requires_detect_magic') and 'detect_magic' not in getattr(player, 'affect_flags', set()):
+                    continue
+
+                difficulty = hidden.get('search_difficulty', 60)
+                roll = random.randint(1, 100) + perception_bonus
+                if roll >= difficulty:
+                    obj = create_object(hidden.get('vnum'), player.world)
+                    if obj:
+                        room.items.append(obj)
+                        room.hidden_items.remove(hidden)
+                        found_any = True
+                        found_messages.append(hidden.get('reveal_message') or f"You uncover {obj.short_desc}!")
+                        if getattr(obj, 'lore_id', None):
+                            if hasattr(player, 'add_journal_entry'):
+                                player.add_journal_entry(f"Recovered lore item: {obj.lore_title or obj.short_desc}.", category='lore')
+
+        if found_messages:
+            for msg in found_messages:
+                await player.send(f"{c['bright_green']}{msg}{c['reset']}")
+            return
+
+        if not found_any:
+            await player.send(f"{c['yellow']}You find nothing out of the ordinary.{c['reset']}")
+
+    @classmethod
+    async def cmd_answer(cls, player: 'Player', args: List[str]):
+        """Answer a riddle puzzle in the room."""
+        if not args:
+            await player.send("Answer what?")
+            return
+        from puzzles import PuzzleManager
+        await PuzzleManager.handle_answer(player, ' '.join(args))
+
+    @classmethod
+    async def cmd_pull(cls, player: 'Player', args: List[str]):
+        """Pull a lever for lever puzzles."""
+        if not args:
+            await player.send("Pull what?")
+            return
+        from puzzles import PuzzleManager
+        await PuzzleManager.handle_pull(player, ' '.join(args))
+
+    @classmethod
+    async def cmd_push(cls, player: 'Player', args: List[str]):
+        """Push a symbol or object for puzzle interactions."""
+        if not args:
+            await player.send("Push what?")
+            return
+        from puzzles import PuzzleManager
+        await PuzzleManager.handle_push(player, ' '.join(args))
+
+    @classmethod
+    async def cmd_hint(cls, player: 'Player', args: List[str]):
+        """Show a hint for your current tutorial quest objective, or a puzzle hint."""
+        c = player.config.COLORS
+        # Check for active tutorial quest first
+        tutorial_quest = None
+        for quest in getattr(player, 'active_quests', []):
+            if quest.quest_id.startswith('tutorial_'):
+                tutorial_quest = quest
+                break
+        
+        if tutorial_quest:
+            from quests import QUEST_DEFINITIONS
+            quest_def = QUEST_DEFINITIONS.get(tutorial_quest.quest_id, {})
+            await player.send(f"\r\n{c['bright_cyan']}═══ Quest Hint: {tutorial_quest.name} ═══{c['reset']}")
+            await player.send(f"{c['white']}{quest_def.get('description', tutorial_quest.description)}{c['reset']}\r\n")
+            await player.send(f"{c['yellow']}Current objectives:{c['reset']}")
+            for obj in tutorial_quest.objectives:
+                if not obj.completed:
+                    status = f"({obj.current}/{obj.required})"
+                    await player.send(f"  {c['bright_white']}→ {obj.description} {status}{c['reset']}")
+                else:
+                    await player.send(f"  {c['green']}✓ {obj.description}{c['reset']}")
+            await player.send("")
+            return
+        
+        # Fall back to puzzle hints if no tutorial quest
+        if not getattr(player, 'active_quests', []):
+            await player.send(f"{c['white']}You have no active objectives. Try 'quests' to see available quests.{c['reset']}")
+            return
+        
+        from puzzles import PuzzleManager
+        await PuzzleManager.request_hint(player)
+
+    @classmethod
+    async def cmd_collections(cls, player: 'Player', args: List[str]):
+        """View collection progress."""
+        from collection_system import CollectionManager
+        lines = CollectionManager.render_collections(player)
+        for line in lines:
+            await player.send(line)
+
+    @classmethod
+    async def cmd_read(cls, player: 'Player', args: List[str]):
+        """Read a book, scroll, or readable item."""
+        if not args:
+            await player.send("Read what?")
+            return
+
+        target_name = ' '.join(args).lower()
+        item = None
+
+        # Check inventory and room
+        for candidate in player.inventory + (player.room.items if player.room else []):
+            if target_name in candidate.name.lower() or target_name in candidate.short_desc.lower():
+                item = candidate
+                break
+
+        if not item:
+            await player.send("You don't see that here.")
+            return
+
+        text = getattr(item, 'lore_text', None) or getattr(item, 'readable_text', None)
+        if not text:
+            await player.send("You can't read that.")
+            return
+
+        c = player.config.COLORS
+
+        # Recipe scroll: learn the recipe
+        if 'recipe_scroll' in getattr(item, 'flags', set()):
+            from crafting import handle_recipe_scroll
+            await handle_recipe_scroll(player, item)
+            return
+
+        await player.send(f"{c['bright_cyan']}{item.lore_title or item.short_desc}{c['reset']}")
+        await player.send(f"{c['white']}{text}{c['reset']}")
+
+        # Track lore discovery
+        lore_id = getattr(item, 'lore_id', None)
+        if lore_id:
+            if lore_id not in getattr(player, 'discovered_lore', set()):
+                player.discovered_lore.add(lore_id)
+                if hasattr(player, 'lore_catalog'):
+                    player.lore_catalog[lore_id] = item.lore_title or item.short_desc
+                from achievements import AchievementManager
+                await AchievementManager.record_lore_found(player, item)
+                
+                # Add to discovery journal
+                try:
+                    from journal import JournalManager
+                    lore_title = item.lore_title or item.short_desc
+                    await JournalManager.discover_lore(
+                        player, lore_id, lore_title, text
+                    )
+                except Exception:
+                    pass
+
+    @classmethod
+    async def cmd_lore(cls, player: 'Player', args: List[str]):
+        """Review discovered lore."""
+        c = player.config.COLORS
+        discovered = getattr(player, 'discovered_lore', set())
+        if not discovered:
+            await player.send("You haven't discovered any lore yet.")
+            return
+
+        # Build zone totals from world prototypes
+        zone_totals = {}
+        zone_discovered = {}
+        lore_lookup = {}
+        if hasattr(player, 'world') and player.world:
+            for proto in player.world.obj_prototypes.values():
+                lore_id = proto.get('lore_id')
+                lore_zone = proto.get('lore_zone')
+                lore_title = proto.get('lore_title') or proto.get('short_desc')
+                if lore_id:
+                    lore_lookup[lore_id] = (lore_zone, lore_title)
+                if lore_id and lore_zone is not None:
+                    zone_totals.setdefault(lore_zone, set()).add(lore_id)
+
+        for lore_id in discovered:
+            lore_zone = lore_lookup.get(lore_id, (None, None))[0]
+            zone_discovered.setdefault(lore_zone, set()).add(lore_id)
+
+        await player.send(f"{c['cyan']}Discovered Lore:{c['reset']}")
+        for lore_id in sorted(discovered):
+            title = getattr(player, 'lore_catalog', {}).get(lore_id, lore_id)
+            await player.send(f"  {c['bright_green']}- {title}{c['reset']}")
+
+        if zone_totals:
+            await player.send(f"\n{c['cyan']}Lore Progress by Zone:{c['reset']}")
+            for zone_id, total_ids in zone_totals.items():
+                found = len(zone_discovered.get(zone_id, set()))
+                total = len(total_ids)
+                percent = int((found / total) * 100) if total else 0
+                await player.send(f"  {c['bright_yellow']}Zone {zone_id}:{c['reset']} {found}/{total} ({percent}%)")
+
+    @classmethod
+    async def cmd_journal(cls, player: 'Player', args: List[str]):
+        """Review your discovery journal.
+        
+        Usage:
+            journal              - Show journal overview and recent entries
+            journal stats        - Show discovery statistics
+            journal lore         - Show lore entries
+            journal secrets      - Show discovered secrets
+            journal npcs         - Show NPCs you've met
+            journal areas        - Show discovered areas
+            journal read <num>   - Read a specific entry
+            journal all          - Show all entries
+        """
+        from journal import JournalManager
+        
+        c = player.config.COLORS
+        stats = JournalManager.get_stats(player)
+        
+        sub = args[0].lower() if args else None
+        
+        if sub == 'stats':
+            # Detailed statistics
+            explored_total = len(getattr(player, 'explored_rooms', set()))
+            total_rooms = len(player.world.rooms) if hasattr(player, 'world') and player.world else 0
+            overall_pct = int((explored_total / total_rooms) * 100) if total_rooms else 0
+            
+            await player.send(f"\r\n{c['bright_cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
+            await player.send(f"{c['bright_cyan']}║{c['reset']}            📖 {c['bright_yellow']}DISCOVERY JOURNAL - STATISTICS{c['reset']}             {c['bright_cyan']}║{c['reset']}")
+            await player.send(f"{c['bright_cyan']}╠══════════════════════════════════════════════════════════════╣{c['reset']}")
+            await player.send(f"{c['bright_cyan']}║{c['reset']}                                                              {c['bright_cyan']}║{c['reset']}")
+            await player.send(f"{c['bright_cyan']}║{c['reset']}  {c['white']}🗺️  Rooms Explored:{c['reset']} {explored_total}/{total_rooms} ({overall_pct}%)                     {c['bright_cyan']}║{c['reset']}")
+            await player.send(f"{c['bright_cyan']}║{c['reset']}  {c['white']}📜 Lore Discovered:{c['reset']} {stats['lore_discovered']:<5}                               {c['bright_cyan']}║{c['reset']}")
+            await player.send(f"{c['bright_cyan']}║{c['reset']}  {c['white']}🔮 Secrets Found:{c['reset']}   {stats['secrets_found']:<5}                               {c['bright_cyan']}║{c['reset']}")
+            await player.send(f"{c['bright_cyan']}║{c['reset']}  {c['white']}👤 NPCs Met:{c['reset']}        {stats['npcs_met']:<5}                               {c['bright_cyan']}║{c['reset']}")
+            await player.send(f"{c['bright_cyan']}║{c['reset']}  {c['white']}🌍 Areas Found:{c['reset']}     {stats['areas_discovered']:<5}                               {c['bright_cyan']}║{c['reset']}")
+            await player.send(f"{c['bright_cyan']}║{c['reset']}                                                              {c['bright_cyan']}║{c['reset']}")
+            await player.send(f"{c['bright_cyan']}║{c['reset']}  {c['white']}📝 Total Entries:{c['reset']}   {stats['total_entries']:<5}                               {c['bright_cyan']}║{c['reset']}")
+            if stats['unread'] > 0:
+                await player.send(f"{c['bright_cyan']}║{c['reset']}  {c['bright_yellow']}📬 Unread:{c['reset']}          {stats['unread']:<5}                               {c['bright_cyan']}║{c['reset']}")
+            await player.send(f"{c['bright_cyan']}║{c['reset']}                                                              {c['bright_cyan']}║{c['reset']}")
+            await player.send(f"{c['bright_cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}\r\n")
+            return
+        
+        # Filter by category
+        category_map = {
+            'lore': 'lore',
+            'secrets': 'secret',
+            'secret': 'secret',
+            'npcs': 'npc',
+            'npc': 'npc',
+            'areas': 'area',
+            'area': 'area',
+            'quests': 'quest',
+            'quest': 'quest',
+            'achievements': 'achievement',
+            'achievement': 'achievement',
+        }
+        
+        category = category_map.get(sub) if sub else None
+        
+        if sub == 'read' and len(args) > 1:
+            try:
+                idx = int(args[1]) - 1
+                entries = JournalManager.get_entries(player)
+                if 0 <= idx < len(entries):
+                    entry = entries[idx]
+                    entry.read = True
+                    
+                    cat_color = JournalManager.CATEGORY_COLORS.get(entry.category, 'white')
+                    icon = JournalManager.CATEGORY_ICONS.get(entry.category, '📝')
+                    
+                    await player.send(f"\r\n{c[cat_color]}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
+                    await player.send(f"{c[cat_color]}║{c['reset']}  {icon} {c['bright_yellow']}{entry.title[:52]:<52}{c['reset']}  {c[cat_color]}║{c['reset']}")
+                    await player.send(f"{c[cat_color]}╠══════════════════════════════════════════════════════════════╣{c['reset']}")
+                    
+                    # Word wrap content
+                    words = entry.content.split()
+                    line = ""
+                    for word in words:
+                        if len(line) + len(word) + 1 <= 56:
+                            line = line + " " + word if line else word
+                        else:
+                            await player.send(f"{c[cat_color]}║{c['reset']}  {c['white']}{line:<56}{c['reset']}  {c[cat_color]}║{c['reset']}")
+                            line = word
+                    if line:
+                        await player.send(f"{c[cat_color]}║{c['reset']}  {c['white']}{line:<56}{c['reset']}  {c[cat_color]}║{c['reset']}")
+                    
+                    await player.send(f"{c[cat_color]}╚══════════════════════════════════════════════════════════════╝{c['reset']}\r\n")
+                else:
+                    await player.send(f"{c['red']}Invalid entry number.{c['reset']}")
+            except ValueError:
+                await player.send(f"{c['red']}Usage: journal read <number>{c['reset']}")
+            return
+        
+        # Get entries (filtered or all)
+        limit = None if sub == 'all' else 10
+        entries = JournalManager.get_entries(player, category=category, limit=limit)
+        
+        # Header
+        title = "DISCOVERY JOURNAL"
+        if category:
+            title = f"JOURNAL - {category.upper()}"
+        
+        await player.send(f"\r\n{c['bright_cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
+        await player.send(f"{c['bright_cyan']}║{c['reset']}            📖 {c['bright_yellow']}{title:^40}{c['reset']}      {c['bright_cyan']}║{c['reset']}")
+        await player.send(f"{c['bright_cyan']}╠══════════════════════════════════════════════════════════════╣{c['reset']}")
+        
+        if not entries:
+            await player.send(f"{c['bright_cyan']}║{c['reset']}  {c['yellow']}No entries yet. Explore the world to fill your journal!{c['reset']}   {c['bright_cyan']}║{c['reset']}")
+        else:
+            for i, entry in enumerate(entries, 1):
+                icon = JournalManager.CATEGORY_ICONS.get(entry.category, '📝')
+                cat_color = JournalManager.CATEGORY_COLORS.get(entry.category, 'white')
+                unread = "" if entry.read else f"{c['bright_yellow']}*{c['reset']}"
+                title_display = entry.title[:45]
+                await player.send(f"{c['bright_cyan']}║{c['reset']}  {c['white']}{i:>2}.{c['reset']} {icon} {c[cat_color]}{title_display:<45}{c['reset']} {unread} {c['bright_cyan']}║{c['reset']}")
+        
+        await player.send(f"{c['bright_cyan']}╠══════════════════════════════════════════════════════════════╣{c['reset']}")
+        await player.send(f"{c['bright_cyan']}║{c['reset']}  {c['cyan']}Commands: journal stats | lore | secrets | read <#>{c['reset']}       {c['bright_cyan']}║{c['reset']}")
+        await player.send(f"{c['bright_cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}\r\n")
+        
+        # Mark all as read if viewing
+        JournalManager.mark_read(player)
+
+    @classmethod
+    async def cmd_weather(cls, player: 'Player', args: List[str]):
+        """Check the current weather."""
+        c = player.config.COLORS
+
+        if not player.room or not player.room.zone:
+            await player.send("You can't sense any weather here.")
+            return
+
+        # Get zone weather
+        weather = player.room.zone.weather
+        game_time = player.world.game_time if hasattr(player, 'world') and player.world else None
+
+        # Display weather information
+        await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
+        await player.send(f"{c['cyan']}║{c['bright_yellow']} Weather Conditions{c['cyan']}                                            ║{c['reset']}")
+        await player.send(f"{c['cyan']}╠══════════════════════════════════════════════════════════════╣{c['reset']}")
+
+        # Weather description
+        desc = weather.get_weather_desc()
+        await player.send(f"{c['cyan']}║ {c['white']}{desc:<59}{c['cyan']}║{c['reset']}")
+        await player.send(f"{c['cyan']}╠══════════════════════════════════════════════════════════════╣{c['reset']}")
+
+        # Temperature
+        temp_f = weather.temperature
+        temp_c = int((temp_f - 32) * 5 / 9)
+        await player.send(f"{c['cyan']}║ {c['white']}Temperature: {temp_f}°F ({temp_c}°C){c['cyan']}                                      ║{c['reset']}")
+
+        # Wind
+        wind_desc = "calm"
+        if weather.wind_speed > 25:
+            wind_desc = "strong gale"
+        elif weather.wind_speed > 15:
+            wind_desc = "steady wind"
+        elif weather.wind_speed > 8:
+            wind_desc = "light breeze"
+        await player.send(f"{c['cyan']}║ {c['white']}Wind: {wind_desc} ({weather.wind_speed} mph){c['cyan']}                                     ║{c['reset']}")
+
+        # Time and season
+        if game_time:
+            season = game_time.get_season()
+            time_str = game_time.get_short_time_string()
+            await player.send(f"{c['cyan']}║ {c['white']}Time: {time_str} ({season}){c['cyan']}                                    ║{c['reset']}")
+
+        await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}\r\n")
+
+    @classmethod
+    async def cmd_score(cls, player: 'Player', args: List[str]):
+        """Show player stats."""
+        c = player.config.COLORS
+        race_info = player.config.RACES.get(player.race, {})
+        class_info = player.config.CLASSES.get(player.char_class, {})
+        
+        # Check for ASCII mode
+        use_ascii = getattr(player, 'ascii_ui', False)
+        
+        # Box drawing characters (ASCII or Unicode)
+        if use_ascii:
+            TL, TR, BL, BR = '+', '+', '+', '+'
+            H, V = '-', '|'
+            LT, RT, TT, BT = '+', '+', '+', '+'
+        else:
+            TL, TR, BL, BR = '╔', '╗', '╚', '╝'
+            H, V = '═', '║'
+            LT, RT, TT, BT = '╠', '╣', '╦', '╩'
+        
+        W = 64  # Width of box interior
+        
+        await player.send(f"{c['cyan']}{TL}{H*W}{TR}{c['reset']}")
+        await player.send(f"{c['cyan']}{V}{c['bright_yellow']} {player.name} {player.title:<52}{c['cyan']}{V}{c['reset']}")
+        await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
+        from prestige import get_class_display
+        display_class = get_class_display(player)
+        await player.send(f"{c['cyan']}{V} {c['white']}Race: {race_info.get('name', player.race):<12} Class: {display_class:<12} Level: {player.level:<3}{c['cyan']}    {V}{c['reset']}")
+        await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
+        # Calculate effective max values with equipment bonuses
+        eff_max_hp = player.max_hp + player.get_equipment_bonus('hp')
+        eff_max_mana = player.max_mana + player.get_equipment_bonus('mana')
+        eff_max_move = player.max_move + player.get_equipment_bonus('move')
+        await player.send(f"{c['cyan']}{V} {c['bright_red']}HP: {player.hp:>4}/{eff_max_hp:<4}{c['cyan']}  {c['bright_cyan']}Mana: {player.mana:>4}/{eff_max_mana:<4}{c['cyan']}  {c['bright_yellow']}Move: {player.move:>4}/{eff_max_move:<4}{c['cyan']}   {V}{c['reset']}")
+        await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
+        # Calculate stat bonuses from equipment
+        def stat_display(base, stat_name):
+            bonus = player.get_equipment_bonus(stat_name)
+            soulstone = player.get_soulstone_bonus_int() if stat_name == 'int' and hasattr(player, 'get_soulstone_bonus_int') else 0
+            total_bonus = bonus + soulstone
+            if total_bonus > 0:
+                return f"{base:>2}(+{total_bonus})"
+            elif total_bonus < 0:
+                return f"{base:>2}({total_bonus})"
+            return f"{base:>2}"
+        str_d = stat_display(player.str, 'str')
+        int_d = stat_display(player.int, 'int')
+        wis_d = stat_display(player.wis, 'wis')
+        dex_d = stat_display(player.dex, 'dex')
+        con_d = stat_display(player.con, 'con')
+        cha_d = stat_display(player.cha, 'cha')
+        await player.send(f"{c['cyan']}{V} {c['white']}Str:{str_d:<7} Int:{int_d:<7} Wis:{wis_d:<7} Dex:{dex_d:<7} Con:{con_d:<7} Cha:{cha_d:<5}{c['cyan']}{V}{c['reset']}")
+        await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
+        await player.send(f"{c['cyan']}{V} {c['bright_green']}Experience: {player.exp:<10}{c['cyan']} {c['bright_yellow']}Gold: {player.gold:<10}{c['cyan']} {c['white']}Practices: {player.practices:<3}{c['cyan']}  {V}{c['reset']}")
+        await player.send(f"{c['cyan']}{V} {c['white']}To next level: {player.exp_to_level() - player.exp:<10}{c['cyan']}                              {V}{c['reset']}")
+        await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
+        # Calculate hitroll/damroll with equipment bonuses
+        total_hitroll = player.hitroll + player.get_equipment_bonus('hitroll')
+        total_damroll = player.damroll + player.get_equipment_bonus('damroll')
+        await player.send(f"{c['cyan']}{V} {c['white']}Armor Class: {player.get_armor_class():<4}  Hitroll: {total_hitroll:>+3}  Damroll: {total_damroll:>+3}{c['cyan']}            {V}{c['reset']}")
+        # OB/DB/PB quick tactical readout
+        ob = player.get_hit_bonus()
+        db_info = player.get_db_breakdown() if hasattr(player, 'get_db_breakdown') else {'total': (100 - player.get_armor_class())}
+        pb_info = player.get_pb_breakdown() if hasattr(player, 'get_pb_breakdown') else {'total': int(getattr(player, 'damage_reduction', 0))}
+        db = db_info.get('total', 0)
+        pb = pb_info.get('total', 0)
+        await player.send(f"{c['cyan']}{V} {c['white']}Combat: OB {ob:>+3}  DB {db:>+3}  PB {pb:>2}%{c['cyan']}                     {V}{c['reset']}")
+        db_break = f"base {db_info.get('base',0):+d} st {db_info.get('stance',0):+d} sh {db_info.get('shield',0):+d} dg {db_info.get('dodge_skill',0):+d}/{db_info.get('dodge_item',0):+d} wt -{db_info.get('weight_penalty',0)}"
+        pb_break = f"base {pb_info.get('base',0):+d} st {pb_info.get('stance',0):+d} pa {pb_info.get('parry',0):+d} sb {pb_info.get('shield_block',0):+d} wt -{pb_info.get('weight_penalty',0)}"
+        await player.send(f"{c['cyan']}{V} {c['bright_black']}DB:{db_break[:50]:<50}{c['cyan']}{V}{c['reset']}")
+        await player.send(f"{c['cyan']}{V} {c['bright_black']}PB:{pb_break[:50]:<50}{c['cyan']}{V}{c['reset']}")
+        mood = getattr(player, 'stance', 'normal')
+        wimpy = int(getattr(player, 'wimpy', 0))
+        await player.send(f"{c['cyan']}{V} {c['white']}Mood: {c['bright_cyan']}{mood:<10}{c['white']} Wimpy: {wimpy:<4}{c['cyan']}                       {V}{c['reset']}")
+
+        # Show hunger and thirst status
+        hunger_cond = player.get_hunger_condition()
+        thirst_cond = player.get_thirst_condition()
+        hunger_color = c['red'] if player.hunger <= 3 else c['yellow'] if player.hunger <= 6 else c['green']
+        thirst_color = c['red'] if player.thirst <= 3 else c['yellow'] if player.thirst <= 6 else c['green']
+
+        await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
+        sneak_status = f"{c['bright_black']}SNEAKING{c['reset']}" if 'sneaking' in player.flags else f"{c['white']}--{c['reset']}"
+        per = player.get_perception() if hasattr(player, 'get_perception') else 0
+        await player.send(f"{c['cyan']}{V} {c['white']}Hunger: {hunger_color}{hunger_cond:<12}{c['white']}  Thirst: {thirst_color}{thirst_cond:<12}{c['white']}  Stealth: {sneak_status}  PER: {per:<2}{c['cyan']}{V}{c['reset']}")
+
+        # Show active affects/buffs/debuffs
+        if player.affects:
+            await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
+            await player.send(f"{c['cyan']}{V} {c['bright_cyan']}Active Effects:{c['reset']}                                            {c['cyan']}{V}{c['reset']}")
+
+            for affect in player.affects:
+                # Determine if it's a buff (positive) or debuff (negative)
+                is_debuff = affect.name.lower() in ['poison', 'blindness', 'weaken', 'sleep', 'fear', 'curse']
+                affect_color = c['red'] if is_debuff else c['bright_green']
+
+                # Format the affect display
+                duration_str = f"{affect.remaining}t"  # 't' for ticks
+                affect_desc = f"{affect.name}"
+
+                # Add effect details based on type
+                if affect.type == 'modify_stat':
+                    if affect.value > 0:
+                        effect_str = f"+{affect.value} {affect.applies_to}"
+                    else:
+                        effect_str = f"{affect.value} {affect.applies_to}"
+                    affect_desc = f"{affect.name} ({effect_str})"
+                elif affect.type == 'flag':
+                    affect_desc = f"{affect.name}"
+                elif affect.type == 'dot':
+                    affect_desc = f"{affect.name} ({affect.value} dmg/tick)"
+                elif affect.type == 'hot':
+                    affect_desc = f"{affect.name} ({affect.value} hp/tick)"
+
+                # Truncate if too long
+                if len(affect_desc) > 45:
+                    affect_desc = affect_desc[:42] + "..."
+
+                await player.send(f"{c['cyan']}{V}  {affect_color}* {affect_desc:<43}{c['white']}[{duration_str:>5}]{c['cyan']} {V}{c['reset']}")
+
+        # Necromancer-specific info
+        if player.char_class == 'necromancer':
+            has_necro_info = False
+            
+            # Soul fragments
+            fragments = getattr(player, 'soul_fragments', 0)
+            if fragments > 0:
+                if not has_necro_info:
+                    await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
+                    await player.send(f"{c['cyan']}{V} {c['bright_magenta']}Necromancer:{c['reset']}                                               {c['cyan']}{V}{c['reset']}")
+                    has_necro_info = True
+                
+                import time
+                expires = getattr(player, 'soul_fragment_expires', 0)
+                remaining = max(0, int(expires - time.time()))
+                await player.send(f"{c['cyan']}{V}  {c['bright_cyan']}Soul Fragments: {fragments}/5{c['white']}  (-10% mana cost, +20% pet duration){c['cyan']} {V}{c['reset']}")
+                if remaining > 0:
+                    await player.send(f"{c['cyan']}{V}  {c['yellow']}Expires in: {remaining}s{c['cyan']}                                          {V}{c['reset']}")
+            
+            # Ritual status
+            if getattr(player, 'channeling_ritual', False):
+                if not has_necro_info:
+                    await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
+                    await player.send(f"{c['cyan']}{V} {c['bright_magenta']}Necromancer:{c['reset']}                                               {c['cyan']}{V}{c['reset']}")
+                    has_necro_info = True
+                duration = getattr(player, 'ritual_duration', 0)
+                await player.send(f"{c['cyan']}{V}  {c['bright_green']}Dark Ritual ACTIVE{c['white']} - {duration} rounds remaining{c['cyan']}              {V}{c['reset']}")
+            
+            # Ritual cooldown
+            cooldown_end = getattr(player, 'dark_ritual_cooldown', 0)
+            import time
+            now = time.time()
+            if cooldown_end > now:
+                if not has_necro_info:
+                    await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
+                    await player.send(f"{c['cyan']}{V} {c['bright_magenta']}Necromancer:{c['reset']}                                               {c['cyan']}{V}{c['reset']}")
+                    has_necro_info = True
+                remaining = int(cooldown_end - now)
+                await player.send(f"{c['cyan']}{V}  {c['red']}Dark Ritual on cooldown: {remaining}s{c['cyan']}                           {V}{c['reset']}")
+
+        await player.send(f"{c['cyan']}{BL}{H*W}{BR}{c['reset']}")
+        
+    @classmethod
+    @classmethod
+    async def cmd_inspect(cls, player: 'Player', args: List[str]):
+        """Inspect an item in detail — shows rarity, procs, lore, drop source.
+        
+        Usage: inspect <item>
+        """
+        if not args:
+            await player.send("Inspect what?")
+            return
+        target_name = ' '.join(args).lower()
+        item = None
+        for candidate in player.inventory + list(player.equipment.values()) + (player.room.items if player.room else []):
+            if candidate and (target_name in getattr(candidate, 'name', '').lower() or target_name in getattr(candidate, 'short_desc', '').lower()):
+                item = candidate
+                break
+        if not item:
+            await player.send("You don't see that here.")
+            return
+        try:
+            from legendary import format_inspect
+            lines = format_inspect(item, player.config)
+            for line in lines:
+                await player.send(line)
+        except Exception:
+            await player.send(item.get_description())
+
+    @classmethod
+    async def cmd_inventory(cls, player: 'Player', args: List[str]):
+        """Show inventory."""
+        c = player.config.COLORS
+        await player.send(f"{c['cyan']}You are carrying:{c['reset']}")
+        
+        if not player.inventory:
+            await player.send(f"  {c['white']}Nothing.{c['reset']}")
+        else:
+            from legendary import colorize_item_name
+            for item in player.inventory:
+                await player.send(f"  {colorize_item_name(item, player.config)}")
+
+        try:
+            from tips import TipManager
+            await TipManager.show_tutorial_hint(player, 'tutorial_inventory')
+        except Exception:
+            pass
+
+    @classmethod
+    async def cmd_clear(cls, player: 'Player', args: List[str]):
+        """Clear the screen.
+        
+        Usage: clear
+        """
+        # Send ANSI clear screen sequence
+        await player.send("\033[2J\033[H")
+
+    @classmethod
+    async def cmd_worth(cls, player: 'Player', args: List[str]):
+        """Show your total wealth breakdown.
+        
+        Usage: worth
+        """
+        c = player.config.COLORS
+        
+        # Gold on hand
+        gold_carried = player.gold
+        
+        # Gold in bank
+        bank_gold = getattr(player, 'bank_gold', 0)
+        
+        # Value of inventory items
+        inv_value = 0
+        for item in player.inventory:
+            inv_value += getattr(item, 'value', 0)
+        
+        # Value of equipped items
+        eq_value = 0
+        for slot, item in player.equipment.items():
+            if item:
+                eq_value += getattr(item, 'value', 0)
+        
+        # Value of storage
+        storage_value = 0
+        for item in getattr(player, 'storage', []):
+            storage_value += getattr(item, 'value', 0)
+        
+        total = gold_carried + bank_gold + inv_value + eq_value + storage_value
+        
+        await player.send(f"\n{c['bright_cyan']}═══════════════════════════════════════{c['reset']}")
+        await player.send(f"{c['bright_yellow']}          💰 Your Worth 💰{c['reset']}")
+        await player.send(f"{c['bright_cyan']}═══════════════════════════════════════{c['reset']}")
+        await player.send(f"{c['white']}  Gold carried:    {c['bright_yellow']}{gold_carried:>12,}{c['reset']}")
+        if bank_gold > 0:
+            await player.send(f"{c['white']}  Gold in bank:    {c['bright_yellow']}{bank_gold:>12,}{c['reset']}")
+        await player.send(f"{c['white']}  Inventory value: {c['yellow']}{inv_value:>12,}{c['reset']}")
+        await player.send(f"{c['white']}  Equipment value: {c['yellow']}{eq_value:>12,}{c['reset']}")
+        if storage_value > 0:
+            await player.send(f"{c['white']}  Storage value:   {c['yellow']}{storage_value:>12,}{c['reset']}")
+        await player.send(f"{c['bright_cyan']}───────────────────────────────────────{c['reset']}")
+        await player.send(f"{c['bright_white']}  Total worth:     {c['bright_green']}{total:>12,}{c['reset']}")
+        await player.send(f"{c['bright_cyan']}═══════════════════════════════════════{c['reset']}\n")
+
+    @classmethod
+    async def cmd_equipment(cls, player: 'Player', args: List[str]):
+        """Show equipped items."""
+        c = player.config.COLORS
+        await player.send(f"{c['cyan']}You are using:{c['reset']}")
+        
+        slot_names = {
+            'light': '<used as light>',
+            'finger1': '<worn on finger>',
+            'finger2': '<worn on finger>',
+            'neck1': '<worn around neck>',
+            'neck2': '<worn around neck>',
+            'body': '<worn on body>',
+            'head': '<worn on head>',
+            'legs': '<worn on legs>',
+            'feet': '<worn on feet>',
+            'hands': '<worn on hands>',
+            'arms': '<worn on arms>',
+            'shield': '<worn as shield>',
+            'about': '<worn about body>',
+            'waist': '<worn about waist>',
+            'wrist1': '<worn on wrist>',
+            'wrist2': '<worn on wrist>',
+            'wield': '<wielded>',
+            'hold': '<held>',
+            'dual_wield': '<dual wielded>',
+        }
+        
+        has_equipment = False
+        for slot in player.config.WEAR_SLOTS:
+            item = player.equipment.get(slot)
+            if item:
+                has_equipment = True
+                slot_desc = slot_names.get(slot, f'<{slot}>')
+                
+                # Special display for light sources
+                from legendary import colorize_item_name
+                colored_name = colorize_item_name(item, player.config)
+                if slot == 'light' or (slot == 'hold' and getattr(item, 'item_type', '') == 'light'):
+                    is_lit = getattr(item, 'light_lit', True)
+                    if is_lit:
+                        light_status = f"{c['bright_yellow']}(blazing){c['reset']}"
+                    else:
+                        light_status = f"{c['bright_black']}(dark){c['reset']}"
+                    await player.send(f"  {c['green']}{slot_desc:20}{colored_name} {light_status}")
+                else:
+                    await player.send(f"  {c['green']}{slot_desc:20}{colored_name}{c['reset']}")
+                
+        if not has_equipment:
+            await player.send(f"  {c['white']}Nothing.{c['reset']}")
+            
+    @classmethod
+    async def cmd_who(cls, player: 'Player', args: List[str]):
+        """Show online players with class, level, prestige, guild, title, idle time, and zone."""
+        import time as _time
+        c = player.config.COLORS
+        players = list(player.world.players.values())
+        
+        await player.send(f"{c['cyan']}╔══════════════════════════════════════════════════════════════════════╗{c['reset']}")
+        await player.send(f"{c['cyan']}║{c['bright_yellow']}                         Players Online                               {c['cyan']}║{c['reset']}")
+        await player.send(f"{c['cyan']}╠══════════════════════════════════════════════════════════════════════╣{c['reset']}")
+        
+        for p in players:
+            cls_name = player.config.CLASSES.get(p.char_class, {}).get('name', p.char_class)[:10]
+            from prestige import get_prestige_display_name
+            prestige_name = get_prestige_display_name(p)
+            prestige_str = f"/{prestige_name[:8]}" if prestige_name else ""
+            guild = getattr(p, 'guild', None)
+            guild_str = f" <{guild[:10]}>" if guild else ""
+            title_str = getattr(p, 'title', '') or ''
+            zone_name = ''
+            if p.room and p.room.zone:
+                zone_name = p.room.zone.name[:20]
+            # Idle time
+            idle_secs = 0
+            if hasattr(p, 'connection') and p.connection and hasattr(p.connection, 'last_input_time'):
+                idle_secs = int(_time.time() - p.connection.last_input_time)
+            idle_str = ''
+            if idle_secs > 300:
+                idle_min = idle_secs // 60
+                idle_str = f" (idle {idle_min}m)"
+            
+            line = f"[{p.level:>2} {cls_name}{prestige_str}]{guild_str} {p.name} {title_str}{idle_str}"
+            if zone_name:
+                line += f" - {zone_name}"
+            # Truncate/pad to fit box (68 chars content area)
+            if len(line) > 68:
+                line = line[:68]
+            pad = 68 - len(line)
+            await player.send(f"{c['cyan']}║ {c['bright_green']}{line}{' ' * pad}{c['cyan']}║{c['reset']}")
+            
+        await player.send(f"{c['cyan']}╠══════════════════════════════════════════════════════════════════════╣{c['reset']}")
+        count_str = f"{len(players)} player(s) online"
+        pad = max(0, 68 - len(count_str))
+        await player.send(f"{c['cyan']}║ {c['white']}{count_str}{' ' * pad}{c['cyan']}║{c['reset']}")
+        await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════════════╝{c['reset']}")
+
+    @classmethod
+    async def cmd_daily(cls, player: 'Player', args: List[str]):
+        """View your daily login bonus status.
+        
+        Usage: daily
+        
+        Log in each day to build your streak and earn better rewards!
+        """
+        from daily import DailyBonusManager
+        await DailyBonusManager.show_daily_status(player)
+
+    @classmethod
+    async def cmd_leaderboard(cls, player: 'Player', args: List[str]):
+        """View the server leaderboards.
+        
+        Usage: leaderboard [category]
+        Categories: level, kills, gold, deaths, achievements, quests
+        """
+        import os
+        from pathlib import Path
+        
+        c = player.config.COLORS
+        category = args[0].lower() if args else 'level'
+        
+        valid_categories = ['level', 'kills', 'gold', 'deaths', 'achievements', 'quests']
+        if category not in valid_categories:
+            await player.send(f"{c['yellow']}Valid categories: {', '.join(valid_categories)}{c['reset']}")
+            return
+        
+        # Load all player files
+        players_dir = Path(__file__).parent.parent / 'data' / 'players'
+        player_stats = []
+        
+        if players_dir.exists():
+            import json
+            for pfile in players_dir.glob('*.json'):
+                try:
+                    with open(pfile) as f:
+                        data = json.load(f)
+                    
+                    stats = {
+                        'name': data.get('name', pfile.stem),
+                        'level': data.get('level', 1),
+                        'kills': data.get('stats', {}).get('kills', 0),
+                        'gold': data.get('gold', 0),
+                        'deaths': data.get('stats', {}).get('deaths', data.get('deaths', 0)),
+                        'achievements': len(data.get('achievements', {})),
+                        'quests': len(data.get('quests_completed', [])),
+                    }
+                    player_stats.append(stats)
+                except Exception:
+                    pass
+        
+        # Sort by category
+        player_stats.sort(key=lambda x: x.get(category, 0), reverse=True)
+        
+        # Display leaderboard
+        category_titles = {
+            'level': '⚔️ Top Players by Level',
+            'kills': '💀 Most Kills',
+            'gold': '💰 Wealthiest Players',
+            'deaths': '👻 Most Deaths',
+            'achievements': '🏆 Achievement Leaders',
+            'quests': '📜 Quest Champions',
+        }
+        
+        await player.send(f"\n{c['bright_cyan']}═══════════════════════════════════════{c['reset']}")
+        await player.send(f"{c['bright_yellow']}     {category_titles.get(category, 'Leaderboard')}{c['reset']}")
+        await player.send(f"{c['bright_cyan']}═══════════════════════════════════════{c['reset']}")
+        
+        for i, ps in enumerate(player_stats[:10], 1):
+            # Medal for top 3
+            if i == 1:
+                medal = f"{c['bright_yellow']}🥇{c['reset']}"
+            elif i == 2:
+                medal = f"{c['white']}🥈{c['reset']}"
+            elif i == 3:
+                medal = f"{c['yellow']}🥉{c['reset']}"
+            else:
+                medal = f"{c['bright_black']}{i:>2}.{c['reset']}"
+            
+            value = ps.get(category, 0)
+            name = ps['name']
+            
+            # Highlight current player
+            if name.lower() == player.name.lower():
+                name = f"{c['bright_green']}{name}{c['reset']}"
+            else:
+                name = f"{c['white']}{name}{c['reset']}"
+            
+            await player.send(f" {medal} {name:<20} {c['bright_cyan']}{value:,}{c['reset']}")
+        
+        if not player_stats:
+            await player.send(f"{c['yellow']}  No players found.{c['reset']}")
+        
+        await player.send(f"{c['bright_cyan']}═══════════════════════════════════════{c['reset']}")
+        await player.send(f"{c['bright_black']}Categories: {', '.join(valid_categories)}{c['reset']}\n")
+
+    @classmethod
+    async def cmd_account(cls, player: 'Player', args: List[str]):
+        """View and manage your account. Usage: account [create|chars|info]"""
+        c = player.config.COLORS
+        from accounts import Account, AccountManager
+        
+        if not args:
+            # Show account info
+            if player.account_name:
+                account = Account.load(player.account_name)
+                if account:
+                    await player.send(f"\r\n{c['cyan']}Account: {c['bright_green']}{account.account_name}{c['reset']}")
+                    await player.send(f"{c['cyan']}Characters: {c['white']}{', '.join(account.characters)}{c['reset']}")
+                    await player.send(f"{c['cyan']}Created: {c['white']}{account.created_at[:10]}{c['reset']}")
+                    if account.is_admin:
+                        await player.send(f"{c['bright_red']}[ADMIN ACCOUNT]{c['reset']}")
+                else:
+                    await player.send(f"{c['yellow']}Account not found.{c['reset']}")
+            else:
+                await player.send(f"{c['yellow']}You are not linked to an account.{c['reset']}")
+                await player.send(f"{c['cyan']}Use 'account create' to create one.{c['reset']}")
+            return
+        
+        cmd = args[0].lower()
+        
+        if cmd == 'create':
+            # Create account from current character
+            if player.account_name:
+                await player.send(f"{c['yellow']}You already have an account: {player.account_name}{c['reset']}")
+                return
+            
+            # Use character name as account name
+            account_name = player.name.lower()
+            if Account.exists(account_name):
+                await player.send(f"{c['red']}Account '{account_name}' already exists!{c['reset']}")
+                return
+            
+            # Create account with same password as character
+            account = Account(account_name)
+            account.password_hash = player.password_hash  # Copy password
+            account.add_character(player.name)
+            account.save()
+            
+            player.account_name = account_name
+            await player.save()
+            
+            await player.send(f"{c['bright_green']}Account '{account_name}' created!{c['reset']}")
+            await player.send(f"{c['cyan']}Your character '{player.name}' is now linked.{c['reset']}")
+            await player.send(f"{c['cyan']}You can create more characters by logging in with your account.{c['reset']}")
+        
+        elif cmd == 'chars':
+            if not player.account_name:
+                await player.send(f"{c['yellow']}You are not linked to an account.{c['reset']}")
+                return
+            
+            account = Account.load(player.account_name)
+            if account:
+                char_info = AccountManager.get_character_info(account)
+                await player.send(f"\r\n{c['cyan']}Characters on account '{account.account_name}':{c['reset']}")
+                for info in char_info:
+                    marker = " *" if info['name'] == player.name else ""
+                    await player.send(f"  {c['bright_green']}{info['name']:<12}{c['white']} Lvl {info['level']:<3} {info['class']}{marker}{c['reset']}")
+            else:
+                await player.send(f"{c['red']}Account not found.{c['reset']}")
+        
+        elif cmd == 'password':
+            # Change account password: account password <old> <new>
+            if not player.account_name:
+                await player.send(f"{c['yellow']}You are not linked to an account.{c['reset']}")
+                return
+            if len(args) < 3:
+                await player.send(f"{c['yellow']}Usage: account password <old> <new>{c['reset']}")
+                return
+            old_pw = args[1]
+            new_pw = args[2]
+            account = Account.load(player.account_name)
+            if not account:
+                await player.send(f"{c['red']}Account not found.{c['reset']}")
+                return
+            if not account.check_password(old_pw):
+                await player.send(f"{c['red']}Incorrect current password.{c['reset']}")
+                return
+            if len(new_pw) < 4:
+                await player.send(f"{c['yellow']}New password must be at least 4 characters.{c['reset']}")
+                return
+            account.set_password(new_pw)
+            account.save()
+            await player.send(f"{c['bright_green']}Password updated successfully.{c['reset']}")
+
+        elif cmd == 'email':
+            # account email <address>
+            if not player.account_name:
+                await player.send(f"{c['yellow']}You are not linked to an account.{c['reset']}")
+                return
+            if len(args) < 2:
+                await player.send(f"{c['yellow']}Usage: account email <address>{c['reset']}")
+                return
+            account = Account.load(player.account_name)
+            if not account:
+                await player.send(f"{c['red']}Account not found.{c['reset']}")
+                return
+            email = args[1]
+            if not AccountManager.set_email(account, email):
+                await player.send(f"{c['red']}Invalid email address.{c['reset']}")
+                return
+            await player.send(f"{c['bright_green']}Email set to {email}.{c['reset']}")
+
+        elif cmd == 'forgot':
+            # account forgot - send reset email
+            if not player.account_name:
+                await player.send(f"{c['yellow']}You are not linked to an account.{c['reset']}")
+                return
+            account = Account.load(player.account_name)
+            if not account:
+                await player.send(f"{c['red']}Account not found.{c['reset']}")
+                return
+            if not account.settings.get('email'):
+                await player.send(f"{c['yellow']}No email set. Use: account email <address>{c['reset']}")
+                return
+            token = AccountManager.generate_reset_token(account)
+            sent = AccountManager.send_reset_email(account, token)
+            if sent:
+                await player.send(f"{c['bright_green']}Reset email sent to {account.settings['email']}.{c['reset']}")
+            else:
+                await player.send(f"{c['red']}Email not configured. Ask an admin to reset your password.{c['reset']}")
+
+        elif cmd == 'recover':
+            # account recover <token> <newpass>
+            if not player.account_name:
+                await player.send(f"{c['yellow']}You are not linked to an account.{c['reset']}")
+                return
+            if len(args) < 3:
+                await player.send(f"{c['yellow']}Usage: account recover <token> <newpass>{c['reset']}")
+                return
+            token = args[1]
+            new_pw = args[2]
+            ok = AccountManager.reset_with_token(player.account_name, token, new_pw)
+            if ok:
+                await player.send(f"{c['bright_green']}Password reset successfully.{c['reset']}")
+            else:
+                await player.send(f"{c['red']}Invalid or expired token.{c['reset']}")
+        
+        elif cmd == 'reset':
+            # Immortal reset: account reset <account> <newpass>
+            if len(args) < 3:
+                await player.send(f"{c['yellow']}Usage: account reset <account> <newpass>{c['reset']}")
+                return
+            # Immortal check
+            if getattr(player, 'level', 0) < player.config.IMMORTAL_LEVEL:
+                await player.send(f"{c['red']}You do not have permission to do that.{c['reset']}")
+                return
+            target_account = args[1].lower()
+            new_pw = args[2]
+            if len(new_pw) < 4:
+                await player.send(f"{c['yellow']}New password must be at least 4 characters.{c['reset']}")
+                return
+            account = Account.load(target_account)
+            if not account:
+                await player.send(f"{c['red']}Account '{target_account}' not found.{c['reset']}")
+                return
+            account.set_password(new_pw)
+            account.save()
+            await player.send(f"{c['bright_green']}Password for '{target_account}' reset.{c['reset']}")
+        
+        elif cmd == 'info':
+            await cls.cmd_account(player, [])  # Same as no args
+        
+        else:
+            await player.send(f"{c['yellow']}Usage: account [create|chars|info|password|email|forgot|recover|reset]{c['reset']}")
+
+    @classmethod
+    async def cmd_map(cls, player: 'Player', args: List[str]):
+        """Display ASCII map.
+
+        Usage:
+            map        - Show local explored map
+            map full   - Show entire explored area
+            map zone   - Show explored rooms in current zone
+        """
+        from map_system import render_ascii_map
+
+        mode = 'local'
+        if args:
+            arg = args[0].lower()
+            if arg in ('full', 'zone'):
+                mode = arg
+
+        size = getattr(player.config, 'MAP_VIEW_SIZE', 11)
+        output = render_ascii_map(player, mode=mode, size=size)
+        for line in output.split('\n'):
+            await player.send(line)
+
+    @classmethod
+    @classmethod
+    async def cmd_minimap(cls, player: 'Player', args: List[str]):
+        """Display a compact ASCII minimap centered on the player."""
+        from map_system import render_ascii_map
+
+        size = getattr(player.config, 'MAP_MINI_SIZE', 7)
+        output = render_ascii_map(player, mode='local', size=size)
+        for line in output.split('\n'):
+            await player.send(line)
+
+    @classmethod
+    async def cmd_mapurl(cls, player: 'Player', args: List[str]):
+        """Show the web map URL for this player."""
+        host = getattr(player.config, 'MAP_PUBLIC_HOST', 'localhost')
+        port = getattr(player.config, 'MAP_PORT', 4001)
+        url = f"http://{host}:{port}/?player={player.name}"
+        c = player.config.COLORS
+        current_zone = player.room.zone if getattr(player, 'room', None) else None
+        await player.send(f"{c['cyan']}Web map:{c['reset']} {c['bright_green']}{url}{c['reset']}")
+
+        await player.send("")
+        await player.send(f"{c['bright_yellow']}═══ SPECIAL ZONES ═══{c['reset']}")
+        zones_special = [
+            (0, "Limbo", "Admin zone"),
+            (12, "God Simplex", "Immortal area"),
+        ]
+        for vnum, name, desc in zones_special:
+            marker = f"{c['bright_green']}[YOU]" if vnum == current_zone else "     "
+            await player.send(f"  {marker} {c['magenta']}{vnum:3d}{c['reset']} - {c['white']}{name:<30}{c['magenta']} {desc}{c['reset']}")
+
+        await player.send("")
+        await player.send(f"{c['cyan']}═══ MAP LEGEND ═══{c['reset']}")
+        await player.send(f"  {c['bright_green']}[YOU]{c['reset']} - Your current zone")
+        await player.send(f"  {c['cyan']}###{c['reset']}  - Zone number (use 'goto' to travel)")
+        await player.send(f"  {c['yellow']}Recall{c['reset']} to return to Temple of Midgaard (zone 30)")
+        await player.send("")
+        await player.send(f"{c['white']}Total: {c['bright_green']}37 zones{c['white']}, {c['bright_green']}2,002 rooms{c['white']}, {c['bright_green']}48 shops{c['reset']}")
+        await player.send(f"{c['cyan']}═════════════════════════════════════════════════════════════════════════{c['reset']}")
+
+    @classmethod
+    async def _show_local_map(cls, player: 'Player'):
+        """Display an ASCII map of the current zone with player position."""
+        c = player.config.COLORS
+
+        if not player.room:
+            await player.send("You are nowhere!")
+            return
+
+        # Zone-specific ASCII maps
+        zone_maps = {
+            30: """
+{cyan}╔════════════════════════════════════════════════════════════╗
+║{bright_yellow}              The City of Midgaard - Map                    {cyan}║
+╠════════════════════════════════════════════════════════════╣
+║{white}                                                            {cyan}║
+║{white}                         [Temple]                          {cyan}║
+║{white}                            |                              {cyan}║
+║{white}              [Dark]---[Square]---[East St]---[E.Gate]    {cyan}║
+║{white}               Alley       |         |                     {cyan}║
+║{white}                 |      [W.St]---[Weapon]                 {cyan}║
+║{white}              [Dead]       |         |                     {cyan}║
+║{white}                 |       [Inn]---[Magic]                   {cyan}║
+║{white}              [Guild]                                      {cyan}║
+║{white}                 |                                         {cyan}║
+║{white}              [Sewers]                                     {cyan}║
+║{white}                                                            {cyan}║
+╚════════════════════════════════════════════════════════════╝{reset}
+""",
+            35: """
+{cyan}╔════════════════════════════════════════════════════════════╗
+║{bright_yellow}           The Sewers of Midgaard - Map                    {cyan}║
+╠════════════════════════════════════════════════════════════╣
+║{white}                                                            {cyan}║
+║{white}              [City Exit]                                  {cyan}║
+║{white}                   |                                       {cyan}║
+║{white}          [Flooded]---[Side]                              {cyan}║
+║{white}               |         |                                 {cyan}║
+║{white}     [Entrance]---[Junction]---[Storage]                  {cyan}║
+║{white}               |         |                                 {cyan}║
+║{white}           [Rat King] [Pool]---[Collector]                {cyan}║
+║{white}                                                            {cyan}║
+╚════════════════════════════════════════════════════════════╝{reset}
+""",
+            40: """
+{cyan}╔════════════════════════════════════════════════════════════╗
+║{bright_yellow}             Haon Dor Forest - Map                         {cyan}║
+╠════════════════════════════════════════════════════════════╣
+║{white}                                                            {cyan}║
+║{white}                      [Clearing]                           {cyan}║
+║{white}                           |                               {cyan}║
+║{white}         [Midgaard]---[Entrance]---[Dark Path]            {cyan}║
+║{white}                           |                               {cyan}║
+║{white}                      [Oak Grove]                          {cyan}║
+║{white}                           |                               {cyan}║
+║{white}                    [Goblin Warrens]                       {cyan}║
+║{white}                                                            {cyan}║
+╚════════════════════════════════════════════════════════════╝{reset}
+"""
+        }
+
+        # Get the appropriate map for this zone
+        zone_num = player.room.vnum // 100
+        map_template = zone_maps.get(zone_num)
+
+        if not map_template:
+            # Generic map for zones without specific maps
+            await player.send(f"{c['cyan']}Local map not available for this zone.{c['reset']}")
+            await player.send(f"{c['yellow']}Try 'map' or 'map world' to see the world overview.{c['reset']}")
+            await player.send(f"{c['white']}Current location: {player.room.name}{c['reset']}")
+            return
+
+        # Replace room names with highlighted version if player is there
+        room_markers = {
+            # Zone 30 - Midgaard
+            3001: "Temple",
+            3002: "Square",
+            3003: "East St",
+            3004: "E.Gate",
+            3005: "W.St",
+            3010: "Dark",
+            3011: "Dead",
+            3012: "Guild",
+            3020: "Weapon",
+            3021: "Magic",
+            3030: "Inn",
+            3031: "Inn",
+            # Zone 35 - Sewers
+            3500: "Entrance",
+            3501: "Flooded",
+            3502: "Junction",
+            3503: "Rat King",
+            3504: "City Exit",
+            3505: "Flooded",
+            3506: "Pool",
+            3507: "Side",
+            3508: "Storage",
+            3509: "Collector",
+            # Zone 40 - Forest
+            4001: "Entrance",
+            4002: "Clearing",
+            4003: "Dark Path",
+            4004: "Oak Grove",
+        }
+
+        marker = room_markers.get(player.room.vnum)
+        if marker:
+            # Highlight player's current position
+            map_output = map_template.replace(f"[{marker}]", f"{{bright_green}}[@{marker}@]{{white}}")
+        else:
+            map_output = map_template
+
+        # Format with colors
+        map_output = map_output.format(**c)
+
+        await player.send(map_output)
+        await player.send(f"{c['bright_yellow']}You are here: {c['bright_green']}{player.room.name}{c['reset']}")
+
+    @classmethod
+    async def cmd_help(cls, player: 'Player', args: List[str]):
+        """Show help information for commands, skills, and spells."""
+        from help_data import get_help_text, HELP_TOPICS
+
+        c = player.config.COLORS
+
+        if not args:
+            # Show comprehensive help index with pagination
+            await cls.show_help_index(player)
+            return
+
+        # Look up specific topic
+        topic = ' '.join(args).lower()
+        help_text = get_help_text(topic)
+
+        if help_text:
+            await player.send(f"{c['white']}{help_text}{c['reset']}")
+        else:
+            await player.send(f"{c['red']}No help available for '{topic}'.{c['reset']}")
+            await player.send(f"{c['yellow']}Type 'help' for a list of topics.{c['reset']}")
+
+    @classmethod
+    async def show_help_index(cls, player: 'Player'):
+        """Show paginated help index with all topics."""
+        from help_data import HELP_TOPICS
+        c = player.config.COLORS
+        
+        # Organize topics by category
+        categories = {
+            'Basic Commands': [],
+            'Movement': [],
+            'Communication': [],
+            'Combat': [],
+            'Skills': [],
+            'Spells': [],
+            'Bard Songs': [],
+            'Equipment & Items': [],
+            'Groups & Social': [],
+            'Information': [],
+            'Classes': [],
+            'Miscellaneous': []
+        }
+        
+        # Categorize all topics
+        for topic, data in sorted(HELP_TOPICS.items()):
+            cat = data.get('category', 'command')
+            title = data.get('title', topic.replace('_', ' ').title())
+            
+            if cat == 'skill':
+                categories['Skills'].append(topic)
+            elif cat == 'spell':
+                categories['Spells'].append(topic)
+            elif cat == 'class':
+                categories['Classes'].append(topic)
+            elif 'song' in topic.lower() or topic in ['perform', 'encore', 'countersong', 'fascinate', 'mock', 'songs']:
+                categories['Bard Songs'].append(topic)
+            elif topic in ['north', 'south', 'east', 'west', 'up', 'down', 'movement', 'flee', 'enter', 'leave', 'recall', 'teleport']:
+                categories['Movement'].append(topic)
+            elif topic in ['say', 'tell', 'shout', 'whisper', 'chat', 'gtell', 'emote', 'communication', 'channels']:
+                categories['Communication'].append(topic)
+            elif topic in ['kill', 'attack', 'combat', 'flee', 'rescue', 'kick', 'bash', 'backstab', 'target']:
+                categories['Combat'].append(topic)
+            elif topic in ['equipment', 'inventory', 'wear', 'wield', 'remove', 'drop', 'get', 'put', 'containers', 'armor']:
+                categories['Equipment & Items'].append(topic)
+            elif topic in ['group', 'follow', 'unfollow', 'assist', 'split', 'gtell']:
+                categories['Groups & Social'].append(topic)
+            elif topic in ['score', 'who', 'look', 'examine', 'consider', 'where', 'time', 'weather', 'affects']:
+                categories['Information'].append(topic)
+            elif topic in ['look', 'help', 'quit', 'save', 'practice', 'train', 'rest', 'sleep', 'wake', 'stand']:
+                categories['Basic Commands'].append(topic)
+            else:
+                categories['Miscellaneous'].append(topic)
+        
+        # Build output lines
+        lines = []
+        lines.append(f"{c['bright_cyan']}{'═' * 70}")
+        lines.append(f"{c['bright_yellow']}{'MISTHOLLOW HELP INDEX':^70}")
+        lines.append(f"{c['bright_cyan']}{'═' * 70}{c['reset']}")
+        lines.append(f"{c['white']}Type 'help <topic>' for detailed information on any topic.{c['reset']}")
+        lines.append("")
+        
+        for cat_name, topics in categories.items():
+            if not topics:
+                continue
+            topics = sorted(set(topics))
+            lines.append(f"{c['bright_yellow']}[ {cat_name} ]{c['reset']}")
+            # Format in columns
+            row = []
+            for topic in topics:
+                row.append(f"{c['cyan']}{topic:<18}{c['reset']}")
+                if len(row) == 4:
+                    lines.append("  " + "".join(row))
+                    row = []
+            if row:
+                lines.append("  " + "".join(row))
+            lines.append("")
+        
+        lines.append(f"{c['bright_cyan']}{'═' * 70}{c['reset']}")
+        lines.append(f"{c['white']}Total topics: {len(HELP_TOPICS)} | Type 'help <topic>' for details{c['reset']}")
+        
+        # Paginate - 20 lines per page
+        page_size = 20
+        total_lines = len(lines)
+        
+        for i in range(0, total_lines, page_size):
+            page = lines[i:i + page_size]
+            for line in page:
+                await player.send(line)
+            
+            # If more pages, prompt to continue
+            if i + page_size < total_lines:
+                await player.send(f"\n{c['bright_yellow']}-- Press ENTER to continue ({i + page_size}/{total_lines} lines) --{c['reset']}")
+                # Set a flag so the next empty input continues
+                player.help_pagination = {
+                    'lines': lines,
+                    'offset': i + page_size
+                }
+                return
+        
+        # Clear pagination if we reached the end
+        player.help_pagination = None
+
+    @classmethod
+    async def continue_help_pagination(cls, player: 'Player'):
+        """Continue showing paginated help."""
+        c = player.config.COLORS
+        pag = player.help_pagination
+        if not pag:
+            return
+        
+        lines = pag['lines']
+        offset = pag['offset']
+        page_size = 20
+        total_lines = len(lines)
+        
+        # Show next page
+        page = lines[offset:offset + page_size]
+        for line in page:
+            await player.send(line)
+        
+        # If more pages remain
+        if offset + page_size < total_lines:
+            await player.send(f"\n{c['bright_yellow']}-- Press ENTER to continue ({offset + page_size}/{total_lines} lines) --{c['reset']}")
+            player.help_pagination = {
+                'lines': lines,
+                'offset': offset + page_size
+            }
+        else:
+            # Done
+            player.help_pagination = None
+
+    @classmethod
+    async def cmd_where(cls, player: 'Player', args: List[str]):
+        """Show where players/mobs are."""
+        c = player.config.COLORS
+        world = player.world
+        zone = player.room.zone if player.room else None
+        players = sorted(world.players_in_zone(zone), key=lambda p: p.name)
+
+        if not args:
+            # Show all players in zone
+            await player.send(f"{c['cyan']}Players in your area:{c['reset']}")
+            for p in players:
+                await player.send(f"  {c['white']}{p.name:20} - {p.room.name}{c['reset']}")
+        else:
+            # Search for a specific mob/player
+            target = ' '.join(args).lower()
+            found = False
+            
+            # Search NPCs in zone
+            for npc in sorted(world.npcs_in_zone(zone), key=lambda n: n.name):
+                if target in npc.name.lower():
+                    await player.send(f"  {c['white']}{npc.name:20} - {npc.room.name}{c['reset']}")
+                    found = True
+                        
+            # Search players
+            for p in players:
+                if target in p.name.lower():
+                    await player.send(f"  {c['white']}{p.name:20} - {p.room.name}{c['reset']}")
+                    found = True
+                        
+            if not found:
+                await player.send(f"You don't sense '{target}' nearby.")
+
+
+    @classmethod
+    async def cmd_time_old(cls, player: 'Player', args: List[str]):
+        """Show the current in-game time (old version)."""
+        if not player.world or not getattr(player.world, 'game_time', None):
+            await player.send("Time seems to stand still.")
+            return
+
+        c = player.config.COLORS
+        game_time = player.world.game_time
+        await player.send(
+            f"{c['bright_cyan']}It is {game_time.get_time_string()} ({game_time.get_period()}, {game_time.get_season()}).{c['reset']}"
+        )
+
+    @classmethod
+    async def cmd_time(cls, player: 'Player', args: List[str]):
+        """Display the current game time."""
+        c = player.config.COLORS
+        
+        if hasattr(player, 'world') and player.world and hasattr(player.world, 'game_time'):
+            gt = player.world.game_time
+            
+            # Determine time of day
+            if gt.hour < 6:
+                time_desc = "the dead of night"
+            elif gt.hour < 9:
+                time_desc = "early morning"
+            elif gt.hour < 12:
+                time_desc = "morning"
+            elif gt.hour < 14:
+                time_desc = "midday"
+            elif gt.hour < 17:
+                time_desc = "afternoon"
+            elif gt.hour < 20:
+                time_desc = "evening"
+            elif gt.hour < 22:
+                time_desc = "night"
+            else:
+                time_desc = "late night"
+            
+            # Calculate minutes from tick counter if available
+            minutes = 0
+            if hasattr(gt, 'tick_counter'):
+                # tick_counter counts seconds until next hour (120 seconds = 1 MUD hour)
+                # So current minutes = (elapsed seconds in hour) / 2
+                seconds_per_hour = getattr(gt, 'SECONDS_PER_MUD_HOUR', 120)
+                elapsed = seconds_per_hour - gt.tick_counter if gt.tick_counter else 0
+                minutes = (elapsed * 60) // seconds_per_hour
+            
+            await player.send(f"{c['cyan']}It is {time_desc} ({gt.hour}:{minutes:02d}).{c['reset']}")
+            await player.send(f"{c['white']}Day {gt.day} of {gt.MONTH_NAMES[gt.month - 1] if hasattr(gt, 'MONTH_NAMES') else f'month {gt.month}'}, year {gt.year}.{c['reset']}")
+        else:
+            await player.send(f"{c['yellow']}Time seems meaningless here...{c['reset']}")
+
+    @classmethod
+    async def cmd_commands(cls, player: 'Player', args: List[str]):
+        """List all available commands."""
+        c = player.config.COLORS
+        
+        # Get all command methods
+        cmds = cls.registry.names()
+        
+        await player.send(f"{c['cyan']}=== Available Commands ==={c['reset']}")
+        
+        # Display in columns
+        cols = 5
+        for i in range(0, len(cmds), cols):
+            row = cmds[i:i+cols]
+            formatted = '  '.join(f"{cmd:<14}" for cmd in row)
+            await player.send(f"{c['white']}{formatted}{c['reset']}")
+        
+        await player.send(f"\n{c['yellow']}Type 'help <command>' for more information.{c['reset']}")
+
+    @classmethod
+    async def cmd_diagnose(cls, player: 'Player', args: List[str]):
+        """Check detailed health status. Usage: diagnose [target]"""
+        c = player.config.COLORS
+        
+        if args:
+            # Diagnose target
+            target = player.find_target_in_room(' '.join(args))
+            if not target:
+                await player.send(f"{c['red']}You don't see them here.{c['reset']}")
+                return
+        elif player.target:
+            target = player.target
+        else:
+            target = player
+        
+        hp_pct = target.hp / target.max_hp if target.max_hp > 0 else 0
+        
+        if hp_pct >= 1.0:
+            condition = f"{c['bright_green']}in perfect health{c['reset']}"
+        elif hp_pct >= 0.9:
+            condition = f"{c['green']}slightly scratched{c['reset']}"
+        elif hp_pct >= 0.75:
+            condition = f"{c['green']}lightly wounded{c['reset']}"
+        elif hp_pct >= 0.5:
+            condition = f"{c['yellow']}moderately wounded{c['reset']}"
+        elif hp_pct >= 0.30:
+            condition = f"{c['yellow']}heavily wounded{c['reset']}"
+        elif hp_pct >= 0.15:
+            condition = f"{c['bright_red']}severely wounded{c['reset']}"
+        elif hp_pct > 0:
+            condition = f"{c['red']}critically wounded{c['reset']}"
+        else:
+            condition = f"{c['red']}DEAD{c['reset']}"
+        
+        await player.send(f"{c['cyan']}{target.name} is {condition}.{c['reset']}")
+        await player.send(f"{c['white']}HP: {target.hp}/{target.max_hp} ({int(hp_pct * 100)}%){c['reset']}")
+        
+        # Show affects if any
+        if hasattr(target, 'affect_flags') and target.affect_flags:
+            affects = ', '.join(target.affect_flags)
+            await player.send(f"{c['magenta']}Affected by: {affects}{c['reset']}")
+
+    # ==================== SERVER INFO ====================
+
+    @classmethod
+    async def cmd_motd(cls, player: 'Player', args: List[str]):
+        """Display the Message of the Day."""
+        c = player.config.COLORS
+        
+        await player.send(f"{c['bright_yellow']}=== Message of the Day ==={c['reset']}")
+        await player.send(f"")
+        await player.send(f"{c['white']}Welcome, adventurer!{c['reset']}")
+        await player.send(f"")
+        await player.send(f"{c['cyan']}The Realms await your exploration.{c['reset']}")
+        await player.send(f"{c['cyan']}New players: Head south to the Market Square,{c['reset']}")
+        await player.send(f"{c['cyan']}then explore the city of Midgaard.{c['reset']}")
+        await player.send(f"")
+        await player.send(f"{c['bright_green']}Quickstart:{c['reset']}")
+        await player.send(f"  {c['white']}look  | score  | inventory  | equipment{c['reset']}")
+        await player.send(f"  {c['white']}consider <mob> | kill <mob> | flee{c['reset']}")
+        await player.send(f"  {c['white']}drink fountain | deposit <amt> | balance{c['reset']}")
+        await player.send(f"")
+        await player.send(f"{c['yellow']}Tip: Use 'consider <mob>' before attacking!{c['reset']}")
+        await player.send(f"{c['yellow']}Tip: Drink from the fountain in Temple Square or Market Square!{c['reset']}")
+
+    @classmethod
+    async def cmd_updates(cls, player: 'Player', args: List[str]):
+        """Show recent game updates and changes. Usage: updates [number of days]"""
+        import json
+        import os
+        c = player.config.COLORS
+        
+        updates_file = 'data/updates.json'
+        if not os.path.exists(updates_file):
+            await player.send(f"{c['yellow']}No updates available.{c['reset']}")
+            return
+        
+        try:
+            with open(updates_file) as f:
+                data = json.load(f)
+        except Exception as e:
+            await player.send(f"{c['red']}Error reading updates.{c['reset']}")
+            return
+        
+        updates = data.get('updates', [])
+        if not updates:
+            await player.send(f"{c['yellow']}No updates available.{c['reset']}")
+            return
+        
+        # How many days to show (default 7)
+        days_to_show = 7
+        if args:
+            try:
+                days_to_show = int(args[0])
+            except ValueError:
+                pass
+        
+        await player.send(f"\n{c['bright_cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
+        await player.send(f"{c['bright_cyan']}║{c['bright_yellow']}                    RECENT UPDATES                           {c['bright_cyan']}║{c['reset']}")
+        await player.send(f"{c['bright_cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}")
+        
+        shown = 0
+        for update in updates[:days_to_show]:
+            date = update.get('date', 'Unknown')
+            version = update.get('version', '')
+            changes = update.get('changes', [])
+            
+            version_str = f" (v{version})" if version else ""
+            await player.send(f"\n{c['bright_green']}═══ {date}{version_str} ═══{c['reset']}")
+            
+            for change in changes:
+                await player.send(f"  {c['white']}• {change}{c['reset']}")
+            
+            shown += 1
+        
+        await player.send(f"\n{c['cyan']}Showing {shown} update(s). Use 'updates <n>' for more.{c['reset']}")
+        await player.send(f"{c['cyan']}Report bugs with: bug <description>{c['reset']}\n")
+
+    @classmethod
+    async def cmd_changelog(cls, player: 'Player', args: List[str]):
+        """Alias for updates command."""
+        await cls.cmd_updates(player, args)
+
+    @classmethod
+    async def cmd_news(cls, player: 'Player', args: List[str]):
+        """Alias for updates command."""
+        await cls.cmd_updates(player, args)
+
+    @classmethod
+    async def cmd_policy(cls, player: 'Player', args: List[str]):
+        """Display server policies and rules."""
+        c = player.config.COLORS
+        
+        await player.send(f"{c['bright_red']}=== Server Policy ==={c['reset']}")
+        await player.send(f"")
+        await player.send(f"{c['white']}1. Be respectful to other players.{c['reset']}")
+        await player.send(f"{c['white']}2. No harassment or hate speech.{c['reset']}")
+        await player.send(f"{c['white']}3. No exploiting bugs (report them with 'bug').{c['reset']}")
+        await player.send(f"{c['white']}4. No botting or automation scripts.{c['reset']}")
+        await player.send(f"{c['white']}5. Multiple characters are allowed.{c['reset']}")
+        await player.send(f"")
+        await player.send(f"{c['yellow']}Violations may result in character deletion.{c['reset']}")
+        await player.send(f"{c['cyan']}Have fun and happy adventuring!{c['reset']}")
+
+    @classmethod
+    async def cmd_info(cls, player: 'Player', args: List[str]):
+        """Display game information for new players."""
+        c = player.config.COLORS
+        
+        await player.send(f"{c['bright_green']}=== New Player Information ==={c['reset']}")
+        await player.send(f"")
+        await player.send(f"{c['cyan']}Getting Started:{c['reset']}")
+        await player.send(f"  - Use compass directions to move (north, south, etc.)")
+        await player.send(f"  - 'look' to see your surroundings")
+        await player.send(f"  - 'score' to see your character stats")
+        await player.send(f"  - 'inventory' or 'i' to see what you're carrying")
+        await player.send(f"  - 'equipment' or 'eq' to see what you're wearing")
+        await player.send(f"")
+        await player.send(f"{c['cyan']}Combat:{c['reset']}")
+        await player.send(f"  - 'consider <mob>' to check difficulty")
+        await player.send(f"  - 'kill <mob>' to attack")
+        await player.send(f"  - 'flee' to escape")
+        await player.send(f"")
+        await player.send(f"{c['cyan']}Useful Commands:{c['reset']}")
+        await player.send(f"  - 'help <topic>' for detailed help")
+        await player.send(f"  - 'commands' for full command list")
+        await player.send(f"  - 'who' to see online players")
+
+
+    @classmethod
+    async def cmd_title(cls, player: 'Player', args: List[str]):
+        """Set your title. Usage: title <new title>"""
+        c = player.config.COLORS
+        
+        if not args:
+            current = getattr(player, 'title', 'the Adventurer')
+            await player.send(f"{c['cyan']}Your current title: {c['white']}{player.name} {current}{c['reset']}")
+            await player.send(f"{c['yellow']}Usage: title <new title>{c['reset']}")
+            return
+        
+        new_title = ' '.join(args)
+        
+        # Sanitize - no parentheses (reserved for flags)
+        if '(' in new_title or ')' in new_title:
+            await player.send(f"{c['red']}Titles cannot contain parentheses.{c['reset']}")
+            return
+        
+        # Length limit
+        if len(new_title) > 40:
+            await player.send(f"{c['red']}Title too long (max 40 characters).{c['reset']}")
+            return
+        
+        player.title = new_title
+        await player.send(f"{c['green']}Title set to: {player.name} {new_title}{c['reset']}")
+
+    # ==================== ACHIEVEMENTS ====================
+
+    @classmethod
+    async def cmd_achievements(cls, player: 'Player', args: List[str]):
+        """List earned achievements and progress. Usage: achievements [all|progress]"""
+        from achievements import ACHIEVEMENTS, AchievementManager
+
+        c = player.config.COLORS
+        AchievementManager._ensure_player_fields(player)
+        
+        show_all = args and args[0].lower() == 'all'
+        show_progress = args and args[0].lower() == 'progress'
+        
+        earned = player.achievements or {}
+        total_points = sum(ACHIEVEMENTS.get(ach_id, {}).get('points', 0) for ach_id in earned)
+        max_points = sum(a.get('points', 0) for a in ACHIEVEMENTS.values())
+        
+        await player.send(f"\r\n{c['bright_cyan']}═══════════════════ ACHIEVEMENTS ═══════════════════{c['reset']}")
+        await player.send(f"{c['yellow']}Points: {c['bright_yellow']}{total_points}/{max_points}{c['reset']}  |  "
+                         f"{c['yellow']}Earned: {c['bright_green']}{len(earned)}/{len(ACHIEVEMENTS)}{c['reset']}")
+        await player.send(f"{c['bright_cyan']}════════════════════════════════════════════════════{c['reset']}")
+        
+        # Show progress stats
+        progress = player.achievement_progress or {}
+        kills = progress.get('kills', 0)
+        explored = len(player.explored_rooms) if hasattr(player, 'explored_rooms') else 0
+        secrets = len(player.secret_rooms_found) if hasattr(player, 'secret_rooms_found') else 0
+        
+        await player.send(f"\r\n{c['cyan']}Progress:{c['reset']}")
+        await player.send(f"  Kills: {c['white']}{kills}{c['reset']}  |  Rooms explored: {c['white']}{explored}{c['reset']}  |  Secrets: {c['white']}{secrets}{c['reset']}")
+        
+        if show_progress:
+            # Show next milestones
+            await player.send(f"\r\n{c['cyan']}Next milestones:{c['reset']}")
+            if kills < 10:
+                await player.send(f"  {c['yellow']}Hunter:{c['reset']} {kills}/10 kills")
+            if explored < 10:
+                await player.send(f"  {c['yellow']}Explorer:{c['reset']} {explored}/10 rooms")
+            if secrets < 5:
+                await player.send(f"  {c['yellow']}Secret Seeker I:{c['reset']} {secrets}/5 secrets")
+            elif secrets < 10:
+                await player.send(f"  {c['yellow']}Secret Seeker II:{c['reset']} {secrets}/10 secrets")
+            return
+        
+        # Show earned achievements
+        if earned:
+            await player.send(f"\r\n{c['bright_green']}✓ Earned:{c['reset']}")
+            for ach_id in earned:
+                info = ACHIEVEMENTS.get(ach_id, {})
+                title = info.get('title', ach_id)
+                points = info.get('points', 0)
+                await player.send(f"  {c['bright_green']}★{c['reset']} {title} {c['yellow']}({points} pts){c['reset']}")
+        
+        # Show unearned if requested
+        if show_all:
+            unearned = [a for a in ACHIEVEMENTS if a not in earned]
+            if unearned:
+                await player.send(f"\r\n{c['white']}○ Not yet earned:{c['reset']}")
+                for ach_id in unearned[:10]:  # Limit to avoid spam
+                    info = ACHIEVEMENTS.get(ach_id, {})
+                    title = info.get('title', ach_id)
+                    desc = info.get('description', '')
+                    await player.send(f"  {c['white']}○{c['reset']} {title} - {c['white']}{desc}{c['reset']}")
+                if len(unearned) > 10:
+                    await player.send(f"  {c['white']}... and {len(unearned) - 10} more{c['reset']}")
+        else:
+            unearned_count = len(ACHIEVEMENTS) - len(earned)
+            if unearned_count > 0:
+                await player.send(f"\r\n{c['white']}Type 'achievements all' to see {unearned_count} unearned achievements.{c['reset']}")
+                await player.send(f"{c['white']}Type 'achievements progress' to see milestone progress.{c['reset']}")
+
+    # ==================== WORLD EVENTS ====================
+
+    @classmethod
+    async def cmd_events(cls, player: 'Player', args: List[str]):
+        """Show active world events and time remaining."""
+        c = player.config.COLORS
+        em = getattr(player.world, 'event_manager', None)
+        if not em:
+            await player.send(f"{c['yellow']}No event system available.{c['reset']}")
+            return
+
+        summaries = em.get_active_summaries()
+        if not summaries:
+            await player.send(f"{c['cyan']}There are no active world events right now.{c['reset']}")
+            await player.send(f"{c['white']}Events trigger automatically every 30-60 minutes.{c['reset']}")
+            return
+
+        await player.send(f"\n{c['bright_cyan']}═══ Active World Events ═══{c['reset']}")
+        for s in summaries:
+            await player.send(f"  {c['bright_white']}{s}{c['reset']}")
+        await player.send("")
@@ -0,0 +1,1106 @@
+"""
+Misthollow Item Commands
+=======================
+Picking up, wearing, giving and using items.
+"""
+
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class ItemCommands:
+    """Item commands."""
+
+    @classmethod
+    async def cmd_get(cls, player: 'Player', args: List[str]):
+        """Pick up an item.
+
+        Usage:
+            get <item>              - Get item from room
+            get all                 - Get all items from room
+            get <item> <container>  - Get item from container
+            get all <container>     - Get all items from container
+            get <item> from <container> - Alternative syntax
+            get all from <container>    - Alternative syntax
+        """
+        if not args:
+            await player.send("Get what?")
+            return
+
+        c = player.config.COLORS
+
+        # Support both "get item container" and "get item from container" syntax
+        # Check if last argument is a container (and no "from" keyword)
+        from_container = False
+        container_name = None
+
+        def find_in_list(items, name):
+            """Find item in list with numbered targeting (e.g., 2.corpse)."""
+            if not name:
+                return None
+            target_number = 1
+            if '.' in name:
+                parts = name.split('.', 1)
+                if parts[0].isdigit():
+                    target_number = int(parts[0])
+                    name = parts[1]
+            matches = []
+            for item in items:
+                if name.lower() in item.name.lower():
+                    matches.append(item)
+            if target_number <= len(matches):
+                return matches[target_number - 1]
+            return None
+
+        if len(args) >= 2 and 'from' not in args:
+            # Check if last argument might be a container
+            potential_container = args[-1].lower()
+            for item in player.inventory + player.room.items:
+                if hasattr(item, 'item_type') and item.item_type == 'container':
+                    if potential_container in item.name.lower() or potential_container in item.short_desc.lower():
+                        from_container = True
+                        container_name = potential_container
+                        # Rebuild item_name without container
+                        item_name = ' '.join(args[:-1]).lower()
+                        break
+
+        if not from_container:
+            item_name = ' '.join(args).lower()
+
+        # Check if getting gold from room (not from container)
+        if not from_container and 'from' not in args and (item_name in ['gold', 'coins', 'coin', 'gold coins']):
+            if player.room.gold <= 0:
+                await player.send(f"{c['yellow']}There's no gold here.{c['reset']}")
+                return
+
+            gold_amount = player.room.gold
+            player.gold += gold_amount
+            player.room.gold = 0
+
+            await player.send(f"{c['yellow']}You get {gold_amount} gold coins. You now have {player.gold} gold.{c['reset']}")
+            await player.room.send_to_room(
+                f"{player.name} picks up some gold coins.",
+                exclude=[player]
+            )
+            return
+
+        # Check if getting from container (either "get item container" or "get item from container")
+        if from_container or 'from' in args:
+            # If using "from" syntax, extract container name
+            if 'from' in args:
+                from_idx = args.index('from')
+                item_name = ' '.join(args[:from_idx]).lower()
+                container_name = ' '.join(args[from_idx+1:]).lower()
+
+            # Find container using numbered targeting (e.g., "2.corpse")
+            container = find_in_list(player.inventory + player.room.items, container_name)
+            if container and getattr(container, 'item_type', None) != 'container':
+                container = None
+
+            if not container:
+                await player.send(f"You don't see a '{container_name}' container here.")
+                return
+
+            # Check if container is closed
+            if hasattr(container, 'is_closed') and container.is_closed:
+                await player.send(f"The {container.name} is closed.")
+                return
+
+            # Check if getting gold from container
+            if item_name in ['gold', 'coins', 'coin', 'gold coins']:
+                if not hasattr(container, 'gold') or container.gold <= 0:
+                    await player.send(f"{c['yellow']}There's no gold in {container.short_desc}.{c['reset']}")
+                    return
+
+                gold_amount = container.gold
+                player.gold += gold_amount
+                container.gold = 0
+
+                await player.send(f"{c['yellow']}You get {gold_amount} gold coins from {container.short_desc}. You now have {player.gold} gold.{c['reset']}")
+                await player.room.send_to_room(
+                    f"{player.name} gets gold coins from {container.short_desc}.",
+                    exclude=[player]
+                )
+                return
+
+            # Check if getting 'all' from container
+            if item_name == 'all':
+                # Get gold first if any
+                if hasattr(container, 'gold') and container.gold > 0:
+                    gold_amount = container.gold
+                    player.gold += gold_amount
+                    container.gold = 0
+                    await player.send(f"{c['yellow']}You get {gold_amount} gold coins from {container.short_desc}.{c['reset']}")
+
+                if not hasattr(container, 'contents') or not container.contents:
+                    if not hasattr(container, 'gold') or container.gold == 0:
+                        await player.send(f"The {container.name} is empty.")
+                    return
+
+                for item in list(container.contents):
+                    container.contents.remove(item)
+                    player.inventory.append(item)
+                    await cls._record_collection_item(player, item)
+                    from quests import QuestManager
+                    await QuestManager.check_quest_progress(
+                        player, 'collect', {'item_vnum': getattr(item, 'vnum', 0), 'item_name': item.name}
+                    )
+                    await player.send(f"You get {item.short_desc} from {container.short_desc}.")
+                return
+
+            # Get specific item from container
+            if not hasattr(container, 'contents'):
+                await player.send(f"The {container.name} is empty.")
+                return
+
+            item = find_in_list(container.contents, item_name)
+            if item:
+                container.contents.remove(item)
+                player.inventory.append(item)
+                await cls._record_collection_item(player, item)
+                from quests import QuestManager
+                await QuestManager.check_quest_progress(
+                    player, 'collect', {'item_vnum': getattr(item, 'vnum', 0), 'item_name': item.name}
+                )
+                await player.send(f"You get {item.short_desc} from {container.short_desc}.")
+                await player.room.send_to_room(
+                    f"{player.name} gets {item.short_desc} from {container.short_desc}.",
+                    exclude=[player]
+                )
+                return
+
+            await player.send(f"There's no '{item_name}' in {container.short_desc}.")
+            return
+
+        # Check for 'all.corpse' or 'all.chest' - get all items from all matching containers
+        if '.' in item_name and item_name.startswith('all.'):
+            container_type = item_name.split('.', 1)[1]
+            containers = []
+
+            # Find all matching containers
+            for item in player.room.items:
+                if hasattr(item, 'item_type') and item.item_type == 'container':
+                    if container_type in item.name.lower():
+                        containers.append(item)
+
+            if not containers:
+                await player.send(f"{c['yellow']}You don't see any {container_type}s here.{c['reset']}")
+                return
+
+            total_gold = 0
+            total_items = 0
+
+            for container in containers:
+                # Check if container is closed
+                if hasattr(container, 'is_closed') and container.is_closed:
+                    await player.send(f"{c['yellow']}The {container.short_desc} is closed.{c['reset']}")
+                    continue
+
+                # Get gold from this container
+                if hasattr(container, 'gold') and container.gold > 0:
+                    total_gold += container.gold
+                    container.gold = 0
+
+                # Get items from this container
+                if hasattr(container, 'contents') and container.contents:
+                    for item in list(container.contents):
+                        container.contents.remove(item)
+                        player.inventory.append(item)
+                        await cls._record_collection_item(player, item)
+                        from quests import QuestManager
+                        await QuestManager.check_quest_progress(
+                            player, 'collect', {'item_vnum': getattr(item, 'vnum', 0), 'item_name': item.name}
+                        )
+                        await player.send(f"You get {item.short_desc} from {container.short_desc}.")
+                        total_items += 1
+
+            if total_gold > 0:
+                player.gold += total_gold
+                await player.send(f"{c['yellow']}You get {total_gold} gold coins. You now have {player.gold} gold.{c['reset']}")
+
+            if total_items == 0 and total_gold == 0:
+                await player.send(f"{c['white']}All {container_type}s are empty.{c['reset']}")
+
+            return
+
+        # Check if getting 'all'
+        if item_name == 'all':
+            if not player.room.items:
+                await player.send("There's nothing here to get.")
+                return
+            for item in list(player.room.items):
+                player.room.items.remove(item)
+                player.inventory.append(item)
+                await cls._record_collection_item(player, item)
+                from quests import QuestManager
+                await QuestManager.check_quest_progress(
+                    player, 'collect', {'item_vnum': getattr(item, 'vnum', 0), 'item_name': item.name}
+                )
+                await player.send(f"You get {item.short_desc}.")
+            return
+            
+        # Find item in room with numbered targeting (e.g., "2.corpse", "3.sword")
+        item = player.find_item_in_room(item_name)
+        if item:
+            player.room.items.remove(item)
+            player.inventory.append(item)
+            await cls._record_collection_item(player, item)
+            from quests import QuestManager
+            await QuestManager.check_quest_progress(
+                player, 'collect', {'item_vnum': getattr(item, 'vnum', 0), 'item_name': item.name}
+            )
+            await player.send(f"You get {item.short_desc}.")
+            await player.room.send_to_room(
+                f"{player.name} picks up {item.short_desc}.",
+                exclude=[player]
+            )
+            return
+                
+        await player.send(f"You don't see '{item_name}' here.")
+        
+    @classmethod
+    async def cmd_take(cls, player: 'Player', args: List[str]):
+        """Alias for get."""
+        await cls.cmd_get(player, args)
+
+    @classmethod
+    async def cmd_loot(cls, player: 'Player', args: List[str]):
+        """Loot items from a corpse. Supports numbered targeting (e.g., loot 2.corpse)"""
+        c = player.config.COLORS
+
+        # Find corpse - default to first corpse if no args
+        corpse = None
+        if args:
+            corpse_name = ' '.join(args).lower()
+            # Use find_container for numbered targeting (e.g., "loot 2.corpse")
+            corpse = player.find_container(corpse_name)
+            # Verify it's actually a corpse
+            if corpse and 'corpse' not in corpse.name.lower():
+                corpse = None
+        else:
+            # No args - find first corpse
+            for item in player.room.items:
+                if hasattr(item, 'item_type') and item.item_type == 'container':
+                    if 'corpse' in item.name.lower():
+                        corpse = item
+                        break
+
+        if not corpse:
+            await player.send(f"{c['yellow']}You don't see any corpses to loot here.{c['reset']}")
+            return
+
+        # Loot gold from corpse if any
+        gold_looted = 0
+        if hasattr(corpse, 'gold') and corpse.gold > 0:
+            player.gold += corpse.gold
+            gold_looted = corpse.gold
+            corpse.gold = 0
+
+        # Loot items from corpse
+        items_looted = 0
+        if hasattr(corpse, 'contents') and corpse.contents:
+            for item in list(corpse.contents):
+                corpse.contents.remove(item)
+                player.inventory.append(item)
+                await cls._record_collection_item(player, item)
+                from quests import QuestManager
+                await QuestManager.check_quest_progress(
+                    player, 'collect', {'item_vnum': getattr(item, 'vnum', 0), 'item_name': item.name}
+                )
+                await player.send(f"{c['bright_cyan']}You get {item.short_desc} from {corpse.short_desc}.{c['reset']}")
+                items_looted += 1
+
+        # Report what was looted
+        if gold_looted > 0:
+            await player.send(f"{c['yellow']}You get {gold_looted} gold coins from {corpse.short_desc}.{c['reset']}")
+
+        if items_looted == 0 and gold_looted == 0:
+            await player.send(f"{c['white']}The {corpse.short_desc} is empty.{c['reset']}")
+        else:
+            await player.room.send_to_room(
+                f"{player.name} loots {corpse.short_desc}.",
+                exclude=[player]
+            )
+
+    @classmethod
+    async def cmd_sacrifice(cls, player: 'Player', args: List[str]):
+        """Sacrifice a corpse to the gods for gold."""
+        c = player.config.COLORS
+
+        # Check for .all, all, or all.corpse to sacrifice all corpses
+        if args and (args[0] == '.all' or args[0] == 'all' or args[0].startswith('all.')):
+            corpses = []
+            for item in player.room.items:
+                if hasattr(item, 'item_type') and item.item_type == 'container':
+                    if 'corpse' in item.name.lower():
+                        corpses.append(item)
+
+            if not corpses:
+                await player.send(f"{c['yellow']}You don't see any corpses to sacrifice here.{c['reset']}")
+                return
+
+            total_gold = 0
+            corpse_count = 0
+
+            for corpse in list(corpses):
+                # Drop all items from corpse onto the floor
+                if hasattr(corpse, 'contents') and corpse.contents:
+                    for item in list(corpse.contents):
+                        corpse.contents.remove(item)
+                        player.room.items.append(item)
+
+                # Drop any gold from corpse onto the floor
+                if hasattr(corpse, 'gold') and corpse.gold > 0:
+                    player.room.gold += corpse.gold
+
+                # Remove corpse from room
+                player.room.items.remove(corpse)
+
+                # Give player 1 gold per corpse
+                player.gold += 1
+                total_gold += 1
+                corpse_count += 1
+
+            await player.send(f"{c['bright_yellow']}You sacrifice {corpse_count} corpses to the gods!{c['reset']}")
+            await player.send(f"{c['yellow']}The gods give you {total_gold} gold coins for your offerings.{c['reset']}")
+            await player.room.send_to_room(
+                f"{player.name} sacrifices multiple corpses in brilliant flashes of light!",
+                exclude=[player]
+            )
+            return
+
+        # Find corpse - default to first corpse if no args
+        corpse = None
+        if args:
+            corpse_name = ' '.join(args).lower()
+            for item in player.room.items:
+                if hasattr(item, 'item_type') and item.item_type == 'container':
+                    if 'corpse' in item.name.lower() and corpse_name in item.name.lower():
+                        corpse = item
+                        break
+        else:
+            # No args - find first corpse
+            for item in player.room.items:
+                if hasattr(item, 'item_type') and item.item_type == 'container':
+                    if 'corpse' in item.name.lower():
+                        corpse = item
+                        break
+
+        if not corpse:
+            await player.send(f"{c['yellow']}You don't see any corpses to sacrifice here.{c['reset']}")
+            return
+
+        # Drop all items from corpse onto the floor
+        items_dropped = 0
+        if hasattr(corpse, 'contents') and corpse.contents:
+            for item in list(corpse.contents):
+                corpse.contents.remove(item)
+                player.room.items.append(item)
+                items_dropped += 1
+
+        # Drop any gold from corpse onto the floor
+        if hasattr(corpse, 'gold') and corpse.gold > 0:
+            player.room.gold += corpse.gold
+
+        # Remove corpse from room
+        player.room.items.remove(corpse)
+
+        # Give player 1 gold for the sacrifice
+        player.gold += 1
+
+        # Messages
+        await player.send(f"{c['bright_yellow']}You sacrifice {corpse.short_desc} to the gods!{c['reset']}")
+        await player.send(f"{c['yellow']}The gods give you 1 gold coin for your offering.{c['reset']}")
+
+        if items_dropped > 0:
+            await player.send(f"{c['white']}The contents of the corpse scatter on the ground.{c['reset']}")
+
+        await player.room.send_to_room(
+            f"{player.name} sacrifices {corpse.short_desc} in a brilliant flash of light!",
+            exclude=[player]
+        )
+
+    @classmethod
+    async def cmd_drop(cls, player: 'Player', args: List[str]):
+        """Drop an item or gold."""
+        if not args:
+            await player.send("Drop what?")
+            return
+
+        c = player.config.COLORS
+        item_name = ' '.join(args).lower()
+
+        # Check if dropping gold
+        if 'gold' in item_name or 'coins' in item_name or 'coin' in item_name:
+            # Extract amount if specified (e.g., "drop 100 gold")
+            amount = None
+            words = item_name.split()
+            for word in words:
+                if word.isdigit():
+                    amount = int(word)
+                    break
+
+            if amount is None:
+                amount = player.gold
+
+            if amount <= 0:
+                await player.send(f"{c['yellow']}Drop how much gold?{c['reset']}")
+                return
+
+            if player.gold < amount:
+                await player.send(f"{c['red']}You don't have that much gold. You have {player.gold} gold.{c['reset']}")
+                return
+
+            player.gold -= amount
+            player.room.gold += amount
+
+            await player.send(f"{c['yellow']}You drop {amount} gold coins. You have {player.gold} gold remaining.{c['reset']}")
+            await player.room.send_to_room(
+                f"{player.name} drops some gold coins.",
+                exclude=[player]
+            )
+            return
+
+        # Check if dropping 'all'
+        if item_name == 'all':
+            if not player.inventory:
+                await player.send("You're not carrying anything.")
+                return
+            for item in list(player.inventory):
+                player.inventory.remove(item)
+                player.room.items.append(item)
+                await player.send(f"You drop {item.short_desc}.")
+            return
+            
+        # Find item in inventory
+        for item in player.inventory:
+            if item_name in item.name.lower():
+                player.inventory.remove(item)
+                player.room.items.append(item)
+                await player.send(f"You drop {item.short_desc}.")
+                await player.room.send_to_room(
+                    f"{player.name} drops {item.short_desc}.",
+                    exclude=[player]
+                )
+                return
+                
+        await player.send(f"You don't have '{item_name}'.")
+
+    @classmethod
+    async def cmd_put(cls, player: 'Player', args: List[str]):
+        """Put an item into a container. Usage: put <item> <container> or put all <container>"""
+        if not args or len(args) < 2:
+            await player.send("Usage: put <item> <container> or put all <container>")
+            return
+
+        c = player.config.COLORS
+
+        # Check for 'in' or 'into' preposition
+        if 'in' in args:
+            in_idx = args.index('in')
+            item_name = ' '.join(args[:in_idx]).lower()
+            container_name = ' '.join(args[in_idx+1:]).lower()
+        elif 'into' in args:
+            into_idx = args.index('into')
+            item_name = ' '.join(args[:into_idx]).lower()
+            container_name = ' '.join(args[into_idx+1:]).lower()
+        else:
+            # Assume last word is container
+            container_name = args[-1].lower()
+            item_name = ' '.join(args[:-1]).lower()
+
+        # Find container in inventory or room
+        container = None
+        for item in player.inventory + player.room.items:
+            if container_name in item.name.lower():
+                if hasattr(item, 'item_type') and item.item_type == 'container':
+                    container = item
+                    break
+
+        if not container:
+            await player.send(f"{c['red']}You don't see a '{container_name}' container here.{c['reset']}")
+            return
+
+        # Check if container is closed
+        if hasattr(container, 'is_closed') and container.is_closed:
+            await player.send(f"{c['red']}The {container.name} is closed.{c['reset']}")
+            return
+
+        # Initialize contents if not present
+        if not hasattr(container, 'contents'):
+            container.contents = []
+
+        # Check for 'all'
+        if item_name == 'all':
+            if not player.inventory:
+                await player.send(f"{c['yellow']}You're not carrying anything.{c['reset']}")
+                return
+
+            put_count = 0
+            for item in list(player.inventory):
+                # Don't put container into itself
+                if item == container:
+                    continue
+
+                # Check weight capacity if container has it
+                if hasattr(container, 'capacity'):
+                    current_weight = sum(getattr(i, 'weight', 1) for i in container.contents)
+                    item_weight = getattr(item, 'weight', 1)
+                    if current_weight + item_weight > container.capacity:
+                        await player.send(f"{c['yellow']}{container.short_desc} is full.{c['reset']}")
+                        break
+
+                player.inventory.remove(item)
+                container.contents.append(item)
+                await player.send(f"You put {item.short_desc} in {container.short_desc}.")
+                put_count += 1
+
+            if put_count > 0:
+                await player.room.send_to_room(
+                    f"{player.name} puts several items in {container.short_desc}.",
+                    exclude=[player]
+                )
+            return
+
+        # Put specific item
+        for item in player.inventory:
+            if item_name in item.name.lower():
+                # Don't put container into itself
+                if item == container:
+                    await player.send(f"{c['red']}You can't put {item.short_desc} into itself!{c['reset']}")
+                    return
+
+                # Check weight capacity
+                if hasattr(container, 'capacity'):
+                    current_weight = sum(getattr(i, 'weight', 1) for i in container.contents)
+                    item_weight = getattr(item, 'weight', 1)
+                    if current_weight + item_weight > container.capacity:
+                        await player.send(f"{c['red']}{container.short_desc} is full.{c['reset']}")
+                        return
+
+                player.inventory.remove(item)
+                container.contents.append(item)
+                await player.send(f"{c['green']}You put {item.short_desc} in {container.short_desc}.{c['reset']}")
+                await player.room.send_to_room(
+                    f"{player.name} puts {item.short_desc} in {container.short_desc}.",
+                    exclude=[player]
+                )
+                return
+
+        await player.send(f"{c['red']}You don't have '{item_name}'.{c['reset']}")
+
+    @classmethod
+    async def cmd_wear(cls, player: 'Player', args: List[str]):
+        """Wear an item or 'wear all' to wear everything you can."""
+        if not args:
+            await player.send("Wear what?")
+            return
+
+        item_name = ' '.join(args).lower()
+
+        # Handle "wear all"
+        if item_name == 'all':
+            worn_count = 0
+            # Include lights even without wear_slot (they auto-assign to 'light')
+            items_to_wear = [item for item in player.inventory
+                           if item.item_type in ('armor', 'light', 'worn') and (hasattr(item, 'wear_slot') or item.item_type == 'light')]
+
+            # Handle paired slots
+            paired_slots = {
+                'finger': ['finger1', 'finger2'],
+                'neck': ['neck1', 'neck2'],
+                'wrist': ['wrist1', 'wrist2'],
+            }
+            
+            for item in items_to_wear:
+                slot = getattr(item, 'wear_slot', None)
+                # Auto-assign light slot for light items
+                if not slot and item.item_type == 'light':
+                    slot = 'light'
+                if not slot:
+                    continue
+                actual_slot = slot
+                
+                # Handle paired slots
+                if slot in paired_slots:
+                    for paired in paired_slots[slot]:
+                        if not player.equipment.get(paired):
+                            actual_slot = paired
+                            break
+                    else:
+                        continue  # Both slots full, skip this item
+                elif player.equipment.get(slot):
+                    continue  # Slot occupied
+                
+                player.inventory.remove(item)
+                player.equipment[actual_slot] = item
+                await player.send(f"You wear {item.short_desc}.")
+                worn_count += 1
+
+            if worn_count > 0:
+                await player.room.send_to_room(
+                    f"{player.name} puts on several items.",
+                    exclude=[player]
+                )
+            else:
+                await player.send("You don't have anything to wear.")
+            return
+
+        # Find specific item in inventory
+        for item in player.inventory:
+            if item_name in item.name.lower():
+                if item.item_type not in ('armor', 'light', 'worn'):
+                    await player.send(f"You can't wear {item.short_desc}.")
+                    return
+
+                slot = getattr(item, 'wear_slot', None)
+                # Auto-assign light slot for light items
+                if not slot and item.item_type == 'light':
+                    slot = 'light'
+                if not slot:
+                    await player.send(f"You can't figure out how to wear {item.short_desc}.")
+                    return
+
+                # Handle paired slots (finger, neck, wrist -> finger1/finger2, etc.)
+                paired_slots = {
+                    'finger': ['finger1', 'finger2'],
+                    'neck': ['neck1', 'neck2'],
+                    'wrist': ['wrist1', 'wrist2'],
+                }
+                
+                actual_slot = slot
+                if slot in paired_slots:
+                    # Find first empty slot in the pair
+                    for paired in paired_slots[slot]:
+                        if not player.equipment.get(paired):
+                            actual_slot = paired
+                            break
+                    else:
+                        # Both slots full
+                        await player.send(f"You're already wearing something in both {slot} slots.")
+                        return
+                elif player.equipment.get(slot):
+                    # Single slot already occupied
+                    await player.send(f"You're already wearing something there.")
+                    return
+
+                player.inventory.remove(item)
+                player.equipment[actual_slot] = item
+                await player.send(f"You wear {item.short_desc}.")
+                await player.room.send_to_room(
+                    f"{player.name} wears {item.short_desc}.",
+                    exclude=[player]
+                )
+                return
+
+        await player.send(f"You don't have '{item_name}'.")
+        
+    @classmethod
+    async def cmd_wield(cls, player: 'Player', args: List[str]):
+        """Wield a weapon."""
+        if not args:
+            await player.send("Wield what?")
+            return
+            
+        item_name = ' '.join(args).lower()
+        
+        # Find item in inventory
+        for item in player.inventory:
+            if item_name in item.name.lower():
+                if item.item_type != 'weapon':
+                    await player.send(f"You can't wield {item.short_desc}.")
+                    return
+                    
+                # If already wielding, require dual wield skill and use off-hand slot
+                if player.equipment.get('wield'):
+                    if 'dual_wield' not in player.skills:
+                        await player.send("You're already wielding something.")
+                        return
+                    if player.equipment.get('dual_wield'):
+                        await player.send("You're already dual wielding.")
+                        return
+                    # Restrict to light weapons
+                    name_l = (item.name + ' ' + item.short_desc).lower()
+                    allowed_name = any(x in name_l for x in ['dagger', 'knife', 'stiletto', 'short sword', 'shortsword'])
+                    if getattr(item, 'weapon_type', '') not in ('pierce', 'stab') and not allowed_name:
+                        await player.send("Off-hand weapons must be daggers, knives, or short swords.")
+                        return
+                    player.inventory.remove(item)
+                    player.equipment['dual_wield'] = item
+                    await player.send(f"You off-hand {item.short_desc}.")
+                    await player.room.send_to_room(
+                        f"{player.name} off-hands {item.short_desc}.",
+                        exclude=[player]
+                    )
+                    try:
+                        from tips import TipManager
+                        await TipManager.show_tutorial_hint(player, 'tutorial_wield')
+                    except Exception:
+                        pass
+                    return
+                    
+                player.inventory.remove(item)
+                player.equipment['wield'] = item
+                await player.send(f"You wield {item.short_desc}.")
+                await player.room.send_to_room(
+                    f"{player.name} wields {item.short_desc}.",
+                    exclude=[player]
+                )
+                try:
+                    from tips import TipManager
+                    await TipManager.show_tutorial_hint(player, 'tutorial_wield')
+                except Exception:
+                    pass
+                return
+                
+        await player.send(f"You don't have '{item_name}'.")
+        
+    @classmethod
+    async def cmd_remove(cls, player: 'Player', args: List[str]):
+        """Remove worn equipment or 'remove all' to remove everything."""
+        if not args:
+            await player.send("Remove what?")
+            return
+
+        item_name = ' '.join(args).lower()
+
+        # Handle "remove all"
+        if item_name == 'all':
+            removed_count = 0
+            for slot, item in list(player.equipment.items()):
+                if item:
+                    player.equipment[slot] = None
+                    player.inventory.append(item)
+                    await cls._record_collection_item(player, item)
+                    await player.send(f"You remove {item.short_desc}.")
+                    removed_count += 1
+
+            if removed_count > 0:
+                await player.room.send_to_room(
+                    f"{player.name} removes several items.",
+                    exclude=[player]
+                )
+            else:
+                await player.send("You're not wearing anything to remove.")
+            return
+
+        # Find specific item in equipment
+        for slot, item in list(player.equipment.items()):
+            if item and item_name in item.name.lower():
+                player.equipment[slot] = None
+                player.inventory.append(item)
+                await cls._record_collection_item(player, item)
+                await player.send(f"You remove {item.short_desc}.")
+                await player.room.send_to_room(
+                    f"{player.name} removes {item.short_desc}.",
+                    exclude=[player]
+                )
+                return
+
+        await player.send(f"You're not wearing '{item_name}'.")
+        
+    @classmethod
+    async def cmd_give(cls, player: 'Player', args: List[str]):
+        """Give an item to someone."""
+        if len(args) < 2:
+            await player.send("Give what to whom?")
+            return
+            
+        item_name = args[0].lower()
+        target_name = args[-1].lower()
+        
+        # Find target
+        target = None
+        for char in player.room.characters:
+            if char != player and target_name in char.name.lower():
+                target = char
+                break
+                
+        if not target:
+            await player.send(f"You don't see '{target_name}' here.")
+            return
+            
+        # Find item
+        for item in player.inventory:
+            if item_name in item.name.lower():
+                player.inventory.remove(item)
+                if hasattr(target, 'inventory'):
+                    target.inventory.append(item)
+                await player.send(f"You give {item.short_desc} to {target.name}.")
+                if hasattr(target, 'send'):
+                    await target.send(f"{player.name} gives you {item.short_desc}.")
+                await player.room.send_to_room(
+                    f"{player.name} gives {item.short_desc} to {target.name}.",
+                    exclude=[player, target]
+                )
+                return
+                
+        await player.send(f"You don't have '{item_name}'.")
+    
+
+    @classmethod
+    async def cmd_junk(cls, player: 'Player', args: List[str]):
+        """Destroy an item. Usage: junk <item>"""
+        c = player.config.COLORS
+        
+        if not args:
+            await player.send(f"{c['yellow']}Junk what?{c['reset']}")
+            return
+        
+        item_name = ' '.join(args)
+        item = None
+        
+        # Find in inventory
+        for inv_item in player.inventory:
+            if item_name.lower() in inv_item.name.lower():
+                item = inv_item
+                break
+        
+        if not item:
+            await player.send(f"{c['red']}You don't have that.{c['reset']}")
+            return
+        
+        # Remove item
+        player.inventory.remove(item)
+        
+        # Small gold reward based on item value
+        reward = getattr(item, 'value', 0) // 10
+        if reward > 0:
+            player.gold += reward
+            await player.send(f"{c['green']}You junk {item.short_desc} and salvage {reward} gold.{c['reset']}")
+        else:
+            await player.send(f"{c['yellow']}You junk {item.short_desc}.{c['reset']}")
+
+    @classmethod
+    async def cmd_use(cls, player: 'Player', args: List[str]):
+        """Use an item (potion, scroll, wand, etc). Usage: use <item> [target]"""
+        c = player.config.COLORS
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send(f"{c['yellow']}Use what? Usage: use <item> [target]{c['reset']}")
+                return
+        
+        target_name = args[0].lower()
+        target_obj = None
+        for obj in player.inventory:
+            if target_name in obj.name.lower():
+                target_obj = obj
+                break
+        
+        if not target_obj:
+            await player.send(f"{c['red']}You don't have '{target_name}'.{c['reset']}")
+            return
+        
+        item_type = getattr(target_obj, 'item_type', '')
+        if item_type == 'potion':
+            # Quaff the potion
+            effects = getattr(target_obj, 'spell_effects', [])
+            await player.send(f"{c['bright_green']}You quaff {target_obj.short_desc}.{c['reset']}")
+            if player.room:
+                for char in player.room.characters:
+                    if char != player and hasattr(char, 'send'):
+                        await char.send(f"{c['white']}{player.name} quaffs {target_obj.short_desc}.{c['reset']}")
+            # Apply spell effects
+            from spells import SpellHandler as SpellManager
+            target = player
+            if len(args) > 1:
+                # Find target
+                target_arg = args[1].lower()
+                for char in player.room.characters:
+                    if target_arg in char.name.lower():
+                        target = char
+                        break
+            for effect in effects:
+                spell_name = effect if isinstance(effect, str) else effect.get('spell', '')
+                if spell_name:
+                    try:
+                        await SpellManager.apply_spell_effect(player, target, spell_name, getattr(target_obj, 'level', player.level))
+                    except Exception:
+                        pass
+            # If no spell effects, check for healing value
+            if not effects:
+                heal = getattr(target_obj, 'value', 0)
+                if heal and isinstance(heal, int) and heal > 0:
+                    player.hp = min(player.max_hp, player.hp + heal)
+                    await player.send(f"{c['bright_green']}You feel better! (+{heal} HP){c['reset']}")
+                else:
+                    # Generic small heal for potions without defined effects
+                    heal = max(10, player.level * 2)
+                    player.hp = min(player.max_hp, player.hp + heal)
+                    await player.send(f"{c['bright_green']}You feel better! (+{heal} HP){c['reset']}")
+            player.inventory.remove(target_obj)
+        elif item_type == 'scroll':
+            await player.send(f"{c['bright_cyan']}You recite {target_obj.short_desc}.{c['reset']}")
+            effects = getattr(target_obj, 'spell_effects', [])
+            from spells import SpellHandler as SpellManager
+            target = player
+            if len(args) > 1:
+                target_arg = args[1].lower()
+                for char in player.room.characters:
+                    if target_arg in char.name.lower():
+                        target = char
+                        break
+            for effect in effects:
+                spell_name = effect if isinstance(effect, str) else effect.get('spell', '')
+                if spell_name:
+                    try:
+                        await SpellManager.apply_spell_effect(player, target, spell_name, getattr(target_obj, 'level', player.level))
+                    except Exception:
+                        pass
+            player.inventory.remove(target_obj)
+        elif item_type == 'wand':
+            # Wands have charges
+            charges = getattr(target_obj, 'charges', 0)
+            if charges <= 0:
+                await player.send(f"{c['yellow']}{target_obj.short_desc} is out of charges.{c['reset']}")
+                return
+            await player.send(f"{c['bright_magenta']}You wave {target_obj.short_desc}.{c['reset']}")
+            effects = getattr(target_obj, 'spell_effects', [])
+            from spells import SpellHandler as SpellManager
+            target = player
+            if len(args) > 1:
+                target_arg = args[1].lower()
+                for char in player.room.characters:
+                    if target_arg in char.name.lower():
+                        target = char
+                        break
+            for effect in effects:
+                spell_name = effect if isinstance(effect, str) else effect.get('spell', '')
+                if spell_name:
+                    try:
+                        await SpellManager.apply_spell_effect(player, target, spell_name, getattr(target_obj, 'level', player.level))
+                    except Exception:
+                        pass
+            target_obj.charges = charges - 1
+            await player.send(f"{c['cyan']}({target_obj.charges} charges remaining){c['reset']}")
+            if target_obj.charges <= 0:
+                await player.send(f"{c['yellow']}{target_obj.short_desc} crumbles to dust.{c['reset']}")
+                player.inventory.remove(target_obj)
+        elif item_type == 'staff':
+            # Staves have charges, affect all enemies in room
+            charges = getattr(target_obj, 'charges', 0)
+            if charges <= 0:
+                await player.send(f"{c['yellow']}{target_obj.short_desc} is out of charges.{c['reset']}")
+                return
+            await player.send(f"{c['bright_magenta']}You tap {target_obj.short_desc}.{c['reset']}")
+            effects = getattr(target_obj, 'spell_effects', [])
+            from spells import SpellHandler as SpellManager
+            for effect in effects:
+                spell_name = effect if isinstance(effect, str) else effect.get('spell', '')
+                if spell_name:
+                    try:
+                        await SpellManager.apply_spell_effect(player, player, spell_name, getattr(target_obj, 'level', player.level))
+                    except Exception:
+                        pass
+            target_obj.charges = charges - 1
+            await player.send(f"{c['cyan']}({target_obj.charges} charges remaining){c['reset']}")
+            if target_obj.charges <= 0:
+                await player.send(f"{c['yellow']}{target_obj.short_desc} crumbles to dust.{c['reset']}")
+                player.inventory.remove(target_obj)
+        elif item_type == 'food':
+            await cls.cmd_eat(player, args)
+        elif item_type == 'drink':
+            await cls.cmd_drink(player, args)
+        else:
+            await player.send(f"{c['yellow']}You can't figure out how to use {target_obj.short_desc}.{c['reset']}")
+
+    @classmethod
+    async def cmd_recite(cls, player: 'Player', args: List[str]):
+        """Read a scroll. Usage: recite <scroll> [target]"""
+        await cls.cmd_use(player, args)
+
+    @classmethod
+    async def cmd_donate(cls, player: 'Player', args: List[str]):
+        """Donate an item to help newbies. Usage: donate <item>"""
+        c = player.config.COLORS
+        
+        if not args:
+            await player.send(f"{c['yellow']}Donate what?{c['reset']}")
+            return
+        
+        item_name = ' '.join(args)
+        item = None
+        
+        # Find in inventory
+        for inv_item in player.inventory:
+            if item_name.lower() in inv_item.name.lower():
+                item = inv_item
+                break
+        
+        if not item:
+            await player.send(f"{c['red']}You don't have that.{c['reset']}")
+            return
+        
+        # Remove from inventory
+        player.inventory.remove(item)
+        
+        # 75% chance goes to donation room, 25% junked
+        import random
+        if random.randint(1, 100) <= 75:
+            # Find donation room (3002 in Midgaard)
+            donation_room = player.world.rooms.get(3002) if hasattr(player, 'world') else None
+            if donation_room:
+                donation_room.items.append(item)
+                await player.send(f"{c['green']}You donate {item.short_desc}. It has been sent to the donation room.{c['reset']}")
+            else:
+                await player.send(f"{c['green']}You donate {item.short_desc}. The gods accept your generosity.{c['reset']}")
+        else:
+            await player.send(f"{c['yellow']}You donate {item.short_desc}, but it was too damaged to be useful.{c['reset']}")
+        
+        if player.room:
+            await player.room.send_to_room(f"{player.name} donates {item.short_desc}.", exclude=[player])
+
+    @classmethod
+    async def cmd_sets(cls, player: 'Player', args: List[str]):
+        """Show active zone set bonuses."""
+        c = player.config.COLORS
+        try:
+            from sets import ZONE_CATEGORIES, CATEGORY_BONUSES, get_set_bonus
+        except Exception:
+            await player.send(f"{c['yellow']}Set system not available.{c['reset']}")
+            return
+
+        # Count equipped pieces by set_id
+        set_counts = {}
+        for slot, item in getattr(player, 'equipment', {}).items():
+            if item and getattr(item, 'set_id', None):
+                set_id = item.set_id
+                if isinstance(set_id, str) and set_id.isdigit():
+                    set_id = int(set_id)
+                set_counts[set_id] = set_counts.get(set_id, 0) + 1
+
+        if not set_counts:
+            await player.send(f"{c['yellow']}You have no set pieces equipped.{c['reset']}")
+            return
+
+        current_zone = getattr(player.room.zone, 'number', None) if player.room and player.room.zone else None
+
+        await player.send(f"\n{c['bright_cyan']}╔══════════════════════════════════════════════════════╗{c['reset']}")
+        await player.send(f"{c['bright_cyan']}║{c['bright_yellow']}               ACTIVE SET BONUSES              {c['bright_cyan']}║{c['reset']}")
+        await player.send(f"{c['bright_cyan']}╚══════════════════════════════════════════════════════╝{c['reset']}")
+
+        for set_id, pieces in set_counts.items():
+            category = ZONE_CATEGORIES.get(set_id, 'unknown')
+            await player.send(f"\n{c['bright_green']}Set {set_id} ({category}) — {pieces} piece(s){c['reset']}")
+
+            # Always-on bonuses
+            always = get_set_bonus(set_id, pieces, in_zone=False)
+            if always:
+                await player.send(f"{c['white']}  Always-on:{c['reset']}")
+                for stat, val in always.items():
+                    await player.send(f"    {c['cyan']}{stat}{c['reset']}: +{val}")
+
+            # In-zone bonuses
+            in_zone = get_set_bonus(set_id, pieces, in_zone=True) if current_zone == set_id else {}
+            if in_zone:
+                await player.send(f"{c['white']}  In-zone:{c['reset']}")
+                for stat, val in in_zone.items():
+                    await player.send(f"    {c['bright_magenta']}{stat}{c['reset']}: +{val}")
+
+            if current_zone != set_id:
+                await player.send(f"{c['yellow']}  (Enter zone {set_id} to activate in-zone bonuses){c['reset']}")
@@ -0,0 +1,275 @@
+"""
+Misthollow Magic Commands
+========================
+Casting, spell lists and mage abilities.
+"""
+
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class MagicCommands:
+    """Magic commands."""
+
+    @classmethod
+    async def cmd_cast(cls, player: 'Player', args: List[str]):
+        """Cast a spell."""
+        c = player.config.COLORS
+
+        if not args:
+            await player.send("Cast what spell?")
+            return
+
+        # Check if player has any spells
+        if not player.spells:
+            await player.send(f"{c['red']}You don't know any spells!{c['reset']}")
+            return
+
+        # Join all args to handle quoted spell names
+        full_args = ' '.join(args)
+
+        # Remove quotes if present
+        full_args = full_args.replace("'", "").replace('"', '').strip()
+        
+        # Safety check for empty input after quote removal
+        if not full_args:
+            await player.send("Cast what spell?")
+            return
+        
+        # Smart spell matching: try progressively longer spell names
+        # This handles "animate dead knight" -> spell="animate_dead", target="knight"
+        words = full_args.lower().split()
+        if not words:
+            await player.send("Cast what spell?")
+            return
+            
+        matching_spell = None
+        target_name = None
+        
+        # Try matching 1 word, 2 words, 3 words as the spell name
+        for num_words in range(1, min(4, len(words) + 1)):
+            spell_try = '_'.join(words[:num_words])
+            
+            # Check exact match first
+            if spell_try in player.spells:
+                matching_spell = spell_try
+                target_name = ' '.join(words[num_words:]) if num_words < len(words) else None
+                break
+            
+            # Check prefix match
+            for spell_key in player.spells:
+                if spell_key.startswith(spell_try):
+                    matching_spell = spell_key
+                    target_name = ' '.join(words[num_words:]) if num_words < len(words) else None
+                    break
+            
+            if matching_spell:
+                break
+
+        if not matching_spell:
+            # Fall back to simple first-word matching
+            spell_input = words[0]
+            for spell_key in player.spells:
+                if spell_key == spell_input or spell_key.startswith(spell_input):
+                    matching_spell = spell_key
+                    target_name = ' '.join(words[1:]) if len(words) > 1 else None
+                    break
+
+        if not matching_spell:
+            await player.send(f"{c['red']}You don't know the spell '{words[0]}'!{c['reset']}")
+            await player.send(f"{c['cyan']}Type 'spells' to see your known spells.{c['reset']}")
+            return
+
+        from spells import SpellHandler
+        # Typed casts only lag input, and only when the spell went off
+        if await SpellHandler.cast_spell(player, matching_spell, target_name):
+            player.add_wait_state('cast')
+        
+    @classmethod
+    async def cmd_spells(cls, player: 'Player', args: List[str]):
+        """Show known spells."""
+        c = player.config.COLORS
+        
+        if not player.spells:
+            await player.send("You don't know any spells.")
+            return
+            
+        use_ascii = getattr(player, 'ascii_ui', False)
+        if use_ascii:
+            await player.send(f"{c['cyan']}+---------------------------------------+{c['reset']}")
+            await player.send(f"{c['cyan']}|{c['bright_yellow']}        Your Known Spells              {c['cyan']}|{c['reset']}")
+            await player.send(f"{c['cyan']}+---------------------------------------+{c['reset']}")
+        else:
+            await player.send(f"{c['cyan']}╔═══════════════════════════════════════╗{c['reset']}")
+            await player.send(f"{c['cyan']}║{c['bright_yellow']}        Your Known Spells              {c['cyan']}║{c['reset']}")
+            await player.send(f"{c['cyan']}╠═══════════════════════════════════════╣{c['reset']}")
+        
+        for spell, proficiency in player.spells.items():
+            spell_name = spell.replace('_', ' ').title()
+            from spells import SPELLS
+            spell_info = SPELLS.get(spell, {})
+            mana_cost = spell_info.get('mana_cost', 10)
+            if use_ascii:
+                await player.send(f"{c['cyan']}| {c['bright_magenta']}{spell_name:<20} {c['white']}Mana: {mana_cost:<3} {proficiency}%{c['cyan']}  |{c['reset']}")
+            else:
+                await player.send(f"{c['cyan']}║ {c['bright_magenta']}{spell_name:<20} {c['white']}Mana: {mana_cost:<3} {proficiency}%{c['cyan']}  ║{c['reset']}")
+            
+        if use_ascii:
+            await player.send(f"{c['cyan']}+---------------------------------------+{c['reset']}")
+        else:
+            await player.send(f"{c['cyan']}╚═══════════════════════════════════════╝{c['reset']}")
+        
+    # ----- MAGE: Arcane Charge Abilities -----
+
+    @classmethod
+    async def cmd_arcane_barrage(cls, player: 'Player', args: List[str]):
+        """Consume ALL Arcane Charges. Deals (charges * int * 2) arcane damage. No cooldown. Mage only."""
+        c = player.config.COLORS
+        import random
+
+        if player.char_class.lower() != 'mage':
+            await player.send(f"{c['red']}Only mages can use Arcane Barrage!{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
+            return
+
+        charges = getattr(player, 'arcane_charges', 0)
+        if charges <= 0:
+            await player.send(f"{c['red']}You have no Arcane Charges to consume!{c['reset']}")
+            return
+
+        target = player.fighting
+        damage = charges * player.int * 2
+
+        # Arcane Mastery: guaranteed crit at 6 charges
+        is_crit = False
+        try:
+            from talents import TalentManager
+            if TalentManager.get_talent_rank(player, 'arcane_mastery') > 0 and charges >= 6:
+                is_crit = True
+        except Exception:
+            pass
+        if is_crit:
+            damage = int(damage * 2)
+
+        player.arcane_charges = 0
+
+        # Arcane Echo: 25% chance to refund 2 charges
+        try:
+            from talents import TalentManager
+            if TalentManager.get_talent_rank(player, 'arcane_echo') > 0 and random.randint(1, 100) <= 25:
+                player.arcane_charges = 2
+                await player.send(f"{c['bright_cyan']}✨ Arcane Echo! 2 charges refunded!{c['reset']}")
+        except Exception:
+            pass
+
+        crit_msg = " **CRIT**" if is_crit else ""
+        await player.send(f"{c['bright_magenta']}✨ ARCANE BARRAGE! You unleash {charges} charges at {target.name}! [{damage}]{crit_msg}{c['reset']}")
+        if hasattr(target, 'send'):
+            await target.send(f"{c['bright_magenta']}{player.name} unleashes an arcane barrage at you! [{damage}]{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name} unleashes a barrage of arcane energy!", exclude=[player, target])
+
+        killed = await target.take_damage(damage, player)
+        if killed:
+            from combat import CombatHandler
+            await CombatHandler.handle_death(player, target)
+
+    @classmethod
+    async def cmd_evocation(cls, player: 'Player', args: List[str]):
+        """Restore 30% max mana + reset charges to 0. 120s CD. Mage only."""
+        c = player.config.COLORS
+        import time
+
+        if player.char_class.lower() != 'mage':
+            await player.send(f"{c['red']}Only mages can use Evocation!{c['reset']}")
+            return
+
+        now = time.time()
+        cd = getattr(player, 'evocation_cooldown', 0)
+        if now < cd:
+            await player.send(f"{c['yellow']}Evocation on cooldown ({int(cd - now)}s).{c['reset']}")
+            return
+
+        player.evocation_cooldown = now + 120
+        restored = int(player.max_mana * 0.30)
+        player.mana = min(player.max_mana, player.mana + restored)
+        player.arcane_charges = 0
+
+        await player.send(f"{c['bright_cyan']}✨ EVOCATION! You channel arcane energy, restoring {restored} mana!{c['reset']}")
+        await player.send(f"{c['cyan']}Arcane Charges reset to 0. [Mana: {player.mana}/{player.max_mana}]{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name} channels a surge of arcane energy!", exclude=[player])
+
+    @classmethod
+    async def cmd_arcane_blast(cls, player: 'Player', args: List[str]):
+        """int*3 + (charges * int) damage. Generates +1 charge. 8s CD. Mage only."""
+        c = player.config.COLORS
+        import time
+
+        if player.char_class.lower() != 'mage':
+            await player.send(f"{c['red']}Only mages can use Arcane Blast!{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
+            return
+
+        now = time.time()
+        cd = getattr(player, 'arcane_blast_cooldown', 0)
+        if now < cd:
+            await player.send(f"{c['yellow']}Arcane Blast on cooldown ({int(cd - now)}s).{c['reset']}")
+            return
+
+        charges = getattr(player, 'arcane_charges', 0)
+        mana_cost = 20 + int(20 * charges * 0.10)  # +10% per charge
+
+        # Arcane stability reduces the cost increase
+        try:
+            from talents import TalentManager
+            stability = TalentManager.get_talent_rank(player, 'arcane_stability')
+            mana_cost = 20 + int(20 * charges * max(0, 0.10 - stability * 0.02))
+        except Exception:
+            pass
+
+        if player.mana < mana_cost:
+            await player.send(f"{c['red']}You need {mana_cost} mana! (Current: {player.mana}){c['reset']}")
+            return
+
+        target = player.fighting
+        player.mana -= mana_cost
+        player.arcane_blast_cooldown = now + 8
+
+        damage = player.int * 3 + charges * player.int
+
+        # Charge damage bonus from arcane_potency
+        try:
+            from talents import TalentManager
+            potency = TalentManager.get_talent_rank(player, 'arcane_potency')
+            if potency > 0 and charges > 0:
+                damage += int(charges * player.int * potency * 0.01)
+        except Exception:
+            pass
+
+        # Generate a charge
+        max_charges = getattr(player, 'max_arcane_charges', 5)
+        try:
+            from talents import TalentManager
+            if TalentManager.get_talent_rank(player, 'arcane_mastery') > 0:
+                max_charges = 6
+        except Exception:
+            pass
+        if player.arcane_charges < max_charges:
+            player.arcane_charges += 1
+            await player.send(f"{c['bright_cyan']}[Arcane Charges: {player.arcane_charges}/{max_charges}]{c['reset']}")
+
+        await player.send(f"{c['bright_magenta']}✨ ARCANE BLAST hits {target.name}! [{damage}]{c['reset']}")
+        if hasattr(target, 'send'):
+            await target.send(f"{c['bright_magenta']}{player.name} blasts you with arcane energy! [{damage}]{c['reset']}")
+
+        killed = await target.take_damage(damage, player)
+        if killed:
+            from combat import CombatHandler
+            await CombatHandler.handle_death(player, target)
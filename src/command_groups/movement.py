@@ -0,0 +1,1964 @@
+"""
+Misthollow Movement Commands
+===========================
+Walking, positions, doors, travel and mounts.
+"""
+
+import random
+import re
+from typing import List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+from config import Config
+
+# Speedwalk steps: '3n2e' runs, or a direction word with an optional count
+_SPEEDWALK_RUN = re.compile(r'(?:\d*[nsewud])+')
+_SPEEDWALK_STEP = re.compile(r'(\d*)([nsewud])')
+_SPEEDWALK_WORD = re.compile(r'(\d*)(north|south|east|west|up|down)')
+
+
+class MovementCommands:
+    """Movement commands."""
+
+    @classmethod
+    async def cmd_move(cls, player: 'Player', direction: str):
+        """Move in a direction."""
+        if not player.room:
+            await player.send("You are nowhere!")
+            return
+            
+        if player.position == 'sleeping':
+            await player.send("You are sleeping! Wake up first.")
+            return
+
+        # Clear stale fighting state
+        if player.position == 'fighting':
+            # Check if actually fighting someone valid
+            if not player.fighting or player.fighting.hp <= 0 or player.fighting not in player.room.characters:
+                player.fighting = None
+                player.position = 'standing'
+            else:
+                await player.send("You're fighting! Flee if you want to escape.")
+                return
+            
+        if player.position in ('resting', 'sitting'):
+            await player.send("You need to stand up first.")
+            return
+            
+        exit_data = player.room.exits.get(direction)
+        if not exit_data:
+            await player.send("You can't go that way.")
+            return
+
+        # Hidden exit check
+        if exit_data.get('hidden'):
+            if not hasattr(player, 'discovered_exits') or (player.room.vnum, direction) not in player.discovered_exits:
+                await player.send("You can't go that way.")
+                return
+
+        # Check for closed/locked door
+        c = player.config.COLORS
+        if 'door' in exit_data:
+            door = exit_data['door']
+            door_name = door.get('name', 'door')
+            is_closed = door.get('state') == 'closed' or door.get('closed', False)
+            is_locked = door.get('locked', False)
+            
+            if is_closed:
+                if is_locked:
+                    await player.send(f"{c['red']}The {door_name} is closed and locked.{c['reset']}")
+                else:
+                    await player.send(f"{c['red']}The {door_name} is closed.{c['reset']}")
+                return
+        
+        # Also check for door/closed/locked in flags array (alternate format)
+        exit_flags = exit_data.get('flags', [])
+        if 'door' in exit_flags and 'closed' in exit_flags:
+            door_name = exit_data.get('keyword', 'door').split()[0] if exit_data.get('keyword') else 'door'
+            is_locked = 'locked' in exit_flags
+            if is_locked:
+                await player.send(f"{c['red']}The {door_name} is closed and locked.{c['reset']}")
+            else:
+                await player.send(f"{c['red']}The {door_name} is closed.{c['reset']}")
+            return
+
+        target_room = exit_data.get('room')
+        if not target_room:
+            await player.send("That exit seems to lead nowhere...")
+            return
+
+        # Class-only room restriction
+        for flag in getattr(target_room, 'flags', set()):
+            if isinstance(flag, str) and flag.startswith('class_only:'):
+                allowed = [c.strip().lower() for c in flag.split(':', 1)[1].split(',') if c.strip()]
+                if player.char_class.lower() not in allowed:
+                    allowed_display = ', '.join([c.title() for c in allowed])
+                    await player.send(f"{c['red']}Only {allowed_display} may enter.{c['reset']}")
+                    return
+
+        # Immortal-only rooms
+        if 'imm_only' in getattr(target_room, 'flags', set()) and not player.is_immortal:
+            await player.send(f"{c['red']}A divine force prevents you from entering.{c['reset']}")
+            return
+
+        # Reputation-based gate for faction-controlled areas
+        if exit_data.get('faction_required'):
+            try:
+                from factions import FactionManager
+                faction_key = FactionManager.normalize_key(exit_data.get('faction_required'))
+                min_rep = exit_data.get('min_reputation', 0)
+                min_rep_level = exit_data.get('min_rep_level')
+                if min_rep_level:
+                    min_rep = max(min_rep, FactionManager.get_threshold_for_level(min_rep_level))
+                if faction_key and FactionManager.get_reputation(player, faction_key) < min_rep:
+                    c = player.config.COLORS
+                    await player.send(f"{c['yellow']}You are not trusted enough by {FactionManager.format_faction_detail(player, faction_key)[0].split(' - ')[0]} to enter.{c['reset']}")
+                    return
+            except Exception:
+                pass
+            
+        # Check movement points
+        move_cost = cls._calculate_move_cost(player, target_room)
+
+        if player.move < move_cost:
+            await player.send("You are too exhausted to move!")
+            return
+            
+        # Check if sneaking and make skill check
+        sneak_success = False
+        if 'sneaking' in player.flags and not player.mount:
+            import random
+            sneak_skill = player.skills.get('sneak', 0)
+            # Skill check to move silently - easier than initial sneak
+            if random.randint(1, 100) <= sneak_skill + 10:
+                sneak_success = True
+                # Small chance to improve skill
+                if random.randint(1, 100) <= 5:
+                    await player.improve_skill('sneak', difficulty=2)
+            else:
+                # Failed sneak check - break stealth
+                player.flags.discard('sneaking')
+                c = player.config.COLORS
+                await player.send(f"{c['yellow']}You make a noise and break your stealth!{c['reset']}")
+
+        # Leave message (only if not sneaking successfully)
+        if not sneak_success:
+            affect_flags = getattr(player, 'affect_flags', set())
+            if player.mount:
+                await player.room.send_to_room(
+                    f"{player.name} rides {player.mount.name} {direction}.",
+                    exclude=[player]
+                )
+            elif 'fly' in affect_flags:
+                await player.room.send_to_room(
+                    f"{player.name} soars {direction}.",
+                    exclude=[player]
+                )
+            elif 'sanctuary' in affect_flags:
+                await player.room.send_to_room(
+                    f"{player.name} glides {direction}, a holy aura trailing behind.",
+                    exclude=[player]
+                )
+            else:
+                await player.room.send_to_room(
+                    f"{player.name} leaves {direction}.",
+                    exclude=[player]
+                )
+
+        # Track old room for transition messages
+        old_room = player.room
+
+        # Move player
+        player.room.characters.remove(player)
+
+        player.room = target_room
+        target_room.characters.append(player)
+        
+        # Track explored rooms for map
+        if not hasattr(player, 'explored_rooms'):
+            player.explored_rooms = set()
+        player.explored_rooms.add(target_room.vnum)
+
+        # Deathtrap rooms
+        if player.room and ('deathtrap' in player.room.flags or 'death' in player.room.flags):
+            from combat import CombatHandler
+            c = player.config.COLORS
+            # Dex + perception save to avoid deathtrap
+            try:
+                import random
+                save = player.dex + player.get_perception() + random.randint(1, 20)
+            except Exception:
+                save = player.dex + random.randint(1, 20)
+            if save >= 35:
+                await player.send(f"{c['yellow']}You catch yourself at the last second and stumble back!{c['reset']}")
+                # Move back to old room
+                if old_room:
+                    player.room.characters.remove(player)
+                    player.room = old_room
+                    old_room.characters.append(player)
+                return
+            await player.send(f"{c['red']}You trigger a deadly trap!{c['reset']}")
+            # Deathtrap achievement (unlocks before death)
+            try:
+                from achievements import AchievementManager
+                await AchievementManager.check_deathtrap(player)
+            except Exception:
+                pass
+            await CombatHandler.handle_death(player, player)
+            return
+
+        player.move -= move_cost
+
+        # End bard performance on movement
+        if player.performing:
+            c = player.config.COLORS
+            from spells import BARD_SONGS
+            song = BARD_SONGS.get(player.performing, {})
+            await player.send(f"{c['yellow']}Your {song.get('name', 'song')} ends as you move.{c['reset']}")
+            player.performing = None
+            player.performance_ticks = 0
+            player.encore_active = False
+
+        # Quest visit progress
+        from quests import QuestManager
+        await QuestManager.check_quest_progress(
+            player, 'visit', {'room_vnum': getattr(player.room, 'vnum', 0)}
+        )
+
+        # Achievement exploration tracking
+        try:
+            from achievements import AchievementManager
+            await AchievementManager.check_exploration(player, getattr(player.room, 'vnum', 0))
+        except Exception:
+            pass
+
+        # Journal zone discovery - check if entering a new zone
+        try:
+            from journal import JournalManager
+            if hasattr(target_room, 'zone') and target_room.zone:
+                zone = target_room.zone
+                zone_id = getattr(zone, 'number', None)
+                zone_key = f"zone_{zone_id}" if zone_id is not None else zone.name.lower().replace(' ', '_')
+                if not JournalManager.has_entry(player, f'area:{zone_key}'):
+                    zone_desc = getattr(zone, 'description', '') or f"You have discovered {zone.name}."
+                    await JournalManager.discover_area(
+                        player, zone_key, zone.name, zone_desc
+                    )
+        except Exception:
+            pass
+
+        # Waypoint discovery
+        try:
+            from travel import discover_waypoint
+            discovered = discover_waypoint(player, getattr(player.room, 'vnum', 0))
+            if discovered:
+                key, info = discovered
+                await player.send(f"{c['bright_cyan']}Waypoint discovered: {info['name']}{c['reset']}")
+        except Exception:
+            pass
+
+        # Contextual hints for new players
+        try:
+            from tips import TipManager
+            # Gathering room hint
+            if hasattr(target_room, 'resource_nodes') and target_room.resource_nodes:
+                await TipManager.show_contextual_hint(player, 'gathering_room')
+            elif hasattr(target_room, 'flags') and any(f in getattr(target_room, 'flags', []) for f in ('mine', 'forage', 'fish', 'gathering')):
+                await TipManager.show_contextual_hint(player, 'gathering_room')
+            # Quest giver hint - check for NPCs with available quests
+            from quests import QuestManager
+            for npc in getattr(target_room, 'characters', []):
+                if hasattr(npc, 'vnum') and not hasattr(npc, 'connection'):
+                    npc_vnum = getattr(npc, 'vnum', None)
+                    if npc_vnum and QuestManager.get_available_quests(player, npc_vnum):
+                        await TipManager.show_contextual_hint(player, 'quest_giver')
+                        break
+            # Tutorial movement prompt (one-time)
+            await TipManager.show_tutorial_hint(player, 'tutorial_move')
+        except Exception:
+            pass
+
+        # Auto-pickup gold
+        if getattr(player, 'autogold', False) and player.room.gold > 0:
+            gold_amount = player.room.gold
+            player.gold += gold_amount
+            player.room.gold = 0
+            await player.send(f"{c['yellow']}You pick up {gold_amount} gold coins. You now have {player.gold} gold.{c['reset']}")
+
+        # Web map update (a speedwalk pushes the map once, when it stops)
+        speedwalk = getattr(player, 'speedwalk', None)
+        if speedwalk is None and hasattr(player.world, 'web_map') and player.world.web_map:
+            await player.world.web_map.notify_player(player)
+
+        # Sneak detection check in new room
+        import time, random
+        if sneak_success and 'sneaking' in player.flags:
+            env_bonus = 0
+            if player.room:
+                if getattr(player.room, 'is_dark', False):
+                    env_bonus += 20
+                if player.room.sector_type in ('forest','swamp'):
+                    env_bonus += 10
+            if player.has_light_source():
+                env_bonus -= 25
+            sneak_roll = player.skills.get('sneak', 0) + (player.get_skill_level('hide') // 2) + player.dex + env_bonus + player.get_equipment_bonus('sneak') + random.randint(1,20)
+            for observer in list(target_room.characters):
+                if observer == player:
+                    continue
+                det = 0
+                if hasattr(observer, 'get_perception'):
+                    det = observer.get_perception()
+                else:
+                    det = int((getattr(observer,'wis',10)+getattr(observer,'dex',10))/2 + getattr(observer,'level',1)/5)
+                if getattr(observer, 'ai_state', {}).get('searching_until', 0) > time.time():
+                    det += 15
+                det += random.randint(1,20)
+                if det > sneak_roll:
+                    player.exposed_until = time.time() + random.randint(10,30)
+                    if hasattr(observer, 'ai_state'):
+                        observer.ai_state['searching_until'] = time.time() + random.randint(10,20)
+                        # no-track gear prevents tracking lock
+                        if player.get_equipment_bonus('no_track') <= 0:
+                            observer.ai_state['track_target'] = player
+                            observer.ai_state['track_until'] = time.time() + random.randint(10,20)
+                            if hasattr(observer, 'wake'):
+                                observer.wake()
+                    if player.get_equipment_bonus('no_track') <= 0:
+                        player.tracked_by = observer
+                    await player.send(f"{c['red']}You are spotted!{c['reset']}")
+                    if hasattr(observer, 'send'):
+                        await observer.send(f"You notice a shadowy figure slipping by: {player.name}.")
+                    await target_room.send_to_room(
+                        f"{observer.name} narrows their eyes and scans the shadows.",
+                        exclude=[player]
+                    )
+                    break
+
+        # Arrival message (only if not sneaking successfully)
+        if not sneak_success:
+            opposite = Config.DIRECTIONS.get(direction, {}).get('opposite', 'somewhere')
+            affect_flags = getattr(player, 'affect_flags', set())
+            if player.mount:
+                await target_room.send_to_room(
+                    f"{player.name} arrives from the {opposite}, riding {player.mount.name}.",
+                    exclude=[player]
+                )
+            elif 'fly' in affect_flags:
+                await target_room.send_to_room(
+                    f"{player.name} soars in from the {opposite}.",
+                    exclude=[player]
+                )
+            elif 'sanctuary' in affect_flags:
+                await target_room.send_to_room(
+                    f"{player.name} glides in from the {opposite}, wreathed in a holy aura.",
+                    exclude=[player]
+                )
+            else:
+                await target_room.send_to_room(
+                    f"{player.name} arrives from the {opposite}.",
+                    exclude=[player]
+                )
+        
+        # Move companions who are following
+        if hasattr(player, 'companions') and player.companions:
+            from companions import Companion
+            for companion in list(player.companions):
+                if isinstance(companion, Companion):
+                    if companion.order == 'follow' and not companion.ai_state.get('staying', False):
+                        if companion.room and companion in companion.room.characters:
+                            companion.room.characters.remove(companion)
+                        companion.room = target_room
+                        target_room.characters.append(companion)
+
+        # Move pets who are following (not staying)
+        # Check both player.pets (legacy) and player.companions for Pet instances
+        pets_arriving = []
+        all_pets = list(getattr(player, 'pets', []) or [])
+        if hasattr(player, 'companions') and player.companions:
+            from pets import Pet as PetClass
+            for comp in player.companions:
+                if isinstance(comp, PetClass) and comp not in all_pets:
+                    all_pets.append(comp)
+        if all_pets:
+            from pets import Pet
+            for pet in list(all_pets):
+                if isinstance(pet, Pet):
+                    # Skip if pet is staying in place
+                    if getattr(pet, 'ai_state', {}).get('staying', False):
+                        # But if pet is in the target room, clear staying (owner arrived)
+                        if pet.room == target_room:
+                            pet.ai_state['staying'] = False
+                        continue
+                    # Move pet to follow owner
+                    if pet.room and pet.room != target_room:
+                        if pet in pet.room.characters:
+                            pet.room.characters.remove(pet)
+                        pet.room = target_room
+                        if pet not in target_room.characters:
+                            target_room.characters.append(pet)
+                        pets_arriving.append(pet)
+        
+        # Announce pets arriving with player
+        if pets_arriving and not sneak_success:
+            pet_names = ', '.join([p.name for p in pets_arriving])
+            await target_room.send_to_room(
+                f"{c['magenta']}{pet_names} follows {player.name} in.{c['reset']}",
+                exclude=[player]
+            )
+            await player.send(f"{c['magenta']}Your pets follow you.{c['reset']}")
+
+        # Move players who are following this player
+        followers_moved = []
+        for char in list(old_room.characters):
+            if hasattr(char, 'following') and char.following == player:
+                if hasattr(char, 'connection'):  # Is a player
+                    # Check if follower can move
+                    if char.move >= 1:
+                        # Move follower
+                        if char in old_room.characters:
+                            old_room.characters.remove(char)
+                        char.room = target_room
+                        if char not in target_room.characters:
+                            target_room.characters.append(char)
+                        char.move = max(0, char.move - 1)
+                        followers_moved.append(char)
+        
+        # Announce followers arriving
+        if followers_moved and not sneak_success:
+            for follower in followers_moved:
+                await target_room.send_to_room(
+                    f"{follower.name} follows {player.name} in.",
+                    exclude=[player, follower]
+                )
+                await follower.send(f"{c['cyan']}You follow {player.name} {direction}.{c['reset']}")
+                if speedwalk is not None:
+                    speedwalk.add(follower)  # Shown where the speedwalk ends
+                    continue
+                # Show room to follower
+                await follower.do_look([])
+                # Update web map for follower
+                if hasattr(player.world, 'web_map') and player.world.web_map:
+                    await player.world.web_map.notify_player(follower)
+
+        # Atmospheric transition message when moving between different area types
+        try:
+            from atmosphere import AtmosphereManager
+            game_time = player.world.game_time if hasattr(player, 'world') and player.world else None
+            transition_msg = AtmosphereManager.get_transition_message(old_room, target_room, game_time)
+            if transition_msg:
+                await player.send(f"{c['blue']}{transition_msg}{c['reset']}")
+        except Exception:
+            pass
+
+        # Show new room
+        if speedwalk is None:
+            await player.do_look([])
+
+        # Room entry triggers (NPC greetings, etc.)
+        await cls._room_entry_triggers(player)
+
+    @classmethod
+    async def _room_entry_triggers(cls, player: 'Player'):
+        """Handle NPC greeting triggers when a player enters a room."""
+        if not player.room:
+            return
+        c = player.config.COLORS
+
+        # Sage Aldric greets players with active tutorial quests
+        for npc in player.room.characters:
+            if getattr(npc, 'special', None) in ('sage_aldric', 'quest_giver') and 'aldric' in getattr(npc, 'name', '').lower():
+                if player.level < 10:
+                    completed = getattr(player, 'quests_completed', None) or []
+                    active_tutorial = any(
+                        q.quest_id.startswith('tutorial_')
+                        for q in getattr(player, 'active_quests', [])
+                    )
+                    if 'tutorial_1_awakening' not in completed and not active_tutorial:
+                        await player.send(
+                            f"\r\n{c['bright_cyan']}Sage Aldric tells you, "
+                            f"'Welcome, young {player.name}! I am Sage Aldric, guide to new adventurers. "
+                            f"Speak with me to begin your training — simply type "
+                            f"{c['bright_white']}talk aldric{c['bright_cyan']}"
+                            f" and I shall set you on your path.'{c['reset']}"
+                        )
+                    elif active_tutorial:
+                        from quests import QuestManager
+                        has_awakening = QuestManager.has_active_quest(player, 'tutorial_1_awakening')
+                        if has_awakening:
+                            await player.send(
+                                f"\r\n{c['bright_cyan']}Sage Aldric tells you, "
+                                f"'Welcome, young {player.name}! I am Sage Aldric, guide to new adventurers. "
+                                f"Speak with me to begin your training — simply type "
+                                f"{c['bright_white']}talk aldric{c['bright_cyan']}"
+                                f" and I shall set you on your path.'{c['reset']}"
+                            )
+                        else:
+                            await player.send(
+                                f"\r\n{c['bright_cyan']}Sage Aldric tells you, "
+                                f"'How goes your training, {player.name}? Remember, type "
+                                f"{c['bright_white']}hint{c['bright_cyan']}"
+                                f" if you need guidance.'{c['reset']}"
+                            )
+                    else:
+                        # Player completed tutorial - give progression guidance
+                        if player.level < 5:
+                            await player.send(
+                                f"\r\n{c['bright_cyan']}Sage Aldric tells you, "
+                                f"'Well done on completing your training, {player.name}! "
+                                f"Venture to the Light Forest west of the city gates — Ranger Thornwood can guide you. "
+                                f"Check the quest board in Temple Square for more opportunities!'{c['reset']}"
+                            )
+                        elif player.level < 10:
+                            await player.send(
+                                f"\r\n{c['bright_cyan']}Sage Aldric tells you, "
+                                f"'You grow strong, {player.name}! "
+                                f"The Great Northern Forest to the north holds challenges worthy of your skill. "
+                                f"Or seek the Orc Enclave if you crave real danger!'{c['reset']}"
+                            )
+                        else:
+                            await player.send(
+                                f"\r\n{c['bright_cyan']}Sage Aldric tells you, "
+                                f"'You have outgrown my teachings, {player.name}! "
+                                f"Seek Grimjaw in the Mines of Moria, or travel east to the city of Thalos. "
+                                f"The quest board in Temple Square lists all known adventures!'{c['reset']}"
+                            )
+                break
+
+    @classmethod
+    def _calculate_move_cost(cls, player: 'Player', target_room: 'Room') -> int:
+        sector = player.config.SECTOR_TYPES.get(target_room.sector_type, {'move_cost': 1})
+        move_cost = sector['move_cost']
+
+        terrain_mods = getattr(player.config, 'TERRAIN_MOVE_COST_MODIFIERS', {})
+        move_cost = int(max(1, move_cost * terrain_mods.get(target_room.sector_type, 1.0)))
+
+        # Weather movement modifier (outdoors only)
+        if player.room and player.room.zone and player.room.sector_type in {
+            'field', 'forest', 'hills', 'mountain', 'water_swim', 'water_noswim',
+            'flying', 'desert', 'swamp'
+        }:
+            weather = player.room.zone.weather
+            if weather:
+                move_cost = int(max(1, move_cost * weather.get_movement_modifier()))
+
+        # Can't sneak on water - cancel sneak
+        if hasattr(player, 'flags') and 'sneaking' in player.flags:
+            if target_room.sector_type in ('water_swim', 'water_noswim'):
+                player.flags.discard('sneaking')
+                if hasattr(player, 'send'):
+                    import asyncio
+                    asyncio.ensure_future(player.send(f"{player.config.COLORS['yellow']}You can't sneak on water!{player.config.COLORS['reset']}"))
+            else:
+                # Sneaking movement penalty (terrain-aware)
+                sneak_mods = {
+                    'city': 1.1,
+                    'indoors': 1.2,
+                    'field': 1.4,
+                    'forest': 1.8,
+                    'swamp': 2.0,
+                    'hills': 1.6,
+                    'mountain': 2.0,
+                    'desert': 1.5,
+                    'flying': 1.6,
+                }
+                move_cost = int(max(1, move_cost * sneak_mods.get(target_room.sector_type, 1.3)))
+
+        # Watercraft in inventory reduces water movement cost
+        if target_room.sector_type in ('water_swim', 'water_noswim'):
+            best_reduction = 0
+            for item in player.inventory:
+                if getattr(item, 'item_type', None) == 'boat':
+                    reduction = getattr(item, 'water_speed', 0.5)
+                    best_reduction = max(best_reduction, reduction)
+            # Also check equipment (held items)
+            for slot, item in player.equipment.items():
+                if item and getattr(item, 'item_type', None) == 'boat':
+                    reduction = getattr(item, 'water_speed', 0.5)
+                    best_reduction = max(best_reduction, reduction)
+            if best_reduction > 0:
+                move_cost = max(1, int(move_cost * (1 - best_reduction)))
+
+        # Mounted movement bonus (reduced movement cost)
+        if player.mount:
+            bonus = getattr(player.mount, 'speed_bonus', 0.5)
+            move_cost = max(1, int(move_cost * (1 - bonus)))
+
+        return move_cost
+        
+    @classmethod
+    async def cmd_north(cls, player: 'Player', args: List[str]):
+        await cls.cmd_move(player, 'north')
+        
+    @classmethod
+    async def cmd_south(cls, player: 'Player', args: List[str]):
+        await cls.cmd_move(player, 'south')
+        
+    @classmethod
+    async def cmd_east(cls, player: 'Player', args: List[str]):
+        await cls.cmd_move(player, 'east')
+        
+    @classmethod
+    async def cmd_west(cls, player: 'Player', args: List[str]):
+        await cls.cmd_move(player, 'west')
+        
+    @classmethod
+    async def cmd_up(cls, player: 'Player', args: List[str]):
+        await cls.cmd_move(player, 'up')
+        
+    @classmethod
+    async def cmd_down(cls, player: 'Player', args: List[str]):
+        await cls.cmd_move(player, 'down')
+
+    # ==================== POSITIONS ====================
+
+    @classmethod
+    async def cmd_sit(cls, player: 'Player', args: List[str]):
+        """Sit down."""
+        if player.is_fighting:
+            await player.send("You can't sit while fighting!")
+            return
+        if player.position == 'sitting':
+            await player.send("You're already sitting.")
+            return
+        player.position = 'sitting'
+        await player.send("You sit down.")
+        await player.room.send_to_room(f"{player.name} sits down.", exclude=[player])
+        
+    @classmethod
+    async def cmd_rest(cls, player: 'Player', args: List[str]):
+        """Rest to regenerate faster."""
+        if player.is_fighting:
+            await player.send("You can't rest while fighting!")
+            return
+        if player.position == 'resting':
+            await player.send("You're already resting.")
+            return
+        player.position = 'resting'
+        await player.send("You rest and begin to recuperate.")
+        await player.room.send_to_room(f"{player.name} rests.", exclude=[player])
+        # Revive knocked-out combat companion
+        if hasattr(player, 'combat_companion') and player.combat_companion and player.combat_companion.knocked_out:
+            if player.combat_companion.rest_revive():
+                c = player.config.COLORS
+                await player.send(f"{c['bright_green']}{player.combat_companion.name} revives and is ready to fight again!{c['reset']}")
+        
+    @classmethod
+    async def cmd_sleep(cls, player: 'Player', args: List[str]):
+        """Go to sleep."""
+        if player.is_fighting:
+            await player.send("You can't sleep while fighting!")
+            return
+        if player.position == 'sleeping':
+            await player.send("You're already asleep.")
+            return
+        player.position = 'sleeping'
+        await player.send("You go to sleep.")
+        await player.room.send_to_room(f"{player.name} goes to sleep.", exclude=[player])
+        # Revive knocked-out combat companion
+        if hasattr(player, 'combat_companion') and player.combat_companion and player.combat_companion.knocked_out:
+            if player.combat_companion.rest_revive():
+                c = player.config.COLORS
+                await player.send(f"{c['bright_green']}{player.combat_companion.name} revives and is ready to fight again!{c['reset']}")
+        
+    @classmethod
+    async def cmd_wake(cls, player: 'Player', args: List[str]):
+        """Wake up."""
+        if player.position != 'sleeping':
+            await player.send("You're not sleeping!")
+            return
+        player.position = 'standing'
+        await player.send("You wake and stand up.")
+        await player.room.send_to_room(f"{player.name} wakes up.", exclude=[player])
+        
+    @classmethod
+    async def cmd_stand(cls, player: 'Player', args: List[str]):
+        """Stand up."""
+        if player.position == 'standing':
+            await player.send("You're already standing.")
+            return
+        if player.position == 'sleeping':
+            await player.send("You wake and stand up.")
+        else:
+            await player.send("You stand up.")
+        player.position = 'standing'
+        await player.room.send_to_room(f"{player.name} stands up.", exclude=[player])
+
+    # ==================== DOORS ====================
+
+    @classmethod
+    async def cmd_open(cls, player: 'Player', args: List[str]):
+        """Open a door or container. Usage: open <door/container>"""
+        if not args:
+            await player.send("Open what?")
+            return
+
+        c = player.config.COLORS
+        target_name = ' '.join(args).lower()
+
+        # Check for container first
+        container = None
+        for item in player.inventory + player.room.items:
+            if target_name in item.name.lower():
+                if hasattr(item, 'item_type') and item.item_type == 'container':
+                    container = item
+                    break
+
+        if container:
+            if not hasattr(container, 'is_closed'):
+                await player.send(f"{c['yellow']}The {container.name} doesn't open and close.{c['reset']}")
+                return
+
+            if not container.is_closed:
+                await player.send(f"{c['yellow']}The {container.name} is already open.{c['reset']}")
+                return
+
+            # Check if locked
+            if hasattr(container, 'is_locked') and container.is_locked:
+                await player.send(f"{c['red']}The {container.name} is locked.{c['reset']}")
+                return
+
+            container.is_closed = False
+            await player.send(f"{c['green']}You open {container.short_desc}.{c['reset']}")
+            await player.room.send_to_room(
+                f"{player.name} opens {container.short_desc}.",
+                exclude=[player]
+            )
+            return
+
+        # Check for door - handle "door north", "door n", "north", or door names like "trapdoor"
+        direction = None
+        door = None
+        exit_data = None
+
+        # Remove "door" from the target name if present
+        if target_name.startswith('door '):
+            target_name = target_name[5:].strip()
+
+        # First try to match by direction
+        for dir_name in player.config.DIRECTIONS.keys():
+            if target_name == dir_name or target_name in dir_name:
+                direction = dir_name
+                break
+
+        if direction and direction in player.room.exits and player.room.exits[direction]:
+            exit_data = player.room.exits[direction]
+            if 'door' in exit_data:
+                door = exit_data['door']
+
+        # If no door found by direction, try to find by door name
+        if not door:
+            for dir_name, ex_data in player.room.exits.items():
+                if ex_data and 'door' in ex_data:
+                    door_obj = ex_data['door']
+                    door_name = door_obj.get('name', 'door').lower()
+                    if target_name in door_name or door_name in target_name:
+                        door = door_obj
+                        exit_data = ex_data
+                        direction = dir_name
+                        break
+
+        if not door:
+            await player.send(f"{c['red']}You don't see a '{target_name}' to open here.{c['reset']}")
+            return
+
+        if door.get('state') != 'closed':
+            await player.send(f"{c['yellow']}The door is already open.{c['reset']}")
+            return
+
+        # Check if locked
+        if door.get('locked', False):
+            await player.send(f"{c['red']}The door is locked.{c['reset']}")
+            return
+
+        # Check if magically blocked
+        if door.get('magically_blocked', False):
+            await player.send(f"{c['red']}The door is magically sealed!{c['reset']}")
+            return
+
+        door['state'] = 'open'
+        await player.send(f"{c['green']}You open the {door.get('name', 'door')} {direction}.{c['reset']}")
+        await player.room.send_to_room(
+            f"{player.name} opens the {door.get('name', 'door')} {direction}.",
+            exclude=[player]
+        )
+
+        # Update the other side of the door
+        next_room = exit_data.get('room')
+        if next_room:
+            opposite_dir = player.config.DIRECTIONS[direction]['opposite']
+            if opposite_dir in next_room.exits and 'door' in next_room.exits[opposite_dir]:
+                next_room.exits[opposite_dir]['door']['state'] = 'open'
+
+    @classmethod
+    async def cmd_close(cls, player: 'Player', args: List[str]):
+        """Close a door or container. Usage: close <door/container>"""
+        if not args:
+            await player.send("Close what?")
+            return
+
+        c = player.config.COLORS
+        target_name = ' '.join(args).lower()
+
+        # Check for container first
+        container = None
+        for item in player.inventory + player.room.items:
+            if target_name in item.name.lower():
+                if hasattr(item, 'item_type') and item.item_type == 'container':
+                    container = item
+                    break
+
+        if container:
+            if not hasattr(container, 'is_closed'):
+                await player.send(f"{c['yellow']}The {container.name} doesn't open and close.{c['reset']}")
+                return
+
+            if container.is_closed:
+                await player.send(f"{c['yellow']}The {container.name} is already closed.{c['reset']}")
+                return
+
+            container.is_closed = True
+            await player.send(f"{c['green']}You close {container.short_desc}.{c['reset']}")
+            await player.room.send_to_room(
+                f"{player.name} closes {container.short_desc}.",
+                exclude=[player]
+            )
+            return
+
+        # Check for door - handle "door north", "door n", "north", or door names like "trapdoor"
+        direction = None
+        door = None
+        exit_data = None
+
+        # Remove "door" from the target name if present
+        if target_name.startswith('door '):
+            target_name = target_name[5:].strip()
+
+        # First try to match by direction
+        for dir_name in player.config.DIRECTIONS.keys():
+            if target_name == dir_name or target_name in dir_name:
+                direction = dir_name
+                break
+
+        if direction and direction in player.room.exits and player.room.exits[direction]:
+            exit_data = player.room.exits[direction]
+            if 'door' in exit_data:
+                door = exit_data['door']
+
+        # If no door found by direction, try to find by door name
+        if not door:
+            for dir_name, ex_data in player.room.exits.items():
+                if ex_data and 'door' in ex_data:
+                    door_obj = ex_data['door']
+                    door_name = door_obj.get('name', 'door').lower()
+                    if target_name in door_name or door_name in target_name:
+                        door = door_obj
+                        exit_data = ex_data
+                        direction = dir_name
+                        break
+
+        if not door:
+            await player.send(f"{c['red']}You don't see a '{target_name}' to close here.{c['reset']}")
+            return
+
+        # Check if broken
+        if door.get('broken', False):
+            await player.send(f"{c['red']}The door is broken and cannot be closed!{c['reset']}")
+            return
+
+        if door.get('state') == 'closed':
+            await player.send(f"{c['yellow']}The door is already closed.{c['reset']}")
+            return
+
+        door['state'] = 'closed'
+        await player.send(f"{c['green']}You close the {door.get('name', 'door')} {direction}.{c['reset']}")
+        await player.room.send_to_room(
+            f"{player.name} closes the {door.get('name', 'door')} {direction}.",
+            exclude=[player]
+        )
+
+        # Update the other side of the door
+        next_room = exit_data.get('room')
+        if next_room:
+            opposite_dir = player.config.DIRECTIONS[direction]['opposite']
+            if opposite_dir in next_room.exits and 'door' in next_room.exits[opposite_dir]:
+                next_room.exits[opposite_dir]['door']['state'] = 'closed'
+
+    @classmethod
+    async def cmd_lock(cls, player: 'Player', args: List[str]):
+        """Lock a door or container. Usage: lock <door/container>"""
+        if not args:
+            await player.send("Lock what?")
+            return
+
+        c = player.config.COLORS
+        target_name = ' '.join(args).lower()
+
+        # Check for container first
+        container = None
+        for item in player.inventory + player.room.items:
+            if target_name in item.name.lower():
+                if hasattr(item, 'item_type') and item.item_type == 'container':
+                    container = item
+                    break
+
+        if container:
+            if not hasattr(container, 'is_locked'):
+                await player.send(f"{c['yellow']}The {container.name} cannot be locked.{c['reset']}")
+                return
+
+            if container.is_locked:
+                await player.send(f"{c['yellow']}The {container.name} is already locked.{c['reset']}")
+                return
+
+            # Check if closed
+            if hasattr(container, 'is_closed') and not container.is_closed:
+                await player.send(f"{c['red']}You must close it first.{c['reset']}")
+                return
+
+            # Check for key
+            key_vnum = getattr(container, 'key_vnum', None)
+            has_key = False
+            if key_vnum:
+                for item in player.inventory:
+                    if hasattr(item, 'vnum') and item.vnum == key_vnum:
+                        has_key = True
+                        break
+
+            if key_vnum and not has_key:
+                await player.send(f"{c['red']}You don't have the key.{c['reset']}")
+                return
+
+            container.is_locked = True
+            await player.send(f"{c['green']}*Click* You lock {container.short_desc}.{c['reset']}")
+            return
+
+        # Check for door - handle "door north", "door n", or just "north"
+        direction = None
+
+        # Remove "door" from the target name if present
+        if target_name.startswith('door '):
+            target_name = target_name[5:].strip()
+
+        for dir_name in player.config.DIRECTIONS.keys():
+            if target_name == dir_name or target_name in dir_name:
+                direction = dir_name
+                break
+
+        if not direction:
+            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
+            return
+
+        if direction not in player.room.exits or not player.room.exits[direction]:
+            await player.send(f"{c['red']}There's no exit {direction}.{c['reset']}")
+            return
+
+        exit_data = player.room.exits[direction]
+
+        if 'door' not in exit_data:
+            await player.send(f"{c['yellow']}There's no door {direction}.{c['reset']}")
+            return
+
+        door = exit_data['door']
+
+        if door.get('locked', False):
+            await player.send(f"{c['yellow']}The door is already locked.{c['reset']}")
+            return
+
+        # Check if closed
+        if door.get('state') != 'closed':
+            await player.send(f"{c['red']}You must close it first.{c['reset']}")
+            return
+
+        # Check for key
+        key_vnum = door.get('key_vnum')
+        has_key = False
+        if key_vnum:
+            for item in player.inventory:
+                if hasattr(item, 'vnum') and item.vnum == key_vnum:
+                    has_key = True
+                    break
+
+        if key_vnum and not has_key:
+            await player.send(f"{c['red']}You don't have the key.{c['reset']}")
+            return
+
+        door['locked'] = True
+        await player.send(f"{c['green']}*Click* You lock the {door.get('name', 'door')} {direction}.{c['reset']}")
+
+        # Update the other side of the door
+        next_room = exit_data.get('room')
+        if next_room:
+            opposite_dir = player.config.DIRECTIONS[direction]['opposite']
+            if opposite_dir in next_room.exits and 'door' in next_room.exits[opposite_dir]:
+                next_room.exits[opposite_dir]['door']['locked'] = True
+
+    @classmethod
+    async def cmd_unlock(cls, player: 'Player', args: List[str]):
+        """Unlock a door or container. Usage: unlock <door/container>"""
+        if not args:
+            await player.send("Unlock what?")
+            return
+
+        c = player.config.COLORS
+        target_name = ' '.join(args).lower()
+
+        # Check for container first
+        container = None
+        for item in player.inventory + player.room.items:
+            if target_name in item.name.lower():
+                if hasattr(item, 'item_type') and item.item_type == 'container':
+                    container = item
+                    break
+
+        if container:
+            if not hasattr(container, 'is_locked'):
+                await player.send(f"{c['yellow']}The {container.name} cannot be locked.{c['reset']}")
+                return
+
+            if not container.is_locked:
+                await player.send(f"{c['yellow']}The {container.name} is already unlocked.{c['reset']}")
+                return
+
+            # Check for key
+            key_vnum = getattr(container, 'key_vnum', None)
+            has_key = False
+            if key_vnum:
+                for item in player.inventory:
+                    if hasattr(item, 'vnum') and item.vnum == key_vnum:
+                        has_key = True
+                        break
+
+            if key_vnum and not has_key:
+                await player.send(f"{c['red']}You don't have the key.{c['reset']}")
+                return
+
+            container.is_locked = False
+            await player.send(f"{c['green']}*Click* You unlock {container.short_desc}.{c['reset']}")
+            return
+
+        # Check for door - handle "door north", "door n", or just "north"
+        direction = None
+
+        # Remove "door" from the target name if present
+        if target_name.startswith('door '):
+            target_name = target_name[5:].strip()
+
+        for dir_name in player.config.DIRECTIONS.keys():
+            if target_name == dir_name or target_name in dir_name:
+                direction = dir_name
+                break
+
+        if not direction:
+            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
+            return
+
+        if direction not in player.room.exits or not player.room.exits[direction]:
+            await player.send(f"{c['red']}There's no exit {direction}.{c['reset']}")
+            return
+
+        exit_data = player.room.exits[direction]
+
+        if 'door' not in exit_data:
+            await player.send(f"{c['yellow']}There's no door {direction}.{c['reset']}")
+            return
+
+        door = exit_data['door']
+
+        if not door.get('locked', False):
+            await player.send(f"{c['yellow']}The door is already unlocked.{c['reset']}")
+            return
+
+        # Check for key
+        key_vnum = door.get('key_vnum')
+        has_key = False
+        if key_vnum:
+            for item in player.inventory:
+                if hasattr(item, 'vnum') and item.vnum == key_vnum:
+                    has_key = True
+                    break
+
+        if key_vnum and not has_key:
+            await player.send(f"{c['red']}You don't have the key.{c['reset']}")
+            return
+
+        door['locked'] = False
+        await player.send(f"{c['green']}*Click* You unlock the {door.get('name', 'door')} {direction}.{c['reset']}")
+
+        # Update the other side of the door
+        next_room = exit_data.get('room')
+        if next_room:
+            opposite_dir = player.config.DIRECTIONS[direction]['opposite']
+            if opposite_dir in next_room.exits and 'door' in next_room.exits[opposite_dir]:
+                next_room.exits[opposite_dir]['door']['locked'] = False
+
+    @classmethod
+    async def cmd_pick(cls, player: 'Player', args: List[str]):
+        """Pick a lock (Thief skill). Usage: pick <door/container>"""
+        if not args:
+            await player.send("Pick what lock?")
+            return
+
+        c = player.config.COLORS
+
+        # Check if player has pick lock skill
+        pick_skill = player.skills.get('pick_lock', 0)
+        if pick_skill == 0:
+            await player.send(f"{c['red']}You don't know how to pick locks!{c['reset']}")
+            return
+
+        target_name = ' '.join(args).lower()
+
+        # Check for container first
+        container = None
+        for item in player.inventory + player.room.items:
+            if target_name in item.name.lower():
+                if hasattr(item, 'item_type') and item.item_type == 'container':
+                    container = item
+                    break
+
+        if container:
+            if not hasattr(container, 'is_locked') or not container.is_locked:
+                await player.send(f"{c['yellow']}The {container.name} isn't locked.{c['reset']}")
+                return
+
+            # Get pick difficulty
+            difficulty = getattr(container, 'pick_difficulty', 50)
+
+            # Attempt to pick
+            roll = random.randint(1, 100)
+            if roll <= pick_skill and roll + pick_skill >= difficulty:
+                container.is_locked = False
+                await player.send(f"{c['bright_green']}*Click* You successfully pick the lock on {container.short_desc}!{c['reset']}")
+                await player.room.send_to_room(
+                    f"{player.name} fiddles with {container.short_desc}.",
+                    exclude=[player]
+                )
+            else:
+                await player.send(f"{c['yellow']}You fail to pick the lock.{c['reset']}")
+            return
+
+        # Check for door - handle "door north", "door n", or just "north"
+        direction = None
+
+        # Remove "door" from the target name if present
+        if target_name.startswith('door '):
+            target_name = target_name[5:].strip()
+
+        for dir_name in player.config.DIRECTIONS.keys():
+            if target_name == dir_name or target_name in dir_name:
+                direction = dir_name
+                break
+
+        if not direction:
+            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
+            return
+
+        if direction not in player.room.exits or not player.room.exits[direction]:
+            await player.send(f"{c['red']}There's no exit {direction}.{c['reset']}")
+            return
+
+        exit_data = player.room.exits[direction]
+
+        if 'door' not in exit_data:
+            await player.send(f"{c['yellow']}There's no door {direction}.{c['reset']}")
+            return
+
+        door = exit_data['door']
+
+        if not door.get('locked', False):
+            await player.send(f"{c['yellow']}The door isn't locked.{c['reset']}")
+            return
+
+        # Get pick difficulty
+        difficulty = door.get('pick_difficulty', 50)
+
+        # Attempt to pick
+        roll = random.randint(1, 100)
+        if roll <= pick_skill and roll + pick_skill >= difficulty:
+            door['locked'] = False
+            await player.send(f"{c['bright_green']}*Click* You successfully pick the lock on the {door.get('name', 'door')}!{c['reset']}")
+            await player.room.send_to_room(
+                f"{player.name} fiddles with the {door.get('name', 'door')} {direction}.",
+                exclude=[player]
+            )
+        else:
+            await player.send(f"{c['yellow']}You fail to pick the lock.{c['reset']}")
+
+
+    @classmethod
+    async def cmd_knock(cls, player: 'Player', args: List[str]):
+        """Knock on a door. Usage: knock <direction>"""
+        c = player.config.COLORS
+        
+        if not args:
+            await player.send(f"{c['yellow']}Knock on which door?{c['reset']}")
+            return
+        
+        direction = args[0].lower()
+        
+        if not player.room or direction not in player.room.exits:
+            await player.send(f"{c['red']}There's no exit in that direction.{c['reset']}")
+            return
+        
+        exit_data = player.room.exits[direction]
+        
+        if 'door' not in exit_data:
+            await player.send(f"{c['yellow']}There's no door there.{c['reset']}")
+            return
+        
+        door = exit_data['door']
+        door_name = door.get('name', 'door')
+        
+        await player.send(f"{c['cyan']}You knock on the {door_name}.{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name} knocks on the {door_name}.", exclude=[player])
+        
+        # Notify people on the other side
+        target_room = exit_data.get('room')
+        if target_room:
+            await target_room.send_to_room(f"{c['yellow']}Someone knocks on the {door_name} from the other side.{c['reset']}")
+
+    @classmethod
+    async def cmd_enter(cls, player: 'Player', args: List[str]):
+        """Enter a building or portal. Usage: enter [portal/building name]"""
+        c = player.config.COLORS
+        
+        if not player.room:
+            await player.send(f"{c['red']}You are nowhere!{c['reset']}")
+            return
+        
+        # If no args, look for obvious entrance
+        if not args:
+            # Check for portals or buildings in room
+            for item in player.room.items:
+                if getattr(item, 'item_type', '') == 'portal':
+                    target_room = item.portal_target if hasattr(item, 'portal_target') else None
+                    if target_room and hasattr(player, 'world'):
+                        dest = player.world.rooms.get(target_room)
+                        if dest:
+                            await player.room.send_to_room(f"{player.name} enters {item.short_desc}.", exclude=[player])
+                            player.room.characters.remove(player)
+                            player.room = dest
+                            dest.characters.append(player)
+                            await player.send(f"{c['cyan']}You enter {item.short_desc}.{c['reset']}")
+                            await player.do_look([])
+                            await dest.send_to_room(f"{player.name} arrives.", exclude=[player])
+                            return
+            
+            # Try common directions for "inside"
+            for direction in ['in', 'inside', 'building', 'enter']:
+                if direction in player.room.exits:
+                    from commands import CommandHandler
+                    await CommandHandler.cmd_move(player, direction)
+                    return
+            
+            await player.send(f"{c['yellow']}Enter what? Specify a direction or portal name.{c['reset']}")
+            return
+        
+        target = ' '.join(args).lower()
+        
+        # Check items for portals
+        for item in player.room.items:
+            if target in item.name.lower() and getattr(item, 'item_type', '') == 'portal':
+                target_room = item.portal_target if hasattr(item, 'portal_target') else None
+                if target_room and hasattr(player, 'world'):
+                    dest = player.world.rooms.get(target_room)
+                    if dest:
+                        await player.room.send_to_room(f"{player.name} enters {item.short_desc}.", exclude=[player])
+                        player.room.characters.remove(player)
+                        player.room = dest
+                        dest.characters.append(player)
+                        await player.send(f"{c['cyan']}You enter {item.short_desc}.{c['reset']}")
+                        await player.do_look([])
+                        await dest.send_to_room(f"{player.name} arrives.", exclude=[player])
+                        return
+        
+        await player.send(f"{c['red']}You can't enter that.{c['reset']}")
+
+    @classmethod
+    async def cmd_leave(cls, player: 'Player', args: List[str]):
+        """Leave a building to go outside. Usage: leave"""
+        c = player.config.COLORS
+        
+        if not player.room:
+            await player.send(f"{c['red']}You are nowhere!{c['reset']}")
+            return
+        
+        # Try common exit directions
+        for direction in ['out', 'outside', 'exit', 'leave']:
+            if direction in player.room.exits:
+                from commands import CommandHandler
+                await CommandHandler.cmd_move(player, direction)
+                return
+        
+        # If indoors, try to find an outdoor exit
+        if 'indoors' in getattr(player.room, 'flags', []):
+            for direction, exit_data in player.room.exits.items():
+                target_room = exit_data.get('room')
+                if target_room and 'indoors' not in getattr(target_room, 'flags', []):
+                    from commands import CommandHandler
+                    await CommandHandler.cmd_move(player, direction)
+                    return
+        
+        await player.send(f"{c['yellow']}There's no obvious way out.{c['reset']}")
+
+    # ==================== TRAVEL ====================
+
+    @classmethod
+    async def cmd_waypoints(cls, player: 'Player', args: List[str]):
+        """List discovered waypoints."""
+        c = player.config.COLORS
+        from travel import WAYPOINTS
+
+        discovered = getattr(player, 'discovered_waypoints', set())
+        await player.send(f"{c['cyan']}Discovered Waypoints:{c['reset']}")
+        if not discovered:
+            await player.send(f"{c['yellow']}None yet. Visit major locations to discover waypoints.{c['reset']}")
+            return
+
+        for key in discovered:
+            info = WAYPOINTS.get(key)
+            if not info:
+                continue
+            await player.send(f"  {c['bright_green']}{info['name']}{c['reset']} (Cost: {info['cost']} gold)")
+
+        undiscovered = len(WAYPOINTS) - len(discovered)
+        if undiscovered > 0:
+            await player.send(f"{c['yellow']}Undiscovered: {undiscovered}{c['reset']}")
+
+    @classmethod
+    async def cmd_travel(cls, player: 'Player', args: List[str]):
+        """Travel to a discovered waypoint.
+
+        Usage:
+            travel <waypoint>
+        """
+        c = player.config.COLORS
+        if not args:
+            await player.send(f"{c['yellow']}Usage: travel <waypoint>{c['reset']}")
+            await player.send(f"{c['cyan']}Use 'waypoints' to see discovered locations.{c['reset']}")
+            return
+
+        from travel import get_waypoint_by_name, can_travel, set_travel_cooldown
+
+        name = ' '.join(args)
+        result = get_waypoint_by_name(name)
+        if not result:
+            await player.send(f"{c['red']}Unknown waypoint '{name}'.{c['reset']}")
+            return
+
+        key, info = result
+        if key not in getattr(player, 'discovered_waypoints', set()):
+            await player.send(f"{c['red']}You haven't discovered that waypoint yet.{c['reset']}")
+            return
+
+        ok, msg = can_travel(player)
+        if not ok:
+            await player.send(f"{c['red']}{msg}{c['reset']}")
+            return
+
+        cost = info.get('cost', 0)
+        if cost > 0 and player.gold < cost:
+            await player.send(f"{c['red']}You need {cost} gold to travel there.{c['reset']}")
+            return
+
+        target_room = player.world.rooms.get(info['vnum']) if player.world else None
+        if not target_room:
+            await player.send(f"{c['red']}That waypoint no longer exists.{c['reset']}")
+            return
+
+        if player.room == target_room:
+            await player.send(f"{c['yellow']}You are already there.{c['reset']}")
+            return
+
+        # Pay cost
+        if cost > 0:
+            player.gold -= cost
+
+        # Teleport
+        old_room = player.room
+        if old_room:
+            await old_room.send_to_room(
+                f"{c['bright_cyan']}{player.name} disappears in a flash of light!{c['reset']}",
+                exclude=[player]
+            )
+            old_room.characters.remove(player)
+
+        player.room = target_room
+        target_room.characters.append(player)
+
+        set_travel_cooldown(player)
+
+        await player.send(f"{c['bright_cyan']}You travel to {info['name']}!{c['reset']}")
+        if cost > 0:
+            await player.send(f"{c['yellow']}Travel cost: {cost} gold. Remaining: {player.gold} gold.{c['reset']}")
+        await player.send("")
+        await target_room.show_to(player)
+        await target_room.send_to_room(
+            f"{c['bright_cyan']}{player.name} arrives in a flash of light!{c['reset']}",
+            exclude=[player]
+        )
+
+    @classmethod
+    async def cmd_speedwalk(cls, player: 'Player', args: List[str]):
+        """Walk several rooms in one go.
+
+        Usage:
+            run <path>          - e.g. 'run 3n2e' or 'run n n e u'
+            run to <waypoint>   - Walk the shortest known way to a discovered waypoint
+
+        Everything that happens in a room still happens on the way (traps,
+        quests, waypoints, followers), but you only see the room you stop in.
+        The walk stops early if a step fails or something gets in your way.
+        """
+        c = player.config.COLORS
+        if not args:
+            await player.send(f"{c['yellow']}Usage: run <path> (e.g. run 3n2e) or run to <waypoint>{c['reset']}")
+            return
+        if not player.room:
+            await player.send("You are nowhere!")
+            return
+
+        if args[0].lower() == 'to' and len(args) > 1:
+            from travel import get_waypoint_by_name
+            from map_system import find_directions
+
+            name = ' '.join(args[1:])
+            result = get_waypoint_by_name(name)
+            if not result:
+                await player.send(f"{c['red']}Unknown waypoint '{name}'.{c['reset']}")
+                return
+            key, info = result
+            if key not in getattr(player, 'discovered_waypoints', set()):
+                await player.send(f"{c['red']}You haven't discovered that waypoint yet.{c['reset']}")
+                return
+            if player.room.vnum == info['vnum']:
+                await player.send(f"{c['yellow']}You are already there.{c['reset']}")
+                return
+            steps = find_directions(player.world.rooms, player.room.vnum, info['vnum'], player)
+            if not steps:
+                await player.send(f"{c['red']}You don't know a way to {info['name']} from here.{c['reset']}")
+                return
+        else:
+            steps = cls._parse_speedwalk(' '.join(args))
+            if not steps:
+                await player.send(f"{c['red']}That isn't a path. Try something like 'run 3n2e' or 'run n n e'.{c['reset']}")
+                return
+
+        limit = Config.SPEEDWALK_MAX_STEPS
+        if len(steps) > limit:
+            await player.send(f"{c['red']}You can run at most {limit} steps at a time.{c['reset']}")
+            return
+        await cls._speedwalk(player, steps)
+
+    @classmethod
+    def _parse_speedwalk(cls, text: str) -> Optional[List[str]]:
+        """'3n2e', 'n n e' or '2 north, east' -> directions; None if malformed."""
+        steps = []
+        pending = ''  # A count given as its own word: '2 north'
+        for token in re.split(r'[\s,;.]+', text.lower()):
+            if not token:
+                continue
+            if token.isdigit() and not pending:
+                pending = token
+                continue
+            word = _SPEEDWALK_WORD.fullmatch(pending + token)
+            if word:
+                runs = [word.groups()]
+            elif _SPEEDWALK_RUN.fullmatch(pending + token):
+                runs = _SPEEDWALK_STEP.findall(pending + token)
+            else:
+                return None
+            pending = ''
+            for count, direction in runs:
+                count = int(count) if count else 1
+                if count < 1:
+                    return None
+                full = next(d for d, info in Config.DIRECTIONS.items()
+                            if direction in (d, info['abbrev']))
+                # Past the limit is refused by the caller; don't build a huge list
+                steps.extend([full] * min(count, Config.SPEEDWALK_MAX_STEPS + 1))
+        if pending:
+            return None
+        return steps or None
+
+    @classmethod
+    async def _speedwalk(cls, player: 'Player', steps: List[str]):
+        """Walk ``steps`` through cmd_move as one batch.
+
+        Each step's room side effects fire as usual; the room render and the
+        web map push happen once, where the walk ends.
+        """
+        c = player.config.COLORS
+        walked = 0
+        player.speedwalk = set()  # Followers dragged along, shown the last room
+        try:
+            for direction in steps:
+                before = player.room
+                exit_data = before.exits.get(direction) or {}
+                await cls.cmd_move(player, direction)
+                if player.room is before:
+                    break  # cmd_move said why
+                walked += 1
+                # A trap, death or teleport put us somewhere the exit doesn't lead
+                if player.room is not exit_data.get('room'):
+                    break
+                if player.fighting or player.position != 'standing':
+                    break
+        finally:
+            followers = player.speedwalk
+            player.speedwalk = None
+
+        if not walked:
+            return
+        await player.do_look([])
+        web_map = getattr(player.world, 'web_map', None)
+        for follower in followers:
+            await follower.do_look([])
+        if web_map:
+            await web_map.notify_player(player)
+            for follower in followers:
+                await web_map.notify_player(follower)
+        if walked < len(steps):
+            await player.send(f"{c['yellow']}You stop after {walked} of {len(steps)} steps.{c['reset']}")
+
+    @classmethod
+    async def cmd_bind(cls, player: 'Player', args: List[str]):
+        """Set your recall point to the current location."""
+        await cls.cmd_recall(player, ['set'])
+
+    @classmethod
+    async def cmd_recall(cls, player: 'Player', args: List[str]):
+        """Recall to your recall point (temple).
+
+        Usage:
+            recall     - Teleport to your recall point
+            recall set - Set current location as recall point
+        """
+        c = player.config.COLORS
+
+        # Check if setting recall point
+        if args and args[0] and args[0].lower() == 'set':
+            if not player.room:
+                await player.send(f"{c['red']}You are nowhere!{c['reset']}")
+                return
+
+            # Can't set recall in certain rooms
+            if 'no_recall' in player.room.flags:
+                await player.send(f"{c['red']}You cannot set your recall point here!{c['reset']}")
+                return
+
+            player.recall_point = player.room.vnum
+            await player.send(f"{c['bright_cyan']}Recall point set to: {player.room.name}{c['reset']}")
+            await player.send(f"{c['yellow']}You can now use 'recall' to return here from anywhere.{c['reset']}")
+            return
+
+        # Can't recall while fighting
+        if player.is_fighting:
+            await player.send(f"{c['red']}You can't recall while fighting!{c['reset']}")
+            return
+
+        # Can't recall from no_recall rooms
+        if player.room and 'no_recall' in player.room.flags:
+            await player.send(f"{c['red']}Powerful magic prevents you from recalling!{c['reset']}")
+            return
+
+        # Get recall point (default to temple at 3001)
+        recall_vnum = getattr(player, 'recall_point', 3001)
+
+        # Find recall room
+        recall_room = player.world.rooms.get(recall_vnum)
+        if not recall_room:
+            # Fallback to temple if custom recall point doesn't exist
+            recall_room = player.world.rooms.get(3001)
+            if not recall_room:
+                await player.send(f"{c['red']}Your recall point no longer exists!{c['reset']}")
+                return
+
+        # Already at recall point?
+        if player.room == recall_room:
+            await player.send(f"{c['yellow']}You are already at your recall point!{c['reset']}")
+            return
+
+        # Recall!
+        old_room = player.room
+
+        # Leave old room
+        if old_room:
+            await old_room.send_to_room(
+                f"{c['bright_cyan']}{player.name} disappears in a flash of light!{c['reset']}",
+                exclude=[player]
+            )
+            old_room.characters.remove(player)
+
+        # Enter recall room
+        player.room = recall_room
+        recall_room.characters.append(player)
+
+        await player.send(f"{c['bright_cyan']}You recall to safety!{c['reset']}")
+        await player.send("")
+
+        # Show room
+        await recall_room.show_to(player)
+
+        # Announce arrival
+        await recall_room.send_to_room(
+            f"{c['bright_cyan']}{player.name} appears in a flash of light!{c['reset']}",
+            exclude=[player]
+        )
+
+        # Recall pets to player
+        try:
+            from pets import PetManager, Pet
+            pets = PetManager.get_player_pets(player)
+            for pet in pets:
+                if not pet or pet.room is None:
+                    continue
+                # Remove from old room
+                if pet.room:
+                    await pet.room.send_to_room(f"{c['bright_cyan']}{pet.name} vanishes in a flash of light!{c['reset']}")
+                    if pet in pet.room.characters:
+                        pet.room.characters.remove(pet)
+                # Move to recall room
+                pet.room = recall_room
+                recall_room.characters.append(pet)
+                pet.fighting = None
+                if not hasattr(pet, 'ai_state'):
+                    pet.ai_state = {}
+                pet.ai_state['staying'] = False
+                await recall_room.send_to_room(f"{c['bright_cyan']}{pet.name} appears beside {player.name}.{c['reset']}")
+        except Exception:
+            pass
+
+    @classmethod
+    async def cmd_goto(cls, player: 'Player', args: List[str]):
+        """Teleport to a room or zone (testing command).
+
+        Usage:
+            goto <vnum>     - Go to room vnum (e.g. goto 3001)
+            goto <zone>     - Go to zone entrance (e.g. goto 30)
+        """
+        c = player.config.COLORS
+
+        if not args:
+            await player.send(f"{c['yellow']}Usage: goto <room_vnum> or goto <zone_number>{c['reset']}")
+            await player.send(f"{c['cyan']}Examples:{c['reset']}")
+            await player.send(f"{c['white']}  goto 3001    {c['yellow']}# Go to Temple of Midgaard{c['reset']}")
+            await player.send(f"{c['white']}  goto 30      {c['yellow']}# Go to zone 30 entrance{c['reset']}")
+            await player.send(f"{c['white']}  goto 80      {c['yellow']}# Go to Dragon's Domain{c['reset']}")
+            return
+
+        try:
+            target_vnum = int(args[0])
+        except ValueError:
+            await player.send(f"{c['red']}Invalid room/zone number. Must be a number.{c['reset']}")
+            return
+
+        # Check if it's a zone number (under 100) and convert to first room in zone
+        if target_vnum < 100:
+            # It's a zone number - find first room in that zone
+            zone_num = target_vnum
+            zone = player.world.zones.get(zone_num)
+            if not zone:
+                await player.send(f"{c['red']}Zone {zone_num} does not exist.{c['reset']}")
+                return
+
+            # Get first room in zone
+            if not zone.rooms:
+                await player.send(f"{c['red']}Zone {zone_num} has no rooms!{c['reset']}")
+                return
+
+            # Find the lowest vnum room in the zone
+            target_vnum = min(zone.rooms.keys())
+            await player.send(f"{c['cyan']}Teleporting to {zone.name} (room {target_vnum})...{c['reset']}")
+
+        # Find the target room
+        target_room = player.world.rooms.get(target_vnum)
+        if not target_room:
+            await player.send(f"{c['red']}Room {target_vnum} does not exist.{c['reset']}")
+            await player.send(f"{c['yellow']}Tip: Use 'map' to see available zones.{c['reset']}")
+            return
+
+        # Already there?
+        if player.room == target_room:
+            await player.send(f"{c['yellow']}You are already in that room!{c['reset']}")
+            return
+
+        # Teleport!
+        old_room = player.room
+
+        # Leave old room
+        if old_room:
+            await old_room.send_to_room(
+                f"{c['bright_magenta']}{player.name} vanishes in a puff of smoke!{c['reset']}",
+                exclude=[player]
+            )
+            old_room.characters.remove(player)
+
+        # Enter target room
+        player.room = target_room
+        target_room.characters.append(player)
+
+        await player.send(f"{c['bright_magenta']}You teleport through space!{c['reset']}")
+        await player.send("")
+
+        # Show room
+        await target_room.show_to(player)
+
+        # Announce arrival
+        await target_room.send_to_room(
+            f"{c['bright_magenta']}{player.name} appears in a puff of smoke!{c['reset']}",
+            exclude=[player]
+        )
+
+    @classmethod
+    async def cmd_autorecall(cls, player: 'Player', args: List[str]):
+        """Set automatic recall when HP drops below a threshold.
+
+        Usage:
+            autorecall             - Show current autorecall settings
+            autorecall <hp>        - Set HP threshold (number or percentage)
+            autorecall 50          - Recall when HP drops below 50
+            autorecall 25%         - Recall when HP drops below 25%
+            autorecall off         - Disable autorecall
+        """
+        c = player.config.COLORS
+
+        if not args:
+            # Show current settings
+            if not hasattr(player, 'autorecall_hp') or player.autorecall_hp is None:
+                await player.send(f"{c['yellow']}Autorecall is currently {c['red']}OFF{c['reset']}")
+                await player.send(f"{c['cyan']}Usage: autorecall <hp> or autorecall <percentage>%{c['reset']}")
+                await player.send(f"{c['cyan']}Example: autorecall 50 or autorecall 25%{c['reset']}")
+            else:
+                threshold = player.autorecall_hp
+                if player.autorecall_is_percent:
+                    percent_val = int(threshold)
+                    actual_hp = int((percent_val / 100.0) * player.max_hp)
+                    await player.send(f"{c['bright_green']}Autorecall is {c['bright_green']}ON{c['reset']}")
+                    await player.send(f"{c['cyan']}Threshold: {percent_val}% ({actual_hp} HP){c['reset']}")
+                else:
+                    await player.send(f"{c['bright_green']}Autorecall is {c['bright_green']}ON{c['reset']}")
+                    await player.send(f"{c['cyan']}Threshold: {int(threshold)} HP{c['reset']}")
+            return
+
+        setting = args[0].lower()
+
+        # Turn off autorecall
+        if setting in ['off', 'disable', 'no']:
+            player.autorecall_hp = None
+            player.autorecall_is_percent = False
+            await player.send(f"{c['yellow']}Autorecall disabled.{c['reset']}")
+            return
+
+        # Parse HP threshold
+        try:
+            if '%' in setting:
+                # Percentage
+                percent = int(setting.rstrip('%'))
+                if percent < 1 or percent > 99:
+                    await player.send(f"{c['red']}Percentage must be between 1% and 99%.{c['reset']}")
+                    return
+
+                player.autorecall_hp = percent
+                player.autorecall_is_percent = True
+                actual_hp = int((percent / 100.0) * player.max_hp)
+                await player.send(f"{c['bright_green']}Autorecall enabled at {percent}% HP ({actual_hp} HP).{c['reset']}")
+                await player.send(f"{c['yellow']}You will automatically recall when your HP drops below this threshold.{c['reset']}")
+            else:
+                # Absolute HP value
+                hp_value = int(setting)
+                if hp_value < 1:
+                    await player.send(f"{c['red']}HP threshold must be at least 1.{c['reset']}")
+                    return
+
+                if hp_value >= player.max_hp:
+                    await player.send(f"{c['red']}HP threshold must be less than your maximum HP ({player.max_hp}).{c['reset']}")
+                    return
+
+                player.autorecall_hp = hp_value
+                player.autorecall_is_percent = False
+                await player.send(f"{c['bright_green']}Autorecall enabled at {hp_value} HP.{c['reset']}")
+                await player.send(f"{c['yellow']}You will automatically recall when your HP drops below this threshold.{c['reset']}")
+        except ValueError:
+            await player.send(f"{c['red']}Invalid HP value. Use a number or percentage (e.g., 50 or 25%).{c['reset']}")
+            return
+
+    # ==================== MOUNTS ====================
+
+    @classmethod
+    async def cmd_mount(cls, player: 'Player', args: List[str]):
+        """Mount an owned mount. Usage: mount [name]"""
+        from mounts import MountManager
+
+        c = player.config.COLORS
+
+        if player.is_fighting:
+            await player.send(f"{c['red']}You can't mount while fighting!{c['reset']}")
+            return
+
+        if player.mount:
+            await player.send(f"{c['yellow']}You are already riding {player.mount.name}.{c['reset']}")
+            return
+
+        if not args:
+            # Show owned mounts
+            if not player.owned_mounts:
+                await player.send(f"{c['yellow']}You don't own any mounts. Visit a stable to buy one!{c['reset']}")
+                return
+            await player.send(f"{c['cyan']}Your mounts:{c['reset']}")
+            for m in player.owned_mounts:
+                mkey = m if isinstance(m, str) else m.get('key', '?')
+                loyalty = m.get('loyalty', 100) if isinstance(m, dict) else 100
+                tmpl = MountManager.get_mount_template(mkey)
+                desc = tmpl['description'] if tmpl else ''
+                name = tmpl['name'] if tmpl else mkey
+                await player.send(f"  {c['bright_green']}{mkey}{c['reset']} — {name} (loyalty: {loyalty}) {desc}")
+            await player.send(f"{c['cyan']}Use: mount <name>{c['reset']}")
+            return
+
+        target_name = ' '.join(args).lower()
+
+        # Check owned mounts
+        mount_data = MountManager.get_owned_mount_data(player, target_name)
+        if mount_data:
+            loyalty = mount_data.get('loyalty', 100) if isinstance(mount_data, dict) else 100
+            mount = MountManager.create_mount(target_name, loyalty=loyalty)
+            if not mount:
+                await player.send(f"{c['red']}Can't mount that.{c['reset']}")
+                return
+            player.mount = mount
+            await player.send(f"{c['bright_green']}You mount {mount.name}.{c['reset']}")
+            if player.room:
+                await player.room.send_to_room(
+                    f"{player.name} mounts {mount.name}.", exclude=[player])
+            return
+
+        # Try to tame from room
+        target = None
+        if player.room:
+            for char in player.room.characters:
+                if char != player and hasattr(char, 'name') and target_name in char.name.lower():
+                    target = char
+                    break
+
+        if target:
+            success = await MountManager.tame_mount(player, target)
+            if success:
+                player.mount = MountManager.create_mount(target.name.lower())
+                if player.mount:
+                    await player.send(f"{c['bright_green']}You mount your new {player.mount.name}.{c['reset']}")
+            return
+
+        await player.send(f"{c['red']}You don't own '{target_name}'. Use 'mount' to see your mounts.{c['reset']}")
+
+    @classmethod
+    async def cmd_dismount(cls, player: 'Player', args: List[str]):
+        """Dismount your current mount."""
+        c = player.config.COLORS
+        if not player.mount:
+            await player.send(f"{c['yellow']}You are not mounted.{c['reset']}")
+            return
+        mount_name = player.mount.name
+        # Save loyalty back to owned_mounts
+        for m in player.owned_mounts:
+            if isinstance(m, dict) and m.get('key') == player.mount.key:
+                m['loyalty'] = player.mount.loyalty
+                break
+        player.mount = None
+        await player.send(f"{c['green']}You dismount from {mount_name}.{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(
+                f"{player.name} dismounts from {mount_name}.", exclude=[player])
+
+    @classmethod
+    async def cmd_stable(cls, player: 'Player', args: List[str]):
+        """Stable services. Usage: stable [list|buy <mount>|store]"""
+        from mounts import MountManager
+
+        c = player.config.COLORS
+
+        # Check for stable master NPC in room
+        has_stable = False
+        if player.room:
+            for char in player.room.characters:
+                if hasattr(char, 'special') and char.special == 'stable_master':
+                    has_stable = True
+                    break
+            # Also allow in city sector type as fallback
+            if not has_stable and player.room.sector_type == 'city':
+                has_stable = True
+
+        if not has_stable:
+            await player.send(f"{c['red']}You need to be at a stable to use this command.{c['reset']}")
+            return
+
+        if not args or args[0].lower() == 'list':
+            await player.send(f"\n{c['bright_cyan']}═══════════ Midgaard Stables ═══════════{c['reset']}")
+            await player.send(f"{c['cyan']}Available for purchase:{c['reset']}")
+            for name, info in MountManager.list_purchasable_mounts().items():
+                cost_str = f"{info['cost']} gold" if info['cost'] > 0 else "Not for sale"
+                await player.send(f"  {c['bright_green']}{name:<18}{c['yellow']}{cost_str:<12}{c['white']}{info['description']}{c['reset']}")
+            special_mounts = {k: v for k, v in MountManager.list_mounts().items() if not v.get('purchasable')}
+            await player.send(f"\n{c['cyan']}Special mounts (rare drops & faction rewards):{c['reset']}")
+            for name, info in special_mounts.items():
+                await player.send(f"  {c['bright_magenta']}{name:<18}{c['white']}{info['description']}{c['reset']}")
+            if player.owned_mounts:
+                await player.send(f"\n{c['cyan']}Your mounts:{c['reset']}")
+                for m in player.owned_mounts:
+                    mkey = m if isinstance(m, str) else m.get('key', '?')
+                    await player.send(f"  {c['bright_green']}{mkey}{c['reset']}")
+            await player.send(f"{c['bright_cyan']}════════════════════════════════════════{c['reset']}\n")
+            return
+
+        if args[0].lower() == 'buy' and len(args) > 1:
+            mount_name = args[1].lower()
+            await MountManager.buy_mount(player, mount_name)
+            return
+
+        if args[0].lower() == 'store':
+            if player.mount:
+                await cls.cmd_dismount(player, [])
+                await player.send(f"{c['green']}Your mount is safely stabled.{c['reset']}")
+            else:
+                await player.send(f"{c['yellow']}You're not riding anything to stable.{c['reset']}")
+            return
+
+        await player.send(f"{c['yellow']}Usage: stable [list|buy <mount>|store]{c['reset']}")
+
+    @classmethod
+    async def cmd_feed(cls, player: 'Player', args: List[str]):
+        """Feed your mount to maintain loyalty. Usage: feed [mount]"""
+        c = player.config.COLORS
+
+        if not player.mount:
+            await player.send(f"{c['yellow']}You are not riding a mount to feed.{c['reset']}")
+            return
+
+        # Check if player has food
+        food_item = None
+        for item in player.inventory:
+            if getattr(item, 'item_type', '') == 'food':
+                food_item = item
+                break
+
+        if not food_item:
+            # Allow feeding without food for 10 gold
+            if player.gold >= 10:
+                player.gold -= 10
+                msg = player.mount.feed()
+                await player.send(f"{c['green']}{msg} (Cost: 10 gold){c['reset']}")
+            else:
+                await player.send(f"{c['red']}You have no food and not enough gold (10g) to feed your mount.{c['reset']}")
+            return
+
+        player.inventory.remove(food_item)
+        msg = player.mount.feed()
+        await player.send(f"{c['green']}{msg}{c['reset']}")
+
+    @classmethod
+    async def cmd_mounts(cls, player: 'Player', args: List[str]):
+        """List your owned mounts."""
+        await cls.cmd_mount(player, [])
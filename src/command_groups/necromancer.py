@@ -0,0 +1,154 @@
+"""
+Misthollow Necromancer Commands
+==============================
+Necromancer soul shards.
+"""
+
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class NecromancerCommands:
+    """Necromancer commands."""
+
+    # --- NECROMANCER SOUL SHARD ABILITIES ---
+
+    @classmethod
+    async def cmd_soul_bolt(cls, player: 'Player', args: List[str]):
+        """Shadow damage bolt. Costs 2 Soul Shards. Necromancer only."""
+        import time
+        c = player.config.COLORS
+        if player.char_class.lower() != 'necromancer':
+            await player.send(f"{c['red']}Only necromancers can use soul bolt!{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
+            return
+        now = time.time()
+        if now < getattr(player, 'soul_bolt_cooldown', 0):
+            remaining = int(player.soul_bolt_cooldown - now)
+            await player.send(f"{c['yellow']}Soul Bolt on cooldown ({remaining}s).{c['reset']}")
+            return
+        if player.soul_shards < 2:
+            await player.send(f"{c['red']}You need 2 Soul Shards! (Current: {player.soul_shards}/10){c['reset']}")
+            return
+        player.soul_shards -= 2
+        player.soul_bolt_cooldown = now + 10
+        target = player.fighting
+        spell_damage = (player.int * 3 + player.level * 2) * 2
+        # Shard passive: +5% per shard held
+        shard_bonus = 1.0 + (player.soul_shards * 0.05)
+        spell_damage = int(spell_damage * shard_bonus)
+        await player.send(f"{c['bright_magenta']}A bolt of shadow energy strikes {target.name}! [{spell_damage}]{c['reset']}")
+        if hasattr(target, 'send'):
+            await target.send(f"{c['magenta']}{player.name} blasts you with shadow energy! [{spell_damage}]{c['reset']}")
+        killed = await target.take_damage(spell_damage, player)
+        if killed:
+            from combat import CombatHandler
+            await CombatHandler.handle_death(player, target)
+
+    @classmethod
+    async def cmd_drain_soul(cls, player: 'Player', args: List[str]):
+        """Drain HP from target. Costs 3 Shards. Necromancer only."""
+        import time
+        c = player.config.COLORS
+        if player.char_class.lower() != 'necromancer':
+            await player.send(f"{c['red']}Only necromancers can drain souls!{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
+            return
+        now = time.time()
+        if now < getattr(player, 'drain_soul_cooldown', 0):
+            remaining = int(player.drain_soul_cooldown - now)
+            await player.send(f"{c['yellow']}Drain Soul on cooldown ({remaining}s).{c['reset']}")
+            return
+        if player.soul_shards < 3:
+            await player.send(f"{c['red']}You need 3 Soul Shards! (Current: {player.soul_shards}/10){c['reset']}")
+            return
+        player.soul_shards -= 3
+        player.drain_soul_cooldown = now + 15
+        target = player.fighting
+        spell_damage = int((player.int * 3 + player.level * 2) * 1.5)
+        shard_bonus = 1.0 + (player.soul_shards * 0.05)
+        spell_damage = int(spell_damage * shard_bonus)
+        heal = spell_damage
+        player.hp = min(player.max_hp, player.hp + heal)
+        await player.send(f"{c['bright_magenta']}You drain the soul of {target.name}! [{spell_damage}] Healed {heal} HP!{c['reset']}")
+        if hasattr(target, 'send'):
+            await target.send(f"{c['magenta']}{player.name} drains your life force! [{spell_damage}]{c['reset']}")
+        killed = await target.take_damage(spell_damage, player)
+        if killed:
+            from combat import CombatHandler
+            await CombatHandler.handle_death(player, target)
+
+    @classmethod
+    async def cmd_bone_shield(cls, player: 'Player', args: List[str]):
+        """Absorb next 3 hits. Costs 4 Shards. Necromancer only."""
+        import time
+        c = player.config.COLORS
+        if player.char_class.lower() != 'necromancer':
+            await player.send(f"{c['red']}Only necromancers can use bone shield!{c['reset']}")
+            return
+        now = time.time()
+        if now < getattr(player, 'bone_shield_cooldown', 0):
+            remaining = int(player.bone_shield_cooldown - now)
+            await player.send(f"{c['yellow']}Bone Shield on cooldown ({remaining}s).{c['reset']}")
+            return
+        if player.soul_shards < 4:
+            await player.send(f"{c['red']}You need 4 Soul Shards! (Current: {player.soul_shards}/10){c['reset']}")
+            return
+        player.soul_shards -= 4
+        player.bone_shield_cooldown = now + 60
+        player.bone_shield_charges = 3
+        player.bone_shield_until = now + 60
+        from talents import TalentManager
+        absorb = 750 if TalentManager.has_talent(player, 'bone_armor_mastery') else 500
+        player.bone_shield_absorb = absorb
+        await player.send(f"{c['bright_cyan']}Bones swirl around you forming a shield! (3 charges, {absorb} absorb each){c['reset']}")
+        await player.room.send_to_room(f"Bones swirl around {player.name} forming a protective shield!", exclude=[player])
+
+    @classmethod
+    async def cmd_soul_reap(cls, player: 'Player', args: List[str]):
+        """Execute target below 25% HP or massive damage. Costs 8 Shards. Necromancer only."""
+        import time
+        c = player.config.COLORS
+        if player.char_class.lower() != 'necromancer':
+            await player.send(f"{c['red']}Only necromancers can reap souls!{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
+            return
+        now = time.time()
+        if now < getattr(player, 'soul_reap_cooldown', 0):
+            remaining = int(player.soul_reap_cooldown - now)
+            await player.send(f"{c['yellow']}Soul Reap on cooldown ({remaining}s).{c['reset']}")
+            return
+        if player.soul_shards < 8:
+            await player.send(f"{c['red']}You need 8 Soul Shards! (Current: {player.soul_shards}/10){c['reset']}")
+            return
+        player.soul_shards -= 8
+        player.soul_reap_cooldown = now + 90
+        target = player.fighting
+        hp_pct = (target.hp / target.max_hp * 100) if target.max_hp > 0 else 100
+        is_boss = getattr(target, 'is_boss', False) or ('boss' in getattr(target, 'flags', set()))
+        if hp_pct <= 25 and not is_boss:
+            await player.send(f"{c['bright_red']}💀 SOUL REAPED! {target.name}'s soul is torn from their body!{c['reset']}")
+            if hasattr(target, 'send'):
+                await target.send(f"{c['bright_red']}{player.name} reaps your very soul!{c['reset']}")
+            target.hp = 0
+            from combat import CombatHandler
+            await CombatHandler.handle_death(player, target)
+        else:
+            spell_damage = (player.int * 3 + player.level * 2) * 4
+            shard_bonus = 1.0 + (player.soul_shards * 0.05)
+            spell_damage = int(spell_damage * shard_bonus)
+            await player.send(f"{c['bright_magenta']}You attempt to reap {target.name}'s soul! [{spell_damage}]{c['reset']}")
+            if hasattr(target, 'send'):
+                await target.send(f"{c['magenta']}{player.name} unleashes dark energy upon you! [{spell_damage}]{c['reset']}")
+            killed = await target.take_damage(spell_damage, player)
+            if killed:
+                from combat import CombatHandler
+                await CombatHandler.handle_death(player, target)
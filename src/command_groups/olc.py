@@ -0,0 +1,818 @@
+"""
+Misthollow OLC Commands
+======================
+Online room, mobile and object editors.
+"""
+
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class OlcCommands:
+    """OLC commands."""
+
+    @classmethod
+    async def cmd_redit(cls, player: 'Player', args: List[str]):
+        """Online room editor (immortal only)."""
+        c = player.config.COLORS
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have access to OLC.{c['reset']}")
+            return
+
+        try:
+            vnum = int(args[0]) if args else player.room.vnum
+        except Exception:
+            await player.send(f"{c['yellow']}Usage: redit <vnum>{c['reset']}")
+            return
+
+        zone_num = vnum // 100
+        zone = player.world.zones.get(zone_num)
+        if not zone:
+            await player.send(f"{c['red']}Zone {zone_num} not found.{c['reset']}")
+            return
+
+        room = player.world.rooms.get(vnum)
+        if not room:
+            from world import Room
+            room = Room(vnum)
+            room.zone = zone
+            zone.rooms[vnum] = room
+            player.world.rooms[vnum] = room
+
+        player.olc_state = {
+            'mode': 'redit',
+            'menu': 'main',
+            'room': room,
+            'exit_dir': None,
+            'buffer': [],
+            'extra_key': None
+        }
+        await cls.show_redit_menu(player)
+
+    @classmethod
+    async def cmd_medit(cls, player: 'Player', args: List[str]):
+        """Online mob editor (immortal only)."""
+        c = player.config.COLORS
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have access to OLC.{c['reset']}")
+            return
+
+        if not args:
+            await player.send(f"{c['yellow']}Usage: medit <vnum>{c['reset']}")
+            return
+
+        try:
+            vnum = int(args[0])
+        except Exception:
+            await player.send(f"{c['yellow']}Usage: medit <vnum>{c['reset']}")
+            return
+
+        zone_num = vnum // 100
+        zone = player.world.zones.get(zone_num)
+        if not zone:
+            await player.send(f"{c['red']}Zone {zone_num} not found.{c['reset']}")
+            return
+
+        # Get or create mob prototype
+        mob = zone.mobs.get(str(vnum)) or zone.mobs.get(vnum)
+        if not mob:
+            mob = {
+                'vnum': vnum,
+                'name': 'new mob',
+                'short_desc': 'a new mob',
+                'long_desc': 'A new mob stands here.',
+                'description': '',
+                'level': 1,
+                'hp_dice': '1d10+10',
+                'damage_dice': '1d4+1',
+                'gold': 0,
+                'exp': 100,
+                'alignment': 0,
+                'flags': [],
+                'armor_class': 0
+            }
+            zone.mobs[str(vnum)] = mob
+            player.world.mob_prototypes[vnum] = mob
+
+        player.olc_state = {
+            'mode': 'medit',
+            'menu': 'main',
+            'mob': mob,
+            'vnum': vnum,
+            'zone': zone,
+            'buffer': []
+        }
+        await cls.show_medit_menu(player)
+
+    @classmethod
+    async def cmd_oedit(cls, player: 'Player', args: List[str]):
+        """Online object editor (immortal only)."""
+        c = player.config.COLORS
+        if not player.is_immortal:
+            await player.send(f"{c['red']}You do not have access to OLC.{c['reset']}")
+            return
+
+        if not args:
+            await player.send(f"{c['yellow']}Usage: oedit <vnum>{c['reset']}")
+            return
+
+        try:
+            vnum = int(args[0])
+        except Exception:
+            await player.send(f"{c['yellow']}Usage: oedit <vnum>{c['reset']}")
+            return
+
+        zone_num = vnum // 100
+        zone = player.world.zones.get(zone_num)
+        if not zone:
+            await player.send(f"{c['red']}Zone {zone_num} not found.{c['reset']}")
+            return
+
+        # Get or create object prototype
+        obj = zone.objects.get(str(vnum)) or zone.objects.get(vnum)
+        if not obj:
+            obj = {
+                'vnum': vnum,
+                'name': 'new object',
+                'short_desc': 'a new object',
+                'room_desc': 'A new object lies here.',
+                'description': '',
+                'item_type': 'trash',
+                'wear_slot': None,
+                'weight': 1,
+                'value': 0,
+                'flags': [],
+                'affects': []
+            }
+            zone.objects[str(vnum)] = obj
+            player.world.obj_prototypes[vnum] = obj
+
+        player.olc_state = {
+            'mode': 'oedit',
+            'menu': 'main',
+            'obj': obj,
+            'vnum': vnum,
+            'zone': zone,
+            'buffer': []
+        }
+        await cls.show_oedit_menu(player)
+
+    @classmethod
+    async def show_medit_menu(cls, player: 'Player'):
+        c = player.config.COLORS
+        state = player.olc_state
+        mob = state['mob']
+        await player.send(f"{c['cyan']}-- Mob Number   : [{mob.get('vnum')}]{c['reset']}")
+        await player.send(f"{c['white']}1){c['reset']} Keywords    : {mob.get('name', '')}")
+        await player.send(f"{c['white']}2){c['reset']} Short desc  : {mob.get('short_desc', '')}")
+        await player.send(f"{c['white']}3){c['reset']} Long desc   : {mob.get('long_desc', '')}")
+        await player.send(f"{c['white']}4){c['reset']} Description :")
+        await player.send(mob.get('description') or "(none)")
+        await player.send(f"{c['white']}5){c['reset']} Level       : {mob.get('level', 1)}")
+        await player.send(f"{c['white']}6){c['reset']} HP Dice     : {mob.get('hp_dice', '1d10+10')}")
+        await player.send(f"{c['white']}7){c['reset']} Damage Dice : {mob.get('damage_dice', '1d4+1')}")
+        await player.send(f"{c['white']}8){c['reset']} Armor Class : {mob.get('armor_class', 0)}")
+        await player.send(f"{c['white']}9){c['reset']} Gold        : {mob.get('gold', 0)}")
+        await player.send(f"{c['white']}A){c['reset']} Experience  : {mob.get('exp', 0)}")
+        await player.send(f"{c['white']}B){c['reset']} Alignment   : {mob.get('alignment', 0)}")
+        await player.send(f"{c['white']}C){c['reset']} Flags       : {' '.join(mob.get('flags', [])) or 'NOBITS'}")
+        await player.send(f"{c['white']}D){c['reset']} Boss Setup  : {'Yes' if mob.get('boss') else 'No'}")
+        await player.send(f"{c['white']}Q){c['reset']} Quit")
+        await player.send(f"{c['yellow']}Enter choice:{c['reset']}")
+
+    @classmethod
+    async def show_oedit_menu(cls, player: 'Player'):
+        c = player.config.COLORS
+        state = player.olc_state
+        obj = state['obj']
+        await player.send(f"{c['cyan']}-- Object Number: [{obj.get('vnum')}]{c['reset']}")
+        await player.send(f"{c['white']}1){c['reset']} Keywords    : {obj.get('name', '')}")
+        await player.send(f"{c['white']}2){c['reset']} Short desc  : {obj.get('short_desc', '')}")
+        await player.send(f"{c['white']}3){c['reset']} Room desc   : {obj.get('room_desc', '')}")
+        await player.send(f"{c['white']}4){c['reset']} Description :")
+        await player.send(obj.get('description') or "(none)")
+        await player.send(f"{c['white']}5){c['reset']} Item type   : {obj.get('item_type', 'trash')}")
+        await player.send(f"{c['white']}6){c['reset']} Wear slot   : {obj.get('wear_slot') or 'none'}")
+        await player.send(f"{c['white']}7){c['reset']} Weight      : {obj.get('weight', 1)}")
+        await player.send(f"{c['white']}8){c['reset']} Value       : {obj.get('value', 0)}")
+        await player.send(f"{c['white']}9){c['reset']} Flags       : {' '.join(obj.get('flags', [])) or 'NOBITS'}")
+        await player.send(f"{c['white']}A){c['reset']} Affects     : {len(obj.get('affects', []))} affects")
+        if obj.get('item_type') == 'weapon':
+            await player.send(f"{c['white']}B){c['reset']} Damage dice : {obj.get('damage_dice', '1d4')}")
+            await player.send(f"{c['white']}C){c['reset']} Weapon type : {obj.get('weapon_type', 'pound')}")
+        elif obj.get('item_type') == 'armor':
+            await player.send(f"{c['white']}B){c['reset']} Armor bonus : {obj.get('armor_bonus', 0)}")
+        elif obj.get('item_type') == 'container':
+            await player.send(f"{c['white']}B){c['reset']} Capacity    : {obj.get('capacity', 10)}")
+        await player.send(f"{c['white']}Q){c['reset']} Quit")
+        await player.send(f"{c['yellow']}Enter choice:{c['reset']}")
+
+    @classmethod
+    async def show_redit_menu(cls, player: 'Player'):
+        c = player.config.COLORS
+        state = player.olc_state
+        room = state['room']
+        await player.send(f"{c['cyan']}--Room Number   : [{room.vnum}]{c['reset']}")
+        await player.send(f"{c['white']}1){c['reset']} Name        : {room.name}")
+        await player.send(f"{c['white']}2){c['reset']} Description :")
+        await player.send(room.description or "(none)")
+        await player.send(f"{c['white']}3){c['reset']} Room flags  : {' '.join(sorted(room.flags)) if room.flags else 'NOBITS'}")
+        await player.send(f"{c['white']}4){c['reset']} Sector type : {room.sector_type}")
+        await player.send(f"{c['white']}5){c['reset']} Exit North  : {room.exits.get('north', {}).get('to_room', -1)}")
+        await player.send(f"{c['white']}6){c['reset']} Exit East   : {room.exits.get('east', {}).get('to_room', -1)}")
+        await player.send(f"{c['white']}7){c['reset']} Exit South  : {room.exits.get('south', {}).get('to_room', -1)}")
+        await player.send(f"{c['white']}8){c['reset']} Exit West   : {room.exits.get('west', {}).get('to_room', -1)}")
+        await player.send(f"{c['white']}9){c['reset']} Exit Up     : {room.exits.get('up', {}).get('to_room', -1)}")
+        await player.send(f"{c['white']}A){c['reset']} Exit Down   : {room.exits.get('down', {}).get('to_room', -1)}")
+        await player.send(f"{c['white']}B){c['reset']} Extra Descriptions")
+        await player.send(f"{c['white']}Q){c['reset']} Quit")
+        await player.send(f"{c['yellow']}Enter choice:{c['reset']}")
+
+    @classmethod
+    async def handle_olc_input(cls, player: 'Player', cmd: str, args: List[str]):
+        c = player.config.COLORS
+        state = player.olc_state
+        if not state:
+            player.olc_state = None
+            return
+
+        mode = state.get('mode')
+        if mode == 'medit':
+            await cls.handle_medit_input(player, cmd, args)
+            return
+        elif mode == 'oedit':
+            await cls.handle_oedit_input(player, cmd, args)
+            return
+        elif mode != 'redit':
+            player.olc_state = None
+            return
+
+        line = (cmd + (' ' + ' '.join(args) if args else '')).strip()
+        room = state['room']
+        menu = state['menu']
+
+        if menu == 'main':
+            choice = cmd.lower()
+            if choice == 'q':
+                player.olc_state = None
+                await player.send(f"{c['yellow']}OLC exited. Use 'save <zone>' to write changes.{c['reset']}")
+                return
+            if choice == 'save':
+                await cls.cmd_save(player, [])
+                return
+            if choice == '1':
+                state['menu'] = 'name'
+                await player.send(f"{c['yellow']}Room name:{c['reset']}")
+                return
+            if choice == '2':
+                state['menu'] = 'desc'
+                state['buffer'] = []
+                await player.send(f"{c['yellow']}Enter description, end with @:{c['reset']}")
+                return
+            if choice == '3':
+                state['menu'] = 'flags'
+                await player.send(f"{c['yellow']}Enter flag (dark/indoors/peaceful/deathtrap/nomob/notrack/nomagic/tunnel/private/soundproof) or 0 to done:{c['reset']}")
+                return
+            if choice == '4':
+                state['menu'] = 'sector'
+                await player.send(f"{c['yellow']}Sector type (inside/city/field/forest/hills/mountain/water_swim/water_noswim/underwater/flying):{c['reset']}")
+                return
+            if choice in ['5','6','7','8','9','a']:
+                dir_map = {'5':'north','6':'east','7':'south','8':'west','9':'up','a':'down'}
+                state['exit_dir'] = dir_map[choice]
+                state['menu'] = 'exit_to'
+                await player.send(f"{c['yellow']}Exit to room vnum (-1 to delete):{c['reset']}")
+                return
+            if choice == 'b':
+                state['menu'] = 'extra_key'
+                await player.send(f"{c['yellow']}Extra desc keywords:{c['reset']}")
+                return
+
+            await player.send(f"{c['yellow']}Invalid choice.{c['reset']}")
+            await cls.show_redit_menu(player)
+            return
+
+        if menu == 'name':
+            room.name = line if line else room.name
+            state['menu'] = 'main'
+            await cls.show_redit_menu(player)
+            return
+
+        if menu == 'desc':
+            if line == '@':
+                room.description = '\n'.join(state['buffer'])
+                state['menu'] = 'main'
+                await cls.show_redit_menu(player)
+            else:
+                state['buffer'].append(line)
+            return
+
+        if menu == 'flags':
+            if line in ['0','done']:
+                state['menu'] = 'main'
+                await cls.show_redit_menu(player)
+                return
+            flag = line.lower()
+            if flag == 'death':
+                flag = 'deathtrap'
+            if flag:
+                if flag in room.flags:
+                    room.flags.remove(flag)
+                else:
+                    room.flags.add(flag)
+            await player.send(f"{c['cyan']}Flags now: {' '.join(sorted(room.flags))}{c['reset']}")
+            await player.send(f"{c['yellow']}Enter flag (or 0 to done):{c['reset']}")
+            return
+
+        if menu == 'sector':
+            room.sector_type = line.lower()
+            state['menu'] = 'main'
+            await cls.show_redit_menu(player)
+            return
+
+        if menu == 'exit_to':
+            try:
+                to_vnum = int(line)
+            except Exception:
+                await player.send(f"{c['yellow']}Enter a valid vnum or -1.{c['reset']}")
+                return
+            dir_ = state['exit_dir']
+            if to_vnum == -1:
+                room.exits.pop(dir_, None)
+                state['menu'] = 'main'
+                await cls.show_redit_menu(player)
+                return
+            room.exits[dir_] = {'to_room': to_vnum, 'description': ''}
+            state['menu'] = 'exit_desc'
+            await player.send(f"{c['yellow']}Exit description (blank for none):{c['reset']}")
+            return
+
+        if menu == 'exit_desc':
+            dir_ = state['exit_dir']
+            room.exits[dir_]['description'] = line
+            state['menu'] = 'exit_door'
+            await player.send(f"{c['yellow']}Door? (y/n):{c['reset']}")
+            return
+
+        if menu == 'exit_door':
+            dir_ = state['exit_dir']
+            if line.lower().startswith('y'):
+                state['menu'] = 'exit_door_name'
+                await player.send(f"{c['yellow']}Door name:{c['reset']}")
+            else:
+                state['menu'] = 'exit_hidden'
+                await player.send(f"{c['yellow']}Hidden exit? (y/n):{c['reset']}")
+            return
+
+        if menu == 'exit_door_name':
+            dir_ = state['exit_dir']
+            room.exits[dir_]['door'] = {'name': line or 'door', 'state': 'closed', 'locked': False}
+            state['menu'] = 'exit_locked'
+            await player.send(f"{c['yellow']}Locked? (y/n):{c['reset']}")
+            return
+
+        if menu == 'exit_locked':
+            dir_ = state['exit_dir']
+            if line.lower().startswith('y'):
+                room.exits[dir_]['door']['locked'] = True
+                state['menu'] = 'exit_key'
+                await player.send(f"{c['yellow']}Key vnum (0 for none):{c['reset']}")
+            else:
+                state['menu'] = 'exit_hidden'
+                await player.send(f"{c['yellow']}Hidden exit? (y/n):{c['reset']}")
+            return
+
+        if menu == 'exit_key':
+            dir_ = state['exit_dir']
+            try:
+                key_vnum = int(line)
+            except Exception:
+                key_vnum = 0
+            if key_vnum:
+                room.exits[dir_]['door']['key_vnum'] = key_vnum
+            state['menu'] = 'exit_hidden'
+            await player.send(f"{c['yellow']}Hidden exit? (y/n):{c['reset']}")
+            return
+
+        if menu == 'exit_hidden':
+            dir_ = state['exit_dir']
+            if line.lower().startswith('y'):
+                room.exits[dir_]['hidden'] = True
+                room.exits[dir_]['secret'] = True
+                state['menu'] = 'exit_search'
+                await player.send(f"{c['yellow']}Search difficulty (e.g. 55):{c['reset']}")
+            else:
+                room.exits[dir_].pop('hidden', None)
+                room.exits[dir_].pop('secret', None)
+                room.exits[dir_].pop('search_difficulty', None)
+                player.world.link_exits()
+                state['menu'] = 'main'
+                await cls.show_redit_menu(player)
+            return
+
+        if menu == 'exit_search':
+            dir_ = state['exit_dir']
+            try:
+                sd = int(line)
+            except Exception:
+                sd = 55
+            room.exits[dir_]['search_difficulty'] = sd
+            player.world.link_exits()
+            state['menu'] = 'main'
+            await cls.show_redit_menu(player)
+            return
+
+        if menu == 'extra_key':
+            state['extra_key'] = line
+            state['buffer'] = []
+            state['menu'] = 'extra_desc'
+            await player.send(f"{c['yellow']}Extra description, end with @:{c['reset']}")
+            return
+
+        if menu == 'extra_desc':
+            if line == '@':
+                if state.get('extra_key'):
+                    room.extra_descs[state['extra_key']] = '\n'.join(state['buffer'])
+                state['menu'] = 'main'
+                await cls.show_redit_menu(player)
+            else:
+                state['buffer'].append(line)
+            return
+
+    @classmethod
+    async def handle_medit_input(cls, player: 'Player', cmd: str, args: List[str]):
+        """Handle medit menu input."""
+        c = player.config.COLORS
+        state = player.olc_state
+        line = (cmd + (' ' + ' '.join(args) if args else '')).strip()
+        mob = state['mob']
+        menu = state['menu']
+
+        if menu == 'main':
+            choice = cmd.lower()
+            if choice == 'q':
+                player.olc_state = None
+                await player.send(f"{c['yellow']}Medit exited. Use 'save <zone>' to write changes.{c['reset']}")
+                return
+            if choice == '1':
+                state['menu'] = 'name'
+                await player.send(f"{c['yellow']}Keywords (e.g. 'guard cityguard'):{c['reset']}")
+                return
+            if choice == '2':
+                state['menu'] = 'short'
+                await player.send(f"{c['yellow']}Short desc (e.g. 'a city guard'):{c['reset']}")
+                return
+            if choice == '3':
+                state['menu'] = 'long'
+                await player.send(f"{c['yellow']}Long desc (shown in room):{c['reset']}")
+                return
+            if choice == '4':
+                state['menu'] = 'desc'
+                state['buffer'] = []
+                await player.send(f"{c['yellow']}Description (end with @):{c['reset']}")
+                return
+            if choice == '5':
+                state['menu'] = 'level'
+                await player.send(f"{c['yellow']}Level (1-60):{c['reset']}")
+                return
+            if choice == '6':
+                state['menu'] = 'hp'
+                await player.send(f"{c['yellow']}HP dice (e.g. '10d10+100'):{c['reset']}")
+                return
+            if choice == '7':
+                state['menu'] = 'damage'
+                await player.send(f"{c['yellow']}Damage dice (e.g. '2d6+4'):{c['reset']}")
+                return
+            if choice == '8':
+                state['menu'] = 'ac'
+                await player.send(f"{c['yellow']}Armor class (-20 to 10, lower is better):{c['reset']}")
+                return
+            if choice == '9':
+                state['menu'] = 'gold'
+                await player.send(f"{c['yellow']}Gold dropped:{c['reset']}")
+                return
+            if choice == 'a':
+                state['menu'] = 'exp'
+                await player.send(f"{c['yellow']}Experience value:{c['reset']}")
+                return
+            if choice == 'b':
+                state['menu'] = 'align'
+                await player.send(f"{c['yellow']}Alignment (-1000 to 1000):{c['reset']}")
+                return
+            if choice == 'c':
+                state['menu'] = 'flags'
+                await player.send(f"{c['yellow']}Flags (aggressive/sentinel/helper/boss/slow_wander/stay_zone/wimpy/memory), 0 to done:{c['reset']}")
+                return
+            if choice == 'd':
+                state['menu'] = 'boss'
+                await player.send(f"{c['yellow']}Make boss? (y/n):{c['reset']}")
+                return
+            await player.send(f"{c['yellow']}Invalid choice.{c['reset']}")
+            await cls.show_medit_menu(player)
+            return
+
+        if menu == 'name':
+            mob['name'] = line
+            state['menu'] = 'main'
+            await cls.show_medit_menu(player)
+            return
+        if menu == 'short':
+            mob['short_desc'] = line
+            state['menu'] = 'main'
+            await cls.show_medit_menu(player)
+            return
+        if menu == 'long':
+            mob['long_desc'] = line
+            state['menu'] = 'main'
+            await cls.show_medit_menu(player)
+            return
+        if menu == 'desc':
+            if line == '@':
+                mob['description'] = '\n'.join(state['buffer'])
+                state['menu'] = 'main'
+                await cls.show_medit_menu(player)
+            else:
+                state['buffer'].append(line)
+            return
+        if menu == 'level':
+            try:
+                mob['level'] = max(1, min(60, int(line)))
+            except:
+                pass
+            state['menu'] = 'main'
+            await cls.show_medit_menu(player)
+            return
+        if menu == 'hp':
+            mob['hp_dice'] = line
+            state['menu'] = 'main'
+            await cls.show_medit_menu(player)
+            return
+        if menu == 'damage':
+            mob['damage_dice'] = line
+            state['menu'] = 'main'
+            await cls.show_medit_menu(player)
+            return
+        if menu == 'ac':
+            try:
+                mob['armor_class'] = int(line)
+            except:
+                pass
+            state['menu'] = 'main'
+            await cls.show_medit_menu(player)
+            return
+        if menu == 'gold':
+            try:
+                mob['gold'] = max(0, int(line))
+            except:
+                pass
+            state['menu'] = 'main'
+            await cls.show_medit_menu(player)
+            return
+        if menu == 'exp':
+            try:
+                mob['exp'] = max(0, int(line))
+            except:
+                pass
+            state['menu'] = 'main'
+            await cls.show_medit_menu(player)
+            return
+        if menu == 'align':
+            try:
+                mob['alignment'] = max(-1000, min(1000, int(line)))
+            except:
+                pass
+            state['menu'] = 'main'
+            await cls.show_medit_menu(player)
+            return
+        if menu == 'flags':
+            if line in ['0', 'done']:
+                state['menu'] = 'main'
+                await cls.show_medit_menu(player)
+                return
+            flag = line.lower()
+            flags = mob.get('flags', [])
+            if not isinstance(flags, list):
+                flags = list(flags)
+            if flag in flags:
+                flags.remove(flag)
+            else:
+                flags.append(flag)
+            mob['flags'] = flags
+            await player.send(f"{c['cyan']}Flags: {' '.join(flags)}{c['reset']}")
+            await player.send(f"{c['yellow']}Enter flag (or 0 to done):{c['reset']}")
+            return
+        if menu == 'boss':
+            if line.lower().startswith('y'):
+                mob['boss'] = True
+                mob['boss_id'] = mob.get('name', 'boss').replace(' ', '_')
+                state['menu'] = 'boss_loot'
+                await player.send(f"{c['yellow']}Boss loot chance % (0-100):{c['reset']}")
+            else:
+                mob['boss'] = False
+                state['menu'] = 'main'
+                await cls.show_medit_menu(player)
+            return
+        if menu == 'boss_loot':
+            try:
+                mob['boss_loot_chance'] = max(0, min(100, int(line)))
+            except:
+                mob['boss_loot_chance'] = 100
+            state['menu'] = 'main'
+            await cls.show_medit_menu(player)
+            return
+
+    @classmethod
+    async def handle_oedit_input(cls, player: 'Player', cmd: str, args: List[str]):
+        """Handle oedit menu input."""
+        c = player.config.COLORS
+        state = player.olc_state
+        line = (cmd + (' ' + ' '.join(args) if args else '')).strip()
+        obj = state['obj']
+        menu = state['menu']
+
+        if menu == 'main':
+            choice = cmd.lower()
+            if choice == 'q':
+                player.olc_state = None
+                await player.send(f"{c['yellow']}Oedit exited. Use 'save <zone>' to write changes.{c['reset']}")
+                return
+            if choice == '1':
+                state['menu'] = 'name'
+                await player.send(f"{c['yellow']}Keywords (e.g. 'sword longsword'):{c['reset']}")
+                return
+            if choice == '2':
+                state['menu'] = 'short'
+                await player.send(f"{c['yellow']}Short desc (e.g. 'a long sword'):{c['reset']}")
+                return
+            if choice == '3':
+                state['menu'] = 'room'
+                await player.send(f"{c['yellow']}Room desc (shown on ground):{c['reset']}")
+                return
+            if choice == '4':
+                state['menu'] = 'desc'
+                state['buffer'] = []
+                await player.send(f"{c['yellow']}Description (end with @):{c['reset']}")
+                return
+            if choice == '5':
+                state['menu'] = 'type'
+                await player.send(f"{c['yellow']}Item type (weapon/armor/container/key/food/drink/light/scroll/potion/trash):{c['reset']}")
+                return
+            if choice == '6':
+                state['menu'] = 'wear'
+                await player.send(f"{c['yellow']}Wear slot (head/neck1/neck2/body/arms/hands/waist/legs/feet/wield/hold/shield/about/finger1/finger2/wrist1/wrist2/back/shoulders/ears/face):{c['reset']}")
+                return
+            if choice == '7':
+                state['menu'] = 'weight'
+                await player.send(f"{c['yellow']}Weight:{c['reset']}")
+                return
+            if choice == '8':
+                state['menu'] = 'value'
+                await player.send(f"{c['yellow']}Value (gold):{c['reset']}")
+                return
+            if choice == '9':
+                state['menu'] = 'flags'
+                await player.send(f"{c['yellow']}Flags (magic/glow/hum/nodrop/norent/invisible/cursed/anti_good/anti_evil/anti_neutral), 0 to done:{c['reset']}")
+                return
+            if choice == 'a':
+                state['menu'] = 'affects'
+                state['affect_idx'] = 0
+                await player.send(f"{c['yellow']}Add affect type (str/dex/con/int/wis/cha/hitroll/damroll/hp/mana/move/ac/spell_power/heal_power), or 0 to done:{c['reset']}")
+                return
+            if choice == 'b':
+                if obj.get('item_type') == 'weapon':
+                    state['menu'] = 'damage'
+                    await player.send(f"{c['yellow']}Damage dice (e.g. '2d6'):{c['reset']}")
+                elif obj.get('item_type') == 'armor':
+                    state['menu'] = 'armor'
+                    await player.send(f"{c['yellow']}Armor bonus:{c['reset']}")
+                elif obj.get('item_type') == 'container':
+                    state['menu'] = 'capacity'
+                    await player.send(f"{c['yellow']}Capacity:{c['reset']}")
+                else:
+                    await player.send(f"{c['yellow']}N/A for this item type.{c['reset']}")
+                return
+            if choice == 'c' and obj.get('item_type') == 'weapon':
+                state['menu'] = 'weapontype'
+                await player.send(f"{c['yellow']}Weapon type (slash/pierce/pound/crush):{c['reset']}")
+                return
+            await player.send(f"{c['yellow']}Invalid choice.{c['reset']}")
+            await cls.show_oedit_menu(player)
+            return
+
+        if menu == 'name':
+            obj['name'] = line
+            state['menu'] = 'main'
+            await cls.show_oedit_menu(player)
+            return
+        if menu == 'short':
+            obj['short_desc'] = line
+            state['menu'] = 'main'
+            await cls.show_oedit_menu(player)
+            return
+        if menu == 'room':
+            obj['room_desc'] = line
+            state['menu'] = 'main'
+            await cls.show_oedit_menu(player)
+            return
+        if menu == 'desc':
+            if line == '@':
+                obj['description'] = '\n'.join(state['buffer'])
+                state['menu'] = 'main'
+                await cls.show_oedit_menu(player)
+            else:
+                state['buffer'].append(line)
+            return
+        if menu == 'type':
+            obj['item_type'] = line.lower()
+            state['menu'] = 'main'
+            await cls.show_oedit_menu(player)
+            return
+        if menu == 'wear':
+            obj['wear_slot'] = line.lower() if line.lower() != 'none' else None
+            state['menu'] = 'main'
+            await cls.show_oedit_menu(player)
+            return
+        if menu == 'weight':
+            try:
+                obj['weight'] = max(0, int(line))
+            except:
+                pass
+            state['menu'] = 'main'
+            await cls.show_oedit_menu(player)
+            return
+        if menu == 'value':
+            try:
+                obj['value'] = max(0, int(line))
+            except:
+                pass
+            state['menu'] = 'main'
+            await cls.show_oedit_menu(player)
+            return
+        if menu == 'flags':
+            if line in ['0', 'done']:
+                state['menu'] = 'main'
+                await cls.show_oedit_menu(player)
+                return
+            flag = line.lower()
+            flags = obj.get('flags', [])
+            if not isinstance(flags, list):
+                flags = list(flags)
+            if flag in flags:
+                flags.remove(flag)
+            else:
+                flags.append(flag)
+            obj['flags'] = flags
+            await player.send(f"{c['cyan']}Flags: {' '.join(flags)}{c['reset']}")
+            await player.send(f"{c['yellow']}Enter flag (or 0 to done):{c['reset']}")
+            return
+        if menu == 'affects':
+            if line in ['0', 'done']:
+                state['menu'] = 'main'
+                await cls.show_oedit_menu(player)
+                return
+            state['affect_type'] = line.lower()
+            state['menu'] = 'affect_value'
+            await player.send(f"{c['yellow']}Value for {line}:{c['reset']}")
+            return
+        if menu == 'affect_value':
+            try:
+                val = int(line)
+            except:
+                val = 0
+            affects = obj.get('affects', [])
+            if not isinstance(affects, list):
+                affects = []
+            affects.append({'type': state['affect_type'], 'value': val})
+            obj['affects'] = affects
+            state['menu'] = 'affects'
+            await player.send(f"{c['cyan']}Added {state['affect_type']} +{val}{c['reset']}")
+            await player.send(f"{c['yellow']}Add another affect type, or 0 to done:{c['reset']}")
+            return
+        if menu == 'damage':
+            obj['damage_dice'] = line
+            state['menu'] = 'main'
+            await cls.show_oedit_menu(player)
+            return
+        if menu == 'armor':
+            try:
+                obj['armor_bonus'] = int(line)
+            except:
+                pass
+            state['menu'] = 'main'
+            await cls.show_oedit_menu(player)
+            return
+        if menu == 'capacity':
+            try:
+                obj['capacity'] = max(1, int(line))
+            except:
+                pass
+            state['menu'] = 'main'
+            await cls.show_oedit_menu(player)
+            return
+        if menu == 'weapontype':
+            obj['weapon_type'] = line.lower()
+            state['menu'] = 'main'
+            await cls.show_oedit_menu(player)
+            return
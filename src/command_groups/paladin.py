@@ -0,0 +1,305 @@
+"""
+Misthollow Paladin Commands
+==========================
+Paladin auras and holy power.
+"""
+
+import random
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class PaladinCommands:
+    """Paladin commands."""
+
+    @classmethod
+    async def cmd_aura(cls, player: 'Player', args: List[str]):
+        """Activate or view paladin auras."""
+        c = player.config.COLORS
+        
+        if player.char_class.lower() != 'paladin':
+            await player.send(f"{c['red']}Only paladins can use auras!{c['reset']}")
+            return
+        
+        auras = {
+            'devotion': {
+                'name': 'Devotion Aura',
+                'desc': '+15 AC to all allies in room',
+                'effect': 'ac',
+                'value': -15,
+                'level': 5
+            },
+            'protection': {
+                'name': 'Protection Aura', 
+                'desc': '+10% damage reduction to all allies',
+                'effect': 'damage_reduction',
+                'value': 10,
+                'level': 12
+            },
+            'retribution': {
+                'name': 'Retribution Aura',
+                'desc': 'Enemies take damage when they hit allies',
+                'effect': 'thorns',
+                'value': 5,
+                'level': 20
+            }
+        }
+        
+        if not args:
+            await player.send(f"{c['bright_yellow']}╔══════════════════════════════════════════════════╗{c['reset']}")
+            await player.send(f"{c['bright_yellow']}║  ✟ PALADIN AURAS ✟                               {c['bright_yellow']}║{c['reset']}")
+            await player.send(f"{c['bright_yellow']}╠══════════════════════════════════════════════════╣{c['reset']}")
+            
+            current = player.active_aura
+            if current:
+                await player.send(f"{c['bright_yellow']}║ {c['bright_green']}Active: {auras[current]['name']}{c['reset']}")
+            else:
+                await player.send(f"{c['bright_yellow']}║ {c['yellow']}No aura active{c['reset']}")
+            
+            await player.send(f"{c['bright_yellow']}╠══════════════════════════════════════════════════╣{c['reset']}")
+            for key, data in auras.items():
+                active = " ✓" if key == current else ""
+                locked = f" (Lvl {data['level']})" if player.level < data['level'] else ""
+                await player.send(f"{c['bright_yellow']}║ {c['cyan']}{data['name']}{active}{locked}{c['reset']}")
+                await player.send(f"{c['bright_yellow']}║   {c['white']}{data['desc']}{c['reset']}")
+            await player.send(f"{c['bright_yellow']}╚══════════════════════════════════════════════════╝{c['reset']}")
+            return
+        
+        aura_input = args[0].lower()
+        
+        if aura_input == 'off' or aura_input == 'none':
+            if player.active_aura:
+                await player.send(f"{c['cyan']}You deactivate your {auras[player.active_aura]['name']}.{c['reset']}")
+                player.active_aura = None
+            else:
+                await player.send(f"{c['yellow']}You have no aura active.{c['reset']}")
+            return
+        
+        # Match aura
+        matched = None
+        for key in auras:
+            if key.startswith(aura_input):
+                matched = key
+                break
+        
+        if not matched:
+            await player.send(f"{c['red']}Unknown aura. Try: devotion, protection, retribution, off{c['reset']}")
+            return
+        
+        aura_data = auras[matched]
+        
+        if player.level < aura_data['level']:
+            await player.send(f"{c['red']}You need level {aura_data['level']} to use {aura_data['name']}!{c['reset']}")
+            return
+        
+        player.active_aura = matched
+        
+        await player.send(f"{c['bright_yellow']}✟ You activate {aura_data['name']}! ✟{c['reset']}")
+        await player.send(f"{c['cyan']}{aura_data['desc']}{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(
+                f"A holy aura emanates from {player.name}.",
+                exclude=[player]
+            )
+    
+    @classmethod
+    async def cmd_smite(cls, player: 'Player', args: List[str]):
+        """Smite an enemy with holy power."""
+        c = player.config.COLORS
+        import time
+        import random
+        
+        if player.char_class.lower() != 'paladin':
+            await player.send(f"{c['red']}Only paladins can smite!{c['reset']}")
+            return
+        
+        if not player.is_fighting:
+            await player.send(f"{c['red']}You must be fighting to smite!{c['reset']}")
+            return
+        
+        # Check cooldown (20 seconds)
+        now = time.time()
+        if now - player.last_smite < 20:
+            remaining = int(20 - (now - player.last_smite))
+            await player.send(f"{c['yellow']}Smite is on cooldown! ({remaining}s){c['reset']}")
+            return
+        
+        if player.mana < 25:
+            await player.send(f"{c['red']}You need 25 mana to smite!{c['reset']}")
+            return
+        
+        player.mana -= 25
+        player.last_smite = now
+        
+        target = player.fighting
+        
+        # Base damage + bonus vs evil/undead
+        base_damage = random.randint(10, 20) + player.level
+        smite_bonus = player.get_equipment_bonus('smite') + player.get_equipment_bonus('holy_smite')
+        if smite_bonus:
+            base_damage += int(base_damage * (smite_bonus / 100))
+        
+        # Check if target is undead or evil (by keywords or flags)
+        is_evil = False
+        evil_keywords = ['undead', 'demon', 'devil', 'skeleton', 'zombie', 'vampire', 'lich', 'ghost', 'wraith', 'evil']
+        for kw in evil_keywords:
+            if kw in target.name.lower():
+                is_evil = True
+                break
+        
+        if is_evil:
+            damage = int(base_damage * 2.5)  # 2.5x vs evil
+            await player.send(f"{c['bright_yellow']}✟ Your smite burns {target.name} with holy fire! ✟ [{damage}]{c['reset']}")
+        else:
+            damage = base_damage
+            await player.send(f"{c['bright_yellow']}✟ You smite {target.name}! [{damage}]{c['reset']}")
+        
+        if hasattr(target, 'send'):
+            await target.send(f"{c['bright_yellow']}{player.name} smites you with holy power!{c['reset']}")
+        
+        await player.room.send_to_room(
+            f"{player.name} smites {target.name} with divine power!",
+            exclude=[player, target]
+        )
+        
+        killed = await target.take_damage(damage, player)
+        if killed:
+            from combat import CombatHandler
+            await CombatHandler.handle_death(player, target)
+    
+    @classmethod
+    async def cmd_layhands(cls, player: 'Player', args: List[str]):
+        """Use lay on hands to heal yourself or an ally."""
+        c = player.config.COLORS
+        
+        if player.char_class.lower() != 'paladin':
+            await player.send(f"{c['red']}Only paladins can use lay on hands!{c['reset']}")
+            return
+        
+        if player.lay_hands_used:
+            await player.send(f"{c['yellow']}You have already used lay on hands today. Rest to restore it.{c['reset']}")
+            return
+        
+        target = player
+        
+        if args:
+            target_name = ' '.join(args).lower()
+            for char in player.room.characters:
+                from mobs import Mobile
+                if not isinstance(char, Mobile) and target_name in char.name.lower():
+                    target = char
+                    break
+        
+        # Heal amount: 50% of paladin max HP
+        heal_amount = player.max_hp // 2
+        old_hp = target.hp
+        target.hp = min(target.max_hp, target.hp + heal_amount)
+        actual_heal = target.hp - old_hp
+        
+        player.lay_hands_used = True
+        
+        if target == player:
+            await player.send(f"{c['bright_yellow']}✟ You lay hands upon yourself, healing {actual_heal} HP! ✟{c['reset']}")
+            await player.room.send_to_room(
+                f"Divine light surrounds {player.name} as they heal themselves.",
+                exclude=[player]
+            )
+        else:
+            await player.send(f"{c['bright_yellow']}✟ You lay hands upon {target.name}, healing {actual_heal} HP! ✟{c['reset']}")
+            await target.send(f"{c['bright_yellow']}{player.name} lays hands upon you, healing {actual_heal} HP!{c['reset']}")
+            await player.room.send_to_room(
+                f"Divine light flows from {player.name} to {target.name}.",
+                exclude=[player, target]
+            )
+
+    
+    # --- PALADIN HOLY POWER ABILITIES ---
+
+    @classmethod
+    async def cmd_templars_verdict(cls, player: 'Player', args: List[str]):
+        """Powerful holy strike. Costs 3 Holy Power. Paladin only."""
+        c = player.config.COLORS
+        if player.char_class.lower() != 'paladin':
+            await player.send(f"{c['red']}Only paladins can use Templar's Verdict!{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
+            return
+        if player.holy_power < 3:
+            await player.send(f"{c['red']}You need 3 Holy Power! (Current: {player.holy_power}/5){c['reset']}")
+            return
+        from combat import CombatHandler
+        from talents import TalentManager
+        spent = player.holy_power
+        player.holy_power = 0  # Spend all
+        target = player.fighting
+        weapon = player.equipment.get('wield')
+        if weapon and hasattr(weapon, 'damage_dice'):
+            damage = CombatHandler.roll_dice(weapon.damage_dice)
+        else:
+            damage = random.randint(2, 8)
+        multiplier = 2.0
+        # Sanctified wrath: at 5 holy power, 3x instead of 2x
+        if spent >= 5 and TalentManager.has_talent(player, 'sanctified_wrath'):
+            multiplier = 3.0
+        # Sanctity of battle talent
+        sob_rank = TalentManager.get_talent_rank(player, 'sanctity_of_battle')
+        multiplier += sob_rank * 0.03
+        damage = int(damage * multiplier) + player.get_damage_bonus()
+        # Holy bonus from wis
+        damage += player.wis // 2
+        # Oath vengeance bonus
+        if getattr(player, 'active_oath', None) == 'vengeance':
+            damage = int(damage * 1.15)
+        elif getattr(player, 'active_oath', None) == 'justice':
+            damage = int(damage * 1.10)
+        damage = max(1, damage)
+        await player.send(f"{c['bright_yellow']}⚔️ Templar's Verdict strikes {target.name}! [{damage}]{c['reset']}")
+        if hasattr(target, 'send'):
+            await target.send(f"{c['bright_yellow']}{player.name} delivers divine judgment upon you! [{damage}]{c['reset']}")
+        killed = await target.take_damage(damage, player)
+        if killed:
+            await CombatHandler.handle_death(player, target)
+
+    @classmethod
+    async def cmd_word_of_glory(cls, player: 'Player', args: List[str]):
+        """Heal self for 30% max HP. Costs 3 Holy Power. Paladin only."""
+        c = player.config.COLORS
+        if player.char_class.lower() != 'paladin':
+            await player.send(f"{c['red']}Only paladins can use Word of Glory!{c['reset']}")
+            return
+        if player.holy_power < 3:
+            await player.send(f"{c['red']}You need 3 Holy Power! (Current: {player.holy_power}/5){c['reset']}")
+            return
+        from talents import TalentManager
+        player.holy_power -= 3
+        heal_pct = 0.30
+        hl_rank = TalentManager.get_talent_rank(player, 'healing_light')
+        heal_pct += hl_rank * 0.05
+        if getattr(player, 'active_oath', None) == 'devotion':
+            heal_pct *= 1.20
+        elif getattr(player, 'active_oath', None) == 'vengeance':
+            heal_pct *= 0.90
+        elif getattr(player, 'active_oath', None) == 'justice':
+            heal_pct *= 1.10
+        heal = int(player.max_hp * heal_pct)
+        player.hp = min(player.max_hp, player.hp + heal)
+        await player.send(f"{c['bright_green']}✨ Word of Glory heals you for {heal} HP! [{player.hp}/{player.max_hp}]{c['reset']}")
+        await player.room.send_to_room(f"A golden light surrounds {player.name}, healing their wounds.", exclude=[player])
+
+    @classmethod
+    async def cmd_divine_storm(cls, player: 'Player', args: List[str]):
+        """Holy whirlwind attack."""
+        c = player.config.COLORS
+        if 'divine_storm' not in player.skills:
+            await player.send(f"{c['red']}You don't know Divine Storm.{c['reset']}")
+            return
+        from mobs import Mobile
+        import random
+        targets = [m for m in player.room.characters if isinstance(m, Mobile) and m.hp > 0]
+        await player.send(f"{c['bright_yellow']}You unleash a Divine Storm!{c['reset']}")
+        for target in targets:
+            dmg = random.randint(6, 12) + player.level
+            await target.take_damage(dmg, player)
@@ -0,0 +1,367 @@
+"""
+Misthollow Party Commands
+========================
+Grouping and following.
+"""
+
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class PartyCommands:
+    """Party commands."""
+
+    @classmethod
+    async def cmd_group(cls, player: 'Player', args: List[str]):
+        """Manage your group/party for multiplayer dungeon runs.
+        
+        Usage:
+            group               - Show group status
+            group <player>      - Invite a player to your group
+            group accept        - Accept a pending group invitation
+            group decline       - Decline a pending group invitation
+            group leave         - Leave your current group
+            group list          - Show group status (same as no args)
+            group kick <player> - Remove player from group (leader only)
+            group leader <player> - Transfer leadership (leader only)
+            group loot <mode>   - Set loot mode: freeforall or roundrobin
+            group follow        - Toggle auto-follow on/off
+            group disband       - Disband the group (leader only)
+            group all           - Group all players following you
+        
+        Max group size: 6 players. The first person to invite becomes leader.
+        """
+        from groups import GroupManager
+
+        c = player.config.COLORS
+
+        # No args - show group info
+        if not args:
+            await GroupManager.show_group(player)
+            return
+
+        action = args[0].lower()
+
+        # --- accept / decline ---
+        if action == 'accept':
+            await GroupManager.accept_invite(player)
+            return
+        if action == 'decline':
+            await GroupManager.decline_invite(player)
+            return
+
+        # --- list (alias for no-args) ---
+        if action == 'list':
+            await GroupManager.show_group(player)
+            return
+
+        # --- leave ---
+        if action == 'leave':
+            await GroupManager.leave_group(player)
+            return
+            
+        # --- disband (leader only) ---
+        if action == 'disband':
+            if not getattr(player, 'group', None):
+                await player.send(f"{c['yellow']}You're not in a group.{c['reset']}")
+                return
+            if player.group.leader != player:
+                await player.send(f"{c['red']}Only the group leader can disband the group.{c['reset']}")
+                return
+            for member in player.group.members:
+                if member != player:
+                    await member.send(f"{c['yellow']}{player.name} has disbanded the group.{c['reset']}")
+            player.group.disband()
+            await player.send(f"{c['yellow']}You disband the group.{c['reset']}")
+            return
+
+        # --- leader <player> (transfer leadership) ---
+        if action == 'leader' and len(args) > 1:
+            if not getattr(player, 'group', None):
+                await player.send(f"{c['yellow']}You're not in a group.{c['reset']}")
+                return
+            if player.group.leader != player:
+                await player.send(f"{c['red']}Only the current leader can transfer leadership.{c['reset']}")
+                return
+            target_name = ' '.join(args[1:]).lower()
+            target = None
+            for member in player.group.members:
+                if member.name.lower().startswith(target_name) and member != player:
+                    target = member
+                    break
+            if not target:
+                await player.send(f"{c['red']}'{target_name}' is not in your group.{c['reset']}")
+                return
+            player.group.set_leader(target)
+            for member in player.group.members:
+                await member.send(f"{c['bright_green']}{target.name} is now the group leader.{c['reset']}")
+            return
+
+        # --- loot <mode> ---
+        if action == 'loot':
+            if not getattr(player, 'group', None):
+                await player.send(f"{c['yellow']}You're not in a group.{c['reset']}")
+                return
+            if player.group.leader != player:
+                await player.send(f"{c['red']}Only the leader can change loot mode.{c['reset']}")
+                return
+            if len(args) < 2:
+                current = 'Round-Robin' if player.group.loot_mode == 'roundrobin' else 'Free-for-All'
+                await player.send(f"{c['cyan']}Current loot mode: {current}. Use 'group loot freeforall' or 'group loot roundrobin'.{c['reset']}")
+                return
+            mode = args[1].lower().replace('-', '').replace('_', '')
+            if mode in ('ffa', 'freeforall', 'free'):
+                player.group.loot_mode = 'freeforall'
+                for member in player.group.members:
+                    await member.send(f"{c['bright_green']}Loot mode set to Free-for-All.{c['reset']}")
+            elif mode in ('rr', 'roundrobin', 'round'):
+                player.group.loot_mode = 'roundrobin'
+                for member in player.group.members:
+                    await member.send(f"{c['bright_green']}Loot mode set to Round-Robin.{c['reset']}")
+            else:
+                await player.send(f"{c['red']}Unknown loot mode. Use 'freeforall' or 'roundrobin'.{c['reset']}")
+            return
+
+        # --- follow (toggle auto-follow) ---
+        if action == 'follow':
+            if not getattr(player, 'group', None):
+                await player.send(f"{c['yellow']}You're not in a group.{c['reset']}")
+                return
+            group = player.group
+            group.auto_follow = not group.auto_follow
+            state = 'ON' if group.auto_follow else 'OFF'
+            # Update following pointers for all non-leader members
+            for member in group.members:
+                if member != group.leader:
+                    member.following = group.leader if group.auto_follow else None
+                await member.send(f"{c['cyan']}Group auto-follow is now {state}.{c['reset']}")
+            return
+
+        # --- kick <player> ---
+        if action == 'kick' and len(args) > 1:
+            if not getattr(player, 'group', None):
+                await player.send(f"{c['yellow']}You're not in a group.{c['reset']}")
+                return
+            if player.group.leader != player:
+                await player.send(f"{c['red']}Only the group leader can kick members.{c['reset']}")
+                return
+            target_name = ' '.join(args[1:]).lower()
+            target = None
+            for member in player.group.members:
+                if member.name.lower().startswith(target_name) and member != player:
+                    target = member
+                    break
+            if not target:
+                await player.send(f"{c['red']}'{target_name}' is not in your group.{c['reset']}")
+                return
+            player.group.remove_member(target)
+            await player.send(f"{c['yellow']}You kick {target.name} from the group.{c['reset']}")
+            await target.send(f"{c['yellow']}{player.name} kicks you from the group.{c['reset']}")
+            for member in player.group.members:
+                if member != player:
+                    await member.send(f"{c['yellow']}{target.name} has been kicked from the group.{c['reset']}")
+            return
+            
+        # --- group all (legacy: group all followers) ---
+        if action == 'all':
+            followers = []
+            for char in player.room.characters:
+                if char != player and hasattr(char, 'connection'):
+                    if getattr(char, 'following', None) == player:
+                        followers.append(char)
+            if not followers:
+                await player.send(f"{c['yellow']}No one is following you here.{c['reset']}")
+                return
+            added = 0
+            for follower in followers:
+                success = await GroupManager.join_group(player, follower)
+                if success:
+                    added += 1
+            if added > 0:
+                await player.send(f"{c['green']}Added {added} follower(s) to your group.{c['reset']}")
+            else:
+                await player.send(f"{c['yellow']}Could not add any followers to the group.{c['reset']}")
+            return
+
+        # --- group <player> (invite) ---
+        target_name = ' '.join(args).lower()
+        target = None
+        for char in player.room.characters:
+            if char != player and hasattr(char, 'connection'):
+                if char.name.lower().startswith(target_name):
+                    target = char
+                    break
+        if not target:
+            await player.send(f"{c['red']}Player '{target_name}' not found here.{c['reset']}")
+            return
+        await GroupManager.invite(player, target)
+    
+    @classmethod
+    async def cmd_ungroup(cls, player: 'Player', args: List[str]):
+        """Leave your group or remove someone from it.
+        
+        Usage:
+            ungroup         - Leave your current group
+            ungroup <name>  - Remove player from group (leader only)
+        """
+        from groups import GroupManager
+        c = player.config.COLORS
+        
+        if not hasattr(player, 'group') or not player.group:
+            await player.send(f"{c['yellow']}You're not in a group.{c['reset']}")
+            return
+        
+        if not args:
+            # Leave group
+            await GroupManager.leave_group(player)
+            return
+        
+        # Remove specific player (leader only)
+        if player.group.leader != player:
+            await player.send(f"{c['red']}Only the group leader can remove members.{c['reset']}")
+            return
+        
+        target_name = ' '.join(args).lower()
+        target = None
+        for member in player.group.members:
+            if member.name.lower().startswith(target_name) and member != player:
+                target = member
+                break
+        
+        if not target:
+            await player.send(f"{c['red']}'{target_name}' is not in your group.{c['reset']}")
+            return
+        
+        player.group.remove_member(target)
+        target.group = None
+        await player.send(f"{c['yellow']}You remove {target.name} from the group.{c['reset']}")
+        await target.send(f"{c['yellow']}{player.name} removes you from the group.{c['reset']}")
+        for member in player.group.members:
+            if member != player:
+                await member.send(f"{c['yellow']}{target.name} has left the group.{c['reset']}")
+
+    @classmethod
+    async def cmd_follow(cls, player: 'Player', args: List[str]):
+        """Follow another player. Usage: follow <player> or follow self"""
+        c = player.config.COLORS
+
+        if not args:
+            if hasattr(player, 'following') and player.following:
+                await player.send(f"{c['cyan']}You are following {player.following.name}.{c['reset']}")
+            else:
+                await player.send(f"{c['yellow']}You aren't following anyone.{c['reset']}")
+            return
+
+        target_name = ' '.join(args).lower()
+
+        # Stop following
+        if target_name in ('self', 'stop', 'none'):
+            if hasattr(player, 'following') and player.following:
+                old_leader = player.following
+                player.following = None
+                await player.send(f"{c['yellow']}You stop following {old_leader.name}.{c['reset']}")
+                await old_leader.send(f"{c['yellow']}{player.name} stops following you.{c['reset']}")
+            else:
+                await player.send(f"{c['yellow']}You aren't following anyone.{c['reset']}")
+            return
+
+        # Find target in room
+        target = None
+        for char in player.room.characters:
+            if char != player and hasattr(char, 'connection'):  # Is a player
+                if char.name.lower().startswith(target_name):
+                    target = char
+                    break
+
+        if not target:
+            await player.send(f"{c['red']}Player '{target_name}' not found here.{c['reset']}")
+            return
+
+        # Can't follow yourself
+        if target == player:
+            await player.send(f"{c['red']}You can't follow yourself!{c['reset']}")
+            return
+
+        # Start following
+        player.following = target
+        await player.send(f"{c['green']}You start following {target.name}.{c['reset']}")
+        await target.send(f"{c['green']}{player.name} starts following you.{c['reset']}")
+
+    @classmethod
+    async def cmd_gtell(cls, player: 'Player', args: List[str]):
+        """Send a message to your group. Usage: gtell <message>"""
+        c = player.config.COLORS
+
+        if not hasattr(player, 'group') or not player.group:
+            await player.send(f"{c['red']}You're not in a group!{c['reset']}")
+            return
+
+        if not args:
+            await player.send(f"{c['yellow']}Tell the group what?{c['reset']}")
+            return
+
+        message = ' '.join(args)
+        await player.group.group_tell(player, message)
+
+    @classmethod
+    async def cmd_split(cls, player: 'Player', args: List[str]):
+        """Split gold with your group. Usage: split <amount>"""
+        c = player.config.COLORS
+
+        if not hasattr(player, 'group') or not player.group:
+            await player.send(f"{c['red']}You're not in a group!{c['reset']}")
+            return
+
+        if not args:
+            await player.send(f"{c['yellow']}Split how much gold?{c['reset']}")
+            return
+
+        try:
+            amount = int(args[0])
+        except ValueError:
+            await player.send(f"{c['red']}Invalid amount.{c['reset']}")
+            return
+
+        if amount <= 0:
+            await player.send(f"{c['red']}You must split a positive amount.{c['reset']}")
+            return
+
+        if player.gold < amount:
+            await player.send(f"{c['red']}You don't have that much gold! You have {player.gold} gold.{c['reset']}")
+            return
+
+        # Take gold from player
+        player.gold -= amount
+
+        # Split among group
+        await player.group.split_gold(amount)
+
+        # Announce
+        await player.send(f"{c['bright_yellow']}You split {amount} gold with your group.{c['reset']}")
+        for member in player.group.members:
+            if member != player:
+                await member.send(f"{c['bright_yellow']}{player.name} splits {amount} gold with the group.{c['reset']}")
+
+
+    @classmethod
+    async def cmd_report(cls, player: 'Player', args: List[str]):
+        """Report your status to the group."""
+        c = player.config.COLORS
+        
+        hp_pct = int((player.hp / player.max_hp) * 100) if player.max_hp > 0 else 0
+        mana_pct = int((player.mana / player.max_mana) * 100) if player.max_mana > 0 else 0
+        move_pct = int((player.move / player.max_move) * 100) if player.max_move > 0 else 0
+        
+        report = f"{player.name} reports: {player.hp}/{player.max_hp} HP ({hp_pct}%), {player.mana}/{player.max_mana} Mana ({mana_pct}%), {player.move}/{player.max_move} Move ({move_pct}%)"
+        
+        if hasattr(player, 'group') and player.group:
+            # Send to group
+            for member in player.group.members:
+                await member.send(f"{c['cyan']}{report}{c['reset']}")
+        else:
+            # Just show in room
+            await player.send(f"{c['cyan']}You report: {player.hp}/{player.max_hp} HP, {player.mana}/{player.max_mana} Mana, {player.move}/{player.max_move} Move{c['reset']}")
+            if player.room:
+                await player.room.send_to_room(f"{c['white']}{report}{c['reset']}", exclude=[player])
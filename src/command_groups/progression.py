@@ -0,0 +1,708 @@
+"""
+Misthollow Progression Commands
+==============================
+Skills, talents, practice, levels and prestige.
+"""
+
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class ProgressionCommands:
+    """Progression commands."""
+
+    @classmethod
+    async def cmd_newgameplus(cls, player: 'Player', args: List[str]):
+        """Start a New Game+ cycle after completing the main story."""
+        from quests import QuestManager
+        state = QuestManager._get_chain_state(player, 'main_story')
+        if not state or not state.get('completed'):
+            await player.send("You must complete the main story before starting New Game+.")
+            return
+
+        nightmare = any(arg.lower() == 'nightmare' for arg in args)
+
+        c = player.config.COLORS
+        gold_keep = int(player.gold * 0.4)
+
+        # Retain skills/spells at reduced power
+        player.skills = {k: max(1, int(v * 0.6)) for k, v in player.skills.items()}
+        player.spells = {k: max(1, int(v * 0.6)) for k, v in player.spells.items()}
+
+        player.level = 1
+        player.exp = 0
+        player.gold = gold_keep
+        player.hp = player.max_hp = 100
+        player.mana = player.max_mana = 100
+        player.move = player.max_move = 100
+
+        player.quests_completed = []
+        player.quest_flags = {}
+        player.quest_chains = {}
+        player.dialogue_state = {}
+        player.active_quests = []
+        player.explored_rooms = set()
+        player.discovered_exits = set()
+        player.secret_rooms_found = set()
+
+        player.inventory = []
+        player.equipment = {slot: None for slot in player.equipment}
+
+        old_room = player.room
+        player.room_vnum = player.config.STARTING_ROOM
+        if player.world:
+            player.room = player.world.get_room(player.room_vnum)
+            if old_room and player in old_room.characters:
+                old_room.characters.remove(player)
+            if player.room and player not in player.room.characters:
+                player.room.characters.append(player)
+
+        player.ng_plus_cycle = getattr(player, 'ng_plus_cycle', 0) + 1
+        player.nightmare_mode = nightmare
+
+        await player.send(
+            f"{c['bright_magenta']}New Game+ begins!{c['reset']} "
+            f"Cycle {player.ng_plus_cycle} {'(Nightmare)' if nightmare else ''}"
+        )
+        await player.send(
+            f"{c['yellow']}You retain {gold_keep} gold, some skill mastery, and your title.{c['reset']}"
+        )
+
+    @classmethod
+    async def cmd_skills(cls, player: 'Player', args: List[str]):
+        """Show all skills and spells available to your class, or pet abilities."""
+        c = player.config.COLORS
+        
+        # Check if user wants to see pet skills
+        if args:
+            pet_arg = args[0].lower()
+            pet_map = {
+                'knight': 'undead_warrior', 'warrior': 'undead_warrior', 'bone': 'undead_warrior',
+                'wraith': 'undead_healer', 'healer': 'undead_healer',
+                'lich': 'undead_caster', 'caster': 'undead_caster', 'mage': 'undead_caster',
+                'stalker': 'undead_rogue', 'rogue': 'undead_rogue', 'shadow': 'undead_rogue',
+                'air': 'air_elemental', 'fire': 'fire_elemental', 'water': 'water_elemental', 'earth': 'earth_elemental',
+                'wolf': 'wolf', 'bear': 'bear', 'hawk': 'hawk', 'cat': 'panther',
+            }
+            if pet_arg in pet_map:
+                await cls._show_pet_skills(player, pet_map[pet_arg])
+                return
+        
+        # ASCII mode support
+        use_ascii = getattr(player, 'ascii_ui', False)
+        if use_ascii:
+            TL, TR, BL, BR = '+', '+', '+', '+'
+            H, V = '-', '|'
+            LT, RT = '+', '+'
+            BAR_FULL, BAR_EMPTY = '#', '.'
+        else:
+            TL, TR, BL, BR = '╔', '╗', '╚', '╝'
+            H, V = '═', '║'
+            LT, RT = '╠', '╣'
+            BAR_FULL, BAR_EMPTY = '█', '░'
+        
+        W = 64
+        
+        # Get class data
+        class_data = player.config.CLASSES.get(player.char_class.lower(), {})
+        class_skills = class_data.get('skills', [])
+        class_spells = class_data.get('spells', [])
+        
+        await player.send(f"{c['cyan']}{TL}{H*W}{TR}{c['reset']}")
+        await player.send(f"{c['cyan']}{V}{c['bright_yellow']}  {player.char_class.upper()} SKILLS & SPELLS                              {c['cyan']}{V}{c['reset']}")
+        await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
+        await player.send(f"{c['cyan']}{V} {c['white']}Practice sessions: {c['bright_green']}{player.practices}{c['cyan']}                                      {V}{c['reset']}")
+        await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
+        
+        # Skills section
+        await player.send(f"{c['cyan']}{V} {c['bright_yellow']}SKILLS:{c['cyan']}                                                     {V}{c['reset']}")
+        if class_skills:
+            for skill in class_skills:
+                prof = player.skills.get(skill, 0)
+                skill_name = skill.replace('_', ' ').title()
+                if prof > 0:
+                    bar = BAR_FULL * (prof // 10) + BAR_EMPTY * (10 - prof // 10)
+                    await player.send(f"{c['cyan']}{V}   {c['bright_green']}{skill_name:<20} {c['white']}[{bar}] {prof:>3}%{c['cyan']}          {V}{c['reset']}")
+                else:
+                    await player.send(f"{c['cyan']}{V}   {c['white']}{skill_name:<20} {c['yellow']}[not learned]{c['cyan']}                 {V}{c['reset']}")
+        else:
+            await player.send(f"{c['cyan']}{V}   {c['white']}(none){c['cyan']}                                                  {V}{c['reset']}")
+        
+        await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
+        
+        # Spells section
+        await player.send(f"{c['cyan']}{V} {c['bright_yellow']}SPELLS:{c['cyan']}                                                     {V}{c['reset']}")
+        if class_spells:
+            for spell in class_spells:
+                prof = player.spells.get(spell, 0)
+                spell_name = spell.replace('_', ' ').title()
+                if prof > 0:
+                    bar = BAR_FULL * (prof // 10) + BAR_EMPTY * (10 - prof // 10)
+                    await player.send(f"{c['cyan']}{V}   {c['bright_magenta']}{spell_name:<20} {c['white']}[{bar}] {prof:>3}%{c['cyan']}          {V}{c['reset']}")
+                else:
+                    await player.send(f"{c['cyan']}{V}   {c['white']}{spell_name:<20} {c['yellow']}[not learned]{c['cyan']}                 {V}{c['reset']}")
+        else:
+            await player.send(f"{c['cyan']}{V}   {c['white']}(none){c['cyan']}                                                  {V}{c['reset']}")
+        
+        # Talent abilities section
+        from talents import CLASS_TALENT_TREES
+        talent_skills = []
+        trees = CLASS_TALENT_TREES.get(player.char_class.lower(), [])
+        for tree in trees:
+            for tid, talent in tree['talents'].items():
+                if 'skill_unlock' in talent.effects:
+                    skill_id = talent.effects['skill_unlock']
+                    cur_rank = getattr(player, 'talents', {}).get(tid, 0)
+                    prof = player.skills.get(skill_id, 0)
+                    talent_skills.append((skill_id, talent.name, cur_rank >= 1, prof))
+        
+        if talent_skills:
+            await player.send(f"{c['cyan']}{LT}{H*W}{c['reset']}")
+            await player.send(f"{c['cyan']}{V} {c['bright_yellow']}TALENT ABILITIES:{c['reset']}")
+            for skill_id, talent_name, unlocked, prof in talent_skills:
+                skill_name = skill_id.replace('_', ' ').title()
+                if unlocked and prof > 0:
+                    bar = BAR_FULL * (prof // 10) + BAR_EMPTY * (10 - prof // 10)
+                    await player.send(f"{c['cyan']}{V}   {c['bright_green']}{skill_name:<20} {c['white']}[{bar}] {prof:>3}%{c['reset']}")
+                elif unlocked:
+                    await player.send(f"{c['cyan']}{V}   {c['bright_green']}{skill_name:<20} {c['white']}[unlocked]{c['reset']}")
+                else:
+                    await player.send(f"{c['cyan']}{V}   {c['white']}{skill_name:<20} {c['red']}[locked - need {talent_name}]{c['reset']}")
+        
+        await player.send(f"{c['cyan']}{LT}{H*W}{c['reset']}")
+        await player.send(f"{c['cyan']}{V} {c['white']}Find a trainer to practice and improve your abilities!{c['reset']}")
+        await player.send(f"{c['cyan']}{BL}{H*W}{c['reset']}")
+
+    @classmethod
+    async def _show_pet_skills(cls, player: 'Player', template_name: str):
+        """Show abilities for a pet type."""
+        c = player.config.COLORS
+        from pets import PET_TEMPLATES
+        
+        template = PET_TEMPLATES.get(template_name)
+        if not template:
+            await player.send(f"{c['red']}Unknown pet type.{c['reset']}")
+            return
+        
+        use_ascii = getattr(player, 'ascii_ui', False)
+        if use_ascii:
+            TL, TR, BL, BR = '+', '+', '+', '+'
+            H, V = '-', '|'
+            LT, RT = '+', '+'
+        else:
+            TL, TR, BL, BR = '╔', '╗', '╚', '╝'
+            H, V = '═', '║'
+            LT, RT = '╠', '╣'
+        
+        W = 50
+        name = template.get('name', template_name).upper()
+        role = template.get('role', 'companion').title()
+        pet_type = template.get('pet_type', 'summon').title()
+        abilities = template.get('special_abilities', [])
+        duration = template.get('duration', 3600) // 60  # minutes
+        hp_dice = template.get('hp_dice', '?')
+        damage_dice = template.get('damage_dice', '?')
+        level_mult = template.get('level_mult', 1.0)
+        
+        await player.send(f"{c['cyan']}{TL}{H*W}{TR}{c['reset']}")
+        await player.send(f"{c['cyan']}{V}{c['bright_magenta']}  {name:<46} {c['cyan']}{V}{c['reset']}")
+        await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
+        await player.send(f"{c['cyan']}{V} {c['white']}Type: {c['yellow']}{pet_type:<15} {c['white']}Role: {c['yellow']}{role:<15}{c['cyan']} {V}{c['reset']}")
+        await player.send(f"{c['cyan']}{V} {c['white']}Level: {c['green']}{int(level_mult*100)}% of yours   {c['white']}Duration: {c['green']}{duration} min{c['cyan']}        {V}{c['reset']}")
+        await player.send(f"{c['cyan']}{V} {c['white']}HP: {c['green']}{hp_dice:<12} {c['white']}Damage: {c['green']}{damage_dice:<12}{c['cyan']}    {V}{c['reset']}")
+        await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
+        await player.send(f"{c['cyan']}{V} {c['bright_yellow']}ABILITIES:{c['cyan']}                                       {V}{c['reset']}")
+        
+        # Ability descriptions
+        ability_info = {
+            'undead': ('Undead', 'Immune to poison, disease, and fear'),
+            'shield_wall': ('Shield Wall', 'Reduces incoming damage, taunts enemies'),
+            'dark_heal': ('Dark Heal', 'Heals owner using dark magic'),
+            'necrotic_bolt': ('Necrotic Bolt', 'Ranged magic attack dealing shadow damage'),
+            'backstab': ('Backstab', 'High damage sneak attack from shadows'),
+            'whirlwind': ('Whirlwind', 'Area attack hitting all enemies'),
+            'fly': ('Flying', 'Can fly over obstacles'),
+            'fire_breath': ('Fire Breath', 'Cone of fire damage'),
+            'immolate': ('Immolate', 'Burns enemies that attack'),
+            'tidal_wave': ('Tidal Wave', 'Knockback water attack'),
+            'healing_mist': ('Healing Mist', 'Heals allies in the area'),
+            'earthquake': ('Earthquake', 'Stuns and damages all enemies'),
+            'stone_skin': ('Stone Skin', 'Greatly increased defense'),
+            'howl': ('Howl', 'Buffs attack speed'),
+            'pack_tactics': ('Pack Tactics', 'Bonus damage when owner is fighting'),
+            'maul': ('Maul', 'Heavy damage with stun chance'),
+            'thick_hide': ('Thick Hide', 'Damage reduction'),
+            'dive': ('Dive', 'Aerial attack with bonus damage'),
+            'scout': ('Scout', 'Can scout ahead, reveals hidden enemies'),
+            'pounce': ('Pounce', 'Leaps at target for opening attack'),
+            'stealth': ('Stealth', 'Sneaks alongside owner'),
+        }
+        
+        if abilities:
+            for ability in abilities:
+                info = ability_info.get(ability, (ability.replace('_', ' ').title(), 'Special ability'))
+                await player.send(f"{c['cyan']}{V}   {c['bright_green']}{info[0]:<15} {c['white']}{info[1]:<30}{c['cyan']}{V}{c['reset']}")
+        else:
+            await player.send(f"{c['cyan']}{V}   {c['white']}(no special abilities){c['cyan']}                      {V}{c['reset']}")
+        
+        await player.send(f"{c['cyan']}{BL}{H*W}{BR}{c['reset']}")
+        
+        # Show how to summon
+        if template.get('pet_type') == 'undead':
+            themed_name = {'undead_warrior': 'knight', 'undead_healer': 'wraith', 'undead_caster': 'lich', 'undead_rogue': 'stalker'}.get(template_name, template_name)
+            await player.send(f"{c['yellow']}Summon with: raise {themed_name}{c['reset']}")
+        elif 'elemental' in template_name:
+            elem = template_name.split('_')[0]
+            await player.send(f"{c['yellow']}Summon with: cast summon {elem}{c['reset']}")
+        elif template_name in ('wolf', 'bear', 'hawk', 'panther'):
+            await player.send(f"{c['yellow']}Tame with: tame {template_name}{c['reset']}")
+
+    @classmethod
+    async def cmd_skill(cls, player: 'Player', args: List[str]):
+        """Alias for skills command."""
+        await cls.cmd_skills(player, args)
+    
+    @classmethod
+    async def cmd_talents(cls, player: 'Player', args: List[str]):
+        """View and spend talent points.
+        
+        Usage:
+            talents           - Show all talent trees
+            talents <tree>    - Show specific tree (e.g., 'talents fury')
+            talents learn <id> - Learn/rank up a talent
+            talents reset     - Reset all talents (costs gold)
+        """
+        from talents import TalentManager, CLASS_TALENT_TREES
+        
+        c = player.config.COLORS
+        char_class = (getattr(player, 'char_class', 'warrior') or 'warrior').lower()
+        
+        if char_class == 'warrior':
+            await player.send(f"{c['bright_yellow']}Warriors progress through Martial Doctrines and Ability Evolution.{c['reset']}")
+            await player.send(f"{c['white']}Use 'doctrine' and 'evolve' to view your progression.{c['reset']}")
+            return
+        
+        trees = CLASS_TALENT_TREES.get(char_class, [])
+        
+        if not trees:
+            await player.send(f"{c['red']}No talent trees defined for your class.{c['reset']}")
+            return
+        
+        # Ensure player has talents dict
+        if not hasattr(player, 'talents'):
+            player.talents = {}
+        
+        sub = args[0].lower() if args else None
+        
+        # Learn a talent
+        if sub == 'learn' and len(args) > 1:
+            talent_id = args[1].lower()
+            await TalentManager.learn_talent(player, talent_id)
+            return
+        
+        # Reset talents
+        if sub == 'reset':
+            cost = player.level * 100
+            if player.gold < cost:
+                await player.send(f"{c['red']}Talent reset costs {cost} gold. You only have {player.gold}.{c['reset']}")
+                return
+            player.gold -= cost
+            player.talents = {}
+            await player.send(f"{c['bright_yellow']}Your talents have been reset! Paid {cost} gold.{c['reset']}")
+            return
+        
+        # Show specific tree
+        if sub:
+            for tree in trees:
+                if tree['name'].lower() == sub.lower():
+                    await cls._show_talent_tree(player, tree)
+                    return
+            await player.send(f"{c['red']}Unknown tree. Your trees: {', '.join(t['name'] for t in trees)}{c['reset']}")
+            return
+        
+        # Show overview of all trees
+        total_pts = TalentManager.get_talent_points(player)
+        spent_pts = TalentManager.get_spent_points(player)
+        avail_pts = total_pts - spent_pts
+        
+        W = 62
+        title = f"★ {char_class.upper()} TALENT TREES ★"
+        
+        await player.send(f"\r\n{c['bright_yellow']}╔{'═'*W}{c['reset']}")
+        await player.send(f"{c['bright_yellow']}║{c['reset']}  {c['white']}{title}{c['reset']}")
+        await player.send(f"{c['bright_yellow']}╠{'═'*W}{c['reset']}")
+        await player.send(f"{c['bright_yellow']}║{c['reset']}  Talent Points: {c['bright_green']}{avail_pts}{c['reset']} available / {c['cyan']}{spent_pts}{c['reset']} spent / {c['white']}{total_pts}{c['reset']} total")
+        await player.send(f"{c['bright_yellow']}╠{'═'*W}{c['reset']}")
+        
+        for tree in trees:
+            icon = tree.get('icon', '★')
+            name = tree['name']
+            desc = tree['description'][:55]
+            tree_pts = TalentManager.get_tree_points(player, name)
+            
+            await player.send(f"{c['bright_yellow']}║{c['reset']}")
+            await player.send(f"{c['bright_yellow']}║{c['reset']}  {icon} {c['bright_cyan']}{name}{c['reset']}    ({tree_pts} points)")
+            await player.send(f"{c['bright_yellow']}║{c['reset']}    {c['white']}{desc}{c['reset']}")
+        
+        await player.send(f"{c['bright_yellow']}║{c['reset']}")
+        await player.send(f"{c['bright_yellow']}╚{'═'*W}{c['reset']}")
+        await player.send(f"{c['cyan']}  Commands: talents <tree> | talents learn <id> | talents reset{c['reset']}\r\n")
+    
+    @classmethod
+    async def _show_talent_tree(cls, player: 'Player', tree: dict):
+        """Show a single talent tree in detail (two-column layout)."""
+        import re as _re
+        from talents import TalentManager
+
+        c = player.config.COLORS
+        name = tree['name']
+        icon = tree.get('icon', '★')
+        desc = tree['description']
+        talents = tree['talents']
+        tree_pts = TalentManager.get_tree_points(player, name)
+        player_talents = getattr(player, 'talents', {})
+
+        _ansi_re = _re.compile(r'\x1b\[[0-9;]*m')
+
+        def _vis_len(s: str) -> int:
+            return len(_ansi_re.sub('', s))
+
+        def _pad(s: str, w: int) -> str:
+            return s + ' ' * max(0, w - _vis_len(s))
+
+        # Column / total widths
+        COL_W = 38
+        W = COL_W * 2 + 3  # 79  (col ║ sep ║ col)
+
+        # --- Header (full width, open right) ---
+        header = f"  {icon} {name.upper()} TALENTS"
+        await player.send(f"\r\n{c['bright_cyan']}╔{'═'*W}{c['reset']}")
+        await player.send(f"{c['bright_cyan']}║{c['white']}{header}{c['reset']}")
+        await player.send(f"{c['bright_cyan']}╠{'═'*W}{c['reset']}")
+        await player.send(f"{c['bright_cyan']}║{c['reset']}  {desc}")
+        await player.send(f"{c['bright_cyan']}║{c['reset']}  Points in tree: {c['bright_green']}{tree_pts}{c['reset']}")
+        await player.send(f"{c['bright_cyan']}╠{'═'*W}{c['reset']}")
+
+        # --- Group by tier ---
+        tiers: dict = {}
+        for tid, talent in talents.items():
+            tier = talent.tier
+            if tier not in tiers:
+                tiers[tier] = []
+            tiers[tier].append((tid, talent))
+        sorted_tiers = sorted(tiers.keys())
+
+        # --- Build lines for a single tier ---
+        def _tier_lines(tier_num):
+            lines = []
+            req_pts = (tier_num - 1) * 5
+            unlocked = tree_pts >= req_pts
+            tier_color = c['bright_green'] if unlocked else c['red']
+            lines.append(f"{tier_color}━━ TIER {tier_num} ({req_pts}+ pts) ━━{c['reset']}")
+            for tid, talent in tiers[tier_num]:
+                cur_rank = player_talents.get(tid, 0)
+                max_rank = talent.max_rank
+                if cur_rank >= max_rank:
+                    rank_str = f"{c['bright_green']}{cur_rank}/{max_rank}{c['reset']}"
+                    tag = f" {c['bright_green']}MAX{c['reset']}"
+                elif not unlocked:
+                    rank_str = f"{c['red']}0/{max_rank}{c['reset']}"
+                    tag = f" {c['red']}LOCKED{c['reset']}"
+                elif cur_rank > 0:
+                    rank_str = f"{c['yellow']}{cur_rank}/{max_rank}{c['reset']}"
+                    tag = ""
+                else:
+                    rank_str = f"{c['white']}0/{max_rank}{c['reset']}"
+                    tag = ""
+                tname = talent.name
+                # Truncate name if needed
+                name_line = f" {c['white']}{tname}{c['reset']} [{rank_str}]{tag}"
+                if _vis_len(name_line) > COL_W:
+                    tname = tname[:COL_W - 12] + '..'
+                    name_line = f" {c['white']}{tname}{c['reset']} [{rank_str}]{tag}"
+                lines.append(name_line)
+                # Word-wrap description to fit column
+                tdesc = talent.description
+                wrap_w = COL_W - 4
+                while len(tdesc) > wrap_w:
+                    # Find last space within wrap width
+                    brk = tdesc.rfind(' ', 0, wrap_w)
+                    if brk <= 0:
+                        brk = wrap_w
+                    lines.append(f"   {c['cyan']}{tdesc[:brk]}{c['reset']}")
+                    tdesc = tdesc[brk:].lstrip()
+                if tdesc:
+                    lines.append(f"   {c['cyan']}{tdesc}{c['reset']}")
+                lines.append(f"   {c['yellow']}ID: {tid}{c['reset']}")
+            lines.append("")  # blank spacer
+            return lines
+
+        # --- Split tiers into two columns ---
+        mid = (len(sorted_tiers) + 1) // 2
+        left_tiers = sorted_tiers[:mid]
+        right_tiers = sorted_tiers[mid:]
+
+        left_lines = []
+        for t in left_tiers:
+            left_lines.extend(_tier_lines(t))
+        right_lines = []
+        for t in right_tiers:
+            right_lines.extend(_tier_lines(t))
+
+        # Equalize length
+        max_len = max(len(left_lines), len(right_lines))
+        while len(left_lines) < max_len:
+            left_lines.append("")
+        while len(right_lines) < max_len:
+            right_lines.append("")
+
+        # --- Send columns side by side ---
+        sep = f"{c['bright_cyan']}║{c['reset']}"
+        for l_line, r_line in zip(left_lines, right_lines):
+            left_padded = _pad(l_line, COL_W)
+            await player.send(f"{c['bright_cyan']}║{c['reset']} {left_padded} {sep} {r_line}")
+
+        # --- Footer ---
+        await player.send(f"{c['bright_cyan']}╚{'═'*W}{c['reset']}")
+        await player.send(f"{c['yellow']}  Use 'talents learn <id>' to learn a talent.{c['reset']}\r\n")
+        
+    @classmethod
+    async def cmd_practice(cls, player: 'Player', args: List[str]):
+        """Practice skills/spells - must be at a guild master for your class."""
+        c = player.config.COLORS
+
+        # Check for trainer/guildmaster in room that trains player's class
+        trainer = None
+        any_trainer = False
+        from mobs import Mobile
+        if player.room:
+            for char in player.room.characters:
+                if isinstance(char, Mobile) and char.special in ('trainer', 'guildmaster'):
+                    any_trainer = True
+                    # Check if this trainer teaches the player's class
+                    trains_class = getattr(char, 'trains_class', None)
+                    if trains_class:
+                        allowed = [t.strip().lower() for t in trains_class.split(',') if t.strip()]
+                        if player.char_class.lower() in allowed:
+                            trainer = char
+                            break
+
+        # Get class data for validation
+        class_data = player.config.CLASSES.get(player.char_class.lower(), {})
+        class_skills = class_data.get('skills', [])
+        class_spells = class_data.get('spells', [])
+
+        async def show_practice_list(show_practices: bool):
+            if show_practices:
+                await player.send(f"{c['cyan']}You have {player.practices} practice sessions.{c['reset']}")
+            await player.send(f"{c['cyan']}Skills available to {player.char_class}s:{c['reset']}")
+            if class_skills:
+                for skill in class_skills:
+                    prof = player.skills.get(skill, 0)
+                    skill_name = skill.replace('_', ' ').title()
+                    if prof > 0:
+                        status = f"{prof}%" if prof < 85 else f"{c['bright_green']}MASTERED{c['reset']}"
+                    else:
+                        status = f"{c['yellow']}0%{c['reset']}"
+                    await player.send(f"  {skill_name}: {status}")
+            else:
+                await player.send(f"  (none)")
+
+            await player.send(f"{c['cyan']}Spells available to {player.char_class}s:{c['reset']}")
+            if class_spells:
+                for spell in class_spells:
+                    prof = player.spells.get(spell, 0)
+                    spell_name = spell.replace('_', ' ').title()
+                    if prof > 0:
+                        status = f"{prof}%" if prof < 85 else f"{c['bright_green']}MASTERED{c['reset']}"
+                    else:
+                        status = f"{c['yellow']}0%{c['reset']}"
+                    await player.send(f"  {spell_name}: {status}")
+            else:
+                await player.send(f"  (none)")
+
+        if not any_trainer:
+            await player.send(f"{c['red']}You must find a guild master or trainer to practice!{c['reset']}")
+            await player.send(f"{c['yellow']}Trainers can be found in the guilds around town.{c['reset']}")
+            # Show full list even when not at trainer
+            await show_practice_list(show_practices=False)
+            return
+        
+        if not trainer:
+            await player.send(f"{c['red']}This trainer cannot teach {player.char_class}s.{c['reset']}")
+            await player.send(f"{c['yellow']}Find the {player.char_class}s' guildmaster to practice your skills.{c['reset']}")
+            await show_practice_list(show_practices=False)
+            return
+
+        if not args:
+            # Show what can be practiced (class-specific)
+            await show_practice_list(show_practices=True)
+            return
+            
+        if player.practices <= 0:
+            await player.send("You have no practice sessions left!")
+            return
+            
+        # Abbreviation matching - find skills/spells that start with input
+        search_term = ' '.join(args).lower().replace(' ', '_')
+        search_term_nospace = ''.join(args).lower()
+        
+        # Combine all available abilities
+        all_abilities = [(s, 'skill') for s in class_skills] + [(s, 'spell') for s in class_spells]
+        
+        # Find matches - check prefix match with underscores and without
+        matches = []
+        for ability, atype in all_abilities:
+            ability_nospace = ability.replace('_', '')
+            # Exact match
+            if ability == search_term:
+                matches = [(ability, atype)]
+                break
+            # Prefix match (underscore version)
+            if ability.startswith(search_term):
+                matches.append((ability, atype))
+            # Prefix match (no underscore version) 
+            elif ability_nospace.startswith(search_term_nospace):
+                matches.append((ability, atype))
+        
+        # Handle results
+        if not matches:
+            await player.send(f"{c['red']}'{' '.join(args)}' is not available to {player.char_class}s.{c['reset']}")
+            await player.send(f"{c['yellow']}Type 'practice' to see what you can learn.{c['reset']}")
+            return
+        
+        if len(matches) > 1:
+            await player.send(f"{c['yellow']}Which ability did you mean?{c['reset']}")
+            for ability, atype in matches:
+                await player.send(f"  {ability.replace('_', ' ')} ({atype})")
+            return
+        
+        # Single match - practice it
+        target, ability_type = matches[0]
+        
+        if ability_type == 'skill':
+            current = player.skills.get(target, 0)
+            if current >= 85:
+                await player.send("You've already mastered that skill!")
+                return
+            player.skills[target] = min(85, current + 10)
+            player.practices -= 1
+            if current == 0:
+                await player.send(f"You learn {target.replace('_', ' ')}! ({player.skills[target]}%)")
+            else:
+                await player.send(f"You practice {target.replace('_', ' ')}. ({player.skills[target]}%)")
+        else:  # spell
+            current = player.spells.get(target, 0)
+            if current >= 85:
+                await player.send("You've already mastered that spell!")
+                return
+            player.spells[target] = min(85, current + 10)
+            player.practices -= 1
+            if current == 0:
+                await player.send(f"You learn {target.replace('_', ' ')}! ({player.spells[target]}%)")
+            else:
+                await player.send(f"You practice {target.replace('_', ' ')}. ({player.spells[target]}%)")
+
+    
+    @classmethod  
+    async def cmd_levels(cls, player: 'Player', args: List[str]):
+        """Show experience required for each level."""
+        c = player.config.COLORS
+        
+        base_exp = getattr(player.config, 'BASE_EXP', 800)
+        exp_mult = getattr(player.config, 'EXP_MULTIPLIER', 1.4)
+        high_mult = getattr(player.config, 'HIGH_LEVEL_EXP_MULTIPLIER', 1.6)
+        threshold = getattr(player.config, 'HIGH_LEVEL_THRESHOLD', 30)
+        max_level = getattr(player.config, 'MAX_MORTAL_LEVEL', 60)
+        
+        await player.send(f"{c['cyan']}{'=' * 40}{c['reset']}")
+        await player.send(f"{c['cyan']}         Level Requirements{c['reset']}")
+        await player.send(f"{c['cyan']}{'=' * 40}{c['reset']}")
+        
+        # Calculate XP at threshold for high-level progression
+        level_30_xp = int(base_exp * (exp_mult ** (threshold - 1)))
+        
+        for lvl in range(1, max_level + 1):
+            if lvl <= threshold:
+                xp_required = int(base_exp * (exp_mult ** (lvl - 1)))
+            else:
+                levels_beyond = lvl - threshold
+                xp_required = int(level_30_xp * (high_mult ** levels_beyond))
+            
+            marker = f" {c['bright_green']}<-- YOU{c['reset']}" if lvl == player.level else ""
+            
+            # Color code by tier
+            if lvl <= 10:
+                lvl_color = c['white']
+            elif lvl <= 20:
+                lvl_color = c['green']
+            elif lvl <= 30:
+                lvl_color = c['cyan']
+            elif lvl <= 40:
+                lvl_color = c['yellow']
+            elif lvl <= 50:
+                lvl_color = c['bright_magenta']
+            else:
+                lvl_color = c['bright_red']
+            
+            await player.send(f"{lvl_color}Level {lvl:2}: {xp_required:>15,} XP{c['reset']}{marker}")
+
+
+    @classmethod
+    async def cmd_xp(cls, player: 'Player', args: List[str]):
+        """Show XP breakdown and progress."""
+        c = player.config.COLORS
+        to_level = player.exp_to_level()
+        remaining = max(0, to_level - player.exp)
+        pct = (player.exp / to_level) * 100 if to_level > 0 else 0
+
+        await player.send(f"{c['cyan']}XP Progress:{c['reset']}")
+        await player.send(f"  Current XP: {player.exp}")
+        await player.send(f"  Next Level: {remaining} XP ({pct:.1f}% of level)")
+
+        breakdown = getattr(player, 'xp_breakdown', {})
+        if breakdown:
+            await player.send(f"{c['cyan']}XP Breakdown:{c['reset']}")
+            for key in ['kill', 'exploration', 'quest', 'boss', 'streak', 'rested', 'other']:
+                if key in breakdown:
+                    await player.send(f"  {key.title():<12}: {breakdown[key]}")
+
+        if getattr(player, 'rested_xp', 0) > 0:
+            await player.send(f"{c['bright_green']}Rested XP available: {player.rested_xp}{c['reset']}")
+
+        if getattr(player, 'kill_streak', 0) > 1:
+            await player.send(f"{c['yellow']}Current kill streak: {player.kill_streak} (Best: {player.best_kill_streak}){c['reset']}")
+
+    # =========================================================================
+    # PRESTIGE CLASS SYSTEM
+    # =========================================================================
+
+    @classmethod
+    async def cmd_specialize(cls, player: 'Player', args: List[str]):
+        """Choose your prestige class specialization at level 50.
+        
+        Usage: specialize [class name]
+        Type 'specialize' alone to see available options.
+        """
+        from prestige import cmd_specialize
+        await cmd_specialize(player, args)
+
+    @classmethod
+    async def cmd_respec(cls, player: 'Player', args: List[str]):
+        """Reset your prestige specialization for 50,000 gold.
+        
+        Usage: respec
+        """
+        from prestige import cmd_respec
+        await cmd_respec(player, args)
+
+    @classmethod
+    async def cmd_prestige(cls, player: 'Player', args: List[str]):
+        """View your prestige class info and abilities.
+        
+        Usage: prestige
+        """
+        from prestige import cmd_prestige
+        await cmd_prestige(player, args)
@@ -0,0 +1,145 @@
+"""
+Misthollow PvP Commands
+======================
+Duels and the arena.
+"""
+
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class PvpCommands:
+    """PvP commands."""
+
+    @classmethod
+    async def cmd_duel(cls, player: 'Player', args: List[str]):
+        """Challenge another player to a duel.
+
+        Usage:
+            duel <player> [gold]  - Challenge a player (optional gold wager)
+            duel accept           - Accept a duel challenge
+        """
+        c = player.config.COLORS
+
+        if not args:
+            await player.send(f"{c['yellow']}Usage: duel <player> [gold wager] | duel accept{c['reset']}")
+            return
+
+        sub = args[0].lower()
+
+        if not hasattr(player, 'duel_challenge_from'):
+            player.duel_challenge_from = None
+            player.duel_wager = 0
+
+        if sub == 'accept':
+            challenger = getattr(player, 'duel_challenge_from', None)
+            if not challenger:
+                await player.send("No pending duel challenges.")
+                return
+            if challenger.room != player.room:
+                await player.send("Your challenger is no longer here.")
+                player.duel_challenge_from = None
+                return
+            wager = getattr(player, 'duel_wager', 0)
+            if wager > 0:
+                if player.gold < wager:
+                    await player.send(f"{c['red']}You don't have {wager} gold for the wager!{c['reset']}")
+                    return
+                if challenger.gold < wager:
+                    await player.send(f"{c['red']}{challenger.name} can no longer afford the wager!{c['reset']}")
+                    return
+
+            # Start duel
+            player.duel_challenge_from = None
+            player.dueling = challenger
+            challenger.dueling = player
+            player.duel_wager_amount = wager
+            challenger.duel_wager_amount = wager
+
+            await player.room.send_to_room(
+                f"{c['bright_yellow']}═══ DUEL ═══ {challenger.name} vs {player.name}!"
+                + (f" Wager: {wager} gold!" if wager else "")
+                + f"{c['reset']}"
+            )
+
+            # Start combat (special duel mode)
+            from combat import CombatHandler
+            player.fighting = challenger
+            challenger.fighting = player
+            player.position = 'fighting'
+            challenger.position = 'fighting'
+            await CombatHandler.one_round(challenger, player)
+            return
+
+        # Challenge a player
+        target_name = sub.capitalize()
+        wager = 0
+        if len(args) >= 2:
+            try:
+                wager = int(args[1])
+                if wager < 0:
+                    wager = 0
+            except ValueError:
+                pass
+
+        if not player.room:
+            return
+        target = None
+        for ch in player.room.characters:
+            if hasattr(ch, 'connection') and ch.name.lower() == target_name.lower() and ch != player:
+                target = ch
+                break
+        if not target:
+            await player.send(f"{c['red']}{target_name} is not here.{c['reset']}")
+            return
+
+        if wager > 0 and player.gold < wager:
+            await player.send(f"{c['red']}You don't have {wager} gold to wager!{c['reset']}")
+            return
+
+        if not hasattr(target, 'duel_challenge_from'):
+            target.duel_challenge_from = None
+            target.duel_wager = 0
+        target.duel_challenge_from = player
+        target.duel_wager = wager
+
+        wager_msg = f" for a wager of {c['yellow']}{wager} gold{c['reset']}" if wager else ""
+        await player.send(f"{c['cyan']}You challenge {target.name} to a duel{wager_msg}!{c['reset']}")
+        await target.send(f"\r\n{c['bright_yellow']}{player.name} challenges you to a duel{wager_msg}! Type 'duel accept' to accept.{c['reset']}")
+
+    # =========================================================================
+    # PVP ARENA COMMANDS
+    # =========================================================================
+
+    @classmethod
+    async def cmd_challenge(cls, player: 'Player', args: List[str]):
+        """Challenge another player to an arena duel. Both must be in the Arena Lobby."""
+        from arena import ArenaManager
+        await ArenaManager.cmd_challenge(player, args)
+
+    @classmethod
+    async def cmd_accept(cls, player: 'Player', args: List[str]):
+        """Accept a pending arena challenge."""
+        from arena import ArenaManager
+        await ArenaManager.cmd_accept(player, args)
+
+    @classmethod
+    async def cmd_decline(cls, player: 'Player', args: List[str]):
+        """Decline a pending arena challenge."""
+        from arena import ArenaManager
+        await ArenaManager.cmd_decline(player, args)
+
+    @classmethod
+    async def cmd_arena(cls, player: 'Player', args: List[str]):
+        """Arena system: join queue, view stats, leaderboard.
+
+        Usage:
+            arena join   — Queue for random matchmaking
+            arena leave  — Leave the queue
+            arena stats  — View your PvP record
+            arena top    — Leaderboard (top 10)
+        """
+        from arena import ArenaManager
+        await ArenaManager.cmd_arena(player, args)
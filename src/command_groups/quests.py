@@ -0,0 +1,477 @@
+"""
+Misthollow Quest Commands
+========================
+Quests, story and reputation.
+"""
+
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class QuestCommands:
+    """Quest commands."""
+
+    @classmethod
+    async def cmd_reputation(cls, player: 'Player', args: List[str]):
+        """Show reputation standings with all factions.
+        Usage: reputation [faction_name] - Shows all factions or details for one."""
+        from factions import FactionManager
+        c = player.config.COLORS
+
+        if args:
+            # Show detail for a specific faction
+            key = FactionManager.normalize_key(' '.join(args))
+            if not key:
+                await player.send(f"{c['yellow']}Unknown faction. Type 'rep' to see all factions.{c['reset']}")
+                return
+            lines = FactionManager.format_faction_detail(player, key)
+            for line in lines:
+                await player.send(f"{c['white']}{line}{c['reset']}")
+            return
+
+        await player.send(f"\n{c['bright_cyan']}═══ Faction Reputation ═══{c['reset']}")
+        lines = FactionManager.format_reputation_summary(player)
+        for line in lines:
+            await player.send(line)
+        await player.send(f"\n{c['cyan']}Use 'rep <faction>' for details. Use 'faction <name>' for full info.{c['reset']}")
+
+    @classmethod
+    async def cmd_faction(cls, player: 'Player', args: List[str]):
+        """Show detailed reputation for a specific faction."""
+        if not args:
+            await player.send("Usage: faction <name>")
+            return
+
+        from factions import FactionManager
+        c = player.config.COLORS
+        key = FactionManager.normalize_key(' '.join(args))
+        if not key:
+            await player.send(f"{c['yellow']}Unknown faction.{c['reset']}")
+            return
+
+        lines = FactionManager.format_faction_detail(player, key)
+        for line in lines:
+            await player.send(f"{c['white']}{line}{c['reset']}")
+
+    @classmethod
+    async def cmd_quest(cls, player: 'Player', args: List[str]):
+        """Manage quests."""
+        from quests import QuestManager
+        from datetime import datetime
+
+        c = player.config.COLORS
+
+        if not args:
+            # Show active quests
+            if not hasattr(player, 'active_quests') or not player.active_quests:
+                await player.send(f"{c['yellow']}You have no active quests.{c['reset']}")
+                await player.send(f"{c['white']}Talk to NPCs to find available quests!{c['reset']}")
+                return
+
+            await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
+            await player.send(f"{c['cyan']}║{c['bright_yellow']} Active Quests{c['cyan']}                                                  ║{c['reset']}")
+            await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}\r\n")
+
+            for quest in player.active_quests:
+                complete_str = f"{c['bright_green']}COMPLETE{c['reset']}" if quest.is_complete() else f"{c['yellow']}In Progress{c['reset']}"
+                await player.send(f"{c['bright_cyan']}{quest.name}{c['reset']} [{complete_str}]")
+                await player.send(f"{c['white']}{quest.description}{c['reset']}")
+                await player.send(quest.get_progress_string())
+
+                if quest.is_complete():
+                    await player.send(f"{c['bright_green']}✓ Return to quest giver to complete!{c['reset']}")
+
+                if quest.time_limit:
+                    elapsed = (datetime.now() - quest.started_at).total_seconds() / 60
+                    remaining = quest.time_limit - elapsed
+                    if remaining > 0:
+                        await player.send(f"{c['yellow']}Time remaining: {int(remaining)} minutes{c['reset']}")
+                    else:
+                        await player.send(f"{c['red']}TIME EXPIRED!{c['reset']}")
+
+                await player.send("")  # Blank line between quests
+
+            return
+
+        subcommand = args[0].lower()
+
+        if subcommand == 'accept':
+            if len(args) < 2:
+                await player.send("Usage: quest accept <quest_id>")
+                return
+            await QuestManager.accept_quest(player, args[1])
+
+        elif subcommand == 'abandon':
+            if len(args) < 2:
+                await player.send("Usage: quest abandon <quest_id>")
+                return
+            await QuestManager.abandon_quest(player, args[1])
+
+        elif subcommand == 'complete':
+            if len(args) < 2:
+                await player.send("Usage: quest complete <quest_id>")
+                return
+            await QuestManager.complete_quest(player, args[1])
+
+        elif subcommand == 'log':
+            # Show completed quests
+            if not hasattr(player, 'quests_completed') or not player.quests_completed:
+                await player.send(f"{c['yellow']}You haven't completed any quests yet.{c['reset']}")
+                return
+
+            await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
+            await player.send(f"{c['cyan']}║{c['bright_yellow']} Completed Quests{c['cyan']}                                             ║{c['reset']}")
+            await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}\r\n")
+
+            for quest_id in player.quests_completed:
+                await player.send(f"{c['bright_green']}✓{c['reset']} {quest_id}")
+
+            await player.send(f"\r\n{c['white']}Total: {len(player.quests_completed)} quests completed{c['reset']}\r\n")
+
+        elif subcommand == 'list' or subcommand == 'available':
+            # Show available quests from NPCs in the current room
+            from quests import QuestManager, QUEST_DEFINITIONS
+
+            if not player.room:
+                await player.send("You need to be somewhere to find quests!")
+                return
+
+            found_quests = False
+            for npc in player.room.npcs:
+                vnum = getattr(npc, 'vnum', 0)
+                available = QuestManager.get_available_quests(player, vnum)
+                if available:
+                    if not found_quests:
+                        await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
+                        await player.send(f"{c['cyan']}║{c['bright_yellow']} Available Quests{c['cyan']}                                             ║{c['reset']}")
+                        await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}\r\n")
+                        found_quests = True
+
+                    await player.send(f"{c['bright_cyan']}From {npc.name}:{c['reset']}")
+                    for quest_id in available:
+                        quest_def = QUEST_DEFINITIONS[quest_id]
+                        lvl_range = f"[L{quest_def['level_min']}-{quest_def['level_max']}]"
+                        repeatable = " {c['bright_green']}(Repeatable){c['reset']}" if quest_def.get('repeatable') else ""
+                        await player.send(f"  {c['bright_yellow']}{quest_def['name']}{c['reset']} {lvl_range}{repeatable}")
+                        await player.send(f"    {c['white']}{quest_def['description'][:70]}{c['reset']}")
+                        await player.send(f"    {c['bright_black']}(quest accept {quest_id}){c['reset']}")
+                    await player.send("")
+
+            if not found_quests:
+                await player.send(f"{c['yellow']}No quests available from NPCs in this room.{c['reset']}")
+                await player.send(f"{c['white']}Check the Quest Board in Temple Square, or visit zone quest givers throughout the realm.{c['reset']}")
+            else:
+                await player.send(f"{c['white']}Use 'quest accept <quest_id>' to accept a quest.{c['reset']}\r\n")
+
+        elif subcommand == 'info':
+            # Show details about a specific quest
+            from quests import QUEST_DEFINITIONS
+
+            if len(args) < 2:
+                await player.send("Usage: quest info <quest_id>")
+                return
+
+            quest_id = args[1]
+            if quest_id not in QUEST_DEFINITIONS:
+                await player.send(f"Unknown quest: {quest_id}")
+                return
+
+            quest_def = QUEST_DEFINITIONS[quest_id]
+            await player.send(f"\r\n{c['bright_yellow']}Quest: {quest_def['name']}{c['reset']}")
+            await player.send(f"{c['white']}{quest_def['description']}{c['reset']}\r\n")
+            await player.send(f"{c['cyan']}Level Range:{c['reset']} {quest_def['level_min']}-{quest_def['level_max']}")
+            await player.send(f"{c['cyan']}Type:{c['reset']} {quest_def['type'].title()}")
+            await player.send(f"{c['cyan']}Repeatable:{c['reset']} {'Yes' if quest_def.get('repeatable') else 'No'}\r\n")
+
+            await player.send(f"{c['cyan']}Objectives:{c['reset']}")
+            for obj in quest_def['objectives']:
+                await player.send(f"  - {obj['description']} (x{obj['required']})")
+
+            await player.send(f"\r\n{c['green']}Rewards:{c['reset']}")
+            if quest_def['rewards'].get('exp'):
+                await player.send(f"  - {quest_def['rewards']['exp']} experience")
+            if quest_def['rewards'].get('gold'):
+                await player.send(f"  - {quest_def['rewards']['gold']} gold")
+            await player.send("")
+
+        else:
+            await player.send(f"Unknown quest command: {subcommand}")
+            await player.send("Usage: quest [list|accept|abandon|complete|log|info]")
+
+    @classmethod
+    async def cmd_questlog(cls, player: 'Player', args: List[str]):
+        """Show quest log (alias for quest log)."""
+        await cls.cmd_quest(player, ['log'])
+
+    @classmethod
+    async def cmd_quests(cls, player: 'Player', args: List[str]):
+        """Quest journal — view active and completed quests by category.
+        
+        Usage:
+            quests               - Show all active quests grouped by category
+            quests completed     - Show completed quests
+            quests daily         - Show available daily quests
+            quests main          - Show main story quests only
+            quests side          - Show side quests only
+            quests faction       - Show faction quests only
+            quests dungeon       - Show dungeon quests only
+            quests track <name>  - Track a quest (show progress in prompt)
+            quests untrack       - Stop tracking
+        """
+        from quests import QuestManager, QUEST_DEFINITIONS, QUEST_CATEGORY_INFO
+
+        c = player.config.COLORS
+        sub = args[0].lower() if args else None
+
+        # Track/untrack subcommands
+        if sub == 'track':
+            if len(args) < 2:
+                await player.send(f"{c['yellow']}Usage: quests track <quest name or id>{c['reset']}")
+                return
+            search = ' '.join(args[1:]).lower()
+            for quest in getattr(player, 'active_quests', []):
+                if search in quest.quest_id.lower() or search in quest.name.lower():
+                    player.tracked_quest = quest.quest_id
+                    await player.send(f"{c['bright_green']}Now tracking: {quest.name}{c['reset']}")
+                    return
+            await player.send(f"{c['red']}No active quest matching '{search}'.{c['reset']}")
+            return
+
+        if sub == 'untrack':
+            player.tracked_quest = None
+            await player.send(f"{c['cyan']}Quest tracking disabled.{c['reset']}")
+            return
+
+        # Completed quests view
+        if sub == 'completed':
+            completed = getattr(player, 'quests_completed', [])
+            if not completed:
+                await player.send(f"{c['yellow']}You haven't completed any quests yet.{c['reset']}")
+                return
+            await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
+            await player.send(f"{c['cyan']}║{c['bright_yellow']}  QUEST JOURNAL - Completed ({len(completed)} quests)                     {c['cyan']}║{c['reset']}")
+            await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}")
+            # Group by category
+            by_cat = {}
+            for qid in completed:
+                cat = QuestManager.get_quest_category(qid)
+                by_cat.setdefault(cat, []).append(qid)
+            for cat_key in ['main_story', 'side', 'daily', 'faction', 'dungeon']:
+                quests = by_cat.get(cat_key, [])
+                if not quests:
+                    continue
+                info = QUEST_CATEGORY_INFO.get(cat_key, {'name': cat_key.title(), 'color': 'white', 'icon': '-'})
+                await player.send(f"\r\n  {c[info['color']]}{info['icon']} {info['name']}{c['reset']}")
+                for qid in quests:
+                    qdef = QUEST_DEFINITIONS.get(qid, {})
+                    name = qdef.get('name', qid)
+                    await player.send(f"    {c['green']}✓{c['reset']} {name}")
+            await player.send("")
+            return
+
+        # Daily quests view
+        if sub == 'daily':
+            await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
+            await player.send(f"{c['cyan']}║{c['bright_green']}  DAILY QUESTS                                                {c['cyan']}║{c['reset']}")
+            await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}")
+            for qid, qdef in QUEST_DEFINITIONS.items():
+                if not qdef.get('daily'):
+                    continue
+                can_do = QuestManager.can_accept_daily(player, qid)
+                already_active = QuestManager.has_active_quest(player, qid)
+                if already_active:
+                    status = f"{c['yellow']}In Progress{c['reset']}"
+                elif can_do:
+                    status = f"{c['bright_green']}Available{c['reset']}"
+                else:
+                    status = f"{c['bright_black']}Done Today{c['reset']}"
+                await player.send(f"\r\n  {c['bright_white']}{qdef['name']}{c['reset']} [{status}]")
+                await player.send(f"  {c['white']}{qdef['description']}{c['reset']}")
+                rewards = []
+                if qdef['rewards'].get('exp'):
+                    rewards.append(f"{qdef['rewards']['exp']} XP")
+                if qdef['rewards'].get('gold'):
+                    rewards.append(f"{qdef['rewards']['gold']} gold")
+                if rewards:
+                    await player.send(f"  {c['yellow']}Rewards: {', '.join(rewards)}{c['reset']}")
+            await player.send(f"\r\n  {c['cyan']}Daily quests reset at midnight.{c['reset']}\r\n")
+            return
+
+        # Filter by specific category
+        cat_filter = None
+        cat_map = {'main': 'main_story', 'story': 'main_story', 'side': 'side',
+                    'faction': 'faction', 'dungeon': 'dungeon'}
+        if sub and sub in cat_map:
+            cat_filter = cat_map[sub]
+
+        # Area or name lookup (quests <area> | quests <name>)
+        if sub and sub not in cat_map:
+            if sub not in ('completed', 'daily', 'track', 'untrack'):
+                term = ' '.join(args).strip().lower()
+                active = getattr(player, 'active_quests', [])
+
+                def _raw_area(qid=None, qdef=None):
+                    return QuestManager.get_quest_area(player, quest_id=qid, quest_def=qdef)
+
+                def _quest_area(qid=None, qdef=None):
+                    return _raw_area(qid=qid, qdef=qdef) or 'Unknown'
+
+                # Detect area matches from known quest definitions
+                known_areas = {(area).lower() for area in (_raw_area(qdef=qdef) for qdef in QUEST_DEFINITIONS.values()) if area}
+                is_area = any(term in area for area in known_areas)
+
+                if is_area:
+                    area_matches = [(q, _quest_area(qid=q.quest_id)) for q in active if term in _quest_area(qid=q.quest_id).lower()]
+                    if area_matches:
+                        await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
+                        await player.send(f"{c['cyan']}║{c['bright_yellow']}  QUESTS IN {area_matches[0][1][:46]:<46}{c['cyan']}║{c['reset']}")
+                        await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}")
+                        for quest, area in area_matches:
+                            done = sum(1 for o in quest.objectives if o.completed)
+                            total = len(quest.objectives)
+                            await player.send(f"  {c['bright_white']}{quest.name}{c['reset']} {c['yellow']}[{done}/{total}]{c['reset']}")
+                        await player.send("")
+                        return
+
+                    area_defs = [(qid, qdef, _quest_area(qdef=qdef)) for qid, qdef in QUEST_DEFINITIONS.items()
+                                 if term in _quest_area(qdef=qdef).lower()]
+                    if area_defs:
+                        await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
+                        await player.send(f"{c['cyan']}║{c['bright_yellow']}  QUESTS BY AREA                                             {c['cyan']}║{c['reset']}")
+                        await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}")
+                        for qid, qdef, area in area_defs[:12]:
+                            lvl = f"L{qdef.get('level_min', 1)}-{qdef.get('level_max', 1)}"
+                            await player.send(f"  {c['bright_white']}{qdef.get('name', qid)}{c['reset']} {c['bright_black']}({qid}){c['reset']} {c['yellow']}[{lvl}]{c['reset']}")
+                        if len(area_defs) > 12:
+                            await player.send(f"  {c['bright_black']}...and {len(area_defs) - 12} more. Use a narrower area search.{c['reset']}")
+                        await player.send("")
+                        return
+
+                # Name/abbrev lookup
+                name_matches = [q for q in active if term in q.quest_id.lower() or term in q.name.lower()]
+                if name_matches:
+                    await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
+                    await player.send(f"{c['cyan']}║{c['bright_yellow']}  QUEST MATCHES                                              {c['cyan']}║{c['reset']}")
+                    await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}")
+                    for quest in name_matches:
+                        area = _quest_area(qid=quest.quest_id)
+                        done = sum(1 for o in quest.objectives if o.completed)
+                        total = len(quest.objectives)
+                        await player.send(f"  {c['bright_white']}{quest.name}{c['reset']} {c['yellow']}[{done}/{total}]{c['reset']} {c['bright_black']}({area}){c['reset']}")
+                    await player.send("")
+                    return
+
+                def_matches = [(qid, qdef) for qid, qdef in QUEST_DEFINITIONS.items()
+                               if term in qid.lower() or term in qdef.get('name', '').lower()]
+                if def_matches:
+                    await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
+                    await player.send(f"{c['cyan']}║{c['bright_yellow']}  QUEST LOOKUP                                               {c['cyan']}║{c['reset']}")
+                    await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}")
+                    for qid, qdef in def_matches[:10]:
+                        area = _quest_area(qdef=qdef)
+                        lvl = f"L{qdef.get('level_min', 1)}-{qdef.get('level_max', 1)}"
+                        await player.send(f"  {c['bright_white']}{qdef.get('name', qid)}{c['reset']} {c['bright_black']}({qid}){c['reset']} {c['yellow']}[{lvl}]{c['reset']} {c['bright_black']}{area}{c['reset']}")
+                    if len(def_matches) > 10:
+                        await player.send(f"  {c['bright_black']}...and {len(def_matches) - 10} more. Try a narrower name search.{c['reset']}")
+                    await player.send("")
+                    return
+
+                await player.send(f"{c['yellow']}No quests found matching '{term}'.{c['reset']}")
+                return
+
+        # Active quests view (default)
+        active = getattr(player, 'active_quests', [])
+        if not active:
+            await player.send(f"{c['yellow']}You have no active quests. Talk to NPCs to find adventures!{c['reset']}")
+            return
+
+        await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
+        title_str = "QUEST JOURNAL"
+        if cat_filter:
+            info = QUEST_CATEGORY_INFO.get(cat_filter, {})
+            title_str = f"QUEST JOURNAL - {info.get('name', cat_filter.title())}"
+        await player.send(f"{c['cyan']}║{c['bright_yellow']}  {title_str:<58}{c['cyan']}║{c['reset']}")
+        await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}")
+
+        # Group active quests by category
+        by_cat = {}
+        for quest in active:
+            cat = QuestManager.get_quest_category(quest.quest_id)
+            if cat_filter and cat != cat_filter:
+                continue
+            by_cat.setdefault(cat, []).append(quest)
+
+        if not by_cat:
+            await player.send(f"\r\n  {c['yellow']}No quests in this category.{c['reset']}\r\n")
+            return
+
+        tracked = getattr(player, 'tracked_quest', None)
+
+        for cat_key in ['main_story', 'side', 'daily', 'faction', 'dungeon']:
+            quests = by_cat.get(cat_key, [])
+            if not quests:
+                continue
+            info = QUEST_CATEGORY_INFO.get(cat_key, {'name': cat_key.title(), 'color': 'white', 'icon': '-'})
+            await player.send(f"\r\n  {c[info['color']]}{info['icon']} {info['name']}{c['reset']}")
+
+            for quest in quests:
+                track_mark = f" {c['bright_yellow']}[TRACKED]{c['reset']}" if tracked == quest.quest_id else ""
+                if quest.is_complete():
+                    status = f"{c['bright_green']}COMPLETE{c['reset']}"
+                else:
+                    done = sum(1 for o in quest.objectives if o.completed)
+                    total = len(quest.objectives)
+                    status = f"{c['yellow']}{done}/{total}{c['reset']}"
+                await player.send(f"    {c['bright_white']}{quest.name}{c['reset']} [{status}]{track_mark}")
+
+                for obj in quest.objectives:
+                    if obj.completed:
+                        await player.send(f"      {c['green']}✓ {obj.description}{c['reset']}")
+                    else:
+                        await player.send(f"      {c['white']}  {obj.description} ({obj.current}/{obj.required}){c['reset']}")
+
+                if quest.is_complete():
+                    await player.send(f"      {c['bright_green']}→ Return to quest giver!{c['reset']}")
+
+        await player.send(f"\r\n  {c['cyan']}Commands: quests completed | daily | track <name> | untrack{c['reset']}\r\n")
+
+    @classmethod
+    async def cmd_story(cls, player: 'Player', args: List[str]):
+        """Show main story quest progress."""
+        from quests import QuestManager, QUEST_CHAINS, QUEST_DEFINITIONS
+
+        c = player.config.COLORS
+        chain_def = QUEST_CHAINS.get('main_story')
+        if not chain_def:
+            await player.send(f"{c['yellow']}No main story configured.{c['reset']}")
+            return
+
+        state = QuestManager._get_chain_state(player, 'main_story')
+        await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
+        await player.send(f"{c['cyan']}║{c['bright_yellow']} Main Story Progress{c['cyan']}                                          ║{c['reset']}")
+        await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}\r\n")
+
+        await player.send(f"{c['bright_cyan']}{QuestManager.get_story_progress(player)}{c['reset']}")
+        await player.send("")
+
+        if not state:
+            return
+
+        stages = chain_def.get('stages', {})
+        history = set(state.get('history', []))
+        current = state.get('stage')
+
+        for stage_id, stage_def in stages.items():
+            quest_id = stage_def.get('quest_id')
+            quest_name = QUEST_DEFINITIONS.get(quest_id, {}).get('name', quest_id)
+            if stage_id in history:
+                status = f"{c['bright_green']}✓ COMPLETE{c['reset']}"
+            elif stage_id == current:
+                status = f"{c['yellow']}▶ CURRENT{c['reset']}"
+            else:
+                status = f"{c['white']}LOCKED{c['reset']}"
+            await player.send(f"{status} {quest_name}")
+
+        await player.send("")
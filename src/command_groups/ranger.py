@@ -0,0 +1,363 @@
+"""
+Misthollow Ranger Commands
+=========================
+Ranger tracking and archery.
+"""
+
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class RangerCommands:
+    """Ranger commands."""
+
+    @classmethod
+    async def cmd_track(cls, player: 'Player', args: List[str]):
+        """Track a creature type or specific target."""
+        c = player.config.COLORS
+        
+        if 'track' not in player.skills:
+            await player.send(f"{c['red']}You don't know how to track!{c['reset']}")
+            return
+        
+        if not args:
+            if player.tracking_target:
+                await player.send(f"{c['cyan']}Currently tracking: {c['bright_yellow']}{player.tracking_target}{c['reset']}")
+                await player.send(f"{c['cyan']}Type 'track stop' to stop tracking.{c['reset']}")
+            else:
+                await player.send(f"{c['yellow']}Track what? Usage: track <creature type>{c['reset']}")
+            return
+        
+        target = ' '.join(args).lower()
+        
+        if target == 'stop':
+            if player.tracking_target:
+                await player.send(f"{c['cyan']}You stop tracking {player.tracking_target}.{c['reset']}")
+                player.tracking_target = None
+                player.tracking_vnum = None
+            else:
+                await player.send(f"{c['yellow']}You're not tracking anything.{c['reset']}")
+            return
+        
+        # Start tracking
+        player.tracking_target = target
+        
+        skill_level = player.skills.get('track', 50)
+        
+        await player.send(f"{c['bright_green']}You begin tracking {target}...{c['reset']}")
+        
+        # Search for the target in nearby rooms
+        found_direction = None
+        from mobs import Mobile
+        
+        for direction, exit_info in player.room.exits.items():
+            if not exit_info or not exit_info.get('room'):
+                continue
+            adj_room = exit_info['room']
+            for char in adj_room.characters:
+                if isinstance(char, Mobile) and target in char.name.lower():
+                    found_direction = direction
+                    break
+            if found_direction:
+                break
+        
+        # Deeper search if not found adjacent
+        if not found_direction:
+            import random
+            if random.randint(1, 100) <= skill_level:
+                # Search 2 rooms deep
+                for direction, exit_info in player.room.exits.items():
+                    if not exit_info or not exit_info.get('room'):
+                        continue
+                    adj_room = exit_info['room']
+                    for dir2, exit2 in adj_room.exits.items():
+                        if not exit2 or not exit2.get('room'):
+                            continue
+                        far_room = exit2['room']
+                        for char in far_room.characters:
+                            if isinstance(char, Mobile) and target in char.name.lower():
+                                found_direction = direction
+                                break
+                        if found_direction:
+                            break
+                    if found_direction:
+                        break
+        
+        if found_direction:
+            await player.send(f"{c['bright_yellow']}You sense tracks leading {found_direction}!{c['reset']}")
+        else:
+            await player.send(f"{c['yellow']}You find no fresh tracks nearby.{c['reset']}")
+    
+    @classmethod
+    async def cmd_scan(cls, player: 'Player', args: List[str]):
+        """Scan for creatures in adjacent rooms."""
+        c = player.config.COLORS
+        import time
+        
+        if 'scan' not in player.skills:
+            await player.send(f"{c['red']}You don't know how to scan!{c['reset']}")
+            return
+        
+        # Check cooldown (10 seconds)
+        now = time.time()
+        if now - player.last_scan < 10:
+            remaining = int(10 - (now - player.last_scan))
+            await player.send(f"{c['yellow']}You need to wait {remaining}s before scanning again.{c['reset']}")
+            return
+        
+        player.last_scan = now
+        
+        await player.send(f"{c['cyan']}You scan your surroundings...{c['reset']}")
+        
+        from mobs import Mobile
+        
+        found_any = False
+        
+        for direction, exit_info in player.room.exits.items():
+            if not exit_info or not exit_info.get('room'):
+                continue
+            
+            # Skip hidden exits
+            if exit_info.get('hidden'):
+                continue
+            
+            adj_room = exit_info['room']
+            creatures = []
+            
+            for char in adj_room.characters:
+                if isinstance(char, Mobile):
+                    creatures.append(char.name)
+            
+            if creatures:
+                found_any = True
+                count = len(creatures)
+                if count == 1:
+                    await player.send(f"{c['bright_yellow']}{direction.title()}{c['white']}: {creatures[0]}{c['reset']}")
+                elif count <= 3:
+                    await player.send(f"{c['bright_yellow']}{direction.title()}{c['white']}: {', '.join(creatures)}{c['reset']}")
+                else:
+                    await player.send(f"{c['bright_yellow']}{direction.title()}{c['white']}: {creatures[0]}, {creatures[1]}, and {count - 2} more...{c['reset']}")
+        
+        if not found_any:
+            await player.send(f"{c['cyan']}You don't sense any creatures nearby.{c['reset']}")
+    
+    @classmethod
+    async def cmd_camouflage(cls, player: 'Player', args: List[str]):
+        """Blend into the wilderness for enhanced stealth."""
+        c = player.config.COLORS
+        import random
+        
+        if 'camouflage' not in player.skills:
+            await player.send(f"{c['red']}You don't know how to camouflage!{c['reset']}")
+            return
+        
+        # Check if outdoors
+        outdoor_sectors = {'field', 'forest', 'hills', 'mountain', 'desert', 'swamp'}
+        is_outdoors = player.room and player.room.sector_type in outdoor_sectors
+        
+        if not is_outdoors:
+            await player.send(f"{c['yellow']}Camouflage works best in wilderness areas.{c['reset']}")
+        
+        skill_level = player.skills.get('camouflage', 50)
+        bonus = 30 if is_outdoors else 0
+        
+        if random.randint(1, 100) <= skill_level + bonus:
+            from affects import AffectManager
+            
+            # Apply enhanced hide
+            duration = 10 + (player.level // 5)
+            affect_data = {
+                'name': 'camouflage',
+                'type': AffectManager.TYPE_FLAG,
+                'applies_to': 'hidden',
+                'value': 2,  # 2 = enhanced hide
+                'duration': duration,
+                'caster_level': player.level
+            }
+            AffectManager.apply_affect(player, affect_data)
+            player.flags.add('hidden')
+            
+            await player.send(f"{c['bright_green']}You blend seamlessly into your surroundings.{c['reset']}")
+            await player.room.send_to_room(
+                f"{player.name} seems to fade into the wilderness.",
+                exclude=[player]
+            )
+        else:
+            await player.send(f"{c['yellow']}You fail to properly camouflage yourself.{c['reset']}")
+    
+    @classmethod
+    async def cmd_rapid_shot(cls, player: 'Player', args: List[str]):
+        """Fire multiple arrows in quick succession."""
+        c = player.config.COLORS
+        import random
+        
+        if 'rapid_shot' not in player.skills:
+            await player.send(f"{c['red']}You don't know Rapid Shot.{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['yellow']}You must be fighting to use Rapid Shot.{c['reset']}")
+            return
+        
+        target = player.fighting
+        shots = 3  # Fire 3 rapid shots
+        total_damage = 0
+        
+        await player.send(f"{c['bright_green']}You loose a rapid volley of arrows!{c['reset']}")
+        for i in range(shots):
+            damage = random.randint(4, 10) + player.level // 3
+            total_damage += damage
+            await player.send(f"{c['green']}  → Arrow {i+1} hits {target.name}! [{damage}]{c['reset']}")
+        
+        await target.take_damage(total_damage, player)
+
+    @classmethod
+    async def cmd_marked_shot(cls, player: 'Player', args: List[str]):
+        """Fire a powerful shot at a marked target for bonus damage."""
+        c = player.config.COLORS
+        import random
+        
+        if 'marked_shot' not in player.skills:
+            await player.send(f"{c['red']}You don't know Marked Shot.{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['yellow']}You must be fighting to use Marked Shot.{c['reset']}")
+            return
+        
+        target = player.fighting
+        base_damage = random.randint(12, 24) + player.level
+        
+        # Bonus damage if target is marked (vendetta, hunter's mark, etc.)
+        marked = getattr(target, 'hunters_mark', None) == player or getattr(target, 'vendetta_from', None) == player
+        if marked:
+            base_damage = int(base_damage * 1.5)
+            await player.send(f"{c['bright_yellow']}MARKED! Your shot finds its mark with deadly precision!{c['reset']}")
+        
+        await player.send(f"{c['bright_green']}Your marked shot strikes {target.name}! [{base_damage}]{c['reset']}")
+        await target.take_damage(base_damage, player)
+
+    @classmethod
+    async def cmd_hunters_mark(cls, player: 'Player', args: List[str]):
+        """Mark target as prey. +10% damage, +5 Focus per hit. Free. Ranger only."""
+        c = player.config.COLORS
+
+        if player.char_class.lower() != 'ranger':
+            await player.send(f"{c['red']}Only rangers can use Hunter's Mark!{c['reset']}")
+            return
+
+        target = None
+        if args:
+            target = player.find_target_in_room(' '.join(args))
+        elif player.is_fighting:
+            target = player.fighting
+        if not target:
+            await player.send(f"{c['yellow']}Mark whom as prey?{c['reset']}")
+            return
+
+        # Clear old mark
+        old_mark = getattr(player, 'hunters_mark_target', None)
+        if old_mark == target:
+            player.hunters_mark_target = None
+            await player.send(f"{c['yellow']}You remove your mark from {target.name}.{c['reset']}")
+            return
+
+        player.hunters_mark_target = target
+        # Predator's Mark talent: also reduces armor
+        armor_msg = ""
+        try:
+            from talents import TalentManager
+            if TalentManager.get_talent_rank(player, 'predators_mark') > 0:
+                armor_msg = f" Their armor is weakened!"
+        except Exception:
+            pass
+
+        await player.send(f"{c['bright_yellow']}🎯 You mark {target.name} as your prey! +10% damage, +5 Focus per hit.{armor_msg}{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name} marks {target.name} as prey.", exclude=[player])
+
+    @classmethod
+    async def cmd_ambush(cls, player: 'Player', args: List[str]):
+        """Launch a devastating attack from hiding."""
+        c = player.config.COLORS
+        import random
+        
+        if 'ambush' not in player.skills:
+            await player.send(f"{c['red']}You don't know how to ambush!{c['reset']}")
+            return
+        
+        # Must be hidden
+        is_hidden = 'hidden' in player.flags or (hasattr(player, 'affects') and 'hide' in player.affects)
+        if not is_hidden:
+            is_hidden = hasattr(player, 'affects') and 'camouflage' in player.affects
+        
+        if not is_hidden:
+            await player.send(f"{c['red']}You must be hidden to ambush!{c['reset']}")
+            return
+        
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send(f"{c['yellow']}Ambush whom?{c['reset']}")
+                return
+        
+        target_name = ' '.join(args).lower()
+        target = None
+        
+        from mobs import Mobile
+        for char in player.room.characters:
+            if char != player and target_name in char.name.lower():
+                target = char
+                break
+        
+        if not target:
+            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
+            return
+        
+        if target.is_fighting:
+            await player.send(f"{c['red']}{target.name} is too alert to ambush!{c['reset']}")
+            return
+        
+        skill_level = player.get_skill_level('ambush')
+        
+        # Remove hidden status
+        player.flags.discard('hidden')
+        from affects import AffectManager
+        AffectManager.remove_affect_by_name(player, 'hide')
+        AffectManager.remove_affect_by_name(player, 'camouflage')
+        
+        if random.randint(1, 100) <= skill_level:
+            # Ambush damage: 2.5x weapon damage
+            weapon = player.equipment.get('wield')
+            if weapon and hasattr(weapon, 'damage_dice'):
+                from combat import CombatHandler
+                base_damage = CombatHandler.roll_dice(weapon.damage_dice)
+            else:
+                base_damage = random.randint(2, 8)
+            
+            # Bonus damage if tracking this target
+            tracking_bonus = 1.15 if player.tracking_target and player.tracking_target in target.name.lower() else 1.0
+            
+            damage = int(base_damage * 2.5 * tracking_bonus) + player.get_damage_bonus() * 2
+            
+            await player.send(f"{c['bright_green']}You ambush {target.name} from the shadows! [{damage}]{c['reset']}")
+            if hasattr(target, 'send'):
+                await target.send(f"{c['bright_red']}{player.name} ambushes you from hiding! [{damage}]{c['reset']}")
+            await player.room.send_to_room(
+                f"{player.name} leaps from concealment, ambushing {target.name}!",
+                exclude=[player, target]
+            )
+            
+            killed = await target.take_damage(damage, player)
+            if killed:
+                from combat import CombatHandler
+                await CombatHandler.handle_death(player, target)
+            else:
+                from combat import CombatHandler
+                await CombatHandler.start_combat(player, target)
+        else:
+            await player.send(f"{c['yellow']}Your ambush fails! {target.name} spots you!{c['reset']}")
+            from combat import CombatHandler
+            await CombatHandler.start_combat(player, target)
@@ -0,0 +1,180 @@
+"""
+Misthollow Rent Commands
+=======================
+Rent, storage and quitting.
+"""
+
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class RentCommands:
+    """Rent commands."""
+
+    @classmethod
+    @staticmethod
+    def _calc_item_rent_cost(item) -> int:
+        """Calculate per-day rent cost for a single item based on rarity."""
+        rarity = getattr(item, 'rarity', None)
+        if not rarity:
+            # Infer rarity from flags or value
+            flags = getattr(item, 'flags', set())
+            if isinstance(flags, list):
+                flags = set(flags)
+            if 'legendary' in flags:
+                rarity = 'legendary'
+            elif 'epic' in flags:
+                rarity = 'epic'
+            elif 'rare' in flags:
+                rarity = 'rare'
+            elif 'uncommon' in flags:
+                rarity = 'uncommon'
+            else:
+                rarity = 'common'
+        rarity_costs = {
+            'common': 10,
+            'uncommon': 50,
+            'rare': 200,
+            'epic': 1000,
+            'legendary': 5000,
+        }
+        return rarity_costs.get(rarity, 10)
+
+    @classmethod
+    def calc_total_rent(cls, player) -> int:
+        """Calculate total daily rent cost for a player's gear."""
+        base_cost = max(20, player.level * 5)
+        item_cost = 0
+        # Inventory
+        for item in getattr(player, 'inventory', []):
+            item_cost += cls._calc_item_rent_cost(item)
+        # Equipment
+        for slot, item in getattr(player, 'equipment', {}).items():
+            if item:
+                item_cost += cls._calc_item_rent_cost(item)
+        return base_cost + item_cost
+
+    @classmethod
+    async def cmd_rent(cls, player: 'Player', args: List[str]):
+        """Rent a room at the Inn to save your character and quit safely.
+        Usage: rent        - Rent and log out
+               rent cost   - Check your rental cost without renting"""
+        c = player.config.COLORS
+        from datetime import datetime
+
+        # Check if player is in combat
+        if player.is_fighting:
+            await player.send(f"{c['red']}You can't rent while fighting! Try to flee first.{c['reset']}")
+            return
+
+        # Check for innkeeper NPC in room, or known inn rooms
+        inn_rooms = [3006, 3007, 3008, 3030, 3031, 3032, 3033, 3034, 3048]
+        has_innkeeper = False
+        if player.room:
+            from mobs import Mobile
+            for char in player.room.characters:
+                if isinstance(char, Mobile) and getattr(char, 'special', None) == 'innkeeper':
+                    has_innkeeper = True
+                    break
+        if not has_innkeeper and (not player.room or player.room.vnum not in inn_rooms):
+            await player.send(f"{c['yellow']}You need to find an innkeeper or be at an inn to rent.{c['reset']}")
+            return
+
+        rent_cost = cls.calc_total_rent(player)
+
+        # If just checking cost
+        if args and args[0].lower() in ('cost', 'check', 'price'):
+            await player.send(f"\n{c['bright_cyan']}╔══════════════════════════════════════╗{c['reset']}")
+            await player.send(f"{c['bright_cyan']}║{c['bright_yellow']}       Rental Cost Estimate          {c['bright_cyan']}║{c['reset']}")
+            await player.send(f"{c['bright_cyan']}╠══════════════════════════════════════╣{c['reset']}")
+            await player.send(f"{c['bright_cyan']}║ {c['white']}Base cost:     {max(20, player.level * 5):>6} gold/day   {c['bright_cyan']}║{c['reset']}")
+            inv_cost = sum(cls._calc_item_rent_cost(i) for i in getattr(player, 'inventory', []))
+            eq_cost = sum(cls._calc_item_rent_cost(i) for s, i in getattr(player, 'equipment', {}).items() if i)
+            await player.send(f"{c['bright_cyan']}║ {c['white']}Inventory:     {inv_cost:>6} gold/day   {c['bright_cyan']}║{c['reset']}")
+            await player.send(f"{c['bright_cyan']}║ {c['white']}Equipment:     {eq_cost:>6} gold/day   {c['bright_cyan']}║{c['reset']}")
+            await player.send(f"{c['bright_cyan']}╠══════════════════════════════════════╣{c['reset']}")
+            await player.send(f"{c['bright_cyan']}║ {c['bright_green']}TOTAL:         {rent_cost:>6} gold/day   {c['bright_cyan']}║{c['reset']}")
+            await player.send(f"{c['bright_cyan']}╚══════════════════════════════════════╝{c['reset']}")
+            await player.send(f"{c['yellow']}You have {player.gold} gold. Type 'rent' to rent and log out.{c['reset']}\n")
+            return
+
+        # Check if player can afford it
+        if player.gold < rent_cost:
+            await player.send(f"{c['red']}You need {rent_cost} gold to rent, but you only have {player.gold} gold.{c['reset']}")
+            await player.send(f"{c['yellow']}The innkeeper says, 'Come back when you have enough coin, friend.'{c['reset']}")
+            await player.send(f"{c['yellow']}Tip: Use 'rent cost' to see the breakdown. Drop items to lower cost.{c['reset']}")
+            return
+
+        # Deduct rent cost
+        player.gold -= rent_cost
+
+        # Save rent data for reconnect charging
+        player.rent_data = {
+            'rent_time': datetime.now().isoformat(),
+            'daily_cost': rent_cost,
+            'rented': True,
+        }
+
+        # Save the player
+        await player.save()
+
+        # Send messages
+        await player.send(f"{c['bright_yellow']}You pay {rent_cost} gold to the innkeeper.{c['reset']}")
+        await player.send(f"{c['bright_cyan']}The innkeeper says, 'Rest well, {player.name}. Your room will be ready when you return.'{c['reset']}")
+        await player.send(f"{c['bright_green']}You settle into your room and drift off to sleep...{c['reset']}")
+        await player.send(f"{c['white']}Your character has been saved. Daily rent: {rent_cost} gold.{c['reset']}")
+
+        if player.room:
+            await player.room.send_to_room(
+                f"{player.name} rents a room and retires for the evening.",
+                exclude=[player]
+            )
+
+        # Disconnect
+        if player.connection:
+            await player.connection.disconnect()
+
+
+    @classmethod
+    async def cmd_storage(cls, player: 'Player', args: List[str]):
+        """View items in your storage locker."""
+        c = player.config.COLORS
+
+        if not player.storage:
+            await player.send(f"{c['yellow']}Your storage is empty.{c['reset']}")
+            return
+
+        storage_room = player.world.get_room(player.storage_location) if player.storage_location else None
+        location_name = storage_room.name if storage_room else "Unknown Location"
+
+        await player.send(f"{c['cyan']}╔════════════════════════════════════════════════╗{c['reset']}")
+        await player.send(f"{c['cyan']}║{c['bright_yellow']}     Your Storage at {location_name:<20}{c['cyan']}║{c['reset']}")
+        await player.send(f"{c['cyan']}╠════════════════════════════════════════════════╣{c['reset']}")
+
+        for item in player.storage:
+            await player.send(f"{c['cyan']}║ {c['yellow']}{item.short_desc:<44}{c['cyan']}║{c['reset']}")
+
+        await player.send(f"{c['cyan']}╚════════════════════════════════════════════════╝{c['reset']}")
+        await player.send(f"{c['white']}Total: {len(player.storage)} items{c['reset']}")
+
+    @classmethod
+    async def cmd_quit(cls, player: 'Player', args: List[str]):
+        """Quit the game."""
+        if player.is_fighting:
+            await player.send("You can't quit while fighting! Try to flee first.")
+            return
+
+        await player.save()
+        await player.send("Farewell, brave adventurer! Your progress has been saved.")
+
+        if player.room:
+            await player.room.send_to_room(
+                f"{player.name} has left the realm.",
+                exclude=[player]
+            )
+
+        # Disconnect
+        if player.connection:
+            await player.connection.disconnect()
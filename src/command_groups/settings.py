@@ -0,0 +1,612 @@
+"""
+Misthollow Settings Commands
+===========================
+Toggles, display options, aliases and saving.
+"""
+
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class SettingsCommands:
+    """Settings commands."""
+
+    @classmethod
+    async def cmd_ascii(cls, player: 'Player', args: List[str]):
+        """Toggle ASCII-only UI (no box-drawing characters). Usage: ascii [on|off]"""
+        c = player.config.COLORS
+        if args:
+            arg = args[0].lower()
+            if arg in ('on', 'true', 'yes'):
+                player.ascii_ui = True
+            elif arg in ('off', 'false', 'no'):
+                player.ascii_ui = False
+            else:
+                await player.send(f"{c['yellow']}Usage: ascii [on|off]{c['reset']}")
+                return
+        else:
+            player.ascii_ui = not getattr(player, 'ascii_ui', False)
+        state = 'ON' if player.ascii_ui else 'OFF'
+        await player.send(f"{c['cyan']}ASCII UI is now {state}.{c['reset']}")
+
+    @classmethod
+    async def cmd_change(cls, player: 'Player', args: List[str]):
+        """MUME-style change command wrapper. Usage: change mood <mode> | change wimpy <hp> | change color <scheme>"""
+        c = player.config.COLORS
+
+        if not args:
+            await player.send(f"{c['yellow']}Usage: change mood <aggressive|normal|defensive>, change wimpy <hp>, change color <scheme>{c['reset']}")
+            return
+
+        sub = args[0].lower()
+        rest = args[1:]
+
+        if sub in ('mood', 'stance', 'emood', 'chgmode'):
+            await cls.cmd_stance(player, rest)
+            return
+        if sub == 'wimpy':
+            await cls.cmd_wimpy(player, rest)
+            return
+        if sub in ('color', 'colour'):
+            await cls.cmd_color(player, rest)
+            return
+
+        await player.send(f"{c['yellow']}Unknown change option '{sub}'. Try: mood, wimpy, color.{c['reset']}")
+
+    @classmethod
+    async def cmd_toggle(cls, player: 'Player', args: List[str]):
+        """Show all toggle settings."""
+        c = player.config.COLORS
+        
+        def on_off(val):
+            return f"{c['green']}ON{c['reset']}" if val else f"{c['red']}OFF{c['reset']}"
+        
+        await player.send(f"{c['cyan']}=== Toggle Settings ==={c['reset']}")
+        await player.send(f"  Brief mode:      {on_off(getattr(player, 'brief_mode', False))}")
+        await player.send(f"  Compact mode:    {on_off(getattr(player, 'compact_mode', False))}")
+        await player.send(f"  Autoexit:        {on_off(getattr(player, 'autoexit', False))}")
+        await player.send(f"  Autoloot:        {on_off(getattr(player, 'autoloot', False))}")
+        await player.send(f"  Autoloot gold:   {on_off(getattr(player, 'autoloot_gold', True))}")
+        await player.send(f"  Autogold:        {on_off(getattr(player, 'autogold', True))}")
+        await player.send(f"  Autoattack:      {on_off(getattr(player, 'autoattack', False))}")
+        await player.send(f"  Autocombat:      {on_off(getattr(player, 'autocombat', False))}")
+        await player.send(f"  ASCII UI:        {on_off(getattr(player, 'ascii_ui', False))}")
+        await player.send(f"  Norepeat:        {on_off(getattr(player, 'norepeat', False))}")
+        await player.send(f"  Notell:          {on_off(getattr(player, 'notell', False))}")
+        await player.send(f"  Noshout:         {on_off(getattr(player, 'noshout', False))}")
+        
+        color_level = getattr(player, 'color_level', 'complete')
+        await player.send(f"  Color level:     {c['yellow']}{color_level}{c['reset']}")
+        
+        wimpy = getattr(player, 'wimpy', 0)
+        await player.send(f"  Wimpy:           {c['yellow']}{wimpy}{c['reset']} HP" if wimpy else f"  Wimpy:           {c['red']}OFF{c['reset']}")
+        
+        autorecall = getattr(player, 'autorecall_hp', None)
+        if autorecall:
+            pct = '%' if getattr(player, 'autorecall_is_percent', False) else ' HP'
+            await player.send(f"  Autorecall:      {c['yellow']}{autorecall}{pct}{c['reset']}")
+        else:
+            await player.send(f"  Autorecall:      {c['red']}OFF{c['reset']}")
+        
+        prompt = getattr(player, 'custom_prompt', None)
+        await player.send(f"  Custom prompt:   {c['yellow']}{prompt}{c['reset']}" if prompt else f"  Custom prompt:   {c['red']}default{c['reset']}")
+        await player.send(f"  Prompt display:  {on_off(getattr(player, 'prompt_enabled', True))}")
+        
+        await player.send(f"\n{c['white']}Use command name to toggle (e.g., 'brief', 'autoexit', 'notell'){c['reset']}")
+
+    @classmethod
+    async def cmd_color(cls, player: 'Player', args: List[str]):
+        """Set color level. Usage: color [off|sparse|normal|complete]"""
+        c = player.config.COLORS
+        
+        levels = ['off', 'sparse', 'normal', 'complete']
+        current = getattr(player, 'color_level', 'complete')
+        
+        if not args:
+            await player.send(f"{c['cyan']}Current color level: {c['white']}{current}{c['reset']}")
+            await player.send(f"{c['yellow']}Usage: color <off|sparse|normal|complete>{c['reset']}")
+            return
+        
+        level = args[0].lower()
+        if level not in levels:
+            await player.send(f"{c['red']}Invalid level. Choose: off, sparse, normal, complete{c['reset']}")
+            return
+        
+        player.color_level = level
+        await player.send(f"{c['green']}Color level set to: {level}{c['reset']}")
+
+    @classmethod
+    async def cmd_prompt(cls, player: 'Player', args: List[str]):
+        """Set custom prompt. Usage: prompt <format> or prompt default"""
+        c = player.config.COLORS
+        
+        if not args:
+            current = getattr(player, 'custom_prompt', None)
+            if current:
+                await player.send(f"{c['cyan']}Current prompt: {c['white']}{current}{c['reset']}")
+            else:
+                await player.send(f"{c['cyan']}Using default prompt.{c['reset']}")
+            await player.send(f"{c['yellow']}Prompt is {'ON' if getattr(player, 'prompt_enabled', True) else 'OFF'} (use: prompt on/off){c['reset']}")
+            await player.send(f"{c['yellow']}Format codes: %h=HP %H=MaxHP %m=Mana %M=MaxMana %v=Move %V=MaxMove %g=Gold %x=XP %p=HP% %q=Mana% %r=Move% %n=Newline{c['reset']}")
+            await player.send(f"{c['yellow']}Example: prompt <%h/%Hhp %m/%Mm %v/%Vmv> {c['reset']}")
+            return
+        
+        prompt_str = ' '.join(args)
+        
+        # Toggle prompt display
+        if prompt_str.lower() in ['on', 'off']:
+            player.prompt_enabled = (prompt_str.lower() == 'on')
+            state = 'ON' if player.prompt_enabled else 'OFF'
+            await player.send(f"{c['green']}Prompt is now {state}.{c['reset']}")
+            return
+        
+        if prompt_str.lower() == 'default':
+            player.custom_prompt = None
+            await player.send(f"{c['green']}Prompt reset to default.{c['reset']}")
+        else:
+            from prompt import compile_prompt
+            compile_prompt(prompt_str)
+            player.custom_prompt = prompt_str
+            await player.send(f"{c['green']}Prompt set to: {prompt_str}{c['reset']}")
+
+    @classmethod
+    async def cmd_display(cls, player: 'Player', args: List[str]):
+        """Set display options. Alias for prompt."""
+        await cls.cmd_prompt(player, args)
+
+    @classmethod
+    async def cmd_autoexit(cls, player: 'Player', args: List[str]):
+        """Toggle automatic exit display on room entry."""
+        c = player.config.COLORS
+        
+        player.autoexit = not getattr(player, 'autoexit', False)
+        
+        if player.autoexit:
+            await player.send(f"{c['green']}Autoexit is now ON. Exits will show when you enter rooms.{c['reset']}")
+        else:
+            await player.send(f"{c['yellow']}Autoexit is now OFF.{c['reset']}")
+
+    @classmethod
+    async def cmd_norepeat(cls, player: 'Player', args: List[str]):
+        """Toggle echoing of your own communication."""
+        c = player.config.COLORS
+        
+        player.norepeat = not getattr(player, 'norepeat', False)
+        
+        if player.norepeat:
+            await player.send(f"{c['green']}Norepeat ON. You won't see your own says/tells echoed.{c['reset']}")
+        else:
+            await player.send(f"{c['yellow']}Norepeat OFF. You'll see your own communication.{c['reset']}")
+
+    @classmethod
+    async def cmd_notell(cls, player: 'Player', args: List[str]):
+        """Toggle blocking of tells from other players."""
+        c = player.config.COLORS
+        
+        player.notell = not getattr(player, 'notell', False)
+        
+        if player.notell:
+            await player.send(f"{c['green']}Notell ON. You will not receive tells.{c['reset']}")
+        else:
+            await player.send(f"{c['yellow']}Notell OFF. You can receive tells.{c['reset']}")
+
+    @classmethod
+    async def cmd_noshout(cls, player: 'Player', args: List[str]):
+        """Toggle blocking of shouts and hollers."""
+        c = player.config.COLORS
+        
+        player.noshout = not getattr(player, 'noshout', False)
+        
+        if player.noshout:
+            await player.send(f"{c['green']}Noshout ON. You will not hear shouts or hollers.{c['reset']}")
+        else:
+            await player.send(f"{c['yellow']}Noshout OFF. You can hear shouts.{c['reset']}")
+
+    # ==================== SAVING ====================
+
+    @classmethod
+    async def cmd_save(cls, player: 'Player', args: List[str]):
+        """Save your character."""
+        await player.save()
+        await player.send("Character saved.")
+        
+    @classmethod
+    async def cmd_alias(cls, player: 'Player', args: List[str]):
+        """Create, view, or remove personal command aliases.
+
+        Usage:
+            alias              - List all your aliases
+            alias <word>       - Show what <word> is aliased to
+            alias <word> <cmd> - Create alias <word> for <cmd>
+            unalias <word>     - Remove an alias
+        """
+        c = player.config.COLORS
+
+        if not args:
+            # List all aliases
+            if not player.custom_aliases:
+                await player.send("You have no aliases defined.")
+            else:
+                await player.send(f"{c['cyan']}Your Aliases:{c['reset']}")
+                for alias, command in sorted(player.custom_aliases.items()):
+                    await player.send(f"  {c['bright_green']}{alias}{c['white']} -> {c['bright_yellow']}{command}{c['reset']}")
+        elif len(args) == 1:
+            # Show specific alias
+            alias_word = args[0].lower()
+            if alias_word in player.custom_aliases:
+                await player.send(f"{c['bright_green']}{alias_word}{c['white']} is aliased to: {c['bright_yellow']}{player.custom_aliases[alias_word]}{c['reset']}")
+            else:
+                await player.send(f"You have no alias for '{alias_word}'.")
+        else:
+            # Create new alias
+            alias_word = args[0].lower()
+            command = ' '.join(args[1:])
+            player.custom_aliases[alias_word] = command
+            await player.send(f"{c['bright_green']}Alias created:{c['white']} {alias_word} -> {command}{c['reset']}")
+
+    @classmethod
+    async def cmd_unalias(cls, player: 'Player', args: List[str]):
+        """Remove a personal alias."""
+        c = player.config.COLORS
+
+        if not args:
+            await player.send("Usage: unalias <word>")
+            return
+
+        alias_word = args[0].lower()
+        if alias_word in player.custom_aliases:
+            del player.custom_aliases[alias_word]
+            await player.send(f"{c['bright_green']}Alias '{alias_word}' removed.{c['reset']}")
+        else:
+            await player.send(f"You have no alias for '{alias_word}'.")
+
+    @classmethod
+    async def cmd_autoloot(cls, player: 'Player', args: List[str]):
+        """Toggle automatic looting of items from corpses.
+
+        Usage:
+            autoloot          - Toggle autoloot on/off
+            autoloot on       - Turn autoloot on
+            autoloot off      - Turn autoloot off
+            autoloot gold     - Toggle gold autoloot on/off
+            autoloot gold on  - Turn gold autoloot on
+            autoloot gold off - Turn gold autoloot off
+        """
+        c = player.config.COLORS
+
+        # Handle autoloot gold
+        if args and args[0].lower() == 'gold':
+            if len(args) > 1:
+                setting = args[1].lower()
+                if setting == 'on':
+                    player.autoloot_gold = True
+                    await player.send(f"{c['bright_green']}Autoloot gold is now ON. You will automatically loot gold from corpses.{c['reset']}")
+                elif setting == 'off':
+                    player.autoloot_gold = False
+                    await player.send(f"{c['yellow']}Autoloot gold is now OFF. You must manually loot gold from corpses.{c['reset']}")
+                else:
+                    await player.send(f"{c['red']}Usage: autoloot gold [on|off]{c['reset']}")
+            else:
+                # Toggle
+                player.autoloot_gold = not player.autoloot_gold
+                status = f"{c['bright_green']}ON{c['reset']}" if player.autoloot_gold else f"{c['red']}OFF{c['reset']}"
+                await player.send(f"Autoloot gold is now {status}.")
+        # Handle regular autoloot
+        elif args:
+            setting = args[0].lower()
+            if setting == 'on':
+                player.autoloot = True
+                await player.send(f"{c['bright_green']}Autoloot is now ON. You will automatically loot all items from corpses.{c['reset']}")
+            elif setting == 'off':
+                player.autoloot = False
+                await player.send(f"{c['yellow']}Autoloot is now OFF. You must manually loot items from corpses.{c['reset']}")
+            else:
+                await player.send(f"{c['red']}Usage: autoloot [on|off] or autoloot gold [on|off]{c['reset']}")
+        else:
+            # Toggle
+            player.autoloot = not player.autoloot
+            status = f"{c['bright_green']}ON{c['reset']}" if player.autoloot else f"{c['red']}OFF{c['reset']}"
+            await player.send(f"Autoloot is now {status}.")
+
+        # Show current status
+        gold_status = f"{c['bright_green']}ON{c['reset']}" if player.autoloot_gold else f"{c['red']}OFF{c['reset']}"
+        item_status = f"{c['bright_green']}ON{c['reset']}" if player.autoloot else f"{c['red']}OFF{c['reset']}"
+        await player.send(f"{c['cyan']}Current settings: Autoloot Items: {item_status}, Autoloot Gold: {gold_status}{c['reset']}")
+
+    @classmethod
+    async def cmd_autogold(cls, player: 'Player', args: List[str]):
+        """Toggle automatic pickup of ground gold.
+
+        Usage:
+            autogold          - Toggle autogold on/off
+            autogold on       - Turn autogold on
+            autogold off      - Turn autogold off
+        """
+        c = player.config.COLORS
+
+        if args:
+            setting = args[0].lower()
+            if setting == 'on':
+                player.autogold = True
+                await player.send(f"{c['bright_green']}Autogold is now ON. You will automatically pick up gold on the ground.{c['reset']}")
+            elif setting == 'off':
+                player.autogold = False
+                await player.send(f"{c['yellow']}Autogold is now OFF. You must manually pick up gold.{c['reset']}")
+            else:
+                await player.send(f"{c['red']}Usage: autogold [on|off]{c['reset']}")
+        else:
+            player.autogold = not player.autogold
+            status = f"{c['bright_green']}ON{c['reset']}" if player.autogold else f"{c['red']}OFF{c['reset']}"
+            await player.send(f"Autogold is now {status}.")
+
+    @classmethod
+    async def cmd_autoattack(cls, player: 'Player', args: List[str]):
+        """Toggle automatic basic attacks.
+
+        Usage:
+            autoattack          - Toggle autoattack on/off
+            autoattack on       - Turn autoattack on
+            autoattack off      - Turn autoattack off
+        """
+        c = player.config.COLORS
+
+        if args:
+            setting = args[0].lower()
+            if setting == 'on':
+                player.autoattack = True
+                await player.send(f"{c['bright_green']}Autoattack is now ON.{c['reset']}")
+            elif setting == 'off':
+                player.autoattack = False
+                await player.send(f"{c['yellow']}Autoattack is now OFF.{c['reset']}")
+            else:
+                await player.send(f"{c['red']}Usage: autoattack [on|off]{c['reset']}")
+        else:
+            player.autoattack = not player.autoattack
+            status = f"{c['bright_green']}ON{c['reset']}" if player.autoattack else f"{c['red']}OFF{c['reset']}"
+            await player.send(f"Autoattack is now {status}.")
+
+    @classmethod
+    async def cmd_autocombat(cls, player: 'Player', args: List[str]):
+        """Toggle automatic combat skills/spells.
+
+        Usage:
+            autocombat          - Toggle autocombat on/off
+            autocombat on       - Turn autocombat on
+            autocombat off      - Turn autocombat off
+        """
+        c = player.config.COLORS
+
+        if args:
+            setting = args[0].lower()
+            if setting == 'on':
+                player.autocombat = True
+                await player.send(f"{c['bright_green']}Autocombat is now ON.{c['reset']}")
+            elif setting == 'off':
+                player.autocombat = False
+                await player.send(f"{c['yellow']}Autocombat is now OFF.{c['reset']}")
+            else:
+                await player.send(f"{c['red']}Usage: autocombat [on|off]{c['reset']}")
+        else:
+            player.autocombat = not player.autocombat
+            status = f"{c['bright_green']}ON{c['reset']}" if player.autocombat else f"{c['red']}OFF{c['reset']}"
+            await player.send(f"Autocombat is now {status}.")
+
+    @classmethod
+    async def cmd_brief(cls, player: 'Player', args: List[str]):
+        """Toggle brief room descriptions.
+
+        Usage:
+            brief          - Toggle brief mode on/off
+            brief on       - Turn brief mode on
+            brief off      - Turn brief mode off
+        """
+        c = player.config.COLORS
+
+        if args:
+            setting = args[0].lower()
+            if setting == 'on':
+                player.brief_mode = True
+                await player.send(f"{c['bright_green']}Brief mode is now ON.{c['reset']}")
+            elif setting == 'off':
+                player.brief_mode = False
+                await player.send(f"{c['yellow']}Brief mode is now OFF.{c['reset']}")
+            else:
+                await player.send(f"{c['red']}Usage: brief [on|off]{c['reset']}")
+        else:
+            player.brief_mode = not player.brief_mode
+            status = f"{c['bright_green']}ON{c['reset']}" if player.brief_mode else f"{c['red']}OFF{c['reset']}"
+            await player.send(f"Brief mode is now {status}.")
+
+    @classmethod
+    async def cmd_compact(cls, player: 'Player', args: List[str]):
+        """Toggle compact combat messages.
+
+        Usage:
+            compact          - Toggle compact mode on/off
+            compact on       - Turn compact mode on
+            compact off      - Turn compact mode off
+        """
+        c = player.config.COLORS
+
+        if args:
+            setting = args[0].lower()
+            if setting == 'on':
+                player.compact_mode = True
+                await player.send(f"{c['bright_green']}Compact mode is now ON.{c['reset']}")
+            elif setting == 'off':
+                player.compact_mode = False
+                await player.send(f"{c['yellow']}Compact mode is now OFF.{c['reset']}")
+            else:
+                await player.send(f"{c['red']}Usage: compact [on|off]{c['reset']}")
+        else:
+            player.compact_mode = not player.compact_mode
+            status = f"{c['bright_green']}ON{c['reset']}" if player.compact_mode else f"{c['red']}OFF{c['reset']}"
+            await player.send(f"Compact mode is now {status}.")
+
+    @classmethod
+    async def cmd_vnums(cls, player: 'Player', args: List[str]):
+        """Toggle room vnum display."""
+        c = player.config.COLORS
+        player.show_room_vnums = not player.show_room_vnums
+        status = f"{c['bright_green']}ON{c['reset']}" if player.show_room_vnums else f"{c['red']}OFF{c['reset']}"
+        await player.send(f"Room vnums are now {status}.")
+
+    @classmethod
+    async def cmd_tick(cls, player: 'Player', args: List[str]):
+        """Toggle tick timer notifications.
+        
+        Shows when game ticks happen (regen, combat, etc.)
+        
+        Usage:
+            tick         - Toggle tick notifications
+            tick on      - Turn on
+            tick off     - Turn off
+        """
+        c = player.config.COLORS
+        
+        if args:
+            setting = args[0].lower()
+            if setting == 'on':
+                player.show_ticks = True
+            elif setting == 'off':
+                player.show_ticks = False
+            else:
+                await player.send(f"{c['yellow']}Usage: tick [on|off]{c['reset']}")
+                return
+        else:
+            player.show_ticks = not getattr(player, 'show_ticks', False)
+        
+        if player.show_ticks:
+            await player.send(f"{c['bright_green']}Tick notifications ON.{c['reset']}")
+            await player.send(f"{c['cyan']}Tick rates: Combat=4s, Regen=60s, Pet=10s{c['reset']}")
+        else:
+            await player.send(f"{c['yellow']}Tick notifications OFF.{c['reset']}")
+
+    @classmethod
+    async def cmd_notick(cls, player: 'Player', args: List[str]):
+        """Alias for tick - toggle tick notifications."""
+        await cls.cmd_tick(player, args)
+
+    @classmethod
+    async def cmd_settings(cls, player: 'Player', args: List[str]):
+        """Show toggleable settings."""
+        c = player.config.COLORS
+
+        toggles = {
+            'Autoattack': getattr(player, 'autoattack', False),
+            'Autocombat': getattr(player, 'autocombat', False),
+            'Autoexit': getattr(player, 'autoexit', False),
+            'Autoloot Items': getattr(player, 'autoloot', False),
+            'Autoloot Gold': getattr(player, 'autoloot_gold', True),
+            'Autogold': getattr(player, 'autogold', True),
+            'Brief': getattr(player, 'brief_mode', False),
+            'Compact': getattr(player, 'compact_mode', False),
+            'Prompt': getattr(player, 'prompt_enabled', True),
+            'Norepeat': getattr(player, 'norepeat', False),
+            'Notell': getattr(player, 'notell', False),
+            'Noshout': getattr(player, 'noshout', False),
+            'AI Chat': getattr(player, 'ai_chat_enabled', True),
+        }
+
+        await player.send(f"{c['cyan']}Current Settings:{c['reset']}")
+        for label, enabled in toggles.items():
+            status = f"{c['bright_green']}ON{c['reset']}" if enabled else f"{c['red']}OFF{c['reset']}"
+            await player.send(f"  {label:<14} {status}")
+
+        if hasattr(player, 'autorecall_hp') and player.autorecall_hp is not None:
+            if getattr(player, 'autorecall_is_percent', False):
+                await player.send(f"  Autorecall: {player.autorecall_hp}%")
+            else:
+                await player.send(f"  Autorecall: {int(player.autorecall_hp)} HP")
+        
+        # Extra settings
+        color_level = getattr(player, 'color_level', 'complete')
+        await player.send(f"  Color level: {color_level}")
+        if getattr(player, 'custom_prompt', None):
+            await player.send(f"  Prompt format: {player.custom_prompt}")
+
+    @classmethod
+    async def cmd_combat(cls, player: 'Player', args: List[str]):
+        """Combat settings for auto-combat.
+
+        Usage:
+            combat settings
+            combat settings heal <percent>
+            combat settings skills on|off
+            combat settings spells on|off
+            combat settings skillpriority <skill1,skill2,...>
+            combat settings spellpriority <spell1,spell2,...>
+            combat settings reset
+        """
+        c = player.config.COLORS
+
+        if not args or args[0].lower() != 'settings':
+            await player.send(f"{c['yellow']}Usage: combat settings{c['reset']}")
+            return
+
+        settings = getattr(player, 'auto_combat_settings', {})
+        if len(args) == 1:
+            await player.send(f"{c['cyan']}Auto-Combat Settings:{c['reset']}")
+            await player.send(f"  Heal Threshold: {settings.get('heal_threshold', 35)}%")
+            await player.send(f"  Use Skills: {'ON' if settings.get('use_skills', True) else 'OFF'}")
+            await player.send(f"  Use Spells: {'ON' if settings.get('use_spells', True) else 'OFF'}")
+            await player.send(f"  Skill Priority: {', '.join(settings.get('skill_priority', []))}")
+            await player.send(f"  Spell Priority: {', '.join(settings.get('spell_priority', []))}")
+            return
+
+        sub = args[1].lower()
+        if sub == 'reset':
+            player.auto_combat_settings = {
+                'heal_threshold': 35,
+                'use_skills': True,
+                'use_spells': True,
+                'skill_priority': ['bash', 'kick'],
+                'spell_priority': ['heal', 'cure_critical', 'cure_serious', 'cure_light', 'fireball', 'lightning_bolt', 'magic_missile'],
+            }
+            await player.send(f"{c['bright_green']}Auto-combat settings reset to defaults.{c['reset']}")
+            return
+
+        if sub == 'heal' and len(args) >= 3:
+            try:
+                val = int(args[2].rstrip('%'))
+                if val < 1 or val > 99:
+                    raise ValueError
+                settings['heal_threshold'] = val
+                await player.send(f"{c['green']}Heal threshold set to {val}%{c['reset']}")
+            except ValueError:
+                await player.send(f"{c['red']}Usage: combat settings heal <1-99>{c['reset']}")
+            return
+
+        if sub == 'skills' and len(args) >= 3:
+            setting = args[2].lower()
+            if setting in ('on', 'off'):
+                settings['use_skills'] = setting == 'on'
+                await player.send(f"{c['green']}Auto skills set to {setting.upper()}.{c['reset']}")
+            else:
+                await player.send(f"{c['red']}Usage: combat settings skills on|off{c['reset']}")
+            return
+
+        if sub == 'spells' and len(args) >= 3:
+            setting = args[2].lower()
+            if setting in ('on', 'off'):
+                settings['use_spells'] = setting == 'on'
+                await player.send(f"{c['green']}Auto spells set to {setting.upper()}.{c['reset']}")
+            else:
+                await player.send(f"{c['red']}Usage: combat settings spells on|off{c['reset']}")
+            return
+
+        if sub == 'skillpriority' and len(args) >= 3:
+            raw = ' '.join(args[2:]).replace(',', ' ').split()
+            settings['skill_priority'] = [s.lower() for s in raw]
+            await player.send(f"{c['green']}Skill priority set to: {', '.join(settings['skill_priority'])}{c['reset']}")
+            return
+
+        if sub == 'spellpriority' and len(args) >= 3:
+            raw = ' '.join(args[2:]).replace(',', ' ').split()
+            settings['spell_priority'] = [s.lower() for s in raw]
+            await player.send(f"{c['green']}Spell priority set to: {', '.join(settings['spell_priority'])}{c['reset']}")
+            return
+
+        await player.send(f"{c['yellow']}Usage: combat settings (heal|skills|spells|skillpriority|spellpriority|reset){c['reset']}")
@@ -0,0 +1,699 @@
+"""
+Misthollow Skill Commands
+========================
+General skills: stealth, tricks, light and dual wielding.
+"""
+
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class SkillCommands:
+    """Skill commands."""
+
+    @classmethod
+    async def cmd_sneak(cls, player: 'Player', args: List[str]):
+        """Toggle sneak mode."""
+        c = player.config.COLORS
+
+        # Check if player has the skill
+        if 'sneak' not in player.skills:
+            await player.send(f"{c['red']}You don't know how to sneak!{c['reset']}")
+            return
+
+        # If exposed, block sneaking
+        import time, random
+        if getattr(player, 'exposed_until', 0) > time.time():
+            await player.send(f"{c['red']}You're too exposed to sneak right now.{c['reset']}")
+            return
+
+        # Toggle sneak
+        if 'sneaking' in player.flags:
+            player.flags.remove('sneaking')
+            await player.send(f"{c['yellow']}You stop sneaking.{c['reset']}")
+        else:
+            skill_level = player.get_skill_level('sneak')
+            if random.randint(1, 100) <= skill_level:
+                player.flags.add('sneaking')
+                await player.send(f"{c['green']}You start moving silently...{c['reset']}")
+                await player.improve_skill('sneak', difficulty=3)
+            else:
+                await player.send(f"{c['yellow']}You try to move quietly but fail.{c['reset']}")
+
+    @classmethod
+    async def cmd_ritual(cls, player: 'Player', args: List[str]):
+        """Perform dark ritual to empower all undead pets (Necromancer only)."""
+        c = player.config.COLORS
+        
+        # Class check
+        if player.char_class != 'necromancer':
+            await player.send(f"{c['red']}Only necromancers can perform dark rituals!{c['reset']}")
+            return
+        
+        # Check if already channeling
+        if hasattr(player, 'channeling_ritual') and player.channeling_ritual:
+            await player.send(f"{c['yellow']}You are already channeling a ritual!{c['reset']}")
+            return
+        
+        # Check cooldown
+        import time
+        now = time.time()
+        cooldown_end = getattr(player, 'dark_ritual_cooldown', 0)
+        if now < cooldown_end:
+            remaining = int(cooldown_end - now)
+            await player.send(f"{c['red']}Dark ritual is on cooldown! ({remaining}s remaining){c['reset']}")
+            return
+        
+        # Check mana and HP cost
+        mana_cost = 30
+        skill_level = player.skills.get('dark_ritual', 1)
+        hp_percent = 0.15 if skill_level < 76 else 0.10  # Reduced at high skill
+        hp_cost = int(player.max_hp * hp_percent)
+        
+        if player.mana < mana_cost:
+            await player.send(f"{c['red']}You need {mana_cost} mana to perform the ritual!{c['reset']}")
+            return
+        
+        if player.hp <= hp_cost:
+            await player.send(f"{c['red']}The ritual would kill you! You need more than {hp_cost} HP.{c['reset']}")
+            return
+        
+        # Get undead pets
+        from pets import PetManager
+        pets = PetManager.get_player_pets(player)
+        undead_pets = [p for p in pets if p.pet_type == 'undead']
+        
+        if not undead_pets:
+            await player.send(f"{c['yellow']}You have no undead servants to empower!{c['reset']}")
+            return
+        
+        # Pay costs
+        player.mana -= mana_cost
+        player.hp -= hp_cost
+        
+        # Calculate duration based on skill level
+        if skill_level < 26:
+            duration_rounds = 20  # ~1 minute
+        elif skill_level < 51:
+            duration_rounds = 30  # ~1.5 minutes
+        elif skill_level < 76:
+            duration_rounds = 40  # ~2 minutes
+        else:
+            duration_rounds = 50  # ~2.5 minutes
+        
+        # Apply ritual buff to all undead pets
+        for pet in undead_pets:
+            if not hasattr(pet, 'ritual_buff_duration'):
+                pet.ritual_buff_duration = 0
+            pet.ritual_buff_duration = duration_rounds
+            
+            # Apply stat bonuses
+            if not hasattr(pet, 'ritual_bonuses'):
+                pet.ritual_bonuses = {}
+            pet.ritual_bonuses = {
+                'str': 3,
+                'dex': 3,
+                'con': 3,
+                'regen': 5  # 5% HP per round
+            }
+        
+        # Set channeling state (prevents other spellcasting)
+        player.channeling_ritual = True
+        player.ritual_duration = duration_rounds
+        
+        # Set cooldown (5 minutes)
+        player.dark_ritual_cooldown = now + 300
+        
+        await player.send(f"{c['bright_magenta']}You begin the dark ritual, sacrificing {hp_cost} HP and {mana_cost} mana!{c['reset']}")
+        await player.send(f"{c['green']}All {len(undead_pets)} undead servants are empowered for {duration_rounds} rounds!{c['reset']}")
+        await player.send(f"{c['yellow']}Effects: +3 to all stats, 5% HP regen per round{c['reset']}")
+        
+        if player.room:
+            await player.room.send_to_room(
+                f"{c['bright_magenta']}{player.name} begins chanting in a guttural tongue, dark energy swirling!{c['reset']}",
+                exclude=[player]
+            )
+        
+        # Improve skill
+        await player.improve_skill('dark_ritual', difficulty=5)
+
+    @classmethod
+    async def cmd_hide(cls, player: 'Player', args: List[str]):
+        """Attempt to hide in shadows."""
+        c = player.config.COLORS
+
+        # Check if player has the skill
+        if 'hide' not in player.skills:
+            await player.send(f"{c['red']}You don't know how to hide!{c['reset']}")
+            return
+
+        # Can't hide while fighting
+        if player.is_fighting:
+            await player.send(f"{c['red']}You can't hide while fighting!{c['reset']}")
+            return
+
+        import time, random
+        if getattr(player, 'exposed_until', 0) > time.time():
+            await player.send(f"{c['red']}You're too exposed to hide right now.{c['reset']}")
+            return
+
+        # Environment bonus
+        env_bonus = 0
+        if player.room:
+            if hasattr(player.room, 'is_dark') and player.room.is_dark(getattr(player.world, 'game_time', None)):
+                env_bonus += 20
+            if player.room.sector_type in ('forest','swamp'):
+                env_bonus += 10
+        if player.has_light_source():
+            env_bonus -= 25
+
+        skill_level = player.get_skill_level('hide') + env_bonus
+        if random.randint(1, 100) <= max(5, skill_level):
+            player.flags.add('hidden')
+            await player.send(f"{c['green']}You blend into the shadows...{c['reset']}")
+            await player.improve_skill('hide', difficulty=4)
+            # chance to clear tracking if being searched
+            if getattr(player, 'tracked_by', None):
+                if random.randint(1, 100) <= 50:
+                    player.tracked_by = None
+                    await player.send(f"{c['cyan']}You lose your pursuer in the shadows.{c['reset']}")
+        else:
+            await player.send(f"{c['yellow']}You fail to conceal yourself.{c['reset']}")
+
+    @classmethod
+    async def cmd_blur(cls, player: 'Player', args: List[str]):
+        """Blur your outline to make attacks less accurate."""
+        c = player.config.COLORS
+        if 'blur' not in player.skills:
+            await player.send(f"{c['red']}You don't know how to blur yourself.{c['reset']}")
+            return
+        import time
+        now = time.time()
+        if getattr(player, 'blur_cooldown_until', 0) > now:
+            remaining = int(player.blur_cooldown_until - now)
+            await player.send(f"{c['yellow']}Blur is on cooldown ({remaining}s).{c['reset']}")
+            return
+        player.blur_until = now + 20
+        player.blur_cooldown_until = now + 30
+        await player.send(f"{c['cyan']}Your outline shimmers and blurs.{c['reset']}")
+
+    @classmethod
+    async def cmd_feint(cls, player: 'Player', args: List[str]):
+        """Feint — target deals 30% less damage to you for 3 rounds (Assassin rework)."""
+        import time
+        c = player.config.COLORS
+        char_class = getattr(player, 'char_class', '').lower()
+        if char_class == 'assassin':
+            if not player.is_fighting:
+                await player.send(f"{c['red']}You must be in combat to feint!{c['reset']}")
+                return
+            now = time.time()
+            if now < getattr(player, 'feint_cooldown', 0):
+                remaining = int(player.feint_cooldown - now)
+                await player.send(f"{c['yellow']}Feint on cooldown ({remaining}s).{c['reset']}")
+                return
+            player.feint_cooldown = now + 20
+            player.feint_until = now + 12  # ~3 combat rounds at 4s each
+            player.feint_reduction = 0.30
+            await player.send(f"{c['green']}You feint, causing your opponent to misjudge their strikes! (30% damage reduction for 3 rounds){c['reset']}")
+            if player.room:
+                await player.room.send_to_room(
+                    f"{c['white']}{player.name} makes a deceptive feint.{c['reset']}",
+                    exclude=[player]
+                )
+            return
+        # Non-assassin fallback (original behavior)
+        if 'feint' not in player.skills:
+            await player.send(f"{c['red']}You don't know how to feint.{c['reset']}")
+            return
+        if not args:
+            target = player.target if player.target and player.target in player.room.characters else None
+            if not target:
+                await player.send("Feint whom?")
+                return
+        else:
+            target = player.find_target_in_room(' '.join(args).lower())
+        if not target:
+            await player.send(f"{c['red']}They aren't here.{c['reset']}")
+            return
+        import random
+        chance = player.skills.get('feint', 0) + (player.dex - getattr(target, 'dex', 10))
+        if random.randint(1, 100) <= max(5, chance):
+            if not hasattr(target, 'ai_state'):
+                target.ai_state = {}
+            target.ai_state['feinted_until'] = time.time() + 6
+            target.ai_state['feinted_by'] = player
+            await player.send(f"{c['green']}You feint, opening {target.name}'s guard!{c['reset']}")
+        else:
+            await player.send(f"{c['yellow']}Your feint fails.{c['reset']}")
+
+    @classmethod
+    async def cmd_tumble(cls, player: 'Player', args: List[str]):
+        """Tumble to reduce incoming damage briefly."""
+        c = player.config.COLORS
+        if 'tumble' not in player.skills:
+            await player.send(f"{c['red']}You don't know how to tumble.{c['reset']}")
+            return
+        import time
+        player.tumble_until = time.time() + 3
+        await player.send(f"{c['cyan']}You tumble and roll, ready to evade blows.{c['reset']}")
+
+    @classmethod
+    async def cmd_circle(cls, player: 'Player', args: List[str]):
+        """Circle behind a distracted target for a quick strike."""
+        c = player.config.COLORS
+        if 'circle' not in player.skills:
+            await player.send(f"{c['red']}You don't know how to circle attack.{c['reset']}")
+            return
+        if not args:
+            target = player.target if player.target and player.target in player.room.characters else None
+            if not target:
+                await player.send("Circle whom?")
+                return
+        else:
+            target = player.find_target_in_room(' '.join(args).lower())
+        if not target:
+            await player.send(f"{c['red']}They aren't here.{c['reset']}")
+            return
+        if not getattr(target, 'fighting', None) or target.fighting == player:
+            await player.send(f"{c['yellow']}They're not distracted enough to circle.{c['reset']}")
+            return
+        from combat import CombatHandler
+        # Quick bonus attack
+        await CombatHandler.bonus_attack(player, target)
+
+    @classmethod
+    async def cmd_cleave(cls, player: 'Player', args: List[str]):
+        """Cleave — Hit all enemies in room (warrior) or basic AoE."""
+        import time, random
+        c = player.config.COLORS
+
+        # Warriors use the new doctrine system
+        if player.char_class.lower() == 'warrior':
+            from warrior_abilities import do_cleave
+            await do_cleave(player, args)
+            return
+
+        # Non-warriors use legacy cleave
+        if 'cleave' not in player.skills:
+            await player.send(f"{c['red']}You don't know how to cleave.{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['yellow']}You need to be fighting to cleave.{c['reset']}")
+            return
+        from combat import CombatHandler
+        targets = [ch for ch in player.room.characters if ch != player and hasattr(ch, 'is_fighting') and ch.is_fighting]
+        if not targets:
+            await player.send(f"{c['yellow']}No targets to cleave.{c['reset']}")
+            return
+        await player.send(f"{c['red']}You swing in a wide arc!{c['reset']}")
+        for t in targets[:3]:
+            await CombatHandler.bonus_attack(player, t)
+
+    @classmethod
+    async def cmd_trip(cls, player: 'Player', args: List[str]):
+        """Trip a target, knocking them down."""
+        c = player.config.COLORS
+        if 'trip' not in player.skills:
+            await player.send(f"{c['red']}You don't know how to trip.{c['reset']}")
+            return
+        if not args:
+            target = player.target if player.target and player.target in player.room.characters else None
+            if not target:
+                await player.send("Trip whom?")
+                return
+        else:
+            target = player.find_target_in_room(' '.join(args).lower())
+        if not target:
+            await player.send(f"{c['red']}They aren't here.{c['reset']}")
+            return
+        import random
+        player.add_wait_state('trip')
+        chance = player.skills.get('trip', 0) + (player.dex - getattr(target, 'dex', 10))
+        if random.randint(1, 100) <= max(5, chance):
+            target.position = 'sitting'
+            await player.send(f"{c['green']}You trip {target.name}!{c['reset']}")
+            await player.room.send_to_room(f"{target.name} is knocked to the ground!", exclude=[player])
+        else:
+            await player.send(f"{c['yellow']}You fail to trip {target.name}.{c['reset']}")
+
+    @classmethod
+    async def cmd_turn_undead(cls, player: 'Player', args: List[str]):
+        """Turn undead creatures with holy power."""
+        c = player.config.COLORS
+        if 'turn_undead' not in player.skills:
+            await player.send(f"{c['red']}You don't know how to turn undead.{c['reset']}")
+            return
+        if not args:
+            target = player.target if player.target and player.target in player.room.characters else None
+            if not target:
+                await player.send("Turn whom?")
+                return
+        else:
+            target = player.find_target_in_room(' '.join(args).lower())
+        if not target:
+            await player.send(f"{c['red']}They aren't here.{c['reset']}")
+            return
+        if 'undead' not in getattr(target, 'flags', set()):
+            await player.send(f"{c['yellow']}{target.name} is not undead.{c['reset']}")
+            return
+        import random
+        chance = player.skills.get('turn_undead', 0) + (player.wis - 10) * 2
+        if random.randint(1, 100) <= max(5, chance):
+            await player.send(f"{c['bright_white']}You turn the undead!{c['reset']}")
+            if hasattr(target, 'flee'):
+                await target.flee()
+        else:
+            await player.send(f"{c['yellow']}Your turning fails.{c['reset']}")
+
+    @classmethod
+    async def cmd_detect_traps(cls, player: 'Player', args: List[str]):
+        """Detect traps or hidden dangers."""
+        c = player.config.COLORS
+        if 'detect_traps' not in player.skills:
+            await player.send(f"{c['red']}You don't know how to detect traps.{c['reset']}")
+            return
+        if not player.room:
+            await player.send("You are nowhere.")
+            return
+        import random
+        roll = random.randint(1, 100)
+        if roll <= player.skills.get('detect_traps', 0):
+            await player.send(f"{c['green']}You carefully scan for traps but find none.{c['reset']}")
+        else:
+            await player.send(f"{c['yellow']}You don't notice anything unusual.{c['reset']}")
+
+    @classmethod
+    async def cmd_intimidate(cls, player: 'Player', args: List[str]):
+        """Intimidate a target, possibly forcing them to flee."""
+        c = player.config.COLORS
+        if 'intimidate' not in player.skills:
+            await player.send(f"{c['red']}You don't know how to intimidate.{c['reset']}")
+            return
+        if not args:
+            target = player.target if player.target and player.target in player.room.characters else None
+            if not target:
+                await player.send("Intimidate whom?")
+                return
+        else:
+            target = player.find_target_in_room(' '.join(args).lower())
+        if not target:
+            await player.send(f"{c['red']}They aren't here.{c['reset']}")
+            return
+        import random
+        chance = player.skills.get('intimidate', 0) + (player.cha - getattr(target, 'cha', 10))
+        if random.randint(1, 100) <= max(5, chance):
+            await player.send(f"{c['green']}You intimidate {target.name}!{c['reset']}")
+            if hasattr(target, 'flee'):
+                await target.flee()
+        else:
+            await player.send(f"{c['yellow']}Your intimidation fails.{c['reset']}")
+
+    @classmethod
+    async def cmd_steal(cls, player: 'Player', args: List[str]):
+        """Attempt to steal gold from a target."""
+        c = player.config.COLORS
+        if 'steal' not in player.skills:
+            await player.send(f"{c['red']}You don't know how to steal.{c['reset']}")
+            return
+        if not args:
+            target = player.target if player.target and player.target in player.room.characters else None
+            if not target:
+                await player.send("Steal from whom?")
+                return
+        else:
+            target = player.find_target_in_room(' '.join(args).lower())
+        if not target:
+            await player.send(f"{c['red']}They aren't here.{c['reset']}")
+            return
+        import random
+        chance = player.skills.get('steal', 0) + (player.dex - getattr(target, 'dex', 10))
+        if random.randint(1, 100) <= max(5, chance):
+            amt = min(getattr(target, 'gold', 0), random.randint(1, 20))
+            if amt > 0:
+                target.gold -= amt
+                player.gold += amt
+                await player.send(f"{c['green']}You steal {amt} gold from {target.name}.{c['reset']}")
+            else:
+                await player.send(f"{c['yellow']}{target.name} has nothing to steal.{c['reset']}")
+        else:
+            await player.send(f"{c['yellow']}You fail to steal from {target.name}.{c['reset']}")
+
+    @classmethod
+    async def cmd_scribe(cls, player: 'Player', args: List[str]):
+        """Scribe a scroll from a known spell. Usage: scribe <spell>"""
+        c = player.config.COLORS
+        if 'scribe' not in player.skills:
+            await player.send(f"{c['red']}You don't know how to scribe.{c['reset']}")
+            return
+        if not args:
+            await player.send("Scribe which spell?")
+            return
+        spell_name = ' '.join(args).lower().replace(' ', '_')
+        if spell_name not in player.spells:
+            await player.send(f"{c['red']}You don't know that spell.{c['reset']}")
+            return
+        from objects import Object
+        scroll = Object(0, player.world)
+        scroll.name = f"scroll of {spell_name.replace('_',' ')}"
+        scroll.short_desc = f"a scroll of {spell_name.replace('_',' ')}"
+        scroll.room_desc = f"A scroll lies here."
+        scroll.description = f"A scroll inscribed with {spell_name.replace('_',' ')}."
+        scroll.item_type = 'scroll'
+        scroll.spell_effects = [spell_name]
+        player.inventory.append(scroll)
+        await player.send(f"{c['green']}You scribe a scroll of {spell_name.replace('_',' ')}.{c['reset']}")
+
+    @classmethod
+    async def cmd_slip(cls, player: 'Player', args: List[str]):
+        """Slip out of combat to a chosen direction. Usage: slip <direction>"""
+        c = player.config.COLORS
+        if 'slip' not in player.skills:
+            await player.send(f"{c['red']}You don't know how to slip away!{c['reset']}")
+            return
+        if not args:
+            await player.send("Slip which direction?")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['yellow']}You aren't fighting anyone.{c['reset']}")
+            return
+        direction = args[0].lower()
+        dir_map = {'n':'north','s':'south','e':'east','w':'west','u':'up','d':'down'}
+        direction = dir_map.get(direction, direction)
+        if player.room and direction not in player.room.exits and direction not in player.config.DIRECTIONS:
+            await player.send("That's not a valid direction.")
+            return
+        from combat import CombatHandler
+        await CombatHandler.attempt_escape(player, direction)
+
+    @classmethod
+    async def cmd_visible(cls, player: 'Player', args: List[str]):
+        """Come out of hiding or stop sneaking."""
+        c = player.config.COLORS
+
+        made_visible = False
+        if 'hidden' in player.flags:
+            player.flags.remove('hidden')
+            made_visible = True
+        if 'sneaking' in player.flags:
+            player.flags.remove('sneaking')
+            made_visible = True
+
+        if made_visible:
+            await player.send(f"{c['yellow']}You step out of the shadows.{c['reset']}")
+            await player.room.send_to_room(
+                f"{player.name} emerges from the shadows.",
+                exclude=[player]
+            )
+        else:
+            await player.send(f"{c['yellow']}You are already visible.{c['reset']}")
+
+    @classmethod
+    async def cmd_cover(cls, player: 'Player', args: List[str]):
+        """Cover your light source. Usage: cover light"""
+        c = player.config.COLORS
+        if not args or args[0].lower() != 'light':
+            await player.send(f"{c['yellow']}Usage: cover light{c['reset']}")
+            return
+        item = player.equipment.get('light') or player.equipment.get('hold')
+        if not item:
+            await player.send(f"{c['yellow']}You're not holding or wearing a light source.{c['reset']}")
+            return
+        item.covered = True
+        await player.send(f"{c['cyan']}You cover your light source, dimming its glow.{c['reset']}")
+
+    @classmethod
+    async def cmd_uncover(cls, player: 'Player', args: List[str]):
+        """Uncover your light source. Usage: uncover light"""
+        c = player.config.COLORS
+        if not args or args[0].lower() != 'light':
+            await player.send(f"{c['yellow']}Usage: uncover light{c['reset']}")
+            return
+        item = player.equipment.get('light') or player.equipment.get('hold')
+        if not item:
+            await player.send(f"{c['yellow']}You're not holding or wearing a light source.{c['reset']}")
+            return
+        item.covered = False
+        await player.send(f"{c['cyan']}You uncover your light source, letting it shine.{c['reset']}")
+
+    @classmethod
+    async def cmd_snuff(cls, player: 'Player', args: List[str]):
+        """Snuff your light source. Usage: snuff light"""
+        c = player.config.COLORS
+        if not args or args[0].lower() != 'light':
+            await player.send(f"{c['yellow']}Usage: snuff light{c['reset']}")
+            return
+        item = player.equipment.get('light') or player.equipment.get('hold')
+        if not item:
+            await player.send(f"{c['yellow']}You're not holding or wearing a light source.{c['reset']}")
+            return
+        if not getattr(item, 'light_lit', True):
+            await player.send(f"{c['yellow']}Your {item.short_desc} is already dark.{c['reset']}")
+            return
+        item.light_lit = False
+        import random
+        snuff_msgs = [
+            f"You cup your hand over the flame and snuff out {item.short_desc}. Darkness creeps closer.",
+            f"With a quick breath, you extinguish {item.short_desc}. The shadows seem to sigh in relief.",
+            f"You pinch the wick of {item.short_desc}, plunging yourself into deeper darkness.",
+            f"The flame of {item.short_desc} gutters and dies at your command.",
+            f"You snuff {item.short_desc}. The darkness eagerly swallows the space where light once was.",
+        ]
+        await player.send(f"{c['bright_black']}{random.choice(snuff_msgs)}{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(
+                f"{c['bright_black']}{player.name} snuffs out their light, and the shadows grow deeper.{c['reset']}",
+                exclude=[player]
+            )
+
+    @classmethod
+    async def cmd_relight(cls, player: 'Player', args: List[str]):
+        """Relight your light source. Usage: relight light"""
+        c = player.config.COLORS
+        if not args or args[0].lower() != 'light':
+            await player.send(f"{c['yellow']}Usage: relight light{c['reset']}")
+            return
+        item = player.equipment.get('light') or player.equipment.get('hold')
+        if not item:
+            await player.send(f"{c['yellow']}You're not holding or wearing a light source.{c['reset']}")
+            return
+        if getattr(item, 'light_lit', False):
+            await player.send(f"{c['yellow']}Your {item.short_desc} is already burning brightly.{c['reset']}")
+            return
+        item.light_lit = True
+        item.covered = False
+        import random
+        light_msgs = [
+            f"You strike a spark and {item.short_desc} flares to life, pushing back the darkness.",
+            f"A warm glow spreads from {item.short_desc} as you coax the flame back to life.",
+            f"Light blooms from {item.short_desc}, banishing the shadows that had crept close.",
+            f"With practiced hands, you relight {item.short_desc}. The darkness retreats grudgingly.",
+            f"The flame of {item.short_desc} dances back into existence, casting dancing shadows on the walls.",
+        ]
+        await player.send(f"{c['bright_yellow']}{random.choice(light_msgs)}{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(
+                f"{c['bright_yellow']}{player.name} relights their {item.short_desc}, and warm light fills the area.{c['reset']}",
+                exclude=[player]
+            )
+
+    @classmethod
+    async def cmd_dual_wield(cls, player: 'Player', args: List[str]):
+        """Wield a weapon in your off-hand (requires dual wield skill). Usage: dual_wield <weapon>"""
+        if not args:
+            await player.send("Dual wield what?")
+            return
+        if 'dual_wield' not in player.skills:
+            await player.send("You don't know how to dual wield.")
+            return
+        item_name = ' '.join(args).lower()
+        for item in player.inventory:
+            if item_name in item.name.lower():
+                if item.item_type != 'weapon':
+                    await player.send(f"You can't wield {item.short_desc}.")
+                    return
+                if player.equipment.get('dual_wield'):
+                    await player.send("You're already dual wielding.")
+                    return
+                name_l = (item.name + ' ' + item.short_desc).lower()
+                allowed_name = any(x in name_l for x in ['dagger', 'knife', 'stiletto', 'short sword', 'shortsword'])
+                if getattr(item, 'weapon_type', '') not in ('pierce', 'stab') and not allowed_name:
+                    await player.send("Off-hand weapons must be daggers, knives, or short swords.")
+                    return
+                player.inventory.remove(item)
+                player.equipment['dual_wield'] = item
+                await player.send(f"You off-hand {item.short_desc}.")
+                await player.room.send_to_room(
+                    f"{player.name} off-hands {item.short_desc}.",
+                    exclude=[player]
+                )
+                return
+        await player.send(f"You don't have '{item_name}'.")
+
+    @classmethod
+    async def cmd_backstab(cls, player: 'Player', args: List[str]):
+        """Attempt to backstab a target (thief/assassin skill)."""
+        c = player.config.COLORS
+
+        if 'backstab' not in player.skills:
+            await player.send(f"{c['red']}You don't know how to backstab!{c['reset']}")
+            return
+
+        if player.is_fighting:
+            await player.send(f"{c['red']}You can't backstab while already fighting!{c['reset']}")
+            return
+
+        # If no args, use current target
+        if not args:
+            if player.target and player.target in player.room.characters:
+                target = player.target
+            else:
+                await player.send("Backstab whom?")
+                if player.target:
+                    await player.send(f"{c['yellow']}(Your target is not here. Use 'target <name>' to set a new target){c['reset']}")
+                return
+        else:
+            # Find target with numbered targeting support
+            target_name = ' '.join(args).lower()
+            target = player.find_target_in_room(target_name)
+
+            if not target:
+                await player.send(f"{c['red']}They aren't here.{c['reset']}")
+                return
+
+        import time, random, asyncio
+        from combat import CombatHandler
+
+        # Cooldown check
+        now = time.time()
+        cooldown_until = getattr(player, 'backstab_cooldown_until', 0)
+        if now < cooldown_until:
+            remaining = int(cooldown_until - now)
+            await player.send(f"{c['yellow']}Backstab is on cooldown ({remaining}s).{c['reset']}")
+            return
+
+        # Wind-up time (1-4s) with spinner
+        windup = random.randint(1, 4)
+        spinner = ['|', '/', '-', '\\']
+        await player.send(f"{c['bright_black']}You size up your target...{c['reset']}")
+        for i in range(windup * 2):  # 0.5s ticks
+            # Abort if target leaves/you fight/move
+            if not player.room or target not in player.room.characters or player.is_fighting:
+                await player.send(f"{c['yellow']}You lose your opening.{c['reset']}")
+                return
+            glyph = spinner[i % 4]
+            await player.send(f"\r{c['bright_black']}Backstab {glyph}{c['reset']}", newline=False)
+            await asyncio.sleep(0.5)
+        await player.send("\r", newline=False)
+
+        # Set cooldown (short)
+        player.backstab_cooldown_until = time.time() + 6
+
+        # Attempt backstab using combat handler logic
+        success = await CombatHandler.do_backstab(player, target)
+
+        # Improve skill on successful backstab
+        if success:
+            await player.improve_skill('backstab', difficulty=6)
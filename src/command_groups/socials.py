@@ -0,0 +1,755 @@
+"""
+Misthollow Social Commands
+=========================
+Social emotes.
+"""
+
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class SocialCommands:
+    """Social commands."""
+
+    @classmethod
+    async def cmd_socials(cls, player: 'Player', args: List[str]):
+        """List all available social commands."""
+        c = player.config.COLORS
+        
+        social_list = sorted(cls.SOCIALS.keys())
+        
+        await player.send(f"{c['cyan']}=== Social Commands ==={c['reset']}")
+        
+        # Display in columns
+        cols = 6
+        for i in range(0, len(social_list), cols):
+            row = social_list[i:i+cols]
+            formatted = '  '.join(f"{s:<12}" for s in row)
+            await player.send(f"{c['white']}{formatted}{c['reset']}")
+        
+        await player.send(f"\n{c['yellow']}Usage: <social> [target]{c['reset']}")
+
+    SOCIALS = {
+        # --- Affection ---
+        'hug': {
+            'no_arg_self': 'You need a hug!',
+            'no_arg_room': '$n looks like $e needs a hug.',
+            'with_arg_self': 'You hug $N warmly.',
+            'with_arg_target': '$n hugs you warmly.',
+            'with_arg_room': '$n hugs $N warmly.',
+            'self_self': 'You hug yourself.',
+            'self_room': '$n hugs $mself.',
+        },
+        'kiss': {
+            'no_arg_self': 'You pucker up, but no one is there.',
+            'no_arg_room': '$n puckers up, looking for someone to kiss.',
+            'with_arg_self': 'You kiss $N tenderly.',
+            'with_arg_target': '$n kisses you tenderly.',
+            'with_arg_room': '$n kisses $N tenderly.',
+            'self_self': 'You kiss your own hand. Classy.',
+            'self_room': '$n kisses $s own hand.',
+        },
+        'cuddle': {
+            'no_arg_self': 'You curl up and cuddle with a pillow.',
+            'no_arg_room': '$n curls up and cuddles with an imaginary pillow.',
+            'with_arg_self': 'You cuddle up to $N.',
+            'with_arg_target': '$n cuddles up to you.',
+            'with_arg_room': '$n cuddles up to $N.',
+            'self_self': 'You wrap your arms around yourself.',
+            'self_room': '$n wraps $s arms around $mself.',
+        },
+        'pat': {
+            'no_arg_self': 'You pat yourself on the back.',
+            'no_arg_room': '$n pats $mself on the back.',
+            'with_arg_self': 'You pat $N on the head.',
+            'with_arg_target': '$n pats you on the head.',
+            'with_arg_room': '$n pats $N on the head.',
+            'self_self': 'You pat yourself on the back.',
+            'self_room': '$n pats $mself on the back.',
+        },
+        'comfort': {
+            'no_arg_self': 'You console yourself.',
+            'no_arg_room': '$n looks like $e needs comfort.',
+            'with_arg_self': 'You comfort $N.',
+            'with_arg_target': '$n comforts you.',
+            'with_arg_room': '$n comforts $N.',
+            'self_self': 'You comfort yourself. There, there.',
+            'self_room': '$n comforts $mself. There, there.',
+        },
+        # --- Greetings ---
+        'wave': {
+            'no_arg_self': 'You wave.',
+            'no_arg_room': '$n waves.',
+            'with_arg_self': 'You wave at $N.',
+            'with_arg_target': '$n waves at you.',
+            'with_arg_room': '$n waves at $N.',
+            'self_self': 'You wave at yourself in a mirror.',
+            'self_room': '$n waves at $mself.',
+        },
+        'bow': {
+            'no_arg_self': 'You bow deeply.',
+            'no_arg_room': '$n bows deeply.',
+            'with_arg_self': 'You bow before $N.',
+            'with_arg_target': '$n bows before you.',
+            'with_arg_room': '$n bows before $N.',
+            'self_self': 'You bow to yourself. How humble.',
+            'self_room': '$n bows to $mself.',
+        },
+        'salute': {
+            'no_arg_self': 'You salute smartly.',
+            'no_arg_room': '$n salutes smartly.',
+            'with_arg_self': 'You salute $N.',
+            'with_arg_target': '$n salutes you.',
+            'with_arg_room': '$n salutes $N.',
+            'self_self': 'You salute yourself in the mirror.',
+            'self_room': '$n salutes $mself.',
+        },
+        'nod': {
+            'no_arg_self': 'You nod solemnly.',
+            'no_arg_room': '$n nods solemnly.',
+            'with_arg_self': 'You nod at $N.',
+            'with_arg_target': '$n nods at you.',
+            'with_arg_room': '$n nods at $N.',
+            'self_self': 'You nod to yourself in agreement.',
+            'self_room': '$n nods to $mself.',
+        },
+        'curtsy': {
+            'no_arg_self': 'You curtsy gracefully.',
+            'no_arg_room': '$n curtsies gracefully.',
+            'with_arg_self': 'You curtsy before $N.',
+            'with_arg_target': '$n curtsies before you.',
+            'with_arg_room': '$n curtsies before $N.',
+            'self_self': 'You curtsy to yourself. How regal.',
+            'self_room': '$n curtsies to $mself.',
+        },
+        'greet': {
+            'no_arg_self': 'You greet everyone cheerfully.',
+            'no_arg_room': '$n greets everyone cheerfully.',
+            'with_arg_self': 'You greet $N cheerfully.',
+            'with_arg_target': '$n greets you cheerfully.',
+            'with_arg_room': '$n greets $N cheerfully.',
+            'self_self': 'You greet yourself. Hello, you!',
+            'self_room': '$n greets $mself.',
+        },
+        # --- Fun ---
+        'dance': {
+            'no_arg_self': 'You dance wildly!',
+            'no_arg_room': '$n dances wildly!',
+            'with_arg_self': 'You dance with $N.',
+            'with_arg_target': '$n dances with you.',
+            'with_arg_room': '$n dances with $N.',
+            'self_self': 'You dance with yourself, spinning in circles.',
+            'self_room': '$n dances with $mself, spinning in circles.',
+        },
+        'laugh': {
+            'no_arg_self': 'You laugh out loud.',
+            'no_arg_room': '$n laughs out loud.',
+            'with_arg_self': 'You laugh at $N.',
+            'with_arg_target': '$n laughs at you.',
+            'with_arg_room': '$n laughs at $N.',
+            'self_self': 'You laugh at yourself.',
+            'self_room': '$n laughs at $mself.',
+        },
+        'giggle': {
+            'no_arg_self': 'You giggle.',
+            'no_arg_room': '$n giggles.',
+            'with_arg_self': 'You giggle at $N.',
+            'with_arg_target': '$n giggles at you.',
+            'with_arg_room': '$n giggles at $N.',
+            'self_self': 'You giggle at yourself.',
+            'self_room': '$n giggles at $mself.',
+        },
+        'cheer': {
+            'no_arg_self': 'You cheer loudly!',
+            'no_arg_room': '$n cheers loudly!',
+            'with_arg_self': 'You cheer for $N!',
+            'with_arg_target': '$n cheers for you!',
+            'with_arg_room': '$n cheers for $N!',
+            'self_self': 'You cheer for yourself!',
+            'self_room': '$n cheers for $mself!',
+        },
+        'clap': {
+            'no_arg_self': 'You clap your hands together.',
+            'no_arg_room': '$n claps $s hands together.',
+            'with_arg_self': 'You clap for $N.',
+            'with_arg_target': '$n claps for you.',
+            'with_arg_room': '$n claps for $N.',
+            'self_self': 'You give yourself a round of applause.',
+            'self_room': '$n gives $mself a round of applause.',
+        },
+        'whistle': {
+            'no_arg_self': 'You whistle a jaunty tune.',
+            'no_arg_room': '$n whistles a jaunty tune.',
+            'with_arg_self': 'You whistle at $N.',
+            'with_arg_target': '$n whistles at you.',
+            'with_arg_room': '$n whistles at $N.',
+            'self_self': 'You whistle to yourself.',
+            'self_room': '$n whistles to $mself.',
+        },
+        'wink': {
+            'no_arg_self': 'You wink suggestively.',
+            'no_arg_room': '$n winks suggestively.',
+            'with_arg_self': 'You wink at $N.',
+            'with_arg_target': '$n winks at you.',
+            'with_arg_room': '$n winks at $N.',
+            'self_self': 'You wink at yourself. Lookin\' good.',
+            'self_room': '$n winks at $mself.',
+        },
+        # --- Rude ---
+        'slap': {
+            'no_arg_self': 'You slap yourself. Ouch!',
+            'no_arg_room': '$n slaps $mself. Ouch!',
+            'with_arg_self': 'You slap $N across the face!',
+            'with_arg_target': '$n slaps you across the face!',
+            'with_arg_room': '$n slaps $N across the face!',
+            'self_self': 'You slap yourself. Ouch!',
+            'self_room': '$n slaps $mself. Ouch!',
+        },
+        'poke': {
+            'no_arg_self': 'You poke yourself in the ribs.',
+            'no_arg_room': '$n pokes $mself in the ribs.',
+            'with_arg_self': 'You poke $N in the ribs.',
+            'with_arg_target': '$n pokes you in the ribs.',
+            'with_arg_room': '$n pokes $N in the ribs.',
+            'self_self': 'You poke yourself in the ribs.',
+            'self_room': '$n pokes $mself in the ribs.',
+        },
+        'bonk': {
+            'no_arg_self': 'You bonk yourself on the head.',
+            'no_arg_room': '$n bonks $mself on the head.',
+            'with_arg_self': 'You bonk $N on the head!',
+            'with_arg_target': '$n bonks you on the head!',
+            'with_arg_room': '$n bonks $N on the head!',
+            'self_self': 'You bonk yourself on the head.',
+            'self_room': '$n bonks $mself on the head.',
+        },
+        'facepalm': {
+            'no_arg_self': 'You facepalm.',
+            'no_arg_room': '$n facepalms.',
+            'with_arg_self': 'You facepalm at $N.',
+            'with_arg_target': '$n facepalms at you.',
+            'with_arg_room': '$n facepalms at $N.',
+            'self_self': 'You facepalm at yourself.',
+            'self_room': '$n facepalms at $mself.',
+        },
+        'shrug': {
+            'no_arg_self': 'You shrug helplessly.',
+            'no_arg_room': '$n shrugs helplessly.',
+            'with_arg_self': 'You shrug at $N.',
+            'with_arg_target': '$n shrugs at you.',
+            'with_arg_room': '$n shrugs at $N.',
+            'self_self': 'You shrug at yourself.',
+            'self_room': '$n shrugs at $mself.',
+        },
+        'eyeroll': {
+            'no_arg_self': 'You roll your eyes.',
+            'no_arg_room': '$n rolls $s eyes.',
+            'with_arg_self': 'You roll your eyes at $N.',
+            'with_arg_target': '$n rolls $s eyes at you.',
+            'with_arg_room': '$n rolls $s eyes at $N.',
+            'self_self': 'You roll your eyes at yourself.',
+            'self_room': '$n rolls $s eyes at $mself.',
+        },
+        'spit': {
+            'no_arg_self': 'You spit on the ground.',
+            'no_arg_room': '$n spits on the ground.',
+            'with_arg_self': 'You spit at $N!',
+            'with_arg_target': '$n spits at you!',
+            'with_arg_room': '$n spits at $N!',
+            'self_self': 'You spit on yourself. Gross.',
+            'self_room': '$n spits on $mself. Gross.',
+        },
+        # --- Expressions ---
+        'cry': {
+            'no_arg_self': 'You cry softly.',
+            'no_arg_room': '$n cries softly.',
+            'with_arg_self': 'You cry on $N\'s shoulder.',
+            'with_arg_target': '$n cries on your shoulder.',
+            'with_arg_room': '$n cries on $N\'s shoulder.',
+            'self_self': 'You cry to yourself.',
+            'self_room': '$n cries to $mself.',
+        },
+        'sigh': {
+            'no_arg_self': 'You sigh loudly.',
+            'no_arg_room': '$n sighs loudly.',
+            'with_arg_self': 'You sigh at $N.',
+            'with_arg_target': '$n sighs at you.',
+            'with_arg_room': '$n sighs at $N.',
+            'self_self': 'You sigh at yourself.',
+            'self_room': '$n sighs at $mself.',
+        },
+        'gasp': {
+            'no_arg_self': 'You gasp in shock!',
+            'no_arg_room': '$n gasps in shock!',
+            'with_arg_self': 'You gasp at $N!',
+            'with_arg_target': '$n gasps at you!',
+            'with_arg_room': '$n gasps at $N!',
+            'self_self': 'You gasp at yourself!',
+            'self_room': '$n gasps at $mself!',
+        },
+        'scream': {
+            'no_arg_self': 'You scream at the top of your lungs!',
+            'no_arg_room': '$n screams at the top of $s lungs!',
+            'with_arg_self': 'You scream at $N!',
+            'with_arg_target': '$n screams at you!',
+            'with_arg_room': '$n screams at $N!',
+            'self_self': 'You scream at yourself!',
+            'self_room': '$n screams at $mself!',
+        },
+        'yawn': {
+            'no_arg_self': 'You yawn sleepily.',
+            'no_arg_room': '$n yawns sleepily.',
+            'with_arg_self': 'You yawn in $N\'s face.',
+            'with_arg_target': '$n yawns in your face.',
+            'with_arg_room': '$n yawns in $N\'s face.',
+            'self_self': 'You yawn at yourself.',
+            'self_room': '$n yawns at $mself.',
+        },
+        'stretch': {
+            'no_arg_self': 'You stretch your tired muscles.',
+            'no_arg_room': '$n stretches $s tired muscles.',
+            'with_arg_self': 'You stretch languidly in front of $N.',
+            'with_arg_target': '$n stretches languidly in front of you.',
+            'with_arg_room': '$n stretches languidly in front of $N.',
+            'self_self': 'You stretch your tired muscles.',
+            'self_room': '$n stretches $s tired muscles.',
+        },
+        'flex': {
+            'no_arg_self': 'You flex your muscles impressively!',
+            'no_arg_room': '$n flexes $s muscles impressively!',
+            'with_arg_self': 'You flex your muscles at $N.',
+            'with_arg_target': '$n flexes $s muscles at you.',
+            'with_arg_room': '$n flexes $s muscles at $N.',
+            'self_self': 'You flex at yourself admiringly.',
+            'self_room': '$n flexes at $mself admiringly.',
+        },
+        'cringe': {
+            'no_arg_self': 'You cringe in terror.',
+            'no_arg_room': '$n cringes in terror.',
+            'with_arg_self': 'You cringe away from $N.',
+            'with_arg_target': '$n cringes away from you.',
+            'with_arg_room': '$n cringes away from $N.',
+            'self_self': 'You cringe at yourself.',
+            'self_room': '$n cringes at $mself.',
+        },
+        # --- Actions ---
+        'sit': {
+            'no_arg_self': 'You sit down.',
+            'no_arg_room': '$n sits down.',
+            'with_arg_self': 'You sit down next to $N.',
+            'with_arg_target': '$n sits down next to you.',
+            'with_arg_room': '$n sits down next to $N.',
+            'self_self': 'You sit down.',
+            'self_room': '$n sits down.',
+        },
+        'kneel': {
+            'no_arg_self': 'You kneel on the ground.',
+            'no_arg_room': '$n kneels on the ground.',
+            'with_arg_self': 'You kneel before $N.',
+            'with_arg_target': '$n kneels before you.',
+            'with_arg_room': '$n kneels before $N.',
+            'self_self': 'You kneel on the ground.',
+            'self_room': '$n kneels on the ground.',
+        },
+        'meditate': {
+            'no_arg_self': 'You close your eyes and meditate.',
+            'no_arg_room': '$n closes $s eyes and begins to meditate.',
+            'with_arg_self': 'You meditate alongside $N.',
+            'with_arg_target': '$n meditates alongside you.',
+            'with_arg_room': '$n meditates alongside $N.',
+            'self_self': 'You close your eyes and meditate.',
+            'self_room': '$n closes $s eyes and begins to meditate.',
+        },
+        'pray': {
+            'no_arg_self': 'You pray to the gods for guidance.',
+            'no_arg_room': '$n prays to the gods for guidance.',
+            'with_arg_self': 'You pray for $N\'s well-being.',
+            'with_arg_target': '$n prays for your well-being.',
+            'with_arg_room': '$n prays for $N\'s well-being.',
+            'self_self': 'You pray for yourself.',
+            'self_room': '$n prays for $mself.',
+        },
+        # --- Combat Flavor ---
+        'battlecry': {
+            'no_arg_self': 'You let out a mighty battle cry!',
+            'no_arg_room': '$n lets out a mighty battle cry!',
+            'with_arg_self': 'You let out a battle cry at $N!',
+            'with_arg_target': '$n lets out a battle cry at you!',
+            'with_arg_room': '$n lets out a battle cry at $N!',
+            'self_self': 'You roar at yourself. Intimidating.',
+            'self_room': '$n roars at $mself.',
+        },
+        'taunt': {
+            'no_arg_self': 'You taunt your enemies!',
+            'no_arg_room': '$n taunts $s enemies!',
+            'with_arg_self': 'You taunt $N mercilessly!',
+            'with_arg_target': '$n taunts you mercilessly!',
+            'with_arg_room': '$n taunts $N mercilessly!',
+            'self_self': 'You taunt yourself. That\'s... sad.',
+            'self_room': '$n taunts $mself.',
+        },
+        'challenge_emote': {
+            'no_arg_self': 'You issue a challenge to all comers!',
+            'no_arg_room': '$n issues a challenge to all comers!',
+            'with_arg_self': 'You challenge $N to single combat!',
+            'with_arg_target': '$n challenges you to single combat!',
+            'with_arg_room': '$n challenges $N to single combat!',
+            'self_self': 'You challenge yourself. Inner demons, beware.',
+            'self_room': '$n challenges $mself.',
+        },
+        'surrender': {
+            'no_arg_self': 'You raise your hands in surrender.',
+            'no_arg_room': '$n raises $s hands in surrender.',
+            'with_arg_self': 'You surrender to $N.',
+            'with_arg_target': '$n surrenders to you.',
+            'with_arg_room': '$n surrenders to $N.',
+            'self_self': 'You surrender to yourself.',
+            'self_room': '$n surrenders to $mself.',
+        },
+        # --- Existing socials kept ---
+        'smile': {
+            'no_arg_self': 'You smile happily.',
+            'no_arg_room': '$n smiles happily.',
+            'with_arg_self': 'You smile at $N.',
+            'with_arg_target': '$n smiles at you.',
+            'with_arg_room': '$n smiles at $N.',
+            'self_self': 'You smile at yourself.',
+            'self_room': '$n smiles at $mself.',
+        },
+        'ponder': {
+            'no_arg_self': 'You ponder the situation.',
+            'no_arg_room': '$n ponders the situation.',
+            'with_arg_self': 'You ponder $N thoughtfully.',
+            'with_arg_target': '$n ponders you thoughtfully.',
+            'with_arg_room': '$n ponders $N thoughtfully.',
+            'self_self': 'You ponder yourself thoughtfully.',
+            'self_room': '$n ponders $mself thoughtfully.',
+        },
+        'grin': {
+            'no_arg_self': 'You grin evilly.',
+            'no_arg_room': '$n grins evilly.',
+            'with_arg_self': 'You grin evilly at $N.',
+            'with_arg_target': '$n grins evilly at you.',
+            'with_arg_room': '$n grins evilly at $N.',
+            'self_self': 'You grin at yourself evilly.',
+            'self_room': '$n grins at $mself evilly.',
+        },
+        'snicker': {
+            'no_arg_self': 'You snicker.',
+            'no_arg_room': '$n snickers.',
+            'with_arg_self': 'You snicker at $N.',
+            'with_arg_target': '$n snickers at you.',
+            'with_arg_room': '$n snickers at $N.',
+            'self_self': 'You snicker at yourself.',
+            'self_room': '$n snickers at $mself.',
+        },
+        'thank': {
+            'no_arg_self': 'You thank everyone.',
+            'no_arg_room': '$n thanks everyone.',
+            'with_arg_self': 'You thank $N heartily.',
+            'with_arg_target': '$n thanks you heartily.',
+            'with_arg_room': '$n thanks $N heartily.',
+            'self_self': 'You thank yourself. You deserve it.',
+            'self_room': '$n thanks $mself.',
+        },
+        'glare': {
+            'no_arg_self': 'You glare at nothing in particular.',
+            'no_arg_room': '$n glares around $mself.',
+            'with_arg_self': 'You glare icily at $N.',
+            'with_arg_target': '$n glares icily at you.',
+            'with_arg_room': '$n glares at $N.',
+            'self_self': 'You glare at yourself.',
+            'self_room': '$n glares at $mself.',
+        },
+        'grumble': {
+            'no_arg_self': 'You grumble.',
+            'no_arg_room': '$n grumbles.',
+            'with_arg_self': 'You grumble at $N.',
+            'with_arg_target': '$n grumbles at you.',
+            'with_arg_room': '$n grumbles at $N.',
+            'self_self': 'You grumble at yourself.',
+            'self_room': '$n grumbles at $mself.',
+        },
+        'cackle': {
+            'no_arg_self': 'You cackle gleefully!',
+            'no_arg_room': '$n cackles gleefully!',
+            'with_arg_self': 'You cackle at $N.',
+            'with_arg_target': '$n cackles at you.',
+            'with_arg_room': '$n cackles at $N.',
+            'self_self': 'You cackle at yourself.',
+            'self_room': '$n cackles at $mself.',
+        },
+        'tickle': {
+            'no_arg_self': 'You tickle yourself. How silly.',
+            'no_arg_room': '$n tickles $mself. How silly.',
+            'with_arg_self': 'You tickle $N.',
+            'with_arg_target': '$n tickles you. Hee hee!',
+            'with_arg_room': '$n tickles $N.',
+            'self_self': 'You tickle yourself. How silly.',
+            'self_room': '$n tickles $mself. How silly.',
+        },
+        'apologize': {
+            'no_arg_self': 'You apologize for your behavior.',
+            'no_arg_room': '$n apologizes for $s behavior.',
+            'with_arg_self': 'You apologize to $N profusely.',
+            'with_arg_target': '$n apologizes to you profusely.',
+            'with_arg_room': '$n apologizes to $N profusely.',
+            'self_self': 'You apologize to yourself.',
+            'self_room': '$n apologizes to $mself.',
+        },
+        'blush': {
+            'no_arg_self': 'You blush.',
+            'no_arg_room': '$n blushes.',
+            'with_arg_self': 'You blush at $N.',
+            'with_arg_target': '$n blushes at you.',
+            'with_arg_room': '$n blushes at $N.',
+            'self_self': 'You blush at yourself.',
+            'self_room': '$n blushes at $mself.',
+        },
+    }
+
+    @classmethod
+    def _social_sub(cls, msg: str, player, target=None):
+        """Substitute social message tokens ($n, $N, $e, $s, $m, $mself)."""
+        sex = getattr(player, 'sex', 'neutral')
+        he = 'he' if sex == 'male' else ('she' if sex == 'female' else 'they')
+        his = 'his' if sex == 'male' else ('her' if sex == 'female' else 'their')
+        him = 'him' if sex == 'male' else ('her' if sex == 'female' else 'them')
+        himself = 'himself' if sex == 'male' else ('herself' if sex == 'female' else 'themselves')
+        msg = msg.replace('$n', player.name)
+        msg = msg.replace('$e', he)
+        msg = msg.replace('$mself', himself)
+        msg = msg.replace('$s', his)
+        msg = msg.replace('$m', him)
+        if target:
+            msg = msg.replace('$N', target.name)
+        return msg
+
+    @classmethod
+    async def cmd_social(cls, player: 'Player', social_name: str, args: List[str]):
+        """Process a social command."""
+        if social_name not in cls.SOCIALS:
+            return False
+
+        c = player.config.COLORS
+        social = cls.SOCIALS[social_name]
+        from social import is_ignored
+
+        # No target - social to room
+        if not args:
+            await player.send(f"{c['cyan']}{social['no_arg_self']}{c['reset']}")
+            msg = cls._social_sub(social['no_arg_room'], player)
+            if player.room:
+                for char in player.room.characters:
+                    if char != player and hasattr(char, 'send') and not is_ignored(char, player.name):
+                        await char.send(f"{c['cyan']}{msg}{c['reset']}")
+        else:
+            # Find target
+            target_name = ' '.join(args).lower()
+            target = None
+
+            for char in player.room.characters:
+                if char.name.lower().startswith(target_name):
+                    target = char
+                    break
+
+            if not target:
+                await player.send(f"{c['red']}Who do you want to {social_name}?{c['reset']}")
+                return True
+
+            # Self-target
+            if target == player:
+                self_msg = social.get('self_self', social['no_arg_self'])
+                await player.send(f"{c['cyan']}{self_msg}{c['reset']}")
+                room_msg = cls._social_sub(social.get('self_room', social['no_arg_room']), player)
+                if player.room:
+                    for char in player.room.characters:
+                        if char != player and hasattr(char, 'send') and not is_ignored(char, player.name):
+                            await char.send(f"{c['cyan']}{room_msg}{c['reset']}")
+                return True
+
+            # Check ignore list on target
+            if hasattr(target, 'send') and is_ignored(target, player.name):
+                await player.send(f"{c['red']}{target.name} is ignoring you.{c['reset']}")
+                return True
+
+            # Message to self
+            msg_self = cls._social_sub(social['with_arg_self'], player, target)
+            await player.send(f"{c['cyan']}{msg_self}{c['reset']}")
+
+            # Message to target
+            if hasattr(target, 'send'):
+                msg_target = cls._social_sub(social['with_arg_target'], player, target)
+                await target.send(f"{c['cyan']}{msg_target}{c['reset']}")
+
+            # Message to room
+            msg_room = cls._social_sub(social['with_arg_room'], player, target)
+            if player.room:
+                for char in player.room.characters:
+                    if char not in (player, target) and hasattr(char, 'send') and not is_ignored(char, player.name):
+                        await char.send(f"{c['cyan']}{msg_room}{c['reset']}")
+
+        return True
+
+    # Generate individual social command methods for every social in SOCIALS dict.
+    # Each is a thin wrapper around cmd_social for command dispatch.
+
+    @classmethod
+    async def cmd_smile(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'smile', args)
+    @classmethod
+    async def cmd_laugh(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'laugh', args)
+    @classmethod
+    async def cmd_nod(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'nod', args)
+    @classmethod
+    async def cmd_bow(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'bow', args)
+    @classmethod
+    async def cmd_wave(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'wave', args)
+    @classmethod
+    async def cmd_hug(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'hug', args)
+    @classmethod
+    async def cmd_kiss(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'kiss', args)
+    @classmethod
+    async def cmd_cuddle(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'cuddle', args)
+    @classmethod
+    async def cmd_pat(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'pat', args)
+    @classmethod
+    async def cmd_comfort(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'comfort', args)
+    @classmethod
+    async def cmd_curtsy(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'curtsy', args)
+    @classmethod
+    async def cmd_greet(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'greet', args)
+    @classmethod
+    async def cmd_salute(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'salute', args)
+    @classmethod
+    async def cmd_dance(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'dance', args)
+    @classmethod
+    async def cmd_giggle(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'giggle', args)
+    @classmethod
+    async def cmd_cheer(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'cheer', args)
+    @classmethod
+    async def cmd_clap(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'clap', args)
+    @classmethod
+    async def cmd_whistle(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'whistle', args)
+    @classmethod
+    async def cmd_wink(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'wink', args)
+    @classmethod
+    async def cmd_slap(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'slap', args)
+    @classmethod
+    async def cmd_poke(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'poke', args)
+    @classmethod
+    async def cmd_bonk(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'bonk', args)
+    @classmethod
+    async def cmd_facepalm(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'facepalm', args)
+    @classmethod
+    async def cmd_shrug(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'shrug', args)
+    @classmethod
+    async def cmd_eyeroll(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'eyeroll', args)
+    @classmethod
+    async def cmd_spit(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'spit', args)
+    @classmethod
+    async def cmd_cry(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'cry', args)
+    @classmethod
+    async def cmd_sigh(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'sigh', args)
+    @classmethod
+    async def cmd_gasp(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'gasp', args)
+    @classmethod
+    async def cmd_scream(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'scream', args)
+    @classmethod
+    async def cmd_yawn(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'yawn', args)
+    @classmethod
+    async def cmd_stretch(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'stretch', args)
+    @classmethod
+    async def cmd_flex(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'flex', args)
+    @classmethod
+    async def cmd_cringe(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'cringe', args)
+    @classmethod
+    async def cmd_kneel(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'kneel', args)
+    @classmethod
+    async def cmd_meditate(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'meditate', args)
+    @classmethod
+    async def cmd_pray(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'pray', args)
+    @classmethod
+    async def cmd_battlecry(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'battlecry', args)
+    @classmethod
+    async def cmd_taunt(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'taunt', args)
+    @classmethod
+    async def cmd_challenge_emote(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'challenge_emote', args)
+    @classmethod
+    async def cmd_surrender(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'surrender', args)
+    @classmethod
+    async def cmd_grin(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'grin', args)
+    @classmethod
+    async def cmd_snicker(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'snicker', args)
+    @classmethod
+    async def cmd_thank(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'thank', args)
+    @classmethod
+    async def cmd_glare(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'glare', args)
+    @classmethod
+    async def cmd_grumble(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'grumble', args)
+    @classmethod
+    async def cmd_cackle(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'cackle', args)
+    @classmethod
+    async def cmd_tickle(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'tickle', args)
+    @classmethod
+    async def cmd_apologize(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'apologize', args)
+    @classmethod
+    async def cmd_blush(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'blush', args)
+    @classmethod
+    async def cmd_ponder(cls, player: 'Player', args: List[str]):
+        await cls.cmd_social(player, 'ponder', args)
+    @classmethod
+    async def cmd_sit_social(cls, player: 'Player', args: List[str]):
+        """Sit social emote (use 'sit' for the position command)."""
+        await cls.cmd_social(player, 'sit', args)
@@ -0,0 +1,1922 @@
+"""
+Misthollow Talent Commands
+=========================
+Talent and level 31-60 class abilities.
+"""
+
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class TalentCommands:
+    """Talent commands."""
+
+    @classmethod
+    async def cmd_shield_bash(cls, player: 'Player', args: List[str]):
+        """Stun and interrupt with your shield."""
+        c = player.config.COLORS
+        if 'shield_bash' not in player.skills:
+            await player.send(f"{c['red']}You don't know Shield Bash.{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['yellow']}You must be fighting to Shield Bash.{c['reset']}")
+            return
+        shield = player.equipment.get('shield') if hasattr(player, 'equipment') else None
+        if not shield:
+            await player.send(f"{c['red']}You need a shield to use Shield Bash.{c['reset']}")
+            return
+        target = player.fighting
+        from affects import AffectManager
+        import random
+        damage = random.randint(5, 12) + player.level
+        await player.send(f"{c['bright_green']}You smash {target.name} with your shield! [{damage}]{c['reset']}")
+        await target.take_damage(damage, player)
+        # Stun for 1 round
+        AffectManager.apply_affect(target, {
+            'name': 'shield_bash',
+            'type': AffectManager.TYPE_FLAG,
+            'applies_to': 'stunned',
+            'value': 1,
+            'duration': 2,
+            'caster_level': player.level
+        })
+
+    @classmethod
+    async def cmd_shield_wall(cls, player: 'Player', args: List[str]):
+        """Shield Wall — Chain ability (🟡). Reduce damage taken by 50% for 10s. 120s CD."""
+        c = player.config.COLORS
+        await player.send(f"{c['yellow']}Shield Wall has been replaced by the Warrior Doctrine system.{c['reset']}")
+        await player.send(f"{c['white']}Use strike, bash, cleave, charge, rally, execute. Type 'doctrine' for details.{c['reset']}")
+
+    @classmethod
+    async def cmd_avatar_of_war(cls, player: 'Player', args: List[str]):
+        """Massive offensive burst."""
+        c = player.config.COLORS
+        if 'avatar_of_war' not in player.skills:
+            await player.send(f"{c['red']}You don't know Avatar of War.{c['reset']}")
+            return
+        from affects import AffectManager
+        AffectManager.apply_affect(player, {'name': 'avatar_of_war', 'type': AffectManager.TYPE_MODIFY_STAT,
+                                            'applies_to': 'damroll', 'value': 8, 'duration': 6, 'caster_level': player.level})
+        AffectManager.apply_affect(player, {'name': 'avatar_of_war', 'type': AffectManager.TYPE_MODIFY_STAT,
+                                            'applies_to': 'hitroll', 'value': 6, 'duration': 6, 'caster_level': player.level})
+        AffectManager.apply_affect(player, {'name': 'avatar_of_war', 'type': AffectManager.TYPE_FLAG,
+                                            'applies_to': 'haste', 'value': 1, 'duration': 6, 'caster_level': player.level})
+        await player.send(f"{c['bright_red']}You become an Avatar of War!{c['reset']}")
+
+    @classmethod
+    async def cmd_mortal_strike(cls, player: 'Player', args: List[str]):
+        """Deals 2.5x weapon damage + reduces target healing by 50%. Costs 40 Rage. 12s CD."""
+        c = player.config.COLORS
+        import time, random
+
+        if player.char_class.lower() != 'warrior':
+            await player.send(f"{c['red']}Only warriors can use Mortal Strike!{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['yellow']}You must be fighting to use Mortal Strike.{c['reset']}")
+            return
+
+        now = time.time()
+        cd = getattr(player, 'mortal_strike_cooldown', 0)
+        if now < cd:
+            await player.send(f"{c['yellow']}Mortal Strike on cooldown ({int(cd - now)}s).{c['reset']}")
+            return
+        if player.rage < 40:
+            await player.send(f"{c['red']}You need 40 Rage! (Current: {player.rage}){c['reset']}")
+            return
+
+        target = player.fighting
+        player.rage -= 40
+        player.mortal_strike_cooldown = now + 12
+
+        weapon = player.equipment.get('wield')
+        if weapon and hasattr(weapon, 'damage_dice'):
+            from combat import CombatHandler
+            base_damage = CombatHandler.roll_dice(weapon.damage_dice)
+        else:
+            base_damage = random.randint(2, 8)
+
+        multiplier = 2.5
+        try:
+            from talents import TalentManager
+            multiplier += TalentManager.get_talent_rank(player, 'mortal_strike_mastery') * 0.03 * 2.5
+        except Exception:
+            pass
+
+        damage = int(base_damage * multiplier) + player.get_damage_bonus() * 2
+        damage = max(1, damage)
+
+        # Apply healing reduction debuff
+        from affects import AffectManager
+        AffectManager.apply_affect(target, {
+            'name': 'mortal_wound',
+            'type': AffectManager.TYPE_MODIFY_STAT,
+            'applies_to': 'heal_reduction',
+            'value': 50,
+            'duration': 5,
+            'caster_level': player.level
+        })
+
+        await player.send(f"{c['bright_red']}You cleave {target.name} with a MORTAL STRIKE! [{damage}]{c['reset']}")
+        await player.send(f"{c['yellow']}{target.name}'s healing is reduced by 50%!{c['reset']}")
+        if hasattr(target, 'send'):
+            await target.send(f"{c['bright_red']}{player.name} strikes you with a mortal wound! [{damage}]{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name} delivers a mortal strike to {target.name}!", exclude=[player, target])
+
+        killed = await target.take_damage(damage, player)
+        if killed:
+            from combat import CombatHandler
+            await CombatHandler.handle_death(player, target)
+
+    @classmethod
+    async def cmd_bladestorm(cls, player: 'Player', args: List[str]):
+        """Bladestorm — Finisher (🔴). AoE. Hit all enemies for weapon damage × chain count. 60s CD."""
+        c = player.config.COLORS
+        await player.send(f"{c['yellow']}Bladestorm has been replaced by the Warrior Doctrine system.{c['reset']}")
+        await player.send(f"{c['white']}Use strike, bash, cleave, charge, rally, execute. Type 'doctrine' for details.{c['reset']}")
+
+    @classmethod
+    async def cmd_rend(cls, player: 'Player', args: List[str]):
+        """Rend — Chain ability (🟡). Apply bleed DoT. 8s CD."""
+        c = player.config.COLORS
+        await player.send(f"{c['yellow']}Rend has been replaced by the Warrior Doctrine system.{c['reset']}")
+        await player.send(f"{c['white']}Use strike, bash, cleave, charge, rally, execute. Type 'doctrine' for details.{c['reset']}")
+
+    @classmethod
+    async def cmd_sunder_armor(cls, player: 'Player', args: List[str]):
+        """Reduce target armor temporarily."""
+        c = player.config.COLORS
+        if 'sunder_armor' not in player.skills:
+            await player.send(f"{c['red']}You don't know Sunder Armor.{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['yellow']}You must be fighting to Sunder.{c['reset']}")
+            return
+        target = player.fighting
+        from affects import AffectManager
+        AffectManager.apply_affect(target, {
+            'name': 'sunder_armor',
+            'type': AffectManager.TYPE_MODIFY_STAT,
+            'applies_to': 'armor_class',
+            'value': 20,
+            'duration': 4,
+            'caster_level': player.level
+        })
+        await player.send(f"{c['yellow']}You sunder {target.name}'s armor!{c['reset']}")
+
+    @classmethod
+    async def cmd_charge(cls, player: 'Player', args: List[str]):
+        """Charge — Rush to target for warriors."""
+        c = player.config.COLORS
+        if player.char_class.lower() != 'warrior':
+            await player.send(f"{c['red']}Only warriors can charge!{c['reset']}")
+            return
+        from warrior_abilities import do_charge
+        await do_charge(player, args)
+
+    @classmethod
+    async def cmd_shield_slam(cls, player: 'Player', args: List[str]):
+        """Shield Slam — Opener (🟢). Requires shield. Deals weapon damage + shield armor. 10s CD."""
+        c = player.config.COLORS
+        await player.send(f"{c['yellow']}Shield Slam has been replaced by the Warrior Doctrine system.{c['reset']}")
+        await player.send(f"{c['white']}Use strike, bash, cleave, charge, rally, execute. Type 'doctrine' for details.{c['reset']}")
+
+    @classmethod
+    async def cmd_hamstring(cls, player: 'Player', args: List[str]):
+        """Hamstring — Chain ability (🟡). Slow target + 0.75x weapon damage. 6s CD."""
+        c = player.config.COLORS
+        await player.send(f"{c['yellow']}Hamstring has been replaced by the Warrior Doctrine system.{c['reset']}")
+        await player.send(f"{c['white']}Use strike, bash, cleave, charge, rally, execute. Type 'doctrine' for details.{c['reset']}")
+
+    @classmethod
+    async def cmd_devastating_blow(cls, player: 'Player', args: List[str]):
+        """Devastating Blow — Finisher (🔴). 3x weapon damage + stun. At chain 4+: 4x + stun 2 rounds. 20s CD."""
+        c = player.config.COLORS
+        await player.send(f"{c['yellow']}Devastating Blow has been replaced by the Warrior Doctrine system.{c['reset']}")
+        await player.send(f"{c['white']}Use strike, bash, cleave, charge, rally, execute. Type 'doctrine' for details.{c['reset']}")
+
+    @classmethod
+    async def cmd_overpower(cls, player: 'Player', args: List[str]):
+        """Quick counterattack."""
+        c = player.config.COLORS
+        if 'overpower' not in player.skills:
+            await player.send(f"{c['red']}You don't know Overpower.{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['yellow']}You must be fighting to Overpower.{c['reset']}")
+            return
+        target = player.fighting
+        import random
+        damage = random.randint(6, 12) + player.level // 2
+        await player.send(f"{c['bright_yellow']}You overpower {target.name}! [{damage}]{c['reset']}")
+        await target.take_damage(damage, player)
+
+    # ----- Thief talent skills -----
+    @classmethod
+    async def cmd_cold_blood(cls, player: 'Player', args: List[str]):
+        """Guarantee your next attack crits."""
+        c = player.config.COLORS
+        if 'cold_blood' not in player.skills:
+            await player.send(f"{c['red']}You don't know Cold Blood.{c['reset']}")
+            return
+        player.cold_blood = True
+        await player.send(f"{c['cyan']}Your next attack will critically strike.{c['reset']}")
+
+    @classmethod
+    async def cmd_mutilate(cls, player: 'Player', args: List[str]):
+        """Dual strike that builds combo points."""
+        c = player.config.COLORS
+        if 'mutilate' not in player.skills:
+            await player.send(f"{c['red']}You don't know Mutilate.{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['yellow']}You must be fighting to Mutilate.{c['reset']}")
+            return
+        target = player.fighting
+        import random
+        damage = random.randint(8, 14) + player.level
+        await player.send(f"{c['bright_red']}You mutilate {target.name}! [{damage}]{c['reset']}")
+        await target.take_damage(damage, player)
+        if hasattr(player, 'combo_points'):
+            player.combo_points = min(5, player.combo_points + 2)
+            player.combo_target = target
+
+    @classmethod
+    async def cmd_vendetta(cls, player: 'Player', args: List[str]):
+        """Mark target to take extra damage from you."""
+        c = player.config.COLORS
+        # Assassins with vendetta_assassin get the upgraded version
+        if 'vendetta_assassin' in player.skills:
+            await cls.cmd_vendetta_assassin(player, args)
+            return
+        if 'vendetta' not in player.skills:
+            await player.send(f"{c['red']}You don't know Vendetta.{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['yellow']}You must be fighting to Vendetta.{c['reset']}")
+            return
+        target = player.fighting
+        target.vendetta_from = player
+        target.vendetta_ticks = 6
+        await player.send(f"{c['magenta']}You mark {target.name} for Vendetta!{c['reset']}")
+
+    @classmethod
+    async def cmd_adrenaline_rush(cls, player: 'Player', args: List[str]):
+        """Burst of speed."""
+        c = player.config.COLORS
+        if 'adrenaline_rush' not in player.skills:
+            await player.send(f"{c['red']}You don't know Adrenaline Rush.{c['reset']}")
+            return
+        from affects import AffectManager
+        AffectManager.apply_affect(player, {'name': 'adrenaline_rush', 'type': AffectManager.TYPE_FLAG,
+                                            'applies_to': 'haste', 'value': 1, 'duration': 6, 'caster_level': player.level})
+        await player.send(f"{c['bright_green']}Adrenaline surges through you!{c['reset']}")
+
+    @classmethod
+    async def cmd_killing_spree(cls, player: 'Player', args: List[str]):
+        """Rapidly strike multiple enemies."""
+        c = player.config.COLORS
+        if 'killing_spree' not in player.skills:
+            await player.send(f"{c['red']}You don't know Killing Spree.{c['reset']}")
+            return
+        from mobs import Mobile
+        import random
+        targets = [m for m in player.room.characters if isinstance(m, Mobile) and m.hp > 0]
+        if not targets:
+            await player.send(f"{c['yellow']}No enemies to strike.{c['reset']}")
+            return
+        await player.send(f"{c['bright_red']}You go on a Killing Spree!{c['reset']}")
+        for target in targets[:4]:
+            dmg = random.randint(6, 10) + player.level
+            await target.take_damage(dmg, player)
+            await player.send(f"{c['red']}  → {target.name} takes {dmg} damage!{c['reset']}")
+
+    @classmethod
+    async def cmd_preparation(cls, player: 'Player', args: List[str]):
+        """Reset major cooldowns."""
+        c = player.config.COLORS
+        if 'preparation' not in player.skills:
+            await player.send(f"{c['red']}You don't know Preparation.{c['reset']}")
+            return
+        # simple reset: clear last skill timestamps if present
+        for attr in ['last_shadowstep', 'last_ambush', 'last_backstab']:
+            if hasattr(player, attr):
+                setattr(player, attr, 0)
+        await player.send(f"{c['cyan']}You feel prepared for another strike.{c['reset']}")
+
+    @classmethod
+    async def cmd_shadowstep_talent(cls, player: 'Player', args: List[str]):
+        """Step through shadows behind target (talent version, thief)."""
+        c = player.config.COLORS
+        if 'shadowstep' not in player.skills:
+            await player.send(f"{c['red']}You don't know Shadowstep.{c['reset']}")
+            return
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send(f"{c['yellow']}Shadowstep whom?{c['reset']}")
+                return
+        target = player.find_target_in_room(' '.join(args))
+        if not target:
+            await player.send(f"{c['red']}They aren't here.{c['reset']}")
+            return
+        player.flags.add('hidden')
+        await player.send(f"{c['magenta']}You blur through shadows behind {target.name}.{c['reset']}")
+
+    @classmethod
+    async def cmd_shadow_dance(cls, player: 'Player', args: List[str]):
+        """Use stealth abilities in combat for a short time."""
+        c = player.config.COLORS
+        if 'shadow_dance' not in player.skills:
+            await player.send(f"{c['red']}You don't know Shadow Dance.{c['reset']}")
+            return
+        player.shadow_dance_ticks = 6
+        await player.send(f"{c['magenta']}You slip into a Shadow Dance.{c['reset']}")
+
+    @classmethod
+    async def cmd_blade_dance(cls, player: 'Player', args: List[str]):
+        """Spin striking nearby enemies."""
+        c = player.config.COLORS
+        if 'blade_dance' not in player.skills:
+            await player.send(f"{c['red']}You don't know Blade Dance.{c['reset']}")
+            return
+        from mobs import Mobile
+        import random
+        targets = [m for m in player.room.characters if isinstance(m, Mobile) and m.hp > 0]
+        if not targets:
+            await player.send(f"{c['yellow']}No enemies to strike.{c['reset']}")
+            return
+        await player.send(f"{c['bright_red']}You whirl in a Blade Dance!{c['reset']}")
+        for target in targets:
+            dmg = random.randint(4, 8) + player.level // 2
+            await target.take_damage(dmg, player)
+
+    @classmethod
+    async def cmd_slip_away(cls, player: 'Player', args: List[str]):
+        """Enter stealth after a dodge."""
+        c = player.config.COLORS
+        if 'slip_away' not in player.skills:
+            await player.send(f"{c['red']}You don't know Slip Away.{c['reset']}")
+            return
+        player.flags.add('hidden')
+        await player.send(f"{c['cyan']}You slip into the shadows.{c['reset']}")
+
+    # ----- Ranger talent skills -----
+    @classmethod
+    async def cmd_bestial_wrath(cls, player: 'Player', args: List[str]):
+        """Enrage your pet."""
+        c = player.config.COLORS
+        if 'bestial_wrath' not in player.skills:
+            await player.send(f"{c['red']}You don't know Bestial Wrath.{c['reset']}")
+            return
+        from pets import PetManager
+        pets = PetManager.get_player_pets(player)
+        if not pets:
+            await player.send(f"{c['yellow']}You have no pet to empower.{c['reset']}")
+            return
+        for pet in pets:
+            pet.bestial_wrath = 5
+        await player.send(f"{c['bright_green']}Your pet enters a bestial rage!{c['reset']}")
+
+    @classmethod
+    async def cmd_stampede(cls, player: 'Player', args: List[str]):
+        """Command all pets to attack."""
+        c = player.config.COLORS
+        if 'stampede' not in player.skills:
+            await player.send(f"{c['red']}You don't know Stampede.{c['reset']}")
+            return
+        from pets import PetManager
+        pets = PetManager.get_player_pets(player)
+        if not pets:
+            await player.send(f"{c['yellow']}You have no pets to stampede.{c['reset']}")
+            return
+        await player.send(f"{c['bright_green']}You unleash a stampede of companions!{c['reset']}")
+        for pet in pets:
+            pet.ai_state['aggressive'] = True
+
+    @classmethod
+    async def cmd_aimed_shot(cls, player: 'Player', args: List[str]):
+        """2.5x weapon damage, guaranteed hit. Costs 30 Focus. 12s CD. Ranger only."""
+        c = player.config.COLORS
+        import time, random
+
+        if player.char_class.lower() != 'ranger':
+            await player.send(f"{c['red']}Only rangers can use Aimed Shot!{c['reset']}")
+            return
+
+        now = time.time()
+        cd = getattr(player, 'aimed_shot_cooldown', 0)
+        if now < cd:
+            await player.send(f"{c['yellow']}Aimed Shot on cooldown ({int(cd - now)}s).{c['reset']}")
+            return
+
+        focus_cost = 30
+        if getattr(player, 'focus', 0) >= 100:
+            focus_cost = 15  # 50% discount at max focus
+
+        if getattr(player, 'focus', 0) < focus_cost:
+            await player.send(f"{c['red']}You need {focus_cost} Focus! (Current: {player.focus}){c['reset']}")
+            return
+
+        target = None
+        if args:
+            target = player.find_target_in_room(' '.join(args))
+        elif player.is_fighting:
+            target = player.fighting
+        if not target:
+            await player.send(f"{c['yellow']}Aimed Shot at whom?{c['reset']}")
+            return
+
+        player.focus -= focus_cost
+        player.aimed_shot_cooldown = now + 12
+
+        weapon = player.equipment.get('wield')
+        if weapon and hasattr(weapon, 'damage_dice'):
+            from combat import CombatHandler
+            base_damage = CombatHandler.roll_dice(weapon.damage_dice)
+        else:
+            base_damage = random.randint(4, 12)
+
+        multiplier = 2.5
+        try:
+            from talents import TalentManager
+            multiplier += TalentManager.get_talent_rank(player, 'careful_aim') * 0.03 * 2.5
+        except Exception:
+            pass
+
+        # Hunter's mark bonus
+        if getattr(player, 'hunters_mark_target', None) == target:
+            multiplier *= 1.10
+
+        damage = int(base_damage * multiplier) + player.get_damage_bonus() * 2
+        damage = max(1, damage)
+
+        await player.send(f"{c['bright_green']}🏹 You fire a perfectly aimed shot at {target.name}! [{damage}]{c['reset']}")
+        if hasattr(target, 'send'):
+            await target.send(f"{c['red']}{player.name} fires a devastating aimed shot at you! [{damage}]{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name} fires a precise aimed shot at {target.name}!", exclude=[player, target])
+
+        killed = await target.take_damage(damage, player)
+        if killed:
+            from combat import CombatHandler
+            await CombatHandler.handle_death(player, target)
+        if not player.is_fighting and not killed:
+            from combat import CombatHandler
+            await CombatHandler.start_combat(player, target)
+
+    @classmethod
+    async def cmd_explosive_trap(cls, player: 'Player', args: List[str]):
+        """Set an explosive trap in the room."""
+        c = player.config.COLORS
+        if 'explosive_trap' not in player.skills:
+            await player.send(f"{c['red']}You don't know Explosive Trap.{c['reset']}")
+            return
+        player.room.trap_explosive = 5
+        await player.send(f"{c['yellow']}You set an explosive trap.{c['reset']}")
+
+    @classmethod
+    async def cmd_black_arrow(cls, player: 'Player', args: List[str]):
+        """Poisoned arrow dealing damage over time."""
+        c = player.config.COLORS
+        if 'black_arrow' not in player.skills:
+            await player.send(f"{c['red']}You don't know Black Arrow.{c['reset']}")
+            return
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send(f"{c['yellow']}Black Arrow at whom?{c['reset']}")
+                return
+        target = player.find_target_in_room(' '.join(args))
+        if not target:
+            await player.send(f"{c['red']}Target not found.{c['reset']}")
+            return
+        from affects import AffectManager
+        AffectManager.apply_affect(target, {'name': 'black_arrow', 'type': AffectManager.TYPE_DOT,
+                                            'applies_to': 'hp', 'value': 6, 'duration': 4,
+                                            'caster_level': player.level})
+        await player.send(f"{c['green']}You fire a black arrow into {target.name}!{c['reset']}")
+
+    @classmethod
+    async def cmd_wyvern_sting(cls, player: 'Player', args: List[str]):
+        """Put target to sleep briefly."""
+        c = player.config.COLORS
+        if 'wyvern_sting' not in player.skills:
+            await player.send(f"{c['red']}You don't know Wyvern Sting.{c['reset']}")
+            return
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send(f"{c['yellow']}Wyvern sting whom?{c['reset']}")
+                return
+        target = player.find_target_in_room(' '.join(args))
+        if not target:
+            await player.send(f"{c['red']}Target not found.{c['reset']}")
+            return
+        from affects import AffectManager
+        AffectManager.apply_affect(target, {'name': 'wyvern_sting', 'type': AffectManager.TYPE_FLAG,
+                                            'applies_to': 'sleeping', 'value': 1, 'duration': 3,
+                                            'caster_level': player.level})
+        await player.send(f"{c['cyan']}{target.name} is lulled into sleep!{c['reset']}")
+
+    @classmethod
+    async def cmd_predators_mark(cls, player: 'Player', args: List[str]):
+        """Mark a target for increased damage and tracking."""
+        c = player.config.COLORS
+        if 'predators_mark' not in player.skills:
+            await player.send(f"{c['red']}You don't know Predator's Mark.{c['reset']}")
+            return
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send(f"{c['yellow']}Mark whom?{c['reset']}")
+                return
+        target = player.find_target_in_room(' '.join(args))
+        if not target:
+            await player.send(f"{c['red']}Target not found.{c['reset']}")
+            return
+        target.predators_mark = player
+        target.predators_mark_ticks = 8
+        await player.send(f"{c['bright_green']}You mark {target.name} as prey.{c['reset']}")
+
+    # ----- Paladin talent skills -----
+    @classmethod
+    async def cmd_seal_of_command(cls, player: 'Player', args: List[str]):
+        """Empower attacks with holy damage."""
+        c = player.config.COLORS
+        if 'seal_of_command' not in player.skills:
+            await player.send(f"{c['red']}You don't know Seal of Command.{c['reset']}")
+            return
+        player.seal_of_command = True
+        await player.send(f"{c['bright_yellow']}Holy power surrounds your weapon.{c['reset']}")
+
+    @classmethod
+    async def cmd_crusader_strike(cls, player: 'Player', args: List[str]):
+        """Instant weapon strike."""
+        c = player.config.COLORS
+        if 'crusader_strike' not in player.skills:
+            await player.send(f"{c['red']}You don't know Crusader Strike.{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['yellow']}You must be fighting to strike.{c['reset']}")
+            return
+        target = player.fighting
+        import random
+        damage = random.randint(8, 14) + player.level
+        await player.send(f"{c['bright_yellow']}You crusader strike {target.name}! [{damage}]{c['reset']}")
+        await target.take_damage(damage, player)
+
+    @classmethod
+    async def cmd_judgment(cls, player: 'Player', args: List[str]):
+        """Ranged holy strike."""
+        c = player.config.COLORS
+        if 'judgment' not in player.skills:
+            await player.send(f"{c['red']}You don't know Judgment.{c['reset']}")
+            return
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send(f"{c['yellow']}Judge whom?{c['reset']}")
+                return
+        target = player.find_target_in_room(' '.join(args))
+        if not target:
+            await player.send(f"{c['red']}Target not found.{c['reset']}")
+            return
+        import random
+        damage = random.randint(10, 16) + player.level
+        await player.send(f"{c['bright_yellow']}You smite {target.name} with Judgment! [{damage}]{c['reset']}")
+        await target.take_damage(damage, player)
+
+    @classmethod
+    async def cmd_sacred_shield(cls, player: 'Player', args: List[str]):
+        """Apply a holy shield."""
+        c = player.config.COLORS
+        if 'sacred_shield' not in player.skills:
+            await player.send(f"{c['red']}You don't know Sacred Shield.{c['reset']}")
+            return
+        from affects import AffectManager
+        AffectManager.apply_affect(player, {'name': 'sacred_shield', 'type': AffectManager.TYPE_FLAG,
+                                            'applies_to': 'divine_shield', 'value': 1, 'duration': 6,
+                                            'caster_level': player.level})
+        await player.send(f"{c['bright_yellow']}A sacred shield surrounds you.{c['reset']}")
+
+    # ----- Assassin talent skills -----
+    @classmethod
+    async def cmd_marked_for_death(cls, player: 'Player', args: List[str]):
+        """Mark a target for lethal focus."""
+        c = player.config.COLORS
+        if 'marked_for_death' not in player.skills:
+            await player.send(f"{c['red']}You don't know Marked for Death.{c['reset']}")
+            return
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send(f"{c['yellow']}Mark whom?{c['reset']}")
+                return
+        target = player.find_target_in_room(' '.join(args))
+        if not target:
+            await player.send(f"{c['red']}Target not found.{c['reset']}")
+            return
+        target.marked_for_death = player
+        target.marked_for_death_ticks = 8
+        await player.send(f"{c['magenta']}You mark {target.name} for death.{c['reset']}")
+
+    @classmethod
+    async def cmd_death_from_above(cls, player: 'Player', args: List[str]):
+        """Leap attack for massive damage."""
+        c = player.config.COLORS
+        if 'death_from_above' not in player.skills:
+            await player.send(f"{c['red']}You don't know Death from Above.{c['reset']}")
+            return
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send(f"{c['yellow']}Leap at whom?{c['reset']}")
+                return
+        target = player.find_target_in_room(' '.join(args))
+        if not target:
+            await player.send(f"{c['red']}Target not found.{c['reset']}")
+            return
+        import random
+        damage = random.randint(14, 22) + player.level
+        await player.send(f"{c['bright_red']}You strike from above! [{damage}]{c['reset']}")
+        await target.take_damage(damage, player)
+
+    @classmethod
+    async def cmd_crippling_poison(cls, player: 'Player', args: List[str]):
+        """Apply crippling poison to your weapon."""
+        c = player.config.COLORS
+        if 'crippling_poison' not in player.skills:
+            await player.send(f"{c['red']}You don't know Crippling Poison.{c['reset']}")
+            return
+        player.preferred_poison_type = 'crippling'
+        from combat import CombatHandler
+        await CombatHandler.do_envenom(player)
+
+    @classmethod
+    async def cmd_deadly_poison(cls, player: 'Player', args: List[str]):
+        """Apply deadly poison to your weapon."""
+        c = player.config.COLORS
+        if 'deadly_poison' not in player.skills:
+            await player.send(f"{c['red']}You don't know Deadly Poison.{c['reset']}")
+            return
+        player.preferred_poison_type = 'deadly'
+        from combat import CombatHandler
+        await CombatHandler.do_envenom(player)
+
+    @classmethod
+    async def cmd_cloak_of_shadows(cls, player: 'Player', args: List[str]):
+        """Remove harmful magic effects."""
+        c = player.config.COLORS
+        if 'cloak_of_shadows' not in player.skills:
+            await player.send(f"{c['red']}You don't know Cloak of Shadows.{c['reset']}")
+            return
+        from affects import AffectManager
+        count = AffectManager.dispel_affects(player, player.level)
+        await player.send(f"{c['cyan']}You shed {count} harmful effects.{c['reset']}")
+
+    @classmethod
+    async def cmd_vanish(cls, player: 'Player', args: List[str]):
+        """Instant stealth, drop combat. Does NOT reset Intel."""
+        import time
+        c = player.config.COLORS
+        char_class = getattr(player, 'char_class', '').lower()
+        if char_class not in ('assassin', 'thief') and 'vanish' not in player.skills:
+            await player.send(f"{c['red']}You don't know Vanish.{c['reset']}")
+            return
+        now = time.time()
+        if now < getattr(player, 'vanish_cooldown', 0):
+            remaining = int(player.vanish_cooldown - now)
+            await player.send(f"{c['yellow']}Vanish on cooldown ({remaining}s).{c['reset']}")
+            return
+        player.vanish_cooldown = now + 60
+        # Drop combat
+        target = player.fighting
+        if target:
+            player.fighting = None
+            if hasattr(target, 'fighting') and target.fighting == player:
+                target.fighting = None
+                if target.position == 'fighting':
+                    target.position = 'standing'
+        if player.position == 'fighting':
+            player.position = 'standing'
+        # Stealth
+        player.flags.add('hidden')
+        player.flags.add('sneaking')
+        # Intel is NOT reset
+        await player.send(f"{c['magenta']}You vanish into the shadows.{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(
+                f"{c['white']}{player.name} vanishes!{c['reset']}",
+                exclude=[player]
+            )
+
+    @classmethod
+    async def cmd_shadow_blade(cls, player: 'Player', args: List[str]):
+        """Empower attacks from stealth."""
+        c = player.config.COLORS
+        if 'shadow_blade' not in player.skills:
+            await player.send(f"{c['red']}You don't know Shadow Blade.{c['reset']}")
+            return
+        player.shadow_blade_ticks = 6
+        await player.send(f"{c['magenta']}Your blade drinks the darkness.{c['reset']}")
+
+    @classmethod
+    async def cmd_shadow_blink(cls, player: 'Player', args: List[str]):
+        """Blink behind target and stealth briefly."""
+        c = player.config.COLORS
+        if 'shadow_blink' not in player.skills:
+            await player.send(f"{c['red']}You don't know Shadow Blink.{c['reset']}")
+            return
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send(f"{c['yellow']}Blink to whom?{c['reset']}")
+                return
+        target = player.find_target_in_room(' '.join(args))
+        if not target:
+            await player.send(f"{c['red']}Target not found.{c['reset']}")
+            return
+        player.flags.add('hidden')
+        await player.send(f"{c['magenta']}You blink behind {target.name} and fade from sight.{c['reset']}")
+
+    @classmethod
+    async def cmd_silence_strike(cls, player: 'Player', args: List[str]):
+        """Strike and silence spellcasting."""
+        c = player.config.COLORS
+        if 'silence_strike' not in player.skills:
+            await player.send(f"{c['red']}You don't know Silence Strike.{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['yellow']}You must be fighting to use Silence Strike.{c['reset']}")
+            return
+        target = player.fighting
+        from affects import AffectManager
+        AffectManager.apply_affect(target, {'name': 'silence_strike', 'type': AffectManager.TYPE_FLAG,
+                                            'applies_to': 'silenced', 'value': 1, 'duration': 3,
+                                            'caster_level': player.level})
+        await player.send(f"{c['bright_red']}You silence {target.name}!{c['reset']}")
+
+    # ==================== LEVEL 31-60 SKILL COMMANDS ====================
+
+    # These are the powerful high-level abilities that define endgame combat.
+
+    # ----- WARRIOR LEVEL 31-60 -----
+    @classmethod
+    async def cmd_rallying_cry(cls, player: 'Player', args: List[str]):
+        """Buff the entire party with increased max HP and regeneration."""
+        c = player.config.COLORS
+        import time
+        
+        if player.char_class.lower() != 'warrior':
+            await player.send(f"{c['red']}Only warriors can use Rallying Cry!{c['reset']}")
+            return
+        if player.level < 32:
+            await player.send(f"{c['red']}You must be level 32 to use Rallying Cry!{c['reset']}")
+            return
+        
+        # Cooldown check (2 minutes)
+        now = time.time()
+        cooldown_until = getattr(player, 'rallying_cry_cooldown', 0)
+        if now < cooldown_until:
+            remaining = int(cooldown_until - now)
+            await player.send(f"{c['yellow']}Rallying Cry on cooldown ({remaining}s).{c['reset']}")
+            return
+        
+        player.rallying_cry_cooldown = now + 120
+        
+        from affects import AffectManager
+        
+        # Apply to self and group members
+        targets = [player]
+        if player.group:
+            targets.extend([m for m in player.group.members if m != player and m.room == player.room])
+        
+        hp_boost = 20 + player.level
+        for target in targets:
+            AffectManager.apply_affect(target, {
+                'name': 'rallying_cry',
+                'type': AffectManager.TYPE_STAT,
+                'applies_to': 'max_hp',
+                'value': hp_boost,
+                'duration': 15,
+                'caster_level': player.level
+            })
+            if hasattr(target, 'send'):
+                await target.send(f"{c['bright_yellow']}You feel a surge of vitality from the Rallying Cry!{c['reset']}")
+        
+        await player.send(f"{c['bright_yellow']}You let out a RALLYING CRY! All allies gain +{hp_boost} max HP!{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name} lets out a thunderous rallying cry!", exclude=[player])
+
+    @classmethod
+    async def cmd_shattering_blow(cls, player: 'Player', args: List[str]):
+        """Strike with such force that armor is reduced."""
+        c = player.config.COLORS
+        import time, random
+        
+        if player.char_class.lower() != 'warrior':
+            await player.send(f"{c['red']}Only warriors can use Shattering Blow!{c['reset']}")
+            return
+        if player.level < 38:
+            await player.send(f"{c['red']}You must be level 38 to use Shattering Blow!{c['reset']}")
+            return
+        
+        target = None
+        if args:
+            target = player.find_target_in_room(' '.join(args))
+        elif player.is_fighting:
+            target = player.fighting
+        elif player.target and player.target in player.room.characters:
+            target = player.target
+        
+        if not target:
+            await player.send(f"{c['yellow']}Shattering Blow whom?{c['reset']}")
+            return
+        
+        # Cooldown (15 seconds)
+        now = time.time()
+        cooldown_until = getattr(player, 'shattering_blow_cooldown', 0)
+        if now < cooldown_until:
+            remaining = int(cooldown_until - now)
+            await player.send(f"{c['yellow']}Shattering Blow on cooldown ({remaining}s).{c['reset']}")
+            return
+        
+        player.shattering_blow_cooldown = now + 15
+        
+        from affects import AffectManager
+        
+        # Damage + armor reduction
+        damage = random.randint(15, 25) + player.level + player.get_damage_bonus()
+        AffectManager.apply_affect(target, {
+            'name': 'armor_shattered',
+            'type': AffectManager.TYPE_STAT,
+            'applies_to': 'ac',
+            'value': 30,  # Worse AC (higher number = worse)
+            'duration': 10,
+            'caster_level': player.level
+        })
+        
+        await target.take_damage(damage, player)
+        await player.send(f"{c['bright_red']}Your SHATTERING BLOW cracks {target.name}'s armor! [{damage}]{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name}'s weapon SHATTERS against {target.name}'s armor!", exclude=[player])
+
+    @classmethod
+    async def cmd_commanding_shout(cls, player: 'Player', args: List[str]):
+        """Taunt all enemies in the room, forcing them to attack you."""
+        c = player.config.COLORS
+        import time
+        
+        if player.char_class.lower() != 'warrior':
+            await player.send(f"{c['red']}Only warriors can use Commanding Shout!{c['reset']}")
+            return
+        if player.level < 44:
+            await player.send(f"{c['red']}You must be level 44 to use Commanding Shout!{c['reset']}")
+            return
+        
+        now = time.time()
+        cooldown_until = getattr(player, 'commanding_shout_cooldown', 0)
+        if now < cooldown_until:
+            remaining = int(cooldown_until - now)
+            await player.send(f"{c['yellow']}Commanding Shout on cooldown ({remaining}s).{c['reset']}")
+            return
+        
+        player.commanding_shout_cooldown = now + 30
+        
+        from mobs import Mobile
+        
+        taunted = 0
+        for char in player.room.characters:
+            if isinstance(char, Mobile) and char.hp > 0:
+                char.fighting = player
+                char.taunted_by = player
+                char.taunt_ticks = 6
+                taunted += 1
+        
+        await player.send(f"{c['bright_yellow']}You let out a COMMANDING SHOUT! {taunted} enemies focus on you!{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name} bellows a commanding shout that echoes through the room!", exclude=[player])
+
+    @classmethod
+    async def cmd_heroic_leap(cls, player: 'Player', args: List[str]):
+        """Leap to a target, stunning them on impact."""
+        c = player.config.COLORS
+        import time, random
+        
+        if player.char_class.lower() != 'warrior':
+            await player.send(f"{c['red']}Only warriors can use Heroic Leap!{c['reset']}")
+            return
+        if player.level < 50:
+            await player.send(f"{c['red']}You must be level 50 to use Heroic Leap!{c['reset']}")
+            return
+        
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send(f"{c['yellow']}Heroic Leap at whom?{c['reset']}")
+                return
+        
+        target = player.find_target_in_room(' '.join(args))
+        if not target:
+            await player.send(f"{c['red']}Target not found.{c['reset']}")
+            return
+        
+        now = time.time()
+        cooldown_until = getattr(player, 'heroic_leap_cooldown', 0)
+        if now < cooldown_until:
+            remaining = int(cooldown_until - now)
+            await player.send(f"{c['yellow']}Heroic Leap on cooldown ({remaining}s).{c['reset']}")
+            return
+        
+        player.heroic_leap_cooldown = now + 45
+        
+        from affects import AffectManager
+        from combat import CombatHandler
+        
+        damage = random.randint(20, 35) + player.level
+        AffectManager.apply_affect(target, {
+            'name': 'heroic_leap_stun',
+            'type': AffectManager.TYPE_FLAG,
+            'applies_to': 'stunned',
+            'value': 1,
+            'duration': 3,
+            'caster_level': player.level
+        })
+        
+        await target.take_damage(damage, player)
+        await CombatHandler.start_combat(player, target)
+        
+        await player.send(f"{c['bright_yellow']}You HEROICALLY LEAP onto {target.name}, stunning them! [{damage}]{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name} leaps through the air and SLAMS into {target.name}!", exclude=[player])
+
+    @classmethod
+    async def cmd_warpath(cls, player: 'Player', args: List[str]):
+        """Enter a sustained damage mode - all attacks deal increased damage."""
+        c = player.config.COLORS
+        import time
+        
+        if player.char_class.lower() != 'warrior':
+            await player.send(f"{c['red']}Only warriors can use Warpath!{c['reset']}")
+            return
+        if player.level < 56:
+            await player.send(f"{c['red']}You must be level 56 to use Warpath!{c['reset']}")
+            return
+        
+        now = time.time()
+        cooldown_until = getattr(player, 'warpath_cooldown', 0)
+        if now < cooldown_until:
+            remaining = int(cooldown_until - now)
+            await player.send(f"{c['yellow']}Warpath on cooldown ({remaining}s).{c['reset']}")
+            return
+        
+        player.warpath_cooldown = now + 180  # 3 minutes
+        
+        from affects import AffectManager
+        
+        AffectManager.apply_affect(player, {
+            'name': 'warpath',
+            'type': AffectManager.TYPE_STAT,
+            'applies_to': 'damroll',
+            'value': 15,
+            'duration': 20,
+            'caster_level': player.level
+        })
+        AffectManager.apply_affect(player, {
+            'name': 'warpath_speed',
+            'type': AffectManager.TYPE_FLAG,
+            'applies_to': 'haste',
+            'value': 1,
+            'duration': 20,
+            'caster_level': player.level
+        })
+        
+        await player.send(f"{c['bright_red']}You enter the WARPATH! Destruction follows in your wake!{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name}'s eyes glow red as they enter a devastating WARPATH!", exclude=[player])
+
+    @classmethod
+    async def cmd_titans_wrath(cls, player: 'Player', args: List[str]):
+        """CAPSTONE: 10 seconds of god mode - immune to damage, 2x damage, AoE cleave."""
+        c = player.config.COLORS
+        import time
+        
+        if player.char_class.lower() != 'warrior':
+            await player.send(f"{c['red']}Only warriors can invoke Titan's Wrath!{c['reset']}")
+            return
+        if player.level < 60:
+            await player.send(f"{c['red']}You must be level 60 to invoke Titan's Wrath!{c['reset']}")
+            return
+        
+        now = time.time()
+        cooldown_until = getattr(player, 'titans_wrath_cooldown', 0)
+        if now < cooldown_until:
+            remaining = int(cooldown_until - now)
+            await player.send(f"{c['yellow']}Titan's Wrath on cooldown ({int(remaining/60)}m {remaining%60}s).{c['reset']}")
+            return
+        
+        player.titans_wrath_cooldown = now + 600  # 10 minutes
+        
+        from affects import AffectManager
+        
+        # Invulnerability
+        AffectManager.apply_affect(player, {
+            'name': 'titans_wrath_invuln',
+            'type': AffectManager.TYPE_FLAG,
+            'applies_to': 'invulnerable',
+            'value': 1,
+            'duration': 5,  # ~10 seconds (2s per tick)
+            'caster_level': player.level
+        })
+        # Double damage
+        AffectManager.apply_affect(player, {
+            'name': 'titans_wrath_damage',
+            'type': AffectManager.TYPE_STAT,
+            'applies_to': 'damroll',
+            'value': 50,
+            'duration': 5,
+            'caster_level': player.level
+        })
+        # AoE cleave flag
+        player.titans_wrath_active = True
+        player.titans_wrath_ticks = 5
+        
+        await player.send(f"{c['bright_yellow']}████████████████████████████████████████████{c['reset']}")
+        await player.send(f"{c['bright_yellow']}█ {c['bright_red']}TITAN'S WRATH{c['bright_yellow']} - YOU ARE UNSTOPPABLE! █{c['reset']}")
+        await player.send(f"{c['bright_yellow']}████████████████████████████████████████████{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(
+                f"The air CRACKLES with power as {player.name} invokes TITAN'S WRATH! They are INVINCIBLE!",
+                exclude=[player]
+            )
+
+    # ----- THIEF LEVEL 31-60 -----
+    @classmethod
+    async def cmd_nerve_strike(cls, player: 'Player', args: List[str]):
+        """Paralyze a target with a precise nerve strike."""
+        c = player.config.COLORS
+        import time
+        
+        if player.char_class.lower() != 'thief':
+            await player.send(f"{c['red']}Only thieves can use Nerve Strike!{c['reset']}")
+            return
+        if player.level < 32:
+            await player.send(f"{c['red']}You must be level 32 to use Nerve Strike!{c['reset']}")
+            return
+        
+        target = None
+        if args:
+            target = player.find_target_in_room(' '.join(args))
+        elif player.is_fighting:
+            target = player.fighting
+        
+        if not target:
+            await player.send(f"{c['yellow']}Nerve Strike whom?{c['reset']}")
+            return
+        
+        now = time.time()
+        cooldown_until = getattr(player, 'nerve_strike_cooldown', 0)
+        if now < cooldown_until:
+            remaining = int(cooldown_until - now)
+            await player.send(f"{c['yellow']}Nerve Strike on cooldown ({remaining}s).{c['reset']}")
+            return
+        
+        player.nerve_strike_cooldown = now + 30
+        
+        from affects import AffectManager
+        
+        AffectManager.apply_affect(target, {
+            'name': 'paralyzed',
+            'type': AffectManager.TYPE_FLAG,
+            'applies_to': 'paralyzed',
+            'value': 1,
+            'duration': 3,
+            'caster_level': player.level
+        })
+        
+        await player.send(f"{c['magenta']}You strike {target.name}'s nerve cluster - they are PARALYZED!{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name} strikes {target.name}'s pressure point!", exclude=[player])
+
+    @classmethod
+    async def cmd_garrote(cls, player: 'Player', args: List[str]):
+        """Strangle a target, silencing them and causing bleed damage."""
+        c = player.config.COLORS
+        import time, random
+        
+        if player.char_class.lower() != 'thief':
+            await player.send(f"{c['red']}Only thieves can use Garrote!{c['reset']}")
+            return
+        if player.level < 44:
+            await player.send(f"{c['red']}You must be level 44 to use Garrote!{c['reset']}")
+            return
+        
+        if player.is_fighting:
+            await player.send(f"{c['red']}You can only Garrote from stealth!{c['reset']}")
+            return
+        
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send(f"{c['yellow']}Garrote whom?{c['reset']}")
+                return
+        
+        target = player.find_target_in_room(' '.join(args))
+        if not target:
+            await player.send(f"{c['red']}Target not found.{c['reset']}")
+            return
+        
+        now = time.time()
+        cooldown_until = getattr(player, 'garrote_cooldown', 0)
+        if now < cooldown_until:
+            remaining = int(cooldown_until - now)
+            await player.send(f"{c['yellow']}Garrote on cooldown ({remaining}s).{c['reset']}")
+            return
+        
+        player.garrote_cooldown = now + 20
+        
+        from affects import AffectManager
+        from combat import CombatHandler
+        
+        damage = random.randint(10, 18) + player.level
+        
+        # Silence
+        AffectManager.apply_affect(target, {
+            'name': 'garrote_silence',
+            'type': AffectManager.TYPE_FLAG,
+            'applies_to': 'silenced',
+            'value': 1,
+            'duration': 5,
+            'caster_level': player.level
+        })
+        # Bleed DoT
+        AffectManager.apply_affect(target, {
+            'name': 'garrote_bleed',
+            'type': AffectManager.TYPE_DOT,
+            'applies_to': 'hp',
+            'value': 8 + player.level // 5,
+            'duration': 6,
+            'caster_level': player.level
+        })
+        
+        await target.take_damage(damage, player)
+        await CombatHandler.start_combat(player, target)
+        
+        await player.send(f"{c['bright_red']}You GARROTE {target.name} - silenced and bleeding! [{damage}]{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name} wraps a garrote around {target.name}'s throat!", exclude=[player])
+
+    @classmethod
+    async def cmd_evasion(cls, player: 'Player', args: List[str]):
+        """100% dodge chance for 10 seconds. Assassin/Thief."""
+        c = player.config.COLORS
+        import time
+        char_class = getattr(player, 'char_class', '').lower()
+        if char_class not in ('thief', 'assassin'):
+            await player.send(f"{c['red']}Only thieves and assassins can use Evasion!{c['reset']}")
+            return
+
+        now = time.time()
+        cooldown_until = getattr(player, 'evasion_cooldown', 0)
+        if now < cooldown_until:
+            remaining = int(cooldown_until - now)
+            await player.send(f"{c['yellow']}Evasion on cooldown ({remaining}s).{c['reset']}")
+            return
+
+        player.evasion_cooldown = now + 180  # 3 minutes
+        player.evasion_until = now + 10  # 10 seconds
+
+        await player.send(f"{c['cyan']}You enter a state of perfect EVASION - all attacks will miss for 10 seconds!{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name}'s movements become a blur - impossible to hit!", exclude=[player])
+
+    @classmethod
+    async def cmd_marked_for_death_thief(cls, player: 'Player', args: List[str]):
+        """Mark a target for massive damage bonus."""
+        c = player.config.COLORS
+        import time
+        
+        if player.char_class.lower() != 'thief':
+            await player.send(f"{c['red']}Only thieves can use Marked for Death!{c['reset']}")
+            return
+        if player.level < 56:
+            await player.send(f"{c['red']}You must be level 56 to use Marked for Death!{c['reset']}")
+            return
+        
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send(f"{c['yellow']}Mark whom for death?{c['reset']}")
+                return
+        
+        target = player.find_target_in_room(' '.join(args))
+        if not target:
+            await player.send(f"{c['red']}Target not found.{c['reset']}")
+            return
+        
+        now = time.time()
+        cooldown_until = getattr(player, 'marked_for_death_thief_cooldown', 0)
+        if now < cooldown_until:
+            remaining = int(cooldown_until - now)
+            await player.send(f"{c['yellow']}Marked for Death on cooldown ({remaining}s).{c['reset']}")
+            return
+        
+        player.marked_for_death_thief_cooldown = now + 60
+        
+        target.marked_for_death_by = player
+        target.marked_for_death_bonus = 50  # 50% extra damage
+        target.marked_for_death_ticks = 10
+        
+        await player.send(f"{c['bright_red']}You mark {target.name} for DEATH - your attacks deal 50% more damage!{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"A dark mark appears on {target.name} - they have been marked for death!", exclude=[player])
+
+    @classmethod
+    async def cmd_perfect_crime(cls, player: 'Player', args: List[str]):
+        """CAPSTONE: 30 seconds of permanent stealth with guaranteed crits."""
+        c = player.config.COLORS
+        import time
+        
+        if player.char_class.lower() != 'thief':
+            await player.send(f"{c['red']}Only thieves can commit the Perfect Crime!{c['reset']}")
+            return
+        if player.level < 60:
+            await player.send(f"{c['red']}You must be level 60 to commit the Perfect Crime!{c['reset']}")
+            return
+        
+        now = time.time()
+        cooldown_until = getattr(player, 'perfect_crime_cooldown', 0)
+        if now < cooldown_until:
+            remaining = int(cooldown_until - now)
+            await player.send(f"{c['yellow']}Perfect Crime on cooldown ({int(remaining/60)}m {remaining%60}s).{c['reset']}")
+            return
+        
+        player.perfect_crime_cooldown = now + 600  # 10 minutes
+        
+        from affects import AffectManager
+        
+        # Permanent stealth
+        AffectManager.apply_affect(player, {
+            'name': 'perfect_crime_stealth',
+            'type': AffectManager.TYPE_FLAG,
+            'applies_to': 'invisible',
+            'value': 1,
+            'duration': 15,  # ~30 seconds
+            'caster_level': player.level
+        })
+        # Guaranteed crits
+        AffectManager.apply_affect(player, {
+            'name': 'perfect_crime_crit',
+            'type': AffectManager.TYPE_STAT,
+            'applies_to': 'crit_chance',
+            'value': 100,
+            'duration': 15,
+            'caster_level': player.level
+        })
+        
+        player.perfect_crime_active = True
+        player.flags.add('hidden')
+        
+        await player.send(f"{c['bright_magenta']}████████████████████████████████████████████{c['reset']}")
+        await player.send(f"{c['bright_magenta']}█ {c['bright_white']}PERFECT CRIME{c['bright_magenta']} - YOU ARE A GHOST █{c['reset']}")
+        await player.send(f"{c['bright_magenta']}████████████████████████████████████████████{c['reset']}")
+        await player.send(f"{c['cyan']}30 seconds of permanent stealth. All attacks are critical hits.{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name} vanishes without a trace...", exclude=[player])
+
+    # ----- RANGER LEVEL 31-60 -----
+    @classmethod
+    async def cmd_volley(cls, player: 'Player', args: List[str]):
+        """Rain arrows on all enemies in the room."""
+        c = player.config.COLORS
+        import time, random
+        
+        if player.char_class.lower() != 'ranger':
+            await player.send(f"{c['red']}Only rangers can use Volley!{c['reset']}")
+            return
+        if player.level < 32:
+            await player.send(f"{c['red']}You must be level 32 to use Volley!{c['reset']}")
+            return
+        
+        now = time.time()
+        cooldown_until = getattr(player, 'volley_cooldown', 0)
+        if now < cooldown_until:
+            remaining = int(cooldown_until - now)
+            await player.send(f"{c['yellow']}Volley on cooldown ({remaining}s).{c['reset']}")
+            return
+        
+        player.volley_cooldown = now + 20
+        
+        from mobs import Mobile
+        
+        targets = [m for m in player.room.characters if isinstance(m, Mobile) and m.hp > 0]
+        if not targets:
+            await player.send(f"{c['yellow']}No enemies to rain arrows on.{c['reset']}")
+            return
+        
+        await player.send(f"{c['bright_green']}You fire a VOLLEY of arrows into the air!{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name} fires a volley of arrows into the sky!", exclude=[player])
+        
+        for target in targets:
+            damage = random.randint(8, 14) + player.level // 2
+            await target.take_damage(damage, player)
+            await player.send(f"{c['green']}  → {target.name} is struck! [{damage}]{c['reset']}")
+
+    @classmethod
+    async def cmd_camouflage_master(cls, player: 'Player', args: List[str]):
+        """Enter advanced camouflage - harder to detect than regular hide."""
+        c = player.config.COLORS
+        import time
+        
+        if player.char_class.lower() != 'ranger':
+            await player.send(f"{c['red']}Only rangers can use Camouflage!{c['reset']}")
+            return
+        if player.level < 38:
+            await player.send(f"{c['red']}You must be level 38 to use Camouflage!{c['reset']}")
+            return
+        
+        now = time.time()
+        cooldown_until = getattr(player, 'camouflage_master_cooldown', 0)
+        if now < cooldown_until:
+            remaining = int(cooldown_until - now)
+            await player.send(f"{c['yellow']}Camouflage on cooldown ({remaining}s).{c['reset']}")
+            return
+        
+        player.camouflage_master_cooldown = now + 30
+        
+        from affects import AffectManager
+        
+        player.flags.add('hidden')
+        AffectManager.apply_affect(player, {
+            'name': 'camouflage',
+            'type': AffectManager.TYPE_FLAG,
+            'applies_to': 'invisible',
+            'value': 1,
+            'duration': 20,
+            'caster_level': player.level
+        })
+        player.camouflage_bonus = 30  # +30 to stealth check
+        
+        await player.send(f"{c['green']}You blend perfectly into your surroundings with CAMOUFLAGE!{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name} seems to melt into the environment...", exclude=[player])
+
+    @classmethod
+    async def cmd_serpent_sting(cls, player: 'Player', args: List[str]):
+        """Apply a strong poison DoT to the target."""
+        c = player.config.COLORS
+        import time, random
+        
+        if player.char_class.lower() != 'ranger':
+            await player.send(f"{c['red']}Only rangers can use Serpent Sting!{c['reset']}")
+            return
+        if player.level < 44:
+            await player.send(f"{c['red']}You must be level 44 to use Serpent Sting!{c['reset']}")
+            return
+        
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send(f"{c['yellow']}Serpent Sting whom?{c['reset']}")
+                return
+        
+        target = player.find_target_in_room(' '.join(args))
+        if not target:
+            await player.send(f"{c['red']}Target not found.{c['reset']}")
+            return
+        
+        now = time.time()
+        cooldown_until = getattr(player, 'serpent_sting_cooldown', 0)
+        if now < cooldown_until:
+            remaining = int(cooldown_until - now)
+            await player.send(f"{c['yellow']}Serpent Sting on cooldown ({remaining}s).{c['reset']}")
+            return
+        
+        player.serpent_sting_cooldown = now + 15
+        
+        from affects import AffectManager
+        
+        damage = random.randint(5, 10) + player.level // 3
+        AffectManager.apply_affect(target, {
+            'name': 'serpent_sting',
+            'type': AffectManager.TYPE_DOT,
+            'applies_to': 'hp',
+            'value': 10 + player.level // 4,
+            'duration': 10,
+            'caster_level': player.level
+        })
+        
+        await target.take_damage(damage, player)
+        await player.send(f"{c['green']}You strike {target.name} with SERPENT STING! [{damage}] (Poison applied){c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name}'s arrow drips with venom as it strikes {target.name}!", exclude=[player])
+
+    @classmethod
+    async def cmd_rapid_fire(cls, player: 'Player', args: List[str]):
+        """Next 3 attacks happen instantly. Costs 50 Focus. 30s CD. Ranger only."""
+        c = player.config.COLORS
+        import time, random
+
+        if player.char_class.lower() != 'ranger':
+            await player.send(f"{c['red']}Only rangers can use Rapid Fire!{c['reset']}")
+            return
+
+        now = time.time()
+        cd = getattr(player, 'rapid_fire_cooldown', 0)
+        if now < cd:
+            await player.send(f"{c['yellow']}Rapid Fire on cooldown ({int(cd - now)}s).{c['reset']}")
+            return
+
+        focus_cost = 50
+        if getattr(player, 'focus', 0) >= 100:
+            focus_cost = 25
+
+        if getattr(player, 'focus', 0) < focus_cost:
+            await player.send(f"{c['red']}You need {focus_cost} Focus! (Current: {player.focus}){c['reset']}")
+            return
+
+        target = None
+        if args:
+            target = player.find_target_in_room(' '.join(args))
+        elif player.is_fighting:
+            target = player.fighting
+        if not target:
+            await player.send(f"{c['yellow']}Rapid Fire at whom?{c['reset']}")
+            return
+
+        player.focus -= focus_cost
+        player.rapid_fire_cooldown = now + 30
+
+        num_attacks = 3
+        try:
+            from talents import TalentManager
+            extra = TalentManager.get_talent_rank(player, 'rapid_fire_mastery') // 2
+            num_attacks += extra
+        except Exception:
+            pass
+
+        weapon = player.equipment.get('wield')
+        from combat import CombatHandler
+        total_damage = 0
+
+        await player.send(f"{c['bright_green']}🏹 RAPID FIRE! You unleash {num_attacks} shots at {target.name}!{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name} fires a rapid barrage!", exclude=[player])
+
+        for i in range(num_attacks):
+            if not target.is_alive:
+                break
+            if weapon and hasattr(weapon, 'damage_dice'):
+                base_damage = CombatHandler.roll_dice(weapon.damage_dice)
+            else:
+                base_damage = random.randint(4, 10)
+            damage = base_damage + player.get_damage_bonus()
+            if getattr(player, 'hunters_mark_target', None) == target:
+                damage = int(damage * 1.10)
+            damage = max(1, damage)
+            total_damage += damage
+            await player.send(f"{c['green']}  → Shot #{i+1} hits! [{damage}]{c['reset']}")
+            killed = await target.take_damage(damage, player)
+            if killed:
+                await CombatHandler.handle_death(player, target)
+                break
+
+        await player.send(f"{c['bright_green']}Total Rapid Fire damage: {total_damage}{c['reset']}")
+        if not player.is_fighting and target.is_alive:
+            await CombatHandler.start_combat(player, target)
+
+    @classmethod
+    async def cmd_kill_command(cls, player: 'Player', args: List[str]):
+        """Pet attacks for 2x damage. Costs 25 Focus. 15s CD. Ranger only."""
+        c = player.config.COLORS
+        import time, random
+
+        if player.char_class.lower() != 'ranger':
+            await player.send(f"{c['red']}Only rangers can use Kill Command!{c['reset']}")
+            return
+
+        now = time.time()
+        cd = getattr(player, 'kill_command_cooldown', 0)
+        if now < cd:
+            await player.send(f"{c['yellow']}Kill Command on cooldown ({int(cd - now)}s).{c['reset']}")
+            return
+
+        focus_cost = 25
+        if getattr(player, 'focus', 0) >= 100:
+            focus_cost = 12
+
+        if getattr(player, 'focus', 0) < focus_cost:
+            await player.send(f"{c['red']}You need {focus_cost} Focus! (Current: {player.focus}){c['reset']}")
+            return
+
+        target = None
+        if args:
+            target = player.find_target_in_room(' '.join(args))
+        elif player.is_fighting:
+            target = player.fighting
+        if not target:
+            await player.send(f"{c['yellow']}Kill Command whom?{c['reset']}")
+            return
+
+        player.focus -= focus_cost
+        player.kill_command_cooldown = now + 15
+
+        # Check for pet
+        from pets import PetManager
+        pets = PetManager.get_player_pets(player)
+        has_pet = bool(pets)
+
+        if has_pet:
+            pet = pets[0]
+            base_damage = random.randint(15, 30) + player.level
+            damage = int(base_damage * 2)
+            if getattr(player, 'hunters_mark_target', None) == target:
+                damage = int(damage * 1.10)
+            pet_name = pet.name
+            await player.send(f"{c['bright_green']}{pet_name} savages {target.name} on your command! [{damage}]{c['reset']}")
+            if player.room:
+                await player.room.send_to_room(f"{pet_name} lunges at {target.name}!", exclude=[player])
+        else:
+            base_damage = random.randint(10, 20) + player.level
+            damage = base_damage
+            if getattr(player, 'hunters_mark_target', None) == target:
+                damage = int(damage * 1.10)
+            await player.send(f"{c['bright_green']}You strike {target.name} with predatory force! [{damage}]{c['reset']}")
+
+        killed = await target.take_damage(damage, player)
+        if killed:
+            from combat import CombatHandler
+            await CombatHandler.handle_death(player, target)
+        if not player.is_fighting and not killed:
+            from combat import CombatHandler
+            await CombatHandler.start_combat(player, target)
+
+    @classmethod
+    async def cmd_alpha_pack(cls, player: 'Player', args: List[str]):
+        """CAPSTONE: Summon ALL your pets simultaneously in a frenzy."""
+        c = player.config.COLORS
+        import time
+        
+        if player.char_class.lower() != 'ranger':
+            await player.send(f"{c['red']}Only rangers can summon the Alpha Pack!{c['reset']}")
+            return
+        if player.level < 60:
+            await player.send(f"{c['red']}You must be level 60 to summon the Alpha Pack!{c['reset']}")
+            return
+        
+        now = time.time()
+        cooldown_until = getattr(player, 'alpha_pack_cooldown', 0)
+        if now < cooldown_until:
+            remaining = int(cooldown_until - now)
+            await player.send(f"{c['yellow']}Alpha Pack on cooldown ({int(remaining/60)}m {remaining%60}s).{c['reset']}")
+            return
+        
+        player.alpha_pack_cooldown = now + 600  # 10 minutes
+        
+        from pets import Pet
+        
+        pack_types = ['wolf', 'bear', 'hawk', 'cat', 'boar']
+        pack_members = []
+        
+        await player.send(f"{c['bright_green']}████████████████████████████████████████████{c['reset']}")
+        await player.send(f"{c['bright_green']}█ {c['bright_yellow']}ALPHA PACK{c['bright_green']} - THE HUNT BEGINS! █{c['reset']}")
+        await player.send(f"{c['bright_green']}████████████████████████████████████████████{c['reset']}")
+        
+        for pet_type in pack_types:
+            pet = Pet(0, player.world, player, pet_type)
+            pet.name = f"Pack {pet_type.title()}"
+            pet.level = player.level
+            pet.hp = int(player.max_hp * 0.5)
+            pet.max_hp = pet.hp
+            pet.timer = 15  # 30 seconds duration
+            pet.bestial_wrath = 15  # Permanent frenzy
+            pack_members.append(pet)
+            player.companions.append(pet)
+            if player.room:
+                player.room.characters.append(pet)
+                pet.room = player.room
+        
+        await player.send(f"{c['bright_yellow']}5 ferocious beasts answer your call!{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(
+                f"A PACK of wild beasts bursts forth to fight alongside {player.name}!",
+                exclude=[player]
+            )
+
+    # ----- ASSASSIN LEVEL 31-60 -----
+    @classmethod
+    async def cmd_shadowstrike(cls, player: 'Player', args: List[str]):
+        """Teleport behind a target and backstab them."""
+        c = player.config.COLORS
+        import time, random
+        
+        if player.char_class.lower() != 'assassin':
+            await player.send(f"{c['red']}Only assassins can use Shadowstrike!{c['reset']}")
+            return
+        if player.level < 32:
+            await player.send(f"{c['red']}You must be level 32 to use Shadowstrike!{c['reset']}")
+            return
+        
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send(f"{c['yellow']}Shadowstrike whom?{c['reset']}")
+                return
+        
+        target = player.find_target_in_room(' '.join(args))
+        if not target:
+            await player.send(f"{c['red']}Target not found.{c['reset']}")
+            return
+        
+        now = time.time()
+        cooldown_until = getattr(player, 'shadowstrike_cooldown', 0)
+        if now < cooldown_until:
+            remaining = int(cooldown_until - now)
+            await player.send(f"{c['yellow']}Shadowstrike on cooldown ({remaining}s).{c['reset']}")
+            return
+        
+        player.shadowstrike_cooldown = now + 20
+        
+        from combat import CombatHandler
+        
+        # Backstab damage from behind
+        damage = random.randint(20, 35) + player.level * 2
+        await target.take_damage(damage, player)
+        await CombatHandler.start_combat(player, target)
+        
+        await player.send(f"{c['magenta']}You SHADOWSTRIKE behind {target.name}! [{damage}]{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name} vanishes and reappears behind {target.name} with a deadly strike!", exclude=[player])
+
+    @classmethod
+    async def cmd_fan_of_knives(cls, player: 'Player', args: List[str]):
+        """Throw poisoned knives at all enemies in the room."""
+        c = player.config.COLORS
+        import time, random
+        
+        if player.char_class.lower() != 'assassin':
+            await player.send(f"{c['red']}Only assassins can use Fan of Knives!{c['reset']}")
+            return
+        if player.level < 38:
+            await player.send(f"{c['red']}You must be level 38 to use Fan of Knives!{c['reset']}")
+            return
+        
+        now = time.time()
+        cooldown_until = getattr(player, 'fan_of_knives_cooldown', 0)
+        if now < cooldown_until:
+            remaining = int(cooldown_until - now)
+            await player.send(f"{c['yellow']}Fan of Knives on cooldown ({remaining}s).{c['reset']}")
+            return
+        
+        player.fan_of_knives_cooldown = now + 15
+        
+        from mobs import Mobile
+        from affects import AffectManager
+        
+        targets = [m for m in player.room.characters if isinstance(m, Mobile) and m.hp > 0]
+        if not targets:
+            await player.send(f"{c['yellow']}No enemies to strike.{c['reset']}")
+            return
+        
+        await player.send(f"{c['magenta']}You hurl a FAN OF KNIVES at your enemies!{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name} hurls a fan of poisoned knives!", exclude=[player])
+        
+        for target in targets:
+            damage = random.randint(8, 15) + player.level // 2
+            AffectManager.apply_affect(target, {
+                'name': 'knife_poison',
+                'type': AffectManager.TYPE_DOT,
+                'applies_to': 'hp',
+                'value': 5 + player.level // 6,
+                'duration': 5,
+                'caster_level': player.level
+            })
+            await target.take_damage(damage, player)
+            await player.send(f"{c['magenta']}  → {target.name} is struck and poisoned! [{damage}]{c['reset']}")
+
+    @classmethod
+    async def cmd_rupture(cls, player: 'Player', args: List[str]):
+        """Cause massive bleeding with a vicious strike."""
+        c = player.config.COLORS
+        import time, random
+        
+        if player.char_class.lower() != 'assassin':
+            await player.send(f"{c['red']}Only assassins can use Rupture!{c['reset']}")
+            return
+        if player.level < 44:
+            await player.send(f"{c['red']}You must be level 44 to use Rupture!{c['reset']}")
+            return
+        
+        target = None
+        if args:
+            target = player.find_target_in_room(' '.join(args))
+        elif player.is_fighting:
+            target = player.fighting
+        
+        if not target:
+            await player.send(f"{c['yellow']}Rupture whom?{c['reset']}")
+            return
+        
+        now = time.time()
+        cooldown_until = getattr(player, 'rupture_cooldown', 0)
+        if now < cooldown_until:
+            remaining = int(cooldown_until - now)
+            await player.send(f"{c['yellow']}Rupture on cooldown ({remaining}s).{c['reset']}")
+            return
+        
+        player.rupture_cooldown = now + 20
+        
+        from affects import AffectManager
+        
+        damage = random.randint(15, 25) + player.level
+        AffectManager.apply_affect(target, {
+            'name': 'rupture_bleed',
+            'type': AffectManager.TYPE_DOT,
+            'applies_to': 'hp',
+            'value': 15 + player.level // 3,
+            'duration': 8,
+            'caster_level': player.level
+        })
+        
+        await target.take_damage(damage, player)
+        await player.send(f"{c['bright_red']}You RUPTURE {target.name}'s flesh! [{damage}] (Massive bleed applied){c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name} tears into {target.name}, causing horrific bleeding!", exclude=[player])
+
+    @classmethod
+    async def cmd_shadow_blades_master(cls, player: 'Player', args: List[str]):
+        """Conjure shadow weapons that deal bonus damage."""
+        c = player.config.COLORS
+        import time
+        
+        if player.char_class.lower() != 'assassin':
+            await player.send(f"{c['red']}Only assassins can use Shadow Blades!{c['reset']}")
+            return
+        if player.level < 50:
+            await player.send(f"{c['red']}You must be level 50 to use Shadow Blades!{c['reset']}")
+            return
+        
+        now = time.time()
+        cooldown_until = getattr(player, 'shadow_blades_master_cooldown', 0)
+        if now < cooldown_until:
+            remaining = int(cooldown_until - now)
+            await player.send(f"{c['yellow']}Shadow Blades on cooldown ({remaining}s).{c['reset']}")
+            return
+        
+        player.shadow_blades_master_cooldown = now + 120
+        
+        from affects import AffectManager
+        
+        AffectManager.apply_affect(player, {
+            'name': 'shadow_blades',
+            'type': AffectManager.TYPE_STAT,
+            'applies_to': 'damroll',
+            'value': 20,
+            'duration': 12,
+            'caster_level': player.level
+        })
+        AffectManager.apply_affect(player, {
+            'name': 'shadow_blades_haste',
+            'type': AffectManager.TYPE_FLAG,
+            'applies_to': 'haste',
+            'value': 1,
+            'duration': 12,
+            'caster_level': player.level
+        })
+        
+        await player.send(f"{c['magenta']}SHADOW BLADES manifest in your hands - +20 damage for 24 seconds!{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"Shadowy blades form in {player.name}'s hands!", exclude=[player])
+
+    @classmethod
+    async def cmd_vendetta_assassin(cls, player: 'Player', args: List[str]):
+        """Mark a target for death - all damage to them is doubled."""
+        c = player.config.COLORS
+        import time
+        
+        if player.char_class.lower() != 'assassin':
+            await player.send(f"{c['red']}Only assassins can use Vendetta!{c['reset']}")
+            return
+        if player.level < 56:
+            await player.send(f"{c['red']}You must be level 56 to use Vendetta!{c['reset']}")
+            return
+        
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send(f"{c['yellow']}Vendetta against whom?{c['reset']}")
+                return
+        
+        target = player.find_target_in_room(' '.join(args))
+        if not target:
+            await player.send(f"{c['red']}Target not found.{c['reset']}")
+            return
+        
+        now = time.time()
+        cooldown_until = getattr(player, 'vendetta_assassin_cooldown', 0)
+        if now < cooldown_until:
+            remaining = int(cooldown_until - now)
+            await player.send(f"{c['yellow']}Vendetta on cooldown ({remaining}s).{c['reset']}")
+            return
+        
+        player.vendetta_assassin_cooldown = now + 120
+        
+        target.vendetta_target = player
+        target.vendetta_bonus = 100  # 100% (2x) damage
+        target.vendetta_ticks = 10
+        
+        await player.send(f"{c['bright_red']}You swear VENDETTA against {target.name} - ALL damage doubled!{c['reset']}")
+        if player.room:
+            await player.room.send_to_room(f"{player.name} swears a deadly vendetta against {target.name}!", exclude=[player])
+
+    @classmethod
+    async def cmd_death_mark(cls, player: 'Player', args: List[str]):
+        """CAPSTONE: Execute a boss at <25% HP instantly."""
+        c = player.config.COLORS
+        import time
+        
+        if player.char_class.lower() != 'assassin':
+            await player.send(f"{c['red']}Only assassins can use Death Mark!{c['reset']}")
+            return
+        if player.level < 60:
+            await player.send(f"{c['red']}You must be level 60 to use Death Mark!{c['reset']}")
+            return
+        
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send(f"{c['yellow']}Death Mark whom?{c['reset']}")
+                return
+        
+        target = player.find_target_in_room(' '.join(args))
+        if not target:
+            await player.send(f"{c['red']}Target not found.{c['reset']}")
+            return
+        
+        now = time.time()
+        cooldown_until = getattr(player, 'death_mark_cooldown', 0)
+        if now < cooldown_until:
+            remaining = int(cooldown_until - now)
+            await player.send(f"{c['yellow']}Death Mark on cooldown ({int(remaining/60)}m {remaining%60}s).{c['reset']}")
+            return
+        
+        # Check if target is below 25% HP
+        hp_pct = target.hp / target.max_hp if target.max_hp > 0 else 0
+        
+        if hp_pct >= 0.25:
+            await player.send(f"{c['yellow']}{target.name} must be below 25% HP to execute!{c['reset']}")
+            await player.send(f"{c['cyan']}(Currently at {int(hp_pct*100)}% HP){c['reset']}")
+            return
+        
+        player.death_mark_cooldown = now + 600  # 10 minutes
+        
+        # Instant kill
+        await player.send(f"{c['bright_red']}████████████████████████████████████████████{c['reset']}")
+        await player.send(f"{c['bright_red']}█ {c['bright_white']}DEATH MARK{c['bright_red']} - EXECUTION COMPLETE █{c['reset']}")
+        await player.send(f"{c['bright_red']}████████████████████████████████████████████{c['reset']}")
+        
+        if player.room:
+            await player.room.send_to_room(
+                f"{player.name} marks {target.name} for DEATH - they fall instantly!",
+                exclude=[player]
+            )
+        
+        # Deal massive damage to kill
+        await target.take_damage(target.hp + 1000, player)
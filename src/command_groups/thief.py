@@ -0,0 +1,334 @@
+"""
+Misthollow Thief Commands
+========================
+Thief combo points and luck.
+"""
+
+import random
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class ThiefCommands:
+    """Thief commands."""
+
+    @classmethod
+    async def cmd_combo(cls, player: 'Player', args: List[str]):
+        """View current combo points."""
+        c = player.config.COLORS
+        
+        if player.char_class.lower() != 'thief':
+            await player.send(f"{c['red']}Only thieves use combo points!{c['reset']}")
+            return
+        
+        cp = player.combo_points
+        cp_bar = "●" * cp + "○" * (5 - cp)
+        target_name = player.combo_target.name if player.combo_target else "none"
+        
+        await player.send(f"{c['bright_yellow']}Combo Points: {c['bright_red']}{cp_bar}{c['white']} ({cp}/5) on {target_name}{c['reset']}")
+        await player.send(f"{c['cyan']}Finishers: eviscerate (5), kidney_shot (4), slice_dice (3){c['reset']}")
+    
+    @classmethod
+    async def cmd_eviscerate(cls, player: 'Player', args: List[str]):
+        """Powerful finisher that consumes all combo points."""
+        c = player.config.COLORS
+        import random
+        
+        if player.char_class.lower() != 'thief':
+            await player.send(f"{c['red']}Only thieves can eviscerate!{c['reset']}")
+            return
+        
+        if not player.is_fighting:
+            await player.send(f"{c['red']}You must be fighting to eviscerate!{c['reset']}")
+            return
+        
+        if player.combo_points < 1:
+            await player.send(f"{c['red']}You need at least 1 combo point!{c['reset']}")
+            return
+        
+        target = player.fighting
+        
+        # Damage scales with combo points
+        weapon = player.equipment.get('wield')
+        if weapon and hasattr(weapon, 'damage_dice'):
+            from combat import CombatHandler
+            base_damage = CombatHandler.roll_dice(weapon.damage_dice)
+        else:
+            base_damage = random.randint(2, 8)
+        
+        # Each combo point adds 50% damage
+        multiplier = 1 + (player.combo_points * 0.5)
+        damage = int(base_damage * multiplier) + player.get_damage_bonus()
+        
+        await player.send(f"{c['bright_red']}You eviscerate {target.name}! [{damage}] ({player.combo_points} combo points){c['reset']}")
+        if hasattr(target, 'send'):
+            await target.send(f"{c['bright_red']}{player.name} eviscerates you!{c['reset']}")
+        
+        player.combo_points = 0
+        player.combo_target = None
+        
+        killed = await target.take_damage(damage, player)
+        if killed:
+            from combat import CombatHandler
+            await CombatHandler.handle_death(player, target)
+    
+    @classmethod
+    async def cmd_kidneyshot(cls, player: 'Player', args: List[str]):
+        """Stun finisher that uses 4+ combo points."""
+        c = player.config.COLORS
+        
+        if player.char_class.lower() != 'thief':
+            await player.send(f"{c['red']}Only thieves can use kidney shot!{c['reset']}")
+            return
+        
+        if not player.is_fighting:
+            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
+            return
+        
+        if player.combo_points < 4:
+            await player.send(f"{c['red']}You need at least 4 combo points for kidney shot!{c['reset']}")
+            return
+        
+        target = player.fighting
+        
+        # Stun duration based on combo points
+        stun_duration = 1 + (player.combo_points - 4)  # 1-2 ticks
+        
+        from affects import AffectManager
+        affect_data = {
+            'name': 'kidney_shot',
+            'type': AffectManager.TYPE_FLAG,
+            'applies_to': 'stunned',
+            'value': 1,
+            'duration': stun_duration,
+            'caster_level': player.level
+        }
+        AffectManager.apply_affect(target, affect_data)
+        target.position = 'stunned'
+        
+        await player.send(f"{c['bright_yellow']}You kidney shot {target.name}! Stunned for {stun_duration} ticks!{c['reset']}")
+        if hasattr(target, 'send'):
+            await target.send(f"{c['bright_red']}{player.name} kidney shots you! You're stunned!{c['reset']}")
+        
+        player.combo_points = 0
+        player.combo_target = None
+    
+    @classmethod 
+    async def cmd_slicedice(cls, player: 'Player', args: List[str]):
+        """DoT finisher that uses 3+ combo points."""
+        c = player.config.COLORS
+        
+        if player.char_class.lower() != 'thief':
+            await player.send(f"{c['red']}Only thieves can use slice and dice!{c['reset']}")
+            return
+        
+        if not player.is_fighting:
+            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
+            return
+        
+        if player.combo_points < 3:
+            await player.send(f"{c['red']}You need at least 3 combo points for slice and dice!{c['reset']}")
+            return
+        
+        target = player.fighting
+        
+        # Bleed duration based on combo points
+        bleed_duration = player.combo_points
+        bleed_damage = 3 + (player.level // 5)
+        
+        from affects import AffectManager
+        affect_data = {
+            'name': 'slice_dice',
+            'type': AffectManager.TYPE_DOT,
+            'applies_to': 'hp',
+            'value': bleed_damage,
+            'duration': bleed_duration,
+            'caster_level': player.level
+        }
+        AffectManager.apply_affect(target, affect_data)
+        
+        await player.send(f"{c['bright_red']}You slice and dice {target.name}! Bleeding for {bleed_damage}/tick for {bleed_duration} ticks!{c['reset']}")
+        if hasattr(target, 'send'):
+            await target.send(f"{c['bright_red']}{player.name} slices you! You're bleeding!{c['reset']}")
+        
+        player.combo_points = 0
+        player.combo_target = None
+
+    
+    # --- THIEF LUCK ABILITIES ---
+
+    @classmethod
+    async def cmd_pocket_sand(cls, player: 'Player', args: List[str]):
+        """Blind your target with pocket sand. Costs 3 Luck. Thief only."""
+        import time
+        c = player.config.COLORS
+        if player.char_class.lower() != 'thief':
+            await player.send(f"{c['red']}Only thieves can use pocket sand!{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['red']}You must be fighting to use this!{c['reset']}")
+            return
+        now = time.time()
+        if now < getattr(player, 'pocket_sand_cooldown', 0):
+            remaining = int(player.pocket_sand_cooldown - now)
+            await player.send(f"{c['yellow']}Pocket Sand on cooldown ({remaining}s).{c['reset']}")
+            return
+        from talents import TalentManager
+        cost = 3
+        fw_rank = TalentManager.get_talent_rank(player, 'fortune_wheel')
+        cost -= fw_rank // 2
+        cost = max(1, cost)
+        if player.luck_points < cost:
+            await player.send(f"{c['red']}You need {cost} Luck! (Current: {player.luck_points}/10){c['reset']}")
+            return
+        player.luck_points -= cost
+        player.pocket_sand_cooldown = now + 20
+        target = player.fighting
+        blind_rounds = 2
+        dirty_rank = TalentManager.get_talent_rank(player, 'dirty_fighting')
+        blind_rounds += dirty_rank
+        target.blinded_rounds = blind_rounds
+        target.blinded_until = now + blind_rounds * 4
+        await player.send(f"{c['bright_yellow']}You throw sand in {target.name}'s eyes! Blinded for {blind_rounds} rounds!{c['reset']}")
+        if hasattr(target, 'send'):
+            await target.send(f"{c['red']}{player.name} throws sand in your eyes! You can't see!{c['reset']}")
+        await player.room.send_to_room(f"{player.name} throws sand in {target.name}'s face!", exclude=[player, target])
+        # Vanishing act talent
+        if TalentManager.has_talent(player, 'vanishing_act'):
+            player.flags.add('hidden')
+            await player.send(f"{c['cyan']}You vanish into the shadows!{c['reset']}")
+
+    @classmethod
+    async def cmd_low_blow(cls, player: 'Player', args: List[str]):
+        """Stun target for 1 round + weapon damage. Costs 5 Luck. Thief only."""
+        import time
+        c = player.config.COLORS
+        if player.char_class.lower() != 'thief':
+            await player.send(f"{c['red']}Only thieves can use low blow!{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
+            return
+        now = time.time()
+        if now < getattr(player, 'low_blow_cooldown', 0):
+            remaining = int(player.low_blow_cooldown - now)
+            await player.send(f"{c['yellow']}Low Blow on cooldown ({remaining}s).{c['reset']}")
+            return
+        from talents import TalentManager
+        cost = 5
+        fw_rank = TalentManager.get_talent_rank(player, 'fortune_wheel')
+        cost -= fw_rank // 2
+        cost = max(1, cost)
+        if player.luck_points < cost:
+            await player.send(f"{c['red']}You need {cost} Luck! (Current: {player.luck_points}/10){c['reset']}")
+            return
+        player.luck_points -= cost
+        player.low_blow_cooldown = now + 30
+        target = player.fighting
+        from combat import CombatHandler
+        weapon = player.equipment.get('wield')
+        if weapon and hasattr(weapon, 'damage_dice'):
+            damage = CombatHandler.roll_dice(weapon.damage_dice)
+        else:
+            damage = random.randint(1, 6)
+        damage += player.get_damage_bonus()
+        damage = max(1, damage)
+        target.stunned_rounds = 1
+        # Marked man talent
+        if TalentManager.has_talent(player, 'marked_man'):
+            target.marked_man_until = now + 10
+        await player.send(f"{c['bright_red']}You deliver a devastating low blow to {target.name}! [{damage}] STUNNED!{c['reset']}")
+        if hasattr(target, 'send'):
+            await target.send(f"{c['red']}{player.name} hits you below the belt! You're stunned!{c['reset']}")
+        killed = await target.take_damage(damage, player)
+        if killed:
+            await CombatHandler.handle_death(player, target)
+
+    @classmethod
+    async def cmd_rigged_dice(cls, player: 'Player', args: List[str]):
+        """Next 3 attacks are guaranteed crits. Costs 7 Luck. Thief only."""
+        import time
+        c = player.config.COLORS
+        if player.char_class.lower() != 'thief':
+            await player.send(f"{c['red']}Only thieves can use rigged dice!{c['reset']}")
+            return
+        now = time.time()
+        if now < getattr(player, 'rigged_dice_cooldown', 0):
+            remaining = int(player.rigged_dice_cooldown - now)
+            await player.send(f"{c['yellow']}Rigged Dice on cooldown ({remaining}s).{c['reset']}")
+            return
+        from talents import TalentManager
+        cost = 7
+        fw_rank = TalentManager.get_talent_rank(player, 'fortune_wheel')
+        cost -= fw_rank // 2
+        cost = max(1, cost)
+        if player.luck_points < cost:
+            await player.send(f"{c['red']}You need {cost} Luck! (Current: {player.luck_points}/10){c['reset']}")
+            return
+        player.luck_points -= cost
+        player.rigged_dice_cooldown = now + 45
+        player.rigged_dice_hits = 3
+        await player.send(f"{c['bright_yellow']}🎲 You pull out your loaded dice... next 3 attacks are GUARANTEED CRITS!{c['reset']}")
+
+    @classmethod
+    async def cmd_jackpot(cls, player: 'Player', args: List[str]):
+        """Massive damage + steal gold. Costs 10 Luck. Thief only."""
+        import time
+        c = player.config.COLORS
+        if player.char_class.lower() != 'thief':
+            await player.send(f"{c['red']}Only thieves can hit the jackpot!{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
+            return
+        now = time.time()
+        if now < getattr(player, 'jackpot_cooldown', 0):
+            remaining = int(player.jackpot_cooldown - now)
+            await player.send(f"{c['yellow']}Jackpot on cooldown ({remaining}s).{c['reset']}")
+            return
+        from talents import TalentManager
+        cost = 10
+        fw_rank = TalentManager.get_talent_rank(player, 'fortune_wheel')
+        cost -= fw_rank // 2
+        cost = max(1, cost)
+        if player.luck_points < cost:
+            await player.send(f"{c['red']}You need {cost} Luck! (Current: {player.luck_points}/10){c['reset']}")
+            return
+        player.luck_points -= cost
+        player.jackpot_cooldown = now + 60
+        target = player.fighting
+        from combat import CombatHandler
+        weapon = player.equipment.get('wield')
+        if weapon and hasattr(weapon, 'damage_dice'):
+            damage = CombatHandler.roll_dice(weapon.damage_dice) * 4
+        else:
+            damage = random.randint(4, 24)
+        damage += player.get_damage_bonus() * 2
+        damage = max(1, damage)
+        # Steal gold
+        stolen_gold = int(getattr(target, 'gold', 0) * 0.25)
+        if stolen_gold > 0:
+            target.gold -= stolen_gold
+            player.gold += stolen_gold
+        # Jackpot master talent
+        if TalentManager.has_talent(player, 'jackpot_master'):
+            target.stunned_rounds = getattr(target, 'stunned_rounds', 0) + 1
+            heal = int(player.max_hp * 0.10)
+            player.hp = min(player.max_hp, player.hp + heal)
+            await player.send(f"{c['bright_green']}Jackpot Master! Stun + heal {heal} HP!{c['reset']}")
+        # Grand heist talent
+        if TalentManager.has_talent(player, 'grand_heist') and hasattr(target, 'inventory') and target.inventory:
+            stolen_item = random.choice(target.inventory)
+            target.inventory.remove(stolen_item)
+            player.inventory.append(stolen_item)
+            await player.send(f"{c['bright_cyan']}Grand Heist! You stole {stolen_item.short_desc}!{c['reset']}")
+        await player.send(f"{c['bright_yellow']}💰💰💰 JACKPOT! You devastate {target.name} for [{damage}] damage!{c['reset']}")
+        if stolen_gold > 0:
+            await player.send(f"{c['yellow']}You steal {stolen_gold} gold coins!{c['reset']}")
+        if hasattr(target, 'send'):
+            await target.send(f"{c['red']}{player.name} hits the JACKPOT on you! [{damage}]{c['reset']}")
+        killed = await target.take_damage(damage, player)
+        if killed:
+            await CombatHandler.handle_death(player, target)
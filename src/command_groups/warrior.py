@@ -0,0 +1,334 @@
+"""
+Misthollow Warrior Commands
+==========================
+Warrior rage, stances and shouts.
+"""
+
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class WarriorCommands:
+    """Warrior commands."""
+
+    @classmethod
+    async def cmd_rage(cls, player: 'Player', args: List[str]):
+        """Display current rage level."""
+        c = player.config.COLORS
+        
+        if player.char_class.lower() != 'warrior':
+            await player.send(f"{c['red']}Only warriors can harness rage!{c['reset']}")
+            return
+        
+        rage_bar = cls._make_bar(player.rage, player.max_rage, 20, c['bright_red'], c['red'])
+        stance_colors = {
+            'battle': c['white'],
+            'berserk': c['bright_red'],
+            'defensive': c['bright_blue'],
+            'precision': c['bright_yellow']
+        }
+        stance_color = stance_colors.get(player.stance, c['white'])
+        
+        await player.send(f"{c['bright_red']}╔═══════════════════════════════════════╗{c['reset']}")
+        await player.send(f"{c['bright_red']}║{c['bright_yellow']}  ⚔  WARRIOR STATUS  ⚔                 {c['bright_red']}║{c['reset']}")
+        await player.send(f"{c['bright_red']}╠═══════════════════════════════════════╣{c['reset']}")
+        await player.send(f"{c['bright_red']}║ {c['white']}Rage: {rage_bar} {player.rage}/{player.max_rage}")
+        await player.send(f"{c['bright_red']}║ {c['white']}Stance: {stance_color}{player.stance.title()}{c['reset']}")
+        if player.ignore_pain_absorb > 0:
+            await player.send(f"{c['bright_red']}║ {c['cyan']}Ignore Pain: {player.ignore_pain_absorb} damage remaining{c['reset']}")
+        await player.send(f"{c['bright_red']}╠═══════════════════════════════════════╣{c['reset']}")
+        await player.send(f"{c['bright_red']}║ {c['cyan']}Rage Abilities:{c['reset']}")
+        await player.send(f"{c['bright_red']}║   {c['yellow']}ignorepain{c['white']} (20) - Absorb damage{c['reset']}")
+        await player.send(f"{c['bright_red']}║   {c['yellow']}warcry{c['white']} (30) - Fear enemies, buff allies{c['reset']}")
+        await player.send(f"{c['bright_red']}║   {c['yellow']}rampage{c['white']} (40) - Attack all enemies{c['reset']}")
+        await player.send(f"{c['bright_red']}║   {c['yellow']}execute{c['white']} (50) - Devastating finisher{c['reset']}")
+        await player.send(f"{c['bright_red']}╚═══════════════════════════════════════╝{c['reset']}")
+    
+    @classmethod
+    async def cmd_stance(cls, player: 'Player', args: List[str]):
+        """Set combat stance (aggressive/normal/defensive)."""
+        c = player.config.COLORS
+        stance_mods = player.config.STANCE_MODIFIERS
+        if not args:
+            current = getattr(player, 'stance', 'normal')
+            mods = stance_mods.get(current, stance_mods['normal'])
+            await player.send(
+                f"{c['white']}Current stance:{c['reset']} {c['bright_cyan']}{current.title()}{c['reset']} "
+                f"(Hit {mods.get('hit', 0):+d}, Dam {mods.get('dam', 0):+d}, AC {mods.get('ac', 0):+d})"
+            )
+            await player.send(
+                f"{c['white']}Available:{c['reset']} aggressive, normal, defensive"
+            )
+            await player.send(f"{c['yellow']}Tip:{c['reset']} Warrior doctrine status is now under {c['white']}doctrine{c['reset']}.")
+            return
+
+        requested = args[0].lower()
+        mapping = {
+            'agg': 'aggressive',
+            'aggressive': 'aggressive',
+            'norm': 'normal',
+            'normal': 'normal',
+            'def': 'defensive',
+            'defensive': 'defensive',
+        }
+        stance = mapping.get(requested)
+        if not stance:
+            await player.send(f"{c['red']}Invalid stance. Use: aggressive, normal, defensive.{c['reset']}")
+            return
+
+        player.stance = stance
+        mods = stance_mods.get(stance, stance_mods['normal'])
+        await player.send(
+            f"{c['green']}You shift to {stance.title()} stance.{c['reset']} "
+            f"(Hit {mods.get('hit', 0):+d}, Dam {mods.get('dam', 0):+d}, AC {mods.get('ac', 0):+d})"
+        )
+
+    @classmethod
+    async def cmd_doctrine(cls, player: 'Player', args: List[str]):
+        """View your War Doctrine and progression."""
+        c = player.config.COLORS
+        if player.char_class.lower() != 'warrior':
+            await player.send(f"{c['red']}Only warriors use doctrines!{c['reset']}")
+            return
+        from warrior_abilities import cmd_doctrine
+        await cmd_doctrine(player, args)
+
+    @classmethod
+    async def cmd_swear(cls, player: 'Player', args: List[str]):
+        """Swear to a War Doctrine."""
+        c = player.config.COLORS
+        if player.char_class.lower() != 'warrior':
+            await player.send(f"{c['red']}Only warriors can swear doctrines!{c['reset']}")
+            return
+        from warrior_abilities import cmd_swear
+        await cmd_swear(player, args)
+
+    @classmethod
+    async def cmd_evolve(cls, player: 'Player', args: List[str]):
+        """Evolve warrior abilities."""
+        c = player.config.COLORS
+        if player.char_class.lower() != 'warrior':
+            await player.send(f"{c['red']}Only warriors evolve abilities!{c['reset']}")
+            return
+        from warrior_abilities import cmd_evolve
+        await cmd_evolve(player, args)
+
+    @classmethod
+    async def cmd_strike(cls, player: 'Player', args: List[str]):
+        """Strike - Enhanced basic attack for warriors."""
+        c = player.config.COLORS
+        if player.char_class.lower() != 'warrior':
+            await player.send(f"{c['red']}Only warriors can use strike!{c['reset']}")
+            return
+        from warrior_abilities import do_strike
+        await do_strike(player, args)
+
+    @classmethod
+    async def cmd_rally(cls, player: 'Player', args: List[str]):
+        """Rally - Self-buff/recovery for warriors."""
+        c = player.config.COLORS
+        if player.char_class.lower() != 'warrior':
+            await player.send(f"{c['red']}Only warriors can rally!{c['reset']}")
+            return
+        from warrior_abilities import do_rally
+        await do_rally(player, args)
+    
+    @classmethod
+    async def cmd_execute(cls, player: 'Player', args: List[str]):
+        """Execute — Finisher for warriors. Target must be below 25% HP."""
+        c = player.config.COLORS
+        if player.char_class.lower() != 'warrior':
+            await player.send(f"{c['red']}Only warriors can execute!{c['reset']}")
+            return
+        from warrior_abilities import do_execute
+        await do_execute(player, args)
+    
+    @classmethod
+    async def cmd_rampage(cls, player: 'Player', args: List[str]):
+        """Legacy ability. Use doctrine abilities instead."""
+        c = player.config.COLORS
+        await player.send(f"{c['yellow']}Rampage has been replaced by the Doctrine system. See 'help warrior'.{c['reset']}")
+    
+    @classmethod
+    async def cmd_warcry(cls, player: 'Player', args: List[str]):
+        """Legacy ability. Replaced by Doctrine system."""
+        c = player.config.COLORS
+        await player.send(f"{c['yellow']}War Cry has been replaced by the Doctrine system. See 'help warrior'.{c['reset']}")
+    
+    @classmethod
+    async def cmd_ignorepain(cls, player: 'Player', args: List[str]):
+        """Legacy ability. Replaced by Doctrine system."""
+        c = player.config.COLORS
+        await player.send(f"{c['yellow']}Ignore Pain has been replaced by the Doctrine system. See 'help warrior'.{c['reset']}")
+    
+    @classmethod
+    async def cmd_battleshout(cls, player: 'Player', args: List[str]):
+        """Legacy ability. Replaced by Doctrine system."""
+        c = player.config.COLORS
+        await player.send(f"{c['yellow']}Battle Shout has been replaced by the Doctrine system. Use 'rally' instead. See 'help warrior'.{c['reset']}")
+    
+    @classmethod
+    async def cmd_rescue(cls, player: 'Player', args: List[str]):
+        """Rescue an ally from combat, becoming the new target."""
+        c = player.config.COLORS
+        import random, time
+        from combat import CombatHandler
+        
+        if player.char_class.lower() not in ('warrior', 'paladin'):
+            await player.send(f"{c['red']}Only warriors and paladins can rescue!{c['reset']}")
+            return
+        
+        if 'rescue' not in player.skills:
+            await player.send(f"{c['red']}You haven't learned rescue!{c['reset']}")
+            return
+
+        now = time.time()
+        if now < getattr(player, 'rescue_cooldown_until', 0):
+            remaining = int(max(0, getattr(player, 'rescue_cooldown_until', 0) - now))
+            await player.send(f"{c['yellow']}You need {remaining}s before you can rescue again.{c['reset']}")
+            return
+        
+        if not args:
+            if hasattr(player, "fighting") and player.fighting:
+                target = player.fighting
+                args = [target.name]
+            else:
+                await player.send(f"{c['yellow']}Rescue whom?{c['reset']}")
+                return
+        
+        target_name = ' '.join(args).lower()
+        
+        # Find the ally to rescue
+        ally = None
+        for char in player.room.characters:
+            from mobs import Mobile
+            if not isinstance(char, Mobile) and char != player:
+                if target_name in char.name.lower():
+                    ally = char
+                    break
+        
+        if not ally:
+            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
+            return
+        
+        if not ally.is_fighting:
+            await player.send(f"{c['yellow']}{ally.name} isn't fighting anyone!{c['reset']}")
+            return
+        
+        attacker = ally.fighting
+        if not attacker:
+            await player.send(f"{c['yellow']}{ally.name} has no attacker to rescue from!{c['reset']}")
+            return
+        
+        skill_level = CombatHandler.get_rescue_chance(player, ally, attacker)
+        player.rescue_cooldown_until = now + player.config.RESCUE_COOLDOWN_SECONDS
+        player.add_wait_state('rescue')
+        
+        if random.randint(1, 100) <= skill_level:
+            # Successful rescue
+            await player.send(f"{c['bright_green']}You heroically rescue {ally.name} from {attacker.name}!{c['reset']}")
+            if hasattr(ally, 'send'):
+                await ally.send(f"{c['bright_green']}{player.name} rescues you from {attacker.name}!{c['reset']}")
+            if hasattr(attacker, 'send'):
+                await attacker.send(f"{c['red']}{player.name} wrests {ally.name} away from you!{c['reset']}")
+            if player.room:
+                await player.room.send_to_room(
+                    f"{c['cyan']}{player.name} heroically rescues {ally.name}!{c['reset']}",
+                    exclude=[player, ally]
+                )
+
+            # Skill progression hook
+            try:
+                if hasattr(player, 'improve_skill'):
+                    await player.improve_skill('rescue', difficulty=6)
+            except Exception:
+                pass
+            
+            # Switch aggro
+            ally.fighting = None
+            ally.position = 'standing'
+            
+            attacker.fighting = player
+            player.fighting = attacker
+            player.position = 'fighting'
+            if hasattr(player, 'target'):
+                player.target = attacker
+            
+            # Gain rage for the heroic act
+            if player.char_class.lower() == 'warrior':
+                player.rage = min(player.max_rage, player.rage + 15)
+                await player.send(f"{c['red']}(+15 rage){c['reset']}")
+        else:
+            await player.send(f"{c['yellow']}You fail to rescue {ally.name}!{c['reset']}")
+            # Low-noise failure visibility for involved parties
+            if hasattr(ally, 'send'):
+                await ally.send(f"{c['yellow']}{player.name} tries to rescue you, but fails.{c['reset']}")
+            if hasattr(attacker, 'send'):
+                await attacker.send(f"{c['cyan']}{player.name} attempts to pull {ally.name} away from you, but fails.{c['reset']}")
+    
+    @classmethod
+    async def cmd_disarm(cls, player: 'Player', args: List[str]):
+        """Disarm — Chain ability (🟡) for warriors. Disarm target for 2 rounds. 15s CD."""
+        import time, random
+        c = player.config.COLORS
+
+        if 'disarm' not in player.skills:
+            await player.send(f"{c['red']}You don't know how to disarm!{c['reset']}")
+            return
+        if not player.is_fighting:
+            await player.send(f"{c['red']}You need to be fighting someone to disarm them!{c['reset']}")
+            return
+
+        target = player.fighting
+        if args:
+            t = player.find_target_in_room(' '.join(args))
+            if t:
+                target = t
+        if not target:
+            await player.send(f"{c['red']}You have no target!{c['reset']}")
+            return
+
+        now = time.time()
+        cd = getattr(player, 'disarm_cooldown', 0)
+        if now < cd:
+            await player.send(f"{c['yellow']}Disarm on cooldown ({int(cd - now)}s).{c['reset']}")
+            return
+        player.disarm_cooldown = now + 15
+
+        target_weapon = None
+        if hasattr(target, 'equipment'):
+            target_weapon = target.equipment.get('wield')
+
+        if not target_weapon:
+            await player.send(f"{c['yellow']}{target.name} isn't wielding a weapon!{c['reset']}")
+            return
+
+        player.add_wait_state('disarm')
+        skill_level = player.skills.get('disarm', 50)
+        level_diff = getattr(target, 'level', 1) - player.level
+        chance = skill_level - (level_diff * 5)
+
+        if random.randint(1, 100) <= chance:
+            target.equipment['wield'] = None
+            if hasattr(player.room, 'items'):
+                player.room.items.append(target_weapon)
+
+            await player.send(f"{c['bright_green']}You disarm {target.name}! Their {target_weapon.name} clatters to the ground!{c['reset']}")
+
+            if hasattr(target, 'send'):
+                await target.send(f"{c['bright_red']}{player.name} disarms you!{c['reset']}")
+            if player.room:
+                await player.room.send_to_room(f"{player.name} disarms {target.name}!", exclude=[player, target])
+        else:
+            await player.send(f"{c['yellow']}You fail to disarm {target.name}!{c['reset']}")
+
+    
+    # ----- WARRIOR: Battle Cry -----
+
+    @classmethod
+    async def cmd_battle_cry(cls, player: 'Player', args: List[str]):
+        """Legacy ability. Replaced by Combo Chain system. See HELP WARRIOR."""
+        c = player.config.COLORS
+        await player.send(f"{c['yellow']}Battle Cry has been replaced by the Combo Chain system. See 'help warrior'.{c['reset']}")
@@ -0,0 +1,292 @@
+"""
+Misthollow Command Registry
+==========================
+Name resolution for ``CommandHandler``, precompiled once at import time.
+
+Every ``cmd_*`` method is indexed four ways:
+
+    exact       'shadow_step'  -> 'shadow_step'
+    squashed    'shadowstep'   -> 'shadow_step' (underscores ignored)
+    prefix      'shadow_s'     -> best command starting with the input
+    sq. prefix  'shadows'      -> best command whose squashed name starts with it
+
+The built-in ``ALIASES`` and ``COMMAND_ALIASES`` are folded into one table
+with the same chaining as before (an ALIASES result may be a
+COMMAND_ALIASES key). Each prefix trie node stores the command that wins for
+that prefix, so abbreviations resolve in O(length of input) with no scan of
+the class. The winner is the shortest name, with ties going alphabetically.
+That is the order the old ``dir()`` scan produced.
+
+The commands themselves live in the ``command_groups`` package.
+``CommandGroups`` indexes which group defines each name by parsing the
+group class body in each module's source, so the registry is built without
+importing any of them. Parsing all of them costs more than the imports it
+saves, so the names are cached in ``__pycache__`` next to the bytecode and
+a module is only parsed again when its source changes.
+``LazyCommandGroups`` is the handler's metaclass: the first lookup of a
+name the handler doesn't have yet imports the owning group and copies its
+class attributes onto the handler. ``CommandGroups.reload`` swaps one
+group for a fresh import of its module.
+"""
+
+import ast
+import importlib
+import json
+import logging
+import os
+import sys
+from typing import Dict, List, Optional
+
+logger = logging.getLogger('Misthollow.Commands')
+
+# Group -> names cache, kept with the package's bytecode
+_INDEX_FILE = 'command_index.json'
+
+
+def command_priority(name: str):
+    """Sort key for prefix matches: lower wins."""
+    return (len(name), name)
+
+
+class _PrefixTrie:
+    """Character trie whose nodes remember their best command."""
+
+    __slots__ = ('_root',)
+
+    def __init__(self):
+        self._root = [{}, None]  # [children, best]
+
+    def add(self, key: str, name: str):
+        node = self._root
+        for ch in key:
+            best = node[1]
+            if best is None or command_priority(name) < command_priority(best):
+                node[1] = name
+            child = node[0].get(ch)
+            if child is None:
+                child = node[0][ch] = [{}, None]
+            node = child
+        best = node[1]
+        if best is None or command_priority(name) < command_priority(best):
+            node[1] = name
+
+    def best(self, prefix: str) -> Optional[str]:
+        node = self._root
+        for ch in prefix:
+            node = node[0].get(ch)
+            if node is None:
+                return None
+        return node[1]
+
+
+def _is_dunder(name: str) -> bool:
+    return name.startswith('__') and name.endswith('__')
+
+
+def _class_names(source: str, filename: str) -> List[str]:
+    """Methods and class attributes defined in the body of the module's one class."""
+    classes = [node for node in ast.parse(source, filename).body if isinstance(node, ast.ClassDef)]
+    if len(classes) != 1:
+        raise ValueError(f"{filename} must define exactly one class")
+    names = []
+    for node in classes[0].body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            targets = [node.name]
+        elif isinstance(node, ast.Assign):
+            targets = [t.id for t in node.targets if isinstance(t, ast.Name)]
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            targets = [node.target.id]
+        else:
+            continue
+        names.extend(name for name in targets if not _is_dunder(name) and name not in names)
+    return names
+
+
+class CommandGroups:
+    """Which group module defines each handler attribute, and which are loaded."""
+
+    def __init__(self, handler_cls, package):
+        self.handler = handler_cls
+        self.package = package.__name__
+        self.groups: Dict[str, str] = dict(package.GROUPS)  # module -> description
+        self._dir = os.path.dirname(package.__file__)
+        self._core = set(vars(handler_cls))  # Defined on the handler itself
+        self.owner: Dict[str, str] = {}      # attribute -> group
+        self.loaded: Dict[str, List[str]] = {}  # group -> attributes it attached
+        self._index_path = os.path.join(self._dir, '__pycache__', _INDEX_FILE)
+        self._index = self._read_index()
+        stale = False
+        for group in self.groups:
+            stale |= self._index.get(group, {}).get('stamp') != self._stamp(group)
+            self.owner.update(self._scan(group, self.owner))
+        if stale:
+            self._write_index()
+
+    def _read_index(self) -> dict:
+        try:
+            with open(self._index_path, encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def _write_index(self):
+        if sys.dont_write_bytecode:
+            return
+        try:
+            os.makedirs(os.path.dirname(self._index_path), exist_ok=True)
+            with open(self._index_path, 'w', encoding='utf-8') as f:
+                json.dump(self._index, f)
+        except OSError as e:
+            logger.debug(f"Could not write command index: {e}")
+
+    def _stamp(self, group: str) -> List[int]:
+        st = os.stat(os.path.join(self._dir, group + '.py'))
+        return [st.st_mtime_ns, st.st_size]
+
+    def _source_names(self, group: str, fresh: bool = False) -> List[str]:
+        """Names ``group``'s class defines, from the index unless its source changed."""
+        stamp = self._stamp(group)
+        entry = self._index.get(group)
+        if not fresh and entry and entry.get('stamp') == stamp:
+            return entry['names']
+        path = os.path.join(self._dir, group + '.py')
+        with open(path, encoding='utf-8') as f:
+            names = _class_names(f.read(), path)
+        self._index[group] = {'stamp': stamp, 'names': names}
+        return names
+
+    def _scan(self, group: str, owner: Dict[str, str], fresh: bool = False) -> Dict[str, str]:
+        """Names ``group``'s source defines; ValueError if one is already taken."""
+        names = {}
+        for name in self._source_names(group, fresh):
+            other = 'CommandHandler' if name in self._core else owner.get(name)
+            if other is not None:
+                raise ValueError(f"{group} defines {name}, which {other} already has")
+            names[name] = group
+        return names
+
+    def names(self) -> List[str]:
+        """Every attribute the handler has or can load."""
+        return sorted(self._core | set(self.owner))
+
+    def group_of(self, name: str) -> Optional[str]:
+        return self.owner.get(name)
+
+    def _attach(self, group: str, module):
+        classes = [obj for obj in vars(module).values()
+                   if isinstance(obj, type) and obj.__module__ == module.__name__]
+        if len(classes) != 1:
+            raise ValueError(f"{module.__name__} must define exactly one class")
+        attrs = {name: value for name, value in vars(classes[0]).items() if not _is_dunder(name)}
+        unindexed = [name for name in attrs if self.owner.get(name) != group]
+        if unindexed:
+            logger.warning(f"Command group {group} defines names its source scan missed: "
+                           f"{', '.join(unindexed)}")
+        for name in self.loaded.pop(group, ()):
+            if name not in attrs:
+                delattr(self.handler, name)
+        for name, value in attrs.items():
+            setattr(self.handler, name, value)
+        self.loaded[group] = list(attrs)
+
+    def load(self, group: str):
+        """Import ``group`` and attach its commands to the handler."""
+        self._attach(group, importlib.import_module(f"{self.package}.{group}"))
+        logger.debug(f"Loaded command group {group} ({len(self.loaded[group])} names)")
+
+    def reload(self, group: str) -> int:
+        """Re-import ``group`` from disk; returns how many names it now defines.
+
+        Nothing changes if the new source clashes with another group or
+        fails to import.
+        """
+        if group not in self.groups:
+            raise KeyError(group)
+        others = {name: g for name, g in self.owner.items() if g != group}
+        names = self._scan(group, others, fresh=True)
+        module_name = f"{self.package}.{group}"
+        module = sys.modules.get(module_name)
+        module = importlib.reload(module) if module else importlib.import_module(module_name)
+        self.owner = dict(others, **names)
+        self._write_index()
+        self._attach(group, module)
+        logger.info(f"Reloaded command group {group} ({len(names)} names)")
+        return len(names)
+
+
+class LazyCommandGroups(type):
+    """Metaclass that loads a command group on the first lookup of one of its names."""
+
+    def __getattr__(cls, name):
+        groups = cls.__dict__.get('groups')
+        group = groups.owner.get(name) if groups is not None and not _is_dunder(name) else None
+        if group is None or group in groups.loaded:
+            raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+        groups.load(group)
+        return getattr(cls, name)
+
+
+class CommandRegistry:
+    """Precompiled command lookups for a handler class."""
+
+    PREFIX = 'cmd_'
+
+    def __init__(self, handler_cls, aliases: Dict[str, str] = None,
+                 command_aliases: Dict[str, str] = None, groups: CommandGroups = None):
+        self.handler = handler_cls
+        self.groups = groups
+        self.commands: Dict[str, str] = {}  # command name -> method name
+        self.squashed: Dict[str, str] = {}  # name without underscores -> command name
+        self.aliases: Dict[str, str] = {}   # built-in alias -> command word
+        self._prefix = _PrefixTrie()
+        self._squashed_prefix = _PrefixTrie()
+        self.rebuild(aliases or {}, command_aliases or {})
+
+    def rebuild(self, aliases: Dict[str, str], command_aliases: Dict[str, str]):
+        """Index every ``cmd_*`` on the handler class (or its groups) and the alias tables."""
+        prefix = self.PREFIX
+        if self.groups is not None:
+            attrs = self.groups.names()
+        else:
+            attrs = [attr for attr in dir(self.handler) if callable(getattr(self.handler, attr))]
+        names = sorted(attr[len(prefix):] for attr in attrs if attr.startswith(prefix))
+        self.commands = {name: prefix + name for name in names}
+        self.squashed = {}
+        self._prefix = _PrefixTrie()
+        self._squashed_prefix = _PrefixTrie()
+        for name in names:
+            squashed = name.replace('_', '')
+            self.squashed.setdefault(squashed, name)  # First alphabetically wins
+            self._prefix.add(name, name)
+            self._squashed_prefix.add(squashed, name)
+
+        self.aliases = {}
+        for key in set(aliases) | set(command_aliases):
+            word = aliases.get(key, key)
+            self.aliases[key] = command_aliases.get(word, word)
+
+    def names(self) -> List[str]:
+        """Every command name, sorted."""
+        return list(self.commands)
+
+    def has(self, name: str) -> bool:
+        return name in self.commands
+
+    def method(self, name: str):
+        """The handler method for an exact command name, or None."""
+        attr = self.commands.get(name)
+        return getattr(self.handler, attr) if attr else None
+
+    def lookup(self, word: str) -> Optional[str]:
+        """Command for a full name: exact, spaces as underscores, or underscore-free."""
+        if word in self.commands:
+            return word
+        underscored = word.replace(' ', '_')
+        if underscored in self.commands:
+            return underscored
+        return self.squashed.get(word.replace('_', '').replace(' ', ''))
+
+    def complete(self, word: str) -> Optional[str]:
+        """Best command ``word`` abbreviates, with or without its underscores."""
+        return self._prefix.best(word) or self._squashed_prefix.best(word.replace('_', ''))
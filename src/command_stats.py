@@ -0,0 +1,208 @@
+"""
+Misthollow Command Stats
+=======================
+Per-command timing for ``CommandHandler.execute``.
+
+Every dispatch is timed and filed under the command it resolved to
+(``l`` and ``look`` both count as ``look``), so the report shows which
+commands the server actually spends its time on:
+
+    calls       lifetime invocations
+    total ms    lifetime time spent, the column to sort by for CPU hogs
+    p50/p99     over a rolling window of recent calls
+
+A run slower than ``SLOW_COMMAND_MS`` is logged with the player and the
+arguments, and kept in a short list for ``cmdstats slowlog``.
+
+Allocation tracking is off by default. When it is on, ``tracemalloc``
+records the peak bytes allocated while each command runs. That slows the
+whole server noticeably, so it is meant to be switched on for a while
+with ``cmdstats alloc on`` and off again.
+"""
+
+import logging
+import time
+import tracemalloc
+from collections import deque
+from typing import Dict, List, Optional
+
+from tick_profiler import RollingHistogram
+
+logger = logging.getLogger('Misthollow.CommandStats')
+
+# Longest argument string kept in the slow log
+ARGS_LIMIT = 80
+
+
+class CommandTimings:
+    """Counters for one command."""
+
+    __slots__ = ('latency', 'alloc_kb', 'slow')
+
+    def __init__(self, window: int):
+        self.latency = RollingHistogram(window)   # ms
+        self.alloc_kb = RollingHistogram(window)  # peak KB, only while tracking
+        self.slow = 0
+
+
+class CommandStats:
+    """Server-wide per-command timings and the slow-command log."""
+
+    def __init__(self, slow_ms: float, slow_log: int = 100, window: int = 500,
+                 track_alloc: bool = False):
+        self.slow_ms = slow_ms
+        self.window = window
+        self.commands: Dict[str, CommandTimings] = {}
+        self.slow_log: deque = deque(maxlen=slow_log)
+        self.started_at = time.time()
+        self.tracking_alloc = False
+        if track_alloc:
+            self.start_alloc_tracking()
+
+    def start(self) -> tuple:
+        """Token for ``finish``; taken just before the command is dispatched."""
+        if self.tracking_alloc:
+            tracemalloc.reset_peak()
+            return time.perf_counter(), tracemalloc.get_traced_memory()[0]
+        return time.perf_counter(), None
+
+    def finish(self, token: tuple, name: Optional[str], player, args: List[str]):
+        """Record a finished dispatch; ``name`` is None for unknown commands."""
+        started, memory = token
+        ms = (time.perf_counter() - started) * 1000.0
+        if name is None:
+            return
+        timings = self.commands.get(name)
+        if timings is None:
+            timings = self.commands[name] = CommandTimings(self.window)
+        timings.latency.record(ms)
+        alloc_kb = None
+        if memory is not None and self.tracking_alloc:
+            alloc_kb = max(0, tracemalloc.get_traced_memory()[1] - memory) / 1024.0
+            timings.alloc_kb.record(alloc_kb)
+        if ms >= self.slow_ms:
+            timings.slow += 1
+            self._log_slow(name, ms, player, args, alloc_kb)
+
+    def _log_slow(self, name: str, ms: float, player, args: List[str], alloc_kb: Optional[float]):
+        arg_text = ' '.join(args)
+        if len(arg_text) > ARGS_LIMIT:
+            arg_text = arg_text[:ARGS_LIMIT - 3] + '...'
+        room = getattr(player, 'room', None)
+        entry = {
+            'at': time.time(),
+            'command': name,
+            'args': arg_text,
+            'player': getattr(player, 'name', '?'),
+            'room': getattr(room, 'vnum', None),
+            'ms': round(ms, 2),
+            'alloc_kb': round(alloc_kb, 1) if alloc_kb is not None else None,
+        }
+        self.slow_log.append(entry)
+        typed = f"{name} {arg_text}" if arg_text else name
+        logger.warning(f"Slow command: {entry['player']} '{typed}' took {ms:.1f}ms (room {entry['room']})")
+
+    def start_alloc_tracking(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.tracking_alloc = True
+
+    def stop_alloc_tracking(self):
+        self.tracking_alloc = False
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def reset(self):
+        self.commands.clear()
+        self.slow_log.clear()
+        self.started_at = time.time()
+
+    def rows(self, sort: str = 'total') -> List[dict]:
+        """One row per command, sorted descending by ``sort`` (see SORT_KEYS)."""
+        rows = []
+        for name, timings in self.commands.items():
+            latency = timings.latency
+            pct = latency.percentiles((50, 99))
+            alloc = timings.alloc_kb
+            rows.append({
+                'command': name,
+                'calls': latency.count,
+                'total_ms': round(latency.total_ms, 1),
+                'avg_ms': round(latency.total_ms / latency.count, 3) if latency.count else 0.0,
+                'p50_ms': round(pct[50], 3),
+                'p99_ms': round(pct[99], 3),
+                'max_ms': round(latency.max_ms, 3),
+                'slow': timings.slow,
+                'alloc_p50_kb': round(alloc.percentiles((50,))[50], 1) if alloc.count else None,
+                'alloc_max_kb': round(max(alloc.samples), 1) if alloc.samples else None,
+            })
+        key = SORT_KEYS.get(sort, 'total_ms')
+        rows.sort(key=lambda row: row[key] or 0, reverse=True)
+        return rows
+
+    def snapshot(self, sort: str = 'total') -> dict:
+        """JSON-friendly view for the dashboard."""
+        rows = self.rows(sort)
+        return {
+            'since': self.started_at,
+            'slow_ms': self.slow_ms,
+            'tracking_alloc': self.tracking_alloc,
+            'calls': sum(row['calls'] for row in rows),
+            'total_ms': round(sum(row['total_ms'] for row in rows), 1),
+            'commands': rows,
+            'slow_log': list(self.slow_log),
+        }
+
+    def format_report(self, colors: dict, sort: str = 'total', limit: int = 20) -> List[str]:
+        """Lines for the in-game immortal report."""
+        c = colors
+        rows = self.rows(sort)
+        total_ms = sum(row['total_ms'] for row in rows) or 1.0
+        alloc = self.tracking_alloc or any(row['alloc_p50_kb'] is not None for row in rows)
+        lines = [
+            f"{c['bright_cyan']}=== Command Timings ({len(rows)} commands, "
+            f"{sum(row['calls'] for row in rows):,} calls) ==={c['reset']}",
+            f"  {c['white']}Slow threshold:{c['reset']} {self.slow_ms:g}ms   "
+            f"{c['white']}Allocation tracking:{c['reset']} {'on' if self.tracking_alloc else 'off'}",
+            f"  {c['yellow']}{'Command':<16}{'calls':>8}{'total ms':>11}{'%':>6}{'p50':>8}{'p99':>8}"
+            f"{'max':>9}{'slow':>6}" + (f"{'KB p50':>8}{'KB max':>8}" if alloc else '') + c['reset'],
+        ]
+        for row in rows[:limit]:
+            color = c['red'] if row['p99_ms'] >= self.slow_ms else c['white']
+            line = (f"  {color}{row['command'][:16]:<16}{row['calls']:>8}{row['total_ms']:>11.1f}"
+                    f"{100.0 * row['total_ms'] / total_ms:>6.1f}{row['p50_ms']:>8.2f}{row['p99_ms']:>8.2f}"
+                    f"{row['max_ms']:>9.2f}{row['slow']:>6}")
+            if alloc:
+                line += (f"{row['alloc_p50_kb'] if row['alloc_p50_kb'] is not None else '-':>8}"
+                         f"{row['alloc_max_kb'] if row['alloc_max_kb'] is not None else '-':>8}")
+            lines.append(line + c['reset'])
+        if len(rows) > limit:
+            lines.append(f"  ... {len(rows) - limit} more")
+        return lines
+
+    def format_slow(self, colors: dict, limit: int = 20) -> List[str]:
+        """The most recent slow commands, newest first."""
+        c = colors
+        if not self.slow_log:
+            return [f"{c['green']}No command has taken over {self.slow_ms:g}ms.{c['reset']}"]
+        lines = [f"{c['bright_cyan']}=== Slow Commands (>= {self.slow_ms:g}ms) ==={c['reset']}"]
+        for entry in list(self.slow_log)[::-1][:limit]:
+            when = time.strftime('%H:%M:%S', time.localtime(entry['at']))
+            alloc = f" {entry['alloc_kb']:>8.1f}KB" if entry['alloc_kb'] is not None else ''
+            lines.append(f"  {c['white']}{when}{c['reset']} {entry['ms']:>8.1f}ms{alloc}  "
+                         f"{entry['player']:<12} {c['yellow']}{entry['command']}{c['reset']} "
+                         f"{entry['args']}  {c['bright_black']}(room {entry['room']}){c['reset']}")
+        return lines
+
+
+# cmdstats / dashboard sort argument -> row field
+SORT_KEYS = {
+    'total': 'total_ms',
+    'calls': 'calls',
+    'avg': 'avg_ms',
+    'p50': 'p50_ms',
+    'p99': 'p99_ms',
+    'max': 'max_ms',
+    'slow': 'slow',
+    'alloc': 'alloc_max_kb',
+}
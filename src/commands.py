@@ -1,31 +1,35 @@
 """
 Misthollow Commands
 ==================
-All player commands and their implementations.
+Command dispatch for players.
+
+``CommandHandler`` holds the alias tables and ``execute``. The commands
+themselves live in the ``command_groups`` package, one module per group
+(movement, combat, OLC, immortal, ...). A group is imported the first time
+one of its names is looked up on the handler, and can be reloaded while
+the server runs (``cmdgroup reload <group>``).
 """
 
 import logging
-import random
-import time
 from typing import List, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from player import Player
 
+import command_groups
 from config import Config
-import os
-import json
+from command_registry import CommandGroups, CommandRegistry, LazyCommandGroups
 
 logger = logging.getLogger('Misthollow.Commands')
 
 
-class CommandHandler:
+class CommandHandler(metaclass=LazyCommandGroups):
     """Handles all player commands."""
     
     # Command aliases
     ALIASES = {
         'n': 'north', 's': 'south', 'e': 'east', 'w': 'west',
-        'u': 'up', 'd': 'down',
+        'u': 'up', 'd': 'down', 'run': 'speedwalk',
         'l': 'look', 'ex': 'examine',
         'i': 'inventory', 'inv': 'inventory',
         'eq': 'equipment', 'worn': 'equipment',
@@ -224,18 +228,38 @@ class CommandHandler:
 
     @classmethod
     async def execute(cls, player: 'Player', cmd: str, args: List[str]):
-        """Execute a command."""
+        """Execute a command, timed under the command it resolves to."""
+        stats = getattr(getattr(player, 'world', None), 'command_stats', None)
+        if stats is None:
+            await cls._dispatch(player, cmd, args)
+            return
+        token = stats.start()
+        name = None
+        try:
+            name = await cls._dispatch(player, cmd, args)
+        except Exception:
+            # File the failed run under what the word would have resolved to
+            registry = cls.registry
+            word = registry.aliases.get(cmd, cmd)
+            name = registry.lookup(word) or registry.complete(word) or word
+            raise
+        finally:
+            stats.finish(token, name, player, args)
+
+    @classmethod
+    async def _dispatch(cls, player: 'Player', cmd: str, args: List[str]):
+        """Resolve and run a command; returns the name it ran as (None if unknown)."""
         original_cmd = cmd
 
         # Help pagination - continue if player presses enter
         if not cmd and not args and getattr(player, 'help_pagination', None):
             await cls.continue_help_pagination(player)
-            return
+            return 'help'
 
         # OLC input handling
         if getattr(player, 'olc_state', None):
             await cls.handle_olc_input(player, cmd, args)
-            return
+            return 'olc'
 
         # Clear help pagination on any other input
         if hasattr(player, 'help_pagination'):
@@ -245,86 +269,51 @@ class CommandHandler:
         if cmd in player.custom_aliases:
             cmd = player.custom_aliases[cmd]
 
-        # Check built-in aliases
-        cmd = cls.ALIASES.get(cmd, cmd)
-
-        # Also check COMMAND_ALIASES (underscore-free shortcuts)
-        cmd = cls.COMMAND_ALIASES.get(cmd, cmd)
+        # Built-in aliases (ALIASES, then COMMAND_ALIASES underscore-free shortcuts)
+        registry = cls.registry
+        cmd = registry.aliases.get(cmd, cmd)
 
         # Hard-route MUME-style change commands to avoid prefix collisions (e.g., changelog)
         if cmd in ('change', 'chang', 'ch') and args:
             sub = args[0].lower()
             if sub in ('mood', 'stance', 'emood', 'chgmode'):
                 await cls.cmd_stance(player, args[1:])
-                return
+                return 'stance'
             if sub == 'wimpy':
                 await cls.cmd_wimpy(player, args[1:])
-                return
+                return 'wimpy'
             if sub in ('color', 'colour'):
                 await cls.cmd_color(player, args[1:])
-                return
+                return 'color'
 
         # Try combining cmd + first arg as underscore-separated command
         # e.g., "shadow step goblin" -> try cmd_shadow_step with args ["goblin"]
-        if args and not getattr(cls, f'cmd_{cmd}', None):
+        if args and not registry.has(cmd):
             combined = f"{cmd}_{args[0]}"
-            if getattr(cls, f'cmd_{combined}', None) or cls.COMMAND_ALIASES.get(cmd + args[0], None) or cls.ALIASES.get(cmd + '_' + args[0], None):
-                if getattr(cls, f'cmd_{combined}', None):
-                    cmd = combined
-                    args = args[1:]
-                elif cls.COMMAND_ALIASES.get(cmd + args[0]):
-                    cmd = cls.COMMAND_ALIASES[cmd + args[0]]
-                    args = args[1:]
-
-        # Try exact match first
-        method_name = f'cmd_{cmd}'
-        method = getattr(cls, method_name, None)
-
-        # If no exact match, try underscore-free matching
-        if not method:
-            # Try with underscores replacing spaces (cmd might have spaces from multi-word input)
-            underscore_cmd = cmd.replace(' ', '_')
-            method = getattr(cls, f'cmd_{underscore_cmd}', None)
-
-        # Try matching by removing underscores from both sides
-        if not method:
-            cmd_nounderscore = cmd.replace('_', '').replace(' ', '')
-            for attr_name in dir(cls):
-                if attr_name.startswith('cmd_'):
-                    if attr_name[4:].replace('_', '') == cmd_nounderscore:
-                        method = getattr(cls, attr_name)
-                        break
-
-        # If still no match, try prefix matching (shortest match wins)
-        if not method:
-            matches = []
-            for attr_name in dir(cls):
-                if attr_name.startswith('cmd_'):
-                    command_name = attr_name[4:]  # Remove 'cmd_' prefix
-                    if command_name.startswith(cmd):
-                        matches.append((command_name, getattr(cls, attr_name)))
-
-            if len(matches) == 1:
-                # Single match found
-                method = matches[0][1]
-                # Show what command was matched
+            if registry.has(combined):
+                cmd = combined
+                args = args[1:]
+            elif cmd + args[0] in cls.COMMAND_ALIASES:
+                cmd = cls.COMMAND_ALIASES[cmd + args[0]]
+                args = args[1:]
+
+        # Exact name (underscores optional), else the best abbreviation
+        name = registry.lookup(cmd)
+        if name is None:
+            name = registry.complete(cmd)
+            if name and original_cmd != name:
                 c = player.config.COLORS
-                if original_cmd != matches[0][0]:
-                    await player.send(f"{c['cyan']}[{matches[0][0]}]{c['reset']}")
-            elif len(matches) > 1:
-                # Pick shortest match
-                matches.sort(key=lambda m: len(m[0]))
-                method = matches[0][1]
-                c = player.config.COLORS
-                if original_cmd != matches[0][0]:
-                    await player.send(f"{c['cyan']}[{matches[0][0]}]{c['reset']}")
+                await player.send(f"{c['cyan']}[{name}]{c['reset']}")
+        method = registry.method(name) if name else None
 
         if method:
             await method(player, args)
+            return name
         else:
             # Check if it's a direction
             if cmd in Config.DIRECTIONS:
                 await cls.cmd_move(player, cmd)
+                return 'move'
             else:
                 # Check partial direction matching
                 dir_matches = [d for d in Config.DIRECTIONS if d.startswith(cmd)]
@@ -334,6 +323,7 @@ class CommandHandler:
                     if original_cmd != dir_matches[0]:
                         await player.send(f"{c['cyan']}[{dir_matches[0]}]{c['reset']}")
                     await cls.cmd_move(player, dir_matches[0])
+                    return 'move'
                 elif len(dir_matches) > 1:
                     c = player.config.COLORS
                     dir_list = f"{c['bright_yellow']}, {c['bright_green']}".join(dir_matches)
@@ -345,7 +335,7 @@ class CommandHandler:
                         # Exact match
                         if cmd in exits:
                             await cls.cmd_move(player, cmd)
-                            return
+                            return 'move'
                         # Prefix match (unique)
                         exit_matches = [e for e in exits if e.startswith(cmd)]
                         if len(exit_matches) == 1:
@@ -353,12 +343,12 @@ class CommandHandler:
                             if original_cmd != exit_matches[0]:
                                 await player.send(f"{c['cyan']}[{exit_matches[0]}]{c['reset']}")
                             await cls.cmd_move(player, exit_matches[0])
-                            return
+                            return 'move'
                         # Match first token of multi-word exit keys
                         token_matches = [e for e in exits if e.split()[0] == cmd]
                         if len(token_matches) == 1:
                             await cls.cmd_move(player, token_matches[0])
-                            return
+                            return 'move'
                     await player.send(f"Huh?!? '{original_cmd}' is not a valid command. Type 'help' for a list.")
 
     @classmethod
@@ -368,20567 +358,9 @@ class CommandHandler:
             await CollectionManager.record_item(player, item)
         except Exception:
             pass
-    
-    # ==================== MOVEMENT ====================
-    
-    @classmethod
-    async def cmd_move(cls, player: 'Player', direction: str):
-        """Move in a direction."""
-        if not player.room:
-            await player.send("You are nowhere!")
-            return
-            
-        if player.position == 'sleeping':
-            await player.send("You are sleeping! Wake up first.")
-            return
-
-        # Clear stale fighting state
-        if player.position == 'fighting':
-            # Check if actually fighting someone valid
-            if not player.fighting or player.fighting.hp <= 0 or player.fighting not in player.room.characters:
-                player.fighting = None
-                player.position = 'standing'
-            else:
-                await player.send("You're fighting! Flee if you want to escape.")
-                return
-            
-        if player.position in ('resting', 'sitting'):
-            await player.send("You need to stand up first.")
-            return
-            
-        exit_data = player.room.exits.get(direction)
-        if not exit_data:
-            await player.send("You can't go that way.")
-            return
-
-        # Hidden exit check
-        if exit_data.get('hidden'):
-            if not hasattr(player, 'discovered_exits') or (player.room.vnum, direction) not in player.discovered_exits:
-                await player.send("You can't go that way.")
-                return
-
-        # Check for closed/locked door
-        c = player.config.COLORS
-        if 'door' in exit_data:
-            door = exit_data['door']
-            door_name = door.get('name', 'door')
-            is_closed = door.get('state') == 'closed' or door.get('closed', False)
-            is_locked = door.get('locked', False)
-            
-            if is_closed:
-                if is_locked:
-                    await player.send(f"{c['red']}The {door_name} is closed and locked.{c['reset']}")
-                else:
-                    await player.send(f"{c['red']}The {door_name} is closed.{c['reset']}")
-                return
-        
-        # Also check for door/closed/locked in flags array (alternate format)
-        exit_flags = exit_data.get('flags', [])
-        if 'door' in exit_flags and 'closed' in exit_flags:
-            door_name = exit_data.get('keyword', 'door').split()[0] if exit_data.get('keyword') else 'door'
-            is_locked = 'locked' in exit_flags
-            if is_locked:
-                await player.send(f"{c['red']}The {door_name} is closed and locked.{c['reset']}")
-            else:
-                await player.send(f"{c['red']}The {door_name} is closed.{c['reset']}")
-            return
-
-        target_room = exit_data.get('room')
-        if not target_room:
-            await player.send("That exit seems to lead nowhere...")
-            return
-
-        # Class-only room restriction
-        for flag in getattr(target_room, 'flags', set()):
-            if isinstance(flag, str) and flag.startswith('class_only:'):
-                allowed = [c.strip().lower() for c in flag.split(':', 1)[1].split(',') if c.strip()]
-                if player.char_class.lower() not in allowed:
-                    allowed_display = ', '.join([c.title() for c in allowed])
-                    await player.send(f"{c['red']}Only {allowed_display} may enter.{c['reset']}")
-                    return
-
-        # Immortal-only rooms
-        if 'imm_only' in getattr(target_room, 'flags', set()) and not player.is_immortal:
-            await player.send(f"{c['red']}A divine force prevents you from entering.{c['reset']}")
-            return
-
-        # Reputation-based gate for faction-controlled areas
-        if exit_data.get('faction_required'):
-            try:
-                from factions import FactionManager
-                faction_key = FactionManager.normalize_key(exit_data.get('faction_required'))
-                min_rep = exit_data.get('min_reputation', 0)
-                min_rep_level = exit_data.get('min_rep_level')
-                if min_rep_level:
-                    min_rep = max(min_rep, FactionManager.get_threshold_for_level(min_rep_level))
-                if faction_key and FactionManager.get_reputation(player, faction_key) < min_rep:
-                    c = player.config.COLORS
-                    await player.send(f"{c['yellow']}You are not trusted enough by {FactionManager.format_faction_detail(player, faction_key)[0].split(' - ')[0]} to enter.{c['reset']}")
-                    return
-            except Exception:
-                pass
-            
-        # Check movement points
-        move_cost = cls._calculate_move_cost(player, target_room)
-
-        if player.move < move_cost:
-            await player.send("You are too exhausted to move!")
-            return
-            
-        # Check if sneaking and make skill check
-        sneak_success = False
-        if 'sneaking' in player.flags and not player.mount:
-            import random
-            sneak_skill = player.skills.get('sneak', 0)
-            # Skill check to move silently - easier than initial sneak
-            if random.randint(1, 100) <= sneak_skill + 10:
-                sneak_success = True
-                # Small chance to improve skill
-                if random.randint(1, 100) <= 5:
-                    await player.improve_skill('sneak', difficulty=2)
-            else:
-                # Failed sneak check - break stealth
-                player.flags.discard('sneaking')
-                c = player.config.COLORS
-                await player.send(f"{c['yellow']}You make a noise and break your stealth!{c['reset']}")
-
-        # Leave message (only if not sneaking successfully)
-        if not sneak_success:
-            affect_flags = getattr(player, 'affect_flags', set())
-            if player.mount:
-                await player.room.send_to_room(
-                    f"{player.name} rides {player.mount.name} {direction}.",
-                    exclude=[player]
-                )
-            elif 'fly' in affect_flags:
-                await player.room.send_to_room(
-                    f"{player.name} soars {direction}.",
-                    exclude=[player]
-                )
-            elif 'sanctuary' in affect_flags:
-                await player.room.send_to_room(
-                    f"{player.name} glides {direction}, a holy aura trailing behind.",
-                    exclude=[player]
-                )
-            else:
-                await player.room.send_to_room(
-                    f"{player.name} leaves {direction}.",
-                    exclude=[player]
-                )
-
-        # Track old room for transition messages
-        old_room = player.room
-
-        # Move player
-        player.room.characters.remove(player)
-
-        player.room = target_room
-        target_room.characters.append(player)
-        
-        # Track explored rooms for map
-        if not hasattr(player, 'explored_rooms'):
-            player.explored_rooms = set()
-        player.explored_rooms.add(target_room.vnum)
-
-        # Deathtrap rooms
-        if player.room and ('deathtrap' in player.room.flags or 'death' in player.room.flags):
-            from combat import CombatHandler
-            c = player.config.COLORS
-            # Dex + perception save to avoid deathtrap
-            try:
-                import random
-                save = player.dex + player.get_perception() + random.randint(1, 20)
-            except Exception:
-                save = player.dex + random.randint(1, 20)
-            if save >= 35:
-                await player.send(f"{c['yellow']}You catch yourself at the last second and stumble back!{c['reset']}")
-                # Move back to old room
-                if old_room:
-                    player.room.characters.remove(player)
-                    player.room = old_room
-                    old_room.characters.append(player)
-                return
-            await player.send(f"{c['red']}You trigger a deadly trap!{c['reset']}")
-            # Deathtrap achievement (unlocks before death)
-            try:
-                from achievements import AchievementManager
-                await AchievementManager.check_deathtrap(player)
-            except Exception:
-                pass
-            await CombatHandler.handle_death(player, player)
-            return
-
-        player.move -= move_cost
-
-        # End bard performance on movement
-        if player.performing:
-            c = player.config.COLORS
-            from spells import BARD_SONGS
-            song = BARD_SONGS.get(player.performing, {})
-            await player.send(f"{c['yellow']}Your {song.get('name', 'song')} ends as you move.{c['reset']}")
-            player.performing = None
-            player.performance_ticks = 0
-            player.encore_active = False
-
-        # Quest visit progress
-        from quests import QuestManager
-        await QuestManager.check_quest_progress(
-            player, 'visit', {'room_vnum': getattr(player.room, 'vnum', 0)}
-        )
-
-        # Achievement exploration tracking
-        try:
-            from achievements import AchievementManager
-            await AchievementManager.check_exploration(player, getattr(player.room, 'vnum', 0))
-        except Exception:
-            pass
-
-        # Journal zone discovery - check if entering a new zone
-        try:
-            from journal import JournalManager
-            if hasattr(target_room, 'zone') and target_room.zone:
-                zone = target_room.zone
-                zone_id = getattr(zone, 'number', None)
-                zone_key = f"zone_{zone_id}" if zone_id is not None else zone.name.lower().replace(' ', '_')
-                if not JournalManager.has_entry(player, f'area:{zone_key}'):
-                    zone_desc = getattr(zone, 'description', '') or f"You have discovered {zone.name}."
-                    await JournalManager.discover_area(
-                        player, zone_key, zone.name, zone_desc
-                    )
-        except Exception:
-            pass
-
-        # Waypoint discovery
-        try:
-            from travel import discover_waypoint
-            discovered = discover_waypoint(player, getattr(player.room, 'vnum', 0))
-            if discovered:
-                key, info = discovered
-                await player.send(f"{c['bright_cyan']}Waypoint discovered: {info['name']}{c['reset']}")
-        except Exception:
-            pass
-
-        # Contextual hints for new players
-        try:
-            from tips import TipManager
-            # Gathering room hint
-            if hasattr(target_room, 'resource_nodes') and target_room.resource_nodes:
-                await TipManager.show_contextual_hint(player, 'gathering_room')
-            elif hasattr(target_room, 'flags') and any(f in getattr(target_room, 'flags', []) for f in ('mine', 'forage', 'fish', 'gathering')):
-                await TipManager.show_contextual_hint(player, 'gathering_room')
-            # Quest giver hint - check for NPCs with available quests
-            from quests import QuestManager
-            for npc in getattr(target_room, 'characters', []):
-                if hasattr(npc, 'vnum') and not hasattr(npc, 'connection'):
-                    npc_vnum = getattr(npc, 'vnum', None)
-                    if npc_vnum and QuestManager.get_available_quests(player, npc_vnum):
-                        await TipManager.show_contextual_hint(player, 'quest_giver')
-                        break
-            # Tutorial movement prompt (one-time)
-            await TipManager.show_tutorial_hint(player, 'tutorial_move')
-        except Exception:
-            pass
-
-        # Auto-pickup gold
-        if getattr(player, 'autogold', False) and player.room.gold > 0:
-            gold_amount = player.room.gold
-            player.gold += gold_amount
-            player.room.gold = 0
-            await player.send(f"{c['yellow']}You pick up {gold_amount} gold coins. You now have {player.gold} gold.{c['reset']}")
-
-        # Web map update
-        if hasattr(player.world, 'web_map') and player.world.web_map:
-            await player.world.web_map.notify_player(player)
-
-        # Sneak detection check in new room
-        import time, random
-        if sneak_success and 'sneaking' in player.flags:
-            env_bonus = 0
-            if player.room:
-                if getattr(player.room, 'is_dark', False):
-                    env_bonus += 20
-                if player.room.sector_type in ('forest','swamp'):
-                    env_bonus += 10
-            if player.has_light_source():
-                env_bonus -= 25
-            sneak_roll = player.skills.get('sneak', 0) + (player.get_skill_level('hide') // 2) + player.dex + env_bonus + player.get_equipment_bonus('sneak') + random.randint(1,20)
-            for observer in list(target_room.characters):
-                if observer == player:
-                    continue
-                det = 0
-                if hasattr(observer, 'get_perception'):
-                    det = observer.get_perception()
-                else:
-                    det = int((getattr(observer,'wis',10)+getattr(observer,'dex',10))/2 + getattr(observer,'level',1)/5)
-                if getattr(observer, 'ai_state', {}).get('searching_until', 0) > time.time():
-                    det += 15
-                det += random.randint(1,20)
-                if det > sneak_roll:
-                    player.exposed_until = time.time() + random.randint(10,30)
-                    if hasattr(observer, 'ai_state'):
-                        observer.ai_state['searching_until'] = time.time() + random.randint(10,20)
-                        # no-track gear prevents tracking lock
-                        if player.get_equipment_bonus('no_track') <= 0:
-                            observer.ai_state['track_target'] = player
-                            observer.ai_state['track_until'] = time.time() + random.randint(10,20)
-                    if player.get_equipment_bonus('no_track') <= 0:
-                        player.tracked_by = observer
-                    await player.send(f"{c['red']}You are spotted!{c['reset']}")
-                    if hasattr(observer, 'send'):
-                        await observer.send(f"You notice a shadowy figure slipping by: {player.name}.")
-                    await target_room.send_to_room(
-                        f"{observer.name} narrows their eyes and scans the shadows.",
-                        exclude=[player]
-                    )
-                    break
-
-        # Arrival message (only if not sneaking successfully)
-        if not sneak_success:
-            opposite = Config.DIRECTIONS.get(direction, {}).get('opposite', 'somewhere')
-            affect_flags = getattr(player, 'affect_flags', set())
-            if player.mount:
-                await target_room.send_to_room(
-                    f"{player.name} arrives from the {opposite}, riding {player.mount.name}.",
-                    exclude=[player]
-                )
-            elif 'fly' in affect_flags:
-                await target_room.send_to_room(
-                    f"{player.name} soars in from the {opposite}.",
-                    exclude=[player]
-                )
-            elif 'sanctuary' in affect_flags:
-                await target_room.send_to_room(
-                    f"{player.name} glides in from the {opposite}, wreathed in a holy aura.",
-                    exclude=[player]
-                )
-            else:
-                await target_room.send_to_room(
-                    f"{player.name} arrives from the {opposite}.",
-                    exclude=[player]
-                )
-        
-        # Move companions who are following
-        if hasattr(player, 'companions') and player.companions:
-            from companions import Companion
-            for companion in list(player.companions):
-                if isinstance(companion, Companion):
-                    if companion.order == 'follow' and not companion.ai_state.get('staying', False):
-                        if companion.room and companion in companion.room.characters:
-                            companion.room.characters.remove(companion)
-                        companion.room = target_room
-                        target_room.characters.append(companion)
-
-        # Move pets who are following (not staying)
-        # Check both player.pets (legacy) and player.companions for Pet instances
-        pets_arriving = []
-        all_pets = list(getattr(player, 'pets', []) or [])
-        if hasattr(player, 'companions') and player.companions:
-            from pets import Pet as PetClass
-            for comp in player.companions:
-                if isinstance(comp, PetClass) and comp not in all_pets:
-                    all_pets.append(comp)
-        if all_pets:
-            from pets import Pet
-            for pet in list(all_pets):
-                if isinstance(pet, Pet):
-                    # Skip if pet is staying in place
-                    if getattr(pet, 'ai_state', {}).get('staying', False):
-                        # But if pet is in the target room, clear staying (owner arrived)
-                        if pet.room == target_room:
-                            pet.ai_state['staying'] = False
-                        continue
-                    # Move pet to follow owner
-                    if pet.room and pet.room != target_room:
-                        if pet in pet.room.characters:
-                            pet.room.characters.remove(pet)
-                        pet.room = target_room
-                        if pet not in target_room.characters:
-                            target_room.characters.append(pet)
-                        pets_arriving.append(pet)
-        
-        # Announce pets arriving with player
-        if pets_arriving and not sneak_success:
-            pet_names = ', '.join([p.name for p in pets_arriving])
-            await target_room.send_to_room(
-                f"{c['magenta']}{pet_names} follows {player.name} in.{c['reset']}",
-                exclude=[player]
-            )
-            await player.send(f"{c['magenta']}Your pets follow you.{c['reset']}")
-
-        # Move players who are following this player
-        followers_moved = []
-        for char in list(old_room.characters):
-            if hasattr(char, 'following') and char.following == player:
-                if hasattr(char, 'connection'):  # Is a player
-                    # Check if follower can move
-                    if char.move >= 1:
-                        # Move follower
-                        if char in old_room.characters:
-                            old_room.characters.remove(char)
-                        char.room = target_room
-                        if char not in target_room.characters:
-                            target_room.characters.append(char)
-                        char.move = max(0, char.move - 1)
-                        followers_moved.append(char)
-        
-        # Announce followers arriving
-        if followers_moved and not sneak_success:
-            for follower in followers_moved:
-                await target_room.send_to_room(
-                    f"{follower.name} follows {player.name} in.",
-                    exclude=[player, follower]
-                )
-                await follower.send(f"{c['cyan']}You follow {player.name} {direction}.{c['reset']}")
-                # Show room to follower
-                await follower.do_look([])
-                # Update web map for follower
-                if hasattr(player.world, 'web_map') and player.world.web_map:
-                    await player.world.web_map.notify_player(follower)
-
-        # Atmospheric transition message when moving between different area types
-        try:
-            from atmosphere import AtmosphereManager
-            game_time = player.world.game_time if hasattr(player, 'world') and player.world else None
-            transition_msg = AtmosphereManager.get_transition_message(old_room, target_room, game_time)
-            if transition_msg:
-                await player.send(f"{c['blue']}{transition_msg}{c['reset']}")
-        except Exception:
-            pass
-
-        # Show new room
-        await player.do_look([])
-
-        # Room entry triggers (NPC greetings, etc.)
-        await cls._room_entry_triggers(player)
-
-    @classmethod
-    async def _room_entry_triggers(cls, player: 'Player'):
-        """Handle NPC greeting triggers when a player enters a room."""
-        if not player.room:
-            return
-        c = player.config.COLORS
-
-        # Sage Aldric greets players with active tutorial quests
-        for npc in player.room.characters:
-            if getattr(npc, 'special', None) in ('sage_aldric', 'quest_giver') and 'aldric' in getattr(npc, 'name', '').lower():
-                if player.level < 10:
-                    completed = getattr(player, 'quests_completed', None) or []
-                    active_tutorial = any(
-                        q.quest_id.startswith('tutorial_')
-                        for q in getattr(player, 'active_quests', [])
-                    )
-                    if 'tutorial_1_awakening' not in completed and not active_tutorial:
-                        await player.send(
-                            f"\r\n{c['bright_cyan']}Sage Aldric tells you, "
-                            f"'Welcome, young {player.name}! I am Sage Aldric, guide to new adventurers. "
-                            f"Speak with me to begin your training — simply type "
-                            f"{c['bright_white']}talk aldric{c['bright_cyan']}"
-                            f" and I shall set you on your path.'{c['reset']}"
-                        )
-                    elif active_tutorial:
-                        from quests import QuestManager
-                        has_awakening = QuestManager.has_active_quest(player, 'tutorial_1_awakening')
-                        if has_awakening:
-                            await player.send(
-                                f"\r\n{c['bright_cyan']}Sage Aldric tells you, "
-                                f"'Welcome, young {player.name}! I am Sage Aldric, guide to new adventurers. "
-                                f"Speak with me to begin your training — simply type "
-                                f"{c['bright_white']}talk aldric{c['bright_cyan']}"
-                                f" and I shall set you on your path.'{c['reset']}"
-                            )
-                        else:
-                            await player.send(
-                                f"\r\n{c['bright_cyan']}Sage Aldric tells you, "
-                                f"'How goes your training, {player.name}? Remember, type "
-                                f"{c['bright_white']}hint{c['bright_cyan']}"
-                                f" if you need guidance.'{c['reset']}"
-                            )
-                    else:
-                        # Player completed tutorial - give progression guidance
-                        if player.level < 5:
-                            await player.send(
-                                f"\r\n{c['bright_cyan']}Sage Aldric tells you, "
-                                f"'Well done on completing your training, {player.name}! "
-                                f"Venture to the Light Forest west of the city gates — Ranger Thornwood can guide you. "
-                                f"Check the quest board in Temple Square for more opportunities!'{c['reset']}"
-                            )
-                        elif player.level < 10:
-                            await player.send(
-                                f"\r\n{c['bright_cyan']}Sage Aldric tells you, "
-                                f"'You grow strong, {player.name}! "
-                                f"The Great Northern Forest to the north holds challenges worthy of your skill. "
-                                f"Or seek the Orc Enclave if you crave real danger!'{c['reset']}"
-                            )
-                        else:
-                            await player.send(
-                                f"\r\n{c['bright_cyan']}Sage Aldric tells you, "
-                                f"'You have outgrown my teachings, {player.name}! "
-                                f"Seek Grimjaw in the Mines of Moria, or travel east to the city of Thalos. "
-                                f"The quest board in Temple Square lists all known adventures!'{c['reset']}"
-                            )
-                break
-
-    @classmethod
-    def _calculate_move_cost(cls, player: 'Player', target_room: 'Room') -> int:
-        sector = player.config.SECTOR_TYPES.get(target_room.sector_type, {'move_cost': 1})
-        move_cost = sector['move_cost']
-
-        terrain_mods = getattr(player.config, 'TERRAIN_MOVE_COST_MODIFIERS', {})
-        move_cost = int(max(1, move_cost * terrain_mods.get(target_room.sector_type, 1.0)))
-
-        # Weather movement modifier (outdoors only)
-        if player.room and player.room.zone and player.room.sector_type in {
-            'field', 'forest', 'hills', 'mountain', 'water_swim', 'water_noswim',
-            'flying', 'desert', 'swamp'
-        }:
-            weather = player.room.zone.weather
-            if weather:
-                move_cost = int(max(1, move_cost * weather.get_movement_modifier()))
-
-        # Can't sneak on water - cancel sneak
-        if hasattr(player, 'flags') and 'sneaking' in player.flags:
-            if target_room.sector_type in ('water_swim', 'water_noswim'):
-                player.flags.discard('sneaking')
-                if hasattr(player, 'send'):
-                    import asyncio
-                    asyncio.ensure_future(player.send(f"{player.config.COLORS['yellow']}You can't sneak on water!{player.config.COLORS['reset']}"))
-            else:
-                # Sneaking movement penalty (terrain-aware)
-                sneak_mods = {
-                    'city': 1.1,
-                    'indoors': 1.2,
-                    'field': 1.4,
-                    'forest': 1.8,
-                    'swamp': 2.0,
-                    'hills': 1.6,
-                    'mountain': 2.0,
-                    'desert': 1.5,
-                    'flying': 1.6,
-                }
-                move_cost = int(max(1, move_cost * sneak_mods.get(target_room.sector_type, 1.3)))
-
-        # Watercraft in inventory reduces water movement cost
-        if target_room.sector_type in ('water_swim', 'water_noswim'):
-            best_reduction = 0
-            for item in player.inventory:
-                if getattr(item, 'item_type', None) == 'boat':
-                    reduction = getattr(item, 'water_speed', 0.5)
-                    best_reduction = max(best_reduction, reduction)
-            # Also check equipment (held items)
-            for slot, item in player.equipment.items():
-                if item and getattr(item, 'item_type', None) == 'boat':
-                    reduction = getattr(item, 'water_speed', 0.5)
-                    best_reduction = max(best_reduction, reduction)
-            if best_reduction > 0:
-                move_cost = max(1, int(move_cost * (1 - best_reduction)))
-
-        # Mounted movement bonus (reduced movement cost)
-        if player.mount:
-            bonus = getattr(player.mount, 'speed_bonus', 0.5)
-            move_cost = max(1, int(move_cost * (1 - bonus)))
-
-        return move_cost
-        
-    @classmethod
-    async def cmd_north(cls, player: 'Player', args: List[str]):
-        await cls.cmd_move(player, 'north')
-        
-    @classmethod
-    async def cmd_south(cls, player: 'Player', args: List[str]):
-        await cls.cmd_move(player, 'south')
-        
-    @classmethod
-    async def cmd_east(cls, player: 'Player', args: List[str]):
-        await cls.cmd_move(player, 'east')
-        
-    @classmethod
-    async def cmd_west(cls, player: 'Player', args: List[str]):
-        await cls.cmd_move(player, 'west')
-        
-    @classmethod
-    async def cmd_up(cls, player: 'Player', args: List[str]):
-        await cls.cmd_move(player, 'up')
-        
-    @classmethod
-    async def cmd_down(cls, player: 'Player', args: List[str]):
-        await cls.cmd_move(player, 'down')
-    
-    # ==================== INFORMATION ====================
-    
-    @classmethod
-    async def cmd_look(cls, player: 'Player', args: List[str]):
-        """Look at the room or something."""
-        await player.do_look(args)
-
-    @classmethod
-    async def cmd_exits(cls, player: 'Player', args: List[str]):
-        """Show available exits from the current room with descriptions."""
-        c = player.config.COLORS
-
-        if not player.room:
-            await player.send("You are nowhere!")
-            return
-
-        visible_exits = player.room.get_visible_exits(player) if player.room else {}
-        if not visible_exits:
-            await player.send(f"{c['yellow']}There are no obvious exits.{c['reset']}")
-            return
-
-        await player.send(f"\n{c['cyan']}Obvious exits:{c['reset']}")
-
-        has_exits = False
-        for direction, exit_data in visible_exits.items():
-            if exit_data:
-                has_exits = True
-                # Get description if available
-                desc = exit_data.get('description', '')
-
-                # Check for door
-                door_info = ""
-                if 'door' in exit_data:
-                    door = exit_data['door']
-                    door_name = door.get('name', 'door')
-                    state = door.get('state', 'open')
-                    locked = door.get('locked', False)
-                    if state == 'closed':
-                        if locked:
-                            door_info = f" {c['red']}[{door_name}, closed, locked]{c['reset']}"
-                        else:
-                            door_info = f" {c['yellow']}[{door_name}, closed]{c['reset']}"
-                    else:
-                        door_info = f" {c['green']}[{door_name}]{c['reset']}"
-
-                # Format exit line
-                if desc:
-                    await player.send(f"  {c['bright_green']}{direction:8}{c['white']} - {desc}{door_info}{c['reset']}")
-                else:
-                    await player.send(f"  {c['bright_green']}{direction:8}{door_info}{c['reset']}")
-
-        if not has_exits:
-            await player.send(f"{c['yellow']}There are no obvious exits.{c['reset']}")
-
-    @classmethod
-    async def cmd_search(cls, player: 'Player', args: List[str]):
-        """Search the room for hidden exits or items."""
-        if not player.room:
-            await player.send("You are nowhere!")
-            return
-
-        c = player.config.COLORS
-        room = player.room
-
-        # Too dark to search without light or infravision
-        game_time = player.world.game_time if hasattr(player, 'world') and player.world else None
-        if room.is_dark(game_time) and not player.can_see_in_dark():
-            await player.send(f"{c['blue']}It is too dark to search here.{c['reset']}")
-            return
-
-        # Small movement cost
-        if player.move < 2:
-            await player.send("You are too exhausted to search.")
-            return
-        player.move -= 2
-
-        # Perception-style score
-        perception_bonus = player.level * 2
-        perception_bonus += (player.wis - 10) * 3
-        int_bonus = player.get_soulstone_bonus_int() if hasattr(player, 'get_soulstone_bonus_int') else 0
-        perception_bonus += ((player.int + int_bonus) - 10) * 2
-        perception_bonus += (player.dex - 10)
-        perception_bonus += player.skills.get('detect_traps', 0) // 10
-
-        found_any = False
-        found_messages = []
-
-        # Hidden exits
-        for direction, exit_data in room.exits.items():
-            if not exit_data or not exit_data.get('hidden'):
-                continue
-            if (room.vnum, direction) in getattr(player, 'discovered_exits', set()):
-                continue
-
-            # Requirements
-            if exit_data.get('requires_light') and not player.has_light_source():
-                continue
-            if exit_data.get('requires_detect_magic') and 'detect_magic' not in getattr(player, 'affect_flags', set()):
-                continue
-
-            difficulty = exit_data.get('search_difficulty', 60)
-            roll = random.randint(1, 100) + perception_bonus
-            if roll >= difficulty:
-                player.discovered_exits.add((room.vnum, direction))
-                found_any = True
-                found_messages.append(exit_data.get('reveal_message') or f"You discover a hidden exit {direction}!")
-
-                if exit_data.get('secret'):
-                    from achievements import AchievementManager
-                    await AchievementManager.record_secret_found(player, exit_data.get('to_room', room.vnum))
-                    if hasattr(player, 'add_journal_entry'):
-                        player.add_journal_entry(f"Discovered a secret passage {direction} in {room.name}.", category='secret')
-
-        # Hidden items
-        if room.hidden_items:
-            from objects import create_object
-            for hidden in list(room.hidden_items):
-                if hidden.get('requires_light') and not player.has_light_source():
-                    continue
-                if hidden.get('requires_detect_magic') and 'detect_magic' not in getattr(player, 'affect_flags', set()):
-                    continue
-
-                difficulty = hidden.get('search_difficulty', 60)
-                roll = random.randint(1, 100) + perception_bonus
-                if roll >= difficulty:
-                    obj = create_object(hidden.get('vnum'), player.world)
-                    if obj:
-                        room.items.append(obj)
-                        room.hidden_items.remove(hidden)
-                        found_any = True
-                        found_messages.append(hidden.get('reveal_message') or f"You uncover {obj.short_desc}!")
-                        if getattr(obj, 'lore_id', None):
-                            if hasattr(player, 'add_journal_entry'):
-                                player.add_journal_entry(f"Recovered lore item: {obj.lore_title or obj.short_desc}.", category='lore')
-
-        if found_messages:
-            for msg in found_messages:
-                await player.send(f"{c['bright_green']}{msg}{c['reset']}")
-            return
-
-        if not found_any:
-            await player.send(f"{c['yellow']}You find nothing out of the ordinary.{c['reset']}")
-
-    @classmethod
-    async def cmd_answer(cls, player: 'Player', args: List[str]):
-        """Answer a riddle puzzle in the room."""
-        if not args:
-            await player.send("Answer what?")
-            return
-        from puzzles import PuzzleManager
-        await PuzzleManager.handle_answer(player, ' '.join(args))
-
-    @classmethod
-    async def cmd_pull(cls, player: 'Player', args: List[str]):
-        """Pull a lever for lever puzzles."""
-        if not args:
-            await player.send("Pull what?")
-            return
-        from puzzles import PuzzleManager
-        await PuzzleManager.handle_pull(player, ' '.join(args))
-
-    @classmethod
-    async def cmd_push(cls, player: 'Player', args: List[str]):
-        """Push a symbol or object for puzzle interactions."""
-        if not args:
-            await player.send("Push what?")
-            return
-        from puzzles import PuzzleManager
-        await PuzzleManager.handle_push(player, ' '.join(args))
-
-    @classmethod
-    async def cmd_hint(cls, player: 'Player', args: List[str]):
-        """Show a hint for your current tutorial quest objective, or a puzzle hint."""
-        c = player.config.COLORS
-        # Check for active tutorial quest first
-        tutorial_quest = None
-        for quest in getattr(player, 'active_quests', []):
-            if quest.quest_id.startswith('tutorial_'):
-                tutorial_quest = quest
-                break
-        
-        if tutorial_quest:
-            from quests import QUEST_DEFINITIONS
-            quest_def = QUEST_DEFINITIONS.get(tutorial_quest.quest_id, {})
-            await player.send(f"\r\n{c['bright_cyan']}═══ Quest Hint: {tutorial_quest.name} ═══{c['reset']}")
-            await player.send(f"{c['white']}{quest_def.get('description', tutorial_quest.description)}{c['reset']}\r\n")
-            await player.send(f"{c['yellow']}Current objectives:{c['reset']}")
-            for obj in tutorial_quest.objectives:
-                if not obj.completed:
-                    status = f"({obj.current}/{obj.required})"
-                    await player.send(f"  {c['bright_white']}→ {obj.description} {status}{c['reset']}")
-                else:
-                    await player.send(f"  {c['green']}✓ {obj.description}{c['reset']}")
-            await player.send("")
-            return
-        
-        # Fall back to puzzle hints if no tutorial quest
-        if not getattr(player, 'active_quests', []):
-            await player.send(f"{c['white']}You have no active objectives. Try 'quests' to see available quests.{c['reset']}")
-            return
-        
-        from puzzles import PuzzleManager
-        await PuzzleManager.request_hint(player)
-
-    @classmethod
-    async def cmd_achievements(cls, player: 'Player', args: List[str]):
-        """View achievements and progress."""
-        from achievements import AchievementManager
-        category = args[0].lower() if args else None
-        valid_cats = {'combat', 'exploration', 'progression', 'class', 'social', 'wealth', 'collection'}
-        if category and category not in valid_cats:
-            category = None
-        await AchievementManager.show_achievements(player, category)
-
-    @classmethod
-    async def cmd_title(cls, player: 'Player', args: List[str]):
-        """Set or view your display title from earned achievements."""
-        from achievements import AchievementManager
-        if not args:
-            await AchievementManager.show_titles(player)
-        else:
-            await AchievementManager.set_title(player, ' '.join(args))
-
-    @classmethod
-    async def cmd_collections(cls, player: 'Player', args: List[str]):
-        """View collection progress."""
-        from collection_system import CollectionManager
-        lines = CollectionManager.render_collections(player)
-        for line in lines:
-            await player.send(line)
-
-    @classmethod
-    async def cmd_newgameplus(cls, player: 'Player', args: List[str]):
-        """Start a New Game+ cycle after completing the main story."""
-        from quests import QuestManager
-        state = QuestManager._get_chain_state(player, 'main_story')
-        if not state or not state.get('completed'):
-            await player.send("You must complete the main story before starting New Game+.")
-            return
-
-        nightmare = any(arg.lower() == 'nightmare' for arg in args)
-
-        c = player.config.COLORS
-        gold_keep = int(player.gold * 0.4)
-
-        # Retain skills/spells at reduced power
-        player.skills = {k: max(1, int(v * 0.6)) for k, v in player.skills.items()}
-        player.spells = {k: max(1, int(v * 0.6)) for k, v in player.spells.items()}
-
-        player.level = 1
-        player.exp = 0
-        player.gold = gold_keep
-        player.hp = player.max_hp = 100
-        player.mana = player.max_mana = 100
-        player.move = player.max_move = 100
-
-        player.quests_completed = []
-        player.quest_flags = {}
-        player.quest_chains = {}
-        player.dialogue_state = {}
-        player.active_quests = []
-        player.explored_rooms = set()
-        player.discovered_exits = set()
-        player.secret_rooms_found = set()
-
-        player.inventory = []
-        player.equipment = {slot: None for slot in player.equipment}
-
-        old_room = player.room
-        player.room_vnum = player.config.STARTING_ROOM
-        if player.world:
-            player.room = player.world.get_room(player.room_vnum)
-            if old_room and player in old_room.characters:
-                old_room.characters.remove(player)
-            if player.room and player not in player.room.characters:
-                player.room.characters.append(player)
-
-        player.ng_plus_cycle = getattr(player, 'ng_plus_cycle', 0) + 1
-        player.nightmare_mode = nightmare
-
-        await player.send(
-            f"{c['bright_magenta']}New Game+ begins!{c['reset']} "
-            f"Cycle {player.ng_plus_cycle} {'(Nightmare)' if nightmare else ''}"
-        )
-        await player.send(
-            f"{c['yellow']}You retain {gold_keep} gold, some skill mastery, and your title.{c['reset']}"
-        )
-
-    @classmethod
-    async def cmd_read(cls, player: 'Player', args: List[str]):
-        """Read a book, scroll, or readable item."""
-        if not args:
-            await player.send("Read what?")
-            return
-
-        target_name = ' '.join(args).lower()
-        item = None
-
-        # Check inventory and room
-        for candidate in player.inventory + (player.room.items if player.room else []):
-            if target_name in candidate.name.lower() or target_name in candidate.short_desc.lower():
-                item = candidate
-                break
-
-        if not item:
-            await player.send("You don't see that here.")
-            return
-
-        text = getattr(item, 'lore_text', None) or getattr(item, 'readable_text', None)
-        if not text:
-            await player.send("You can't read that.")
-            return
-
-        c = player.config.COLORS
-
-        # Recipe scroll: learn the recipe
-        if 'recipe_scroll' in getattr(item, 'flags', set()):
-            from crafting import handle_recipe_scroll
-            await handle_recipe_scroll(player, item)
-            return
-
-        await player.send(f"{c['bright_cyan']}{item.lore_title or item.short_desc}{c['reset']}")
-        await player.send(f"{c['white']}{text}{c['reset']}")
-
-        # Track lore discovery
-        lore_id = getattr(item, 'lore_id', None)
-        if lore_id:
-            if lore_id not in getattr(player, 'discovered_lore', set()):
-                player.discovered_lore.add(lore_id)
-                if hasattr(player, 'lore_catalog'):
-                    player.lore_catalog[lore_id] = item.lore_title or item.short_desc
-                from achievements import AchievementManager
-                await AchievementManager.record_lore_found(player, item)
-                
-                # Add to discovery journal
-                try:
-                    from journal import JournalManager
-                    lore_title = item.lore_title or item.short_desc
-                    await JournalManager.discover_lore(
-                        player, lore_id, lore_title, text
-                    )
-                except Exception:
-                    pass
-
-    @classmethod
-    async def cmd_lore(cls, player: 'Player', args: List[str]):
-        """Review discovered lore."""
-        c = player.config.COLORS
-        discovered = getattr(player, 'discovered_lore', set())
-        if not discovered:
-            await player.send("You haven't discovered any lore yet.")
-            return
-
-        # Build zone totals from world prototypes
-        zone_totals = {}
-        zone_discovered = {}
-        lore_lookup = {}
-        if hasattr(player, 'world') and player.world:
-            for proto in player.world.obj_prototypes.values():
-                lore_id = proto.get('lore_id')
-                lore_zone = proto.get('lore_zone')
-                lore_title = proto.get('lore_title') or proto.get('short_desc')
-                if lore_id:
-                    lore_lookup[lore_id] = (lore_zone, lore_title)
-                if lore_id and lore_zone is not None:
-                    zone_totals.setdefault(lore_zone, set()).add(lore_id)
-
-        for lore_id in discovered:
-            lore_zone = lore_lookup.get(lore_id, (None, None))[0]
-            zone_discovered.setdefault(lore_zone, set()).add(lore_id)
-
-        await player.send(f"{c['cyan']}Discovered Lore:{c['reset']}")
-        for lore_id in sorted(discovered):
-            title = getattr(player, 'lore_catalog', {}).get(lore_id, lore_id)
-            await player.send(f"  {c['bright_green']}- {title}{c['reset']}")
-
-        if zone_totals:
-            await player.send(f"\n{c['cyan']}Lore Progress by Zone:{c['reset']}")
-            for zone_id, total_ids in zone_totals.items():
-                found = len(zone_discovered.get(zone_id, set()))
-                total = len(total_ids)
-                percent = int((found / total) * 100) if total else 0
-                await player.send(f"  {c['bright_yellow']}Zone {zone_id}:{c['reset']} {found}/{total} ({percent}%)")
-
-    @classmethod
-    async def cmd_journal(cls, player: 'Player', args: List[str]):
-        """Review your discovery journal.
-        
-        Usage:
-            journal              - Show journal overview and recent entries
-            journal stats        - Show discovery statistics
-            journal lore         - Show lore entries
-            journal secrets      - Show discovered secrets
-            journal npcs         - Show NPCs you've met
-            journal areas        - Show discovered areas
-            journal read <num>   - Read a specific entry
-            journal all          - Show all entries
-        """
-        from journal import JournalManager
-        
-        c = player.config.COLORS
-        stats = JournalManager.get_stats(player)
-        
-        sub = args[0].lower() if args else None
-        
-        if sub == 'stats':
-            # Detailed statistics
-            explored_total = len(getattr(player, 'explored_rooms', set()))
-            total_rooms = len(player.world.rooms) if hasattr(player, 'world') and player.world else 0
-            overall_pct = int((explored_total / total_rooms) * 100) if total_rooms else 0
-            
-            await player.send(f"\r\n{c['bright_cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
-            await player.send(f"{c['bright_cyan']}║{c['reset']}            📖 {c['bright_yellow']}DISCOVERY JOURNAL - STATISTICS{c['reset']}             {c['bright_cyan']}║{c['reset']}")
-            await player.send(f"{c['bright_cyan']}╠══════════════════════════════════════════════════════════════╣{c['reset']}")
-            await player.send(f"{c['bright_cyan']}║{c['reset']}                                                              {c['bright_cyan']}║{c['reset']}")
-            await player.send(f"{c['bright_cyan']}║{c['reset']}  {c['white']}🗺️  Rooms Explored:{c['reset']} {explored_total}/{total_rooms} ({overall_pct}%)                     {c['bright_cyan']}║{c['reset']}")
-            await player.send(f"{c['bright_cyan']}║{c['reset']}  {c['white']}📜 Lore Discovered:{c['reset']} {stats['lore_discovered']:<5}                               {c['bright_cyan']}║{c['reset']}")
-            await player.send(f"{c['bright_cyan']}║{c['reset']}  {c['white']}🔮 Secrets Found:{c['reset']}   {stats['secrets_found']:<5}                               {c['bright_cyan']}║{c['reset']}")
-            await player.send(f"{c['bright_cyan']}║{c['reset']}  {c['white']}👤 NPCs Met:{c['reset']}        {stats['npcs_met']:<5}                               {c['bright_cyan']}║{c['reset']}")
-            await player.send(f"{c['bright_cyan']}║{c['reset']}  {c['white']}🌍 Areas Found:{c['reset']}     {stats['areas_discovered']:<5}                               {c['bright_cyan']}║{c['reset']}")
-            await player.send(f"{c['bright_cyan']}║{c['reset']}                                                              {c['bright_cyan']}║{c['reset']}")
-            await player.send(f"{c['bright_cyan']}║{c['reset']}  {c['white']}📝 Total Entries:{c['reset']}   {stats['total_entries']:<5}                               {c['bright_cyan']}║{c['reset']}")
-            if stats['unread'] > 0:
-                await player.send(f"{c['bright_cyan']}║{c['reset']}  {c['bright_yellow']}📬 Unread:{c['reset']}          {stats['unread']:<5}                               {c['bright_cyan']}║{c['reset']}")
-            await player.send(f"{c['bright_cyan']}║{c['reset']}                                                              {c['bright_cyan']}║{c['reset']}")
-            await player.send(f"{c['bright_cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}\r\n")
-            return
-        
-        # Filter by category
-        category_map = {
-            'lore': 'lore',
-            'secrets': 'secret',
-            'secret': 'secret',
-            'npcs': 'npc',
-            'npc': 'npc',
-            'areas': 'area',
-            'area': 'area',
-            'quests': 'quest',
-            'quest': 'quest',
-            'achievements': 'achievement',
-            'achievement': 'achievement',
-        }
-        
-        category = category_map.get(sub) if sub else None
-        
-        if sub == 'read' and len(args) > 1:
-            try:
-                idx = int(args[1]) - 1
-                entries = JournalManager.get_entries(player)
-                if 0 <= idx < len(entries):
-                    entry = entries[idx]
-                    entry.read = True
-                    
-                    cat_color = JournalManager.CATEGORY_COLORS.get(entry.category, 'white')
-                    icon = JournalManager.CATEGORY_ICONS.get(entry.category, '📝')
-                    
-                    await player.send(f"\r\n{c[cat_color]}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
-                    await player.send(f"{c[cat_color]}║{c['reset']}  {icon} {c['bright_yellow']}{entry.title[:52]:<52}{c['reset']}  {c[cat_color]}║{c['reset']}")
-                    await player.send(f"{c[cat_color]}╠══════════════════════════════════════════════════════════════╣{c['reset']}")
-                    
-                    # Word wrap content
-                    words = entry.content.split()
-                    line = ""
-                    for word in words:
-                        if len(line) + len(word) + 1 <= 56:
-                            line = line + " " + word if line else word
-                        else:
-                            await player.send(f"{c[cat_color]}║{c['reset']}  {c['white']}{line:<56}{c['reset']}  {c[cat_color]}║{c['reset']}")
-                            line = word
-                    if line:
-                        await player.send(f"{c[cat_color]}║{c['reset']}  {c['white']}{line:<56}{c['reset']}  {c[cat_color]}║{c['reset']}")
-                    
-                    await player.send(f"{c[cat_color]}╚══════════════════════════════════════════════════════════════╝{c['reset']}\r\n")
-                else:
-                    await player.send(f"{c['red']}Invalid entry number.{c['reset']}")
-            except ValueError:
-                await player.send(f"{c['red']}Usage: journal read <number>{c['reset']}")
-            return
-        
-        # Get entries (filtered or all)
-        limit = None if sub == 'all' else 10
-        entries = JournalManager.get_entries(player, category=category, limit=limit)
-        
-        # Header
-        title = "DISCOVERY JOURNAL"
-        if category:
-            title = f"JOURNAL - {category.upper()}"
-        
-        await player.send(f"\r\n{c['bright_cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
-        await player.send(f"{c['bright_cyan']}║{c['reset']}            📖 {c['bright_yellow']}{title:^40}{c['reset']}      {c['bright_cyan']}║{c['reset']}")
-        await player.send(f"{c['bright_cyan']}╠══════════════════════════════════════════════════════════════╣{c['reset']}")
-        
-        if not entries:
-            await player.send(f"{c['bright_cyan']}║{c['reset']}  {c['yellow']}No entries yet. Explore the world to fill your journal!{c['reset']}   {c['bright_cyan']}║{c['reset']}")
-        else:
-            for i, entry in enumerate(entries, 1):
-                icon = JournalManager.CATEGORY_ICONS.get(entry.category, '📝')
-                cat_color = JournalManager.CATEGORY_COLORS.get(entry.category, 'white')
-                unread = "" if entry.read else f"{c['bright_yellow']}*{c['reset']}"
-                title_display = entry.title[:45]
-                await player.send(f"{c['bright_cyan']}║{c['reset']}  {c['white']}{i:>2}.{c['reset']} {icon} {c[cat_color]}{title_display:<45}{c['reset']} {unread} {c['bright_cyan']}║{c['reset']}")
-        
-        await player.send(f"{c['bright_cyan']}╠══════════════════════════════════════════════════════════════╣{c['reset']}")
-        await player.send(f"{c['bright_cyan']}║{c['reset']}  {c['cyan']}Commands: journal stats | lore | secrets | read <#>{c['reset']}       {c['bright_cyan']}║{c['reset']}")
-        await player.send(f"{c['bright_cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}\r\n")
-        
-        # Mark all as read if viewing
-        JournalManager.mark_read(player)
-
-    @classmethod
-    async def cmd_examine(cls, player: 'Player', args: List[str]):
-        """Examine something in detail."""
-        await player.do_look(args)
-
-    @classmethod
-    async def cmd_weather(cls, player: 'Player', args: List[str]):
-        """Check the current weather."""
-        c = player.config.COLORS
-
-        if not player.room or not player.room.zone:
-            await player.send("You can't sense any weather here.")
-            return
-
-        # Get zone weather
-        weather = player.room.zone.weather
-        game_time = player.world.game_time if hasattr(player, 'world') and player.world else None
-
-        # Display weather information
-        await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
-        await player.send(f"{c['cyan']}║{c['bright_yellow']} Weather Conditions{c['cyan']}                                            ║{c['reset']}")
-        await player.send(f"{c['cyan']}╠══════════════════════════════════════════════════════════════╣{c['reset']}")
-
-        # Weather description
-        desc = weather.get_weather_desc()
-        await player.send(f"{c['cyan']}║ {c['white']}{desc:<59}{c['cyan']}║{c['reset']}")
-        await player.send(f"{c['cyan']}╠══════════════════════════════════════════════════════════════╣{c['reset']}")
-
-        # Temperature
-        temp_f = weather.temperature
-        temp_c = int((temp_f - 32) * 5 / 9)
-        await player.send(f"{c['cyan']}║ {c['white']}Temperature: {temp_f}°F ({temp_c}°C){c['cyan']}                                      ║{c['reset']}")
-
-        # Wind
-        wind_desc = "calm"
-        if weather.wind_speed > 25:
-            wind_desc = "strong gale"
-        elif weather.wind_speed > 15:
-            wind_desc = "steady wind"
-        elif weather.wind_speed > 8:
-            wind_desc = "light breeze"
-        await player.send(f"{c['cyan']}║ {c['white']}Wind: {wind_desc} ({weather.wind_speed} mph){c['cyan']}                                     ║{c['reset']}")
-
-        # Time and season
-        if game_time:
-            season = game_time.get_season()
-            time_str = game_time.get_short_time_string()
-            await player.send(f"{c['cyan']}║ {c['white']}Time: {time_str} ({season}){c['cyan']}                                    ║{c['reset']}")
-
-        await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}\r\n")
-
-    @classmethod
-    async def cmd_score(cls, player: 'Player', args: List[str]):
-        """Show player stats."""
-        c = player.config.COLORS
-        race_info = player.config.RACES.get(player.race, {})
-        class_info = player.config.CLASSES.get(player.char_class, {})
-        
-        # Check for ASCII mode
-        use_ascii = getattr(player, 'ascii_ui', False)
-        
-        # Box drawing characters (ASCII or Unicode)
-        if use_ascii:
-            TL, TR, BL, BR = '+', '+', '+', '+'
-            H, V = '-', '|'
-            LT, RT, TT, BT = '+', '+', '+', '+'
-        else:
-            TL, TR, BL, BR = '╔', '╗', '╚', '╝'
-            H, V = '═', '║'
-            LT, RT, TT, BT = '╠', '╣', '╦', '╩'
-        
-        W = 64  # Width of box interior
-        
-        await player.send(f"{c['cyan']}{TL}{H*W}{TR}{c['reset']}")
-        await player.send(f"{c['cyan']}{V}{c['bright_yellow']} {player.name} {player.title:<52}{c['cyan']}{V}{c['reset']}")
-        await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
-        from prestige import get_class_display
-        display_class = get_class_display(player)
-        await player.send(f"{c['cyan']}{V} {c['white']}Race: {race_info.get('name', player.race):<12} Class: {display_class:<12} Level: {player.level:<3}{c['cyan']}    {V}{c['reset']}")
-        await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
-        # Calculate effective max values with equipment bonuses
-        eff_max_hp = player.max_hp + player.get_equipment_bonus('hp')
-        eff_max_mana = player.max_mana + player.get_equipment_bonus('mana')
-        eff_max_move = player.max_move + player.get_equipment_bonus('move')
-        await player.send(f"{c['cyan']}{V} {c['bright_red']}HP: {player.hp:>4}/{eff_max_hp:<4}{c['cyan']}  {c['bright_cyan']}Mana: {player.mana:>4}/{eff_max_mana:<4}{c['cyan']}  {c['bright_yellow']}Move: {player.move:>4}/{eff_max_move:<4}{c['cyan']}   {V}{c['reset']}")
-        await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
-        # Calculate stat bonuses from equipment
-        def stat_display(base, stat_name):
-            bonus = player.get_equipment_bonus(stat_name)
-            soulstone = player.get_soulstone_bonus_int() if stat_name == 'int' and hasattr(player, 'get_soulstone_bonus_int') else 0
-            total_bonus = bonus + soulstone
-            if total_bonus > 0:
-                return f"{base:>2}(+{total_bonus})"
-            elif total_bonus < 0:
-                return f"{base:>2}({total_bonus})"
-            return f"{base:>2}"
-        str_d = stat_display(player.str, 'str')
-        int_d = stat_display(player.int, 'int')
-        wis_d = stat_display(player.wis, 'wis')
-        dex_d = stat_display(player.dex, 'dex')
-        con_d = stat_display(player.con, 'con')
-        cha_d = stat_display(player.cha, 'cha')
-        await player.send(f"{c['cyan']}{V} {c['white']}Str:{str_d:<7} Int:{int_d:<7} Wis:{wis_d:<7} Dex:{dex_d:<7} Con:{con_d:<7} Cha:{cha_d:<5}{c['cyan']}{V}{c['reset']}")
-        await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
-        await player.send(f"{c['cyan']}{V} {c['bright_green']}Experience: {player.exp:<10}{c['cyan']} {c['bright_yellow']}Gold: {player.gold:<10}{c['cyan']} {c['white']}Practices: {player.practices:<3}{c['cyan']}  {V}{c['reset']}")
-        await player.send(f"{c['cyan']}{V} {c['white']}To next level: {player.exp_to_level() - player.exp:<10}{c['cyan']}                              {V}{c['reset']}")
-        await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
-        # Calculate hitroll/damroll with equipment bonuses
-        total_hitroll = player.hitroll + player.get_equipment_bonus('hitroll')
-        total_damroll = player.damroll + player.get_equipment_bonus('damroll')
-        await player.send(f"{c['cyan']}{V} {c['white']}Armor Class: {player.get_armor_class():<4}  Hitroll: {total_hitroll:>+3}  Damroll: {total_damroll:>+3}{c['cyan']}            {V}{c['reset']}")
-        # OB/DB/PB quick tactical readout
-        ob = player.get_hit_bonus()
-        db_info = player.get_db_breakdown() if hasattr(player, 'get_db_breakdown') else {'total': (100 - player.get_armor_class())}
-        pb_info = player.get_pb_breakdown() if hasattr(player, 'get_pb_breakdown') else {'total': int(getattr(player, 'damage_reduction', 0))}
-        db = db_info.get('total', 0)
-        pb = pb_info.get('total', 0)
-        await player.send(f"{c['cyan']}{V} {c['white']}Combat: OB {ob:>+3}  DB {db:>+3}  PB {pb:>2}%{c['cyan']}                     {V}{c['reset']}")
-        db_break = f"base {db_info.get('base',0):+d} st {db_info.get('stance',0):+d} sh {db_info.get('shield',0):+d} dg {db_info.get('dodge_skill',0):+d}/{db_info.get('dodge_item',0):+d} wt -{db_info.get('weight_penalty',0)}"
-        pb_break = f"base {pb_info.get('base',0):+d} st {pb_info.get('stance',0):+d} pa {pb_info.get('parry',0):+d} sb {pb_info.get('shield_block',0):+d} wt -{pb_info.get('weight_penalty',0)}"
-        await player.send(f"{c['cyan']}{V} {c['bright_black']}DB:{db_break[:50]:<50}{c['cyan']}{V}{c['reset']}")
-        await player.send(f"{c['cyan']}{V} {c['bright_black']}PB:{pb_break[:50]:<50}{c['cyan']}{V}{c['reset']}")
-        mood = getattr(player, 'stance', 'normal')
-        wimpy = int(getattr(player, 'wimpy', 0))
-        await player.send(f"{c['cyan']}{V} {c['white']}Mood: {c['bright_cyan']}{mood:<10}{c['white']} Wimpy: {wimpy:<4}{c['cyan']}                       {V}{c['reset']}")
-
-        # Show hunger and thirst status
-        hunger_cond = player.get_hunger_condition()
-        thirst_cond = player.get_thirst_condition()
-        hunger_color = c['red'] if player.hunger <= 3 else c['yellow'] if player.hunger <= 6 else c['green']
-        thirst_color = c['red'] if player.thirst <= 3 else c['yellow'] if player.thirst <= 6 else c['green']
-
-        await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
-        sneak_status = f"{c['bright_black']}SNEAKING{c['reset']}" if 'sneaking' in player.flags else f"{c['white']}--{c['reset']}"
-        per = player.get_perception() if hasattr(player, 'get_perception') else 0
-        await player.send(f"{c['cyan']}{V} {c['white']}Hunger: {hunger_color}{hunger_cond:<12}{c['white']}  Thirst: {thirst_color}{thirst_cond:<12}{c['white']}  Stealth: {sneak_status}  PER: {per:<2}{c['cyan']}{V}{c['reset']}")
-
-        # Show active affects/buffs/debuffs
-        if player.affects:
-            await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
-            await player.send(f"{c['cyan']}{V} {c['bright_cyan']}Active Effects:{c['reset']}                                            {c['cyan']}{V}{c['reset']}")
-
-            for affect in player.affects:
-                # Determine if it's a buff (positive) or debuff (negative)
-                is_debuff = affect.name.lower() in ['poison', 'blindness', 'weaken', 'sleep', 'fear', 'curse']
-                affect_color = c['red'] if is_debuff else c['bright_green']
-
-                # Format the affect display
-                duration_str = f"{affect.remaining}t"  # 't' for ticks
-                affect_desc = f"{affect.name}"
-
-                # Add effect details based on type
-                if affect.type == 'modify_stat':
-                    if affect.value > 0:
-                        effect_str = f"+{affect.value} {affect.applies_to}"
-                    else:
-                        effect_str = f"{affect.value} {affect.applies_to}"
-                    affect_desc = f"{affect.name} ({effect_str})"
-                elif affect.type == 'flag':
-                    affect_desc = f"{affect.name}"
-                elif affect.type == 'dot':
-                    affect_desc = f"{affect.name} ({affect.value} dmg/tick)"
-                elif affect.type == 'hot':
-                    affect_desc = f"{affect.name} ({affect.value} hp/tick)"
-
-                # Truncate if too long
-                if len(affect_desc) > 45:
-                    affect_desc = affect_desc[:42] + "..."
-
-                await player.send(f"{c['cyan']}{V}  {affect_color}* {affect_desc:<43}{c['white']}[{duration_str:>5}]{c['cyan']} {V}{c['reset']}")
-
-        # Necromancer-specific info
-        if player.char_class == 'necromancer':
-            has_necro_info = False
-            
-            # Soul fragments
-            fragments = getattr(player, 'soul_fragments', 0)
-            if fragments > 0:
-                if not has_necro_info:
-                    await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
-                    await player.send(f"{c['cyan']}{V} {c['bright_magenta']}Necromancer:{c['reset']}                                               {c['cyan']}{V}{c['reset']}")
-                    has_necro_info = True
-                
-                import time
-                expires = getattr(player, 'soul_fragment_expires', 0)
-                remaining = max(0, int(expires - time.time()))
-                await player.send(f"{c['cyan']}{V}  {c['bright_cyan']}Soul Fragments: {fragments}/5{c['white']}  (-10% mana cost, +20% pet duration){c['cyan']} {V}{c['reset']}")
-                if remaining > 0:
-                    await player.send(f"{c['cyan']}{V}  {c['yellow']}Expires in: {remaining}s{c['cyan']}                                          {V}{c['reset']}")
-            
-            # Ritual status
-            if getattr(player, 'channeling_ritual', False):
-                if not has_necro_info:
-                    await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
-                    await player.send(f"{c['cyan']}{V} {c['bright_magenta']}Necromancer:{c['reset']}                                               {c['cyan']}{V}{c['reset']}")
-                    has_necro_info = True
-                duration = getattr(player, 'ritual_duration', 0)
-                await player.send(f"{c['cyan']}{V}  {c['bright_green']}Dark Ritual ACTIVE{c['white']} - {duration} rounds remaining{c['cyan']}              {V}{c['reset']}")
-            
-            # Ritual cooldown
-            cooldown_end = getattr(player, 'dark_ritual_cooldown', 0)
-            import time
-            now = time.time()
-            if cooldown_end > now:
-                if not has_necro_info:
-                    await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
-                    await player.send(f"{c['cyan']}{V} {c['bright_magenta']}Necromancer:{c['reset']}                                               {c['cyan']}{V}{c['reset']}")
-                    has_necro_info = True
-                remaining = int(cooldown_end - now)
-                await player.send(f"{c['cyan']}{V}  {c['red']}Dark Ritual on cooldown: {remaining}s{c['cyan']}                           {V}{c['reset']}")
-
-        await player.send(f"{c['cyan']}{BL}{H*W}{BR}{c['reset']}")
-        
-    @classmethod
-    @classmethod
-    async def cmd_inspect(cls, player: 'Player', args: List[str]):
-        """Inspect an item in detail — shows rarity, procs, lore, drop source.
-        
-        Usage: inspect <item>
-        """
-        if not args:
-            await player.send("Inspect what?")
-            return
-        target_name = ' '.join(args).lower()
-        item = None
-        for candidate in player.inventory + list(player.equipment.values()) + (player.room.items if player.room else []):
-            if candidate and (target_name in getattr(candidate, 'name', '').lower() or target_name in getattr(candidate, 'short_desc', '').lower()):
-                item = candidate
-                break
-        if not item:
-            await player.send("You don't see that here.")
-            return
-        try:
-            from legendary import format_inspect
-            lines = format_inspect(item, player.config)
-            for line in lines:
-                await player.send(line)
-        except Exception:
-            await player.send(item.get_description())
-
-    @classmethod
-    async def cmd_inventory(cls, player: 'Player', args: List[str]):
-        """Show inventory."""
-        c = player.config.COLORS
-        await player.send(f"{c['cyan']}You are carrying:{c['reset']}")
-        
-        if not player.inventory:
-            await player.send(f"  {c['white']}Nothing.{c['reset']}")
-        else:
-            from legendary import colorize_item_name
-            for item in player.inventory:
-                await player.send(f"  {colorize_item_name(item, player.config)}")
-
-        try:
-            from tips import TipManager
-            await TipManager.show_tutorial_hint(player, 'tutorial_inventory')
-        except Exception:
-            pass
-
-    @classmethod
-    async def cmd_clear(cls, player: 'Player', args: List[str]):
-        """Clear the screen.
-        
-        Usage: clear
-        """
-        # Send ANSI clear screen sequence
-        await player.send("\033[2J\033[H")
-
-    @classmethod
-    async def cmd_worth(cls, player: 'Player', args: List[str]):
-        """Show your total wealth breakdown.
-        
-        Usage: worth
-        """
-        c = player.config.COLORS
-        
-        # Gold on hand
-        gold_carried = player.gold
-        
-        # Gold in bank
-        bank_gold = getattr(player, 'bank_gold', 0)
-        
-        # Value of inventory items
-        inv_value = 0
-        for item in player.inventory:
-            inv_value += getattr(item, 'value', 0)
-        
-        # Value of equipped items
-        eq_value = 0
-        for slot, item in player.equipment.items():
-            if item:
-                eq_value += getattr(item, 'value', 0)
-        
-        # Value of storage
-        storage_value = 0
-        for item in getattr(player, 'storage', []):
-            storage_value += getattr(item, 'value', 0)
-        
-        total = gold_carried + bank_gold + inv_value + eq_value + storage_value
-        
-        await player.send(f"\n{c['bright_cyan']}═══════════════════════════════════════{c['reset']}")
-        await player.send(f"{c['bright_yellow']}          💰 Your Worth 💰{c['reset']}")
-        await player.send(f"{c['bright_cyan']}═══════════════════════════════════════{c['reset']}")
-        await player.send(f"{c['white']}  Gold carried:    {c['bright_yellow']}{gold_carried:>12,}{c['reset']}")
-        if bank_gold > 0:
-            await player.send(f"{c['white']}  Gold in bank:    {c['bright_yellow']}{bank_gold:>12,}{c['reset']}")
-        await player.send(f"{c['white']}  Inventory value: {c['yellow']}{inv_value:>12,}{c['reset']}")
-        await player.send(f"{c['white']}  Equipment value: {c['yellow']}{eq_value:>12,}{c['reset']}")
-        if storage_value > 0:
-            await player.send(f"{c['white']}  Storage value:   {c['yellow']}{storage_value:>12,}{c['reset']}")
-        await player.send(f"{c['bright_cyan']}───────────────────────────────────────{c['reset']}")
-        await player.send(f"{c['bright_white']}  Total worth:     {c['bright_green']}{total:>12,}{c['reset']}")
-        await player.send(f"{c['bright_cyan']}═══════════════════════════════════════{c['reset']}\n")
-
-    @classmethod
-    async def cmd_equipment(cls, player: 'Player', args: List[str]):
-        """Show equipped items."""
-        c = player.config.COLORS
-        await player.send(f"{c['cyan']}You are using:{c['reset']}")
-        
-        slot_names = {
-            'light': '<used as light>',
-            'finger1': '<worn on finger>',
-            'finger2': '<worn on finger>',
-            'neck1': '<worn around neck>',
-            'neck2': '<worn around neck>',
-            'body': '<worn on body>',
-            'head': '<worn on head>',
-            'legs': '<worn on legs>',
-            'feet': '<worn on feet>',
-            'hands': '<worn on hands>',
-            'arms': '<worn on arms>',
-            'shield': '<worn as shield>',
-            'about': '<worn about body>',
-            'waist': '<worn about waist>',
-            'wrist1': '<worn on wrist>',
-            'wrist2': '<worn on wrist>',
-            'wield': '<wielded>',
-            'hold': '<held>',
-            'dual_wield': '<dual wielded>',
-        }
-        
-        has_equipment = False
-        for slot in player.config.WEAR_SLOTS:
-            item = player.equipment.get(slot)
-            if item:
-                has_equipment = True
-                slot_desc = slot_names.get(slot, f'<{slot}>')
-                
-                # Special display for light sources
-                from legendary import colorize_item_name
-                colored_name = colorize_item_name(item, player.config)
-                if slot == 'light' or (slot == 'hold' and getattr(item, 'item_type', '') == 'light'):
-                    is_lit = getattr(item, 'light_lit', True)
-                    if is_lit:
-                        light_status = f"{c['bright_yellow']}(blazing){c['reset']}"
-                    else:
-                        light_status = f"{c['bright_black']}(dark){c['reset']}"
-                    await player.send(f"  {c['green']}{slot_desc:20}{colored_name} {light_status}")
-                else:
-                    await player.send(f"  {c['green']}{slot_desc:20}{colored_name}{c['reset']}")
-                
-        if not has_equipment:
-            await player.send(f"  {c['white']}Nothing.{c['reset']}")
-            
-    @classmethod
-    async def cmd_who(cls, player: 'Player', args: List[str]):
-        """Show online players with class, level, prestige, guild, title, idle time, and zone."""
-        import time as _time
-        c = player.config.COLORS
-        players = list(player.world.players.values())
-        
-        await player.send(f"{c['cyan']}╔══════════════════════════════════════════════════════════════════════╗{c['reset']}")
-        await player.send(f"{c['cyan']}║{c['bright_yellow']}                         Players Online                               {c['cyan']}║{c['reset']}")
-        await player.send(f"{c['cyan']}╠══════════════════════════════════════════════════════════════════════╣{c['reset']}")
-        
-        for p in players:
-            cls_name = player.config.CLASSES.get(p.char_class, {}).get('name', p.char_class)[:10]
-            from prestige import get_prestige_display_name
-            prestige_name = get_prestige_display_name(p)
-            prestige_str = f"/{prestige_name[:8]}" if prestige_name else ""
-            guild = getattr(p, 'guild', None)
-            guild_str = f" <{guild[:10]}>" if guild else ""
-            title_str = getattr(p, 'title', '') or ''
-            zone_name = ''
-            if p.room and p.room.zone:
-                zone_name = p.room.zone.name[:20]
-            # Idle time
-            idle_secs = 0
-            if hasattr(p, 'connection') and p.connection and hasattr(p.connection, 'last_input_time'):
-                idle_secs = int(_time.time() - p.connection.last_input_time)
-            idle_str = ''
-            if idle_secs > 300:
-                idle_min = idle_secs // 60
-                idle_str = f" (idle {idle_min}m)"
-            
-            line = f"[{p.level:>2} {cls_name}{prestige_str}]{guild_str} {p.name} {title_str}{idle_str}"
-            if zone_name:
-                line += f" - {zone_name}"
-            # Truncate/pad to fit box (68 chars content area)
-            if len(line) > 68:
-                line = line[:68]
-            pad = 68 - len(line)
-            await player.send(f"{c['cyan']}║ {c['bright_green']}{line}{' ' * pad}{c['cyan']}║{c['reset']}")
-            
-        await player.send(f"{c['cyan']}╠══════════════════════════════════════════════════════════════════════╣{c['reset']}")
-        count_str = f"{len(players)} player(s) online"
-        pad = max(0, 68 - len(count_str))
-        await player.send(f"{c['cyan']}║ {c['white']}{count_str}{' ' * pad}{c['cyan']}║{c['reset']}")
-        await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════════════╝{c['reset']}")
-
-    @classmethod
-    async def cmd_daily(cls, player: 'Player', args: List[str]):
-        """View your daily login bonus status.
-        
-        Usage: daily
-        
-        Log in each day to build your streak and earn better rewards!
-        """
-        from daily import DailyBonusManager
-        await DailyBonusManager.show_daily_status(player)
-
-    @classmethod
-    async def cmd_leaderboard(cls, player: 'Player', args: List[str]):
-        """View the server leaderboards.
-        
-        Usage: leaderboard [category]
-        Categories: level, kills, gold, deaths, achievements, quests
-        """
-        import os
-        from pathlib import Path
-        
-        c = player.config.COLORS
-        category = args[0].lower() if args else 'level'
-        
-        valid_categories = ['level', 'kills', 'gold', 'deaths', 'achievements', 'quests']
-        if category not in valid_categories:
-            await player.send(f"{c['yellow']}Valid categories: {', '.join(valid_categories)}{c['reset']}")
-            return
-        
-        # Load all player files
-        players_dir = Path(__file__).parent.parent / 'data' / 'players'
-        player_stats = []
-        
-        if players_dir.exists():
-            import json
-            for pfile in players_dir.glob('*.json'):
-                try:
-                    with open(pfile) as f:
-                        data = json.load(f)
-                    
-                    stats = {
-                        'name': data.get('name', pfile.stem),
-                        'level': data.get('level', 1),
-                        'kills': data.get('stats', {}).get('kills', 0),
-                        'gold': data.get('gold', 0),
-                        'deaths': data.get('stats', {}).get('deaths', data.get('deaths', 0)),
-                        'achievements': len(data.get('achievements', {})),
-                        'quests': len(data.get('quests_completed', [])),
-                    }
-                    player_stats.append(stats)
-                except Exception:
-                    pass
-        
-        # Sort by category
-        player_stats.sort(key=lambda x: x.get(category, 0), reverse=True)
-        
-        # Display leaderboard
-        category_titles = {
-            'level': '⚔️ Top Players by Level',
-            'kills': '💀 Most Kills',
-            'gold': '💰 Wealthiest Players',
-            'deaths': '👻 Most Deaths',
-            'achievements': '🏆 Achievement Leaders',
-            'quests': '📜 Quest Champions',
-        }
-        
-        await player.send(f"\n{c['bright_cyan']}═══════════════════════════════════════{c['reset']}")
-        await player.send(f"{c['bright_yellow']}     {category_titles.get(category, 'Leaderboard')}{c['reset']}")
-        await player.send(f"{c['bright_cyan']}═══════════════════════════════════════{c['reset']}")
-        
-        for i, ps in enumerate(player_stats[:10], 1):
-            # Medal for top 3
-            if i == 1:
-                medal = f"{c['bright_yellow']}🥇{c['reset']}"
-            elif i == 2:
-                medal = f"{c['white']}🥈{c['reset']}"
-            elif i == 3:
-                medal = f"{c['yellow']}🥉{c['reset']}"
-            else:
-                medal = f"{c['bright_black']}{i:>2}.{c['reset']}"
-            
-            value = ps.get(category, 0)
-            name = ps['name']
-            
-            # Highlight current player
-            if name.lower() == player.name.lower():
-                name = f"{c['bright_green']}{name}{c['reset']}"
-            else:
-                name = f"{c['white']}{name}{c['reset']}"
-            
-            await player.send(f" {medal} {name:<20} {c['bright_cyan']}{value:,}{c['reset']}")
-        
-        if not player_stats:
-            await player.send(f"{c['yellow']}  No players found.{c['reset']}")
-        
-        await player.send(f"{c['bright_cyan']}═══════════════════════════════════════{c['reset']}")
-        await player.send(f"{c['bright_black']}Categories: {', '.join(valid_categories)}{c['reset']}\n")
-
-    @classmethod
-    async def cmd_achievements(cls, player: 'Player', args: List[str]):
-        """View your achievements and progress.
-        
-        Usage: achievements [category]
-        Categories: combat, exploration, progression, collection, social
-        """
-        from achievements import AchievementManager
-        
-        category = args[0].lower() if args else None
-        valid_categories = ['combat', 'exploration', 'progression', 'collection', 'social']
-        
-        if category and category not in valid_categories:
-            c = player.config.COLORS
-            await player.send(f"{c['yellow']}Valid categories: {', '.join(valid_categories)}{c['reset']}")
-            return
-        
-        await AchievementManager.show_achievements(player, category)
-
-    @classmethod
-    async def cmd_account(cls, player: 'Player', args: List[str]):
-        """View and manage your account. Usage: account [create|chars|info]"""
-        c = player.config.COLORS
-        from accounts import Account, AccountManager
-        
-        if not args:
-            # Show account info
-            if player.account_name:
-                account = Account.load(player.account_name)
-                if account:
-                    await player.send(f"\r\n{c['cyan']}Account: {c['bright_green']}{account.account_name}{c['reset']}")
-                    await player.send(f"{c['cyan']}Characters: {c['white']}{', '.join(account.characters)}{c['reset']}")
-                    await player.send(f"{c['cyan']}Created: {c['white']}{account.created_at[:10]}{c['reset']}")
-                    if account.is_admin:
-                        await player.send(f"{c['bright_red']}[ADMIN ACCOUNT]{c['reset']}")
-                else:
-                    await player.send(f"{c['yellow']}Account not found.{c['reset']}")
-            else:
-                await player.send(f"{c['yellow']}You are not linked to an account.{c['reset']}")
-                await player.send(f"{c['cyan']}Use 'account create' to create one.{c['reset']}")
-            return
-        
-        cmd = args[0].lower()
-        
-        if cmd == 'create':
-            # Create account from current character
-            if player.account_name:
-                await player.send(f"{c['yellow']}You already have an account: {player.account_name}{c['reset']}")
-                return
-            
-            # Use character name as account name
-            account_name = player.name.lower()
-            if Account.exists(account_name):
-                await player.send(f"{c['red']}Account '{account_name}' already exists!{c['reset']}")
-                return
-            
-            # Create account with same password as character
-            account = Account(account_name)
-            account.password_hash = player.password_hash  # Copy password
-            account.add_character(player.name)
-            account.save()
-            
-            player.account_name = account_name
-            await player.save()
-            
-            await player.send(f"{c['bright_green']}Account '{account_name}' created!{c['reset']}")
-            await player.send(f"{c['cyan']}Your character '{player.name}' is now linked.{c['reset']}")
-            await player.send(f"{c['cyan']}You can create more characters by logging in with your account.{c['reset']}")
-        
-        elif cmd == 'chars':
-            if not player.account_name:
-                await player.send(f"{c['yellow']}You are not linked to an account.{c['reset']}")
-                return
-            
-            account = Account.load(player.account_name)
-            if account:
-                char_info = AccountManager.get_character_info(account)
-                await player.send(f"\r\n{c['cyan']}Characters on account '{account.account_name}':{c['reset']}")
-                for info in char_info:
-                    marker = " *" if info['name'] == player.name else ""
-                    await player.send(f"  {c['bright_green']}{info['name']:<12}{c['white']} Lvl {info['level']:<3} {info['class']}{marker}{c['reset']}")
-            else:
-                await player.send(f"{c['red']}Account not found.{c['reset']}")
-        
-        elif cmd == 'password':
-            # Change account password: account password <old> <new>
-            if not player.account_name:
-                await player.send(f"{c['yellow']}You are not linked to an account.{c['reset']}")
-                return
-            if len(args) < 3:
-                await player.send(f"{c['yellow']}Usage: account password <old> <new>{c['reset']}")
-                return
-            old_pw = args[1]
-            new_pw = args[2]
-            account = Account.load(player.account_name)
-            if not account:
-                await player.send(f"{c['red']}Account not found.{c['reset']}")
-                return
-            if not account.check_password(old_pw):
-                await player.send(f"{c['red']}Incorrect current password.{c['reset']}")
-                return
-            if len(new_pw) < 4:
-                await player.send(f"{c['yellow']}New password must be at least 4 characters.{c['reset']}")
-                return
-            account.set_password(new_pw)
-            account.save()
-            await player.send(f"{c['bright_green']}Password updated successfully.{c['reset']}")
 
-        elif cmd == 'email':
-            # account email <address>
-            if not player.account_name:
-                await player.send(f"{c['yellow']}You are not linked to an account.{c['reset']}")
-                return
-            if len(args) < 2:
-                await player.send(f"{c['yellow']}Usage: account email <address>{c['reset']}")
-                return
-            account = Account.load(player.account_name)
-            if not account:
-                await player.send(f"{c['red']}Account not found.{c['reset']}")
-                return
-            email = args[1]
-            if not AccountManager.set_email(account, email):
-                await player.send(f"{c['red']}Invalid email address.{c['reset']}")
-                return
-            await player.send(f"{c['bright_green']}Email set to {email}.{c['reset']}")
 
-        elif cmd == 'forgot':
-            # account forgot - send reset email
-            if not player.account_name:
-                await player.send(f"{c['yellow']}You are not linked to an account.{c['reset']}")
-                return
-            account = Account.load(player.account_name)
-            if not account:
-                await player.send(f"{c['red']}Account not found.{c['reset']}")
-                return
-            if not account.settings.get('email'):
-                await player.send(f"{c['yellow']}No email set. Use: account email <address>{c['reset']}")
-                return
-            token = AccountManager.generate_reset_token(account)
-            sent = AccountManager.send_reset_email(account, token)
-            if sent:
-                await player.send(f"{c['bright_green']}Reset email sent to {account.settings['email']}.{c['reset']}")
-            else:
-                await player.send(f"{c['red']}Email not configured. Ask an admin to reset your password.{c['reset']}")
-
-        elif cmd == 'recover':
-            # account recover <token> <newpass>
-            if not player.account_name:
-                await player.send(f"{c['yellow']}You are not linked to an account.{c['reset']}")
-                return
-            if len(args) < 3:
-                await player.send(f"{c['yellow']}Usage: account recover <token> <newpass>{c['reset']}")
-                return
-            token = args[1]
-            new_pw = args[2]
-            ok = AccountManager.reset_with_token(player.account_name, token, new_pw)
-            if ok:
-                await player.send(f"{c['bright_green']}Password reset successfully.{c['reset']}")
-            else:
-                await player.send(f"{c['red']}Invalid or expired token.{c['reset']}")
-        
-        elif cmd == 'reset':
-            # Immortal reset: account reset <account> <newpass>
-            if len(args) < 3:
-                await player.send(f"{c['yellow']}Usage: account reset <account> <newpass>{c['reset']}")
-                return
-            # Immortal check
-            if getattr(player, 'level', 0) < player.config.IMMORTAL_LEVEL:
-                await player.send(f"{c['red']}You do not have permission to do that.{c['reset']}")
-                return
-            target_account = args[1].lower()
-            new_pw = args[2]
-            if len(new_pw) < 4:
-                await player.send(f"{c['yellow']}New password must be at least 4 characters.{c['reset']}")
-                return
-            account = Account.load(target_account)
-            if not account:
-                await player.send(f"{c['red']}Account '{target_account}' not found.{c['reset']}")
-                return
-            account.set_password(new_pw)
-            account.save()
-            await player.send(f"{c['bright_green']}Password for '{target_account}' reset.{c['reset']}")
-        
-        elif cmd == 'info':
-            await cls.cmd_account(player, [])  # Same as no args
-        
-        else:
-            await player.send(f"{c['yellow']}Usage: account [create|chars|info|password|email|forgot|recover|reset]{c['reset']}")
-
-    @classmethod
-    async def cmd_map(cls, player: 'Player', args: List[str]):
-        """Display ASCII map.
-
-        Usage:
-            map        - Show local explored map
-            map full   - Show entire explored area
-            map zone   - Show explored rooms in current zone
-        """
-        from map_system import render_ascii_map
-
-        mode = 'local'
-        if args:
-            arg = args[0].lower()
-            if arg in ('full', 'zone'):
-                mode = arg
-
-        size = getattr(player.config, 'MAP_VIEW_SIZE', 11)
-        output = render_ascii_map(player, mode=mode, size=size)
-        for line in output.split('\n'):
-            await player.send(line)
-
-    @classmethod
-    @classmethod
-    async def cmd_minimap(cls, player: 'Player', args: List[str]):
-        """Display a compact ASCII minimap centered on the player."""
-        from map_system import render_ascii_map
-
-        size = getattr(player.config, 'MAP_MINI_SIZE', 7)
-        output = render_ascii_map(player, mode='local', size=size)
-        for line in output.split('\n'):
-            await player.send(line)
-
-    @classmethod
-    async def cmd_mapurl(cls, player: 'Player', args: List[str]):
-        """Show the web map URL for this player."""
-        host = getattr(player.config, 'MAP_PUBLIC_HOST', 'localhost')
-        port = getattr(player.config, 'MAP_PORT', 4001)
-        url = f"http://{host}:{port}/?player={player.name}"
-        c = player.config.COLORS
-        current_zone = player.room.zone if getattr(player, 'room', None) else None
-        await player.send(f"{c['cyan']}Web map:{c['reset']} {c['bright_green']}{url}{c['reset']}")
-
-        await player.send("")
-        await player.send(f"{c['bright_yellow']}═══ SPECIAL ZONES ═══{c['reset']}")
-        zones_special = [
-            (0, "Limbo", "Admin zone"),
-            (12, "God Simplex", "Immortal area"),
-        ]
-        for vnum, name, desc in zones_special:
-            marker = f"{c['bright_green']}[YOU]" if vnum == current_zone else "     "
-            await player.send(f"  {marker} {c['magenta']}{vnum:3d}{c['reset']} - {c['white']}{name:<30}{c['magenta']} {desc}{c['reset']}")
-
-        await player.send("")
-        await player.send(f"{c['cyan']}═══ MAP LEGEND ═══{c['reset']}")
-        await player.send(f"  {c['bright_green']}[YOU]{c['reset']} - Your current zone")
-        await player.send(f"  {c['cyan']}###{c['reset']}  - Zone number (use 'goto' to travel)")
-        await player.send(f"  {c['yellow']}Recall{c['reset']} to return to Temple of Midgaard (zone 30)")
-        await player.send("")
-        await player.send(f"{c['white']}Total: {c['bright_green']}37 zones{c['white']}, {c['bright_green']}2,002 rooms{c['white']}, {c['bright_green']}48 shops{c['reset']}")
-        await player.send(f"{c['cyan']}═════════════════════════════════════════════════════════════════════════{c['reset']}")
-
-    @classmethod
-    async def _show_local_map(cls, player: 'Player'):
-        """Display an ASCII map of the current zone with player position."""
-        c = player.config.COLORS
-
-        if not player.room:
-            await player.send("You are nowhere!")
-            return
-
-        # Zone-specific ASCII maps
-        zone_maps = {
-            30: """
-{cyan}╔════════════════════════════════════════════════════════════╗
-║{bright_yellow}              The City of Midgaard - Map                    {cyan}║
-╠════════════════════════════════════════════════════════════╣
-║{white}                                                            {cyan}║
-║{white}                         [Temple]                          {cyan}║
-║{white}                            |                              {cyan}║
-║{white}              [Dark]---[Square]---[East St]---[E.Gate]    {cyan}║
-║{white}               Alley       |         |                     {cyan}║
-║{white}                 |      [W.St]---[Weapon]                 {cyan}║
-║{white}              [Dead]       |         |                     {cyan}║
-║{white}                 |       [Inn]---[Magic]                   {cyan}║
-║{white}              [Guild]                                      {cyan}║
-║{white}                 |                                         {cyan}║
-║{white}              [Sewers]                                     {cyan}║
-║{white}                                                            {cyan}║
-╚════════════════════════════════════════════════════════════╝{reset}
-""",
-            35: """
-{cyan}╔════════════════════════════════════════════════════════════╗
-║{bright_yellow}           The Sewers of Midgaard - Map                    {cyan}║
-╠════════════════════════════════════════════════════════════╣
-║{white}                                                            {cyan}║
-║{white}              [City Exit]                                  {cyan}║
-║{white}                   |                                       {cyan}║
-║{white}          [Flooded]---[Side]                              {cyan}║
-║{white}               |         |                                 {cyan}║
-║{white}     [Entrance]---[Junction]---[Storage]                  {cyan}║
-║{white}               |         |                                 {cyan}║
-║{white}           [Rat King] [Pool]---[Collector]                {cyan}║
-║{white}                                                            {cyan}║
-╚════════════════════════════════════════════════════════════╝{reset}
-""",
-            40: """
-{cyan}╔════════════════════════════════════════════════════════════╗
-║{bright_yellow}             Haon Dor Forest - Map                         {cyan}║
-╠════════════════════════════════════════════════════════════╣
-║{white}                                                            {cyan}║
-║{white}                      [Clearing]                           {cyan}║
-║{white}                           |                               {cyan}║
-║{white}         [Midgaard]---[Entrance]---[Dark Path]            {cyan}║
-║{white}                           |                               {cyan}║
-║{white}                      [Oak Grove]                          {cyan}║
-║{white}                           |                               {cyan}║
-║{white}                    [Goblin Warrens]                       {cyan}║
-║{white}                                                            {cyan}║
-╚════════════════════════════════════════════════════════════╝{reset}
-"""
-        }
-
-        # Get the appropriate map for this zone
-        zone_num = player.room.vnum // 100
-        map_template = zone_maps.get(zone_num)
-
-        if not map_template:
-            # Generic map for zones without specific maps
-            await player.send(f"{c['cyan']}Local map not available for this zone.{c['reset']}")
-            await player.send(f"{c['yellow']}Try 'map' or 'map world' to see the world overview.{c['reset']}")
-            await player.send(f"{c['white']}Current location: {player.room.name}{c['reset']}")
-            return
-
-        # Replace room names with highlighted version if player is there
-        room_markers = {
-            # Zone 30 - Midgaard
-            3001: "Temple",
-            3002: "Square",
-            3003: "East St",
-            3004: "E.Gate",
-            3005: "W.St",
-            3010: "Dark",
-            3011: "Dead",
-            3012: "Guild",
-            3020: "Weapon",
-            3021: "Magic",
-            3030: "Inn",
-            3031: "Inn",
-            # Zone 35 - Sewers
-            3500: "Entrance",
-            3501: "Flooded",
-            3502: "Junction",
-            3503: "Rat King",
-            3504: "City Exit",
-            3505: "Flooded",
-            3506: "Pool",
-            3507: "Side",
-            3508: "Storage",
-            3509: "Collector",
-            # Zone 40 - Forest
-            4001: "Entrance",
-            4002: "Clearing",
-            4003: "Dark Path",
-            4004: "Oak Grove",
-        }
-
-        marker = room_markers.get(player.room.vnum)
-        if marker:
-            # Highlight player's current position
-            map_output = map_template.replace(f"[{marker}]", f"{{bright_green}}[@{marker}@]{{white}}")
-        else:
-            map_output = map_template
-
-        # Format with colors
-        map_output = map_output.format(**c)
-
-        await player.send(map_output)
-        await player.send(f"{c['bright_yellow']}You are here: {c['bright_green']}{player.room.name}{c['reset']}")
-
-    @classmethod
-    async def cmd_help(cls, player: 'Player', args: List[str]):
-        """Show help information for commands, skills, and spells."""
-        from help_data import get_help_text, HELP_TOPICS
-
-        c = player.config.COLORS
-
-        if not args:
-            # Show comprehensive help index with pagination
-            await cls.show_help_index(player)
-            return
-
-        # Look up specific topic
-        topic = ' '.join(args).lower()
-        help_text = get_help_text(topic)
-
-        if help_text:
-            await player.send(f"{c['white']}{help_text}{c['reset']}")
-        else:
-            await player.send(f"{c['red']}No help available for '{topic}'.{c['reset']}")
-            await player.send(f"{c['yellow']}Type 'help' for a list of topics.{c['reset']}")
-
-    @classmethod
-    async def show_help_index(cls, player: 'Player'):
-        """Show paginated help index with all topics."""
-        from help_data import HELP_TOPICS
-        c = player.config.COLORS
-        
-        # Organize topics by category
-        categories = {
-            'Basic Commands': [],
-            'Movement': [],
-            'Communication': [],
-            'Combat': [],
-            'Skills': [],
-            'Spells': [],
-            'Bard Songs': [],
-            'Equipment & Items': [],
-            'Groups & Social': [],
-            'Information': [],
-            'Classes': [],
-            'Miscellaneous': []
-        }
-        
-        # Categorize all topics
-        for topic, data in sorted(HELP_TOPICS.items()):
-            cat = data.get('category', 'command')
-            title = data.get('title', topic.replace('_', ' ').title())
-            
-            if cat == 'skill':
-                categories['Skills'].append(topic)
-            elif cat == 'spell':
-                categories['Spells'].append(topic)
-            elif cat == 'class':
-                categories['Classes'].append(topic)
-            elif 'song' in topic.lower() or topic in ['perform', 'encore', 'countersong', 'fascinate', 'mock', 'songs']:
-                categories['Bard Songs'].append(topic)
-            elif topic in ['north', 'south', 'east', 'west', 'up', 'down', 'movement', 'flee', 'enter', 'leave', 'recall', 'teleport']:
-                categories['Movement'].append(topic)
-            elif topic in ['say', 'tell', 'shout', 'whisper', 'chat', 'gtell', 'emote', 'communication', 'channels']:
-                categories['Communication'].append(topic)
-            elif topic in ['kill', 'attack', 'combat', 'flee', 'rescue', 'kick', 'bash', 'backstab', 'target']:
-                categories['Combat'].append(topic)
-            elif topic in ['equipment', 'inventory', 'wear', 'wield', 'remove', 'drop', 'get', 'put', 'containers', 'armor']:
-                categories['Equipment & Items'].append(topic)
-            elif topic in ['group', 'follow', 'unfollow', 'assist', 'split', 'gtell']:
-                categories['Groups & Social'].append(topic)
-            elif topic in ['score', 'who', 'look', 'examine', 'consider', 'where', 'time', 'weather', 'affects']:
-                categories['Information'].append(topic)
-            elif topic in ['look', 'help', 'quit', 'save', 'practice', 'train', 'rest', 'sleep', 'wake', 'stand']:
-                categories['Basic Commands'].append(topic)
-            else:
-                categories['Miscellaneous'].append(topic)
-        
-        # Build output lines
-        lines = []
-        lines.append(f"{c['bright_cyan']}{'═' * 70}")
-        lines.append(f"{c['bright_yellow']}{'MISTHOLLOW HELP INDEX':^70}")
-        lines.append(f"{c['bright_cyan']}{'═' * 70}{c['reset']}")
-        lines.append(f"{c['white']}Type 'help <topic>' for detailed information on any topic.{c['reset']}")
-        lines.append("")
-        
-        for cat_name, topics in categories.items():
-            if not topics:
-                continue
-            topics = sorted(set(topics))
-            lines.append(f"{c['bright_yellow']}[ {cat_name} ]{c['reset']}")
-            # Format in columns
-            row = []
-            for topic in topics:
-                row.append(f"{c['cyan']}{topic:<18}{c['reset']}")
-                if len(row) == 4:
-                    lines.append("  " + "".join(row))
-                    row = []
-            if row:
-                lines.append("  " + "".join(row))
-            lines.append("")
-        
-        lines.append(f"{c['bright_cyan']}{'═' * 70}{c['reset']}")
-        lines.append(f"{c['white']}Total topics: {len(HELP_TOPICS)} | Type 'help <topic>' for details{c['reset']}")
-        
-        # Paginate - 20 lines per page
-        page_size = 20
-        total_lines = len(lines)
-        
-        for i in range(0, total_lines, page_size):
-            page = lines[i:i + page_size]
-            for line in page:
-                await player.send(line)
-            
-            # If more pages, prompt to continue
-            if i + page_size < total_lines:
-                await player.send(f"\n{c['bright_yellow']}-- Press ENTER to continue ({i + page_size}/{total_lines} lines) --{c['reset']}")
-                # Set a flag so the next empty input continues
-                player.help_pagination = {
-                    'lines': lines,
-                    'offset': i + page_size
-                }
-                return
-        
-        # Clear pagination if we reached the end
-        player.help_pagination = None
-
-    @classmethod
-    async def continue_help_pagination(cls, player: 'Player'):
-        """Continue showing paginated help."""
-        c = player.config.COLORS
-        pag = player.help_pagination
-        if not pag:
-            return
-        
-        lines = pag['lines']
-        offset = pag['offset']
-        page_size = 20
-        total_lines = len(lines)
-        
-        # Show next page
-        page = lines[offset:offset + page_size]
-        for line in page:
-            await player.send(line)
-        
-        # If more pages remain
-        if offset + page_size < total_lines:
-            await player.send(f"\n{c['bright_yellow']}-- Press ENTER to continue ({offset + page_size}/{total_lines} lines) --{c['reset']}")
-            player.help_pagination = {
-                'lines': lines,
-                'offset': offset + page_size
-            }
-        else:
-            # Done
-            player.help_pagination = None
-
-    @classmethod
-    async def cmd_where(cls, player: 'Player', args: List[str]):
-        """Show where players/mobs are."""
-        c = player.config.COLORS
-        
-        if not args:
-            # Show all players in zone
-            await player.send(f"{c['cyan']}Players in your area:{c['reset']}")
-            for p in player.world.players.values():
-                if p.room and player.room and p.room.zone == player.room.zone:
-                    await player.send(f"  {c['white']}{p.name:20} - {p.room.name}{c['reset']}")
-        else:
-            # Search for a specific mob/player
-            target = ' '.join(args).lower()
-            found = False
-            
-            # Search NPCs in zone
-            for npc in player.world.npcs:
-                if npc.room and player.room and npc.room.zone == player.room.zone:
-                    if target in npc.name.lower():
-                        await player.send(f"  {c['white']}{npc.name:20} - {npc.room.name}{c['reset']}")
-                        found = True
-                        
-            # Search players
-            for p in player.world.players.values():
-                if p.room and player.room and p.room.zone == player.room.zone:
-                    if target in p.name.lower():
-                        await player.send(f"  {c['white']}{p.name:20} - {p.room.name}{c['reset']}")
-                        found = True
-                        
-            if not found:
-                await player.send(f"You don't sense '{target}' nearby.")
-
-
-    @classmethod
-    async def cmd_consider(cls, player: 'Player', args: List[str]):
-        """Consider how tough a mob is and learn about its capabilities."""
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send("Consider whom?")
-                return
-            
-        target_name = ' '.join(args)
-        target = player.find_target_in_room(target_name)
-                
-        if not target:
-            await player.send(f"You don't see '{target_name}' here.")
-            return
-            
-        c = player.config.COLORS
-        diff = target.level - player.level
-        target_level = getattr(target, 'level', 1)
-        
-        await player.send(f"\r\n{c['bright_cyan']}=== Considering: {target.name} ==={c['reset']}")
-        
-        # Difficulty rating and exp info
-        if diff <= -10:
-            msg = f"{c['bright_cyan']}Now where did that chicken go?{c['reset']}"
-            exp_note = "gray (10% exp)"
-            danger = "Trivial"
-            advice = "No real danger."
-        elif diff <= -7:
-            msg = f"{c['cyan']}You could kill {target.name} naked and weaponless.{c['reset']}"
-            exp_note = "trivial (25% exp)"
-            danger = "Trivial"
-            advice = "Very low risk."
-        elif diff <= -4:
-            msg = f"{c['cyan']}{target.name} is far beneath your skill.{c['reset']}"
-            exp_note = "easy (50% exp)"
-            danger = "Easy"
-            advice = "You should win easily."
-        elif diff <= -2:
-            msg = f"{c['bright_green']}{target.name} looks like an easy kill.{c['reset']}"
-            exp_note = "green (80% exp)"
-            danger = "Easy"
-            advice = "You should win with minimal risk."
-        elif diff <= 1:
-            msg = f"{c['green']}A perfect match!{c['reset']}"
-            exp_note = "even (100% exp)"
-            danger = "Even"
-            advice = "Expect a fair fight."
-        elif diff <= 2:
-            msg = f"{c['yellow']}{target.name} might put up a fight.{c['reset']}"
-            exp_note = "yellow (+15% exp)"
-            danger = "Moderate"
-            advice = "Be ready to heal or flee."
-        elif diff <= 4:
-            msg = f"{c['yellow']}{target.name} says 'Do you feel lucky, punk?'{c['reset']}"
-            exp_note = "challenging (+30% exp)"
-            danger = "Challenging"
-            advice = "Bring consumables or a friend."
-        elif diff <= 6:
-            msg = f"{c['bright_red']}{target.name} laughs at your puny weapons.{c['reset']}"
-            exp_note = "dangerous (+50% exp)"
-            danger = "Dangerous"
-            advice = "High risk without a group."
-        else:
-            msg = f"{c['red']}Death will thank you for your gift.{c['reset']}"
-            exp_note = "suicide (+50% exp)"
-            danger = "DEADLY"
-            advice = "Avoid unless you have a strong group."
-            
-        await player.send(msg)
-        await player.send(f"{c['white']}Threat: {danger}  |  Level: {target_level} vs You {player.level}  |  XP: {exp_note}{c['reset']}")
-        await player.send(f"{c['white']}Outcome: {advice}{c['reset']}")
-
-        # Tactical quick stats (OB/DB/PB style)
-        try:
-            player_ob = player.get_hit_bonus()
-            player_db = 100 - player.get_armor_class()
-            player_pb = int(getattr(player, 'damage_reduction', 0))
-            target_ob = target.get_hit_bonus() if hasattr(target, 'get_hit_bonus') else getattr(target, 'hitroll', 0)
-            target_db = 100 - (target.get_armor_class() if hasattr(target, 'get_armor_class') else getattr(target, 'armor_class', 100))
-            target_pb = int(getattr(target, 'damage_reduction', 0))
-            await player.send(
-                f"{c['white']}Tactics:{c['reset']} "
-                f"{c['bright_cyan']}OB/DB/PB{c['reset']} "
-                f"{c['white']}You {player_ob:+d}/{player_db:+d}/{player_pb}% "
-                f"| {target.name} {target_ob:+d}/{target_db:+d}/{target_pb}%{c['reset']}"
-            )
-        except Exception:
-            pass
-
-        # Stance, movement, and defense layers
-        try:
-            stance = getattr(target, 'stance', 'normal')
-            stance_label = stance.title() if isinstance(stance, str) else 'Normal'
-            move = getattr(target, 'move', None)
-            if move is None:
-                move_state = "steady"
-            else:
-                move_state = "winded" if move < player.config.FLEE_MOVE_COST else "steady"
-            defenses = []
-            shield_bonus = target.get_shield_evasion_bonus() if hasattr(target, 'get_shield_evasion_bonus') else 0
-            if shield_bonus > 0:
-                defenses.append(f"shield +{shield_bonus}%")
-            skills = getattr(target, 'skills', {}) or {}
-            if skills.get('parry', 0) > 0:
-                defenses.append('parry')
-            if skills.get('dodge', 0) > 0:
-                defenses.append('dodge')
-            if skills.get('shield_block', 0) > 0:
-                defenses.append('block')
-            if skills.get('evasion', 0) > 0:
-                defenses.append('evasion')
-            if getattr(target, 'damage_reduction', 0) > 0:
-                defenses.append(f"mit {int(getattr(target, 'damage_reduction', 0))}%")
-            defenses_display = ', '.join(defenses[:4]) if defenses else 'baseline'
-            await player.send(
-                f"{c['white']}State:{c['reset']} "
-                f"Stance {stance_label} | Move {move_state} | Defenses: {defenses_display}"
-            )
-        except Exception:
-            pass
-        
-        # Health assessment
-        hp_ratio = target.hp / max(1, target.max_hp)
-        if hp_ratio > 0.9:
-            hp_status = f"{c['bright_green']}excellent condition{c['reset']}"
-        elif hp_ratio > 0.7:
-            hp_status = f"{c['green']}good condition{c['reset']}"
-        elif hp_ratio > 0.5:
-            hp_status = f"{c['yellow']}slightly wounded{c['reset']}"
-        elif hp_ratio > 0.3:
-            hp_status = f"{c['yellow']}wounded{c['reset']}"
-        elif hp_ratio > 0.15:
-            hp_status = f"{c['red']}badly wounded{c['reset']}"
-        else:
-            hp_status = f"{c['bright_red']}near death{c['reset']}"
-        await player.send(f"{c['white']}Health: {hp_status}{c['reset']}")
-        
-        # Combat style assessment (based on stats and equipment)
-        combat_styles = []
-        target_str = getattr(target, 'str', 10)
-        target_int = getattr(target, 'int', 10)
-        target_dex = getattr(target, 'dex', 10)
-        
-        if target_str > target_int and target_str > target_dex:
-            combat_styles.append("heavy hitter")
-        elif target_int > target_str:
-            combat_styles.append("spellcaster")
-        elif target_dex > target_str:
-            combat_styles.append("agile fighter")
-        
-        # Check for special abilities based on mob type/flags
-        special_abilities = []
-        target_flags = getattr(target, 'flags', set())
-        if isinstance(target_flags, list):
-            target_flags = set(target_flags)
-            
-        if 'caster' in target_flags or 'magic_user' in target_flags:
-            special_abilities.append(f"{c['magenta']}casts spells{c['reset']}")
-        if 'healer' in target_flags:
-            special_abilities.append(f"{c['green']}can heal{c['reset']}")
-        if 'poisonous' in target_flags:
-            special_abilities.append(f"{c['bright_green']}poisonous attacks{c['reset']}")
-        if 'stun' in target_flags or 'basher' in target_flags:
-            special_abilities.append(f"{c['yellow']}can stun{c['reset']}")
-        if 'drainer' in target_flags:
-            special_abilities.append(f"{c['magenta']}drains life{c['reset']}")
-        if 'fire' in target_flags or 'firebreath' in target_flags:
-            special_abilities.append(f"{c['red']}fire attacks{c['reset']}")
-        if 'cold' in target_flags or 'frostbreath' in target_flags:
-            special_abilities.append(f"{c['cyan']}cold attacks{c['reset']}")
-            
-        # Boss-specific info
-        if getattr(target, 'is_boss', False) or 'boss' in target_flags:
-            special_abilities.insert(0, f"{c['bright_magenta']}BOSS{c['reset']}")
-            # Show boss abilities if available
-            boss_config = getattr(target, 'boss_config', {})
-            abilities = boss_config.get('abilities', [])
-            for ability in abilities[:3]:  # Show up to 3 abilities
-                ability_name = ability.get('name', ability.get('type', 'unknown'))
-                special_abilities.append(f"{c['bright_yellow']}{ability_name}{c['reset']}")
-        
-        if special_abilities:
-            await player.send(f"{c['cyan']}Special:{c['reset']} {', '.join(special_abilities)}")
-        
-        # Behavior warnings
-        warnings = []
-        if 'aggressive' in target_flags:
-            warnings.append(f"{c['red']}Will attack on sight!{c['reset']}")
-        if 'hunter' in target_flags or 'tracker' in target_flags:
-            warnings.append(f"{c['yellow']}Will hunt you if you flee!{c['reset']}")
-        if 'memory' in target_flags:
-            warnings.append(f"{c['yellow']}Remembers attackers{c['reset']}")
-        if 'assist' in target_flags:
-            warnings.append(f"{c['yellow']}Calls for help{c['reset']}")
-        if 'wimpy' in target_flags:
-            warnings.append(f"{c['green']}Flees when wounded{c['reset']}")
-            
-        if warnings:
-            await player.send(f"{c['red']}Warning:{c['reset']} {', '.join(warnings)}")
-        
-        # Weakness hints (class-specific tips)
-        hints = []
-        mob_class = (getattr(target, 'mob_class', '') or '').lower()
-        if 'undead' in target_flags or 'undead' in str(target.name).lower():
-            hints.append("Vulnerable to holy attacks and turning")
-        if 'animal' in target_flags or mob_class == 'animal':
-            hints.append("Can be calmed or charmed by rangers")
-        if 'humanoid' in target_flags and target_int > 12:
-            hints.append("May be susceptible to sleep/charm spells")
-        if target_dex < 10:
-            hints.append("Low agility - easier to hit")
-        if target_level <= 3:
-            hints.append("Good target for beginners")
-            
-        if hints and player.level >= target_level - 5:  # Only show hints if not too underleveled
-            await player.send(f"{c['cyan']}Insight:{c['reset']} {hints[0]}")
-        
-        await player.send("")
-
-    # ==================== SKILLS ====================
-
-    @classmethod
-    async def cmd_sneak(cls, player: 'Player', args: List[str]):
-        """Toggle sneak mode."""
-        c = player.config.COLORS
-
-        # Check if player has the skill
-        if 'sneak' not in player.skills:
-            await player.send(f"{c['red']}You don't know how to sneak!{c['reset']}")
-            return
-
-        # If exposed, block sneaking
-        import time, random
-        if getattr(player, 'exposed_until', 0) > time.time():
-            await player.send(f"{c['red']}You're too exposed to sneak right now.{c['reset']}")
-            return
-
-        # Toggle sneak
-        if 'sneaking' in player.flags:
-            player.flags.remove('sneaking')
-            await player.send(f"{c['yellow']}You stop sneaking.{c['reset']}")
-        else:
-            skill_level = player.get_skill_level('sneak')
-            if random.randint(1, 100) <= skill_level:
-                player.flags.add('sneaking')
-                await player.send(f"{c['green']}You start moving silently...{c['reset']}")
-                await player.improve_skill('sneak', difficulty=3)
-            else:
-                await player.send(f"{c['yellow']}You try to move quietly but fail.{c['reset']}")
-
-    @classmethod
-    async def cmd_ritual(cls, player: 'Player', args: List[str]):
-        """Perform dark ritual to empower all undead pets (Necromancer only)."""
-        c = player.config.COLORS
-        
-        # Class check
-        if player.char_class != 'necromancer':
-            await player.send(f"{c['red']}Only necromancers can perform dark rituals!{c['reset']}")
-            return
-        
-        # Check if already channeling
-        if hasattr(player, 'channeling_ritual') and player.channeling_ritual:
-            await player.send(f"{c['yellow']}You are already channeling a ritual!{c['reset']}")
-            return
-        
-        # Check cooldown
-        import time
-        now = time.time()
-        cooldown_end = getattr(player, 'dark_ritual_cooldown', 0)
-        if now < cooldown_end:
-            remaining = int(cooldown_end - now)
-            await player.send(f"{c['red']}Dark ritual is on cooldown! ({remaining}s remaining){c['reset']}")
-            return
-        
-        # Check mana and HP cost
-        mana_cost = 30
-        skill_level = player.skills.get('dark_ritual', 1)
-        hp_percent = 0.15 if skill_level < 76 else 0.10  # Reduced at high skill
-        hp_cost = int(player.max_hp * hp_percent)
-        
-        if player.mana < mana_cost:
-            await player.send(f"{c['red']}You need {mana_cost} mana to perform the ritual!{c['reset']}")
-            return
-        
-        if player.hp <= hp_cost:
-            await player.send(f"{c['red']}The ritual would kill you! You need more than {hp_cost} HP.{c['reset']}")
-            return
-        
-        # Get undead pets
-        from pets import PetManager
-        pets = PetManager.get_player_pets(player)
-        undead_pets = [p for p in pets if p.pet_type == 'undead']
-        
-        if not undead_pets:
-            await player.send(f"{c['yellow']}You have no undead servants to empower!{c['reset']}")
-            return
-        
-        # Pay costs
-        player.mana -= mana_cost
-        player.hp -= hp_cost
-        
-        # Calculate duration based on skill level
-        if skill_level < 26:
-            duration_rounds = 20  # ~1 minute
-        elif skill_level < 51:
-            duration_rounds = 30  # ~1.5 minutes
-        elif skill_level < 76:
-            duration_rounds = 40  # ~2 minutes
-        else:
-            duration_rounds = 50  # ~2.5 minutes
-        
-        # Apply ritual buff to all undead pets
-        for pet in undead_pets:
-            if not hasattr(pet, 'ritual_buff_duration'):
-                pet.ritual_buff_duration = 0
-            pet.ritual_buff_duration = duration_rounds
-            
-            # Apply stat bonuses
-            if not hasattr(pet, 'ritual_bonuses'):
-                pet.ritual_bonuses = {}
-            pet.ritual_bonuses = {
-                'str': 3,
-                'dex': 3,
-                'con': 3,
-                'regen': 5  # 5% HP per round
-            }
-        
-        # Set channeling state (prevents other spellcasting)
-        player.channeling_ritual = True
-        player.ritual_duration = duration_rounds
-        
-        # Set cooldown (5 minutes)
-        player.dark_ritual_cooldown = now + 300
-        
-        await player.send(f"{c['bright_magenta']}You begin the dark ritual, sacrificing {hp_cost} HP and {mana_cost} mana!{c['reset']}")
-        await player.send(f"{c['green']}All {len(undead_pets)} undead servants are empowered for {duration_rounds} rounds!{c['reset']}")
-        await player.send(f"{c['yellow']}Effects: +3 to all stats, 5% HP regen per round{c['reset']}")
-        
-        if player.room:
-            await player.room.send_to_room(
-                f"{c['bright_magenta']}{player.name} begins chanting in a guttural tongue, dark energy swirling!{c['reset']}",
-                exclude=[player]
-            )
-        
-        # Improve skill
-        await player.improve_skill('dark_ritual', difficulty=5)
-
-    @classmethod
-    async def cmd_hide(cls, player: 'Player', args: List[str]):
-        """Attempt to hide in shadows."""
-        c = player.config.COLORS
-
-        # Check if player has the skill
-        if 'hide' not in player.skills:
-            await player.send(f"{c['red']}You don't know how to hide!{c['reset']}")
-            return
-
-        # Can't hide while fighting
-        if player.is_fighting:
-            await player.send(f"{c['red']}You can't hide while fighting!{c['reset']}")
-            return
-
-        import time, random
-        if getattr(player, 'exposed_until', 0) > time.time():
-            await player.send(f"{c['red']}You're too exposed to hide right now.{c['reset']}")
-            return
-
-        # Environment bonus
-        env_bonus = 0
-        if player.room:
-            if hasattr(player.room, 'is_dark') and player.room.is_dark(getattr(player.world, 'game_time', None)):
-                env_bonus += 20
-            if player.room.sector_type in ('forest','swamp'):
-                env_bonus += 10
-        if player.has_light_source():
-            env_bonus -= 25
-
-        skill_level = player.get_skill_level('hide') + env_bonus
-        if random.randint(1, 100) <= max(5, skill_level):
-            player.flags.add('hidden')
-            await player.send(f"{c['green']}You blend into the shadows...{c['reset']}")
-            await player.improve_skill('hide', difficulty=4)
-            # chance to clear tracking if being searched
-            if getattr(player, 'tracked_by', None):
-                if random.randint(1, 100) <= 50:
-                    player.tracked_by = None
-                    await player.send(f"{c['cyan']}You lose your pursuer in the shadows.{c['reset']}")
-        else:
-            await player.send(f"{c['yellow']}You fail to conceal yourself.{c['reset']}")
-
-    @classmethod
-    async def cmd_blur(cls, player: 'Player', args: List[str]):
-        """Blur your outline to make attacks less accurate."""
-        c = player.config.COLORS
-        if 'blur' not in player.skills:
-            await player.send(f"{c['red']}You don't know how to blur yourself.{c['reset']}")
-            return
-        import time
-        now = time.time()
-        if getattr(player, 'blur_cooldown_until', 0) > now:
-            remaining = int(player.blur_cooldown_until - now)
-            await player.send(f"{c['yellow']}Blur is on cooldown ({remaining}s).{c['reset']}")
-            return
-        player.blur_until = now + 20
-        player.blur_cooldown_until = now + 30
-        await player.send(f"{c['cyan']}Your outline shimmers and blurs.{c['reset']}")
-
-    @classmethod
-    async def cmd_feint(cls, player: 'Player', args: List[str]):
-        """Feint — target deals 30% less damage to you for 3 rounds (Assassin rework)."""
-        import time
-        c = player.config.COLORS
-        char_class = getattr(player, 'char_class', '').lower()
-        if char_class == 'assassin':
-            if not player.is_fighting:
-                await player.send(f"{c['red']}You must be in combat to feint!{c['reset']}")
-                return
-            now = time.time()
-            if now < getattr(player, 'feint_cooldown', 0):
-                remaining = int(player.feint_cooldown - now)
-                await player.send(f"{c['yellow']}Feint on cooldown ({remaining}s).{c['reset']}")
-                return
-            player.feint_cooldown = now + 20
-            player.feint_until = now + 12  # ~3 combat rounds at 4s each
-            player.feint_reduction = 0.30
-            await player.send(f"{c['green']}You feint, causing your opponent to misjudge their strikes! (30% damage reduction for 3 rounds){c['reset']}")
-            if player.room:
-                await player.room.send_to_room(
-                    f"{c['white']}{player.name} makes a deceptive feint.{c['reset']}",
-                    exclude=[player]
-                )
-            return
-        # Non-assassin fallback (original behavior)
-        if 'feint' not in player.skills:
-            await player.send(f"{c['red']}You don't know how to feint.{c['reset']}")
-            return
-        if not args:
-            target = player.target if player.target and player.target in player.room.characters else None
-            if not target:
-                await player.send("Feint whom?")
-                return
-        else:
-            target = player.find_target_in_room(' '.join(args).lower())
-        if not target:
-            await player.send(f"{c['red']}They aren't here.{c['reset']}")
-            return
-        import random
-        chance = player.skills.get('feint', 0) + (player.dex - getattr(target, 'dex', 10))
-        if random.randint(1, 100) <= max(5, chance):
-            if not hasattr(target, 'ai_state'):
-                target.ai_state = {}
-            target.ai_state['feinted_until'] = time.time() + 6
-            target.ai_state['feinted_by'] = player
-            await player.send(f"{c['green']}You feint, opening {target.name}'s guard!{c['reset']}")
-        else:
-            await player.send(f"{c['yellow']}Your feint fails.{c['reset']}")
-
-    @classmethod
-    async def cmd_tumble(cls, player: 'Player', args: List[str]):
-        """Tumble to reduce incoming damage briefly."""
-        c = player.config.COLORS
-        if 'tumble' not in player.skills:
-            await player.send(f"{c['red']}You don't know how to tumble.{c['reset']}")
-            return
-        import time
-        player.tumble_until = time.time() + 3
-        await player.send(f"{c['cyan']}You tumble and roll, ready to evade blows.{c['reset']}")
-
-    @classmethod
-    async def cmd_circle(cls, player: 'Player', args: List[str]):
-        """Circle behind a distracted target for a quick strike."""
-        c = player.config.COLORS
-        if 'circle' not in player.skills:
-            await player.send(f"{c['red']}You don't know how to circle attack.{c['reset']}")
-            return
-        if not args:
-            target = player.target if player.target and player.target in player.room.characters else None
-            if not target:
-                await player.send("Circle whom?")
-                return
-        else:
-            target = player.find_target_in_room(' '.join(args).lower())
-        if not target:
-            await player.send(f"{c['red']}They aren't here.{c['reset']}")
-            return
-        if not getattr(target, 'fighting', None) or target.fighting == player:
-            await player.send(f"{c['yellow']}They're not distracted enough to circle.{c['reset']}")
-            return
-        from combat import CombatHandler
-        # Quick bonus attack
-        await CombatHandler.bonus_attack(player, target)
-
-    @classmethod
-    async def cmd_cleave(cls, player: 'Player', args: List[str]):
-        """Cleave — Hit all enemies in room (warrior) or basic AoE."""
-        import time, random
-        c = player.config.COLORS
-
-        # Warriors use the new doctrine system
-        if player.char_class.lower() == 'warrior':
-            from warrior_abilities import do_cleave
-            await do_cleave(player, args)
-            return
-
-        # Non-warriors use legacy cleave
-        if 'cleave' not in player.skills:
-            await player.send(f"{c['red']}You don't know how to cleave.{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['yellow']}You need to be fighting to cleave.{c['reset']}")
-            return
-        from combat import CombatHandler
-        targets = [ch for ch in player.room.characters if ch != player and hasattr(ch, 'is_fighting') and ch.is_fighting]
-        if not targets:
-            await player.send(f"{c['yellow']}No targets to cleave.{c['reset']}")
-            return
-        await player.send(f"{c['red']}You swing in a wide arc!{c['reset']}")
-        for t in targets[:3]:
-            await CombatHandler.bonus_attack(player, t)
-
-    @classmethod
-    async def cmd_trip(cls, player: 'Player', args: List[str]):
-        """Trip a target, knocking them down."""
-        c = player.config.COLORS
-        if 'trip' not in player.skills:
-            await player.send(f"{c['red']}You don't know how to trip.{c['reset']}")
-            return
-        if not args:
-            target = player.target if player.target and player.target in player.room.characters else None
-            if not target:
-                await player.send("Trip whom?")
-                return
-        else:
-            target = player.find_target_in_room(' '.join(args).lower())
-        if not target:
-            await player.send(f"{c['red']}They aren't here.{c['reset']}")
-            return
-        import random
-        chance = player.skills.get('trip', 0) + (player.dex - getattr(target, 'dex', 10))
-        if random.randint(1, 100) <= max(5, chance):
-            target.position = 'sitting'
-            await player.send(f"{c['green']}You trip {target.name}!{c['reset']}")
-            await player.room.send_to_room(f"{target.name} is knocked to the ground!", exclude=[player])
-        else:
-            await player.send(f"{c['yellow']}You fail to trip {target.name}.{c['reset']}")
-
-    @classmethod
-    async def cmd_turn_undead(cls, player: 'Player', args: List[str]):
-        """Turn undead creatures with holy power."""
-        c = player.config.COLORS
-        if 'turn_undead' not in player.skills:
-            await player.send(f"{c['red']}You don't know how to turn undead.{c['reset']}")
-            return
-        if not args:
-            target = player.target if player.target and player.target in player.room.characters else None
-            if not target:
-                await player.send("Turn whom?")
-                return
-        else:
-            target = player.find_target_in_room(' '.join(args).lower())
-        if not target:
-            await player.send(f"{c['red']}They aren't here.{c['reset']}")
-            return
-        if 'undead' not in getattr(target, 'flags', set()):
-            await player.send(f"{c['yellow']}{target.name} is not undead.{c['reset']}")
-            return
-        import random
-        chance = player.skills.get('turn_undead', 0) + (player.wis - 10) * 2
-        if random.randint(1, 100) <= max(5, chance):
-            await player.send(f"{c['bright_white']}You turn the undead!{c['reset']}")
-            if hasattr(target, 'flee'):
-                await target.flee()
-        else:
-            await player.send(f"{c['yellow']}Your turning fails.{c['reset']}")
-
-    @classmethod
-    async def cmd_detect_traps(cls, player: 'Player', args: List[str]):
-        """Detect traps or hidden dangers."""
-        c = player.config.COLORS
-        if 'detect_traps' not in player.skills:
-            await player.send(f"{c['red']}You don't know how to detect traps.{c['reset']}")
-            return
-        if not player.room:
-            await player.send("You are nowhere.")
-            return
-        import random
-        roll = random.randint(1, 100)
-        if roll <= player.skills.get('detect_traps', 0):
-            await player.send(f"{c['green']}You carefully scan for traps but find none.{c['reset']}")
-        else:
-            await player.send(f"{c['yellow']}You don't notice anything unusual.{c['reset']}")
-
-    @classmethod
-    async def cmd_intimidate(cls, player: 'Player', args: List[str]):
-        """Intimidate a target, possibly forcing them to flee."""
-        c = player.config.COLORS
-        if 'intimidate' not in player.skills:
-            await player.send(f"{c['red']}You don't know how to intimidate.{c['reset']}")
-            return
-        if not args:
-            target = player.target if player.target and player.target in player.room.characters else None
-            if not target:
-                await player.send("Intimidate whom?")
-                return
-        else:
-            target = player.find_target_in_room(' '.join(args).lower())
-        if not target:
-            await player.send(f"{c['red']}They aren't here.{c['reset']}")
-            return
-        import random
-        chance = player.skills.get('intimidate', 0) + (player.cha - getattr(target, 'cha', 10))
-        if random.randint(1, 100) <= max(5, chance):
-            await player.send(f"{c['green']}You intimidate {target.name}!{c['reset']}")
-            if hasattr(target, 'flee'):
-                await target.flee()
-        else:
-            await player.send(f"{c['yellow']}Your intimidation fails.{c['reset']}")
-
-    @classmethod
-    async def cmd_steal(cls, player: 'Player', args: List[str]):
-        """Attempt to steal gold from a target."""
-        c = player.config.COLORS
-        if 'steal' not in player.skills:
-            await player.send(f"{c['red']}You don't know how to steal.{c['reset']}")
-            return
-        if not args:
-            target = player.target if player.target and player.target in player.room.characters else None
-            if not target:
-                await player.send("Steal from whom?")
-                return
-        else:
-            target = player.find_target_in_room(' '.join(args).lower())
-        if not target:
-            await player.send(f"{c['red']}They aren't here.{c['reset']}")
-            return
-        import random
-        chance = player.skills.get('steal', 0) + (player.dex - getattr(target, 'dex', 10))
-        if random.randint(1, 100) <= max(5, chance):
-            amt = min(getattr(target, 'gold', 0), random.randint(1, 20))
-            if amt > 0:
-                target.gold -= amt
-                player.gold += amt
-                await player.send(f"{c['green']}You steal {amt} gold from {target.name}.{c['reset']}")
-            else:
-                await player.send(f"{c['yellow']}{target.name} has nothing to steal.{c['reset']}")
-        else:
-            await player.send(f"{c['yellow']}You fail to steal from {target.name}.{c['reset']}")
-
-    @classmethod
-    async def cmd_scribe(cls, player: 'Player', args: List[str]):
-        """Scribe a scroll from a known spell. Usage: scribe <spell>"""
-        c = player.config.COLORS
-        if 'scribe' not in player.skills:
-            await player.send(f"{c['red']}You don't know how to scribe.{c['reset']}")
-            return
-        if not args:
-            await player.send("Scribe which spell?")
-            return
-        spell_name = ' '.join(args).lower().replace(' ', '_')
-        if spell_name not in player.spells:
-            await player.send(f"{c['red']}You don't know that spell.{c['reset']}")
-            return
-        from objects import Object
-        scroll = Object(0, player.world)
-        scroll.name = f"scroll of {spell_name.replace('_',' ')}"
-        scroll.short_desc = f"a scroll of {spell_name.replace('_',' ')}"
-        scroll.room_desc = f"A scroll lies here."
-        scroll.description = f"A scroll inscribed with {spell_name.replace('_',' ')}."
-        scroll.item_type = 'scroll'
-        scroll.spell_effects = [spell_name]
-        player.inventory.append(scroll)
-        await player.send(f"{c['green']}You scribe a scroll of {spell_name.replace('_',' ')}.{c['reset']}")
-
-    @classmethod
-    async def cmd_slip(cls, player: 'Player', args: List[str]):
-        """Slip out of combat to a chosen direction. Usage: slip <direction>"""
-        c = player.config.COLORS
-        if 'slip' not in player.skills:
-            await player.send(f"{c['red']}You don't know how to slip away!{c['reset']}")
-            return
-        if not args:
-            await player.send("Slip which direction?")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['yellow']}You aren't fighting anyone.{c['reset']}")
-            return
-        direction = args[0].lower()
-        dir_map = {'n':'north','s':'south','e':'east','w':'west','u':'up','d':'down'}
-        direction = dir_map.get(direction, direction)
-        if player.room and direction not in player.room.exits and direction not in player.config.DIRECTIONS:
-            await player.send("That's not a valid direction.")
-            return
-        from combat import CombatHandler
-        await CombatHandler.attempt_escape(player, direction)
-
-    @classmethod
-    async def cmd_visible(cls, player: 'Player', args: List[str]):
-        """Come out of hiding or stop sneaking."""
-        c = player.config.COLORS
-
-        made_visible = False
-        if 'hidden' in player.flags:
-            player.flags.remove('hidden')
-            made_visible = True
-        if 'sneaking' in player.flags:
-            player.flags.remove('sneaking')
-            made_visible = True
-
-        if made_visible:
-            await player.send(f"{c['yellow']}You step out of the shadows.{c['reset']}")
-            await player.room.send_to_room(
-                f"{player.name} emerges from the shadows.",
-                exclude=[player]
-            )
-        else:
-            await player.send(f"{c['yellow']}You are already visible.{c['reset']}")
-
-    @classmethod
-    async def cmd_cover(cls, player: 'Player', args: List[str]):
-        """Cover your light source. Usage: cover light"""
-        c = player.config.COLORS
-        if not args or args[0].lower() != 'light':
-            await player.send(f"{c['yellow']}Usage: cover light{c['reset']}")
-            return
-        item = player.equipment.get('light') or player.equipment.get('hold')
-        if not item:
-            await player.send(f"{c['yellow']}You're not holding or wearing a light source.{c['reset']}")
-            return
-        item.covered = True
-        await player.send(f"{c['cyan']}You cover your light source, dimming its glow.{c['reset']}")
-
-    @classmethod
-    async def cmd_uncover(cls, player: 'Player', args: List[str]):
-        """Uncover your light source. Usage: uncover light"""
-        c = player.config.COLORS
-        if not args or args[0].lower() != 'light':
-            await player.send(f"{c['yellow']}Usage: uncover light{c['reset']}")
-            return
-        item = player.equipment.get('light') or player.equipment.get('hold')
-        if not item:
-            await player.send(f"{c['yellow']}You're not holding or wearing a light source.{c['reset']}")
-            return
-        item.covered = False
-        await player.send(f"{c['cyan']}You uncover your light source, letting it shine.{c['reset']}")
-
-    @classmethod
-    async def cmd_snuff(cls, player: 'Player', args: List[str]):
-        """Snuff your light source. Usage: snuff light"""
-        c = player.config.COLORS
-        if not args or args[0].lower() != 'light':
-            await player.send(f"{c['yellow']}Usage: snuff light{c['reset']}")
-            return
-        item = player.equipment.get('light') or player.equipment.get('hold')
-        if not item:
-            await player.send(f"{c['yellow']}You're not holding or wearing a light source.{c['reset']}")
-            return
-        if not getattr(item, 'light_lit', True):
-            await player.send(f"{c['yellow']}Your {item.short_desc} is already dark.{c['reset']}")
-            return
-        item.light_lit = False
-        import random
-        snuff_msgs = [
-            f"You cup your hand over the flame and snuff out {item.short_desc}. Darkness creeps closer.",
-            f"With a quick breath, you extinguish {item.short_desc}. The shadows seem to sigh in relief.",
-            f"You pinch the wick of {item.short_desc}, plunging yourself into deeper darkness.",
-            f"The flame of {item.short_desc} gutters and dies at your command.",
-            f"You snuff {item.short_desc}. The darkness eagerly swallows the space where light once was.",
-        ]
-        await player.send(f"{c['bright_black']}{random.choice(snuff_msgs)}{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(
-                f"{c['bright_black']}{player.name} snuffs out their light, and the shadows grow deeper.{c['reset']}",
-                exclude=[player]
-            )
-
-    @classmethod
-    async def cmd_relight(cls, player: 'Player', args: List[str]):
-        """Relight your light source. Usage: relight light"""
-        c = player.config.COLORS
-        if not args or args[0].lower() != 'light':
-            await player.send(f"{c['yellow']}Usage: relight light{c['reset']}")
-            return
-        item = player.equipment.get('light') or player.equipment.get('hold')
-        if not item:
-            await player.send(f"{c['yellow']}You're not holding or wearing a light source.{c['reset']}")
-            return
-        if getattr(item, 'light_lit', False):
-            await player.send(f"{c['yellow']}Your {item.short_desc} is already burning brightly.{c['reset']}")
-            return
-        item.light_lit = True
-        item.covered = False
-        import random
-        light_msgs = [
-            f"You strike a spark and {item.short_desc} flares to life, pushing back the darkness.",
-            f"A warm glow spreads from {item.short_desc} as you coax the flame back to life.",
-            f"Light blooms from {item.short_desc}, banishing the shadows that had crept close.",
-            f"With practiced hands, you relight {item.short_desc}. The darkness retreats grudgingly.",
-            f"The flame of {item.short_desc} dances back into existence, casting dancing shadows on the walls.",
-        ]
-        await player.send(f"{c['bright_yellow']}{random.choice(light_msgs)}{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(
-                f"{c['bright_yellow']}{player.name} relights their {item.short_desc}, and warm light fills the area.{c['reset']}",
-                exclude=[player]
-            )
-
-    @classmethod
-    async def cmd_redit(cls, player: 'Player', args: List[str]):
-        """Online room editor (immortal only)."""
-        c = player.config.COLORS
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have access to OLC.{c['reset']}")
-            return
-
-        try:
-            vnum = int(args[0]) if args else player.room.vnum
-        except Exception:
-            await player.send(f"{c['yellow']}Usage: redit <vnum>{c['reset']}")
-            return
-
-        zone_num = vnum // 100
-        zone = player.world.zones.get(zone_num)
-        if not zone:
-            await player.send(f"{c['red']}Zone {zone_num} not found.{c['reset']}")
-            return
-
-        room = player.world.rooms.get(vnum)
-        if not room:
-            from world import Room
-            room = Room(vnum)
-            room.zone = zone
-            zone.rooms[vnum] = room
-            player.world.rooms[vnum] = room
-
-        player.olc_state = {
-            'mode': 'redit',
-            'menu': 'main',
-            'room': room,
-            'exit_dir': None,
-            'buffer': [],
-            'extra_key': None
-        }
-        await cls.show_redit_menu(player)
-
-    @classmethod
-    async def cmd_save(cls, player: 'Player', args: List[str]):
-        """Save a zone to disk (immortal only)."""
-        c = player.config.COLORS
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have access to save zones.{c['reset']}")
-            return
-
-        try:
-            zone_num = int(args[0]) if args else player.room.zone.number
-        except Exception:
-            await player.send(f"{c['yellow']}Usage: save <zone_number>{c['reset']}")
-            return
-
-        zone = player.world.zones.get(zone_num)
-        if not zone:
-            await player.send(f"{c['red']}Zone {zone_num} not found.{c['reset']}")
-            return
-
-        zones_dir = os.path.join(player.config.WORLD_DIR, 'zones')
-        os.makedirs(zones_dir, exist_ok=True)
-        filepath = os.path.join(zones_dir, f"zone_{zone_num:03d}.json")
-        with open(filepath, 'w') as f:
-            json.dump(zone.to_dict(), f, indent=2)
-        await player.send(f"{c['green']}Zone {zone_num} saved to {filepath}.{c['reset']}")
-
-    @classmethod
-    async def cmd_medit(cls, player: 'Player', args: List[str]):
-        """Online mob editor (immortal only)."""
-        c = player.config.COLORS
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have access to OLC.{c['reset']}")
-            return
-
-        if not args:
-            await player.send(f"{c['yellow']}Usage: medit <vnum>{c['reset']}")
-            return
-
-        try:
-            vnum = int(args[0])
-        except Exception:
-            await player.send(f"{c['yellow']}Usage: medit <vnum>{c['reset']}")
-            return
-
-        zone_num = vnum // 100
-        zone = player.world.zones.get(zone_num)
-        if not zone:
-            await player.send(f"{c['red']}Zone {zone_num} not found.{c['reset']}")
-            return
-
-        # Get or create mob prototype
-        mob = zone.mobs.get(str(vnum)) or zone.mobs.get(vnum)
-        if not mob:
-            mob = {
-                'vnum': vnum,
-                'name': 'new mob',
-                'short_desc': 'a new mob',
-                'long_desc': 'A new mob stands here.',
-                'description': '',
-                'level': 1,
-                'hp_dice': '1d10+10',
-                'damage_dice': '1d4+1',
-                'gold': 0,
-                'exp': 100,
-                'alignment': 0,
-                'flags': [],
-                'armor_class': 0
-            }
-            zone.mobs[str(vnum)] = mob
-            player.world.mob_prototypes[vnum] = mob
-
-        player.olc_state = {
-            'mode': 'medit',
-            'menu': 'main',
-            'mob': mob,
-            'vnum': vnum,
-            'zone': zone,
-            'buffer': []
-        }
-        await cls.show_medit_menu(player)
-
-    @classmethod
-    async def cmd_oedit(cls, player: 'Player', args: List[str]):
-        """Online object editor (immortal only)."""
-        c = player.config.COLORS
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have access to OLC.{c['reset']}")
-            return
-
-        if not args:
-            await player.send(f"{c['yellow']}Usage: oedit <vnum>{c['reset']}")
-            return
-
-        try:
-            vnum = int(args[0])
-        except Exception:
-            await player.send(f"{c['yellow']}Usage: oedit <vnum>{c['reset']}")
-            return
-
-        zone_num = vnum // 100
-        zone = player.world.zones.get(zone_num)
-        if not zone:
-            await player.send(f"{c['red']}Zone {zone_num} not found.{c['reset']}")
-            return
-
-        # Get or create object prototype
-        obj = zone.objects.get(str(vnum)) or zone.objects.get(vnum)
-        if not obj:
-            obj = {
-                'vnum': vnum,
-                'name': 'new object',
-                'short_desc': 'a new object',
-                'room_desc': 'A new object lies here.',
-                'description': '',
-                'item_type': 'trash',
-                'wear_slot': None,
-                'weight': 1,
-                'value': 0,
-                'flags': [],
-                'affects': []
-            }
-            zone.objects[str(vnum)] = obj
-            player.world.obj_prototypes[vnum] = obj
-
-        player.olc_state = {
-            'mode': 'oedit',
-            'menu': 'main',
-            'obj': obj,
-            'vnum': vnum,
-            'zone': zone,
-            'buffer': []
-        }
-        await cls.show_oedit_menu(player)
-
-    @classmethod
-    async def show_medit_menu(cls, player: 'Player'):
-        c = player.config.COLORS
-        state = player.olc_state
-        mob = state['mob']
-        await player.send(f"{c['cyan']}-- Mob Number   : [{mob.get('vnum')}]{c['reset']}")
-        await player.send(f"{c['white']}1){c['reset']} Keywords    : {mob.get('name', '')}")
-        await player.send(f"{c['white']}2){c['reset']} Short desc  : {mob.get('short_desc', '')}")
-        await player.send(f"{c['white']}3){c['reset']} Long desc   : {mob.get('long_desc', '')}")
-        await player.send(f"{c['white']}4){c['reset']} Description :")
-        await player.send(mob.get('description') or "(none)")
-        await player.send(f"{c['white']}5){c['reset']} Level       : {mob.get('level', 1)}")
-        await player.send(f"{c['white']}6){c['reset']} HP Dice     : {mob.get('hp_dice', '1d10+10')}")
-        await player.send(f"{c['white']}7){c['reset']} Damage Dice : {mob.get('damage_dice', '1d4+1')}")
-        await player.send(f"{c['white']}8){c['reset']} Armor Class : {mob.get('armor_class', 0)}")
-        await player.send(f"{c['white']}9){c['reset']} Gold        : {mob.get('gold', 0)}")
-        await player.send(f"{c['white']}A){c['reset']} Experience  : {mob.get('exp', 0)}")
-        await player.send(f"{c['white']}B){c['reset']} Alignment   : {mob.get('alignment', 0)}")
-        await player.send(f"{c['white']}C){c['reset']} Flags       : {' '.join(mob.get('flags', [])) or 'NOBITS'}")
-        await player.send(f"{c['white']}D){c['reset']} Boss Setup  : {'Yes' if mob.get('boss') else 'No'}")
-        await player.send(f"{c['white']}Q){c['reset']} Quit")
-        await player.send(f"{c['yellow']}Enter choice:{c['reset']}")
-
-    @classmethod
-    async def show_oedit_menu(cls, player: 'Player'):
-        c = player.config.COLORS
-        state = player.olc_state
-        obj = state['obj']
-        await player.send(f"{c['cyan']}-- Object Number: [{obj.get('vnum')}]{c['reset']}")
-        await player.send(f"{c['white']}1){c['reset']} Keywords    : {obj.get('name', '')}")
-        await player.send(f"{c['white']}2){c['reset']} Short desc  : {obj.get('short_desc', '')}")
-        await player.send(f"{c['white']}3){c['reset']} Room desc   : {obj.get('room_desc', '')}")
-        await player.send(f"{c['white']}4){c['reset']} Description :")
-        await player.send(obj.get('description') or "(none)")
-        await player.send(f"{c['white']}5){c['reset']} Item type   : {obj.get('item_type', 'trash')}")
-        await player.send(f"{c['white']}6){c['reset']} Wear slot   : {obj.get('wear_slot') or 'none'}")
-        await player.send(f"{c['white']}7){c['reset']} Weight      : {obj.get('weight', 1)}")
-        await player.send(f"{c['white']}8){c['reset']} Value       : {obj.get('value', 0)}")
-        await player.send(f"{c['white']}9){c['reset']} Flags       : {' '.join(obj.get('flags', [])) or 'NOBITS'}")
-        await player.send(f"{c['white']}A){c['reset']} Affects     : {len(obj.get('affects', []))} affects")
-        if obj.get('item_type') == 'weapon':
-            await player.send(f"{c['white']}B){c['reset']} Damage dice : {obj.get('damage_dice', '1d4')}")
-            await player.send(f"{c['white']}C){c['reset']} Weapon type : {obj.get('weapon_type', 'pound')}")
-        elif obj.get('item_type') == 'armor':
-            await player.send(f"{c['white']}B){c['reset']} Armor bonus : {obj.get('armor_bonus', 0)}")
-        elif obj.get('item_type') == 'container':
-            await player.send(f"{c['white']}B){c['reset']} Capacity    : {obj.get('capacity', 10)}")
-        await player.send(f"{c['white']}Q){c['reset']} Quit")
-        await player.send(f"{c['yellow']}Enter choice:{c['reset']}")
-
-    @classmethod
-    async def show_redit_menu(cls, player: 'Player'):
-        c = player.config.COLORS
-        state = player.olc_state
-        room = state['room']
-        await player.send(f"{c['cyan']}--Room Number   : [{room.vnum}]{c['reset']}")
-        await player.send(f"{c['white']}1){c['reset']} Name        : {room.name}")
-        await player.send(f"{c['white']}2){c['reset']} Description :")
-        await player.send(room.description or "(none)")
-        await player.send(f"{c['white']}3){c['reset']} Room flags  : {' '.join(sorted(room.flags)) if room.flags else 'NOBITS'}")
-        await player.send(f"{c['white']}4){c['reset']} Sector type : {room.sector_type}")
-        await player.send(f"{c['white']}5){c['reset']} Exit North  : {room.exits.get('north', {}).get('to_room', -1)}")
-        await player.send(f"{c['white']}6){c['reset']} Exit East   : {room.exits.get('east', {}).get('to_room', -1)}")
-        await player.send(f"{c['white']}7){c['reset']} Exit South  : {room.exits.get('south', {}).get('to_room', -1)}")
-        await player.send(f"{c['white']}8){c['reset']} Exit West   : {room.exits.get('west', {}).get('to_room', -1)}")
-        await player.send(f"{c['white']}9){c['reset']} Exit Up     : {room.exits.get('up', {}).get('to_room', -1)}")
-        await player.send(f"{c['white']}A){c['reset']} Exit Down   : {room.exits.get('down', {}).get('to_room', -1)}")
-        await player.send(f"{c['white']}B){c['reset']} Extra Descriptions")
-        await player.send(f"{c['white']}Q){c['reset']} Quit")
-        await player.send(f"{c['yellow']}Enter choice:{c['reset']}")
-
-    @classmethod
-    async def handle_olc_input(cls, player: 'Player', cmd: str, args: List[str]):
-        c = player.config.COLORS
-        state = player.olc_state
-        if not state:
-            player.olc_state = None
-            return
-
-        mode = state.get('mode')
-        if mode == 'medit':
-            await cls.handle_medit_input(player, cmd, args)
-            return
-        elif mode == 'oedit':
-            await cls.handle_oedit_input(player, cmd, args)
-            return
-        elif mode != 'redit':
-            player.olc_state = None
-            return
-
-        line = (cmd + (' ' + ' '.join(args) if args else '')).strip()
-        room = state['room']
-        menu = state['menu']
-
-        if menu == 'main':
-            choice = cmd.lower()
-            if choice == 'q':
-                player.olc_state = None
-                await player.send(f"{c['yellow']}OLC exited. Use 'save <zone>' to write changes.{c['reset']}")
-                return
-            if choice == 'save':
-                await cls.cmd_save(player, [])
-                return
-            if choice == '1':
-                state['menu'] = 'name'
-                await player.send(f"{c['yellow']}Room name:{c['reset']}")
-                return
-            if choice == '2':
-                state['menu'] = 'desc'
-                state['buffer'] = []
-                await player.send(f"{c['yellow']}Enter description, end with @:{c['reset']}")
-                return
-            if choice == '3':
-                state['menu'] = 'flags'
-                await player.send(f"{c['yellow']}Enter flag (dark/indoors/peaceful/deathtrap/nomob/notrack/nomagic/tunnel/private/soundproof) or 0 to done:{c['reset']}")
-                return
-            if choice == '4':
-                state['menu'] = 'sector'
-                await player.send(f"{c['yellow']}Sector type (inside/city/field/forest/hills/mountain/water_swim/water_noswim/underwater/flying):{c['reset']}")
-                return
-            if choice in ['5','6','7','8','9','a']:
-                dir_map = {'5':'north','6':'east','7':'south','8':'west','9':'up','a':'down'}
-                state['exit_dir'] = dir_map[choice]
-                state['menu'] = 'exit_to'
-                await player.send(f"{c['yellow']}Exit to room vnum (-1 to delete):{c['reset']}")
-                return
-            if choice == 'b':
-                state['menu'] = 'extra_key'
-                await player.send(f"{c['yellow']}Extra desc keywords:{c['reset']}")
-                return
-
-            await player.send(f"{c['yellow']}Invalid choice.{c['reset']}")
-            await cls.show_redit_menu(player)
-            return
-
-        if menu == 'name':
-            room.name = line if line else room.name
-            state['menu'] = 'main'
-            await cls.show_redit_menu(player)
-            return
-
-        if menu == 'desc':
-            if line == '@':
-                room.description = '\n'.join(state['buffer'])
-                state['menu'] = 'main'
-                await cls.show_redit_menu(player)
-            else:
-                state['buffer'].append(line)
-            return
-
-        if menu == 'flags':
-            if line in ['0','done']:
-                state['menu'] = 'main'
-                await cls.show_redit_menu(player)
-                return
-            flag = line.lower()
-            if flag == 'death':
-                flag = 'deathtrap'
-            if flag:
-                if flag in room.flags:
-                    room.flags.remove(flag)
-                else:
-                    room.flags.add(flag)
-            await player.send(f"{c['cyan']}Flags now: {' '.join(sorted(room.flags))}{c['reset']}")
-            await player.send(f"{c['yellow']}Enter flag (or 0 to done):{c['reset']}")
-            return
-
-        if menu == 'sector':
-            room.sector_type = line.lower()
-            state['menu'] = 'main'
-            await cls.show_redit_menu(player)
-            return
-
-        if menu == 'exit_to':
-            try:
-                to_vnum = int(line)
-            except Exception:
-                await player.send(f"{c['yellow']}Enter a valid vnum or -1.{c['reset']}")
-                return
-            dir_ = state['exit_dir']
-            if to_vnum == -1:
-                room.exits.pop(dir_, None)
-                state['menu'] = 'main'
-                await cls.show_redit_menu(player)
-                return
-            room.exits[dir_] = {'to_room': to_vnum, 'description': ''}
-            state['menu'] = 'exit_desc'
-            await player.send(f"{c['yellow']}Exit description (blank for none):{c['reset']}")
-            return
-
-        if menu == 'exit_desc':
-            dir_ = state['exit_dir']
-            room.exits[dir_]['description'] = line
-            state['menu'] = 'exit_door'
-            await player.send(f"{c['yellow']}Door? (y/n):{c['reset']}")
-            return
-
-        if menu == 'exit_door':
-            dir_ = state['exit_dir']
-            if line.lower().startswith('y'):
-                state['menu'] = 'exit_door_name'
-                await player.send(f"{c['yellow']}Door name:{c['reset']}")
-            else:
-                state['menu'] = 'exit_hidden'
-                await player.send(f"{c['yellow']}Hidden exit? (y/n):{c['reset']}")
-            return
-
-        if menu == 'exit_door_name':
-            dir_ = state['exit_dir']
-            room.exits[dir_]['door'] = {'name': line or 'door', 'state': 'closed', 'locked': False}
-            state['menu'] = 'exit_locked'
-            await player.send(f"{c['yellow']}Locked? (y/n):{c['reset']}")
-            return
-
-        if menu == 'exit_locked':
-            dir_ = state['exit_dir']
-            if line.lower().startswith('y'):
-                room.exits[dir_]['door']['locked'] = True
-                state['menu'] = 'exit_key'
-                await player.send(f"{c['yellow']}Key vnum (0 for none):{c['reset']}")
-            else:
-                state['menu'] = 'exit_hidden'
-                await player.send(f"{c['yellow']}Hidden exit? (y/n):{c['reset']}")
-            return
-
-        if menu == 'exit_key':
-            dir_ = state['exit_dir']
-            try:
-                key_vnum = int(line)
-            except Exception:
-                key_vnum = 0
-            if key_vnum:
-                room.exits[dir_]['door']['key_vnum'] = key_vnum
-            state['menu'] = 'exit_hidden'
-            await player.send(f"{c['yellow']}Hidden exit? (y/n):{c['reset']}")
-            return
-
-        if menu == 'exit_hidden':
-            dir_ = state['exit_dir']
-            if line.lower().startswith('y'):
-                room.exits[dir_]['hidden'] = True
-                room.exits[dir_]['secret'] = True
-                state['menu'] = 'exit_search'
-                await player.send(f"{c['yellow']}Search difficulty (e.g. 55):{c['reset']}")
-            else:
-                room.exits[dir_].pop('hidden', None)
-                room.exits[dir_].pop('secret', None)
-                room.exits[dir_].pop('search_difficulty', None)
-                player.world.link_exits()
-                state['menu'] = 'main'
-                await cls.show_redit_menu(player)
-            return
-
-        if menu == 'exit_search':
-            dir_ = state['exit_dir']
-            try:
-                sd = int(line)
-            except Exception:
-                sd = 55
-            room.exits[dir_]['search_difficulty'] = sd
-            player.world.link_exits()
-            state['menu'] = 'main'
-            await cls.show_redit_menu(player)
-            return
-
-        if menu == 'extra_key':
-            state['extra_key'] = line
-            state['buffer'] = []
-            state['menu'] = 'extra_desc'
-            await player.send(f"{c['yellow']}Extra description, end with @:{c['reset']}")
-            return
-
-        if menu == 'extra_desc':
-            if line == '@':
-                if state.get('extra_key'):
-                    room.extra_descs[state['extra_key']] = '\n'.join(state['buffer'])
-                state['menu'] = 'main'
-                await cls.show_redit_menu(player)
-            else:
-                state['buffer'].append(line)
-            return
-
-    @classmethod
-    async def handle_medit_input(cls, player: 'Player', cmd: str, args: List[str]):
-        """Handle medit menu input."""
-        c = player.config.COLORS
-        state = player.olc_state
-        line = (cmd + (' ' + ' '.join(args) if args else '')).strip()
-        mob = state['mob']
-        menu = state['menu']
-
-        if menu == 'main':
-            choice = cmd.lower()
-            if choice == 'q':
-                player.olc_state = None
-                await player.send(f"{c['yellow']}Medit exited. Use 'save <zone>' to write changes.{c['reset']}")
-                return
-            if choice == '1':
-                state['menu'] = 'name'
-                await player.send(f"{c['yellow']}Keywords (e.g. 'guard cityguard'):{c['reset']}")
-                return
-            if choice == '2':
-                state['menu'] = 'short'
-                await player.send(f"{c['yellow']}Short desc (e.g. 'a city guard'):{c['reset']}")
-                return
-            if choice == '3':
-                state['menu'] = 'long'
-                await player.send(f"{c['yellow']}Long desc (shown in room):{c['reset']}")
-                return
-            if choice == '4':
-                state['menu'] = 'desc'
-                state['buffer'] = []
-                await player.send(f"{c['yellow']}Description (end with @):{c['reset']}")
-                return
-            if choice == '5':
-                state['menu'] = 'level'
-                await player.send(f"{c['yellow']}Level (1-60):{c['reset']}")
-                return
-            if choice == '6':
-                state['menu'] = 'hp'
-                await player.send(f"{c['yellow']}HP dice (e.g. '10d10+100'):{c['reset']}")
-                return
-            if choice == '7':
-                state['menu'] = 'damage'
-                await player.send(f"{c['yellow']}Damage dice (e.g. '2d6+4'):{c['reset']}")
-                return
-            if choice == '8':
-                state['menu'] = 'ac'
-                await player.send(f"{c['yellow']}Armor class (-20 to 10, lower is better):{c['reset']}")
-                return
-            if choice == '9':
-                state['menu'] = 'gold'
-                await player.send(f"{c['yellow']}Gold dropped:{c['reset']}")
-                return
-            if choice == 'a':
-                state['menu'] = 'exp'
-                await player.send(f"{c['yellow']}Experience value:{c['reset']}")
-                return
-            if choice == 'b':
-                state['menu'] = 'align'
-                await player.send(f"{c['yellow']}Alignment (-1000 to 1000):{c['reset']}")
-                return
-            if choice == 'c':
-                state['menu'] = 'flags'
-                await player.send(f"{c['yellow']}Flags (aggressive/sentinel/helper/boss/slow_wander/stay_zone/wimpy/memory), 0 to done:{c['reset']}")
-                return
-            if choice == 'd':
-                state['menu'] = 'boss'
-                await player.send(f"{c['yellow']}Make boss? (y/n):{c['reset']}")
-                return
-            await player.send(f"{c['yellow']}Invalid choice.{c['reset']}")
-            await cls.show_medit_menu(player)
-            return
-
-        if menu == 'name':
-            mob['name'] = line
-            state['menu'] = 'main'
-            await cls.show_medit_menu(player)
-            return
-        if menu == 'short':
-            mob['short_desc'] = line
-            state['menu'] = 'main'
-            await cls.show_medit_menu(player)
-            return
-        if menu == 'long':
-            mob['long_desc'] = line
-            state['menu'] = 'main'
-            await cls.show_medit_menu(player)
-            return
-        if menu == 'desc':
-            if line == '@':
-                mob['description'] = '\n'.join(state['buffer'])
-                state['menu'] = 'main'
-                await cls.show_medit_menu(player)
-            else:
-                state['buffer'].append(line)
-            return
-        if menu == 'level':
-            try:
-                mob['level'] = max(1, min(60, int(line)))
-            except:
-                pass
-            state['menu'] = 'main'
-            await cls.show_medit_menu(player)
-            return
-        if menu == 'hp':
-            mob['hp_dice'] = line
-            state['menu'] = 'main'
-            await cls.show_medit_menu(player)
-            return
-        if menu == 'damage':
-            mob['damage_dice'] = line
-            state['menu'] = 'main'
-            await cls.show_medit_menu(player)
-            return
-        if menu == 'ac':
-            try:
-                mob['armor_class'] = int(line)
-            except:
-                pass
-            state['menu'] = 'main'
-            await cls.show_medit_menu(player)
-            return
-        if menu == 'gold':
-            try:
-                mob['gold'] = max(0, int(line))
-            except:
-                pass
-            state['menu'] = 'main'
-            await cls.show_medit_menu(player)
-            return
-        if menu == 'exp':
-            try:
-                mob['exp'] = max(0, int(line))
-            except:
-                pass
-            state['menu'] = 'main'
-            await cls.show_medit_menu(player)
-            return
-        if menu == 'align':
-            try:
-                mob['alignment'] = max(-1000, min(1000, int(line)))
-            except:
-                pass
-            state['menu'] = 'main'
-            await cls.show_medit_menu(player)
-            return
-        if menu == 'flags':
-            if line in ['0', 'done']:
-                state['menu'] = 'main'
-                await cls.show_medit_menu(player)
-                return
-            flag = line.lower()
-            flags = mob.get('flags', [])
-            if not isinstance(flags, list):
-                flags = list(flags)
-            if flag in flags:
-                flags.remove(flag)
-            else:
-                flags.append(flag)
-            mob['flags'] = flags
-            await player.send(f"{c['cyan']}Flags: {' '.join(flags)}{c['reset']}")
-            await player.send(f"{c['yellow']}Enter flag (or 0 to done):{c['reset']}")
-            return
-        if menu == 'boss':
-            if line.lower().startswith('y'):
-                mob['boss'] = True
-                mob['boss_id'] = mob.get('name', 'boss').replace(' ', '_')
-                state['menu'] = 'boss_loot'
-                await player.send(f"{c['yellow']}Boss loot chance % (0-100):{c['reset']}")
-            else:
-                mob['boss'] = False
-                state['menu'] = 'main'
-                await cls.show_medit_menu(player)
-            return
-        if menu == 'boss_loot':
-            try:
-                mob['boss_loot_chance'] = max(0, min(100, int(line)))
-            except:
-                mob['boss_loot_chance'] = 100
-            state['menu'] = 'main'
-            await cls.show_medit_menu(player)
-            return
-
-    @classmethod
-    async def handle_oedit_input(cls, player: 'Player', cmd: str, args: List[str]):
-        """Handle oedit menu input."""
-        c = player.config.COLORS
-        state = player.olc_state
-        line = (cmd + (' ' + ' '.join(args) if args else '')).strip()
-        obj = state['obj']
-        menu = state['menu']
-
-        if menu == 'main':
-            choice = cmd.lower()
-            if choice == 'q':
-                player.olc_state = None
-                await player.send(f"{c['yellow']}Oedit exited. Use 'save <zone>' to write changes.{c['reset']}")
-                return
-            if choice == '1':
-                state['menu'] = 'name'
-                await player.send(f"{c['yellow']}Keywords (e.g. 'sword longsword'):{c['reset']}")
-                return
-            if choice == '2':
-                state['menu'] = 'short'
-                await player.send(f"{c['yellow']}Short desc (e.g. 'a long sword'):{c['reset']}")
-                return
-            if choice == '3':
-                state['menu'] = 'room'
-                await player.send(f"{c['yellow']}Room desc (shown on ground):{c['reset']}")
-                return
-            if choice == '4':
-                state['menu'] = 'desc'
-                state['buffer'] = []
-                await player.send(f"{c['yellow']}Description (end with @):{c['reset']}")
-                return
-            if choice == '5':
-                state['menu'] = 'type'
-                await player.send(f"{c['yellow']}Item type (weapon/armor/container/key/food/drink/light/scroll/potion/trash):{c['reset']}")
-                return
-            if choice == '6':
-                state['menu'] = 'wear'
-                await player.send(f"{c['yellow']}Wear slot (head/neck1/neck2/body/arms/hands/waist/legs/feet/wield/hold/shield/about/finger1/finger2/wrist1/wrist2/back/shoulders/ears/face):{c['reset']}")
-                return
-            if choice == '7':
-                state['menu'] = 'weight'
-                await player.send(f"{c['yellow']}Weight:{c['reset']}")
-                return
-            if choice == '8':
-                state['menu'] = 'value'
-                await player.send(f"{c['yellow']}Value (gold):{c['reset']}")
-                return
-            if choice == '9':
-                state['menu'] = 'flags'
-                await player.send(f"{c['yellow']}Flags (magic/glow/hum/nodrop/norent/invisible/cursed/anti_good/anti_evil/anti_neutral), 0 to done:{c['reset']}")
-                return
-            if choice == 'a':
-                state['menu'] = 'affects'
-                state['affect_idx'] = 0
-                await player.send(f"{c['yellow']}Add affect type (str/dex/con/int/wis/cha/hitroll/damroll/hp/mana/move/ac/spell_power/heal_power), or 0 to done:{c['reset']}")
-                return
-            if choice == 'b':
-                if obj.get('item_type') == 'weapon':
-                    state['menu'] = 'damage'
-                    await player.send(f"{c['yellow']}Damage dice (e.g. '2d6'):{c['reset']}")
-                elif obj.get('item_type') == 'armor':
-                    state['menu'] = 'armor'
-                    await player.send(f"{c['yellow']}Armor bonus:{c['reset']}")
-                elif obj.get('item_type') == 'container':
-                    state['menu'] = 'capacity'
-                    await player.send(f"{c['yellow']}Capacity:{c['reset']}")
-                else:
-                    await player.send(f"{c['yellow']}N/A for this item type.{c['reset']}")
-                return
-            if choice == 'c' and obj.get('item_type') == 'weapon':
-                state['menu'] = 'weapontype'
-                await player.send(f"{c['yellow']}Weapon type (slash/pierce/pound/crush):{c['reset']}")
-                return
-            await player.send(f"{c['yellow']}Invalid choice.{c['reset']}")
-            await cls.show_oedit_menu(player)
-            return
-
-        if menu == 'name':
-            obj['name'] = line
-            state['menu'] = 'main'
-            await cls.show_oedit_menu(player)
-            return
-        if menu == 'short':
-            obj['short_desc'] = line
-            state['menu'] = 'main'
-            await cls.show_oedit_menu(player)
-            return
-        if menu == 'room':
-            obj['room_desc'] = line
-            state['menu'] = 'main'
-            await cls.show_oedit_menu(player)
-            return
-        if menu == 'desc':
-            if line == '@':
-                obj['description'] = '\n'.join(state['buffer'])
-                state['menu'] = 'main'
-                await cls.show_oedit_menu(player)
-            else:
-                state['buffer'].append(line)
-            return
-        if menu == 'type':
-            obj['item_type'] = line.lower()
-            state['menu'] = 'main'
-            await cls.show_oedit_menu(player)
-            return
-        if menu == 'wear':
-            obj['wear_slot'] = line.lower() if line.lower() != 'none' else None
-            state['menu'] = 'main'
-            await cls.show_oedit_menu(player)
-            return
-        if menu == 'weight':
-            try:
-                obj['weight'] = max(0, int(line))
-            except:
-                pass
-            state['menu'] = 'main'
-            await cls.show_oedit_menu(player)
-            return
-        if menu == 'value':
-            try:
-                obj['value'] = max(0, int(line))
-            except:
-                pass
-            state['menu'] = 'main'
-            await cls.show_oedit_menu(player)
-            return
-        if menu == 'flags':
-            if line in ['0', 'done']:
-                state['menu'] = 'main'
-                await cls.show_oedit_menu(player)
-                return
-            flag = line.lower()
-            flags = obj.get('flags', [])
-            if not isinstance(flags, list):
-                flags = list(flags)
-            if flag in flags:
-                flags.remove(flag)
-            else:
-                flags.append(flag)
-            obj['flags'] = flags
-            await player.send(f"{c['cyan']}Flags: {' '.join(flags)}{c['reset']}")
-            await player.send(f"{c['yellow']}Enter flag (or 0 to done):{c['reset']}")
-            return
-        if menu == 'affects':
-            if line in ['0', 'done']:
-                state['menu'] = 'main'
-                await cls.show_oedit_menu(player)
-                return
-            state['affect_type'] = line.lower()
-            state['menu'] = 'affect_value'
-            await player.send(f"{c['yellow']}Value for {line}:{c['reset']}")
-            return
-        if menu == 'affect_value':
-            try:
-                val = int(line)
-            except:
-                val = 0
-            affects = obj.get('affects', [])
-            if not isinstance(affects, list):
-                affects = []
-            affects.append({'type': state['affect_type'], 'value': val})
-            obj['affects'] = affects
-            state['menu'] = 'affects'
-            await player.send(f"{c['cyan']}Added {state['affect_type']} +{val}{c['reset']}")
-            await player.send(f"{c['yellow']}Add another affect type, or 0 to done:{c['reset']}")
-            return
-        if menu == 'damage':
-            obj['damage_dice'] = line
-            state['menu'] = 'main'
-            await cls.show_oedit_menu(player)
-            return
-        if menu == 'armor':
-            try:
-                obj['armor_bonus'] = int(line)
-            except:
-                pass
-            state['menu'] = 'main'
-            await cls.show_oedit_menu(player)
-            return
-        if menu == 'capacity':
-            try:
-                obj['capacity'] = max(1, int(line))
-            except:
-                pass
-            state['menu'] = 'main'
-            await cls.show_oedit_menu(player)
-            return
-        if menu == 'weapontype':
-            obj['weapon_type'] = line.lower()
-            state['menu'] = 'main'
-            await cls.show_oedit_menu(player)
-            return
-
-    @classmethod
-    async def cmd_dual_wield(cls, player: 'Player', args: List[str]):
-        """Wield a weapon in your off-hand (requires dual wield skill). Usage: dual_wield <weapon>"""
-        if not args:
-            await player.send("Dual wield what?")
-            return
-        if 'dual_wield' not in player.skills:
-            await player.send("You don't know how to dual wield.")
-            return
-        item_name = ' '.join(args).lower()
-        for item in player.inventory:
-            if item_name in item.name.lower():
-                if item.item_type != 'weapon':
-                    await player.send(f"You can't wield {item.short_desc}.")
-                    return
-                if player.equipment.get('dual_wield'):
-                    await player.send("You're already dual wielding.")
-                    return
-                name_l = (item.name + ' ' + item.short_desc).lower()
-                allowed_name = any(x in name_l for x in ['dagger', 'knife', 'stiletto', 'short sword', 'shortsword'])
-                if getattr(item, 'weapon_type', '') not in ('pierce', 'stab') and not allowed_name:
-                    await player.send("Off-hand weapons must be daggers, knives, or short swords.")
-                    return
-                player.inventory.remove(item)
-                player.equipment['dual_wield'] = item
-                await player.send(f"You off-hand {item.short_desc}.")
-                await player.room.send_to_room(
-                    f"{player.name} off-hands {item.short_desc}.",
-                    exclude=[player]
-                )
-                return
-        await player.send(f"You don't have '{item_name}'.")
-
-    @classmethod
-    async def cmd_backstab(cls, player: 'Player', args: List[str]):
-        """Attempt to backstab a target (thief/assassin skill)."""
-        c = player.config.COLORS
-
-        if 'backstab' not in player.skills:
-            await player.send(f"{c['red']}You don't know how to backstab!{c['reset']}")
-            return
-
-        if player.is_fighting:
-            await player.send(f"{c['red']}You can't backstab while already fighting!{c['reset']}")
-            return
-
-        # If no args, use current target
-        if not args:
-            if player.target and player.target in player.room.characters:
-                target = player.target
-            else:
-                await player.send("Backstab whom?")
-                if player.target:
-                    await player.send(f"{c['yellow']}(Your target is not here. Use 'target <name>' to set a new target){c['reset']}")
-                return
-        else:
-            # Find target with numbered targeting support
-            target_name = ' '.join(args).lower()
-            target = player.find_target_in_room(target_name)
-
-            if not target:
-                await player.send(f"{c['red']}They aren't here.{c['reset']}")
-                return
-
-        import time, random, asyncio
-        from combat import CombatHandler
-
-        # Cooldown check
-        now = time.time()
-        cooldown_until = getattr(player, 'backstab_cooldown_until', 0)
-        if now < cooldown_until:
-            remaining = int(cooldown_until - now)
-            await player.send(f"{c['yellow']}Backstab is on cooldown ({remaining}s).{c['reset']}")
-            return
-
-        # Wind-up time (1-4s) with spinner
-        windup = random.randint(1, 4)
-        spinner = ['|', '/', '-', '\\']
-        await player.send(f"{c['bright_black']}You size up your target...{c['reset']}")
-        for i in range(windup * 2):  # 0.5s ticks
-            # Abort if target leaves/you fight/move
-            if not player.room or target not in player.room.characters or player.is_fighting:
-                await player.send(f"{c['yellow']}You lose your opening.{c['reset']}")
-                return
-            glyph = spinner[i % 4]
-            await player.send(f"\r{c['bright_black']}Backstab {glyph}{c['reset']}", newline=False)
-            await asyncio.sleep(0.5)
-        await player.send("\r", newline=False)
-
-        # Set cooldown (short)
-        player.backstab_cooldown_until = time.time() + 6
-
-        # Attempt backstab using combat handler logic
-        success = await CombatHandler.do_backstab(player, target)
-
-        # Improve skill on successful backstab
-        if success:
-            await player.improve_skill('backstab', difficulty=6)
-
-    # ==================== COMBAT ====================
-
-    @classmethod
-    async def cmd_target(cls, player: 'Player', args: List[str]):
-        """Set your combat target."""
-        c = player.config.COLORS
-
-        if not args:
-            # Show current target
-            if player.target:
-                await player.send(f"{c['yellow']}Your current target: {c['red']}{player.target.name}{c['reset']}")
-            else:
-                await player.send(f"{c['yellow']}You have no target set.{c['reset']}")
-                await player.send(f"{c['white']}Usage: target <name> - Set combat target{c['reset']}")
-                await player.send(f"{c['white']}       target clear - Clear target{c['reset']}")
-            return
-
-        if args[0].lower() in ['clear', 'none', 'off']:
-            player.target = None
-            await player.send(f"{c['yellow']}Combat target cleared.{c['reset']}")
-            return
-
-        target_name = ' '.join(args).lower()
-        target = player.find_target_in_room(target_name)
-
-        if not target:
-            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
-            return
-
-        # Check if it's a player
-        if hasattr(target, 'connection'):
-            await player.send(f"{c['red']}You can't target other players!{c['reset']}")
-            return
-
-        player.target = target
-        await player.send(f"{c['green']}Target set: {c['red']}{target.name}{c['reset']}")
-
-    @classmethod
-    async def cmd_kill(cls, player: 'Player', args: List[str]):
-        """Attack a target."""
-        c = player.config.COLORS
-
-        # If no args, use current target
-        if not args:
-            if player.target and player.target in player.room.characters:
-                target = player.target
-            else:
-                await player.send("Kill whom?")
-                if player.target:
-                    await player.send(f"{c['yellow']}(Your target is not here. Use 'target <name>' to set a new target){c['reset']}")
-                return
-        else:
-            # Find target with numbered targeting support
-            target_name = ' '.join(args).lower()
-            target = player.find_target_in_room(target_name)
-
-            if not target:
-                await player.send(f"You don't see '{target_name}' here.")
-                return
-            
-        # Check if it's a player
-        if hasattr(target, 'connection'):
-            await player.send("You can't attack other players here!")
-            return
-            
-        # Check if room is peaceful
-        if 'peaceful' in player.room.flags:
-            await player.send("A peaceful feeling overwhelms you. You cannot fight here.")
-            return
-            
-        # Start combat
-        from combat import CombatHandler
-        await CombatHandler.start_combat(player, target)
-        
-    @classmethod
-    async def cmd_attack(cls, player: 'Player', args: List[str]):
-        """Alias for kill."""
-        await cls.cmd_kill(player, args)
-        
-    @classmethod
-    async def cmd_flee(cls, player: 'Player', args: List[str]):
-        """Flee from combat."""
-        if not player.is_fighting:
-            await player.send("You're not fighting anyone!")
-            return
-            
-        from combat import CombatHandler
-        await CombatHandler.attempt_flee(player)
-
-    @classmethod
-    async def cmd_escape(cls, player: 'Player', args: List[str]):
-        """Escape from combat to a chosen direction. Usage: escape <direction>"""
-        c = player.config.COLORS
-        if not player.is_fighting:
-            await player.send(f"{c['yellow']}You're not fighting anyone.{c['reset']}")
-            return
-        if not args:
-            await player.send(f"{c['yellow']}Escape which direction?{c['reset']}")
-            return
-        direction = args[0].lower()
-        dir_map = {'n':'north','s':'south','e':'east','w':'west','u':'up','d':'down'}
-        direction = dir_map.get(direction, direction)
-        if player.room and direction not in player.room.exits and direction not in player.config.DIRECTIONS:
-            await player.send(f"{c['red']}That's not a valid direction.{c['reset']}")
-            return
-        from combat import CombatHandler
-        await CombatHandler.attempt_escape(player, direction)
-
-    @classmethod
-    async def cmd_disengage(cls, player: 'Player', args: List[str]):
-        """Disengage from combat if you're not the primary target."""
-        c = player.config.COLORS
-        if not player.is_fighting:
-            await player.send(f"{c['yellow']}You're not fighting anyone.{c['reset']}")
-            return
-        from combat import CombatHandler
-        await CombatHandler.attempt_disengage(player)
-
-    @classmethod
-    async def cmd_tactical(cls, player: 'Player', args: List[str]):
-        """Show concise tactical combat readout."""
-        from combat import CombatHandler
-        c = player.config.COLORS
-        stance = getattr(player, 'stance', 'normal')
-        stance_label = stance.title()
-        ob = player.get_hit_bonus()
-        db_info = player.get_db_breakdown() if hasattr(player, 'get_db_breakdown') else {'total': (100 - player.get_armor_class())}
-        pb_info = player.get_pb_breakdown() if hasattr(player, 'get_pb_breakdown') else {'total': int(getattr(player, 'damage_reduction', 0))}
-        db = db_info.get('total', 0)
-        pb = pb_info.get('total', 0)
-        ac = player.get_armor_class()
-        wimpy = getattr(player, 'wimpy', 0)
-        flee_chance = CombatHandler.get_flee_chance(player)
-        flee_risk = CombatHandler.get_flee_risk_label(flee_chance)
-        flee_cd = int(max(0, getattr(player, 'flee_cooldown_until', 0) - time.time()))
-        if flee_chance <= 0:
-            flee_display = f"{c['red']}0% (winded){c['reset']}"
-        else:
-            cd_text = f", cd {flee_cd}s" if flee_cd > 0 else ""
-            flee_display = f"{c['white']}{flee_chance}% ({flee_risk}{cd_text}){c['reset']}"
-        escape_chance = CombatHandler.get_escape_chance(player)
-        escape_risk = CombatHandler.get_escape_risk_label(escape_chance)
-        escape_cd = int(max(0, getattr(player, 'escape_cooldown_until', 0) - time.time()))
-        if escape_chance <= 0:
-            escape_display = f"{c['red']}0% (winded){c['reset']}"
-        else:
-            cd_text = f", cd {escape_cd}s" if escape_cd > 0 else ""
-            escape_display = f"{c['white']}{escape_chance}% ({escape_risk}{cd_text}){c['reset']}"
-        dis_cd = int(max(0, getattr(player, 'disengage_cooldown_until', 0) - time.time()))
-        dis_status = "ready" if dis_cd <= 0 else f"cd {dis_cd}s"
-        if player.room:
-            attackers = [ch for ch in player.room.characters if hasattr(ch, 'fighting') and ch.fighting == player]
-            if attackers:
-                dis_status = "blocked"
-        wimpy_display = f"{wimpy}" if wimpy > 0 else "off"
-        shield_bonus = player.get_shield_evasion_bonus() if hasattr(player, 'get_shield_evasion_bonus') else 0
-        shield_display = f" | Shield +{shield_bonus}%" if shield_bonus > 0 else ""
-        protecting = getattr(player, 'protecting', None)
-        guarded_by = None
-        if player.room:
-            for char in player.room.characters:
-                if getattr(char, 'protecting', None) == player:
-                    guarded_by = char
-                    break
-        protect_bits = []
-        if protecting:
-            protect_bits.append(f"Protect {protecting.name}")
-        if guarded_by:
-            protect_bits.append(f"Guarded by {guarded_by.name}")
-        protect_display = f" | {' / '.join(protect_bits)}" if protect_bits else ""
-        line = (
-            f"{c['white']}Tactical:{c['reset']} "
-            f"HP {player.hp}/{player.max_hp} "
-            f"MN {player.mana}/{player.max_mana} "
-            f"MV {player.move}/{player.max_move} "
-            f"| {c['bright_cyan']}OB/DB/PB{c['reset']} {ob:+d}/{db:+d}/{pb}%{shield_display} "
-            f"| AC {ac:+d} Mit {pb}% "
-            f"| Stance {stance_label} "
-            f"| Wimpy {wimpy_display} "
-            f"| Flee {flee_display} "
-            f"| Escape {escape_display} "
-            f"| Disengage {dis_status}{protect_display}"
-        )
-        await player.send(line)
-        db_break = f"DB base {db_info.get('base',0):+d} st {db_info.get('stance',0):+d} sh {db_info.get('shield',0):+d} dg {db_info.get('dodge_skill',0):+d}/{db_info.get('dodge_item',0):+d} wt -{db_info.get('weight_penalty',0)}"
-        pb_break = f"PB base {pb_info.get('base',0):+d} st {pb_info.get('stance',0):+d} pa {pb_info.get('parry',0):+d} sb {pb_info.get('shield_block',0):+d} wt -{pb_info.get('weight_penalty',0)}"
-        await player.send(f"{c['bright_black']}{db_break} | {pb_break}{c['reset']}")
-
-    @classmethod
-    async def cmd_secondwind(cls, player: 'Player', args: List[str]):
-        """Recover movement points with a burst of endurance."""
-        c = player.config.COLORS
-        now = time.time()
-        if now < getattr(player, 'second_wind_cooldown_until', 0):
-            remaining = int(getattr(player, 'second_wind_cooldown_until', 0) - now)
-            await player.send(f"{c['yellow']}Second Wind is on cooldown ({remaining}s).{c['reset']}")
-            return
-        if player.position == 'sleeping':
-            await player.send(f"{c['yellow']}You need to wake up first.{c['reset']}")
-            return
-        # Determine resource cost by class type
-        caster_classes = {'mage', 'cleric', 'necromancer', 'bard'}
-        char_class = str(getattr(player, 'char_class', '')).lower()
-        restore = max(10, int(player.max_move * player.config.SECOND_WIND_RESTORE_PCT))
-        if char_class in caster_classes:
-            cost = max(10, int(player.max_mana * 0.10))
-            if player.mana < cost:
-                await player.send(f"{c['red']}You lack the mana to steady your breathing.{c['reset']}")
-                return
-            player.mana -= cost
-        else:
-            cost = max(10, int(player.max_hp * 0.08))
-            if player.hp <= cost + 1:
-                await player.send(f"{c['red']}You're too hurt to push for a second wind.{c['reset']}")
-                return
-            player.hp -= cost
-        player.move = min(player.max_move, player.move + restore)
-        player.second_wind_until = now + player.config.SECOND_WIND_BUFF_SECONDS
-        player.second_wind_cooldown_until = now + player.config.SECOND_WIND_COOLDOWN_SECONDS
-        await player.send(f"{c['bright_green']}You catch a second wind, restoring {restore} move.{c['reset']}")
-
-    @classmethod
-    async def cmd_dodge(cls, player: 'Player', args: List[str]):
-        """Attempt to dodge a telegraphed boss attack."""
-        if not player.is_fighting:
-            await player.send("You're not fighting anyone!")
-            return
-
-        target = player.fighting
-        if not getattr(target, 'is_boss', False):
-            await player.send("You don't need to dodge right now.")
-            return
-
-        if not target.can_dodge():
-            await player.send("There's nothing to dodge yet!")
-            return
-
-        # Dodge chance based on skill and dex
-        import random
-        skill = player.skills.get('dodge', 0) if hasattr(player, 'skills') else 0
-        bonus = (player.dex - 10) * 2
-        chance = min(95, max(25, skill + bonus))
-
-        if random.randint(1, 100) <= chance:
-            target.mark_dodging(player)
-            await player.send("You prepare to dodge the incoming attack!")
-            if player.room:
-                await player.room.send_to_room(f"{player.name} braces to dodge.", exclude=[player])
-            if skill:
-                await player.improve_skill('dodge', difficulty=3)
-        else:
-            await player.send("You mistime your dodge!")
-
-    @classmethod
-    async def cmd_interrupt(cls, player: 'Player', args: List[str]):
-        """Attempt to interrupt a boss cast with bash or kick."""
-        if not player.is_fighting:
-            await player.send("You're not fighting anyone!")
-            return
-
-        target = player.fighting
-        if not getattr(target, 'is_boss', False):
-            await player.send("There's nothing to interrupt.")
-            return
-
-        if not target.can_interrupt():
-            await player.send("The boss isn't casting anything interruptible.")
-            return
-
-        if target.attempt_interrupt(player):
-            await player.send("You slam into the boss and break its cast!")
-            if player.room:
-                await player.room.send_to_room(
-                    f"{player.name} interrupts {target.name}'s casting!",
-                    exclude=[player]
-                )
-        else:
-            await player.send("You fail to interrupt the cast!")
-
-    @classmethod
-    async def cmd_kick(cls, player: 'Player', args: List[str]):
-        """Kick skill."""
-        c = player.config.COLORS
-        if 'kick' not in player.skills:
-            await player.send(f"{c['red']}You don't know how to kick!{c['reset']}")
-            return
-        
-        # Find target: args > fighting > pre-set target
-        target = None
-        if args:
-            target_name = ' '.join(args).lower()
-            target = player.find_target_in_room(target_name)
-            if not target:
-                await player.send(f"{c['red']}You don't see '{args[0]}' here.{c['reset']}")
-                return
-        elif hasattr(player, 'target') and player.target and player.target in player.room.characters:
-            target = player.target
-        elif player.is_fighting:
-            target = player.fighting
-        else:
-            await player.send(f"{c['yellow']}Kick whom? (Use 'target <name>' to set a target){c['reset']}")
-            return
-            
-        from combat import CombatHandler
-        await CombatHandler.do_kick(player, target)
-        
-    @classmethod
-    async def cmd_bash(cls, player: 'Player', args: List[str]):
-        """Bash — Stun + damage. Warriors use doctrine system, others use legacy."""
-        import time, random
-        c = player.config.COLORS
-
-        # Warriors use the new doctrine system
-        if player.char_class.lower() == 'warrior':
-            from warrior_abilities import do_bash
-            await do_bash(player, args)
-            return
-
-        # Non-warriors use legacy bash
-        if 'bash' not in player.skills:
-            await player.send(f"{c['red']}You don't know how to bash!{c['reset']}")
-            return
-        target = None
-        if args:
-            target = player.find_target_in_room(' '.join(args).lower())
-        elif hasattr(player, 'target') and player.target and player.target in player.room.characters:
-            target = player.target
-        elif player.is_fighting:
-            target = player.fighting
-        if not target:
-            await player.send(f"{c['yellow']}Bash whom?{c['reset']}")
-            return
-        from combat import CombatHandler
-        await CombatHandler.do_bash(player, target)
-
-
-    @classmethod
-    async def cmd_envenom(cls, player: 'Player', args: List[str]):
-        """Envenom your weapon with deadly poison."""
-        if 'envenom' not in player.skills:
-            await player.send("You don't know how to envenom weapons!")
-            return
-
-        from combat import CombatHandler
-        await CombatHandler.do_envenom(player)
-
-    @classmethod
-    async def cmd_assassinate(cls, player: 'Player', args: List[str]):
-        """Attempt a deadly assassination on an unsuspecting target."""
-        if 'assassinate' not in player.skills:
-            await player.send("You don't know how to assassinate!")
-            return
-
-        if player.is_fighting:
-            await player.send("You're too busy fighting!")
-            return
-
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send("Assassinate whom?")
-                return
-
-        target_name = ' '.join(args)
-        target = player.find_target_in_room(target_name)
-
-        if not target:
-            await player.send(f"You don't see '{target_name}' here.")
-            return
-
-        from combat import CombatHandler
-        await CombatHandler.do_assassinate(player, target)
-
-    @classmethod
-    async def cmd_garrote(cls, player: 'Player', args: List[str]):
-        """Strangle a target from behind, silencing them."""
-        if 'garrote' not in player.skills:
-            await player.send("You don't know how to garrote!")
-            return
-
-        if player.is_fighting:
-            await player.send("You're too busy fighting!")
-            return
-
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send("Garrote whom?")
-                return
-
-        target_name = ' '.join(args)
-        target = player.find_target_in_room(target_name)
-
-        if not target:
-            await player.send(f"You don't see '{target_name}' here.")
-            return
-
-        from combat import CombatHandler
-        await CombatHandler.do_garrote(player, target)
-
-    @classmethod
-    async def cmd_shadowstep(cls, player: 'Player', args: List[str]):
-        """Shadow Step — teleport behind target, dodge next attack, +1 Intel."""
-        import time
-        c = player.config.COLORS
-        char_class = getattr(player, 'char_class', '').lower()
-
-        if char_class == 'assassin':
-            if not args:
-                if hasattr(player, "fighting") and player.fighting:
-                    target = player.fighting
-                    args = [target.name]
-                else:
-                    await player.send(f"{c['yellow']}Shadow step to whom?{c['reset']}")
-                    return
-            target = player.find_target_in_room(' '.join(args))
-            if not target:
-                await player.send(f"{c['red']}They aren't here.{c['reset']}")
-                return
-            now = time.time()
-            if now < getattr(player, 'shadowstep_cooldown', 0):
-                remaining = int(player.shadowstep_cooldown - now)
-                await player.send(f"{c['yellow']}Shadow Step on cooldown ({remaining}s).{c['reset']}")
-                return
-            player.shadowstep_cooldown = now + 30
-            player.shadowstep_dodge = True
-            await player.send(f"{c['magenta']}You step through shadows behind {target.name}!{c['reset']}")
-            if player.room:
-                await player.room.send_to_room(
-                    f"{c['white']}{player.name} dissolves into shadow and reappears behind {target.name}!{c['reset']}",
-                    exclude=[player]
-                )
-            # Grant +1 Intel on marked target
-            if player.intel_target == target:
-                player.intel_points = min(10, player.intel_points + 1)
-                await player.send(f"{c['cyan']}[Intel: {player.intel_points}/10]{c['reset']}")
-                await cls._check_intel_thresholds(player)
-            return
-
-        # Non-assassin fallback
-        if 'shadow_step' not in player.skills:
-            await player.send("You don't know how to shadow step!")
-            return
-        if player.is_fighting:
-            await player.send("You're too busy fighting!")
-            return
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send("Shadow step to whom?")
-                return
-        target_name = ' '.join(args)
-        target = player.find_target_in_room(target_name)
-        if not target:
-            target_lower = target_name.lower()
-            for direction, exit_info in player.room.exits.items():
-                if exit_info and exit_info.get('room'):
-                    adj_room = exit_info['room']
-                    for char in adj_room.characters:
-                        if target_lower in char.name.lower():
-                            target = char
-                            break
-                    if target:
-                        break
-        if not target:
-            await player.send(f"You don't sense '{target_name}' nearby.")
-            return
-        from combat import CombatHandler
-        await CombatHandler.do_shadow_step(player, target)
-
-    @classmethod
-    async def _check_intel_thresholds(cls, player: 'Player'):
-        """Check and announce Intel threshold crossings."""
-        c = player.config.COLORS
-        target = player.intel_target
-        if not target:
-            return
-        tname = target.name
-        thresholds = getattr(player, 'intel_thresholds', {})
-        if player.intel_points >= 3 and not thresholds.get(3):
-            thresholds[3] = True
-            await player.send(f"{c['bright_green']}You spot an opening in {tname}'s defenses! [Expose Weakness unlocked]{c['reset']}")
-        if player.intel_points >= 6 and not thresholds.get(6):
-            thresholds[6] = True
-            await player.send(f"{c['bright_yellow']}You've mapped {tname}'s vital points! [Vital Strike unlocked]{c['reset']}")
-        if player.intel_points >= 10 and not thresholds.get(10):
-            thresholds[10] = True
-            await player.send(f"{c['bright_red']}You know exactly how to kill {tname}. [Execute Contract unlocked]{c['reset']}")
-        player.intel_thresholds = thresholds
-
-    @classmethod
-    async def cmd_mark(cls, player: 'Player', args: List[str]):
-        """Mark a target for Intel tracking (Assassin)."""
-        c = player.config.COLORS
-        if getattr(player, 'char_class', '').lower() != 'assassin':
-            # Fallback to old mark for non-assassins
-            if 'mark_target' in player.skills:
-                if not args:
-                    if hasattr(player, "fighting") and player.fighting:
-                        target = player.fighting
-                        args = [target.name]
-                    else:
-                        await player.send("Mark whom for death?")
-                        return
-                target = player.find_target_in_room(' '.join(args))
-                if not target:
-                    await player.send(f"You don't see that here.")
-                    return
-                from combat import CombatHandler
-                await CombatHandler.do_mark_target(player, target)
-                return
-            await player.send(f"{c['red']}You don't know how to mark targets!{c['reset']}")
-            return
-
-        if not args:
-            # Show current mark status
-            if player.intel_target:
-                await player.send(f"{c['cyan']}Intel target: {player.intel_target.name} [{player.intel_points}/10]{c['reset']}")
-            else:
-                await player.send(f"{c['yellow']}Usage: mark <target>{c['reset']}")
-            return
-
-        target = player.find_target_in_room(' '.join(args))
-        if not target:
-            await player.send(f"{c['red']}You don't see that here.{c['reset']}")
-            return
-
-        player.intel_target = target
-        player.intel_points = 0
-        player.intel_thresholds = {}
-        await player.send(f"{c['magenta']}You study {target.name}, looking for weaknesses...{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(
-                f"{c['white']}{player.name} studies {target.name} intently.{c['reset']}",
-                exclude=[player]
-            )
-
-    @classmethod
-    async def cmd_expose(cls, player: 'Player', args: List[str]):
-        """Expose Weakness — Intel 3 threshold ability."""
-        import time
-        c = player.config.COLORS
-        if getattr(player, 'char_class', '').lower() != 'assassin':
-            await player.send(f"{c['red']}Only assassins can use Expose Weakness!{c['reset']}")
-            return
-        if not player.intel_target or player.intel_target not in getattr(player.room, 'characters', []):
-            await player.send(f"{c['red']}Your Intel target is not here.{c['reset']}")
-            return
-        if player.intel_points < 3:
-            await player.send(f"{c['red']}You need at least 3 Intel! (Current: {player.intel_points}){c['reset']}")
-            return
-        now = time.time()
-        if now < getattr(player, 'expose_cooldown', 0):
-            remaining = int(player.expose_cooldown - now)
-            await player.send(f"{c['yellow']}Expose Weakness on cooldown ({remaining}s).{c['reset']}")
-            return
-        player.intel_points -= 3
-        player.expose_target = player.intel_target
-        player.expose_until = now + 30
-        await player.send(f"{c['bright_green']}You expose {player.intel_target.name}'s weakness! They take 15% more damage from you for 30s.{c['reset']}")
-        await player.send(f"{c['cyan']}[Intel: {player.intel_points}/10]{c['reset']}")
-
-    @classmethod
-    async def cmd_vital(cls, player: 'Player', args: List[str]):
-        """Vital Strike — Intel 6 threshold ability."""
-        import time
-        c = player.config.COLORS
-        if getattr(player, 'char_class', '').lower() != 'assassin':
-            await player.send(f"{c['red']}Only assassins can use Vital Strike!{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['red']}You must be in combat!{c['reset']}")
-            return
-        if not player.intel_target or player.intel_target not in getattr(player.room, 'characters', []):
-            await player.send(f"{c['red']}Your Intel target is not here.{c['reset']}")
-            return
-        if player.fighting != player.intel_target:
-            await player.send(f"{c['red']}You must be fighting your marked target!{c['reset']}")
-            return
-        if player.intel_points < 6:
-            await player.send(f"{c['red']}You need at least 6 Intel! (Current: {player.intel_points}){c['reset']}")
-            return
-        now = time.time()
-        if now < getattr(player, 'vital_cooldown', 0):
-            remaining = int(player.vital_cooldown - now)
-            await player.send(f"{c['yellow']}Vital Strike on cooldown ({remaining}s).{c['reset']}")
-            return
-        player.intel_points -= 6
-        player.vital_cooldown = now + 30
-        target = player.intel_target
-        # Guaranteed crit, ignores 50% AC, weapon damage * 3
-        weapon = player.equipment.get('wield')
-        if weapon and hasattr(weapon, 'damage_dice'):
-            from combat import CombatHandler
-            base = CombatHandler.roll_dice(weapon.damage_dice)
-        else:
-            import random
-            base = random.randint(2, 6)
-        damage = int(base * 3) + player.get_damage_bonus()
-        damage = max(1, damage)
-        await player.send(f"{c['bright_yellow']}*** VITAL STRIKE! ***{c['reset']}")
-        await player.send(f"{c['bright_red']}You strike {target.name}'s vital points! [{damage}]{c['reset']}")
-        if hasattr(target, 'send'):
-            await target.send(f"{c['bright_red']}{player.name} strikes your vital points! [{damage}]{c['reset']}")
-        killed = await target.take_damage(damage, player)
-        if killed:
-            from combat import CombatHandler
-            await CombatHandler.handle_death(player, target)
-        await player.send(f"{c['cyan']}[Intel: {player.intel_points}/10]{c['reset']}")
-
-    @classmethod
-    async def cmd_execute_contract(cls, player: 'Player', args: List[str]):
-        """Execute Contract — Intel 10 threshold ability."""
-        import time
-        c = player.config.COLORS
-        if getattr(player, 'char_class', '').lower() != 'assassin':
-            await player.send(f"{c['red']}Only assassins can Execute Contract!{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['red']}You must be in combat!{c['reset']}")
-            return
-        if not player.intel_target or player.intel_target not in getattr(player.room, 'characters', []):
-            await player.send(f"{c['red']}Your Intel target is not here.{c['reset']}")
-            return
-        if player.fighting != player.intel_target:
-            await player.send(f"{c['red']}You must be fighting your marked target!{c['reset']}")
-            return
-        if player.intel_points < 10:
-            await player.send(f"{c['red']}You need 10 Intel! (Current: {player.intel_points}){c['reset']}")
-            return
-        target = player.intel_target
-        player.intel_points = 0
-        player.intel_thresholds = {}
-        hp_pct = (target.hp / target.max_hp) * 100 if target.max_hp > 0 else 100
-        if hp_pct <= 20:
-            # Instant kill (non-boss check)
-            flags = getattr(target, 'flags', set()) or set()
-            is_boss = ('boss' in flags) or getattr(target, 'is_boss', False)
-            if is_boss:
-                # Bosses take weapon * 5 instead
-                weapon = player.equipment.get('wield')
-                if weapon and hasattr(weapon, 'damage_dice'):
-                    from combat import CombatHandler
-                    base = CombatHandler.roll_dice(weapon.damage_dice)
-                else:
-                    import random
-                    base = random.randint(2, 6)
-                damage = int(base * 5) + player.get_damage_bonus() * 2
-                await player.send(f"{c['bright_red']}*** EXECUTE CONTRACT! *** You deliver a devastating blow! [{damage}]{c['reset']}")
-                killed = await target.take_damage(damage, player)
-            else:
-                await player.send(f"{c['bright_red']}*** EXECUTE CONTRACT! *** You execute {target.name}!{c['reset']}")
-                killed = await target.take_damage(target.hp + 1, player)
-        else:
-            weapon = player.equipment.get('wield')
-            if weapon and hasattr(weapon, 'damage_dice'):
-                from combat import CombatHandler
-                base = CombatHandler.roll_dice(weapon.damage_dice)
-            else:
-                import random
-                base = random.randint(2, 6)
-            damage = int(base * 5) + player.get_damage_bonus() * 2
-            damage = max(1, damage)
-            await player.send(f"{c['bright_red']}*** EXECUTE CONTRACT! *** [{damage}]{c['reset']}")
-            killed = await target.take_damage(damage, player)
-        if killed:
-            from combat import CombatHandler
-            await CombatHandler.handle_death(player, target)
-        await player.send(f"{c['cyan']}[Intel: {player.intel_points}/10]{c['reset']}")
-
-    # ==================== MAGIC ====================
-    
-    @classmethod
-    async def cmd_cast(cls, player: 'Player', args: List[str]):
-        """Cast a spell."""
-        c = player.config.COLORS
-
-        if not args:
-            await player.send("Cast what spell?")
-            return
-
-        # Check if player has any spells
-        if not player.spells:
-            await player.send(f"{c['red']}You don't know any spells!{c['reset']}")
-            return
-
-        # Join all args to handle quoted spell names
-        full_args = ' '.join(args)
-
-        # Remove quotes if present
-        full_args = full_args.replace("'", "").replace('"', '').strip()
-        
-        # Safety check for empty input after quote removal
-        if not full_args:
-            await player.send("Cast what spell?")
-            return
-        
-        # Smart spell matching: try progressively longer spell names
-        # This handles "animate dead knight" -> spell="animate_dead", target="knight"
-        words = full_args.lower().split()
-        if not words:
-            await player.send("Cast what spell?")
-            return
-            
-        matching_spell = None
-        target_name = None
-        
-        # Try matching 1 word, 2 words, 3 words as the spell name
-        for num_words in range(1, min(4, len(words) + 1)):
-            spell_try = '_'.join(words[:num_words])
-            
-            # Check exact match first
-            if spell_try in player.spells:
-                matching_spell = spell_try
-                target_name = ' '.join(words[num_words:]) if num_words < len(words) else None
-                break
-            
-            # Check prefix match
-            for spell_key in player.spells:
-                if spell_key.startswith(spell_try):
-                    matching_spell = spell_key
-                    target_name = ' '.join(words[num_words:]) if num_words < len(words) else None
-                    break
-            
-            if matching_spell:
-                break
-
-        if not matching_spell:
-            # Fall back to simple first-word matching
-            spell_input = words[0]
-            for spell_key in player.spells:
-                if spell_key == spell_input or spell_key.startswith(spell_input):
-                    matching_spell = spell_key
-                    target_name = ' '.join(words[1:]) if len(words) > 1 else None
-                    break
-
-        if not matching_spell:
-            await player.send(f"{c['red']}You don't know the spell '{words[0]}'!{c['reset']}")
-            await player.send(f"{c['cyan']}Type 'spells' to see your known spells.{c['reset']}")
-            return
-
-        from spells import SpellHandler
-        await SpellHandler.cast_spell(player, matching_spell, target_name)
-        
-    @classmethod
-    async def cmd_spells(cls, player: 'Player', args: List[str]):
-        """Show known spells."""
-        c = player.config.COLORS
-        
-        if not player.spells:
-            await player.send("You don't know any spells.")
-            return
-            
-        use_ascii = getattr(player, 'ascii_ui', False)
-        if use_ascii:
-            await player.send(f"{c['cyan']}+---------------------------------------+{c['reset']}")
-            await player.send(f"{c['cyan']}|{c['bright_yellow']}        Your Known Spells              {c['cyan']}|{c['reset']}")
-            await player.send(f"{c['cyan']}+---------------------------------------+{c['reset']}")
-        else:
-            await player.send(f"{c['cyan']}╔═══════════════════════════════════════╗{c['reset']}")
-            await player.send(f"{c['cyan']}║{c['bright_yellow']}        Your Known Spells              {c['cyan']}║{c['reset']}")
-            await player.send(f"{c['cyan']}╠═══════════════════════════════════════╣{c['reset']}")
-        
-        for spell, proficiency in player.spells.items():
-            spell_name = spell.replace('_', ' ').title()
-            from spells import SPELLS
-            spell_info = SPELLS.get(spell, {})
-            mana_cost = spell_info.get('mana_cost', 10)
-            if use_ascii:
-                await player.send(f"{c['cyan']}| {c['bright_magenta']}{spell_name:<20} {c['white']}Mana: {mana_cost:<3} {proficiency}%{c['cyan']}  |{c['reset']}")
-            else:
-                await player.send(f"{c['cyan']}║ {c['bright_magenta']}{spell_name:<20} {c['white']}Mana: {mana_cost:<3} {proficiency}%{c['cyan']}  ║{c['reset']}")
-            
-        if use_ascii:
-            await player.send(f"{c['cyan']}+---------------------------------------+{c['reset']}")
-        else:
-            await player.send(f"{c['cyan']}╚═══════════════════════════════════════╝{c['reset']}")
-        
-    @classmethod
-    async def cmd_ascii(cls, player: 'Player', args: List[str]):
-        """Toggle ASCII-only UI (no box-drawing characters). Usage: ascii [on|off]"""
-        c = player.config.COLORS
-        if args:
-            arg = args[0].lower()
-            if arg in ('on', 'true', 'yes'):
-                player.ascii_ui = True
-            elif arg in ('off', 'false', 'no'):
-                player.ascii_ui = False
-            else:
-                await player.send(f"{c['yellow']}Usage: ascii [on|off]{c['reset']}")
-                return
-        else:
-            player.ascii_ui = not getattr(player, 'ascii_ui', False)
-        state = 'ON' if player.ascii_ui else 'OFF'
-        await player.send(f"{c['cyan']}ASCII UI is now {state}.{c['reset']}")
-
-    @classmethod
-    async def cmd_skills(cls, player: 'Player', args: List[str]):
-        """Show all skills and spells available to your class, or pet abilities."""
-        c = player.config.COLORS
-        
-        # Check if user wants to see pet skills
-        if args:
-            pet_arg = args[0].lower()
-            pet_map = {
-                'knight': 'undead_warrior', 'warrior': 'undead_warrior', 'bone': 'undead_warrior',
-                'wraith': 'undead_healer', 'healer': 'undead_healer',
-                'lich': 'undead_caster', 'caster': 'undead_caster', 'mage': 'undead_caster',
-                'stalker': 'undead_rogue', 'rogue': 'undead_rogue', 'shadow': 'undead_rogue',
-                'air': 'air_elemental', 'fire': 'fire_elemental', 'water': 'water_elemental', 'earth': 'earth_elemental',
-                'wolf': 'wolf', 'bear': 'bear', 'hawk': 'hawk', 'cat': 'panther',
-            }
-            if pet_arg in pet_map:
-                await cls._show_pet_skills(player, pet_map[pet_arg])
-                return
-        
-        # ASCII mode support
-        use_ascii = getattr(player, 'ascii_ui', False)
-        if use_ascii:
-            TL, TR, BL, BR = '+', '+', '+', '+'
-            H, V = '-', '|'
-            LT, RT = '+', '+'
-            BAR_FULL, BAR_EMPTY = '#', '.'
-        else:
-            TL, TR, BL, BR = '╔', '╗', '╚', '╝'
-            H, V = '═', '║'
-            LT, RT = '╠', '╣'
-            BAR_FULL, BAR_EMPTY = '█', '░'
-        
-        W = 64
-        
-        # Get class data
-        class_data = player.config.CLASSES.get(player.char_class.lower(), {})
-        class_skills = class_data.get('skills', [])
-        class_spells = class_data.get('spells', [])
-        
-        await player.send(f"{c['cyan']}{TL}{H*W}{TR}{c['reset']}")
-        await player.send(f"{c['cyan']}{V}{c['bright_yellow']}  {player.char_class.upper()} SKILLS & SPELLS                              {c['cyan']}{V}{c['reset']}")
-        await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
-        await player.send(f"{c['cyan']}{V} {c['white']}Practice sessions: {c['bright_green']}{player.practices}{c['cyan']}                                      {V}{c['reset']}")
-        await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
-        
-        # Skills section
-        await player.send(f"{c['cyan']}{V} {c['bright_yellow']}SKILLS:{c['cyan']}                                                     {V}{c['reset']}")
-        if class_skills:
-            for skill in class_skills:
-                prof = player.skills.get(skill, 0)
-                skill_name = skill.replace('_', ' ').title()
-                if prof > 0:
-                    bar = BAR_FULL * (prof // 10) + BAR_EMPTY * (10 - prof // 10)
-                    await player.send(f"{c['cyan']}{V}   {c['bright_green']}{skill_name:<20} {c['white']}[{bar}] {prof:>3}%{c['cyan']}          {V}{c['reset']}")
-                else:
-                    await player.send(f"{c['cyan']}{V}   {c['white']}{skill_name:<20} {c['yellow']}[not learned]{c['cyan']}                 {V}{c['reset']}")
-        else:
-            await player.send(f"{c['cyan']}{V}   {c['white']}(none){c['cyan']}                                                  {V}{c['reset']}")
-        
-        await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
-        
-        # Spells section
-        await player.send(f"{c['cyan']}{V} {c['bright_yellow']}SPELLS:{c['cyan']}                                                     {V}{c['reset']}")
-        if class_spells:
-            for spell in class_spells:
-                prof = player.spells.get(spell, 0)
-                spell_name = spell.replace('_', ' ').title()
-                if prof > 0:
-                    bar = BAR_FULL * (prof // 10) + BAR_EMPTY * (10 - prof // 10)
-                    await player.send(f"{c['cyan']}{V}   {c['bright_magenta']}{spell_name:<20} {c['white']}[{bar}] {prof:>3}%{c['cyan']}          {V}{c['reset']}")
-                else:
-                    await player.send(f"{c['cyan']}{V}   {c['white']}{spell_name:<20} {c['yellow']}[not learned]{c['cyan']}                 {V}{c['reset']}")
-        else:
-            await player.send(f"{c['cyan']}{V}   {c['white']}(none){c['cyan']}                                                  {V}{c['reset']}")
-        
-        # Talent abilities section
-        from talents import CLASS_TALENT_TREES
-        talent_skills = []
-        trees = CLASS_TALENT_TREES.get(player.char_class.lower(), [])
-        for tree in trees:
-            for tid, talent in tree['talents'].items():
-                if 'skill_unlock' in talent.effects:
-                    skill_id = talent.effects['skill_unlock']
-                    cur_rank = getattr(player, 'talents', {}).get(tid, 0)
-                    prof = player.skills.get(skill_id, 0)
-                    talent_skills.append((skill_id, talent.name, cur_rank >= 1, prof))
-        
-        if talent_skills:
-            await player.send(f"{c['cyan']}{LT}{H*W}{c['reset']}")
-            await player.send(f"{c['cyan']}{V} {c['bright_yellow']}TALENT ABILITIES:{c['reset']}")
-            for skill_id, talent_name, unlocked, prof in talent_skills:
-                skill_name = skill_id.replace('_', ' ').title()
-                if unlocked and prof > 0:
-                    bar = BAR_FULL * (prof // 10) + BAR_EMPTY * (10 - prof // 10)
-                    await player.send(f"{c['cyan']}{V}   {c['bright_green']}{skill_name:<20} {c['white']}[{bar}] {prof:>3}%{c['reset']}")
-                elif unlocked:
-                    await player.send(f"{c['cyan']}{V}   {c['bright_green']}{skill_name:<20} {c['white']}[unlocked]{c['reset']}")
-                else:
-                    await player.send(f"{c['cyan']}{V}   {c['white']}{skill_name:<20} {c['red']}[locked - need {talent_name}]{c['reset']}")
-        
-        await player.send(f"{c['cyan']}{LT}{H*W}{c['reset']}")
-        await player.send(f"{c['cyan']}{V} {c['white']}Find a trainer to practice and improve your abilities!{c['reset']}")
-        await player.send(f"{c['cyan']}{BL}{H*W}{c['reset']}")
-
-    @classmethod
-    async def _show_pet_skills(cls, player: 'Player', template_name: str):
-        """Show abilities for a pet type."""
-        c = player.config.COLORS
-        from pets import PET_TEMPLATES
-        
-        template = PET_TEMPLATES.get(template_name)
-        if not template:
-            await player.send(f"{c['red']}Unknown pet type.{c['reset']}")
-            return
-        
-        use_ascii = getattr(player, 'ascii_ui', False)
-        if use_ascii:
-            TL, TR, BL, BR = '+', '+', '+', '+'
-            H, V = '-', '|'
-            LT, RT = '+', '+'
-        else:
-            TL, TR, BL, BR = '╔', '╗', '╚', '╝'
-            H, V = '═', '║'
-            LT, RT = '╠', '╣'
-        
-        W = 50
-        name = template.get('name', template_name).upper()
-        role = template.get('role', 'companion').title()
-        pet_type = template.get('pet_type', 'summon').title()
-        abilities = template.get('special_abilities', [])
-        duration = template.get('duration', 3600) // 60  # minutes
-        hp_dice = template.get('hp_dice', '?')
-        damage_dice = template.get('damage_dice', '?')
-        level_mult = template.get('level_mult', 1.0)
-        
-        await player.send(f"{c['cyan']}{TL}{H*W}{TR}{c['reset']}")
-        await player.send(f"{c['cyan']}{V}{c['bright_magenta']}  {name:<46} {c['cyan']}{V}{c['reset']}")
-        await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
-        await player.send(f"{c['cyan']}{V} {c['white']}Type: {c['yellow']}{pet_type:<15} {c['white']}Role: {c['yellow']}{role:<15}{c['cyan']} {V}{c['reset']}")
-        await player.send(f"{c['cyan']}{V} {c['white']}Level: {c['green']}{int(level_mult*100)}% of yours   {c['white']}Duration: {c['green']}{duration} min{c['cyan']}        {V}{c['reset']}")
-        await player.send(f"{c['cyan']}{V} {c['white']}HP: {c['green']}{hp_dice:<12} {c['white']}Damage: {c['green']}{damage_dice:<12}{c['cyan']}    {V}{c['reset']}")
-        await player.send(f"{c['cyan']}{LT}{H*W}{RT}{c['reset']}")
-        await player.send(f"{c['cyan']}{V} {c['bright_yellow']}ABILITIES:{c['cyan']}                                       {V}{c['reset']}")
-        
-        # Ability descriptions
-        ability_info = {
-            'undead': ('Undead', 'Immune to poison, disease, and fear'),
-            'shield_wall': ('Shield Wall', 'Reduces incoming damage, taunts enemies'),
-            'dark_heal': ('Dark Heal', 'Heals owner using dark magic'),
-            'necrotic_bolt': ('Necrotic Bolt', 'Ranged magic attack dealing shadow damage'),
-            'backstab': ('Backstab', 'High damage sneak attack from shadows'),
-            'whirlwind': ('Whirlwind', 'Area attack hitting all enemies'),
-            'fly': ('Flying', 'Can fly over obstacles'),
-            'fire_breath': ('Fire Breath', 'Cone of fire damage'),
-            'immolate': ('Immolate', 'Burns enemies that attack'),
-            'tidal_wave': ('Tidal Wave', 'Knockback water attack'),
-            'healing_mist': ('Healing Mist', 'Heals allies in the area'),
-            'earthquake': ('Earthquake', 'Stuns and damages all enemies'),
-            'stone_skin': ('Stone Skin', 'Greatly increased defense'),
-            'howl': ('Howl', 'Buffs attack speed'),
-            'pack_tactics': ('Pack Tactics', 'Bonus damage when owner is fighting'),
-            'maul': ('Maul', 'Heavy damage with stun chance'),
-            'thick_hide': ('Thick Hide', 'Damage reduction'),
-            'dive': ('Dive', 'Aerial attack with bonus damage'),
-            'scout': ('Scout', 'Can scout ahead, reveals hidden enemies'),
-            'pounce': ('Pounce', 'Leaps at target for opening attack'),
-            'stealth': ('Stealth', 'Sneaks alongside owner'),
-        }
-        
-        if abilities:
-            for ability in abilities:
-                info = ability_info.get(ability, (ability.replace('_', ' ').title(), 'Special ability'))
-                await player.send(f"{c['cyan']}{V}   {c['bright_green']}{info[0]:<15} {c['white']}{info[1]:<30}{c['cyan']}{V}{c['reset']}")
-        else:
-            await player.send(f"{c['cyan']}{V}   {c['white']}(no special abilities){c['cyan']}                      {V}{c['reset']}")
-        
-        await player.send(f"{c['cyan']}{BL}{H*W}{BR}{c['reset']}")
-        
-        # Show how to summon
-        if template.get('pet_type') == 'undead':
-            themed_name = {'undead_warrior': 'knight', 'undead_healer': 'wraith', 'undead_caster': 'lich', 'undead_rogue': 'stalker'}.get(template_name, template_name)
-            await player.send(f"{c['yellow']}Summon with: raise {themed_name}{c['reset']}")
-        elif 'elemental' in template_name:
-            elem = template_name.split('_')[0]
-            await player.send(f"{c['yellow']}Summon with: cast summon {elem}{c['reset']}")
-        elif template_name in ('wolf', 'bear', 'hawk', 'panther'):
-            await player.send(f"{c['yellow']}Tame with: tame {template_name}{c['reset']}")
-
-    @classmethod
-    async def cmd_skill(cls, player: 'Player', args: List[str]):
-        """Alias for skills command."""
-        await cls.cmd_skills(player, args)
-    
-    @classmethod
-    async def cmd_talents(cls, player: 'Player', args: List[str]):
-        """View and spend talent points.
-        
-        Usage:
-            talents           - Show all talent trees
-            talents <tree>    - Show specific tree (e.g., 'talents fury')
-            talents learn <id> - Learn/rank up a talent
-            talents reset     - Reset all talents (costs gold)
-        """
-        from talents import TalentManager, CLASS_TALENT_TREES
-        
-        c = player.config.COLORS
-        char_class = (getattr(player, 'char_class', 'warrior') or 'warrior').lower()
-        
-        if char_class == 'warrior':
-            await player.send(f"{c['bright_yellow']}Warriors progress through Martial Doctrines and Ability Evolution.{c['reset']}")
-            await player.send(f"{c['white']}Use 'doctrine' and 'evolve' to view your progression.{c['reset']}")
-            return
-        
-        trees = CLASS_TALENT_TREES.get(char_class, [])
-        
-        if not trees:
-            await player.send(f"{c['red']}No talent trees defined for your class.{c['reset']}")
-            return
-        
-        # Ensure player has talents dict
-        if not hasattr(player, 'talents'):
-            player.talents = {}
-        
-        sub = args[0].lower() if args else None
-        
-        # Learn a talent
-        if sub == 'learn' and len(args) > 1:
-            talent_id = args[1].lower()
-            await TalentManager.learn_talent(player, talent_id)
-            return
-        
-        # Reset talents
-        if sub == 'reset':
-            cost = player.level * 100
-            if player.gold < cost:
-                await player.send(f"{c['red']}Talent reset costs {cost} gold. You only have {player.gold}.{c['reset']}")
-                return
-            player.gold -= cost
-            player.talents = {}
-            await player.send(f"{c['bright_yellow']}Your talents have been reset! Paid {cost} gold.{c['reset']}")
-            return
-        
-        # Show specific tree
-        if sub:
-            for tree in trees:
-                if tree['name'].lower() == sub.lower():
-                    await cls._show_talent_tree(player, tree)
-                    return
-            await player.send(f"{c['red']}Unknown tree. Your trees: {', '.join(t['name'] for t in trees)}{c['reset']}")
-            return
-        
-        # Show overview of all trees
-        total_pts = TalentManager.get_talent_points(player)
-        spent_pts = TalentManager.get_spent_points(player)
-        avail_pts = total_pts - spent_pts
-        
-        W = 62
-        title = f"★ {char_class.upper()} TALENT TREES ★"
-        
-        await player.send(f"\r\n{c['bright_yellow']}╔{'═'*W}{c['reset']}")
-        await player.send(f"{c['bright_yellow']}║{c['reset']}  {c['white']}{title}{c['reset']}")
-        await player.send(f"{c['bright_yellow']}╠{'═'*W}{c['reset']}")
-        await player.send(f"{c['bright_yellow']}║{c['reset']}  Talent Points: {c['bright_green']}{avail_pts}{c['reset']} available / {c['cyan']}{spent_pts}{c['reset']} spent / {c['white']}{total_pts}{c['reset']} total")
-        await player.send(f"{c['bright_yellow']}╠{'═'*W}{c['reset']}")
-        
-        for tree in trees:
-            icon = tree.get('icon', '★')
-            name = tree['name']
-            desc = tree['description'][:55]
-            tree_pts = TalentManager.get_tree_points(player, name)
-            
-            await player.send(f"{c['bright_yellow']}║{c['reset']}")
-            await player.send(f"{c['bright_yellow']}║{c['reset']}  {icon} {c['bright_cyan']}{name}{c['reset']}    ({tree_pts} points)")
-            await player.send(f"{c['bright_yellow']}║{c['reset']}    {c['white']}{desc}{c['reset']}")
-        
-        await player.send(f"{c['bright_yellow']}║{c['reset']}")
-        await player.send(f"{c['bright_yellow']}╚{'═'*W}{c['reset']}")
-        await player.send(f"{c['cyan']}  Commands: talents <tree> | talents learn <id> | talents reset{c['reset']}\r\n")
-    
-    @classmethod
-    async def _show_talent_tree(cls, player: 'Player', tree: dict):
-        """Show a single talent tree in detail (two-column layout)."""
-        import re as _re
-        from talents import TalentManager
-
-        c = player.config.COLORS
-        name = tree['name']
-        icon = tree.get('icon', '★')
-        desc = tree['description']
-        talents = tree['talents']
-        tree_pts = TalentManager.get_tree_points(player, name)
-        player_talents = getattr(player, 'talents', {})
-
-        _ansi_re = _re.compile(r'\x1b\[[0-9;]*m')
-
-        def _vis_len(s: str) -> int:
-            return len(_ansi_re.sub('', s))
-
-        def _pad(s: str, w: int) -> str:
-            return s + ' ' * max(0, w - _vis_len(s))
-
-        # Column / total widths
-        COL_W = 38
-        W = COL_W * 2 + 3  # 79  (col ║ sep ║ col)
-
-        # --- Header (full width, open right) ---
-        header = f"  {icon} {name.upper()} TALENTS"
-        await player.send(f"\r\n{c['bright_cyan']}╔{'═'*W}{c['reset']}")
-        await player.send(f"{c['bright_cyan']}║{c['white']}{header}{c['reset']}")
-        await player.send(f"{c['bright_cyan']}╠{'═'*W}{c['reset']}")
-        await player.send(f"{c['bright_cyan']}║{c['reset']}  {desc}")
-        await player.send(f"{c['bright_cyan']}║{c['reset']}  Points in tree: {c['bright_green']}{tree_pts}{c['reset']}")
-        await player.send(f"{c['bright_cyan']}╠{'═'*W}{c['reset']}")
-
-        # --- Group by tier ---
-        tiers: dict = {}
-        for tid, talent in talents.items():
-            tier = talent.tier
-            if tier not in tiers:
-                tiers[tier] = []
-            tiers[tier].append((tid, talent))
-        sorted_tiers = sorted(tiers.keys())
-
-        # --- Build lines for a single tier ---
-        def _tier_lines(tier_num):
-            lines = []
-            req_pts = (tier_num - 1) * 5
-            unlocked = tree_pts >= req_pts
-            tier_color = c['bright_green'] if unlocked else c['red']
-            lines.append(f"{tier_color}━━ TIER {tier_num} ({req_pts}+ pts) ━━{c['reset']}")
-            for tid, talent in tiers[tier_num]:
-                cur_rank = player_talents.get(tid, 0)
-                max_rank = talent.max_rank
-                if cur_rank >= max_rank:
-                    rank_str = f"{c['bright_green']}{cur_rank}/{max_rank}{c['reset']}"
-                    tag = f" {c['bright_green']}MAX{c['reset']}"
-                elif not unlocked:
-                    rank_str = f"{c['red']}0/{max_rank}{c['reset']}"
-                    tag = f" {c['red']}LOCKED{c['reset']}"
-                elif cur_rank > 0:
-                    rank_str = f"{c['yellow']}{cur_rank}/{max_rank}{c['reset']}"
-                    tag = ""
-                else:
-                    rank_str = f"{c['white']}0/{max_rank}{c['reset']}"
-                    tag = ""
-                tname = talent.name
-                # Truncate name if needed
-                name_line = f" {c['white']}{tname}{c['reset']} [{rank_str}]{tag}"
-                if _vis_len(name_line) > COL_W:
-                    tname = tname[:COL_W - 12] + '..'
-                    name_line = f" {c['white']}{tname}{c['reset']} [{rank_str}]{tag}"
-                lines.append(name_line)
-                # Word-wrap description to fit column
-                tdesc = talent.description
-                wrap_w = COL_W - 4
-                while len(tdesc) > wrap_w:
-                    # Find last space within wrap width
-                    brk = tdesc.rfind(' ', 0, wrap_w)
-                    if brk <= 0:
-                        brk = wrap_w
-                    lines.append(f"   {c['cyan']}{tdesc[:brk]}{c['reset']}")
-                    tdesc = tdesc[brk:].lstrip()
-                if tdesc:
-                    lines.append(f"   {c['cyan']}{tdesc}{c['reset']}")
-                lines.append(f"   {c['yellow']}ID: {tid}{c['reset']}")
-            lines.append("")  # blank spacer
-            return lines
-
-        # --- Split tiers into two columns ---
-        mid = (len(sorted_tiers) + 1) // 2
-        left_tiers = sorted_tiers[:mid]
-        right_tiers = sorted_tiers[mid:]
-
-        left_lines = []
-        for t in left_tiers:
-            left_lines.extend(_tier_lines(t))
-        right_lines = []
-        for t in right_tiers:
-            right_lines.extend(_tier_lines(t))
-
-        # Equalize length
-        max_len = max(len(left_lines), len(right_lines))
-        while len(left_lines) < max_len:
-            left_lines.append("")
-        while len(right_lines) < max_len:
-            right_lines.append("")
-
-        # --- Send columns side by side ---
-        sep = f"{c['bright_cyan']}║{c['reset']}"
-        for l_line, r_line in zip(left_lines, right_lines):
-            left_padded = _pad(l_line, COL_W)
-            await player.send(f"{c['bright_cyan']}║{c['reset']} {left_padded} {sep} {r_line}")
-
-        # --- Footer ---
-        await player.send(f"{c['bright_cyan']}╚{'═'*W}{c['reset']}")
-        await player.send(f"{c['yellow']}  Use 'talents learn <id>' to learn a talent.{c['reset']}\r\n")
-        
-    @classmethod
-    async def cmd_practice(cls, player: 'Player', args: List[str]):
-        """Practice skills/spells - must be at a guild master for your class."""
-        c = player.config.COLORS
-
-        # Check for trainer/guildmaster in room that trains player's class
-        trainer = None
-        any_trainer = False
-        from mobs import Mobile
-        if player.room:
-            for char in player.room.characters:
-                if isinstance(char, Mobile) and char.special in ('trainer', 'guildmaster'):
-                    any_trainer = True
-                    # Check if this trainer teaches the player's class
-                    trains_class = getattr(char, 'trains_class', None)
-                    if trains_class:
-                        allowed = [t.strip().lower() for t in trains_class.split(',') if t.strip()]
-                        if player.char_class.lower() in allowed:
-                            trainer = char
-                            break
-
-        # Get class data for validation
-        class_data = player.config.CLASSES.get(player.char_class.lower(), {})
-        class_skills = class_data.get('skills', [])
-        class_spells = class_data.get('spells', [])
-
-        async def show_practice_list(show_practices: bool):
-            if show_practices:
-                await player.send(f"{c['cyan']}You have {player.practices} practice sessions.{c['reset']}")
-            await player.send(f"{c['cyan']}Skills available to {player.char_class}s:{c['reset']}")
-            if class_skills:
-                for skill in class_skills:
-                    prof = player.skills.get(skill, 0)
-                    skill_name = skill.replace('_', ' ').title()
-                    if prof > 0:
-                        status = f"{prof}%" if prof < 85 else f"{c['bright_green']}MASTERED{c['reset']}"
-                    else:
-                        status = f"{c['yellow']}0%{c['reset']}"
-                    await player.send(f"  {skill_name}: {status}")
-            else:
-                await player.send(f"  (none)")
-
-            await player.send(f"{c['cyan']}Spells available to {player.char_class}s:{c['reset']}")
-            if class_spells:
-                for spell in class_spells:
-                    prof = player.spells.get(spell, 0)
-                    spell_name = spell.replace('_', ' ').title()
-                    if prof > 0:
-                        status = f"{prof}%" if prof < 85 else f"{c['bright_green']}MASTERED{c['reset']}"
-                    else:
-                        status = f"{c['yellow']}0%{c['reset']}"
-                    await player.send(f"  {spell_name}: {status}")
-            else:
-                await player.send(f"  (none)")
-
-        if not any_trainer:
-            await player.send(f"{c['red']}You must find a guild master or trainer to practice!{c['reset']}")
-            await player.send(f"{c['yellow']}Trainers can be found in the guilds around town.{c['reset']}")
-            # Show full list even when not at trainer
-            await show_practice_list(show_practices=False)
-            return
-        
-        if not trainer:
-            await player.send(f"{c['red']}This trainer cannot teach {player.char_class}s.{c['reset']}")
-            await player.send(f"{c['yellow']}Find the {player.char_class}s' guildmaster to practice your skills.{c['reset']}")
-            await show_practice_list(show_practices=False)
-            return
-
-        if not args:
-            # Show what can be practiced (class-specific)
-            await show_practice_list(show_practices=True)
-            return
-            
-        if player.practices <= 0:
-            await player.send("You have no practice sessions left!")
-            return
-            
-        # Abbreviation matching - find skills/spells that start with input
-        search_term = ' '.join(args).lower().replace(' ', '_')
-        search_term_nospace = ''.join(args).lower()
-        
-        # Combine all available abilities
-        all_abilities = [(s, 'skill') for s in class_skills] + [(s, 'spell') for s in class_spells]
-        
-        # Find matches - check prefix match with underscores and without
-        matches = []
-        for ability, atype in all_abilities:
-            ability_nospace = ability.replace('_', '')
-            # Exact match
-            if ability == search_term:
-                matches = [(ability, atype)]
-                break
-            # Prefix match (underscore version)
-            if ability.startswith(search_term):
-                matches.append((ability, atype))
-            # Prefix match (no underscore version) 
-            elif ability_nospace.startswith(search_term_nospace):
-                matches.append((ability, atype))
-        
-        # Handle results
-        if not matches:
-            await player.send(f"{c['red']}'{' '.join(args)}' is not available to {player.char_class}s.{c['reset']}")
-            await player.send(f"{c['yellow']}Type 'practice' to see what you can learn.{c['reset']}")
-            return
-        
-        if len(matches) > 1:
-            await player.send(f"{c['yellow']}Which ability did you mean?{c['reset']}")
-            for ability, atype in matches:
-                await player.send(f"  {ability.replace('_', ' ')} ({atype})")
-            return
-        
-        # Single match - practice it
-        target, ability_type = matches[0]
-        
-        if ability_type == 'skill':
-            current = player.skills.get(target, 0)
-            if current >= 85:
-                await player.send("You've already mastered that skill!")
-                return
-            player.skills[target] = min(85, current + 10)
-            player.practices -= 1
-            if current == 0:
-                await player.send(f"You learn {target.replace('_', ' ')}! ({player.skills[target]}%)")
-            else:
-                await player.send(f"You practice {target.replace('_', ' ')}. ({player.skills[target]}%)")
-        else:  # spell
-            current = player.spells.get(target, 0)
-            if current >= 85:
-                await player.send("You've already mastered that spell!")
-                return
-            player.spells[target] = min(85, current + 10)
-            player.practices -= 1
-            if current == 0:
-                await player.send(f"You learn {target.replace('_', ' ')}! ({player.spells[target]}%)")
-            else:
-                await player.send(f"You practice {target.replace('_', ' ')}. ({player.spells[target]}%)")
-
-    # ==================== BARD PERFORMANCE SYSTEM ====================
-    
-    @classmethod
-    async def cmd_songs(cls, player: 'Player', args: List[str]):
-        """Show known bard songs and current performance status."""
-        c = player.config.COLORS
-        
-        if player.char_class.lower() != 'bard':
-            await player.send(f"{c['red']}Only bards can perform songs!{c['reset']}")
-            return
-        
-        from spells import BARD_SONGS
-        
-        # Get songs available to this bard
-        known_songs = []
-        for song_key, song_data in BARD_SONGS.items():
-            if player.level >= song_data['level']:
-                known_songs.append((song_key, song_data))
-        
-        await player.send(f"{c['bright_magenta']}╔═══════════════════════════════════════════════════╗{c['reset']}")
-        await player.send(f"{c['bright_magenta']}║{c['bright_yellow']}  ♪  BARD SONGS  ♪                                 {c['bright_magenta']}║{c['reset']}")
-        await player.send(f"{c['bright_magenta']}╠═══════════════════════════════════════════════════╣{c['reset']}")
-        
-        if player.performing:
-            current = BARD_SONGS.get(player.performing, {})
-            encore_str = f" {c['bright_yellow']}[ENCORE!]{c['reset']}" if player.encore_active else ""
-            await player.send(f"{c['bright_magenta']}║ {c['bright_green']}♪ NOW PLAYING: {current.get('name', player.performing)}{encore_str}")
-            await player.send(f"{c['bright_magenta']}║ {c['cyan']}  Duration: {player.performance_ticks} ticks | Mana/tick: {current.get('mana_per_tick', 0)}")
-            await player.send(f"{c['bright_magenta']}╠═══════════════════════════════════════════════════╣{c['reset']}")
-        
-        if not known_songs:
-            await player.send(f"{c['bright_magenta']}║ {c['yellow']}You haven't learned any songs yet!{c['reset']}")
-        else:
-            for song_key, song_data in known_songs:
-                name = song_data['name']
-                mana = song_data['mana_per_tick']
-                lvl = song_data['level']
-                target = song_data['target'].title()
-                playing = " ♪" if player.performing == song_key else ""
-                await player.send(f"{c['bright_magenta']}║ {c['bright_cyan']}{name:<25} {c['white']}Mana: {mana}/tick  Lvl {lvl:<2} ({target}){playing}")
-        
-        await player.send(f"{c['bright_magenta']}╠═══════════════════════════════════════════════════╣{c['reset']}")
-        await player.send(f"{c['bright_magenta']}║ {c['cyan']}Commands: perform <song>, stop, encore{c['bright_magenta']}            ║{c['reset']}")
-        await player.send(f"{c['bright_magenta']}╚═══════════════════════════════════════════════════╝{c['reset']}")
-    
-    @classmethod
-    async def cmd_perform(cls, player: 'Player', args: List[str]):
-        """Start performing a bard song."""
-        c = player.config.COLORS
-        
-        if player.char_class.lower() != 'bard':
-            await player.send(f"{c['red']}Only bards can perform songs!{c['reset']}")
-            return
-        
-        if not args:
-            await player.send(f"{c['yellow']}Perform which song? Type 'songs' to see your repertoire.{c['reset']}")
-            return
-        
-        from spells import BARD_SONGS
-        
-        song_input = '_'.join(args).lower()
-        
-        # Find matching song
-        matching_song = None
-        for song_key in BARD_SONGS:
-            if song_key == song_input or song_key.startswith(song_input):
-                matching_song = song_key
-                break
-            # Also check display name
-            song_name = BARD_SONGS[song_key]['name'].lower().replace(' ', '_')
-            if song_name.startswith(song_input.replace(' ', '_')):
-                matching_song = song_key
-                break
-        
-        if not matching_song:
-            await player.send(f"{c['red']}You don't know the song '{' '.join(args)}'.{c['reset']}")
-            await player.send(f"{c['cyan']}Type 'songs' to see your repertoire.{c['reset']}")
-            return
-        
-        song = BARD_SONGS[matching_song]
-        
-        # Check level requirement
-        if player.level < song['level']:
-            await player.send(f"{c['red']}You need to be level {song['level']} to perform {song['name']}!{c['reset']}")
-            return
-        
-        # Check if already performing
-        if player.performing:
-            if player.performing == matching_song:
-                await player.send(f"{c['yellow']}You're already performing {song['name']}!{c['reset']}")
-                return
-            # Switch songs
-            old_song = BARD_SONGS.get(player.performing, {})
-            await player.send(f"{c['cyan']}{old_song.get('end_self', 'Your song ends.')}{c['reset']}")
-            if player.room:
-                await player.room.send_to_room(
-                    old_song.get('end_room', '$n stops playing.').replace('$n', player.name),
-                    exclude=[player]
-                )
-        
-        # Check mana
-        if player.mana < song['mana_per_tick']:
-            await player.send(f"{c['red']}You don't have enough mana to begin performing!{c['reset']}")
-            return
-        
-        # Check if song is combat-only or non-combat only
-        if song.get('combat_only') == False and player.is_fighting:
-            await player.send(f"{c['red']}{song['name']} can only be performed out of combat!{c['reset']}")
-            return
-        
-        # Start performing
-        player.performing = matching_song
-        player.performance_ticks = 0
-        player.encore_active = False
-        player.lullaby_saves = {}  # Reset lullaby tracking
-        
-        await player.send(f"{c['bright_magenta']}{song['start_self']}{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(
-                song['start_room'].replace('$n', player.name),
-                exclude=[player]
-            )
-    
-    @classmethod
-    async def cmd_stop(cls, player: 'Player', args: List[str]):
-        """Stop the current bard performance."""
-        c = player.config.COLORS
-        
-        if not player.performing:
-            await player.send(f"{c['yellow']}You're not performing anything.{c['reset']}")
-            return
-        
-        from spells import BARD_SONGS
-        song = BARD_SONGS.get(player.performing, {})
-        
-        await player.send(f"{c['cyan']}{song.get('end_self', 'You stop playing.')}{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(
-                song.get('end_room', '$n stops playing.').replace('$n', player.name),
-                exclude=[player]
-            )
-        
-        player.performing = None
-        player.performance_ticks = 0
-        player.encore_active = False
-        player.encore_ticks = 0
-        player.lullaby_saves = {}
-    
-    @classmethod
-    async def cmd_encore(cls, player: 'Player', args: List[str]):
-        """Reapply current song buff at 2x strength for 2 ticks. Costs 3 Inspiration. 30s CD."""
-        c = player.config.COLORS
-        import time
-
-        if player.char_class.lower() != 'bard':
-            await player.send(f"{c['red']}Only bards can perform encores!{c['reset']}")
-            return
-        if not player.performing:
-            await player.send(f"{c['red']}You must be performing a song to use encore!{c['reset']}")
-            return
-
-        now = time.time()
-        cd = getattr(player, 'encore_cooldown', 0)
-        if now < cd:
-            await player.send(f"{c['yellow']}Encore on cooldown ({int(cd - now)}s).{c['reset']}")
-            return
-
-        insp_cost = 3
-        try:
-            from talents import TalentManager
-            if TalentManager.get_talent_rank(player, 'encore_mastery') > 0:
-                insp_cost = 2
-        except Exception:
-            pass
-
-        if getattr(player, 'inspiration', 0) < insp_cost:
-            await player.send(f"{c['red']}You need {insp_cost} Inspiration! (Current: {player.inspiration}){c['reset']}")
-            return
-
-        player.inspiration -= insp_cost
-        player.encore_active = True
-        player.encore_ticks = 2
-        player.encore_cooldown = now + 30
-
-        from spells import BARD_SONGS
-        song = BARD_SONGS.get(player.performing, {})
-
-        await player.send(f"{c['bright_yellow']}♪♪ ENCORE! ♪♪ Your {song.get('name', 'song')} swells with double power!{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"♪♪ {player.name}'s performance reaches a powerful crescendo! ♪♪", exclude=[player])
-    
-    @classmethod
-    async def cmd_countersong(cls, player: 'Player', args: List[str]):
-        """Use your music to dispel magical effects."""
-        c = player.config.COLORS
-        import time
-        
-        if player.char_class.lower() != 'bard':
-            await player.send(f"{c['red']}Only bards can perform countersong!{c['reset']}")
-            return
-        
-        if 'countersong' not in player.skills:
-            await player.send(f"{c['red']}You haven't learned countersong yet!{c['reset']}")
-            return
-        
-        # Check cooldown (30 seconds)
-        now = time.time()
-        if now - player.last_countersong < 30:
-            remaining = int(30 - (now - player.last_countersong))
-            await player.send(f"{c['yellow']}Countersong is on cooldown! ({remaining}s remaining){c['reset']}")
-            return
-        
-        # Check mana cost
-        if player.mana < 25:
-            await player.send(f"{c['red']}You need 25 mana to perform countersong!{c['reset']}")
-            return
-        
-        player.mana -= 25
-        player.last_countersong = now
-        
-        skill_level = player.skills.get('countersong', 50)
-        
-        await player.send(f"{c['bright_cyan']}♪ You weave a countersong to disrupt magical energies! ♪{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(
-                f"{player.name} begins a disruptive countersong!",
-                exclude=[player]
-            )
-        
-        from affects import AffectManager
-        
-        # Try to remove debuffs from allies
-        dispelled_ally = 0
-        for char in player.room.characters:
-            if char == player or (hasattr(char, 'is_hostile') and char.is_hostile):
-                continue
-            # Try to remove negative effects
-            if hasattr(char, 'affects') and char.affects:
-                debuffs = ['poison', 'blindness', 'curse', 'weakness', 'slow', 'fear', 'silence']
-                for debuff in debuffs:
-                    if debuff in char.affects and random.randint(1, 100) <= skill_level:
-                        AffectManager.remove_affect_by_name(char, debuff)
-                        dispelled_ally += 1
-                        if hasattr(char, 'send'):
-                            await char.send(f"{c['bright_cyan']}The countersong dispels your {debuff}!{c['reset']}")
-        
-        # Try to remove buffs from enemies
-        dispelled_enemy = 0
-        from mobs import Mobile
-        for char in player.room.characters:
-            if isinstance(char, Mobile):
-                if hasattr(char, 'affects') and char.affects:
-                    buffs = ['haste', 'bless', 'armor', 'sanctuary', 'shield']
-                    for buff in buffs:
-                        if buff in char.affects and random.randint(1, 100) <= skill_level // 2:
-                            AffectManager.remove_affect_by_name(char, buff)
-                            dispelled_enemy += 1
-                            await player.send(f"{c['cyan']}Your countersong strips {buff} from {char.name}!{c['reset']}")
-        
-        if dispelled_ally + dispelled_enemy == 0:
-            await player.send(f"{c['yellow']}Your countersong fails to dispel anything.{c['reset']}")
-        else:
-            total = dispelled_ally + dispelled_enemy
-            await player.send(f"{c['bright_green']}Your countersong dispelled {total} magical effect{'s' if total != 1 else ''}!{c['reset']}")
-    
-    @classmethod
-    async def cmd_fascinate(cls, player: 'Player', args: List[str]):
-        """Charm an enemy with your music, preventing them from attacking."""
-        c = player.config.COLORS
-        
-        if player.char_class.lower() != 'bard':
-            await player.send(f"{c['red']}Only bards can fascinate!{c['reset']}")
-            return
-        
-        if 'fascinate' not in player.skills:
-            await player.send(f"{c['red']}You haven't learned fascinate yet!{c['reset']}")
-            return
-        
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send(f"{c['yellow']}Fascinate whom?{c['reset']}")
-                return
-        
-        target_name = ' '.join(args)
-        target = player.find_target_in_room(target_name)
-        
-        from mobs import Mobile
-        if target and not isinstance(target, Mobile):
-            target = None
-        
-        if not target:
-            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
-            return
-        
-        if target.is_fighting:
-            await player.send(f"{c['red']}{target.name} is too alert to be fascinated!{c['reset']}")
-            return
-        
-        # Check mana
-        if player.mana < 20:
-            await player.send(f"{c['red']}You need 20 mana to fascinate!{c['reset']}")
-            return
-        
-        player.mana -= 20
-        skill_level = player.skills.get('fascinate', 50)
-        
-        # Charm check
-        if random.randint(1, 100) <= skill_level:
-            from affects import AffectManager
-            duration = 3 + (player.level // 10)
-            affect_data = {
-                'name': 'fascinated',
-                'type': AffectManager.TYPE_FLAG,
-                'applies_to': 'charmed',
-                'value': 1,
-                'duration': duration,
-                'caster_level': player.level
-            }
-            AffectManager.apply_affect(target, affect_data)
-            
-            await player.send(f"{c['bright_magenta']}♪ Your captivating melody fascinates {target.name}! ♪{c['reset']}")
-            await player.room.send_to_room(
-                f"{target.name} stares dreamily at {player.name}, fascinated by the music.",
-                exclude=[player]
-            )
-        else:
-            await player.send(f"{c['yellow']}{target.name} resists your captivating melody.{c['reset']}")
-    
-    @classmethod
-    async def cmd_mock(cls, player: 'Player', args: List[str]):
-        """Taunt an enemy with vicious mockery, debuffing them."""
-        c = player.config.COLORS
-        
-        if player.char_class.lower() != 'bard':
-            await player.send(f"{c['red']}Only bards can use mockery!{c['reset']}")
-            return
-        
-        if 'mockery' not in player.skills:
-            await player.send(f"{c['red']}You haven't learned mockery yet!{c['reset']}")
-            return
-        
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send(f"{c['yellow']}Mock whom?{c['reset']}")
-                return
-        
-        target_name = ' '.join(args)
-        target = player.find_target_in_room(target_name)
-        
-        if not target:
-            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
-            return
-        
-        # Check mana
-        if player.mana < 10:
-            await player.send(f"{c['red']}You need 10 mana for mockery!{c['reset']}")
-            return
-        
-        player.mana -= 10
-        skill_level = player.skills.get('mockery', 50)
-        
-        # Mockery always lands some effect
-        from affects import AffectManager
-        
-        # Psychic damage
-        damage = random.randint(1, 4) + (player.level // 5)
-        
-        # Debuff
-        if random.randint(1, 100) <= skill_level:
-            duration = 2 + (player.level // 15)
-            affect_data = {
-                'name': 'mocked',
-                'type': AffectManager.TYPE_MODIFY_STAT,
-                'applies_to': 'hitroll',
-                'value': -2,
-                'duration': duration,
-                'caster_level': player.level
-            }
-            AffectManager.apply_affect(target, affect_data)
-            
-            insults = [
-                f"Your mother was a hamster and your father smelt of elderberries!",
-                f"I've seen scarier things in a goblin's lunchbox!",
-                f"Even the village idiot thinks you're an embarrassment!",
-                f"You fight like a dairy farmer!",
-                f"I've met corpses with more charisma than you!",
-            ]
-            insult = random.choice(insults)
-            
-            await player.send(f"{c['bright_yellow']}♪ \"{insult}\" ♪ [{damage} psychic damage]{c['reset']}")
-            if hasattr(target, 'send'):
-                await target.send(f"{c['red']}{player.name} mocks you viciously! You feel demoralized.{c['reset']}")
-            await player.room.send_to_room(
-                f"{player.name} hurls vicious mockery at {target.name}!",
-                exclude=[player, target]
-            )
-        else:
-            await player.send(f"{c['yellow']}Your mockery falls flat, but still stings. [{damage} damage]{c['reset']}")
-        
-        await target.take_damage(damage, player)
-        
-        # Start combat if not already fighting
-        if not player.is_fighting:
-            from combat import CombatHandler
-            await CombatHandler.start_combat(player, target)
-
-    # ==================== WARRIOR RAGE & STANCE SYSTEM ====================
-    
-    @classmethod
-    async def cmd_rage(cls, player: 'Player', args: List[str]):
-        """Display current rage level."""
-        c = player.config.COLORS
-        
-        if player.char_class.lower() != 'warrior':
-            await player.send(f"{c['red']}Only warriors can harness rage!{c['reset']}")
-            return
-        
-        rage_bar = cls._make_bar(player.rage, player.max_rage, 20, c['bright_red'], c['red'])
-        stance_colors = {
-            'battle': c['white'],
-            'berserk': c['bright_red'],
-            'defensive': c['bright_blue'],
-            'precision': c['bright_yellow']
-        }
-        stance_color = stance_colors.get(player.stance, c['white'])
-        
-        await player.send(f"{c['bright_red']}╔═══════════════════════════════════════╗{c['reset']}")
-        await player.send(f"{c['bright_red']}║{c['bright_yellow']}  ⚔  WARRIOR STATUS  ⚔                 {c['bright_red']}║{c['reset']}")
-        await player.send(f"{c['bright_red']}╠═══════════════════════════════════════╣{c['reset']}")
-        await player.send(f"{c['bright_red']}║ {c['white']}Rage: {rage_bar} {player.rage}/{player.max_rage}")
-        await player.send(f"{c['bright_red']}║ {c['white']}Stance: {stance_color}{player.stance.title()}{c['reset']}")
-        if player.ignore_pain_absorb > 0:
-            await player.send(f"{c['bright_red']}║ {c['cyan']}Ignore Pain: {player.ignore_pain_absorb} damage remaining{c['reset']}")
-        await player.send(f"{c['bright_red']}╠═══════════════════════════════════════╣{c['reset']}")
-        await player.send(f"{c['bright_red']}║ {c['cyan']}Rage Abilities:{c['reset']}")
-        await player.send(f"{c['bright_red']}║   {c['yellow']}ignorepain{c['white']} (20) - Absorb damage{c['reset']}")
-        await player.send(f"{c['bright_red']}║   {c['yellow']}warcry{c['white']} (30) - Fear enemies, buff allies{c['reset']}")
-        await player.send(f"{c['bright_red']}║   {c['yellow']}rampage{c['white']} (40) - Attack all enemies{c['reset']}")
-        await player.send(f"{c['bright_red']}║   {c['yellow']}execute{c['white']} (50) - Devastating finisher{c['reset']}")
-        await player.send(f"{c['bright_red']}╚═══════════════════════════════════════╝{c['reset']}")
-    
-    @classmethod
-    def _make_bar(cls, current, maximum, width, filled_color, empty_color):
-        """Create a visual bar."""
-        if maximum <= 0:
-            return f"{empty_color}{'░' * width}"
-        filled = int((current / maximum) * width)
-        empty = width - filled
-        return f"{filled_color}{'█' * filled}{empty_color}{'░' * empty}"
-    
-    @classmethod
-    async def cmd_stance(cls, player: 'Player', args: List[str]):
-        """Set combat stance (aggressive/normal/defensive)."""
-        c = player.config.COLORS
-        stance_mods = player.config.STANCE_MODIFIERS
-        if not args:
-            current = getattr(player, 'stance', 'normal')
-            mods = stance_mods.get(current, stance_mods['normal'])
-            await player.send(
-                f"{c['white']}Current stance:{c['reset']} {c['bright_cyan']}{current.title()}{c['reset']} "
-                f"(Hit {mods.get('hit', 0):+d}, Dam {mods.get('dam', 0):+d}, AC {mods.get('ac', 0):+d})"
-            )
-            await player.send(
-                f"{c['white']}Available:{c['reset']} aggressive, normal, defensive"
-            )
-            await player.send(f"{c['yellow']}Tip:{c['reset']} Warrior doctrine status is now under {c['white']}doctrine{c['reset']}.")
-            return
-
-        requested = args[0].lower()
-        mapping = {
-            'agg': 'aggressive',
-            'aggressive': 'aggressive',
-            'norm': 'normal',
-            'normal': 'normal',
-            'def': 'defensive',
-            'defensive': 'defensive',
-        }
-        stance = mapping.get(requested)
-        if not stance:
-            await player.send(f"{c['red']}Invalid stance. Use: aggressive, normal, defensive.{c['reset']}")
-            return
-
-        player.stance = stance
-        mods = stance_mods.get(stance, stance_mods['normal'])
-        await player.send(
-            f"{c['green']}You shift to {stance.title()} stance.{c['reset']} "
-            f"(Hit {mods.get('hit', 0):+d}, Dam {mods.get('dam', 0):+d}, AC {mods.get('ac', 0):+d})"
-        )
-
-    @classmethod
-    async def cmd_doctrine(cls, player: 'Player', args: List[str]):
-        """View your War Doctrine and progression."""
-        c = player.config.COLORS
-        if player.char_class.lower() != 'warrior':
-            await player.send(f"{c['red']}Only warriors use doctrines!{c['reset']}")
-            return
-        from warrior_abilities import cmd_doctrine
-        await cmd_doctrine(player, args)
-
-    @classmethod
-    async def cmd_swear(cls, player: 'Player', args: List[str]):
-        """Swear to a War Doctrine."""
-        c = player.config.COLORS
-        if player.char_class.lower() != 'warrior':
-            await player.send(f"{c['red']}Only warriors can swear doctrines!{c['reset']}")
-            return
-        from warrior_abilities import cmd_swear
-        await cmd_swear(player, args)
-
-    @classmethod
-    async def cmd_evolve(cls, player: 'Player', args: List[str]):
-        """Evolve warrior abilities."""
-        c = player.config.COLORS
-        if player.char_class.lower() != 'warrior':
-            await player.send(f"{c['red']}Only warriors evolve abilities!{c['reset']}")
-            return
-        from warrior_abilities import cmd_evolve
-        await cmd_evolve(player, args)
-
-    @classmethod
-    async def cmd_strike(cls, player: 'Player', args: List[str]):
-        """Strike - Enhanced basic attack for warriors."""
-        c = player.config.COLORS
-        if player.char_class.lower() != 'warrior':
-            await player.send(f"{c['red']}Only warriors can use strike!{c['reset']}")
-            return
-        from warrior_abilities import do_strike
-        await do_strike(player, args)
-
-    @classmethod
-    async def cmd_rally(cls, player: 'Player', args: List[str]):
-        """Rally - Self-buff/recovery for warriors."""
-        c = player.config.COLORS
-        if player.char_class.lower() != 'warrior':
-            await player.send(f"{c['red']}Only warriors can rally!{c['reset']}")
-            return
-        from warrior_abilities import do_rally
-        await do_rally(player, args)
-    
-    @classmethod
-    async def cmd_execute(cls, player: 'Player', args: List[str]):
-        """Execute — Finisher for warriors. Target must be below 25% HP."""
-        c = player.config.COLORS
-        if player.char_class.lower() != 'warrior':
-            await player.send(f"{c['red']}Only warriors can execute!{c['reset']}")
-            return
-        from warrior_abilities import do_execute
-        await do_execute(player, args)
-    
-    @classmethod
-    async def cmd_rampage(cls, player: 'Player', args: List[str]):
-        """Legacy ability. Use doctrine abilities instead."""
-        c = player.config.COLORS
-        await player.send(f"{c['yellow']}Rampage has been replaced by the Doctrine system. See 'help warrior'.{c['reset']}")
-    
-    @classmethod
-    async def cmd_warcry(cls, player: 'Player', args: List[str]):
-        """Legacy ability. Replaced by Doctrine system."""
-        c = player.config.COLORS
-        await player.send(f"{c['yellow']}War Cry has been replaced by the Doctrine system. See 'help warrior'.{c['reset']}")
-    
-    @classmethod
-    async def cmd_ignorepain(cls, player: 'Player', args: List[str]):
-        """Legacy ability. Replaced by Doctrine system."""
-        c = player.config.COLORS
-        await player.send(f"{c['yellow']}Ignore Pain has been replaced by the Doctrine system. See 'help warrior'.{c['reset']}")
-    
-    @classmethod
-    async def cmd_battleshout(cls, player: 'Player', args: List[str]):
-        """Legacy ability. Replaced by Doctrine system."""
-        c = player.config.COLORS
-        await player.send(f"{c['yellow']}Battle Shout has been replaced by the Doctrine system. Use 'rally' instead. See 'help warrior'.{c['reset']}")
-    
-    @classmethod
-    async def cmd_rescue(cls, player: 'Player', args: List[str]):
-        """Rescue an ally from combat, becoming the new target."""
-        c = player.config.COLORS
-        import random, time
-        from combat import CombatHandler
-        
-        if player.char_class.lower() not in ('warrior', 'paladin'):
-            await player.send(f"{c['red']}Only warriors and paladins can rescue!{c['reset']}")
-            return
-        
-        if 'rescue' not in player.skills:
-            await player.send(f"{c['red']}You haven't learned rescue!{c['reset']}")
-            return
-
-        now = time.time()
-        if now < getattr(player, 'rescue_cooldown_until', 0):
-            remaining = int(max(0, getattr(player, 'rescue_cooldown_until', 0) - now))
-            await player.send(f"{c['yellow']}You need {remaining}s before you can rescue again.{c['reset']}")
-            return
-        
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send(f"{c['yellow']}Rescue whom?{c['reset']}")
-                return
-        
-        target_name = ' '.join(args).lower()
-        
-        # Find the ally to rescue
-        ally = None
-        for char in player.room.characters:
-            from mobs import Mobile
-            if not isinstance(char, Mobile) and char != player:
-                if target_name in char.name.lower():
-                    ally = char
-                    break
-        
-        if not ally:
-            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
-            return
-        
-        if not ally.is_fighting:
-            await player.send(f"{c['yellow']}{ally.name} isn't fighting anyone!{c['reset']}")
-            return
-        
-        attacker = ally.fighting
-        if not attacker:
-            await player.send(f"{c['yellow']}{ally.name} has no attacker to rescue from!{c['reset']}")
-            return
-        
-        skill_level = CombatHandler.get_rescue_chance(player, ally, attacker)
-        player.rescue_cooldown_until = now + player.config.RESCUE_COOLDOWN_SECONDS
-        
-        if random.randint(1, 100) <= skill_level:
-            # Successful rescue
-            await player.send(f"{c['bright_green']}You heroically rescue {ally.name} from {attacker.name}!{c['reset']}")
-            if hasattr(ally, 'send'):
-                await ally.send(f"{c['bright_green']}{player.name} rescues you from {attacker.name}!{c['reset']}")
-            if hasattr(attacker, 'send'):
-                await attacker.send(f"{c['red']}{player.name} wrests {ally.name} away from you!{c['reset']}")
-            if player.room:
-                await player.room.send_to_room(
-                    f"{c['cyan']}{player.name} heroically rescues {ally.name}!{c['reset']}",
-                    exclude=[player, ally]
-                )
-
-            # Skill progression hook
-            try:
-                if hasattr(player, 'improve_skill'):
-                    await player.improve_skill('rescue', difficulty=6)
-            except Exception:
-                pass
-            
-            # Switch aggro
-            ally.fighting = None
-            ally.position = 'standing'
-            
-            attacker.fighting = player
-            player.fighting = attacker
-            player.position = 'fighting'
-            if hasattr(player, 'target'):
-                player.target = attacker
-            
-            # Gain rage for the heroic act
-            if player.char_class.lower() == 'warrior':
-                player.rage = min(player.max_rage, player.rage + 15)
-                await player.send(f"{c['red']}(+15 rage){c['reset']}")
-        else:
-            await player.send(f"{c['yellow']}You fail to rescue {ally.name}!{c['reset']}")
-            # Low-noise failure visibility for involved parties
-            if hasattr(ally, 'send'):
-                await ally.send(f"{c['yellow']}{player.name} tries to rescue you, but fails.{c['reset']}")
-            if hasattr(attacker, 'send'):
-                await attacker.send(f"{c['cyan']}{player.name} attempts to pull {ally.name} away from you, but fails.{c['reset']}")
-    
-    @classmethod
-    async def cmd_disarm(cls, player: 'Player', args: List[str]):
-        """Disarm — Chain ability (🟡) for warriors. Disarm target for 2 rounds. 15s CD."""
-        import time, random
-        c = player.config.COLORS
-
-        if 'disarm' not in player.skills:
-            await player.send(f"{c['red']}You don't know how to disarm!{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['red']}You need to be fighting someone to disarm them!{c['reset']}")
-            return
-
-        target = player.fighting
-        if args:
-            t = player.find_target_in_room(' '.join(args))
-            if t:
-                target = t
-        if not target:
-            await player.send(f"{c['red']}You have no target!{c['reset']}")
-            return
-
-        now = time.time()
-        cd = getattr(player, 'disarm_cooldown', 0)
-        if now < cd:
-            await player.send(f"{c['yellow']}Disarm on cooldown ({int(cd - now)}s).{c['reset']}")
-            return
-        player.disarm_cooldown = now + 15
-
-        target_weapon = None
-        if hasattr(target, 'equipment'):
-            target_weapon = target.equipment.get('wield')
-
-        if not target_weapon:
-            await player.send(f"{c['yellow']}{target.name} isn't wielding a weapon!{c['reset']}")
-            return
-
-        skill_level = player.skills.get('disarm', 50)
-        level_diff = getattr(target, 'level', 1) - player.level
-        chance = skill_level - (level_diff * 5)
-
-        if random.randint(1, 100) <= chance:
-            target.equipment['wield'] = None
-            if hasattr(player.room, 'items'):
-                player.room.items.append(target_weapon)
-
-            await player.send(f"{c['bright_green']}You disarm {target.name}! Their {target_weapon.name} clatters to the ground!{c['reset']}")
-
-            if hasattr(target, 'send'):
-                await target.send(f"{c['bright_red']}{player.name} disarms you!{c['reset']}")
-            if player.room:
-                await player.room.send_to_room(f"{player.name} disarms {target.name}!", exclude=[player, target])
-        else:
-            await player.send(f"{c['yellow']}You fail to disarm {target.name}!{c['reset']}")
-
-    # ==================== RANGER COMPANION & TRACKING SYSTEM ====================
-    
-    @classmethod
-    async def cmd_companion(cls, player: 'Player', args: List[str]):
-        """View or command your animal companion."""
-        c = player.config.COLORS
-        
-        if player.char_class.lower() != 'ranger':
-            await player.send(f"{c['red']}Only rangers can have animal companions!{c['reset']}")
-            return
-        
-        if not player.animal_companion:
-            await player.send(f"{c['yellow']}You don't have an animal companion.{c['reset']}")
-            await player.send(f"{c['cyan']}Use 'tame <animal>' to bond with a wild beast.{c['reset']}")
-            return
-        
-        comp = player.animal_companion
-        
-        if not args:
-            # Show companion status
-            hp_bar = cls._make_bar(comp.hp, comp.max_hp, 15, c['bright_green'], c['red'])
-            
-            await player.send(f"{c['bright_green']}╔══════════════════════════════════════════════════╗{c['reset']}")
-            await player.send(f"{c['bright_green']}║{c['bright_yellow']}  🐾 ANIMAL COMPANION 🐾                          {c['bright_green']}║{c['reset']}")
-            await player.send(f"{c['bright_green']}╠══════════════════════════════════════════════════╣{c['reset']}")
-            await player.send(f"{c['bright_green']}║ {c['white']}Name: {c['bright_cyan']}{comp.name}{c['reset']}")
-            await player.send(f"{c['bright_green']}║ {c['white']}Type: {c['cyan']}{player.companion_type.title()}{c['reset']}")
-            await player.send(f"{c['bright_green']}║ {c['white']}HP: {hp_bar} {comp.hp}/{comp.max_hp}{c['reset']}")
-            await player.send(f"{c['bright_green']}║ {c['white']}Level: {comp.level}{c['reset']}")
-            
-            from spells import RANGER_COMPANIONS
-            comp_data = RANGER_COMPANIONS.get(player.companion_type, {})
-            special = comp_data.get('special', 'none').title()
-            await player.send(f"{c['bright_green']}║ {c['white']}Special: {c['bright_yellow']}{special}{c['reset']}")
-            
-            await player.send(f"{c['bright_green']}╠══════════════════════════════════════════════════╣{c['reset']}")
-            await player.send(f"{c['bright_green']}║ {c['cyan']}Commands: attack, defend, stay, follow, heel{c['reset']}")
-            await player.send(f"{c['bright_green']}╚══════════════════════════════════════════════════╝{c['reset']}")
-            return
-        
-        command = args[0].lower()
-        
-        if command == 'attack':
-            if not player.is_fighting:
-                await player.send(f"{c['yellow']}You're not fighting anyone for {comp.name} to attack!{c['reset']}")
-                return
-            target = player.fighting
-            comp.fighting = target
-            await player.send(f"{c['bright_green']}You command {comp.name} to attack!{c['reset']}")
-            await player.room.send_to_room(f"{comp.name} lunges at {target.name}!", exclude=[player])
-        
-        elif command == 'defend':
-            await player.send(f"{c['cyan']}{comp.name} moves to defend you.{c['reset']}")
-            if not hasattr(comp, 'defending'):
-                comp.defending = player
-        
-        elif command == 'stay':
-            comp.following = None
-            await player.send(f"{c['cyan']}{comp.name} stays in place.{c['reset']}")
-        
-        elif command == 'follow':
-            comp.following = player
-            await player.send(f"{c['cyan']}{comp.name} begins following you.{c['reset']}")
-        
-        elif command == 'heel':
-            if comp.room != player.room:
-                if comp.room and comp in comp.room.characters:
-                    comp.room.characters.remove(comp)
-                player.room.characters.append(comp)
-                comp.room = player.room
-                await player.send(f"{c['cyan']}{comp.name} returns to your side.{c['reset']}")
-            else:
-                await player.send(f"{c['yellow']}{comp.name} is already at your side.{c['reset']}")
-        
-        else:
-            await player.send(f"{c['yellow']}Unknown command. Try: attack, defend, stay, follow, heel{c['reset']}")
-    
-    @classmethod
-    async def cmd_tame(cls, player: 'Player', args: List[str]):
-        """Attempt to tame a wild animal as your companion."""
-        c = player.config.COLORS
-        import random
-        
-        if player.char_class.lower() != 'ranger':
-            await player.send(f"{c['red']}Only rangers can tame animals!{c['reset']}")
-            return
-        
-        if 'tame' not in player.skills:
-            await player.send(f"{c['red']}You haven't learned how to tame animals!{c['reset']}")
-            return
-        
-        if player.animal_companion:
-            await player.send(f"{c['yellow']}You already have a companion! Use 'dismiss' first.{c['reset']}")
-            return
-        
-        if not args:
-            await player.send(f"{c['yellow']}Tame which animal?{c['reset']}")
-            return
-        
-        target_name = ' '.join(args).lower()
-        
-        from mobs import Mobile
-        from spells import RANGER_COMPANIONS
-        
-        # Find target animal
-        target = None
-        matched_type = None
-        
-        for char in player.room.characters:
-            if isinstance(char, Mobile) and target_name in char.name.lower():
-                # Check if it's a tameable beast
-                for comp_type, comp_data in RANGER_COMPANIONS.items():
-                    for keyword in comp_data['keywords']:
-                        if keyword in char.name.lower():
-                            target = char
-                            matched_type = comp_type
-                            break
-                    if matched_type:
-                        break
-                if matched_type:
-                    break
-        
-        if not target:
-            await player.send(f"{c['red']}You don't see a tameable animal called '{target_name}' here.{c['reset']}")
-            await player.send(f"{c['cyan']}Tameable types: wolf, bear, hawk, cat, boar{c['reset']}")
-            return
-        
-        comp_data = RANGER_COMPANIONS[matched_type]
-        
-        # Check level requirement
-        if player.level < comp_data['level_required']:
-            await player.send(f"{c['red']}You need to be level {comp_data['level_required']} to tame a {matched_type}!{c['reset']}")
-            return
-        
-        # Check if target is hostile/fighting
-        if target.is_fighting:
-            await player.send(f"{c['red']}{target.name} is too aggressive to tame right now!{c['reset']}")
-            return
-        
-        # Taming attempt
-        skill_level = player.skills.get('tame', 50)
-        difficulty = comp_data['level_required'] * 2
-        chance = skill_level - difficulty + (player.level - comp_data['level_required']) * 2
-        
-        await player.send(f"{c['cyan']}You approach {target.name} slowly, attempting to bond...{c['reset']}")
-        await player.room.send_to_room(f"{player.name} approaches {target.name} carefully.", exclude=[player])
-        
-        if random.randint(1, 100) <= chance:
-            # Success! Convert to companion
-            player.animal_companion = target
-            player.companion_type = matched_type
-            
-            # Set companion stats based on ranger
-            target.max_hp = int(player.max_hp * comp_data['hp_mult'])
-            target.hp = target.max_hp
-            target.level = player.level
-            target.armor_class = comp_data['armor_class']
-            target.following = player
-            target.is_companion = True
-            target.companion_owner = player
-            target.special_ability = comp_data['special']
-            
-            await player.send(f"{c['bright_green']}Success! {target.name} bonds with you as your companion!{c['reset']}")
-            await player.send(f"{c['cyan']}{comp_data['description']}{c['reset']}")
-            await player.room.send_to_room(
-                f"{target.name} nuzzles {player.name} affectionately.",
-                exclude=[player]
-            )
-        else:
-            await player.send(f"{c['yellow']}{target.name} refuses to bond with you.{c['reset']}")
-            # Failed tame might make it hostile
-            if random.randint(1, 100) <= 20:
-                await player.send(f"{c['red']}{target.name} becomes aggressive!{c['reset']}")
-                from combat import CombatHandler
-                await CombatHandler.start_combat(target, player)
-    
-    @classmethod
-    async def cmd_dismiss(cls, player: 'Player', args: List[str]):
-        """Release your animal companion back to the wild."""
-        c = player.config.COLORS
-        
-        if not player.animal_companion:
-            await player.send(f"{c['yellow']}You don't have an animal companion.{c['reset']}")
-            return
-        
-        comp = player.animal_companion
-        
-        await player.send(f"{c['cyan']}You release {comp.name} back to the wild.{c['reset']}")
-        await player.send(f"{c['cyan']}{comp.name} nuzzles you one last time before departing.{c['reset']}")
-        
-        if player.room:
-            await player.room.send_to_room(
-                f"{comp.name} bounds away into the wilderness.",
-                exclude=[player]
-            )
-            if comp in player.room.characters:
-                player.room.characters.remove(comp)
-        
-        # Remove from world
-        if hasattr(player, 'world') and hasattr(player.world, 'npcs'):
-            if comp in player.world.npcs:
-                player.world.npcs.remove(comp)
-        
-        player.animal_companion = None
-        player.companion_type = None
-    
-    @classmethod
-    async def cmd_track(cls, player: 'Player', args: List[str]):
-        """Track a creature type or specific target."""
-        c = player.config.COLORS
-        
-        if 'track' not in player.skills:
-            await player.send(f"{c['red']}You don't know how to track!{c['reset']}")
-            return
-        
-        if not args:
-            if player.tracking_target:
-                await player.send(f"{c['cyan']}Currently tracking: {c['bright_yellow']}{player.tracking_target}{c['reset']}")
-                await player.send(f"{c['cyan']}Type 'track stop' to stop tracking.{c['reset']}")
-            else:
-                await player.send(f"{c['yellow']}Track what? Usage: track <creature type>{c['reset']}")
-            return
-        
-        target = ' '.join(args).lower()
-        
-        if target == 'stop':
-            if player.tracking_target:
-                await player.send(f"{c['cyan']}You stop tracking {player.tracking_target}.{c['reset']}")
-                player.tracking_target = None
-                player.tracking_vnum = None
-            else:
-                await player.send(f"{c['yellow']}You're not tracking anything.{c['reset']}")
-            return
-        
-        # Start tracking
-        player.tracking_target = target
-        
-        skill_level = player.skills.get('track', 50)
-        
-        await player.send(f"{c['bright_green']}You begin tracking {target}...{c['reset']}")
-        
-        # Search for the target in nearby rooms
-        found_direction = None
-        from mobs import Mobile
-        
-        for direction, exit_info in player.room.exits.items():
-            if not exit_info or not exit_info.get('room'):
-                continue
-            adj_room = exit_info['room']
-            for char in adj_room.characters:
-                if isinstance(char, Mobile) and target in char.name.lower():
-                    found_direction = direction
-                    break
-            if found_direction:
-                break
-        
-        # Deeper search if not found adjacent
-        if not found_direction:
-            import random
-            if random.randint(1, 100) <= skill_level:
-                # Search 2 rooms deep
-                for direction, exit_info in player.room.exits.items():
-                    if not exit_info or not exit_info.get('room'):
-                        continue
-                    adj_room = exit_info['room']
-                    for dir2, exit2 in adj_room.exits.items():
-                        if not exit2 or not exit2.get('room'):
-                            continue
-                        far_room = exit2['room']
-                        for char in far_room.characters:
-                            if isinstance(char, Mobile) and target in char.name.lower():
-                                found_direction = direction
-                                break
-                        if found_direction:
-                            break
-                    if found_direction:
-                        break
-        
-        if found_direction:
-            await player.send(f"{c['bright_yellow']}You sense tracks leading {found_direction}!{c['reset']}")
-        else:
-            await player.send(f"{c['yellow']}You find no fresh tracks nearby.{c['reset']}")
-    
-    @classmethod
-    async def cmd_scan(cls, player: 'Player', args: List[str]):
-        """Scan for creatures in adjacent rooms."""
-        c = player.config.COLORS
-        import time
-        
-        if 'scan' not in player.skills:
-            await player.send(f"{c['red']}You don't know how to scan!{c['reset']}")
-            return
-        
-        # Check cooldown (10 seconds)
-        now = time.time()
-        if now - player.last_scan < 10:
-            remaining = int(10 - (now - player.last_scan))
-            await player.send(f"{c['yellow']}You need to wait {remaining}s before scanning again.{c['reset']}")
-            return
-        
-        player.last_scan = now
-        
-        await player.send(f"{c['cyan']}You scan your surroundings...{c['reset']}")
-        
-        from mobs import Mobile
-        
-        found_any = False
-        
-        for direction, exit_info in player.room.exits.items():
-            if not exit_info or not exit_info.get('room'):
-                continue
-            
-            # Skip hidden exits
-            if exit_info.get('hidden'):
-                continue
-            
-            adj_room = exit_info['room']
-            creatures = []
-            
-            for char in adj_room.characters:
-                if isinstance(char, Mobile):
-                    creatures.append(char.name)
-            
-            if creatures:
-                found_any = True
-                count = len(creatures)
-                if count == 1:
-                    await player.send(f"{c['bright_yellow']}{direction.title()}{c['white']}: {creatures[0]}{c['reset']}")
-                elif count <= 3:
-                    await player.send(f"{c['bright_yellow']}{direction.title()}{c['white']}: {', '.join(creatures)}{c['reset']}")
-                else:
-                    await player.send(f"{c['bright_yellow']}{direction.title()}{c['white']}: {creatures[0]}, {creatures[1]}, and {count - 2} more...{c['reset']}")
-        
-        if not found_any:
-            await player.send(f"{c['cyan']}You don't sense any creatures nearby.{c['reset']}")
-    
-    @classmethod
-    async def cmd_camouflage(cls, player: 'Player', args: List[str]):
-        """Blend into the wilderness for enhanced stealth."""
-        c = player.config.COLORS
-        import random
-        
-        if 'camouflage' not in player.skills:
-            await player.send(f"{c['red']}You don't know how to camouflage!{c['reset']}")
-            return
-        
-        # Check if outdoors
-        outdoor_sectors = {'field', 'forest', 'hills', 'mountain', 'desert', 'swamp'}
-        is_outdoors = player.room and player.room.sector_type in outdoor_sectors
-        
-        if not is_outdoors:
-            await player.send(f"{c['yellow']}Camouflage works best in wilderness areas.{c['reset']}")
-        
-        skill_level = player.skills.get('camouflage', 50)
-        bonus = 30 if is_outdoors else 0
-        
-        if random.randint(1, 100) <= skill_level + bonus:
-            from affects import AffectManager
-            
-            # Apply enhanced hide
-            duration = 10 + (player.level // 5)
-            affect_data = {
-                'name': 'camouflage',
-                'type': AffectManager.TYPE_FLAG,
-                'applies_to': 'hidden',
-                'value': 2,  # 2 = enhanced hide
-                'duration': duration,
-                'caster_level': player.level
-            }
-            AffectManager.apply_affect(player, affect_data)
-            player.flags.add('hidden')
-            
-            await player.send(f"{c['bright_green']}You blend seamlessly into your surroundings.{c['reset']}")
-            await player.room.send_to_room(
-                f"{player.name} seems to fade into the wilderness.",
-                exclude=[player]
-            )
-        else:
-            await player.send(f"{c['yellow']}You fail to properly camouflage yourself.{c['reset']}")
-    
-    @classmethod
-    async def cmd_rapid_shot(cls, player: 'Player', args: List[str]):
-        """Fire multiple arrows in quick succession."""
-        c = player.config.COLORS
-        import random
-        
-        if 'rapid_shot' not in player.skills:
-            await player.send(f"{c['red']}You don't know Rapid Shot.{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['yellow']}You must be fighting to use Rapid Shot.{c['reset']}")
-            return
-        
-        target = player.fighting
-        shots = 3  # Fire 3 rapid shots
-        total_damage = 0
-        
-        await player.send(f"{c['bright_green']}You loose a rapid volley of arrows!{c['reset']}")
-        for i in range(shots):
-            damage = random.randint(4, 10) + player.level // 3
-            total_damage += damage
-            await player.send(f"{c['green']}  → Arrow {i+1} hits {target.name}! [{damage}]{c['reset']}")
-        
-        await target.take_damage(total_damage, player)
-
-    @classmethod
-    async def cmd_volley(cls, player: 'Player', args: List[str]):
-        """Rain arrows on all enemies in the room."""
-        c = player.config.COLORS
-        import random
-        from mobs import Mobile
-        
-        if 'volley' not in player.skills:
-            await player.send(f"{c['red']}You don't know Volley.{c['reset']}")
-            return
-        
-        targets = [m for m in player.room.characters if isinstance(m, Mobile) and m.hp > 0]
-        if not targets:
-            await player.send(f"{c['yellow']}No enemies to target!{c['reset']}")
-            return
-        
-        await player.send(f"{c['bright_green']}You fire a volley of arrows into the air!{c['reset']}")
-        for target in targets:
-            damage = random.randint(6, 14) + player.level // 2
-            await player.send(f"{c['green']}  → {target.name} takes {damage} damage!{c['reset']}")
-            await target.take_damage(damage, player)
-
-    @classmethod
-    async def cmd_marked_shot(cls, player: 'Player', args: List[str]):
-        """Fire a powerful shot at a marked target for bonus damage."""
-        c = player.config.COLORS
-        import random
-        
-        if 'marked_shot' not in player.skills:
-            await player.send(f"{c['red']}You don't know Marked Shot.{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['yellow']}You must be fighting to use Marked Shot.{c['reset']}")
-            return
-        
-        target = player.fighting
-        base_damage = random.randint(12, 24) + player.level
-        
-        # Bonus damage if target is marked (vendetta, hunter's mark, etc.)
-        marked = getattr(target, 'hunters_mark', None) == player or getattr(target, 'vendetta_from', None) == player
-        if marked:
-            base_damage = int(base_damage * 1.5)
-            await player.send(f"{c['bright_yellow']}MARKED! Your shot finds its mark with deadly precision!{c['reset']}")
-        
-        await player.send(f"{c['bright_green']}Your marked shot strikes {target.name}! [{base_damage}]{c['reset']}")
-        await target.take_damage(base_damage, player)
-
-    @classmethod
-    async def cmd_hunters_mark(cls, player: 'Player', args: List[str]):
-        """Mark target as prey. +10% damage, +5 Focus per hit. Free. Ranger only."""
-        c = player.config.COLORS
-
-        if player.char_class.lower() != 'ranger':
-            await player.send(f"{c['red']}Only rangers can use Hunter's Mark!{c['reset']}")
-            return
-
-        target = None
-        if args:
-            target = player.find_target_in_room(' '.join(args))
-        elif player.is_fighting:
-            target = player.fighting
-        if not target:
-            await player.send(f"{c['yellow']}Mark whom as prey?{c['reset']}")
-            return
-
-        # Clear old mark
-        old_mark = getattr(player, 'hunters_mark_target', None)
-        if old_mark == target:
-            player.hunters_mark_target = None
-            await player.send(f"{c['yellow']}You remove your mark from {target.name}.{c['reset']}")
-            return
-
-        player.hunters_mark_target = target
-        # Predator's Mark talent: also reduces armor
-        armor_msg = ""
-        try:
-            from talents import TalentManager
-            if TalentManager.get_talent_rank(player, 'predators_mark') > 0:
-                armor_msg = f" Their armor is weakened!"
-        except Exception:
-            pass
-
-        await player.send(f"{c['bright_yellow']}🎯 You mark {target.name} as your prey! +10% damage, +5 Focus per hit.{armor_msg}{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name} marks {target.name} as prey.", exclude=[player])
-
-    @classmethod
-    async def cmd_ambush(cls, player: 'Player', args: List[str]):
-        """Launch a devastating attack from hiding."""
-        c = player.config.COLORS
-        import random
-        
-        if 'ambush' not in player.skills:
-            await player.send(f"{c['red']}You don't know how to ambush!{c['reset']}")
-            return
-        
-        # Must be hidden
-        is_hidden = 'hidden' in player.flags or (hasattr(player, 'affects') and 'hide' in player.affects)
-        if not is_hidden:
-            is_hidden = hasattr(player, 'affects') and 'camouflage' in player.affects
-        
-        if not is_hidden:
-            await player.send(f"{c['red']}You must be hidden to ambush!{c['reset']}")
-            return
-        
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send(f"{c['yellow']}Ambush whom?{c['reset']}")
-                return
-        
-        target_name = ' '.join(args).lower()
-        target = None
-        
-        from mobs import Mobile
-        for char in player.room.characters:
-            if char != player and target_name in char.name.lower():
-                target = char
-                break
-        
-        if not target:
-            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
-            return
-        
-        if target.is_fighting:
-            await player.send(f"{c['red']}{target.name} is too alert to ambush!{c['reset']}")
-            return
-        
-        skill_level = player.get_skill_level('ambush')
-        
-        # Remove hidden status
-        player.flags.discard('hidden')
-        from affects import AffectManager
-        AffectManager.remove_affect_by_name(player, 'hide')
-        AffectManager.remove_affect_by_name(player, 'camouflage')
-        
-        if random.randint(1, 100) <= skill_level:
-            # Ambush damage: 2.5x weapon damage
-            weapon = player.equipment.get('wield')
-            if weapon and hasattr(weapon, 'damage_dice'):
-                from combat import CombatHandler
-                base_damage = CombatHandler.roll_dice(weapon.damage_dice)
-            else:
-                base_damage = random.randint(2, 8)
-            
-            # Bonus damage if tracking this target
-            tracking_bonus = 1.15 if player.tracking_target and player.tracking_target in target.name.lower() else 1.0
-            
-            damage = int(base_damage * 2.5 * tracking_bonus) + player.get_damage_bonus() * 2
-            
-            await player.send(f"{c['bright_green']}You ambush {target.name} from the shadows! [{damage}]{c['reset']}")
-            if hasattr(target, 'send'):
-                await target.send(f"{c['bright_red']}{player.name} ambushes you from hiding! [{damage}]{c['reset']}")
-            await player.room.send_to_room(
-                f"{player.name} leaps from concealment, ambushing {target.name}!",
-                exclude=[player, target]
-            )
-            
-            killed = await target.take_damage(damage, player)
-            if killed:
-                from combat import CombatHandler
-                await CombatHandler.handle_death(player, target)
-            else:
-                from combat import CombatHandler
-                await CombatHandler.start_combat(player, target)
-        else:
-            await player.send(f"{c['yellow']}Your ambush fails! {target.name} spots you!{c['reset']}")
-            from combat import CombatHandler
-            await CombatHandler.start_combat(player, target)
-
-    # ==================== PALADIN AURA & HOLY POWER SYSTEM ====================
-    
-    @classmethod
-    async def cmd_aura(cls, player: 'Player', args: List[str]):
-        """Activate or view paladin auras."""
-        c = player.config.COLORS
-        
-        if player.char_class.lower() != 'paladin':
-            await player.send(f"{c['red']}Only paladins can use auras!{c['reset']}")
-            return
-        
-        auras = {
-            'devotion': {
-                'name': 'Devotion Aura',
-                'desc': '+15 AC to all allies in room',
-                'effect': 'ac',
-                'value': -15,
-                'level': 5
-            },
-            'protection': {
-                'name': 'Protection Aura', 
-                'desc': '+10% damage reduction to all allies',
-                'effect': 'damage_reduction',
-                'value': 10,
-                'level': 12
-            },
-            'retribution': {
-                'name': 'Retribution Aura',
-                'desc': 'Enemies take damage when they hit allies',
-                'effect': 'thorns',
-                'value': 5,
-                'level': 20
-            }
-        }
-        
-        if not args:
-            await player.send(f"{c['bright_yellow']}╔══════════════════════════════════════════════════╗{c['reset']}")
-            await player.send(f"{c['bright_yellow']}║  ✟ PALADIN AURAS ✟                               {c['bright_yellow']}║{c['reset']}")
-            await player.send(f"{c['bright_yellow']}╠══════════════════════════════════════════════════╣{c['reset']}")
-            
-            current = player.active_aura
-            if current:
-                await player.send(f"{c['bright_yellow']}║ {c['bright_green']}Active: {auras[current]['name']}{c['reset']}")
-            else:
-                await player.send(f"{c['bright_yellow']}║ {c['yellow']}No aura active{c['reset']}")
-            
-            await player.send(f"{c['bright_yellow']}╠══════════════════════════════════════════════════╣{c['reset']}")
-            for key, data in auras.items():
-                active = " ✓" if key == current else ""
-                locked = f" (Lvl {data['level']})" if player.level < data['level'] else ""
-                await player.send(f"{c['bright_yellow']}║ {c['cyan']}{data['name']}{active}{locked}{c['reset']}")
-                await player.send(f"{c['bright_yellow']}║   {c['white']}{data['desc']}{c['reset']}")
-            await player.send(f"{c['bright_yellow']}╚══════════════════════════════════════════════════╝{c['reset']}")
-            return
-        
-        aura_input = args[0].lower()
-        
-        if aura_input == 'off' or aura_input == 'none':
-            if player.active_aura:
-                await player.send(f"{c['cyan']}You deactivate your {auras[player.active_aura]['name']}.{c['reset']}")
-                player.active_aura = None
-            else:
-                await player.send(f"{c['yellow']}You have no aura active.{c['reset']}")
-            return
-        
-        # Match aura
-        matched = None
-        for key in auras:
-            if key.startswith(aura_input):
-                matched = key
-                break
-        
-        if not matched:
-            await player.send(f"{c['red']}Unknown aura. Try: devotion, protection, retribution, off{c['reset']}")
-            return
-        
-        aura_data = auras[matched]
-        
-        if player.level < aura_data['level']:
-            await player.send(f"{c['red']}You need level {aura_data['level']} to use {aura_data['name']}!{c['reset']}")
-            return
-        
-        player.active_aura = matched
-        
-        await player.send(f"{c['bright_yellow']}✟ You activate {aura_data['name']}! ✟{c['reset']}")
-        await player.send(f"{c['cyan']}{aura_data['desc']}{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(
-                f"A holy aura emanates from {player.name}.",
-                exclude=[player]
-            )
-    
-    @classmethod
-    async def cmd_smite(cls, player: 'Player', args: List[str]):
-        """Smite an enemy with holy power."""
-        c = player.config.COLORS
-        import time
-        import random
-        
-        if player.char_class.lower() != 'paladin':
-            await player.send(f"{c['red']}Only paladins can smite!{c['reset']}")
-            return
-        
-        if not player.is_fighting:
-            await player.send(f"{c['red']}You must be fighting to smite!{c['reset']}")
-            return
-        
-        # Check cooldown (20 seconds)
-        now = time.time()
-        if now - player.last_smite < 20:
-            remaining = int(20 - (now - player.last_smite))
-            await player.send(f"{c['yellow']}Smite is on cooldown! ({remaining}s){c['reset']}")
-            return
-        
-        if player.mana < 25:
-            await player.send(f"{c['red']}You need 25 mana to smite!{c['reset']}")
-            return
-        
-        player.mana -= 25
-        player.last_smite = now
-        
-        target = player.fighting
-        
-        # Base damage + bonus vs evil/undead
-        base_damage = random.randint(10, 20) + player.level
-        smite_bonus = player.get_equipment_bonus('smite') + player.get_equipment_bonus('holy_smite')
-        if smite_bonus:
-            base_damage += int(base_damage * (smite_bonus / 100))
-        
-        # Check if target is undead or evil (by keywords or flags)
-        is_evil = False
-        evil_keywords = ['undead', 'demon', 'devil', 'skeleton', 'zombie', 'vampire', 'lich', 'ghost', 'wraith', 'evil']
-        for kw in evil_keywords:
-            if kw in target.name.lower():
-                is_evil = True
-                break
-        
-        if is_evil:
-            damage = int(base_damage * 2.5)  # 2.5x vs evil
-            await player.send(f"{c['bright_yellow']}✟ Your smite burns {target.name} with holy fire! ✟ [{damage}]{c['reset']}")
-        else:
-            damage = base_damage
-            await player.send(f"{c['bright_yellow']}✟ You smite {target.name}! [{damage}]{c['reset']}")
-        
-        if hasattr(target, 'send'):
-            await target.send(f"{c['bright_yellow']}{player.name} smites you with holy power!{c['reset']}")
-        
-        await player.room.send_to_room(
-            f"{player.name} smites {target.name} with divine power!",
-            exclude=[player, target]
-        )
-        
-        killed = await target.take_damage(damage, player)
-        if killed:
-            from combat import CombatHandler
-            await CombatHandler.handle_death(player, target)
-    
-    @classmethod
-    async def cmd_layhands(cls, player: 'Player', args: List[str]):
-        """Use lay on hands to heal yourself or an ally."""
-        c = player.config.COLORS
-        
-        if player.char_class.lower() != 'paladin':
-            await player.send(f"{c['red']}Only paladins can use lay on hands!{c['reset']}")
-            return
-        
-        if player.lay_hands_used:
-            await player.send(f"{c['yellow']}You have already used lay on hands today. Rest to restore it.{c['reset']}")
-            return
-        
-        target = player
-        
-        if args:
-            target_name = ' '.join(args).lower()
-            for char in player.room.characters:
-                from mobs import Mobile
-                if not isinstance(char, Mobile) and target_name in char.name.lower():
-                    target = char
-                    break
-        
-        # Heal amount: 50% of paladin max HP
-        heal_amount = player.max_hp // 2
-        old_hp = target.hp
-        target.hp = min(target.max_hp, target.hp + heal_amount)
-        actual_heal = target.hp - old_hp
-        
-        player.lay_hands_used = True
-        
-        if target == player:
-            await player.send(f"{c['bright_yellow']}✟ You lay hands upon yourself, healing {actual_heal} HP! ✟{c['reset']}")
-            await player.room.send_to_room(
-                f"Divine light surrounds {player.name} as they heal themselves.",
-                exclude=[player]
-            )
-        else:
-            await player.send(f"{c['bright_yellow']}✟ You lay hands upon {target.name}, healing {actual_heal} HP! ✟{c['reset']}")
-            await target.send(f"{c['bright_yellow']}{player.name} lays hands upon you, healing {actual_heal} HP!{c['reset']}")
-            await player.room.send_to_room(
-                f"Divine light flows from {player.name} to {target.name}.",
-                exclude=[player, target]
-            )
-
-    # ==================== THIEF COMBO POINT SYSTEM ====================
-    
-    @classmethod
-    async def cmd_combo(cls, player: 'Player', args: List[str]):
-        """View current combo points."""
-        c = player.config.COLORS
-        
-        if player.char_class.lower() != 'thief':
-            await player.send(f"{c['red']}Only thieves use combo points!{c['reset']}")
-            return
-        
-        cp = player.combo_points
-        cp_bar = "●" * cp + "○" * (5 - cp)
-        target_name = player.combo_target.name if player.combo_target else "none"
-        
-        await player.send(f"{c['bright_yellow']}Combo Points: {c['bright_red']}{cp_bar}{c['white']} ({cp}/5) on {target_name}{c['reset']}")
-        await player.send(f"{c['cyan']}Finishers: eviscerate (5), kidney_shot (4), slice_dice (3){c['reset']}")
-    
-    @classmethod
-    async def cmd_eviscerate(cls, player: 'Player', args: List[str]):
-        """Powerful finisher that consumes all combo points."""
-        c = player.config.COLORS
-        import random
-        
-        if player.char_class.lower() != 'thief':
-            await player.send(f"{c['red']}Only thieves can eviscerate!{c['reset']}")
-            return
-        
-        if not player.is_fighting:
-            await player.send(f"{c['red']}You must be fighting to eviscerate!{c['reset']}")
-            return
-        
-        if player.combo_points < 1:
-            await player.send(f"{c['red']}You need at least 1 combo point!{c['reset']}")
-            return
-        
-        target = player.fighting
-        
-        # Damage scales with combo points
-        weapon = player.equipment.get('wield')
-        if weapon and hasattr(weapon, 'damage_dice'):
-            from combat import CombatHandler
-            base_damage = CombatHandler.roll_dice(weapon.damage_dice)
-        else:
-            base_damage = random.randint(2, 8)
-        
-        # Each combo point adds 50% damage
-        multiplier = 1 + (player.combo_points * 0.5)
-        damage = int(base_damage * multiplier) + player.get_damage_bonus()
-        
-        await player.send(f"{c['bright_red']}You eviscerate {target.name}! [{damage}] ({player.combo_points} combo points){c['reset']}")
-        if hasattr(target, 'send'):
-            await target.send(f"{c['bright_red']}{player.name} eviscerates you!{c['reset']}")
-        
-        player.combo_points = 0
-        player.combo_target = None
-        
-        killed = await target.take_damage(damage, player)
-        if killed:
-            from combat import CombatHandler
-            await CombatHandler.handle_death(player, target)
-    
-    @classmethod
-    async def cmd_kidneyshot(cls, player: 'Player', args: List[str]):
-        """Stun finisher that uses 4+ combo points."""
-        c = player.config.COLORS
-        
-        if player.char_class.lower() != 'thief':
-            await player.send(f"{c['red']}Only thieves can use kidney shot!{c['reset']}")
-            return
-        
-        if not player.is_fighting:
-            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
-            return
-        
-        if player.combo_points < 4:
-            await player.send(f"{c['red']}You need at least 4 combo points for kidney shot!{c['reset']}")
-            return
-        
-        target = player.fighting
-        
-        # Stun duration based on combo points
-        stun_duration = 1 + (player.combo_points - 4)  # 1-2 ticks
-        
-        from affects import AffectManager
-        affect_data = {
-            'name': 'kidney_shot',
-            'type': AffectManager.TYPE_FLAG,
-            'applies_to': 'stunned',
-            'value': 1,
-            'duration': stun_duration,
-            'caster_level': player.level
-        }
-        AffectManager.apply_affect(target, affect_data)
-        target.position = 'stunned'
-        
-        await player.send(f"{c['bright_yellow']}You kidney shot {target.name}! Stunned for {stun_duration} ticks!{c['reset']}")
-        if hasattr(target, 'send'):
-            await target.send(f"{c['bright_red']}{player.name} kidney shots you! You're stunned!{c['reset']}")
-        
-        player.combo_points = 0
-        player.combo_target = None
-    
-    @classmethod 
-    async def cmd_slicedice(cls, player: 'Player', args: List[str]):
-        """DoT finisher that uses 3+ combo points."""
-        c = player.config.COLORS
-        
-        if player.char_class.lower() != 'thief':
-            await player.send(f"{c['red']}Only thieves can use slice and dice!{c['reset']}")
-            return
-        
-        if not player.is_fighting:
-            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
-            return
-        
-        if player.combo_points < 3:
-            await player.send(f"{c['red']}You need at least 3 combo points for slice and dice!{c['reset']}")
-            return
-        
-        target = player.fighting
-        
-        # Bleed duration based on combo points
-        bleed_duration = player.combo_points
-        bleed_damage = 3 + (player.level // 5)
-        
-        from affects import AffectManager
-        affect_data = {
-            'name': 'slice_dice',
-            'type': AffectManager.TYPE_DOT,
-            'applies_to': 'hp',
-            'value': bleed_damage,
-            'duration': bleed_duration,
-            'caster_level': player.level
-        }
-        AffectManager.apply_affect(target, affect_data)
-        
-        await player.send(f"{c['bright_red']}You slice and dice {target.name}! Bleeding for {bleed_damage}/tick for {bleed_duration} ticks!{c['reset']}")
-        if hasattr(target, 'send'):
-            await target.send(f"{c['bright_red']}{player.name} slices you! You're bleeding!{c['reset']}")
-        
-        player.combo_points = 0
-        player.combo_target = None
-
-    # ==================== CLERIC DIVINE FAVOR SYSTEM ====================
-    
-    @classmethod
-    async def cmd_turnundead(cls, player: 'Player', args: List[str]):
-        """Turn undead creatures, causing fear or destroying weak ones."""
-        c = player.config.COLORS
-        import time
-        import random
-        
-        if player.char_class.lower() not in ('cleric', 'paladin'):
-            await player.send(f"{c['red']}Only clerics and paladins can turn undead!{c['reset']}")
-            return
-        
-        # Check cooldown (30 seconds)
-        now = time.time()
-        if now - player.last_turn_undead < 30:
-            remaining = int(30 - (now - player.last_turn_undead))
-            await player.send(f"{c['yellow']}Turn Undead is on cooldown! ({remaining}s){c['reset']}")
-            return
-        
-        if player.mana < 20:
-            await player.send(f"{c['red']}You need 20 mana to turn undead!{c['reset']}")
-            return
-        
-        player.mana -= 20
-        player.last_turn_undead = now
-        
-        await player.send(f"{c['bright_yellow']}✟ You raise your holy symbol and invoke divine power! ✟{c['reset']}")
-        await player.room.send_to_room(
-            f"{player.name} raises a holy symbol, radiating divine light!",
-            exclude=[player]
-        )
-        
-        from mobs import Mobile
-        from affects import AffectManager
-        
-        undead_keywords = ['undead', 'skeleton', 'zombie', 'vampire', 'lich', 'ghost', 'wraith', 'ghoul', 'wight', 'specter']
-        
-        turned = 0
-        destroyed = 0
-        
-        for char in list(player.room.characters):
-            if not isinstance(char, Mobile):
-                continue
-            
-            is_undead = False
-            for kw in undead_keywords:
-                if kw in char.name.lower():
-                    is_undead = True
-                    break
-            
-            if not is_undead:
-                continue
-            
-            # Check if destroyed (weak undead) or turned (strong)
-            level_diff = player.level - char.level
-            
-            if level_diff >= 5:
-                # Destroy weak undead
-                destroyed += 1
-                await player.send(f"{c['bright_yellow']}{char.name} is destroyed by holy power!{c['reset']}")
-                
-                # Remove from room and world
-                if char in player.room.characters:
-                    player.room.characters.remove(char)
-                if hasattr(player.world, 'npcs') and char in player.world.npcs:
-                    player.world.npcs.remove(char)
-                
-                # Give XP
-                from combat import CombatHandler
-                await CombatHandler.award_experience(player, char)
-            else:
-                # Turn (fear) stronger undead
-                if random.randint(1, 100) <= 70 + (level_diff * 5):
-                    turned += 1
-                    affect_data = {
-                        'name': 'turned',
-                        'type': AffectManager.TYPE_FLAG,
-                        'applies_to': 'feared',
-                        'value': 1,
-                        'duration': 3,
-                        'caster_level': player.level
-                    }
-                    AffectManager.apply_affect(char, affect_data)
-                    await player.send(f"{c['yellow']}{char.name} cowers from your holy power!{c['reset']}")
-        
-        if turned == 0 and destroyed == 0:
-            await player.send(f"{c['cyan']}There are no undead here to turn.{c['reset']}")
-        else:
-            await player.send(f"{c['bright_green']}Turned {turned}, destroyed {destroyed} undead!{c['reset']}")
-            
-            # Gain divine favor
-            if player.char_class.lower() == 'cleric':
-                favor_gain = (turned + destroyed * 2) * 5
-                player.divine_favor = min(100, player.divine_favor + favor_gain)
-                await player.send(f"{c['cyan']}(+{favor_gain} Divine Favor){c['reset']}")
-    
-    @classmethod
-    async def cmd_divinefavor(cls, player: 'Player', args: List[str]):
-        """View current divine favor."""
-        c = player.config.COLORS
-        
-        if player.char_class.lower() != 'cleric':
-            await player.send(f"{c['red']}Only clerics have divine favor!{c['reset']}")
-            return
-        
-        favor_bar = cls._make_bar(player.divine_favor, 100, 20, c['bright_yellow'], c['yellow'])
-        
-        await player.send(f"{c['bright_yellow']}╔══════════════════════════════════════════════════╗{c['reset']}")
-        await player.send(f"{c['bright_yellow']}║  ✟ DIVINE FAVOR ✟                                {c['bright_yellow']}║{c['reset']}")
-        await player.send(f"{c['bright_yellow']}╠══════════════════════════════════════════════════╣{c['reset']}")
-        await player.send(f"{c['bright_yellow']}║ {favor_bar} {player.divine_favor}/100{c['reset']}")
-        await player.send(f"{c['bright_yellow']}╠══════════════════════════════════════════════════╣{c['reset']}")
-        await player.send(f"{c['bright_yellow']}║ {c['cyan']}Gain favor: Heal allies, turn undead{c['reset']}")
-        await player.send(f"{c['bright_yellow']}║ {c['cyan']}Spend favor: holysmite (50), sanctuary (30){c['reset']}")
-        await player.send(f"{c['bright_yellow']}╚══════════════════════════════════════════════════╝{c['reset']}")
-    
-    @classmethod
-    async def cmd_holysmite(cls, player: 'Player', args: List[str]):
-        """Spend divine favor for a powerful holy attack."""
-        c = player.config.COLORS
-        import random
-        
-        if player.char_class.lower() != 'cleric':
-            await player.send(f"{c['red']}Only clerics can use holy smite!{c['reset']}")
-            return
-        
-        if player.divine_favor < 50:
-            await player.send(f"{c['red']}You need 50 divine favor to use holy smite! (Current: {player.divine_favor}){c['reset']}")
-            return
-        
-        if not player.is_fighting:
-            await player.send(f"{c['red']}You must be fighting to smite!{c['reset']}")
-            return
-        
-        player.divine_favor -= 50
-        target = player.fighting
-        
-        damage = random.randint(20, 40) + player.level + (player.wis - 10)
-        
-        await player.send(f"{c['bright_yellow']}✟ You channel divine favor into a devastating holy smite! [{damage}] ✟{c['reset']}")
-        if hasattr(target, 'send'):
-            await target.send(f"{c['bright_yellow']}{player.name} smites you with divine power!{c['reset']}")
-        
-        killed = await target.take_damage(damage, player)
-        if killed:
-            from combat import CombatHandler
-            await CombatHandler.handle_death(player, target)
-
-    # ==================== CLASS REWORK WAVE 1 ABILITIES ====================
-
-    # --- THIEF LUCK ABILITIES ---
-
-    @classmethod
-    async def cmd_pocket_sand(cls, player: 'Player', args: List[str]):
-        """Blind your target with pocket sand. Costs 3 Luck. Thief only."""
-        import time
-        c = player.config.COLORS
-        if player.char_class.lower() != 'thief':
-            await player.send(f"{c['red']}Only thieves can use pocket sand!{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['red']}You must be fighting to use this!{c['reset']}")
-            return
-        now = time.time()
-        if now < getattr(player, 'pocket_sand_cooldown', 0):
-            remaining = int(player.pocket_sand_cooldown - now)
-            await player.send(f"{c['yellow']}Pocket Sand on cooldown ({remaining}s).{c['reset']}")
-            return
-        from talents import TalentManager
-        cost = 3
-        fw_rank = TalentManager.get_talent_rank(player, 'fortune_wheel')
-        cost -= fw_rank // 2
-        cost = max(1, cost)
-        if player.luck_points < cost:
-            await player.send(f"{c['red']}You need {cost} Luck! (Current: {player.luck_points}/10){c['reset']}")
-            return
-        player.luck_points -= cost
-        player.pocket_sand_cooldown = now + 20
-        target = player.fighting
-        blind_rounds = 2
-        dirty_rank = TalentManager.get_talent_rank(player, 'dirty_fighting')
-        blind_rounds += dirty_rank
-        target.blinded_rounds = blind_rounds
-        target.blinded_until = now + blind_rounds * 4
-        await player.send(f"{c['bright_yellow']}You throw sand in {target.name}'s eyes! Blinded for {blind_rounds} rounds!{c['reset']}")
-        if hasattr(target, 'send'):
-            await target.send(f"{c['red']}{player.name} throws sand in your eyes! You can't see!{c['reset']}")
-        await player.room.send_to_room(f"{player.name} throws sand in {target.name}'s face!", exclude=[player, target])
-        # Vanishing act talent
-        if TalentManager.has_talent(player, 'vanishing_act'):
-            player.flags.add('hidden')
-            await player.send(f"{c['cyan']}You vanish into the shadows!{c['reset']}")
-
-    @classmethod
-    async def cmd_low_blow(cls, player: 'Player', args: List[str]):
-        """Stun target for 1 round + weapon damage. Costs 5 Luck. Thief only."""
-        import time
-        c = player.config.COLORS
-        if player.char_class.lower() != 'thief':
-            await player.send(f"{c['red']}Only thieves can use low blow!{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
-            return
-        now = time.time()
-        if now < getattr(player, 'low_blow_cooldown', 0):
-            remaining = int(player.low_blow_cooldown - now)
-            await player.send(f"{c['yellow']}Low Blow on cooldown ({remaining}s).{c['reset']}")
-            return
-        from talents import TalentManager
-        cost = 5
-        fw_rank = TalentManager.get_talent_rank(player, 'fortune_wheel')
-        cost -= fw_rank // 2
-        cost = max(1, cost)
-        if player.luck_points < cost:
-            await player.send(f"{c['red']}You need {cost} Luck! (Current: {player.luck_points}/10){c['reset']}")
-            return
-        player.luck_points -= cost
-        player.low_blow_cooldown = now + 30
-        target = player.fighting
-        from combat import CombatHandler
-        weapon = player.equipment.get('wield')
-        if weapon and hasattr(weapon, 'damage_dice'):
-            damage = CombatHandler.roll_dice(weapon.damage_dice)
-        else:
-            damage = random.randint(1, 6)
-        damage += player.get_damage_bonus()
-        damage = max(1, damage)
-        target.stunned_rounds = 1
-        # Marked man talent
-        if TalentManager.has_talent(player, 'marked_man'):
-            target.marked_man_until = now + 10
-        await player.send(f"{c['bright_red']}You deliver a devastating low blow to {target.name}! [{damage}] STUNNED!{c['reset']}")
-        if hasattr(target, 'send'):
-            await target.send(f"{c['red']}{player.name} hits you below the belt! You're stunned!{c['reset']}")
-        killed = await target.take_damage(damage, player)
-        if killed:
-            await CombatHandler.handle_death(player, target)
-
-    @classmethod
-    async def cmd_rigged_dice(cls, player: 'Player', args: List[str]):
-        """Next 3 attacks are guaranteed crits. Costs 7 Luck. Thief only."""
-        import time
-        c = player.config.COLORS
-        if player.char_class.lower() != 'thief':
-            await player.send(f"{c['red']}Only thieves can use rigged dice!{c['reset']}")
-            return
-        now = time.time()
-        if now < getattr(player, 'rigged_dice_cooldown', 0):
-            remaining = int(player.rigged_dice_cooldown - now)
-            await player.send(f"{c['yellow']}Rigged Dice on cooldown ({remaining}s).{c['reset']}")
-            return
-        from talents import TalentManager
-        cost = 7
-        fw_rank = TalentManager.get_talent_rank(player, 'fortune_wheel')
-        cost -= fw_rank // 2
-        cost = max(1, cost)
-        if player.luck_points < cost:
-            await player.send(f"{c['red']}You need {cost} Luck! (Current: {player.luck_points}/10){c['reset']}")
-            return
-        player.luck_points -= cost
-        player.rigged_dice_cooldown = now + 45
-        player.rigged_dice_hits = 3
-        await player.send(f"{c['bright_yellow']}🎲 You pull out your loaded dice... next 3 attacks are GUARANTEED CRITS!{c['reset']}")
-
-    @classmethod
-    async def cmd_jackpot(cls, player: 'Player', args: List[str]):
-        """Massive damage + steal gold. Costs 10 Luck. Thief only."""
-        import time
-        c = player.config.COLORS
-        if player.char_class.lower() != 'thief':
-            await player.send(f"{c['red']}Only thieves can hit the jackpot!{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
-            return
-        now = time.time()
-        if now < getattr(player, 'jackpot_cooldown', 0):
-            remaining = int(player.jackpot_cooldown - now)
-            await player.send(f"{c['yellow']}Jackpot on cooldown ({remaining}s).{c['reset']}")
-            return
-        from talents import TalentManager
-        cost = 10
-        fw_rank = TalentManager.get_talent_rank(player, 'fortune_wheel')
-        cost -= fw_rank // 2
-        cost = max(1, cost)
-        if player.luck_points < cost:
-            await player.send(f"{c['red']}You need {cost} Luck! (Current: {player.luck_points}/10){c['reset']}")
-            return
-        player.luck_points -= cost
-        player.jackpot_cooldown = now + 60
-        target = player.fighting
-        from combat import CombatHandler
-        weapon = player.equipment.get('wield')
-        if weapon and hasattr(weapon, 'damage_dice'):
-            damage = CombatHandler.roll_dice(weapon.damage_dice) * 4
-        else:
-            damage = random.randint(4, 24)
-        damage += player.get_damage_bonus() * 2
-        damage = max(1, damage)
-        # Steal gold
-        stolen_gold = int(getattr(target, 'gold', 0) * 0.25)
-        if stolen_gold > 0:
-            target.gold -= stolen_gold
-            player.gold += stolen_gold
-        # Jackpot master talent
-        if TalentManager.has_talent(player, 'jackpot_master'):
-            target.stunned_rounds = getattr(target, 'stunned_rounds', 0) + 1
-            heal = int(player.max_hp * 0.10)
-            player.hp = min(player.max_hp, player.hp + heal)
-            await player.send(f"{c['bright_green']}Jackpot Master! Stun + heal {heal} HP!{c['reset']}")
-        # Grand heist talent
-        if TalentManager.has_talent(player, 'grand_heist') and hasattr(target, 'inventory') and target.inventory:
-            stolen_item = random.choice(target.inventory)
-            target.inventory.remove(stolen_item)
-            player.inventory.append(stolen_item)
-            await player.send(f"{c['bright_cyan']}Grand Heist! You stole {stolen_item.short_desc}!{c['reset']}")
-        await player.send(f"{c['bright_yellow']}💰💰💰 JACKPOT! You devastate {target.name} for [{damage}] damage!{c['reset']}")
-        if stolen_gold > 0:
-            await player.send(f"{c['yellow']}You steal {stolen_gold} gold coins!{c['reset']}")
-        if hasattr(target, 'send'):
-            await target.send(f"{c['red']}{player.name} hits the JACKPOT on you! [{damage}]{c['reset']}")
-        killed = await target.take_damage(damage, player)
-        if killed:
-            await CombatHandler.handle_death(player, target)
-
-    # --- NECROMANCER SOUL SHARD ABILITIES ---
-
-    @classmethod
-    async def cmd_soul_bolt(cls, player: 'Player', args: List[str]):
-        """Shadow damage bolt. Costs 2 Soul Shards. Necromancer only."""
-        import time
-        c = player.config.COLORS
-        if player.char_class.lower() != 'necromancer':
-            await player.send(f"{c['red']}Only necromancers can use soul bolt!{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
-            return
-        now = time.time()
-        if now < getattr(player, 'soul_bolt_cooldown', 0):
-            remaining = int(player.soul_bolt_cooldown - now)
-            await player.send(f"{c['yellow']}Soul Bolt on cooldown ({remaining}s).{c['reset']}")
-            return
-        if player.soul_shards < 2:
-            await player.send(f"{c['red']}You need 2 Soul Shards! (Current: {player.soul_shards}/10){c['reset']}")
-            return
-        player.soul_shards -= 2
-        player.soul_bolt_cooldown = now + 10
-        target = player.fighting
-        spell_damage = (player.int * 3 + player.level * 2) * 2
-        # Shard passive: +5% per shard held
-        shard_bonus = 1.0 + (player.soul_shards * 0.05)
-        spell_damage = int(spell_damage * shard_bonus)
-        await player.send(f"{c['bright_magenta']}A bolt of shadow energy strikes {target.name}! [{spell_damage}]{c['reset']}")
-        if hasattr(target, 'send'):
-            await target.send(f"{c['magenta']}{player.name} blasts you with shadow energy! [{spell_damage}]{c['reset']}")
-        killed = await target.take_damage(spell_damage, player)
-        if killed:
-            from combat import CombatHandler
-            await CombatHandler.handle_death(player, target)
-
-    @classmethod
-    async def cmd_drain_soul(cls, player: 'Player', args: List[str]):
-        """Drain HP from target. Costs 3 Shards. Necromancer only."""
-        import time
-        c = player.config.COLORS
-        if player.char_class.lower() != 'necromancer':
-            await player.send(f"{c['red']}Only necromancers can drain souls!{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
-            return
-        now = time.time()
-        if now < getattr(player, 'drain_soul_cooldown', 0):
-            remaining = int(player.drain_soul_cooldown - now)
-            await player.send(f"{c['yellow']}Drain Soul on cooldown ({remaining}s).{c['reset']}")
-            return
-        if player.soul_shards < 3:
-            await player.send(f"{c['red']}You need 3 Soul Shards! (Current: {player.soul_shards}/10){c['reset']}")
-            return
-        player.soul_shards -= 3
-        player.drain_soul_cooldown = now + 15
-        target = player.fighting
-        spell_damage = int((player.int * 3 + player.level * 2) * 1.5)
-        shard_bonus = 1.0 + (player.soul_shards * 0.05)
-        spell_damage = int(spell_damage * shard_bonus)
-        heal = spell_damage
-        player.hp = min(player.max_hp, player.hp + heal)
-        await player.send(f"{c['bright_magenta']}You drain the soul of {target.name}! [{spell_damage}] Healed {heal} HP!{c['reset']}")
-        if hasattr(target, 'send'):
-            await target.send(f"{c['magenta']}{player.name} drains your life force! [{spell_damage}]{c['reset']}")
-        killed = await target.take_damage(spell_damage, player)
-        if killed:
-            from combat import CombatHandler
-            await CombatHandler.handle_death(player, target)
-
-    @classmethod
-    async def cmd_bone_shield(cls, player: 'Player', args: List[str]):
-        """Absorb next 3 hits. Costs 4 Shards. Necromancer only."""
-        import time
-        c = player.config.COLORS
-        if player.char_class.lower() != 'necromancer':
-            await player.send(f"{c['red']}Only necromancers can use bone shield!{c['reset']}")
-            return
-        now = time.time()
-        if now < getattr(player, 'bone_shield_cooldown', 0):
-            remaining = int(player.bone_shield_cooldown - now)
-            await player.send(f"{c['yellow']}Bone Shield on cooldown ({remaining}s).{c['reset']}")
-            return
-        if player.soul_shards < 4:
-            await player.send(f"{c['red']}You need 4 Soul Shards! (Current: {player.soul_shards}/10){c['reset']}")
-            return
-        player.soul_shards -= 4
-        player.bone_shield_cooldown = now + 60
-        player.bone_shield_charges = 3
-        player.bone_shield_until = now + 60
-        from talents import TalentManager
-        absorb = 750 if TalentManager.has_talent(player, 'bone_armor_mastery') else 500
-        player.bone_shield_absorb = absorb
-        await player.send(f"{c['bright_cyan']}Bones swirl around you forming a shield! (3 charges, {absorb} absorb each){c['reset']}")
-        await player.room.send_to_room(f"Bones swirl around {player.name} forming a protective shield!", exclude=[player])
-
-    @classmethod
-    async def cmd_soul_reap(cls, player: 'Player', args: List[str]):
-        """Execute target below 25% HP or massive damage. Costs 8 Shards. Necromancer only."""
-        import time
-        c = player.config.COLORS
-        if player.char_class.lower() != 'necromancer':
-            await player.send(f"{c['red']}Only necromancers can reap souls!{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
-            return
-        now = time.time()
-        if now < getattr(player, 'soul_reap_cooldown', 0):
-            remaining = int(player.soul_reap_cooldown - now)
-            await player.send(f"{c['yellow']}Soul Reap on cooldown ({remaining}s).{c['reset']}")
-            return
-        if player.soul_shards < 8:
-            await player.send(f"{c['red']}You need 8 Soul Shards! (Current: {player.soul_shards}/10){c['reset']}")
-            return
-        player.soul_shards -= 8
-        player.soul_reap_cooldown = now + 90
-        target = player.fighting
-        hp_pct = (target.hp / target.max_hp * 100) if target.max_hp > 0 else 100
-        is_boss = getattr(target, 'is_boss', False) or ('boss' in getattr(target, 'flags', set()))
-        if hp_pct <= 25 and not is_boss:
-            await player.send(f"{c['bright_red']}💀 SOUL REAPED! {target.name}'s soul is torn from their body!{c['reset']}")
-            if hasattr(target, 'send'):
-                await target.send(f"{c['bright_red']}{player.name} reaps your very soul!{c['reset']}")
-            target.hp = 0
-            from combat import CombatHandler
-            await CombatHandler.handle_death(player, target)
-        else:
-            spell_damage = (player.int * 3 + player.level * 2) * 4
-            shard_bonus = 1.0 + (player.soul_shards * 0.05)
-            spell_damage = int(spell_damage * shard_bonus)
-            await player.send(f"{c['bright_magenta']}You attempt to reap {target.name}'s soul! [{spell_damage}]{c['reset']}")
-            if hasattr(target, 'send'):
-                await target.send(f"{c['magenta']}{player.name} unleashes dark energy upon you! [{spell_damage}]{c['reset']}")
-            killed = await target.take_damage(spell_damage, player)
-            if killed:
-                from combat import CombatHandler
-                await CombatHandler.handle_death(player, target)
-
-    # --- PALADIN HOLY POWER ABILITIES ---
-
-    @classmethod
-    async def cmd_templars_verdict(cls, player: 'Player', args: List[str]):
-        """Powerful holy strike. Costs 3 Holy Power. Paladin only."""
-        c = player.config.COLORS
-        if player.char_class.lower() != 'paladin':
-            await player.send(f"{c['red']}Only paladins can use Templar's Verdict!{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
-            return
-        if player.holy_power < 3:
-            await player.send(f"{c['red']}You need 3 Holy Power! (Current: {player.holy_power}/5){c['reset']}")
-            return
-        from combat import CombatHandler
-        from talents import TalentManager
-        spent = player.holy_power
-        player.holy_power = 0  # Spend all
-        target = player.fighting
-        weapon = player.equipment.get('wield')
-        if weapon and hasattr(weapon, 'damage_dice'):
-            damage = CombatHandler.roll_dice(weapon.damage_dice)
-        else:
-            damage = random.randint(2, 8)
-        multiplier = 2.0
-        # Sanctified wrath: at 5 holy power, 3x instead of 2x
-        if spent >= 5 and TalentManager.has_talent(player, 'sanctified_wrath'):
-            multiplier = 3.0
-        # Sanctity of battle talent
-        sob_rank = TalentManager.get_talent_rank(player, 'sanctity_of_battle')
-        multiplier += sob_rank * 0.03
-        damage = int(damage * multiplier) + player.get_damage_bonus()
-        # Holy bonus from wis
-        damage += player.wis // 2
-        # Oath vengeance bonus
-        if getattr(player, 'active_oath', None) == 'vengeance':
-            damage = int(damage * 1.15)
-        elif getattr(player, 'active_oath', None) == 'justice':
-            damage = int(damage * 1.10)
-        damage = max(1, damage)
-        await player.send(f"{c['bright_yellow']}⚔️ Templar's Verdict strikes {target.name}! [{damage}]{c['reset']}")
-        if hasattr(target, 'send'):
-            await target.send(f"{c['bright_yellow']}{player.name} delivers divine judgment upon you! [{damage}]{c['reset']}")
-        killed = await target.take_damage(damage, player)
-        if killed:
-            await CombatHandler.handle_death(player, target)
-
-    @classmethod
-    async def cmd_word_of_glory(cls, player: 'Player', args: List[str]):
-        """Heal self for 30% max HP. Costs 3 Holy Power. Paladin only."""
-        c = player.config.COLORS
-        if player.char_class.lower() != 'paladin':
-            await player.send(f"{c['red']}Only paladins can use Word of Glory!{c['reset']}")
-            return
-        if player.holy_power < 3:
-            await player.send(f"{c['red']}You need 3 Holy Power! (Current: {player.holy_power}/5){c['reset']}")
-            return
-        from talents import TalentManager
-        player.holy_power -= 3
-        heal_pct = 0.30
-        hl_rank = TalentManager.get_talent_rank(player, 'healing_light')
-        heal_pct += hl_rank * 0.05
-        if getattr(player, 'active_oath', None) == 'devotion':
-            heal_pct *= 1.20
-        elif getattr(player, 'active_oath', None) == 'vengeance':
-            heal_pct *= 0.90
-        elif getattr(player, 'active_oath', None) == 'justice':
-            heal_pct *= 1.10
-        heal = int(player.max_hp * heal_pct)
-        player.hp = min(player.max_hp, player.hp + heal)
-        await player.send(f"{c['bright_green']}✨ Word of Glory heals you for {heal} HP! [{player.hp}/{player.max_hp}]{c['reset']}")
-        await player.room.send_to_room(f"A golden light surrounds {player.name}, healing their wounds.", exclude=[player])
-
-    @classmethod
-    async def cmd_divine_storm(cls, player: 'Player', args: List[str]):
-        """AoE holy damage. Costs 5 Holy Power. Paladin only. 30s CD."""
-        import time
-        c = player.config.COLORS
-        if player.char_class.lower() != 'paladin':
-            await player.send(f"{c['red']}Only paladins can use Divine Storm!{c['reset']}")
-            return
-        now = time.time()
-        if now < getattr(player, 'divine_storm_cooldown', 0):
-            remaining = int(player.divine_storm_cooldown - now)
-            await player.send(f"{c['yellow']}Divine Storm on cooldown ({remaining}s).{c['reset']}")
-            return
-        if player.holy_power < 5:
-            await player.send(f"{c['red']}You need 5 Holy Power! (Current: {player.holy_power}/5){c['reset']}")
-            return
-        player.holy_power = 0
-        player.divine_storm_cooldown = now + 30
-        from combat import CombatHandler
-        weapon = player.equipment.get('wield')
-        if weapon and hasattr(weapon, 'damage_dice'):
-            base_damage = CombatHandler.roll_dice(weapon.damage_dice)
-        else:
-            base_damage = random.randint(2, 8)
-        damage = int(base_damage * 1.5) + player.get_damage_bonus()
-        damage = max(1, damage)
-        await player.send(f"{c['bright_yellow']}⚡ Divine Storm! Holy energy radiates outward!{c['reset']}")
-        await player.room.send_to_room(f"{player.name} unleashes a divine storm!", exclude=[player])
-        enemies = [ch for ch in player.room.characters if ch.fighting == player and ch != player]
-        if player.fighting and player.fighting not in enemies:
-            enemies.append(player.fighting)
-        for enemy in enemies:
-            if hasattr(enemy, 'send'):
-                await enemy.send(f"{c['bright_yellow']}{player.name}'s divine storm hits you! [{damage}]{c['reset']}")
-            await player.send(f"{c['green']}Divine Storm hits {enemy.name}! [{damage}]{c['reset']}")
-            killed = await enemy.take_damage(damage, player)
-            if killed:
-                await CombatHandler.handle_death(player, enemy)
-
-    @classmethod
-    async def cmd_oath(cls, player: 'Player', args: List[str]):
-        """Swear a paladin oath. Usage: oath vengeance|devotion|justice"""
-        c = player.config.COLORS
-        if player.char_class.lower() != 'paladin':
-            await player.send(f"{c['red']}Only paladins can swear oaths!{c['reset']}")
-            return
-        if not args:
-            current = getattr(player, 'active_oath', None) or 'none'
-            await player.send(f"{c['cyan']}Current oath: {c['bright_yellow']}{current}{c['reset']}")
-            await player.send(f"{c['white']}Usage: oath vengeance|devotion|justice{c['reset']}")
-            await player.send(f"{c['white']}  Vengeance: +15% dmg, -10% healing, faster Holy Power from hits{c['reset']}")
-            await player.send(f"{c['white']}  Devotion: +20% healing, +10% DR, Holy Power from heals{c['reset']}")
-            await player.send(f"{c['white']}  Justice: +10% dmg, +10% healing, balanced generation{c['reset']}")
-            return
-        oath = args[0].lower()
-        if oath not in ('vengeance', 'devotion', 'justice'):
-            await player.send(f"{c['red']}Valid oaths: vengeance, devotion, justice{c['reset']}")
-            return
-        if player.active_oath == oath:
-            await player.send(f"{c['yellow']}You have already sworn the Oath of {oath.title()}.{c['reset']}")
-            return
-        player.holy_power = 0  # Switching costs all holy power
-        player.active_oath = oath
-        await player.send(f"{c['bright_yellow']}✟ You swear the Oath of {oath.title()}! Holy Power reset to 0.{c['reset']}")
-        await player.room.send_to_room(f"{player.name} swears the Oath of {oath.title()}!", exclude=[player])
-
-    # --- CLERIC FAITH ABILITIES ---
-
-    @classmethod
-    async def cmd_divine_word(cls, player: 'Player', args: List[str]):
-        """AoE group heal. Costs 3 Faith. Cleric only. 20s CD."""
-        import time
-        c = player.config.COLORS
-        if player.char_class.lower() != 'cleric':
-            await player.send(f"{c['red']}Only clerics can use Divine Word!{c['reset']}")
-            return
-        now = time.time()
-        if now < getattr(player, 'divine_word_cooldown', 0):
-            remaining = int(player.divine_word_cooldown - now)
-            await player.send(f"{c['yellow']}Divine Word on cooldown ({remaining}s).{c['reset']}")
-            return
-        if player.faith < 3:
-            await player.send(f"{c['red']}You need 3 Faith! (Current: {player.faith}/10){c['reset']}")
-            return
-        player.faith -= 3
-        player.divine_word_cooldown = now + 20
-        heal_pct = 0.15
-        if getattr(player, 'shadow_form', False):
-            heal_pct = int(heal_pct * 0.70 * 100) / 100  # -30% healing in shadow form
-        # Heal all group members in room
-        healed = []
-        if player.group:
-            for member in player.group.members:
-                if member.room == player.room:
-                    heal = int(member.max_hp * heal_pct)
-                    member.hp = min(member.max_hp, member.hp + heal)
-                    healed.append((member, heal))
-        else:
-            heal = int(player.max_hp * heal_pct)
-            player.hp = min(player.max_hp, player.hp + heal)
-            healed.append((player, heal))
-        await player.send(f"{c['bright_green']}✨ Divine Word! Healing light fills the room!{c['reset']}")
-        for member, heal in healed:
-            if member == player:
-                await player.send(f"{c['green']}You are healed for {heal} HP!{c['reset']}")
-            else:
-                await player.send(f"{c['green']}{member.name} is healed for {heal} HP!{c['reset']}")
-                if hasattr(member, 'send'):
-                    await member.send(f"{c['bright_green']}{player.name}'s Divine Word heals you for {heal} HP!{c['reset']}")
-
-    @classmethod
-    async def cmd_holy_fire(cls, player: 'Player', args: List[str]):
-        """Massive holy damage + DoT. Costs 5 Faith. Cleric only. 25s CD."""
-        import time
-        c = player.config.COLORS
-        if player.char_class.lower() != 'cleric':
-            await player.send(f"{c['red']}Only clerics can use Holy Fire!{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
-            return
-        now = time.time()
-        if now < getattr(player, 'holy_fire_cooldown', 0):
-            remaining = int(player.holy_fire_cooldown - now)
-            await player.send(f"{c['yellow']}Holy Fire on cooldown ({remaining}s).{c['reset']}")
-            return
-        if player.faith < 5:
-            await player.send(f"{c['red']}You need 5 Faith! (Current: {player.faith}/10){c['reset']}")
-            return
-        player.faith -= 5
-        player.holy_fire_cooldown = now + 25
-        target = player.fighting
-        damage = player.int * 5 + player.level * 3
-        dot_damage = damage // 4  # Each of 4 ticks
-        player.holy_fire_dot_target = target
-        player.holy_fire_dot_ticks = 4
-        player.holy_fire_dot_damage = dot_damage
-        await player.send(f"{c['bright_yellow']}🔥 Holy Fire engulfs {target.name}! [{damage}] + DoT{c['reset']}")
-        if hasattr(target, 'send'):
-            await target.send(f"{c['bright_yellow']}{player.name} engulfs you in holy fire! [{damage}]{c['reset']}")
-        killed = await target.take_damage(damage, player)
-        if killed:
-            from combat import CombatHandler
-            await CombatHandler.handle_death(player, target)
-
-    @classmethod
-    async def cmd_divine_intervention(cls, player: 'Player', args: List[str]):
-        """Make target invulnerable for 8s. Costs 10 Faith. 5min CD."""
-        import time
-        c = player.config.COLORS
-        if player.char_class.lower() != 'cleric':
-            await player.send(f"{c['red']}Only clerics can use Divine Intervention!{c['reset']}")
-            return
-        now = time.time()
-        if now < getattr(player, 'divine_intervention_cooldown', 0):
-            remaining = int(player.divine_intervention_cooldown - now)
-            await player.send(f"{c['yellow']}Divine Intervention on cooldown ({remaining}s).{c['reset']}")
-            return
-        if player.faith < 10:
-            await player.send(f"{c['red']}You need 10 Faith! (Current: {player.faith}/10){c['reset']}")
-            return
-        player.faith -= 10
-        player.divine_intervention_cooldown = now + 300
-        # Target self or named ally
-        target = player
-        if args:
-            target_name = ' '.join(args).lower()
-            for ch in player.room.characters:
-                if hasattr(ch, 'connection') and target_name in ch.name.lower():
-                    target = ch
-                    break
-        target.evasion_until = now + 8  # Reuse evasion mechanism for invulnerability
-        await player.send(f"{c['bright_yellow']}✟ DIVINE INTERVENTION! {target.name} is protected by the divine for 8 seconds!{c['reset']}")
-        if target != player and hasattr(target, 'send'):
-            await target.send(f"{c['bright_yellow']}{player.name} grants you Divine Intervention! You are invulnerable!{c['reset']}")
-        await player.room.send_to_room(f"A blinding light surrounds {target.name}!", exclude=[player, target])
-
-    @classmethod
-    async def cmd_shadowform(cls, player: 'Player', args: List[str]):
-        """Toggle shadow form. Cleric only."""
-        c = player.config.COLORS
-        if player.char_class.lower() != 'cleric':
-            await player.send(f"{c['red']}Only clerics can use Shadowform!{c['reset']}")
-            return
-        player.shadow_form = not getattr(player, 'shadow_form', False)
-        if player.shadow_form:
-            await player.send(f"{c['bright_magenta']}You embrace the shadows... +25% shadow damage, -30% healing. Damage builds Faith.{c['reset']}")
-            await player.room.send_to_room(f"{player.name} shifts into shadow form!", exclude=[player])
-        else:
-            await player.send(f"{c['bright_green']}You return to the light. Normal healing restored.{c['reset']}")
-            await player.room.send_to_room(f"{player.name} returns from the shadows.", exclude=[player])
-
-    # ==================== ITEMS ====================
-    
-    @classmethod
-    async def cmd_get(cls, player: 'Player', args: List[str]):
-        """Pick up an item.
-
-        Usage:
-            get <item>              - Get item from room
-            get all                 - Get all items from room
-            get <item> <container>  - Get item from container
-            get all <container>     - Get all items from container
-            get <item> from <container> - Alternative syntax
-            get all from <container>    - Alternative syntax
-        """
-        if not args:
-            await player.send("Get what?")
-            return
-
-        c = player.config.COLORS
-
-        # Support both "get item container" and "get item from container" syntax
-        # Check if last argument is a container (and no "from" keyword)
-        from_container = False
-        container_name = None
-
-        def find_in_list(items, name):
-            """Find item in list with numbered targeting (e.g., 2.corpse)."""
-            if not name:
-                return None
-            target_number = 1
-            if '.' in name:
-                parts = name.split('.', 1)
-                if parts[0].isdigit():
-                    target_number = int(parts[0])
-                    name = parts[1]
-            matches = []
-            for item in items:
-                if name.lower() in item.name.lower():
-                    matches.append(item)
-            if target_number <= len(matches):
-                return matches[target_number - 1]
-            return None
-
-        if len(args) >= 2 and 'from' not in args:
-            # Check if last argument might be a container
-            potential_container = args[-1].lower()
-            for item in player.inventory + player.room.items:
-                if hasattr(item, 'item_type') and item.item_type == 'container':
-                    if potential_container in item.name.lower() or potential_container in item.short_desc.lower():
-                        from_container = True
-                        container_name = potential_container
-                        # Rebuild item_name without container
-                        item_name = ' '.join(args[:-1]).lower()
-                        break
-
-        if not from_container:
-            item_name = ' '.join(args).lower()
-
-        # Check if getting gold from room (not from container)
-        if not from_container and 'from' not in args and (item_name in ['gold', 'coins', 'coin', 'gold coins']):
-            if player.room.gold <= 0:
-                await player.send(f"{c['yellow']}There's no gold here.{c['reset']}")
-                return
-
-            gold_amount = player.room.gold
-            player.gold += gold_amount
-            player.room.gold = 0
-
-            await player.send(f"{c['yellow']}You get {gold_amount} gold coins. You now have {player.gold} gold.{c['reset']}")
-            await player.room.send_to_room(
-                f"{player.name} picks up some gold coins.",
-                exclude=[player]
-            )
-            return
-
-        # Check if getting from container (either "get item container" or "get item from container")
-        if from_container or 'from' in args:
-            # If using "from" syntax, extract container name
-            if 'from' in args:
-                from_idx = args.index('from')
-                item_name = ' '.join(args[:from_idx]).lower()
-                container_name = ' '.join(args[from_idx+1:]).lower()
-
-            # Find container using numbered targeting (e.g., "2.corpse")
-            container = find_in_list(player.inventory + player.room.items, container_name)
-            if container and getattr(container, 'item_type', None) != 'container':
-                container = None
-
-            if not container:
-                await player.send(f"You don't see a '{container_name}' container here.")
-                return
-
-            # Check if container is closed
-            if hasattr(container, 'is_closed') and container.is_closed:
-                await player.send(f"The {container.name} is closed.")
-                return
-
-            # Check if getting gold from container
-            if item_name in ['gold', 'coins', 'coin', 'gold coins']:
-                if not hasattr(container, 'gold') or container.gold <= 0:
-                    await player.send(f"{c['yellow']}There's no gold in {container.short_desc}.{c['reset']}")
-                    return
-
-                gold_amount = container.gold
-                player.gold += gold_amount
-                container.gold = 0
-
-                await player.send(f"{c['yellow']}You get {gold_amount} gold coins from {container.short_desc}. You now have {player.gold} gold.{c['reset']}")
-                await player.room.send_to_room(
-                    f"{player.name} gets gold coins from {container.short_desc}.",
-                    exclude=[player]
-                )
-                return
-
-            # Check if getting 'all' from container
-            if item_name == 'all':
-                # Get gold first if any
-                if hasattr(container, 'gold') and container.gold > 0:
-                    gold_amount = container.gold
-                    player.gold += gold_amount
-                    container.gold = 0
-                    await player.send(f"{c['yellow']}You get {gold_amount} gold coins from {container.short_desc}.{c['reset']}")
-
-                if not hasattr(container, 'contents') or not container.contents:
-                    if not hasattr(container, 'gold') or container.gold == 0:
-                        await player.send(f"The {container.name} is empty.")
-                    return
-
-                for item in list(container.contents):
-                    container.contents.remove(item)
-                    player.inventory.append(item)
-                    await cls._record_collection_item(player, item)
-                    from quests import QuestManager
-                    await QuestManager.check_quest_progress(
-                        player, 'collect', {'item_vnum': getattr(item, 'vnum', 0), 'item_name': item.name}
-                    )
-                    await player.send(f"You get {item.short_desc} from {container.short_desc}.")
-                return
-
-            # Get specific item from container
-            if not hasattr(container, 'contents'):
-                await player.send(f"The {container.name} is empty.")
-                return
-
-            item = find_in_list(container.contents, item_name)
-            if item:
-                container.contents.remove(item)
-                player.inventory.append(item)
-                await cls._record_collection_item(player, item)
-                from quests import QuestManager
-                await QuestManager.check_quest_progress(
-                    player, 'collect', {'item_vnum': getattr(item, 'vnum', 0), 'item_name': item.name}
-                )
-                await player.send(f"You get {item.short_desc} from {container.short_desc}.")
-                await player.room.send_to_room(
-                    f"{player.name} gets {item.short_desc} from {container.short_desc}.",
-                    exclude=[player]
-                )
-                return
-
-            await player.send(f"There's no '{item_name}' in {container.short_desc}.")
-            return
-
-        # Check for 'all.corpse' or 'all.chest' - get all items from all matching containers
-        if '.' in item_name and item_name.startswith('all.'):
-            container_type = item_name.split('.', 1)[1]
-            containers = []
-
-            # Find all matching containers
-            for item in player.room.items:
-                if hasattr(item, 'item_type') and item.item_type == 'container':
-                    if container_type in item.name.lower():
-                        containers.append(item)
-
-            if not containers:
-                await player.send(f"{c['yellow']}You don't see any {container_type}s here.{c['reset']}")
-                return
-
-            total_gold = 0
-            total_items = 0
-
-            for container in containers:
-                # Check if container is closed
-                if hasattr(container, 'is_closed') and container.is_closed:
-                    await player.send(f"{c['yellow']}The {container.short_desc} is closed.{c['reset']}")
-                    continue
-
-                # Get gold from this container
-                if hasattr(container, 'gold') and container.gold > 0:
-                    total_gold += container.gold
-                    container.gold = 0
-
-                # Get items from this container
-                if hasattr(container, 'contents') and container.contents:
-                    for item in list(container.contents):
-                        container.contents.remove(item)
-                        player.inventory.append(item)
-                        await cls._record_collection_item(player, item)
-                        from quests import QuestManager
-                        await QuestManager.check_quest_progress(
-                            player, 'collect', {'item_vnum': getattr(item, 'vnum', 0), 'item_name': item.name}
-                        )
-                        await player.send(f"You get {item.short_desc} from {container.short_desc}.")
-                        total_items += 1
-
-            if total_gold > 0:
-                player.gold += total_gold
-                await player.send(f"{c['yellow']}You get {total_gold} gold coins. You now have {player.gold} gold.{c['reset']}")
-
-            if total_items == 0 and total_gold == 0:
-                await player.send(f"{c['white']}All {container_type}s are empty.{c['reset']}")
-
-            return
-
-        # Check if getting 'all'
-        if item_name == 'all':
-            if not player.room.items:
-                await player.send("There's nothing here to get.")
-                return
-            for item in list(player.room.items):
-                player.room.items.remove(item)
-                player.inventory.append(item)
-                await cls._record_collection_item(player, item)
-                from quests import QuestManager
-                await QuestManager.check_quest_progress(
-                    player, 'collect', {'item_vnum': getattr(item, 'vnum', 0), 'item_name': item.name}
-                )
-                await player.send(f"You get {item.short_desc}.")
-            return
-            
-        # Find item in room with numbered targeting (e.g., "2.corpse", "3.sword")
-        item = player.find_item_in_room(item_name)
-        if item:
-            player.room.items.remove(item)
-            player.inventory.append(item)
-            await cls._record_collection_item(player, item)
-            from quests import QuestManager
-            await QuestManager.check_quest_progress(
-                player, 'collect', {'item_vnum': getattr(item, 'vnum', 0), 'item_name': item.name}
-            )
-            await player.send(f"You get {item.short_desc}.")
-            await player.room.send_to_room(
-                f"{player.name} picks up {item.short_desc}.",
-                exclude=[player]
-            )
-            return
-                
-        await player.send(f"You don't see '{item_name}' here.")
-        
-    @classmethod
-    async def cmd_take(cls, player: 'Player', args: List[str]):
-        """Alias for get."""
-        await cls.cmd_get(player, args)
-
-    @classmethod
-    async def cmd_loot(cls, player: 'Player', args: List[str]):
-        """Loot items from a corpse. Supports numbered targeting (e.g., loot 2.corpse)"""
-        c = player.config.COLORS
-
-        # Find corpse - default to first corpse if no args
-        corpse = None
-        if args:
-            corpse_name = ' '.join(args).lower()
-            # Use find_container for numbered targeting (e.g., "loot 2.corpse")
-            corpse = player.find_container(corpse_name)
-            # Verify it's actually a corpse
-            if corpse and 'corpse' not in corpse.name.lower():
-                corpse = None
-        else:
-            # No args - find first corpse
-            for item in player.room.items:
-                if hasattr(item, 'item_type') and item.item_type == 'container':
-                    if 'corpse' in item.name.lower():
-                        corpse = item
-                        break
-
-        if not corpse:
-            await player.send(f"{c['yellow']}You don't see any corpses to loot here.{c['reset']}")
-            return
-
-        # Loot gold from corpse if any
-        gold_looted = 0
-        if hasattr(corpse, 'gold') and corpse.gold > 0:
-            player.gold += corpse.gold
-            gold_looted = corpse.gold
-            corpse.gold = 0
-
-        # Loot items from corpse
-        items_looted = 0
-        if hasattr(corpse, 'contents') and corpse.contents:
-            for item in list(corpse.contents):
-                corpse.contents.remove(item)
-                player.inventory.append(item)
-                await cls._record_collection_item(player, item)
-                from quests import QuestManager
-                await QuestManager.check_quest_progress(
-                    player, 'collect', {'item_vnum': getattr(item, 'vnum', 0), 'item_name': item.name}
-                )
-                await player.send(f"{c['bright_cyan']}You get {item.short_desc} from {corpse.short_desc}.{c['reset']}")
-                items_looted += 1
-
-        # Report what was looted
-        if gold_looted > 0:
-            await player.send(f"{c['yellow']}You get {gold_looted} gold coins from {corpse.short_desc}.{c['reset']}")
-
-        if items_looted == 0 and gold_looted == 0:
-            await player.send(f"{c['white']}The {corpse.short_desc} is empty.{c['reset']}")
-        else:
-            await player.room.send_to_room(
-                f"{player.name} loots {corpse.short_desc}.",
-                exclude=[player]
-            )
-
-    @classmethod
-    async def cmd_sacrifice(cls, player: 'Player', args: List[str]):
-        """Sacrifice a corpse to the gods for gold."""
-        c = player.config.COLORS
-
-        # Check for .all, all, or all.corpse to sacrifice all corpses
-        if args and (args[0] == '.all' or args[0] == 'all' or args[0].startswith('all.')):
-            corpses = []
-            for item in player.room.items:
-                if hasattr(item, 'item_type') and item.item_type == 'container':
-                    if 'corpse' in item.name.lower():
-                        corpses.append(item)
-
-            if not corpses:
-                await player.send(f"{c['yellow']}You don't see any corpses to sacrifice here.{c['reset']}")
-                return
-
-            total_gold = 0
-            corpse_count = 0
-
-            for corpse in list(corpses):
-                # Drop all items from corpse onto the floor
-                if hasattr(corpse, 'contents') and corpse.contents:
-                    for item in list(corpse.contents):
-                        corpse.contents.remove(item)
-                        player.room.items.append(item)
-
-                # Drop any gold from corpse onto the floor
-                if hasattr(corpse, 'gold') and corpse.gold > 0:
-                    player.room.gold += corpse.gold
-
-                # Remove corpse from room
-                player.room.items.remove(corpse)
-
-                # Give player 1 gold per corpse
-                player.gold += 1
-                total_gold += 1
-                corpse_count += 1
-
-            await player.send(f"{c['bright_yellow']}You sacrifice {corpse_count} corpses to the gods!{c['reset']}")
-            await player.send(f"{c['yellow']}The gods give you {total_gold} gold coins for your offerings.{c['reset']}")
-            await player.room.send_to_room(
-                f"{player.name} sacrifices multiple corpses in brilliant flashes of light!",
-                exclude=[player]
-            )
-            return
-
-        # Find corpse - default to first corpse if no args
-        corpse = None
-        if args:
-            corpse_name = ' '.join(args).lower()
-            for item in player.room.items:
-                if hasattr(item, 'item_type') and item.item_type == 'container':
-                    if 'corpse' in item.name.lower() and corpse_name in item.name.lower():
-                        corpse = item
-                        break
-        else:
-            # No args - find first corpse
-            for item in player.room.items:
-                if hasattr(item, 'item_type') and item.item_type == 'container':
-                    if 'corpse' in item.name.lower():
-                        corpse = item
-                        break
-
-        if not corpse:
-            await player.send(f"{c['yellow']}You don't see any corpses to sacrifice here.{c['reset']}")
-            return
-
-        # Drop all items from corpse onto the floor
-        items_dropped = 0
-        if hasattr(corpse, 'contents') and corpse.contents:
-            for item in list(corpse.contents):
-                corpse.contents.remove(item)
-                player.room.items.append(item)
-                items_dropped += 1
-
-        # Drop any gold from corpse onto the floor
-        if hasattr(corpse, 'gold') and corpse.gold > 0:
-            player.room.gold += corpse.gold
-
-        # Remove corpse from room
-        player.room.items.remove(corpse)
-
-        # Give player 1 gold for the sacrifice
-        player.gold += 1
-
-        # Messages
-        await player.send(f"{c['bright_yellow']}You sacrifice {corpse.short_desc} to the gods!{c['reset']}")
-        await player.send(f"{c['yellow']}The gods give you 1 gold coin for your offering.{c['reset']}")
-
-        if items_dropped > 0:
-            await player.send(f"{c['white']}The contents of the corpse scatter on the ground.{c['reset']}")
-
-        await player.room.send_to_room(
-            f"{player.name} sacrifices {corpse.short_desc} in a brilliant flash of light!",
-            exclude=[player]
-        )
-
-    @classmethod
-    async def cmd_drop(cls, player: 'Player', args: List[str]):
-        """Drop an item or gold."""
-        if not args:
-            await player.send("Drop what?")
-            return
-
-        c = player.config.COLORS
-        item_name = ' '.join(args).lower()
-
-        # Check if dropping gold
-        if 'gold' in item_name or 'coins' in item_name or 'coin' in item_name:
-            # Extract amount if specified (e.g., "drop 100 gold")
-            amount = None
-            words = item_name.split()
-            for word in words:
-                if word.isdigit():
-                    amount = int(word)
-                    break
-
-            if amount is None:
-                amount = player.gold
-
-            if amount <= 0:
-                await player.send(f"{c['yellow']}Drop how much gold?{c['reset']}")
-                return
-
-            if player.gold < amount:
-                await player.send(f"{c['red']}You don't have that much gold. You have {player.gold} gold.{c['reset']}")
-                return
-
-            player.gold -= amount
-            player.room.gold += amount
-
-            await player.send(f"{c['yellow']}You drop {amount} gold coins. You have {player.gold} gold remaining.{c['reset']}")
-            await player.room.send_to_room(
-                f"{player.name} drops some gold coins.",
-                exclude=[player]
-            )
-            return
-
-        # Check if dropping 'all'
-        if item_name == 'all':
-            if not player.inventory:
-                await player.send("You're not carrying anything.")
-                return
-            for item in list(player.inventory):
-                player.inventory.remove(item)
-                player.room.items.append(item)
-                await player.send(f"You drop {item.short_desc}.")
-            return
-            
-        # Find item in inventory
-        for item in player.inventory:
-            if item_name in item.name.lower():
-                player.inventory.remove(item)
-                player.room.items.append(item)
-                await player.send(f"You drop {item.short_desc}.")
-                await player.room.send_to_room(
-                    f"{player.name} drops {item.short_desc}.",
-                    exclude=[player]
-                )
-                return
-                
-        await player.send(f"You don't have '{item_name}'.")
-
-    @classmethod
-    async def cmd_put(cls, player: 'Player', args: List[str]):
-        """Put an item into a container. Usage: put <item> <container> or put all <container>"""
-        if not args or len(args) < 2:
-            await player.send("Usage: put <item> <container> or put all <container>")
-            return
-
-        c = player.config.COLORS
-
-        # Check for 'in' or 'into' preposition
-        if 'in' in args:
-            in_idx = args.index('in')
-            item_name = ' '.join(args[:in_idx]).lower()
-            container_name = ' '.join(args[in_idx+1:]).lower()
-        elif 'into' in args:
-            into_idx = args.index('into')
-            item_name = ' '.join(args[:into_idx]).lower()
-            container_name = ' '.join(args[into_idx+1:]).lower()
-        else:
-            # Assume last word is container
-            container_name = args[-1].lower()
-            item_name = ' '.join(args[:-1]).lower()
-
-        # Find container in inventory or room
-        container = None
-        for item in player.inventory + player.room.items:
-            if container_name in item.name.lower():
-                if hasattr(item, 'item_type') and item.item_type == 'container':
-                    container = item
-                    break
-
-        if not container:
-            await player.send(f"{c['red']}You don't see a '{container_name}' container here.{c['reset']}")
-            return
-
-        # Check if container is closed
-        if hasattr(container, 'is_closed') and container.is_closed:
-            await player.send(f"{c['red']}The {container.name} is closed.{c['reset']}")
-            return
-
-        # Initialize contents if not present
-        if not hasattr(container, 'contents'):
-            container.contents = []
-
-        # Check for 'all'
-        if item_name == 'all':
-            if not player.inventory:
-                await player.send(f"{c['yellow']}You're not carrying anything.{c['reset']}")
-                return
-
-            put_count = 0
-            for item in list(player.inventory):
-                # Don't put container into itself
-                if item == container:
-                    continue
-
-                # Check weight capacity if container has it
-                if hasattr(container, 'capacity'):
-                    current_weight = sum(getattr(i, 'weight', 1) for i in container.contents)
-                    item_weight = getattr(item, 'weight', 1)
-                    if current_weight + item_weight > container.capacity:
-                        await player.send(f"{c['yellow']}{container.short_desc} is full.{c['reset']}")
-                        break
-
-                player.inventory.remove(item)
-                container.contents.append(item)
-                await player.send(f"You put {item.short_desc} in {container.short_desc}.")
-                put_count += 1
-
-            if put_count > 0:
-                await player.room.send_to_room(
-                    f"{player.name} puts several items in {container.short_desc}.",
-                    exclude=[player]
-                )
-            return
-
-        # Put specific item
-        for item in player.inventory:
-            if item_name in item.name.lower():
-                # Don't put container into itself
-                if item == container:
-                    await player.send(f"{c['red']}You can't put {item.short_desc} into itself!{c['reset']}")
-                    return
-
-                # Check weight capacity
-                if hasattr(container, 'capacity'):
-                    current_weight = sum(getattr(i, 'weight', 1) for i in container.contents)
-                    item_weight = getattr(item, 'weight', 1)
-                    if current_weight + item_weight > container.capacity:
-                        await player.send(f"{c['red']}{container.short_desc} is full.{c['reset']}")
-                        return
-
-                player.inventory.remove(item)
-                container.contents.append(item)
-                await player.send(f"{c['green']}You put {item.short_desc} in {container.short_desc}.{c['reset']}")
-                await player.room.send_to_room(
-                    f"{player.name} puts {item.short_desc} in {container.short_desc}.",
-                    exclude=[player]
-                )
-                return
-
-        await player.send(f"{c['red']}You don't have '{item_name}'.{c['reset']}")
-
-    @classmethod
-    async def cmd_wear(cls, player: 'Player', args: List[str]):
-        """Wear an item or 'wear all' to wear everything you can."""
-        if not args:
-            await player.send("Wear what?")
-            return
-
-        item_name = ' '.join(args).lower()
-
-        # Handle "wear all"
-        if item_name == 'all':
-            worn_count = 0
-            # Include lights even without wear_slot (they auto-assign to 'light')
-            items_to_wear = [item for item in player.inventory
-                           if item.item_type in ('armor', 'light', 'worn') and (hasattr(item, 'wear_slot') or item.item_type == 'light')]
-
-            # Handle paired slots
-            paired_slots = {
-                'finger': ['finger1', 'finger2'],
-                'neck': ['neck1', 'neck2'],
-                'wrist': ['wrist1', 'wrist2'],
-            }
-            
-            for item in items_to_wear:
-                slot = getattr(item, 'wear_slot', None)
-                # Auto-assign light slot for light items
-                if not slot and item.item_type == 'light':
-                    slot = 'light'
-                if not slot:
-                    continue
-                actual_slot = slot
-                
-                # Handle paired slots
-                if slot in paired_slots:
-                    for paired in paired_slots[slot]:
-                        if not player.equipment.get(paired):
-                            actual_slot = paired
-                            break
-                    else:
-                        continue  # Both slots full, skip this item
-                elif player.equipment.get(slot):
-                    continue  # Slot occupied
-                
-                player.inventory.remove(item)
-                player.equipment[actual_slot] = item
-                await player.send(f"You wear {item.short_desc}.")
-                worn_count += 1
-
-            if worn_count > 0:
-                await player.room.send_to_room(
-                    f"{player.name} puts on several items.",
-                    exclude=[player]
-                )
-            else:
-                await player.send("You don't have anything to wear.")
-            return
-
-        # Find specific item in inventory
-        for item in player.inventory:
-            if item_name in item.name.lower():
-                if item.item_type not in ('armor', 'light', 'worn'):
-                    await player.send(f"You can't wear {item.short_desc}.")
-                    return
-
-                slot = getattr(item, 'wear_slot', None)
-                # Auto-assign light slot for light items
-                if not slot and item.item_type == 'light':
-                    slot = 'light'
-                if not slot:
-                    await player.send(f"You can't figure out how to wear {item.short_desc}.")
-                    return
-
-                # Handle paired slots (finger, neck, wrist -> finger1/finger2, etc.)
-                paired_slots = {
-                    'finger': ['finger1', 'finger2'],
-                    'neck': ['neck1', 'neck2'],
-                    'wrist': ['wrist1', 'wrist2'],
-                }
-                
-                actual_slot = slot
-                if slot in paired_slots:
-                    # Find first empty slot in the pair
-                    for paired in paired_slots[slot]:
-                        if not player.equipment.get(paired):
-                            actual_slot = paired
-                            break
-                    else:
-                        # Both slots full
-                        await player.send(f"You're already wearing something in both {slot} slots.")
-                        return
-                elif player.equipment.get(slot):
-                    # Single slot already occupied
-                    await player.send(f"You're already wearing something there.")
-                    return
-
-                player.inventory.remove(item)
-                player.equipment[actual_slot] = item
-                await player.send(f"You wear {item.short_desc}.")
-                await player.room.send_to_room(
-                    f"{player.name} wears {item.short_desc}.",
-                    exclude=[player]
-                )
-                return
-
-        await player.send(f"You don't have '{item_name}'.")
-        
-    @classmethod
-    async def cmd_wield(cls, player: 'Player', args: List[str]):
-        """Wield a weapon."""
-        if not args:
-            await player.send("Wield what?")
-            return
-            
-        item_name = ' '.join(args).lower()
-        
-        # Find item in inventory
-        for item in player.inventory:
-            if item_name in item.name.lower():
-                if item.item_type != 'weapon':
-                    await player.send(f"You can't wield {item.short_desc}.")
-                    return
-                    
-                # If already wielding, require dual wield skill and use off-hand slot
-                if player.equipment.get('wield'):
-                    if 'dual_wield' not in player.skills:
-                        await player.send("You're already wielding something.")
-                        return
-                    if player.equipment.get('dual_wield'):
-                        await player.send("You're already dual wielding.")
-                        return
-                    # Restrict to light weapons
-                    name_l = (item.name + ' ' + item.short_desc).lower()
-                    allowed_name = any(x in name_l for x in ['dagger', 'knife', 'stiletto', 'short sword', 'shortsword'])
-                    if getattr(item, 'weapon_type', '') not in ('pierce', 'stab') and not allowed_name:
-                        await player.send("Off-hand weapons must be daggers, knives, or short swords.")
-                        return
-                    player.inventory.remove(item)
-                    player.equipment['dual_wield'] = item
-                    await player.send(f"You off-hand {item.short_desc}.")
-                    await player.room.send_to_room(
-                        f"{player.name} off-hands {item.short_desc}.",
-                        exclude=[player]
-                    )
-                    try:
-                        from tips import TipManager
-                        await TipManager.show_tutorial_hint(player, 'tutorial_wield')
-                    except Exception:
-                        pass
-                    return
-                    
-                player.inventory.remove(item)
-                player.equipment['wield'] = item
-                await player.send(f"You wield {item.short_desc}.")
-                await player.room.send_to_room(
-                    f"{player.name} wields {item.short_desc}.",
-                    exclude=[player]
-                )
-                try:
-                    from tips import TipManager
-                    await TipManager.show_tutorial_hint(player, 'tutorial_wield')
-                except Exception:
-                    pass
-                return
-                
-        await player.send(f"You don't have '{item_name}'.")
-        
-    @classmethod
-    async def cmd_remove(cls, player: 'Player', args: List[str]):
-        """Remove worn equipment or 'remove all' to remove everything."""
-        if not args:
-            await player.send("Remove what?")
-            return
-
-        item_name = ' '.join(args).lower()
-
-        # Handle "remove all"
-        if item_name == 'all':
-            removed_count = 0
-            for slot, item in list(player.equipment.items()):
-                if item:
-                    player.equipment[slot] = None
-                    player.inventory.append(item)
-                    await cls._record_collection_item(player, item)
-                    await player.send(f"You remove {item.short_desc}.")
-                    removed_count += 1
-
-            if removed_count > 0:
-                await player.room.send_to_room(
-                    f"{player.name} removes several items.",
-                    exclude=[player]
-                )
-            else:
-                await player.send("You're not wearing anything to remove.")
-            return
-
-        # Find specific item in equipment
-        for slot, item in list(player.equipment.items()):
-            if item and item_name in item.name.lower():
-                player.equipment[slot] = None
-                player.inventory.append(item)
-                await cls._record_collection_item(player, item)
-                await player.send(f"You remove {item.short_desc}.")
-                await player.room.send_to_room(
-                    f"{player.name} removes {item.short_desc}.",
-                    exclude=[player]
-                )
-                return
-
-        await player.send(f"You're not wearing '{item_name}'.")
-        
-    @classmethod
-    async def cmd_give(cls, player: 'Player', args: List[str]):
-        """Give an item to someone."""
-        if len(args) < 2:
-            await player.send("Give what to whom?")
-            return
-            
-        item_name = args[0].lower()
-        target_name = args[-1].lower()
-        
-        # Find target
-        target = None
-        for char in player.room.characters:
-            if char != player and target_name in char.name.lower():
-                target = char
-                break
-                
-        if not target:
-            await player.send(f"You don't see '{target_name}' here.")
-            return
-            
-        # Find item
-        for item in player.inventory:
-            if item_name in item.name.lower():
-                player.inventory.remove(item)
-                if hasattr(target, 'inventory'):
-                    target.inventory.append(item)
-                await player.send(f"You give {item.short_desc} to {target.name}.")
-                if hasattr(target, 'send'):
-                    await target.send(f"{player.name} gives you {item.short_desc}.")
-                await player.room.send_to_room(
-                    f"{player.name} gives {item.short_desc} to {target.name}.",
-                    exclude=[player, target]
-                )
-                return
-                
-        await player.send(f"You don't have '{item_name}'.")
-    
-    # ==================== COMMUNICATION ====================
-
-    @classmethod
-    async def handle_npc_trigger(cls, player: 'Player', npc: 'Mobile', message: str):
-        """Handle NPC responses to player speech."""
-        c = player.config.COLORS
-
-        # Healer NPCs
-        if npc.special == 'healer':
-            if 'heal' in message or 'help' in message:
-                # Check if player needs healing
-                if player.hp < player.max_hp:
-                    heal_amount = player.max_hp - player.hp
-                    player.hp = player.max_hp
-                    await player.send(f"{c['bright_cyan']}{npc.name} says, 'Let me tend to your wounds.'{c['reset']}")
-                    await player.room.send_to_room(
-                        f"{npc.name} places their hands on {player.name} and heals them.",
-                        exclude=[player]
-                    )
-                    await player.send(f"{c['bright_green']}You are fully healed! [{heal_amount} HP]{c['reset']}")
-                else:
-                    await player.send(f"{c['bright_cyan']}{npc.name} says, 'You appear to be in perfect health already.'{c['reset']}")
-
-        # Shopkeeper NPCs
-        elif npc.special == 'shopkeeper':
-            if 'hello' in message or 'hi' in message or 'greet' in message:
-                await player.send(f"{c['bright_cyan']}{npc.name} says, 'Welcome! Type LIST to see my wares.'{c['reset']}")
-            elif 'buy' in message or 'sell' in message:
-                await player.send(f"{c['bright_cyan']}{npc.name} says, 'Use BUY <item> to purchase or SELL <item> to sell to me.'{c['reset']}")
-
-        # Trainer NPCs
-        elif npc.special == 'trainer':
-            if 'train' in message or 'teach' in message or 'practice' in message:
-                await player.send(f"{c['bright_cyan']}{npc.name} says, 'I can train you in the arts of thievery. Type PRACTICE to see what I offer.'{c['reset']}")
-            elif 'hello' in message or 'hi' in message:
-                await player.send(f"{c['bright_cyan']}{npc.name} says, 'Welcome to the guild, shadow walker.'{c['reset']}")
-
-        # Innkeeper NPCs
-        elif npc.special == 'innkeeper':
-            if 'rent' in message or 'room' in message or 'stay' in message:
-                rent_cost = max(20, player.level * 10)
-                await player.send(f"{c['bright_cyan']}{npc.name} says, 'A room costs {rent_cost} gold per night. Type RENT to secure a room and rest.'{c['reset']}")
-            elif 'hello' in message or 'hi' in message or 'greet' in message:
-                await player.send(f"{c['bright_cyan']}{npc.name} says, 'Welcome to The Prancing Pony! Looking for a room to rest? Just ask about rent.'{c['reset']}")
-            elif 'help' in message:
-                await player.send(f"{c['bright_cyan']}{npc.name} says, 'We offer safe rooms where you can rest and save your progress. Type RENT when you're ready.'{c['reset']}")
-
-        # Flavor / Lore NPCs with talk_responses
-        elif npc.special == 'flavor_npc':
-            talk_responses = getattr(npc, 'talk_responses', {})
-            if talk_responses:
-                # Try to match a keyword in the message
-                response = None
-                for keyword, resp in talk_responses.items():
-                    if keyword != 'default' and keyword in message:
-                        response = resp
-                        break
-                if not response:
-                    # Use 'hello' for greetings, otherwise 'default'
-                    if 'hello' in message or 'hi' in message or 'greet' in message or message == 'hello':
-                        response = talk_responses.get('hello', talk_responses.get('default', ''))
-                    else:
-                        response = talk_responses.get('default', '')
-                if response:
-                    await player.send(f"\n{c['bright_cyan']}{response}{c['reset']}\n")
-            else:
-                await player.send(f"{c['bright_cyan']}{npc.name} regards you silently.{c['reset']}")
-
-        # Generic helper NPCs
-        elif 'helper' in npc.flags:
-            if 'hello' in message or 'hi' in message or 'greet' in message:
-                await player.send(f"{c['bright_cyan']}{npc.name} nods at you in acknowledgment.{c['reset']}")
-            elif 'help' in message:
-                await player.send(f"{c['bright_cyan']}{npc.name} says, 'I'm here to keep the peace. Stay out of trouble!'{c['reset']}")
-
-    @classmethod
-    async def cmd_ask(cls, player: 'Player', args: List[str]):
-        """Ask an NPC a question using LLM-powered conversation."""
-        c = player.config.COLORS
-        
-        if len(args) < 2:
-            await player.send(f"{c['yellow']}Usage: ask <npc> <question>{c['reset']}")
-            await player.send(f"{c['cyan']}Example: ask sage What is the history of this realm?{c['reset']}")
-            return
-        
-        npc_name = args[0].lower()
-        question = ' '.join(args[1:])
-        
-        # Find the NPC in the room
-        from mobs import Mobile
-        target_npc = None
-        
-        for char in player.room.characters:
-            if isinstance(char, Mobile):
-                if npc_name in char.name.lower():
-                    target_npc = char
-                    break
-                # Check keywords
-                keywords = getattr(char, 'keywords', [])
-                if isinstance(keywords, str):
-                    keywords = [keywords]
-                for kw in keywords:
-                    if npc_name in kw.lower():
-                        target_npc = char
-                        break
-                if target_npc:
-                    break
-        
-        if not target_npc:
-            await player.send(f"{c['red']}You don't see '{npc_name}' here to ask.{c['reset']}")
-            return
-        
-        # Check if LLM is available
-        from llm_client import get_llm_client
-        llm = get_llm_client()
-        
-        if not await llm.is_available():
-            # Fallback to generic response
-            await player.send(f"{c['cyan']}{target_npc.name} looks at you thoughtfully but doesn't seem to understand.{c['reset']}")
-            await player.send(f"{c['yellow']}(LLM server not available - start LM Studio to enable NPC conversations){c['reset']}")
-            return
-        
-        # Show thinking indicator
-        await player.send(f"{c['cyan']}You ask {target_npc.name}: \"{question}\"{c['reset']}")
-        await player.room.send_to_room(
-            f"{player.name} speaks with {target_npc.name}.",
-            exclude=[player]
-        )
-        
-        # Get NPC personality and context
-        from npc_personalities import get_npc_personality, get_world_context
-        
-        personality = get_npc_personality(target_npc)
-        context = get_world_context(player, target_npc)
-        
-        # Get conversation history for this NPC (if we have it)
-        conv_key = f"{player.name}:{target_npc.vnum if hasattr(target_npc, 'vnum') else target_npc.name}"
-        if not hasattr(player, 'npc_conversations'):
-            player.npc_conversations = {}
-        history = player.npc_conversations.get(conv_key, [])
-        
-        # Call LLM
-        response = await llm.ask_npc(
-            npc_name=target_npc.name,
-            npc_personality=personality,
-            player_name=player.name,
-            question=question,
-            context=context,
-            conversation_history=history
-        )
-        
-        if response:
-            # Store conversation history
-            history.append({"role": "user", "content": f"{player.name} asks: {question}"})
-            history.append({"role": "assistant", "content": response})
-            # Keep only last 10 messages
-            player.npc_conversations[conv_key] = history[-10:]
-            
-            # Display NPC response
-            await player.send(f"\n{c['bright_cyan']}{target_npc.name} says, \"{response}\"{c['reset']}\n")
-        else:
-            await player.send(f"{c['cyan']}{target_npc.name} ponders for a moment but doesn't respond.{c['reset']}")
-
-    @classmethod
-    async def cmd_say(cls, player: 'Player', args: List[str]):
-        """Say something to the room."""
-        if not args:
-            await player.send("Say what?")
-            return
-
-        message = ' '.join(args)
-        c = player.config.COLORS
-
-        if not getattr(player, 'norepeat', False):
-            await player.send(f"{c['bright_green']}You say, '{message}'{c['reset']}")
-        await player.room.send_to_room(
-            f"{c['bright_green']}{player.name} says, '{message}'{c['reset']}",
-            exclude=[player]
-        )
-
-        # Check for NPC triggers
-        from mobs import Mobile
-        for char in player.room.characters:
-            if isinstance(char, Mobile) and char.special:
-                await cls.handle_npc_trigger(player, char, message.lower())
-        
-    @classmethod
-    async def cmd_shout(cls, player: 'Player', args: List[str]):
-        """Shout to everyone in the zone."""
-        if not args:
-            await player.send("Shout what?")
-            return
-            
-        message = ' '.join(args)
-        c = player.config.COLORS
-        
-        if not getattr(player, 'norepeat', False):
-            await player.send(f"{c['bright_yellow']}You shout, '{message}'{c['reset']}")
-        
-        # Send to all players in the zone
-        for p in player.world.players.values():
-            if p != player and p.room and player.room and p.room.zone == player.room.zone:
-                if not getattr(p, 'noshout', False):
-                    await p.send(f"\r\n{c['bright_yellow']}{player.name} shouts, '{message}'{c['reset']}")
-                
-    @classmethod
-    async def cmd_gossip(cls, player: 'Player', args: List[str]):
-        """Gossip to all players."""
-        if not args:
-            await player.send("Gossip what?")
-            return
-            
-        message = ' '.join(args)
-        c = player.config.COLORS
-        
-        await player.send(f"{c['bright_magenta']}You gossip, '{message}'{c['reset']}")
-        
-        for p in player.world.players.values():
-            if p != player:
-                await p.send(f"\r\n{c['bright_magenta']}{player.name} gossips, '{message}'{c['reset']}")
-                
-    @classmethod
-    async def cmd_emote(cls, player: 'Player', args: List[str]):
-        """Emote an action."""
-        if not args:
-            await player.send("Emote what?")
-            return
-            
-        message = ' '.join(args)
-        c = player.config.COLORS
-        
-        # Send to room, respecting ignore lists
-        from social import is_ignored
-        if player.room:
-            for char in player.room.characters:
-                if hasattr(char, 'connection') and char.connection:
-                    if char == player or not is_ignored(char, player.name):
-                        await char.send(f"{c['yellow']}{player.name} {message}{c['reset']}")
-        
-    @classmethod
-    async def cmd_tell(cls, player: 'Player', args: List[str]):
-        """Send a private message."""
-        if len(args) < 2:
-            await player.send("Tell whom what?")
-            return
-            
-        target_name = args[0].lower()
-        message = ' '.join(args[1:])
-        c = player.config.COLORS
-        
-        target = player.world.get_player(target_name)
-        if not target:
-            await player.send(f"No player named '{target_name}' is online.")
-            return
-            
-        if getattr(target, 'notell', False):
-            await player.send(f"{c['yellow']}{target.name} is not accepting tells.{c['reset']}")
-            return
-
-        # Check ignore list
-        from social import is_ignored
-        if is_ignored(target, player.name):
-            await player.send(f"{c['yellow']}{target.name} is not accepting tells.{c['reset']}")
-            return
-        
-        if not getattr(player, 'norepeat', False):
-            await player.send(f"{c['bright_cyan']}You tell {target.name}, '{message}'{c['reset']}")
-        await target.send(f"\r\n{c['bright_cyan']}{player.name} tells you, '{message}'{c['reset']}")
-    
-    # ==================== POSITIONS ====================
-    
-    @classmethod
-    async def cmd_sit(cls, player: 'Player', args: List[str]):
-        """Sit down."""
-        if player.is_fighting:
-            await player.send("You can't sit while fighting!")
-            return
-        if player.position == 'sitting':
-            await player.send("You're already sitting.")
-            return
-        player.position = 'sitting'
-        await player.send("You sit down.")
-        await player.room.send_to_room(f"{player.name} sits down.", exclude=[player])
-        
-    @classmethod
-    async def cmd_rest(cls, player: 'Player', args: List[str]):
-        """Rest to regenerate faster."""
-        if player.is_fighting:
-            await player.send("You can't rest while fighting!")
-            return
-        if player.position == 'resting':
-            await player.send("You're already resting.")
-            return
-        player.position = 'resting'
-        await player.send("You rest and begin to recuperate.")
-        await player.room.send_to_room(f"{player.name} rests.", exclude=[player])
-        # Revive knocked-out combat companion
-        if hasattr(player, 'combat_companion') and player.combat_companion and player.combat_companion.knocked_out:
-            if player.combat_companion.rest_revive():
-                c = player.config.COLORS
-                await player.send(f"{c['bright_green']}{player.combat_companion.name} revives and is ready to fight again!{c['reset']}")
-        
-    @classmethod
-    async def cmd_sleep(cls, player: 'Player', args: List[str]):
-        """Go to sleep."""
-        if player.is_fighting:
-            await player.send("You can't sleep while fighting!")
-            return
-        if player.position == 'sleeping':
-            await player.send("You're already asleep.")
-            return
-        player.position = 'sleeping'
-        await player.send("You go to sleep.")
-        await player.room.send_to_room(f"{player.name} goes to sleep.", exclude=[player])
-        # Revive knocked-out combat companion
-        if hasattr(player, 'combat_companion') and player.combat_companion and player.combat_companion.knocked_out:
-            if player.combat_companion.rest_revive():
-                c = player.config.COLORS
-                await player.send(f"{c['bright_green']}{player.combat_companion.name} revives and is ready to fight again!{c['reset']}")
-        
-    @classmethod
-    async def cmd_wake(cls, player: 'Player', args: List[str]):
-        """Wake up."""
-        if player.position != 'sleeping':
-            await player.send("You're not sleeping!")
-            return
-        player.position = 'standing'
-        await player.send("You wake and stand up.")
-        await player.room.send_to_room(f"{player.name} wakes up.", exclude=[player])
-        
-    @classmethod
-    async def cmd_stand(cls, player: 'Player', args: List[str]):
-        """Stand up."""
-        if player.position == 'standing':
-            await player.send("You're already standing.")
-            return
-        if player.position == 'sleeping':
-            await player.send("You wake and stand up.")
-        else:
-            await player.send("You stand up.")
-        player.position = 'standing'
-        await player.room.send_to_room(f"{player.name} stands up.", exclude=[player])
-    
-    # ==================== CONSUMABLES ====================
-    
-    @classmethod
-    async def cmd_eat(cls, player: 'Player', args: List[str]):
-        """Eat food."""
-        if not args:
-            await player.send("Eat what?")
-            return
-            
-        item_name = ' '.join(args).lower()
-        
-        for item in player.inventory:
-            if item_name in item.name.lower():
-                if item.item_type != 'food':
-                    await player.send(f"You can't eat {item.short_desc}!")
-                    return
-                    
-                c = player.config.COLORS
-                player.inventory.remove(item)
-                food_value = getattr(item, 'food_value', 10)
-
-                # Restore hunger based on food value
-                old_hunger = player.hunger
-                player.hunger = min(player.max_hunger, player.hunger + food_value)
-                hunger_restored = player.hunger - old_hunger
-
-                await player.send(f"You eat {item.short_desc}.")
-                if player.hunger >= player.max_hunger:
-                    await player.send(f"{c['bright_green']}You are completely full.{c['reset']}")
-                elif hunger_restored > 0:
-                    if player.hunger >= player.max_hunger * 0.75:
-                        await player.send(f"{c['green']}You feel satiated.{c['reset']}")
-                    elif player.hunger >= player.max_hunger * 0.5:
-                        await player.send(f"{c['green']}You feel less hungry.{c['reset']}")
-                    else:
-                        await player.send(f"{c['green']}You eat but are still hungry.{c['reset']}")
-                else:
-                    await player.send(f"{c['yellow']}You are already full!{c['reset']}")
-
-                # Check for food bonuses (rare/magical food)
-                food_bonus = getattr(item, 'food_bonus', None)
-                if food_bonus:
-                    from affects import AffectManager
-                    bonus_type = food_bonus.get('type')
-                    bonus_value = food_bonus.get('value', 1)
-                    duration = food_bonus.get('duration', 300) // 6  # Convert seconds to ticks
-                    
-                    # Custom message
-                    food_msg = getattr(item, 'food_message', None)
-                    if food_msg:
-                        await player.send(f"{c['bright_magenta']}{food_msg}{c['reset']}")
-                    
-                    if bonus_type == 'all_stats':
-                        # Boost all stats
-                        for stat in ['str', 'int', 'wis', 'dex', 'con', 'cha']:
-                            AffectManager.apply_affect(player, {
-                                'name': f'divine_nourishment_{stat}',
-                                'type': AffectManager.TYPE_MODIFY_STAT,
-                                'applies_to': stat,
-                                'value': bonus_value,
-                                'duration': duration,
-                                'caster_level': 30
-                            })
-                        await player.send(f"{c['bright_cyan']}You feel divinely nourished! All stats +{bonus_value} for {food_bonus.get('duration', 300)//60} minutes.{c['reset']}")
-                    elif bonus_type == 'regen':
-                        # Bonus HP/mana regen - just heal directly for now
-                        heal = bonus_value
-                        player.hp = min(player.max_hp, player.hp + heal)
-                        player.mana = min(player.max_mana, player.mana + heal)
-                        await player.send(f"{c['bright_green']}You recover {heal} HP and mana!{c['reset']}")
-                    elif bonus_type == 'stealth':
-                        # Stealth bonus
-                        AffectManager.apply_affect(player, {
-                            'name': 'shadow_nourishment',
-                            'type': AffectManager.TYPE_FLAG,
-                            'applies_to': 'sneak_bonus',
-                            'value': bonus_value,
-                            'duration': duration,
-                            'caster_level': 20
-                        })
-                        await player.send(f"{c['bright_cyan']}You feel stealthier! Sneak bonus +{bonus_value} for {food_bonus.get('duration', 300)//60} minutes.{c['reset']}")
-                    elif bonus_type in ['str', 'int', 'wis', 'dex', 'con', 'cha', 'hitroll', 'damroll']:
-                        # Stat bonus
-                        AffectManager.apply_affect(player, {
-                            'name': 'nourishment_bonus',
-                            'type': AffectManager.TYPE_MODIFY_STAT,
-                            'applies_to': bonus_type,
-                            'value': bonus_value,
-                            'duration': duration,
-                            'caster_level': 20
-                        })
-                        await player.send(f"{c['bright_cyan']}You feel empowered! {bonus_type.upper()} +{bonus_value} for {food_bonus.get('duration', 300)//60} minutes.{c['reset']}")
-
-                return
-                
-        await player.send(f"You don't have '{item_name}'.")
-        
-    @classmethod
-    async def cmd_drink(cls, player: 'Player', args: List[str]):
-        """Drink from a container or fountain."""
-        if not args:
-            # Default: try to drink from a fountain in the room
-            if player.room:
-                for item in player.room.items:
-                    if getattr(item, 'item_type', '') == 'fountain':
-                        args = [item.name.split()[0]]
-                        break
-            if not args:
-                await player.send("Drink what?")
-                return
-            
-        c = player.config.COLORS
-        target = ' '.join(args).lower()
-        if target.startswith('from '):
-            target = target[5:]
-
-        # Check for explicit drink container in inventory
-        explicit_container = None
-        for item in player.inventory:
-            if target in item.name.lower() and getattr(item, 'item_type', '') == 'drink':
-                explicit_container = item
-                break
-
-        # If there's a fountain in the room, drink from it by default
-        fountain = None
-        if player.room:
-            for item in player.room.items:
-                if getattr(item, 'item_type', '') == 'fountain':
-                    if target in item.name.lower() or target in ('fountain', 'water', 'spring', 'pool'):
-                        fountain = item
-                        break
-            if fountain is None:
-                # If no specific target matched but a fountain exists, default to it
-                for item in player.room.items:
-                    if getattr(item, 'item_type', '') == 'fountain':
-                        fountain = item
-                        break
-
-        if fountain and not explicit_container:
-            drink_value = getattr(fountain, 'drink_value', 12)
-            old_thirst = player.thirst
-            player.thirst = min(player.max_thirst, player.thirst + drink_value)
-            await player.send(f"{c['cyan']}You drink from {fountain.short_desc}.{c['reset']}")
-            if player.thirst >= player.max_thirst:
-                await player.send(f"{c['bright_cyan']}Your thirst is completely quenched.{c['reset']}")
-            elif player.thirst > old_thirst:
-                if player.thirst >= player.max_thirst * 0.75:
-                    await player.send(f"{c['cyan']}You feel well hydrated.{c['reset']}")
-                else:
-                    await player.send(f"{c['cyan']}You feel less thirsty.{c['reset']}")
-            else:
-                await player.send(f"{c['yellow']}You can't drink any more!{c['reset']}")
-            if player.room:
-                await player.room.send_to_room(f"{player.name} drinks from {fountain.short_desc}.", exclude=[player])
-            return
-
-        # Drink from container if explicitly requested or no fountain available
-        if explicit_container:
-            item = explicit_container
-            drinks_remaining = getattr(item, 'drinks', 20)
-            drink_value = 3  # Each drink restores 3 hours of thirst
-
-            if drinks_remaining > 0:
-                item.drinks = drinks_remaining - 1
-
-                old_thirst = player.thirst
-                player.thirst = min(player.max_thirst, player.thirst + drink_value)
-                thirst_restored = player.thirst - old_thirst
-
-                liquid = getattr(item, 'liquid', 'water')
-                await player.send(f"You drink {liquid} from {item.short_desc}.")
-                if player.thirst >= player.max_thirst:
-                    await player.send(f"{c['bright_cyan']}Your thirst is completely quenched.{c['reset']}")
-                elif thirst_restored > 0:
-                    if player.thirst >= player.max_thirst * 0.75:
-                        await player.send(f"{c['cyan']}You feel well hydrated.{c['reset']}")
-                    else:
-                        await player.send(f"{c['cyan']}You feel less thirsty.{c['reset']}")
-                else:
-                    await player.send(f"{c['yellow']}You can't drink any more!{c['reset']}")
-
-                if item.drinks <= 0:
-                    await player.send(f"{c['white']}{item.short_desc} is now empty.{c['reset']}")
-                    player.inventory.remove(item)
-            else:
-                await player.send(f"{item.short_desc} is empty!")
-            return
-
-        await player.send(f"You don't have '{target}'.")
-        
-    @classmethod
-    async def cmd_quaff(cls, player: 'Player', args: List[str]):
-        """Drink a potion."""
-        if not args:
-            await player.send("Quaff what?")
-            return
-            
-        item_name = ' '.join(args).lower()
-        
-        for item in player.inventory:
-            if item_name in item.name.lower():
-                if item.item_type != 'potion':
-                    await player.send(f"You can't quaff {item.short_desc}!")
-                    return
-                    
-                player.inventory.remove(item)
-                c = player.config.COLORS
-                await player.send(f"You quaff {item.short_desc}.")
-
-                # Apply potion effects
-                if hasattr(item, 'spell_effects'):
-                    from spells import SpellHandler
-                    for spell in item.spell_effects:
-                        await SpellHandler.apply_spell_effect(player, player, spell)
-                elif hasattr(item, 'potion_spell'):
-                    # Handle cure potions
-                    from affects import AffectManager
-                    spell_name = item.potion_spell
-
-                    if spell_name == 'cure_poison':
-                        # Remove poison effect
-                        if AffectManager.remove_affect_by_name(player, 'poison'):
-                            await player.send(f"{c['green']}The antidote neutralizes the poison in your blood!{c['reset']}")
-                        else:
-                            await player.send(f"{c['yellow']}You feel refreshed, but you weren't poisoned.{c['reset']}")
-
-                    elif spell_name == 'cure_blindness':
-                        # Remove blindness
-                        if AffectManager.remove_affect_by_name(player, 'blindness'):
-                            await player.send(f"{c['white']}Your vision clears!{c['reset']}")
-                        else:
-                            await player.send(f"{c['yellow']}You feel refreshed, but your vision was fine.{c['reset']}")
-
-                    elif spell_name == 'cure_silence':
-                        # Remove silence
-                        if AffectManager.remove_affect_by_name(player, 'silence'):
-                            await player.send(f"{c['magenta']}You can speak again!{c['reset']}")
-                        else:
-                            await player.send(f"{c['yellow']}You feel refreshed, but you weren't silenced.{c['reset']}")
-
-                    elif spell_name == 'restoration':
-                        # Remove stat debuffs
-                        removed_any = False
-                        if AffectManager.remove_affect_by_name(player, 'weakened'):
-                            await player.send(f"{c['red']}Your strength returns!{c['reset']}")
-                            removed_any = True
-                        if AffectManager.remove_affect_by_name(player, 'slowed'):
-                            await player.send(f"{c['blue']}Your movements quicken!{c['reset']}")
-                            removed_any = True
-                        if not removed_any:
-                            await player.send(f"{c['yellow']}You feel refreshed, but had no debuffs.{c['reset']}")
-
-                    elif spell_name == 'panacea':
-                        # Remove all debuffs
-                        removed = []
-                        if AffectManager.remove_affect_by_name(player, 'poison'):
-                            removed.append('poison')
-                        if AffectManager.remove_affect_by_name(player, 'blindness'):
-                            removed.append('blindness')
-                        if AffectManager.remove_affect_by_name(player, 'silence'):
-                            removed.append('silence')
-                        if AffectManager.remove_affect_by_name(player, 'weakened'):
-                            removed.append('weakness')
-                        if AffectManager.remove_affect_by_name(player, 'slowed'):
-                            removed.append('slowness')
-
-                        if removed:
-                            await player.send(f"{c['bright_yellow']}The panacea purges all ailments from your body!{c['reset']}")
-                            await player.send(f"{c['cyan']}Cured: {', '.join(removed)}{c['reset']}")
-                        else:
-                            await player.send(f"{c['yellow']}You feel incredibly refreshed!{c['reset']}")
-
-                return
-                
-        await player.send(f"You don't have '{item_name}'.")
-
-    @classmethod
-    async def cmd_time_old(cls, player: 'Player', args: List[str]):
-        """Show the current in-game time (old version)."""
-        if not player.world or not getattr(player.world, 'game_time', None):
-            await player.send("Time seems to stand still.")
-            return
-
-        c = player.config.COLORS
-        game_time = player.world.game_time
-        await player.send(
-            f"{c['bright_cyan']}It is {game_time.get_time_string()} ({game_time.get_period()}, {game_time.get_season()}).{c['reset']}"
-        )
-
-    @classmethod
-    async def cmd_reputation(cls, player: 'Player', args: List[str]):
-        """Show reputation standings with all factions.
-        Usage: reputation [faction_name] - Shows all factions or details for one."""
-        from factions import FactionManager
-        c = player.config.COLORS
-
-        if args:
-            # Show detail for a specific faction
-            key = FactionManager.normalize_key(' '.join(args))
-            if not key:
-                await player.send(f"{c['yellow']}Unknown faction. Type 'rep' to see all factions.{c['reset']}")
-                return
-            lines = FactionManager.format_faction_detail(player, key)
-            for line in lines:
-                await player.send(f"{c['white']}{line}{c['reset']}")
-            return
-
-        await player.send(f"\n{c['bright_cyan']}═══ Faction Reputation ═══{c['reset']}")
-        lines = FactionManager.format_reputation_summary(player)
-        for line in lines:
-            await player.send(line)
-        await player.send(f"\n{c['cyan']}Use 'rep <faction>' for details. Use 'faction <name>' for full info.{c['reset']}")
-
-    @classmethod
-    async def cmd_faction(cls, player: 'Player', args: List[str]):
-        """Show detailed reputation for a specific faction."""
-        if not args:
-            await player.send("Usage: faction <name>")
-            return
-
-        from factions import FactionManager
-        c = player.config.COLORS
-        key = FactionManager.normalize_key(' '.join(args))
-        if not key:
-            await player.send(f"{c['yellow']}Unknown faction.{c['reset']}")
-            return
-
-        lines = FactionManager.format_faction_detail(player, key)
-        for line in lines:
-            await player.send(f"{c['white']}{line}{c['reset']}")
-
-    @classmethod
-    async def cmd_gather(cls, player: 'Player', args: List[str]):
-        """Gather resources based on environment (auto-detects type)."""
-        from crafting import gather
-        await gather(player)
-
-    @classmethod
-    async def cmd_mine(cls, player: 'Player', args: List[str]):
-        """Mine ore from mountain or cave rooms."""
-        from crafting import cmd_mine
-        await cmd_mine(player, args)
-
-    @classmethod
-    async def cmd_forage(cls, player: 'Player', args: List[str]):
-        """Forage for herbs in forest or field rooms."""
-        from crafting import cmd_forage
-        await cmd_forage(player, args)
-
-    @classmethod
-    async def cmd_skin(cls, player: 'Player', args: List[str]):
-        """Skin an animal corpse for hides and pelts."""
-        from crafting import cmd_skin
-        await cmd_skin(player, args)
-
-    @classmethod
-    async def cmd_fish(cls, player: 'Player', args: List[str]):
-        """Fish in water rooms."""
-        from crafting import cmd_fish
-        await cmd_fish(player, args)
-
-    @classmethod
-    async def cmd_recipes(cls, player: 'Player', args: List[str]):
-        """Show your known crafting recipes."""
-        from crafting import show_recipes
-        await show_recipes(player, args)
-
-    @classmethod
-    async def cmd_craft(cls, player: 'Player', args: List[str]):
-        """Craft an item from a recipe."""
-        from crafting import craft, craft_list
-        c = player.config.COLORS
-
-        if not args or args[0] == 'list':
-            await craft_list(player, args[1:] if len(args) > 1 else None)
-            return
-
-        await craft(player, args[0])
-
-    @classmethod
-    async def cmd_talk(cls, player: 'Player', args: List[str]):
-        """Talk to an NPC."""
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send("Talk to whom?")
-                return
-
-        if not player.room:
-            await player.send("You are nowhere.")
-            return
-
-        choice_index = None
-        if args and args[-1].isdigit():
-            choice_index = int(args[-1])
-            target_name = ' '.join(args[:-1]).lower()
-        else:
-            target_name = ' '.join(args).lower()
-
-        if not target_name:
-            await player.send("Talk to whom?")
-            return
-
-        from mobs import Mobile
-        target = None
-        for char in player.room.characters:
-            if isinstance(char, Mobile) and target_name in char.name.lower():
-                target = char
-                break
-
-        if not target:
-            await player.send("You don't see them here.")
-            return
-
-        # Reputation gating for NPC interactions
-        try:
-            from factions import FactionManager
-            faction_key = FactionManager.normalize_key(getattr(target, 'faction', None))
-            min_required = None
-            if getattr(target, 'min_rep_talk', None) is not None:
-                min_required = int(target.min_rep_talk)
-            elif getattr(target, 'min_rep_talk_level', None) and faction_key:
-                min_required = FactionManager.get_threshold_for_level(target.min_rep_talk_level)
-
-            if faction_key and min_required is not None:
-                rep = FactionManager.get_reputation(player, faction_key)
-                if rep < min_required:
-                    c = player.config.COLORS
-                    await player.send(f"{c['yellow']}{target.name} refuses to speak with you.{c['reset']}")
-                    return
-        except Exception:
-            pass
-
-        c = player.config.COLORS
-        await player.send(f"{c['bright_green']}You greet {target.name}.{c['reset']}")
-
-        # Trigger NPC responses
-        if target.special:
-            await cls.handle_npc_trigger(player, target, 'hello')
-
-        # Dialogue trees
-        from quests import QuestManager, QUEST_DEFINITIONS
-        if hasattr(target, 'vnum'):
-            await QuestManager.handle_dialogue(player, target.vnum, choice_index)
-
-        # Quest giver interactions
-        if hasattr(target, 'vnum'):
-            available = QuestManager.get_available_quests(player, target.vnum)
-            # Filter out tutorial quests that aren't the current next step
-            if available:
-                active_tutorials = [q.quest_id for q in getattr(player, 'active_quests', []) if q.quest_id.startswith('tutorial_')]
-                if active_tutorials:
-                    # Player has active tutorial — don't show other tutorial quests
-                    available = [q for q in available if not q.startswith('tutorial_')]
-                else:
-                    # Show only the first available tutorial quest (the next in chain)
-                    tutorial_avail = [q for q in available if q.startswith('tutorial_')]
-                    non_tutorial = [q for q in available if not q.startswith('tutorial_')]
-                    available = non_tutorial + tutorial_avail[:1]
-            if available:
-                # Flavorful NPC intro based on quest giver identity
-                _quest_giver_intros = {
-                    4050: "Grimjaw the Prospector strokes his iron-grey beard. 'The deep mines have been overrun, friend. I could use help with a few things...'",
-                    5290: "Captain Varro fixes you with a piercing stare. 'The desert holds many dangers. If you've got steel in your spine, I have work for you.'",
-                    5390: "Professor Khepri adjusts her spectacles excitedly. 'The pyramid holds secrets untold! I need brave souls to help with my research...'",
-                    6090: "Ranger Thornwood nocks an arrow absently. 'The forest grows more dangerous by the day. I could use another pair of hands.'",
-                    6590: "Zilara's silver eyes gleam from beneath her hood. 'The drow stir below. If you dare the darkness, I can guide your purpose.'",
-                    7090: "Skullcap grins, revealing a mouth of mostly-absent teeth. 'The sewers ain't gonna clean themselves, friend. Interested in some dirty work?'",
-                    7390: "Professor Mindwell's hands tremble as he speaks. 'They're down there... the mindflayers. I need someone braver than I to finish what we started.'",
-                    8090: "Drakon runs a whetstone along his massive blade. 'Dragons. Nothing else worth hunting, if you ask me. You look like you might survive.'",
-                    10090: "Scout Harken unfurls a stained map. 'Orc patrols are getting bolder. I've been tracking them — want to help thin the herd?'",
-                    11090: "Lyralei's harp falls silent as she regards you. 'The ancient forest needs protectors. Will you answer its call?'",
-                    14090: "Paladin Dawnguard's war hammer pulses with golden light. 'The undead defile this sacred ground. Join the crusade, and we shall purge them.'",
-                    16090: "Arcanist Veyla's orbiting runes flare briefly. 'The planes bleed into each other here. I need capable hands to help contain the chaos.'",
-                    18090: "Borin the Wilderness Guide checks his massive pack. 'The northern forest is no place for the unprepared. But if you're ready, I've got work.'",
-                    19090: "Freja breathes frost as she speaks. 'The Frostspire is death for the careless. But the rewards... come, let me tell you what I need.'",
-                    22090: "Sir Aldren slams his fist against his dented breastplate. 'Castle Apocalypse WILL fall. This time, I swear it. Are you with me?'",
-                }
-                npc_vnum = getattr(target, 'vnum', 0)
-                intro = _quest_giver_intros.get(npc_vnum)
-                if intro:
-                    await player.send(f"\n{c['bright_yellow']}{intro}{c['reset']}\n")
-                else:
-                    await player.send(f"\n{c['bright_yellow']}{target.name} has quests for you:{c['reset']}")
-                for quest_id in available:
-                    quest_def = QUEST_DEFINITIONS[quest_id]
-                    await player.send(f"  {c['bright_cyan']}{quest_def['name']}{c['reset']} — {c['white']}{quest_def['description'][:80]}{c['reset']}")
-                    await player.send(f"    {c['bright_black']}(quest accept {quest_id}){c['reset']}")
-                await player.send(f"\n{c['white']}Use 'quest accept <quest_id>' to accept a quest.{c['reset']}")
-
-        await QuestManager.check_quest_progress(
-            player, 'talk', {'npc_vnum': getattr(target, 'vnum', 0), 'npc_name': target.name}
-        )
-        
-        # Journal entry for notable NPCs (those with quests, special functions, or notable flag)
-        try:
-            from journal import JournalManager, NOTABLE_NPCS
-            is_notable = (
-                getattr(target, 'notable', False) or
-                getattr(target, 'special', None) or
-                available or  # Has quests
-                getattr(target, 'shopkeeper', False) or
-                getattr(target, 'trainer', False)
-            )
-            if is_notable:
-                npc_key = f"{getattr(target, 'vnum', 0)}_{target.name.lower().replace(' ', '_')}"
-                npc_desc = getattr(target, 'description', '') or getattr(target, 'long_desc', '') or f"A resident of the realm."
-                
-                # Check for predefined lore about this NPC
-                for lore_key, lore_data in NOTABLE_NPCS.items():
-                    if lore_key.lower() in target.name.lower() or target.name.lower() in lore_key.lower():
-                        npc_desc = lore_data['content']
-                        break
-                
-                await JournalManager.discover_npc(
-                    player, npc_key, target.name, npc_desc
-                )
-        except Exception:
-            pass
-
-    @classmethod
-    async def cmd_chat(cls, player: 'Player', args: List[str]):
-        """Have a dynamic AI conversation with an NPC. Usage: chat <npc> <message>"""
-        c = player.config.COLORS
-        
-        if len(args) < 2:
-            await player.send(f"{c['yellow']}Usage: chat <npc> <what you want to say>{c['reset']}")
-            await player.send(f"{c['white']}Example: chat guard Hello, any trouble around here?{c['reset']}")
-            return
-        
-        if not player.room:
-            await player.send("You are nowhere.")
-            return
-        
-        # First arg is NPC name, rest is message
-        target_name = args[0].lower()
-        message = ' '.join(args[1:])
-        
-        from mobs import Mobile
-        target = None
-        for char in player.room.characters:
-            if isinstance(char, Mobile) and target_name in char.name.lower():
-                target = char
-                break
-        
-        if not target:
-            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
-            return
-        
-        # Check AI chat toggle
-        if not getattr(player, 'ai_chat_enabled', True):
-            await player.send(f"{c['yellow']}AI chat is disabled. Use 'ai on' to enable.{c['reset']}")
-            return
-        
-        # Conversation key
-        convo_key = f"chat_{target.vnum if hasattr(target, 'vnum') else id(target)}"
-        if not hasattr(player, 'conversation_history'):
-            player.conversation_history = {}
-        
-        # Handle reset
-        if message.strip().lower() == 'reset':
-            player.conversation_history.pop(convo_key, None)
-            await player.send(f"{c['yellow']}Conversation with {target.name} has been reset.{c['reset']}")
-            return
-        
-        # Show player speaking
-        await player.send(f"{c['white']}You say to {target.name}, \"{message}\"{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(
-                f"{player.name} says something to {target.name}.",
-                exclude=[player]
-            )
-        
-        # Try AI response
-        from ai_service import ai_service
-        
-        # Get NPC personality from attributes or generate defaults
-        npc_desc = getattr(target, 'short_desc', target.name)
-        npc_personality = getattr(target, 'personality', None)
-        
-        if not npc_personality:
-            # Generate personality from NPC type/keywords
-            if any(k in target.name.lower() for k in ['guard', 'soldier', 'knight']):
-                npc_personality = "Serious, dutiful, protective. Speaks formally."
-            elif any(k in target.name.lower() for k in ['merchant', 'vendor', 'shopkeeper']):
-                npc_personality = "Friendly, business-minded, always looking to make a sale."
-            elif any(k in target.name.lower() for k in ['beggar', 'peasant', 'farmer']):
-                npc_personality = "Humble, weary, speaks simply."
-            elif any(k in target.name.lower() for k in ['wizard', 'mage', 'sage']):
-                npc_personality = "Wise, cryptic, speaks in riddles sometimes."
-            elif any(k in target.name.lower() for k in ['priest', 'cleric', 'monk']):
-                npc_personality = "Pious, kind, speaks of faith and blessings."
-            elif any(k in target.name.lower() for k in ['thief', 'rogue', 'bandit']):
-                npc_personality = "Shifty, cunning, speaks in hushed tones."
-            elif any(k in target.name.lower() for k in ['bartender', 'innkeeper']):
-                npc_personality = "Friendly, gossipy, knows local rumors."
-            else:
-                npc_personality = "A typical citizen of the realm."
-        
-        # Get conversation history if we have it
-        history = player.conversation_history.get(convo_key, [])
-        
-        # Generate AI response
-        response = await ai_service.npc_dialogue(
-            npc_name=target.name,
-            npc_desc=npc_desc,
-            npc_personality=npc_personality,
-            player_name=player.name,
-            player_says=message,
-            conversation_history=history
-        )
-        
-        if response:
-            await player.send(f"{c['bright_green']}{target.name} says, \"{response}\"{c['reset']}")
-            
-            # Store in history
-            history.append(f"{player.name}: {message}")
-            history.append(f"{target.name}: {response}")
-            player.conversation_history[convo_key] = history[-8:]  # Keep last 8 lines
-        else:
-            # Fallback to generic responses
-            import random
-            fallbacks = [
-                f"{target.name} looks at you but doesn't seem to understand.",
-                f"{target.name} nods politely.",
-                f"{target.name} shrugs.",
-                f"{target.name} seems distracted.",
-                f"{target.name} grunts acknowledgment.",
-            ]
-            await player.send(f"{c['yellow']}{random.choice(fallbacks)}{c['reset']}")
-
-    @classmethod
-    async def cmd_chathistory(cls, player: 'Player', args: List[str]):
-        """Show recent AI chat history with an NPC. Usage: chathistory <npc>"""
-        c = player.config.COLORS
-        
-        if not args:
-            await player.send(f"{c['yellow']}Usage: chathistory <npc>{c['reset']}")
-            return
-        
-        target_name = ' '.join(args).lower()
-        from mobs import Mobile
-        target = None
-        if player.room:
-            for char in player.room.characters:
-                if isinstance(char, Mobile) and target_name in char.name.lower():
-                    target = char
-                    break
-        
-        if not target:
-            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
-            return
-        
-        if not hasattr(player, 'conversation_history'):
-            player.conversation_history = {}
-        
-        convo_key = f"chat_{target.vnum if hasattr(target, 'vnum') else id(target)}"
-        history = player.conversation_history.get(convo_key, [])
-        
-        if not history:
-            await player.send(f"{c['yellow']}No conversation history with {target.name}.{c['reset']}")
-            return
-        
-        await player.send(f"{c['cyan']}=== Chat History: {target.name} ==={c['reset']}")
-        for line in history:
-            await player.send(f"{c['white']}{line}{c['reset']}")
-
-    @classmethod
-    async def cmd_ai(cls, player: 'Player', args: List[str]):
-        """Toggle AI chat on/off. Usage: ai on|off"""
-        c = player.config.COLORS
-        
-        if not args:
-            status = 'ON' if getattr(player, 'ai_chat_enabled', True) else 'OFF'
-            await player.send(f"{c['cyan']}AI chat is currently {status}.{c['reset']}")
-            await player.send(f"{c['yellow']}Usage: ai on|off{c['reset']}")
-            return
-        
-        val = args[0].lower()
-        if val not in ['on', 'off']:
-            await player.send(f"{c['red']}Usage: ai on|off{c['reset']}")
-            return
-        
-        player.ai_chat_enabled = (val == 'on')
-        await player.send(f"{c['green']}AI chat {val.upper()}.{c['reset']}")
-
-    @classmethod
-    async def cmd_aistatus(cls, player: 'Player', args: List[str]):
-        """Check AI service status (admin command)."""
-        c = player.config.COLORS
-        
-        from ai_service import ai_service
-        
-        await player.send(f"{c['cyan']}=== AI Service Status ==={c['reset']}")
-        await player.send(f"  Enabled: {c['green'] if ai_service.config.enabled else c['red']}{ai_service.config.enabled}{c['reset']}")
-        await player.send(f"  Available: {c['green'] if ai_service.available else c['red']}{ai_service.available}{c['reset']}")
-        await player.send(f"  Endpoint: {ai_service.config.base_url}")
-        await player.send(f"  Cache entries: {len(ai_service.cache)}")
-        
-        # Try to check connection
-        available = await ai_service.check_availability()
-        if available:
-            await player.send(f"{c['bright_green']}LM Studio is running and ready!{c['reset']}")
-        else:
-            await player.send(f"{c['yellow']}LM Studio not detected. Start it for AI features.{c['reset']}")
-
-    @classmethod
-    async def cmd_quest(cls, player: 'Player', args: List[str]):
-        """Manage quests."""
-        from quests import QuestManager
-        from datetime import datetime
-
-        c = player.config.COLORS
-
-        if not args:
-            # Show active quests
-            if not hasattr(player, 'active_quests') or not player.active_quests:
-                await player.send(f"{c['yellow']}You have no active quests.{c['reset']}")
-                await player.send(f"{c['white']}Talk to NPCs to find available quests!{c['reset']}")
-                return
-
-            await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
-            await player.send(f"{c['cyan']}║{c['bright_yellow']} Active Quests{c['cyan']}                                                  ║{c['reset']}")
-            await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}\r\n")
-
-            for quest in player.active_quests:
-                complete_str = f"{c['bright_green']}COMPLETE{c['reset']}" if quest.is_complete() else f"{c['yellow']}In Progress{c['reset']}"
-                await player.send(f"{c['bright_cyan']}{quest.name}{c['reset']} [{complete_str}]")
-                await player.send(f"{c['white']}{quest.description}{c['reset']}")
-                await player.send(quest.get_progress_string())
-
-                if quest.is_complete():
-                    await player.send(f"{c['bright_green']}✓ Return to quest giver to complete!{c['reset']}")
-
-                if quest.time_limit:
-                    elapsed = (datetime.now() - quest.started_at).total_seconds() / 60
-                    remaining = quest.time_limit - elapsed
-                    if remaining > 0:
-                        await player.send(f"{c['yellow']}Time remaining: {int(remaining)} minutes{c['reset']}")
-                    else:
-                        await player.send(f"{c['red']}TIME EXPIRED!{c['reset']}")
-
-                await player.send("")  # Blank line between quests
-
-            return
-
-        subcommand = args[0].lower()
-
-        if subcommand == 'accept':
-            if len(args) < 2:
-                await player.send("Usage: quest accept <quest_id>")
-                return
-            await QuestManager.accept_quest(player, args[1])
-
-        elif subcommand == 'abandon':
-            if len(args) < 2:
-                await player.send("Usage: quest abandon <quest_id>")
-                return
-            await QuestManager.abandon_quest(player, args[1])
-
-        elif subcommand == 'complete':
-            if len(args) < 2:
-                await player.send("Usage: quest complete <quest_id>")
-                return
-            await QuestManager.complete_quest(player, args[1])
-
-        elif subcommand == 'log':
-            # Show completed quests
-            if not hasattr(player, 'quests_completed') or not player.quests_completed:
-                await player.send(f"{c['yellow']}You haven't completed any quests yet.{c['reset']}")
-                return
-
-            await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
-            await player.send(f"{c['cyan']}║{c['bright_yellow']} Completed Quests{c['cyan']}                                             ║{c['reset']}")
-            await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}\r\n")
-
-            for quest_id in player.quests_completed:
-                await player.send(f"{c['bright_green']}✓{c['reset']} {quest_id}")
-
-            await player.send(f"\r\n{c['white']}Total: {len(player.quests_completed)} quests completed{c['reset']}\r\n")
-
-        elif subcommand == 'list' or subcommand == 'available':
-            # Show available quests from NPCs in the current room
-            from quests import QuestManager, QUEST_DEFINITIONS
-
-            if not player.room:
-                await player.send("You need to be somewhere to find quests!")
-                return
-
-            found_quests = False
-            for npc in player.room.npcs:
-                vnum = getattr(npc, 'vnum', 0)
-                available = QuestManager.get_available_quests(player, vnum)
-                if available:
-                    if not found_quests:
-                        await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
-                        await player.send(f"{c['cyan']}║{c['bright_yellow']} Available Quests{c['cyan']}                                             ║{c['reset']}")
-                        await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}\r\n")
-                        found_quests = True
-
-                    await player.send(f"{c['bright_cyan']}From {npc.name}:{c['reset']}")
-                    for quest_id in available:
-                        quest_def = QUEST_DEFINITIONS[quest_id]
-                        lvl_range = f"[L{quest_def['level_min']}-{quest_def['level_max']}]"
-                        repeatable = " {c['bright_green']}(Repeatable){c['reset']}" if quest_def.get('repeatable') else ""
-                        await player.send(f"  {c['bright_yellow']}{quest_def['name']}{c['reset']} {lvl_range}{repeatable}")
-                        await player.send(f"    {c['white']}{quest_def['description'][:70]}{c['reset']}")
-                        await player.send(f"    {c['bright_black']}(quest accept {quest_id}){c['reset']}")
-                    await player.send("")
-
-            if not found_quests:
-                await player.send(f"{c['yellow']}No quests available from NPCs in this room.{c['reset']}")
-                await player.send(f"{c['white']}Check the Quest Board in Temple Square, or visit zone quest givers throughout the realm.{c['reset']}")
-            else:
-                await player.send(f"{c['white']}Use 'quest accept <quest_id>' to accept a quest.{c['reset']}\r\n")
-
-        elif subcommand == 'info':
-            # Show details about a specific quest
-            from quests import QUEST_DEFINITIONS
-
-            if len(args) < 2:
-                await player.send("Usage: quest info <quest_id>")
-                return
-
-            quest_id = args[1]
-            if quest_id not in QUEST_DEFINITIONS:
-                await player.send(f"Unknown quest: {quest_id}")
-                return
-
-            quest_def = QUEST_DEFINITIONS[quest_id]
-            await player.send(f"\r\n{c['bright_yellow']}Quest: {quest_def['name']}{c['reset']}")
-            await player.send(f"{c['white']}{quest_def['description']}{c['reset']}\r\n")
-            await player.send(f"{c['cyan']}Level Range:{c['reset']} {quest_def['level_min']}-{quest_def['level_max']}")
-            await player.send(f"{c['cyan']}Type:{c['reset']} {quest_def['type'].title()}")
-            await player.send(f"{c['cyan']}Repeatable:{c['reset']} {'Yes' if quest_def.get('repeatable') else 'No'}\r\n")
-
-            await player.send(f"{c['cyan']}Objectives:{c['reset']}")
-            for obj in quest_def['objectives']:
-                await player.send(f"  - {obj['description']} (x{obj['required']})")
-
-            await player.send(f"\r\n{c['green']}Rewards:{c['reset']}")
-            if quest_def['rewards'].get('exp'):
-                await player.send(f"  - {quest_def['rewards']['exp']} experience")
-            if quest_def['rewards'].get('gold'):
-                await player.send(f"  - {quest_def['rewards']['gold']} gold")
-            await player.send("")
-
-        else:
-            await player.send(f"Unknown quest command: {subcommand}")
-            await player.send("Usage: quest [list|accept|abandon|complete|log|info]")
-
-    @classmethod
-    async def cmd_questlog(cls, player: 'Player', args: List[str]):
-        """Show quest log (alias for quest log)."""
-        await cls.cmd_quest(player, ['log'])
-
-    @classmethod
-    async def cmd_quests(cls, player: 'Player', args: List[str]):
-        """Quest journal — view active and completed quests by category.
-        
-        Usage:
-            quests               - Show all active quests grouped by category
-            quests completed     - Show completed quests
-            quests daily         - Show available daily quests
-            quests main          - Show main story quests only
-            quests side          - Show side quests only
-            quests faction       - Show faction quests only
-            quests dungeon       - Show dungeon quests only
-            quests track <name>  - Track a quest (show progress in prompt)
-            quests untrack       - Stop tracking
-        """
-        from quests import QuestManager, QUEST_DEFINITIONS, QUEST_CATEGORY_INFO
-
-        c = player.config.COLORS
-        sub = args[0].lower() if args else None
-
-        # Track/untrack subcommands
-        if sub == 'track':
-            if len(args) < 2:
-                await player.send(f"{c['yellow']}Usage: quests track <quest name or id>{c['reset']}")
-                return
-            search = ' '.join(args[1:]).lower()
-            for quest in getattr(player, 'active_quests', []):
-                if search in quest.quest_id.lower() or search in quest.name.lower():
-                    player.tracked_quest = quest.quest_id
-                    await player.send(f"{c['bright_green']}Now tracking: {quest.name}{c['reset']}")
-                    return
-            await player.send(f"{c['red']}No active quest matching '{search}'.{c['reset']}")
-            return
-
-        if sub == 'untrack':
-            player.tracked_quest = None
-            await player.send(f"{c['cyan']}Quest tracking disabled.{c['reset']}")
-            return
-
-        # Completed quests view
-        if sub == 'completed':
-            completed = getattr(player, 'quests_completed', [])
-            if not completed:
-                await player.send(f"{c['yellow']}You haven't completed any quests yet.{c['reset']}")
-                return
-            await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
-            await player.send(f"{c['cyan']}║{c['bright_yellow']}  QUEST JOURNAL - Completed ({len(completed)} quests)                     {c['cyan']}║{c['reset']}")
-            await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}")
-            # Group by category
-            by_cat = {}
-            for qid in completed:
-                cat = QuestManager.get_quest_category(qid)
-                by_cat.setdefault(cat, []).append(qid)
-            for cat_key in ['main_story', 'side', 'daily', 'faction', 'dungeon']:
-                quests = by_cat.get(cat_key, [])
-                if not quests:
-                    continue
-                info = QUEST_CATEGORY_INFO.get(cat_key, {'name': cat_key.title(), 'color': 'white', 'icon': '-'})
-                await player.send(f"\r\n  {c[info['color']]}{info['icon']} {info['name']}{c['reset']}")
-                for qid in quests:
-                    qdef = QUEST_DEFINITIONS.get(qid, {})
-                    name = qdef.get('name', qid)
-                    await player.send(f"    {c['green']}✓{c['reset']} {name}")
-            await player.send("")
-            return
-
-        # Daily quests view
-        if sub == 'daily':
-            await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
-            await player.send(f"{c['cyan']}║{c['bright_green']}  DAILY QUESTS                                                {c['cyan']}║{c['reset']}")
-            await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}")
-            for qid, qdef in QUEST_DEFINITIONS.items():
-                if not qdef.get('daily'):
-                    continue
-                can_do = QuestManager.can_accept_daily(player, qid)
-                already_active = QuestManager.has_active_quest(player, qid)
-                if already_active:
-                    status = f"{c['yellow']}In Progress{c['reset']}"
-                elif can_do:
-                    status = f"{c['bright_green']}Available{c['reset']}"
-                else:
-                    status = f"{c['bright_black']}Done Today{c['reset']}"
-                await player.send(f"\r\n  {c['bright_white']}{qdef['name']}{c['reset']} [{status}]")
-                await player.send(f"  {c['white']}{qdef['description']}{c['reset']}")
-                rewards = []
-                if qdef['rewards'].get('exp'):
-                    rewards.append(f"{qdef['rewards']['exp']} XP")
-                if qdef['rewards'].get('gold'):
-                    rewards.append(f"{qdef['rewards']['gold']} gold")
-                if rewards:
-                    await player.send(f"  {c['yellow']}Rewards: {', '.join(rewards)}{c['reset']}")
-            await player.send(f"\r\n  {c['cyan']}Daily quests reset at midnight.{c['reset']}\r\n")
-            return
-
-        # Filter by specific category
-        cat_filter = None
-        cat_map = {'main': 'main_story', 'story': 'main_story', 'side': 'side',
-                    'faction': 'faction', 'dungeon': 'dungeon'}
-        if sub and sub in cat_map:
-            cat_filter = cat_map[sub]
-
-        # Area or name lookup (quests <area> | quests <name>)
-        if sub and sub not in cat_map:
-            if sub not in ('completed', 'daily', 'track', 'untrack'):
-                term = ' '.join(args).strip().lower()
-                active = getattr(player, 'active_quests', [])
-
-                def _raw_area(qid=None, qdef=None):
-                    return QuestManager.get_quest_area(player, quest_id=qid, quest_def=qdef)
-
-                def _quest_area(qid=None, qdef=None):
-                    return _raw_area(qid=qid, qdef=qdef) or 'Unknown'
-
-                # Detect area matches from known quest definitions
-                known_areas = {(area).lower() for area in (_raw_area(qdef=qdef) for qdef in QUEST_DEFINITIONS.values()) if area}
-                is_area = any(term in area for area in known_areas)
-
-                if is_area:
-                    area_matches = [(q, _quest_area(qid=q.quest_id)) for q in active if term in _quest_area(qid=q.quest_id).lower()]
-                    if area_matches:
-                        await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
-                        await player.send(f"{c['cyan']}║{c['bright_yellow']}  QUESTS IN {area_matches[0][1][:46]:<46}{c['cyan']}║{c['reset']}")
-                        await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}")
-                        for quest, area in area_matches:
-                            done = sum(1 for o in quest.objectives if o.completed)
-                            total = len(quest.objectives)
-                            await player.send(f"  {c['bright_white']}{quest.name}{c['reset']} {c['yellow']}[{done}/{total}]{c['reset']}")
-                        await player.send("")
-                        return
-
-                    area_defs = [(qid, qdef, _quest_area(qdef=qdef)) for qid, qdef in QUEST_DEFINITIONS.items()
-                                 if term in _quest_area(qdef=qdef).lower()]
-                    if area_defs:
-                        await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
-                        await player.send(f"{c['cyan']}║{c['bright_yellow']}  QUESTS BY AREA                                             {c['cyan']}║{c['reset']}")
-                        await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}")
-                        for qid, qdef, area in area_defs[:12]:
-                            lvl = f"L{qdef.get('level_min', 1)}-{qdef.get('level_max', 1)}"
-                            await player.send(f"  {c['bright_white']}{qdef.get('name', qid)}{c['reset']} {c['bright_black']}({qid}){c['reset']} {c['yellow']}[{lvl}]{c['reset']}")
-                        if len(area_defs) > 12:
-                            await player.send(f"  {c['bright_black']}...and {len(area_defs) - 12} more. Use a narrower area search.{c['reset']}")
-                        await player.send("")
-                        return
-
-                # Name/abbrev lookup
-                name_matches = [q for q in active if term in q.quest_id.lower() or term in q.name.lower()]
-                if name_matches:
-                    await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
-                    await player.send(f"{c['cyan']}║{c['bright_yellow']}  QUEST MATCHES                                              {c['cyan']}║{c['reset']}")
-                    await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}")
-                    for quest in name_matches:
-                        area = _quest_area(qid=quest.quest_id)
-                        done = sum(1 for o in quest.objectives if o.completed)
-                        total = len(quest.objectives)
-                        await player.send(f"  {c['bright_white']}{quest.name}{c['reset']} {c['yellow']}[{done}/{total}]{c['reset']} {c['bright_black']}({area}){c['reset']}")
-                    await player.send("")
-                    return
-
-                def_matches = [(qid, qdef) for qid, qdef in QUEST_DEFINITIONS.items()
-                               if term in qid.lower() or term in qdef.get('name', '').lower()]
-                if def_matches:
-                    await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
-                    await player.send(f"{c['cyan']}║{c['bright_yellow']}  QUEST LOOKUP                                               {c['cyan']}║{c['reset']}")
-                    await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}")
-                    for qid, qdef in def_matches[:10]:
-                        area = _quest_area(qdef=qdef)
-                        lvl = f"L{qdef.get('level_min', 1)}-{qdef.get('level_max', 1)}"
-                        await player.send(f"  {c['bright_white']}{qdef.get('name', qid)}{c['reset']} {c['bright_black']}({qid}){c['reset']} {c['yellow']}[{lvl}]{c['reset']} {c['bright_black']}{area}{c['reset']}")
-                    if len(def_matches) > 10:
-                        await player.send(f"  {c['bright_black']}...and {len(def_matches) - 10} more. Try a narrower name search.{c['reset']}")
-                    await player.send("")
-                    return
-
-                await player.send(f"{c['yellow']}No quests found matching '{term}'.{c['reset']}")
-                return
-
-        # Active quests view (default)
-        active = getattr(player, 'active_quests', [])
-        if not active:
-            await player.send(f"{c['yellow']}You have no active quests. Talk to NPCs to find adventures!{c['reset']}")
-            return
-
-        await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
-        title_str = "QUEST JOURNAL"
-        if cat_filter:
-            info = QUEST_CATEGORY_INFO.get(cat_filter, {})
-            title_str = f"QUEST JOURNAL - {info.get('name', cat_filter.title())}"
-        await player.send(f"{c['cyan']}║{c['bright_yellow']}  {title_str:<58}{c['cyan']}║{c['reset']}")
-        await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}")
-
-        # Group active quests by category
-        by_cat = {}
-        for quest in active:
-            cat = QuestManager.get_quest_category(quest.quest_id)
-            if cat_filter and cat != cat_filter:
-                continue
-            by_cat.setdefault(cat, []).append(quest)
-
-        if not by_cat:
-            await player.send(f"\r\n  {c['yellow']}No quests in this category.{c['reset']}\r\n")
-            return
-
-        tracked = getattr(player, 'tracked_quest', None)
-
-        for cat_key in ['main_story', 'side', 'daily', 'faction', 'dungeon']:
-            quests = by_cat.get(cat_key, [])
-            if not quests:
-                continue
-            info = QUEST_CATEGORY_INFO.get(cat_key, {'name': cat_key.title(), 'color': 'white', 'icon': '-'})
-            await player.send(f"\r\n  {c[info['color']]}{info['icon']} {info['name']}{c['reset']}")
-
-            for quest in quests:
-                track_mark = f" {c['bright_yellow']}[TRACKED]{c['reset']}" if tracked == quest.quest_id else ""
-                if quest.is_complete():
-                    status = f"{c['bright_green']}COMPLETE{c['reset']}"
-                else:
-                    done = sum(1 for o in quest.objectives if o.completed)
-                    total = len(quest.objectives)
-                    status = f"{c['yellow']}{done}/{total}{c['reset']}"
-                await player.send(f"    {c['bright_white']}{quest.name}{c['reset']} [{status}]{track_mark}")
-
-                for obj in quest.objectives:
-                    if obj.completed:
-                        await player.send(f"      {c['green']}✓ {obj.description}{c['reset']}")
-                    else:
-                        await player.send(f"      {c['white']}  {obj.description} ({obj.current}/{obj.required}){c['reset']}")
-
-                if quest.is_complete():
-                    await player.send(f"      {c['bright_green']}→ Return to quest giver!{c['reset']}")
-
-        await player.send(f"\r\n  {c['cyan']}Commands: quests completed | daily | track <name> | untrack{c['reset']}\r\n")
-
-    @classmethod
-    async def cmd_story(cls, player: 'Player', args: List[str]):
-        """Show main story quest progress."""
-        from quests import QuestManager, QUEST_CHAINS, QUEST_DEFINITIONS
-
-        c = player.config.COLORS
-        chain_def = QUEST_CHAINS.get('main_story')
-        if not chain_def:
-            await player.send(f"{c['yellow']}No main story configured.{c['reset']}")
-            return
-
-        state = QuestManager._get_chain_state(player, 'main_story')
-        await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
-        await player.send(f"{c['cyan']}║{c['bright_yellow']} Main Story Progress{c['cyan']}                                          ║{c['reset']}")
-        await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}\r\n")
-
-        await player.send(f"{c['bright_cyan']}{QuestManager.get_story_progress(player)}{c['reset']}")
-        await player.send("")
-
-        if not state:
-            return
-
-        stages = chain_def.get('stages', {})
-        history = set(state.get('history', []))
-        current = state.get('stage')
-
-        for stage_id, stage_def in stages.items():
-            quest_id = stage_def.get('quest_id')
-            quest_name = QUEST_DEFINITIONS.get(quest_id, {}).get('name', quest_id)
-            if stage_id in history:
-                status = f"{c['bright_green']}✓ COMPLETE{c['reset']}"
-            elif stage_id == current:
-                status = f"{c['yellow']}▶ CURRENT{c['reset']}"
-            else:
-                status = f"{c['white']}LOCKED{c['reset']}"
-            await player.send(f"{status} {quest_name}")
-
-        await player.send("")
-
-    # ==================== PET/COMPANION COMMANDS ====================
-
-    @classmethod
-    async def cmd_order(cls, player: 'Player', args: List[str]):
-        """Order your companion or pet. Usage: order <action> [target] OR order <pet> <action> [target]"""
-        from pets import PetManager
-        from companions import CompanionManager
-
-        c = player.config.COLORS
-
-        if not args:
-            await player.send(f"{c['yellow']}Usage: order <action> [target]{c['reset']}")
-            await player.send(f"Actions: attack, assist, follow, stay, guard, protect, fetch, report")
-            await player.send(f"Positions: sit, stand, sleep, rest")
-            await player.send(f"Movement: order north/south/east/west/up/down")
-            await player.send(f"{c['cyan']}Assist: 'order assist' - pet attacks what you're fighting{c['reset']}")
-            await player.send(f"{c['cyan']}Report: 'order report' - pet reports its status{c['reset']}")
-            await player.send(f"{c['cyan']}Protect: 'order protect <player>' - pet intercepts attacks{c['reset']}")
-            return
-
-        # Check for companion order by name
-        companions = CompanionManager.get_player_companions(player)
-        if companions:
-            companion = CompanionManager.find_companion(player, args[0])
-            if companion:
-                if len(args) < 2:
-                    await player.send(f"{c['yellow']}Usage: order <companion> <action> [target]{c['reset']}")
-                    return
-                action = args[1]
-                target = ' '.join(args[2:]) if len(args) > 2 else ''
-                await CompanionManager.order_companion(player, companion, action, target)
-                return
-
-        # Get all pets
-        pets = PetManager.get_player_pets(player)
-        if not pets:
-            await player.send(f"{c['red']}You don't have any pets to command!{c['reset']}")
-            return
-
-        # Check if first arg is a pet name
-        command = args[0].lower()
-        target = ' '.join(args[1:]) if len(args) > 1 else ''
-        
-        # Check if first arg matches a pet name - if so, shift args
-        for pet in pets:
-            if pet.name.lower().startswith(command) or command in pet.name.lower():
-                if len(args) >= 2:
-                    command = args[1].lower()
-                    target = ' '.join(args[2:]) if len(args) > 2 else ''
-                    if pet.room == player.room:
-                        await pet.execute_command(command, target)
-                    else:
-                        await player.send(f"{c['yellow']}{pet.name} is not here.{c['reset']}")
-                    return
-
-        # Order all pets in room
-        ordered_any = False
-        for pet in pets:
-            if pet.room == player.room:
-                await pet.execute_command(command, target)
-                ordered_any = True
-        
-        if not ordered_any:
-            await player.send(f"{c['yellow']}None of your pets are here.{c['reset']}")
-
-    @classmethod
-    async def cmd_pets(cls, player: 'Player', args: List[str]):
-        """Manage all your pets. Usage: pets [list|report|assist|recall|dismiss all]"""
-        from pets import PetManager
-        c = player.config.COLORS
-        
-        pets = PetManager.get_player_pets(player)
-        
-        if not args:
-            args = ['list']
-            
-        action = args[0].lower()
-        
-        if action == 'list':
-            if not pets:
-                await player.send(f"{c['yellow']}You don't have any pets.{c['reset']}")
-                return
-                
-            await player.send(f"{c['cyan']}╔═══════════════════════════════════════════════════════════╗{c['reset']}")
-            await player.send(f"{c['cyan']}║{c['reset']}              {c['bright_white']}YOUR PETS{c['reset']}                                   {c['cyan']}║{c['reset']}")
-            await player.send(f"{c['cyan']}╠═══════════════════════════════════════════════════════════╣{c['reset']}")
-            
-            for i, pet in enumerate(pets, 1):
-                hp_pct = int((pet.hp / pet.max_hp) * 100) if pet.max_hp > 0 else 0
-                if hp_pct > 75:
-                    hp_color = c['bright_green']
-                elif hp_pct > 50:
-                    hp_color = c['green']
-                elif hp_pct > 25:
-                    hp_color = c['yellow']
-                else:
-                    hp_color = c['red']
-                
-                # Location
-                if pet.room == player.room:
-                    loc = f"{c['green']}Here{c['reset']}"
-                elif pet.room:
-                    loc = f"{c['yellow']}{pet.room.name[:15]}{c['reset']}"
-                else:
-                    loc = f"{c['red']}Unknown{c['reset']}"
-                
-                # Fighting status
-                if pet.is_fighting and pet.fighting:
-                    status = f"{c['red']}Fighting {pet.fighting.name[:10]}{c['reset']}"
-                else:
-                    status = f"{c['green']}Idle{c['reset']}"
-                
-                await player.send(f"{c['cyan']}║{c['reset']} {i}. {c['white']}{pet.name[:18]:<18}{c['reset']} Lvl {pet.level:<2} {hp_color}{pet.hp:>4}/{pet.max_hp:<4}{c['reset']} {loc:<20} {status} {c['cyan']}║{c['reset']}")
-            
-            await player.send(f"{c['cyan']}╠═══════════════════════════════════════════════════════════╣{c['reset']}")
-            await player.send(f"{c['cyan']}║{c['reset']} Commands: pets report | pets assist | pets recall         {c['cyan']}║{c['reset']}")
-            await player.send(f"{c['cyan']}╚═══════════════════════════════════════════════════════════╝{c['reset']}")
-            
-        elif action == 'report':
-            if not pets:
-                await player.send(f"{c['yellow']}You don't have any pets.{c['reset']}")
-                return
-            for pet in pets:
-                await pet.execute_command('report', '')
-                
-        elif action == 'assist':
-            if not pets:
-                await player.send(f"{c['yellow']}You don't have any pets.{c['reset']}")
-                return
-            if not player.is_fighting:
-                await player.send(f"{c['yellow']}You're not fighting anyone!{c['reset']}")
-                return
-            for pet in pets:
-                if pet.room == player.room:
-                    await pet.execute_command('assist', '')
-                    
-        elif action == 'recall':
-            if not pets:
-                await player.send(f"{c['yellow']}You don't have any pets.{c['reset']}")
-                return
-            for pet in pets:
-                if pet.room != player.room:
-                    if pet.room:
-                        pet.room.characters.remove(pet)
-                    pet.room = player.room
-                    player.room.characters.append(pet)
-                    await player.send(f"{c['green']}{pet.name} appears at your side!{c['reset']}")
-                    await player.room.send_to_room(f"{c['cyan']}{pet.name} appears at {player.name}'s side.{c['reset']}", exclude=[player])
-                else:
-                    await player.send(f"{c['yellow']}{pet.name} is already here.{c['reset']}")
-                    
-        elif action == 'dismiss' and len(args) > 1 and args[1].lower() == 'all':
-            if not pets:
-                await player.send(f"{c['yellow']}You don't have any pets.{c['reset']}")
-                return
-            count = 0
-            for pet in list(pets):
-                await PetManager.dismiss_pet(pet)
-                count += 1
-            await player.send(f"{c['green']}Dismissed {count} pet(s).{c['reset']}")
-            
-        else:
-            await player.send(f"{c['yellow']}Usage: pets [list|report|assist|recall|dismiss all]{c['reset']}")
-
-    @classmethod
-    async def cmd_dismiss(cls, player: 'Player', args: List[str]):
-        """Dismiss a pet or companion. Usage: dismiss <pet name>"""
-        from pets import PetManager
-        from companions import CompanionManager
-
-        c = player.config.COLORS
-        
-        pets = PetManager.get_player_pets(player)
-        
-        # If no pets at all
-        if not pets and not getattr(player, 'animal_companion', None):
-            await player.send(f"{c['red']}You don't have any pets to dismiss!{c['reset']}")
-            return
-
-        # If a name is provided, find that specific pet
-        if args:
-            target_name = ' '.join(args).lower()
-            
-            # Check companions first
-            companion = CompanionManager.find_companion(player, target_name)
-            if companion:
-                await CompanionManager.dismiss_companion(player, companion)
-                return
-            
-            # Check animal companion (ranger)
-            if player.animal_companion and target_name in player.animal_companion.name.lower():
-                comp = player.animal_companion
-                await player.send(f"{c['cyan']}You release {comp.name} back to the wild.{c['reset']}")
-                if player.room and comp in player.room.characters:
-                    player.room.characters.remove(comp)
-                if hasattr(player, 'group_members') and comp in player.group_members:
-                    player.group_members.remove(comp)
-                if hasattr(player.world, 'npcs') and comp in player.world.npcs:
-                    player.world.npcs.remove(comp)
-                player.animal_companion = None
-                return
-            
-            # Check undead/summoned pets
-            for pet in pets:
-                if target_name in pet.name.lower():
-                    await PetManager.dismiss_pet(pet)
-                    await player.send(f"{c['green']}You dismiss {pet.name}.{c['reset']}")
-                    return
-            
-            await player.send(f"{c['yellow']}You don't have a pet named '{target_name}'.{c['reset']}")
-            return
-
-        # No name provided - list pets
-        await player.send(f"{c['cyan']}Your pets:{c['reset']}")
-        for pet in pets:
-            await player.send(f"  {c['yellow']}{pet.name}{c['reset']}")
-        if player.animal_companion:
-            await player.send(f"  {c['yellow']}{player.animal_companion.name}{c['reset']} (companion)")
-        await player.send(f"{c['white']}Use 'dismiss <name>' to dismiss a specific pet.{c['reset']}")
-
-    @classmethod
-    async def cmd_hire(cls, player: 'Player', args: List[str]):
-        """Hire a companion from a tavern or guild. Usage: hire <npc>"""
-        from companions import CompanionManager
-
-        c = player.config.COLORS
-
-        if not args:
-            await player.send(f"{c['yellow']}Usage: hire <npc>{c['reset']}")
-            return
-
-        target_name = ' '.join(args).lower()
-        target = None
-        for char in player.room.characters:
-            if char != player and not hasattr(char, 'connection') and target_name in char.name.lower():
-                target = char
-                break
-
-        if not target:
-            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
-            return
-
-        await CompanionManager.hire_companion(player, target)
-
-    @classmethod
-    async def cmd_companions(cls, player: 'Player', args: List[str]):
-        """List your current companions. Usage: companions"""
-        from companions import CompanionManager
-
-        c = player.config.COLORS
-        companions = CompanionManager.get_player_companions(player)
-        if not companions:
-            await player.send(f"{c['yellow']}You have no companions.{c['reset']}")
-            return
-
-        await player.send(f"{c['cyan']}╔═══════════════════════════════════════╗{c['reset']}")
-        await player.send(f"{c['cyan']}║{c['bright_yellow']}           Your Companions             {c['cyan']}║{c['reset']}")
-        await player.send(f"{c['cyan']}╠═══════════════════════════════════════╣{c['reset']}")
-        for comp in companions:
-            hp_pct = int((comp.hp / max(1, comp.max_hp)) * 100)
-            await player.send(
-                f"{c['cyan']}║ {c['bright_green']}{comp.name[:16]:<16} {c['white']}Lv {comp.level:<2} {c['yellow']}{comp.companion_type:<6} {c['magenta']}{hp_pct:>3}% {c['cyan']}║{c['reset']}"
-            )
-            await player.send(
-                f"{c['cyan']}║ {c['white']}Morale:{comp.morale:<3} Loyalty:{comp.loyalty:<3} Order:{comp.order:<6} Upkeep:{comp.daily_upkeep:<4}{c['cyan']}║{c['reset']}"
-            )
-        await player.send(f"{c['cyan']}╚═══════════════════════════════════════╝{c['reset']}")
-
-    @classmethod
-    async def cmd_minions(cls, player: 'Player', args: List[str]):
-        """List your summoned minions (undead, summons). Usage: minions"""
-        from pets import PetManager
-
-        c = player.config.COLORS
-        pets = PetManager.get_player_pets(player)
-        minions = [p for p in pets if not p.is_persistent]
-        
-        if not minions:
-            await player.send(f"{c['yellow']}You have no summoned minions.{c['reset']}")
-            return
-
-        await player.send(f"{c['magenta']}╔═══════════════════════════════════════╗{c['reset']}")
-        await player.send(f"{c['magenta']}║{c['bright_magenta']}           Your Minions                {c['magenta']}║{c['reset']}")
-        await player.send(f"{c['magenta']}╠═══════════════════════════════════════╣{c['reset']}")
-        for minion in minions:
-            hp_pct = int((minion.hp / max(1, minion.max_hp)) * 100)
-            timer_str = ""
-            if minion.timer:
-                mins_left = minion.timer // 60
-                timer_str = f" ({mins_left}m)"
-            await player.send(
-                f"{c['magenta']}║ {c['bright_red']}{minion.name[:18]:<18} {c['white']}Lv {minion.level:<2} {c['yellow']}{hp_pct:>3}%{timer_str:<8}{c['magenta']}║{c['reset']}"
-            )
-        await player.send(f"{c['magenta']}╚═══════════════════════════════════════╝{c['reset']}")
-
-    @classmethod
-    async def cmd_tame(cls, player: 'Player', args: List[str]):
-        """Tame a wild creature. Usage: tame <creature>"""
-        from pets import PetManager
-
-        c = player.config.COLORS
-
-        # Check if ranger
-        if player.char_class != 'ranger':
-            await player.send(f"{c['red']}Only Rangers can tame creatures!{c['reset']}")
-            return
-
-        if not args:
-            await player.send(f"{c['yellow']}Usage: tame <creature>{c['reset']}")
-            return
-
-        target_name = ' '.join(args).lower()
-
-        # Find creature in room
-        target = None
-        for char in player.room.characters:
-            if char != player and hasattr(char, 'name'):
-                if char.name.lower().startswith(target_name):
-                    target = char
-                    break
-
-        if not target:
-            await player.send(f"{c['red']}There's no '{target_name}' here to tame.{c['reset']}")
-            return
-
-        # Can't tame players or existing pets
-        if hasattr(target, 'connection'):
-            await player.send(f"{c['red']}You can't tame a player!{c['reset']}")
-            return
-
-        if hasattr(target, 'owner'):
-            await player.send(f"{c['red']}That creature is already tamed!{c['reset']}")
-            return
-
-        # Attempt to tame
-        success = await PetManager.tame_companion(player, target)
-        if success:
-            await player.send(f"{c['bright_green']}You successfully tame {target.name}!{c['reset']}")
-
-    @classmethod
-    async def cmd_summon(cls, player: 'Player', args: List[str]):
-        """Summon an elemental. Usage: summon <air|fire|water|earth>"""
-        from pets import PetManager
-
-        c = player.config.COLORS
-
-        # Check if mage
-        if player.char_class != 'mage':
-            await player.send(f"{c['red']}Only Mages can summon elementals!{c['reset']}")
-            return
-
-        if not args:
-            await player.send(f"{c['yellow']}Usage: summon <air|fire|water|earth>{c['reset']}")
-            await player.send(f"Elementals: air, fire, water, earth")
-            return
-
-        element = args[0].lower()
-        valid_elements = ['air', 'fire', 'water', 'earth']
-
-        if element not in valid_elements:
-            await player.send(f"{c['red']}Invalid elemental type. Choose: air, fire, water, earth{c['reset']}")
-            return
-
-        # Check mana cost
-        mana_cost = 50
-        if player.mana < mana_cost:
-            await player.send(f"{c['red']}You don't have enough mana! (Need {mana_cost}){c['reset']}")
-            return
-
-        # Check level requirement
-        if player.level < 5:
-            await player.send(f"{c['red']}You must be at least level 5 to summon elementals!{c['reset']}")
-            return
-
-        # Summon elemental
-        template_name = f"{element}_elemental"
-        pet = await PetManager.summon_pet(player, template_name, duration_minutes=30)
-
-        if pet:
-            player.mana -= mana_cost
-            await player.send(f"{c['bright_magenta']}You summon {pet.short_desc}!{c['reset']}")
-            await player.send(f"{c['yellow']}Duration: 30 minutes{c['reset']}")
-
-    @classmethod
-    async def cmd_animate(cls, player: 'Player', args: List[str]):
-        """Animate a corpse as undead. Usage: animate <corpse>"""
-        from pets import PetManager
-
-        c = player.config.COLORS
-
-        # Check if necromancer/cleric with evil alignment
-        if player.char_class not in ('cleric',) or player.alignment > -200:
-            await player.send(f"{c['red']}Only evil Clerics can animate the dead!{c['reset']}")
-            return
-
-        # Look for corpse in room
-        corpse = None
-        for item in player.room.items:
-            if hasattr(item, 'item_type') and item.item_type == 'container':
-                if 'corpse' in item.name.lower():
-                    corpse = item
-                    break
-
-        if not corpse:
-            await player.send(f"{c['red']}There's no corpse here to animate!{c['reset']}")
-            return
-
-        # Check mana cost
-        mana_cost = 60
-        if player.mana < mana_cost:
-            await player.send(f"{c['red']}You don't have enough mana! (Need {mana_cost}){c['reset']}")
-            return
-
-        # Check level requirement
-        if player.level < 8:
-            await player.send(f"{c['red']}You must be at least level 8 to animate the dead!{c['reset']}")
-            return
-
-        # Determine type of undead based on level
-        if player.level >= 20:
-            undead_type = 'wight'
-            duration = 30
-        elif player.level >= 15:
-            undead_type = 'ghoul'
-            duration = 45
-        elif player.level >= 10:
-            undead_type = 'skeleton'
-            duration = 60
-        else:
-            undead_type = 'zombie'
-            duration = 60
-
-        # Summon undead
-        pet = await PetManager.summon_pet(player, undead_type, duration_minutes=duration)
-
-        if pet:
-            player.mana -= mana_cost
-            # Remove corpse
-            player.room.items.remove(corpse)
-
-            await player.send(f"{c['bright_magenta']}You animate {corpse.name} as {pet.short_desc}!{c['reset']}")
-            await player.send(f"{c['yellow']}Duration: {duration} minutes{c['reset']}")
-
-    @classmethod
-    async def cmd_raise(cls, player: 'Player', args: List[str]):
-        """Raise a necromancer servant. Usage: raise <knight|wraith|lich|stalker>"""
-        c = player.config.COLORS
-
-        if player.char_class != 'necromancer':
-            await player.send(f"{c['red']}Only necromancers can raise undead servants!{c['reset']}")
-            return
-
-        if not args:
-            await player.send(f"{c['yellow']}Usage: raise <knight|wraith|lich|stalker>{c['reset']}")
-            await player.send(f"{c['cyan']}Servant types:{c['reset']}")
-            await player.send(f"  {c['white']}knight{c['reset']}  - Bone Knight (tank, high defense)")
-            await player.send(f"  {c['white']}wraith{c['reset']}  - Wraith Healer (support, heals you)")
-            await player.send(f"  {c['white']}lich{c['reset']}    - Lich Acolyte (caster, high damage)")
-            await player.send(f"  {c['white']}stalker{c['reset']} - Shadow Stalker (rogue, fast attacks)")
-            return
-
-        if 'animate_dead' not in player.spells:
-            await player.send(f"{c['red']}You do not yet know how to animate the dead.{c['reset']}")
-            return
-
-        choice = args[0].lower()
-        # Map themed names to template names
-        themed_map = {
-            'knight': 'knight', 'bone': 'knight', 'tank': 'knight',
-            'wraith': 'wraith', 'healer': 'wraith', 'support': 'wraith',
-            'lich': 'lich', 'caster': 'lich', 'mage': 'lich',
-            'stalker': 'stalker', 'rogue': 'stalker', 'shadow': 'stalker',
-        }
-        if choice not in themed_map:
-            await player.send(f"{c['yellow']}Choose a servant: knight, wraith, lich, stalker.{c['reset']}")
-            return
-
-        from spells import SpellHandler
-        await SpellHandler.cast_spell(player, 'animate_dead', themed_map[choice])
-
-    @classmethod
-    async def cmd_soulstone(cls, player: 'Player', args: List[str]):
-        """Create a necromancer soulstone. Usage: soulstone [create]"""
-        c = player.config.COLORS
-
-        if player.char_class != 'necromancer':
-            await player.send(f"{c['red']}Only necromancers can forge soulstones!{c['reset']}")
-            return
-
-        # Allow optional 'create' argument
-        if args and args[0].lower() not in ('create', 'forge', 'craft'):
-            await player.send(f"{c['yellow']}Usage: soulstone [create]{c['reset']}")
-            return
-
-        # Check if already has a soulstone
-        def has_soulstone():
-            for item in player.inventory:
-                if getattr(item, 'is_soulstone', False) or ('soulstone' in getattr(item, 'flags', set())):
-                    return True
-            for item in player.equipment.values():
-                if item and (getattr(item, 'is_soulstone', False) or ('soulstone' in getattr(item, 'flags', set()))):
-                    return True
-            return False
-
-        if has_soulstone():
-            await player.send(f"{c['yellow']}You already possess a soulstone.{c['reset']}")
-            return
-
-        # Require a corpse in the room
-        if not player.room:
-            await player.send(f"{c['red']}You are nowhere. There is no corpse to bind.{c['reset']}")
-            return
-
-        corpse = None
-        for item in player.room.items:
-            if hasattr(item, 'item_type') and item.item_type == 'container' and 'corpse' in item.name.lower():
-                corpse = item
-                break
-
-        if not corpse:
-            await player.send(f"{c['yellow']}You need a corpse here to bind into a soulstone.{c['reset']}")
-            return
-
-        mana_cost = 60
-        if player.mana < mana_cost:
-            await player.send(f"{c['red']}You need {mana_cost} mana to forge a soulstone.{c['reset']}")
-            return
-
-        # Consume resources
-        player.mana -= mana_cost
-        if corpse in player.room.items:
-            player.room.items.remove(corpse)
-
-        # Create the soulstone object
-        from objects import Object
-        stone = Object(0, player.world if hasattr(player, 'world') else None)
-        stone.name = 'soulstone'
-        stone.short_desc = '\x1b[95ma soulstone\x1b[0m'
-        stone.room_desc = '\x1b[95mA faintly glowing soulstone lies here, drinking the light.\x1b[0m'
-        stone.description = 'A crystal of bound souls, pulsing with cold necromantic light. Dark tendrils swirl within it like trapped smoke.'
-        stone.item_type = 'worn'
-        stone.wear_slot = 'hold'
-        stone.weight = 1
-        stone.cost = 0
-        stone.flags.add('soulstone')
-        stone.is_soulstone = True
-        stone.soulstone_bonus_int = 3
-        stone.soulstone_mana_regen = 0.10
-        stone.soulstone_spell_damage = 2
-
-        player.inventory.append(stone)
-        await player.send(f"{c['bright_magenta']}You bind the corpse's essence into a soulstone.{c['reset']}")
-        await player.send(f"{c['cyan']}It hums with power. Hold it in your offhand to channel its bonuses.{c['reset']}")
-        await player.room.send_to_room(
-            f"{player.name} binds a corpse into a coldly glowing soulstone.",
-            exclude=[player]
-        )
-
-    @classmethod
-    async def cmd_imbue(cls, player: 'Player', args: List[str]):
-        """Imbue a corpse with soulstone power. Usage: imbue [corpse]"""
-        c = player.config.COLORS
-
-        if player.char_class != 'necromancer':
-            await player.send(f"{c['red']}Only necromancers can imbue corpses.{c['reset']}")
-            return
-
-        if args and args[0].lower() not in ('corpse', 'body'):
-            await player.send(f"{c['yellow']}Usage: imbue [corpse]{c['reset']}")
-            return
-
-        # Must be holding a soulstone in offhand
-        stone = player.equipment.get('hold')
-        if not stone or not (getattr(stone, 'is_soulstone', False) or ('soulstone' in getattr(stone, 'flags', set()))):
-            await player.send(f"{c['yellow']}You must hold a soulstone in your offhand to imbue a corpse.{c['reset']}")
-            return
-
-        if not player.room:
-            await player.send(f"{c['red']}You are nowhere. There is no corpse to imbue.{c['reset']}")
-            return
-
-        corpse = None
-        for item in player.room.items:
-            if hasattr(item, 'item_type') and item.item_type == 'container' and 'corpse' in item.name.lower():
-                corpse = item
-                break
-
-        if not corpse:
-            await player.send(f"{c['yellow']}There is no corpse here to imbue.{c['reset']}")
-            return
-
-        level = getattr(corpse, 'soul_imbue_level', 0)
-        if level >= 5:
-            await player.send(f"{c['yellow']}This corpse is already saturated with soulstone power.{c['reset']}")
-            return
-
-        mana_cost = 20 + (level * 15)
-        if player.mana < mana_cost:
-            await player.send(f"{c['red']}You need {mana_cost} mana to deepen the imbue.{c['reset']}")
-            return
-
-        player.mana -= mana_cost
-        level += 1
-        corpse.soul_imbue_level = level
-
-        progress_msgs = {
-            1: "The corpse shudders as dark veins spread across its flesh.",
-            2: "Bones tighten and re-knit as the soulstone drinks deeper.",
-            3: "A cold aura wreathes the corpse, thick with necromantic gravity.",
-            4: "The corpse rises slightly, then settles—heavier, denser.",
-            5: "The corpse glows with a dense, hungry darkness. It is ready."
-        }
-
-        await player.send(f"{c['bright_magenta']}You channel soulstone power into the corpse.{c['reset']}")
-        await player.send(f"{c['cyan']}Imbue level: {level}/5{c['reset']}")
-        await player.room.send_to_room(
-            progress_msgs.get(level, "The corpse crackles with dark power."),
-            exclude=[player]
-        )
-
-    @classmethod
-    async def cmd_companion(cls, player: 'Player', args: List[str]):
-        """Show your companion's stats. Usage: companion"""
-        from pets import PetManager
-
-        c = player.config.COLORS
-
-        pets = PetManager.get_player_pets(player)
-
-        if not pets:
-            await player.send(f"{c['yellow']}You don't have any companions.{c['reset']}")
-            return
-
-        await player.send(f"{c['bright_cyan']}╔══════════════════════════════════════════════════════╗{c['reset']}")
-        await player.send(f"{c['bright_cyan']}║{c['bright_yellow']}                  Your Companions                     {c['bright_cyan']}║{c['reset']}")
-        await player.send(f"{c['bright_cyan']}╚══════════════════════════════════════════════════════╝{c['reset']}")
-
-        for pet in pets:
-            hp_bar = cls._make_bar(pet.hp, pet.max_hp, 20)
-            loyalty_bar = cls._make_bar(pet.loyalty, 100, 20)
-
-            pet_type = "PERMANENT" if pet.is_persistent else "TEMPORARY"
-            time_remaining = ""
-            if pet.timer:
-                remaining = pet.get_despawn_time()
-                if remaining:
-                    minutes = remaining // 60
-                    seconds = remaining % 60
-                    time_remaining = f" (Time left: {minutes}m {seconds}s)"
-
-            await player.send(f"\n{c['white']}{pet.name} [{pet_type}]{c['reset']}{time_remaining}")
-            await player.send(f"  Level: {pet.level}  Type: {pet.pet_type}")
-            await player.send(f"  HP:      {hp_bar} {pet.hp}/{pet.max_hp}")
-            await player.send(f"  Loyalty: {loyalty_bar} {pet.loyalty}/100")
-
-            if pet.room == player.room:
-                await player.send(f"  Location: {c['green']}Here{c['reset']}")
-            elif pet.room:
-                await player.send(f"  Location: {c['yellow']}{pet.room.name}{c['reset']}")
-            else:
-                await player.send(f"  Location: {c['red']}Unknown{c['reset']}")
-
-    @staticmethod
-    def _make_bar(current: int, maximum: int, width: int = 20) -> str:
-        """Create a visual bar for stats."""
-        if maximum == 0:
-            filled = 0
-        else:
-            filled = int((current / maximum) * width)
-
-        bar = '█' * filled + '░' * (width - filled)
-        return f"[{bar}]"
-
-    # ==================== DOOR COMMANDS ====================
-
-    @classmethod
-    async def cmd_open(cls, player: 'Player', args: List[str]):
-        """Open a door or container. Usage: open <door/container>"""
-        if not args:
-            await player.send("Open what?")
-            return
-
-        c = player.config.COLORS
-        target_name = ' '.join(args).lower()
-
-        # Check for container first
-        container = None
-        for item in player.inventory + player.room.items:
-            if target_name in item.name.lower():
-                if hasattr(item, 'item_type') and item.item_type == 'container':
-                    container = item
-                    break
-
-        if container:
-            if not hasattr(container, 'is_closed'):
-                await player.send(f"{c['yellow']}The {container.name} doesn't open and close.{c['reset']}")
-                return
-
-            if not container.is_closed:
-                await player.send(f"{c['yellow']}The {container.name} is already open.{c['reset']}")
-                return
-
-            # Check if locked
-            if hasattr(container, 'is_locked') and container.is_locked:
-                await player.send(f"{c['red']}The {container.name} is locked.{c['reset']}")
-                return
-
-            container.is_closed = False
-            await player.send(f"{c['green']}You open {container.short_desc}.{c['reset']}")
-            await player.room.send_to_room(
-                f"{player.name} opens {container.short_desc}.",
-                exclude=[player]
-            )
-            return
-
-        # Check for door - handle "door north", "door n", "north", or door names like "trapdoor"
-        direction = None
-        door = None
-        exit_data = None
-
-        # Remove "door" from the target name if present
-        if target_name.startswith('door '):
-            target_name = target_name[5:].strip()
-
-        # First try to match by direction
-        for dir_name in player.config.DIRECTIONS.keys():
-            if target_name == dir_name or target_name in dir_name:
-                direction = dir_name
-                break
-
-        if direction and direction in player.room.exits and player.room.exits[direction]:
-            exit_data = player.room.exits[direction]
-            if 'door' in exit_data:
-                door = exit_data['door']
-
-        # If no door found by direction, try to find by door name
-        if not door:
-            for dir_name, ex_data in player.room.exits.items():
-                if ex_data and 'door' in ex_data:
-                    door_obj = ex_data['door']
-                    door_name = door_obj.get('name', 'door').lower()
-                    if target_name in door_name or door_name in target_name:
-                        door = door_obj
-                        exit_data = ex_data
-                        direction = dir_name
-                        break
-
-        if not door:
-            await player.send(f"{c['red']}You don't see a '{target_name}' to open here.{c['reset']}")
-            return
-
-        if door.get('state') != 'closed':
-            await player.send(f"{c['yellow']}The door is already open.{c['reset']}")
-            return
-
-        # Check if locked
-        if door.get('locked', False):
-            await player.send(f"{c['red']}The door is locked.{c['reset']}")
-            return
-
-        # Check if magically blocked
-        if door.get('magically_blocked', False):
-            await player.send(f"{c['red']}The door is magically sealed!{c['reset']}")
-            return
-
-        door['state'] = 'open'
-        await player.send(f"{c['green']}You open the {door.get('name', 'door')} {direction}.{c['reset']}")
-        await player.room.send_to_room(
-            f"{player.name} opens the {door.get('name', 'door')} {direction}.",
-            exclude=[player]
-        )
-
-        # Update the other side of the door
-        next_room = exit_data.get('room')
-        if next_room:
-            opposite_dir = player.config.DIRECTIONS[direction]['opposite']
-            if opposite_dir in next_room.exits and 'door' in next_room.exits[opposite_dir]:
-                next_room.exits[opposite_dir]['door']['state'] = 'open'
-
-    @classmethod
-    async def cmd_close(cls, player: 'Player', args: List[str]):
-        """Close a door or container. Usage: close <door/container>"""
-        if not args:
-            await player.send("Close what?")
-            return
-
-        c = player.config.COLORS
-        target_name = ' '.join(args).lower()
-
-        # Check for container first
-        container = None
-        for item in player.inventory + player.room.items:
-            if target_name in item.name.lower():
-                if hasattr(item, 'item_type') and item.item_type == 'container':
-                    container = item
-                    break
-
-        if container:
-            if not hasattr(container, 'is_closed'):
-                await player.send(f"{c['yellow']}The {container.name} doesn't open and close.{c['reset']}")
-                return
-
-            if container.is_closed:
-                await player.send(f"{c['yellow']}The {container.name} is already closed.{c['reset']}")
-                return
-
-            container.is_closed = True
-            await player.send(f"{c['green']}You close {container.short_desc}.{c['reset']}")
-            await player.room.send_to_room(
-                f"{player.name} closes {container.short_desc}.",
-                exclude=[player]
-            )
-            return
-
-        # Check for door - handle "door north", "door n", "north", or door names like "trapdoor"
-        direction = None
-        door = None
-        exit_data = None
-
-        # Remove "door" from the target name if present
-        if target_name.startswith('door '):
-            target_name = target_name[5:].strip()
-
-        # First try to match by direction
-        for dir_name in player.config.DIRECTIONS.keys():
-            if target_name == dir_name or target_name in dir_name:
-                direction = dir_name
-                break
-
-        if direction and direction in player.room.exits and player.room.exits[direction]:
-            exit_data = player.room.exits[direction]
-            if 'door' in exit_data:
-                door = exit_data['door']
-
-        # If no door found by direction, try to find by door name
-        if not door:
-            for dir_name, ex_data in player.room.exits.items():
-                if ex_data and 'door' in ex_data:
-                    door_obj = ex_data['door']
-                    door_name = door_obj.get('name', 'door').lower()
-                    if target_name in door_name or door_name in target_name:
-                        door = door_obj
-                        exit_data = ex_data
-                        direction = dir_name
-                        break
-
-        if not door:
-            await player.send(f"{c['red']}You don't see a '{target_name}' to close here.{c['reset']}")
-            return
-
-        # Check if broken
-        if door.get('broken', False):
-            await player.send(f"{c['red']}The door is broken and cannot be closed!{c['reset']}")
-            return
-
-        if door.get('state') == 'closed':
-            await player.send(f"{c['yellow']}The door is already closed.{c['reset']}")
-            return
-
-        door['state'] = 'closed'
-        await player.send(f"{c['green']}You close the {door.get('name', 'door')} {direction}.{c['reset']}")
-        await player.room.send_to_room(
-            f"{player.name} closes the {door.get('name', 'door')} {direction}.",
-            exclude=[player]
-        )
-
-        # Update the other side of the door
-        next_room = exit_data.get('room')
-        if next_room:
-            opposite_dir = player.config.DIRECTIONS[direction]['opposite']
-            if opposite_dir in next_room.exits and 'door' in next_room.exits[opposite_dir]:
-                next_room.exits[opposite_dir]['door']['state'] = 'closed'
-
-    @classmethod
-    async def cmd_lock(cls, player: 'Player', args: List[str]):
-        """Lock a door or container. Usage: lock <door/container>"""
-        if not args:
-            await player.send("Lock what?")
-            return
-
-        c = player.config.COLORS
-        target_name = ' '.join(args).lower()
-
-        # Check for container first
-        container = None
-        for item in player.inventory + player.room.items:
-            if target_name in item.name.lower():
-                if hasattr(item, 'item_type') and item.item_type == 'container':
-                    container = item
-                    break
-
-        if container:
-            if not hasattr(container, 'is_locked'):
-                await player.send(f"{c['yellow']}The {container.name} cannot be locked.{c['reset']}")
-                return
-
-            if container.is_locked:
-                await player.send(f"{c['yellow']}The {container.name} is already locked.{c['reset']}")
-                return
-
-            # Check if closed
-            if hasattr(container, 'is_closed') and not container.is_closed:
-                await player.send(f"{c['red']}You must close it first.{c['reset']}")
-                return
-
-            # Check for key
-            key_vnum = getattr(container, 'key_vnum', None)
-            has_key = False
-            if key_vnum:
-                for item in player.inventory:
-                    if hasattr(item, 'vnum') and item.vnum == key_vnum:
-                        has_key = True
-                        break
-
-            if key_vnum and not has_key:
-                await player.send(f"{c['red']}You don't have the key.{c['reset']}")
-                return
-
-            container.is_locked = True
-            await player.send(f"{c['green']}*Click* You lock {container.short_desc}.{c['reset']}")
-            return
-
-        # Check for door - handle "door north", "door n", or just "north"
-        direction = None
-
-        # Remove "door" from the target name if present
-        if target_name.startswith('door '):
-            target_name = target_name[5:].strip()
-
-        for dir_name in player.config.DIRECTIONS.keys():
-            if target_name == dir_name or target_name in dir_name:
-                direction = dir_name
-                break
-
-        if not direction:
-            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
-            return
-
-        if direction not in player.room.exits or not player.room.exits[direction]:
-            await player.send(f"{c['red']}There's no exit {direction}.{c['reset']}")
-            return
-
-        exit_data = player.room.exits[direction]
-
-        if 'door' not in exit_data:
-            await player.send(f"{c['yellow']}There's no door {direction}.{c['reset']}")
-            return
-
-        door = exit_data['door']
-
-        if door.get('locked', False):
-            await player.send(f"{c['yellow']}The door is already locked.{c['reset']}")
-            return
-
-        # Check if closed
-        if door.get('state') != 'closed':
-            await player.send(f"{c['red']}You must close it first.{c['reset']}")
-            return
-
-        # Check for key
-        key_vnum = door.get('key_vnum')
-        has_key = False
-        if key_vnum:
-            for item in player.inventory:
-                if hasattr(item, 'vnum') and item.vnum == key_vnum:
-                    has_key = True
-                    break
-
-        if key_vnum and not has_key:
-            await player.send(f"{c['red']}You don't have the key.{c['reset']}")
-            return
-
-        door['locked'] = True
-        await player.send(f"{c['green']}*Click* You lock the {door.get('name', 'door')} {direction}.{c['reset']}")
-
-        # Update the other side of the door
-        next_room = exit_data.get('room')
-        if next_room:
-            opposite_dir = player.config.DIRECTIONS[direction]['opposite']
-            if opposite_dir in next_room.exits and 'door' in next_room.exits[opposite_dir]:
-                next_room.exits[opposite_dir]['door']['locked'] = True
-
-    @classmethod
-    async def cmd_unlock(cls, player: 'Player', args: List[str]):
-        """Unlock a door or container. Usage: unlock <door/container>"""
-        if not args:
-            await player.send("Unlock what?")
-            return
-
-        c = player.config.COLORS
-        target_name = ' '.join(args).lower()
-
-        # Check for container first
-        container = None
-        for item in player.inventory + player.room.items:
-            if target_name in item.name.lower():
-                if hasattr(item, 'item_type') and item.item_type == 'container':
-                    container = item
-                    break
-
-        if container:
-            if not hasattr(container, 'is_locked'):
-                await player.send(f"{c['yellow']}The {container.name} cannot be locked.{c['reset']}")
-                return
-
-            if not container.is_locked:
-                await player.send(f"{c['yellow']}The {container.name} is already unlocked.{c['reset']}")
-                return
-
-            # Check for key
-            key_vnum = getattr(container, 'key_vnum', None)
-            has_key = False
-            if key_vnum:
-                for item in player.inventory:
-                    if hasattr(item, 'vnum') and item.vnum == key_vnum:
-                        has_key = True
-                        break
-
-            if key_vnum and not has_key:
-                await player.send(f"{c['red']}You don't have the key.{c['reset']}")
-                return
-
-            container.is_locked = False
-            await player.send(f"{c['green']}*Click* You unlock {container.short_desc}.{c['reset']}")
-            return
-
-        # Check for door - handle "door north", "door n", or just "north"
-        direction = None
-
-        # Remove "door" from the target name if present
-        if target_name.startswith('door '):
-            target_name = target_name[5:].strip()
-
-        for dir_name in player.config.DIRECTIONS.keys():
-            if target_name == dir_name or target_name in dir_name:
-                direction = dir_name
-                break
-
-        if not direction:
-            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
-            return
-
-        if direction not in player.room.exits or not player.room.exits[direction]:
-            await player.send(f"{c['red']}There's no exit {direction}.{c['reset']}")
-            return
-
-        exit_data = player.room.exits[direction]
-
-        if 'door' not in exit_data:
-            await player.send(f"{c['yellow']}There's no door {direction}.{c['reset']}")
-            return
-
-        door = exit_data['door']
-
-        if not door.get('locked', False):
-            await player.send(f"{c['yellow']}The door is already unlocked.{c['reset']}")
-            return
-
-        # Check for key
-        key_vnum = door.get('key_vnum')
-        has_key = False
-        if key_vnum:
-            for item in player.inventory:
-                if hasattr(item, 'vnum') and item.vnum == key_vnum:
-                    has_key = True
-                    break
-
-        if key_vnum and not has_key:
-            await player.send(f"{c['red']}You don't have the key.{c['reset']}")
-            return
-
-        door['locked'] = False
-        await player.send(f"{c['green']}*Click* You unlock the {door.get('name', 'door')} {direction}.{c['reset']}")
-
-        # Update the other side of the door
-        next_room = exit_data.get('room')
-        if next_room:
-            opposite_dir = player.config.DIRECTIONS[direction]['opposite']
-            if opposite_dir in next_room.exits and 'door' in next_room.exits[opposite_dir]:
-                next_room.exits[opposite_dir]['door']['locked'] = False
-
-    @classmethod
-    async def cmd_pick(cls, player: 'Player', args: List[str]):
-        """Pick a lock (Thief skill). Usage: pick <door/container>"""
-        if not args:
-            await player.send("Pick what lock?")
-            return
-
-        c = player.config.COLORS
-
-        # Check if player has pick lock skill
-        pick_skill = player.skills.get('pick_lock', 0)
-        if pick_skill == 0:
-            await player.send(f"{c['red']}You don't know how to pick locks!{c['reset']}")
-            return
-
-        target_name = ' '.join(args).lower()
-
-        # Check for container first
-        container = None
-        for item in player.inventory + player.room.items:
-            if target_name in item.name.lower():
-                if hasattr(item, 'item_type') and item.item_type == 'container':
-                    container = item
-                    break
-
-        if container:
-            if not hasattr(container, 'is_locked') or not container.is_locked:
-                await player.send(f"{c['yellow']}The {container.name} isn't locked.{c['reset']}")
-                return
-
-            # Get pick difficulty
-            difficulty = getattr(container, 'pick_difficulty', 50)
-
-            # Attempt to pick
-            roll = random.randint(1, 100)
-            if roll <= pick_skill and roll + pick_skill >= difficulty:
-                container.is_locked = False
-                await player.send(f"{c['bright_green']}*Click* You successfully pick the lock on {container.short_desc}!{c['reset']}")
-                await player.room.send_to_room(
-                    f"{player.name} fiddles with {container.short_desc}.",
-                    exclude=[player]
-                )
-            else:
-                await player.send(f"{c['yellow']}You fail to pick the lock.{c['reset']}")
-            return
-
-        # Check for door - handle "door north", "door n", or just "north"
-        direction = None
-
-        # Remove "door" from the target name if present
-        if target_name.startswith('door '):
-            target_name = target_name[5:].strip()
-
-        for dir_name in player.config.DIRECTIONS.keys():
-            if target_name == dir_name or target_name in dir_name:
-                direction = dir_name
-                break
-
-        if not direction:
-            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
-            return
-
-        if direction not in player.room.exits or not player.room.exits[direction]:
-            await player.send(f"{c['red']}There's no exit {direction}.{c['reset']}")
-            return
-
-        exit_data = player.room.exits[direction]
-
-        if 'door' not in exit_data:
-            await player.send(f"{c['yellow']}There's no door {direction}.{c['reset']}")
-            return
-
-        door = exit_data['door']
-
-        if not door.get('locked', False):
-            await player.send(f"{c['yellow']}The door isn't locked.{c['reset']}")
-            return
-
-        # Get pick difficulty
-        difficulty = door.get('pick_difficulty', 50)
-
-        # Attempt to pick
-        roll = random.randint(1, 100)
-        if roll <= pick_skill and roll + pick_skill >= difficulty:
-            door['locked'] = False
-            await player.send(f"{c['bright_green']}*Click* You successfully pick the lock on the {door.get('name', 'door')}!{c['reset']}")
-            await player.room.send_to_room(
-                f"{player.name} fiddles with the {door.get('name', 'door')} {direction}.",
-                exclude=[player]
-            )
-        else:
-            await player.send(f"{c['yellow']}You fail to pick the lock.{c['reset']}")
-
-    # ==================== SHOP COMMANDS ====================
-
-    @classmethod
-    async def cmd_list(cls, player: 'Player', args: List[str]):
-        """List items for sale in a shop. Usage: list"""
-        from shops import ShopManager
-
-        c = player.config.COLORS
-
-        # Find shopkeeper in room
-        shopkeeper = None
-        for char in player.room.characters:
-            if ShopManager.is_shopkeeper(char):
-                shopkeeper = char
-                break
-
-        if not shopkeeper:
-            # Check if this is a pet shop (room name must contain 'pet shop')
-            if player.room and player.room.vnum and 'pet shop' in player.room.name.lower():
-                pet_room_vnum = player.room.vnum + 1
-                pet_room = player.world.get_room(pet_room_vnum) if player.world else None
-                if pet_room and pet_room.characters:
-                    from mobs import Mobile
-                    pets = [ch for ch in pet_room.characters if isinstance(ch, Mobile) and ('pet' in ch.flags or 'pet_shop' in ch.flags or getattr(ch, 'special', None) == 'pet')]
-                    if pets:
-                        await player.send(f"\n{c['bright_cyan']}╔══════════════════════════════════════════════════════════╗{c['reset']}")
-                        await player.send(f"{c['bright_cyan']}║{c['bright_yellow']}            Pets Available for Purchase                 {c['bright_cyan']}║{c['reset']}")
-                        await player.send(f"{c['bright_cyan']}╠══════════════════════════════════════════════════════════╣{c['reset']}")
-                        await player.send(f"{c['bright_cyan']}║ {c['white']}Pet                                   Lvl    Price    {c['bright_cyan']}║{c['reset']}")
-                        await player.send(f"{c['bright_cyan']}╠══════════════════════════════════════════════════════════╣{c['reset']}")
-                        for pet in pets:
-                            price = getattr(pet, 'gold', 100) * 3
-                            if price <= 0:
-                                price = pet.level * 100
-                            pname = pet.short_desc[:36].ljust(36)
-                            await player.send(f"{c['bright_cyan']}║ {c['white']}{pname} {pet.level:>3}  {price:>6} gold {c['bright_cyan']}║{c['reset']}")
-                        await player.send(f"{c['bright_cyan']}╚══════════════════════════════════════════════════════════╝{c['reset']}")
-                        await player.send(f"{c['yellow']}Use 'buy <pet name>' to purchase.{c['reset']}\n")
-                        return
-            await player.send(f"{c['red']}There's no shopkeeper here.{c['reset']}")
-            return
-
-        # Get shop
-        shop = ShopManager.get_shop(shopkeeper)
-        if not shop:
-            await player.send(f"{c['red']}This merchant has nothing to sell.{c['reset']}")
-            return
-
-        # Check if shop is open
-        game_time = player.world.game_time if hasattr(player.world, 'game_time') else None
-        if not shop.is_open(game_time):
-            await player.send(f"{c['yellow']}{shopkeeper.name} says, 'Sorry, I'm closed right now. Come back during business hours.'{c['reset']}")
-            return
-
-        await shop.list_items(player)
-
-    @classmethod
-    async def cmd_buy(cls, player: 'Player', args: List[str]):
-        """Buy an item from a shop. Usage: buy <item>"""
-        from shops import ShopManager
-
-        c = player.config.COLORS
-
-        if not args:
-            await player.send(f"{c['yellow']}Buy what? Use 'list' to see what's available.{c['reset']}")
-            return
-
-        # Find shopkeeper in room
-        shopkeeper = None
-        for char in player.room.characters:
-            if ShopManager.is_shopkeeper(char):
-                shopkeeper = char
-                break
-
-        if not shopkeeper:
-            # Check if this is a pet shop (room name must contain 'pet shop')
-            if player.room and player.room.vnum and 'pet shop' in player.room.name.lower():
-                pet_room_vnum = player.room.vnum + 1
-                pet_room = player.world.get_room(pet_room_vnum) if player.world else None
-                if pet_room and pet_room.characters:
-                    from mobs import Mobile
-                    pet_name = ' '.join(args).lower()
-                    target_pet = None
-                    for char in pet_room.characters:
-                        if isinstance(char, Mobile) and ('pet' in char.flags or 'pet_shop' in char.flags or getattr(char, 'special', None) == 'pet') and pet_name in char.name.lower():
-                            target_pet = char
-                            break
-                    if target_pet:
-                        # Pet purchase
-                        price = getattr(target_pet, 'gold', 100) * 3  # Pets cost 3x their gold value
-                        if price <= 0:
-                            price = target_pet.level * 100
-                        if player.gold < price:
-                            await player.send(f"{c['red']}You need {price} gold to buy {target_pet.short_desc}.{c['reset']}")
-                            return
-                        player.gold -= price
-                        # Create pet from mob
-                        from pets import Pet
-                        pet = Pet(target_pet.vnum, player.world, player, 'companion')
-                        pet.name = target_pet.name
-                        pet.short_desc = target_pet.short_desc
-                        pet.long_desc = target_pet.long_desc
-                        pet.level = target_pet.level
-                        pet.hp = target_pet.hp
-                        pet.max_hp = target_pet.max_hp
-                        pet.damage_dice = target_pet.damage_dice
-                        pet.armor_class = target_pet.armor_class
-                        pet.is_persistent = True
-                        # Add to player companions (persisted on save/load)
-                        if not hasattr(player, 'companions'):
-                            player.companions = []
-                        player.companions.append(pet)
-                        # Also register in world NPCs so pet_tick and combat work
-                        if player.world and pet not in player.world.npcs:
-                            player.world.npcs.append(pet)
-                        pet.room = player.room
-                        player.room.characters.append(pet)
-                        await player.send(f"{c['bright_green']}You buy {target_pet.short_desc} for {price} gold!{c['reset']}")
-                        await player.send(f"{c['cyan']}{pet.short_desc} follows you loyally.{c['reset']}")
-                        if player.room:
-                            await player.room.send_to_room(
-                                f"{player.name} just bought {pet.short_desc}!", exclude=[player])
-                        return
-                    else:
-                        # Show available pets
-                        await player.send(f"{c['yellow']}Available pets:{c['reset']}")
-                        for char in pet_room.characters:
-                            if isinstance(char, Mobile) and ('pet' in char.flags or 'pet_shop' in char.flags or getattr(char, 'special', None) == 'pet'):
-                                price = getattr(char, 'gold', 100) * 3
-                                if price <= 0:
-                                    price = char.level * 100
-                                await player.send(f"  {c['white']}{char.short_desc} (Level {char.level}) - {price} gold{c['reset']}")
-                        return
-            await player.send(f"{c['red']}There's no shopkeeper here.{c['reset']}")
-            return
-
-        # Get shop
-        shop = ShopManager.get_shop(shopkeeper)
-        if not shop:
-            await player.send(f"{c['red']}This merchant has nothing to sell.{c['reset']}")
-            return
-
-        # Check if shop is open
-        game_time = player.world.game_time if hasattr(player.world, 'game_time') else None
-        if not shop.is_open(game_time):
-            await player.send(f"{c['yellow']}{shopkeeper.name} says, 'Sorry, I'm closed right now.'{c['reset']}")
-            return
-
-        item_identifier = ' '.join(args)
-        await shop.sell_to_player(player, item_identifier)
-
-    @classmethod
-    async def cmd_sell(cls, player: 'Player', args: List[str]):
-        """Sell an item to a shop. Usage: sell <item>"""
-        from shops import ShopManager
-
-        c = player.config.COLORS
-
-        if not args:
-            await player.send(f"{c['yellow']}Sell what? Use 'value <item>' to check prices.{c['reset']}")
-            return
-
-        # Find shopkeeper in room
-        shopkeeper = None
-        for char in player.room.characters:
-            if ShopManager.is_shopkeeper(char):
-                shopkeeper = char
-                break
-
-        if not shopkeeper:
-            await player.send(f"{c['red']}There's no shopkeeper here.{c['reset']}")
-            return
-
-        # Get shop
-        shop = ShopManager.get_shop(shopkeeper)
-        if not shop:
-            await player.send(f"{c['red']}This merchant doesn't buy items.{c['reset']}")
-            return
-
-        # Check if shop is open
-        game_time = player.world.game_time if hasattr(player.world, 'game_time') else None
-        if not shop.is_open(game_time):
-            await player.send(f"{c['yellow']}{shopkeeper.name} says, 'Sorry, I'm closed right now.'{c['reset']}")
-            return
-
-        item_name = ' '.join(args)
-        await shop.buy_from_player(player, item_name)
-
-    @classmethod
-    async def cmd_value(cls, player: 'Player', args: List[str]):
-        """Check how much a shop will pay for an item. Usage: value <item>"""
-        from shops import ShopManager
-
-        c = player.config.COLORS
-
-        if not args:
-            await player.send(f"{c['yellow']}Check the value of what?{c['reset']}")
-            return
-
-        # Find shopkeeper in room
-        shopkeeper = None
-        for char in player.room.characters:
-            if ShopManager.is_shopkeeper(char):
-                shopkeeper = char
-                break
-
-        if not shopkeeper:
-            await player.send(f"{c['red']}There's no shopkeeper here.{c['reset']}")
-            return
-
-        # Get shop
-        shop = ShopManager.get_shop(shopkeeper)
-        if not shop:
-            await player.send(f"{c['red']}This merchant doesn't buy items.{c['reset']}")
-            return
-
-        item_name = ' '.join(args)
-        await shop.value_item(player, item_name)
-
-    @classmethod
-    async def cmd_show(cls, player: 'Player', args: List[str]):
-        """Show detailed stats of an item in the shop. Usage: show <item>"""
-        from shops import ShopManager
-
-        c = player.config.COLORS
-
-        if not args:
-            await player.send(f"{c['yellow']}Show what? Use 'list' to see available items.{c['reset']}")
-            return
-
-        # Find shopkeeper in room
-        shopkeeper = None
-        for char in player.room.characters:
-            if ShopManager.is_shopkeeper(char):
-                shopkeeper = char
-                break
-
-        if not shopkeeper:
-            await player.send(f"{c['red']}There's no shopkeeper here.{c['reset']}")
-            return
-
-        # Get shop
-        shop = ShopManager.get_shop(shopkeeper)
-        if not shop:
-            await player.send(f"{c['red']}This merchant has nothing to sell.{c['reset']}")
-            return
-
-        # Check if shop is open
-        game_time = player.world.game_time if hasattr(player.world, 'game_time') else None
-        if not shop.is_open(game_time):
-            await player.send(f"{c['yellow']}{shopkeeper.name} says, 'Sorry, I'm closed right now.'{c['reset']}")
-            return
-
-        item_name = ' '.join(args).lower()
-
-        # Find the item in shop inventory
-        item = None
-        for shop_item in shop.inventory:
-            if item_name in shop_item.name.lower() or item_name in shop_item.short_desc.lower():
-                item = shop_item
-                break
-
-        if not item:
-            await player.send(f"{c['red']}The shopkeeper doesn't have '{item_name}' for sale.{c['reset']}")
-            return
-
-        # Calculate price
-        price = int(item.cost * shop.markup)
-
-        # Show detailed item information
-        await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
-        await player.send(f"{c['cyan']}║{c['bright_yellow']} {shopkeeper.name} shows you:{c['cyan']}{'':>36}║{c['reset']}")
-        await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}\r\n")
-
-        await player.send(f"{c['white']}{item.short_desc.capitalize()}{c['reset']}")
-        await player.send(f"{c['white']}{item.description}{c['reset']}\r\n")
-
-        # Item type
-        await player.send(f"{c['yellow']}Type: {item.item_type.capitalize()}{c['reset']}")
-
-        # Weapon stats
-        if item.item_type == 'weapon':
-            await player.send(f"{c['red']}Damage: {item.damage_dice} ({item.weapon_type}){c['reset']}")
-            if hasattr(item, 'weapon_class'):
-                await player.send(f"{c['yellow']}Weapon Class: {item.weapon_class}{c['reset']}")
-
-        # Armor stats
-        elif item.item_type == 'armor':
-            await player.send(f"{c['blue']}Armor: {item.armor} AC{c['reset']}")
-            if item.wear_slot:
-                await player.send(f"{c['cyan']}Worn on: {item.wear_slot}{c['reset']}")
-
-        # Poison stats
-        elif item.item_type == 'poison':
-            if hasattr(item, 'poison_type'):
-                poison_config = player.config.POISON_TYPES.get(item.poison_type, {})
-                await player.send(f"{c['green']}Effect: {poison_config.get('effect', 'unknown').capitalize()}{c['reset']}")
-                if 'duration' in poison_config:
-                    await player.send(f"{c['green']}Duration: {poison_config['duration']} ticks{c['reset']}")
-                if 'damage' in poison_config:
-                    await player.send(f"{c['red']}Damage: {poison_config['damage']} per tick{c['reset']}")
-
-        # Potion stats
-        elif item.item_type == 'potion':
-            if hasattr(item, 'potion_spell'):
-                await player.send(f"{c['magenta']}Effect: {item.potion_spell.replace('_', ' ').title()}{c['reset']}")
-
-        # Magical affects
-        if hasattr(item, 'affects') and item.affects:
-            await player.send(f"\r\n{c['bright_magenta']}Magical Properties:{c['reset']}")
-            for affect in item.affects:
-                sign = '+' if affect['value'] > 0 else ''
-                await player.send(f"  {c['magenta']}{affect['type'].capitalize()}: {sign}{affect['value']}{c['reset']}")
-
-        # Weight and value
-        await player.send(f"\r\n{c['white']}Weight: {item.weight} lbs{c['reset']}")
-        await player.send(f"{c['yellow']}Price: {price} gold{c['reset']}")
-
-    @classmethod
-    async def cmd_compare(cls, player: 'Player', args: List[str]):
-        """Compare a shop item to your equipped item. Usage: compare <item>"""
-        from shops import ShopManager
-
-        c = player.config.COLORS
-
-        if not args:
-            await player.send(f"{c['yellow']}Compare what? Use 'list' to see available items.{c['reset']}")
-            return
-
-        # Find shopkeeper in room
-        shopkeeper = None
-        for char in player.room.characters:
-            if ShopManager.is_shopkeeper(char):
-                shopkeeper = char
-                break
-
-        if not shopkeeper:
-            await player.send(f"{c['red']}There's no shopkeeper here.{c['reset']}")
-            return
-
-        # Get shop
-        shop = ShopManager.get_shop(shopkeeper)
-        if not shop:
-            await player.send(f"{c['red']}This merchant has nothing to sell.{c['reset']}")
-            return
-
-        item_name = ' '.join(args).lower()
-
-        # Find the item in shop inventory
-        shop_item = None
-        for item in shop.inventory:
-            if item_name in item.name.lower() or item_name in item.short_desc.lower():
-                shop_item = item
-                break
-
-        if not shop_item:
-            await player.send(f"{c['red']}The shopkeeper doesn't have '{item_name}' for sale.{c['reset']}")
-            return
-
-        # Determine what slot this item uses
-        equipped_item = None
-        if shop_item.item_type == 'weapon':
-            equipped_item = player.equipment.get('wield')
-        elif shop_item.item_type == 'armor' and shop_item.wear_slot:
-            equipped_item = player.equipment.get(shop_item.wear_slot)
-
-        # Show comparison
-        await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
-        await player.send(f"{c['cyan']}║{c['bright_yellow']} Comparing Items:{c['cyan']}{'':>45}║{c['reset']}")
-        await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}\r\n")
-
-        if not equipped_item:
-            await player.send(f"{c['yellow']}You have nothing equipped in that slot.{c['reset']}\r\n")
-            await player.send(f"{c['white']}Shop Item:{c['reset']} {shop_item.short_desc}")
-            if shop_item.item_type == 'weapon':
-                await player.send(f"  {c['red']}Damage: {shop_item.damage_dice}{c['reset']}")
-            elif shop_item.item_type == 'armor':
-                await player.send(f"  {c['blue']}Armor: {shop_item.armor} AC{c['reset']}")
-            return
-
-        # Compare equipped vs shop item
-        await player.send(f"{c['bright_cyan']}Currently Equipped:{c['reset']} {equipped_item.short_desc}")
-        await player.send(f"{c['bright_yellow']}Shop Item:{c['reset']} {shop_item.short_desc}\r\n")
-
-        if shop_item.item_type == 'weapon':
-            # Parse damage dice to compare
-            def parse_damage(dice_str):
-                # Parse "2d6" -> avg = 2 * 3.5 = 7
-                try:
-                    num, sides = dice_str.lower().split('d')
-                    return int(num) * (int(sides) + 1) / 2
-                except:
-                    return 0
-
-            equipped_dmg = parse_damage(equipped_item.damage_dice if hasattr(equipped_item, 'damage_dice') else '1d4')
-            shop_dmg = parse_damage(shop_item.damage_dice)
-
-            diff = shop_dmg - equipped_dmg
-            if diff > 0:
-                await player.send(f"{c['red']}Damage: {equipped_item.damage_dice} → {shop_item.damage_dice} {c['green']}(+{diff:.1f} avg){c['reset']}")
-            elif diff < 0:
-                await player.send(f"{c['red']}Damage: {equipped_item.damage_dice} → {shop_item.damage_dice} {c['red']}({diff:.1f} avg){c['reset']}")
-            else:
-                await player.send(f"{c['red']}Damage: {equipped_item.damage_dice} → {shop_item.damage_dice} {c['yellow']}(same){c['reset']}")
-
-        elif shop_item.item_type == 'armor':
-            equipped_ac = equipped_item.armor if hasattr(equipped_item, 'armor') else 0
-            shop_ac = shop_item.armor
-
-            diff = shop_ac - equipped_ac
-            if diff > 0:
-                await player.send(f"{c['blue']}Armor: {equipped_ac} AC → {shop_ac} AC {c['green']}(+{diff}){c['reset']}")
-            elif diff < 0:
-                await player.send(f"{c['blue']}Armor: {equipped_ac} AC → {shop_ac} AC {c['red']}({diff}){c['reset']}")
-            else:
-                await player.send(f"{c['blue']}Armor: {equipped_ac} AC → {shop_ac} AC {c['yellow']}(same){c['reset']}")
-
-        # Compare magical affects
-        if hasattr(shop_item, 'affects') and shop_item.affects:
-            await player.send(f"\r\n{c['bright_magenta']}Shop Item Magical Properties:{c['reset']}")
-            for affect in shop_item.affects:
-                sign = '+' if affect['value'] > 0 else ''
-                await player.send(f"  {c['magenta']}{affect['type'].capitalize()}: {sign}{affect['value']}{c['reset']}")
-
-        if hasattr(equipped_item, 'affects') and equipped_item.affects:
-            await player.send(f"\r\n{c['bright_cyan']}Current Item Magical Properties:{c['reset']}")
-            for affect in equipped_item.affects:
-                sign = '+' if affect['value'] > 0 else ''
-                await player.send(f"  {c['cyan']}{affect['type'].capitalize()}: {sign}{affect['value']}{c['reset']}")
-
-    @classmethod
-    async def cmd_examine(cls, player: 'Player', args: List[str]):
-        """Examine an item in your inventory or equipment. Usage: examine <item>"""
-        c = player.config.COLORS
-
-        if not args:
-            await player.send(f"{c['yellow']}Examine what? Specify an item in your inventory or equipment.{c['reset']}")
-            return
-
-        item_name = ' '.join(args).lower()
-
-        # Search in equipment first
-        item = None
-        item_location = None
-
-        for slot, equipped in player.equipment.items():
-            if equipped and (item_name in equipped.name.lower() or item_name in equipped.short_desc.lower()):
-                item = equipped
-                item_location = f"worn on {slot}"
-                break
-
-        # Search in inventory if not found
-        if not item:
-            for inv_item in player.inventory:
-                if item_name in inv_item.name.lower() or item_name in inv_item.short_desc.lower():
-                    item = inv_item
-                    item_location = "in inventory"
-                    break
-
-        if not item:
-            await player.send(f"{c['red']}You don't have '{item_name}'.{c['reset']}")
-            return
-
-        # Display item details
-        await player.send(f"\r\n{c['cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
-        await player.send(f"{c['cyan']}║{c['bright_yellow']} Examining: {item.short_desc:<46}{c['cyan']}║{c['reset']}")
-        await player.send(f"{c['cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}\r\n")
-
-        await player.send(f"{c['white']}{item.description}{c['reset']}\r\n")
-
-        await player.send(f"{c['yellow']}Type: {item.item_type.capitalize()}{c['reset']}")
-        await player.send(f"{c['cyan']}Location: {item_location.capitalize()}{c['reset']}")
-
-        # Weapon stats
-        if item.item_type == 'weapon':
-            await player.send(f"{c['red']}Damage: {item.damage_dice} ({item.weapon_type}){c['reset']}")
-            if hasattr(item, 'envenomed') and item.envenomed:
-                poison_type = getattr(item, 'poison_type', 'venom')
-                charges = getattr(item, 'envenom_charges', 0)
-                await player.send(f"{c['green']}Envenomed with {poison_type} ({charges} charges remaining){c['reset']}")
-
-        # Armor stats
-        elif item.item_type == 'armor':
-            await player.send(f"{c['blue']}Armor: {item.armor} AC{c['reset']}")
-            if item.wear_slot:
-                await player.send(f"{c['cyan']}Slot: {item.wear_slot}{c['reset']}")
-
-        # Poison stats
-        elif item.item_type == 'poison':
-            if hasattr(item, 'poison_type'):
-                poison_config = player.config.POISON_TYPES.get(item.poison_type, {})
-                await player.send(f"{c['green']}Poison Type: {poison_config.get('name', 'Unknown')}{c['reset']}")
-                await player.send(f"{c['green']}Effect: {poison_config.get('effect', 'unknown').capitalize()}{c['reset']}")
-
-        # Potion stats
-        elif item.item_type == 'potion':
-            if hasattr(item, 'potion_spell'):
-                await player.send(f"{c['magenta']}Effect: {item.potion_spell.replace('_', ' ').title()}{c['reset']}")
-
-        # Container stats
-        elif item.item_type == 'container':
-            status = 'closed' if item.is_closed else 'open'
-            locked = ' (locked)' if item.is_locked else ''
-            await player.send(f"{c['yellow']}Container: {status}{locked}{c['reset']}")
-            if item.contents:
-                await player.send(f"{c['yellow']}Contains: {len(item.contents)} item(s){c['reset']}")
-
-        # Magical affects
-        if hasattr(item, 'affects') and item.affects:
-            await player.send(f"\r\n{c['bright_magenta']}Magical Properties:{c['reset']}")
-            for affect in item.affects:
-                if isinstance(affect, dict):
-                    affect_type = affect.get('type', '')
-                    applies_to = affect.get('applies_to', '')
-                    value = affect.get('value', 0)
-                    sign = '+' if value > 0 else ''
-                    
-                    # Format nicely based on type
-                    if affect_type == 'modify_stat':
-                        stat_name = applies_to.upper() if applies_to in ('str', 'int', 'wis', 'dex', 'con', 'cha') else applies_to.replace('_', ' ').title()
-                        await player.send(f"  {c['magenta']}{sign}{value} {stat_name}{c['reset']}")
-                    else:
-                        await player.send(f"  {c['magenta']}{affect_type}: {sign}{value} {applies_to}{c['reset']}")
-                else:
-                    # Handle affect objects
-                    await player.send(f"  {c['magenta']}{getattr(affect, 'name', 'Unknown')}{c['reset']}")
-
-        # Weight and value
-        await player.send(f"\r\n{c['white']}Weight: {item.weight} lbs{c['reset']}")
-        if hasattr(item, 'cost'):
-            await player.send(f"{c['yellow']}Value: {item.cost} gold{c['reset']}")
-
-    # ==================== GROUP COMMANDS ====================
-
-    @classmethod
-    async def cmd_group(cls, player: 'Player', args: List[str]):
-        """Manage your group/party for multiplayer dungeon runs.
-        
-        Usage:
-            group               - Show group status
-            group <player>      - Invite a player to your group
-            group accept        - Accept a pending group invitation
-            group decline       - Decline a pending group invitation
-            group leave         - Leave your current group
-            group list          - Show group status (same as no args)
-            group kick <player> - Remove player from group (leader only)
-            group leader <player> - Transfer leadership (leader only)
-            group loot <mode>   - Set loot mode: freeforall or roundrobin
-            group follow        - Toggle auto-follow on/off
-            group disband       - Disband the group (leader only)
-            group all           - Group all players following you
-        
-        Max group size: 6 players. The first person to invite becomes leader.
-        """
-        from groups import GroupManager
-
-        c = player.config.COLORS
-
-        # No args - show group info
-        if not args:
-            await GroupManager.show_group(player)
-            return
-
-        action = args[0].lower()
-
-        # --- accept / decline ---
-        if action == 'accept':
-            await GroupManager.accept_invite(player)
-            return
-        if action == 'decline':
-            await GroupManager.decline_invite(player)
-            return
-
-        # --- list (alias for no-args) ---
-        if action == 'list':
-            await GroupManager.show_group(player)
-            return
-
-        # --- leave ---
-        if action == 'leave':
-            await GroupManager.leave_group(player)
-            return
-            
-        # --- disband (leader only) ---
-        if action == 'disband':
-            if not getattr(player, 'group', None):
-                await player.send(f"{c['yellow']}You're not in a group.{c['reset']}")
-                return
-            if player.group.leader != player:
-                await player.send(f"{c['red']}Only the group leader can disband the group.{c['reset']}")
-                return
-            for member in player.group.members:
-                if member != player:
-                    await member.send(f"{c['yellow']}{player.name} has disbanded the group.{c['reset']}")
-            player.group.disband()
-            await player.send(f"{c['yellow']}You disband the group.{c['reset']}")
-            return
-
-        # --- leader <player> (transfer leadership) ---
-        if action == 'leader' and len(args) > 1:
-            if not getattr(player, 'group', None):
-                await player.send(f"{c['yellow']}You're not in a group.{c['reset']}")
-                return
-            if player.group.leader != player:
-                await player.send(f"{c['red']}Only the current leader can transfer leadership.{c['reset']}")
-                return
-            target_name = ' '.join(args[1:]).lower()
-            target = None
-            for member in player.group.members:
-                if member.name.lower().startswith(target_name) and member != player:
-                    target = member
-                    break
-            if not target:
-                await player.send(f"{c['red']}'{target_name}' is not in your group.{c['reset']}")
-                return
-            player.group.set_leader(target)
-            for member in player.group.members:
-                await member.send(f"{c['bright_green']}{target.name} is now the group leader.{c['reset']}")
-            return
-
-        # --- loot <mode> ---
-        if action == 'loot':
-            if not getattr(player, 'group', None):
-                await player.send(f"{c['yellow']}You're not in a group.{c['reset']}")
-                return
-            if player.group.leader != player:
-                await player.send(f"{c['red']}Only the leader can change loot mode.{c['reset']}")
-                return
-            if len(args) < 2:
-                current = 'Round-Robin' if player.group.loot_mode == 'roundrobin' else 'Free-for-All'
-                await player.send(f"{c['cyan']}Current loot mode: {current}. Use 'group loot freeforall' or 'group loot roundrobin'.{c['reset']}")
-                return
-            mode = args[1].lower().replace('-', '').replace('_', '')
-            if mode in ('ffa', 'freeforall', 'free'):
-                player.group.loot_mode = 'freeforall'
-                for member in player.group.members:
-                    await member.send(f"{c['bright_green']}Loot mode set to Free-for-All.{c['reset']}")
-            elif mode in ('rr', 'roundrobin', 'round'):
-                player.group.loot_mode = 'roundrobin'
-                for member in player.group.members:
-                    await member.send(f"{c['bright_green']}Loot mode set to Round-Robin.{c['reset']}")
-            else:
-                await player.send(f"{c['red']}Unknown loot mode. Use 'freeforall' or 'roundrobin'.{c['reset']}")
-            return
-
-        # --- follow (toggle auto-follow) ---
-        if action == 'follow':
-            if not getattr(player, 'group', None):
-                await player.send(f"{c['yellow']}You're not in a group.{c['reset']}")
-                return
-            group = player.group
-            group.auto_follow = not group.auto_follow
-            state = 'ON' if group.auto_follow else 'OFF'
-            # Update following pointers for all non-leader members
-            for member in group.members:
-                if member != group.leader:
-                    member.following = group.leader if group.auto_follow else None
-                await member.send(f"{c['cyan']}Group auto-follow is now {state}.{c['reset']}")
-            return
-
-        # --- kick <player> ---
-        if action == 'kick' and len(args) > 1:
-            if not getattr(player, 'group', None):
-                await player.send(f"{c['yellow']}You're not in a group.{c['reset']}")
-                return
-            if player.group.leader != player:
-                await player.send(f"{c['red']}Only the group leader can kick members.{c['reset']}")
-                return
-            target_name = ' '.join(args[1:]).lower()
-            target = None
-            for member in player.group.members:
-                if member.name.lower().startswith(target_name) and member != player:
-                    target = member
-                    break
-            if not target:
-                await player.send(f"{c['red']}'{target_name}' is not in your group.{c['reset']}")
-                return
-            player.group.remove_member(target)
-            await player.send(f"{c['yellow']}You kick {target.name} from the group.{c['reset']}")
-            await target.send(f"{c['yellow']}{player.name} kicks you from the group.{c['reset']}")
-            for member in player.group.members:
-                if member != player:
-                    await member.send(f"{c['yellow']}{target.name} has been kicked from the group.{c['reset']}")
-            return
-            
-        # --- group all (legacy: group all followers) ---
-        if action == 'all':
-            followers = []
-            for char in player.room.characters:
-                if char != player and hasattr(char, 'connection'):
-                    if getattr(char, 'following', None) == player:
-                        followers.append(char)
-            if not followers:
-                await player.send(f"{c['yellow']}No one is following you here.{c['reset']}")
-                return
-            added = 0
-            for follower in followers:
-                success = await GroupManager.join_group(player, follower)
-                if success:
-                    added += 1
-            if added > 0:
-                await player.send(f"{c['green']}Added {added} follower(s) to your group.{c['reset']}")
-            else:
-                await player.send(f"{c['yellow']}Could not add any followers to the group.{c['reset']}")
-            return
-
-        # --- group <player> (invite) ---
-        target_name = ' '.join(args).lower()
-        target = None
-        for char in player.room.characters:
-            if char != player and hasattr(char, 'connection'):
-                if char.name.lower().startswith(target_name):
-                    target = char
-                    break
-        if not target:
-            await player.send(f"{c['red']}Player '{target_name}' not found here.{c['reset']}")
-            return
-        await GroupManager.invite(player, target)
-    
-    @classmethod
-    async def cmd_ungroup(cls, player: 'Player', args: List[str]):
-        """Leave your group or remove someone from it.
-        
-        Usage:
-            ungroup         - Leave your current group
-            ungroup <name>  - Remove player from group (leader only)
-        """
-        from groups import GroupManager
-        c = player.config.COLORS
-        
-        if not hasattr(player, 'group') or not player.group:
-            await player.send(f"{c['yellow']}You're not in a group.{c['reset']}")
-            return
-        
-        if not args:
-            # Leave group
-            await GroupManager.leave_group(player)
-            return
-        
-        # Remove specific player (leader only)
-        if player.group.leader != player:
-            await player.send(f"{c['red']}Only the group leader can remove members.{c['reset']}")
-            return
-        
-        target_name = ' '.join(args).lower()
-        target = None
-        for member in player.group.members:
-            if member.name.lower().startswith(target_name) and member != player:
-                target = member
-                break
-        
-        if not target:
-            await player.send(f"{c['red']}'{target_name}' is not in your group.{c['reset']}")
-            return
-        
-        player.group.remove_member(target)
-        target.group = None
-        await player.send(f"{c['yellow']}You remove {target.name} from the group.{c['reset']}")
-        await target.send(f"{c['yellow']}{player.name} removes you from the group.{c['reset']}")
-        for member in player.group.members:
-            if member != player:
-                await member.send(f"{c['yellow']}{target.name} has left the group.{c['reset']}")
-
-    @classmethod
-    async def cmd_follow(cls, player: 'Player', args: List[str]):
-        """Follow another player. Usage: follow <player> or follow self"""
-        c = player.config.COLORS
-
-        if not args:
-            if hasattr(player, 'following') and player.following:
-                await player.send(f"{c['cyan']}You are following {player.following.name}.{c['reset']}")
-            else:
-                await player.send(f"{c['yellow']}You aren't following anyone.{c['reset']}")
-            return
-
-        target_name = ' '.join(args).lower()
-
-        # Stop following
-        if target_name in ('self', 'stop', 'none'):
-            if hasattr(player, 'following') and player.following:
-                old_leader = player.following
-                player.following = None
-                await player.send(f"{c['yellow']}You stop following {old_leader.name}.{c['reset']}")
-                await old_leader.send(f"{c['yellow']}{player.name} stops following you.{c['reset']}")
-            else:
-                await player.send(f"{c['yellow']}You aren't following anyone.{c['reset']}")
-            return
-
-        # Find target in room
-        target = None
-        for char in player.room.characters:
-            if char != player and hasattr(char, 'connection'):  # Is a player
-                if char.name.lower().startswith(target_name):
-                    target = char
-                    break
-
-        if not target:
-            await player.send(f"{c['red']}Player '{target_name}' not found here.{c['reset']}")
-            return
-
-        # Can't follow yourself
-        if target == player:
-            await player.send(f"{c['red']}You can't follow yourself!{c['reset']}")
-            return
-
-        # Start following
-        player.following = target
-        await player.send(f"{c['green']}You start following {target.name}.{c['reset']}")
-        await target.send(f"{c['green']}{player.name} starts following you.{c['reset']}")
-
-    @classmethod
-    async def cmd_gtell(cls, player: 'Player', args: List[str]):
-        """Send a message to your group. Usage: gtell <message>"""
-        c = player.config.COLORS
-
-        if not hasattr(player, 'group') or not player.group:
-            await player.send(f"{c['red']}You're not in a group!{c['reset']}")
-            return
-
-        if not args:
-            await player.send(f"{c['yellow']}Tell the group what?{c['reset']}")
-            return
-
-        message = ' '.join(args)
-        await player.group.group_tell(player, message)
-
-    @classmethod
-    async def cmd_split(cls, player: 'Player', args: List[str]):
-        """Split gold with your group. Usage: split <amount>"""
-        c = player.config.COLORS
-
-        if not hasattr(player, 'group') or not player.group:
-            await player.send(f"{c['red']}You're not in a group!{c['reset']}")
-            return
-
-        if not args:
-            await player.send(f"{c['yellow']}Split how much gold?{c['reset']}")
-            return
-
-        try:
-            amount = int(args[0])
-        except ValueError:
-            await player.send(f"{c['red']}Invalid amount.{c['reset']}")
-            return
-
-        if amount <= 0:
-            await player.send(f"{c['red']}You must split a positive amount.{c['reset']}")
-            return
-
-        if player.gold < amount:
-            await player.send(f"{c['red']}You don't have that much gold! You have {player.gold} gold.{c['reset']}")
-            return
-
-        # Take gold from player
-        player.gold -= amount
-
-        # Split among group
-        await player.group.split_gold(amount)
-
-        # Announce
-        await player.send(f"{c['bright_yellow']}You split {amount} gold with your group.{c['reset']}")
-        for member in player.group.members:
-            if member != player:
-                await member.send(f"{c['bright_yellow']}{player.name} splits {amount} gold with the group.{c['reset']}")
-
-    # ==================== GLOBAL CHANNELS ====================
-
-    @classmethod
-    async def cmd_gossip(cls, player: 'Player', args: List[str]):
-        """Global chat channel. Usage: gossip <message>"""
-        c = player.config.COLORS
-
-        if not args:
-            await player.send(f"{c['yellow']}Gossip what?{c['reset']}")
-            return
-
-        message = ' '.join(args)
-        
-        # Send to all players in the world
-        if hasattr(player, 'world') and player.world:
-            for p in player.world.players.values():
-                if p == player:
-                    if not getattr(player, 'norepeat', False):
-                        await p.send(f"{c['magenta']}[Gossip] You gossip: {message}{c['reset']}")
-                else:
-                    if not getattr(p, 'noshout', False):
-                        await p.send(f"{c['magenta']}[Gossip] {player.name}: {message}{c['reset']}")
-
-    @classmethod
-    async def cmd_auction(cls, player: 'Player', args: List[str]):
-        """Auction channel for selling items. Usage: auction <message>"""
-        c = player.config.COLORS
-
-        if not args:
-            await player.send(f"{c['yellow']}Auction what?{c['reset']}")
-            return
-
-        message = ' '.join(args)
-        
-        if hasattr(player, 'world') and player.world:
-            for p in player.world.players.values():
-                if p == player:
-                    if not getattr(player, 'norepeat', False):
-                        await p.send(f"{c['bright_yellow']}[Auction] You auction: {message}{c['reset']}")
-                else:
-                    if not getattr(p, 'noshout', False):
-                        await p.send(f"{c['bright_yellow']}[Auction] {player.name}: {message}{c['reset']}")
-
-    @classmethod
-    async def cmd_grats(cls, player: 'Player', args: List[str]):
-        """Congratulations channel. Usage: grats <message>"""
-        c = player.config.COLORS
-
-        if not args:
-            # No args = just say grats
-            message = "Congratulations!"
-        else:
-            message = ' '.join(args)
-        
-        if hasattr(player, 'world') and player.world:
-            for p in player.world.players.values():
-                if p == player:
-                    if not getattr(player, 'norepeat', False):
-                        await p.send(f"{c['bright_green']}[Grats] You: {message}{c['reset']}")
-                else:
-                    if not getattr(p, 'noshout', False):
-                        await p.send(f"{c['bright_green']}[Grats] {player.name}: {message}{c['reset']}")
-
-    @classmethod
-    async def cmd_holler(cls, player: 'Player', args: List[str]):
-        """Shout to everyone (costs 20 movement). Usage: holler <message>"""
-        c = player.config.COLORS
-
-        if not args:
-            await player.send(f"{c['yellow']}Holler what?{c['reset']}")
-            return
-        
-        if player.move < 20:
-            await player.send(f"{c['red']}You're too exhausted to holler!{c['reset']}")
-            return
-        
-        player.move -= 20
-        message = ' '.join(args)
-        
-        if hasattr(player, 'world') and player.world:
-            for p in player.world.players.values():
-                if p == player:
-                    if not getattr(player, 'norepeat', False):
-                        await p.send(f"{c['bright_red']}You holler '{message}'{c['reset']}")
-                elif not getattr(p, 'noshout', False):
-                    await p.send(f"{c['bright_red']}{player.name} hollers '{message}'{c['reset']}")
-
-    @classmethod
-    async def cmd_qsay(cls, player: 'Player', args: List[str]):
-        """Say something on the quest channel. Usage: qsay <message>"""
-        c = player.config.COLORS
-
-        if not getattr(player, 'on_quest', False):
-            await player.send(f"{c['yellow']}You're not on a quest.{c['reset']}")
-            return
-
-        if not args:
-            await player.send(f"{c['yellow']}Quest-say what?{c['reset']}")
-            return
-
-        message = ' '.join(args)
-        
-        # Send to all players on the same quest
-        if hasattr(player, 'world') and player.world:
-            for p in player.world.players.values():
-                if getattr(p, 'on_quest', False):
-                    if p == player:
-                        await p.send(f"{c['bright_magenta']}[Quest] You: {message}{c['reset']}")
-                    else:
-                        await p.send(f"{c['bright_magenta']}[Quest] {player.name}: {message}{c['reset']}")
-
-    # ==================== INFO COMMANDS ====================
-
-    @classmethod
-    async def cmd_time(cls, player: 'Player', args: List[str]):
-        """Display the current game time."""
-        c = player.config.COLORS
-        
-        if hasattr(player, 'world') and player.world and hasattr(player.world, 'game_time'):
-            gt = player.world.game_time
-            
-            # Determine time of day
-            if gt.hour < 6:
-                time_desc = "the dead of night"
-            elif gt.hour < 9:
-                time_desc = "early morning"
-            elif gt.hour < 12:
-                time_desc = "morning"
-            elif gt.hour < 14:
-                time_desc = "midday"
-            elif gt.hour < 17:
-                time_desc = "afternoon"
-            elif gt.hour < 20:
-                time_desc = "evening"
-            elif gt.hour < 22:
-                time_desc = "night"
-            else:
-                time_desc = "late night"
-            
-            # Calculate minutes from tick counter if available
-            minutes = 0
-            if hasattr(gt, 'tick_counter'):
-                # tick_counter counts seconds until next hour (120 seconds = 1 MUD hour)
-                # So current minutes = (elapsed seconds in hour) / 2
-                seconds_per_hour = getattr(gt, 'SECONDS_PER_MUD_HOUR', 120)
-                elapsed = seconds_per_hour - gt.tick_counter if gt.tick_counter else 0
-                minutes = (elapsed * 60) // seconds_per_hour
-            
-            await player.send(f"{c['cyan']}It is {time_desc} ({gt.hour}:{minutes:02d}).{c['reset']}")
-            await player.send(f"{c['white']}Day {gt.day} of {gt.MONTH_NAMES[gt.month - 1] if hasattr(gt, 'MONTH_NAMES') else f'month {gt.month}'}, year {gt.year}.{c['reset']}")
-        else:
-            await player.send(f"{c['yellow']}Time seems meaningless here...{c['reset']}")
-
-    @classmethod
-    async def cmd_commands(cls, player: 'Player', args: List[str]):
-        """List all available commands."""
-        c = player.config.COLORS
-        
-        # Get all command methods
-        cmds = sorted([name[4:] for name in dir(cls) if name.startswith('cmd_') and callable(getattr(cls, name))])
-        
-        await player.send(f"{c['cyan']}=== Available Commands ==={c['reset']}")
-        
-        # Display in columns
-        cols = 5
-        for i in range(0, len(cmds), cols):
-            row = cmds[i:i+cols]
-            formatted = '  '.join(f"{cmd:<14}" for cmd in row)
-            await player.send(f"{c['white']}{formatted}{c['reset']}")
-        
-        await player.send(f"\n{c['yellow']}Type 'help <command>' for more information.{c['reset']}")
-
-    @classmethod
-    async def cmd_diagnose(cls, player: 'Player', args: List[str]):
-        """Check detailed health status. Usage: diagnose [target]"""
-        c = player.config.COLORS
-        
-        if args:
-            # Diagnose target
-            target = player.find_target_in_room(' '.join(args))
-            if not target:
-                await player.send(f"{c['red']}You don't see them here.{c['reset']}")
-                return
-        elif player.target:
-            target = player.target
-        else:
-            target = player
-        
-        hp_pct = target.hp / target.max_hp if target.max_hp > 0 else 0
-        
-        if hp_pct >= 1.0:
-            condition = f"{c['bright_green']}in perfect health{c['reset']}"
-        elif hp_pct >= 0.9:
-            condition = f"{c['green']}slightly scratched{c['reset']}"
-        elif hp_pct >= 0.75:
-            condition = f"{c['green']}lightly wounded{c['reset']}"
-        elif hp_pct >= 0.5:
-            condition = f"{c['yellow']}moderately wounded{c['reset']}"
-        elif hp_pct >= 0.30:
-            condition = f"{c['yellow']}heavily wounded{c['reset']}"
-        elif hp_pct >= 0.15:
-            condition = f"{c['bright_red']}severely wounded{c['reset']}"
-        elif hp_pct > 0:
-            condition = f"{c['red']}critically wounded{c['reset']}"
-        else:
-            condition = f"{c['red']}DEAD{c['reset']}"
-        
-        await player.send(f"{c['cyan']}{target.name} is {condition}.{c['reset']}")
-        await player.send(f"{c['white']}HP: {target.hp}/{target.max_hp} ({int(hp_pct * 100)}%){c['reset']}")
-        
-        # Show affects if any
-        if hasattr(target, 'affect_flags') and target.affect_flags:
-            affects = ', '.join(target.affect_flags)
-            await player.send(f"{c['magenta']}Affected by: {affects}{c['reset']}")
-
-    @classmethod
-    async def cmd_assist(cls, player: 'Player', args: List[str]):
-        """Help someone in combat. Usage: assist <player>"""
-        from combat import CombatHandler
-        c = player.config.COLORS
-        
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send(f"{c['yellow']}Assist whom?{c['reset']}")
-                return
-        
-        target_name = ' '.join(args)
-        target = None
-        
-        # Find player in room
-        for char in player.room.characters:
-            if char != player and target_name.lower() in char.name.lower():
-                target = char
-                break
-        
-        if not target:
-            await player.send(f"{c['red']}You don't see {target_name} here.{c['reset']}")
-            return
-        
-        # Check if they're fighting (handle both .target and .fighting attributes)
-        enemy = getattr(target, 'fighting', None) or getattr(target, 'target', None)
-        if not getattr(target, 'is_fighting', False) or not enemy:
-            await player.send(f"{c['yellow']}{target.name} isn't fighting anyone!{c['reset']}")
-            return
-        
-        if player.is_fighting and player.fighting != enemy:
-            await player.send(f"{c['yellow']}You're already fighting {player.fighting.name}.{c['reset']}")
-            return
-
-        await player.send(f"{c['green']}You rush to assist {target.name}!{c['reset']}")
-        # Only send to target if they can receive messages (players, not pets)
-        if hasattr(target, 'send'):
-            await target.send(f"{c['green']}{player.name} rushes to assist you!{c['reset']}")
-
-        # Join the fight without stealing the target
-        if not enemy.is_fighting:
-            await CombatHandler.start_combat(player, enemy)
-        else:
-            player.fighting = enemy
-            player.position = 'fighting'
-            if hasattr(player, 'target'):
-                player.target = enemy
-
-    @classmethod
-    @classmethod
-    async def cmd_protect(cls, player: 'Player', args: List[str]):
-        """Protect an ally, intercepting attacks. Usage: protect <ally>|protect off"""
-        c = player.config.COLORS
-
-        if player.char_class.lower() not in ('warrior', 'paladin'):
-            await player.send(f"{c['red']}Only warriors and paladins can protect allies!{c['reset']}")
-            return
-
-        if 'rescue' not in player.skills and 'shield_block' not in player.skills:
-            await player.send(f"{c['red']}You haven't learned how to protect allies yet.{c['reset']}")
-            return
-
-        if not args:
-            current = getattr(player, 'protecting', None)
-            if current:
-                await player.send(f"{c['cyan']}You are protecting {current.name}.{c['reset']}")
-                await player.send(f"{c['white']}Use 'protect <name>' to switch or 'protect off' to stop.{c['reset']}")
-            else:
-                await player.send(f"{c['yellow']}Protect whom?{c['reset']}")
-            return
-
-        target_name = ' '.join(args).lower()
-        if target_name in ('off', 'none', 'clear', 'stop'):
-            player.protecting = None
-            await player.send(f"{c['yellow']}You relax your protective stance.{c['reset']}")
-            return
-
-        if not player.room:
-            await player.send(f"{c['red']}You don't see anyone here to protect.{c['reset']}")
-            return
-
-        from mobs import Mobile
-        target = None
-        for char in player.room.characters:
-            if char == player:
-                continue
-            if isinstance(char, Mobile):
-                continue
-            if target_name in char.name.lower():
-                target = char
-                break
-
-        if not target:
-            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
-            return
-
-        existing_protectors = [
-            char for char in player.room.characters
-            if char != player and getattr(char, 'protecting', None) == target
-        ]
-        if existing_protectors:
-            names = ', '.join(ch.name for ch in existing_protectors[:2])
-            if len(existing_protectors) > 2:
-                names = f"{names} and others"
-            await player.send(f"{c['yellow']}Note: {target.name} is already being protected by {names}.{c['reset']}")
-
-        player.protecting = target
-        await player.send(f"{c['bright_green']}You move to protect {target.name}.{c['reset']}")
-        if hasattr(target, 'send'):
-            await target.send(f"{c['bright_green']}{player.name} moves to protect you.{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(
-                f"{c['cyan']}{player.name} takes a defensive stance in front of {target.name}.{c['reset']}",
-                exclude=[player, target]
-            )
-
-    @classmethod
-    async def cmd_wimpy(cls, player: 'Player', args: List[str]):
-        """Set auto-flee HP threshold. Usage: wimpy [hp amount]"""
-        c = player.config.COLORS
-        
-        if not args:
-            wimpy = getattr(player, 'wimpy', 0)
-            if wimpy > 0:
-                await player.send(f"{c['yellow']}You will flee when HP drops below {wimpy}.{c['reset']}")
-            else:
-                await player.send(f"{c['yellow']}Wimpy is disabled. Use 'wimpy <hp>' to set it.{c['reset']}")
-            return
-        
-        try:
-            amount = int(args[0])
-        except ValueError:
-            await player.send(f"{c['red']}Invalid HP amount.{c['reset']}")
-            return
-        
-        if amount < 0:
-            amount = 0
-        elif amount > player.max_hp:
-            amount = player.max_hp
-        
-        player.wimpy = amount
-        
-        if amount > 0:
-            await player.send(f"{c['green']}You will flee when HP drops below {amount}.{c['reset']}")
-        else:
-            await player.send(f"{c['yellow']}Wimpy disabled.{c['reset']}")
-
-    @classmethod
-    async def cmd_change(cls, player: 'Player', args: List[str]):
-        """MUME-style change command wrapper. Usage: change mood <mode> | change wimpy <hp> | change color <scheme>"""
-        c = player.config.COLORS
-
-        if not args:
-            await player.send(f"{c['yellow']}Usage: change mood <aggressive|normal|defensive>, change wimpy <hp>, change color <scheme>{c['reset']}")
-            return
-
-        sub = args[0].lower()
-        rest = args[1:]
-
-        if sub in ('mood', 'stance', 'emood', 'chgmode'):
-            await cls.cmd_stance(player, rest)
-            return
-        if sub == 'wimpy':
-            await cls.cmd_wimpy(player, rest)
-            return
-        if sub in ('color', 'colour'):
-            await cls.cmd_color(player, rest)
-            return
-
-        await player.send(f"{c['yellow']}Unknown change option '{sub}'. Try: mood, wimpy, color.{c['reset']}")
-
-    @classmethod
-    async def cmd_junk(cls, player: 'Player', args: List[str]):
-        """Destroy an item. Usage: junk <item>"""
-        c = player.config.COLORS
-        
-        if not args:
-            await player.send(f"{c['yellow']}Junk what?{c['reset']}")
-            return
-        
-        item_name = ' '.join(args)
-        item = None
-        
-        # Find in inventory
-        for inv_item in player.inventory:
-            if item_name.lower() in inv_item.name.lower():
-                item = inv_item
-                break
-        
-        if not item:
-            await player.send(f"{c['red']}You don't have that.{c['reset']}")
-            return
-        
-        # Remove item
-        player.inventory.remove(item)
-        
-        # Small gold reward based on item value
-        reward = getattr(item, 'value', 0) // 10
-        if reward > 0:
-            player.gold += reward
-            await player.send(f"{c['green']}You junk {item.short_desc} and salvage {reward} gold.{c['reset']}")
-        else:
-            await player.send(f"{c['yellow']}You junk {item.short_desc}.{c['reset']}")
-
-    @classmethod
-    async def cmd_use(cls, player: 'Player', args: List[str]):
-        """Use an item (potion, scroll, wand, etc). Usage: use <item> [target]"""
-        c = player.config.COLORS
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send(f"{c['yellow']}Use what? Usage: use <item> [target]{c['reset']}")
-                return
-        
-        target_name = args[0].lower()
-        target_obj = None
-        for obj in player.inventory:
-            if target_name in obj.name.lower():
-                target_obj = obj
-                break
-        
-        if not target_obj:
-            await player.send(f"{c['red']}You don't have '{target_name}'.{c['reset']}")
-            return
-        
-        item_type = getattr(target_obj, 'item_type', '')
-        if item_type == 'potion':
-            # Quaff the potion
-            effects = getattr(target_obj, 'spell_effects', [])
-            await player.send(f"{c['bright_green']}You quaff {target_obj.short_desc}.{c['reset']}")
-            if player.room:
-                for char in player.room.characters:
-                    if char != player and hasattr(char, 'send'):
-                        await char.send(f"{c['white']}{player.name} quaffs {target_obj.short_desc}.{c['reset']}")
-            # Apply spell effects
-            from spells import SpellHandler as SpellManager
-            target = player
-            if len(args) > 1:
-                # Find target
-                target_arg = args[1].lower()
-                for char in player.room.characters:
-                    if target_arg in char.name.lower():
-                        target = char
-                        break
-            for effect in effects:
-                spell_name = effect if isinstance(effect, str) else effect.get('spell', '')
-                if spell_name:
-                    try:
-                        await SpellManager.apply_spell_effect(player, target, spell_name, getattr(target_obj, 'level', player.level))
-                    except Exception:
-                        pass
-            # If no spell effects, check for healing value
-            if not effects:
-                heal = getattr(target_obj, 'value', 0)
-                if heal and isinstance(heal, int) and heal > 0:
-                    player.hp = min(player.max_hp, player.hp + heal)
-                    await player.send(f"{c['bright_green']}You feel better! (+{heal} HP){c['reset']}")
-                else:
-                    # Generic small heal for potions without defined effects
-                    heal = max(10, player.level * 2)
-                    player.hp = min(player.max_hp, player.hp + heal)
-                    await player.send(f"{c['bright_green']}You feel better! (+{heal} HP){c['reset']}")
-            player.inventory.remove(target_obj)
-        elif item_type == 'scroll':
-            await player.send(f"{c['bright_cyan']}You recite {target_obj.short_desc}.{c['reset']}")
-            effects = getattr(target_obj, 'spell_effects', [])
-            from spells import SpellHandler as SpellManager
-            target = player
-            if len(args) > 1:
-                target_arg = args[1].lower()
-                for char in player.room.characters:
-                    if target_arg in char.name.lower():
-                        target = char
-                        break
-            for effect in effects:
-                spell_name = effect if isinstance(effect, str) else effect.get('spell', '')
-                if spell_name:
-                    try:
-                        await SpellManager.apply_spell_effect(player, target, spell_name, getattr(target_obj, 'level', player.level))
-                    except Exception:
-                        pass
-            player.inventory.remove(target_obj)
-        elif item_type == 'wand':
-            # Wands have charges
-            charges = getattr(target_obj, 'charges', 0)
-            if charges <= 0:
-                await player.send(f"{c['yellow']}{target_obj.short_desc} is out of charges.{c['reset']}")
-                return
-            await player.send(f"{c['bright_magenta']}You wave {target_obj.short_desc}.{c['reset']}")
-            effects = getattr(target_obj, 'spell_effects', [])
-            from spells import SpellHandler as SpellManager
-            target = player
-            if len(args) > 1:
-                target_arg = args[1].lower()
-                for char in player.room.characters:
-                    if target_arg in char.name.lower():
-                        target = char
-                        break
-            for effect in effects:
-                spell_name = effect if isinstance(effect, str) else effect.get('spell', '')
-                if spell_name:
-                    try:
-                        await SpellManager.apply_spell_effect(player, target, spell_name, getattr(target_obj, 'level', player.level))
-                    except Exception:
-                        pass
-            target_obj.charges = charges - 1
-            await player.send(f"{c['cyan']}({target_obj.charges} charges remaining){c['reset']}")
-            if target_obj.charges <= 0:
-                await player.send(f"{c['yellow']}{target_obj.short_desc} crumbles to dust.{c['reset']}")
-                player.inventory.remove(target_obj)
-        elif item_type == 'staff':
-            # Staves have charges, affect all enemies in room
-            charges = getattr(target_obj, 'charges', 0)
-            if charges <= 0:
-                await player.send(f"{c['yellow']}{target_obj.short_desc} is out of charges.{c['reset']}")
-                return
-            await player.send(f"{c['bright_magenta']}You tap {target_obj.short_desc}.{c['reset']}")
-            effects = getattr(target_obj, 'spell_effects', [])
-            from spells import SpellHandler as SpellManager
-            for effect in effects:
-                spell_name = effect if isinstance(effect, str) else effect.get('spell', '')
-                if spell_name:
-                    try:
-                        await SpellManager.apply_spell_effect(player, player, spell_name, getattr(target_obj, 'level', player.level))
-                    except Exception:
-                        pass
-            target_obj.charges = charges - 1
-            await player.send(f"{c['cyan']}({target_obj.charges} charges remaining){c['reset']}")
-            if target_obj.charges <= 0:
-                await player.send(f"{c['yellow']}{target_obj.short_desc} crumbles to dust.{c['reset']}")
-                player.inventory.remove(target_obj)
-        elif item_type == 'food':
-            await cls.cmd_eat(player, args)
-        elif item_type == 'drink':
-            await cls.cmd_drink(player, args)
-        else:
-            await player.send(f"{c['yellow']}You can't figure out how to use {target_obj.short_desc}.{c['reset']}")
-
-    @classmethod
-    async def cmd_quaff(cls, player: 'Player', args: List[str]):
-        """Drink a potion. Usage: quaff <potion>"""
-        await cls.cmd_use(player, args)
-
-    @classmethod
-    async def cmd_recite(cls, player: 'Player', args: List[str]):
-        """Read a scroll. Usage: recite <scroll> [target]"""
-        await cls.cmd_use(player, args)
-
-    @classmethod  
-    async def cmd_levels(cls, player: 'Player', args: List[str]):
-        """Show experience required for each level."""
-        c = player.config.COLORS
-        
-        base_exp = getattr(player.config, 'BASE_EXP', 800)
-        exp_mult = getattr(player.config, 'EXP_MULTIPLIER', 1.4)
-        high_mult = getattr(player.config, 'HIGH_LEVEL_EXP_MULTIPLIER', 1.6)
-        threshold = getattr(player.config, 'HIGH_LEVEL_THRESHOLD', 30)
-        max_level = getattr(player.config, 'MAX_MORTAL_LEVEL', 60)
-        
-        await player.send(f"{c['cyan']}{'=' * 40}{c['reset']}")
-        await player.send(f"{c['cyan']}         Level Requirements{c['reset']}")
-        await player.send(f"{c['cyan']}{'=' * 40}{c['reset']}")
-        
-        # Calculate XP at threshold for high-level progression
-        level_30_xp = int(base_exp * (exp_mult ** (threshold - 1)))
-        
-        for lvl in range(1, max_level + 1):
-            if lvl <= threshold:
-                xp_required = int(base_exp * (exp_mult ** (lvl - 1)))
-            else:
-                levels_beyond = lvl - threshold
-                xp_required = int(level_30_xp * (high_mult ** levels_beyond))
-            
-            marker = f" {c['bright_green']}<-- YOU{c['reset']}" if lvl == player.level else ""
-            
-            # Color code by tier
-            if lvl <= 10:
-                lvl_color = c['white']
-            elif lvl <= 20:
-                lvl_color = c['green']
-            elif lvl <= 30:
-                lvl_color = c['cyan']
-            elif lvl <= 40:
-                lvl_color = c['yellow']
-            elif lvl <= 50:
-                lvl_color = c['bright_magenta']
-            else:
-                lvl_color = c['bright_red']
-            
-            await player.send(f"{lvl_color}Level {lvl:2}: {xp_required:>15,} XP{c['reset']}{marker}")
-
-    # ==================== BANKING COMMANDS ====================
-
-    @classmethod
-    async def cmd_deposit(cls, player: 'Player', args: List[str]):
-        """Deposit gold in the bank. Usage: deposit <amount>"""
-        c = player.config.COLORS
-        
-        # Check if in a bank room
-        if not player.room or 'bank' not in getattr(player.room, 'flags', set()):
-            await player.send(f"{c['yellow']}You must be at a bank to deposit gold.{c['reset']}")
-            return
-        
-        if not args:
-            await player.send(f"{c['yellow']}Deposit how much?{c['reset']}")
-            return
-        
-        try:
-            if args[0].lower() == 'all':
-                amount = player.gold
-            else:
-                amount = int(args[0])
-        except ValueError:
-            await player.send(f"{c['red']}Invalid amount.{c['reset']}")
-            return
-        
-        if amount <= 0:
-            await player.send(f"{c['red']}Nice try.{c['reset']}")
-            return
-        
-        if amount > player.gold:
-            await player.send(f"{c['red']}You don't have that much gold!{c['reset']}")
-            return
-        
-        # Ensure bank_gold is initialized and valid
-        player.bank_gold = max(0, getattr(player, 'bank_gold', 0))
-        player.gold -= amount
-        player.bank_gold += amount
-        
-        await player.send(f"{c['bright_yellow']}You deposit {amount:,} gold.{c['reset']}")
-        await player.send(f"{c['white']}Bank balance: {player.bank_gold:,} gold.{c['reset']}")
-
-    @classmethod
-    async def cmd_withdraw(cls, player: 'Player', args: List[str]):
-        """Withdraw gold from the bank. Usage: withdraw <amount>"""
-        c = player.config.COLORS
-        
-        # Check if in a bank room
-        if not player.room or 'bank' not in getattr(player.room, 'flags', set()):
-            await player.send(f"{c['yellow']}You must be at a bank to withdraw gold.{c['reset']}")
-            return
-        
-        if not args:
-            await player.send(f"{c['yellow']}Withdraw how much?{c['reset']}")
-            return
-        
-        bank_gold = getattr(player, 'bank_gold', 0)
-        
-        try:
-            if args[0].lower() == 'all':
-                amount = bank_gold
-            else:
-                amount = int(args[0])
-        except ValueError:
-            await player.send(f"{c['red']}Invalid amount.{c['reset']}")
-            return
-        
-        if amount <= 0:
-            await player.send(f"{c['red']}Nice try.{c['reset']}")
-            return
-        
-        if amount > bank_gold:
-            await player.send(f"{c['red']}You don't have that much gold in the bank!{c['reset']}")
-            return
-        
-        player.bank_gold -= amount
-        player.gold += amount
-        
-        await player.send(f"{c['bright_yellow']}You withdraw {amount:,} gold.{c['reset']}")
-        await player.send(f"{c['white']}Bank balance: {player.bank_gold:,} gold.{c['reset']}")
-
-    @classmethod
-    async def cmd_balance(cls, player: 'Player', args: List[str]):
-        """Check your bank balance."""
-        c = player.config.COLORS
-        
-        bank_gold = getattr(player, 'bank_gold', 0)
-        await player.send(f"{c['bright_yellow']}Bank Balance: {bank_gold:,} gold{c['reset']}")
-        await player.send(f"{c['white']}Gold on hand: {player.gold:,} gold{c['reset']}")
-
-    # ==================== FOOD & DRINK COMMANDS ====================
-
-    @classmethod
-    @classmethod
-    async def cmd_drink_alt(cls, player: 'Player', args: List[str]):
-        """Drink from a fountain or container. Usage: drink [from] <source>"""
-        c = player.config.COLORS
-        
-        if not args:
-            thirst_pct = (player.thirst / player.max_thirst) * 100
-            if thirst_pct > 80:
-                await player.send(f"{c['cyan']}You are not thirsty.{c['reset']}")
-            elif thirst_pct > 50:
-                await player.send(f"{c['yellow']}You could use a drink.{c['reset']}")
-            elif thirst_pct > 25:
-                await player.send(f"{c['yellow']}You are thirsty.{c['reset']}")
-            else:
-                await player.send(f"{c['red']}You are dying of thirst!{c['reset']}")
-            return
-        
-        # Handle "drink from X" syntax
-        target = ' '.join(args)
-        if target.lower().startswith('from '):
-            target = target[5:]
-        
-        # Check for fountains in room
-        fountain = None
-        if player.room:
-            for item in player.room.items:
-                if target.lower() in item.name.lower():
-                    if getattr(item, 'item_type', '') == 'fountain':
-                        fountain = item
-                        break
-        
-        if fountain:
-            drink_value = getattr(fountain, 'drink_value', 12)
-            player.thirst = min(player.max_thirst, player.thirst + drink_value)
-            await player.send(f"{c['cyan']}You drink from {fountain.short_desc}.{c['reset']}")
-            if player.room:
-                await player.room.send_to_room(f"{player.name} drinks from {fountain.short_desc}.", exclude=[player])
-            return
-        
-        # Check containers in inventory
-        container = None
-        for inv_item in player.inventory:
-            if target.lower() in inv_item.name.lower():
-                if getattr(inv_item, 'item_type', '') in ('drink', 'container'):
-                    if getattr(inv_item, 'drink_amount', 0) > 0:
-                        container = inv_item
-                        break
-        
-        if container:
-            drink_value = getattr(container, 'drink_value', 6)
-            container.drink_amount = getattr(container, 'drink_amount', 0) - 1
-            player.thirst = min(player.max_thirst, player.thirst + drink_value)
-            await player.send(f"{c['cyan']}You drink from {container.short_desc}.{c['reset']}")
-            if container.drink_amount <= 0:
-                await player.send(f"{c['yellow']}{container.short_desc} is now empty.{c['reset']}")
-            return
-        
-        await player.send(f"{c['red']}You can't drink from that.{c['reset']}")
-
-    @classmethod
-    async def cmd_fill(cls, player: 'Player', args: List[str]):
-        """Fill a container from a fountain. Usage: fill <container> [fountain]"""
-        c = player.config.COLORS
-        
-        if not args:
-            await player.send(f"{c['yellow']}Fill what?{c['reset']}")
-            return
-        
-        container_name = args[0]
-        fountain_name = ' '.join(args[1:]) if len(args) > 1 else None
-        
-        # Find container in inventory
-        container = None
-        for inv_item in player.inventory:
-            if container_name.lower() in inv_item.name.lower():
-                if getattr(inv_item, 'item_type', '') in ('drink', 'container'):
-                    container = inv_item
-                    break
-        
-        if not container:
-            await player.send(f"{c['red']}You don't have a container called '{container_name}'.{c['reset']}")
-            return
-        
-        # Find fountain in room
-        fountain = None
-        if player.room:
-            for item in player.room.items:
-                if getattr(item, 'item_type', '') == 'fountain':
-                    if fountain_name is None or fountain_name.lower() in item.name.lower():
-                        fountain = item
-                        break
-        
-        if not fountain:
-            await player.send(f"{c['red']}There's no fountain here to fill from.{c['reset']}")
-            return
-        
-        # Fill container
-        # Support new drink system (drinks/max_drinks/liquid) + legacy fields
-        max_drinks = getattr(container, 'max_drinks', None)
-        if max_drinks is None or max_drinks <= 0:
-            max_drinks = getattr(container, 'drinks', 0) or getattr(container, 'max_drink_amount', 10)
-        
-        container.drinks = max_drinks
-        container.max_drinks = max_drinks
-        container.liquid = getattr(fountain, 'liquid', getattr(fountain, 'liquid_type', 'water'))
-        
-        # Legacy fields for backward compatibility
-        container.drink_amount = max_drinks
-        container.liquid_type = container.liquid
-        
-        await player.send(f"{c['cyan']}You fill {container.short_desc} from {fountain.short_desc}.{c['reset']}")
-
-    @classmethod
-    async def cmd_taste(cls, player: 'Player', args: List[str]):
-        """Taste food or drink. Usage: taste <item>"""
-        c = player.config.COLORS
-        
-        if not args:
-            await player.send(f"{c['yellow']}Taste what?{c['reset']}")
-            return
-        
-        item_name = ' '.join(args)
-        item = None
-        
-        # Find in inventory
-        for inv_item in player.inventory:
-            if item_name.lower() in inv_item.name.lower():
-                item = inv_item
-                break
-        
-        if not item:
-            await player.send(f"{c['red']}You don't have that.{c['reset']}")
-            return
-        
-        item_type = getattr(item, 'item_type', '')
-        
-        if item_type == 'food':
-            # Small food benefit
-            player.hunger = min(player.max_hunger, player.hunger + 2)
-            await player.send(f"{c['green']}You taste {item.short_desc}. It's edible.{c['reset']}")
-        elif item_type in ('drink', 'container'):
-            if getattr(item, 'drink_amount', 0) > 0:
-                player.thirst = min(player.max_thirst, player.thirst + 1)
-                await player.send(f"{c['cyan']}You sip {item.short_desc}. It's {getattr(item, 'liquid_type', 'water')}.{c['reset']}")
-            else:
-                await player.send(f"{c['yellow']}{item.short_desc} is empty.{c['reset']}")
-        else:
-            await player.send(f"{c['yellow']}You lick {item.short_desc}. Tastes like... stuff.{c['reset']}")
-
-    # ==================== QUICK UTILITY COMMANDS ====================
-
-    @classmethod
-    async def cmd_toggle(cls, player: 'Player', args: List[str]):
-        """Show all toggle settings."""
-        c = player.config.COLORS
-        
-        def on_off(val):
-            return f"{c['green']}ON{c['reset']}" if val else f"{c['red']}OFF{c['reset']}"
-        
-        await player.send(f"{c['cyan']}=== Toggle Settings ==={c['reset']}")
-        await player.send(f"  Brief mode:      {on_off(getattr(player, 'brief_mode', False))}")
-        await player.send(f"  Compact mode:    {on_off(getattr(player, 'compact_mode', False))}")
-        await player.send(f"  Autoexit:        {on_off(getattr(player, 'autoexit', False))}")
-        await player.send(f"  Autoloot:        {on_off(getattr(player, 'autoloot', False))}")
-        await player.send(f"  Autoloot gold:   {on_off(getattr(player, 'autoloot_gold', True))}")
-        await player.send(f"  Autogold:        {on_off(getattr(player, 'autogold', True))}")
-        await player.send(f"  Autoattack:      {on_off(getattr(player, 'autoattack', False))}")
-        await player.send(f"  Autocombat:      {on_off(getattr(player, 'autocombat', False))}")
-        await player.send(f"  ASCII UI:        {on_off(getattr(player, 'ascii_ui', False))}")
-        await player.send(f"  Norepeat:        {on_off(getattr(player, 'norepeat', False))}")
-        await player.send(f"  Notell:          {on_off(getattr(player, 'notell', False))}")
-        await player.send(f"  Noshout:         {on_off(getattr(player, 'noshout', False))}")
-        
-        color_level = getattr(player, 'color_level', 'complete')
-        await player.send(f"  Color level:     {c['yellow']}{color_level}{c['reset']}")
-        
-        wimpy = getattr(player, 'wimpy', 0)
-        await player.send(f"  Wimpy:           {c['yellow']}{wimpy}{c['reset']} HP" if wimpy else f"  Wimpy:           {c['red']}OFF{c['reset']}")
-        
-        autorecall = getattr(player, 'autorecall_hp', None)
-        if autorecall:
-            pct = '%' if getattr(player, 'autorecall_is_percent', False) else ' HP'
-            await player.send(f"  Autorecall:      {c['yellow']}{autorecall}{pct}{c['reset']}")
-        else:
-            await player.send(f"  Autorecall:      {c['red']}OFF{c['reset']}")
-        
-        prompt = getattr(player, 'custom_prompt', None)
-        await player.send(f"  Custom prompt:   {c['yellow']}{prompt}{c['reset']}" if prompt else f"  Custom prompt:   {c['red']}default{c['reset']}")
-        await player.send(f"  Prompt display:  {on_off(getattr(player, 'prompt_enabled', True))}")
-        
-        await player.send(f"\n{c['white']}Use command name to toggle (e.g., 'brief', 'autoexit', 'notell'){c['reset']}")
-
-    @classmethod
-    async def cmd_color(cls, player: 'Player', args: List[str]):
-        """Set color level. Usage: color [off|sparse|normal|complete]"""
-        c = player.config.COLORS
-        
-        levels = ['off', 'sparse', 'normal', 'complete']
-        current = getattr(player, 'color_level', 'complete')
-        
-        if not args:
-            await player.send(f"{c['cyan']}Current color level: {c['white']}{current}{c['reset']}")
-            await player.send(f"{c['yellow']}Usage: color <off|sparse|normal|complete>{c['reset']}")
-            return
-        
-        level = args[0].lower()
-        if level not in levels:
-            await player.send(f"{c['red']}Invalid level. Choose: off, sparse, normal, complete{c['reset']}")
-            return
-        
-        player.color_level = level
-        await player.send(f"{c['green']}Color level set to: {level}{c['reset']}")
-
-    @classmethod
-    async def cmd_prompt(cls, player: 'Player', args: List[str]):
-        """Set custom prompt. Usage: prompt <format> or prompt default"""
-        c = player.config.COLORS
-        
-        if not args:
-            current = getattr(player, 'custom_prompt', None)
-            if current:
-                await player.send(f"{c['cyan']}Current prompt: {c['white']}{current}{c['reset']}")
-            else:
-                await player.send(f"{c['cyan']}Using default prompt.{c['reset']}")
-            await player.send(f"{c['yellow']}Prompt is {'ON' if getattr(player, 'prompt_enabled', True) else 'OFF'} (use: prompt on/off){c['reset']}")
-            await player.send(f"{c['yellow']}Format codes: %h=HP %H=MaxHP %m=Mana %M=MaxMana %v=Move %V=MaxMove %g=Gold %x=XP %p=HP% %q=Mana% %r=Move% %n=Newline{c['reset']}")
-            await player.send(f"{c['yellow']}Example: prompt <%h/%Hhp %m/%Mm %v/%Vmv> {c['reset']}")
-            return
-        
-        prompt_str = ' '.join(args)
-        
-        # Toggle prompt display
-        if prompt_str.lower() in ['on', 'off']:
-            player.prompt_enabled = (prompt_str.lower() == 'on')
-            state = 'ON' if player.prompt_enabled else 'OFF'
-            await player.send(f"{c['green']}Prompt is now {state}.{c['reset']}")
-            return
-        
-        if prompt_str.lower() == 'default':
-            player.custom_prompt = None
-            await player.send(f"{c['green']}Prompt reset to default.{c['reset']}")
-        else:
-            player.custom_prompt = prompt_str
-            await player.send(f"{c['green']}Prompt set to: {prompt_str}{c['reset']}")
-
-    @classmethod
-    async def cmd_display(cls, player: 'Player', args: List[str]):
-        """Set display options. Alias for prompt."""
-        await cls.cmd_prompt(player, args)
-
-    @classmethod
-    async def cmd_autoexit(cls, player: 'Player', args: List[str]):
-        """Toggle automatic exit display on room entry."""
-        c = player.config.COLORS
-        
-        player.autoexit = not getattr(player, 'autoexit', False)
-        
-        if player.autoexit:
-            await player.send(f"{c['green']}Autoexit is now ON. Exits will show when you enter rooms.{c['reset']}")
-        else:
-            await player.send(f"{c['yellow']}Autoexit is now OFF.{c['reset']}")
-
-    @classmethod
-    async def cmd_norepeat(cls, player: 'Player', args: List[str]):
-        """Toggle echoing of your own communication."""
-        c = player.config.COLORS
-        
-        player.norepeat = not getattr(player, 'norepeat', False)
-        
-        if player.norepeat:
-            await player.send(f"{c['green']}Norepeat ON. You won't see your own says/tells echoed.{c['reset']}")
-        else:
-            await player.send(f"{c['yellow']}Norepeat OFF. You'll see your own communication.{c['reset']}")
-
-    @classmethod
-    async def cmd_notell(cls, player: 'Player', args: List[str]):
-        """Toggle blocking of tells from other players."""
-        c = player.config.COLORS
-        
-        player.notell = not getattr(player, 'notell', False)
-        
-        if player.notell:
-            await player.send(f"{c['green']}Notell ON. You will not receive tells.{c['reset']}")
-        else:
-            await player.send(f"{c['yellow']}Notell OFF. You can receive tells.{c['reset']}")
-
-    @classmethod
-    async def cmd_noshout(cls, player: 'Player', args: List[str]):
-        """Toggle blocking of shouts and hollers."""
-        c = player.config.COLORS
-        
-        player.noshout = not getattr(player, 'noshout', False)
-        
-        if player.noshout:
-            await player.send(f"{c['green']}Noshout ON. You will not hear shouts or hollers.{c['reset']}")
-        else:
-            await player.send(f"{c['yellow']}Noshout OFF. You can hear shouts.{c['reset']}")
-
-    # ==================== SOCIAL & COMMUNICATION ====================
-
-    @classmethod
-    async def cmd_global(cls, player: 'Player', args: List[str]):
-        """Send a message on the global chat channel. Usage: global <message>"""
-        if not args:
-            await player.send("Global what?")
-            return
-        from social import send_channel_message
-        await send_channel_message(player, 'global', ' '.join(args))
-
-    @classmethod
-    async def cmd_newbie(cls, player: 'Player', args: List[str]):
-        """Send a message on the newbie help channel (levels 1-15 + helpers). Usage: newbie <message>"""
-        if not args:
-            await player.send("Newbie what?")
-            return
-        from social import send_channel_message
-        await send_channel_message(player, 'newbie', ' '.join(args))
-
-    @classmethod
-    async def cmd_trade(cls, player: 'Player', args: List[str]):
-        """Send a message on the trade channel. Usage: trade <message>"""
-        if not args:
-            await player.send("Trade what?")
-            return
-        from social import send_channel_message
-        await send_channel_message(player, 'trade', ' '.join(args))
-
-    @classmethod
-    async def cmd_lfg(cls, player: 'Player', args: List[str]):
-        """Send a message on the LFG (Looking For Group) channel. Usage: lfg <message>"""
-        if not args:
-            await player.send("LFG what?")
-            return
-        from social import send_channel_message
-        await send_channel_message(player, 'lfg', ' '.join(args))
-
-    @classmethod
-    async def cmd_channel(cls, player: 'Player', args: List[str]):
-        """Manage chat channels. Usage: channel list | channel on/off <name>"""
-        from social import CHANNELS, can_access_channel, is_channel_on
-        c = player.config.COLORS
-
-        if not args or args[0].lower() == 'list':
-            await player.send(f"\r\n{c['cyan']}═══ Chat Channels ═══{c['reset']}")
-            for key, ch in CHANNELS.items():
-                access = can_access_channel(player, key)
-                enabled = is_channel_on(player, key)
-                color = c.get(ch['color'], c['white'])
-                status = f"{c['bright_green']}ON" if enabled else f"{c['red']}OFF"
-                access_str = "" if access else f" {c['bright_black']}(locked)"
-                await player.send(f"  {color}{ch['name']:<10}{c['reset']} {status}{c['reset']} - {ch['description']}{access_str}{c['reset']}")
-            await player.send(f"{c['white']}Use 'channel on/off <name>' to toggle.{c['reset']}")
-            return
-
-        if len(args) < 2:
-            await player.send(f"{c['yellow']}Usage: channel on/off <name>{c['reset']}")
-            return
-
-        action = args[0].lower()
-        ch_name = args[1].lower()
-
-        if ch_name not in CHANNELS:
-            await player.send(f"{c['red']}Unknown channel '{ch_name}'. Use 'channel list'.{c['reset']}")
-            return
-
-        if not hasattr(player, 'disabled_channels'):
-            player.disabled_channels = set()
-
-        if action == 'on':
-            player.disabled_channels.discard(ch_name)
-            await player.send(f"{c['bright_green']}{CHANNELS[ch_name]['name']} channel turned ON.{c['reset']}")
-        elif action == 'off':
-            player.disabled_channels.add(ch_name)
-            await player.send(f"{c['yellow']}{CHANNELS[ch_name]['name']} channel turned OFF.{c['reset']}")
-        else:
-            await player.send(f"{c['yellow']}Usage: channel on/off <name>{c['reset']}")
-
-    @classmethod
-    async def cmd_friend(cls, player: 'Player', args: List[str]):
-        """Manage your friends list. Usage: friend add/remove/list/notify"""
-        from social import add_friend, remove_friend, show_friends
-        c = player.config.COLORS
-
-        if not args or args[0].lower() == 'list':
-            await show_friends(player)
-            return
-
-        action = args[0].lower()
-        if action == 'add':
-            if len(args) < 2:
-                await player.send(f"{c['yellow']}Usage: friend add <player>{c['reset']}")
-                return
-            await add_friend(player, args[1])
-        elif action == 'remove':
-            if len(args) < 2:
-                await player.send(f"{c['yellow']}Usage: friend remove <player>{c['reset']}")
-                return
-            await remove_friend(player, args[1])
-        elif action == 'notify':
-            player.friend_notify = not getattr(player, 'friend_notify', True)
-            if player.friend_notify:
-                await player.send(f"{c['bright_green']}Friend login/logout notifications ON.{c['reset']}")
-            else:
-                await player.send(f"{c['yellow']}Friend login/logout notifications OFF.{c['reset']}")
-        else:
-            await player.send(f"{c['yellow']}Usage: friend add/remove/list/notify{c['reset']}")
-
-    @classmethod
-    async def cmd_ignore(cls, player: 'Player', args: List[str]):
-        """Ignore a player (blocks tells, channels, emotes). Usage: ignore <player>"""
-        c = player.config.COLORS
-        if not args:
-            # Show ignore list
-            ignored = getattr(player, 'ignore_list', [])
-            if not ignored:
-                await player.send(f"{c['yellow']}Your ignore list is empty.{c['reset']}")
-            else:
-                await player.send(f"\r\n{c['cyan']}═══ Ignore List ═══{c['reset']}")
-                for name in ignored:
-                    await player.send(f"  {c['white']}{name}{c['reset']}")
-            return
-        from social import ignore_player
-        await ignore_player(player, args[0])
-
-    @classmethod
-    async def cmd_unignore(cls, player: 'Player', args: List[str]):
-        """Remove a player from your ignore list. Usage: unignore <player>"""
-        if not args:
-            await player.send("Unignore whom?")
-            return
-        from social import unignore_player
-        await unignore_player(player, args[0])
-
-    @classmethod
-    async def cmd_note(cls, player: 'Player', args: List[str]):
-        """Add private notes about players. Usage: note [player] [text]"""
-        from social import add_note, show_notes
-
-        if not args:
-            await show_notes(player)
-            return
-
-        if len(args) == 1:
-            await show_notes(player, args[0])
-            return
-
-        await add_note(player, args[0], ' '.join(args[1:]))
-
-    @classmethod
-    async def cmd_finger(cls, player: 'Player', args: List[str]):
-        """Show detailed info about a player. Usage: finger <player>"""
-        if not args:
-            await player.send("Finger whom?")
-            return
-        from social import show_finger
-        await show_finger(player, args[0])
-
-    @classmethod
-    async def cmd_whois(cls, player: 'Player', args: List[str]):
-        """Show detailed info about a player. Alias for finger."""
-        await cls.cmd_finger(player, args)
-
-    # ==================== PLAYER FEEDBACK ====================
-
-    @classmethod
-    async def cmd_bug(cls, player: 'Player', args: List[str]):
-        """Report a bug. Usage: bug <description>"""
-        c = player.config.COLORS
-        
-        if not args:
-            await player.send(f"{c['yellow']}Usage: bug <description of the bug>{c['reset']}")
-            return
-        
-        import os
-        from datetime import datetime
-        
-        report = ' '.join(args)
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        room_vnum = player.room.vnum if player.room else 'unknown'
-        
-        # Append to bugs file
-        bug_file = os.path.join(os.path.dirname(__file__), '..', 'logs', 'bugs.log')
-        os.makedirs(os.path.dirname(bug_file), exist_ok=True)
-        
-        with open(bug_file, 'a') as f:
-            f.write(f"[{timestamp}] {player.name} (Room {room_vnum}): {report}\n")
-        
-        await player.send(f"{c['green']}Bug reported. Thank you!{c['reset']}")
-
-    @classmethod
-    async def cmd_idea(cls, player: 'Player', args: List[str]):
-        """Suggest an idea. Usage: idea <your suggestion>"""
-        c = player.config.COLORS
-        
-        if not args:
-            await player.send(f"{c['yellow']}Usage: idea <your suggestion>{c['reset']}")
-            return
-        
-        import os
-        from datetime import datetime
-        
-        report = ' '.join(args)
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        idea_file = os.path.join(os.path.dirname(__file__), '..', 'logs', 'ideas.log')
-        os.makedirs(os.path.dirname(idea_file), exist_ok=True)
-        
-        with open(idea_file, 'a') as f:
-            f.write(f"[{timestamp}] {player.name}: {report}\n")
-        
-        await player.send(f"{c['green']}Idea submitted. Thank you!{c['reset']}")
-
-    @classmethod
-    async def cmd_typo(cls, player: 'Player', args: List[str]):
-        """Report a typo. Usage: typo <description>"""
-        c = player.config.COLORS
-        
-        if not args:
-            await player.send(f"{c['yellow']}Usage: typo <description of the typo>{c['reset']}")
-            return
-        
-        import os
-        from datetime import datetime
-        
-        report = ' '.join(args)
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        room_vnum = player.room.vnum if player.room else 'unknown'
-        
-        typo_file = os.path.join(os.path.dirname(__file__), '..', 'logs', 'typos.log')
-        os.makedirs(os.path.dirname(typo_file), exist_ok=True)
-        
-        with open(typo_file, 'a') as f:
-            f.write(f"[{timestamp}] {player.name} (Room {room_vnum}): {report}\n")
-        
-        await player.send(f"{c['green']}Typo reported. Thank you!{c['reset']}")
-
-    # ==================== SERVER INFO ====================
-
-    @classmethod
-    async def cmd_news(cls, player: 'Player', args: List[str]):
-        """Display server news and updates."""
-        c = player.config.COLORS
-        
-        await player.send(f"{c['bright_cyan']}=== Misthollow News ==={c['reset']}")
-        await player.send(f"{c['white']}Welcome to Misthollow!{c['reset']}")
-        await player.send(f"")
-        await player.send(f"{c['yellow']}Recent Updates:{c['reset']}")
-        await player.send(f"  - 7 unique class systems (Bard, Warrior, Ranger, Paladin, Thief, Cleric, Necromancer)")
-        await player.send(f"  - Pet and companion system")
-        await player.send(f"  - Banking system (west then north from Market Square)")
-        await player.send(f"  - Hunger/thirst system (drink from fountains!)")
-        await player.send(f"  - 30+ social commands")
-        await player.send(f"  - Web map at http://72.35.132.11:4001")
-        await player.send(f"")
-        await player.send(f"{c['cyan']}Type 'help' for commands, 'policy' for rules.{c['reset']}")
-
-    @classmethod
-    async def cmd_motd(cls, player: 'Player', args: List[str]):
-        """Display the Message of the Day."""
-        c = player.config.COLORS
-        
-        await player.send(f"{c['bright_yellow']}=== Message of the Day ==={c['reset']}")
-        await player.send(f"")
-        await player.send(f"{c['white']}Welcome, adventurer!{c['reset']}")
-        await player.send(f"")
-        await player.send(f"{c['cyan']}The Realms await your exploration.{c['reset']}")
-        await player.send(f"{c['cyan']}New players: Head south to the Market Square,{c['reset']}")
-        await player.send(f"{c['cyan']}then explore the city of Midgaard.{c['reset']}")
-        await player.send(f"")
-        await player.send(f"{c['bright_green']}Quickstart:{c['reset']}")
-        await player.send(f"  {c['white']}look  | score  | inventory  | equipment{c['reset']}")
-        await player.send(f"  {c['white']}consider <mob> | kill <mob> | flee{c['reset']}")
-        await player.send(f"  {c['white']}drink fountain | deposit <amt> | balance{c['reset']}")
-        await player.send(f"")
-        await player.send(f"{c['yellow']}Tip: Use 'consider <mob>' before attacking!{c['reset']}")
-        await player.send(f"{c['yellow']}Tip: Drink from the fountain in Temple Square or Market Square!{c['reset']}")
-
-    @classmethod
-    async def cmd_updates(cls, player: 'Player', args: List[str]):
-        """Show recent game updates and changes. Usage: updates [number of days]"""
-        import json
-        import os
-        c = player.config.COLORS
-        
-        updates_file = 'data/updates.json'
-        if not os.path.exists(updates_file):
-            await player.send(f"{c['yellow']}No updates available.{c['reset']}")
-            return
-        
-        try:
-            with open(updates_file) as f:
-                data = json.load(f)
-        except Exception as e:
-            await player.send(f"{c['red']}Error reading updates.{c['reset']}")
-            return
-        
-        updates = data.get('updates', [])
-        if not updates:
-            await player.send(f"{c['yellow']}No updates available.{c['reset']}")
-            return
-        
-        # How many days to show (default 7)
-        days_to_show = 7
-        if args:
-            try:
-                days_to_show = int(args[0])
-            except ValueError:
-                pass
-        
-        await player.send(f"\n{c['bright_cyan']}╔══════════════════════════════════════════════════════════════╗{c['reset']}")
-        await player.send(f"{c['bright_cyan']}║{c['bright_yellow']}                    RECENT UPDATES                           {c['bright_cyan']}║{c['reset']}")
-        await player.send(f"{c['bright_cyan']}╚══════════════════════════════════════════════════════════════╝{c['reset']}")
-        
-        shown = 0
-        for update in updates[:days_to_show]:
-            date = update.get('date', 'Unknown')
-            version = update.get('version', '')
-            changes = update.get('changes', [])
-            
-            version_str = f" (v{version})" if version else ""
-            await player.send(f"\n{c['bright_green']}═══ {date}{version_str} ═══{c['reset']}")
-            
-            for change in changes:
-                await player.send(f"  {c['white']}• {change}{c['reset']}")
-            
-            shown += 1
-        
-        await player.send(f"\n{c['cyan']}Showing {shown} update(s). Use 'updates <n>' for more.{c['reset']}")
-        await player.send(f"{c['cyan']}Report bugs with: bug <description>{c['reset']}\n")
-
-    @classmethod
-    async def cmd_changelog(cls, player: 'Player', args: List[str]):
-        """Alias for updates command."""
-        await cls.cmd_updates(player, args)
-
-    @classmethod
-    async def cmd_news(cls, player: 'Player', args: List[str]):
-        """Alias for updates command."""
-        await cls.cmd_updates(player, args)
-
-    @classmethod
-    async def cmd_policy(cls, player: 'Player', args: List[str]):
-        """Display server policies and rules."""
-        c = player.config.COLORS
-        
-        await player.send(f"{c['bright_red']}=== Server Policy ==={c['reset']}")
-        await player.send(f"")
-        await player.send(f"{c['white']}1. Be respectful to other players.{c['reset']}")
-        await player.send(f"{c['white']}2. No harassment or hate speech.{c['reset']}")
-        await player.send(f"{c['white']}3. No exploiting bugs (report them with 'bug').{c['reset']}")
-        await player.send(f"{c['white']}4. No botting or automation scripts.{c['reset']}")
-        await player.send(f"{c['white']}5. Multiple characters are allowed.{c['reset']}")
-        await player.send(f"")
-        await player.send(f"{c['yellow']}Violations may result in character deletion.{c['reset']}")
-        await player.send(f"{c['cyan']}Have fun and happy adventuring!{c['reset']}")
-
-    @classmethod
-    async def cmd_info(cls, player: 'Player', args: List[str]):
-        """Display game information for new players."""
-        c = player.config.COLORS
-        
-        await player.send(f"{c['bright_green']}=== New Player Information ==={c['reset']}")
-        await player.send(f"")
-        await player.send(f"{c['cyan']}Getting Started:{c['reset']}")
-        await player.send(f"  - Use compass directions to move (north, south, etc.)")
-        await player.send(f"  - 'look' to see your surroundings")
-        await player.send(f"  - 'score' to see your character stats")
-        await player.send(f"  - 'inventory' or 'i' to see what you're carrying")
-        await player.send(f"  - 'equipment' or 'eq' to see what you're wearing")
-        await player.send(f"")
-        await player.send(f"{c['cyan']}Combat:{c['reset']}")
-        await player.send(f"  - 'consider <mob>' to check difficulty")
-        await player.send(f"  - 'kill <mob>' to attack")
-        await player.send(f"  - 'flee' to escape")
-        await player.send(f"")
-        await player.send(f"{c['cyan']}Useful Commands:{c['reset']}")
-        await player.send(f"  - 'help <topic>' for detailed help")
-        await player.send(f"  - 'commands' for full command list")
-        await player.send(f"  - 'who' to see online players")
-
-    # ==================== MISC COMMANDS ====================
-
-    @classmethod
-    async def cmd_knock(cls, player: 'Player', args: List[str]):
-        """Knock on a door. Usage: knock <direction>"""
-        c = player.config.COLORS
-        
-        if not args:
-            await player.send(f"{c['yellow']}Knock on which door?{c['reset']}")
-            return
-        
-        direction = args[0].lower()
-        
-        if not player.room or direction not in player.room.exits:
-            await player.send(f"{c['red']}There's no exit in that direction.{c['reset']}")
-            return
-        
-        exit_data = player.room.exits[direction]
-        
-        if 'door' not in exit_data:
-            await player.send(f"{c['yellow']}There's no door there.{c['reset']}")
-            return
-        
-        door = exit_data['door']
-        door_name = door.get('name', 'door')
-        
-        await player.send(f"{c['cyan']}You knock on the {door_name}.{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name} knocks on the {door_name}.", exclude=[player])
-        
-        # Notify people on the other side
-        target_room = exit_data.get('room')
-        if target_room:
-            await target_room.send_to_room(f"{c['yellow']}Someone knocks on the {door_name} from the other side.{c['reset']}")
-
-    @classmethod
-    async def cmd_enter(cls, player: 'Player', args: List[str]):
-        """Enter a building or portal. Usage: enter [portal/building name]"""
-        c = player.config.COLORS
-        
-        if not player.room:
-            await player.send(f"{c['red']}You are nowhere!{c['reset']}")
-            return
-        
-        # If no args, look for obvious entrance
-        if not args:
-            # Check for portals or buildings in room
-            for item in player.room.items:
-                if getattr(item, 'item_type', '') == 'portal':
-                    target_room = item.portal_target if hasattr(item, 'portal_target') else None
-                    if target_room and hasattr(player, 'world'):
-                        dest = player.world.rooms.get(target_room)
-                        if dest:
-                            await player.room.send_to_room(f"{player.name} enters {item.short_desc}.", exclude=[player])
-                            player.room.characters.remove(player)
-                            player.room = dest
-                            dest.characters.append(player)
-                            await player.send(f"{c['cyan']}You enter {item.short_desc}.{c['reset']}")
-                            await player.do_look([])
-                            await dest.send_to_room(f"{player.name} arrives.", exclude=[player])
-                            return
-            
-            # Try common directions for "inside"
-            for direction in ['in', 'inside', 'building', 'enter']:
-                if direction in player.room.exits:
-                    from commands import CommandHandler
-                    await CommandHandler.cmd_move(player, direction)
-                    return
-            
-            await player.send(f"{c['yellow']}Enter what? Specify a direction or portal name.{c['reset']}")
-            return
-        
-        target = ' '.join(args).lower()
-        
-        # Check items for portals
-        for item in player.room.items:
-            if target in item.name.lower() and getattr(item, 'item_type', '') == 'portal':
-                target_room = item.portal_target if hasattr(item, 'portal_target') else None
-                if target_room and hasattr(player, 'world'):
-                    dest = player.world.rooms.get(target_room)
-                    if dest:
-                        await player.room.send_to_room(f"{player.name} enters {item.short_desc}.", exclude=[player])
-                        player.room.characters.remove(player)
-                        player.room = dest
-                        dest.characters.append(player)
-                        await player.send(f"{c['cyan']}You enter {item.short_desc}.{c['reset']}")
-                        await player.do_look([])
-                        await dest.send_to_room(f"{player.name} arrives.", exclude=[player])
-                        return
-        
-        await player.send(f"{c['red']}You can't enter that.{c['reset']}")
-
-    @classmethod
-    async def cmd_leave(cls, player: 'Player', args: List[str]):
-        """Leave a building to go outside. Usage: leave"""
-        c = player.config.COLORS
-        
-        if not player.room:
-            await player.send(f"{c['red']}You are nowhere!{c['reset']}")
-            return
-        
-        # Try common exit directions
-        for direction in ['out', 'outside', 'exit', 'leave']:
-            if direction in player.room.exits:
-                from commands import CommandHandler
-                await CommandHandler.cmd_move(player, direction)
-                return
-        
-        # If indoors, try to find an outdoor exit
-        if 'indoors' in getattr(player.room, 'flags', []):
-            for direction, exit_data in player.room.exits.items():
-                target_room = exit_data.get('room')
-                if target_room and 'indoors' not in getattr(target_room, 'flags', []):
-                    from commands import CommandHandler
-                    await CommandHandler.cmd_move(player, direction)
-                    return
-        
-        await player.send(f"{c['yellow']}There's no obvious way out.{c['reset']}")
-
-    @classmethod
-    async def cmd_report(cls, player: 'Player', args: List[str]):
-        """Report your status to the group."""
-        c = player.config.COLORS
-        
-        hp_pct = int((player.hp / player.max_hp) * 100) if player.max_hp > 0 else 0
-        mana_pct = int((player.mana / player.max_mana) * 100) if player.max_mana > 0 else 0
-        move_pct = int((player.move / player.max_move) * 100) if player.max_move > 0 else 0
-        
-        report = f"{player.name} reports: {player.hp}/{player.max_hp} HP ({hp_pct}%), {player.mana}/{player.max_mana} Mana ({mana_pct}%), {player.move}/{player.max_move} Move ({move_pct}%)"
-        
-        if hasattr(player, 'group') and player.group:
-            # Send to group
-            for member in player.group.members:
-                await member.send(f"{c['cyan']}{report}{c['reset']}")
-        else:
-            # Just show in room
-            await player.send(f"{c['cyan']}You report: {player.hp}/{player.max_hp} HP, {player.mana}/{player.max_mana} Mana, {player.move}/{player.max_move} Move{c['reset']}")
-            if player.room:
-                await player.room.send_to_room(f"{c['white']}{report}{c['reset']}", exclude=[player])
-
-    @classmethod
-    async def cmd_socials(cls, player: 'Player', args: List[str]):
-        """List all available social commands."""
-        c = player.config.COLORS
-        
-        social_list = sorted(cls.SOCIALS.keys())
-        
-        await player.send(f"{c['cyan']}=== Social Commands ==={c['reset']}")
-        
-        # Display in columns
-        cols = 6
-        for i in range(0, len(social_list), cols):
-            row = social_list[i:i+cols]
-            formatted = '  '.join(f"{s:<12}" for s in row)
-            await player.send(f"{c['white']}{formatted}{c['reset']}")
-        
-        await player.send(f"\n{c['yellow']}Usage: <social> [target]{c['reset']}")
-
-    @classmethod
-    async def cmd_title(cls, player: 'Player', args: List[str]):
-        """Set your title. Usage: title <new title>"""
-        c = player.config.COLORS
-        
-        if not args:
-            current = getattr(player, 'title', 'the Adventurer')
-            await player.send(f"{c['cyan']}Your current title: {c['white']}{player.name} {current}{c['reset']}")
-            await player.send(f"{c['yellow']}Usage: title <new title>{c['reset']}")
-            return
-        
-        new_title = ' '.join(args)
-        
-        # Sanitize - no parentheses (reserved for flags)
-        if '(' in new_title or ')' in new_title:
-            await player.send(f"{c['red']}Titles cannot contain parentheses.{c['reset']}")
-            return
-        
-        # Length limit
-        if len(new_title) > 40:
-            await player.send(f"{c['red']}Title too long (max 40 characters).{c['reset']}")
-            return
-        
-        player.title = new_title
-        await player.send(f"{c['green']}Title set to: {player.name} {new_title}{c['reset']}")
-
-    @classmethod
-    async def cmd_donate(cls, player: 'Player', args: List[str]):
-        """Donate an item to help newbies. Usage: donate <item>"""
-        c = player.config.COLORS
-        
-        if not args:
-            await player.send(f"{c['yellow']}Donate what?{c['reset']}")
-            return
-        
-        item_name = ' '.join(args)
-        item = None
-        
-        # Find in inventory
-        for inv_item in player.inventory:
-            if item_name.lower() in inv_item.name.lower():
-                item = inv_item
-                break
-        
-        if not item:
-            await player.send(f"{c['red']}You don't have that.{c['reset']}")
-            return
-        
-        # Remove from inventory
-        player.inventory.remove(item)
-        
-        # 75% chance goes to donation room, 25% junked
-        import random
-        if random.randint(1, 100) <= 75:
-            # Find donation room (3002 in Midgaard)
-            donation_room = player.world.rooms.get(3002) if hasattr(player, 'world') else None
-            if donation_room:
-                donation_room.items.append(item)
-                await player.send(f"{c['green']}You donate {item.short_desc}. It has been sent to the donation room.{c['reset']}")
-            else:
-                await player.send(f"{c['green']}You donate {item.short_desc}. The gods accept your generosity.{c['reset']}")
-        else:
-            await player.send(f"{c['yellow']}You donate {item.short_desc}, but it was too damaged to be useful.{c['reset']}")
-        
-        if player.room:
-            await player.room.send_to_room(f"{player.name} donates {item.short_desc}.", exclude=[player])
-
-    @classmethod
-    async def cmd_pour(cls, player: 'Player', args: List[str]):
-        """Pour liquid between containers. Usage: pour <from> <to> OR pour <from> out"""
-        c = player.config.COLORS
-        
-        if len(args) < 2:
-            await player.send(f"{c['yellow']}Usage: pour <from container> <to container>{c['reset']}")
-            await player.send(f"{c['yellow']}       pour <container> out{c['reset']}")
-            return
-        
-        from_name = args[0]
-        to_name = args[1]
-        
-        # Find source container
-        from_item = None
-        for inv_item in player.inventory:
-            if from_name.lower() in inv_item.name.lower():
-                if getattr(inv_item, 'item_type', '') in ('drink', 'drinkcon', 'container'):
-                    from_item = inv_item
-                    break
-        
-        if not from_item:
-            await player.send(f"{c['red']}You don't have a container called '{from_name}'.{c['reset']}")
-            return
-        
-        current = getattr(from_item, 'drink_amount', 0)
-        if current <= 0:
-            await player.send(f"{c['yellow']}{from_item.short_desc} is empty.{c['reset']}")
-            return
-        
-        # Pour out
-        if to_name.lower() == 'out':
-            from_item.drink_amount = 0
-            await player.send(f"{c['cyan']}You pour out {from_item.short_desc}.{c['reset']}")
-            if player.room:
-                await player.room.send_to_room(f"{player.name} pours out {from_item.short_desc}.", exclude=[player])
-            return
-        
-        # Find target container
-        to_item = None
-        for inv_item in player.inventory:
-            if inv_item != from_item and to_name.lower() in inv_item.name.lower():
-                if getattr(inv_item, 'item_type', '') in ('drink', 'drinkcon', 'container'):
-                    to_item = inv_item
-                    break
-        
-        if not to_item:
-            await player.send(f"{c['red']}You don't have another container called '{to_name}'.{c['reset']}")
-            return
-        
-        # Pour liquid
-        to_max = getattr(to_item, 'max_drink_amount', 10)
-        to_current = getattr(to_item, 'drink_amount', 0)
-        space = to_max - to_current
-        
-        if space <= 0:
-            await player.send(f"{c['yellow']}{to_item.short_desc} is already full.{c['reset']}")
-            return
-        
-        transfer = min(current, space)
-        from_item.drink_amount -= transfer
-        to_item.drink_amount = to_current + transfer
-        to_item.liquid_type = getattr(from_item, 'liquid_type', 'water')
-        
-        await player.send(f"{c['cyan']}You pour {getattr(from_item, 'liquid_type', 'liquid')} from {from_item.short_desc} into {to_item.short_desc}.{c['reset']}")
-
-    # ==================== SOCIAL COMMANDS ====================
-
-    SOCIALS = {
-        # --- Affection ---
-        'hug': {
-            'no_arg_self': 'You need a hug!',
-            'no_arg_room': '$n looks like $e needs a hug.',
-            'with_arg_self': 'You hug $N warmly.',
-            'with_arg_target': '$n hugs you warmly.',
-            'with_arg_room': '$n hugs $N warmly.',
-            'self_self': 'You hug yourself.',
-            'self_room': '$n hugs $mself.',
-        },
-        'kiss': {
-            'no_arg_self': 'You pucker up, but no one is there.',
-            'no_arg_room': '$n puckers up, looking for someone to kiss.',
-            'with_arg_self': 'You kiss $N tenderly.',
-            'with_arg_target': '$n kisses you tenderly.',
-            'with_arg_room': '$n kisses $N tenderly.',
-            'self_self': 'You kiss your own hand. Classy.',
-            'self_room': '$n kisses $s own hand.',
-        },
-        'cuddle': {
-            'no_arg_self': 'You curl up and cuddle with a pillow.',
-            'no_arg_room': '$n curls up and cuddles with an imaginary pillow.',
-            'with_arg_self': 'You cuddle up to $N.',
-            'with_arg_target': '$n cuddles up to you.',
-            'with_arg_room': '$n cuddles up to $N.',
-            'self_self': 'You wrap your arms around yourself.',
-            'self_room': '$n wraps $s arms around $mself.',
-        },
-        'pat': {
-            'no_arg_self': 'You pat yourself on the back.',
-            'no_arg_room': '$n pats $mself on the back.',
-            'with_arg_self': 'You pat $N on the head.',
-            'with_arg_target': '$n pats you on the head.',
-            'with_arg_room': '$n pats $N on the head.',
-            'self_self': 'You pat yourself on the back.',
-            'self_room': '$n pats $mself on the back.',
-        },
-        'comfort': {
-            'no_arg_self': 'You console yourself.',
-            'no_arg_room': '$n looks like $e needs comfort.',
-            'with_arg_self': 'You comfort $N.',
-            'with_arg_target': '$n comforts you.',
-            'with_arg_room': '$n comforts $N.',
-            'self_self': 'You comfort yourself. There, there.',
-            'self_room': '$n comforts $mself. There, there.',
-        },
-        # --- Greetings ---
-        'wave': {
-            'no_arg_self': 'You wave.',
-            'no_arg_room': '$n waves.',
-            'with_arg_self': 'You wave at $N.',
-            'with_arg_target': '$n waves at you.',
-            'with_arg_room': '$n waves at $N.',
-            'self_self': 'You wave at yourself in a mirror.',
-            'self_room': '$n waves at $mself.',
-        },
-        'bow': {
-            'no_arg_self': 'You bow deeply.',
-            'no_arg_room': '$n bows deeply.',
-            'with_arg_self': 'You bow before $N.',
-            'with_arg_target': '$n bows before you.',
-            'with_arg_room': '$n bows before $N.',
-            'self_self': 'You bow to yourself. How humble.',
-            'self_room': '$n bows to $mself.',
-        },
-        'salute': {
-            'no_arg_self': 'You salute smartly.',
-            'no_arg_room': '$n salutes smartly.',
-            'with_arg_self': 'You salute $N.',
-            'with_arg_target': '$n salutes you.',
-            'with_arg_room': '$n salutes $N.',
-            'self_self': 'You salute yourself in the mirror.',
-            'self_room': '$n salutes $mself.',
-        },
-        'nod': {
-            'no_arg_self': 'You nod solemnly.',
-            'no_arg_room': '$n nods solemnly.',
-            'with_arg_self': 'You nod at $N.',
-            'with_arg_target': '$n nods at you.',
-            'with_arg_room': '$n nods at $N.',
-            'self_self': 'You nod to yourself in agreement.',
-            'self_room': '$n nods to $mself.',
-        },
-        'curtsy': {
-            'no_arg_self': 'You curtsy gracefully.',
-            'no_arg_room': '$n curtsies gracefully.',
-            'with_arg_self': 'You curtsy before $N.',
-            'with_arg_target': '$n curtsies before you.',
-            'with_arg_room': '$n curtsies before $N.',
-            'self_self': 'You curtsy to yourself. How regal.',
-            'self_room': '$n curtsies to $mself.',
-        },
-        'greet': {
-            'no_arg_self': 'You greet everyone cheerfully.',
-            'no_arg_room': '$n greets everyone cheerfully.',
-            'with_arg_self': 'You greet $N cheerfully.',
-            'with_arg_target': '$n greets you cheerfully.',
-            'with_arg_room': '$n greets $N cheerfully.',
-            'self_self': 'You greet yourself. Hello, you!',
-            'self_room': '$n greets $mself.',
-        },
-        # --- Fun ---
-        'dance': {
-            'no_arg_self': 'You dance wildly!',
-            'no_arg_room': '$n dances wildly!',
-            'with_arg_self': 'You dance with $N.',
-            'with_arg_target': '$n dances with you.',
-            'with_arg_room': '$n dances with $N.',
-            'self_self': 'You dance with yourself, spinning in circles.',
-            'self_room': '$n dances with $mself, spinning in circles.',
-        },
-        'laugh': {
-            'no_arg_self': 'You laugh out loud.',
-            'no_arg_room': '$n laughs out loud.',
-            'with_arg_self': 'You laugh at $N.',
-            'with_arg_target': '$n laughs at you.',
-            'with_arg_room': '$n laughs at $N.',
-            'self_self': 'You laugh at yourself.',
-            'self_room': '$n laughs at $mself.',
-        },
-        'giggle': {
-            'no_arg_self': 'You giggle.',
-            'no_arg_room': '$n giggles.',
-            'with_arg_self': 'You giggle at $N.',
-            'with_arg_target': '$n giggles at you.',
-            'with_arg_room': '$n giggles at $N.',
-            'self_self': 'You giggle at yourself.',
-            'self_room': '$n giggles at $mself.',
-        },
-        'cheer': {
-            'no_arg_self': 'You cheer loudly!',
-            'no_arg_room': '$n cheers loudly!',
-            'with_arg_self': 'You cheer for $N!',
-            'with_arg_target': '$n cheers for you!',
-            'with_arg_room': '$n cheers for $N!',
-            'self_self': 'You cheer for yourself!',
-            'self_room': '$n cheers for $mself!',
-        },
-        'clap': {
-            'no_arg_self': 'You clap your hands together.',
-            'no_arg_room': '$n claps $s hands together.',
-            'with_arg_self': 'You clap for $N.',
-            'with_arg_target': '$n claps for you.',
-            'with_arg_room': '$n claps for $N.',
-            'self_self': 'You give yourself a round of applause.',
-            'self_room': '$n gives $mself a round of applause.',
-        },
-        'whistle': {
-            'no_arg_self': 'You whistle a jaunty tune.',
-            'no_arg_room': '$n whistles a jaunty tune.',
-            'with_arg_self': 'You whistle at $N.',
-            'with_arg_target': '$n whistles at you.',
-            'with_arg_room': '$n whistles at $N.',
-            'self_self': 'You whistle to yourself.',
-            'self_room': '$n whistles to $mself.',
-        },
-        'wink': {
-            'no_arg_self': 'You wink suggestively.',
-            'no_arg_room': '$n winks suggestively.',
-            'with_arg_self': 'You wink at $N.',
-            'with_arg_target': '$n winks at you.',
-            'with_arg_room': '$n winks at $N.',
-            'self_self': 'You wink at yourself. Lookin\' good.',
-            'self_room': '$n winks at $mself.',
-        },
-        # --- Rude ---
-        'slap': {
-            'no_arg_self': 'You slap yourself. Ouch!',
-            'no_arg_room': '$n slaps $mself. Ouch!',
-            'with_arg_self': 'You slap $N across the face!',
-            'with_arg_target': '$n slaps you across the face!',
-            'with_arg_room': '$n slaps $N across the face!',
-            'self_self': 'You slap yourself. Ouch!',
-            'self_room': '$n slaps $mself. Ouch!',
-        },
-        'poke': {
-            'no_arg_self': 'You poke yourself in the ribs.',
-            'no_arg_room': '$n pokes $mself in the ribs.',
-            'with_arg_self': 'You poke $N in the ribs.',
-            'with_arg_target': '$n pokes you in the ribs.',
-            'with_arg_room': '$n pokes $N in the ribs.',
-            'self_self': 'You poke yourself in the ribs.',
-            'self_room': '$n pokes $mself in the ribs.',
-        },
-        'bonk': {
-            'no_arg_self': 'You bonk yourself on the head.',
-            'no_arg_room': '$n bonks $mself on the head.',
-            'with_arg_self': 'You bonk $N on the head!',
-            'with_arg_target': '$n bonks you on the head!',
-            'with_arg_room': '$n bonks $N on the head!',
-            'self_self': 'You bonk yourself on the head.',
-            'self_room': '$n bonks $mself on the head.',
-        },
-        'facepalm': {
-            'no_arg_self': 'You facepalm.',
-            'no_arg_room': '$n facepalms.',
-            'with_arg_self': 'You facepalm at $N.',
-            'with_arg_target': '$n facepalms at you.',
-            'with_arg_room': '$n facepalms at $N.',
-            'self_self': 'You facepalm at yourself.',
-            'self_room': '$n facepalms at $mself.',
-        },
-        'shrug': {
-            'no_arg_self': 'You shrug helplessly.',
-            'no_arg_room': '$n shrugs helplessly.',
-            'with_arg_self': 'You shrug at $N.',
-            'with_arg_target': '$n shrugs at you.',
-            'with_arg_room': '$n shrugs at $N.',
-            'self_self': 'You shrug at yourself.',
-            'self_room': '$n shrugs at $mself.',
-        },
-        'eyeroll': {
-            'no_arg_self': 'You roll your eyes.',
-            'no_arg_room': '$n rolls $s eyes.',
-            'with_arg_self': 'You roll your eyes at $N.',
-            'with_arg_target': '$n rolls $s eyes at you.',
-            'with_arg_room': '$n rolls $s eyes at $N.',
-            'self_self': 'You roll your eyes at yourself.',
-            'self_room': '$n rolls $s eyes at $mself.',
-        },
-        'spit': {
-            'no_arg_self': 'You spit on the ground.',
-            'no_arg_room': '$n spits on the ground.',
-            'with_arg_self': 'You spit at $N!',
-            'with_arg_target': '$n spits at you!',
-            'with_arg_room': '$n spits at $N!',
-            'self_self': 'You spit on yourself. Gross.',
-            'self_room': '$n spits on $mself. Gross.',
-        },
-        # --- Expressions ---
-        'cry': {
-            'no_arg_self': 'You cry softly.',
-            'no_arg_room': '$n cries softly.',
-            'with_arg_self': 'You cry on $N\'s shoulder.',
-            'with_arg_target': '$n cries on your shoulder.',
-            'with_arg_room': '$n cries on $N\'s shoulder.',
-            'self_self': 'You cry to yourself.',
-            'self_room': '$n cries to $mself.',
-        },
-        'sigh': {
-            'no_arg_self': 'You sigh loudly.',
-            'no_arg_room': '$n sighs loudly.',
-            'with_arg_self': 'You sigh at $N.',
-            'with_arg_target': '$n sighs at you.',
-            'with_arg_room': '$n sighs at $N.',
-            'self_self': 'You sigh at yourself.',
-            'self_room': '$n sighs at $mself.',
-        },
-        'gasp': {
-            'no_arg_self': 'You gasp in shock!',
-            'no_arg_room': '$n gasps in shock!',
-            'with_arg_self': 'You gasp at $N!',
-            'with_arg_target': '$n gasps at you!',
-            'with_arg_room': '$n gasps at $N!',
-            'self_self': 'You gasp at yourself!',
-            'self_room': '$n gasps at $mself!',
-        },
-        'scream': {
-            'no_arg_self': 'You scream at the top of your lungs!',
-            'no_arg_room': '$n screams at the top of $s lungs!',
-            'with_arg_self': 'You scream at $N!',
-            'with_arg_target': '$n screams at you!',
-            'with_arg_room': '$n screams at $N!',
-            'self_self': 'You scream at yourself!',
-            'self_room': '$n screams at $mself!',
-        },
-        'yawn': {
-            'no_arg_self': 'You yawn sleepily.',
-            'no_arg_room': '$n yawns sleepily.',
-            'with_arg_self': 'You yawn in $N\'s face.',
-            'with_arg_target': '$n yawns in your face.',
-            'with_arg_room': '$n yawns in $N\'s face.',
-            'self_self': 'You yawn at yourself.',
-            'self_room': '$n yawns at $mself.',
-        },
-        'stretch': {
-            'no_arg_self': 'You stretch your tired muscles.',
-            'no_arg_room': '$n stretches $s tired muscles.',
-            'with_arg_self': 'You stretch languidly in front of $N.',
-            'with_arg_target': '$n stretches languidly in front of you.',
-            'with_arg_room': '$n stretches languidly in front of $N.',
-            'self_self': 'You stretch your tired muscles.',
-            'self_room': '$n stretches $s tired muscles.',
-        },
-        'flex': {
-            'no_arg_self': 'You flex your muscles impressively!',
-            'no_arg_room': '$n flexes $s muscles impressively!',
-            'with_arg_self': 'You flex your muscles at $N.',
-            'with_arg_target': '$n flexes $s muscles at you.',
-            'with_arg_room': '$n flexes $s muscles at $N.',
-            'self_self': 'You flex at yourself admiringly.',
-            'self_room': '$n flexes at $mself admiringly.',
-        },
-        'cringe': {
-            'no_arg_self': 'You cringe in terror.',
-            'no_arg_room': '$n cringes in terror.',
-            'with_arg_self': 'You cringe away from $N.',
-            'with_arg_target': '$n cringes away from you.',
-            'with_arg_room': '$n cringes away from $N.',
-            'self_self': 'You cringe at yourself.',
-            'self_room': '$n cringes at $mself.',
-        },
-        # --- Actions ---
-        'sit': {
-            'no_arg_self': 'You sit down.',
-            'no_arg_room': '$n sits down.',
-            'with_arg_self': 'You sit down next to $N.',
-            'with_arg_target': '$n sits down next to you.',
-            'with_arg_room': '$n sits down next to $N.',
-            'self_self': 'You sit down.',
-            'self_room': '$n sits down.',
-        },
-        'kneel': {
-            'no_arg_self': 'You kneel on the ground.',
-            'no_arg_room': '$n kneels on the ground.',
-            'with_arg_self': 'You kneel before $N.',
-            'with_arg_target': '$n kneels before you.',
-            'with_arg_room': '$n kneels before $N.',
-            'self_self': 'You kneel on the ground.',
-            'self_room': '$n kneels on the ground.',
-        },
-        'meditate': {
-            'no_arg_self': 'You close your eyes and meditate.',
-            'no_arg_room': '$n closes $s eyes and begins to meditate.',
-            'with_arg_self': 'You meditate alongside $N.',
-            'with_arg_target': '$n meditates alongside you.',
-            'with_arg_room': '$n meditates alongside $N.',
-            'self_self': 'You close your eyes and meditate.',
-            'self_room': '$n closes $s eyes and begins to meditate.',
-        },
-        'pray': {
-            'no_arg_self': 'You pray to the gods for guidance.',
-            'no_arg_room': '$n prays to the gods for guidance.',
-            'with_arg_self': 'You pray for $N\'s well-being.',
-            'with_arg_target': '$n prays for your well-being.',
-            'with_arg_room': '$n prays for $N\'s well-being.',
-            'self_self': 'You pray for yourself.',
-            'self_room': '$n prays for $mself.',
-        },
-        # --- Combat Flavor ---
-        'battlecry': {
-            'no_arg_self': 'You let out a mighty battle cry!',
-            'no_arg_room': '$n lets out a mighty battle cry!',
-            'with_arg_self': 'You let out a battle cry at $N!',
-            'with_arg_target': '$n lets out a battle cry at you!',
-            'with_arg_room': '$n lets out a battle cry at $N!',
-            'self_self': 'You roar at yourself. Intimidating.',
-            'self_room': '$n roars at $mself.',
-        },
-        'taunt': {
-            'no_arg_self': 'You taunt your enemies!',
-            'no_arg_room': '$n taunts $s enemies!',
-            'with_arg_self': 'You taunt $N mercilessly!',
-            'with_arg_target': '$n taunts you mercilessly!',
-            'with_arg_room': '$n taunts $N mercilessly!',
-            'self_self': 'You taunt yourself. That\'s... sad.',
-            'self_room': '$n taunts $mself.',
-        },
-        'challenge_emote': {
-            'no_arg_self': 'You issue a challenge to all comers!',
-            'no_arg_room': '$n issues a challenge to all comers!',
-            'with_arg_self': 'You challenge $N to single combat!',
-            'with_arg_target': '$n challenges you to single combat!',
-            'with_arg_room': '$n challenges $N to single combat!',
-            'self_self': 'You challenge yourself. Inner demons, beware.',
-            'self_room': '$n challenges $mself.',
-        },
-        'surrender': {
-            'no_arg_self': 'You raise your hands in surrender.',
-            'no_arg_room': '$n raises $s hands in surrender.',
-            'with_arg_self': 'You surrender to $N.',
-            'with_arg_target': '$n surrenders to you.',
-            'with_arg_room': '$n surrenders to $N.',
-            'self_self': 'You surrender to yourself.',
-            'self_room': '$n surrenders to $mself.',
-        },
-        # --- Existing socials kept ---
-        'smile': {
-            'no_arg_self': 'You smile happily.',
-            'no_arg_room': '$n smiles happily.',
-            'with_arg_self': 'You smile at $N.',
-            'with_arg_target': '$n smiles at you.',
-            'with_arg_room': '$n smiles at $N.',
-            'self_self': 'You smile at yourself.',
-            'self_room': '$n smiles at $mself.',
-        },
-        'ponder': {
-            'no_arg_self': 'You ponder the situation.',
-            'no_arg_room': '$n ponders the situation.',
-            'with_arg_self': 'You ponder $N thoughtfully.',
-            'with_arg_target': '$n ponders you thoughtfully.',
-            'with_arg_room': '$n ponders $N thoughtfully.',
-            'self_self': 'You ponder yourself thoughtfully.',
-            'self_room': '$n ponders $mself thoughtfully.',
-        },
-        'grin': {
-            'no_arg_self': 'You grin evilly.',
-            'no_arg_room': '$n grins evilly.',
-            'with_arg_self': 'You grin evilly at $N.',
-            'with_arg_target': '$n grins evilly at you.',
-            'with_arg_room': '$n grins evilly at $N.',
-            'self_self': 'You grin at yourself evilly.',
-            'self_room': '$n grins at $mself evilly.',
-        },
-        'snicker': {
-            'no_arg_self': 'You snicker.',
-            'no_arg_room': '$n snickers.',
-            'with_arg_self': 'You snicker at $N.',
-            'with_arg_target': '$n snickers at you.',
-            'with_arg_room': '$n snickers at $N.',
-            'self_self': 'You snicker at yourself.',
-            'self_room': '$n snickers at $mself.',
-        },
-        'thank': {
-            'no_arg_self': 'You thank everyone.',
-            'no_arg_room': '$n thanks everyone.',
-            'with_arg_self': 'You thank $N heartily.',
-            'with_arg_target': '$n thanks you heartily.',
-            'with_arg_room': '$n thanks $N heartily.',
-            'self_self': 'You thank yourself. You deserve it.',
-            'self_room': '$n thanks $mself.',
-        },
-        'glare': {
-            'no_arg_self': 'You glare at nothing in particular.',
-            'no_arg_room': '$n glares around $mself.',
-            'with_arg_self': 'You glare icily at $N.',
-            'with_arg_target': '$n glares icily at you.',
-            'with_arg_room': '$n glares at $N.',
-            'self_self': 'You glare at yourself.',
-            'self_room': '$n glares at $mself.',
-        },
-        'grumble': {
-            'no_arg_self': 'You grumble.',
-            'no_arg_room': '$n grumbles.',
-            'with_arg_self': 'You grumble at $N.',
-            'with_arg_target': '$n grumbles at you.',
-            'with_arg_room': '$n grumbles at $N.',
-            'self_self': 'You grumble at yourself.',
-            'self_room': '$n grumbles at $mself.',
-        },
-        'cackle': {
-            'no_arg_self': 'You cackle gleefully!',
-            'no_arg_room': '$n cackles gleefully!',
-            'with_arg_self': 'You cackle at $N.',
-            'with_arg_target': '$n cackles at you.',
-            'with_arg_room': '$n cackles at $N.',
-            'self_self': 'You cackle at yourself.',
-            'self_room': '$n cackles at $mself.',
-        },
-        'tickle': {
-            'no_arg_self': 'You tickle yourself. How silly.',
-            'no_arg_room': '$n tickles $mself. How silly.',
-            'with_arg_self': 'You tickle $N.',
-            'with_arg_target': '$n tickles you. Hee hee!',
-            'with_arg_room': '$n tickles $N.',
-            'self_self': 'You tickle yourself. How silly.',
-            'self_room': '$n tickles $mself. How silly.',
-        },
-        'apologize': {
-            'no_arg_self': 'You apologize for your behavior.',
-            'no_arg_room': '$n apologizes for $s behavior.',
-            'with_arg_self': 'You apologize to $N profusely.',
-            'with_arg_target': '$n apologizes to you profusely.',
-            'with_arg_room': '$n apologizes to $N profusely.',
-            'self_self': 'You apologize to yourself.',
-            'self_room': '$n apologizes to $mself.',
-        },
-        'blush': {
-            'no_arg_self': 'You blush.',
-            'no_arg_room': '$n blushes.',
-            'with_arg_self': 'You blush at $N.',
-            'with_arg_target': '$n blushes at you.',
-            'with_arg_room': '$n blushes at $N.',
-            'self_self': 'You blush at yourself.',
-            'self_room': '$n blushes at $mself.',
-        },
-    }
-
-    @classmethod
-    def _social_sub(cls, msg: str, player, target=None):
-        """Substitute social message tokens ($n, $N, $e, $s, $m, $mself)."""
-        sex = getattr(player, 'sex', 'neutral')
-        he = 'he' if sex == 'male' else ('she' if sex == 'female' else 'they')
-        his = 'his' if sex == 'male' else ('her' if sex == 'female' else 'their')
-        him = 'him' if sex == 'male' else ('her' if sex == 'female' else 'them')
-        himself = 'himself' if sex == 'male' else ('herself' if sex == 'female' else 'themselves')
-        msg = msg.replace('$n', player.name)
-        msg = msg.replace('$e', he)
-        msg = msg.replace('$mself', himself)
-        msg = msg.replace('$s', his)
-        msg = msg.replace('$m', him)
-        if target:
-            msg = msg.replace('$N', target.name)
-        return msg
-
-    @classmethod
-    async def cmd_social(cls, player: 'Player', social_name: str, args: List[str]):
-        """Process a social command."""
-        if social_name not in cls.SOCIALS:
-            return False
-
-        c = player.config.COLORS
-        social = cls.SOCIALS[social_name]
-        from social import is_ignored
-
-        # No target - social to room
-        if not args:
-            await player.send(f"{c['cyan']}{social['no_arg_self']}{c['reset']}")
-            msg = cls._social_sub(social['no_arg_room'], player)
-            if player.room:
-                for char in player.room.characters:
-                    if char != player and hasattr(char, 'send') and not is_ignored(char, player.name):
-                        await char.send(f"{c['cyan']}{msg}{c['reset']}")
-        else:
-            # Find target
-            target_name = ' '.join(args).lower()
-            target = None
-
-            for char in player.room.characters:
-                if char.name.lower().startswith(target_name):
-                    target = char
-                    break
-
-            if not target:
-                await player.send(f"{c['red']}Who do you want to {social_name}?{c['reset']}")
-                return True
-
-            # Self-target
-            if target == player:
-                self_msg = social.get('self_self', social['no_arg_self'])
-                await player.send(f"{c['cyan']}{self_msg}{c['reset']}")
-                room_msg = cls._social_sub(social.get('self_room', social['no_arg_room']), player)
-                if player.room:
-                    for char in player.room.characters:
-                        if char != player and hasattr(char, 'send') and not is_ignored(char, player.name):
-                            await char.send(f"{c['cyan']}{room_msg}{c['reset']}")
-                return True
-
-            # Check ignore list on target
-            if hasattr(target, 'send') and is_ignored(target, player.name):
-                await player.send(f"{c['red']}{target.name} is ignoring you.{c['reset']}")
-                return True
-
-            # Message to self
-            msg_self = cls._social_sub(social['with_arg_self'], player, target)
-            await player.send(f"{c['cyan']}{msg_self}{c['reset']}")
-
-            # Message to target
-            if hasattr(target, 'send'):
-                msg_target = cls._social_sub(social['with_arg_target'], player, target)
-                await target.send(f"{c['cyan']}{msg_target}{c['reset']}")
-
-            # Message to room
-            msg_room = cls._social_sub(social['with_arg_room'], player, target)
-            if player.room:
-                for char in player.room.characters:
-                    if char not in (player, target) and hasattr(char, 'send') and not is_ignored(char, player.name):
-                        await char.send(f"{c['cyan']}{msg_room}{c['reset']}")
-
-        return True
-
-    # Generate individual social command methods for every social in SOCIALS dict.
-    # Each is a thin wrapper around cmd_social for command dispatch.
-
-    @classmethod
-    async def cmd_smile(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'smile', args)
-    @classmethod
-    async def cmd_laugh(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'laugh', args)
-    @classmethod
-    async def cmd_nod(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'nod', args)
-    @classmethod
-    async def cmd_bow(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'bow', args)
-    @classmethod
-    async def cmd_wave(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'wave', args)
-    @classmethod
-    async def cmd_hug(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'hug', args)
-    @classmethod
-    async def cmd_kiss(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'kiss', args)
-    @classmethod
-    async def cmd_cuddle(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'cuddle', args)
-    @classmethod
-    async def cmd_pat(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'pat', args)
-    @classmethod
-    async def cmd_comfort(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'comfort', args)
-    @classmethod
-    async def cmd_curtsy(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'curtsy', args)
-    @classmethod
-    async def cmd_greet(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'greet', args)
-    @classmethod
-    async def cmd_salute(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'salute', args)
-    @classmethod
-    async def cmd_dance(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'dance', args)
-    @classmethod
-    async def cmd_giggle(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'giggle', args)
-    @classmethod
-    async def cmd_cheer(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'cheer', args)
-    @classmethod
-    async def cmd_clap(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'clap', args)
-    @classmethod
-    async def cmd_whistle(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'whistle', args)
-    @classmethod
-    async def cmd_wink(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'wink', args)
-    @classmethod
-    async def cmd_slap(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'slap', args)
-    @classmethod
-    async def cmd_poke(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'poke', args)
-    @classmethod
-    async def cmd_bonk(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'bonk', args)
-    @classmethod
-    async def cmd_facepalm(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'facepalm', args)
-    @classmethod
-    async def cmd_shrug(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'shrug', args)
-    @classmethod
-    async def cmd_eyeroll(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'eyeroll', args)
-    @classmethod
-    async def cmd_spit(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'spit', args)
-    @classmethod
-    async def cmd_cry(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'cry', args)
-    @classmethod
-    async def cmd_sigh(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'sigh', args)
-    @classmethod
-    async def cmd_gasp(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'gasp', args)
-    @classmethod
-    async def cmd_scream(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'scream', args)
-    @classmethod
-    async def cmd_yawn(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'yawn', args)
-    @classmethod
-    async def cmd_stretch(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'stretch', args)
-    @classmethod
-    async def cmd_flex(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'flex', args)
-    @classmethod
-    async def cmd_cringe(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'cringe', args)
-    @classmethod
-    async def cmd_kneel(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'kneel', args)
-    @classmethod
-    async def cmd_meditate(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'meditate', args)
-    @classmethod
-    async def cmd_pray(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'pray', args)
-    @classmethod
-    async def cmd_battlecry(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'battlecry', args)
-    @classmethod
-    async def cmd_taunt(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'taunt', args)
-    @classmethod
-    async def cmd_challenge_emote(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'challenge_emote', args)
-    @classmethod
-    async def cmd_surrender(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'surrender', args)
-    @classmethod
-    async def cmd_grin(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'grin', args)
-    @classmethod
-    async def cmd_snicker(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'snicker', args)
-    @classmethod
-    async def cmd_thank(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'thank', args)
-    @classmethod
-    async def cmd_glare(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'glare', args)
-    @classmethod
-    async def cmd_grumble(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'grumble', args)
-    @classmethod
-    async def cmd_cackle(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'cackle', args)
-    @classmethod
-    async def cmd_tickle(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'tickle', args)
-    @classmethod
-    async def cmd_apologize(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'apologize', args)
-    @classmethod
-    async def cmd_blush(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'blush', args)
-    @classmethod
-    async def cmd_ponder(cls, player: 'Player', args: List[str]):
-        await cls.cmd_social(player, 'ponder', args)
-    @classmethod
-    async def cmd_sit_social(cls, player: 'Player', args: List[str]):
-        """Sit social emote (use 'sit' for the position command)."""
-        await cls.cmd_social(player, 'sit', args)
-
-    # ==================== UTILITY ====================
-
-    @classmethod
-    async def cmd_save(cls, player: 'Player', args: List[str]):
-        """Save your character."""
-        await player.save()
-        await player.send("Character saved.")
-        
-    @classmethod
-    @staticmethod
-    def _calc_item_rent_cost(item) -> int:
-        """Calculate per-day rent cost for a single item based on rarity."""
-        rarity = getattr(item, 'rarity', None)
-        if not rarity:
-            # Infer rarity from flags or value
-            flags = getattr(item, 'flags', set())
-            if isinstance(flags, list):
-                flags = set(flags)
-            if 'legendary' in flags:
-                rarity = 'legendary'
-            elif 'epic' in flags:
-                rarity = 'epic'
-            elif 'rare' in flags:
-                rarity = 'rare'
-            elif 'uncommon' in flags:
-                rarity = 'uncommon'
-            else:
-                rarity = 'common'
-        rarity_costs = {
-            'common': 10,
-            'uncommon': 50,
-            'rare': 200,
-            'epic': 1000,
-            'legendary': 5000,
-        }
-        return rarity_costs.get(rarity, 10)
-
-    @classmethod
-    def calc_total_rent(cls, player) -> int:
-        """Calculate total daily rent cost for a player's gear."""
-        base_cost = max(20, player.level * 5)
-        item_cost = 0
-        # Inventory
-        for item in getattr(player, 'inventory', []):
-            item_cost += cls._calc_item_rent_cost(item)
-        # Equipment
-        for slot, item in getattr(player, 'equipment', {}).items():
-            if item:
-                item_cost += cls._calc_item_rent_cost(item)
-        return base_cost + item_cost
-
-    @classmethod
-    async def cmd_rent(cls, player: 'Player', args: List[str]):
-        """Rent a room at the Inn to save your character and quit safely.
-        Usage: rent        - Rent and log out
-               rent cost   - Check your rental cost without renting"""
-        c = player.config.COLORS
-        from datetime import datetime
-
-        # Check if player is in combat
-        if player.is_fighting:
-            await player.send(f"{c['red']}You can't rent while fighting! Try to flee first.{c['reset']}")
-            return
-
-        # Check for innkeeper NPC in room, or known inn rooms
-        inn_rooms = [3006, 3007, 3008, 3030, 3031, 3032, 3033, 3034, 3048]
-        has_innkeeper = False
-        if player.room:
-            from mobs import Mobile
-            for char in player.room.characters:
-                if isinstance(char, Mobile) and getattr(char, 'special', None) == 'innkeeper':
-                    has_innkeeper = True
-                    break
-        if not has_innkeeper and (not player.room or player.room.vnum not in inn_rooms):
-            await player.send(f"{c['yellow']}You need to find an innkeeper or be at an inn to rent.{c['reset']}")
-            return
-
-        rent_cost = cls.calc_total_rent(player)
-
-        # If just checking cost
-        if args and args[0].lower() in ('cost', 'check', 'price'):
-            await player.send(f"\n{c['bright_cyan']}╔══════════════════════════════════════╗{c['reset']}")
-            await player.send(f"{c['bright_cyan']}║{c['bright_yellow']}       Rental Cost Estimate          {c['bright_cyan']}║{c['reset']}")
-            await player.send(f"{c['bright_cyan']}╠══════════════════════════════════════╣{c['reset']}")
-            await player.send(f"{c['bright_cyan']}║ {c['white']}Base cost:     {max(20, player.level * 5):>6} gold/day   {c['bright_cyan']}║{c['reset']}")
-            inv_cost = sum(cls._calc_item_rent_cost(i) for i in getattr(player, 'inventory', []))
-            eq_cost = sum(cls._calc_item_rent_cost(i) for s, i in getattr(player, 'equipment', {}).items() if i)
-            await player.send(f"{c['bright_cyan']}║ {c['white']}Inventory:     {inv_cost:>6} gold/day   {c['bright_cyan']}║{c['reset']}")
-            await player.send(f"{c['bright_cyan']}║ {c['white']}Equipment:     {eq_cost:>6} gold/day   {c['bright_cyan']}║{c['reset']}")
-            await player.send(f"{c['bright_cyan']}╠══════════════════════════════════════╣{c['reset']}")
-            await player.send(f"{c['bright_cyan']}║ {c['bright_green']}TOTAL:         {rent_cost:>6} gold/day   {c['bright_cyan']}║{c['reset']}")
-            await player.send(f"{c['bright_cyan']}╚══════════════════════════════════════╝{c['reset']}")
-            await player.send(f"{c['yellow']}You have {player.gold} gold. Type 'rent' to rent and log out.{c['reset']}\n")
-            return
-
-        # Check if player can afford it
-        if player.gold < rent_cost:
-            await player.send(f"{c['red']}You need {rent_cost} gold to rent, but you only have {player.gold} gold.{c['reset']}")
-            await player.send(f"{c['yellow']}The innkeeper says, 'Come back when you have enough coin, friend.'{c['reset']}")
-            await player.send(f"{c['yellow']}Tip: Use 'rent cost' to see the breakdown. Drop items to lower cost.{c['reset']}")
-            return
-
-        # Deduct rent cost
-        player.gold -= rent_cost
-
-        # Save rent data for reconnect charging
-        player.rent_data = {
-            'rent_time': datetime.now().isoformat(),
-            'daily_cost': rent_cost,
-            'rented': True,
-        }
-
-        # Save the player
-        await player.save()
-
-        # Send messages
-        await player.send(f"{c['bright_yellow']}You pay {rent_cost} gold to the innkeeper.{c['reset']}")
-        await player.send(f"{c['bright_cyan']}The innkeeper says, 'Rest well, {player.name}. Your room will be ready when you return.'{c['reset']}")
-        await player.send(f"{c['bright_green']}You settle into your room and drift off to sleep...{c['reset']}")
-        await player.send(f"{c['white']}Your character has been saved. Daily rent: {rent_cost} gold.{c['reset']}")
-
-        if player.room:
-            await player.room.send_to_room(
-                f"{player.name} rents a room and retires for the evening.",
-                exclude=[player]
-            )
-
-        # Disconnect
-        if player.connection:
-            await player.connection.disconnect()
-
-    # ==================== RENT/STORAGE ====================
-
-    @classmethod
-    async def cmd_storage(cls, player: 'Player', args: List[str]):
-        """View items in your storage locker."""
-        c = player.config.COLORS
-
-        if not player.storage:
-            await player.send(f"{c['yellow']}Your storage is empty.{c['reset']}")
-            return
-
-        storage_room = player.world.get_room(player.storage_location) if player.storage_location else None
-        location_name = storage_room.name if storage_room else "Unknown Location"
-
-        await player.send(f"{c['cyan']}╔════════════════════════════════════════════════╗{c['reset']}")
-        await player.send(f"{c['cyan']}║{c['bright_yellow']}     Your Storage at {location_name:<20}{c['cyan']}║{c['reset']}")
-        await player.send(f"{c['cyan']}╠════════════════════════════════════════════════╣{c['reset']}")
-
-        for item in player.storage:
-            await player.send(f"{c['cyan']}║ {c['yellow']}{item.short_desc:<44}{c['cyan']}║{c['reset']}")
-
-        await player.send(f"{c['cyan']}╚════════════════════════════════════════════════╝{c['reset']}")
-        await player.send(f"{c['white']}Total: {len(player.storage)} items{c['reset']}")
-
-    @classmethod
-    async def cmd_store(cls, player: 'Player', args: List[str]):
-        """Store an item in your inn locker."""
-        c = player.config.COLORS
-
-        # Check if at an inn
-        if not player.room:
-            await player.send(f"{c['red']}You need to be at an inn to use storage!{c['reset']}")
-            return
-
-        # Check for innkeeper in room
-        has_innkeeper = False
-        from mobs import Mobile
-        for char in player.room.characters:
-            if isinstance(char, Mobile) and char.special == 'innkeeper':
-                has_innkeeper = True
-                break
-
-        if not has_innkeeper:
-            await player.send(f"{c['red']}You must be at an inn with an innkeeper to access storage!{c['reset']}")
-            return
-
-        if not args:
-            await player.send(f"Store what item?")
-            return
-
-        item_name = ' '.join(args).lower()
-
-        # Find item in inventory
-        item = None
-        for inv_item in player.inventory:
-            if item_name in inv_item.name.lower():
-                item = inv_item
-                break
-
-        if not item:
-            await player.send(f"{c['yellow']}You don't have that item.{c['reset']}")
-            return
-
-        # Store the item
-        player.inventory.remove(item)
-        player.storage.append(item)
-
-        # Set storage location if first time
-        if not player.storage_location:
-            player.storage_location = player.room.vnum
-
-        await player.send(f"{c['green']}You store {item.short_desc} in your locker.{c['reset']}")
-
-    @classmethod
-    async def cmd_retrieve(cls, player: 'Player', args: List[str]):
-        """Retrieve an item from your inn locker."""
-        c = player.config.COLORS
-
-        # Check if at correct inn
-        if not player.room:
-            await player.send(f"{c['red']}You need to be at an inn to access storage!{c['reset']}")
-            return
-
-        # Check for innkeeper in room
-        has_innkeeper = False
-        from mobs import Mobile
-        for char in player.room.characters:
-            if isinstance(char, Mobile) and char.special == 'innkeeper':
-                has_innkeeper = True
-                break
-
-        if not has_innkeeper:
-            await player.send(f"{c['red']}You must be at an inn with an innkeeper to access storage!{c['reset']}")
-            return
-
-        if not player.storage:
-            await player.send(f"{c['yellow']}Your storage is empty.{c['reset']}")
-            return
-
-        # Check if at the right inn
-        if player.storage_location and player.room.vnum != player.storage_location:
-            storage_room = player.world.get_room(player.storage_location)
-            location_name = storage_room.name if storage_room else f"room {player.storage_location}"
-            await player.send(f"{c['yellow']}Your storage is located at {location_name}.{c['reset']}")
-            await player.send(f"{c['yellow']}You must return there to access it.{c['reset']}")
-            return
-
-        if not args:
-            await player.send(f"Retrieve what item?")
-            return
-
-        item_name = ' '.join(args).lower()
-
-        # Find item in storage
-        item = None
-        for storage_item in player.storage:
-            if item_name in storage_item.name.lower():
-                item = storage_item
-                break
-
-        if not item:
-            await player.send(f"{c['yellow']}That item is not in your storage.{c['reset']}")
-            return
-
-        # Retrieve the item
-        player.storage.remove(item)
-        player.inventory.append(item)
-        await cls._record_collection_item(player, item)
-
-        await player.send(f"{c['green']}You retrieve {item.short_desc} from your locker.{c['reset']}")
-
-    @classmethod
-    async def cmd_quit(cls, player: 'Player', args: List[str]):
-        """Quit the game."""
-        if player.is_fighting:
-            await player.send("You can't quit while fighting! Try to flee first.")
-            return
-
-        await player.save()
-        await player.send("Farewell, brave adventurer! Your progress has been saved.")
-
-        if player.room:
-            await player.room.send_to_room(
-                f"{player.name} has left the realm.",
-                exclude=[player]
-            )
-
-        # Disconnect
-        if player.connection:
-            await player.connection.disconnect()
-
-    @classmethod
-    async def cmd_alias(cls, player: 'Player', args: List[str]):
-        """Create, view, or remove personal command aliases.
-
-        Usage:
-            alias              - List all your aliases
-            alias <word>       - Show what <word> is aliased to
-            alias <word> <cmd> - Create alias <word> for <cmd>
-            unalias <word>     - Remove an alias
-        """
-        c = player.config.COLORS
-
-        if not args:
-            # List all aliases
-            if not player.custom_aliases:
-                await player.send("You have no aliases defined.")
-            else:
-                await player.send(f"{c['cyan']}Your Aliases:{c['reset']}")
-                for alias, command in sorted(player.custom_aliases.items()):
-                    await player.send(f"  {c['bright_green']}{alias}{c['white']} -> {c['bright_yellow']}{command}{c['reset']}")
-        elif len(args) == 1:
-            # Show specific alias
-            alias_word = args[0].lower()
-            if alias_word in player.custom_aliases:
-                await player.send(f"{c['bright_green']}{alias_word}{c['white']} is aliased to: {c['bright_yellow']}{player.custom_aliases[alias_word]}{c['reset']}")
-            else:
-                await player.send(f"You have no alias for '{alias_word}'.")
-        else:
-            # Create new alias
-            alias_word = args[0].lower()
-            command = ' '.join(args[1:])
-            player.custom_aliases[alias_word] = command
-            await player.send(f"{c['bright_green']}Alias created:{c['white']} {alias_word} -> {command}{c['reset']}")
-
-    @classmethod
-    async def cmd_unalias(cls, player: 'Player', args: List[str]):
-        """Remove a personal alias."""
-        c = player.config.COLORS
-
-        if not args:
-            await player.send("Usage: unalias <word>")
-            return
-
-        alias_word = args[0].lower()
-        if alias_word in player.custom_aliases:
-            del player.custom_aliases[alias_word]
-            await player.send(f"{c['bright_green']}Alias '{alias_word}' removed.{c['reset']}")
-        else:
-            await player.send(f"You have no alias for '{alias_word}'.")
-
-    @classmethod
-    async def cmd_label(cls, player: 'Player', args: List[str]):
-        """Label a target for quick targeting in combat.
-        
-        Usage:
-            label                    - Show all current labels
-            label <target> <name>    - Label a target (e.g., label warrior DEAD)
-            label clear              - Clear all labels
-            label clear <name>       - Clear specific label
-        
-        Then use the label in commands: kill DEAD, cast fireball DEAD
-        Labels are case-insensitive and session-only (not saved).
-        """
-        c = player.config.COLORS
-        
-        if not args:
-            # Show all labels
-            if not player.target_labels:
-                await player.send(f"{c['yellow']}You have no targets labeled.{c['reset']}")
-                await player.send(f"{c['cyan']}Usage: label <target> <name>  (e.g., label warrior DEAD){c['reset']}")
-            else:
-                await player.send(f"{c['cyan']}Current Labels:{c['reset']}")
-                for label, char in list(player.target_labels.items()):
-                    if char in player.room.characters:
-                        await player.send(f"  {c['bright_yellow']}{label}{c['white']} -> {c['bright_green']}{char.name}{c['reset']}")
-                    else:
-                        # Stale label
-                        del player.target_labels[label]
-                        await player.send(f"  {c['bright_yellow']}{label}{c['white']} -> {c['red']}(no longer present){c['reset']}")
-            return
-        
-        if args[0].lower() == 'clear':
-            if len(args) > 1:
-                # Clear specific label
-                label_name = args[1].upper()
-                if label_name in player.target_labels:
-                    del player.target_labels[label_name]
-                    await player.send(f"{c['bright_green']}Label '{label_name}' cleared.{c['reset']}")
-                else:
-                    await player.send(f"{c['yellow']}No label '{label_name}' found.{c['reset']}")
-            else:
-                # Clear all labels
-                player.target_labels.clear()
-                await player.send(f"{c['bright_green']}All labels cleared.{c['reset']}")
-            return
-        
-        if len(args) < 2:
-            await player.send(f"{c['yellow']}Usage: label <target> <name>{c['reset']}")
-            await player.send(f"{c['cyan']}Example: label 2.warrior TANK{c['reset']}")
-            return
-        
-        # Parse: label <target> <labelname>
-        target_name = ' '.join(args[:-1])
-        label_name = args[-1].upper()
-        
-        # Find target using existing targeting (supports 1.warrior, 2.warrior, etc.)
-        # But temporarily disable label lookup to avoid circular reference
-        old_labels = player.target_labels
-        player.target_labels = {}
-        target = player.find_target_in_room(target_name)
-        player.target_labels = old_labels
-        
-        if not target:
-            await player.send(f"{c['red']}You don't see '{target_name}' here.{c['reset']}")
-            return
-        
-        # Set the label
-        player.target_labels[label_name] = target
-        await player.send(f"{c['bright_green']}Labeled {target.name} as '{label_name}'.{c['reset']}")
-        await player.send(f"{c['cyan']}Now you can use: kill {label_name}, cast spell {label_name}, etc.{c['reset']}")
-
-    @classmethod
-    async def cmd_unlabel(cls, player: 'Player', args: List[str]):
-        """Remove a target label."""
-        c = player.config.COLORS
-        
-        if not args:
-            await player.send(f"{c['yellow']}Usage: unlabel <name>{c['reset']}")
-            return
-        
-        label_name = args[0].upper()
-        if label_name in player.target_labels:
-            del player.target_labels[label_name]
-            await player.send(f"{c['bright_green']}Label '{label_name}' removed.{c['reset']}")
-        else:
-            await player.send(f"{c['yellow']}No label '{label_name}' found.{c['reset']}")
-
-    @classmethod
-    async def cmd_autoloot(cls, player: 'Player', args: List[str]):
-        """Toggle automatic looting of items from corpses.
-
-        Usage:
-            autoloot          - Toggle autoloot on/off
-            autoloot on       - Turn autoloot on
-            autoloot off      - Turn autoloot off
-            autoloot gold     - Toggle gold autoloot on/off
-            autoloot gold on  - Turn gold autoloot on
-            autoloot gold off - Turn gold autoloot off
-        """
-        c = player.config.COLORS
-
-        # Handle autoloot gold
-        if args and args[0].lower() == 'gold':
-            if len(args) > 1:
-                setting = args[1].lower()
-                if setting == 'on':
-                    player.autoloot_gold = True
-                    await player.send(f"{c['bright_green']}Autoloot gold is now ON. You will automatically loot gold from corpses.{c['reset']}")
-                elif setting == 'off':
-                    player.autoloot_gold = False
-                    await player.send(f"{c['yellow']}Autoloot gold is now OFF. You must manually loot gold from corpses.{c['reset']}")
-                else:
-                    await player.send(f"{c['red']}Usage: autoloot gold [on|off]{c['reset']}")
-            else:
-                # Toggle
-                player.autoloot_gold = not player.autoloot_gold
-                status = f"{c['bright_green']}ON{c['reset']}" if player.autoloot_gold else f"{c['red']}OFF{c['reset']}"
-                await player.send(f"Autoloot gold is now {status}.")
-        # Handle regular autoloot
-        elif args:
-            setting = args[0].lower()
-            if setting == 'on':
-                player.autoloot = True
-                await player.send(f"{c['bright_green']}Autoloot is now ON. You will automatically loot all items from corpses.{c['reset']}")
-            elif setting == 'off':
-                player.autoloot = False
-                await player.send(f"{c['yellow']}Autoloot is now OFF. You must manually loot items from corpses.{c['reset']}")
-            else:
-                await player.send(f"{c['red']}Usage: autoloot [on|off] or autoloot gold [on|off]{c['reset']}")
-        else:
-            # Toggle
-            player.autoloot = not player.autoloot
-            status = f"{c['bright_green']}ON{c['reset']}" if player.autoloot else f"{c['red']}OFF{c['reset']}"
-            await player.send(f"Autoloot is now {status}.")
-
-        # Show current status
-        gold_status = f"{c['bright_green']}ON{c['reset']}" if player.autoloot_gold else f"{c['red']}OFF{c['reset']}"
-        item_status = f"{c['bright_green']}ON{c['reset']}" if player.autoloot else f"{c['red']}OFF{c['reset']}"
-        await player.send(f"{c['cyan']}Current settings: Autoloot Items: {item_status}, Autoloot Gold: {gold_status}{c['reset']}")
-
-    @classmethod
-    async def cmd_autogold(cls, player: 'Player', args: List[str]):
-        """Toggle automatic pickup of ground gold.
-
-        Usage:
-            autogold          - Toggle autogold on/off
-            autogold on       - Turn autogold on
-            autogold off      - Turn autogold off
-        """
-        c = player.config.COLORS
-
-        if args:
-            setting = args[0].lower()
-            if setting == 'on':
-                player.autogold = True
-                await player.send(f"{c['bright_green']}Autogold is now ON. You will automatically pick up gold on the ground.{c['reset']}")
-            elif setting == 'off':
-                player.autogold = False
-                await player.send(f"{c['yellow']}Autogold is now OFF. You must manually pick up gold.{c['reset']}")
-            else:
-                await player.send(f"{c['red']}Usage: autogold [on|off]{c['reset']}")
-        else:
-            player.autogold = not player.autogold
-            status = f"{c['bright_green']}ON{c['reset']}" if player.autogold else f"{c['red']}OFF{c['reset']}"
-            await player.send(f"Autogold is now {status}.")
-
-    @classmethod
-    async def cmd_autoattack(cls, player: 'Player', args: List[str]):
-        """Toggle automatic basic attacks.
-
-        Usage:
-            autoattack          - Toggle autoattack on/off
-            autoattack on       - Turn autoattack on
-            autoattack off      - Turn autoattack off
-        """
-        c = player.config.COLORS
-
-        if args:
-            setting = args[0].lower()
-            if setting == 'on':
-                player.autoattack = True
-                await player.send(f"{c['bright_green']}Autoattack is now ON.{c['reset']}")
-            elif setting == 'off':
-                player.autoattack = False
-                await player.send(f"{c['yellow']}Autoattack is now OFF.{c['reset']}")
-            else:
-                await player.send(f"{c['red']}Usage: autoattack [on|off]{c['reset']}")
-        else:
-            player.autoattack = not player.autoattack
-            status = f"{c['bright_green']}ON{c['reset']}" if player.autoattack else f"{c['red']}OFF{c['reset']}"
-            await player.send(f"Autoattack is now {status}.")
-
-    @classmethod
-    async def cmd_autocombat(cls, player: 'Player', args: List[str]):
-        """Toggle automatic combat skills/spells.
-
-        Usage:
-            autocombat          - Toggle autocombat on/off
-            autocombat on       - Turn autocombat on
-            autocombat off      - Turn autocombat off
-        """
-        c = player.config.COLORS
-
-        if args:
-            setting = args[0].lower()
-            if setting == 'on':
-                player.autocombat = True
-                await player.send(f"{c['bright_green']}Autocombat is now ON.{c['reset']}")
-            elif setting == 'off':
-                player.autocombat = False
-                await player.send(f"{c['yellow']}Autocombat is now OFF.{c['reset']}")
-            else:
-                await player.send(f"{c['red']}Usage: autocombat [on|off]{c['reset']}")
-        else:
-            player.autocombat = not player.autocombat
-            status = f"{c['bright_green']}ON{c['reset']}" if player.autocombat else f"{c['red']}OFF{c['reset']}"
-            await player.send(f"Autocombat is now {status}.")
-
-    @classmethod
-    async def cmd_brief(cls, player: 'Player', args: List[str]):
-        """Toggle brief room descriptions.
-
-        Usage:
-            brief          - Toggle brief mode on/off
-            brief on       - Turn brief mode on
-            brief off      - Turn brief mode off
-        """
-        c = player.config.COLORS
-
-        if args:
-            setting = args[0].lower()
-            if setting == 'on':
-                player.brief_mode = True
-                await player.send(f"{c['bright_green']}Brief mode is now ON.{c['reset']}")
-            elif setting == 'off':
-                player.brief_mode = False
-                await player.send(f"{c['yellow']}Brief mode is now OFF.{c['reset']}")
-            else:
-                await player.send(f"{c['red']}Usage: brief [on|off]{c['reset']}")
-        else:
-            player.brief_mode = not player.brief_mode
-            status = f"{c['bright_green']}ON{c['reset']}" if player.brief_mode else f"{c['red']}OFF{c['reset']}"
-            await player.send(f"Brief mode is now {status}.")
-
-    @classmethod
-    async def cmd_compact(cls, player: 'Player', args: List[str]):
-        """Toggle compact combat messages.
-
-        Usage:
-            compact          - Toggle compact mode on/off
-            compact on       - Turn compact mode on
-            compact off      - Turn compact mode off
-        """
-        c = player.config.COLORS
-
-        if args:
-            setting = args[0].lower()
-            if setting == 'on':
-                player.compact_mode = True
-                await player.send(f"{c['bright_green']}Compact mode is now ON.{c['reset']}")
-            elif setting == 'off':
-                player.compact_mode = False
-                await player.send(f"{c['yellow']}Compact mode is now OFF.{c['reset']}")
-            else:
-                await player.send(f"{c['red']}Usage: compact [on|off]{c['reset']}")
-        else:
-            player.compact_mode = not player.compact_mode
-            status = f"{c['bright_green']}ON{c['reset']}" if player.compact_mode else f"{c['red']}OFF{c['reset']}"
-            await player.send(f"Compact mode is now {status}.")
-
-    @classmethod
-    async def cmd_vnums(cls, player: 'Player', args: List[str]):
-        """Toggle room vnum display."""
-        c = player.config.COLORS
-        player.show_room_vnums = not player.show_room_vnums
-        status = f"{c['bright_green']}ON{c['reset']}" if player.show_room_vnums else f"{c['red']}OFF{c['reset']}"
-        await player.send(f"Room vnums are now {status}.")
-
-    @classmethod
-    async def cmd_tick(cls, player: 'Player', args: List[str]):
-        """Toggle tick timer notifications.
-        
-        Shows when game ticks happen (regen, combat, etc.)
-        
-        Usage:
-            tick         - Toggle tick notifications
-            tick on      - Turn on
-            tick off     - Turn off
-        """
-        c = player.config.COLORS
-        
-        if args:
-            setting = args[0].lower()
-            if setting == 'on':
-                player.show_ticks = True
-            elif setting == 'off':
-                player.show_ticks = False
-            else:
-                await player.send(f"{c['yellow']}Usage: tick [on|off]{c['reset']}")
-                return
-        else:
-            player.show_ticks = not getattr(player, 'show_ticks', False)
-        
-        if player.show_ticks:
-            await player.send(f"{c['bright_green']}Tick notifications ON.{c['reset']}")
-            await player.send(f"{c['cyan']}Tick rates: Combat=4s, Regen=60s, Pet=10s{c['reset']}")
-        else:
-            await player.send(f"{c['yellow']}Tick notifications OFF.{c['reset']}")
-
-    @classmethod
-    async def cmd_notick(cls, player: 'Player', args: List[str]):
-        """Alias for tick - toggle tick notifications."""
-        await cls.cmd_tick(player, args)
-
-    @classmethod
-    async def cmd_sets(cls, player: 'Player', args: List[str]):
-        """Show active zone set bonuses."""
-        c = player.config.COLORS
-        try:
-            from sets import ZONE_CATEGORIES, CATEGORY_BONUSES, get_set_bonus
-        except Exception:
-            await player.send(f"{c['yellow']}Set system not available.{c['reset']}")
-            return
-
-        # Count equipped pieces by set_id
-        set_counts = {}
-        for slot, item in getattr(player, 'equipment', {}).items():
-            if item and getattr(item, 'set_id', None):
-                set_id = item.set_id
-                if isinstance(set_id, str) and set_id.isdigit():
-                    set_id = int(set_id)
-                set_counts[set_id] = set_counts.get(set_id, 0) + 1
-
-        if not set_counts:
-            await player.send(f"{c['yellow']}You have no set pieces equipped.{c['reset']}")
-            return
-
-        current_zone = getattr(player.room.zone, 'number', None) if player.room and player.room.zone else None
-
-        await player.send(f"\n{c['bright_cyan']}╔══════════════════════════════════════════════════════╗{c['reset']}")
-        await player.send(f"{c['bright_cyan']}║{c['bright_yellow']}               ACTIVE SET BONUSES              {c['bright_cyan']}║{c['reset']}")
-        await player.send(f"{c['bright_cyan']}╚══════════════════════════════════════════════════════╝{c['reset']}")
-
-        for set_id, pieces in set_counts.items():
-            category = ZONE_CATEGORIES.get(set_id, 'unknown')
-            await player.send(f"\n{c['bright_green']}Set {set_id} ({category}) — {pieces} piece(s){c['reset']}")
-
-            # Always-on bonuses
-            always = get_set_bonus(set_id, pieces, in_zone=False)
-            if always:
-                await player.send(f"{c['white']}  Always-on:{c['reset']}")
-                for stat, val in always.items():
-                    await player.send(f"    {c['cyan']}{stat}{c['reset']}: +{val}")
-
-            # In-zone bonuses
-            in_zone = get_set_bonus(set_id, pieces, in_zone=True) if current_zone == set_id else {}
-            if in_zone:
-                await player.send(f"{c['white']}  In-zone:{c['reset']}")
-                for stat, val in in_zone.items():
-                    await player.send(f"    {c['bright_magenta']}{stat}{c['reset']}: +{val}")
-
-            if current_zone != set_id:
-                await player.send(f"{c['yellow']}  (Enter zone {set_id} to activate in-zone bonuses){c['reset']}")
-
-    @classmethod
-    async def cmd_settings(cls, player: 'Player', args: List[str]):
-        """Show toggleable settings."""
-        c = player.config.COLORS
-
-        toggles = {
-            'Autoattack': getattr(player, 'autoattack', False),
-            'Autocombat': getattr(player, 'autocombat', False),
-            'Autoexit': getattr(player, 'autoexit', False),
-            'Autoloot Items': getattr(player, 'autoloot', False),
-            'Autoloot Gold': getattr(player, 'autoloot_gold', True),
-            'Autogold': getattr(player, 'autogold', True),
-            'Brief': getattr(player, 'brief_mode', False),
-            'Compact': getattr(player, 'compact_mode', False),
-            'Prompt': getattr(player, 'prompt_enabled', True),
-            'Norepeat': getattr(player, 'norepeat', False),
-            'Notell': getattr(player, 'notell', False),
-            'Noshout': getattr(player, 'noshout', False),
-            'AI Chat': getattr(player, 'ai_chat_enabled', True),
-        }
-
-        await player.send(f"{c['cyan']}Current Settings:{c['reset']}")
-        for label, enabled in toggles.items():
-            status = f"{c['bright_green']}ON{c['reset']}" if enabled else f"{c['red']}OFF{c['reset']}"
-            await player.send(f"  {label:<14} {status}")
-
-        if hasattr(player, 'autorecall_hp') and player.autorecall_hp is not None:
-            if getattr(player, 'autorecall_is_percent', False):
-                await player.send(f"  Autorecall: {player.autorecall_hp}%")
-            else:
-                await player.send(f"  Autorecall: {int(player.autorecall_hp)} HP")
-        
-        # Extra settings
-        color_level = getattr(player, 'color_level', 'complete')
-        await player.send(f"  Color level: {color_level}")
-        if getattr(player, 'custom_prompt', None):
-            await player.send(f"  Prompt format: {player.custom_prompt}")
-
-    @classmethod
-    async def cmd_combat(cls, player: 'Player', args: List[str]):
-        """Combat settings for auto-combat.
-
-        Usage:
-            combat settings
-            combat settings heal <percent>
-            combat settings skills on|off
-            combat settings spells on|off
-            combat settings skillpriority <skill1,skill2,...>
-            combat settings spellpriority <spell1,spell2,...>
-            combat settings reset
-        """
-        c = player.config.COLORS
-
-        if not args or args[0].lower() != 'settings':
-            await player.send(f"{c['yellow']}Usage: combat settings{c['reset']}")
-            return
-
-        settings = getattr(player, 'auto_combat_settings', {})
-        if len(args) == 1:
-            await player.send(f"{c['cyan']}Auto-Combat Settings:{c['reset']}")
-            await player.send(f"  Heal Threshold: {settings.get('heal_threshold', 35)}%")
-            await player.send(f"  Use Skills: {'ON' if settings.get('use_skills', True) else 'OFF'}")
-            await player.send(f"  Use Spells: {'ON' if settings.get('use_spells', True) else 'OFF'}")
-            await player.send(f"  Skill Priority: {', '.join(settings.get('skill_priority', []))}")
-            await player.send(f"  Spell Priority: {', '.join(settings.get('spell_priority', []))}")
-            return
-
-        sub = args[1].lower()
-        if sub == 'reset':
-            player.auto_combat_settings = {
-                'heal_threshold': 35,
-                'use_skills': True,
-                'use_spells': True,
-                'skill_priority': ['bash', 'kick'],
-                'spell_priority': ['heal', 'cure_critical', 'cure_serious', 'cure_light', 'fireball', 'lightning_bolt', 'magic_missile'],
-            }
-            await player.send(f"{c['bright_green']}Auto-combat settings reset to defaults.{c['reset']}")
-            return
-
-        if sub == 'heal' and len(args) >= 3:
-            try:
-                val = int(args[2].rstrip('%'))
-                if val < 1 or val > 99:
-                    raise ValueError
-                settings['heal_threshold'] = val
-                await player.send(f"{c['green']}Heal threshold set to {val}%{c['reset']}")
-            except ValueError:
-                await player.send(f"{c['red']}Usage: combat settings heal <1-99>{c['reset']}")
-            return
-
-        if sub == 'skills' and len(args) >= 3:
-            setting = args[2].lower()
-            if setting in ('on', 'off'):
-                settings['use_skills'] = setting == 'on'
-                await player.send(f"{c['green']}Auto skills set to {setting.upper()}.{c['reset']}")
-            else:
-                await player.send(f"{c['red']}Usage: combat settings skills on|off{c['reset']}")
-            return
-
-        if sub == 'spells' and len(args) >= 3:
-            setting = args[2].lower()
-            if setting in ('on', 'off'):
-                settings['use_spells'] = setting == 'on'
-                await player.send(f"{c['green']}Auto spells set to {setting.upper()}.{c['reset']}")
-            else:
-                await player.send(f"{c['red']}Usage: combat settings spells on|off{c['reset']}")
-            return
-
-        if sub == 'skillpriority' and len(args) >= 3:
-            raw = ' '.join(args[2:]).replace(',', ' ').split()
-            settings['skill_priority'] = [s.lower() for s in raw]
-            await player.send(f"{c['green']}Skill priority set to: {', '.join(settings['skill_priority'])}{c['reset']}")
-            return
-
-        if sub == 'spellpriority' and len(args) >= 3:
-            raw = ' '.join(args[2:]).replace(',', ' ').split()
-            settings['spell_priority'] = [s.lower() for s in raw]
-            await player.send(f"{c['green']}Spell priority set to: {', '.join(settings['spell_priority'])}{c['reset']}")
-            return
-
-        await player.send(f"{c['yellow']}Usage: combat settings (heal|skills|spells|skillpriority|spellpriority|reset){c['reset']}")
-
-    @classmethod
-    async def cmd_waypoints(cls, player: 'Player', args: List[str]):
-        """List discovered waypoints."""
-        c = player.config.COLORS
-        from travel import WAYPOINTS
-
-        discovered = getattr(player, 'discovered_waypoints', set())
-        await player.send(f"{c['cyan']}Discovered Waypoints:{c['reset']}")
-        if not discovered:
-            await player.send(f"{c['yellow']}None yet. Visit major locations to discover waypoints.{c['reset']}")
-            return
-
-        for key in discovered:
-            info = WAYPOINTS.get(key)
-            if not info:
-                continue
-            await player.send(f"  {c['bright_green']}{info['name']}{c['reset']} (Cost: {info['cost']} gold)")
-
-        undiscovered = len(WAYPOINTS) - len(discovered)
-        if undiscovered > 0:
-            await player.send(f"{c['yellow']}Undiscovered: {undiscovered}{c['reset']}")
-
-    @classmethod
-    async def cmd_travel(cls, player: 'Player', args: List[str]):
-        """Travel to a discovered waypoint.
-
-        Usage:
-            travel <waypoint>
-        """
-        c = player.config.COLORS
-        if not args:
-            await player.send(f"{c['yellow']}Usage: travel <waypoint>{c['reset']}")
-            await player.send(f"{c['cyan']}Use 'waypoints' to see discovered locations.{c['reset']}")
-            return
-
-        from travel import get_waypoint_by_name, can_travel, set_travel_cooldown
-
-        name = ' '.join(args)
-        result = get_waypoint_by_name(name)
-        if not result:
-            await player.send(f"{c['red']}Unknown waypoint '{name}'.{c['reset']}")
-            return
-
-        key, info = result
-        if key not in getattr(player, 'discovered_waypoints', set()):
-            await player.send(f"{c['red']}You haven't discovered that waypoint yet.{c['reset']}")
-            return
-
-        ok, msg = can_travel(player)
-        if not ok:
-            await player.send(f"{c['red']}{msg}{c['reset']}")
-            return
-
-        cost = info.get('cost', 0)
-        if cost > 0 and player.gold < cost:
-            await player.send(f"{c['red']}You need {cost} gold to travel there.{c['reset']}")
-            return
-
-        target_room = player.world.rooms.get(info['vnum']) if player.world else None
-        if not target_room:
-            await player.send(f"{c['red']}That waypoint no longer exists.{c['reset']}")
-            return
-
-        if player.room == target_room:
-            await player.send(f"{c['yellow']}You are already there.{c['reset']}")
-            return
-
-        # Pay cost
-        if cost > 0:
-            player.gold -= cost
-
-        # Teleport
-        old_room = player.room
-        if old_room:
-            await old_room.send_to_room(
-                f"{c['bright_cyan']}{player.name} disappears in a flash of light!{c['reset']}",
-                exclude=[player]
-            )
-            old_room.characters.remove(player)
-
-        player.room = target_room
-        target_room.characters.append(player)
-
-        set_travel_cooldown(player)
-
-        await player.send(f"{c['bright_cyan']}You travel to {info['name']}!{c['reset']}")
-        if cost > 0:
-            await player.send(f"{c['yellow']}Travel cost: {cost} gold. Remaining: {player.gold} gold.{c['reset']}")
-        await player.send("")
-        await target_room.show_to(player)
-        await target_room.send_to_room(
-            f"{c['bright_cyan']}{player.name} arrives in a flash of light!{c['reset']}",
-            exclude=[player]
-        )
-
-    @classmethod
-    async def cmd_bind(cls, player: 'Player', args: List[str]):
-        """Set your recall point to the current location."""
-        await cls.cmd_recall(player, ['set'])
-
-    @classmethod
-    async def cmd_xp(cls, player: 'Player', args: List[str]):
-        """Show XP breakdown and progress."""
-        c = player.config.COLORS
-        to_level = player.exp_to_level()
-        remaining = max(0, to_level - player.exp)
-        pct = (player.exp / to_level) * 100 if to_level > 0 else 0
-
-        await player.send(f"{c['cyan']}XP Progress:{c['reset']}")
-        await player.send(f"  Current XP: {player.exp}")
-        await player.send(f"  Next Level: {remaining} XP ({pct:.1f}% of level)")
-
-        breakdown = getattr(player, 'xp_breakdown', {})
-        if breakdown:
-            await player.send(f"{c['cyan']}XP Breakdown:{c['reset']}")
-            for key in ['kill', 'exploration', 'quest', 'boss', 'streak', 'rested', 'other']:
-                if key in breakdown:
-                    await player.send(f"  {key.title():<12}: {breakdown[key]}")
-
-        if getattr(player, 'rested_xp', 0) > 0:
-            await player.send(f"{c['bright_green']}Rested XP available: {player.rested_xp}{c['reset']}")
-
-        if getattr(player, 'kill_streak', 0) > 1:
-            await player.send(f"{c['yellow']}Current kill streak: {player.kill_streak} (Best: {player.best_kill_streak}){c['reset']}")
-
-    @classmethod
-    async def cmd_recall(cls, player: 'Player', args: List[str]):
-        """Recall to your recall point (temple).
-
-        Usage:
-            recall     - Teleport to your recall point
-            recall set - Set current location as recall point
-        """
-        c = player.config.COLORS
-
-        # Check if setting recall point
-        if args and args[0] and args[0].lower() == 'set':
-            if not player.room:
-                await player.send(f"{c['red']}You are nowhere!{c['reset']}")
-                return
-
-            # Can't set recall in certain rooms
-            if 'no_recall' in player.room.flags:
-                await player.send(f"{c['red']}You cannot set your recall point here!{c['reset']}")
-                return
-
-            player.recall_point = player.room.vnum
-            await player.send(f"{c['bright_cyan']}Recall point set to: {player.room.name}{c['reset']}")
-            await player.send(f"{c['yellow']}You can now use 'recall' to return here from anywhere.{c['reset']}")
-            return
-
-        # Can't recall while fighting
-        if player.is_fighting:
-            await player.send(f"{c['red']}You can't recall while fighting!{c['reset']}")
-            return
-
-        # Can't recall from no_recall rooms
-        if player.room and 'no_recall' in player.room.flags:
-            await player.send(f"{c['red']}Powerful magic prevents you from recalling!{c['reset']}")
-            return
-
-        # Get recall point (default to temple at 3001)
-        recall_vnum = getattr(player, 'recall_point', 3001)
-
-        # Find recall room
-        recall_room = player.world.rooms.get(recall_vnum)
-        if not recall_room:
-            # Fallback to temple if custom recall point doesn't exist
-            recall_room = player.world.rooms.get(3001)
-            if not recall_room:
-                await player.send(f"{c['red']}Your recall point no longer exists!{c['reset']}")
-                return
-
-        # Already at recall point?
-        if player.room == recall_room:
-            await player.send(f"{c['yellow']}You are already at your recall point!{c['reset']}")
-            return
-
-        # Recall!
-        old_room = player.room
-
-        # Leave old room
-        if old_room:
-            await old_room.send_to_room(
-                f"{c['bright_cyan']}{player.name} disappears in a flash of light!{c['reset']}",
-                exclude=[player]
-            )
-            old_room.characters.remove(player)
-
-        # Enter recall room
-        player.room = recall_room
-        recall_room.characters.append(player)
-
-        await player.send(f"{c['bright_cyan']}You recall to safety!{c['reset']}")
-        await player.send("")
-
-        # Show room
-        await recall_room.show_to(player)
-
-        # Announce arrival
-        await recall_room.send_to_room(
-            f"{c['bright_cyan']}{player.name} appears in a flash of light!{c['reset']}",
-            exclude=[player]
-        )
-
-        # Recall pets to player
-        try:
-            from pets import PetManager, Pet
-            pets = PetManager.get_player_pets(player)
-            for pet in pets:
-                if not pet or pet.room is None:
-                    continue
-                # Remove from old room
-                if pet.room:
-                    await pet.room.send_to_room(f"{c['bright_cyan']}{pet.name} vanishes in a flash of light!{c['reset']}")
-                    if pet in pet.room.characters:
-                        pet.room.characters.remove(pet)
-                # Move to recall room
-                pet.room = recall_room
-                recall_room.characters.append(pet)
-                pet.fighting = None
-                if not hasattr(pet, 'ai_state'):
-                    pet.ai_state = {}
-                pet.ai_state['staying'] = False
-                await recall_room.send_to_room(f"{c['bright_cyan']}{pet.name} appears beside {player.name}.{c['reset']}")
-        except Exception:
-            pass
-
-    @classmethod
-    async def cmd_goto(cls, player: 'Player', args: List[str]):
-        """Teleport to a room or zone (testing command).
-
-        Usage:
-            goto <vnum>     - Go to room vnum (e.g. goto 3001)
-            goto <zone>     - Go to zone entrance (e.g. goto 30)
-        """
-        c = player.config.COLORS
-
-        if not args:
-            await player.send(f"{c['yellow']}Usage: goto <room_vnum> or goto <zone_number>{c['reset']}")
-            await player.send(f"{c['cyan']}Examples:{c['reset']}")
-            await player.send(f"{c['white']}  goto 3001    {c['yellow']}# Go to Temple of Midgaard{c['reset']}")
-            await player.send(f"{c['white']}  goto 30      {c['yellow']}# Go to zone 30 entrance{c['reset']}")
-            await player.send(f"{c['white']}  goto 80      {c['yellow']}# Go to Dragon's Domain{c['reset']}")
-            return
-
-        try:
-            target_vnum = int(args[0])
-        except ValueError:
-            await player.send(f"{c['red']}Invalid room/zone number. Must be a number.{c['reset']}")
-            return
-
-        # Check if it's a zone number (under 100) and convert to first room in zone
-        if target_vnum < 100:
-            # It's a zone number - find first room in that zone
-            zone_num = target_vnum
-            zone = player.world.zones.get(zone_num)
-            if not zone:
-                await player.send(f"{c['red']}Zone {zone_num} does not exist.{c['reset']}")
-                return
-
-            # Get first room in zone
-            if not zone.rooms:
-                await player.send(f"{c['red']}Zone {zone_num} has no rooms!{c['reset']}")
-                return
-
-            # Find the lowest vnum room in the zone
-            target_vnum = min(zone.rooms.keys())
-            await player.send(f"{c['cyan']}Teleporting to {zone.name} (room {target_vnum})...{c['reset']}")
-
-        # Find the target room
-        target_room = player.world.rooms.get(target_vnum)
-        if not target_room:
-            await player.send(f"{c['red']}Room {target_vnum} does not exist.{c['reset']}")
-            await player.send(f"{c['yellow']}Tip: Use 'map' to see available zones.{c['reset']}")
-            return
-
-        # Already there?
-        if player.room == target_room:
-            await player.send(f"{c['yellow']}You are already in that room!{c['reset']}")
-            return
-
-        # Teleport!
-        old_room = player.room
-
-        # Leave old room
-        if old_room:
-            await old_room.send_to_room(
-                f"{c['bright_magenta']}{player.name} vanishes in a puff of smoke!{c['reset']}",
-                exclude=[player]
-            )
-            old_room.characters.remove(player)
-
-        # Enter target room
-        player.room = target_room
-        target_room.characters.append(player)
-
-        await player.send(f"{c['bright_magenta']}You teleport through space!{c['reset']}")
-        await player.send("")
-
-        # Show room
-        await target_room.show_to(player)
-
-        # Announce arrival
-        await target_room.send_to_room(
-            f"{c['bright_magenta']}{player.name} appears in a puff of smoke!{c['reset']}",
-            exclude=[player]
-        )
-
-    @classmethod
-    async def cmd_autorecall(cls, player: 'Player', args: List[str]):
-        """Set automatic recall when HP drops below a threshold.
-
-        Usage:
-            autorecall             - Show current autorecall settings
-            autorecall <hp>        - Set HP threshold (number or percentage)
-            autorecall 50          - Recall when HP drops below 50
-            autorecall 25%         - Recall when HP drops below 25%
-            autorecall off         - Disable autorecall
-        """
-        c = player.config.COLORS
-
-        if not args:
-            # Show current settings
-            if not hasattr(player, 'autorecall_hp') or player.autorecall_hp is None:
-                await player.send(f"{c['yellow']}Autorecall is currently {c['red']}OFF{c['reset']}")
-                await player.send(f"{c['cyan']}Usage: autorecall <hp> or autorecall <percentage>%{c['reset']}")
-                await player.send(f"{c['cyan']}Example: autorecall 50 or autorecall 25%{c['reset']}")
-            else:
-                threshold = player.autorecall_hp
-                if player.autorecall_is_percent:
-                    percent_val = int(threshold)
-                    actual_hp = int((percent_val / 100.0) * player.max_hp)
-                    await player.send(f"{c['bright_green']}Autorecall is {c['bright_green']}ON{c['reset']}")
-                    await player.send(f"{c['cyan']}Threshold: {percent_val}% ({actual_hp} HP){c['reset']}")
-                else:
-                    await player.send(f"{c['bright_green']}Autorecall is {c['bright_green']}ON{c['reset']}")
-                    await player.send(f"{c['cyan']}Threshold: {int(threshold)} HP{c['reset']}")
-            return
-
-        setting = args[0].lower()
-
-        # Turn off autorecall
-        if setting in ['off', 'disable', 'no']:
-            player.autorecall_hp = None
-            player.autorecall_is_percent = False
-            await player.send(f"{c['yellow']}Autorecall disabled.{c['reset']}")
-            return
-
-        # Parse HP threshold
-        try:
-            if '%' in setting:
-                # Percentage
-                percent = int(setting.rstrip('%'))
-                if percent < 1 or percent > 99:
-                    await player.send(f"{c['red']}Percentage must be between 1% and 99%.{c['reset']}")
-                    return
-
-                player.autorecall_hp = percent
-                player.autorecall_is_percent = True
-                actual_hp = int((percent / 100.0) * player.max_hp)
-                await player.send(f"{c['bright_green']}Autorecall enabled at {percent}% HP ({actual_hp} HP).{c['reset']}")
-                await player.send(f"{c['yellow']}You will automatically recall when your HP drops below this threshold.{c['reset']}")
-            else:
-                # Absolute HP value
-                hp_value = int(setting)
-                if hp_value < 1:
-                    await player.send(f"{c['red']}HP threshold must be at least 1.{c['reset']}")
-                    return
-
-                if hp_value >= player.max_hp:
-                    await player.send(f"{c['red']}HP threshold must be less than your maximum HP ({player.max_hp}).{c['reset']}")
-                    return
-
-                player.autorecall_hp = hp_value
-                player.autorecall_is_percent = False
-                await player.send(f"{c['bright_green']}Autorecall enabled at {hp_value} HP.{c['reset']}")
-                await player.send(f"{c['yellow']}You will automatically recall when your HP drops below this threshold.{c['reset']}")
-        except ValueError:
-            await player.send(f"{c['red']}Invalid HP value. Use a number or percentage (e.g., 50 or 25%).{c['reset']}")
-            return
-
-
-    # ==================== MOUNTS ====================
-
-    @classmethod
-    async def cmd_mount(cls, player: 'Player', args: List[str]):
-        """Mount an owned mount. Usage: mount [name]"""
-        from mounts import MountManager
-
-        c = player.config.COLORS
-
-        if player.is_fighting:
-            await player.send(f"{c['red']}You can't mount while fighting!{c['reset']}")
-            return
-
-        if player.mount:
-            await player.send(f"{c['yellow']}You are already riding {player.mount.name}.{c['reset']}")
-            return
-
-        if not args:
-            # Show owned mounts
-            if not player.owned_mounts:
-                await player.send(f"{c['yellow']}You don't own any mounts. Visit a stable to buy one!{c['reset']}")
-                return
-            await player.send(f"{c['cyan']}Your mounts:{c['reset']}")
-            for m in player.owned_mounts:
-                mkey = m if isinstance(m, str) else m.get('key', '?')
-                loyalty = m.get('loyalty', 100) if isinstance(m, dict) else 100
-                tmpl = MountManager.get_mount_template(mkey)
-                desc = tmpl['description'] if tmpl else ''
-                name = tmpl['name'] if tmpl else mkey
-                await player.send(f"  {c['bright_green']}{mkey}{c['reset']} — {name} (loyalty: {loyalty}) {desc}")
-            await player.send(f"{c['cyan']}Use: mount <name>{c['reset']}")
-            return
-
-        target_name = ' '.join(args).lower()
-
-        # Check owned mounts
-        mount_data = MountManager.get_owned_mount_data(player, target_name)
-        if mount_data:
-            loyalty = mount_data.get('loyalty', 100) if isinstance(mount_data, dict) else 100
-            mount = MountManager.create_mount(target_name, loyalty=loyalty)
-            if not mount:
-                await player.send(f"{c['red']}Can't mount that.{c['reset']}")
-                return
-            player.mount = mount
-            await player.send(f"{c['bright_green']}You mount {mount.name}.{c['reset']}")
-            if player.room:
-                await player.room.send_to_room(
-                    f"{player.name} mounts {mount.name}.", exclude=[player])
-            return
-
-        # Try to tame from room
-        target = None
-        if player.room:
-            for char in player.room.characters:
-                if char != player and hasattr(char, 'name') and target_name in char.name.lower():
-                    target = char
-                    break
-
-        if target:
-            success = await MountManager.tame_mount(player, target)
-            if success:
-                player.mount = MountManager.create_mount(target.name.lower())
-                if player.mount:
-                    await player.send(f"{c['bright_green']}You mount your new {player.mount.name}.{c['reset']}")
-            return
-
-        await player.send(f"{c['red']}You don't own '{target_name}'. Use 'mount' to see your mounts.{c['reset']}")
-
-    @classmethod
-    async def cmd_dismount(cls, player: 'Player', args: List[str]):
-        """Dismount your current mount."""
-        c = player.config.COLORS
-        if not player.mount:
-            await player.send(f"{c['yellow']}You are not mounted.{c['reset']}")
-            return
-        mount_name = player.mount.name
-        # Save loyalty back to owned_mounts
-        for m in player.owned_mounts:
-            if isinstance(m, dict) and m.get('key') == player.mount.key:
-                m['loyalty'] = player.mount.loyalty
-                break
-        player.mount = None
-        await player.send(f"{c['green']}You dismount from {mount_name}.{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(
-                f"{player.name} dismounts from {mount_name}.", exclude=[player])
-
-    @classmethod
-    async def cmd_stable(cls, player: 'Player', args: List[str]):
-        """Stable services. Usage: stable [list|buy <mount>|store]"""
-        from mounts import MountManager
-
-        c = player.config.COLORS
-
-        # Check for stable master NPC in room
-        has_stable = False
-        if player.room:
-            for char in player.room.characters:
-                if hasattr(char, 'special') and char.special == 'stable_master':
-                    has_stable = True
-                    break
-            # Also allow in city sector type as fallback
-            if not has_stable and player.room.sector_type == 'city':
-                has_stable = True
-
-        if not has_stable:
-            await player.send(f"{c['red']}You need to be at a stable to use this command.{c['reset']}")
-            return
-
-        if not args or args[0].lower() == 'list':
-            await player.send(f"\n{c['bright_cyan']}═══════════ Midgaard Stables ═══════════{c['reset']}")
-            await player.send(f"{c['cyan']}Available for purchase:{c['reset']}")
-            for name, info in MountManager.list_purchasable_mounts().items():
-                cost_str = f"{info['cost']} gold" if info['cost'] > 0 else "Not for sale"
-                await player.send(f"  {c['bright_green']}{name:<18}{c['yellow']}{cost_str:<12}{c['white']}{info['description']}{c['reset']}")
-            special_mounts = {k: v for k, v in MountManager.list_mounts().items() if not v.get('purchasable')}
-            await player.send(f"\n{c['cyan']}Special mounts (rare drops & faction rewards):{c['reset']}")
-            for name, info in special_mounts.items():
-                await player.send(f"  {c['bright_magenta']}{name:<18}{c['white']}{info['description']}{c['reset']}")
-            if player.owned_mounts:
-                await player.send(f"\n{c['cyan']}Your mounts:{c['reset']}")
-                for m in player.owned_mounts:
-                    mkey = m if isinstance(m, str) else m.get('key', '?')
-                    await player.send(f"  {c['bright_green']}{mkey}{c['reset']}")
-            await player.send(f"{c['bright_cyan']}════════════════════════════════════════{c['reset']}\n")
-            return
-
-        if args[0].lower() == 'buy' and len(args) > 1:
-            mount_name = args[1].lower()
-            await MountManager.buy_mount(player, mount_name)
-            return
-
-        if args[0].lower() == 'store':
-            if player.mount:
-                await cls.cmd_dismount(player, [])
-                await player.send(f"{c['green']}Your mount is safely stabled.{c['reset']}")
-            else:
-                await player.send(f"{c['yellow']}You're not riding anything to stable.{c['reset']}")
-            return
-
-        await player.send(f"{c['yellow']}Usage: stable [list|buy <mount>|store]{c['reset']}")
-
-    @classmethod
-    async def cmd_feed(cls, player: 'Player', args: List[str]):
-        """Feed your mount to maintain loyalty. Usage: feed [mount]"""
-        c = player.config.COLORS
-
-        if not player.mount:
-            await player.send(f"{c['yellow']}You are not riding a mount to feed.{c['reset']}")
-            return
-
-        # Check if player has food
-        food_item = None
-        for item in player.inventory:
-            if getattr(item, 'item_type', '') == 'food':
-                food_item = item
-                break
-
-        if not food_item:
-            # Allow feeding without food for 10 gold
-            if player.gold >= 10:
-                player.gold -= 10
-                msg = player.mount.feed()
-                await player.send(f"{c['green']}{msg} (Cost: 10 gold){c['reset']}")
-            else:
-                await player.send(f"{c['red']}You have no food and not enough gold (10g) to feed your mount.{c['reset']}")
-            return
-
-        player.inventory.remove(food_item)
-        msg = player.mount.feed()
-        await player.send(f"{c['green']}{msg}{c['reset']}")
-
-    @classmethod
-    async def cmd_mounts(cls, player: 'Player', args: List[str]):
-        """List your owned mounts."""
-        await cls.cmd_mount(player, [])
-
-    # ==================== COMBAT COMPANIONS ====================
-
-    @classmethod
-    async def cmd_companion(cls, player: 'Player', args: List[str]):
-        """Manage your combat companion. Usage: companion [attack|defend|passive|status|summon|dismiss]"""
-        from companions import CombatCompanion, COMBAT_COMPANION_TYPES
-
-        c = player.config.COLORS
-
-        if not args:
-            # Show status
-            if player.combat_companion:
-                cc = player.combat_companion
-                hp_pct = (cc.hp / cc.max_hp * 100) if cc.max_hp > 0 else 0
-                if hp_pct > 75: hp_color = c['bright_green']
-                elif hp_pct > 50: hp_color = c['green']
-                elif hp_pct > 25: hp_color = c['yellow']
-                else: hp_color = c['red']
-
-                status = "KNOCKED OUT" if cc.knocked_out else cc.behavior.upper()
-                await player.send(f"\n{c['bright_cyan']}═══ Combat Companion ═══{c['reset']}")
-                await player.send(f"  {c['white']}{cc.name}{c['reset']} (Lv {cc.level})")
-                await player.send(f"  {hp_color}HP: {cc.hp}/{cc.max_hp}{c['reset']}")
-                await player.send(f"  Mode: {c['bright_yellow']}{status}{c['reset']}")
-                if cc.knocked_out:
-                    await player.send(f"  {c['red']}Revives after resting ({cc.ko_timer} ticks remaining){c['reset']}")
-                await player.send(f"{c['bright_cyan']}════════════════════════{c['reset']}\n")
-            else:
-                if CombatCompanion.can_unlock(player):
-                    comp_key = CombatCompanion.get_available_type(player)
-                    cfg = COMBAT_COMPANION_TYPES.get(comp_key, {})
-                    await player.send(f"{c['cyan']}You can summon a {cfg.get('name', 'companion')}! Use: companion summon{c['reset']}")
-                else:
-                    await player.send(f"{c['yellow']}Combat companions unlock at level 20.{c['reset']}")
-            return
-
-        sub = args[0].lower()
-
-        if sub == 'summon':
-            if player.combat_companion:
-                await player.send(f"{c['yellow']}You already have {player.combat_companion.name} as your companion.{c['reset']}")
-                return
-            if not CombatCompanion.can_unlock(player):
-                await player.send(f"{c['red']}You must be level 20 to summon a combat companion.{c['reset']}")
-                return
-            comp_key = CombatCompanion.get_available_type(player)
-            cc = CombatCompanion(player, comp_key)
-            player.combat_companion = cc
-            await player.send(f"{c['bright_green']}{cc.name} appears at your side!{c['reset']}")
-            if player.room:
-                await player.room.send_to_room(
-                    f"{c['cyan']}{cc.name} materializes beside {player.name}.{c['reset']}",
-                    exclude=[player])
-            return
-
-        if sub == 'dismiss':
-            if not player.combat_companion:
-                await player.send(f"{c['yellow']}You have no combat companion.{c['reset']}")
-                return
-            name = player.combat_companion.name
-            player.combat_companion = None
-            await player.send(f"{c['yellow']}{name} fades away.{c['reset']}")
-            return
-
-        if sub in ('attack', 'defend', 'passive'):
-            if not player.combat_companion:
-                await player.send(f"{c['yellow']}You have no combat companion.{c['reset']}")
-                return
-            if player.combat_companion.knocked_out:
-                await player.send(f"{c['red']}{player.combat_companion.name} is knocked out!{c['reset']}")
-                return
-            player.combat_companion.behavior = sub
-            await player.send(f"{c['green']}{player.combat_companion.name} is now in {sub.upper()} mode.{c['reset']}")
-            return
-
-        if sub == 'status':
-            await cls.cmd_companion(player, [])
-            return
-
-        await player.send(f"{c['yellow']}Usage: companion [summon|dismiss|attack|defend|passive|status]{c['reset']}")
-
-    # ==================== PETS ====================
-
-    @classmethod
-    async def cmd_pet(cls, player: 'Player', args: List[str]):
-        """Show your pets and companions."""
-        from pets import PetManager
-
-        c = player.config.COLORS
-        pets = PetManager.get_player_pets(player)
-        if not pets:
-            await player.send(f"{c['yellow']}You have no pets or companions.{c['reset']}")
-            await player.send(f"{c['cyan']}Tip: Necromancers animate undead, Rangers tame beasts, Mages summon elementals.{c['reset']}")
-            return
-
-        await player.send(f"\n{c['bright_cyan']}═══════════════ Your Pets ═══════════════{c['reset']}")
-        for pet in pets:
-            # Type badge
-            if pet.is_persistent:
-                badge = f"{c['bright_green']}[Companion]{c['reset']}"
-            elif pet.pet_type == 'undead':
-                badge = f"{c['magenta']}[Undead]{c['reset']}"
-            else:
-                badge = f"{c['yellow']}[Summon]{c['reset']}"
-            
-            # HP bar
-            hp_pct = (pet.hp / pet.max_hp * 100) if pet.max_hp > 0 else 0
-            if hp_pct > 75:
-                hp_color = c['bright_green']
-            elif hp_pct > 50:
-                hp_color = c['green']
-            elif hp_pct > 25:
-                hp_color = c['yellow']
-            else:
-                hp_color = c['red']
-            
-            await player.send(f"  {c['white']}{pet.name}{c['reset']} {badge} Lv {pet.level}")
-            await player.send(f"    {hp_color}HP: {pet.hp}/{pet.max_hp}{c['reset']} | Loyalty: {pet.loyalty}")
-            
-            # Position
-            pos = getattr(pet, 'position', 'standing')
-            staying = getattr(pet, 'ai_state', {}).get('staying', False)
-            guarding = getattr(pet, 'ai_state', {}).get('guarding', False)
-            
-            status_parts = [pos]
-            if staying:
-                status_parts.append("staying")
-            if guarding:
-                status_parts.append("guarding")
-            if pet.is_fighting:
-                status_parts.append(f"fighting {pet.fighting.name}" if pet.fighting else "fighting")
-            
-            await player.send(f"    Status: {', '.join(status_parts)}")
-            
-            # Time remaining for temp pets
-            if pet.timer:
-                remaining = pet.get_despawn_time()
-                if remaining:
-                    mins = remaining // 60
-                    secs = remaining % 60
-                    await player.send(f"    {c['yellow']}Time left: {mins}m {secs}s{c['reset']}")
-            
-            # Location
-            if pet.room != player.room:
-                await player.send(f"    {c['cyan']}Location: {pet.room.name if pet.room else 'Unknown'}{c['reset']}")
-        
-        await player.send(f"{c['bright_cyan']}═════════════════════════════════════════{c['reset']}")
-        await player.send(f"{c['cyan']}Use 'order <action>' to command pets. See 'help order'.{c['reset']}\n")
-
-    # ==================== ACHIEVEMENTS ====================
-
-    @classmethod
-    async def cmd_achievements(cls, player: 'Player', args: List[str]):
-        """List earned achievements and progress. Usage: achievements [all|progress]"""
-        from achievements import ACHIEVEMENTS, AchievementManager
-
-        c = player.config.COLORS
-        AchievementManager._ensure_player_fields(player)
-        
-        show_all = args and args[0].lower() == 'all'
-        show_progress = args and args[0].lower() == 'progress'
-        
-        earned = player.achievements or {}
-        total_points = sum(ACHIEVEMENTS.get(ach_id, {}).get('points', 0) for ach_id in earned)
-        max_points = sum(a.get('points', 0) for a in ACHIEVEMENTS.values())
-        
-        await player.send(f"\r\n{c['bright_cyan']}═══════════════════ ACHIEVEMENTS ═══════════════════{c['reset']}")
-        await player.send(f"{c['yellow']}Points: {c['bright_yellow']}{total_points}/{max_points}{c['reset']}  |  "
-                         f"{c['yellow']}Earned: {c['bright_green']}{len(earned)}/{len(ACHIEVEMENTS)}{c['reset']}")
-        await player.send(f"{c['bright_cyan']}════════════════════════════════════════════════════{c['reset']}")
-        
-        # Show progress stats
-        progress = player.achievement_progress or {}
-        kills = progress.get('kills', 0)
-        explored = len(player.explored_rooms) if hasattr(player, 'explored_rooms') else 0
-        secrets = len(player.secret_rooms_found) if hasattr(player, 'secret_rooms_found') else 0
-        
-        await player.send(f"\r\n{c['cyan']}Progress:{c['reset']}")
-        await player.send(f"  Kills: {c['white']}{kills}{c['reset']}  |  Rooms explored: {c['white']}{explored}{c['reset']}  |  Secrets: {c['white']}{secrets}{c['reset']}")
-        
-        if show_progress:
-            # Show next milestones
-            await player.send(f"\r\n{c['cyan']}Next milestones:{c['reset']}")
-            if kills < 10:
-                await player.send(f"  {c['yellow']}Hunter:{c['reset']} {kills}/10 kills")
-            if explored < 10:
-                await player.send(f"  {c['yellow']}Explorer:{c['reset']} {explored}/10 rooms")
-            if secrets < 5:
-                await player.send(f"  {c['yellow']}Secret Seeker I:{c['reset']} {secrets}/5 secrets")
-            elif secrets < 10:
-                await player.send(f"  {c['yellow']}Secret Seeker II:{c['reset']} {secrets}/10 secrets")
-            return
-        
-        # Show earned achievements
-        if earned:
-            await player.send(f"\r\n{c['bright_green']}✓ Earned:{c['reset']}")
-            for ach_id in earned:
-                info = ACHIEVEMENTS.get(ach_id, {})
-                title = info.get('title', ach_id)
-                points = info.get('points', 0)
-                await player.send(f"  {c['bright_green']}★{c['reset']} {title} {c['yellow']}({points} pts){c['reset']}")
-        
-        # Show unearned if requested
-        if show_all:
-            unearned = [a for a in ACHIEVEMENTS if a not in earned]
-            if unearned:
-                await player.send(f"\r\n{c['white']}○ Not yet earned:{c['reset']}")
-                for ach_id in unearned[:10]:  # Limit to avoid spam
-                    info = ACHIEVEMENTS.get(ach_id, {})
-                    title = info.get('title', ach_id)
-                    desc = info.get('description', '')
-                    await player.send(f"  {c['white']}○{c['reset']} {title} - {c['white']}{desc}{c['reset']}")
-                if len(unearned) > 10:
-                    await player.send(f"  {c['white']}... and {len(unearned) - 10} more{c['reset']}")
-        else:
-            unearned_count = len(ACHIEVEMENTS) - len(earned)
-            if unearned_count > 0:
-                await player.send(f"\r\n{c['white']}Type 'achievements all' to see {unearned_count} unearned achievements.{c['reset']}")
-                await player.send(f"{c['white']}Type 'achievements progress' to see milestone progress.{c['reset']}")
-
-    # ==================== HOUSING ====================
-
-    @classmethod
-    async def cmd_house(cls, player: 'Player', args: List[str]):
-        """Manage housing. Usage: house [buy|sell|list|info|lock|unlock|invite|name|decorate|furnish|enter|storage]"""
-        from housing import HouseManager
-
-        c = player.config.COLORS
-
-        if not args or args[0].lower() == 'info':
-            await HouseManager.show_info(player)
-            return
-
-        sub = args[0].lower()
-
-        if sub == 'buy':
-            await HouseManager.buy_house(player)
-        elif sub == 'sell':
-            await HouseManager.sell_house(player)
-        elif sub == 'list':
-            await HouseManager.list_houses(player)
-        elif sub == 'enter':
-            await HouseManager.teleport_home(player)
-        elif sub == 'lock':
-            await HouseManager.lock_house(player)
-        elif sub == 'unlock':
-            await HouseManager.unlock_house(player)
-        elif sub == 'invite':
-            if len(args) < 2:
-                await player.send(f"{c['yellow']}Usage: house invite <player>{c['reset']}")
-                return
-            await HouseManager.invite_guest(player, args[1])
-        elif sub == 'name':
-            if len(args) < 2:
-                await player.send(f"{c['yellow']}Usage: house name <name>{c['reset']}")
-                return
-            await HouseManager.set_name(player, ' '.join(args[1:]))
-        elif sub == 'decorate':
-            if len(args) < 2:
-                await player.send(f"{c['yellow']}Usage: house decorate <description>{c['reset']}")
-                return
-            await HouseManager.set_description(player, ' '.join(args[1:]))
-        elif sub == 'furnish':
-            if len(args) < 2:
-                await HouseManager.show_furniture(player)
-            else:
-                await HouseManager.install_furniture(player, ' '.join(args[1:]))
-        elif sub == 'storage':
-            await HouseManager.show_storage(player)
-        else:
-            await player.send(f"{c['yellow']}Housing commands: house [buy|sell|list|info|enter|lock|unlock|invite|name|decorate|furnish|storage]{c['reset']}")
-
-    @classmethod
-    async def cmd_home(cls, player: 'Player', args: List[str]):
-        """Teleport to your house. Alias for 'house enter'."""
-        from housing import HouseManager
-        await HouseManager.teleport_home(player)
-
-    @classmethod
-    async def cmd_store(cls, player: 'Player', args: List[str]):
-        """Store an item in your house chest. Usage: store <item>"""
-        from housing import HouseManager
-
-        c = player.config.COLORS
-
-        if not args:
-            # Show storage contents if in house
-            await HouseManager.show_storage(player)
-            return
-
-        await HouseManager.store_item(player, ' '.join(args))
-
-    @classmethod
-    async def cmd_retrieve(cls, player: 'Player', args: List[str]):
-        """Retrieve an item from your house chest. Usage: retrieve <item>"""
-        from housing import HouseManager
-
-        c = player.config.COLORS
-        if not args:
-            await player.send(f"{c['yellow']}Usage: retrieve <item>{c['reset']}")
-            return
-
-        await HouseManager.retrieve_item(player, ' '.join(args))
-
-    @classmethod
-    async def cmd_dungeon(cls, player: 'Player', args: List[str]):
-        """Procedural dungeon commands.
-
-        Usage:
-            dungeon list
-            dungeon enter <type> [difficulty] [permadeath]
-            dungeon enter daily [difficulty] [permadeath]
-            dungeon leave
-        """
-        from procedural import get_dungeon_manager
-
-        c = player.config.COLORS
-        manager = get_dungeon_manager()
-
-        if not args or args[0].lower() == 'list':
-            await player.send(f"{c['bright_cyan']}Available Dungeons:{c['reset']}")
-            for entry in manager.list_dungeons():
-                daily_marker = f" {c['bright_yellow']}[DAILY]{c['reset']}" if entry['daily'] else ''
-                await player.send(f"  {c['green']}{entry['key']:<8}{c['reset']} - {c['white']}{entry['name']}{c['reset']}{daily_marker}")
-            await player.send(f"{c['yellow']}Usage: dungeon enter <type> [difficulty] [permadeath]{c['reset']}")
-            return
-
-        sub = args[0].lower()
-        if sub == 'enter':
-            if len(args) < 2:
-                await player.send(f"{c['yellow']}Usage: dungeon enter <type> [difficulty] [permadeath]{c['reset']}")
-                return
-
-            if not player.room or player.room.vnum != 3015:
-                await player.send(f"{c['red']}You must be at the Adventurer's Guild to enter a dungeon.{c['reset']}")
-                return
-
-            dungeon_key = args[1].lower()
-            daily = False
-            if dungeon_key == 'daily':
-                dungeon_key = manager.get_daily_type()
-                daily = True
-
-            difficulty = None
-            permadeath = False
-            for arg in args[2:]:
-                if arg.isdigit():
-                    difficulty = int(arg)
-                elif arg.lower() in {'permadeath', 'hardcore'}:
-                    permadeath = True
-
-            await manager.enter_dungeon(player, dungeon_key, difficulty=difficulty, permadeath=permadeath, daily=daily)
-            return
-
-        if sub == 'leave':
-            await manager.leave_dungeon(player, reason='abandon')
-            return
-
-        if sub in {'leaderboard', 'leaders', 'scores'}:
-            boards = manager.get_leaderboards()
-            if not boards:
-                await player.send(f"{c['yellow']}No dungeon clears recorded yet.{c['reset']}")
-                return
-
-            if len(args) >= 2:
-                dungeon_key = args[1].lower()
-                difficulty = None
-                if len(args) >= 3 and args[2].isdigit():
-                    difficulty = int(args[2])
-                if difficulty:
-                    board_key = f"{dungeon_key}:{difficulty}"
-                    entries = boards.get(board_key, [])
-                    await player.send(f"{c['bright_cyan']}Leaderboard: {dungeon_key} (Level {difficulty}){c['reset']}")
-                    for idx, entry in enumerate(entries, 1):
-                        await player.send(f"  {c['green']}{idx}. {entry['player']} - {entry['duration']}s{c['reset']}")
-                    return
-                else:
-                    await player.send(f"{c['bright_cyan']}Leaderboards for {dungeon_key}:{c['reset']}")
-                    for key, entries in boards.items():
-                        if not key.startswith(f"{dungeon_key}:"):
-                            continue
-                        level = key.split(':', 1)[1]
-                        best = entries[0] if entries else None
-                        if best:
-                            await player.send(f"  {c['green']}Level {level}:{c['reset']} {best['player']} - {best['duration']}s")
-                    return
-
-            await player.send(f"{c['bright_cyan']}Dungeon Leaderboards:{c['reset']}")
-            for key, entries in boards.items():
-                best = entries[0] if entries else None
-                if best:
-                    await player.send(f"  {c['green']}{key}{c['reset']} - {best['player']} {best['duration']}s")
-            return
-
-        await player.send(f"{c['yellow']}Unknown dungeon command. Use 'dungeon list'.{c['reset']}")
-
-    # ==================== IMMORTAL COMMANDS ====================
-    
-    @classmethod
-    async def cmd_mload(cls, player: 'Player', args: List[str]):
-        """Load a mob into the current room (immortal only).
-        
-        Usage: mload <vnum>
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-            
-        if not args:
-            await player.send(f"{c['yellow']}Usage: mload <vnum>{c['reset']}")
-            return
-            
-        try:
-            vnum = int(args[0])
-        except ValueError:
-            await player.send(f"{c['red']}Invalid vnum. Must be a number.{c['reset']}")
-            return
-            
-        proto = player.world.mob_prototypes.get(vnum)
-        if not proto:
-            await player.send(f"{c['red']}No mob with vnum {vnum} exists.{c['reset']}")
-            return
-            
-        from bosses import create_mob_from_prototype
-        mob = create_mob_from_prototype(proto, player.world)
-        mob.room = player.room
-        mob.home_room = player.room
-        player.room.characters.append(mob)
-        player.world.mobs.append(mob)
-        
-        await player.send(f"{c['bright_green']}You wave your hand and {mob.short_desc} appears!{c['reset']}")
-        await player.room.send_to_room(
-            f"{c['bright_magenta']}{mob.short_desc} appears out of thin air!{c['reset']}",
-            exclude=[player]
-        )
-    
-    @classmethod
-    async def cmd_oload(cls, player: 'Player', args: List[str]):
-        """Load an object into the room or your inventory (immortal only).
-        
-        Usage: oload <vnum> [room]
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-            
-        if not args:
-            await player.send(f"{c['yellow']}Usage: oload <vnum> [room]{c['reset']}")
-            return
-            
-        try:
-            vnum = int(args[0])
-        except ValueError:
-            await player.send(f"{c['red']}Invalid vnum. Must be a number.{c['reset']}")
-            return
-            
-        from objects import create_object, create_preset_object
-        obj = create_object(vnum, player.world) or create_preset_object(vnum)
-        
-        if not obj:
-            await player.send(f"{c['red']}No object with vnum {vnum} exists.{c['reset']}")
-            return
-        
-        to_room = len(args) > 1 and args[1].lower() == 'room'
-        
-        if to_room:
-            player.room.items.append(obj)
-            await player.send(f"{c['bright_green']}You conjure {obj.short_desc} onto the ground.{c['reset']}")
-            await player.room.send_to_room(
-                f"{c['bright_magenta']}{obj.short_desc} materializes out of thin air!{c['reset']}",
-                exclude=[player]
-            )
-        else:
-            player.inventory.append(obj)
-            await player.send(f"{c['bright_green']}You conjure {obj.short_desc} into your hands.{c['reset']}")
-    
-    @classmethod
-    async def cmd_slay(cls, player: 'Player', args: List[str]):
-        """Instantly kill a target (immortal only).
-        
-        Usage: slay <target>
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-            
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send(f"{c['yellow']}Usage: slay <target>{c['reset']}")
-                return
-            
-        target = cls._find_target(player, ' '.join(args))
-        if not target:
-            await player.send(f"{c['red']}No one by that name here.{c['reset']}")
-            return
-            
-        if target == player:
-            await player.send(f"{c['red']}That would be unwise...{c['reset']}")
-            return
-            
-        # Check if it's a player
-        from player import Player
-        if isinstance(target, Player):
-            await player.send(f"{c['red']}You cannot slay other players!{c['reset']}")
-            return
-            
-        target.hp = 0
-        await player.send(f"{c['bright_red']}You slay {target.name} with a wave of your hand!{c['reset']}")
-        await player.room.send_to_room(
-            f"{c['bright_red']}{player.name} waves their hand and {target.name} crumples to the ground, dead!{c['reset']}",
-            exclude=[player]
-        )
-        
-        # Trigger death
-        from combat import CombatHandler
-        await CombatHandler.handle_death(player, target)
-    
-    @classmethod
-    async def cmd_purge(cls, player: 'Player', args: List[str]):
-        """Remove all mobs and objects from the room, or a specific target (immortal only).
-        
-        Usage: 
-            purge           - Remove all mobs/objects in room
-            purge <target>  - Remove specific mob/object
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-        
-        from mobs import Mobile
-        from player import Player
-        
-        if args:
-            # Purge specific target
-            target_name = ' '.join(args)
-            target = cls._find_target(player, target_name)
-            
-            if not target:
-                # Try finding an object
-                for item in player.room.items:
-                    if target_name.lower() in item.name.lower():
-                        player.room.items.remove(item)
-                        await player.send(f"{c['bright_magenta']}{item.short_desc} vanishes in a puff of smoke.{c['reset']}")
-                        return
-                await player.send(f"{c['red']}Nothing by that name here.{c['reset']}")
-                return
-                
-            if isinstance(target, Player):
-                await player.send(f"{c['red']}You cannot purge players!{c['reset']}")
-                return
-                
-            # Remove the mob
-            if target in player.room.characters:
-                player.room.characters.remove(target)
-            if target in player.world.mobs:
-                player.world.mobs.remove(target)
-            await player.send(f"{c['bright_magenta']}{target.name} vanishes in a puff of smoke.{c['reset']}")
-            return
-        
-        # Purge all mobs and objects in room
-        purged_mobs = 0
-        purged_objs = 0
-        
-        for char in player.room.characters[:]:
-            if isinstance(char, Mobile):
-                player.room.characters.remove(char)
-                if char in player.world.mobs:
-                    player.world.mobs.remove(char)
-                purged_mobs += 1
-                
-        for item in player.room.items[:]:
-            player.room.items.remove(item)
-            purged_objs += 1
-            
-        await player.send(f"{c['bright_magenta']}You purge the room!{c['reset']}")
-        await player.send(f"{c['cyan']}Removed {purged_mobs} mobs and {purged_objs} objects.{c['reset']}")
-        await player.room.send_to_room(
-            f"{c['bright_magenta']}{player.name} gestures and everything not a player vanishes!{c['reset']}",
-            exclude=[player]
-        )
-    
-    @classmethod
-    async def cmd_restore(cls, player: 'Player', args: List[str]):
-        """Fully restore HP/mana/move for self or a target (immortal only).
-        
-        Usage:
-            restore         - Restore yourself
-            restore <name>  - Restore a player
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-            
-        if not args:
-            target = player
-        else:
-            # Find the player
-            target_name = args[0].lower()
-            target = None
-            for p in player.world.players.values():
-                if p.name.lower() == target_name:
-                    target = p
-                    break
-            if not target:
-                await player.send(f"{c['red']}No player named '{args[0]}' is online.{c['reset']}")
-                return
-        
-        target.hp = target.max_hp
-        target.mana = target.max_mana
-        target.move = target.max_move
-        
-        if target == player:
-            await player.send(f"{c['bright_green']}You restore yourself to full health!{c['reset']}")
-        else:
-            await player.send(f"{c['bright_green']}You restore {target.name} to full health!{c['reset']}")
-            await target.send(f"{c['bright_green']}You feel a surge of divine energy! Fully restored!{c['reset']}")
-    
-    @classmethod
-    async def cmd_advance(cls, player: 'Player', args: List[str]):
-        """Set a player's level (immortal only).
-        
-        Usage: advance <player> <level>
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-            
-        if len(args) < 2:
-            await player.send(f"{c['yellow']}Usage: advance <player> <level>{c['reset']}")
-            return
-            
-        target_name = args[0].lower()
-        try:
-            new_level = int(args[1])
-        except ValueError:
-            await player.send(f"{c['red']}Level must be a number.{c['reset']}")
-            return
-            
-        if new_level < 1 or new_level > 100:
-            await player.send(f"{c['red']}Level must be between 1 and 100.{c['reset']}")
-            return
-            
-        # Find the player
-        target = None
-        for p in player.world.players.values():
-            if p.name.lower() == target_name:
-                target = p
-                break
-        if not target:
-            await player.send(f"{c['red']}No player named '{args[0]}' is online.{c['reset']}")
-            return
-            
-        old_level = target.level
-        
-        await player.send(f"{c['bright_green']}You advance {target.name} from level {old_level} to level {new_level}!{c['reset']}")
-        
-        # Level up one at a time to trigger proper celebrations and ability unlocks
-        while target.level < new_level:
-            await target.level_up()
-        
-        # Restore to full
-        target.hp = target.max_hp
-        target.mana = target.max_mana
-        target.move = target.max_move
-    
-    @classmethod
-    async def cmd_transfer(cls, player: 'Player', args: List[str]):
-        """Teleport a player to your location (immortal only).
-        
-        Usage: transfer <player>
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-            
-        if not args:
-            await player.send(f"{c['yellow']}Usage: transfer <player>{c['reset']}")
-            return
-            
-        target_name = args[0].lower()
-        target = None
-        for p in player.world.players.values():
-            if p.name.lower() == target_name:
-                target = p
-                break
-        if not target:
-            await player.send(f"{c['red']}No player named '{args[0]}' is online.{c['reset']}")
-            return
-            
-        if target == player:
-            await player.send(f"{c['yellow']}You're already here!{c['reset']}")
-            return
-            
-        old_room = target.room
-        
-        # Remove from old room
-        if old_room:
-            await old_room.send_to_room(
-                f"{c['bright_magenta']}{target.name} disappears in a flash of light!{c['reset']}",
-                exclude=[target]
-            )
-            old_room.characters.remove(target)
-            
-        # Add to new room
-        target.room = player.room
-        player.room.characters.append(target)
-        
-        await target.send(f"{c['bright_magenta']}You feel yourself being pulled through space!{c['reset']}")
-        await target.room.show_to(target)
-        
-        await player.send(f"{c['bright_green']}You summon {target.name} to your location!{c['reset']}")
-        await player.room.send_to_room(
-            f"{c['bright_magenta']}{target.name} appears in a flash of light!{c['reset']}",
-            exclude=[player, target]
-        )
-    
-    @classmethod
-    async def cmd_wizinvis(cls, player: 'Player', args: List[str]):
-        """Toggle invisibility to mortals (immortal only).
-        
-        Usage: wizinvis [level]
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-        
-        # Toggle wizinvis flag
-        if not hasattr(player, 'wizinvis'):
-            player.wizinvis = False
-            
-        player.wizinvis = not player.wizinvis
-        
-        if player.wizinvis:
-            await player.send(f"{c['bright_cyan']}You slowly vanish from sight...{c['reset']}")
-            await player.room.send_to_room(
-                f"{c['bright_cyan']}{player.name} slowly fades from view.{c['reset']}",
-                exclude=[player]
-            )
-        else:
-            await player.send(f"{c['bright_cyan']}You become visible again.{c['reset']}")
-            await player.room.send_to_room(
-                f"{c['bright_cyan']}{player.name} slowly fades into view.{c['reset']}",
-                exclude=[player]
-            )
-    
-    @classmethod
-    async def cmd_peace(cls, player: 'Player', args: List[str]):
-        """Stop all combat in the current room (immortal only).
-        
-        Usage: peace
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-            
-        stopped = 0
-        for char in player.room.characters:
-            if char.fighting:
-                char.fighting = None
-                stopped += 1
-                
-        if stopped > 0:
-            await player.send(f"{c['bright_cyan']}You wave your hand and all combat ceases!{c['reset']}")
-            await player.room.send_to_room(
-                f"{c['bright_cyan']}{player.name} waves their hand and a feeling of peace washes over everyone.{c['reset']}",
-                exclude=[player]
-            )
-        else:
-            await player.send(f"{c['yellow']}No one is fighting here.{c['reset']}")
-    
-    @classmethod
-    async def cmd_force(cls, player: 'Player', args: List[str]):
-        """Force a player to execute a command (immortal only).
-        
-        Usage: force <player> <command>
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-            
-        if len(args) < 2:
-            await player.send(f"{c['yellow']}Usage: force <player> <command>{c['reset']}")
-            return
-            
-        target_name = args[0].lower()
-        command = ' '.join(args[1:])
-        
-        target = None
-        for p in player.world.players.values():
-            if p.name.lower() == target_name:
-                target = p
-                break
-        if not target:
-            await player.send(f"{c['red']}No player named '{args[0]}' is online.{c['reset']}")
-            return
-            
-        await player.send(f"{c['bright_cyan']}You force {target.name} to '{command}'.{c['reset']}")
-        await target.send(f"{c['bright_magenta']}{player.name} forces you to '{command}'.{c['reset']}")
-        
-        # Parse and execute the command
-        parts = command.split()
-        cmd = parts[0].lower()
-        cmd_args = parts[1:] if len(parts) > 1 else []
-        
-        await cls.execute(target, cmd, cmd_args)
-    
-    @classmethod
-    async def cmd_stat(cls, player: 'Player', args: List[str]):
-        """View detailed stats on a player, mob, or object (immortal only).
-        
-        Usage: stat <target>
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-            
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send(f"{c['yellow']}Usage: stat <target>{c['reset']}")
-                return
-            
-        target_name = ' '.join(args).lower()
-        
-        # Try to find a character (player or mob)
-        target = cls._find_target(player, target_name)
-        
-        if target:
-            # Character stats
-            from player import Player
-            from mobs import Mobile
-            
-            char_type = "Player" if isinstance(target, Player) else "Mobile"
-            
-            await player.send(f"{c['bright_cyan']}=== {char_type} Stats: {target.name} ==={c['reset']}")
-            await player.send(f"{c['white']}Level: {target.level}  Class: {getattr(target, 'char_class', 'N/A')}")
-            
-            if isinstance(target, Mobile):
-                await player.send(f"{c['white']}Vnum: {target.vnum}  Keywords: {', '.join(target.keywords)}")
-                await player.send(f"{c['white']}Flags: {', '.join(target.flags) if target.flags else 'none'}")
-                await player.send(f"{c['white']}Special: {target.special or 'none'}")
-                
-            await player.send(f"{c['green']}HP: {target.hp}/{target.max_hp}  Mana: {target.mana}/{target.max_mana}  Move: {target.move}/{target.max_move}")
-            await player.send(f"{c['yellow']}STR: {target.str}  INT: {target.int}  WIS: {target.wis}")
-            await player.send(f"{c['yellow']}DEX: {target.dex}  CON: {target.con}  CHA: {target.cha}")
-            await player.send(f"{c['red']}AC: {target.armor_class}  Hit: {target.hitroll}  Dam: {target.damroll}")
-            await player.send(f"{c['cyan']}Gold: {target.gold}  Exp: {target.exp}  Align: {target.alignment}")
-            
-            if isinstance(target, Mobile):
-                await player.send(f"{c['magenta']}Damage Dice: {target.damage_dice}")
-                
-            if isinstance(target, Player):
-                await player.send(f"{c['white']}Account: {target.account_name or 'None'}  Room: {target.room.vnum if target.room else 'None'}")
-                
-            await player.send(f"{c['cyan']}Position: {target.position}  Fighting: {target.fighting.name if target.fighting else 'No'}")
-            
-            # Equipment
-            if target.equipment:
-                await player.send(f"{c['bright_yellow']}Equipment:{c['reset']}")
-                for slot, item in target.equipment.items():
-                    await player.send(f"  {c['white']}{slot}: {item.short_desc} (vnum {item.vnum})")
-            return
-            
-        # Try to find an object
-        for item in player.room.items + player.inventory:
-            if target_name in item.name.lower():
-                await player.send(f"{c['bright_cyan']}=== Object Stats: {item.name} ==={c['reset']}")
-                await player.send(f"{c['white']}Vnum: {item.vnum}  Type: {item.item_type}")
-                await player.send(f"{c['white']}Short: {item.short_desc}")
-                await player.send(f"{c['white']}Room: {item.room_desc}")
-                await player.send(f"{c['yellow']}Wear Slot: {item.wear_slot or 'None'}  Weight: {item.weight}  Cost: {item.cost}")
-                
-                if item.item_type == 'weapon':
-                    await player.send(f"{c['red']}Damage: {item.damage_dice}  Type: {item.weapon_type}")
-                if item.item_type == 'armor':
-                    await player.send(f"{c['green']}Armor: {item.armor}")
-                if item.affects:
-                    await player.send(f"{c['magenta']}Affects: {item.affects}")
-                if item.flags:
-                    await player.send(f"{c['cyan']}Flags: {', '.join(item.flags)}")
-                return
-                
-        await player.send(f"{c['red']}Nothing by that name found.{c['reset']}")
-    
-    @classmethod
-    async def cmd_set(cls, player: 'Player', args: List[str]):
-        """Set a field on a player or mob (immortal only).
-        
-        Usage: set <target> <field> <value>
-        
-        Fields for characters:
-            level, hp, maxhp, mana, maxmana, move, maxmove
-            str, int, wis, dex, con, cha
-            gold, exp, alignment, hitroll, damroll, ac
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-            
-        if len(args) < 3:
-            await player.send(f"{c['yellow']}Usage: set <target> <field> <value>{c['reset']}")
-            await player.send(f"{c['cyan']}Fields: level, hp, maxhp, mana, maxmana, move, maxmove,")
-            await player.send(f"{c['cyan']}        str, int, wis, dex, con, cha, gold, exp,")
-            await player.send(f"{c['cyan']}        alignment, hitroll, damroll, ac{c['reset']}")
-            return
-            
-        target_name = args[0].lower()
-        field = args[1].lower()
-        try:
-            value = int(args[2])
-        except ValueError:
-            await player.send(f"{c['red']}Value must be a number.{c['reset']}")
-            return
-            
-        # Find target
-        target = cls._find_target(player, target_name)
-        if not target:
-            # Try online players
-            for p in player.world.players.values():
-                if p.name.lower() == target_name:
-                    target = p
-                    break
-                    
-        if not target:
-            await player.send(f"{c['red']}No target named '{args[0]}' found.{c['reset']}")
-            return
-            
-        # Map field names to attributes
-        field_map = {
-            'level': 'level',
-            'hp': 'hp',
-            'maxhp': 'max_hp',
-            'mana': 'mana',
-            'maxmana': 'max_mana',
-            'move': 'move',
-            'maxmove': 'max_move',
-            'str': 'str',
-            'int': 'int',
-            'wis': 'wis',
-            'dex': 'dex',
-            'con': 'con',
-            'cha': 'cha',
-            'gold': 'gold',
-            'exp': 'exp',
-            'alignment': 'alignment',
-            'hitroll': 'hitroll',
-            'damroll': 'damroll',
-            'ac': 'armor_class',
-        }
-        
-        if field not in field_map:
-            await player.send(f"{c['red']}Unknown field '{field}'.{c['reset']}")
-            await player.send(f"{c['cyan']}Valid fields: {', '.join(field_map.keys())}{c['reset']}")
-            return
-            
-        attr = field_map[field]
-        old_value = getattr(target, attr, 0)
-        setattr(target, attr, value)
-        
-        await player.send(f"{c['bright_green']}Set {target.name}'s {field} from {old_value} to {value}.{c['reset']}")
-    
-    @classmethod
-    async def cmd_zreset(cls, player: 'Player', args: List[str]):
-        """Reset (repopulate) a zone (immortal only).
-        
-        Usage: 
-            zreset          - Reset current zone
-            zreset <number> - Reset specific zone
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-            
-        if args:
-            try:
-                zone_num = int(args[0])
-            except ValueError:
-                await player.send(f"{c['red']}Invalid zone number.{c['reset']}")
-                return
-        else:
-            # Get current zone from room vnum
-            if not player.room:
-                await player.send(f"{c['red']}You're not in a room!{c['reset']}")
-                return
-            zone_num = player.room.vnum // 100
-            
-        zone = player.world.zones.get(zone_num)
-        if not zone:
-            await player.send(f"{c['red']}Zone {zone_num} does not exist.{c['reset']}")
-            return
-            
-        # Reset the zone
-        await player.world.reset_zone(zone)
-        await player.send(f"{c['bright_green']}Zone {zone_num} ({zone.name}) has been reset!{c['reset']}")
-    
-    @classmethod
-    async def cmd_backup(cls, player: 'Player', args: List[str]):
-        """Create a backup of game data (immortal only).
-        
-        Usage: backup [players|world|full]
-               backup list
-               backup restore <filename>
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-        
-        import subprocess
-        import sys
-        import re
-        from pathlib import Path
-        
-        script_path = Path(__file__).parent.parent / "scripts" / "backup.py"
-        
-        if not args:
-            args = ['full']
-        
-        mode = args[0].lower()
-        
-        if mode == 'list':
-            await player.send(f"{c['bright_cyan']}=== Available Backups ==={c['reset']}")
-            result = subprocess.run(
-                [sys.executable, str(script_path), '--list'],
-                capture_output=True, text=True
-            )
-            for line in result.stdout.strip().split('\n'):
-                await player.send(f"{c['white']}{line}{c['reset']}")
-            return
-        
-        if mode == 'restore':
-            if len(args) < 2:
-                await player.send(f"{c['red']}Usage: backup restore <filename>{c['reset']}")
-                return
-            filename = args[1]
-
-            # Security: Validate filename to prevent command/argument injection
-            # Only allow alphanumeric, dots, underscores, and hyphens.
-            # Must not start with a hyphen.
-            if not re.match(r'^[a-zA-Z0-9._][a-zA-Z0-9._-]*$', filename):
-                await player.send(f"{c['red']}Invalid backup filename. Only alphanumeric characters, dots, underscores, and hyphens are allowed, and it cannot start with a hyphen.{c['reset']}")
-                return
-
-            await player.send(f"{c['yellow']}Restoring from {filename}...{c['reset']}")
-            result = subprocess.run(
-                [sys.executable, str(script_path), '--restore', filename],
-                capture_output=True, text=True
-            )
-            for line in result.stdout.strip().split('\n'):
-                await player.send(f"{c['white']}{line}{c['reset']}")
-            if result.returncode == 0:
-                await player.send(f"{c['bright_green']}Restore complete! Use 'shutdown reboot' to load changes.{c['reset']}")
-            else:
-                await player.send(f"{c['red']}Restore failed:{c['reset']}")
-                for line in result.stderr.strip().split('\n'):
-                    await player.send(f"{c['red']}{line}{c['reset']}")
-            return
-        
-        # Create backup
-        cmd_args = [sys.executable, str(script_path)]
-        if mode == 'players':
-            cmd_args.append('--players')
-            backup_type = "player data"
-        elif mode == 'world':
-            cmd_args.append('--world')
-            backup_type = "world/zones"
-        else:
-            backup_type = "full"
-        
-        await player.send(f"{c['yellow']}Creating {backup_type} backup...{c['reset']}")
-        
-        result = subprocess.run(cmd_args, capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            # Parse output for summary
-            lines = result.stdout.strip().split('\n')
-            for line in lines[-4:]:  # Show last 4 lines (summary)
-                await player.send(f"{c['bright_green']}{line}{c['reset']}")
-        else:
-            await player.send(f"{c['red']}Backup failed:{c['reset']}")
-            for line in result.stderr.strip().split('\n'):
-                await player.send(f"{c['red']}{line}{c['reset']}")
-    
-    @classmethod
-    async def cmd_shutdown(cls, player: 'Player', args: List[str]):
-        """Shutdown the MUD server (immortal only).
-        
-        Usage: shutdown [now|reboot]
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-            
-        mode = args[0].lower() if args else 'warn'
-        
-        if mode == 'now':
-            # Immediate shutdown
-            await player.send(f"{c['bright_red']}Initiating immediate shutdown...{c['reset']}")
-            for p in player.world.players.values():
-                await p.send(f"{c['bright_red']}*** SHUTDOWN BY {player.name} ***{c['reset']}")
-                p.save()
-            import sys
-            sys.exit(0)
-        elif mode == 'reboot':
-            await player.send(f"{c['bright_yellow']}Initiating reboot...{c['reset']}")
-            for p in player.world.players.values():
-                await p.send(f"{c['bright_yellow']}*** REBOOT BY {player.name} - Please reconnect shortly ***{c['reset']}")
-                p.save()
-            import sys
-            sys.exit(0)
-        else:
-            await player.send(f"{c['yellow']}Shutdown options:{c['reset']}")
-            await player.send(f"{c['white']}  shutdown now    - Immediate shutdown")
-            await player.send(f"{c['white']}  shutdown reboot - Reboot the server")
-    
-    @classmethod
-    async def cmd_immlist(cls, player: 'Player', args: List[str]):
-        """List all immortals (admin accounts).
-        
-        Usage: immlist
-        """
-        c = player.config.COLORS
-        
-        import os
-        from accounts import Account, ACCOUNTS_DIR
-        
-        await player.send(f"{c['bright_cyan']}=== Immortals ==={c['reset']}")
-        
-        if not os.path.exists(ACCOUNTS_DIR):
-            await player.send(f"{c['yellow']}No accounts found.{c['reset']}")
-            return
-            
-        found = False
-        for filename in os.listdir(ACCOUNTS_DIR):
-            if filename.endswith('.json'):
-                account_name = filename[:-5]
-                account = Account.load(account_name)
-                if account and account.is_admin:
-                    found = True
-                    online = any(p.account_name == account_name for p in player.world.players.values())
-                    status = f"{c['bright_green']}[ONLINE]{c['reset']}" if online else f"{c['red']}[OFFLINE]{c['reset']}"
-                    await player.send(f"  {c['white']}{account_name}{c['reset']} {status}")
-                    
-        if not found:
-            await player.send(f"{c['yellow']}No immortals found.{c['reset']}")
-    
-    @classmethod
-    async def cmd_wizhelp(cls, player: 'Player', args: List[str]):
-        """List all immortal commands.
-        
-        Usage: wizhelp
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-            
-        await player.send(f"{c['bright_cyan']}=== Immortal Commands ==={c['reset']}")
-        await player.send(f"{c['yellow']}Loading/Creating:{c['reset']}")
-        await player.send(f"  {c['white']}mload <vnum>         {c['cyan']}- Load a mob into the room")
-        await player.send(f"  {c['white']}oload <vnum> [room]  {c['cyan']}- Load an object (inv or room)")
-        await player.send(f"  {c['white']}load <mob|obj> <vnum>{c['cyan']}- Combined load command")
-        await player.send(f"  {c['white']}purge [target]       {c['cyan']}- Remove mobs/objects from room")
-        await player.send(f"  {c['white']}zreset [zone]        {c['cyan']}- Reset/repopulate a zone")
-        await player.send(f"")
-        await player.send(f"{c['yellow']}Player Management:{c['reset']}")
-        await player.send(f"  {c['white']}restore [player]     {c['cyan']}- Fully heal a player")
-        await player.send(f"  {c['white']}advance <player> <lvl>{c['cyan']}- Set player level")
-        await player.send(f"  {c['white']}transfer <player>    {c['cyan']}- Summon player to you")
-        await player.send(f"  {c['white']}teleport <plr> <room>{c['cyan']}- Send player to room")
-        await player.send(f"  {c['white']}force <player> <cmd> {c['cyan']}- Force player to do command")
-        await player.send(f"  {c['white']}set <tgt> <fld> <val>{c['cyan']}- Modify stats")
-        await player.send(f"  {c['white']}freeze <player>      {c['cyan']}- Toggle player frozen")
-        await player.send(f"  {c['white']}mute <player>        {c['cyan']}- Toggle player muted")
-        await player.send(f"  {c['white']}dc <player>          {c['cyan']}- Disconnect player")
-        await player.send(f"  {c['white']}snoop [player]       {c['cyan']}- Watch what player sees")
-        await player.send(f"")
-        await player.send(f"{c['yellow']}Combat/Control:{c['reset']}")
-        await player.send(f"  {c['white']}slay <target>        {c['cyan']}- Instantly kill a mob")
-        await player.send(f"  {c['white']}peace                {c['cyan']}- Stop all combat in room")
-        await player.send(f"  {c['white']}nohassle             {c['cyan']}- Toggle mob aggro immunity")
-        await player.send(f"")
-        await player.send(f"{c['yellow']}Movement/Location:{c['reset']}")
-        await player.send(f"  {c['white']}goto <vnum/zone>     {c['cyan']}- Teleport to a room")
-        await player.send(f"  {c['white']}at <room> <cmd>      {c['cyan']}- Execute cmd at location")
-        await player.send(f"  {c['white']}wizinvis             {c['cyan']}- Toggle invisibility")
-        await player.send(f"  {c['white']}holylight            {c['cyan']}- See in dark/see invis")
-        await player.send(f"")
-        await player.send(f"{c['yellow']}Communication:{c['reset']}")
-        await player.send(f"  {c['white']}echo <message>       {c['cyan']}- Send msg to room")
-        await player.send(f"  {c['white']}gecho <message>      {c['cyan']}- Send msg to all players")
-        await player.send(f"")
-        await player.send(f"{c['yellow']}Information:{c['reset']}")
-        await player.send(f"  {c['white']}stat <target>        {c['cyan']}- View detailed stats")
-        await player.send(f"  {c['white']}mlist [zone]         {c['cyan']}- List mobs in zone")
-        await player.send(f"  {c['white']}olist [zone]         {c['cyan']}- List objects in zone")
-        await player.send(f"  {c['white']}rlist [zone]         {c['cyan']}- List rooms in zone")
-        await player.send(f"  {c['white']}find <mob|obj> <name>{c['cyan']}- Find mob/obj by name")
-        await player.send(f"  {c['white']}show <zones|players|stats>{c['cyan']}- Show game info")
-        await player.send(f"  {c['white']}invis                {c['cyan']}- List invisible in room")
-        await player.send(f"  {c['white']}immlist              {c['cyan']}- List all immortals")
-        await player.send(f"")
-        await player.send(f"{c['yellow']}Server:{c['reset']}")
-        await player.send(f"  {c['white']}shutdown [now|reboot]{c['cyan']}- Shutdown server")
-    
-    @classmethod
-    def _find_target(cls, player: 'Player', name: str):
-        """Find a character in the room by name or number."""
-        if not player.room:
-            return None
-            
-        name = name.lower()
-        
-        # Check for numbered targeting (e.g., "2.guard")
-        number = 1
-        if '.' in name:
-            parts = name.split('.', 1)
-            try:
-                number = int(parts[0])
-                name = parts[1]
-            except ValueError:
-                pass
-        
-        count = 0
-        for char in player.room.characters:
-            if char == player:
-                continue
-            # Check name
-            char_name = char.name.lower()
-            # Check keywords for mobs
-            keywords = getattr(char, 'keywords', [])
-            
-            if name in char_name or any(name in kw.lower() for kw in keywords):
-                count += 1
-                if count == number:
-                    return char
-        return None
-
-    @classmethod
-    async def cmd_olist(cls, player: 'Player', args: List[str]):
-        """List all objects in a zone (immortal only).
-        
-        Usage:
-            olist           - List objects in current zone
-            olist <zone>    - List objects in specified zone
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-        
-        # Determine zone
-        if args:
-            try:
-                zone_num = int(args[0])
-            except ValueError:
-                await player.send(f"{c['red']}Invalid zone number.{c['reset']}")
-                return
-        else:
-            if not player.room:
-                await player.send(f"{c['red']}You're not in a room!{c['reset']}")
-                return
-            zone_num = player.room.vnum // 100
-        
-        # Get objects in that zone range
-        min_vnum = zone_num * 100
-        max_vnum = min_vnum + 99
-        
-        await player.send(f"{c['bright_cyan']}=== Objects in Zone {zone_num} (vnums {min_vnum}-{max_vnum}) ==={c['reset']}")
-        
-        count = 0
-        for vnum, proto in sorted(player.world.obj_prototypes.items()):
-            if min_vnum <= vnum <= max_vnum:
-                name = proto.get('name', proto.get('short_desc', 'unknown'))
-                obj_type = proto.get('type', 'other')
-                await player.send(f"  {c['yellow']}{vnum:5}{c['reset']} - {c['white']}{name}{c['reset']} ({obj_type})")
-                count += 1
-        
-        if count == 0:
-            await player.send(f"{c['yellow']}No objects defined in this zone.{c['reset']}")
-        else:
-            await player.send(f"{c['cyan']}Total: {count} objects{c['reset']}")
-
-    @classmethod
-    async def cmd_mlist(cls, player: 'Player', args: List[str]):
-        """List all mobs in a zone (immortal only).
-        
-        Usage:
-            mlist           - List mobs in current zone
-            mlist <zone>    - List mobs in specified zone
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-        
-        # Determine zone
-        if args:
-            try:
-                zone_num = int(args[0])
-            except ValueError:
-                await player.send(f"{c['red']}Invalid zone number.{c['reset']}")
-                return
-        else:
-            if not player.room:
-                await player.send(f"{c['red']}You're not in a room!{c['reset']}")
-                return
-            zone_num = player.room.vnum // 100
-        
-        # Get mobs in that zone range
-        min_vnum = zone_num * 100
-        max_vnum = min_vnum + 99
-        
-        await player.send(f"{c['bright_cyan']}=== Mobs in Zone {zone_num} (vnums {min_vnum}-{max_vnum}) ==={c['reset']}")
-        
-        count = 0
-        for vnum, proto in sorted(player.world.mob_prototypes.items()):
-            if min_vnum <= vnum <= max_vnum:
-                name = proto.get('name', proto.get('short_desc', 'unknown'))
-                level = proto.get('level', 1)
-                await player.send(f"  {c['yellow']}{vnum:5}{c['reset']} - [{c['green']}{level:2}{c['reset']}] {c['white']}{name}{c['reset']}")
-                count += 1
-        
-        if count == 0:
-            await player.send(f"{c['yellow']}No mobs defined in this zone.{c['reset']}")
-        else:
-            await player.send(f"{c['cyan']}Total: {count} mobs{c['reset']}")
-
-    @classmethod
-    async def cmd_rlist(cls, player: 'Player', args: List[str]):
-        """List all rooms in a zone (immortal only).
-        
-        Usage:
-            rlist           - List rooms in current zone
-            rlist <zone>    - List rooms in specified zone
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-        
-        # Determine zone
-        if args:
-            try:
-                zone_num = int(args[0])
-            except ValueError:
-                await player.send(f"{c['red']}Invalid zone number.{c['reset']}")
-                return
-        else:
-            if not player.room:
-                await player.send(f"{c['red']}You're not in a room!{c['reset']}")
-                return
-            zone_num = player.room.vnum // 100
-        
-        zone = player.world.zones.get(zone_num)
-        if not zone:
-            await player.send(f"{c['red']}Zone {zone_num} does not exist.{c['reset']}")
-            return
-        
-        await player.send(f"{c['bright_cyan']}=== Rooms in Zone {zone_num}: {zone.name} ==={c['reset']}")
-        
-        count = 0
-        for vnum, room in sorted(zone.rooms.items()):
-            await player.send(f"  {c['yellow']}{vnum:5}{c['reset']} - {c['white']}{room.name}{c['reset']}")
-            count += 1
-        
-        await player.send(f"{c['cyan']}Total: {count} rooms{c['reset']}")
-
-    @classmethod
-    async def cmd_snoop(cls, player: 'Player', args: List[str]):
-        """Watch what another player sees (immortal only).
-        
-        Usage:
-            snoop <player>  - Start snooping on a player
-            snoop           - Stop snooping
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-        
-        if not args:
-            # Stop snooping
-            if hasattr(player, 'snooping') and player.snooping:
-                target = player.snooping
-                player.snooping = None
-                if hasattr(target, 'snooped_by'):
-                    target.snooped_by = None
-                await player.send(f"{c['yellow']}You stop snooping.{c['reset']}")
-            else:
-                await player.send(f"{c['yellow']}You aren't snooping anyone.{c['reset']}")
-            return
-        
-        target_name = args[0].lower()
-        target = None
-        for p in player.world.players.values():
-            if p.name.lower() == target_name:
-                target = p
-                break
-        
-        if not target:
-            await player.send(f"{c['red']}No player named '{args[0]}' is online.{c['reset']}")
-            return
-        
-        if target == player:
-            await player.send(f"{c['red']}You can't snoop yourself!{c['reset']}")
-            return
-        
-        # Stop any current snoop
-        if hasattr(player, 'snooping') and player.snooping:
-            old_target = player.snooping
-            if hasattr(old_target, 'snooped_by'):
-                old_target.snooped_by = None
-        
-        player.snooping = target
-        target.snooped_by = player
-        await player.send(f"{c['bright_cyan']}You begin snooping on {target.name}.{c['reset']}")
-
-    @classmethod
-    async def cmd_at(cls, player: 'Player', args: List[str]):
-        """Execute a command at another location (immortal only).
-        
-        Usage: at <location> <command>
-        
-        Examples:
-            at 3001 look
-            at 3001 mload 3000
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-        
-        if len(args) < 2:
-            await player.send(f"{c['yellow']}Usage: at <room_vnum> <command>{c['reset']}")
-            return
-        
-        try:
-            target_vnum = int(args[0])
-        except ValueError:
-            await player.send(f"{c['red']}Invalid room number.{c['reset']}")
-            return
-        
-        target_room = player.world.rooms.get(target_vnum)
-        if not target_room:
-            await player.send(f"{c['red']}Room {target_vnum} doesn't exist.{c['reset']}")
-            return
-        
-        # Save current location
-        original_room = player.room
-        
-        # Temporarily move to target room (silently)
-        if original_room:
-            original_room.characters.remove(player)
-        player.room = target_room
-        target_room.characters.append(player)
-        
-        # Execute command
-        cmd = args[1].lower()
-        cmd_args = args[2:] if len(args) > 2 else []
-        await cls.execute(player, cmd, cmd_args)
-        
-        # Move back
-        target_room.characters.remove(player)
-        player.room = original_room
-        if original_room:
-            original_room.characters.append(player)
-
-    @classmethod
-    async def cmd_echo(cls, player: 'Player', args: List[str]):
-        """Send a message to the current room (immortal only).
-        
-        Usage: echo <message>
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-        
-        if not args:
-            await player.send(f"{c['yellow']}Usage: echo <message>{c['reset']}")
-            return
-        
-        message = ' '.join(args)
-        await player.room.send_to_room(f"{c['bright_yellow']}{message}{c['reset']}")
-
-    @classmethod
-    async def cmd_gecho(cls, player: 'Player', args: List[str]):
-        """Send a message to all players (immortal only).
-        
-        Usage: gecho <message>
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-        
-        if not args:
-            await player.send(f"{c['yellow']}Usage: gecho <message>{c['reset']}")
-            return
-        
-        message = ' '.join(args)
-        for p in player.world.players.values():
-            await p.send(f"{c['bright_yellow']}{message}{c['reset']}")
-
-    @classmethod
-    async def cmd_teleport(cls, player: 'Player', args: List[str]):
-        """Send a player to a location (immortal only).
-        
-        Usage: teleport <player> <room_vnum>
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-        
-        if len(args) < 2:
-            await player.send(f"{c['yellow']}Usage: teleport <player> <room_vnum>{c['reset']}")
-            return
-        
-        target_name = args[0].lower()
-        try:
-            target_vnum = int(args[1])
-        except ValueError:
-            await player.send(f"{c['red']}Invalid room number.{c['reset']}")
-            return
-        
-        # Find player
-        target = None
-        for p in player.world.players.values():
-            if p.name.lower() == target_name:
-                target = p
-                break
-        
-        if not target:
-            await player.send(f"{c['red']}No player named '{args[0]}' is online.{c['reset']}")
-            return
-        
-        # Find room
-        target_room = player.world.rooms.get(target_vnum)
-        if not target_room:
-            await player.send(f"{c['red']}Room {target_vnum} doesn't exist.{c['reset']}")
-            return
-        
-        # Teleport them
-        old_room = target.room
-        if old_room:
-            await old_room.send_to_room(
-                f"{c['bright_magenta']}{target.name} disappears in a flash of light!{c['reset']}",
-                exclude=[target]
-            )
-            old_room.characters.remove(target)
-        
-        target.room = target_room
-        target_room.characters.append(target)
-        
-        await target.send(f"{c['bright_magenta']}You feel yourself yanked through space!{c['reset']}")
-        await target_room.show_to(target)
-        await target_room.send_to_room(
-            f"{c['bright_magenta']}{target.name} appears in a flash of light!{c['reset']}",
-            exclude=[target]
-        )
-        
-        await player.send(f"{c['bright_green']}You teleport {target.name} to room {target_vnum}.{c['reset']}")
-
-    @classmethod
-    async def cmd_freeze(cls, player: 'Player', args: List[str]):
-        """Freeze a player so they can't do anything (immortal only).
-        
-        Usage: freeze <player>
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-        
-        if not args:
-            await player.send(f"{c['yellow']}Usage: freeze <player>{c['reset']}")
-            return
-        
-        target_name = args[0].lower()
-        target = None
-        for p in player.world.players.values():
-            if p.name.lower() == target_name:
-                target = p
-                break
-        
-        if not target:
-            await player.send(f"{c['red']}No player named '{args[0]}' is online.{c['reset']}")
-            return
-        
-        if not hasattr(target, 'frozen'):
-            target.frozen = False
-        
-        target.frozen = not target.frozen
-        
-        if target.frozen:
-            await player.send(f"{c['bright_cyan']}You freeze {target.name} in place!{c['reset']}")
-            await target.send(f"{c['bright_cyan']}You have been frozen by {player.name}!{c['reset']}")
-        else:
-            await player.send(f"{c['bright_green']}You unfreeze {target.name}.{c['reset']}")
-            await target.send(f"{c['bright_green']}You have been unfrozen.{c['reset']}")
-
-    @classmethod
-    async def cmd_mute(cls, player: 'Player', args: List[str]):
-        """Mute a player so they can't talk (immortal only).
-        
-        Usage: mute <player>
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-        
-        if not args:
-            await player.send(f"{c['yellow']}Usage: mute <player>{c['reset']}")
-            return
-        
-        target_name = args[0].lower()
-        target = None
-        for p in player.world.players.values():
-            if p.name.lower() == target_name:
-                target = p
-                break
-        
-        if not target:
-            await player.send(f"{c['red']}No player named '{args[0]}' is online.{c['reset']}")
-            return
-        
-        if not hasattr(target, 'muted'):
-            target.muted = False
-        
-        target.muted = not target.muted
-        
-        if target.muted:
-            await player.send(f"{c['bright_cyan']}You mute {target.name}!{c['reset']}")
-            await target.send(f"{c['bright_cyan']}You have been muted by {player.name}!{c['reset']}")
-        else:
-            await player.send(f"{c['bright_green']}You unmute {target.name}.{c['reset']}")
-            await target.send(f"{c['bright_green']}You have been unmuted.{c['reset']}")
-
-    @classmethod
-    async def cmd_dc(cls, player: 'Player', args: List[str]):
-        """Disconnect a player (immortal only).
-        
-        Usage: dc <player>
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-        
-        if not args:
-            await player.send(f"{c['yellow']}Usage: dc <player>{c['reset']}")
-            return
-        
-        target_name = args[0].lower()
-        target = None
-        for p in player.world.players.values():
-            if p.name.lower() == target_name:
-                target = p
-                break
-        
-        if not target:
-            await player.send(f"{c['red']}No player named '{args[0]}' is online.{c['reset']}")
-            return
-        
-        if target == player:
-            await player.send(f"{c['red']}You can't disconnect yourself!{c['reset']}")
-            return
-        
-        await target.send(f"{c['bright_red']}You have been disconnected by {player.name}.{c['reset']}")
-        if target.connection:
-            await target.connection.disconnect()
-        
-        await player.send(f"{c['bright_green']}You disconnect {target.name}.{c['reset']}")
-
-    @classmethod
-    async def cmd_invis(cls, player: 'Player', args: List[str]):
-        """List all invisible players/mobs in room (immortal only).
-        
-        Usage: invis
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-        
-        await player.send(f"{c['bright_cyan']}=== Invisible Entities ==={c['reset']}")
-        
-        found = False
-        for char in player.room.characters:
-            is_invis = 'invisible' in getattr(char, 'affect_flags', set())
-            is_hidden = getattr(char, 'hidden', False)
-            is_wizinvis = getattr(char, 'wizinvis', False)
-            
-            if is_invis or is_hidden or is_wizinvis:
-                found = True
-                flags = []
-                if is_invis:
-                    flags.append('invisible')
-                if is_hidden:
-                    flags.append('hidden')
-                if is_wizinvis:
-                    flags.append('wizinvis')
-                await player.send(f"  {c['white']}{char.name}{c['reset']} ({', '.join(flags)})")
-        
-        if not found:
-            await player.send(f"{c['yellow']}No invisible entities in this room.{c['reset']}")
-
-    @classmethod
-    async def cmd_holylight(cls, player: 'Player', args: List[str]):
-        """Toggle ability to see everything (dark rooms, invisible, etc) (immortal only).
-        
-        Usage: holylight
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-        
-        if not hasattr(player, 'holylight'):
-            player.holylight = False
-        
-        player.holylight = not player.holylight
-        
-        if player.holylight:
-            await player.send(f"{c['bright_yellow']}Holy light activated! You can see all.{c['reset']}")
-        else:
-            await player.send(f"{c['yellow']}Holy light deactivated.{c['reset']}")
-
-    @classmethod
-    async def cmd_nohassle(cls, player: 'Player', args: List[str]):
-        """Toggle immunity to mob attacks (immortal only).
-        
-        Usage: nohassle
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-        
-        if not hasattr(player, 'nohassle'):
-            player.nohassle = False
-        
-        player.nohassle = not player.nohassle
-        
-        if player.nohassle:
-            await player.send(f"{c['bright_green']}Nohassle activated! Mobs will ignore you.{c['reset']}")
-        else:
-            await player.send(f"{c['yellow']}Nohassle deactivated.{c['reset']}")
-
-    @classmethod
-    async def cmd_show(cls, player: 'Player', args: List[str]):
-        """Show various game statistics (immortal only).
-        
-        Usage:
-            show zones    - List all zones
-            show players  - List all online players with details
-            show stats    - Show server statistics
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-        
-        if not args:
-            await player.send(f"{c['yellow']}Usage: show <zones|players|stats>{c['reset']}")
-            return
-        
-        sub = args[0].lower()
-        
-        if sub == 'zones':
-            await player.send(f"{c['bright_cyan']}=== All Zones ==={c['reset']}")
-            for zone_num, zone in sorted(player.world.zones.items()):
-                room_count = len(zone.rooms)
-                await player.send(f"  {c['yellow']}{zone_num:3}{c['reset']} - {c['white']}{zone.name}{c['reset']} ({room_count} rooms)")
-        
-        elif sub == 'players':
-            await player.send(f"{c['bright_cyan']}=== Online Players ==={c['reset']}")
-            for p in player.world.players.values():
-                room_vnum = p.room.vnum if p.room else 'None'
-                flags = []
-                if getattr(p, 'frozen', False):
-                    flags.append('FROZEN')
-                if getattr(p, 'muted', False):
-                    flags.append('MUTED')
-                if getattr(p, 'wizinvis', False):
-                    flags.append('WIZINVIS')
-                flag_str = f" [{', '.join(flags)}]" if flags else ""
-                await player.send(f"  {c['white']}{p.name}{c['reset']} [{p.level} {p.char_class}] Room: {room_vnum}{flag_str}")
-        
-        elif sub == 'stats':
-            await player.send(f"{c['bright_cyan']}=== Server Statistics ==={c['reset']}")
-            await player.send(f"  {c['white']}Zones:{c['reset']} {len(player.world.zones)}")
-            await player.send(f"  {c['white']}Rooms:{c['reset']} {len(player.world.rooms)}")
-            await player.send(f"  {c['white']}Mob Prototypes:{c['reset']} {len(player.world.mob_prototypes)}")
-            await player.send(f"  {c['white']}Object Prototypes:{c['reset']} {len(player.world.obj_prototypes)}")
-            await player.send(f"  {c['white']}Online Players:{c['reset']} {len(player.world.players)}")
-            await player.send(f"  {c['white']}Active NPCs:{c['reset']} {len(player.world.npcs)}")
-        
-        else:
-            await player.send(f"{c['yellow']}Unknown option. Try: zones, players, stats{c['reset']}")
-
-    @classmethod
-    async def cmd_find(cls, player: 'Player', args: List[str]):
-        """Find a mob or object anywhere in the world (immortal only).
-        
-        Usage:
-            find mob <name>    - Find all mobs matching name
-            find obj <name>    - Find all objects matching name
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-        
-        if len(args) < 2:
-            await player.send(f"{c['yellow']}Usage: find <mob|obj> <name>{c['reset']}")
-            return
-        
-        search_type = args[0].lower()
-        search_name = ' '.join(args[1:]).lower()
-        
-        if search_type in ('mob', 'm'):
-            await player.send(f"{c['bright_cyan']}=== Mobs matching '{search_name}' ==={c['reset']}")
-            count = 0
-            # Search prototypes
-            for vnum, proto in player.world.mob_prototypes.items():
-                name = proto.get('name', '').lower()
-                if search_name in name:
-                    await player.send(f"  {c['yellow']}[{vnum}]{c['reset']} {c['white']}{proto.get('name')}{c['reset']} (prototype)")
-                    count += 1
-            # Search active mobs
-            for mob in player.world.npcs:
-                if search_name in mob.name.lower():
-                    room_vnum = mob.room.vnum if mob.room else 'None'
-                    await player.send(f"  {c['green']}[{mob.vnum}]{c['reset']} {c['white']}{mob.name}{c['reset']} @ room {room_vnum}")
-                    count += 1
-            await player.send(f"{c['cyan']}Found {count} matches.{c['reset']}")
-        
-        elif search_type in ('obj', 'o', 'object'):
-            await player.send(f"{c['bright_cyan']}=== Objects matching '{search_name}' ==={c['reset']}")
-            count = 0
-            # Search prototypes
-            for vnum, proto in player.world.obj_prototypes.items():
-                name = proto.get('name', proto.get('short_desc', '')).lower()
-                if search_name in name:
-                    await player.send(f"  {c['yellow']}[{vnum}]{c['reset']} {c['white']}{proto.get('name', proto.get('short_desc'))}{c['reset']} (prototype)")
-                    count += 1
-            await player.send(f"{c['cyan']}Found {count} matches.{c['reset']}")
-        
-        else:
-            await player.send(f"{c['yellow']}Usage: find <mob|obj> <name>{c['reset']}")
-
-    @classmethod
-    async def cmd_load(cls, player: 'Player', args: List[str]):
-        """Load a mob or object (immortal only).
-        
-        Usage:
-            load mob <vnum>       - Load a mob
-            load obj <vnum>       - Load an object to inventory
-            load obj <vnum> room  - Load an object to room
-        """
-        c = player.config.COLORS
-        
-        if not player.is_immortal:
-            await player.send(f"{c['red']}You do not have the power to do that.{c['reset']}")
-            return
-        
-        if len(args) < 2:
-            await player.send(f"{c['yellow']}Usage: load <mob|obj> <vnum>{c['reset']}")
-            return
-        
-        load_type = args[0].lower()
-        
-        if load_type in ('mob', 'm'):
-            await cls.cmd_mload(player, args[1:])
-        elif load_type in ('obj', 'o', 'object'):
-            await cls.cmd_oload(player, args[1:])
-        else:
-            await player.send(f"{c['yellow']}Usage: load <mob|obj> <vnum>{c['reset']}")
-
-
-    # ==================== TALENT ABILITIES (NEW) ====================
-
-    @classmethod
-    async def cmd_shield_bash(cls, player: 'Player', args: List[str]):
-        """Stun and interrupt with your shield."""
-        c = player.config.COLORS
-        if 'shield_bash' not in player.skills:
-            await player.send(f"{c['red']}You don't know Shield Bash.{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['yellow']}You must be fighting to Shield Bash.{c['reset']}")
-            return
-        shield = player.equipment.get('shield') if hasattr(player, 'equipment') else None
-        if not shield:
-            await player.send(f"{c['red']}You need a shield to use Shield Bash.{c['reset']}")
-            return
-        target = player.fighting
-        from affects import AffectManager
-        import random
-        damage = random.randint(5, 12) + player.level
-        await player.send(f"{c['bright_green']}You smash {target.name} with your shield! [{damage}]{c['reset']}")
-        await target.take_damage(damage, player)
-        # Stun for 1 round
-        AffectManager.apply_affect(target, {
-            'name': 'shield_bash',
-            'type': AffectManager.TYPE_FLAG,
-            'applies_to': 'stunned',
-            'value': 1,
-            'duration': 2,
-            'caster_level': player.level
-        })
-
-    @classmethod
-    async def cmd_shield_wall(cls, player: 'Player', args: List[str]):
-        """Shield Wall — Chain ability (🟡). Reduce damage taken by 50% for 10s. 120s CD."""
-        c = player.config.COLORS
-        await player.send(f"{c['yellow']}Shield Wall has been replaced by the Warrior Doctrine system.{c['reset']}")
-        await player.send(f"{c['white']}Use strike, bash, cleave, charge, rally, execute. Type 'doctrine' for details.{c['reset']}")
-
-    @classmethod
-    async def cmd_avatar_of_war(cls, player: 'Player', args: List[str]):
-        """Massive offensive burst."""
-        c = player.config.COLORS
-        if 'avatar_of_war' not in player.skills:
-            await player.send(f"{c['red']}You don't know Avatar of War.{c['reset']}")
-            return
-        from affects import AffectManager
-        AffectManager.apply_affect(player, {'name': 'avatar_of_war', 'type': AffectManager.TYPE_MODIFY_STAT,
-                                            'applies_to': 'damroll', 'value': 8, 'duration': 6, 'caster_level': player.level})
-        AffectManager.apply_affect(player, {'name': 'avatar_of_war', 'type': AffectManager.TYPE_MODIFY_STAT,
-                                            'applies_to': 'hitroll', 'value': 6, 'duration': 6, 'caster_level': player.level})
-        AffectManager.apply_affect(player, {'name': 'avatar_of_war', 'type': AffectManager.TYPE_FLAG,
-                                            'applies_to': 'haste', 'value': 1, 'duration': 6, 'caster_level': player.level})
-        await player.send(f"{c['bright_red']}You become an Avatar of War!{c['reset']}")
-
-    @classmethod
-    async def cmd_mortal_strike(cls, player: 'Player', args: List[str]):
-        """Deals 2.5x weapon damage + reduces target healing by 50%. Costs 40 Rage. 12s CD."""
-        c = player.config.COLORS
-        import time, random
-
-        if player.char_class.lower() != 'warrior':
-            await player.send(f"{c['red']}Only warriors can use Mortal Strike!{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['yellow']}You must be fighting to use Mortal Strike.{c['reset']}")
-            return
-
-        now = time.time()
-        cd = getattr(player, 'mortal_strike_cooldown', 0)
-        if now < cd:
-            await player.send(f"{c['yellow']}Mortal Strike on cooldown ({int(cd - now)}s).{c['reset']}")
-            return
-        if player.rage < 40:
-            await player.send(f"{c['red']}You need 40 Rage! (Current: {player.rage}){c['reset']}")
-            return
-
-        target = player.fighting
-        player.rage -= 40
-        player.mortal_strike_cooldown = now + 12
-
-        weapon = player.equipment.get('wield')
-        if weapon and hasattr(weapon, 'damage_dice'):
-            from combat import CombatHandler
-            base_damage = CombatHandler.roll_dice(weapon.damage_dice)
-        else:
-            base_damage = random.randint(2, 8)
-
-        multiplier = 2.5
-        try:
-            from talents import TalentManager
-            multiplier += TalentManager.get_talent_rank(player, 'mortal_strike_mastery') * 0.03 * 2.5
-        except Exception:
-            pass
-
-        damage = int(base_damage * multiplier) + player.get_damage_bonus() * 2
-        damage = max(1, damage)
-
-        # Apply healing reduction debuff
-        from affects import AffectManager
-        AffectManager.apply_affect(target, {
-            'name': 'mortal_wound',
-            'type': AffectManager.TYPE_MODIFY_STAT,
-            'applies_to': 'heal_reduction',
-            'value': 50,
-            'duration': 5,
-            'caster_level': player.level
-        })
-
-        await player.send(f"{c['bright_red']}You cleave {target.name} with a MORTAL STRIKE! [{damage}]{c['reset']}")
-        await player.send(f"{c['yellow']}{target.name}'s healing is reduced by 50%!{c['reset']}")
-        if hasattr(target, 'send'):
-            await target.send(f"{c['bright_red']}{player.name} strikes you with a mortal wound! [{damage}]{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name} delivers a mortal strike to {target.name}!", exclude=[player, target])
-
-        killed = await target.take_damage(damage, player)
-        if killed:
-            from combat import CombatHandler
-            await CombatHandler.handle_death(player, target)
-
-    @classmethod
-    async def cmd_bladestorm(cls, player: 'Player', args: List[str]):
-        """Bladestorm — Finisher (🔴). AoE. Hit all enemies for weapon damage × chain count. 60s CD."""
-        c = player.config.COLORS
-        await player.send(f"{c['yellow']}Bladestorm has been replaced by the Warrior Doctrine system.{c['reset']}")
-        await player.send(f"{c['white']}Use strike, bash, cleave, charge, rally, execute. Type 'doctrine' for details.{c['reset']}")
-
-    @classmethod
-    async def cmd_rend(cls, player: 'Player', args: List[str]):
-        """Rend — Chain ability (🟡). Apply bleed DoT. 8s CD."""
-        c = player.config.COLORS
-        await player.send(f"{c['yellow']}Rend has been replaced by the Warrior Doctrine system.{c['reset']}")
-        await player.send(f"{c['white']}Use strike, bash, cleave, charge, rally, execute. Type 'doctrine' for details.{c['reset']}")
-
-    @classmethod
-    async def cmd_sunder_armor(cls, player: 'Player', args: List[str]):
-        """Reduce target armor temporarily."""
-        c = player.config.COLORS
-        if 'sunder_armor' not in player.skills:
-            await player.send(f"{c['red']}You don't know Sunder Armor.{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['yellow']}You must be fighting to Sunder.{c['reset']}")
-            return
-        target = player.fighting
-        from affects import AffectManager
-        AffectManager.apply_affect(target, {
-            'name': 'sunder_armor',
-            'type': AffectManager.TYPE_MODIFY_STAT,
-            'applies_to': 'armor_class',
-            'value': 20,
-            'duration': 4,
-            'caster_level': player.level
-        })
-        await player.send(f"{c['yellow']}You sunder {target.name}'s armor!{c['reset']}")
-
-    @classmethod
-    async def cmd_charge(cls, player: 'Player', args: List[str]):
-        """Charge — Rush to target for warriors."""
-        c = player.config.COLORS
-        if player.char_class.lower() != 'warrior':
-            await player.send(f"{c['red']}Only warriors can charge!{c['reset']}")
-            return
-        from warrior_abilities import do_charge
-        await do_charge(player, args)
-
-    @classmethod
-    async def cmd_shield_slam(cls, player: 'Player', args: List[str]):
-        """Shield Slam — Opener (🟢). Requires shield. Deals weapon damage + shield armor. 10s CD."""
-        c = player.config.COLORS
-        await player.send(f"{c['yellow']}Shield Slam has been replaced by the Warrior Doctrine system.{c['reset']}")
-        await player.send(f"{c['white']}Use strike, bash, cleave, charge, rally, execute. Type 'doctrine' for details.{c['reset']}")
-
-    @classmethod
-    async def cmd_hamstring(cls, player: 'Player', args: List[str]):
-        """Hamstring — Chain ability (🟡). Slow target + 0.75x weapon damage. 6s CD."""
-        c = player.config.COLORS
-        await player.send(f"{c['yellow']}Hamstring has been replaced by the Warrior Doctrine system.{c['reset']}")
-        await player.send(f"{c['white']}Use strike, bash, cleave, charge, rally, execute. Type 'doctrine' for details.{c['reset']}")
-
-    @classmethod
-    async def cmd_devastating_blow(cls, player: 'Player', args: List[str]):
-        """Devastating Blow — Finisher (🔴). 3x weapon damage + stun. At chain 4+: 4x + stun 2 rounds. 20s CD."""
-        c = player.config.COLORS
-        await player.send(f"{c['yellow']}Devastating Blow has been replaced by the Warrior Doctrine system.{c['reset']}")
-        await player.send(f"{c['white']}Use strike, bash, cleave, charge, rally, execute. Type 'doctrine' for details.{c['reset']}")
-
-    @classmethod
-    async def cmd_overpower(cls, player: 'Player', args: List[str]):
-        """Quick counterattack."""
-        c = player.config.COLORS
-        if 'overpower' not in player.skills:
-            await player.send(f"{c['red']}You don't know Overpower.{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['yellow']}You must be fighting to Overpower.{c['reset']}")
-            return
-        target = player.fighting
-        import random
-        damage = random.randint(6, 12) + player.level // 2
-        await player.send(f"{c['bright_yellow']}You overpower {target.name}! [{damage}]{c['reset']}")
-        await target.take_damage(damage, player)
-
-    # ----- Thief talent skills -----
-    @classmethod
-    async def cmd_cold_blood(cls, player: 'Player', args: List[str]):
-        """Guarantee your next attack crits."""
-        c = player.config.COLORS
-        if 'cold_blood' not in player.skills:
-            await player.send(f"{c['red']}You don't know Cold Blood.{c['reset']}")
-            return
-        player.cold_blood = True
-        await player.send(f"{c['cyan']}Your next attack will critically strike.{c['reset']}")
-
-    @classmethod
-    async def cmd_mutilate(cls, player: 'Player', args: List[str]):
-        """Dual strike that builds combo points."""
-        c = player.config.COLORS
-        if 'mutilate' not in player.skills:
-            await player.send(f"{c['red']}You don't know Mutilate.{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['yellow']}You must be fighting to Mutilate.{c['reset']}")
-            return
-        target = player.fighting
-        import random
-        damage = random.randint(8, 14) + player.level
-        await player.send(f"{c['bright_red']}You mutilate {target.name}! [{damage}]{c['reset']}")
-        await target.take_damage(damage, player)
-        if hasattr(player, 'combo_points'):
-            player.combo_points = min(5, player.combo_points + 2)
-            player.combo_target = target
-
-    @classmethod
-    async def cmd_vendetta(cls, player: 'Player', args: List[str]):
-        """Mark target to take extra damage from you."""
-        c = player.config.COLORS
-        # Assassins with vendetta_assassin get the upgraded version
-        if 'vendetta_assassin' in player.skills:
-            await cls.cmd_vendetta_assassin(player, args)
-            return
-        if 'vendetta' not in player.skills:
-            await player.send(f"{c['red']}You don't know Vendetta.{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['yellow']}You must be fighting to Vendetta.{c['reset']}")
-            return
-        target = player.fighting
-        target.vendetta_from = player
-        target.vendetta_ticks = 6
-        await player.send(f"{c['magenta']}You mark {target.name} for Vendetta!{c['reset']}")
-
-    @classmethod
-    async def cmd_adrenaline_rush(cls, player: 'Player', args: List[str]):
-        """Burst of speed."""
-        c = player.config.COLORS
-        if 'adrenaline_rush' not in player.skills:
-            await player.send(f"{c['red']}You don't know Adrenaline Rush.{c['reset']}")
-            return
-        from affects import AffectManager
-        AffectManager.apply_affect(player, {'name': 'adrenaline_rush', 'type': AffectManager.TYPE_FLAG,
-                                            'applies_to': 'haste', 'value': 1, 'duration': 6, 'caster_level': player.level})
-        await player.send(f"{c['bright_green']}Adrenaline surges through you!{c['reset']}")
-
-    @classmethod
-    async def cmd_killing_spree(cls, player: 'Player', args: List[str]):
-        """Rapidly strike multiple enemies."""
-        c = player.config.COLORS
-        if 'killing_spree' not in player.skills:
-            await player.send(f"{c['red']}You don't know Killing Spree.{c['reset']}")
-            return
-        from mobs import Mobile
-        import random
-        targets = [m for m in player.room.characters if isinstance(m, Mobile) and m.hp > 0]
-        if not targets:
-            await player.send(f"{c['yellow']}No enemies to strike.{c['reset']}")
-            return
-        await player.send(f"{c['bright_red']}You go on a Killing Spree!{c['reset']}")
-        for target in targets[:4]:
-            dmg = random.randint(6, 10) + player.level
-            await target.take_damage(dmg, player)
-            await player.send(f"{c['red']}  → {target.name} takes {dmg} damage!{c['reset']}")
-
-    @classmethod
-    async def cmd_preparation(cls, player: 'Player', args: List[str]):
-        """Reset major cooldowns."""
-        c = player.config.COLORS
-        if 'preparation' not in player.skills:
-            await player.send(f"{c['red']}You don't know Preparation.{c['reset']}")
-            return
-        # simple reset: clear last skill timestamps if present
-        for attr in ['last_shadowstep', 'last_ambush', 'last_backstab']:
-            if hasattr(player, attr):
-                setattr(player, attr, 0)
-        await player.send(f"{c['cyan']}You feel prepared for another strike.{c['reset']}")
-
-    @classmethod
-    async def cmd_shadowstep_talent(cls, player: 'Player', args: List[str]):
-        """Step through shadows behind target (talent version, thief)."""
-        c = player.config.COLORS
-        if 'shadowstep' not in player.skills:
-            await player.send(f"{c['red']}You don't know Shadowstep.{c['reset']}")
-            return
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send(f"{c['yellow']}Shadowstep whom?{c['reset']}")
-                return
-        target = player.find_target_in_room(' '.join(args))
-        if not target:
-            await player.send(f"{c['red']}They aren't here.{c['reset']}")
-            return
-        player.flags.add('hidden')
-        await player.send(f"{c['magenta']}You blur through shadows behind {target.name}.{c['reset']}")
-
-    @classmethod
-    async def cmd_shadow_dance(cls, player: 'Player', args: List[str]):
-        """Use stealth abilities in combat for a short time."""
-        c = player.config.COLORS
-        if 'shadow_dance' not in player.skills:
-            await player.send(f"{c['red']}You don't know Shadow Dance.{c['reset']}")
-            return
-        player.shadow_dance_ticks = 6
-        await player.send(f"{c['magenta']}You slip into a Shadow Dance.{c['reset']}")
-
-    @classmethod
-    async def cmd_blade_dance(cls, player: 'Player', args: List[str]):
-        """Spin striking nearby enemies."""
-        c = player.config.COLORS
-        if 'blade_dance' not in player.skills:
-            await player.send(f"{c['red']}You don't know Blade Dance.{c['reset']}")
-            return
-        from mobs import Mobile
-        import random
-        targets = [m for m in player.room.characters if isinstance(m, Mobile) and m.hp > 0]
-        if not targets:
-            await player.send(f"{c['yellow']}No enemies to strike.{c['reset']}")
-            return
-        await player.send(f"{c['bright_red']}You whirl in a Blade Dance!{c['reset']}")
-        for target in targets:
-            dmg = random.randint(4, 8) + player.level // 2
-            await target.take_damage(dmg, player)
-
-    @classmethod
-    async def cmd_slip_away(cls, player: 'Player', args: List[str]):
-        """Enter stealth after a dodge."""
-        c = player.config.COLORS
-        if 'slip_away' not in player.skills:
-            await player.send(f"{c['red']}You don't know Slip Away.{c['reset']}")
-            return
-        player.flags.add('hidden')
-        await player.send(f"{c['cyan']}You slip into the shadows.{c['reset']}")
-
-    # ----- Ranger talent skills -----
-    @classmethod
-    async def cmd_bestial_wrath(cls, player: 'Player', args: List[str]):
-        """Enrage your pet."""
-        c = player.config.COLORS
-        if 'bestial_wrath' not in player.skills:
-            await player.send(f"{c['red']}You don't know Bestial Wrath.{c['reset']}")
-            return
-        from pets import PetManager
-        pets = PetManager.get_player_pets(player)
-        if not pets:
-            await player.send(f"{c['yellow']}You have no pet to empower.{c['reset']}")
-            return
-        for pet in pets:
-            pet.bestial_wrath = 5
-        await player.send(f"{c['bright_green']}Your pet enters a bestial rage!{c['reset']}")
-
-    @classmethod
-    async def cmd_stampede(cls, player: 'Player', args: List[str]):
-        """Command all pets to attack."""
-        c = player.config.COLORS
-        if 'stampede' not in player.skills:
-            await player.send(f"{c['red']}You don't know Stampede.{c['reset']}")
-            return
-        from pets import PetManager
-        pets = PetManager.get_player_pets(player)
-        if not pets:
-            await player.send(f"{c['yellow']}You have no pets to stampede.{c['reset']}")
-            return
-        await player.send(f"{c['bright_green']}You unleash a stampede of companions!{c['reset']}")
-        for pet in pets:
-            pet.ai_state['aggressive'] = True
-
-    @classmethod
-    async def cmd_aimed_shot(cls, player: 'Player', args: List[str]):
-        """2.5x weapon damage, guaranteed hit. Costs 30 Focus. 12s CD. Ranger only."""
-        c = player.config.COLORS
-        import time, random
-
-        if player.char_class.lower() != 'ranger':
-            await player.send(f"{c['red']}Only rangers can use Aimed Shot!{c['reset']}")
-            return
-
-        now = time.time()
-        cd = getattr(player, 'aimed_shot_cooldown', 0)
-        if now < cd:
-            await player.send(f"{c['yellow']}Aimed Shot on cooldown ({int(cd - now)}s).{c['reset']}")
-            return
-
-        focus_cost = 30
-        if getattr(player, 'focus', 0) >= 100:
-            focus_cost = 15  # 50% discount at max focus
-
-        if getattr(player, 'focus', 0) < focus_cost:
-            await player.send(f"{c['red']}You need {focus_cost} Focus! (Current: {player.focus}){c['reset']}")
-            return
-
-        target = None
-        if args:
-            target = player.find_target_in_room(' '.join(args))
-        elif player.is_fighting:
-            target = player.fighting
-        if not target:
-            await player.send(f"{c['yellow']}Aimed Shot at whom?{c['reset']}")
-            return
-
-        player.focus -= focus_cost
-        player.aimed_shot_cooldown = now + 12
-
-        weapon = player.equipment.get('wield')
-        if weapon and hasattr(weapon, 'damage_dice'):
-            from combat import CombatHandler
-            base_damage = CombatHandler.roll_dice(weapon.damage_dice)
-        else:
-            base_damage = random.randint(4, 12)
-
-        multiplier = 2.5
-        try:
-            from talents import TalentManager
-            multiplier += TalentManager.get_talent_rank(player, 'careful_aim') * 0.03 * 2.5
-        except Exception:
-            pass
-
-        # Hunter's mark bonus
-        if getattr(player, 'hunters_mark_target', None) == target:
-            multiplier *= 1.10
-
-        damage = int(base_damage * multiplier) + player.get_damage_bonus() * 2
-        damage = max(1, damage)
-
-        await player.send(f"{c['bright_green']}🏹 You fire a perfectly aimed shot at {target.name}! [{damage}]{c['reset']}")
-        if hasattr(target, 'send'):
-            await target.send(f"{c['red']}{player.name} fires a devastating aimed shot at you! [{damage}]{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name} fires a precise aimed shot at {target.name}!", exclude=[player, target])
-
-        killed = await target.take_damage(damage, player)
-        if killed:
-            from combat import CombatHandler
-            await CombatHandler.handle_death(player, target)
-        if not player.is_fighting and not killed:
-            from combat import CombatHandler
-            await CombatHandler.start_combat(player, target)
-
-    @classmethod
-    async def cmd_explosive_trap(cls, player: 'Player', args: List[str]):
-        """Set an explosive trap in the room."""
-        c = player.config.COLORS
-        if 'explosive_trap' not in player.skills:
-            await player.send(f"{c['red']}You don't know Explosive Trap.{c['reset']}")
-            return
-        player.room.trap_explosive = 5
-        await player.send(f"{c['yellow']}You set an explosive trap.{c['reset']}")
-
-    @classmethod
-    async def cmd_black_arrow(cls, player: 'Player', args: List[str]):
-        """Poisoned arrow dealing damage over time."""
-        c = player.config.COLORS
-        if 'black_arrow' not in player.skills:
-            await player.send(f"{c['red']}You don't know Black Arrow.{c['reset']}")
-            return
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send(f"{c['yellow']}Black Arrow at whom?{c['reset']}")
-                return
-        target = player.find_target_in_room(' '.join(args))
-        if not target:
-            await player.send(f"{c['red']}Target not found.{c['reset']}")
-            return
-        from affects import AffectManager
-        AffectManager.apply_affect(target, {'name': 'black_arrow', 'type': AffectManager.TYPE_DOT,
-                                            'applies_to': 'hp', 'value': 6, 'duration': 4,
-                                            'caster_level': player.level})
-        await player.send(f"{c['green']}You fire a black arrow into {target.name}!{c['reset']}")
-
-    @classmethod
-    async def cmd_wyvern_sting(cls, player: 'Player', args: List[str]):
-        """Put target to sleep briefly."""
-        c = player.config.COLORS
-        if 'wyvern_sting' not in player.skills:
-            await player.send(f"{c['red']}You don't know Wyvern Sting.{c['reset']}")
-            return
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send(f"{c['yellow']}Wyvern sting whom?{c['reset']}")
-                return
-        target = player.find_target_in_room(' '.join(args))
-        if not target:
-            await player.send(f"{c['red']}Target not found.{c['reset']}")
-            return
-        from affects import AffectManager
-        AffectManager.apply_affect(target, {'name': 'wyvern_sting', 'type': AffectManager.TYPE_FLAG,
-                                            'applies_to': 'sleeping', 'value': 1, 'duration': 3,
-                                            'caster_level': player.level})
-        await player.send(f"{c['cyan']}{target.name} is lulled into sleep!{c['reset']}")
-
-    @classmethod
-    async def cmd_predators_mark(cls, player: 'Player', args: List[str]):
-        """Mark a target for increased damage and tracking."""
-        c = player.config.COLORS
-        if 'predators_mark' not in player.skills:
-            await player.send(f"{c['red']}You don't know Predator's Mark.{c['reset']}")
-            return
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send(f"{c['yellow']}Mark whom?{c['reset']}")
-                return
-        target = player.find_target_in_room(' '.join(args))
-        if not target:
-            await player.send(f"{c['red']}Target not found.{c['reset']}")
-            return
-        target.predators_mark = player
-        target.predators_mark_ticks = 8
-        await player.send(f"{c['bright_green']}You mark {target.name} as prey.{c['reset']}")
-
-    # ----- Paladin talent skills -----
-    @classmethod
-    async def cmd_seal_of_command(cls, player: 'Player', args: List[str]):
-        """Empower attacks with holy damage."""
-        c = player.config.COLORS
-        if 'seal_of_command' not in player.skills:
-            await player.send(f"{c['red']}You don't know Seal of Command.{c['reset']}")
-            return
-        player.seal_of_command = True
-        await player.send(f"{c['bright_yellow']}Holy power surrounds your weapon.{c['reset']}")
-
-    @classmethod
-    async def cmd_crusader_strike(cls, player: 'Player', args: List[str]):
-        """Instant weapon strike."""
-        c = player.config.COLORS
-        if 'crusader_strike' not in player.skills:
-            await player.send(f"{c['red']}You don't know Crusader Strike.{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['yellow']}You must be fighting to strike.{c['reset']}")
-            return
-        target = player.fighting
-        import random
-        damage = random.randint(8, 14) + player.level
-        await player.send(f"{c['bright_yellow']}You crusader strike {target.name}! [{damage}]{c['reset']}")
-        await target.take_damage(damage, player)
-
-    @classmethod
-    async def cmd_divine_storm(cls, player: 'Player', args: List[str]):
-        """Holy whirlwind attack."""
-        c = player.config.COLORS
-        if 'divine_storm' not in player.skills:
-            await player.send(f"{c['red']}You don't know Divine Storm.{c['reset']}")
-            return
-        from mobs import Mobile
-        import random
-        targets = [m for m in player.room.characters if isinstance(m, Mobile) and m.hp > 0]
-        await player.send(f"{c['bright_yellow']}You unleash a Divine Storm!{c['reset']}")
-        for target in targets:
-            dmg = random.randint(6, 12) + player.level
-            await target.take_damage(dmg, player)
-
-    @classmethod
-    async def cmd_judgment(cls, player: 'Player', args: List[str]):
-        """Ranged holy strike."""
-        c = player.config.COLORS
-        if 'judgment' not in player.skills:
-            await player.send(f"{c['red']}You don't know Judgment.{c['reset']}")
-            return
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send(f"{c['yellow']}Judge whom?{c['reset']}")
-                return
-        target = player.find_target_in_room(' '.join(args))
-        if not target:
-            await player.send(f"{c['red']}Target not found.{c['reset']}")
-            return
-        import random
-        damage = random.randint(10, 16) + player.level
-        await player.send(f"{c['bright_yellow']}You smite {target.name} with Judgment! [{damage}]{c['reset']}")
-        await target.take_damage(damage, player)
-
-    @classmethod
-    async def cmd_sacred_shield(cls, player: 'Player', args: List[str]):
-        """Apply a holy shield."""
-        c = player.config.COLORS
-        if 'sacred_shield' not in player.skills:
-            await player.send(f"{c['red']}You don't know Sacred Shield.{c['reset']}")
-            return
-        from affects import AffectManager
-        AffectManager.apply_affect(player, {'name': 'sacred_shield', 'type': AffectManager.TYPE_FLAG,
-                                            'applies_to': 'divine_shield', 'value': 1, 'duration': 6,
-                                            'caster_level': player.level})
-        await player.send(f"{c['bright_yellow']}A sacred shield surrounds you.{c['reset']}")
-
-    # ----- Assassin talent skills -----
-    @classmethod
-    async def cmd_marked_for_death(cls, player: 'Player', args: List[str]):
-        """Mark a target for lethal focus."""
-        c = player.config.COLORS
-        if 'marked_for_death' not in player.skills:
-            await player.send(f"{c['red']}You don't know Marked for Death.{c['reset']}")
-            return
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send(f"{c['yellow']}Mark whom?{c['reset']}")
-                return
-        target = player.find_target_in_room(' '.join(args))
-        if not target:
-            await player.send(f"{c['red']}Target not found.{c['reset']}")
-            return
-        target.marked_for_death = player
-        target.marked_for_death_ticks = 8
-        await player.send(f"{c['magenta']}You mark {target.name} for death.{c['reset']}")
-
-    @classmethod
-    async def cmd_death_from_above(cls, player: 'Player', args: List[str]):
-        """Leap attack for massive damage."""
-        c = player.config.COLORS
-        if 'death_from_above' not in player.skills:
-            await player.send(f"{c['red']}You don't know Death from Above.{c['reset']}")
-            return
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send(f"{c['yellow']}Leap at whom?{c['reset']}")
-                return
-        target = player.find_target_in_room(' '.join(args))
-        if not target:
-            await player.send(f"{c['red']}Target not found.{c['reset']}")
-            return
-        import random
-        damage = random.randint(14, 22) + player.level
-        await player.send(f"{c['bright_red']}You strike from above! [{damage}]{c['reset']}")
-        await target.take_damage(damage, player)
-
-    @classmethod
-    async def cmd_crippling_poison(cls, player: 'Player', args: List[str]):
-        """Apply crippling poison to your weapon."""
-        c = player.config.COLORS
-        if 'crippling_poison' not in player.skills:
-            await player.send(f"{c['red']}You don't know Crippling Poison.{c['reset']}")
-            return
-        player.preferred_poison_type = 'crippling'
-        from combat import CombatHandler
-        await CombatHandler.do_envenom(player)
-
-    @classmethod
-    async def cmd_deadly_poison(cls, player: 'Player', args: List[str]):
-        """Apply deadly poison to your weapon."""
-        c = player.config.COLORS
-        if 'deadly_poison' not in player.skills:
-            await player.send(f"{c['red']}You don't know Deadly Poison.{c['reset']}")
-            return
-        player.preferred_poison_type = 'deadly'
-        from combat import CombatHandler
-        await CombatHandler.do_envenom(player)
-
-    @classmethod
-    async def cmd_cloak_of_shadows(cls, player: 'Player', args: List[str]):
-        """Remove harmful magic effects."""
-        c = player.config.COLORS
-        if 'cloak_of_shadows' not in player.skills:
-            await player.send(f"{c['red']}You don't know Cloak of Shadows.{c['reset']}")
-            return
-        from affects import AffectManager
-        count = AffectManager.dispel_affects(player, player.level)
-        await player.send(f"{c['cyan']}You shed {count} harmful effects.{c['reset']}")
-
-    @classmethod
-    async def cmd_vanish(cls, player: 'Player', args: List[str]):
-        """Instant stealth, drop combat. Does NOT reset Intel."""
-        import time
-        c = player.config.COLORS
-        char_class = getattr(player, 'char_class', '').lower()
-        if char_class not in ('assassin', 'thief') and 'vanish' not in player.skills:
-            await player.send(f"{c['red']}You don't know Vanish.{c['reset']}")
-            return
-        now = time.time()
-        if now < getattr(player, 'vanish_cooldown', 0):
-            remaining = int(player.vanish_cooldown - now)
-            await player.send(f"{c['yellow']}Vanish on cooldown ({remaining}s).{c['reset']}")
-            return
-        player.vanish_cooldown = now + 60
-        # Drop combat
-        target = player.fighting
-        if target:
-            player.fighting = None
-            if hasattr(target, 'fighting') and target.fighting == player:
-                target.fighting = None
-                if target.position == 'fighting':
-                    target.position = 'standing'
-        if player.position == 'fighting':
-            player.position = 'standing'
-        # Stealth
-        player.flags.add('hidden')
-        player.flags.add('sneaking')
-        # Intel is NOT reset
-        await player.send(f"{c['magenta']}You vanish into the shadows.{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(
-                f"{c['white']}{player.name} vanishes!{c['reset']}",
-                exclude=[player]
-            )
-
-    @classmethod
-    async def cmd_shadow_blade(cls, player: 'Player', args: List[str]):
-        """Empower attacks from stealth."""
-        c = player.config.COLORS
-        if 'shadow_blade' not in player.skills:
-            await player.send(f"{c['red']}You don't know Shadow Blade.{c['reset']}")
-            return
-        player.shadow_blade_ticks = 6
-        await player.send(f"{c['magenta']}Your blade drinks the darkness.{c['reset']}")
-
-    @classmethod
-    async def cmd_shadow_blink(cls, player: 'Player', args: List[str]):
-        """Blink behind target and stealth briefly."""
-        c = player.config.COLORS
-        if 'shadow_blink' not in player.skills:
-            await player.send(f"{c['red']}You don't know Shadow Blink.{c['reset']}")
-            return
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send(f"{c['yellow']}Blink to whom?{c['reset']}")
-                return
-        target = player.find_target_in_room(' '.join(args))
-        if not target:
-            await player.send(f"{c['red']}Target not found.{c['reset']}")
-            return
-        player.flags.add('hidden')
-        await player.send(f"{c['magenta']}You blink behind {target.name} and fade from sight.{c['reset']}")
-
-    @classmethod
-    async def cmd_silence_strike(cls, player: 'Player', args: List[str]):
-        """Strike and silence spellcasting."""
-        c = player.config.COLORS
-        if 'silence_strike' not in player.skills:
-            await player.send(f"{c['red']}You don't know Silence Strike.{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['yellow']}You must be fighting to use Silence Strike.{c['reset']}")
-            return
-        target = player.fighting
-        from affects import AffectManager
-        AffectManager.apply_affect(target, {'name': 'silence_strike', 'type': AffectManager.TYPE_FLAG,
-                                            'applies_to': 'silenced', 'value': 1, 'duration': 3,
-                                            'caster_level': player.level})
-        await player.send(f"{c['bright_red']}You silence {target.name}!{c['reset']}")
-
-    # ========== LEVEL 31-60 SKILL COMMANDS ==========
-    # These are the powerful high-level abilities that define endgame combat.
-
-    # ----- WARRIOR LEVEL 31-60 -----
-    @classmethod
-    async def cmd_rallying_cry(cls, player: 'Player', args: List[str]):
-        """Buff the entire party with increased max HP and regeneration."""
-        c = player.config.COLORS
-        import time
-        
-        if player.char_class.lower() != 'warrior':
-            await player.send(f"{c['red']}Only warriors can use Rallying Cry!{c['reset']}")
-            return
-        if player.level < 32:
-            await player.send(f"{c['red']}You must be level 32 to use Rallying Cry!{c['reset']}")
-            return
-        
-        # Cooldown check (2 minutes)
-        now = time.time()
-        cooldown_until = getattr(player, 'rallying_cry_cooldown', 0)
-        if now < cooldown_until:
-            remaining = int(cooldown_until - now)
-            await player.send(f"{c['yellow']}Rallying Cry on cooldown ({remaining}s).{c['reset']}")
-            return
-        
-        player.rallying_cry_cooldown = now + 120
-        
-        from affects import AffectManager
-        
-        # Apply to self and group members
-        targets = [player]
-        if player.group:
-            targets.extend([m for m in player.group.members if m != player and m.room == player.room])
-        
-        hp_boost = 20 + player.level
-        for target in targets:
-            AffectManager.apply_affect(target, {
-                'name': 'rallying_cry',
-                'type': AffectManager.TYPE_STAT,
-                'applies_to': 'max_hp',
-                'value': hp_boost,
-                'duration': 15,
-                'caster_level': player.level
-            })
-            if hasattr(target, 'send'):
-                await target.send(f"{c['bright_yellow']}You feel a surge of vitality from the Rallying Cry!{c['reset']}")
-        
-        await player.send(f"{c['bright_yellow']}You let out a RALLYING CRY! All allies gain +{hp_boost} max HP!{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name} lets out a thunderous rallying cry!", exclude=[player])
-
-    @classmethod
-    async def cmd_shattering_blow(cls, player: 'Player', args: List[str]):
-        """Strike with such force that armor is reduced."""
-        c = player.config.COLORS
-        import time, random
-        
-        if player.char_class.lower() != 'warrior':
-            await player.send(f"{c['red']}Only warriors can use Shattering Blow!{c['reset']}")
-            return
-        if player.level < 38:
-            await player.send(f"{c['red']}You must be level 38 to use Shattering Blow!{c['reset']}")
-            return
-        
-        target = None
-        if args:
-            target = player.find_target_in_room(' '.join(args))
-        elif player.is_fighting:
-            target = player.fighting
-        elif player.target and player.target in player.room.characters:
-            target = player.target
-        
-        if not target:
-            await player.send(f"{c['yellow']}Shattering Blow whom?{c['reset']}")
-            return
-        
-        # Cooldown (15 seconds)
-        now = time.time()
-        cooldown_until = getattr(player, 'shattering_blow_cooldown', 0)
-        if now < cooldown_until:
-            remaining = int(cooldown_until - now)
-            await player.send(f"{c['yellow']}Shattering Blow on cooldown ({remaining}s).{c['reset']}")
-            return
-        
-        player.shattering_blow_cooldown = now + 15
-        
-        from affects import AffectManager
-        
-        # Damage + armor reduction
-        damage = random.randint(15, 25) + player.level + player.get_damage_bonus()
-        AffectManager.apply_affect(target, {
-            'name': 'armor_shattered',
-            'type': AffectManager.TYPE_STAT,
-            'applies_to': 'ac',
-            'value': 30,  # Worse AC (higher number = worse)
-            'duration': 10,
-            'caster_level': player.level
-        })
-        
-        await target.take_damage(damage, player)
-        await player.send(f"{c['bright_red']}Your SHATTERING BLOW cracks {target.name}'s armor! [{damage}]{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name}'s weapon SHATTERS against {target.name}'s armor!", exclude=[player])
-
-    @classmethod
-    async def cmd_commanding_shout(cls, player: 'Player', args: List[str]):
-        """Taunt all enemies in the room, forcing them to attack you."""
-        c = player.config.COLORS
-        import time
-        
-        if player.char_class.lower() != 'warrior':
-            await player.send(f"{c['red']}Only warriors can use Commanding Shout!{c['reset']}")
-            return
-        if player.level < 44:
-            await player.send(f"{c['red']}You must be level 44 to use Commanding Shout!{c['reset']}")
-            return
-        
-        now = time.time()
-        cooldown_until = getattr(player, 'commanding_shout_cooldown', 0)
-        if now < cooldown_until:
-            remaining = int(cooldown_until - now)
-            await player.send(f"{c['yellow']}Commanding Shout on cooldown ({remaining}s).{c['reset']}")
-            return
-        
-        player.commanding_shout_cooldown = now + 30
-        
-        from mobs import Mobile
-        
-        taunted = 0
-        for char in player.room.characters:
-            if isinstance(char, Mobile) and char.hp > 0:
-                char.fighting = player
-                char.taunted_by = player
-                char.taunt_ticks = 6
-                taunted += 1
-        
-        await player.send(f"{c['bright_yellow']}You let out a COMMANDING SHOUT! {taunted} enemies focus on you!{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name} bellows a commanding shout that echoes through the room!", exclude=[player])
-
-    @classmethod
-    async def cmd_heroic_leap(cls, player: 'Player', args: List[str]):
-        """Leap to a target, stunning them on impact."""
-        c = player.config.COLORS
-        import time, random
-        
-        if player.char_class.lower() != 'warrior':
-            await player.send(f"{c['red']}Only warriors can use Heroic Leap!{c['reset']}")
-            return
-        if player.level < 50:
-            await player.send(f"{c['red']}You must be level 50 to use Heroic Leap!{c['reset']}")
-            return
-        
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send(f"{c['yellow']}Heroic Leap at whom?{c['reset']}")
-                return
-        
-        target = player.find_target_in_room(' '.join(args))
-        if not target:
-            await player.send(f"{c['red']}Target not found.{c['reset']}")
-            return
-        
-        now = time.time()
-        cooldown_until = getattr(player, 'heroic_leap_cooldown', 0)
-        if now < cooldown_until:
-            remaining = int(cooldown_until - now)
-            await player.send(f"{c['yellow']}Heroic Leap on cooldown ({remaining}s).{c['reset']}")
-            return
-        
-        player.heroic_leap_cooldown = now + 45
-        
-        from affects import AffectManager
-        from combat import CombatHandler
-        
-        damage = random.randint(20, 35) + player.level
-        AffectManager.apply_affect(target, {
-            'name': 'heroic_leap_stun',
-            'type': AffectManager.TYPE_FLAG,
-            'applies_to': 'stunned',
-            'value': 1,
-            'duration': 3,
-            'caster_level': player.level
-        })
-        
-        await target.take_damage(damage, player)
-        await CombatHandler.start_combat(player, target)
-        
-        await player.send(f"{c['bright_yellow']}You HEROICALLY LEAP onto {target.name}, stunning them! [{damage}]{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name} leaps through the air and SLAMS into {target.name}!", exclude=[player])
-
-    @classmethod
-    async def cmd_warpath(cls, player: 'Player', args: List[str]):
-        """Enter a sustained damage mode - all attacks deal increased damage."""
-        c = player.config.COLORS
-        import time
-        
-        if player.char_class.lower() != 'warrior':
-            await player.send(f"{c['red']}Only warriors can use Warpath!{c['reset']}")
-            return
-        if player.level < 56:
-            await player.send(f"{c['red']}You must be level 56 to use Warpath!{c['reset']}")
-            return
-        
-        now = time.time()
-        cooldown_until = getattr(player, 'warpath_cooldown', 0)
-        if now < cooldown_until:
-            remaining = int(cooldown_until - now)
-            await player.send(f"{c['yellow']}Warpath on cooldown ({remaining}s).{c['reset']}")
-            return
-        
-        player.warpath_cooldown = now + 180  # 3 minutes
-        
-        from affects import AffectManager
-        
-        AffectManager.apply_affect(player, {
-            'name': 'warpath',
-            'type': AffectManager.TYPE_STAT,
-            'applies_to': 'damroll',
-            'value': 15,
-            'duration': 20,
-            'caster_level': player.level
-        })
-        AffectManager.apply_affect(player, {
-            'name': 'warpath_speed',
-            'type': AffectManager.TYPE_FLAG,
-            'applies_to': 'haste',
-            'value': 1,
-            'duration': 20,
-            'caster_level': player.level
-        })
-        
-        await player.send(f"{c['bright_red']}You enter the WARPATH! Destruction follows in your wake!{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name}'s eyes glow red as they enter a devastating WARPATH!", exclude=[player])
-
-    @classmethod
-    async def cmd_titans_wrath(cls, player: 'Player', args: List[str]):
-        """CAPSTONE: 10 seconds of god mode - immune to damage, 2x damage, AoE cleave."""
-        c = player.config.COLORS
-        import time
-        
-        if player.char_class.lower() != 'warrior':
-            await player.send(f"{c['red']}Only warriors can invoke Titan's Wrath!{c['reset']}")
-            return
-        if player.level < 60:
-            await player.send(f"{c['red']}You must be level 60 to invoke Titan's Wrath!{c['reset']}")
-            return
-        
-        now = time.time()
-        cooldown_until = getattr(player, 'titans_wrath_cooldown', 0)
-        if now < cooldown_until:
-            remaining = int(cooldown_until - now)
-            await player.send(f"{c['yellow']}Titan's Wrath on cooldown ({int(remaining/60)}m {remaining%60}s).{c['reset']}")
-            return
-        
-        player.titans_wrath_cooldown = now + 600  # 10 minutes
-        
-        from affects import AffectManager
-        
-        # Invulnerability
-        AffectManager.apply_affect(player, {
-            'name': 'titans_wrath_invuln',
-            'type': AffectManager.TYPE_FLAG,
-            'applies_to': 'invulnerable',
-            'value': 1,
-            'duration': 5,  # ~10 seconds (2s per tick)
-            'caster_level': player.level
-        })
-        # Double damage
-        AffectManager.apply_affect(player, {
-            'name': 'titans_wrath_damage',
-            'type': AffectManager.TYPE_STAT,
-            'applies_to': 'damroll',
-            'value': 50,
-            'duration': 5,
-            'caster_level': player.level
-        })
-        # AoE cleave flag
-        player.titans_wrath_active = True
-        player.titans_wrath_ticks = 5
-        
-        await player.send(f"{c['bright_yellow']}████████████████████████████████████████████{c['reset']}")
-        await player.send(f"{c['bright_yellow']}█ {c['bright_red']}TITAN'S WRATH{c['bright_yellow']} - YOU ARE UNSTOPPABLE! █{c['reset']}")
-        await player.send(f"{c['bright_yellow']}████████████████████████████████████████████{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(
-                f"The air CRACKLES with power as {player.name} invokes TITAN'S WRATH! They are INVINCIBLE!",
-                exclude=[player]
-            )
-
-    # ----- THIEF LEVEL 31-60 -----
-    @classmethod
-    async def cmd_nerve_strike(cls, player: 'Player', args: List[str]):
-        """Paralyze a target with a precise nerve strike."""
-        c = player.config.COLORS
-        import time
-        
-        if player.char_class.lower() != 'thief':
-            await player.send(f"{c['red']}Only thieves can use Nerve Strike!{c['reset']}")
-            return
-        if player.level < 32:
-            await player.send(f"{c['red']}You must be level 32 to use Nerve Strike!{c['reset']}")
-            return
-        
-        target = None
-        if args:
-            target = player.find_target_in_room(' '.join(args))
-        elif player.is_fighting:
-            target = player.fighting
-        
-        if not target:
-            await player.send(f"{c['yellow']}Nerve Strike whom?{c['reset']}")
-            return
-        
-        now = time.time()
-        cooldown_until = getattr(player, 'nerve_strike_cooldown', 0)
-        if now < cooldown_until:
-            remaining = int(cooldown_until - now)
-            await player.send(f"{c['yellow']}Nerve Strike on cooldown ({remaining}s).{c['reset']}")
-            return
-        
-        player.nerve_strike_cooldown = now + 30
-        
-        from affects import AffectManager
-        
-        AffectManager.apply_affect(target, {
-            'name': 'paralyzed',
-            'type': AffectManager.TYPE_FLAG,
-            'applies_to': 'paralyzed',
-            'value': 1,
-            'duration': 3,
-            'caster_level': player.level
-        })
-        
-        await player.send(f"{c['magenta']}You strike {target.name}'s nerve cluster - they are PARALYZED!{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name} strikes {target.name}'s pressure point!", exclude=[player])
-
-    @classmethod
-    async def cmd_garrote(cls, player: 'Player', args: List[str]):
-        """Strangle a target, silencing them and causing bleed damage."""
-        c = player.config.COLORS
-        import time, random
-        
-        if player.char_class.lower() != 'thief':
-            await player.send(f"{c['red']}Only thieves can use Garrote!{c['reset']}")
-            return
-        if player.level < 44:
-            await player.send(f"{c['red']}You must be level 44 to use Garrote!{c['reset']}")
-            return
-        
-        if player.is_fighting:
-            await player.send(f"{c['red']}You can only Garrote from stealth!{c['reset']}")
-            return
-        
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send(f"{c['yellow']}Garrote whom?{c['reset']}")
-                return
-        
-        target = player.find_target_in_room(' '.join(args))
-        if not target:
-            await player.send(f"{c['red']}Target not found.{c['reset']}")
-            return
-        
-        now = time.time()
-        cooldown_until = getattr(player, 'garrote_cooldown', 0)
-        if now < cooldown_until:
-            remaining = int(cooldown_until - now)
-            await player.send(f"{c['yellow']}Garrote on cooldown ({remaining}s).{c['reset']}")
-            return
-        
-        player.garrote_cooldown = now + 20
-        
-        from affects import AffectManager
-        from combat import CombatHandler
-        
-        damage = random.randint(10, 18) + player.level
-        
-        # Silence
-        AffectManager.apply_affect(target, {
-            'name': 'garrote_silence',
-            'type': AffectManager.TYPE_FLAG,
-            'applies_to': 'silenced',
-            'value': 1,
-            'duration': 5,
-            'caster_level': player.level
-        })
-        # Bleed DoT
-        AffectManager.apply_affect(target, {
-            'name': 'garrote_bleed',
-            'type': AffectManager.TYPE_DOT,
-            'applies_to': 'hp',
-            'value': 8 + player.level // 5,
-            'duration': 6,
-            'caster_level': player.level
-        })
-        
-        await target.take_damage(damage, player)
-        await CombatHandler.start_combat(player, target)
-        
-        await player.send(f"{c['bright_red']}You GARROTE {target.name} - silenced and bleeding! [{damage}]{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name} wraps a garrote around {target.name}'s throat!", exclude=[player])
-
-    @classmethod
-    async def cmd_evasion(cls, player: 'Player', args: List[str]):
-        """100% dodge chance for 10 seconds. Assassin/Thief."""
-        c = player.config.COLORS
-        import time
-        char_class = getattr(player, 'char_class', '').lower()
-        if char_class not in ('thief', 'assassin'):
-            await player.send(f"{c['red']}Only thieves and assassins can use Evasion!{c['reset']}")
-            return
-
-        now = time.time()
-        cooldown_until = getattr(player, 'evasion_cooldown', 0)
-        if now < cooldown_until:
-            remaining = int(cooldown_until - now)
-            await player.send(f"{c['yellow']}Evasion on cooldown ({remaining}s).{c['reset']}")
-            return
-
-        player.evasion_cooldown = now + 180  # 3 minutes
-        player.evasion_until = now + 10  # 10 seconds
-
-        await player.send(f"{c['cyan']}You enter a state of perfect EVASION - all attacks will miss for 10 seconds!{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name}'s movements become a blur - impossible to hit!", exclude=[player])
-
-    @classmethod
-    async def cmd_marked_for_death_thief(cls, player: 'Player', args: List[str]):
-        """Mark a target for massive damage bonus."""
-        c = player.config.COLORS
-        import time
-        
-        if player.char_class.lower() != 'thief':
-            await player.send(f"{c['red']}Only thieves can use Marked for Death!{c['reset']}")
-            return
-        if player.level < 56:
-            await player.send(f"{c['red']}You must be level 56 to use Marked for Death!{c['reset']}")
-            return
-        
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send(f"{c['yellow']}Mark whom for death?{c['reset']}")
-                return
-        
-        target = player.find_target_in_room(' '.join(args))
-        if not target:
-            await player.send(f"{c['red']}Target not found.{c['reset']}")
-            return
-        
-        now = time.time()
-        cooldown_until = getattr(player, 'marked_for_death_thief_cooldown', 0)
-        if now < cooldown_until:
-            remaining = int(cooldown_until - now)
-            await player.send(f"{c['yellow']}Marked for Death on cooldown ({remaining}s).{c['reset']}")
-            return
-        
-        player.marked_for_death_thief_cooldown = now + 60
-        
-        target.marked_for_death_by = player
-        target.marked_for_death_bonus = 50  # 50% extra damage
-        target.marked_for_death_ticks = 10
-        
-        await player.send(f"{c['bright_red']}You mark {target.name} for DEATH - your attacks deal 50% more damage!{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"A dark mark appears on {target.name} - they have been marked for death!", exclude=[player])
-
-    @classmethod
-    async def cmd_perfect_crime(cls, player: 'Player', args: List[str]):
-        """CAPSTONE: 30 seconds of permanent stealth with guaranteed crits."""
-        c = player.config.COLORS
-        import time
-        
-        if player.char_class.lower() != 'thief':
-            await player.send(f"{c['red']}Only thieves can commit the Perfect Crime!{c['reset']}")
-            return
-        if player.level < 60:
-            await player.send(f"{c['red']}You must be level 60 to commit the Perfect Crime!{c['reset']}")
-            return
-        
-        now = time.time()
-        cooldown_until = getattr(player, 'perfect_crime_cooldown', 0)
-        if now < cooldown_until:
-            remaining = int(cooldown_until - now)
-            await player.send(f"{c['yellow']}Perfect Crime on cooldown ({int(remaining/60)}m {remaining%60}s).{c['reset']}")
-            return
-        
-        player.perfect_crime_cooldown = now + 600  # 10 minutes
-        
-        from affects import AffectManager
-        
-        # Permanent stealth
-        AffectManager.apply_affect(player, {
-            'name': 'perfect_crime_stealth',
-            'type': AffectManager.TYPE_FLAG,
-            'applies_to': 'invisible',
-            'value': 1,
-            'duration': 15,  # ~30 seconds
-            'caster_level': player.level
-        })
-        # Guaranteed crits
-        AffectManager.apply_affect(player, {
-            'name': 'perfect_crime_crit',
-            'type': AffectManager.TYPE_STAT,
-            'applies_to': 'crit_chance',
-            'value': 100,
-            'duration': 15,
-            'caster_level': player.level
-        })
-        
-        player.perfect_crime_active = True
-        player.flags.add('hidden')
-        
-        await player.send(f"{c['bright_magenta']}████████████████████████████████████████████{c['reset']}")
-        await player.send(f"{c['bright_magenta']}█ {c['bright_white']}PERFECT CRIME{c['bright_magenta']} - YOU ARE A GHOST █{c['reset']}")
-        await player.send(f"{c['bright_magenta']}████████████████████████████████████████████{c['reset']}")
-        await player.send(f"{c['cyan']}30 seconds of permanent stealth. All attacks are critical hits.{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name} vanishes without a trace...", exclude=[player])
-
-    # ----- RANGER LEVEL 31-60 -----
-    @classmethod
-    async def cmd_volley(cls, player: 'Player', args: List[str]):
-        """Rain arrows on all enemies in the room."""
-        c = player.config.COLORS
-        import time, random
-        
-        if player.char_class.lower() != 'ranger':
-            await player.send(f"{c['red']}Only rangers can use Volley!{c['reset']}")
-            return
-        if player.level < 32:
-            await player.send(f"{c['red']}You must be level 32 to use Volley!{c['reset']}")
-            return
-        
-        now = time.time()
-        cooldown_until = getattr(player, 'volley_cooldown', 0)
-        if now < cooldown_until:
-            remaining = int(cooldown_until - now)
-            await player.send(f"{c['yellow']}Volley on cooldown ({remaining}s).{c['reset']}")
-            return
-        
-        player.volley_cooldown = now + 20
-        
-        from mobs import Mobile
-        
-        targets = [m for m in player.room.characters if isinstance(m, Mobile) and m.hp > 0]
-        if not targets:
-            await player.send(f"{c['yellow']}No enemies to rain arrows on.{c['reset']}")
-            return
-        
-        await player.send(f"{c['bright_green']}You fire a VOLLEY of arrows into the air!{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name} fires a volley of arrows into the sky!", exclude=[player])
-        
-        for target in targets:
-            damage = random.randint(8, 14) + player.level // 2
-            await target.take_damage(damage, player)
-            await player.send(f"{c['green']}  → {target.name} is struck! [{damage}]{c['reset']}")
-
-    @classmethod
-    async def cmd_camouflage_master(cls, player: 'Player', args: List[str]):
-        """Enter advanced camouflage - harder to detect than regular hide."""
-        c = player.config.COLORS
-        import time
-        
-        if player.char_class.lower() != 'ranger':
-            await player.send(f"{c['red']}Only rangers can use Camouflage!{c['reset']}")
-            return
-        if player.level < 38:
-            await player.send(f"{c['red']}You must be level 38 to use Camouflage!{c['reset']}")
-            return
-        
-        now = time.time()
-        cooldown_until = getattr(player, 'camouflage_master_cooldown', 0)
-        if now < cooldown_until:
-            remaining = int(cooldown_until - now)
-            await player.send(f"{c['yellow']}Camouflage on cooldown ({remaining}s).{c['reset']}")
-            return
-        
-        player.camouflage_master_cooldown = now + 30
-        
-        from affects import AffectManager
-        
-        player.flags.add('hidden')
-        AffectManager.apply_affect(player, {
-            'name': 'camouflage',
-            'type': AffectManager.TYPE_FLAG,
-            'applies_to': 'invisible',
-            'value': 1,
-            'duration': 20,
-            'caster_level': player.level
-        })
-        player.camouflage_bonus = 30  # +30 to stealth check
-        
-        await player.send(f"{c['green']}You blend perfectly into your surroundings with CAMOUFLAGE!{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name} seems to melt into the environment...", exclude=[player])
-
-    @classmethod
-    async def cmd_serpent_sting(cls, player: 'Player', args: List[str]):
-        """Apply a strong poison DoT to the target."""
-        c = player.config.COLORS
-        import time, random
-        
-        if player.char_class.lower() != 'ranger':
-            await player.send(f"{c['red']}Only rangers can use Serpent Sting!{c['reset']}")
-            return
-        if player.level < 44:
-            await player.send(f"{c['red']}You must be level 44 to use Serpent Sting!{c['reset']}")
-            return
-        
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send(f"{c['yellow']}Serpent Sting whom?{c['reset']}")
-                return
-        
-        target = player.find_target_in_room(' '.join(args))
-        if not target:
-            await player.send(f"{c['red']}Target not found.{c['reset']}")
-            return
-        
-        now = time.time()
-        cooldown_until = getattr(player, 'serpent_sting_cooldown', 0)
-        if now < cooldown_until:
-            remaining = int(cooldown_until - now)
-            await player.send(f"{c['yellow']}Serpent Sting on cooldown ({remaining}s).{c['reset']}")
-            return
-        
-        player.serpent_sting_cooldown = now + 15
-        
-        from affects import AffectManager
-        
-        damage = random.randint(5, 10) + player.level // 3
-        AffectManager.apply_affect(target, {
-            'name': 'serpent_sting',
-            'type': AffectManager.TYPE_DOT,
-            'applies_to': 'hp',
-            'value': 10 + player.level // 4,
-            'duration': 10,
-            'caster_level': player.level
-        })
-        
-        await target.take_damage(damage, player)
-        await player.send(f"{c['green']}You strike {target.name} with SERPENT STING! [{damage}] (Poison applied){c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name}'s arrow drips with venom as it strikes {target.name}!", exclude=[player])
-
-    @classmethod
-    async def cmd_rapid_fire(cls, player: 'Player', args: List[str]):
-        """Next 3 attacks happen instantly. Costs 50 Focus. 30s CD. Ranger only."""
-        c = player.config.COLORS
-        import time, random
-
-        if player.char_class.lower() != 'ranger':
-            await player.send(f"{c['red']}Only rangers can use Rapid Fire!{c['reset']}")
-            return
-
-        now = time.time()
-        cd = getattr(player, 'rapid_fire_cooldown', 0)
-        if now < cd:
-            await player.send(f"{c['yellow']}Rapid Fire on cooldown ({int(cd - now)}s).{c['reset']}")
-            return
-
-        focus_cost = 50
-        if getattr(player, 'focus', 0) >= 100:
-            focus_cost = 25
-
-        if getattr(player, 'focus', 0) < focus_cost:
-            await player.send(f"{c['red']}You need {focus_cost} Focus! (Current: {player.focus}){c['reset']}")
-            return
-
-        target = None
-        if args:
-            target = player.find_target_in_room(' '.join(args))
-        elif player.is_fighting:
-            target = player.fighting
-        if not target:
-            await player.send(f"{c['yellow']}Rapid Fire at whom?{c['reset']}")
-            return
-
-        player.focus -= focus_cost
-        player.rapid_fire_cooldown = now + 30
-
-        num_attacks = 3
-        try:
-            from talents import TalentManager
-            extra = TalentManager.get_talent_rank(player, 'rapid_fire_mastery') // 2
-            num_attacks += extra
-        except Exception:
-            pass
-
-        weapon = player.equipment.get('wield')
-        from combat import CombatHandler
-        total_damage = 0
-
-        await player.send(f"{c['bright_green']}🏹 RAPID FIRE! You unleash {num_attacks} shots at {target.name}!{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name} fires a rapid barrage!", exclude=[player])
-
-        for i in range(num_attacks):
-            if not target.is_alive:
-                break
-            if weapon and hasattr(weapon, 'damage_dice'):
-                base_damage = CombatHandler.roll_dice(weapon.damage_dice)
-            else:
-                base_damage = random.randint(4, 10)
-            damage = base_damage + player.get_damage_bonus()
-            if getattr(player, 'hunters_mark_target', None) == target:
-                damage = int(damage * 1.10)
-            damage = max(1, damage)
-            total_damage += damage
-            await player.send(f"{c['green']}  → Shot #{i+1} hits! [{damage}]{c['reset']}")
-            killed = await target.take_damage(damage, player)
-            if killed:
-                await CombatHandler.handle_death(player, target)
-                break
-
-        await player.send(f"{c['bright_green']}Total Rapid Fire damage: {total_damage}{c['reset']}")
-        if not player.is_fighting and target.is_alive:
-            await CombatHandler.start_combat(player, target)
-
-    @classmethod
-    async def cmd_kill_command(cls, player: 'Player', args: List[str]):
-        """Pet attacks for 2x damage. Costs 25 Focus. 15s CD. Ranger only."""
-        c = player.config.COLORS
-        import time, random
-
-        if player.char_class.lower() != 'ranger':
-            await player.send(f"{c['red']}Only rangers can use Kill Command!{c['reset']}")
-            return
-
-        now = time.time()
-        cd = getattr(player, 'kill_command_cooldown', 0)
-        if now < cd:
-            await player.send(f"{c['yellow']}Kill Command on cooldown ({int(cd - now)}s).{c['reset']}")
-            return
-
-        focus_cost = 25
-        if getattr(player, 'focus', 0) >= 100:
-            focus_cost = 12
-
-        if getattr(player, 'focus', 0) < focus_cost:
-            await player.send(f"{c['red']}You need {focus_cost} Focus! (Current: {player.focus}){c['reset']}")
-            return
-
-        target = None
-        if args:
-            target = player.find_target_in_room(' '.join(args))
-        elif player.is_fighting:
-            target = player.fighting
-        if not target:
-            await player.send(f"{c['yellow']}Kill Command whom?{c['reset']}")
-            return
-
-        player.focus -= focus_cost
-        player.kill_command_cooldown = now + 15
-
-        # Check for pet
-        from pets import PetManager
-        pets = PetManager.get_player_pets(player)
-        has_pet = bool(pets)
-
-        if has_pet:
-            pet = pets[0]
-            base_damage = random.randint(15, 30) + player.level
-            damage = int(base_damage * 2)
-            if getattr(player, 'hunters_mark_target', None) == target:
-                damage = int(damage * 1.10)
-            pet_name = pet.name
-            await player.send(f"{c['bright_green']}{pet_name} savages {target.name} on your command! [{damage}]{c['reset']}")
-            if player.room:
-                await player.room.send_to_room(f"{pet_name} lunges at {target.name}!", exclude=[player])
-        else:
-            base_damage = random.randint(10, 20) + player.level
-            damage = base_damage
-            if getattr(player, 'hunters_mark_target', None) == target:
-                damage = int(damage * 1.10)
-            await player.send(f"{c['bright_green']}You strike {target.name} with predatory force! [{damage}]{c['reset']}")
-
-        killed = await target.take_damage(damage, player)
-        if killed:
-            from combat import CombatHandler
-            await CombatHandler.handle_death(player, target)
-        if not player.is_fighting and not killed:
-            from combat import CombatHandler
-            await CombatHandler.start_combat(player, target)
-
-    @classmethod
-    async def cmd_alpha_pack(cls, player: 'Player', args: List[str]):
-        """CAPSTONE: Summon ALL your pets simultaneously in a frenzy."""
-        c = player.config.COLORS
-        import time
-        
-        if player.char_class.lower() != 'ranger':
-            await player.send(f"{c['red']}Only rangers can summon the Alpha Pack!{c['reset']}")
-            return
-        if player.level < 60:
-            await player.send(f"{c['red']}You must be level 60 to summon the Alpha Pack!{c['reset']}")
-            return
-        
-        now = time.time()
-        cooldown_until = getattr(player, 'alpha_pack_cooldown', 0)
-        if now < cooldown_until:
-            remaining = int(cooldown_until - now)
-            await player.send(f"{c['yellow']}Alpha Pack on cooldown ({int(remaining/60)}m {remaining%60}s).{c['reset']}")
-            return
-        
-        player.alpha_pack_cooldown = now + 600  # 10 minutes
-        
-        from pets import Pet
-        
-        pack_types = ['wolf', 'bear', 'hawk', 'cat', 'boar']
-        pack_members = []
-        
-        await player.send(f"{c['bright_green']}████████████████████████████████████████████{c['reset']}")
-        await player.send(f"{c['bright_green']}█ {c['bright_yellow']}ALPHA PACK{c['bright_green']} - THE HUNT BEGINS! █{c['reset']}")
-        await player.send(f"{c['bright_green']}████████████████████████████████████████████{c['reset']}")
-        
-        for pet_type in pack_types:
-            pet = Pet(0, player.world, player, pet_type)
-            pet.name = f"Pack {pet_type.title()}"
-            pet.level = player.level
-            pet.hp = int(player.max_hp * 0.5)
-            pet.max_hp = pet.hp
-            pet.timer = 15  # 30 seconds duration
-            pet.bestial_wrath = 15  # Permanent frenzy
-            pack_members.append(pet)
-            player.companions.append(pet)
-            if player.room:
-                player.room.characters.append(pet)
-                pet.room = player.room
-        
-        await player.send(f"{c['bright_yellow']}5 ferocious beasts answer your call!{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(
-                f"A PACK of wild beasts bursts forth to fight alongside {player.name}!",
-                exclude=[player]
-            )
-
-    # ----- ASSASSIN LEVEL 31-60 -----
-    @classmethod
-    async def cmd_shadowstrike(cls, player: 'Player', args: List[str]):
-        """Teleport behind a target and backstab them."""
-        c = player.config.COLORS
-        import time, random
-        
-        if player.char_class.lower() != 'assassin':
-            await player.send(f"{c['red']}Only assassins can use Shadowstrike!{c['reset']}")
-            return
-        if player.level < 32:
-            await player.send(f"{c['red']}You must be level 32 to use Shadowstrike!{c['reset']}")
-            return
-        
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send(f"{c['yellow']}Shadowstrike whom?{c['reset']}")
-                return
-        
-        target = player.find_target_in_room(' '.join(args))
-        if not target:
-            await player.send(f"{c['red']}Target not found.{c['reset']}")
-            return
-        
-        now = time.time()
-        cooldown_until = getattr(player, 'shadowstrike_cooldown', 0)
-        if now < cooldown_until:
-            remaining = int(cooldown_until - now)
-            await player.send(f"{c['yellow']}Shadowstrike on cooldown ({remaining}s).{c['reset']}")
-            return
-        
-        player.shadowstrike_cooldown = now + 20
-        
-        from combat import CombatHandler
-        
-        # Backstab damage from behind
-        damage = random.randint(20, 35) + player.level * 2
-        await target.take_damage(damage, player)
-        await CombatHandler.start_combat(player, target)
-        
-        await player.send(f"{c['magenta']}You SHADOWSTRIKE behind {target.name}! [{damage}]{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name} vanishes and reappears behind {target.name} with a deadly strike!", exclude=[player])
-
-    @classmethod
-    async def cmd_fan_of_knives(cls, player: 'Player', args: List[str]):
-        """Throw poisoned knives at all enemies in the room."""
-        c = player.config.COLORS
-        import time, random
-        
-        if player.char_class.lower() != 'assassin':
-            await player.send(f"{c['red']}Only assassins can use Fan of Knives!{c['reset']}")
-            return
-        if player.level < 38:
-            await player.send(f"{c['red']}You must be level 38 to use Fan of Knives!{c['reset']}")
-            return
-        
-        now = time.time()
-        cooldown_until = getattr(player, 'fan_of_knives_cooldown', 0)
-        if now < cooldown_until:
-            remaining = int(cooldown_until - now)
-            await player.send(f"{c['yellow']}Fan of Knives on cooldown ({remaining}s).{c['reset']}")
-            return
-        
-        player.fan_of_knives_cooldown = now + 15
-        
-        from mobs import Mobile
-        from affects import AffectManager
-        
-        targets = [m for m in player.room.characters if isinstance(m, Mobile) and m.hp > 0]
-        if not targets:
-            await player.send(f"{c['yellow']}No enemies to strike.{c['reset']}")
-            return
-        
-        await player.send(f"{c['magenta']}You hurl a FAN OF KNIVES at your enemies!{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name} hurls a fan of poisoned knives!", exclude=[player])
-        
-        for target in targets:
-            damage = random.randint(8, 15) + player.level // 2
-            AffectManager.apply_affect(target, {
-                'name': 'knife_poison',
-                'type': AffectManager.TYPE_DOT,
-                'applies_to': 'hp',
-                'value': 5 + player.level // 6,
-                'duration': 5,
-                'caster_level': player.level
-            })
-            await target.take_damage(damage, player)
-            await player.send(f"{c['magenta']}  → {target.name} is struck and poisoned! [{damage}]{c['reset']}")
-
-    @classmethod
-    async def cmd_rupture(cls, player: 'Player', args: List[str]):
-        """Cause massive bleeding with a vicious strike."""
-        c = player.config.COLORS
-        import time, random
-        
-        if player.char_class.lower() != 'assassin':
-            await player.send(f"{c['red']}Only assassins can use Rupture!{c['reset']}")
-            return
-        if player.level < 44:
-            await player.send(f"{c['red']}You must be level 44 to use Rupture!{c['reset']}")
-            return
-        
-        target = None
-        if args:
-            target = player.find_target_in_room(' '.join(args))
-        elif player.is_fighting:
-            target = player.fighting
-        
-        if not target:
-            await player.send(f"{c['yellow']}Rupture whom?{c['reset']}")
-            return
-        
-        now = time.time()
-        cooldown_until = getattr(player, 'rupture_cooldown', 0)
-        if now < cooldown_until:
-            remaining = int(cooldown_until - now)
-            await player.send(f"{c['yellow']}Rupture on cooldown ({remaining}s).{c['reset']}")
-            return
-        
-        player.rupture_cooldown = now + 20
-        
-        from affects import AffectManager
-        
-        damage = random.randint(15, 25) + player.level
-        AffectManager.apply_affect(target, {
-            'name': 'rupture_bleed',
-            'type': AffectManager.TYPE_DOT,
-            'applies_to': 'hp',
-            'value': 15 + player.level // 3,
-            'duration': 8,
-            'caster_level': player.level
-        })
-        
-        await target.take_damage(damage, player)
-        await player.send(f"{c['bright_red']}You RUPTURE {target.name}'s flesh! [{damage}] (Massive bleed applied){c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name} tears into {target.name}, causing horrific bleeding!", exclude=[player])
-
-    @classmethod
-    async def cmd_shadow_blades_master(cls, player: 'Player', args: List[str]):
-        """Conjure shadow weapons that deal bonus damage."""
-        c = player.config.COLORS
-        import time
-        
-        if player.char_class.lower() != 'assassin':
-            await player.send(f"{c['red']}Only assassins can use Shadow Blades!{c['reset']}")
-            return
-        if player.level < 50:
-            await player.send(f"{c['red']}You must be level 50 to use Shadow Blades!{c['reset']}")
-            return
-        
-        now = time.time()
-        cooldown_until = getattr(player, 'shadow_blades_master_cooldown', 0)
-        if now < cooldown_until:
-            remaining = int(cooldown_until - now)
-            await player.send(f"{c['yellow']}Shadow Blades on cooldown ({remaining}s).{c['reset']}")
-            return
-        
-        player.shadow_blades_master_cooldown = now + 120
-        
-        from affects import AffectManager
-        
-        AffectManager.apply_affect(player, {
-            'name': 'shadow_blades',
-            'type': AffectManager.TYPE_STAT,
-            'applies_to': 'damroll',
-            'value': 20,
-            'duration': 12,
-            'caster_level': player.level
-        })
-        AffectManager.apply_affect(player, {
-            'name': 'shadow_blades_haste',
-            'type': AffectManager.TYPE_FLAG,
-            'applies_to': 'haste',
-            'value': 1,
-            'duration': 12,
-            'caster_level': player.level
-        })
-        
-        await player.send(f"{c['magenta']}SHADOW BLADES manifest in your hands - +20 damage for 24 seconds!{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"Shadowy blades form in {player.name}'s hands!", exclude=[player])
-
-    @classmethod
-    async def cmd_vendetta_assassin(cls, player: 'Player', args: List[str]):
-        """Mark a target for death - all damage to them is doubled."""
-        c = player.config.COLORS
-        import time
-        
-        if player.char_class.lower() != 'assassin':
-            await player.send(f"{c['red']}Only assassins can use Vendetta!{c['reset']}")
-            return
-        if player.level < 56:
-            await player.send(f"{c['red']}You must be level 56 to use Vendetta!{c['reset']}")
-            return
-        
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send(f"{c['yellow']}Vendetta against whom?{c['reset']}")
-                return
-        
-        target = player.find_target_in_room(' '.join(args))
-        if not target:
-            await player.send(f"{c['red']}Target not found.{c['reset']}")
-            return
-        
-        now = time.time()
-        cooldown_until = getattr(player, 'vendetta_assassin_cooldown', 0)
-        if now < cooldown_until:
-            remaining = int(cooldown_until - now)
-            await player.send(f"{c['yellow']}Vendetta on cooldown ({remaining}s).{c['reset']}")
-            return
-        
-        player.vendetta_assassin_cooldown = now + 120
-        
-        target.vendetta_target = player
-        target.vendetta_bonus = 100  # 100% (2x) damage
-        target.vendetta_ticks = 10
-        
-        await player.send(f"{c['bright_red']}You swear VENDETTA against {target.name} - ALL damage doubled!{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name} swears a deadly vendetta against {target.name}!", exclude=[player])
-
-    @classmethod
-    async def cmd_death_mark(cls, player: 'Player', args: List[str]):
-        """CAPSTONE: Execute a boss at <25% HP instantly."""
-        c = player.config.COLORS
-        import time
-        
-        if player.char_class.lower() != 'assassin':
-            await player.send(f"{c['red']}Only assassins can use Death Mark!{c['reset']}")
-            return
-        if player.level < 60:
-            await player.send(f"{c['red']}You must be level 60 to use Death Mark!{c['reset']}")
-            return
-        
-        if not args:
-            if hasattr(player, "fighting") and player.fighting:
-                target = player.fighting
-                args = [target.name]
-            else:
-                await player.send(f"{c['yellow']}Death Mark whom?{c['reset']}")
-                return
-        
-        target = player.find_target_in_room(' '.join(args))
-        if not target:
-            await player.send(f"{c['red']}Target not found.{c['reset']}")
-            return
-        
-        now = time.time()
-        cooldown_until = getattr(player, 'death_mark_cooldown', 0)
-        if now < cooldown_until:
-            remaining = int(cooldown_until - now)
-            await player.send(f"{c['yellow']}Death Mark on cooldown ({int(remaining/60)}m {remaining%60}s).{c['reset']}")
-            return
-        
-        # Check if target is below 25% HP
-        hp_pct = target.hp / target.max_hp if target.max_hp > 0 else 0
-        
-        if hp_pct >= 0.25:
-            await player.send(f"{c['yellow']}{target.name} must be below 25% HP to execute!{c['reset']}")
-            await player.send(f"{c['cyan']}(Currently at {int(hp_pct*100)}% HP){c['reset']}")
-            return
-        
-        player.death_mark_cooldown = now + 600  # 10 minutes
-        
-        # Instant kill
-        await player.send(f"{c['bright_red']}████████████████████████████████████████████{c['reset']}")
-        await player.send(f"{c['bright_red']}█ {c['bright_white']}DEATH MARK{c['bright_red']} - EXECUTION COMPLETE █{c['reset']}")
-        await player.send(f"{c['bright_red']}████████████████████████████████████████████{c['reset']}")
-        
-        if player.room:
-            await player.room.send_to_room(
-                f"{player.name} marks {target.name} for DEATH - they fall instantly!",
-                exclude=[player]
-            )
-        
-        # Deal massive damage to kill
-        await target.take_damage(target.hp + 1000, player)
-
-    # ==================== MAIL SYSTEM ====================
-
-    @classmethod
-    @classmethod
-    async def cmd_auction(cls, player: 'Player', args: List[str]):
-        """Auction house commands for buying and selling items.
-
-        Usage:
-            auction list [category]      - Browse listings
-            auction sell <item> <price> [auction] - List item for sale
-            auction buy <id>             - Purchase a listing
-            auction bid <id> <amount>    - Bid on an auction listing
-            auction cancel <id>          - Cancel your listing
-            auction search <keyword>     - Search listings
-            auction history              - Your recent transactions
-            auction collect              - Collect pending gold/items
-        """
-        from auction_house import AuctionHouse, AUCTION_HOUSE_ROOM, AUCTIONEER_NAME, CATEGORIES
-        c = player.config.COLORS
-
-        if not args:
-            await player.send(f"\n{c['bright_cyan']}═══ Auction House ═══{c['reset']}")
-            await player.send(f"{c['white']}Commands:{c['reset']}")
-            await player.send(f"  {c['bright_green']}auction list [category]{c['white']}  - Browse (weapons/armor/materials/consumables/misc)")
-            await player.send(f"  {c['bright_green']}auction sell <item> <price>{c['white']} - List item (5% fee)")
-            await player.send(f"  {c['bright_green']}auction sell <item> <price> auction{c['white']} - List as auction with min bid")
-            await player.send(f"  {c['bright_green']}auction buy <id>{c['white']}           - Buy a listing")
-            await player.send(f"  {c['bright_green']}auction bid <id> <amount>{c['white']}  - Bid on auction")
-            await player.send(f"  {c['bright_green']}auction cancel <id>{c['white']}        - Cancel your listing")
-            await player.send(f"  {c['bright_green']}auction search <keyword>{c['white']}   - Search listings")
-            await player.send(f"  {c['bright_green']}auction history{c['white']}            - Recent transactions")
-            await player.send(f"  {c['bright_green']}auction collect{c['white']}            - Collect pending gold/items")
-            await player.send(f"\n{c['yellow']}Visit {AUCTIONEER_NAME} at Market Square to trade.{c['reset']}")
-            return
-
-        sub = args[0].lower()
-
-        if sub == 'list':
-            category = args[1].lower() if len(args) > 1 else None
-            if category and category not in CATEGORIES:
-                await player.send(f"{c['yellow']}Categories: {', '.join(CATEGORIES.keys())}{c['reset']}")
-                return
-            listings = AuctionHouse.get_active_listings(category=category)
-            if not listings:
-                await player.send(f"{c['yellow']}No active listings{' in ' + category if category else ''}.{c['reset']}")
-                return
-            header = f"{'#':<5} {'Price':>9} {'Item':<30} {'Category':<12} {'Seller':<14} {'Time'}"
-            await player.send(f"\n{c['bright_cyan']}═══ Auction House Listings ═══{c['reset']}")
-            await player.send(f"  {c['white']}{header}{c['reset']}")
-            for listing in listings[:30]:
-                await player.send(AuctionHouse.format_listing(listing, c))
-            await player.send(f"{c['white']}  ({len(listings)} listing{'s' if len(listings)!=1 else ''}){c['reset']}")
-
-        elif sub == 'sell':
-            if len(args) < 3:
-                await player.send(f"{c['yellow']}Usage: auction sell <item> <price> [auction]{c['reset']}")
-                return
-
-            # Parse: last arg is price (and optionally "auction" after)
-            is_auction = args[-1].lower() == 'auction'
-            if is_auction:
-                if len(args) < 4:
-                    await player.send(f"{c['yellow']}Usage: auction sell <item> <price> auction{c['reset']}")
-                    return
-                try:
-                    price = int(args[-2])
-                except ValueError:
-                    await player.send(f"{c['red']}Invalid price.{c['reset']}")
-                    return
-                item_name = ' '.join(args[1:-2])
-            else:
-                try:
-                    price = int(args[-1])
-                except ValueError:
-                    await player.send(f"{c['red']}Invalid price. Usage: auction sell <item> <price>{c['reset']}")
-                    return
-                item_name = ' '.join(args[1:-1])
-
-            if not item_name:
-                await player.send(f"{c['yellow']}What item do you want to sell?{c['reset']}")
-                return
-
-            # Find item in inventory
-            item = None
-            for inv_item in player.inventory:
-                if item_name.lower() in inv_item.name.lower() or item_name.lower() in getattr(inv_item, 'short_desc', '').lower():
-                    item = inv_item
-                    break
-            if not item:
-                await player.send(f"{c['red']}You don't have '{item_name}' in your inventory.{c['reset']}")
-                return
-
-            result = AuctionHouse.create_listing(player, item, price, is_auction=is_auction, min_bid=max(1, price // 2) if is_auction else 0)
-            color = c['bright_green'] if result['success'] else c['red']
-            await player.send(f"{color}{result['message']}{c['reset']}")
-
-        elif sub == 'buy':
-            if len(args) < 2:
-                await player.send(f"{c['yellow']}Usage: auction buy <id>{c['reset']}")
-                return
-            try:
-                lid = int(args[1])
-            except ValueError:
-                await player.send(f"{c['red']}Invalid listing ID.{c['reset']}")
-                return
-            result = AuctionHouse.buy_listing(player, lid)
-            color = c['bright_green'] if result['success'] else c['red']
-            await player.send(f"{color}{result['message']}{c['reset']}")
-
-        elif sub == 'bid':
-            if len(args) < 3:
-                await player.send(f"{c['yellow']}Usage: auction bid <id> <amount>{c['reset']}")
-                return
-            try:
-                lid = int(args[1])
-                amount = int(args[2])
-            except ValueError:
-                await player.send(f"{c['red']}Invalid ID or amount.{c['reset']}")
-                return
-            result = AuctionHouse.place_bid(player, lid, amount)
-            color = c['bright_green'] if result['success'] else c['red']
-            await player.send(f"{color}{result['message']}{c['reset']}")
-
-        elif sub == 'cancel':
-            if len(args) < 2:
-                await player.send(f"{c['yellow']}Usage: auction cancel <id>{c['reset']}")
-                return
-            try:
-                lid = int(args[1])
-            except ValueError:
-                await player.send(f"{c['red']}Invalid listing ID.{c['reset']}")
-                return
-            result = AuctionHouse.cancel_listing(player, lid)
-            color = c['bright_green'] if result['success'] else c['red']
-            await player.send(f"{color}{result['message']}{c['reset']}")
-
-        elif sub == 'search':
-            if len(args) < 2:
-                await player.send(f"{c['yellow']}Usage: auction search <keyword>{c['reset']}")
-                return
-            keyword = ' '.join(args[1:])
-            listings = AuctionHouse.get_active_listings(keyword=keyword)
-            if not listings:
-                await player.send(f"{c['yellow']}No listings matching '{keyword}'.{c['reset']}")
-                return
-            await player.send(f"\n{c['bright_cyan']}═══ Search: '{keyword}' ═══{c['reset']}")
-            for listing in listings[:20]:
-                await player.send(AuctionHouse.format_listing(listing, c))
-            await player.send(f"{c['white']}  ({len(listings)} result{'s' if len(listings)!=1 else ''}){c['reset']}")
-
-        elif sub == 'history':
-            history = AuctionHouse.get_player_history(player.name)
-            if not history:
-                await player.send(f"{c['yellow']}No transaction history.{c['reset']}")
-                return
-            await player.send(f"\n{c['bright_cyan']}═══ Your Auction History ═══{c['reset']}")
-            for h in history[-15:]:
-                role = 'SOLD' if h.get('seller', '').lower() == player.name.lower() else 'BOUGHT'
-                color = c['bright_green'] if role == 'SOLD' else c['bright_yellow']
-                ts = datetime.fromtimestamp(h['time']).strftime('%m/%d %H:%M')
-                await player.send(f"  {color}{role:<7}{c['white']}{h['item_name']:<25} {c['yellow']}{h['price']}g {c['blue']}{ts}{c['reset']}")
-
-        elif sub == 'collect':
-            gold = AuctionHouse.collect_pending_gold(player)
-            items = AuctionHouse.collect_pending_items(player)
-            if not gold and not items:
-                await player.send(f"{c['yellow']}Nothing to collect.{c['reset']}")
-                return
-            if gold:
-                await player.send(f"{c['bright_green']}Collected {gold} gold from sales!{c['reset']}")
-            for item in items:
-                await player.send(f"{c['bright_green']}Received: {getattr(item, 'short_desc', item.name)}{c['reset']}")
-
-        else:
-            await player.send(f"{c['yellow']}Unknown auction command. Type 'auction' for help.{c['reset']}")
-
-    @classmethod
-    async def cmd_mail(cls, player: 'Player', args: List[str]):
-        """Send, read, list, and delete mail.
-
-        Usage:
-            mail send <player> <message>  - Send mail to a player
-            mail read                     - Read your unread mail
-            mail list                     - List all mail
-            mail delete <number>          - Delete a mail by ID
-        """
-        from mail_system import MailManager
-        c = player.config.COLORS
-
-        if not args:
-            await player.send(f"{c['yellow']}Usage: mail send <player> <message> | mail read | mail list | mail delete <id>{c['reset']}")
-            return
-
-        sub = args[0].lower()
-
-        if sub == 'send':
-            if len(args) < 3:
-                await player.send("Usage: mail send <player> <message>")
-                return
-            recipient = args[1].capitalize()
-            body = ' '.join(args[2:])
-            # Check if player exists (file or online)
-            player_file = os.path.join(player.config.PLAYER_DIR, f"{recipient.lower()}.json")
-            online = recipient.lower() in player.world.players if hasattr(player, 'world') and player.world else False
-            if not os.path.exists(player_file) and not online:
-                await player.send(f"{c['red']}Player '{recipient}' not found.{c['reset']}")
-                return
-            MailManager.send_mail(player.name, recipient, body)
-            await player.send(f"{c['green']}Mail sent to {recipient}.{c['reset']}")
-            # Notify if online
-            if online:
-                target = player.world.players.get(recipient.lower())
-                if target:
-                    await target.send(f"\r\n{c['bright_yellow']}You have new mail from {player.name}! Type 'mail read' to read it.{c['reset']}")
-
-        elif sub == 'read':
-            messages = MailManager.get_unread_mail(player.name)
-            if not messages:
-                await player.send(f"{c['cyan']}You have no unread mail.{c['reset']}")
-                return
-            for m in messages:
-                ts = m.get('timestamp', 'Unknown')[:16]
-                await player.send(f"\r\n{c['bright_cyan']}═══ Mail #{m['msg_id']} from {m['sender']} ({ts}) ═══{c['reset']}")
-                await player.send(f"{c['white']}{m['body']}{c['reset']}")
-                MailManager.mark_read(player.name, m['msg_id'])
-
-        elif sub == 'list':
-            messages = MailManager.get_all_mail(player.name)
-            if not messages:
-                await player.send(f"{c['cyan']}Your mailbox is empty.{c['reset']}")
-                return
-            await player.send(f"{c['bright_cyan']}═══ Mailbox ({len(messages)} messages) ═══{c['reset']}")
-            for m in messages:
-                ts = m.get('timestamp', 'Unknown')[:16]
-                read_mark = ' ' if m.get('read') else '*'
-                await player.send(f"  {c['white']}{read_mark} #{m['msg_id']:<4} From: {m['sender']:<12} {ts}{c['reset']}")
-
-        elif sub == 'delete':
-            if len(args) < 2:
-                await player.send("Usage: mail delete <id>")
-                return
-            try:
-                msg_id = int(args[1])
-            except ValueError:
-                await player.send("Invalid mail ID.")
-                return
-            if MailManager.delete_mail(player.name, msg_id):
-                await player.send(f"{c['green']}Mail #{msg_id} deleted.{c['reset']}")
-            else:
-                await player.send(f"{c['red']}Mail #{msg_id} not found.{c['reset']}")
-        else:
-            await player.send(f"{c['yellow']}Usage: mail send <player> <message> | mail read | mail list | mail delete <id>{c['reset']}")
-
-    # ==================== PLAYER TRADING ====================
-
-    @classmethod
-    async def cmd_trade(cls, player: 'Player', args: List[str]):
-        """Trade items with another player.
-
-        Usage:
-            trade <player>       - Initiate a trade with a player
-            trade offer <item>   - Add an item to your trade offer
-            trade accept         - Accept the current trade
-            trade cancel         - Cancel the trade
-        """
-        c = player.config.COLORS
-
-        if not args:
-            await player.send(f"{c['yellow']}Usage: trade <player> | trade offer <item> | trade accept | trade cancel{c['reset']}")
-            return
-
-        sub = args[0].lower()
-
-        # Initialize trade state if needed
-        if not hasattr(player, 'trade_partner'):
-            player.trade_partner = None
-            player.trade_offer = []
-            player.trade_accepted = False
-            player.trade_request_from = None
-
-        if sub == 'accept' and not getattr(player, 'trade_partner', None):
-            # Accept incoming trade request
-            requester = getattr(player, 'trade_request_from', None)
-            if not requester:
-                await player.send("No pending trade requests.")
-                return
-            # Start the trade
-            player.trade_partner = requester
-            player.trade_offer = []
-            player.trade_accepted = False
-            requester.trade_partner = player
-            requester.trade_offer = []
-            requester.trade_accepted = False
-            player.trade_request_from = None
-            await player.send(f"{c['green']}Trade started with {requester.name}. Use 'trade offer <item>' to add items.{c['reset']}")
-            await requester.send(f"{c['green']}{player.name} accepted your trade! Use 'trade offer <item>' to add items.{c['reset']}")
-            return
-
-        if sub == 'cancel':
-            partner = getattr(player, 'trade_partner', None)
-            if partner:
-                # Return offered items
-                for item in getattr(player, 'trade_offer', []):
-                    player.inventory.append(item)
-                for item in getattr(partner, 'trade_offer', []):
-                    partner.inventory.append(item)
-                await partner.send(f"{c['red']}{player.name} cancelled the trade.{c['reset']}")
-                partner.trade_partner = None
-                partner.trade_offer = []
-                partner.trade_accepted = False
-            player.trade_partner = None
-            player.trade_offer = []
-            player.trade_accepted = False
-            player.trade_request_from = None
-            await player.send(f"{c['yellow']}Trade cancelled.{c['reset']}")
-            return
-
-        if sub == 'offer':
-            partner = getattr(player, 'trade_partner', None)
-            if not partner:
-                await player.send("You're not in a trade. Start one with 'trade <player>'.")
-                return
-            if len(args) < 2:
-                await player.send("Offer what? Usage: trade offer <item>")
-                return
-            item_name = ' '.join(args[1:]).lower()
-            item = None
-            for i in player.inventory:
-                if item_name in i.name.lower() or item_name in i.short_desc.lower():
-                    item = i
-                    break
-            if not item:
-                await player.send("You don't have that item.")
-                return
-            player.inventory.remove(item)
-            player.trade_offer.append(item)
-            # Reset acceptance when offer changes
-            player.trade_accepted = False
-            partner.trade_accepted = False
-            await player.send(f"{c['green']}You offer {item.short_desc}.{c['reset']}")
-            await partner.send(f"{c['cyan']}{player.name} offers {item.short_desc}.{c['reset']}")
-            # Show trade status
-            await cls._show_trade_status(player)
-            await cls._show_trade_status(partner)
-            return
-
-        if sub == 'accept' or sub == 'ok':
-            partner = getattr(player, 'trade_partner', None)
-            if not partner:
-                await player.send("You're not in a trade.")
-                return
-            player.trade_accepted = True
-            await partner.send(f"{c['green']}{player.name} has accepted the trade.{c['reset']}")
-            await player.send(f"{c['green']}You accept the trade. Waiting for {partner.name}...{c['reset']}")
-            # Check if both accepted
-            if getattr(partner, 'trade_accepted', False):
-                # Complete the trade
-                for item in player.trade_offer:
-                    partner.inventory.append(item)
-                for item in partner.trade_offer:
-                    player.inventory.append(item)
-                await player.send(f"{c['bright_green']}Trade complete!{c['reset']}")
-                await partner.send(f"{c['bright_green']}Trade complete!{c['reset']}")
-                player.trade_partner = None
-                player.trade_offer = []
-                player.trade_accepted = False
-                partner.trade_partner = None
-                partner.trade_offer = []
-                partner.trade_accepted = False
-            return
-
-        # Initiate trade with a player
-        target_name = sub.capitalize()
-        if not player.room:
-            return
-        target = None
-        for ch in player.room.characters:
-            if hasattr(ch, 'connection') and ch.name.lower() == target_name.lower() and ch != player:
-                target = ch
-                break
-        if not target:
-            await player.send(f"{c['red']}{target_name} is not here.{c['reset']}")
-            return
-        if getattr(player, 'trade_partner', None):
-            await player.send("You're already in a trade. Cancel first.")
-            return
-        # Send request
-        if not hasattr(target, 'trade_request_from'):
-            target.trade_request_from = None
-        target.trade_request_from = player
-        await player.send(f"{c['cyan']}You request a trade with {target.name}.{c['reset']}")
-        await target.send(f"\r\n{c['bright_cyan']}{player.name} wants to trade with you. Type 'trade accept' or 'trade cancel'.{c['reset']}")
-
-    @classmethod
-    async def _show_trade_status(cls, player: 'Player'):
-        """Show the current trade offers to a player."""
-        c = player.config.COLORS
-        partner = player.trade_partner
-        if not partner:
-            return
-        your_items = ', '.join(i.short_desc for i in getattr(player, 'trade_offer', [])) or 'nothing'
-        their_items = ', '.join(i.short_desc for i in getattr(partner, 'trade_offer', [])) or 'nothing'
-        await player.send(f"{c['cyan']}  Your offer: {c['white']}{your_items}{c['reset']}")
-        await player.send(f"{c['cyan']}  Their offer: {c['white']}{their_items}{c['reset']}")
-
-    # ==================== DUELING ====================
-
-    @classmethod
-    async def cmd_duel(cls, player: 'Player', args: List[str]):
-        """Challenge another player to a duel.
-
-        Usage:
-            duel <player> [gold]  - Challenge a player (optional gold wager)
-            duel accept           - Accept a duel challenge
-        """
-        c = player.config.COLORS
-
-        if not args:
-            await player.send(f"{c['yellow']}Usage: duel <player> [gold wager] | duel accept{c['reset']}")
-            return
-
-        sub = args[0].lower()
-
-        if not hasattr(player, 'duel_challenge_from'):
-            player.duel_challenge_from = None
-            player.duel_wager = 0
-
-        if sub == 'accept':
-            challenger = getattr(player, 'duel_challenge_from', None)
-            if not challenger:
-                await player.send("No pending duel challenges.")
-                return
-            if challenger.room != player.room:
-                await player.send("Your challenger is no longer here.")
-                player.duel_challenge_from = None
-                return
-            wager = getattr(player, 'duel_wager', 0)
-            if wager > 0:
-                if player.gold < wager:
-                    await player.send(f"{c['red']}You don't have {wager} gold for the wager!{c['reset']}")
-                    return
-                if challenger.gold < wager:
-                    await player.send(f"{c['red']}{challenger.name} can no longer afford the wager!{c['reset']}")
-                    return
-
-            # Start duel
-            player.duel_challenge_from = None
-            player.dueling = challenger
-            challenger.dueling = player
-            player.duel_wager_amount = wager
-            challenger.duel_wager_amount = wager
-
-            await player.room.send_to_room(
-                f"{c['bright_yellow']}═══ DUEL ═══ {challenger.name} vs {player.name}!"
-                + (f" Wager: {wager} gold!" if wager else "")
-                + f"{c['reset']}"
-            )
-
-            # Start combat (special duel mode)
-            from combat import CombatHandler
-            player.fighting = challenger
-            challenger.fighting = player
-            player.position = 'fighting'
-            challenger.position = 'fighting'
-            await CombatHandler.one_round(challenger, player)
-            return
-
-        # Challenge a player
-        target_name = sub.capitalize()
-        wager = 0
-        if len(args) >= 2:
-            try:
-                wager = int(args[1])
-                if wager < 0:
-                    wager = 0
-            except ValueError:
-                pass
-
-        if not player.room:
-            return
-        target = None
-        for ch in player.room.characters:
-            if hasattr(ch, 'connection') and ch.name.lower() == target_name.lower() and ch != player:
-                target = ch
-                break
-        if not target:
-            await player.send(f"{c['red']}{target_name} is not here.{c['reset']}")
-            return
-
-        if wager > 0 and player.gold < wager:
-            await player.send(f"{c['red']}You don't have {wager} gold to wager!{c['reset']}")
-            return
-
-        if not hasattr(target, 'duel_challenge_from'):
-            target.duel_challenge_from = None
-            target.duel_wager = 0
-        target.duel_challenge_from = player
-        target.duel_wager = wager
-
-        wager_msg = f" for a wager of {c['yellow']}{wager} gold{c['reset']}" if wager else ""
-        await player.send(f"{c['cyan']}You challenge {target.name} to a duel{wager_msg}!{c['reset']}")
-        await target.send(f"\r\n{c['bright_yellow']}{player.name} challenges you to a duel{wager_msg}! Type 'duel accept' to accept.{c['reset']}")
-
-    # =========================================================================
-    # PVP ARENA COMMANDS
-    # =========================================================================
-
-    @classmethod
-    async def cmd_challenge(cls, player: 'Player', args: List[str]):
-        """Challenge another player to an arena duel. Both must be in the Arena Lobby."""
-        from arena import ArenaManager
-        await ArenaManager.cmd_challenge(player, args)
-
-    @classmethod
-    async def cmd_accept(cls, player: 'Player', args: List[str]):
-        """Accept a pending arena challenge."""
-        from arena import ArenaManager
-        await ArenaManager.cmd_accept(player, args)
-
-    @classmethod
-    async def cmd_decline(cls, player: 'Player', args: List[str]):
-        """Decline a pending arena challenge."""
-        from arena import ArenaManager
-        await ArenaManager.cmd_decline(player, args)
-
-    @classmethod
-    async def cmd_arena(cls, player: 'Player', args: List[str]):
-        """Arena system: join queue, view stats, leaderboard.
-
-        Usage:
-            arena join   — Queue for random matchmaking
-            arena leave  — Leave the queue
-            arena stats  — View your PvP record
-            arena top    — Leaderboard (top 10)
-        """
-        from arena import ArenaManager
-        await ArenaManager.cmd_arena(player, args)
-
-    # =========================================================================
-    # WAVE 2 CLASS REWORK - New Commands
-    # =========================================================================
-
-    # ----- MAGE: Arcane Charge Abilities -----
-
-    @classmethod
-    async def cmd_arcane_barrage(cls, player: 'Player', args: List[str]):
-        """Consume ALL Arcane Charges. Deals (charges * int * 2) arcane damage. No cooldown. Mage only."""
-        c = player.config.COLORS
-        import random
-
-        if player.char_class.lower() != 'mage':
-            await player.send(f"{c['red']}Only mages can use Arcane Barrage!{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
-            return
-
-        charges = getattr(player, 'arcane_charges', 0)
-        if charges <= 0:
-            await player.send(f"{c['red']}You have no Arcane Charges to consume!{c['reset']}")
-            return
-
-        target = player.fighting
-        damage = charges * player.int * 2
-
-        # Arcane Mastery: guaranteed crit at 6 charges
-        is_crit = False
-        try:
-            from talents import TalentManager
-            if TalentManager.get_talent_rank(player, 'arcane_mastery') > 0 and charges >= 6:
-                is_crit = True
-        except Exception:
-            pass
-        if is_crit:
-            damage = int(damage * 2)
-
-        player.arcane_charges = 0
-
-        # Arcane Echo: 25% chance to refund 2 charges
-        try:
-            from talents import TalentManager
-            if TalentManager.get_talent_rank(player, 'arcane_echo') > 0 and random.randint(1, 100) <= 25:
-                player.arcane_charges = 2
-                await player.send(f"{c['bright_cyan']}✨ Arcane Echo! 2 charges refunded!{c['reset']}")
-        except Exception:
-            pass
-
-        crit_msg = " **CRIT**" if is_crit else ""
-        await player.send(f"{c['bright_magenta']}✨ ARCANE BARRAGE! You unleash {charges} charges at {target.name}! [{damage}]{crit_msg}{c['reset']}")
-        if hasattr(target, 'send'):
-            await target.send(f"{c['bright_magenta']}{player.name} unleashes an arcane barrage at you! [{damage}]{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name} unleashes a barrage of arcane energy!", exclude=[player, target])
-
-        killed = await target.take_damage(damage, player)
-        if killed:
-            from combat import CombatHandler
-            await CombatHandler.handle_death(player, target)
-
-    @classmethod
-    async def cmd_evocation(cls, player: 'Player', args: List[str]):
-        """Restore 30% max mana + reset charges to 0. 120s CD. Mage only."""
-        c = player.config.COLORS
-        import time
-
-        if player.char_class.lower() != 'mage':
-            await player.send(f"{c['red']}Only mages can use Evocation!{c['reset']}")
-            return
-
-        now = time.time()
-        cd = getattr(player, 'evocation_cooldown', 0)
-        if now < cd:
-            await player.send(f"{c['yellow']}Evocation on cooldown ({int(cd - now)}s).{c['reset']}")
-            return
-
-        player.evocation_cooldown = now + 120
-        restored = int(player.max_mana * 0.30)
-        player.mana = min(player.max_mana, player.mana + restored)
-        player.arcane_charges = 0
-
-        await player.send(f"{c['bright_cyan']}✨ EVOCATION! You channel arcane energy, restoring {restored} mana!{c['reset']}")
-        await player.send(f"{c['cyan']}Arcane Charges reset to 0. [Mana: {player.mana}/{player.max_mana}]{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name} channels a surge of arcane energy!", exclude=[player])
-
-    @classmethod
-    async def cmd_arcane_blast(cls, player: 'Player', args: List[str]):
-        """int*3 + (charges * int) damage. Generates +1 charge. 8s CD. Mage only."""
-        c = player.config.COLORS
-        import time
-
-        if player.char_class.lower() != 'mage':
-            await player.send(f"{c['red']}Only mages can use Arcane Blast!{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
-            return
-
-        now = time.time()
-        cd = getattr(player, 'arcane_blast_cooldown', 0)
-        if now < cd:
-            await player.send(f"{c['yellow']}Arcane Blast on cooldown ({int(cd - now)}s).{c['reset']}")
-            return
-
-        charges = getattr(player, 'arcane_charges', 0)
-        mana_cost = 20 + int(20 * charges * 0.10)  # +10% per charge
-
-        # Arcane stability reduces the cost increase
-        try:
-            from talents import TalentManager
-            stability = TalentManager.get_talent_rank(player, 'arcane_stability')
-            mana_cost = 20 + int(20 * charges * max(0, 0.10 - stability * 0.02))
-        except Exception:
-            pass
-
-        if player.mana < mana_cost:
-            await player.send(f"{c['red']}You need {mana_cost} mana! (Current: {player.mana}){c['reset']}")
-            return
-
-        target = player.fighting
-        player.mana -= mana_cost
-        player.arcane_blast_cooldown = now + 8
-
-        damage = player.int * 3 + charges * player.int
-
-        # Charge damage bonus from arcane_potency
-        try:
-            from talents import TalentManager
-            potency = TalentManager.get_talent_rank(player, 'arcane_potency')
-            if potency > 0 and charges > 0:
-                damage += int(charges * player.int * potency * 0.01)
-        except Exception:
-            pass
-
-        # Generate a charge
-        max_charges = getattr(player, 'max_arcane_charges', 5)
-        try:
-            from talents import TalentManager
-            if TalentManager.get_talent_rank(player, 'arcane_mastery') > 0:
-                max_charges = 6
-        except Exception:
-            pass
-        if player.arcane_charges < max_charges:
-            player.arcane_charges += 1
-            await player.send(f"{c['bright_cyan']}[Arcane Charges: {player.arcane_charges}/{max_charges}]{c['reset']}")
-
-        await player.send(f"{c['bright_magenta']}✨ ARCANE BLAST hits {target.name}! [{damage}]{c['reset']}")
-        if hasattr(target, 'send'):
-            await target.send(f"{c['bright_magenta']}{player.name} blasts you with arcane energy! [{damage}]{c['reset']}")
-
-        killed = await target.take_damage(damage, player)
-        if killed:
-            from combat import CombatHandler
-            await CombatHandler.handle_death(player, target)
-
-    # ----- WARRIOR: Battle Cry -----
-
-    @classmethod
-    async def cmd_battle_cry(cls, player: 'Player', args: List[str]):
-        """Legacy ability. Replaced by Combo Chain system. See HELP WARRIOR."""
-        c = player.config.COLORS
-        await player.send(f"{c['yellow']}Battle Cry has been replaced by the Combo Chain system. See 'help warrior'.{c['reset']}")
-
-    # ----- BARD: Inspiration Abilities -----
-
-    @classmethod
-    async def cmd_crescendo(cls, player: 'Player', args: List[str]):
-        """Massive sonic damage (int*5). Costs 5 Inspiration. 20s CD. Bard only."""
-        c = player.config.COLORS
-        import time
-
-        if player.char_class.lower() != 'bard':
-            await player.send(f"{c['red']}Only bards can use Crescendo!{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
-            return
-
-        now = time.time()
-        cd = getattr(player, 'crescendo_cooldown', 0)
-        if now < cd:
-            await player.send(f"{c['yellow']}Crescendo on cooldown ({int(cd - now)}s).{c['reset']}")
-            return
-        if getattr(player, 'inspiration', 0) < 5:
-            await player.send(f"{c['red']}You need 5 Inspiration! (Current: {player.inspiration}){c['reset']}")
-            return
-
-        target = player.fighting
-        player.inspiration -= 5
-        player.crescendo_cooldown = now + 20
-
-        damage = player.int * 5
-        await player.send(f"{c['bright_yellow']}🎵 CRESCENDO! A devastating wave of sound strikes {target.name}! [{damage}]{c['reset']}")
-        if hasattr(target, 'send'):
-            await target.send(f"{c['bright_yellow']}{player.name}'s music hits you like a wall of sound! [{damage}]{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name}'s music builds to a devastating crescendo!", exclude=[player, target])
-
-        killed = await target.take_damage(damage, player)
-        if killed:
-            from combat import CombatHandler
-            await CombatHandler.handle_death(player, target)
-
-    @classmethod
-    async def cmd_magnum_opus(cls, player: 'Player', args: List[str]):
-        """AoE party buff: +20% damage/healing/DR for 20s. Costs 10 Inspiration. 180s CD. Bard only."""
-        c = player.config.COLORS
-        import time
-
-        if player.char_class.lower() != 'bard':
-            await player.send(f"{c['red']}Only bards can perform a Magnum Opus!{c['reset']}")
-            return
-
-        now = time.time()
-        cd = getattr(player, 'magnum_opus_cooldown', 0)
-        if now < cd:
-            await player.send(f"{c['yellow']}Magnum Opus on cooldown ({int(cd - now)}s).{c['reset']}")
-            return
-        if getattr(player, 'inspiration', 0) < 10:
-            await player.send(f"{c['red']}You need 10 Inspiration! (Current: {player.inspiration}){c['reset']}")
-            return
-
-        player.inspiration -= 10
-        player.magnum_opus_cooldown = now + 180
-
-        from affects import AffectManager
-
-        # Buff self and group
-        targets = [player]
-        if player.group:
-            for member in player.group.members:
-                if member != player and member.room == player.room:
-                    targets.append(member)
-
-        for t in targets:
-            AffectManager.apply_affect(t, {
-                'name': 'magnum_opus_dmg', 'type': AffectManager.TYPE_MODIFY_STAT,
-                'applies_to': 'damroll', 'value': max(1, int(t.get_damage_bonus() * 0.20)),
-                'duration': 10, 'caster_level': player.level
-            })
-            AffectManager.apply_affect(t, {
-                'name': 'magnum_opus_dr', 'type': AffectManager.TYPE_MODIFY_STAT,
-                'applies_to': 'damage_reduction', 'value': 20,
-                'duration': 10, 'caster_level': player.level
-            })
-            if hasattr(t, 'send') and t != player:
-                await t.send(f"{c['bright_yellow']}🎵 {player.name}'s Magnum Opus empowers you! +20% damage, +20% DR!{c['reset']}")
-
-        await player.send(f"{c['bright_yellow']}🎵 MAGNUM OPUS! Your masterwork empowers {len(targets)} allies! +20% damage, +20% DR for 20s!{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"🎵 {player.name} performs a magnificent Magnum Opus!", exclude=[player])
-
-    @classmethod
-    async def cmd_discordant_note(cls, player: 'Player', args: List[str]):
-        """Silence target 2 rounds + int*3 sonic damage. Costs 4 Inspiration. 25s CD. Bard only."""
-        c = player.config.COLORS
-        import time
-
-        if player.char_class.lower() != 'bard':
-            await player.send(f"{c['red']}Only bards can use Discordant Note!{c['reset']}")
-            return
-        if not player.is_fighting:
-            await player.send(f"{c['red']}You must be fighting!{c['reset']}")
-            return
-
-        now = time.time()
-        cd = getattr(player, 'discordant_note_cooldown', 0)
-        if now < cd:
-            await player.send(f"{c['yellow']}Discordant Note on cooldown ({int(cd - now)}s).{c['reset']}")
-            return
-        if getattr(player, 'inspiration', 0) < 4:
-            await player.send(f"{c['red']}You need 4 Inspiration! (Current: {player.inspiration}){c['reset']}")
-            return
-
-        target = player.fighting
-        player.inspiration -= 4
-        player.discordant_note_cooldown = now + 25
-
-        damage = player.int * 3
-
-        # Silence effect
-        silence_rounds = 2
-        try:
-            from talents import TalentManager
-            if TalentManager.get_talent_rank(player, 'discordant_mastery') > 0:
-                silence_rounds = 3
-        except Exception:
-            pass
-
-        from affects import AffectManager
-        AffectManager.apply_affect(target, {
-            'name': 'silenced', 'type': AffectManager.TYPE_FLAG,
-            'applies_to': 'silenced', 'value': 1,
-            'duration': silence_rounds, 'caster_level': player.level
-        })
-
-        await player.send(f"{c['bright_yellow']}🎵 DISCORDANT NOTE! {target.name} is silenced for {silence_rounds} rounds! [{damage}]{c['reset']}")
-        if hasattr(target, 'send'):
-            await target.send(f"{c['bright_yellow']}{player.name}'s jarring note silences you! [{damage}]{c['reset']}")
-        if player.room:
-            await player.room.send_to_room(f"{player.name} strikes a discordant note at {target.name}!", exclude=[player, target])
-
-        killed = await target.take_damage(damage, player)
-        if killed:
-            from combat import CombatHandler
-            await CombatHandler.handle_death(player, target)
-
-    # ==================== WORLD EVENTS ====================
-
-    @classmethod
-    async def cmd_events(cls, player: 'Player', args: List[str]):
-        """Show active world events and time remaining."""
-        c = player.config.COLORS
-        em = getattr(player.world, 'event_manager', None)
-        if not em:
-            await player.send(f"{c['yellow']}No event system available.{c['reset']}")
-            return
-
-        summaries = em.get_active_summaries()
-        if not summaries:
-            await player.send(f"{c['cyan']}There are no active world events right now.{c['reset']}")
-            await player.send(f"{c['white']}Events trigger automatically every 30-60 minutes.{c['reset']}")
-            return
-
-        await player.send(f"\n{c['bright_cyan']}═══ Active World Events ═══{c['reset']}")
-        for s in summaries:
-            await player.send(f"  {c['bright_white']}{s}{c['reset']}")
-        await player.send("")
-
-    @classmethod
-    async def cmd_wevent(cls, player: 'Player', args: List[str]):
-        """Immortal command to manage world events.
-        Usage: wevent start <type> | wevent stop [type] | wevent list | wevent log
-        Types: invasion, world_boss, treasure_hunt, double_xp, weather, storm, fog, blizzard
-        """
-        c = player.config.COLORS
-
-        if not player.is_immortal:
-            await player.send("Huh?!?")
-            return
-
-        em = getattr(player.world, 'event_manager', None)
-        if not em:
-            await player.send(f"{c['red']}Event system not initialized.{c['reset']}")
-            return
-
-        if not args:
-            await player.send(f"{c['yellow']}Usage: wevent start <type> | wevent stop [type] | wevent list | wevent log{c['reset']}")
-            await player.send(f"{c['white']}Types: invasion, world_boss, treasure_hunt, double_xp, weather, storm, fog, blizzard{c['reset']}")
-            return
-
-        sub = args[0].lower()
-
-        if sub == 'start':
-            if len(args) < 2:
-                await player.send(f"{c['yellow']}Usage: wevent start <type>{c['reset']}")
-                await player.send(f"{c['white']}Types: invasion, world_boss, treasure_hunt, double_xp, weather, storm, fog, blizzard{c['reset']}")
-                return
-            event_type = args[1].lower()
-            event = await em.start_event(event_type)
-            if event:
-                await player.send(f"{c['bright_green']}Started {event.event_type} event!{c['reset']}")
-            else:
-                await player.send(f"{c['red']}Failed to start event. Unknown type or duplicate already active.{c['reset']}")
-
-        elif sub == 'stop':
-            event_type = args[1].lower() if len(args) > 1 else None
-            stopped = await em.stop_event(event_type)
-            if stopped:
-                await player.send(f"{c['bright_green']}Event(s) stopped.{c['reset']}")
-            else:
-                await player.send(f"{c['yellow']}No matching active events to stop.{c['reset']}")
-
-        elif sub == 'list':
-            summaries = em.get_active_summaries()
-            if not summaries:
-                await player.send(f"{c['cyan']}No active events.{c['reset']}")
-            else:
-                await player.send(f"\n{c['bright_cyan']}═══ Active World Events ═══{c['reset']}")
-                for s in summaries:
-                    await player.send(f"  {c['bright_white']}{s}{c['reset']}")
-
-        elif sub == 'log':
-            log = em.get_log(20)
-            if not log:
-                await player.send(f"{c['cyan']}No event history yet.{c['reset']}")
-            else:
-                await player.send(f"\n{c['bright_cyan']}═══ Event History (last 20) ═══{c['reset']}")
-                import datetime
-                for entry in reversed(log):
-                    ts = datetime.datetime.fromtimestamp(entry['time']).strftime('%H:%M:%S')
-                    await player.send(f"  {c['white']}[{ts}] {entry['type']} — {entry['status']}{c['reset']}")
-
-        else:
-            await player.send(f"{c['yellow']}Usage: wevent start <type> | wevent stop [type] | wevent list | wevent log{c['reset']}")
-
-
-    # =========================================================================
-    # PRESTIGE CLASS SYSTEM
-    # =========================================================================
-
-    @classmethod
-    async def cmd_specialize(cls, player: 'Player', args: List[str]):
-        """Choose your prestige class specialization at level 50.
-        
-        Usage: specialize [class name]
-        Type 'specialize' alone to see available options.
-        """
-        from prestige import cmd_specialize
-        await cmd_specialize(player, args)
-
-    @classmethod
-    async def cmd_respec(cls, player: 'Player', args: List[str]):
-        """Reset your prestige specialization for 50,000 gold.
-        
-        Usage: respec
-        """
-        from prestige import cmd_respec
-        await cmd_respec(player, args)
-
-    @classmethod
-    async def cmd_prestige(cls, player: 'Player', args: List[str]):
-        """View your prestige class info and abilities.
-        
-        Usage: prestige
-        """
-        from prestige import cmd_prestige
-        await cmd_prestige(player, args)
+# Index the group modules without importing them; see command_registry.py
+CommandHandler.groups = CommandGroups(CommandHandler, command_groups)
+CommandHandler.registry = CommandRegistry(CommandHandler, CommandHandler.ALIASES,
+                                          CommandHandler.COMMAND_ALIASES, CommandHandler.groups)
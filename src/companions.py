@@ -244,6 +244,10 @@ class Companion(Mobile):
                     self.order = 'stay'
                     self.ai_state['staying'] = True
 
+    def ai_think_delay(self):
+        """Companions follow and guard their owner, so they think every pulse."""
+        return 1
+
     async def process_ai(self):
         """Companion AI behavior."""
         if not self.is_alive:
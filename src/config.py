@@ -14,12 +14,48 @@ class Config:
     HOST = '0.0.0.0'
     MAX_PLAYERS = 100
     TICKS_PER_SECOND = 10
+    SHARDS = 0  # Zone-shard worker processes (0 = single-process mode)
+    EVENT_LOOP = 'asyncio'  # 'asyncio', 'uvloop' or 'auto' (uvloop if installed); --loop overrides
+
+    # Per-connection outbound queue (bytes not yet accepted by the socket).
+    # Past the high-water mark low-priority output (ambient, channels) is
+    # dropped; past the limit the client is disconnected as link-dead.
+    OUTBOUND_HIGH_WATER = 64 * 1024
+    OUTBOUND_LIMIT = 512 * 1024
+    OUTBOUND_CLOSE_TIMEOUT = 5.0  # Seconds to finish sending on disconnect
+
+    # Input is queued per connection and run on the game pulse: at most one
+    # command per connection per pulse, round-robin, within a pulse budget.
+    INPUT_QUEUE_LIMIT = 50         # Lines held per connection; extra lines are dropped
+    INPUT_COMMANDS_PER_PULSE = 200  # Commands run per pulse across all connections
+
+    # Every command is timed per resolved name (cmdstats, dashboard). Runs
+    # slower than SLOW_COMMAND_MS are logged with the player and arguments.
+    SLOW_COMMAND_MS = 50
+    SLOW_COMMAND_LOG = 100          # Recent slow commands kept for 'cmdstats slow'
+    COMMAND_ALLOC_TRACKING = False  # Peak allocation per command via tracemalloc (slow)
+
+    # Connections with no input for this long are timed out (players are
+    # force-rented first) by one shared reaper. Sessions that have not
+    # entered the game yet (login, character creation, the account menu)
+    # get the much shorter login timeout.
+    IDLE_TIMEOUT_SECONDS = 1800
+    LOGIN_TIMEOUT_SECONDS = 120
+    IDLE_CHECK_SECONDS = 1
+
+    # Site bans: addresses and CIDR ranges, one per line (reload: ipban reload).
+    # An IP opening more than CONNECT_RATE_LIMIT connections per window is
+    # refused; loopback is exempt because the web client connects from it.
+    CONNECT_RATE_LIMIT = 10
+    CONNECT_RATE_WINDOW = 60
+    CONNECT_RATE_EXEMPT = ('127.0.0.1', '::1')
     
     # Paths
     BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     WORLD_DIR = os.path.join(BASE_DIR, 'world')
     PLAYER_DIR = os.path.join(BASE_DIR, 'lib', 'players')
     LOG_DIR = os.path.join(BASE_DIR, 'log')
+    BAN_FILE = os.path.join(BASE_DIR, 'lib', 'banned_ips.txt')
 
     # Web map settings
     MAP_PORT = 4001
@@ -87,6 +123,9 @@ class Config:
     FLEE_MOVE_COST = 10
     ESCAPE_MOVE_COST = 12
     DISENGAGE_MOVE_COST = 6
+
+    # Speedwalk ('run 3n2e', 'run to <waypoint>'): most steps in one batch
+    SPEEDWALK_MAX_STEPS = 50
     COMBAT_FATIGUE_HIT_PENALTY = 2
     COMBAT_FATIGUE_DAMAGE_PENALTY = 0.10
 
@@ -94,6 +133,19 @@ class Config:
     ESCAPE_COOLDOWN_SECONDS = 8
     DISENGAGE_COOLDOWN_SECONDS = 6
     RESCUE_COOLDOWN_SECONDS = 6
+
+    # Skill lag (CircleMUD's WAIT_STATE): after using one of these, a
+    # player's queued commands wait this long before the next one runs.
+    # Typed-ahead commands are held, not dropped; cooldowns still apply.
+    WAIT_STATE_SECONDS = {
+        'bash': 2.0,
+        'kick': 1.5,
+        'trip': 1.5,
+        'disarm': 1.5,
+        'rescue': 1.5,
+        'backstab': 1.0,
+        'cast': 1.0,
+    }
     PROTECT_INTERCEPT_COOLDOWN_SECONDS = 4
 
     # Second Wind (mobility recovery)
@@ -161,6 +213,13 @@ class Config:
     # Tick intervals (seconds)
     AFFECT_TICK_SECONDS = 6    # DOT/HOT effects tick rate
     POISON_TICK_SECONDS = 3    # Poison tick rate (faster feedback)
+    DECAY_TICK_SECONDS = 6     # Corpse/ground item decay tick rate
+
+    # Zone hibernation: zones with no players (or player-owned pets and
+    # companions) for this long stop running NPC AI, affects and decay
+    # until someone walks back in.
+    ZONE_HIBERNATE_SECONDS = 600
+    ZONE_HIBERNATE_CHECK_SECONDS = 30
     
     # Colors (ANSI)
     COLORS = {
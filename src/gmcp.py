@@ -0,0 +1,119 @@
+"""
+Misthollow GMCP
+==============
+Generic MUD Communication Protocol (telnet option 201).
+
+GMCP carries structured game state next to the text stream as
+``IAC SB GMCP <Package.Name> <json> IAC SE``. The server sends:
+
+    Char.Vitals     hp/maxhp/mana/maxmana/move/maxmove (changed keys only)
+    Room.Info       num/name/area/exits, whenever the room changes
+    Combat.Target   name/hp/maxhp/pct of the current opponent; {} when
+                    combat ends
+
+Each package is sent only when its values differ from what the client last
+got, so a quiet player costs no GMCP traffic at all.
+"""
+
+import json
+import logging
+from typing import Dict, Optional, Set
+
+from telnet import OPT_GMCP, subneg
+
+logger = logging.getLogger('Misthollow.GMCP')
+
+def gmcp_message(package: str, data=None) -> bytes:
+    """Encode one GMCP message as a telnet subnegotiation."""
+    body = package if data is None else f"{package} {json.dumps(data, separators=(',', ':'))}"
+    return subneg(OPT_GMCP, body.encode('utf-8'))
+
+
+def parse_gmcp(payload: bytes):
+    """Split a client message into (package, data); data is None if absent/invalid."""
+    text = payload.decode('utf-8', errors='replace').strip()
+    package, _, body = text.partition(' ')
+    if not body:
+        return package, None
+    try:
+        return package, json.loads(body)
+    except ValueError:
+        return package, None
+
+
+class GMCPSession:
+    """Per-connection GMCP state: what the client supports and was last sent."""
+
+    __slots__ = ('supports', 'client', '_sent')
+
+    def __init__(self):
+        self.supports: Optional[Set[str]] = None  # None = everything
+        self.client = None
+        self._sent: Dict[str, dict] = {}
+
+    def handle(self, payload: bytes):
+        """Apply a client message (Core.Hello / Core.Supports.*)."""
+        package, data = parse_gmcp(payload)
+        name = package.lower()
+        if name == 'core.hello' and isinstance(data, dict):
+            self.client = data.get('client')
+        elif name in ('core.supports.set', 'core.supports.add', 'core.supports.remove'):
+            modules = {str(item).split()[0] for item in data or () if str(item).strip()}
+            if name == 'core.supports.set':
+                self.supports = modules
+            elif name == 'core.supports.add':
+                self.supports = (self.supports or set()) | modules
+            elif self.supports is not None:
+                self.supports -= modules
+            # Resend everything the client now wants
+            self._sent.clear()
+
+    def wants(self, package: str) -> bool:
+        if self.supports is None:
+            return True
+        return package.split('.')[0] in self.supports
+
+    def delta(self, package: str, values: dict, partial: bool = True) -> bytes:
+        """Encoded message for the values that changed, or b'' if none did.
+
+        With ``partial`` only the changed keys are sent; otherwise the whole
+        package is resent when anything in it changed.
+        """
+        if not self.wants(package):
+            return b''
+        last = self._sent.get(package)
+        if last == values:
+            return b''
+        self._sent[package] = values
+        if partial and last and values:
+            changed = {k: v for k, v in values.items() if last.get(k) != v}
+            return gmcp_message(package, changed)
+        return gmcp_message(package, values)
+
+    def update(self, player) -> bytes:
+        """Deltas for every package, concatenated, for one player."""
+        out = self.delta('Char.Vitals', {
+            'hp': player.hp, 'maxhp': player.max_hp,
+            'mana': player.mana, 'maxmana': player.max_mana,
+            'move': player.move, 'maxmove': player.max_move,
+        })
+
+        room = player.room
+        last_room = self._sent.get('Room.Info')
+        if room is not None and (not last_room or last_room['num'] != room.vnum):
+            out += self.delta('Room.Info', {
+                'num': room.vnum,
+                'name': room.name,
+                'area': room.zone.name if room.zone else '',
+                'exits': {d: e.get('to_room') for d, e in room.get_visible_exits(player).items()},
+            }, partial=False)
+
+        enemy = player.fighting if player.is_fighting else None
+        if enemy is not None:
+            max_hp = enemy.max_hp or 1
+            target = {'name': enemy.name, 'hp': enemy.hp, 'maxhp': enemy.max_hp,
+                      'pct': max(0, int(enemy.hp * 100 / max_hp))}
+        else:
+            target = {}
+        out += self.delta('Combat.Target', target)
+        return out
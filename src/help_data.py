@@ -2968,6 +2968,17 @@ HELP_TOPICS = {'auction': {'category': 'command',
                       'mana': 70,
                       'syntax': "cast 'spell reflection'",
                       'title': 'Spell Reflection'},
+ 'speedwalk': {'category': 'command',
+               'description': 'Walk several rooms in one go.\n\n'
+                              'Usage:\n'
+                              '    run <path>          - e.g. run 3n2e or run n n e u\n'
+                              '    run to <waypoint>   - Walk the shortest known way to a discovered waypoint\n\n'
+                              'Everything that happens in a room still happens on the way (traps, quests,\n'
+                              'waypoints, followers), but you only see the room you stop in. The walk\n'
+                              'stops early if a step fails or something gets in your way.\n\n'
+                              'See also: HELP TRAVEL, HELP WAYPOINTS',
+               'syntax': 'run <path> | run to <waypoint>',
+               'title': 'Speedwalk'},
  'spells': {'category': 'command', 'description': 'Show known spells.', 'syntax': 'spells', 'title': 'Spells'},
  'split': {'category': 'command',
            'description': 'Split gold with your group. Usage: split <amount>',
@@ -5112,6 +5123,7 @@ HELP_CATEGORIES = {'class': ['assassin', 'bard', 'cleric', 'mage', 'necromancer'
              'songs',
              'soulstone',
              'south',
+             'speedwalk',
              'spells',
              'split',
              'stable',
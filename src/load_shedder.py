@@ -0,0 +1,142 @@
+"""
+Misthollow Load Shedder
+======================
+Overload controller for the main game loop.
+
+The loop reports every pulse's elapsed time. When a sustained share of
+recent pulses overruns the pulse budget, the shedder raises its level and
+optional work is skipped in priority order:
+
+    level 1  cosmetic work: ambient messages and events, tips/hints,
+             web map pushes
+    level 2  also stretch idle/wander AI waits for mobs in rooms without
+             players
+
+Combat rounds and command handling are never shed. The level drops one
+step at a time after a run of comfortably fast pulses. Shed events are
+counted per category for tickstats and the admin dashboard.
+"""
+
+import logging
+import time
+from collections import Counter, deque
+from typing import Optional
+
+logger = logging.getLogger('Misthollow.LoadShedder')
+
+LEVEL_NORMAL = 0
+LEVEL_SHED_COSMETIC = 1
+LEVEL_SHED_WANDER = 2
+MAX_LEVEL = LEVEL_SHED_WANDER
+
+LEVEL_NAMES = {
+    LEVEL_NORMAL: 'normal',
+    LEVEL_SHED_COSMETIC: 'shedding cosmetic',
+    LEVEL_SHED_WANDER: 'shedding cosmetic + wander',
+}
+
+# Minimum level at which each category of work is skipped
+SHED_LEVELS = {
+    'ambient': LEVEL_SHED_COSMETIC,
+    'tips': LEVEL_SHED_COSMETIC,
+    'web_map': LEVEL_SHED_COSMETIC,
+    'wander': LEVEL_SHED_WANDER,
+}
+
+# Idle/wander waits are multiplied by this while wander is shed
+WANDER_SLOWDOWN = 3
+
+
+class LoadShedder:
+    """Tracks pulse overruns and decides which optional work to skip."""
+
+    def __init__(self, budget_ms: float, window: int = 50, engage_ratio: float = 0.2,
+                 release_ratio: float = 0.7, calm_pulses: int = 300):
+        self.budget_ms = budget_ms
+        self.window = window
+        self.engage_ratio = engage_ratio        # overrun share that escalates
+        self.release_ms = budget_ms * release_ratio
+        self.calm_pulses = calm_pulses          # fast pulses needed to step down
+        self.level = LEVEL_NORMAL
+        self.shed = Counter()
+        self.escalations = 0
+        self.level_since = time.time()
+        self._recent = deque(maxlen=window)
+        self._overruns = 0
+        self._calm = 0
+
+    def observe(self, pulse_ms: float):
+        """Feed one pulse's elapsed milliseconds."""
+        over = pulse_ms > self.budget_ms
+        if len(self._recent) == self.window:
+            self._overruns -= self._recent[0]
+        self._recent.append(over)
+        self._overruns += over
+
+        if (self.level < MAX_LEVEL and len(self._recent) == self.window
+                and self._overruns >= self.window * self.engage_ratio):
+            self._set_level(self.level + 1)
+            self.escalations += 1
+            # The next step up needs another full window of overruns
+            self._recent.clear()
+            self._overruns = 0
+
+        if pulse_ms < self.release_ms:
+            self._calm += 1
+            if self.level and self._calm >= self.calm_pulses:
+                self._set_level(self.level - 1)
+                self._calm = 0
+        else:
+            self._calm = 0
+
+    def _set_level(self, level: int):
+        old = self.level
+        self.level = level
+        self.level_since = time.time()
+        log = logger.warning if level > old else logger.info
+        log(f"Load shedding level {old} -> {level} ({LEVEL_NAMES[level]})")
+
+    def should_shed(self, category: str) -> bool:
+        """True (and counted) if work in ``category`` should be skipped now."""
+        if self.level and self.level >= SHED_LEVELS.get(category, MAX_LEVEL + 1):
+            self.shed[category] += 1
+            return True
+        return False
+
+    def stretch_wander(self, pulses: int) -> int:
+        """Lengthen an idle/wander wait while wander AI is shed."""
+        if self.should_shed('wander'):
+            return pulses * WANDER_SLOWDOWN
+        return pulses
+
+    def reset(self):
+        self.shed.clear()
+        self.escalations = 0
+
+    def snapshot(self) -> dict:
+        return {
+            'level': self.level,
+            'state': LEVEL_NAMES[self.level],
+            'level_since': self.level_since,
+            'escalations': self.escalations,
+            'recent_overruns': self._overruns,
+            'window': self.window,
+            'shed': dict(self.shed),
+        }
+
+    def format_report(self, colors: dict) -> list:
+        """Lines for the in-game immortal report."""
+        c = colors
+        color = c['white'] if self.level == LEVEL_NORMAL else c['red']
+        lines = [f"  {c['white']}Load shedding:{c['reset']} {color}{LEVEL_NAMES[self.level]}{c['reset']} "
+                 f"(level {self.level}, {self.escalations} escalations)"]
+        if self.shed:
+            shed = ', '.join(f"{name} {count}" for name, count in sorted(self.shed.items()))
+            lines.append(f"  {c['white']}Shed:{c['reset']} {shed}")
+        return lines
+
+
+def shedding(world, category: str) -> bool:
+    """Convenience check for code that may run without a shedder."""
+    shedder: Optional[LoadShedder] = getattr(world, 'load_shedder', None) if world else None
+    return shedder is not None and shedder.should_shed(category)
@@ -5,6 +5,7 @@ Misthollow - A Fantasy CircleMUD-style Multi-User Dungeon
 A complete fantasy MUD with character classes, combat, magic, quests, and more.
 """
 
+import argparse
 import asyncio
 import signal
 import sys
@@ -19,6 +20,7 @@ from server import MUDServer
 from world import World
 from config import Config
 from web_map import WebMapServer
+from scheduler import PRIORITY_CRITICAL, PRIORITY_HIGH, PRIORITY_LOW
 
 # Configure logging
 logging.basicConfig(
@@ -34,10 +36,12 @@ logger = logging.getLogger('Misthollow')
 class Misthollow:
     """Main MUD application class."""
     
-    def __init__(self):
+    def __init__(self, shards: int = None):
         self.config = Config()
+        self.shards = self.config.SHARDS if shards is None else shards
         self.world = None
         self.server = None
+        self.router = None
         self.web_map = None
         self.web_client = None
         self.admin_dashboard = None
@@ -53,11 +57,24 @@ class Misthollow:
         
         # Load the world
         self.world = World(self.config)
+        if self.shards:
+            # Shard workers simulate the zones; this process only routes
+            self.world.owned_zones = set()
         await self.world.load()
         
         # Create the server
         self.server = MUDServer(self.world, self.config)
 
+        if self.shards:
+            from sharding import ShardRouter
+            self.router = ShardRouter(self.world, self.server, self.shards)
+            await self.router.start()
+            self.server.router = self.router
+            # Map and dashboard read live world state, which is in the shards
+            await self._start_web_client()
+            logger.info("Initialization complete!")
+            return
+
         # Start web map server
         self.web_map = WebMapServer(self.world, self.config)
         try:
@@ -76,15 +93,17 @@ class Misthollow:
         except Exception as e:
             logger.warning(f"Admin dashboard failed to start: {e}")
 
-        # Start web client
+        await self._start_web_client()
+
+        logger.info("Initialization complete!")
+
+    async def _start_web_client(self):
         try:
             from web_client import WebClient
             self.web_client = WebClient(mud_port=self.config.PORT, web_port=4003)
             await self.web_client.start()
         except Exception as e:
             logger.warning(f"Web client failed to start: {e}")
-
-        logger.info("Initialization complete!")
         
     async def run(self):
         """Main game loop."""
@@ -98,151 +117,28 @@ class Misthollow:
         
         # Main game tick loop
         tick_rate = 1.0 / self.config.TICKS_PER_SECOND
-        combat_tick = 0
-        regen_tick = 0
-        minor_regen_tick = 0
-        affect_tick = 0
-        poison_tick = 0
-        zone_tick = 0
-        autosave_tick = 0
-        time_tick = 0
-        weather_tick = 0
-        pet_tick = 0
-        ambient_tick = 0
-        decay_tick = 0
-        world_event_tick = 0
+        if not self.router:
+            self.schedule_jobs()
+        scheduler = self.world.scheduler
+        profiler = self.world.tick_profiler
+        shedder = self.world.load_shedder
 
         try:
             while self.running:
                 tick_start = asyncio.get_event_loop().time()
+                profiler.begin_pulse()
+
+                # Run every periodic/one-shot job that is due this pulse
+                await scheduler.tick()
 
-                # Process game ticks
-                combat_tick += 1
-                regen_tick += 1
-                minor_regen_tick += 1
-                affect_tick += 1
-                poison_tick += 1
-                zone_tick += 1
-                autosave_tick += 1
-                time_tick += 1
-                weather_tick += 1
-                pet_tick += 1
-                ambient_tick += 1
-                decay_tick += 1
-
-                # Time tick (every 1 second - virtual game time)
-                if time_tick >= self.config.TICKS_PER_SECOND:
-                    await self.world.time_tick()
-                    time_tick = 0
-
-                # Weather tick (every 5 minutes)
-                if weather_tick >= self.config.TICKS_PER_SECOND * 300:
-                    await self.world.weather_tick()
-                    weather_tick = 0
-
-                # Pet tick (every 10 seconds)
-                if pet_tick >= self.config.TICKS_PER_SECOND * 10:
-                    await self.world.pet_tick()
-                    pet_tick = 0
-
-                # Decay tick (every 6 seconds - corpses and ground items)
-                if decay_tick >= self.config.TICKS_PER_SECOND * 6:
-                    await self.world.decay_tick()
-                    decay_tick = 0
-
-                # Combat tick (every 4 seconds - slowed for readability)
-                if combat_tick >= self.config.TICKS_PER_SECOND * 4:
-                    await self.world.combat_tick()
-                    combat_tick = 0
-
-                # Affect tick (DOT/HOT effects)
-                if affect_tick >= self.config.TICKS_PER_SECOND * self.config.AFFECT_TICK_SECONDS:
-                    await self.world.affect_tick()
-                    affect_tick = 0
-
-                # Poison tick (faster feedback)
-                if poison_tick >= int(self.config.TICKS_PER_SECOND * self.config.POISON_TICK_SECONDS):
-                    await self.world.poison_tick()
-                    poison_tick = 0
-
-                # Regen tick every 60 seconds (CircleMUD standard)
-                if regen_tick >= self.config.TICKS_PER_SECOND * 60:
-                    await self.world.regen_tick()
-                    regen_tick = 0
-
-                # Regen tick warning (3 seconds before)
-                if regen_tick == self.config.TICKS_PER_SECOND * 57:
-                    c = self.config.COLORS
-                    for p in self.world.players.values():
-                        if getattr(p, 'show_ticks', False):
-                            await p.send(f"{c['cyan']}[TICK in 3s]{c['reset']}")
-
-                # Minor regen tick every 5 seconds
-                if minor_regen_tick >= self.config.TICKS_PER_SECOND * 5:
-                    await self.world.minor_regen_tick()
-                    minor_regen_tick = 0
-                
-                # Ambient message tick (every 10 seconds, 3% chance per player)
-                if ambient_tick >= self.config.TICKS_PER_SECOND * 10:
-                    from ambient import AmbientManager
-                    await AmbientManager.ambient_tick(self.world)
-                    # Also fire ambient_events system for richer sector-based events
-                    try:
-                        from ambient_events import AmbientEventManager
-                        import random
-                        game_time = getattr(self.world, 'game_time', None)
-                        for p in list(self.world.players.values()):
-                            if not p.room or getattr(p, 'position', 'standing') in ('sleeping', 'fighting'):
-                                continue
-                            if getattr(p, 'fighting', None):
-                                continue
-                            if random.random() > 0.05:  # 5% chance per check
-                                continue
-                            weather = p.room.zone.weather if hasattr(p.room, 'zone') and p.room.zone else None
-                            event = AmbientEventManager.get_event_for_room(p.room, game_time, weather)
-                            if event:
-                                c = p.config.COLORS
-                                await p.send(f"\r\n{c['cyan']}{event}{c['reset']}")
-                    except Exception:
-                        pass
-                    ambient_tick = 0
-                
-                # NPC schedule tick (every game hour change - handled in time_tick)
-                # Schedule processing happens when hour changes in world.time_tick()
-                
-                # Zone reset tick (every 15 minutes)
-                if zone_tick >= self.config.TICKS_PER_SECOND * 900:
-                    await self.world.zone_reset_tick()
-                    zone_tick = 0
-
-                # World event tick (every 30 seconds)
-                world_event_tick += 1
-                if world_event_tick >= self.config.TICKS_PER_SECOND * 30:
-                    if self.world.event_manager:
-                        try:
-                            await self.world.event_manager.tick()
-                        except asyncio.CancelledError:
-                            logger.error("World event tick cancelled (swallowed)")
-                        except Exception as e:
-                            logger.error(f"World event tick error: {e}")
-                    world_event_tick = 0
-                
-                # Auction house expiration tick (every 5 minutes)
-                if autosave_tick == self.config.TICKS_PER_SECOND * 150:
-                    try:
-                        from auction_house import AuctionHouse
-                        AuctionHouse.process_expirations()
-                    except Exception as e:
-                        logger.error(f"Auction expiration tick error: {e}")
-
-                # Autosave tick (every 5 minutes)
-                if autosave_tick >= self.config.TICKS_PER_SECOND * 300:
-                    await self.world.autosave()
-                    autosave_tick = 0
-                
                 # Process player input and NPC AI
-                await self.server.process_input()
-                await self.world.process_npcs()
+                with profiler.measure('process_input'):
+                    await self.server.process_input()
+                with profiler.measure('process_npcs'):
+                    await self.world.process_npcs()
+                with profiler.measure('flush_output'):
+                    await self.server.flush_output()
+                shedder.observe(profiler.end_pulse())
                 
                 # Maintain tick rate
                 elapsed = asyncio.get_event_loop().time() - tick_start
@@ -254,6 +150,88 @@ class Misthollow:
         finally:
             await self.shutdown()
             
+    def schedule_jobs(self):
+        """Register the world's periodic ticks with the pulse scheduler.
+
+        Phases are left to the scheduler so heavy jobs (regen, decay,
+        autosave, zone resets) are staggered onto different pulses.
+        """
+        world = self.world
+        cfg = self.config
+        sched = world.scheduler
+        secs = sched.seconds
+
+        sched.every('combat', secs(4), world.combat_tick, priority=PRIORITY_CRITICAL)
+        sched.every('time', secs(1), world.time_tick, priority=PRIORITY_HIGH)
+        sched.every('affect', secs(cfg.AFFECT_TICK_SECONDS), world.affect_tick, priority=PRIORITY_HIGH)
+        sched.every('poison', secs(cfg.POISON_TICK_SECONDS), world.poison_tick, priority=PRIORITY_HIGH)
+        sched.every('minor_regen', secs(5), world.minor_regen_tick)
+        sched.every('decay', secs(cfg.DECAY_TICK_SECONDS), world.decay_tick)
+        sched.every('pet', secs(10), world.pet_tick)
+        sched.every('world_event', secs(30), self._world_event_tick)
+        sched.every('regen', secs(60), world.regen_tick)
+        sched.every('weather', secs(300), world.weather_tick)
+        sched.every('zone_reset', secs(900), world.zone_reset_tick)
+        sched.every('hibernation', secs(cfg.ZONE_HIBERNATE_CHECK_SECONDS), world.hibernation_tick)
+        sched.every('autosave', secs(300), world.autosave, priority=PRIORITY_LOW)
+        sched.every('auction_expiry', secs(300), self._auction_tick, priority=PRIORITY_LOW)
+        sched.every('ambient', secs(10), self._ambient_tick, priority=PRIORITY_LOW)
+
+        # Regen tick warning fires 3 seconds ahead of each regen tick
+        sched.every('regen_warning', secs(60), self._regen_warning,
+                    phase=sched.pulses_until('regen') - secs(3))
+
+    async def _regen_warning(self):
+        """Warn players with tick display enabled that regen is imminent."""
+        c = self.config.COLORS
+        for p in self.world.players.values():
+            if getattr(p, 'show_ticks', False):
+                await p.send(f"{c['cyan']}[TICK in 3s]{c['reset']}")
+
+    async def _ambient_tick(self):
+        """Ambient flavour messages (every 10 seconds, 3% chance per player)."""
+        if self.world.load_shedder.should_shed('ambient'):
+            return
+        from ambient import AmbientManager
+        await AmbientManager.ambient_tick(self.world)
+        # Also fire ambient_events system for richer sector-based events
+        try:
+            from ambient_events import AmbientEventManager
+            import random
+            game_time = getattr(self.world, 'game_time', None)
+            for p in list(self.world.players.values()):
+                if not p.room or getattr(p, 'position', 'standing') in ('sleeping', 'fighting'):
+                    continue
+                if getattr(p, 'fighting', None):
+                    continue
+                if random.random() > 0.05:  # 5% chance per check
+                    continue
+                weather = p.room.zone.weather if hasattr(p.room, 'zone') and p.room.zone else None
+                event = AmbientEventManager.get_event_for_room(p.room, game_time, weather)
+                if event:
+                    c = p.config.COLORS
+                    await p.send(f"\r\n{c['cyan']}{event}{c['reset']}", low_priority=True)
+        except Exception:
+            pass
+
+    async def _world_event_tick(self):
+        """World event tick (every 30 seconds)."""
+        if self.world.event_manager:
+            try:
+                await self.world.event_manager.tick()
+            except asyncio.CancelledError:
+                logger.error("World event tick cancelled (swallowed)")
+            except Exception as e:
+                logger.error(f"World event tick error: {e}")
+
+    async def _auction_tick(self):
+        """Auction house expiration tick (every 5 minutes)."""
+        try:
+            from auction_house import AuctionHouse
+            AuctionHouse.process_expirations()
+        except Exception as e:
+            logger.error(f"Auction expiration tick error: {e}")
+
     async def shutdown(self):
         """Gracefully shut down the MUD."""
         logger.info("Shutting down Misthollow...")
@@ -265,6 +243,9 @@ class Misthollow:
         if self.server:
             await self.server.shutdown()
 
+        if self.router:
+            await self.router.stop()
+
         if self.web_map:
             await self.web_map.stop()
 
@@ -273,9 +254,51 @@ class Misthollow:
             
         logger.info("Shutdown complete. Farewell!")
 
-async def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Misthollow MUD server')
+    parser.add_argument('--shards', type=int, default=None,
+                        help='simulate zones in N worker processes (default: single process)')
+    parser.add_argument('--simulate', action='store_true',
+                        help='run the world headless with scripted bots as fast as possible')
+    parser.add_argument('--bots', type=int, default=20,
+                        help='bot players for --simulate (default: 20)')
+    parser.add_argument('--duration', type=float, default=3600.0,
+                        help='game seconds to simulate (default: 3600)')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='random seed for --simulate bot scripts')
+    parser.add_argument('--loop', choices=('asyncio', 'uvloop', 'auto'), default=Config.EVENT_LOOP,
+                        help='event loop implementation; auto uses uvloop when installed '
+                             f'(default: {Config.EVENT_LOOP})')
+    return parser.parse_args(argv)
+
+
+def install_event_loop(name: str) -> str:
+    """Install the event loop policy for ``name``; returns the loop in use.
+
+    ``uvloop`` and ``auto`` fall back to the default asyncio loop when
+    uvloop is not installed.
+    """
+    if name == 'asyncio':
+        return 'asyncio'
+    try:
+        import uvloop
+    except ImportError:
+        if name == 'uvloop':
+            logger.warning("uvloop is not installed - using the default asyncio event loop")
+        return 'asyncio'
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return 'uvloop'
+
+
+async def main(args):
     """Entry point."""
-    mud = Misthollow()
+
+    if args.simulate:
+        from simulate import run_simulation
+        await run_simulation(bots=args.bots, duration=args.duration, seed=args.seed)
+        return
+
+    mud = Misthollow(shards=args.shards)
     
     # Handle shutdown signals (Unix only - Windows uses KeyboardInterrupt)
     if sys.platform != 'win32':
@@ -308,4 +331,6 @@ if __name__ == '__main__':
 
     ===============================================================
     """)
-    asyncio.run(main())
+    args = parse_args()
+    logger.info(f"Event loop: {install_event_loop(args.loop)}")
+    asyncio.run(main(args))
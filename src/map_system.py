@@ -169,6 +169,18 @@ def find_path(rooms: Dict[int, object], start_vnum: int, end_vnum: int, player=N
     return []  # No path found
 
 
+def find_directions(rooms: Dict[int, object], start_vnum: int, end_vnum: int, player=None) -> List[str]:
+    """Shortest path between two rooms as the directions to walk."""
+    path = find_path(rooms, start_vnum, end_vnum, player)
+    directions = []
+    for here, there in zip(path, path[1:]):
+        for direction, exit_data in _iter_visible_exits(rooms.get(here), player):
+            if _get_exit_target_vnum(exit_data) == there:
+                directions.append(direction)
+                break
+    return directions
+
+
 def _iter_visible_exits(room, player=None):
     if not room:
         return []
@@ -0,0 +1,83 @@
+"""
+Misthollow MCCP
+==============
+MCCP2 (telnet option 86) output compression.
+
+The server offers ``IAC WILL COMPRESS2`` on connect. When the client answers
+``IAC DO COMPRESS2`` the server sends ``IAC SB COMPRESS2 IAC SE`` and every
+byte after that goes through a per-connection zlib stream. Each flush is
+sync-flushed so the client can render it straight away. Byte counts feed
+one server-wide ``CompressionStats`` for ``show stats`` and the dashboard.
+"""
+
+import zlib
+
+from telnet import OPT_COMPRESS2, subneg
+
+# zlib level: 6 is the usual speed/size trade-off for chatty text
+COMPRESS_LEVEL = 6
+
+# Sent uncompressed; everything after it is part of the zlib stream
+START_COMPRESS = subneg(OPT_COMPRESS2, b'')
+
+
+class CompressionStats:
+    """Server-wide MCCP2 counters."""
+
+    def __init__(self):
+        self.streams_started = 0
+        self.active = 0
+        self.raw_bytes = 0
+        self.compressed_bytes = 0
+
+    @property
+    def ratio(self) -> float:
+        """Raw bytes per byte sent (1.0 when nothing is compressed yet)."""
+        if not self.compressed_bytes:
+            return 1.0
+        return self.raw_bytes / self.compressed_bytes
+
+    @property
+    def bytes_saved(self) -> int:
+        return max(0, self.raw_bytes - self.compressed_bytes)
+
+    def snapshot(self) -> dict:
+        return {
+            'streams_started': self.streams_started,
+            'active': self.active,
+            'raw_bytes': self.raw_bytes,
+            'compressed_bytes': self.compressed_bytes,
+            'bytes_saved': self.bytes_saved,
+            'ratio': round(self.ratio, 2),
+        }
+
+    def format_report(self, colors: dict) -> list:
+        """Lines for the in-game immortal report."""
+        c = colors
+        return [f"  {c['white']}MCCP:{c['reset']} {self.active} compressed connections, "
+                f"{self.raw_bytes:,} -> {self.compressed_bytes:,} bytes "
+                f"({self.ratio:.1f}x, {self.bytes_saved:,} saved)"]
+
+
+class MCCPStream:
+    """One connection's zlib stream."""
+
+    __slots__ = ('_zlib', 'stats')
+
+    def __init__(self, stats: CompressionStats):
+        self._zlib = zlib.compressobj(COMPRESS_LEVEL)
+        self.stats = stats
+        stats.streams_started += 1
+        stats.active += 1
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress and sync-flush ``data`` so the client can decode it now."""
+        out = self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+        self.stats.raw_bytes += len(data)
+        self.stats.compressed_bytes += len(out)
+        return out
+
+    def finish(self) -> bytes:
+        """End the stream; the connection is uncompressed afterwards."""
+        self.stats.active -= 1
+        return self._zlib.flush(zlib.Z_FINISH)
@@ -4,6 +4,7 @@ Misthollow Mobiles (NPCs)
 Non-player characters and monsters.
 """
 
+import math
 import random
 import logging
 from typing import Dict, List, Optional, TYPE_CHECKING
@@ -110,9 +111,31 @@ EXTRA_LOOT_TABLES = {
 }
 
 
+# Chance per pulse that an idle mob acts (aggro check, special, wander)
+IDLE_ACTION_CHANCE = 0.02
+
+# How often stunned/incapacitated mobs are re-checked (pulses)
+AI_RECHECK_PULSES = 10
+
+
 class Mobile(Character):
     """Non-player character (mob)."""
-    
+
+    @property
+    def room(self):
+        return self._room
+
+    @room.setter
+    def room(self, new_room):
+        # As with Player.room: one place that sees every move, so the
+        # world's zone -> NPCs index stays current for listed NPCs.
+        old_room = self.__dict__.get('_room')
+        self._room = new_room
+        if new_room is not old_room and getattr(self, '_ai_listed', False):
+            world = getattr(self, 'world', None)
+            if world is not None and hasattr(world, 'npc_moved'):
+                world.npc_moved(self, old_room, new_room)
+
     def __init__(self, vnum: int, world: 'World'):
         super().__init__()
         self.vnum = vnum
@@ -154,6 +177,11 @@ class Mobile(Character):
         self.hunt_cooldown = 0  # Ticks until can move again while hunting
         self.last_known_room = None  # Last room we saw the target in
 
+        # Active-set AI: pulse at which the next idle action (aggro/special/
+        # wander) comes up. Drawn ahead of time so the world can leave the
+        # mob asleep until then instead of rolling every pulse.
+        self.next_idle_pulse = None
+
         # Combat
         self.damage_dice = '1d4'
         
@@ -490,7 +518,7 @@ class Mobile(Character):
             return
 
         # Random chance to act each tick (2% = ~0.2 actions/sec at 10 tps)
-        if random.randint(1, 100) > 2:
+        if not self.idle_action_due():
             return
 
         # Check for aggressive behavior
@@ -507,6 +535,87 @@ class Mobile(Character):
         if 'sentinel' not in self.flags:
             await self.wander_ai()
     
+    def players_present(self) -> bool:
+        """Whether an online player shares this mob's room."""
+        room = self.room
+        if room is None:
+            return False
+        if self.world is not None:
+            return bool(self.world.players_in_room(room))
+        return any(hasattr(ch, 'connection') for ch in room.characters)
+
+    def _current_pulse(self) -> Optional[int]:
+        scheduler = getattr(self.world, 'scheduler', None) if self.world else None
+        return scheduler.pulse if scheduler else None
+
+    def _pulses_to_idle_action(self, pulse: int) -> int:
+        """Pulses until the next idle action, redrawing a stale roll.
+
+        Rolling IDLE_ACTION_CHANCE every pulse is equivalent to waiting a
+        geometrically distributed number of pulses, so the wait is drawn once.
+        """
+        if self.next_idle_pulse is None or self.next_idle_pulse < pulse:
+            u = 1.0 - random.random()
+            wait = int(math.log(u) / math.log(1.0 - IDLE_ACTION_CHANCE)) + 1
+            # Under load, mobs nobody is watching wander less often
+            shedder = getattr(self.world, 'load_shedder', None) if self.world else None
+            if shedder and shedder.level and self.room and not self.players_present():
+                wait = shedder.stretch_wander(wait)
+            self.next_idle_pulse = pulse + wait
+        return self.next_idle_pulse - pulse
+
+    def idle_action_due(self) -> bool:
+        """Whether this pulse is the one the idle-action roll comes up on."""
+        pulse = self._current_pulse()
+        if pulse is None:
+            return random.random() < IDLE_ACTION_CHANCE
+        if self._pulses_to_idle_action(pulse) > 0:
+            return False
+        self.next_idle_pulse = None
+        return True
+
+    def ai_think_delay(self) -> Optional[int]:
+        """Pulses until process_ai next has something to do.
+
+        Returns None when the mob can sleep until something wakes it (a player
+        entering its room, being attacked, a new grudge). Mirrors the checks in
+        process_ai, so sentinels and idle aggressors in empty rooms cost nothing.
+        """
+        if not self.is_alive or self.position == 'sleeping':
+            return None
+        if self.position in ('stunned', 'incapacitated'):
+            return AI_RECHECK_PULSES
+        if self.ai_controller:
+            return 1
+        if self.is_fighting:
+            return 1
+        if self.grudge_list and 'sentinel' not in self.flags and (
+                'hunter' in self.flags or 'tracker' in self.flags or 'boss' in self.flags):
+            return 1
+        if self.ai_state.get('track_target'):
+            return 1
+
+        players_here = self.players_present()
+        if self.faction and players_here:
+            return 1
+
+        # Idle behaviours (only one of these ever runs, in this order)
+        if 'aggressive' in self.flags or self.special:
+            acts = players_here and ('aggressive' in self.flags or self.special in ('healer', 'druid'))
+        else:
+            acts = 'sentinel' not in self.flags
+        if not acts:
+            return None
+        pulse = self._current_pulse()
+        if pulse is None:
+            return 1
+        return max(1, self._pulses_to_idle_action(pulse))
+
+    def wake(self):
+        """Ask the world to run this mob's AI on the next pulse."""
+        if self.world and hasattr(self.world, 'wake_npc'):
+            self.world.wake_npc(self)
+
     def add_grudge(self, player: 'Character', damage: int = 0):
         """Add or update grudge against a player who attacked us."""
         import time
@@ -529,6 +638,8 @@ class Mobile(Character):
             if not self.hunting_target or not self.hunting_target.is_alive:
                 self.hunting_target = player
                 self.last_known_room = player.room
+
+        self.wake()
     
     def clear_grudge(self, player_name: str = None):
         """Clear grudge(s)."""
@@ -1076,6 +1187,7 @@ class Mobile(Character):
     async def take_damage(self, amount: int, attacker: 'Character' = None, damage_type: str = 'physical') -> bool:
         """Take damage, return True if killed."""
         damage_type = damage_type or 'physical'
+        self.wake()
         
         # Absorb shields (divine_shield / stoneskin / armour_ward)
         try:
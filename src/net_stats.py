@@ -0,0 +1,216 @@
+"""
+Misthollow Net Stats
+===================
+Per-connection traffic and command latency telemetry.
+
+Every Connection carries a ``ConnectionStats``:
+
+    bytes in/out      raw socket bytes (after MCCP compression on the way out)
+    messages out      send() calls, prompts excluded
+    commands          lines run by process_input, plus a 60s window for a
+                      commands-per-minute rate
+    latency           time from a line arriving to its output being flushed,
+                      including time spent queued behind earlier commands
+
+``NetStats`` aggregates them server-wide: lifetime totals (connections
+that closed are folded in), rolling histograms of command latency and
+messages per command, and a commands-per-minute distribution over the
+live connections. It backs the ``netstat`` immortal command and the
+dashboard's /api/net.
+"""
+
+import time
+from collections import deque
+from typing import Dict, List, TYPE_CHECKING
+
+from tick_profiler import RollingHistogram
+
+if TYPE_CHECKING:
+    from server import Connection
+
+# Commands-per-minute window
+RATE_WINDOW = 60.0
+
+
+class ConnectionStats:
+    """Counters for one connection."""
+
+    __slots__ = ('bytes_in', 'bytes_out', 'messages_out', 'commands', 'started',
+                 '_recent', 'total_latency_ms', 'max_latency_ms')
+
+    def __init__(self):
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.messages_out = 0
+        self.commands = 0
+        self.started = time.monotonic()
+        self._recent: deque = deque()  # Monotonic times of commands in the last minute
+        self.total_latency_ms = 0.0
+        self.max_latency_ms = 0.0
+
+    def command_done(self, now: float, latency_ms: float):
+        self.commands += 1
+        self._recent.append(now)
+        self._prune(now)
+        self.total_latency_ms += latency_ms
+        if latency_ms > self.max_latency_ms:
+            self.max_latency_ms = latency_ms
+
+    def commands_per_minute(self, now: float = None) -> int:
+        self._prune(time.monotonic() if now is None else now)
+        return len(self._recent)
+
+    def _prune(self, now: float):
+        """Drop commands older than RATE_WINDOW, so the window stays bounded."""
+        recent = self._recent
+        while recent and now - recent[0] > RATE_WINDOW:
+            recent.popleft()
+
+    @property
+    def avg_latency_ms(self) -> float:
+        return self.total_latency_ms / self.commands if self.commands else 0.0
+
+    @property
+    def messages_per_command(self) -> float:
+        return self.messages_out / self.commands if self.commands else 0.0
+
+
+class NetStats:
+    """Server-wide aggregate of every connection's ConnectionStats."""
+
+    def __init__(self, connections: Dict[str, 'Connection'], window: int = 1000):
+        self.connections = connections  # The server's live table
+        self.latency = RollingHistogram(window)               # ms, line -> flush
+        self.messages_per_command = RollingHistogram(window)  # messages
+        self.started_at = time.time()
+        # Totals from connections that have closed
+        self._closed = {'bytes_in': 0, 'bytes_out': 0, 'messages_out': 0, 'commands': 0}
+        self.connections_closed = 0
+
+    def record_command(self, stats: ConnectionStats, received: float, messages: int):
+        """A command finished and its output was flushed."""
+        now = time.monotonic()
+        latency_ms = (now - received) * 1000.0
+        stats.command_done(now, latency_ms)
+        self.latency.record(latency_ms)
+        self.messages_per_command.record(messages)
+
+    def retire(self, stats: ConnectionStats):
+        """Fold a closed connection into the lifetime totals."""
+        closed = self._closed
+        closed['bytes_in'] += stats.bytes_in
+        closed['bytes_out'] += stats.bytes_out
+        closed['messages_out'] += stats.messages_out
+        closed['commands'] += stats.commands
+        self.connections_closed += 1
+
+    def totals(self) -> dict:
+        totals = dict(self._closed)
+        for conn in self.connections.values():
+            stats = conn.stats
+            totals['bytes_in'] += stats.bytes_in
+            totals['bytes_out'] += stats.bytes_out
+            totals['messages_out'] += stats.messages_out
+            totals['commands'] += stats.commands
+        return totals
+
+    def connection_rows(self, sort: str = 'out') -> List[dict]:
+        """One row per live connection, busiest first."""
+        now = time.monotonic()
+        rows = []
+        for conn in self.connections.values():
+            stats = conn.stats
+            player = conn.player
+            rows.append({
+                'name': player.name if player else '-',
+                'address': conn.address[0] if conn.address else '?',
+                'state': conn.state,
+                'client': conn.terminal_type or '',
+                'connected_s': int(now - stats.started),
+                'bytes_in': stats.bytes_in,
+                'bytes_out': stats.bytes_out,
+                'messages_out': stats.messages_out,
+                'commands': stats.commands,
+                'commands_per_minute': stats.commands_per_minute(now),
+                'messages_per_command': round(stats.messages_per_command, 1),
+                'avg_latency_ms': round(stats.avg_latency_ms, 1),
+                'max_latency_ms': round(stats.max_latency_ms, 1),
+                'queued_lines': len(conn.input_buffer),
+                'outbound_bytes': conn.outbound_bytes,
+                'dropped_messages': conn.dropped_messages,
+            })
+        key = SORT_KEYS.get(sort, 'bytes_out')
+        rows.sort(key=lambda row: row[key], reverse=True)
+        return rows
+
+    @staticmethod
+    def _distribution(values: List[float]) -> dict:
+        if not values:
+            return {'p50': 0, 'p95': 0, 'max': 0}
+        ordered = sorted(values)
+        last = len(ordered) - 1
+        return {'p50': ordered[last // 2], 'p95': ordered[int(round(0.95 * last))],
+                'max': ordered[-1]}
+
+    def snapshot(self, sort: str = 'out') -> dict:
+        rows = self.connection_rows(sort)
+        messages = self.messages_per_command.percentiles()
+        return {
+            'uptime_s': int(time.time() - self.started_at),
+            'connections': len(rows),
+            'connections_closed': self.connections_closed,
+            'totals': self.totals(),
+            'latency': self.latency.summary(),
+            'messages_per_command': {
+                'count': self.messages_per_command.count,
+                'p50': messages[50], 'p95': messages[95], 'p99': messages[99],
+                'max': max(self.messages_per_command.samples, default=0),
+            },
+            'commands_per_minute': self._distribution([r['commands_per_minute'] for r in rows]),
+            'per_connection': rows,
+        }
+
+    def format_report(self, colors: dict, sort: str = 'out', limit: int = 20) -> List[str]:
+        """Lines for the in-game immortal report."""
+        c = colors
+        data = self.snapshot(sort)
+        totals = data['totals']
+        lat = data['latency']
+        mpc = data['messages_per_command']
+        cpm = data['commands_per_minute']
+        lines = [
+            f"{c['bright_cyan']}=== Network Statistics ==={c['reset']}",
+            f"  {c['white']}Connections:{c['reset']} {data['connections']} open, "
+            f"{data['connections_closed']} closed",
+            f"  {c['white']}Traffic:{c['reset']} {totals['bytes_in'] / 1024:,.1f} KB in, "
+            f"{totals['bytes_out'] / 1024:,.1f} KB out, {totals['commands']:,} commands, "
+            f"{totals['messages_out']:,} messages",
+            f"  {c['white']}Line->flush ms:{c['reset']} p50 {lat['p50_ms']:.1f}  p95 {lat['p95_ms']:.1f}  "
+            f"p99 {lat['p99_ms']:.1f}  max {lat['max_ever_ms']:.1f}",
+            f"  {c['white']}Messages/command:{c['reset']} p50 {mpc['p50']:g}  p95 {mpc['p95']:g}  "
+            f"p99 {mpc['p99']:g}  max {mpc['max']:g}",
+            f"  {c['white']}Commands/min:{c['reset']} p50 {cpm['p50']}  p95 {cpm['p95']}  max {cpm['max']}",
+            "",
+            f"  {c['yellow']}{'Name':<12} {'Address':<16} {'In KB':>7} {'Out KB':>8} {'Cmds':>6} "
+            f"{'Cmd/m':>5} {'Msg/c':>5} {'Lat ms':>7} {'Max ms':>7} {'Queue':>5}{c['reset']}",
+        ]
+        for row in data['per_connection'][:limit]:
+            lines.append(
+                f"  {row['name'][:12]:<12} {row['address'][:16]:<16} {row['bytes_in'] / 1024:>7.1f} "
+                f"{row['bytes_out'] / 1024:>8.1f} {row['commands']:>6} {row['commands_per_minute']:>5} "
+                f"{row['messages_per_command']:>5.1f} {row['avg_latency_ms']:>7.1f} "
+                f"{row['max_latency_ms']:>7.1f} {row['queued_lines']:>5}")
+        if len(data['per_connection']) > limit:
+            lines.append(f"  ... {len(data['per_connection']) - limit} more")
+        return lines
+
+
+# netstat sort argument -> row field
+SORT_KEYS = {
+    'in': 'bytes_in',
+    'out': 'bytes_out',
+    'cmds': 'commands',
+    'rate': 'commands_per_minute',
+    'msgs': 'messages_per_command',
+    'lat': 'max_latency_ms',
+}
@@ -140,12 +140,15 @@ class NPCScheduleManager:
         
         hour = game_time.hour
         
-        # Process all mobs in the world
-        for zone in self.world.zones.values():
-            for room in zone.rooms.values():
-                for char in list(room.characters):
-                    if hasattr(char, 'vnum') and not hasattr(char, 'connection'):
-                        await self._process_npc_schedule(char, hour)
+        # Process the mobs of every awake zone, straight from the world's
+        # zone -> NPCs index rather than walking each zone's rooms
+        world = self.world
+        for zone, npcs in list(world.zone_npcs.items()):
+            if zone.hibernating:
+                continue
+            for char in list(npcs):
+                if hasattr(char, 'vnum') and not hasattr(char, 'connection'):
+                    await self._process_npc_schedule(char, hour)
     
     async def _process_npc_schedule(self, npc: 'Mobile', hour: int):
         """Process schedule for a single NPC."""
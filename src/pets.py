@@ -795,6 +795,10 @@ class Pet(Mobile):
             if hasattr(self.owner, 'send'):
                 await self.owner.send(f"{c['cyan']}{self.name} melts into the shadows...{c['reset']}")
 
+    def ai_think_delay(self):
+        """Pets follow and guard their owner, so they think every pulse."""
+        return 1
+
     async def process_ai(self):
         """Pet-specific AI behavior."""
         if not self.is_alive:
@@ -67,6 +67,7 @@ class Character:
         self.protecting = None
         self.second_wind_until = 0
         self.second_wind_cooldown_until = 0
+        self.wait_state = 0  # Pulses before queued commands run again (skill lag)
         
         # Equipment and inventory
         self.inventory = []
@@ -205,6 +206,12 @@ class Character:
     def is_fighting(self):
         return self.fighting is not None
 
+    def add_wait_state(self, action: str):
+        """Skill lag after ``action``: queued commands wait it out (Config.WAIT_STATE_SECONDS)."""
+        seconds = Config.WAIT_STATE_SECONDS.get(action)
+        if seconds:
+            self.wait_state = max(self.wait_state, int(seconds * Config.TICKS_PER_SECOND))
+
     @property
     def is_immortal(self) -> bool:
         """Check if this player has immortal/admin privileges."""
@@ -439,6 +446,21 @@ class Character:
 class Player(Character):
     """Player character class."""
     
+    @property
+    def room(self):
+        return self._room
+
+    @room.setter
+    def room(self, new_room):
+        # Every movement path assigns player.room, so the world hears about
+        # all of them here (NPC wake-ups for the room being entered).
+        old_room = self.__dict__.get('_room')
+        self._room = new_room
+        if new_room is not old_room:
+            world = getattr(self, 'world', None)
+            if world is not None and hasattr(world, 'player_moved'):
+                world.player_moved(self, old_room, new_room)
+
     def __init__(self, world: 'World' = None):
         super().__init__()
         self.world = world
@@ -488,6 +510,7 @@ class Player(Character):
         self.custom_aliases = {}  # Personal alias system
         self.target = None  # Current combat target for targeting system
         self.target_labels = {}  # Label system: {"DEAD": character_obj, "TANK": char_obj}
+        self.speedwalk = None  # Set of followers while a 'run' is in progress
 
         # Autoloot settings
         self.autoloot = False  # Automatically loot items from corpses
@@ -1012,10 +1035,14 @@ class Player(Character):
         """Check if the password matches."""
         return self.password_hash == hashlib.sha256(password.encode()).hexdigest()
         
-    async def send(self, message: str, newline: bool = True):
-        """Send a message to the player."""
+    async def send(self, message: str, newline: bool = True, low_priority: bool = False):
+        """Send a message to the player.
+
+        Low-priority output (ambient flavour, channel chatter) may be dropped
+        for a client that is not keeping up.
+        """
         if self.connection:
-            await self.connection.send(message, newline)
+            await self.connection.send(message, newline, low_priority=low_priority)
             
     def _save_companions(self) -> List[Dict]:
         """Save persistent companions to dict format."""
@@ -1082,7 +1109,8 @@ class Player(Character):
             'damroll': self.damroll,
             'practices': self.practices,
             'trains': self.trains,
-            'room_vnum': self.room.vnum if self.room else self.config.STARTING_ROOM,
+            # Not placed in a room yet (e.g. the sharded front end): keep the saved one
+            'room_vnum': self.room.vnum if self.room else (self.room_vnum or self.config.STARTING_ROOM),
             'skills': self.skills,
             'spells': self.spells,
             'talents': getattr(self, 'talents', {}),
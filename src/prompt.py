@@ -0,0 +1,157 @@
+"""
+Misthollow Prompt
+================
+Compiled prompt templates.
+
+A prompt format such as ``<%h/%Hhp %m/%Mm>`` is parsed once into literal
+text and field segments. Rendering only computes the fields the template
+uses and joins the pieces. Templates are immutable and cached by their
+source string, so players who use the same format share one template.
+
+Player format codes (``prompt`` command):
+
+    %h/%H  hp/max hp      %m/%M  mana/max mana    %v/%V  move/max move
+    %p     hp %           %q     mana %           %r     move %
+    %g     gold           %x     experience       %n     newline
+
+The built-in prompts also use ``%C`` (hp colour), ``%S`` (sneaking),
+``%W`` (warrior momentum) and ``%E`` (opponent's health).
+"""
+
+from functools import lru_cache
+from typing import Callable, Dict, Tuple, Union
+
+from config import Config
+
+_C = Config.COLORS
+
+
+def _pct(value: int, maximum: int) -> str:
+    return str(int(value * 100 / maximum)) if maximum > 0 else '0'
+
+
+def _hp_color(player) -> str:
+    if player.hp > player.max_hp * 0.5:
+        return _C['green']
+    if player.hp > player.max_hp * 0.25:
+        return _C['yellow']
+    return _C['red']
+
+
+def _sneaking(player) -> str:
+    if 'sneaking' in getattr(player, 'flags', ()):
+        return f" {_C['bright_black']}[sneaking]{_C['reset']}"
+    return ''
+
+
+def _momentum(player) -> str:
+    if getattr(player, 'char_class', '').lower() != 'warrior':
+        return ''
+    mom = getattr(player, 'momentum', 0)
+    if mom <= 0:
+        return ''
+    status = (f" {_C['bright_yellow']}[Momentum: {'█' * mom}{'░' * (10 - mom)} "
+              f"{mom}/10]{_C['reset']}")
+    if getattr(player, 'unstoppable_rounds', 0) > 0:
+        status += f" {_C['bright_red']}★UNSTOPPABLE★{_C['reset']}"
+    return status
+
+
+def _enemy(player) -> str:
+    enemy = player.fighting if player.is_fighting else None
+    if not enemy:
+        return ''
+    pct = (enemy.hp / enemy.max_hp) * 100 if enemy.max_hp else 0
+    color = (_C['bright_green'] if pct > 75 else _C['green'] if pct > 50
+             else _C['yellow'] if pct > 25 else _C['red'])
+    return f" {_C['white']}[{color}{enemy.name}: {enemy.hp}/{enemy.max_hp}{_C['white']}]{_C['reset']}"
+
+
+Field = Callable[[object], str]
+
+# Codes players may use in their own prompt
+PLAYER_FIELDS: Dict[str, Field] = {
+    'h': lambda p: str(p.hp),
+    'H': lambda p: str(p.max_hp),
+    'm': lambda p: str(p.mana),
+    'M': lambda p: str(p.max_mana),
+    'v': lambda p: str(p.move),
+    'V': lambda p: str(p.max_move),
+    'g': lambda p: str(p.gold),
+    'x': lambda p: str(p.exp),
+    'p': lambda p: _pct(p.hp, p.max_hp),
+    'q': lambda p: _pct(p.mana, p.max_mana),
+    'r': lambda p: _pct(p.move, p.max_move),
+}
+
+# Codes the built-in prompts use as well
+BUILTIN_FIELDS: Dict[str, Field] = dict(PLAYER_FIELDS, C=_hp_color, S=_sneaking,
+                                        W=_momentum, E=_enemy)
+
+Segment = Union[str, Field]
+
+
+def _parse(source: str, fields: Dict[str, Field]) -> Tuple[Segment, ...]:
+    """Split ``source`` into literal and field segments; unknown codes stay literal."""
+    segments = []
+    literal = []
+    i = 0
+    while i < len(source):
+        ch = source[i]
+        code = source[i + 1] if ch == '%' and i + 1 < len(source) else ''
+        if code == 'n':
+            literal.append('\r\n')
+        elif code in fields:
+            if literal:
+                segments.append(''.join(literal))
+                literal = []
+            segments.append(fields[code])
+        else:
+            literal.append(ch)
+            i += 1
+            continue
+        i += 2
+    if literal:
+        segments.append(''.join(literal))
+    return tuple(segments)
+
+
+class PromptTemplate:
+    """A parsed prompt format, rendered per player."""
+
+    __slots__ = ('source', 'segments')
+
+    def __init__(self, source: str, segments: Tuple[Segment, ...]):
+        self.source = source
+        # Adjacent literals are joined so each renders as one piece
+        merged = []
+        for seg in segments:
+            if merged and seg.__class__ is str and merged[-1].__class__ is str:
+                merged[-1] += seg
+            else:
+                merged.append(seg)
+        self.segments = tuple(merged)
+
+    def render(self, player) -> str:
+        return ''.join([seg if seg.__class__ is str else seg(player) for seg in self.segments])
+
+
+# The default status line: hp/mana/move, then sneak, momentum and opponent
+DEFAULT_PROMPT = PromptTemplate('default', _parse(
+    f"\r\n%C%h/%Hhp {_C['cyan']}%m/%Mmp {_C['yellow']}%v/%Vmv%S%W%E{_C['reset']}> ",
+    BUILTIN_FIELDS))
+
+# A player's format is framed like this, with the opponent's health appended
+_CUSTOM_TAIL = _parse(f" %E{_C['reset']}> ", BUILTIN_FIELDS)
+
+
+@lru_cache(maxsize=1024)
+def compile_prompt(source: str) -> PromptTemplate:
+    """Compile a player's prompt format (cached by source)."""
+    return PromptTemplate(source, ('\r\n',) + _parse(source, PLAYER_FIELDS) + _CUSTOM_TAIL)
+
+
+def prompt_for(player) -> PromptTemplate:
+    """The template a player's prompt is rendered with."""
+    custom = getattr(player, 'custom_prompt', None)
+    return compile_prompt(custom) if custom else DEFAULT_PROMPT
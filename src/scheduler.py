@@ -0,0 +1,162 @@
+"""
+Misthollow Scheduler
+===================
+Pulse-based job scheduler for the main game loop.
+
+Subsystems register periodic or one-shot jobs with a period (in pulses),
+an optional phase offset and a priority. Jobs live in a heap keyed by the
+pulse they are next due on, so each pulse only touches jobs that actually
+fire. Periodic jobs registered without an explicit phase are staggered so
+that heavy ticks (regen, decay, autosave, zone resets) do not pile up on
+the same pulse.
+"""
+
+import heapq
+import itertools
+import logging
+import time
+from math import gcd
+from typing import Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger('Misthollow.Scheduler')
+
+# Lower numbers run first when several jobs are due on the same pulse
+PRIORITY_CRITICAL = 0   # combat rounds
+PRIORITY_HIGH = 10      # affects, poison, time
+PRIORITY_NORMAL = 50    # regen, decay, pets, weather
+PRIORITY_LOW = 90       # autosave, cosmetic ambience
+
+
+class ScheduledJob:
+    """A single registered job."""
+
+    __slots__ = ('name', 'callback', 'period', 'priority', 'next_pulse',
+                 'oneshot', 'cancelled', 'runs')
+
+    def __init__(self, name: str, callback: Callable[[], Awaitable], period: int,
+                 priority: int, next_pulse: int, oneshot: bool):
+        self.name = name
+        self.callback = callback
+        self.period = period
+        self.priority = priority
+        self.next_pulse = next_pulse
+        self.oneshot = oneshot
+        self.cancelled = False
+        self.runs = 0
+
+    def __repr__(self):
+        kind = 'once' if self.oneshot else f'every {self.period}'
+        return f"<ScheduledJob {self.name} {kind} next={self.next_pulse}>"
+
+
+class Scheduler:
+    """Heap-backed scheduler driven once per game pulse."""
+
+    def __init__(self, pulses_per_second: int = 10):
+        self.pulses_per_second = pulses_per_second
+        self.pulse = 0
+        self._heap: List[tuple] = []
+        self._seq = itertools.count()
+        self.jobs: Dict[str, ScheduledJob] = {}
+        # Optional TickProfiler; when set, each job's run time is recorded
+        self.profiler = None
+
+    def seconds(self, seconds: float) -> int:
+        """Convert seconds to a whole number of pulses (at least one)."""
+        return max(1, int(round(seconds * self.pulses_per_second)))
+
+    def every(self, name: str, period: int, callback: Callable[[], Awaitable],
+              phase: Optional[int] = None, priority: int = PRIORITY_NORMAL) -> ScheduledJob:
+        """Register a periodic job.
+
+        The job first runs ``phase`` pulses from now (1..period) and then every
+        ``period`` pulses. If phase is omitted, the latest offset that collides
+        with as few already-registered periodic jobs as possible is used, so
+        the first run still lands close to one full period from now.
+        """
+        period = max(1, int(period))
+        if phase is None:
+            phase = self._pick_phase(period)
+        else:
+            phase = (int(phase) - 1) % period + 1
+        return self._add(name, callback, period, self.pulse + phase, priority, oneshot=False)
+
+    def once(self, name: str, delay: int, callback: Callable[[], Awaitable],
+             priority: int = PRIORITY_NORMAL) -> ScheduledJob:
+        """Register a job that runs a single time ``delay`` pulses from now."""
+        delay = max(1, int(delay))
+        return self._add(name, callback, delay, self.pulse + delay, priority, oneshot=True)
+
+    def cancel(self, name: str) -> bool:
+        """Cancel a job by name. Returns True if a job was cancelled."""
+        job = self.jobs.pop(name, None)
+        if not job:
+            return False
+        job.cancelled = True
+        return True
+
+    def get(self, name: str) -> Optional[ScheduledJob]:
+        return self.jobs.get(name)
+
+    def pulses_until(self, name: str) -> Optional[int]:
+        """Pulses remaining until a job next fires (None if unknown)."""
+        job = self.jobs.get(name)
+        if not job:
+            return None
+        return job.next_pulse - self.pulse
+
+    def _add(self, name, callback, period, next_pulse, priority, oneshot) -> ScheduledJob:
+        # Re-registering a name replaces the old job
+        self.cancel(name)
+        job = ScheduledJob(name, callback, period, priority, next_pulse, oneshot)
+        self.jobs[name] = job
+        heapq.heappush(self._heap, (job.next_pulse, job.priority, next(self._seq), job))
+        return job
+
+    def _pick_phase(self, period: int) -> int:
+        """Choose the first-fire offset that shares the fewest pulses with other jobs.
+
+        Two periodic jobs A and B ever fire on the same pulse iff their first
+        pulses are congruent modulo gcd(period_A, period_B).
+        """
+        others = [j for j in self.jobs.values() if not j.oneshot]
+        if not others:
+            return period
+        best_phase = period
+        best_score = None
+        for phase in range(period, 0, -1):
+            first = self.pulse + phase
+            score = 0
+            for job in others:
+                g = gcd(period, job.period)
+                if (first - job.next_pulse) % g == 0:
+                    # Weight by how often the two jobs would coincide
+                    score += g * g / (period * job.period)
+            if best_score is None or score < best_score:
+                best_score = score
+                best_phase = phase
+                if score == 0:
+                    break
+        return best_phase
+
+    async def tick(self):
+        """Advance one pulse and run every job that is now due."""
+        self.pulse += 1
+        heap = self._heap
+        while heap and heap[0][0] <= self.pulse:
+            _, _, _, job = heapq.heappop(heap)
+            if job.cancelled:
+                continue
+            if job.oneshot:
+                self.jobs.pop(job.name, None)
+            else:
+                job.next_pulse += job.period
+                heapq.heappush(heap, (job.next_pulse, job.priority, next(self._seq), job))
+            job.runs += 1
+            start = time.perf_counter()
+            try:
+                await job.callback()
+            except Exception as e:
+                logger.error(f"Scheduled job '{job.name}' failed: {e}", exc_info=True)
+            if self.profiler:
+                self.profiler.record(job.name, (time.perf_counter() - start) * 1000.0)
@@ -5,66 +5,24 @@ Handles network connections and player sessions.
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
-import re
-import textwrap
-from typing import Dict
+import time
+from collections import deque
+from typing import Dict, List, Optional
 from datetime import datetime
 import os
 
-_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
-_BOX_CHARS = set('║╔╗╚╝═╠╣╬╦╩─│┌┐└┘├┤┬┴┼')
-
-def _wrap_line(line: str, width: int = 80) -> str:
-    """Word-wrap a single line, preserving ANSI codes."""
-    stripped = _ANSI_RE.sub('', line)
-    # Skip wrapping for short lines or box-drawing lines
-    if len(stripped) <= width:
-        return line
-    # Check if line (after stripping ANSI) starts with box chars
-    first_visible = stripped.lstrip()
-    if first_visible and first_visible[0] in _BOX_CHARS:
-        return line
-    # Wrap using the stripped version, then re-insert ANSI codes
-    # Strategy: collect ANSI tokens with positions, wrap plain text, reinsert
-    tokens = []
-    plain = ''
-    for part in re.split(r'(\x1b\[[0-9;]*m)', line):
-        if part.startswith('\x1b['):
-            tokens.append((len(plain), part))
-        else:
-            plain += part
-    wrapped_plain = textwrap.fill(plain, width=width)
-    # Reinsert ANSI codes at their original character positions
-    result = []
-    ti = 0
-    for i, ch in enumerate(wrapped_plain):
-        while ti < len(tokens) and tokens[ti][0] <= i:
-            # Adjust: tokens map to original plain positions, but wrapped may have
-            # replaced spaces with newlines. Use a simpler approach.
-            pass
-            ti += 1
-        result.append(ch)
-    # Simpler approach: just wrap with ANSI by splitting and rejoining
-    # Remove ANSI, wrap, then try to preserve leading ANSI per original line
-    leading_ansi = ''
-    m = re.match(r'^(\x1b\[[0-9;]*m)+', line)
-    if m:
-        leading_ansi = m.group(0)
-    trailing_ansi = ''
-    m2 = re.search(r'(\x1b\[[0-9;]*m)+$', line)
-    if m2:
-        trailing_ansi = m2.group(0)
-    wrapped = textwrap.fill(stripped, width=width)
-    # Re-apply leading ANSI to each wrapped line
-    lines = wrapped.split('\n')
-    return '\n'.join(leading_ansi + l for l in lines) + (trailing_ansi if trailing_ansi and not lines[-1].endswith(trailing_ansi) else '')
-
-def _wrap_text(text: str, width: int = 80) -> str:
-    """Wrap multi-line text preserving newlines."""
-    return '\n'.join(_wrap_line(line, width) for line in text.split('\n'))
-
 from config import Config
+from telnet import (TelnetParser, iac, DO, DONT, WILL, WONT, OPT_NAWS, OPT_TTYPE, OPT_COMPRESS2,
+                    OPT_GMCP, TTYPE_SEND, parse_naws, parse_ttype)
+from mccp import MCCPStream, START_COMPRESS
+from gmcp import GMCPSession
+from text_layout import DEFAULT_WIDTH, clamp_width, wrap_text
+from prompt import prompt_for
+from bans import BanList, ConnectionRateLimiter
+from net_stats import ConnectionStats, NetStats
 
 logger = logging.getLogger('Misthollow.Server')
 
@@ -88,20 +46,45 @@ class Connection:
     STATE_CONFIRM_NEW_PASSWORD = 15
     STATE_CONFIRM_DELETE = 16
     
-    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, server):
-        self.reader = reader
-        self.writer = writer
+    def __init__(self, transport: Optional[asyncio.Transport], server, address=None):
+        # transport is None for sessions without a socket of their own
+        # (shard workers, the simulator); they pass their address instead.
+        self.transport = transport
         self.server = server
         self.world = server.world
         self.config = server.config
         
-        self.address = writer.get_extra_info('peername')
+        self.address = transport.get_extra_info('peername') if transport is not None else address
+        self.conn_id = f"{self.address[0]}:{self.address[1]}" if self.address else f"unknown-{id(self)}"
         self.connected_at = datetime.now()
         self.last_input = datetime.now()
+        self.last_activity = time.monotonic()  # Last input line, for the idle reaper
         
         self.state = self.STATE_GET_NAME
         self.player = None
-        self.input_buffer = []
+        self.input_buffer: deque = deque()  # (line, monotonic arrival) waiting for process_input
+        self.input_flooded = False
+
+        # Telnet negotiation; width comes from NAWS when the client offers it
+        self.telnet = TelnetParser()
+        self.width = DEFAULT_WIDTH
+        self.terminal_type: Optional[str] = None  # From TTYPE
+        self._refused = set()  # Options we already declined (no negotiation loops)
+        self.mccp: Optional[MCCPStream] = None  # Set once MCCP2 is agreed
+        self.gmcp: Optional[GMCPSession] = None  # Set once GMCP is agreed
+
+        # Outbound text is buffered and written once per command/pulse;
+        # the latest prompt always goes out last.
+        self.output_buffer: List[bytes] = []
+        self.pending_prompt: Optional[bytes] = None
+        self.pending_gmcp = b''  # Out-of-band messages, written after the text
+        self.last_prompt: Optional[bytes] = None  # Prompt the client saw last, if nothing followed it
+
+        # Flushed bytes are handed to the transport, which buffers whatever
+        # the socket can't take yet; nothing waits on a slow reader.
+        self.dropped_messages = 0
+        self.link_dead = False
+        self.stats = ConnectionStats()
         
         # Character creation temps
         self.temp_name = None
@@ -115,89 +98,207 @@ class Connection:
         
         logger.info(f"New connection from {self.address}")
         
-    async def send(self, message: str, newline: bool = True):
-        """Send a message to the client."""
-        try:
-            if message is None:
-                return
-            # Word-wrap before sending
-            message = _wrap_text(message, 80)
-            # Convert all newlines to \r\n for telnet compatibility
-            message = message.replace('\r\n', '\n').replace('\n', '\r\n')
-            if newline and not message.endswith('\r\n'):
-                message += '\r\n'
-            self.writer.write(message.encode('utf-8'))
-            await self.writer.drain()
-        except asyncio.CancelledError:
-            logger.debug(f"Send cancelled for {self.address}")
-        except (ConnectionResetError, BrokenPipeError, ConnectionAbortedError, OSError):
-            logger.debug(f"Connection lost while sending to {self.address}")
-        except Exception as e:
-            logger.error(f"Error sending to {self.address}: {e}")
-            
+    async def send(self, message: str, newline: bool = True, prompt: bool = False,
+                   low_priority: bool = False):
+        """Queue a message for the client; it is written on the next flush().
+
+        A prompt replaces any prompt already queued and is written after
+        everything else in the buffer. Low-priority messages (ambient,
+        channels) are dropped while the client is backlogged.
+        """
+        if message is None:
+            return
+        if low_priority and self.backlogged:
+            self.dropped_messages += 1
+            return
+        data = self.render(message, newline)
+        if prompt:
+            self.pending_prompt = data
+        else:
+            self.output_buffer.append(data)
+            self.stats.messages_out += 1
+
+    async def send_shared(self, message: str, rendered: dict, newline: bool = True,
+                          low_priority: bool = False):
+        """send() for fan_out(): reuse bytes already rendered for the same width."""
+        if low_priority and self.backlogged:
+            self.dropped_messages += 1
+            return
+        data = rendered.get(self.width)
+        if data is None:
+            data = rendered[self.width] = self.render(message, newline)
+        self.output_buffer.append(data)
+        self.stats.messages_out += 1
+
+    def render(self, message: str, newline: bool = True) -> bytes:
+        """Wrap to the client's width, convert newlines for telnet and encode."""
+        message = wrap_text(message, self.width)
+        message = message.replace('\r\n', '\n').replace('\n', '\r\n')
+        if newline and not message.endswith('\r\n'):
+            message += '\r\n'
+        return message.encode('utf-8')
+
+    def update_gmcp(self):
+        """Queue GMCP deltas for whatever changed since the last update."""
+        # With shards the live character is in a worker, not self.player
+        if self.gmcp and self.player and self.state == self.STATE_PLAYING and not self.server.router:
+            self.pending_gmcp += self.gmcp.update(self.player)
+
+    @property
+    def has_output(self) -> bool:
+        return bool(self.output_buffer) or self.pending_prompt is not None or bool(self.pending_gmcp)
+
+    async def flush(self):
+        """Write everything queued by send() in a single write/drain."""
+        if not self.has_output:
+            return
+        if self.pending_prompt is not None:
+            self.output_buffer.append(self.pending_prompt)
+            self.last_prompt = self.pending_prompt
+            self.pending_prompt = None
+        elif self.output_buffer:
+            self.last_prompt = None
+        data = b''.join(self.output_buffer)
+        self.output_buffer.clear()
+        if self.pending_gmcp:
+            data += self.pending_gmcp
+            self.pending_gmcp = b''
+        await self.write_raw(data)
+
+    async def write_raw(self, data: bytes):
+        """Queue bytes for the socket as-is (telnet commands, flushed text)."""
+        if self.mccp:
+            data = self.mccp.compress(data)
+        self._enqueue(data)
+
+    @property
+    def outbound_bytes(self) -> int:
+        """Bytes written but not yet accepted by the socket."""
+        return self.transport.get_write_buffer_size() if self.transport else 0
+
+    @property
+    def backlogged(self) -> bool:
+        return self.outbound_bytes >= self.config.OUTBOUND_HIGH_WATER
+
+    def _enqueue(self, data: bytes):
+        if self.link_dead or not data:
+            return
+        if self.transport is None:
+            self.stats.bytes_out += len(data)  # No socket: counted and dropped
+            return
+        if self.transport.is_closing():
+            return
+        self.transport.write(data)
+        self.stats.bytes_out += len(data)
+        if self.outbound_bytes > self.config.OUTBOUND_LIMIT:
+            self.mark_link_dead()
+
+    def mark_link_dead(self):
+        """Give up on a client that stopped reading; connection_lost cleans up."""
+        if self.link_dead:
+            return
+        self.link_dead = True
+        logger.warning(f"Dropping link-dead client {self.address}: "
+                       f"{self.outbound_bytes} bytes unsent, {self.dropped_messages} messages dropped")
+        self.transport.abort()
+
+    def close(self):
+        """Close once queued output is sent, or after OUTBOUND_CLOSE_TIMEOUT."""
+        transport = self.transport
+        if transport is None or transport.is_closing():
+            return
+        transport.close()
+        if transport.get_write_buffer_size():
+            asyncio.get_running_loop().call_later(self.config.OUTBOUND_CLOSE_TIMEOUT, transport.abort)
+
+    def queue_input(self, line: str) -> bool:
+        """Hold a line for the game pulse; False if it had to be dropped."""
+        if len(self.input_buffer) >= self.config.INPUT_QUEUE_LIMIT:
+            return False
+        self.input_buffer.append((line, time.monotonic()))
+        self.input_flooded = False
+        return True
+
+    def telnet_input(self, data: bytes) -> bytes:
+        """Strip telnet negotiation from raw input and act on it."""
+        data = self.telnet.feed(data)
+        for event in self.telnet.take_events():
+            self.handle_telnet(event)
+        return data
+
+    def handle_telnet(self, event: tuple):
+        """React to one negotiation event from the client."""
+        kind, option = event[0], event[1]
+        if kind == 'sb':
+            if option == OPT_NAWS:
+                width, _ = parse_naws(event[2])
+                self.width = clamp_width(width)
+            elif option == OPT_TTYPE:
+                self.terminal_type = parse_ttype(event[2]) or self.terminal_type
+            elif option == OPT_GMCP and self.gmcp:
+                self.gmcp.handle(event[2])
+        elif kind == 'do':
+            if option == OPT_COMPRESS2:
+                self.start_compression()
+            elif option == OPT_GMCP:
+                if not self.gmcp:
+                    self.gmcp = GMCPSession()
+            else:
+                self._refuse(WONT, option)
+        elif kind == 'dont':
+            if option == OPT_COMPRESS2:
+                self.stop_compression()
+            elif option == OPT_GMCP:
+                self.gmcp = None
+        elif kind == 'will':
+            if option == OPT_TTYPE:
+                self._enqueue(TTYPE_SEND)
+            elif option != OPT_NAWS:
+                self._refuse(DONT, option)
+        elif kind == 'wont':
+            if option == OPT_NAWS:
+                self.width = DEFAULT_WIDTH
+
+    def _refuse(self, verb: int, option: int):
+        """Decline an option we don't support, once, so clients can't loop us."""
+        if (verb, option) not in self._refused:
+            self._refused.add((verb, option))
+            self._enqueue(iac(verb, option))
+
+    def start_compression(self):
+        """Begin MCCP2: output after the start marker is zlib-compressed."""
+        if self.mccp or self.transport is None or self.transport.is_closing():
+            return
+        # Queued uncompressed, ahead of anything flushed from now on
+        self._enqueue(START_COMPRESS)
+        self.mccp = MCCPStream(self.world.compression_stats)
+
+    def stop_compression(self):
+        """End the zlib stream; later output is sent uncompressed."""
+        if not self.mccp:
+            return
+        tail = self.mccp.finish()
+        self.mccp = None
+        self._enqueue(tail)
+
     async def send_prompt(self):
         """Send the appropriate prompt based on state."""
+        self.update_gmcp()
         if self.state == self.STATE_PLAYING and self.player:
             # Respect prompt toggle
             if not getattr(self.player, 'prompt_enabled', True):
                 return
             
-            c = self.config.COLORS
-            hp_color = c['green'] if self.player.hp > self.player.max_hp * 0.5 else c['yellow'] if self.player.hp > self.player.max_hp * 0.25 else c['red']
-
-            # Sneaking indicator
-            sneak_status = ""
-            if hasattr(self.player, 'flags') and 'sneaking' in self.player.flags:
-                sneak_status = f" {c['bright_black']}[sneaking]{c['reset']}"
-            
-            # Add enemy health if fighting
-            enemy_status = ""
-            if self.player.is_fighting and self.player.fighting:
-                enemy = self.player.fighting
-                enemy_hp_pct = (enemy.hp / enemy.max_hp) * 100
-                enemy_color = c['bright_green'] if enemy_hp_pct > 75 else c['green'] if enemy_hp_pct > 50 else c['yellow'] if enemy_hp_pct > 25 else c['red']
-                enemy_status = f" {c['white']}[{enemy_color}{enemy.name}: {enemy.hp}/{enemy.max_hp}{c['white']}]{c['reset']}"
-
-            # Custom prompt support
-            custom = getattr(self.player, 'custom_prompt', None)
-            if custom:
-                hp_pct = int((self.player.hp / self.player.max_hp) * 100) if self.player.max_hp > 0 else 0
-                mana_pct = int((self.player.mana / self.player.max_mana) * 100) if self.player.max_mana > 0 else 0
-                move_pct = int((self.player.move / self.player.max_move) * 100) if self.player.max_move > 0 else 0
-                
-                prompt = custom
-                prompt = prompt.replace('%h', str(self.player.hp))
-                prompt = prompt.replace('%H', str(self.player.max_hp))
-                prompt = prompt.replace('%m', str(self.player.mana))
-                prompt = prompt.replace('%M', str(self.player.max_mana))
-                prompt = prompt.replace('%v', str(self.player.move))
-                prompt = prompt.replace('%V', str(self.player.max_move))
-                prompt = prompt.replace('%g', str(self.player.gold))
-                prompt = prompt.replace('%x', str(self.player.exp))
-                prompt = prompt.replace('%p', str(hp_pct))
-                prompt = prompt.replace('%q', str(mana_pct))
-                prompt = prompt.replace('%r', str(move_pct))
-                prompt = prompt.replace('%n', '\r\n')
-                
-                prompt = f"\r\n{prompt} {enemy_status}{c['reset']}> "
-                await self.send(prompt, newline=False)
+            prompt = prompt_for(self.player).render(self.player)
+            # Combat rounds re-prompt constantly; an unchanged prompt with
+            # nothing written since the last one adds nothing
+            if (self.player.is_fighting and self.last_prompt is not None
+                    and not self.output_buffer and self.pending_prompt is None
+                    and self.render(prompt, newline=False) == self.last_prompt):
                 return
-
-            # Warrior Momentum display in prompt
-            momentum_status = ""
-            if getattr(self.player, 'char_class', '').lower() == 'warrior':
-                mom = getattr(self.player, 'momentum', 0)
-                if mom > 0:
-                    filled = '█' * mom
-                    empty = '░' * (10 - mom)
-                    momentum_status = f" {c['bright_yellow']}[Momentum: {filled}{empty} {mom}/10]{c['reset']}"
-                    if getattr(self.player, 'unstoppable_rounds', 0) > 0:
-                        momentum_status += f" {c['bright_red']}★UNSTOPPABLE★{c['reset']}"
-
-            prompt = f"\r\n{hp_color}{self.player.hp}/{self.player.max_hp}hp {c['cyan']}{self.player.mana}/{self.player.max_mana}mp {c['yellow']}{self.player.move}/{self.player.max_move}mv{sneak_status}{momentum_status}{enemy_status}{c['reset']}> "
-            await self.send(prompt, newline=False)
+            await self.send(prompt, newline=False, prompt=True)
         else:
-            await self.send("> ", newline=False)
+            await self.send("> ", newline=False, prompt=True)
             
     async def handle_input(self, line: str):
         """Process input based on current state."""
@@ -476,6 +577,10 @@ class Connection:
     async def enter_game(self):
         """Enter the game world."""
         self.state = self.STATE_PLAYING
+        if self.server.router:
+            # Sharded mode: the zone's worker process runs the session
+            await self.server.router.attach(self)
+            return
         self.player.connection = self
         
         # Track login info for account system
@@ -1058,7 +1163,8 @@ class Connection:
         
         elif cmd == 'quit' or cmd == 'q':
             await self.send("Farewell! Disconnecting...")
-            self.writer.close()
+            await self.flush()
+            self.close()
             return
         
         elif cmd.isdigit():
@@ -1177,6 +1283,10 @@ class Connection:
         
     async def handle_command(self, line: str):
         """Handle a game command."""
+        if self.server.router:
+            await self.server.router.forward(self, line)
+            return
+
         if not line:
             # Allow help pagination to continue on empty input
             if getattr(self.player, 'help_pagination', None):
@@ -1250,11 +1360,44 @@ class Connection:
         
         await self.send_prompt()
         
+    def idle_deadline(self) -> float:
+        """Monotonic time at which this session times out without more input.
+
+        Every state before STATE_PLAYING (login, character creation, the
+        account menu) gets the short LOGIN_TIMEOUT_SECONDS.
+        """
+        if self.state != self.STATE_PLAYING:
+            return self.last_activity + self.config.LOGIN_TIMEOUT_SECONDS
+        return self.last_activity + self.config.IDLE_TIMEOUT_SECONDS
+
+    async def idle_timeout(self):
+        """Disconnect after no input until idle_deadline()."""
+        # Force-rent at 2x cost on idle timeout
+        if self.player and self.state == self.STATE_PLAYING:
+            try:
+                from commands import CommandHandler
+                rent_cost = CommandHandler.calc_total_rent(self.player) * 2
+                if self.player.gold >= rent_cost:
+                    self.player.gold -= rent_cost
+                    self.player.rent_paid = True
+                    await self.send(f"\r\nIdle timeout! You've been force-rented for {rent_cost} gold (2x normal rate).\r\n")
+                else:
+                    await self.send(f"\r\nIdle timeout! You couldn't afford rent ({rent_cost} gold). Some items may be lost!\r\n")
+            except Exception:
+                pass
+        else:
+            await self.send("\r\nConnection timed out. Goodbye!\r\n")
+        await self.flush()
+        self.close()
+
     async def disconnect(self):
         """Handle disconnection gracefully — stop combat, save state, clean up."""
         logger.info(f"Connection closed: {self.address}")
-        
-        if self.player:
+
+        if self.player and self.state == self.STATE_PLAYING and self.server.router:
+            # The owning shard saves and removes the character
+            await self.server.router.detach(self)
+        elif self.player:
             try:
                 # Stop combat immediately
                 if self.player.fighting:
@@ -1301,26 +1444,161 @@ class Connection:
             # Clear connection reference
             self.player.connection = None
         
-        try:
-            self.writer.close()
-            await self.writer.wait_closed()
-        except Exception:
-            pass
+        await self.flush()
+        self.stop_compression()
+        self.close()
+
+
+class TelnetProtocol(asyncio.Protocol):
+    """Socket side of one telnet session.
+
+    Bytes go through the connection's telnet parser, complete lines are
+    cut out of a single bytearray and queued for the game pulse, and
+    connection loss hands off to the server for cleanup. There is no
+    per-connection task; idle sessions cost only their buffers.
+    """
+
+    __slots__ = ('server', 'conn', '_buffer')
+
+    def __init__(self, server: 'MUDServer'):
+        self.server = server
+        self.conn: Optional[Connection] = None
+        self._buffer = bytearray()
+
+    def connection_made(self, transport: asyncio.Transport):
+        self.conn = self.server.accept(transport)
+
+    def data_received(self, data: bytes):
+        conn = self.conn
+        if conn is None:
+            return
+        conn.stats.bytes_in += len(data)
+        buf = self._buffer
+        buf += conn.telnet_input(data)
+        start = 0
+        nl = buf.find(b'\n')
+        if nl >= 0:
+            with memoryview(buf) as view:
+                while nl >= 0:
+                    line = str(view[start:nl], 'utf-8', 'ignore').strip()
+                    self.server.receive_line(conn, line)
+                    start = nl + 1
+                    nl = buf.find(b'\n', start)
+            del buf[:start]
+        if len(buf) > self.server.MAX_LINE_BYTES:
+            logger.info(f"Dropping {conn.address}: unterminated line over {self.server.MAX_LINE_BYTES} bytes")
+            buf.clear()
+            conn.close()
+
+    def connection_lost(self, exc: Optional[Exception]):
+        if exc:
+            logger.info(f"Connection lost for {self.conn.address if self.conn else 'unknown'}: {exc}")
+        if self.conn is not None:
+            asyncio.ensure_future(self.server.finish_connection(self.conn))
+            self.conn = None
+
+
+async def fan_out(recipients, message: str, newline: bool = True, low_priority: bool = False):
+    """Send one message to many characters, rendering it once per client width.
+
+    Recipients without a connection (NPCs, linkdead players) are skipped;
+    callers apply their own filters when building ``recipients``.
+    """
+    if message is None:
+        return
+    rendered = {}
+    for char in recipients:
+        conn = getattr(char, 'connection', None)
+        if conn is not None:
+            await conn.send_shared(message, rendered, newline, low_priority)
+
+
+class IdleReaper:
+    """Times out idle connections from one shared timer.
+
+    Connections sit in a heap ordered by the deadline they had when last
+    pushed. Input never touches the heap: when an entry comes due the real
+    deadline is recomputed, and a connection that has had input since is
+    pushed back. Each sweep therefore only looks at connections that are
+    due, however many are connected.
+    """
+
+    def __init__(self, server: 'MUDServer'):
+        self.server = server
+        self._heap: List[tuple] = []    # (deadline, seq, connection)
+        self._seq = itertools.count()  # Tie-breaker; connections don't compare
+        self._stale = 0                # Entries for connections already gone
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def start(self):
+        self._timer = asyncio.get_running_loop().call_later(
+            self.server.config.IDLE_CHECK_SECONDS, self.sweep)
+
+    def stop(self):
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+    def track(self, conn: Connection):
+        heapq.heappush(self._heap, (conn.idle_deadline(), next(self._seq), conn))
+
+    def discard(self, conn: Connection):
+        """Note a finished connection; its entry is dropped lazily."""
+        self._stale += 1
+        if self._stale > len(self._heap) // 2:
+            # Mostly dead entries: rebuild so closed sessions are released
+            live = self.server.connections
+            self._heap = [e for e in self._heap if live.get(e[2].conn_id) is e[2]]
+            heapq.heapify(self._heap)
+            self._stale = 0
+
+    def sweep(self):
+        now = time.monotonic()
+        heap = self._heap
+        live = self.server.connections
+        while heap and heap[0][0] <= now:
+            _, _, conn = heapq.heappop(heap)
+            if live.get(conn.conn_id) is not conn:
+                self._stale = max(0, self._stale - 1)
+                continue
+            deadline = conn.idle_deadline()
+            if deadline > now:
+                heapq.heappush(heap, (deadline, next(self._seq), conn))
+            elif not conn.transport.is_closing():
+                asyncio.ensure_future(conn.idle_timeout())
+        self.start()
 
 
 class MUDServer:
     """Main MUD server class."""
+
+    # Longest input line buffered while waiting for its newline
+    MAX_LINE_BYTES = 65536
     
     def __init__(self, world, config: Config):
         self.world = world
         self.config = config
         self.connections: Dict[str, Connection] = {}
         self.server = None
+        self.router = None  # ShardRouter when running with zone shards
+        # Connections with queued input, in round-robin order
+        self._input_ready: deque = deque()
+        self.reaper = IdleReaper(self)
+        self.bans = BanList(config.BAN_FILE)
+        self.bans.load()
+        self.rate_limiter = ConnectionRateLimiter(
+            config.CONNECT_RATE_LIMIT, config.CONNECT_RATE_WINDOW, config.CONNECT_RATE_EXEMPT)
+        # For the ipban command
+        world.ban_list = self.bans
+        world.connection_limiter = self.rate_limiter
+        # For the netstat command and the dashboard
+        self.net_stats = world.net_stats = NetStats(self.connections)
         
     async def start(self):
         """Start the server."""
-        self.server = await asyncio.start_server(
-            self.handle_connection,
+        loop = asyncio.get_running_loop()
+        self.server = await loop.create_server(
+            lambda: TelnetProtocol(self),
             self.config.HOST,
             self.config.PORT,
             reuse_address=True
@@ -1329,95 +1607,64 @@ class MUDServer:
         addr = self.server.sockets[0].getsockname()
         logger.info(f"Server listening on {addr[0]}:{addr[1]}")
         
-        asyncio.create_task(self.server.serve_forever())
-        
-    # --- IP Ban List ---
-    BANNED_IPS = {
-        # Scanners / bots
-        '204.76.203.210', '193.111.248.141', '157.245.224.87',
-        '157.230.157.100', '18.116.101.220', '3.129.187.38',
-        '89.42.231.182', '204.76.203.215', '3.130.168.2',
-        '167.94.138.171', '16.58.56.214', '206.168.34.58',
-        # China
-        '106.117.108.141', '110.177.176.239', '110.177.181.3',
-        '111.162.156.51', '111.162.158.127', '112.122.236.114',
-        '113.57.185.86', '119.164.101.49', '119.48.135.48',
-        '121.29.84.65', '122.96.28.137', '123.160.223.73',
-        '123.160.223.74', '123.191.141.46', '123.191.159.14',
-        '123.245.85.154', '124.117.192.143', '124.117.192.29',
-        '124.117.193.197', '14.135.75.17', '171.12.10.208',
-        '171.12.10.76', '171.37.93.108', '220.167.232.177',
-        '220.167.233.72', '220.197.78.186', '221.199.14.242',
-        '221.199.73.249', '221.207.34.83', '222.176.200.45',
-        '222.176.201.50', '222.176.201.94', '222.186.13.130',
-        '223.166.22.174', '223.166.22.191', '223.166.22.35',
-        '27.47.27.109', '59.173.109.209', '60.13.7.147',
-        '60.16.200.153',
-        # Scanners (added Mar 15)
-        '85.217.149.48',
-    }
-
-    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
-        """Handle a new connection."""
-        conn = Connection(reader, writer, self)
-        conn_id = f"{conn.address[0]}:{conn.address[1]}" if conn.address else f"unknown-{id(conn)}"
-
-        # Block banned IPs immediately
-        client_ip = conn.address[0] if conn.address else None
-        if client_ip and client_ip in self.BANNED_IPS:
-            logger.info(f"Blocked banned IP: {client_ip}")
-            try:
-                writer.close()
-            except Exception:
-                pass
-            return
-
-        self.connections[conn_id] = conn
+        self.reaper.start()
         
+    def accept(self, transport: asyncio.Transport) -> Optional[Connection]:
+        """Set up a session for a new socket (None if it was refused)."""
+        address = transport.get_extra_info('peername')
+
+        # Refuse banned sites and connection floods before building anything
+        client_ip = address[0] if address else None
+        if client_ip:
+            ban = self.bans.match(client_ip)
+            if ban:
+                self.bans.blocked += 1
+                logger.info(f"Blocked banned IP: {client_ip} ({ban})")
+                transport.abort()
+                return None
+            if not self.rate_limiter.allow(client_ip):
+                logger.debug(f"Connection rate limit: refused {client_ip}")
+                transport.abort()
+                return None
+
+        conn = Connection(transport, self)
+        self.connections[conn.conn_id] = conn
+        self.reaper.track(conn)
+        asyncio.ensure_future(self.greet(conn))
+        return conn
+
+    async def greet(self, conn: Connection):
+        """Open negotiation and show the welcome screen."""
+        # Ask for the window size and terminal type, offer compression/GMCP
+        await conn.write_raw(iac(DO, OPT_NAWS) + iac(DO, OPT_TTYPE)
+                             + iac(WILL, OPT_COMPRESS2) + iac(WILL, OPT_GMCP))
+        await self.send_welcome(conn)
+        await conn.flush()
+
+    def receive_line(self, conn: Connection, line: str):
+        """Queue one line of input; commands run on the game pulse (process_input)."""
+        conn.last_activity = time.monotonic()
+        if not conn.input_buffer:
+            self._input_ready.append(conn)
+        if not conn.queue_input(line) and not conn.input_flooded:
+            conn.input_flooded = True
+            conn.output_buffer.append(conn.render(
+                f"\r\n*** Input flood: lines beyond {self.config.INPUT_QUEUE_LIMIT} "
+                f"queued commands discarded ***"))
+
+    async def finish_connection(self, conn: Connection):
+        """The socket is gone: save and remove the session."""
+        # Queued commands die with the socket
+        conn.input_buffer.clear()
         try:
-            # Send welcome screen
-            await self.send_welcome(conn)
-            
-            # Read input loop
-            while True:
-                try:
-                    data = await asyncio.wait_for(reader.readline(), timeout=1800.0)
-                    if not data:
-                        break
-                    line = data.decode('utf-8', errors='ignore').strip()
-                    await conn.handle_input(line)
-                except asyncio.TimeoutError:
-                    # Force-rent at 2x cost on idle timeout
-                    if conn.player:
-                        try:
-                            from commands import CommandHandler
-                            rent_cost = CommandHandler.calc_total_rent(conn.player) * 2
-                            if conn.player.gold >= rent_cost:
-                                conn.player.gold -= rent_cost
-                                conn.player.rent_paid = True
-                                await conn.send(f"\r\nIdle timeout! You've been force-rented for {rent_cost} gold (2x normal rate).\r\n")
-                            else:
-                                await conn.send(f"\r\nIdle timeout! You couldn't afford rent ({rent_cost} gold). Some items may be lost!\r\n")
-                        except Exception:
-                            pass
-                    else:
-                        await conn.send("\r\nConnection timed out. Goodbye!\r\n")
-                    break
-                except (ConnectionResetError, BrokenPipeError, ConnectionAbortedError, OSError) as e:
-                    addr = getattr(conn, 'address', 'unknown')
-                    logger.info(f"Connection lost for {addr}: {e}")
-                    break
-                except Exception as e:
-                    import traceback
-                    logger.error(f"Error handling input: {e}")
-                    logger.error(traceback.format_exc())
-                    break
-                    
-        finally:
             await conn.disconnect()
-            if conn_id in self.connections:
-                del self.connections[conn_id]
-                
+        except Exception as e:
+            logger.error(f"Error disconnecting {conn.address}: {e}")
+        if self.connections.get(conn.conn_id) is conn:
+            del self.connections[conn.conn_id]
+            self.net_stats.retire(conn.stats)
+        self.reaper.discard(conn)
+
     async def send_welcome(self, conn: Connection):
         """Send the welcome screen."""
         c = self.config.COLORS
@@ -1451,13 +1698,58 @@ class MUDServer:
         await conn.send(welcome, newline=False)
         
     async def process_input(self):
-        """Process input from all connections (called each tick)."""
-        # Input is handled asynchronously per connection
-        pass
+        """Run queued commands (called each tick).
+
+        Connections take turns: at most one command each per pulse, up to
+        INPUT_COMMANDS_PER_PULSE in total, so a pasted wall of commands
+        can't starve other players or the tick. A character with a
+        wait_state sits out until it counts down.
+        """
+        for conn in self.connections.values():
+            player = conn.player
+            if player is not None and getattr(player, 'wait_state', 0) > 0:
+                player.wait_state -= 1
+
+        ready = self._input_ready
+        budget = self.config.INPUT_COMMANDS_PER_PULSE
+        for _ in range(len(ready)):
+            conn = ready.popleft()
+            if not conn.input_buffer:
+                continue  # Disconnected
+            player = conn.player
+            if budget <= 0 or (player is not None and getattr(player, 'wait_state', 0) > 0):
+                ready.append(conn)
+                continue
+            budget -= 1
+            # The line stays queued while it runs so the reader doesn't
+            # re-add this connection to the ready list meanwhile
+            line, received = conn.input_buffer[0]
+            sent_before = conn.stats.messages_out
+            try:
+                await conn.handle_input(line)
+                await conn.flush()
+            except Exception as e:
+                # One bad command must not escape into the game loop
+                name = conn.player.name if conn.player else conn.address
+                logger.error(f"Error handling input from {name}: {e}", exc_info=True)
+            self.net_stats.record_command(conn.stats, received, conn.stats.messages_out - sent_before)
+            if conn.input_buffer:
+                conn.input_buffer.popleft()
+            if conn.input_buffer:
+                ready.append(conn)
+
+    async def flush_output(self):
+        """Flush output queued outside a command (combat, ticks, other players)."""
+        for conn in list(self.connections.values()):
+            if conn.gmcp:
+                conn.update_gmcp()
+            if conn.has_output:
+                await conn.flush()
         
     async def shutdown(self):
         """Shut down the server."""
         logger.info("Shutting down server...")
+        self.reaper.stop()
         
         # Disconnect all clients
         for conn in list(self.connections.values()):
@@ -1470,6 +1762,7 @@ class MUDServer:
             
     async def broadcast(self, message: str, exclude=None):
         """Broadcast a message to all players."""
-        for conn in self.connections.values():
+        rendered = {}
+        for conn in list(self.connections.values()):
             if conn.player and (exclude is None or conn.player not in exclude):
-                await conn.send(f"\r\n{message}\r\n")
+                await conn.send_shared(f"\r\n{message}\r\n", rendered)
@@ -0,0 +1,518 @@
+"""
+Misthollow Zone Sharding
+=======================
+Optional multi-process mode (``main.py --shards N``).
+
+The zones in ``world/zones/*.json`` are split into N groups, and each group
+is simulated by its own worker process with its own tick loop, scheduler
+and NPCs. The front-end process keeps ``MUDServer`` and every socket. It
+handles login and character selection itself, then relays each playing
+session's input to the shard that owns the player's zone and relays that
+shard's output back to the socket. A worker queues the input it receives
+and runs it on its own pulse through ``MUDServer.process_input``, so
+fair turns, wait_state and the flood limit apply there as well.
+
+Handoff: every worker loads the whole map, but it marks the zones it does
+not own as remote. Remote zones hold no NPCs and are never simulated. When
+a player walks into a remote room through ``Room.exits`` (or flees, recalls
+or is summoned into one), ``World.player_moved`` queues a handoff. At the
+end of the pulse the worker saves the character and removes it from its
+world, and the front end asks the owning shard to load it into the target
+room. Input typed during a handoff is held and replayed once the new shard
+reports the player ready.
+
+Limitations: each shard only knows its own players. ``who``, tells,
+channels, groups and combat across shards are not bridged, and every
+shard keeps its own game clock and world events.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import signal
+from typing import Dict, List, Set, TYPE_CHECKING
+
+from config import Config
+
+if TYPE_CHECKING:
+    from server import Connection
+
+logger = logging.getLogger('Misthollow.Sharding')
+
+# Penalty per exit that would cross between shards, in room-weight units
+CUT_EXIT_WEIGHT = 4
+# Allow a shard to run this much over an even share before spilling over
+BALANCE_SLACK = 1.15
+
+
+def plan_shards(world, count: int) -> List[Set[int]]:
+    """Partition the world's zones into ``count`` shards.
+
+    Zones are weighed by rooms plus mob resets. They are placed heaviest
+    first onto the shard that is lightest once their exits into it are
+    credited, so neighbouring zones stay together where the balance allows.
+    """
+    count = max(1, count)
+    weights: Dict[int, int] = {}
+    links: Dict[int, Dict[int, int]] = {}
+    for zone in world.zones.values():
+        weights[zone.number] = sum(1 + len(room.mob_resets) for room in zone.rooms.values())
+        links[zone.number] = {}
+    for room in world.rooms.values():
+        if room.zone is None:
+            continue
+        for exit_data in room.exits.values():
+            target = (exit_data or {}).get('room')
+            if target is None or target.zone is None or target.zone is room.zone:
+                continue
+            edges = links[room.zone.number]
+            edges[target.zone.number] = edges.get(target.zone.number, 0) + 1
+
+    capacity = sum(weights.values()) / count * BALANCE_SLACK
+    shards: List[Set[int]] = [set() for _ in range(count)]
+    loads = [0] * count
+    for number in sorted(weights, key=lambda n: (-weights[n], n)):
+        weight = weights[number]
+        best = None
+        best_score = None
+        for idx in range(count):
+            if loads[idx] and loads[idx] + weight > capacity:
+                continue
+            shared = sum(links[number].get(other, 0) + links[other].get(number, 0)
+                         for other in shards[idx])
+            score = loads[idx] - shared * CUT_EXIT_WEIGHT
+            if best_score is None or score < best_score:
+                best, best_score = idx, score
+        if best is None:
+            best = loads.index(min(loads))
+        shards[best].add(number)
+        loads[best] += weight
+    return shards
+
+
+def count_boundary_exits(world, shards: List[Set[int]]) -> int:
+    """Number of room exits that lead from one shard into another."""
+    owner = {number: idx for idx, zones in enumerate(shards) for number in zones}
+    total = 0
+    for room in world.rooms.values():
+        if room.zone is None:
+            continue
+        for exit_data in room.exits.values():
+            target = (exit_data or {}).get('room')
+            if target is not None and target.zone is not None:
+                if owner.get(target.zone.number) != owner.get(room.zone.number):
+                    total += 1
+    return total
+
+
+# ----------------------------------------------------------------------
+# Front-end side
+# ----------------------------------------------------------------------
+
+class ShardRouter:
+    """Front-end router between socket connections and shard workers."""
+
+    def __init__(self, world, server, count: int):
+        self.world = world
+        self.server = server
+        self.config = server.config
+        self.plan = plan_shards(world, count)
+        self.zone_owner: Dict[int, int] = {
+            number: idx for idx, zones in enumerate(self.plan) for number in zones}
+        self.processes: List[multiprocessing.Process] = []
+        self.pipes: List = []
+        self.sessions: Dict[str, 'Connection'] = {}
+        self.location: Dict[str, int] = {}       # name -> shard running the player
+        self.pending: Dict[str, List[str]] = {}  # input held until a shard is ready
+        self.handoffs = 0
+        self._inbox: asyncio.Queue = asyncio.Queue()
+        self._pump = None
+        self._stopped = False
+
+    async def start(self):
+        """Spawn one worker process per shard."""
+        ctx = multiprocessing.get_context('spawn')
+        loop = asyncio.get_running_loop()
+        for idx, zones in enumerate(self.plan):
+            parent, child = ctx.Pipe()
+            proc = ctx.Process(target=run_shard_worker, args=(idx, sorted(zones), child),
+                               name=f'misthollow-shard-{idx}', daemon=True)
+            proc.start()
+            child.close()
+            self.processes.append(proc)
+            self.pipes.append(parent)
+            loop.add_reader(parent.fileno(), self._on_readable, idx)
+        self._pump = asyncio.create_task(self._dispatch())
+        logger.info(f"Started {len(self.plan)} zone shards "
+                    f"({count_boundary_exits(self.world, self.plan)} boundary exits)")
+        for idx, zones in enumerate(self.plan):
+            logger.info(f"  Shard {idx}: {len(zones)} zones")
+
+    def shard_for_room(self, vnum: int) -> int:
+        room = self.world.get_room(vnum)
+        if room is None or room.zone is None:
+            return 0
+        return self.zone_owner.get(room.zone.number, 0)
+
+    def _send(self, idx: int, message: tuple):
+        try:
+            self.pipes[idx].send(message)
+        except (BrokenPipeError, EOFError, OSError) as e:
+            logger.error(f"Shard {idx} unreachable: {e}")
+
+    def _on_readable(self, idx: int):
+        pipe = self.pipes[idx]
+        try:
+            while pipe.poll():
+                self._inbox.put_nowait((idx, pipe.recv()))
+        except (EOFError, OSError):
+            asyncio.get_running_loop().remove_reader(pipe.fileno())
+            if not self._stopped:
+                logger.error(f"Shard {idx} exited unexpectedly")
+
+    async def attach(self, conn: 'Connection'):
+        """Hand a freshly logged-in session to the shard owning its room."""
+        player = conn.player
+        name = player.name.lower()
+        # Workers load from disk; make sure new characters exist there. A
+        # returning character's file already has its room, so leave it be.
+        if not player.exists(player.name):
+            await player.save()
+        self.sessions[name] = conn
+        self.pending[name] = []
+        vnum = player.room_vnum or self.config.STARTING_ROOM
+        self._send(self.shard_for_room(vnum), ('login', name, conn.address))
+
+    async def forward(self, conn: 'Connection', line: str):
+        """Relay one line of input to the player's shard."""
+        self._route_input(conn.player.name.lower(), line)
+
+    def _route_input(self, name: str, line: str):
+        held = self.pending.get(name)
+        if held is not None:
+            held.append(line)
+            return
+        idx = self.location.get(name)
+        if idx is not None:
+            self._send(idx, ('input', name, line))
+
+    async def detach(self, conn: 'Connection'):
+        """The socket went away: let the owning shard save and remove the player."""
+        name = conn.player.name.lower()
+        if self.sessions.get(name) is not conn:
+            return
+        del self.sessions[name]
+        self.pending.pop(name, None)
+        idx = self.location.pop(name, None)
+        if idx is not None:
+            self._send(idx, ('logout', name))
+
+    async def _dispatch(self):
+        touched = set()
+        while True:
+            idx, message = await self._inbox.get()
+            try:
+                await self._handle(idx, message)
+            except Exception as e:
+                logger.error(f"Shard {idx} message {message[0]!r} failed: {e}", exc_info=True)
+            conn = self.sessions.get(message[1])
+            if conn:
+                touched.add(conn)
+            if self._inbox.empty():
+                # One write per session for everything the shards just sent
+                for conn in touched:
+                    await conn.flush()
+                touched.clear()
+
+    async def _handle(self, idx: int, message: tuple):
+        kind, name = message[0], message[1]
+        conn = self.sessions.get(name)
+        if kind == 'out':
+            if conn:
+                await conn.send(message[2], newline=message[3], prompt=message[4],
+                                low_priority=message[5])
+        elif kind == 'ready':
+            if conn is None:
+                # Socket closed while the player was in transit
+                self._send(idx, ('logout', name))
+                return
+            self.location[name] = idx
+            for line in self.pending.pop(name, []):
+                self._send(idx, ('input', name, line))
+        elif kind == 'bounce':
+            # Typed before the handoff but reached the old shard after it
+            if conn and self.location.get(name) != idx:
+                self._route_input(name, message[2])
+        elif kind == 'handoff':
+            self.location.pop(name, None)
+            if conn is None:
+                return
+            self.pending.setdefault(name, [])
+            vnum = message[2]
+            self.handoffs += 1
+            self._send(self.shard_for_room(vnum), ('arrive', name, vnum, conn.address))
+        elif kind == 'close':
+            self.location.pop(name, None)
+            self.pending.pop(name, None)
+            if conn:
+                del self.sessions[name]
+                await conn.flush()
+                conn.close()
+
+    async def stop(self):
+        """Ask every shard to save and exit, then reap the processes."""
+        if self._stopped:
+            return
+        self._stopped = True
+        for idx in range(len(self.pipes)):
+            self._send(idx, ('stop', None))
+        loop = asyncio.get_running_loop()
+        for proc in self.processes:
+            await loop.run_in_executor(None, proc.join, 30)
+            if proc.is_alive():
+                logger.warning(f"{proc.name} did not exit; terminating")
+                proc.terminate()
+        for pipe in self.pipes:
+            try:
+                loop.remove_reader(pipe.fileno())
+            except (OSError, ValueError):
+                pass
+        if self._pump:
+            self._pump.cancel()
+
+
+# ----------------------------------------------------------------------
+# Worker side
+# ----------------------------------------------------------------------
+
+def run_shard_worker(shard_id: int, zones: List[int], pipe):
+    """Process entry point for one shard."""
+    # Ctrl-C goes to the whole process group; the front end coordinates shutdown
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    worker = ShardWorker(shard_id, zones, pipe)
+    asyncio.run(worker.run())
+
+
+def _shard_connection_class():
+    from server import Connection
+
+    class ShardConnection(Connection):
+        """Connection stand-in whose output is relayed to the front end."""
+
+        def __init__(self, worker: 'ShardWorker', address):
+            super().__init__(None, worker, tuple(address) if address else None)
+            self.state = self.STATE_PLAYING
+            self.closed = False
+
+        async def send(self, message: str, newline: bool = True, prompt: bool = False,
+                       low_priority: bool = False):
+            if message is None or self.closed:
+                return
+            player = self.player
+            if player is not None and player.room is not None and player.room.zone is not None \
+                    and player.room.zone.remote:
+                return  # Mid-handoff; the next shard shows the new room
+            self.server.post(('out', player.name.lower() if player else '', message, newline, prompt,
+                              low_priority))
+
+        async def send_shared(self, message: str, rendered: dict, newline: bool = True,
+                              low_priority: bool = False):
+            await self.send(message, newline, low_priority=low_priority)
+
+        async def disconnect(self):
+            if self.closed:
+                return
+            await super().disconnect()
+            self.closed = True
+            self.server.session_closed(self)
+
+    return ShardConnection
+
+
+class ShardWorker:
+    """Runs the tick loop for one group of zones."""
+
+    def __init__(self, shard_id: int, zones: List[int], pipe):
+        self.shard_id = shard_id
+        self.zones = set(zones)
+        self.pipe = pipe
+        self.config = Config()
+        self.world = None
+        self.mud = None
+        self.router = None  # Connection code checks server.router
+        self.sessions: Dict[str, 'Connection'] = {}
+        # Never listens; queues the sessions' input for process_input, as
+        # the single-process loop does (fair turns, wait_state, flood limit)
+        self.server = None
+        self.running = False
+        self.logger = logging.getLogger(f'Misthollow.Shard{shard_id}')
+        self._conn_class = None
+
+    def post(self, message: tuple):
+        try:
+            self.pipe.send(message)
+        except (BrokenPipeError, EOFError, OSError):
+            self.running = False
+
+    def session_closed(self, conn):
+        self._untrack(conn)
+        if conn.player:
+            name = conn.player.name.lower()
+            if self.sessions.get(name) is conn:
+                del self.sessions[name]
+                self.post(('close', name, None))
+
+    def _track(self, name: str, conn):
+        self.sessions[name] = conn
+        self.server.connections[conn.conn_id] = conn
+
+    def _untrack(self, conn):
+        """Forget a session's input queue; returns the lines it had not run."""
+        if self.server.connections.get(conn.conn_id) is conn:
+            del self.server.connections[conn.conn_id]
+        lines = [line for line, _ in conn.input_buffer]
+        conn.input_buffer.clear()
+        return lines
+
+    async def start(self):
+        from world import World
+        from main import Misthollow
+        from server import MUDServer
+
+        self.world = World(self.config)
+        self.world.owned_zones = self.zones
+        await self.world.load()
+        self.server = MUDServer(self.world, self.config)
+        self._conn_class = _shard_connection_class()
+
+        # Reuse the single-process job table for this shard's world
+        self.mud = Misthollow()
+        self.mud.world = self.world
+        self.mud.schedule_jobs()
+        self.logger.info(f"Shard {self.shard_id} simulating {len(self.zones)} zones, "
+                         f"{len(self.world.npcs)} NPCs")
+
+    async def run(self):
+        await self.start()
+        self.running = True
+        loop = asyncio.get_running_loop()
+        tick_rate = 1.0 / self.config.TICKS_PER_SECOND
+        scheduler = self.world.scheduler
+        profiler = self.world.tick_profiler
+        try:
+            while self.running:
+                tick_start = loop.time()
+                profiler.begin_pulse()
+                await scheduler.tick()
+                with profiler.measure('process_input'):
+                    await self.process_inbox()
+                    await self.server.process_input()
+                # Before NPCs act on a player who just walked out of the shard
+                await self.process_handoffs()
+                with profiler.measure('process_npcs'):
+                    await self.world.process_npcs()
+                await self.process_handoffs()
+                self.world.load_shedder.observe(profiler.end_pulse())
+                elapsed = loop.time() - tick_start
+                if elapsed < tick_rate:
+                    await asyncio.sleep(tick_rate - elapsed)
+        finally:
+            await self.world.save_all()
+            self.logger.info(f"Shard {self.shard_id} stopped")
+
+    async def process_inbox(self):
+        """Handle every message the front end sent since the last pulse.
+
+        Input lines are only queued here; process_input runs them.
+        """
+        try:
+            while self.running and self.pipe.poll():
+                message = self.pipe.recv()
+                try:
+                    await self._handle(message)
+                except Exception as e:
+                    self.logger.error(f"Shard message {message[0]!r} failed: {e}", exc_info=True)
+                # A login can land in a zone another shard owns
+                await self.process_handoffs()
+        except (EOFError, OSError):
+            self.running = False
+
+    async def _handle(self, message: tuple):
+        from player import Player
+
+        kind, name = message[0], message[1]
+        if kind == 'input':
+            conn = self.sessions.get(name)
+            if conn:
+                self.server.receive_line(conn, message[2])
+            else:
+                self.post(('bounce', name, message[2]))
+        elif kind == 'login':
+            player = Player.load(name, self.world)
+            if player is None:
+                self.post(('close', name, None))
+                return
+            conn = self._conn_class(self, message[2])
+            conn.player = player
+            self._track(name, conn)
+            await conn.enter_game()
+            self.post(('ready', name))
+        elif kind == 'arrive':
+            await self._arrive(name, message[2], message[3])
+        elif kind == 'logout':
+            conn = self.sessions.get(name)
+            if conn:
+                await conn.disconnect()
+        elif kind == 'stop':
+            self.running = False
+
+    async def _arrive(self, name: str, vnum: int, address):
+        """Take over a player handed off by another shard."""
+        from player import Player
+
+        player = Player.load(name, self.world)
+        room = self.world.get_room(vnum)
+        if player is None or room is None:
+            self.post(('close', name, None))
+            return
+        conn = self._conn_class(self, address)
+        conn.player = player
+        player.connection = conn
+        player.room = room
+        self._track(name, conn)
+        await self.world.add_player(player)
+        room.characters.append(player)
+        await room.send_to_room(f"{player.name} has arrived.", exclude=[player])
+        await player.do_look([])
+        await conn.send_prompt()
+        self.post(('ready', name))
+
+    async def process_handoffs(self):
+        """Pass players who walked into a remote zone on to its shard."""
+        world = self.world
+        while world.pending_handoffs:
+            player = world.pending_handoffs.pop(0)
+            name = player.name.lower()
+            room = player.room
+            if world.players.get(name) is not player or room is None or not room.zone.remote:
+                continue  # Logged out or stepped straight back
+            conn = self.sessions.pop(name, None)
+            opponent = player.fighting
+            if opponent is not None and getattr(opponent, 'fighting', None) is player:
+                opponent.fighting = None
+                if opponent.position == 'fighting':
+                    opponent.position = 'standing'
+            player.fighting = None
+            if player.position == 'fighting':
+                player.position = 'standing'
+            await player.save()
+            await world.remove_player(player)
+            player.connection = None
+            unrun = []
+            if conn:
+                conn.closed = True
+                unrun = self._untrack(conn)
+            self.post(('handoff', name, room.vnum))
+            # Lines queued here after the move follow the player to the new shard
+            for line in unrun:
+                self.post(('bounce', name, line))
@@ -0,0 +1,222 @@
+"""
+Misthollow Simulation
+====================
+Headless accelerated-time run of the world loop (``main.py --simulate``).
+
+Loads the World, logs in N scripted bot players through socketless
+connections on a MUDServer that never listens, and drives the normal
+scheduler job table, input queue (process_input), NPC AI and output
+flush pulse after pulse without sleeping to the tick rate. Prints
+progress while it runs, then pulses per second, the speed-up over real
+time and the per-subsystem tick profile, so changes can be benchmarked
+and hours of game time soak-tested in minutes.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import List
+
+from config import Config
+from server import Connection, MUDServer
+from player import Player
+
+logger = logging.getLogger('Misthollow.Simulate')
+
+# Weighted idle actions for a bot that is not fighting
+BOT_ACTIONS = [
+    ('move', 55),
+    ('kill', 15),
+    ('look', 10),
+    ('score', 5),
+    ('inventory', 5),
+    ('rest', 10),
+]
+
+
+class BotPlayer(Player):
+    """Scripted player that is never written to disk."""
+
+    async def save(self):
+        pass
+
+
+class SimConnection(Connection):
+    """Socketless connection: output is rendered and flushed as usual, then
+    counted and dropped (see Connection._enqueue)."""
+
+    def __init__(self, server: 'MUDServer', address):
+        super().__init__(None, server, address)
+        self.state = self.STATE_PLAYING
+
+    async def disconnect(self):
+        if self.player:
+            await self.world.remove_player(self.player)
+            self.player.connection = None
+
+
+class Bot:
+    """Drives one BotPlayer with a simple wander/fight/rest script."""
+
+    def __init__(self, conn: SimConnection, rng: random.Random):
+        self.conn = conn
+        self.player = conn.player
+        self.rng = rng
+        self.next_pulse = 0
+        self.commands = 0
+
+    def choose(self) -> str:
+        player = self.player
+        room = player.room
+        if room is None:
+            return 'look'
+        if player.is_fighting:
+            return 'flee' if player.hp < player.max_hp * 0.2 else ''
+        if player.position in ('resting', 'sleeping'):
+            if player.hp >= player.max_hp * 0.9 and player.move >= player.max_move * 0.5:
+                return 'stand'
+            return ''
+        if player.hp < player.max_hp * 0.4 or player.move < 20:
+            return 'rest'
+
+        action = self.rng.choices([a for a, _ in BOT_ACTIONS], [w for _, w in BOT_ACTIONS])[0]
+        if action == 'move':
+            exits = list(room.get_visible_exits(player))
+            return self.rng.choice(exits) if exits else 'look'
+        if action == 'kill':
+            targets = [ch for ch in room.characters
+                       if getattr(ch, 'keywords', None) and not hasattr(ch, 'connection')
+                       and getattr(ch, 'level', 1) <= player.level + 2]
+            if not targets:
+                return 'look'
+            return f"kill {self.rng.choice(targets).keywords[0]}"
+        return action
+
+    def step(self, pulse: int):
+        if pulse < self.next_pulse:
+            return
+        # A human-ish pace: a command every 0.5-3 seconds
+        self.next_pulse = pulse + self.rng.randint(5, 30)
+        line = self.choose()
+        if line:
+            self.commands += 1
+            # Queued like socket input; process_input runs it on the pulse
+            self.conn.server.receive_line(self.conn, line)
+
+
+class Simulator:
+    """Runs the full tick pipeline as fast as the CPU allows."""
+
+    def __init__(self, bots: int = 20, duration: float = 3600.0, seed: int = None):
+        self.config = Config()
+        self.bot_count = bots
+        self.duration = duration
+        self.rng = random.Random(seed)
+        self.world = None
+        self.server = None  # A MUDServer that never listens; bots are its connections
+        self.bots: List[Bot] = []
+
+    async def setup(self):
+        from world import World
+        from main import Misthollow
+
+        self.world = World(self.config)
+        await self.world.load()
+        self.server = MUDServer(self.world, self.config)
+
+        scheduler = self.world.scheduler
+        tps = self.config.TICKS_PER_SECOND
+        epoch = time.time()
+        # Zone timers follow simulated time rather than the wall clock
+        self.world.clock = lambda: epoch + scheduler.pulse / tps
+
+        # Same job table as a live server
+        mud = Misthollow()
+        mud.world = self.world
+        mud.schedule_jobs()
+
+        races = list(self.config.RACES)
+        classes = list(self.config.CLASSES)
+        for n in range(self.bot_count):
+            race = self.rng.choice(races)
+            stats = {stat: self.rng.randint(10, 16) for stat in ('str', 'int', 'wis', 'dex', 'con', 'cha')}
+            player = BotPlayer.create_new(name=f"Simbot{n + 1}", password='simulated',
+                                          race=race, char_class=self.rng.choice(classes),
+                                          stats=stats, world=self.world)
+            conn = SimConnection(self.server, ('sim', n + 1))
+            self.server.connections[conn.conn_id] = conn
+            conn.player = player
+            await conn.enter_game()
+            bot = Bot(conn, self.rng)
+            bot.next_pulse = self.rng.randint(1, 30)
+            self.bots.append(bot)
+
+    async def run(self) -> dict:
+        await self.setup()
+        world = self.world
+        server = self.server
+        scheduler = world.scheduler
+        profiler = world.tick_profiler
+        profiler.reset()
+        world.command_stats.reset()
+        pulses = scheduler.seconds(self.duration)
+        report_every = max(1, pulses // 10)
+
+        started = time.perf_counter()
+        for done in range(1, pulses + 1):
+            profiler.begin_pulse()
+            await scheduler.tick()
+            for bot in self.bots:
+                bot.step(scheduler.pulse)
+            with profiler.measure('process_input'):
+                await server.process_input()
+            with profiler.measure('process_npcs'):
+                await world.process_npcs()
+            with profiler.measure('flush_output'):
+                await server.flush_output()
+            world.load_shedder.observe(profiler.end_pulse())
+            # Let tasks spawned by commands run
+            await asyncio.sleep(0)
+            if done % report_every == 0:
+                elapsed = time.perf_counter() - started
+                print(f"  {done:,}/{pulses:,} pulses, {done / elapsed:,.0f} pulses/s", flush=True)
+        wall = time.perf_counter() - started
+
+        for bot in self.bots:
+            await server.finish_connection(bot.conn)
+
+        return {
+            'pulses': pulses,
+            'game_seconds': pulses / self.config.TICKS_PER_SECOND,
+            'wall_seconds': wall,
+            'pulses_per_second': pulses / wall if wall else 0.0,
+            'speedup': (pulses / self.config.TICKS_PER_SECOND) / wall if wall else 0.0,
+            'bots': len(self.bots),
+            'bot_commands': sum(b.commands for b in self.bots),
+            'output_messages': sum(b.conn.stats.messages_out for b in self.bots),
+            'output_bytes': sum(b.conn.stats.bytes_out for b in self.bots),
+            'npcs': len(world.npcs),
+        }
+
+
+async def run_simulation(bots: int = 20, duration: float = 3600.0, seed: int = None):
+    """Entry point for ``main.py --simulate``."""
+    # Per-login/zone chatter would swamp the report
+    logging.getLogger().setLevel(logging.WARNING)
+
+    sim = Simulator(bots=bots, duration=duration, seed=seed)
+    stats = await sim.run()
+
+    print(f"Simulated {stats['game_seconds']:,.0f}s of game time "
+          f"({stats['pulses']:,} pulses) in {stats['wall_seconds']:.1f}s wall time")
+    print(f"  {stats['pulses_per_second']:,.0f} pulses/s, {stats['speedup']:.1f}x real time")
+    print(f"  {stats['bots']} bots issued {stats['bot_commands']:,} commands, "
+          f"{stats['output_messages']:,} messages ({stats['output_bytes']:,} bytes) out")
+    print(f"  {stats['npcs']} NPCs loaded")
+    plain = {key: '' for key in Config.COLORS}
+    for line in sim.world.tick_profiler.format_report(plain):
+        print(line)
+    for line in sim.world.command_stats.format_report(plain, limit=10):
+        print(line)
+    return stats
@@ -8,6 +8,8 @@ import time
 import logging
 from typing import List, Dict, Optional, TYPE_CHECKING
 
+from server import fan_out
+
 if TYPE_CHECKING:
     from player import Player
 
@@ -100,10 +102,17 @@ def is_channel_on(player: 'Player', channel_key: str) -> bool:
     return channel_key not in disabled
 
 
+def _ignored_names(player: 'Player') -> set:
+    """Lowercased ignore list, cached on the player until (un)ignore changes it."""
+    names = getattr(player, '_ignored_names', None)
+    if names is None:
+        names = player._ignored_names = {n.lower() for n in getattr(player, 'ignore_list', ())}
+    return names
+
+
 def is_ignored(player: 'Player', sender_name: str) -> bool:
     """Check if player is ignoring sender."""
-    ignored = getattr(player, 'ignore_list', [])
-    return sender_name.lower() in [n.lower() for n in ignored]
+    return sender_name.lower() in _ignored_names(player)
 
 
 async def send_channel_message(player: 'Player', channel_key: str, message: str):
@@ -132,17 +141,15 @@ async def send_channel_message(player: 'Player', channel_key: str, message: str)
     # Send to self
     await player.send(f"{color}{ch['prefix']} You: {message}{c['reset']}")
 
-    # Send to all other online players
-    for p in player.world.players.values():
-        if p == player:
-            continue
-        if not can_access_channel(p, channel_key):
-            continue
-        if not is_channel_on(p, channel_key):
-            continue
-        if is_ignored(p, player.name):
-            continue
-        await p.send(f"\r\n{color}{ch['prefix']} {player.name}: {message}{c['reset']}")
+    # Send to all other online players: the text is rendered once and shared
+    sender = player.name
+    recipients = [p for p in player.world.players.values()
+                  if p is not player
+                  and is_channel_on(p, channel_key)
+                  and not is_ignored(p, sender)
+                  and can_access_channel(p, channel_key)]
+    await fan_out(recipients, f"\r\n{color}{ch['prefix']} {player.name}: {message}{c['reset']}",
+                  low_priority=True)
 
 
 # ==================== FRIENDS ====================
@@ -235,6 +242,7 @@ async def ignore_player(player: 'Player', target_name: str):
         return
 
     player.ignore_list.append(target_name.capitalize())
+    player._ignored_names = None
     await player.send(f"{c['yellow']}You are now ignoring {target_name.capitalize()}.{c['reset']}")
 
 
@@ -248,6 +256,7 @@ async def unignore_player(player: 'Player', target_name: str):
     for i, n in enumerate(player.ignore_list):
         if n.lower() == target_lower:
             player.ignore_list.pop(i)
+            player._ignored_names = None
             await player.send(f"{c['green']}You are no longer ignoring {n}.{c['reset']}")
             return
 
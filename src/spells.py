@@ -1867,20 +1867,20 @@ class SpellHandler:
     config = Config()
 
     @classmethod
-    async def cast_spell(cls, caster: 'Player', spell_name: str, target_name: Optional[str] = None):
-        """Cast a spell."""
+    async def cast_spell(cls, caster: 'Player', spell_name: str, target_name: Optional[str] = None) -> bool:
+        """Cast a spell; True if it went off (mana spent), False if it was refused or fizzled."""
         c = cls.config.COLORS
         
         # Get spell data
         spell = SPELLS.get(spell_name)
         if not spell:
             await caster.send(f"Unknown spell: {spell_name}")
-            return
+            return False
         
         # Check if channeling dark ritual (necromancer)
         if getattr(caster, 'channeling_ritual', False):
             await caster.send(f"{c['red']}You cannot cast spells while channeling the dark ritual!{c['reset']}")
-            return
+            return False
             
         # Check mana - apply soul fragment discount
         mana_cost = spell.get('mana_cost', 10)
@@ -1922,20 +1922,20 @@ class SpellHandler:
         
         if caster.mana < mana_cost:
             await caster.send(f"{c['red']}You don't have enough mana to cast that spell.{c['reset']}")
-            return
+            return False
             
         # Check proficiency for failure
         proficiency = caster.spells.get(spell_name, 50)
         if random.randint(1, 100) > proficiency:
             caster.mana -= mana_cost // 2
             await caster.send(f"{c['yellow']}You lose your concentration and the spell fizzles.{c['reset']}")
-            return
+            return False
             
         # Get target
         target = await cls.get_target(caster, spell, target_name)
         if target is None and spell['target'] not in ('self', 'special', 'object', 'door', 'group', 'room'):
             await caster.send("Cast the spell on whom?")
-            return
+            return False
             
         # Deduct mana
         caster.mana -= mana_cost
@@ -1965,6 +1965,7 @@ class SpellHandler:
         # Attempt to improve spell proficiency through successful casting
         if hasattr(caster, 'improve_spell'):
             await caster.improve_spell(spell_name)
+        return True
         
     @classmethod
     async def get_target(cls, caster: 'Player', spell: dict, target_name: Optional[str]) -> Optional['Character']:
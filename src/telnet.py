@@ -0,0 +1,148 @@
+"""
+Misthollow Telnet
+================
+Telnet protocol constants and an incremental option-negotiation parser.
+
+Raw bytes from a client are fed through ``TelnetParser.feed``. Application
+data comes back with every IAC command and subnegotiation removed, and
+the negotiation events are queued for the connection to act on (NAWS
+window size and so on).
+"""
+
+from typing import List, Tuple
+
+# Commands
+IAC = 255
+DONT = 254
+DO = 253
+WONT = 252
+WILL = 251
+SB = 250
+GA = 249
+NOP = 241
+SE = 240
+
+# Options
+OPT_ECHO = 1
+OPT_SGA = 3
+OPT_TTYPE = 24
+OPT_NAWS = 31
+OPT_COMPRESS2 = 86  # MCCP2
+OPT_GMCP = 201
+
+# TTYPE subnegotiation codes
+TTYPE_IS = 0
+TTYPE_SEND_CODE = 1
+
+_VERBS = {WILL: 'will', WONT: 'wont', DO: 'do', DONT: 'dont'}
+
+# Parser states
+_DATA, _IAC, _VERB, _SB_OPT, _SB, _SB_IAC = range(6)
+
+# Longest subnegotiation payload we buffer before discarding it
+MAX_SUBNEG = 8192
+
+
+def iac(*codes: int) -> bytes:
+    """Build a command sequence, e.g. ``iac(DO, OPT_NAWS)``."""
+    return bytes((IAC,) + codes)
+
+
+def subneg(option: int, payload: bytes) -> bytes:
+    """Build ``IAC SB <option> <payload> IAC SE`` with IACs in the payload doubled."""
+    return bytes((IAC, SB, option)) + payload.replace(b'\xff', b'\xff\xff') + bytes((IAC, SE))
+
+
+class TelnetParser:
+    """Strips telnet commands from a byte stream, remembering negotiation events.
+
+    Events are tuples: ``('will'|'wont'|'do'|'dont', option)`` or
+    ``('sb', option, payload)``. Sequences split across reads are handled.
+    """
+
+    __slots__ = ('_state', '_verb', '_sb_option', '_sb', 'events')
+
+    def __init__(self):
+        self._state = _DATA
+        self._verb = 0
+        self._sb_option = 0
+        self._sb = bytearray()
+        self.events: List[Tuple] = []
+
+    def feed(self, data: bytes) -> bytes:
+        """Return the application bytes in ``data``."""
+        if self._state == _DATA and IAC not in data:
+            return data
+        out = bytearray()
+        for byte in data:
+            state = self._state
+            if state == _DATA:
+                if byte == IAC:
+                    self._state = _IAC
+                else:
+                    out.append(byte)
+            elif state == _IAC:
+                if byte == IAC:
+                    out.append(IAC)  # Escaped 0xFF data byte
+                    self._state = _DATA
+                elif byte in _VERBS:
+                    self._verb = byte
+                    self._state = _VERB
+                elif byte == SB:
+                    self._state = _SB_OPT
+                else:
+                    self._state = _DATA  # NOP, GA, AYT, ... carry no option
+            elif state == _VERB:
+                self.events.append((_VERBS[self._verb], byte))
+                self._state = _DATA
+            elif state == _SB_OPT:
+                self._sb_option = byte
+                self._sb.clear()
+                self._state = _SB
+            elif state == _SB:
+                if byte == IAC:
+                    self._state = _SB_IAC
+                elif len(self._sb) < MAX_SUBNEG:
+                    self._sb.append(byte)
+            else:  # _SB_IAC
+                if byte == SE:
+                    self.events.append(('sb', self._sb_option, bytes(self._sb)))
+                    self._sb.clear()
+                    self._state = _DATA
+                elif byte == IAC:
+                    if len(self._sb) < MAX_SUBNEG:
+                        self._sb.append(IAC)
+                    self._state = _SB
+                else:
+                    # Malformed; drop the subnegotiation
+                    self._sb.clear()
+                    self._state = _DATA
+        return bytes(out)
+
+    def take_events(self) -> List[Tuple]:
+        events = self.events
+        self.events = []
+        return events
+
+    @property
+    def in_command(self) -> bool:
+        """True while in the middle of a command or subnegotiation."""
+        return self._state != _DATA
+
+
+def parse_naws(payload: bytes) -> Tuple[int, int]:
+    """Decode a NAWS payload into (width, height); (0, 0) if malformed."""
+    if len(payload) < 4:
+        return 0, 0
+    return (payload[0] << 8) | payload[1], (payload[2] << 8) | payload[3]
+
+
+def parse_ttype(payload: bytes) -> str:
+    """Decode ``IS <name>`` from a TTYPE reply; '' if it isn't one."""
+    if not payload or payload[0] != TTYPE_IS:
+        return ''
+    return payload[1:].decode('ascii', errors='replace').strip()
+
+
+# Ask the client for its terminal type
+TTYPE_SEND = subneg(OPT_TTYPE, bytes((TTYPE_SEND_CODE,)))
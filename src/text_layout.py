@@ -0,0 +1,179 @@
+"""
+Misthollow Text Layout
+=====================
+ANSI-aware word wrapping for outgoing text.
+
+Each line is tokenized once into escape sequences, runs of spaces and
+words, and filled greedily to the client's width. Escape sequences take
+no columns. Room and help text arrives already hard-wrapped, so for a
+client narrower than that, the source line breaks are undone first:
+lines that the source wrapped are joined back into one paragraph and
+refilled, rather than each being wrapped on its own into a long line
+and a short one. The SGR colour state in effect at a wrap point is re-emitted
+at the start of the continuation line, so colours survive the wrap even
+on clients that reset attributes at a newline. Long lines are cached
+because room descriptions, help pages and the like are sent over and
+over with the same text and width.
+"""
+
+import re
+from functools import lru_cache
+
+DEFAULT_WIDTH = 80
+MIN_WIDTH = 20
+MAX_WIDTH = 250
+
+# Lines starting with these are tables/frames and are never re-flowed
+BOX_CHARS = frozenset('║╔╗╚╝═╠╣╬╦╩─│┌┐└┘├┤┬┴┼')
+
+# Escape sequence (CSI or OSC), a run of spaces, or a word
+_TOKEN_RE = re.compile(r'(\x1b\[[0-9;?]*[A-Za-z]|\x1b\][^\x07]*\x07?)|( +)|([^ \x1b]+|\x1b)')
+_ESCAPE_RE = re.compile(r'\x1b\[[0-9;?]*[A-Za-z]|\x1b\][^\x07]*\x07?')
+_SENTENCE_ENDS = ('.', '!', '?', ':')  # A break after these is kept
+
+
+class _SGRState:
+    """Net effect of the SGR codes seen so far, re-emitted after a wrap."""
+
+    __slots__ = ('attrs', 'fg', 'bg')
+
+    def __init__(self):
+        self.attrs = []   # bold, underline, ... in the order set
+        self.fg = None
+        self.bg = None
+
+    def apply(self, params: str):
+        codes = params.split(';') if params else ['0']
+        i = 0
+        while i < len(codes):
+            code = codes[i]
+            n = int(code) if code.isdigit() else 0
+            if n == 0:
+                self.attrs = []
+                self.fg = self.bg = None
+            elif n in (38, 48):
+                # Extended colour: 38;5;n or 38;2;r;g;b
+                span = 3 if i + 1 < len(codes) and codes[i + 1] == '5' else 5
+                value = ';'.join(codes[i:i + span])
+                if n == 38:
+                    self.fg = value
+                else:
+                    self.bg = value
+                i += span
+                continue
+            elif 30 <= n <= 37 or 90 <= n <= 97:
+                self.fg = code
+            elif n == 39:
+                self.fg = None
+            elif 40 <= n <= 47 or 100 <= n <= 107:
+                self.bg = code
+            elif n == 49:
+                self.bg = None
+            elif 1 <= n <= 9:
+                if code not in self.attrs:
+                    self.attrs.append(code)
+            elif 21 <= n <= 29:
+                # 22 clears bold/dim, 23 italic, 24 underline, ...
+                cleared = ('1', '2') if n == 22 else (str(n - 20),)
+                self.attrs = [a for a in self.attrs if a not in cleared]
+            i += 1
+
+    def code(self) -> str:
+        params = self.attrs + [p for p in (self.fg, self.bg) if p]
+        return f"\x1b[{';'.join(params)}m" if params else ''
+
+
+def clamp_width(width: int) -> int:
+    """Sanitize a client-reported width (0 means unknown)."""
+    if not width:
+        return DEFAULT_WIDTH
+    return max(MIN_WIDTH, min(MAX_WIDTH, width))
+
+
+def wrap_text(text: str, width: int = DEFAULT_WIDTH) -> str:
+    """Wrap multi-line text to ``width`` columns.
+
+    Blank lines, indented lines, tables and short lines keep their breaks.
+    A break is only undone where the source wrapped, i.e. where the next
+    line's first word would not have fitted on the line at the width of
+    the widest line in ``text``, and the line does not end a sentence.
+    """
+    if '\n' not in text:
+        return text if len(text) <= width else _wrap_line(text, width)
+    lines = text.split('\n')
+    if all(len(line) <= width for line in lines):
+        return text
+    return '\n'.join(_wrap_line(line, width) if len(line) > width else line
+                     for line in _reflow(lines))
+
+
+def _visible(line: str) -> str:
+    return _ESCAPE_RE.sub('', line) if '\x1b' in line else line
+
+
+def _reflow(lines: list) -> list:
+    """Join the lines that the source wrapped back into paragraphs."""
+    shown = [_visible(line).rstrip('\r') for line in lines]
+    source_width = max(len(text) for text in shown)
+    out = [lines[0]]
+    for prev, line, text in zip(shown, lines[1:], shown[1:]):
+        # The source broke here only if the next word would not have fitted
+        if (_prose(prev) and _prose(text) and not prev.endswith(_SENTENCE_ENDS)
+                and len(prev) + 1 + len(text.split(' ', 1)[0]) > source_width):
+            out[-1] = out[-1].rstrip('\r') + ' ' + line
+        else:
+            out.append(line)
+    return out
+
+
+def _prose(text: str) -> bool:
+    """A line that may be part of a wrapped paragraph (not blank, indented or a table)."""
+    return bool(text) and not text[0].isspace() and text[0] not in BOX_CHARS
+
+
+@lru_cache(maxsize=4096)
+def _wrap_line(line: str, width: int) -> str:
+    """Wrap one line whose raw length exceeds ``width``."""
+    if '\t' in line:
+        line = line.expandtabs()
+    out = []
+    sgr = _SGRState()
+    col = 0
+    spaces = ''        # spaces seen since the last word
+    wrapped = False
+    seen_word = False
+    for esc, gap, word in _TOKEN_RE.findall(line):
+        if esc:
+            out.append(esc)
+            if esc[1] == '[' and esc[-1] == 'm':
+                sgr.apply(esc[2:-1])
+        elif gap:
+            spaces += gap
+        else:
+            if not seen_word:
+                seen_word = True
+                if word[0] in BOX_CHARS:
+                    return line
+            length = len(word)
+            if col and col + len(spaces) + length > width:
+                out.append('\n')
+                out.append(sgr.code())
+                col = 0
+                wrapped = True
+            elif spaces:
+                out.append(spaces)
+                col += len(spaces)
+            spaces = ''
+            # Break words longer than a whole line
+            while col + length > width:
+                room = width - col
+                out.append(word[:room])
+                out.append('\n')
+                out.append(sgr.code())
+                word = word[room:]
+                length -= room
+                col = 0
+                wrapped = True
+            out.append(word)
+            col += length
+    return ''.join(out) if wrapped else line
@@ -0,0 +1,156 @@
+"""
+Misthollow Tick Profiler
+=======================
+Per-subsystem timing for the main game loop.
+
+Every scheduled job, plus input processing and NPC AI, records its wall
+time for each pulse into a rolling window. The profiler reports
+p50/p95/p99/max per subsystem and counts pulses whose total work
+exceeded the pulse budget (1 / TICKS_PER_SECOND).
+"""
+
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+
+class RollingHistogram:
+    """Rolling window of timing samples in milliseconds."""
+
+    __slots__ = ('samples', 'count', 'total_ms', 'max_ms')
+
+    def __init__(self, window: int = 600):
+        self.samples = deque(maxlen=window)
+        self.count = 0          # lifetime samples
+        self.total_ms = 0.0     # lifetime total
+        self.max_ms = 0.0       # lifetime worst case
+
+    def record(self, ms: float):
+        self.samples.append(ms)
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentiles(self, points=(50, 95, 99)) -> Dict[int, float]:
+        if not self.samples:
+            return {p: 0.0 for p in points}
+        ordered = sorted(self.samples)
+        last = len(ordered) - 1
+        return {p: ordered[min(last, int(round(p / 100.0 * last)))] for p in points}
+
+    def summary(self) -> dict:
+        pct = self.percentiles()
+        window_max = max(self.samples) if self.samples else 0.0
+        return {
+            'count': self.count,
+            'avg_ms': round(self.total_ms / self.count, 3) if self.count else 0.0,
+            'p50_ms': round(pct[50], 3),
+            'p95_ms': round(pct[95], 3),
+            'p99_ms': round(pct[99], 3),
+            'max_ms': round(window_max, 3),
+            'max_ever_ms': round(self.max_ms, 3),
+        }
+
+
+class _Measure:
+    """Context manager that records elapsed time into the profiler."""
+
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler: 'TickProfiler', name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.record(self.name, (time.perf_counter() - self.start) * 1000.0)
+        return False
+
+
+class TickProfiler:
+    """Collects per-subsystem and per-pulse timings."""
+
+    def __init__(self, tick_seconds: float, window: int = 600):
+        self.budget_ms = tick_seconds * 1000.0
+        self.window = window
+        self.subsystems: Dict[str, RollingHistogram] = {}
+        self.pulse = RollingHistogram(window)
+        self.pulses = 0
+        self.overruns = 0
+        self.worst_overrun_ms = 0.0
+        self.last_overrun_at: Optional[float] = None
+        self.started_at = time.time()
+        self._pulse_start = 0.0
+
+    def measure(self, name: str) -> _Measure:
+        """Time a block: ``with profiler.measure('process_npcs'): ...``"""
+        return _Measure(self, name)
+
+    def record(self, name: str, ms: float):
+        hist = self.subsystems.get(name)
+        if hist is None:
+            hist = self.subsystems[name] = RollingHistogram(self.window)
+        hist.record(ms)
+
+    def begin_pulse(self):
+        self._pulse_start = time.perf_counter()
+
+    def end_pulse(self) -> float:
+        """Close the current pulse and return its elapsed milliseconds."""
+        ms = (time.perf_counter() - self._pulse_start) * 1000.0
+        self.pulse.record(ms)
+        self.pulses += 1
+        if ms > self.budget_ms:
+            self.overruns += 1
+            self.last_overrun_at = time.time()
+            if ms - self.budget_ms > self.worst_overrun_ms:
+                self.worst_overrun_ms = ms - self.budget_ms
+        return ms
+
+    def reset(self):
+        self.subsystems.clear()
+        self.pulse = RollingHistogram(self.window)
+        self.pulses = 0
+        self.overruns = 0
+        self.worst_overrun_ms = 0.0
+        self.last_overrun_at = None
+        self.started_at = time.time()
+
+    def snapshot(self) -> dict:
+        """JSON-friendly view of all timings."""
+        return {
+            'budget_ms': round(self.budget_ms, 3),
+            'pulses': self.pulses,
+            'overruns': self.overruns,
+            'overrun_pct': round(100.0 * self.overruns / self.pulses, 2) if self.pulses else 0.0,
+            'worst_overrun_ms': round(self.worst_overrun_ms, 3),
+            'last_overrun_at': self.last_overrun_at,
+            'since': self.started_at,
+            'pulse': self.pulse.summary(),
+            'subsystems': {name: hist.summary() for name, hist in sorted(self.subsystems.items())},
+        }
+
+    def format_report(self, colors: dict) -> List[str]:
+        """Lines for the in-game immortal report."""
+        c = colors
+        snap = self.snapshot()
+        lines = [
+            f"{c['bright_cyan']}=== Tick Budget ({snap['budget_ms']:.0f}ms/pulse) ==={c['reset']}",
+            f"  {c['white']}Pulses:{c['reset']} {snap['pulses']}  "
+            f"{c['white']}Overruns:{c['reset']} {snap['overruns']} ({snap['overrun_pct']}%)  "
+            f"{c['white']}Worst:{c['reset']} +{snap['worst_overrun_ms']:.1f}ms",
+            f"  {c['yellow']}{'Subsystem':<18}{'calls':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}{c['reset']}",
+        ]
+        rows = [('PULSE', snap['pulse'])] + sorted(
+            snap['subsystems'].items(), key=lambda kv: kv[1]['p99_ms'], reverse=True)
+        for name, s in rows:
+            color = c['red'] if s['p99_ms'] > self.budget_ms / 2 else c['white']
+            lines.append(
+                f"  {color}{name:<18}{s['count']:>8}{s['p50_ms']:>9.2f}{s['p95_ms']:>9.2f}"
+                f"{s['p99_ms']:>9.2f}{s['max_ms']:>9.2f}{c['reset']}")
+        return lines
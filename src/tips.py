@@ -7,6 +7,8 @@ Provides helpful tips to players at appropriate moments.
 import random
 from typing import TYPE_CHECKING, List, Optional
 
+from load_shedder import shedding
+
 if TYPE_CHECKING:
     from player import Player
 
@@ -230,6 +232,8 @@ class TipManager:
         """Maybe show a tip to the player (default 10% chance)."""
         if random.random() > chance:
             return False
+        if shedding(getattr(player, 'world', None), 'tips'):
+            return False
         
         tip = cls.get_tip(player)
         if tip:
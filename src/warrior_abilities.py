@@ -475,6 +475,7 @@ async def do_bash(player, args: list):
         remaining = getattr(player, cd_key, 0) - now
         await player.send(f"{c['yellow']}Bash is on cooldown ({remaining:.1f}s).{c['reset']}")
         return
+    player.add_wait_state('bash')
     
     evo = getattr(player, 'ability_evolutions', {}).get('bash')
     ability_display = evo or 'bash'
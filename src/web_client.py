@@ -11,6 +11,9 @@ from aiohttp import web, WSMsgType
 from typing import Optional
 import logging
 
+from telnet import TelnetParser, iac, DO, OPT_GMCP
+from gmcp import gmcp_message, parse_gmcp
+
 logger = logging.getLogger(__name__)
 
 
@@ -89,6 +92,8 @@ class TelnetBridge:
         self.mud_port = mud_port
         self.reader: Optional[asyncio.StreamReader] = None
         self.writer: Optional[asyncio.StreamWriter] = None
+        # Negotiation is stripped from the text; GMCP is relayed as JSON
+        self.telnet = TelnetParser()
     
     async def connect(self) -> bool:
         """Connect to the MUD server."""
@@ -106,6 +111,9 @@ class TelnetBridge:
                 data = await self.reader.read(4096)
                 if not data:
                     break
+                data = self.telnet.feed(data)
+                for event in self.telnet.take_events():
+                    await self.handle_telnet(event)
                 
                 text = data.decode('utf-8', errors='replace')
                 
@@ -135,6 +143,17 @@ class TelnetBridge:
         except Exception as e:
             logger.error(f"Read loop error: {e}")
     
+    async def handle_telnet(self, event: tuple):
+        """Accept GMCP and pass its messages to the browser."""
+        if event == ('will', OPT_GMCP):
+            self.writer.write(iac(DO, OPT_GMCP)
+                              + gmcp_message('Core.Hello', {'client': 'Misthollow Web', 'version': '1'})
+                              + gmcp_message('Core.Supports.Set', ['Char 1', 'Room 1', 'Combat 1']))
+            await self.writer.drain()
+        elif event[0] == 'sb' and event[1] == OPT_GMCP:
+            package, data = parse_gmcp(event[2])
+            await self.ws.send_json({'type': 'gmcp', 'package': package, 'data': data})
+
     async def write(self, data: str):
         """Write to MUD server."""
         if self.writer:
@@ -1068,6 +1087,7 @@ CLIENT_HTML = '''<!DOCTYPE html>
         let historyIndex = -1;
         let playerName = null;
         let inCombat = false;
+        const vitals = {};
         
         // Set map URL
         const mapUrl = `${location.protocol}//${location.hostname}:4001`;
@@ -1109,6 +1129,24 @@ CLIENT_HTML = '''<!DOCTYPE html>
             }
         }
         
+        function handleGmcp(pkg, data) {
+            if (pkg === 'Char.Vitals') {
+                // Deltas: merge into what we already know
+                Object.assign(vitals, data);
+                if (vitals.maxhp !== undefined) {
+                    updateVitals(vitals.hp, vitals.maxhp, vitals.mana, vitals.maxmana, vitals.move, vitals.maxmove);
+                }
+            } else if (pkg === 'Room.Info') {
+                updateRoomInfo(data.name, Object.keys(data.exits || {}));
+            } else if (pkg === 'Combat.Target') {
+                const fighting = data.name !== undefined || (inCombat && Object.keys(data).length > 0);
+                if (fighting && !inCombat) {
+                    triggerCombatFlash();
+                }
+                inCombat = fighting;
+            }
+        }
+        
         function triggerCombatFlash() {
             terminal.classList.add('combat-flash');
             setTimeout(() => terminal.classList.remove('combat-flash'), 1000);
@@ -1213,6 +1251,8 @@ CLIENT_HTML = '''<!DOCTYPE html>
                 const msg = JSON.parse(event.data);
                 if (msg.type === 'output') {
                     appendOutput(msg.data);
+                } else if (msg.type === 'gmcp') {
+                    handleGmcp(msg.package, msg.data || {});
                 } else if (msg.type === 'mapsync') {
                     playerName = msg.player;
                     const newMapUrl = `${mapUrl}/?player=${encodeURIComponent(playerName)}`;
@@ -12,6 +12,7 @@ import os
 from typing import Optional
 from urllib.parse import parse_qs, urlparse
 
+from load_shedder import shedding
 from map_system import build_map_payload
 
 logger = logging.getLogger('Misthollow.WebMap')
@@ -95,6 +96,8 @@ class WebMapServer:
                 continue
             if client.player_name.lower() != player.name.lower():
                 continue
+            if shedding(self.world, 'web_map'):
+                return  # Map catches up on the player's next move
             matching_clients += 1
             try:
                 payload = build_map_payload(player, mode=client.mode)
@@ -9,8 +9,12 @@ import random
 import os
 import json
 import time
+import heapq
+import functools
+import itertools
 import logging
 import asyncio
+from collections import Counter
 from typing import Dict, List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -19,6 +23,12 @@ if TYPE_CHECKING:
 from config import Config
 from time_system import GameTime
 from weather import Weather
+from scheduler import Scheduler
+from tick_profiler import TickProfiler
+from command_stats import CommandStats
+from load_shedder import LoadShedder
+from mccp import CompressionStats
+from server import fan_out
 
 logger = logging.getLogger('Misthollow.World')
 
@@ -389,13 +399,12 @@ class Room:
                     
     async def send_to_room(self, message: str, exclude: List = None, wake_sleepers: bool = False):
         """Send a message to everyone in the room (sleeping players don't see messages unless wake_sleepers=True)."""
-        exclude = exclude or []
-        for char in self.characters:
-            if char not in exclude and hasattr(char, 'send'):
-                # Skip sleeping players unless it's important enough to wake them
-                if not wake_sleepers and getattr(char, 'position', 'standing') == 'sleeping':
-                    continue
-                await char.send(message)
+        exclude = exclude or ()
+        # Skip sleeping players unless it's important enough to wake them
+        recipients = [char for char in self.characters
+                      if char not in exclude
+                      and (wake_sleepers or getattr(char, 'position', 'standing') != 'sleeping')]
+        await fan_out(recipients, message)
                 
     def get_exit(self, direction: str) -> Optional['Room']:
         """Get the room in a given direction."""
@@ -502,6 +511,13 @@ class Zone:
         self.last_reset_at = None
         self.next_reset_at = None
 
+        # Hibernation (see World.hibernation_tick)
+        self.hibernating = False
+        self.empty_since = None  # world.clock() time the zone was last seen empty
+        self.hibernated_at = None
+        # Owned by another shard process (see sharding.py); never simulated here
+        self.remote = False
+
         self.rooms: Dict[int, Room] = {}
         self.mobs: Dict[int, dict] = {}  # mob prototypes
         self.objects: Dict[int, dict] = {}  # object prototypes
@@ -559,6 +575,62 @@ class Zone:
         return zone
 
 
+def _dormant(char) -> bool:
+    """True if a character stands in a hibernating zone."""
+    room = getattr(char, 'room', None)
+    zone = room.zone if room is not None else None
+    return zone is not None and zone.hibernating
+
+
+# Shared empty result for the occupancy lookups
+_NOBODY = frozenset()
+
+
+def _discard(index: dict, key, member):
+    """Remove ``member`` from ``index[key]``, dropping the set once it empties."""
+    members = index.get(key)
+    if members is not None:
+        members.discard(member)
+        if not members:
+            del index[key]
+
+
+class NPCList(list):
+    """List of loaded NPCs that keeps the world's AI wake queue in sync.
+
+    Behaves exactly like a list for the many call sites that append/remove
+    NPCs directly; additions are woken for AI on the next pulse and removals
+    drop out of the queue. The world's zone -> NPCs index follows the same
+    additions and removals.
+    """
+
+    def __init__(self, world: 'World'):
+        super().__init__()
+        self._world = world
+
+    def append(self, npc):
+        super().append(npc)
+        npc._ai_listed = True
+        self._world._index_npc(npc, getattr(npc, 'room', None))
+        self._world.wake_npc(npc)
+
+    def insert(self, index, npc):
+        super().insert(index, npc)
+        npc._ai_listed = True
+        self._world._index_npc(npc, getattr(npc, 'room', None))
+        self._world.wake_npc(npc)
+
+    def extend(self, npcs):
+        for npc in npcs:
+            self.append(npc)
+
+    def remove(self, npc):
+        super().remove(npc)
+        npc._ai_listed = False
+        npc._ai_due = None
+        self._world._unindex_npc(npc, getattr(npc, 'room', None))
+
+
 class World:
     """The game world."""
     
@@ -570,13 +642,51 @@ class World:
         self.obj_prototypes: Dict[int, dict] = {}
 
         self.players: Dict[str, 'Player'] = {}  # Online players
-        self.npcs: List = []  # All loaded NPCs
+
+        # Occupancy indexes, updated as characters move, log in/out, spawn
+        # and die, so zone-scoped work never scans the whole world. Only
+        # zones/rooms with someone in them have an entry.
+        self.zone_players: Dict[Zone, set] = {}  # Online players per zone
+        self.zone_npcs: Dict[Zone, set] = {}     # Loaded NPCs per zone
+        self.room_players: Dict[Room, set] = {}  # Online players per room
+
+        self.npcs: List = NPCList(self)  # All loaded NPCs
+
+        # Active-set NPC AI: heap of (due_pulse, seq, npc). Only NPCs whose
+        # AI has something to do are queued; the rest sleep until woken.
+        self._ai_queue: List[tuple] = []
+        self._ai_seq = itertools.count()
 
         # Initialize game time system
         self.game_time = GameTime()
 
         # World events manager (initialized after load)
         self.event_manager = None
+
+        # Sharded mode: zone numbers this process simulates (None = all).
+        # Online players who walk into a remote zone are queued for handoff.
+        self.owned_zones: Optional[set] = None
+        self.pending_handoffs: List['Player'] = []
+
+        # Wall clock for zone timers; simulate.py swaps in simulated time
+        self.clock = time.time
+
+        # Pulse scheduler for periodic/one-shot subsystem jobs
+        self.scheduler = Scheduler(config.TICKS_PER_SECOND)
+
+        # Per-subsystem pulse timings (admin dashboard / tickstats)
+        self.tick_profiler = TickProfiler(1.0 / config.TICKS_PER_SECOND)
+        self.scheduler.profiler = self.tick_profiler
+
+        # Per-command timings and the slow-command log (cmdstats / dashboard)
+        self.command_stats = CommandStats(config.SLOW_COMMAND_MS, config.SLOW_COMMAND_LOG,
+                                          track_alloc=config.COMMAND_ALLOC_TRACKING)
+
+        # Skips cosmetic work / slows wander AI when pulses keep overrunning
+        self.load_shedder = LoadShedder(self.tick_profiler.budget_ms)
+
+        # MCCP2 byte counts across all telnet connections
+        self.compression_stats = CompressionStats()
         
     async def load(self):
         """Load the world from files."""
@@ -601,6 +711,12 @@ class World:
         # Link room exits
         self.link_exits()
 
+        if self.owned_zones is not None:
+            for zone in self.zones.values():
+                if zone.number not in self.owned_zones:
+                    zone.remote = True
+                    zone.hibernating = True
+
         # Seed puzzles
         try:
             from puzzles import PuzzleManager
@@ -617,6 +733,9 @@ class World:
             spawn_faction_npcs(self)
         except Exception as e:
             logger.warning(f"Failed to spawn faction NPCs: {e}")
+
+        if self.owned_zones is not None:
+            self._drop_remote_npcs()
         
         # Initialize world events system
         from world_events import WorldEventManager
@@ -694,37 +813,35 @@ class World:
         """Reset a single zone."""
         from bosses import create_mob_from_prototype
         from objects import create_object
-        
+
+        if zone.remote:
+            return
+
+        # Existing mobs per vnum that belong to the zone, homed here or
+        # standing in it (prevents dupes when they wander). Counted once
+        # per reset, on the first mob reset, and kept up to date as we spawn.
+        existing = None
+
         for room in zone.rooms.values():
             # Spawn mobs
             for mob_reset in room.mob_resets:
                 mob_vnum = mob_reset.get('vnum')
                 max_count = mob_reset.get('max', 1)
                 max_existing = mob_reset.get('max_existing')
-                
-                # Count existing mobs for this vnum in the zone (prevents dupes when they wander)
-                current = sum(
-                    1 for npc in self.npcs
-                    if hasattr(npc, 'vnum')
-                    and npc.vnum == mob_vnum
-                    and (
-                        getattr(npc, 'home_zone', None) == zone.number
-                        or (npc.room and npc.room.zone == zone)
-                    )
-                )
 
-                if max_existing is not None:
-                    existing_in_zone = sum(
-                        1 for npc in self.npcs
+                if existing is None:
+                    existing = Counter(
+                        npc.vnum for npc in self.npcs
                         if hasattr(npc, 'vnum')
-                        and npc.vnum == mob_vnum
                         and (
                             getattr(npc, 'home_zone', None) == zone.number
                             or (npc.room and npc.room.zone == zone)
                         )
                     )
-                    if existing_in_zone >= max_existing:
-                        continue
+                current = existing[mob_vnum]
+
+                if max_existing is not None and current >= max_existing:
+                    continue
                 
                 if current < max_count:
                     proto = self.mob_prototypes.get(mob_vnum)
@@ -735,6 +852,7 @@ class World:
                         mob.home_zone = zone.number  # Set home zone for movement restrictions
                         room.characters.append(mob)
                         self.npcs.append(mob)
+                        existing[mob_vnum] += 1
                         
             # Spawn objects
             for obj_reset in room.obj_resets:
@@ -751,16 +869,36 @@ class World:
                         room.items.append(obj)
                         
         zone.age = 0
-        zone.last_reset_at = time.time()
+        zone.last_reset_at = self.clock()
         zone.next_reset_at = zone.last_reset_at + zone.reset_interval_seconds
         
+    def _drop_remote_npcs(self):
+        """Remove NPCs standing in zones another shard simulates."""
+        for npc in list(self.npcs):
+            room = npc.room
+            if room is not None and room.zone is not None and room.zone.remote:
+                if npc in room.characters:
+                    room.characters.remove(npc)
+                self.npcs.remove(npc)
+
     def get_room(self, vnum: int) -> Optional[Room]:
         """Get a room by vnum."""
         return self.rooms.get(vnum)
         
     async def add_player(self, player: 'Player'):
         """Add a player to the world."""
+        previous = self.players.get(player.name.lower())
+        if previous is not None and previous is not player:
+            self._unindex_player(previous, previous.room)
         self.players[player.name.lower()] = player
+        self._index_player(player, player.room)
+        if player.room:
+            zone = player.room.zone
+            if zone is not None and zone.remote:
+                self.pending_handoffs.append(player)  # Saved in another shard's zone
+            elif zone is not None and zone.hibernating:
+                self.wake_zone(zone)
+            self.wake_room(player.room)
 
         # Spawn persistent companions
         if hasattr(player, 'companions') and player.companions:
@@ -801,8 +939,9 @@ class World:
                         self.npcs.remove(companion)
                     logger.info(f"Removed companion: {companion.name} for {player.name}")
 
-        if player.name.lower() in self.players:
+        if self.players.get(player.name.lower()) is player:
             del self.players[player.name.lower()]
+            self._unindex_player(player, player.room)
 
         if player.room and player in player.room.characters:
             player.room.characters.remove(player)
@@ -843,14 +982,19 @@ class World:
                     player.position = 'standing'
                     continue
                 await CombatHandler.one_round(player, player.fighting)
-                # Send prompt after combat round so player always sees HP
-                if hasattr(player, 'connection') and player.connection:
-                    await player.connection.send_prompt()
+                # Send prompt after combat round so player always sees HP;
+                # GMCP clients get Char.Vitals/Combat.Target deltas instead
+                conn = getattr(player, 'connection', None)
+                if conn and not getattr(conn, 'gmcp', None):
+                    await conn.send_prompt()
 
         # Process NPC combat
         from mob_ai import mob_ai_tick
         for npc in list(self.npcs):
             if npc.is_fighting:
+                # Combat may have started without waking the NPC's AI
+                if getattr(npc, '_ai_due', None) is None:
+                    self.wake_npc(npc)
                 # Check if target is still valid
                 if npc.fighting is None or npc.fighting.hp <= 0 or (hasattr(npc.fighting, 'room') and npc.fighting not in npc.room.characters):
                     npc.fighting = None
@@ -874,7 +1018,7 @@ class World:
             await AffectManager.tick_affects(player)
 
         for npc in self.npcs:
-            if hasattr(npc, 'affects'):
+            if hasattr(npc, 'affects') and not _dormant(npc):
                 await AffectManager.tick_affects(npc)
 
     async def poison_tick(self):
@@ -886,6 +1030,8 @@ class World:
             await AffectManager.tick_affects(player, poison_only=True)
 
         for npc in self.npcs:
+            if _dormant(npc):
+                continue
             # Only process poison DOT effects, don't decrement durations
             await AffectManager.tick_affects(npc, poison_only=True)
 
@@ -899,7 +1045,7 @@ class World:
                 await player.send(f"{c['cyan']}[TICK - Regen]{c['reset']}")
 
         for npc in self.npcs:
-            if hasattr(npc, 'regen_tick'):
+            if hasattr(npc, 'regen_tick') and not _dormant(npc):
                 await npc.regen_tick()
 
     async def minor_regen_tick(self):
@@ -913,14 +1059,12 @@ class World:
         for zone in self.zones.values():
             zone.age += 1
             if zone.age >= zone.lifespan:
+                if zone.hibernating:
+                    continue  # Deferred until the zone wakes
                 if zone.reset_mode == 2:  # Always reset
                     await self.reset_zone(zone)
                 elif zone.reset_mode == 1:  # Reset if empty
-                    players_in_zone = any(
-                        p.room and p.room.zone == zone 
-                        for p in self.players.values()
-                    )
-                    if not players_in_zone:
+                    if zone not in self.zone_players:
                         await self.reset_zone(zone)
 
     async def time_tick(self):
@@ -985,7 +1129,7 @@ class World:
     async def weather_tick(self):
         """Process weather updates for all zones."""
         for zone in self.zones.values():
-            if zone.number > 0:  # Skip Limbo (zone 0)
+            if zone.number > 0 and not zone.hibernating:  # Skip Limbo (zone 0)
                 old_weather = zone.weather.sky_condition
                 zone.weather.update_weather(self.game_time)
 
@@ -994,9 +1138,8 @@ class World:
                     c = self.config.COLORS
                     weather_desc = zone.weather.get_weather_desc()
 
-                    for player in self.players.values():
-                        if player.room and player.room.zone == zone:
-                            await player.send(f"\r\n{c['cyan']}{weather_desc}{c['reset']}\r\n")
+                    for player in list(self.zone_players.get(zone, ())):
+                        await player.send(f"\r\n{c['cyan']}{weather_desc}{c['reset']}\r\n")
 
     async def pet_tick(self):
         """Process pet timers and expiration."""
@@ -1011,58 +1154,260 @@ class World:
         Ground items (non-permanent) decay after 2-3 MUD days (~30 min real time).
         """
         for room in self.rooms.values():
-            if not hasattr(room, 'items'):
+            if not getattr(room, 'items', None):
                 continue
-            items_to_remove = []
-            items_to_add = []
-            
-            for item in room.items:
-                # Initialize decay timer if not set
-                if not hasattr(item, 'decay_timer'):
-                    if 'corpse' in getattr(item, 'name', '').lower():
-                        item.decay_timer = 50  # ~5 min at 6s per tick
-                    elif getattr(item, 'item_type', '') in ('key',):
-                        item.decay_timer = 300  # Keys last longer (~30 min)
-                    elif hasattr(item, '_permanent') and item._permanent:
-                        item.decay_timer = -1  # Never decay (zone resets)
-                    else:
-                        item.decay_timer = -1  # Don't decay zone-spawned items
-                
-                if item.decay_timer < 0:
-                    continue  # Permanent item
-                    
-                item.decay_timer -= 1
-                
-                if item.decay_timer <= 0:
-                    if 'corpse' in getattr(item, 'name', '').lower():
-                        # Corpse decays — drop contents to ground
-                        contents = getattr(item, 'contents', [])
-                        for contained in contents:
-                            contained.decay_timer = 500  # ~50 min for dropped items
-                            items_to_add.append(contained)
-                        # Notify players in room
-                        for char in room.characters:
-                            if hasattr(char, 'send'):
-                                c = char.config.COLORS
-                                await char.send(f"{c['yellow']}{item.short_desc} decays, leaving behind its contents.{c['reset']}")
-                    else:
-                        # Regular item decays
-                        for char in room.characters:
-                            if hasattr(char, 'send'):
-                                c = char.config.COLORS
-                                await char.send(f"{c['yellow']}{item.short_desc} crumbles to dust.{c['reset']}")
-                    items_to_remove.append(item)
-            
-            for item in items_to_remove:
+            zone = room.zone
+            if zone is not None and zone.hibernating:
+                continue
+
+            for item in self._advance_decay(room):
+                # Notify players in room
+                if 'corpse' in getattr(item, 'name', '').lower():
+                    text = f"{item.short_desc} decays, leaving behind its contents."
+                else:
+                    text = f"{item.short_desc} crumbles to dust."
+                for char in list(self.players_in_room(room)):
+                    c = char.config.COLORS
+                    await char.send(f"{c['yellow']}{text}{c['reset']}")
+
+    @staticmethod
+    def _advance_decay(room: Room, ticks: int = 1) -> List:
+        """Age the items on a room's floor by ``ticks`` decay ticks.
+
+        Decayed items are removed from the room (a corpse drops its contents,
+        which keep aging for whatever ticks are left) and returned in order.
+        """
+        decayed = []
+        work = [(item, ticks) for item in room.items]
+        i = 0
+        while i < len(work):
+            item, left = work[i]
+            i += 1
+            # Initialize decay timer if not set
+            if not hasattr(item, 'decay_timer'):
+                if 'corpse' in getattr(item, 'name', '').lower():
+                    item.decay_timer = 50  # ~5 min at 6s per tick
+                elif getattr(item, 'item_type', '') in ('key',):
+                    item.decay_timer = 300  # Keys last longer (~30 min)
+                elif hasattr(item, '_permanent') and item._permanent:
+                    item.decay_timer = -1  # Never decay (zone resets)
+                else:
+                    item.decay_timer = -1  # Don't decay zone-spawned items
+
+            if item.decay_timer < 0:
+                continue  # Permanent item
+
+            needed = max(1, item.decay_timer)
+            if left < needed:
+                item.decay_timer -= left
+                continue
+
+            item.decay_timer = 0
+            if item in room.items:
                 room.items.remove(item)
-            for item in items_to_add:
-                room.items.append(item)
+            decayed.append(item)
+            if 'corpse' in getattr(item, 'name', '').lower():
+                # Corpse decays — drop contents to ground
+                for contained in getattr(item, 'contents', []):
+                    contained.decay_timer = 500  # ~50 min for dropped items
+                    room.items.append(contained)
+                    work.append((contained, left - needed))
+        return decayed
+
+    # ------------------------------------------------------------------
+    # Zone hibernation
+    # ------------------------------------------------------------------
+
+    def occupied_zones(self) -> set:
+        """Zones holding an online player or one of their pets/companions."""
+        zones = set(self.zone_players)
+        for player in self.players.values():
+            for companion in getattr(player, 'companions', None) or ():
+                room = getattr(companion, 'room', None)
+                if room is not None and room.zone is not None:
+                    zones.add(room.zone)
+        return zones
+
+    async def hibernation_tick(self):
+        """Put zones that have been empty long enough to sleep."""
+        now = self.clock()
+        occupied = self.occupied_zones()
+        for zone in self.zones.values():
+            if zone.remote:
+                continue
+            if zone in occupied:
+                zone.empty_since = None
+                if zone.hibernating:
+                    self.wake_zone(zone)  # e.g. a pet was teleported in
+            elif zone.hibernating:
+                continue
+            elif zone.empty_since is None:
+                zone.empty_since = now
+            elif now - zone.empty_since >= self.config.ZONE_HIBERNATE_SECONDS:
+                self.hibernate_zone(zone, now)
+
+    def hibernate_zone(self, zone: Zone, now: Optional[float] = None):
+        """Suspend NPC AI, affects, decay and weather for a zone.
+
+        Queued AI entries for the zone's NPCs are dropped lazily by
+        process_npcs; wake_npc refuses to queue them while it sleeps.
+        """
+        if zone.hibernating:
+            return
+        zone.hibernating = True
+        zone.hibernated_at = now if now is not None else self.clock()
+        logger.debug(f"Zone {zone.number} ({zone.name}) hibernating")
+
+    def wake_zone(self, zone: Zone):
+        """Wake a hibernating zone, applying the time it slept in one step."""
+        if not zone.hibernating or zone.remote:
+            return
+        zone.hibernating = False
+        zone.empty_since = None
+        now = self.clock()
+        elapsed = max(0.0, now - (zone.hibernated_at or now))
+        zone.hibernated_at = None
+        cfg = self.config
+        decay_ticks = int(elapsed // cfg.DECAY_TICK_SECONDS)
+        affect_ticks = int(elapsed // cfg.AFFECT_TICK_SECONDS)
+
+        from affects import AffectManager
+        for room in zone.rooms.values():
+            if decay_ticks and room.items:
+                self._advance_decay(room, decay_ticks)
+            for npc in room.characters:
+                if not getattr(npc, '_ai_listed', False):
+                    continue
+                if affect_ticks:
+                    for affect in list(getattr(npc, 'affects', ())):
+                        affect.remaining -= affect_ticks
+                        if affect.remaining <= 0:
+                            AffectManager.remove_affect(npc, affect)
+                # Long enough asleep to have regenerated fully
+                if not npc.is_fighting:
+                    for stat in ('hp', 'mana', 'move'):
+                        top = getattr(npc, f'max_{stat}', None)
+                        if top is not None:
+                            setattr(npc, stat, top)
+                self.wake_npc(npc)
+
+        if zone.number > 0:
+            zone.weather.update_weather(self.game_time)
+
+        # Same rule as zone_reset_tick: a reset-if-empty zone waits for its
+        # visitors to leave, and that tick picks it up once they do
+        overdue = zone.age >= zone.lifespan
+        if overdue and (zone.reset_mode == 2 or
+                        (zone.reset_mode == 1 and zone not in self.zone_players)):
+            self.scheduler.once(f'zone_wake_reset_{zone.number}', 1,
+                                functools.partial(self.reset_zone, zone))
+
+        logger.debug(f"Zone {zone.number} ({zone.name}) woke after {elapsed:.0f}s "
+                     f"({decay_ticks} decay ticks)")
+
+    def wake_npc(self, npc, delay: int = 1):
+        """Queue an NPC's AI to run ``delay`` pulses from now."""
+        if not getattr(npc, '_ai_listed', False) or _dormant(npc):
+            return
+        due = self.scheduler.pulse + max(1, delay)
+        current = getattr(npc, '_ai_due', None)
+        if current is not None and current <= due:
+            return  # Already queued at least this soon
+        npc._ai_due = due
+        heapq.heappush(self._ai_queue, (due, next(self._ai_seq), npc))
+
+    def wake_room(self, room):
+        """Wake every NPC in a room (e.g. a player just walked in)."""
+        for char in room.characters:
+            if getattr(char, '_ai_listed', False):
+                self.wake_npc(char)
+
+    # ------------------------------------------------------------------
+    # Occupancy indexes
+    # ------------------------------------------------------------------
+
+    def players_in_zone(self, zone: Zone) -> set:
+        """Online players in ``zone``; the live set, so copy it before awaiting."""
+        return self.zone_players.get(zone, _NOBODY)
+
+    def npcs_in_zone(self, zone: Zone) -> set:
+        """Loaded NPCs in ``zone``; the live set, so copy it before awaiting."""
+        return self.zone_npcs.get(zone, _NOBODY)
+
+    def players_in_room(self, room: Room) -> set:
+        """Online players in ``room``; the live set, so copy it before awaiting."""
+        return self.room_players.get(room, _NOBODY)
+
+    def _index_player(self, player, room):
+        if room is None:
+            return
+        self.room_players.setdefault(room, set()).add(player)
+        if room.zone is not None:
+            self.zone_players.setdefault(room.zone, set()).add(player)
+
+    def _unindex_player(self, player, room):
+        if room is None:
+            return
+        _discard(self.room_players, room, player)
+        if room.zone is not None:
+            _discard(self.zone_players, room.zone, player)
+
+    def _index_npc(self, npc, room):
+        zone = room.zone if room is not None else None
+        if zone is not None:
+            self.zone_npcs.setdefault(zone, set()).add(npc)
+
+    def _unindex_npc(self, npc, room):
+        zone = room.zone if room is not None else None
+        if zone is not None:
+            _discard(self.zone_npcs, zone, npc)
+
+    def npc_moved(self, npc, old_room, new_room):
+        """Called whenever a listed NPC's room changes."""
+        old_zone = old_room.zone if old_room is not None else None
+        new_zone = new_room.zone if new_room is not None else None
+        if old_zone is not new_zone:
+            self._unindex_npc(npc, old_room)
+            self._index_npc(npc, new_room)
+
+    def player_moved(self, player, old_room, new_room):
+        """Called whenever an online player's room changes."""
+        if self.players.get(player.name.lower()) is not player:
+            return  # Not in the world yet (or any more); add_player indexes it
+        self._unindex_player(player, old_room)
+        self._index_player(player, new_room)
+        if new_room is not None:
+            zone = new_room.zone
+            if zone is not None and zone.hibernating:
+                if zone.remote:
+                    self.pending_handoffs.append(player)
+                    return
+                self.wake_zone(zone)
+            self.wake_room(new_room)
+
+    def _schedule_npc_ai(self, npc):
+        """Requeue an NPC after it thought, based on what it wants to do next."""
+        if not getattr(npc, '_ai_listed', False):
+            return
+        think_delay = getattr(npc, 'ai_think_delay', None)
+        delay = think_delay() if think_delay else 1
+        if delay is not None:
+            self.wake_npc(npc, delay)
 
     async def process_npcs(self):
-        """Process NPC AI."""
-        for npc in list(self.npcs):
+        """Process NPC AI for the NPCs that are due this pulse."""
+        pulse = self.scheduler.pulse
+        queue = self._ai_queue
+        while queue and queue[0][0] <= pulse:
+            due, _, npc = heapq.heappop(queue)
+            if getattr(npc, '_ai_due', None) != due:
+                continue  # Stale entry (requeued sooner, or removed)
+            npc._ai_due = None
+            if _dormant(npc):
+                continue  # Zone went to sleep; wake_zone requeues it
             if hasattr(npc, 'process_ai'):
                 await npc.process_ai()
+            self._schedule_npc_ai(npc)
                 
     async def autosave(self):
         """Autosave all players."""
@@ -1078,7 +1423,5 @@ class World:
         
     async def broadcast(self, message: str, exclude: List = None):
         """Broadcast a message to all players."""
-        exclude = exclude or []
-        for player in self.players.values():
-            if player not in exclude:
-                await player.send(f"\r\n{message}\r\n")
+        exclude = exclude or ()
+        await fan_out([p for p in self.players.values() if p not in exclude], f"\r\n{message}\r\n")
@@ -0,0 +1,88 @@
+import ipaddress
+
+from bans import BanList, PrefixTrie, parse_ban_file
+
+BAN_FILE = """\
+# scanners
+85.217.149.48          # single host
+222.186.0.0/16
+10.1.2.0/24
+10.0.0.0/8             # swallows the /24 above
+2001:db8::/32
+not-an-address
+"""
+
+
+def trie_for(text):
+    trie = PrefixTrie()
+    for network in parse_ban_file(text)[0]:
+        trie.add(network)
+    return trie
+
+
+def match(trie, ip):
+    return trie.match(ipaddress.ip_address(ip))
+
+
+def test_parse_ban_file_reports_bad_lines():
+    networks, errors = parse_ban_file(BAN_FILE)
+    assert [str(n) for n in networks] == ['85.217.149.48/32', '222.186.0.0/16', '10.1.2.0/24',
+                                          '10.0.0.0/8', '2001:db8::/32']
+    assert errors == ['not-an-address']
+
+
+def test_single_address_and_cidr_matches():
+    trie = trie_for(BAN_FILE)
+    assert match(trie, '85.217.149.48') == '85.217.149.48/32'
+    assert match(trie, '85.217.149.49') is None
+    assert match(trie, '222.186.0.0') == '222.186.0.0/16'
+    assert match(trie, '222.186.255.255') == '222.186.0.0/16'
+    assert match(trie, '222.187.0.0') is None
+    assert match(trie, '2001:db8:1::5') == '2001:db8::/32'
+    assert match(trie, '2001:db9::1') is None
+
+
+def test_shortest_covering_prefix_wins():
+    trie = trie_for(BAN_FILE)
+    assert match(trie, '10.1.2.3') == '10.0.0.0/8'
+    assert match(trie, '10.200.0.1') == '10.0.0.0/8'
+    # The /24 was added before the /8 and is still counted
+    assert trie.count == 5
+
+
+def test_longer_prefix_added_after_a_covering_one_is_skipped():
+    trie = trie_for('10.0.0.0/8\n10.1.2.0/24\n')
+    assert trie.count == 1
+    assert match(trie, '10.1.2.3') == '10.0.0.0/8'
+
+
+def test_families_do_not_mix():
+    trie = trie_for('0.0.0.0/0\n')
+    assert match(trie, '192.0.2.1') == '0.0.0.0/0'
+    assert match(trie, '::1') is None
+
+
+def test_trie_agrees_with_ipaddress_membership():
+    networks = parse_ban_file(BAN_FILE)[0]
+    trie = trie_for(BAN_FILE)
+    for ip in ('10.255.255.255', '11.0.0.0', '222.185.255.255', '85.217.149.47',
+               '2001:db8:ffff:ffff::', '2001:0db7::ffff', '127.0.0.1'):
+        address = ipaddress.ip_address(ip)
+        covered = any(address.version == n.version and address in n for n in networks)
+        assert (match(trie, ip) is not None) == covered, ip
+
+
+def test_ban_list_loads_file_and_maps_ipv4_in_ipv6(tmp_path):
+    path = tmp_path / 'bans.txt'
+    path.write_text(BAN_FILE, encoding='utf-8')
+    bans = BanList(str(path))
+    assert bans.load() == 5
+    assert bans.errors == ['not-an-address']
+    assert bans.match('::ffff:222.186.1.1') == '222.186.0.0/16'
+    assert bans.match('garbage') is None
+
+
+def test_missing_ban_file_means_no_bans(tmp_path):
+    bans = BanList(str(tmp_path / 'missing.txt'))
+    assert bans.load() == 0
+    assert bans.match('85.217.149.48') is None
@@ -0,0 +1,56 @@
+import pytest
+
+from command_registry import _class_names
+
+GROUP = '''
+"""A group module."""
+from typing import Dict
+
+
+def helper():
+    pass
+
+
+class MovementCommands:
+    """Commands."""
+
+    DIRECTIONS: Dict[str, str] = {}
+    aliases = shortcuts = {'n': 'north'}
+    __slots__ = ()
+
+    async def cmd_north(cls, player, args):
+        def nested():
+            pass
+        x = 1
+        return x
+
+    @classmethod
+    async def cmd_south(cls, player, args):
+        pass
+
+    def _move(cls):
+        pass
+'''
+
+
+def test_class_names_lists_the_class_body_only():
+    assert _class_names(GROUP, 'movement.py') == [
+        'DIRECTIONS', 'aliases', 'shortcuts', 'cmd_north', 'cmd_south', '_move']
+
+
+def test_class_names_is_not_fooled_by_strings_or_comments():
+    source = 'class C:\n    """def cmd_fake(): pass"""\n    # def cmd_other(): pass\n    def cmd_real(self): pass\n'
+    assert _class_names(source, 'c.py') == ['cmd_real']
+
+
+@pytest.mark.parametrize('source', ['x = 1\n', 'class A: pass\nclass B: pass\n'])
+def test_group_modules_must_define_exactly_one_class(source):
+    with pytest.raises(ValueError):
+        _class_names(source, 'bad.py')
+
+
+def test_every_real_group_indexes_cleanly():
+    from commands import CommandHandler
+    groups = CommandHandler.groups
+    assert 'cmd_look' in groups.names()
+    assert set(groups.owner.values()) <= set(groups.groups)
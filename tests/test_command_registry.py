@@ -0,0 +1,126 @@
+import random
+import string
+
+import pytest
+
+from command_registry import CommandRegistry, _PrefixTrie
+
+
+def linear_resolve(names, aliases, command_aliases, word):
+    """The resolver the registry replaced: aliases, then a scan over every command."""
+    word = aliases.get(word, word)
+    word = command_aliases.get(word, word)
+    if word in names:
+        return word
+    underscored = word.replace(' ', '_')
+    if underscored in names:
+        return underscored
+    squashed = word.replace('_', '').replace(' ', '')
+    for name in sorted(names):
+        if name.replace('_', '') == squashed:
+            return name
+    matches = sorted((name for name in sorted(names) if name.startswith(word)), key=len)
+    return matches[0] if matches else None
+
+
+def registry_resolve(registry, word):
+    word = registry.aliases.get(word, word)
+    return registry.lookup(word) or registry.complete(word)
+
+
+class Handler:
+    ALIASES = {'l': 'look', 'k': 'kill', 'ss': 'shadowstep'}
+    COMMAND_ALIASES = {'shadowstep': 'shadow_step'}
+
+    def cmd_look(cls, player, args): pass
+    def cmd_loot(cls, player, args): pass
+    def cmd_kill(cls, player, args): pass
+    def cmd_kick(cls, player, args): pass
+    def cmd_shadow_step(cls, player, args): pass
+    def cmd_shadow_bolt(cls, player, args): pass
+    def cmd_say(cls, player, args): pass
+    def cmd_score(cls, player, args): pass
+    not_a_command = 1
+
+
+@pytest.fixture
+def registry():
+    return CommandRegistry(Handler, Handler.ALIASES, Handler.COMMAND_ALIASES)
+
+
+def test_indexes_only_cmd_methods(registry):
+    assert registry.names() == ['kick', 'kill', 'look', 'loot', 'say', 'score',
+                                'shadow_bolt', 'shadow_step']
+    assert registry.method('look') is Handler.cmd_look
+    assert registry.method('not_a_command') is None
+
+
+def test_lookup_forms(registry):
+    assert registry.lookup('shadow_step') == 'shadow_step'
+    assert registry.lookup('shadow step') == 'shadow_step'
+    assert registry.lookup('shadowstep') == 'shadow_step'
+    assert registry.lookup('shad') is None
+
+
+def test_prefix_goes_to_shortest_then_alphabetical(registry):
+    assert registry.complete('lo') == 'look'   # look/loot tie on length
+    assert registry.complete('s') == 'say'
+    assert registry.complete('sc') == 'score'
+    assert registry.complete('shadow_') == 'shadow_bolt'
+    assert registry.complete('shadows') == 'shadow_step'  # underscore-free prefix
+    assert registry.complete('x') is None
+
+
+def test_aliases_chain_into_command_aliases(registry):
+    assert registry.aliases['ss'] == 'shadow_step'
+    assert registry_resolve(registry, 'ss') == 'shadow_step'
+    assert registry_resolve(registry, 'l') == 'look'
+
+
+def test_prefix_trie_keeps_the_best_name_per_node():
+    trie = _PrefixTrie()
+    for name in ('stand', 'steal', 'st', 'stab'):
+        trie.add(name, name)
+    assert trie.best('') == 'st'
+    assert trie.best('sta') == 'stab'
+    assert trie.best('ste') == 'steal'
+    assert trie.best('stz') is None
+
+
+def parity_inputs(registry, aliases, command_aliases, seed=1, noise=2000):
+    words = set(aliases) | set(command_aliases)
+    for name in registry.names():
+        words.update(name[:i] for i in range(1, len(name) + 1))
+        words.add(name.replace('_', ''))
+        words.add(name.replace('_', ' '))
+    rng = random.Random(seed)
+    letters = string.ascii_lowercase + '_'
+    words.update(''.join(rng.choice(letters) for _ in range(rng.randint(1, 8))) for _ in range(noise))
+    return sorted(words)
+
+
+def assert_parity(registry, aliases, command_aliases):
+    names = set(registry.names())
+    checked = 0
+    for word in parity_inputs(registry, aliases, command_aliases):
+        old = linear_resolve(names, aliases, command_aliases, word)
+        new = registry_resolve(registry, word)
+        if old is None:
+            # Only the underscore-free prefix index may find something the scan didn't
+            word = registry.aliases.get(word, word)
+            assert registry.lookup(word) is None and registry._prefix.best(word) is None, word
+        else:
+            assert new == old, word
+            checked += 1
+    return checked
+
+
+def test_parity_with_linear_scan_on_a_small_handler(registry):
+    assert assert_parity(registry, Handler.ALIASES, Handler.COMMAND_ALIASES) > 0
+
+
+def test_parity_with_linear_scan_on_the_real_handler():
+    from commands import CommandHandler
+    registry = CommandHandler.registry
+    checked = assert_parity(registry, CommandHandler.ALIASES, CommandHandler.COMMAND_ALIASES)
+    assert checked > 1000
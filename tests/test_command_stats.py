@@ -0,0 +1,31 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from command_stats import CommandStats
+from commands import CommandHandler
+
+
+def player_with_stats():
+    stats = CommandStats(slow_ms=1000)
+    return SimpleNamespace(world=SimpleNamespace(command_stats=stats), name='Tester'), stats
+
+
+def test_successful_command_is_timed_under_its_name(monkeypatch):
+    async def dispatch(player, cmd, args):
+        return 'look'
+    monkeypatch.setattr(CommandHandler, '_dispatch', dispatch)
+    player, stats = player_with_stats()
+    asyncio.run(CommandHandler.execute(player, 'l', []))
+    assert stats.commands['look'].latency.count == 1
+
+
+def test_failing_command_is_still_timed_and_the_error_propagates(monkeypatch):
+    async def dispatch(player, cmd, args):
+        raise RuntimeError('boom')
+    monkeypatch.setattr(CommandHandler, '_dispatch', dispatch)
+    player, stats = player_with_stats()
+    with pytest.raises(RuntimeError):
+        asyncio.run(CommandHandler.execute(player, 'look', []))
+    assert stats.commands['look'].latency.count == 1
@@ -0,0 +1,95 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from config import Config
+from server import Connection, IdleReaper
+
+PRE_GAME_STATES = sorted(value for name, value in vars(Connection).items()
+                         if name.startswith('STATE_') and value != Connection.STATE_PLAYING)
+
+
+def make_server():
+    return SimpleNamespace(world=None, config=Config, connections={})
+
+
+def connect(server, port, state=Connection.STATE_GET_NAME):
+    conn = Connection(None, server, ('192.0.2.1', port))
+    conn.transport = SimpleNamespace(is_closing=lambda: False)
+    conn.state = state
+    server.connections[conn.conn_id] = conn
+    return conn
+
+
+@pytest.mark.parametrize('state', PRE_GAME_STATES)
+def test_every_pre_game_state_gets_the_login_timeout(state):
+    conn = connect(make_server(), 1, state)
+    assert conn.idle_deadline() == conn.last_activity + Config.LOGIN_TIMEOUT_SECONDS
+
+
+def test_new_character_states_are_covered():
+    for state in (Connection.STATE_CONFIRM_PASSWORD, Connection.STATE_GET_RACE,
+                  Connection.STATE_GET_CLASS, Connection.STATE_ROLLING_STATS):
+        assert state in PRE_GAME_STATES
+
+
+def test_playing_gets_the_idle_timeout():
+    conn = connect(make_server(), 1, Connection.STATE_PLAYING)
+    assert conn.idle_deadline() == conn.last_activity + Config.IDLE_TIMEOUT_SECONDS
+
+
+def sweep(reaper):
+    async def go():
+        reaper.sweep()
+        await asyncio.sleep(0)  # Let the idle_timeout tasks run
+        reaper.stop()
+    asyncio.run(go())
+
+
+def watch_timeouts(*conns):
+    timed_out = []
+    for conn in conns:
+        async def idle_timeout(conn=conn):
+            timed_out.append(conn.conn_id)
+        conn.idle_timeout = idle_timeout
+    return timed_out
+
+
+def test_sweep_times_out_only_connections_past_their_deadline():
+    server = make_server()
+    reaper = IdleReaper(server)
+    login = connect(server, 1)
+    playing = connect(server, 2, Connection.STATE_PLAYING)
+    timed_out = watch_timeouts(login, playing)
+    for conn in (login, playing):
+        conn.last_activity -= Config.LOGIN_TIMEOUT_SECONDS + 1
+        reaper.track(conn)
+    sweep(reaper)
+    assert timed_out == [login.conn_id]
+    assert [entry[2] for entry in reaper._heap] == [playing]
+
+
+def test_input_since_tracking_pushes_the_entry_back():
+    server = make_server()
+    reaper = IdleReaper(server)
+    conn = connect(server, 1)
+    timed_out = watch_timeouts(conn)
+    conn.last_activity -= Config.LOGIN_TIMEOUT_SECONDS + 1
+    reaper.track(conn)
+    conn.last_activity += Config.LOGIN_TIMEOUT_SECONDS  # Typed something
+    sweep(reaper)
+    assert timed_out == []
+    assert reaper._heap[0][0] == conn.idle_deadline()
+
+
+def test_closed_connections_are_dropped_from_the_heap():
+    server = make_server()
+    reaper = IdleReaper(server)
+    conns = [connect(server, port) for port in range(4)]
+    for conn in conns:
+        reaper.track(conn)
+    for conn in conns[:3]:
+        del server.connections[conn.conn_id]
+        reaper.discard(conn)
+    assert [entry[2] for entry in reaper._heap] == [conns[3]]
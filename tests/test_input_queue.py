@@ -0,0 +1,146 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from commands import CommandHandler
+from config import Config
+from player import Player
+from server import Connection, MUDServer
+from spells import SPELLS, SpellHandler
+
+
+class QueueConfig(Config):
+    INPUT_QUEUE_LIMIT = 3
+    INPUT_COMMANDS_PER_PULSE = 200
+
+
+def make_server(config=QueueConfig):
+    return MUDServer(SimpleNamespace(), config)
+
+
+def connect(server, port, ran):
+    conn = Connection(None, server, ('192.0.2.1', port))
+    server.connections[conn.conn_id] = conn
+
+    async def handle_input(line):
+        ran.append(line)
+    conn.handle_input = handle_input
+    return conn
+
+
+def pulses(server, count):
+    async def go():
+        for _ in range(count):
+            await server.process_input()
+    asyncio.run(go())
+
+
+def test_connections_take_turns_one_command_a_pulse():
+    server = make_server()
+    ran = []
+    a, b = connect(server, 1, ran), connect(server, 2, ran)
+    for line in ('a1', 'a2', 'a3'):
+        server.receive_line(a, line)
+    for line in ('b1', 'b2'):
+        server.receive_line(b, line)
+    pulses(server, 1)
+    assert ran == ['a1', 'b1']
+    pulses(server, 2)
+    assert ran == ['a1', 'b1', 'a2', 'b2', 'a3']
+    assert not server._input_ready
+
+
+def test_commands_per_pulse_budget_is_shared():
+    class OnePerPulse(QueueConfig):
+        INPUT_COMMANDS_PER_PULSE = 1
+    server = make_server(OnePerPulse)
+    ran = []
+    a, b = connect(server, 1, ran), connect(server, 2, ran)
+    server.receive_line(a, 'a1')
+    server.receive_line(b, 'b1')
+    pulses(server, 1)
+    assert ran == ['a1']
+    pulses(server, 1)
+    assert ran == ['a1', 'b1']
+
+
+def test_lines_past_the_queue_limit_are_dropped_with_one_notice():
+    server = make_server()
+    ran = []
+    conn = connect(server, 1, ran)
+    for i in range(5):
+        server.receive_line(conn, f"l{i}")
+    assert [line for line, _ in conn.input_buffer] == ['l0', 'l1', 'l2']
+    assert sum(b'Input flood' in data for data in conn.output_buffer) == 1
+    pulses(server, 5)
+    assert ran == ['l0', 'l1', 'l2']
+
+
+def test_wait_state_holds_input_until_it_counts_down():
+    server = make_server()
+    ran = []
+    conn = connect(server, 1, ran)
+    conn.player = SimpleNamespace(wait_state=2, name='Aria')
+    server.receive_line(conn, 'look')
+    pulses(server, 1)
+    assert ran == []
+    pulses(server, 1)
+    assert ran == ['look']
+    assert conn.player.wait_state == 0
+
+
+def test_a_failing_command_does_not_stop_the_queue():
+    server = make_server()
+    ran = []
+    bad, good = connect(server, 1, ran), connect(server, 2, ran)
+
+    async def boom(line):
+        raise RuntimeError(line)
+    bad.handle_input = boom
+    server.receive_line(bad, 'crash')
+    server.receive_line(bad, 'again')
+    server.receive_line(good, 'look')
+    pulses(server, 2)
+    assert ran == ['look']
+    assert not bad.input_buffer
+
+
+def test_add_wait_state_uses_the_configured_lag():
+    player = Player(None)
+    player.add_wait_state('bash')
+    assert player.wait_state == int(Config.WAIT_STATE_SECONDS['bash'] * Config.TICKS_PER_SECOND)
+    player.add_wait_state('backstab')  # Shorter lag never cuts a longer one
+    assert player.wait_state == int(Config.WAIT_STATE_SECONDS['bash'] * Config.TICKS_PER_SECOND)
+    player.add_wait_state('look')
+    assert player.wait_state == int(Config.WAIT_STATE_SECONDS['bash'] * Config.TICKS_PER_SECOND)
+
+
+def caster(mana):
+    player = Player(None)
+    player.name = 'Aria'
+    player.spells = {spell: 100 for spell in SPELLS}
+    player.mana = mana
+    sent = []
+
+    async def send(message, *args, **kwargs):
+        sent.append(message)
+    player.send = send
+    return player, sent
+
+
+def test_cast_without_mana_reports_failure():
+    spell = next(iter(SPELLS))
+    player, sent = caster(0)
+    assert asyncio.run(SpellHandler.cast_spell(player, spell)) is False
+    assert any('enough mana' in message for message in sent)
+
+
+@pytest.mark.parametrize('went_off', [True, False])
+def test_cast_lags_input_only_when_the_spell_goes_off(monkeypatch, went_off):
+    async def cast_spell(caster, spell_name, target_name=None):
+        return went_off
+    monkeypatch.setattr(SpellHandler, 'cast_spell', cast_spell)
+    player, _ = caster(100)
+    asyncio.run(CommandHandler.cmd_cast(player, [next(iter(SPELLS))]))
+    assert (player.wait_state > 0) is went_off
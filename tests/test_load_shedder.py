@@ -0,0 +1,56 @@
+from load_shedder import LEVEL_NORMAL, LEVEL_SHED_COSMETIC, LEVEL_SHED_WANDER, LoadShedder, shedding
+
+
+def shedder():
+    return LoadShedder(budget_ms=100, window=10, engage_ratio=0.5, calm_pulses=5)
+
+
+def test_sustained_overruns_escalate_one_level_per_window():
+    load = shedder()
+    for _ in range(9):
+        load.observe(150)
+    assert load.level == LEVEL_NORMAL  # Needs a full window first
+    load.observe(150)
+    assert load.level == LEVEL_SHED_COSMETIC
+    for _ in range(10):
+        load.observe(150)
+    assert load.level == LEVEL_SHED_WANDER
+    for _ in range(10):
+        load.observe(150)
+    assert load.level == LEVEL_SHED_WANDER and load.escalations == 2
+
+
+def test_occasional_overruns_do_not_escalate():
+    load = shedder()
+    for pulse in range(100):
+        load.observe(150 if pulse % 5 == 0 else 50)
+    assert load.level == LEVEL_NORMAL
+
+
+def test_shedding_by_category_and_level():
+    load = shedder()
+    load.level = LEVEL_SHED_COSMETIC
+    assert load.should_shed('ambient')
+    assert not load.should_shed('wander')
+    assert not load.should_shed('combat')  # Unknown categories are never shed
+    assert load.stretch_wander(4) == 4
+    load.level = LEVEL_SHED_WANDER
+    assert load.stretch_wander(4) > 4
+    assert load.shed['ambient'] == 1
+
+
+def test_calm_pulses_step_the_level_down():
+    load = shedder()
+    load.level = LEVEL_SHED_WANDER
+    for _ in range(5):
+        load.observe(10)
+    assert load.level == LEVEL_SHED_COSMETIC
+    load.observe(90)  # Over the release threshold: the calm run starts again
+    for _ in range(4):
+        load.observe(10)
+    assert load.level == LEVEL_SHED_COSMETIC
+
+
+def test_shedding_helper_without_a_shedder():
+    assert not shedding(None, 'ambient')
+    assert not shedding(object(), 'ambient')
@@ -0,0 +1,39 @@
+from net_stats import RATE_WINDOW, ConnectionStats, NetStats
+
+
+def test_recent_window_is_pruned_as_commands_arrive():
+    stats = ConnectionStats()
+    for second in range(10 * int(RATE_WINDOW)):
+        stats.command_done(float(second), 1.0)
+        # Never more than a window's worth kept, without anyone asking for the rate
+        assert len(stats._recent) <= RATE_WINDOW + 1
+    assert stats.commands == 10 * int(RATE_WINDOW)
+
+
+def test_commands_per_minute_counts_the_last_window():
+    stats = ConnectionStats()
+    for t in (0.0, 10.0, 50.0, 55.0):
+        stats.command_done(t, 2.0)
+    assert stats.commands_per_minute(59.0) == 4
+    assert stats.commands_per_minute(65.0) == 3
+    assert stats.commands_per_minute(200.0) == 0
+
+
+def test_latency_and_message_averages():
+    stats = ConnectionStats()
+    stats.messages_out = 6
+    stats.command_done(0.0, 10.0)
+    stats.command_done(1.0, 30.0)
+    assert stats.avg_latency_ms == 20.0
+    assert stats.max_latency_ms == 30.0
+    assert stats.messages_per_command == 3.0
+
+
+def test_retired_connections_stay_in_the_totals():
+    net = NetStats({})
+    stats = ConnectionStats()
+    stats.bytes_in, stats.bytes_out, stats.messages_out = 10, 200, 5
+    stats.command_done(0.0, 1.0)
+    net.retire(stats)
+    assert net.totals() == {'bytes_in': 10, 'bytes_out': 200, 'messages_out': 5, 'commands': 1}
+    assert net.connections_closed == 1
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from config import Config
+from world import Room, World, Zone
+
+
+class FakeNPC:
+    def __init__(self, world, room, delay=None):
+        self.room = room
+        self.delay = delay  # Pulses until it wants to think again; None waits for a wake
+        self.thought = []
+        self._world = world
+
+    async def process_ai(self):
+        self.thought.append(self._world.scheduler.pulse)
+
+    def ai_think_delay(self):
+        return self.delay
+
+
+@pytest.fixture
+def world():
+    world = World(Config())
+    zone = world.zones[1] = Zone(1)
+    room = world.rooms[100] = zone.rooms[100] = Room(100)
+    room.zone = zone
+    return world
+
+
+def run_pulses(world, count):
+    async def go():
+        for _ in range(count):
+            world.scheduler.pulse += 1
+            await world.process_npcs()
+    asyncio.run(go())
+
+
+def spawn(world, delay=None):
+    npc = FakeNPC(world, world.rooms[100], delay)
+    world.rooms[100].characters.append(npc)
+    world.npcs.append(npc)
+    return npc
+
+
+def test_new_npc_thinks_next_pulse_then_on_its_own_delay(world):
+    npc = spawn(world, delay=3)
+    start = world.scheduler.pulse
+    run_pulses(world, 7)
+    assert npc.thought == [start + 1, start + 4, start + 7]
+
+
+def test_idle_npc_sleeps_until_woken(world):
+    npc = spawn(world)
+    run_pulses(world, 5)
+    assert len(npc.thought) == 1
+    world.wake_room(world.rooms[100])
+    run_pulses(world, 1)
+    assert len(npc.thought) == 2
+
+
+def test_removed_npc_never_thinks_again(world):
+    npc = spawn(world, delay=1)
+    run_pulses(world, 1)
+    world.npcs.remove(npc)
+    run_pulses(world, 5)
+    assert len(npc.thought) == 1
+
+
+def test_npcs_in_a_hibernating_zone_are_skipped(world):
+    npc = spawn(world, delay=1)
+    world.zones[1].hibernating = True
+    run_pulses(world, 3)
+    assert npc.thought == []
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from config import Config
+from mobs import Mobile
+from player import Player
+from world import Room, World, Zone
+
+
+@pytest.fixture
+def world():
+    world = World(Config())
+    for number, vnums in ((1, (100, 101)), (2, (200,))):
+        zone = world.zones[number] = Zone(number)
+        for vnum in vnums:
+            room = world.rooms[vnum] = zone.rooms[vnum] = Room(vnum)
+            room.zone = zone
+    return world
+
+
+def login(world, name, vnum):
+    player = Player(world)
+    player.name = name
+    player.room = world.rooms[vnum]
+    player.room.characters.append(player)
+    asyncio.run(world.add_player(player))
+    return player
+
+
+def spawn(world, vnum):
+    npc = Mobile(vnum, world)
+    npc.room = world.rooms[vnum]
+    npc.room.characters.append(npc)
+    world.npcs.append(npc)
+    return npc
+
+
+def test_login_and_logout_update_room_and_zone(world):
+    room, zone = world.rooms[100], world.zones[1]
+    player = login(world, 'Aria', 100)
+    assert world.players_in_room(room) == {player}
+    assert world.players_in_zone(zone) == {player}
+    asyncio.run(world.remove_player(player))
+    assert world.room_players == {}
+    assert world.zone_players == {}
+
+
+def test_moves_follow_the_player(world):
+    player = login(world, 'Aria', 100)
+    player.room = world.rooms[101]
+    assert not world.players_in_room(world.rooms[100])
+    assert world.players_in_room(world.rooms[101]) == {player}
+    assert world.players_in_zone(world.zones[1]) == {player}
+    player.room = world.rooms[200]
+    assert world.zones[1] not in world.zone_players
+    assert world.players_in_zone(world.zones[2]) == {player}
+
+
+def test_npcs_are_indexed_by_zone(world):
+    npc = spawn(world, 100)
+    assert world.npcs_in_zone(world.zones[1]) == {npc}
+    npc.room = world.rooms[200]
+    assert world.zones[1] not in world.zone_npcs
+    assert world.npcs_in_zone(world.zones[2]) == {npc}
+    world.npcs.remove(npc)
+    assert world.zone_npcs == {}
+
+
+def test_mobs_see_players_through_the_room_index(world):
+    npc = spawn(world, 101)
+    assert not npc.players_present()
+    player = login(world, 'Aria', 100)
+    player.room = world.rooms[101]
+    assert npc.players_present()
+    player.room = world.rooms[100]
+    assert not npc.players_present()
+
+
+def test_accessors_return_an_empty_set_for_unknown_places(world):
+    assert world.players_in_room(world.rooms[200]) == set()
+    assert world.players_in_zone(world.zones[2]) == set()
+    assert world.npcs_in_zone(world.zones[2]) == set()
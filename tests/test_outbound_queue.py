@@ -0,0 +1,49 @@
+import asyncio
+
+from config import Config
+from test_output_buffer import connect
+
+
+class SmallBuffers(Config):
+    OUTBOUND_HIGH_WATER = 100
+    OUTBOUND_LIMIT = 1000
+
+
+def test_backlogged_client_drops_low_priority_messages_only():
+    _, conn = connect(SmallBuffers)
+    conn.transport.buffered = 150  # The client stopped reading a while ago
+
+    async def go():
+        await conn.send('[Gossip] Bob: hi', low_priority=True)
+        await conn.send('The rat bites you!')
+        await conn.flush()
+    asyncio.run(go())
+    assert conn.dropped_messages == 1
+    assert conn.transport.writes == [b'The rat bites you!\r\n']
+
+
+def test_client_over_the_hard_limit_is_marked_link_dead():
+    _, conn = connect(SmallBuffers)
+
+    async def go():
+        await conn.send('x' * 60)
+        await conn.flush()
+        assert not conn.link_dead
+        await conn.write_raw(b'y' * 1000)
+        await conn.write_raw(b'after')
+    asyncio.run(go())
+    assert conn.link_dead and conn.transport.aborted
+    assert conn.transport.writes[-1] == b'y' * 1000  # Nothing queued once dead
+
+
+def test_shared_fan_out_render_is_reused_for_the_same_width():
+    _, first = connect()
+    _, second = connect()
+    rendered = {}
+
+    async def go():
+        await first.send_shared('Shout!', rendered)
+        await second.send_shared('Shout!', rendered)
+    asyncio.run(go())
+    assert list(rendered) == [first.width]
+    assert first.output_buffer[0] is second.output_buffer[0]
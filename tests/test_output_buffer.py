@@ -0,0 +1,55 @@
+import asyncio
+from types import SimpleNamespace
+
+from config import Config
+from server import Connection, MUDServer
+
+
+class FakeTransport:
+    def __init__(self):
+        self.writes = []
+        self.buffered = 0
+        self.aborted = False
+
+    def get_extra_info(self, name):
+        return ('192.0.2.1', 4000) if name == 'peername' else None
+
+    def write(self, data):
+        self.writes.append(data)
+        self.buffered += len(data)
+
+    def get_write_buffer_size(self):
+        return self.buffered
+
+    def is_closing(self):
+        return self.aborted
+
+    def abort(self):
+        self.aborted = True
+
+
+def connect(config=Config):
+    server = MUDServer(SimpleNamespace(), config)
+    conn = Connection(FakeTransport(), server)
+    server.connections[conn.conn_id] = conn
+    return server, conn
+
+
+def test_output_is_written_once_per_flush_with_the_prompt_last():
+    server, conn = connect()
+
+    async def command():
+        await conn.send('> ', newline=False, prompt=True)
+        await conn.send('You look around.')
+        await conn.send('HP 10> ', newline=False, prompt=True)  # Replaces the first prompt
+        await conn.send('A rat is here.')
+        await server.flush_output()
+    asyncio.run(command())
+    assert conn.transport.writes == [b'You look around.\r\nA rat is here.\r\nHP 10> ']
+    assert conn.last_prompt == b'HP 10> '
+
+
+def test_flush_with_nothing_queued_writes_nothing():
+    server, conn = connect()
+    asyncio.run(server.flush_output())
+    assert conn.transport.writes == []
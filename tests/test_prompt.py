@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+
+from config import Config
+from prompt import DEFAULT_PROMPT, PromptTemplate, compile_prompt, prompt_for
+
+C = Config.COLORS
+
+
+def player(**overrides):
+    fields = dict(hp=50, max_hp=200, mana=30, max_mana=60, move=90, max_move=100,
+                  gold=1234, exp=5678, flags=set(), char_class='Mage', momentum=0,
+                  fighting=None, is_fighting=False, custom_prompt=None)
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def test_player_codes_render_their_values():
+    template = compile_prompt('<%h/%Hhp %m/%Mm %v/%Vmv %p %q %r %g %x>')
+    assert template.render(player()) == (
+        f"\r\n<50/200hp 30/60m 90/100mv 25 50 90 1234 5678> {C['reset']}> ")
+
+
+def test_newline_and_unknown_codes():
+    template = compile_prompt('%h%n%z%')
+    assert template.render(player()) == f"\r\n50\r\n%z% {C['reset']}> "
+
+
+def test_builtin_codes_are_literal_in_player_prompts():
+    assert compile_prompt('%C%S').render(player()).startswith('\r\n%C%S')
+
+
+def test_adjacent_literals_are_merged():
+    template = compile_prompt('hp %h%nmana')
+    assert [seg for seg in template.segments if isinstance(seg, str)][:2] == ['\r\nhp ', '\r\nmana ']
+    assert PromptTemplate('x', ('a', 'b', 'c')).segments == ('abc',)
+
+
+def test_templates_are_cached_by_source():
+    assert compile_prompt('<%h>') is compile_prompt('<%h>')
+    assert compile_prompt('<%h>') is not compile_prompt('<%m>')
+
+
+def test_render_reads_the_player_each_time():
+    template = compile_prompt('%h')
+    p = player()
+    assert template.render(p).startswith('\r\n50 ')
+    p.hp = 7
+    assert template.render(p).startswith('\r\n7 ')
+
+
+def test_opponent_health_is_appended_when_fighting():
+    enemy = SimpleNamespace(name='a goblin', hp=10, max_hp=40)
+    out = compile_prompt('%h').render(player(fighting=enemy, is_fighting=True))
+    assert 'a goblin: 10/40' in out
+    assert out.endswith(f"{C['reset']}> ")
+
+
+def test_default_prompt():
+    p = player(flags={'sneaking'})
+    out = DEFAULT_PROMPT.render(p)
+    assert out.startswith(f"\r\n{C['red']}50/200hp ")
+    assert '30/60mp' in out and '90/100mv' in out and '[sneaking]' in out
+    assert prompt_for(p) is DEFAULT_PROMPT
+    p.custom_prompt = '<%h>'
+    assert prompt_for(p) is compile_prompt('<%h>')
+
+
+def test_hp_colour_thresholds():
+    assert DEFAULT_PROMPT.render(player(hp=150)).startswith(f"\r\n{C['green']}")
+    assert DEFAULT_PROMPT.render(player(hp=75)).startswith(f"\r\n{C['yellow']}")
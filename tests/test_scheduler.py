@@ -0,0 +1,123 @@
+import asyncio
+
+from scheduler import PRIORITY_CRITICAL, PRIORITY_LOW, PRIORITY_NORMAL, Scheduler
+
+
+def run_pulses(scheduler, pulses):
+    async def go():
+        for _ in range(pulses):
+            await scheduler.tick()
+    asyncio.run(go())
+
+
+def recorder(log, name):
+    async def job():
+        log.append(name)
+    return job
+
+
+def test_due_jobs_run_in_pulse_then_priority_order():
+    s = Scheduler()
+    log = []
+    s.once('late', 3, recorder(log, 'late'), priority=PRIORITY_CRITICAL)
+    s.once('low', 2, recorder(log, 'low'), priority=PRIORITY_LOW)
+    s.once('normal', 2, recorder(log, 'normal'), priority=PRIORITY_NORMAL)
+    s.once('critical', 2, recorder(log, 'critical'), priority=PRIORITY_CRITICAL)
+    run_pulses(s, 3)
+    assert log == ['critical', 'normal', 'low', 'late']
+
+
+def test_equal_priority_runs_in_registration_order():
+    s = Scheduler()
+    log = []
+    for name in ('a', 'b', 'c'):
+        s.once(name, 1, recorder(log, name))
+    run_pulses(s, 1)
+    assert log == ['a', 'b', 'c']
+
+
+def test_periodic_job_fires_every_period_from_its_phase():
+    s = Scheduler()
+    pulses = []
+
+    async def job():
+        pulses.append(s.pulse)
+
+    s.every('tick', 5, job, phase=2)
+    run_pulses(s, 20)
+    assert pulses == [2, 7, 12, 17]
+    assert s.get('tick').runs == 4
+    assert s.pulses_until('tick') == 2
+
+
+def test_oneshot_is_forgotten_and_cancel_stops_a_job():
+    s = Scheduler()
+    log = []
+    s.once('once', 1, recorder(log, 'once'))
+    s.every('gone', 1, recorder(log, 'gone'))
+    assert s.cancel('gone')
+    assert not s.cancel('gone')
+    run_pulses(s, 3)
+    assert log == ['once']
+    assert s.get('once') is None
+
+
+def test_reregistering_a_name_replaces_the_job():
+    s = Scheduler()
+    log = []
+    s.once('job', 1, recorder(log, 'first'))
+    s.once('job', 2, recorder(log, 'second'))
+    run_pulses(s, 3)
+    assert log == ['second']
+
+
+def test_failing_job_does_not_stop_the_pulse():
+    s = Scheduler()
+    log = []
+
+    async def boom():
+        raise RuntimeError('boom')
+
+    s.once('boom', 1, boom, priority=PRIORITY_CRITICAL)
+    s.once('after', 1, recorder(log, 'after'))
+    run_pulses(s, 1)
+    assert log == ['after']
+
+
+def test_phase_is_normalised_into_the_period():
+    s = Scheduler()
+
+    async def job():
+        pass
+
+    assert s.every('zero', 10, job, phase=0).next_pulse == 10
+    assert s.every('over', 10, job, phase=13).next_pulse == 3
+
+
+def test_heavy_periodic_jobs_are_staggered():
+    s = Scheduler()
+    fired = {}
+
+    def job(name):
+        async def run():
+            fired.setdefault(s.pulse, []).append(name)
+        return run
+
+    for name, seconds in (('regen', 15), ('decay', 60), ('zones', 60), ('autosave', 150)):
+        s.every(name, s.seconds(seconds), job(name))
+    run_pulses(s, s.seconds(600))
+    assert fired
+    assert all(len(names) == 1 for names in fired.values()), {
+        pulse: names for pulse, names in fired.items() if len(names) > 1}
+
+
+def test_unstaggered_phase_lands_near_a_full_period():
+    s = Scheduler()
+
+    async def job():
+        pass
+
+    s.every('first', 100, job)
+    second = s.every('second', 100, job)
+    assert second.next_pulse != 100
+    assert 90 <= second.next_pulse <= 100
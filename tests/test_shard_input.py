@@ -0,0 +1,84 @@
+import asyncio
+from types import SimpleNamespace
+
+from server import MUDServer
+from sharding import ShardWorker, _shard_connection_class
+from world import World
+
+
+class Pipe:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, message):
+        self.sent.append(message)
+
+
+def make_worker():
+    worker = ShardWorker(0, [], Pipe())
+    worker.world = World(worker.config)
+    worker.server = MUDServer(worker.world, worker.config)
+    worker._conn_class = _shard_connection_class()
+    return worker
+
+
+def session(worker, name, ran):
+    conn = worker._conn_class(worker, ('192.0.2.1', len(worker.sessions) + 1))
+    conn.player = SimpleNamespace(name=name.capitalize(), wait_state=0, room=None)
+
+    async def handle_input(line):
+        ran.append((name, line))
+    conn.handle_input = handle_input
+    worker._track(name, conn)
+    return conn
+
+
+def run(worker, *messages, pulses=1):
+    async def go():
+        for message in messages:
+            await worker._handle(message)
+        for _ in range(pulses):
+            await worker.server.process_input()
+    asyncio.run(go())
+
+
+def test_input_is_queued_and_run_on_the_pulse_in_turns():
+    worker = make_worker()
+    ran = []
+    session(worker, 'aria', ran)
+    session(worker, 'bram', ran)
+    asyncio.run(worker._handle(('input', 'aria', 'n')))
+    assert ran == []  # Not run on arrival
+    run(worker, ('input', 'aria', 'e'), ('input', 'bram', 'look'))
+    assert ran == [('aria', 'n'), ('bram', 'look')]
+    run(worker)
+    assert ran[-1] == ('aria', 'e')
+
+
+def test_wait_state_applies_on_shards():
+    worker = make_worker()
+    ran = []
+    conn = session(worker, 'aria', ran)
+    conn.player.wait_state = 2
+    run(worker, ('input', 'aria', 'kick'))
+    assert ran == []
+    run(worker)
+    assert ran == [('aria', 'kick')]
+
+
+def test_input_for_an_unknown_session_bounces():
+    worker = make_worker()
+    run(worker, ('input', 'gone', 'look'))
+    assert worker.pipe.sent == [('bounce', 'gone', 'look')]
+
+
+def test_closing_a_session_drops_its_queue():
+    worker = make_worker()
+    ran = []
+    conn = session(worker, 'aria', ran)
+    asyncio.run(worker._handle(('input', 'aria', 'look')))
+    assert worker._untrack(conn) == ['look']
+    run(worker)
+    assert ran == []
+    assert conn.conn_id not in worker.server.connections
+
@@ -0,0 +1,39 @@
+import asyncio
+from types import SimpleNamespace
+
+from config import Config
+from server import fan_out
+from social import ignore_player, is_ignored, unignore_player
+
+
+def player(name):
+    async def send(message):
+        pass
+    return SimpleNamespace(name=name, config=Config(), ignore_list=[], send=send)
+
+
+def test_ignore_and_unignore_refresh_the_cached_ignore_set():
+    bob = player('Bob')
+    assert not is_ignored(bob, 'Mallory')  # Caches the empty set
+    asyncio.run(ignore_player(bob, 'mallory'))
+    assert is_ignored(bob, 'MALLORY')
+    asyncio.run(unignore_player(bob, 'Mallory'))
+    assert not is_ignored(bob, 'mallory')
+
+
+class SharedConnection:
+    def __init__(self):
+        self.sent = []
+
+    async def send_shared(self, message, rendered, newline, low_priority):
+        self.sent.append((message, rendered, low_priority))
+
+
+def test_fan_out_shares_one_render_cache_and_skips_the_linkless():
+    conns = [SharedConnection(), SharedConnection()]
+    recipients = [SimpleNamespace(connection=conn) for conn in conns]
+    recipients.append(SimpleNamespace(connection=None))
+    asyncio.run(fan_out(recipients, 'Hello', low_priority=True))
+    (_, first_cache, low), (_, second_cache, _) = conns[0].sent + conns[1].sent
+    assert first_cache is second_cache
+    assert low
@@ -0,0 +1,52 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from commands import CommandHandler
+from config import Config
+
+parse = CommandHandler._parse_speedwalk
+
+
+@pytest.mark.parametrize('text, steps', [
+    ('3n2e', ['north'] * 3 + ['east'] * 2),
+    ('n n e', ['north', 'north', 'east']),
+    ('ne2sw', ['north', 'east', 'south', 'south', 'west']),
+    ('2 north, east', ['north', 'north', 'east']),
+    ('2north;d', ['north', 'north', 'down']),
+    ('U', ['up']),
+])
+def test_parses_paths(text, steps):
+    assert parse(text) == steps
+
+
+@pytest.mark.parametrize('text', ['0n', '3x', 'n3', '2', 'north 2', '', '  '])
+def test_rejects_malformed_paths(text):
+    assert parse(text) is None
+
+
+def test_huge_counts_are_clamped_just_past_the_limit():
+    limit = Config.SPEEDWALK_MAX_STEPS
+    assert len(parse(f'{limit}n')) == limit
+    assert len(parse('100000n')) == limit + 1
+
+
+def test_run_is_an_alias_for_speedwalk():
+    assert CommandHandler.registry.aliases['run'] == 'speedwalk'
+
+
+def run_command(args):
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    player = SimpleNamespace(config=Config, room=SimpleNamespace(vnum=1), send=send)
+    asyncio.run(CommandHandler.cmd_speedwalk(player, args))
+    return sent
+
+
+def test_speedwalk_refuses_bad_and_overlong_paths():
+    assert "isn't a path" in run_command(['0n'])[0]
+    assert f"at most {Config.SPEEDWALK_MAX_STEPS} steps" in run_command(['100n'])[0]
@@ -0,0 +1,76 @@
+from telnet import (DO, IAC, NOP, OPT_NAWS, OPT_TTYPE, SB, SE, TTYPE_IS, WILL,
+                    TelnetParser, iac, parse_naws, parse_ttype, subneg)
+
+
+def feed_chunks(data, size):
+    """Feed ``data`` through one parser ``size`` bytes at a time."""
+    parser = TelnetParser()
+    out = b''.join(parser.feed(data[i:i + size]) for i in range(0, len(data), size))
+    return out, parser.take_events()
+
+
+STREAM = (b'look' + iac(WILL, OPT_NAWS) + b' north'
+          + subneg(OPT_NAWS, bytes((0, 120, 0, 40)))
+          + iac(NOP) + b'\r\n'
+          + subneg(OPT_TTYPE, bytes((TTYPE_IS,)) + b'MUDLET')
+          + b'say \xff\xff' + iac(DO, OPT_TTYPE))
+
+
+def test_plain_data_passes_straight_through():
+    parser = TelnetParser()
+    data = b'look\r\n'
+    assert parser.feed(data) is data
+    assert parser.take_events() == []
+
+
+def test_commands_are_stripped_and_queued():
+    out, events = feed_chunks(STREAM, len(STREAM))
+    assert out == b'look north\r\nsay \xff'
+    assert events == [
+        ('will', OPT_NAWS),
+        ('sb', OPT_NAWS, bytes((0, 120, 0, 40))),
+        ('sb', OPT_TTYPE, bytes((TTYPE_IS,)) + b'MUDLET'),
+        ('do', OPT_TTYPE),
+    ]
+
+
+def test_every_chunk_boundary_gives_the_same_result():
+    whole = feed_chunks(STREAM, len(STREAM))
+    for size in range(1, 8):
+        assert feed_chunks(STREAM, size) == whole, size
+    for split in range(1, len(STREAM)):
+        parser = TelnetParser()
+        out = parser.feed(STREAM[:split]) + parser.feed(STREAM[split:])
+        assert (out, parser.take_events()) == whole, split
+
+
+def test_in_command_while_a_sequence_is_split():
+    parser = TelnetParser()
+    assert parser.feed(bytes((IAC, SB, OPT_NAWS, 0))) == b''
+    assert parser.in_command
+    parser.feed(bytes((80, 0, 24, IAC)))
+    assert parser.in_command
+    parser.feed(bytes((SE,)))
+    assert not parser.in_command
+    assert parser.take_events() == [('sb', OPT_NAWS, bytes((0, 80, 0, 24)))]
+
+
+def test_doubled_iac_inside_subnegotiation_is_one_byte():
+    payload = bytes((0, 255, 0, 40))
+    out, events = feed_chunks(subneg(OPT_NAWS, payload), 1)
+    assert out == b''
+    assert events == [('sb', OPT_NAWS, payload)]
+    assert parse_naws(payload) == (255, 40)
+
+
+def test_malformed_subnegotiation_is_dropped():
+    parser = TelnetParser()
+    out = parser.feed(bytes((IAC, SB, OPT_NAWS, 1, 2, IAC, NOP)) + b'ok')
+    assert out == b'ok'
+    assert parser.take_events() == []
+
+
+def test_payload_parsers():
+    assert parse_naws(b'\x00') == (0, 0)
+    assert parse_ttype(bytes((TTYPE_IS,)) + b' xterm ') == 'xterm'
+    assert parse_ttype(b'\x01xterm') == ''
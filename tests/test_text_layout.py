@@ -0,0 +1,90 @@
+import re
+
+from text_layout import DEFAULT_WIDTH, MAX_WIDTH, MIN_WIDTH, clamp_width, wrap_text
+
+RED = '\x1b[31m'
+BOLD = '\x1b[1m'
+RESET = '\x1b[0m'
+_ANSI = re.compile(r'\x1b\[[0-9;?]*[A-Za-z]')
+
+
+def visible(line):
+    return _ANSI.sub('', line)
+
+
+def test_short_text_is_returned_unchanged():
+    text = f"{RED}A small room.{RESET}"
+    assert wrap_text(text, 20) is text
+
+
+def test_plain_text_wraps_at_word_boundaries():
+    out = wrap_text('the quick brown fox jumps over the lazy dog', 20)
+    assert out.split('\n') == ['the quick brown fox', 'jumps over the lazy', 'dog']
+
+
+def test_escape_sequences_take_no_columns():
+    words = ' '.join(f"{RED}word{RESET}" for _ in range(8))
+    lines = wrap_text(words, 20).split('\n')
+    # Four visible 'word's fit a 20-column line even though the raw text is longer
+    assert [visible(line) for line in lines] == ['word word word word'] * 2
+    assert all(len(visible(line)) <= 20 for line in lines)
+
+
+def test_colour_in_effect_is_reemitted_after_a_wrap():
+    text = f"{BOLD}{RED}" + 'alpha beta gamma delta epsilon' + RESET + ' after'
+    first, second = wrap_text(text, 20).split('\n')
+    assert visible(first) == 'alpha beta gamma'
+    assert second.startswith('\x1b[1;31m')
+    assert visible(second) == 'delta epsilon after'
+
+
+def test_reset_before_the_wrap_is_not_reemitted():
+    text = f"{RED}red{RESET} " + 'plain words that run past the edge'
+    second = wrap_text(text, 20).split('\n')[1]
+    assert not second.startswith('\x1b[')
+
+
+def test_words_longer_than_a_line_are_broken():
+    lines = wrap_text('x' * 45, 20).split('\n')
+    assert lines == ['x' * 20, 'x' * 20, 'x' * 5]
+
+
+def test_existing_newlines_are_kept():
+    text = 'short\n' + 'long line that needs wrapping here'
+    assert wrap_text(text, 20).split('\n') == ['short', 'long line that needs', 'wrapping here']
+
+
+PARAGRAPH = ('This area is the temple square. Huge marble steps lead up to the temple\n'
+             'gate to the north. In the middle of the square stands a statue of the\n'
+             'old king, weathered by centuries of rain.')
+
+
+def test_hard_wrapped_paragraph_is_reflowed_for_a_narrower_client():
+    lines = wrap_text(PARAGRAPH, 40).split('\n')
+    assert ' '.join(lines) == ' '.join(PARAGRAPH.split('\n'))
+    # Refilled as one paragraph: no short line left behind by the source breaks
+    assert all(30 <= len(line) <= 40 for line in lines[:-1])
+
+
+def test_blank_lines_indents_and_sentence_ends_keep_their_breaks():
+    text = ('A large fountain carved from blue marble is here, bubbling away.\n'
+            'A quest board hangs on the wall.\n'
+            '  - an indented item\n'
+            '\n'
+            'Next paragraph.')
+    lines = wrap_text(text, 30).split('\n')
+    assert 'A quest board hangs on the' in lines
+    assert '  - an indented item' in lines
+    assert lines[-2:] == ['', 'Next paragraph.']
+
+
+def test_box_drawing_lines_are_not_reflowed():
+    frame = '║ ' + 'cell ' * 10 + '║'
+    assert wrap_text(frame, 20) == frame
+
+
+def test_clamp_width():
+    assert clamp_width(0) == DEFAULT_WIDTH
+    assert clamp_width(5) == MIN_WIDTH
+    assert clamp_width(1000) == MAX_WIDTH
+    assert clamp_width(100) == 100
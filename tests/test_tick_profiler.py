@@ -0,0 +1,38 @@
+from tick_profiler import RollingHistogram, TickProfiler
+
+
+def test_histogram_window_and_lifetime_counters():
+    hist = RollingHistogram(window=10)
+    for ms in range(1, 21):
+        hist.record(float(ms))
+    summary = hist.summary()
+    assert summary['count'] == 20
+    assert summary['max_ms'] == 20.0 and summary['max_ever_ms'] == 20.0
+    # Percentiles cover only the last 10 samples (11..20)
+    assert summary['p50_ms'] == 15.0
+    assert summary['avg_ms'] == 10.5
+
+
+def test_empty_histogram_reports_zeroes():
+    assert RollingHistogram().summary()['p99_ms'] == 0.0
+
+
+def test_measure_records_under_the_subsystem_name():
+    profiler = TickProfiler(0.1)
+    with profiler.measure('process_npcs'):
+        pass
+    with profiler.measure('process_npcs'):
+        pass
+    assert profiler.snapshot()['subsystems']['process_npcs']['count'] == 2
+
+
+def test_pulses_over_budget_count_as_overruns(monkeypatch):
+    clock = iter([0.0, 0.05, 1.0, 1.25])
+    monkeypatch.setattr('tick_profiler.time.perf_counter', lambda: next(clock))
+    profiler = TickProfiler(0.1)  # 100ms budget
+    for _ in range(2):
+        profiler.begin_pulse()
+        profiler.end_pulse()
+    snap = profiler.snapshot()
+    assert (snap['pulses'], snap['overruns']) == (2, 1)
+    assert round(snap['worst_overrun_ms']) == 150
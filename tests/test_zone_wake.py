@@ -0,0 +1,43 @@
+import pytest
+
+from config import Config
+from world import Room, World, Zone
+
+
+@pytest.fixture
+def world():
+    world = World(Config())
+    zone = world.zones[1] = Zone(1)
+    room = world.rooms[100] = zone.rooms[100] = Room(100)
+    room.zone = zone
+    return world
+
+
+def wake_overdue(world, reset_mode, occupied):
+    zone = world.zones[1]
+    scheduled = []
+    world.scheduler.once = lambda name, *args, **kwargs: scheduled.append(name)
+    zone.reset_mode = reset_mode
+    zone.age = zone.lifespan
+    zone.hibernating = True
+    if occupied:
+        world.zone_players[zone] = {object()}
+    world.wake_zone(zone)
+    assert not zone.hibernating
+    return scheduled
+
+
+def test_overdue_reset_if_empty_zone_resets_when_woken_empty(world):
+    assert wake_overdue(world, 1, occupied=False) == ['zone_wake_reset_1']
+
+
+def test_overdue_reset_if_empty_zone_waits_for_its_visitors(world):
+    assert wake_overdue(world, 1, occupied=True) == []
+
+
+def test_overdue_always_reset_zone_resets_even_when_occupied(world):
+    assert wake_overdue(world, 2, occupied=True) == ['zone_wake_reset_1']
+
+
+def test_never_reset_zone_is_not_reset(world):
+    assert wake_overdue(world, 0, occupied=False) == []